@@ -1,14 +1,39 @@
+import logging
+import os
 import dash
+import flask
 import dash_bootstrap_components as dbc
-from dash import dcc, html, dash_table
-from dash.dependencies import Input, Output
-from dash.long_callback import DiskcacheLongCallbackManager
-from queries import get_gdp, get_country, get_available_data
-from plot import make_health_plot, make_edu_plot
+from dash import dcc, html, dash_table, Patch, ClientsideFunction
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+from queries import (
+    get_available_data, get_available_data_version, get_base_frame, get_pool_stats, INDICATOR_JOIN, REFRESH_SCHEDULER,
+)
+from figures import (
+    get_figure, get_figure_version, get_lazy_figure, get_frames, start_prewarm,
+    PREWARM_FIGURES, LAZY_FRAMES, THEMATIC_CLIENT_CACHE,
+)
+from refresh import datasets_loaded, load_datasets, missing_datasets, refresh_status, start_scheduler
+from caching import cache
+from metrics import InstrumentedDiskcacheManager, init_app as init_metrics
+from worker_pool import WarmPoolManager, LONG_CALLBACK_MANAGER
+from indicators import INDICATORS, tab_id
+from table_query import query_frame
+from static_assets import asset_url, register_media_route
+from warm_up import import_heavy_modules, start_warm_up, WARM_UP
+
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 
-import diskcache
-cache = diskcache.Cache("./cache")
-long_callback_manager = DiskcacheLongCallbackManager(cache)
+logger = logging.getLogger(__name__)
+
+# set by gunicorn.conf.py: the app is loaded once in the server's master
+# process, which forks the workers, so background threads start in each worker
+PREFORK_SERVER = os.getenv("PREFORK_SERVER", "0") == "1"
+
+if LONG_CALLBACK_MANAGER == 'pool':
+    long_callback_manager = WarmPoolManager(cache, initializer=import_heavy_modules)
+else:
+    long_callback_manager = InstrumentedDiskcacheManager(cache)
 
 dbc_css = "https://cdn.jsdelivr.net/gh/AnnMarieW/dash-bootstrap-templates/dbc.min.css"
 app = dash.Dash(
@@ -17,7 +42,17 @@ app = dash.Dash(
     long_callback_manager=long_callback_manager,
     suppress_callback_exceptions=True,
     use_pages=True,
+    compress=True,
 )
+register_media_route(app.server)
+
+
+def backend_gauges():
+    stats = get_pool_stats()
+    return {f'data_backend_{k}': v for k, v in stats.items() if isinstance(v, (int, float))}
+
+
+init_metrics(app, gauges=backend_gauges)
 
 SIDEBAR_STYLE = {
     "position": "fixed",
@@ -41,7 +76,7 @@ sidebar = html.Div(
     [
         dbc.Row([
             html.Img(
-                src=app.get_asset_url('rpf_logo.png'),
+                src=asset_url('rpf_logo.png'),
                 style={'height': '168'}
             ),
         ]),
@@ -71,6 +106,13 @@ app.layout = html.Div([dcc.Location(id='url', refresh=False),
                        content,
                        dummy_div])
 
+if THEMATIC_CLIENT_CACHE != 'none':
+    # tab id -> {version, request, content} of the thematic tabs rendered by
+    # the server, outside the page so it is kept when navigating between pages
+    app.layout.children.append(
+        dcc.Store(id='thematic-client-cache', data={}, storage_type=THEMATIC_CLIENT_CACHE)
+    )
+
 @app.callback(
     Output('div-for-redirect', 'children'),
     Input('url', 'pathname')
@@ -83,34 +125,212 @@ def redirect_default(url_pathname):
         return ""
 
 
-@app.long_callback(
-    Output('thematic-content', 'children'),
-    Input('thematic-tabs', 'active_tab'),
-    running=[
-        (
-            Output("thematic-spinner", "style"),
-            {"display": "block"},
-            {"display": "none"},
-        ),
-        (
-            Output("thematic-content", "style"),
-            {"display": "none"},
-            {"display": "block"},
-        ),
-    ],
-)
-def render_thematic_content(tab):
-    gdp = get_gdp()
-    country = get_country()
-    if tab == 'tab-education':
-        return html.Div([
-            dcc.Graph(id='edu-plot', figure=make_edu_plot(gdp, country))
-        ])
-    elif tab == 'tab-health':
+@app.server.route('/pool-stats')
+def pool_stats():
+    return flask.jsonify(get_pool_stats())
+
+
+@app.server.route('/refresh-status')
+def refresh_status_view():
+    return flask.jsonify(refresh_status())
+
+
+@app.server.route('/ready')
+def ready():
+    if not datasets_loaded():
+        return flask.jsonify(status='loading', missing=missing_datasets()), 503
+    return flask.jsonify(status='ready')
+
+
+def thematic_tab_content(name):
+    if not LAZY_FRAMES:
         return html.Div([
-            dcc.Graph(id='health-plot', figure=make_health_plot(gdp, country))
+            dcc.Graph(id='thematic-graph', figure=get_figure(name))
         ])
 
+    figure, years = get_lazy_figure(name)
+    return html.Div([
+        dcc.Graph(id='thematic-graph', figure=figure),
+        dbc.Row([
+            dbc.Col(
+                dbc.Button('Play', id='thematic-play', color='secondary', size='sm'),
+                width='auto',
+            ),
+            dbc.Col(
+                dcc.Slider(
+                    id='thematic-year-slider',
+                    min=years[0],
+                    max=years[-1],
+                    step=None,
+                    marks={year: str(year) for year in years},
+                    value=years[-1],
+                ),
+            ),
+        ], align='center'),
+        dcc.Interval(id='thematic-player', interval=800, disabled=True),
+        dcc.Store(id='thematic-figure-name', data=name),
+        dcc.Store(id='thematic-years', data=years),
+        dcc.Store(id='thematic-frames', data={}),
+        dcc.Store(id='thematic-frame-request'),
+    ])
+
+
+if THEMATIC_CLIENT_CACHE == 'none':
+    @app.long_callback(
+        Output('thematic-content', 'children'),
+        Input('thematic-tabs', 'active_tab'),
+        running=[
+            (
+                Output("thematic-spinner", "style"),
+                {"display": "block"},
+                {"display": "none"},
+            ),
+            (
+                Output("thematic-content", "style"),
+                {"display": "none"},
+                {"display": "block"},
+            ),
+        ],
+    )
+    def render_thematic_content(tab):
+        name = THEMATIC_TABS.get(tab)
+        if name is None:
+            return None
+        return thematic_tab_content(name)
+
+else:
+    # the browser shows tabs from thematic-client-cache and only asks for the
+    # ones it does not hold, or holds for an older data version. Asking and
+    # showing are separate callbacks: the request leads to a new cache entry,
+    # which must not trigger the callback making requests
+    app.clientside_callback(
+        ClientsideFunction(namespace='thematic', function_name='request_tab'),
+        Output('thematic-request', 'data'),
+        Input('thematic-tabs', 'active_tab'),
+        Input('thematic-versions', 'data'),
+        State('thematic-client-cache', 'data'),
+        State('thematic-request', 'data'),
+    )
+
+    app.clientside_callback(
+        ClientsideFunction(namespace='thematic', function_name='show_tab'),
+        Output('thematic-content', 'children'),
+        Output('thematic-spinner', 'style'),
+        Output('thematic-shown', 'data'),
+        Input('thematic-tabs', 'active_tab'),
+        Input('thematic-client-cache', 'data'),
+        State('thematic-shown', 'data'),
+    )
+
+    @app.long_callback(
+        Output('thematic-client-cache', 'data'),
+        Input('thematic-request', 'data'),
+        prevent_initial_call=True,
+    )
+    def render_thematic_content(request):
+        name = THEMATIC_TABS.get((request or {}).get('tab'))
+        if name is None:
+            raise PreventUpdate
+        cached = Patch()
+        # read before rendering: if the data changes in between, the entry looks
+        # outdated and is rendered again rather than passing for current
+        cached[request['tab']] = {
+            'version': get_figure_version(name),
+            'request': request['id'],
+            'content': thematic_tab_content(name),
+        }
+        return cached
+
+    @app.callback(
+        Output('thematic-versions', 'data'),
+        Input('thematic-version-poll', 'n_intervals'),
+    )
+    def poll_thematic_versions(n_intervals):
+        # cached versions only, a tab whose data is not cached is None (unknown)
+        # rather than fetched from the warehouse on a web thread
+        return {tab: get_figure_version(name, cached_only=True) for tab, name in THEMATIC_TABS.items()}
+
+
+THEMATIC_TABS = {tab_id(name): name for name in INDICATORS}
+
+app.clientside_callback(
+    ClientsideFunction(namespace='thematic', function_name='show_year'),
+    Output('thematic-graph', 'figure'),
+    Output('thematic-frame-request', 'data'),
+    Input('thematic-year-slider', 'value'),
+    State('thematic-frames', 'data'),
+    State('thematic-graph', 'figure'),
+    State('thematic-years', 'data'),
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace='thematic', function_name='toggle_play'),
+    Output('thematic-player', 'disabled'),
+    Output('thematic-play', 'children'),
+    Input('thematic-play', 'n_clicks'),
+    State('thematic-player', 'disabled'),
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace='thematic', function_name='advance_year'),
+    Output('thematic-year-slider', 'value'),
+    Output('thematic-player', 'disabled', allow_duplicate=True),
+    Output('thematic-play', 'children', allow_duplicate=True),
+    Input('thematic-player', 'n_intervals'),
+    State('thematic-year-slider', 'value'),
+    State('thematic-years', 'data'),
+    prevent_initial_call=True,
+)
+
+
+@app.callback(
+    Output('thematic-frames', 'data'),
+    Output('thematic-graph', 'figure', allow_duplicate=True),
+    Input('thematic-frame-request', 'data'),
+    State('thematic-figure-name', 'data'),
+    State('thematic-year-slider', 'value'),
+    prevent_initial_call=True,
+)
+def load_thematic_frames(request, name, year):
+    if not request:
+        raise PreventUpdate
+    frames = get_frames(name, request['years'])
+
+    loaded = Patch()
+    for frame_year, data in frames.items():
+        loaded[frame_year] = data
+
+    figure = dash.no_update
+    show = request.get('show')
+    if show is not None and show == year and str(show) in frames:
+        figure = Patch()
+        figure['data'] = frames[str(show)]
+        figure['layout']['meta'] = {'year': show}
+    return loaded, figure
+
+
+AVAILABILITY_PAGE_SIZE = 200
+
+# the availability table of the current data version, kept in memory so paging
+# through it does not deserialize it from the cache on every page. Its columns
+# are backed by the memory-mapped Arrow data, not copied into each process
+_availability_frames = {}
+
+
+def get_availability_frame():
+    version = get_available_data_version()
+    if version not in _availability_frames:
+        import pandas as pd
+
+        _availability_frames.clear()
+        _availability_frames[version] = get_available_data(as_arrow=True).to_pandas(types_mapper=pd.ArrowDtype)
+    return _availability_frames[version]
+
+
+def format_row_count(total):
+    return f'{total:,} rows'
+
+
 @app.long_callback(
     Output('availability-content', 'children'),
     Input('avail-nav', 'active'),
@@ -128,15 +348,20 @@ def render_thematic_content(tab):
     ],
 )
 def render_availability_content(active):
-    df = get_available_data()
-    df.columns = df.columns.str.replace('_', ' ').str.title()
+    df = get_availability_frame()
+    records, total, page_count = query_frame(df, '', [], 0, AVAILABILITY_PAGE_SIZE)
 
     table = dash_table.DataTable(
-        df.to_dict('records'),
-        [{"name": i, "id": i} for i in df.columns],
-        filter_action="native",
-        sort_action="native",
-        page_size=200,
+        records,
+        [{"name": i.replace('_', ' ').title(), "id": i} for i in df.columns],
+        id='availability-table',
+        filter_action="custom",
+        sort_action="custom",
+        sort_mode="multi",
+        page_action="custom",
+        page_current=0,
+        page_size=AVAILABILITY_PAGE_SIZE,
+        page_count=page_count,
         style_table={'overflowX': 'auto'},  # Scrollable table
         style_cell={'textAlign': 'left'},
         style_header={
@@ -152,7 +377,58 @@ def render_availability_content(active):
         ],
     )
 
-    return table
+    return html.Div([
+        html.P(format_row_count(total), id='availability-row-count'),
+        table,
+    ])
+
+
+@app.callback(
+    Output('availability-table', 'data'),
+    Output('availability-table', 'page_count'),
+    Output('availability-row-count', 'children'),
+    Input('availability-table', 'page_current'),
+    Input('availability-table', 'page_size'),
+    Input('availability-table', 'sort_by'),
+    Input('availability-table', 'filter_query'),
+    # render_availability_content inserts the table with its first page
+    prevent_initial_call=True,
+)
+def update_availability_table(page_current, page_size, sort_by, filter_query):
+    records, total, page_count = query_frame(
+        get_availability_frame(), filter_query, sort_by, page_current, page_size)
+    return records, page_count, format_row_count(total)
+
+
+def preload():
+    """
+    Loads the datasets, the modules and the in memory frames the callbacks
+    need. Run by a preforking server before it forks the workers, which then
+    share all of it instead of each loading its own.
+    """
+    import_heavy_modules()
+    missing = load_datasets()
+    if missing:
+        logger.error('Not ready, failed to load datasets: %s', ', '.join(missing))
+        return
+    get_availability_frame()
+    if INDICATOR_JOIN == 'arrow':
+        get_base_frame()
+
+
+def start_background_tasks():
+    if WARM_UP:
+        start_warm_up()
+
+    if PREWARM_FIGURES:
+        start_prewarm()
+
+    if REFRESH_SCHEDULER:
+        start_scheduler()
+
+
+if not PREFORK_SERVER:
+    start_background_tasks()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,82 @@
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    thematic: {
+        // Asks the server to render the tab when the browser does not hold it,
+        // or holds it for an older data version. Once per data version, and
+        // not while a request for it is still on its way. A version of null
+        // is unknown, the data is not cached on the server.
+        request_tab: function(tab, versions, cache, request) {
+            cache = cache || {};
+            const entry = cache[tab];
+            const version = (versions || {})[tab];
+            const known = version !== undefined && version !== null;
+            const current = entry && (!known || entry.version === version);
+            const pending = request && !(cache[request.tab] && cache[request.tab].request === request.id);
+            const requested = request && request.tab === tab && (pending || request.version === (known ? version : null));
+            if (current || requested) {
+                return window.dash_clientside.no_update;
+            }
+            // unique across reloads too, the cache may outlive the page
+            const id = Math.max(Date.now(), request ? request.id + 1 : 0);
+            return {tab: tab, version: known ? version : null, id: id};
+        },
+
+        // Shows the tab as rendered earlier, even for an outdated data version,
+        // until its replacement arrives, or the spinner while there is none.
+        show_tab: function(tab, cache, shown) {
+            const no_update = window.dash_clientside.no_update;
+            const entry = (cache || {})[tab];
+            let content = no_update;
+            let newShown = no_update;
+            if (entry && !(shown && shown.tab === tab && shown.request === entry.request)) {
+                content = entry.content;
+                newShown = {tab: tab, request: entry.request};
+            } else if (!entry && shown) {
+                content = null;
+                newShown = null;
+            }
+            return [content, {display: entry ? 'none' : 'block'}, newShown];
+        },
+
+        // Shows the selected year from the frames already loaded in the browser.
+        // Frames that are missing for it or its neighbouring years are requested
+        // from the server, which also shows the year once its frame arrives.
+        show_year: function(year, frames, figure, years) {
+            const no_update = window.dash_clientside.no_update;
+            if (year === undefined || year === null || !figure || !years) {
+                return [no_update, no_update];
+            }
+            frames = frames || {};
+            const index = years.indexOf(year);
+            const wanted = [year, years[index - 1], years[index + 1]].filter(y => y !== undefined);
+            const missing = wanted.filter(y => !(y in frames));
+            const shown = figure.layout && figure.layout.meta && figure.layout.meta.year;
+
+            let newFigure = no_update;
+            if (year !== shown && year in frames) {
+                newFigure = Object.assign({}, figure, {
+                    data: frames[year],
+                    layout: Object.assign({}, figure.layout, {meta: {year: year}}),
+                });
+            }
+            const show = year !== shown && !(year in frames) ? year : null;
+            const request = missing.length ? {years: missing, show: show} : no_update;
+            return [newFigure, request];
+        },
+
+        toggle_play: function(n_clicks, disabled) {
+            if (!n_clicks) {
+                return [window.dash_clientside.no_update, window.dash_clientside.no_update];
+            }
+            return [!disabled, disabled ? 'Pause' : 'Play'];
+        },
+
+        advance_year: function(n_intervals, year, years) {
+            const index = years.indexOf(year);
+            if (index === -1 || index === years.length - 1) {
+                return [years[0], window.dash_clientside.no_update, window.dash_clientside.no_update];
+            }
+            const last = index + 1 === years.length - 1;
+            return [years[index + 1], last, last ? 'Play' : window.dash_clientside.no_update];
+        },
+    }
+});
@@ -0,0 +1,204 @@
+import os
+import random
+import threading
+import time
+from databricks import sql
+from connection_pool import ConnectionPool
+from indicators import INDICATORS
+
+# which backend execute_query reads from: "databricks", "duckdb" (local Parquet
+# replica) or "standin" (the local replica with injected warehouse latency)
+DATA_BACKEND = os.getenv("DATA_BACKEND", "databricks")
+DATA_SNAPSHOT_DIR = os.getenv("DATA_SNAPSHOT_DIR", "./data")
+STANDIN_LATENCY = float(os.getenv("STANDIN_LATENCY", 0.5))
+STANDIN_JITTER = float(os.getenv("STANDIN_JITTER", 0.2))
+
+SERVER_HOSTNAME = os.getenv("SERVER_HOSTNAME")
+HTTP_PATH = os.getenv("HTTP_PATH")
+ACCESS_TOKEN = os.getenv("ACCESS_TOKEN")
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 4))
+DB_POOL_IDLE_TIMEOUT = float(os.getenv("DB_POOL_IDLE_TIMEOUT", 300))
+DB_POOL_WAIT_TIMEOUT = float(os.getenv("DB_POOL_WAIT_TIMEOUT", 30))
+
+# tables the dashboard reads, these are the ones mirrored into local snapshots
+SNAPSHOT_TABLES = [
+    'boost.data_availability',
+    'indicator.gdp',
+    'indicator.country',
+    *(indicator['table'] for indicator in INDICATORS.values()),
+]
+
+
+class Backend:
+    """
+    Source of query results. fetch_arrow runs a SQL query and returns the
+    result as a pyarrow Table; the SQL may reference the fully qualified
+    warehouse tables (e.g. indicator.gdp) regardless of the backend.
+    """
+    name = None
+
+    def fetch_arrow(self, dbsql_query):
+        raise NotImplementedError
+
+    def stats(self):
+        return {'backend': self.name}
+
+
+class DatabricksBackend(Backend):
+    """
+    Reads from the Databricks SQL Warehouse through a pool of reusable
+    connections. If a borrowed session turns out to be broken the query is
+    retried once on a fresh connection.
+    """
+    name = 'databricks'
+
+    # errors after which a connection is assumed broken and must not be reused
+    CONNECTION_ERRORS = (sql.exc.OperationalError, sql.exc.InterfaceError)
+
+    def __init__(self, server_hostname=SERVER_HOSTNAME, http_path=HTTP_PATH, access_token=ACCESS_TOKEN):
+        self.server_hostname = server_hostname
+        self.http_path = http_path
+        self.access_token = access_token
+        self.pool = ConnectionPool(
+            self.connect,
+            max_size=DB_POOL_SIZE,
+            idle_timeout=DB_POOL_IDLE_TIMEOUT,
+            wait_timeout=DB_POOL_WAIT_TIMEOUT,
+        )
+
+    def connect(self):
+        return sql.connect(
+            server_hostname=self.server_hostname,
+            http_path=self.http_path,
+            access_token=self.access_token,
+        )
+
+    def fetch_arrow(self, dbsql_query):
+        try:
+            return self._fetch(dbsql_query)
+        except self.CONNECTION_ERRORS:
+            return self._fetch(dbsql_query)
+
+    def _fetch(self, dbsql_query):
+        with self.pool.connection(discard_on=self.CONNECTION_ERRORS) as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(dbsql_query)
+                return cursor.fetchall_arrow()
+            finally:
+                cursor.close()
+
+    def stats(self):
+        return dict(super().stats(), **self.pool.stats())
+
+
+class DuckDBBackend(Backend):
+    """
+    Reads from Parquet snapshots of the warehouse tables with an embedded
+    DuckDB engine. Each snapshot_dir/<schema>.<table>.parquet file is exposed
+    as the view <schema>.<table>, so the warehouse SQL runs unchanged.
+    Snapshots replaced by sync_snapshots are picked up by the next query, and
+    snapshots synced for the first time by the first query that reads them.
+    """
+    name = 'duckdb'
+
+    def __init__(self, snapshot_dir=DATA_SNAPSHOT_DIR):
+        import duckdb
+
+        self.snapshot_dir = snapshot_dir
+        self._conn = duckdb.connect(':memory:')
+        self._local = threading.local()
+        self._views_lock = threading.Lock()
+        self._views = set()
+        for table in SNAPSHOT_TABLES:
+            self._conn.execute(f'CREATE SCHEMA IF NOT EXISTS {table.split(".")[0]}')
+        self._create_views()
+
+    def _create_views(self):
+        """
+        Creates the views of the snapshots that exist and have none yet,
+        returns whether any was created
+        """
+        created = False
+        with self._views_lock:
+            for table in SNAPSHOT_TABLES:
+                path = snapshot_path(self.snapshot_dir, table)
+                if table not in self._views and os.path.exists(path):
+                    escaped = path.replace("'", "''")
+                    self._conn.execute(f"CREATE OR REPLACE VIEW {table} AS SELECT * FROM read_parquet('{escaped}')")
+                    self._views.add(table)
+                    created = True
+        return created
+
+    def fetch_arrow(self, dbsql_query):
+        import duckdb
+
+        # a DuckDB connection must not be shared between threads, cursors are per thread
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self._local.cursor = self._conn.cursor()
+        try:
+            return cursor.execute(dbsql_query).fetch_arrow_table()
+        except duckdb.CatalogException:
+            # the table may have been synced since the views were created
+            if not self._create_views():
+                raise
+            return cursor.execute(dbsql_query).fetch_arrow_table()
+
+
+class StandInBackend(DuckDBBackend):
+    """
+    Databricks stand-in for test and benchmark environments: answers from the
+    local replica after sleeping `latency` seconds plus up to `jitter` seconds,
+    to mimic the warehouse round trip
+    """
+    name = 'standin'
+
+    def __init__(self, snapshot_dir=DATA_SNAPSHOT_DIR, latency=STANDIN_LATENCY, jitter=STANDIN_JITTER):
+        super().__init__(snapshot_dir)
+        self.latency = latency
+        self.jitter = jitter
+
+    def fetch_arrow(self, dbsql_query):
+        time.sleep(self.latency + random.uniform(0, self.jitter))
+        return super().fetch_arrow(dbsql_query)
+
+
+BACKENDS = {
+    'databricks': DatabricksBackend,
+    'duckdb': DuckDBBackend,
+    'standin': StandInBackend,
+}
+
+
+def get_backend(name=DATA_BACKEND):
+    return BACKENDS[name]()
+
+
+def snapshot_path(snapshot_dir, table):
+    return os.path.join(snapshot_dir, f'{table}.parquet')
+
+
+def sync_snapshots(source, snapshot_dir=DATA_SNAPSHOT_DIR, tables=SNAPSHOT_TABLES):
+    """
+    Copies each table from the source backend into a Parquet snapshot. Files
+    are written next to the snapshot and renamed into place, so readers
+    never see a partially written file.
+
+    Returns
+    -------
+    rows : dict
+        table -> number of rows written
+    """
+    import pyarrow.parquet as pq
+
+    os.makedirs(snapshot_dir, exist_ok=True)
+    rows = {}
+    for table in tables:
+        table_data = source.fetch_arrow(f'SELECT * FROM {table}')
+        path = snapshot_path(snapshot_dir, table)
+        pq.write_table(table_data, f'{path}.tmp')
+        os.replace(f'{path}.tmp', path)
+        rows[table] = table_data.num_rows
+    return rows
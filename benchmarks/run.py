@@ -0,0 +1,200 @@
+"""
+Benchmarks for the query post-processing, figure construction and
+availability table paths, run against seeded synthetic data
+
+    python -m benchmarks.run                    # compare with benchmarks/baseline.json
+    python -m benchmarks.run --update-baseline  # record a new baseline
+
+Every benchmark reports its median wall time over --repeat runs and the peak
+Python heap allocation of one traced run (allocations made inside Arrow and
+DuckDB are not seen by tracemalloc). Some also report payload sizes. The run
+fails if any metric is more than --threshold above the baseline, or if there
+is no baseline to compare with. Baselines are machine specific and not
+committed.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+import duckdb
+import pyarrow as pa
+
+from benchmarks import synthetic
+from figure_encoding import serialize_figure
+from plot import make_plot
+from queries import build_base_frame, build_indicator_query, join_indicator
+from table_query import query_frame
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+VALUE_COLUMN = 'learning_poverty_rate'
+INDICATOR_TABLE = f'indicator.{VALUE_COLUMN}'
+MIN_COUNTRIES_PER_YEAR = 45
+
+
+def make_context(countries, years, availability_rows, seed):
+    gdp = synthetic.make_gdp(countries, years, seed)
+    country = synthetic.make_country(countries, seed)
+    indicator = synthetic.make_indicator(countries, years, VALUE_COLUMN, seed=seed)
+    availability = synthetic.make_availability(availability_rows, seed)
+
+    conn = duckdb.connect(':memory:')
+    conn.execute('CREATE SCHEMA indicator')
+    for name, df in [('indicator.gdp', gdp), ('indicator.country', country), (INDICATOR_TABLE, indicator)]:
+        conn.register('df', df)
+        conn.execute(f'CREATE TABLE {name} AS SELECT * FROM df')
+        conn.unregister('df')
+
+    context = {
+        'conn': conn,
+        'gdp': pa.Table.from_pandas(gdp, preserve_index=False),
+        'country': pa.Table.from_pandas(country, preserve_index=False),
+        'indicator': pa.Table.from_pandas(indicator, preserve_index=False),
+        'availability': availability,
+    }
+    context['base'] = base_frame(context)
+    context['dataset'] = join_indicator_arrow(context)
+    context['figure'] = build_figure(context)
+    return context
+
+
+def join_indicator_sql(context):
+    query = build_indicator_query(INDICATOR_TABLE, VALUE_COLUMN, min_countries_per_year=MIN_COUNTRIES_PER_YEAR)
+    return context['conn'].execute(query).fetch_arrow_table().to_pandas()
+
+
+def base_frame(context):
+    return build_base_frame(context['gdp'], context['country'])
+
+
+def join_indicator_arrow(context):
+    # the base frame is shared by every indicator, only the indicator join is paid per indicator
+    return join_indicator(
+        context['base'], context['indicator'],
+        VALUE_COLUMN, min_countries_per_year=MIN_COUNTRIES_PER_YEAR,
+    ).to_pandas(split_blocks=True, self_destruct=True)
+
+
+def build_figure(context):
+    return make_plot(context['dataset'], 'Learning Poverty Rate', 'Learning Poverty Rate', VALUE_COLUMN)
+
+
+def figure_json(context):
+    return serialize_figure(context['figure'], 'benchmark')
+
+
+def availability_page(context):
+    records, _, _ = query_frame(
+        context['availability'], '{boost_source} = BOOST && {latest_year} >= 2010',
+        [{'column_id': 'country_name', 'direction': 'desc'}], 0, 200)
+    return json.dumps(records)
+
+
+def availability_all_records(context):
+    # what the availability callback shipped before server-side paging
+    return json.dumps(context['availability'].to_dict('records'))
+
+
+# name -> (benchmark, whether its return value is a payload to report the size of)
+BENCHMARKS = {
+    'indicator_join_sql': (join_indicator_sql, False),
+    'indicator_base_frame': (base_frame, False),
+    'indicator_join_arrow': (join_indicator_arrow, False),
+    'make_plot': (build_figure, False),
+    'figure_json': (figure_json, True),
+    'availability_page': (availability_page, True),
+    'availability_all_records': (availability_all_records, True),
+}
+
+
+def measure(benchmark, context, repeat, payload):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = benchmark(context)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    benchmark(context)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    metrics = {
+        'seconds': statistics.median(timings),
+        'peak_mb': peak / 2 ** 20,
+    }
+    if payload:
+        metrics['size_bytes'] = len(result)
+    return metrics
+
+
+def find_regressions(results, baseline, threshold):
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(name, {}).get(metric)
+            if base and value > base * (1 + threshold):
+                regressions.append(f'{name}.{metric}: {value:.4g} vs baseline {base:.4g} (+{value / base - 1:.0%})')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--countries', type=int, default=200)
+    parser.add_argument('--years', type=int, default=30)
+    parser.add_argument('--availability-rows', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS.keys(), help='run only these benchmarks')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed relative increase of any metric over the baseline')
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--output', help='also write the results to this file')
+    args = parser.parse_args(argv)
+
+    params = {
+        'countries': args.countries,
+        'years': args.years,
+        'availability_rows': args.availability_rows,
+        'seed': args.seed,
+    }
+    context = make_context(args.countries, args.years, args.availability_rows, args.seed)
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        benchmark, payload = BENCHMARKS[name]
+        results[name] = measure(benchmark, context, args.repeat, payload)
+        print(name, ' '.join(f'{metric}={value:.4g}' for metric, value in results[name].items()))
+
+    report = {'params': params, 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Baseline written to {args.baseline}')
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f'No baseline at {args.baseline}, record one with --update-baseline')
+        return 2
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline['params'] != params:
+        print(f'Baseline was recorded with {baseline["params"]}, not comparable with {params}')
+        return 2
+
+    regressions = find_regressions(results, baseline['results'], args.threshold)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Import time profile of the app and startup time budget check
+
+    python -m benchmarks.startup                # report, fail if over the default budget
+    python -m benchmarks.startup --budget 0.8   # with a tighter budget
+
+Imports app in --repeat fresh interpreters with -X importtime and the
+background warm-up disabled. Reports the modules with the highest cumulative
+import time, and the self time summed per top level package, of the median
+run. The check fails if the median import of app takes longer than --budget
+seconds, or if any of the modules meant to load lazily was imported.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+from warm_up import HEAVY_MODULES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+# imported by the heavy modules, loading any of them at startup means one was pulled in eagerly
+LAZY_MODULES = HEAVY_MODULES + ['pandas', 'plotly.graph_objects']
+
+
+def profile_import(module='app'):
+    """
+    Returns {module: (self seconds, cumulative seconds)} for every module
+    imported by a fresh interpreter importing `module`
+    """
+    env = dict(os.environ, WARM_UP='0', PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'import {module} failed:\n{result.stderr}')
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules[name] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+    return modules
+
+
+def by_package(modules):
+    packages = {}
+    for name, (self_seconds, _) in modules.items():
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0) + self_seconds
+    return packages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--module', default='app')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--budget', type=float, default=float(os.getenv("STARTUP_BUDGET", 1.5)),
+                        help='seconds the import of --module may take')
+    args = parser.parse_args(argv)
+
+    runs = [profile_import(args.module) for _ in range(args.repeat)]
+    runs.sort(key=lambda modules: modules[args.module][1])
+    modules = runs[len(runs) // 2]
+    total = statistics.median(run[args.module][1] for run in runs)
+
+    print(f'{"cumulative ms":>14} {"self ms":>9}  module')
+    for name, (self_seconds, cumulative) in sorted(modules.items(), key=lambda m: -m[1][1])[:args.top]:
+        print(f'{cumulative * 1000:14.1f} {self_seconds * 1000:9.1f}  {name}')
+    print(f'\n{"self ms":>14}  package')
+    for package, seconds in sorted(by_package(modules).items(), key=lambda p: -p[1])[:args.top]:
+        print(f'{seconds * 1000:14.1f}  {package}')
+
+    failures = []
+    if total > args.budget:
+        failures.append(f'import {args.module} took {total:.3f}s, over the {args.budget:.3f}s budget')
+    failures += [f'{name} is imported at startup' for name in LAZY_MODULES if name in modules]
+    print(f'\nimport {args.module}: {total:.3f}s (budget {args.budget:.3f}s)')
+    for failure in failures:
+        print(f'FAIL {failure}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+INCOME_LEVELS = ['LIC', 'LMC', 'UMC', 'HIC', 'INX']
+
+
+def country_codes(countries):
+    return [f'C{i:04d}' for i in range(countries)]
+
+
+def make_country(countries, seed=0):
+    rng = np.random.default_rng(seed)
+    codes = country_codes(countries)
+    return pd.DataFrame({
+        'country_code': codes,
+        'country_name': [f'Country {code}' for code in codes],
+        'income_level': rng.choice(INCOME_LEVELS, countries, p=[0.2, 0.25, 0.25, 0.25, 0.05]),
+        'region': rng.choice(['AFR', 'EAP', 'ECA', 'LAC', 'MNA', 'SAR'], countries),
+    })
+
+
+def make_gdp(countries, years, seed=0, first_year=1990):
+    rng = np.random.default_rng(seed + 1)
+    codes = np.repeat(country_codes(countries), years)
+    year = np.tile(np.arange(first_year, first_year + years), countries)
+    gdp = rng.lognormal(mean=9, sigma=1, size=countries * years)
+    gdp[rng.random(gdp.size) < 0.03] = np.nan
+    return pd.DataFrame({'country_code': codes, 'year': year, 'gdp_per_capita_2017_ppp': gdp})
+
+
+def make_indicator(countries, years, value_column, coverage=0.6, scale=1.0, seed=0, first_year=1990):
+    """
+    Indicator table keyed on country_code and year, with data for roughly
+    `coverage` of the country-years and a value loosely decreasing with gdp
+    """
+    rng = np.random.default_rng(seed + 2)
+    gdp = make_gdp(countries, years, seed, first_year)
+    keep = rng.random(len(gdp)) < coverage
+    df = gdp[keep].reset_index(drop=True)
+    log_gdp = np.log(df['gdp_per_capita_2017_ppp'].fillna(8000))
+    value = 1 / (1 + np.exp(log_gdp - 9)) + rng.normal(0, 0.1, len(df))
+    df[value_column] = np.clip(value, 0, 1) * scale
+    df.loc[rng.random(len(df)) < 0.02, value_column] = np.nan
+    return df.drop(columns='gdp_per_capita_2017_ppp')
+
+
+def make_availability(rows, seed=0):
+    rng = np.random.default_rng(seed + 3)
+    earliest = rng.integers(1990, 2010, rows)
+    return pd.DataFrame({
+        'country_name': [f'Country {i:05d}' for i in range(rows)],
+        'boost_source': rng.choice(['BOOST', 'BOOST Subnational', 'WDI'], rows),
+        'data_source': rng.choice(['Treasury', 'Ministry of Finance', 'Budget Office'], rows),
+        'earliest_year': earliest,
+        'latest_year': earliest + rng.integers(5, 30, rows),
+        'admin_level': rng.choice(['central', 'regional', 'local'], rows),
+    })
@@ -0,0 +1,17 @@
+import os
+import diskcache
+
+CACHE_DIR = os.getenv("CACHE_DIR", "./cache")
+CACHE_SIZE_LIMIT = int(os.getenv("CACHE_SIZE_LIMIT", 2 ** 30))
+
+# shared by every worker process: long callback results and query results.
+# once size_limit is exceeded the least recently stored entries are evicted
+cache = diskcache.Cache(
+    CACHE_DIR,
+    size_limit=CACHE_SIZE_LIMIT,
+    eviction_policy="least-recently-stored",
+    tag_index=True,
+)
+# a SQLite connection must not be used on both sides of a fork, forked
+# processes (long callback workers) open their own
+os.register_at_fork(after_in_child=cache.close)
@@ -0,0 +1,196 @@
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of reusable database connections
+
+    Connections are handed out most-recently-used first so the warmest session
+    is reused, closed once they have been idle for longer than `idle_timeout`
+    seconds, and checked for liveness before reuse. At most `max_size`
+    connections are open at any time; callers beyond that wait up to
+    `wait_timeout` seconds for one to be returned.
+
+    Parameters
+    ----------
+    connect : callable
+        returns a new DB-API connection
+    max_size : int
+        maximum number of open connections (idle + in use)
+    idle_timeout : float
+        seconds after which an idle connection is closed instead of reused
+    wait_timeout : float
+        seconds to wait for a free connection before raising PoolTimeout
+    ping_after : float
+        idle seconds after which a connection is pinged with `SELECT 1` before reuse
+    """
+
+    def __init__(self, connect, max_size=4, idle_timeout=300, wait_timeout=30, ping_after=60):
+        self._connect = connect
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.wait_timeout = wait_timeout
+        self.ping_after = ping_after
+
+        self._idle = deque()  # (connection, last returned at)
+        self._size = 0
+        self._cond = threading.Condition()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'waits': 0,
+            'wait_seconds': 0.0,
+            'timeouts': 0,
+            'reconnects': 0,
+            'expired': 0,
+            'discarded': 0,
+        }
+        os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def acquire(self):
+        start = time.monotonic()
+        waited = False
+        conn = None
+        expired = []
+        try:
+            with self._cond:
+                while True:
+                    expired.extend(self._pop_expired())
+                    if self._idle:
+                        conn, last_used = self._idle.pop()
+                        self._stats['hits'] += 1
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        self._stats['misses'] += 1
+                        break
+                    remaining = self.wait_timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        self._stats['timeouts'] += 1
+                        raise PoolTimeout(f'No connection available after {self.wait_timeout}s (pool size {self.max_size})')
+                    waited = True
+                    self._cond.wait(remaining)
+                if waited:
+                    self._stats['waits'] += 1
+                    self._stats['wait_seconds'] += time.monotonic() - start
+        finally:
+            # close outside the lock, closing a session is a network round trip
+            for stale in expired:
+                self._close(stale)
+
+        if conn is not None and not self._is_alive(conn, last_used):
+            self._close(conn)
+            conn = None
+            with self._cond:
+                self._stats['reconnects'] += 1
+
+        if conn is None:
+            try:
+                conn = self._connect()
+            except Exception:
+                self._release_slot()
+                raise
+        return conn
+
+    def release(self, conn, discard=False):
+        if discard:
+            self._close(conn)
+            with self._cond:
+                self._stats['discarded'] += 1
+            self._release_slot()
+            return
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, discard_on=(Exception,)):
+        """
+        Borrows a connection for the duration of the block. The connection is
+        discarded rather than returned to the pool if the block raises one of
+        `discard_on`.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        except discard_on:
+            self.release(conn, discard=True)
+            raise
+        except BaseException:
+            self.release(conn)
+            raise
+        else:
+            self.release(conn)
+
+    def close_all(self):
+        with self._cond:
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._close(conn)
+
+    def stats(self):
+        with self._cond:
+            stats = dict(self._stats)
+            stats['size'] = self._size
+            stats['idle'] = len(self._idle)
+            stats['in_use'] = self._size - len(self._idle)
+            stats['max_size'] = self.max_size
+        requests = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / requests if requests else 0.0
+        return stats
+
+    def _reset_after_fork(self):
+        # the connections' sessions belong to the parent, a forked process opens
+        # its own. The inherited ones stay referenced so they are never closed
+        # (or collected, which closes them) from here
+        self._inherited = [conn for conn, _ in self._idle]
+        self._idle = deque()
+        self._size = 0
+        self._cond = threading.Condition()
+
+    def _pop_expired(self):
+        # must be called with self._cond held; the oldest idle connections are at the left
+        now = time.monotonic()
+        expired = []
+        while self._idle and now - self._idle[0][1] > self.idle_timeout:
+            expired.append(self._idle.popleft()[0])
+        self._size -= len(expired)
+        self._stats['expired'] += len(expired)
+        return expired
+
+    def _is_alive(self, conn, last_used):
+        if not getattr(conn, 'open', True):
+            return False
+        if time.monotonic() - last_used < self.ping_after:
+            return True
+        try:
+            cursor = conn.cursor()
+            cursor.execute('SELECT 1')
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _release_slot(self):
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
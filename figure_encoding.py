@@ -0,0 +1,155 @@
+import base64
+import json
+import logging
+import time
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# dtypes plotly.js (>= 2.28) can decode from a base64 typed array spec. int64
+# is not among them, so it is narrowed to int32 when the values fit
+TYPED_ARRAY_DTYPES = {
+    'float64': 'f8', 'float32': 'f4',
+    'int32': 'i4', 'int16': 'i2', 'int8': 'i1',
+    'uint32': 'u4', 'uint16': 'u2', 'uint8': 'u1',
+}
+INT32_RANGE = (np.iinfo(np.int32).min, np.iinfo(np.int32).max)
+# attributes that accept a single value in place of an array of identical ones
+SCALAR_ATTRIBUTES = {'textposition', 'align'}
+# trace types whose arrays are nested per column, which plotly.js does not decode
+UNENCODED_TRACE_TYPES = {'table'}
+# plotly.js renders a table cell as HTML only if its value has one of these
+MARKUP_CHARACTERS = '<&>'
+
+_hooks = []
+
+
+def add_serialization_hook(hook):
+    """
+    Registers `hook(name, size_bytes, seconds)` to be called after every figure serialization
+    """
+    _hooks.append(hook)
+    return hook
+
+
+def log_serialization(name, size_bytes, seconds):
+    logger.info('Serialized figure %s: %d bytes in %.1f ms', name, size_bytes, seconds * 1000)
+
+
+add_serialization_hook(log_serialization)
+
+
+def encode_typed_array(values):
+    if values.dtype == np.bool_:
+        values = values.astype(np.uint8)
+    elif values.dtype == np.int64 or values.dtype == np.uint64:
+        fits = values.size == 0 or (values.min() >= INT32_RANGE[0] and values.max() <= INT32_RANGE[1])
+        values = values.astype(np.int32 if fits else np.float64)
+    dtype = TYPED_ARRAY_DTYPES.get(values.dtype.name)
+    if dtype is None:
+        return values.tolist()
+    spec = {
+        'dtype': dtype,
+        'bdata': base64.b64encode(np.ascontiguousarray(values).astype(values.dtype.newbyteorder('<')).tobytes()).decode('ascii'),
+    }
+    if values.ndim > 1:
+        spec['shape'] = ','.join(str(n) for n in values.shape)
+    return spec
+
+
+def encode_value(value, attribute=None, typed=True):
+    if isinstance(value, dict):
+        if 'bdata' in value and 'dtype' in value:
+            return value
+        return {k: encode_value(v, k, typed) for k, v in value.items()}
+    if isinstance(value, (list, tuple)) and attribute in SCALAR_ATTRIBUTES and len(value) > 0 and all(v == value[0] for v in value):
+        return value[0]
+    if isinstance(value, (list, tuple)):
+        return [encode_value(v, None, typed) for v in value]
+    if isinstance(value, np.ndarray):
+        if typed and value.dtype.kind in 'biuf':
+            return encode_typed_array(value)
+        values = value.tolist()
+        if attribute in SCALAR_ATTRIBUTES and len(values) > 0 and all(v == values[0] for v in values):
+            return values[0]
+        return values
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def share_table_columns(trace):
+    """
+    Sends each table column holding the same string in every row once, as
+    that column's cells.prefix. The cells keep only the string from its last
+    markup character on, e.g. `>` of a link, which plotly.js needs in the
+    value to render the cell as HTML. Columns with differing values are sent
+    as they are, plotly.js tables cannot refer to shared strings.
+    """
+    cells = trace.get('cells')
+    if not cells or 'prefix' in cells or 'format' in cells:
+        return trace
+    columns = list(cells.get('values') or [])
+    prefix = [None] * len(columns)
+    for i, column in enumerate(columns):
+        if not isinstance(column, list) or len(column) < 2 or not isinstance(column[0], str):
+            continue
+        if any(value != column[0] for value in column):
+            continue
+        split = max(column[0].rfind(c) for c in MARKUP_CHARACTERS)
+        split = len(column[0]) if split < 0 else split
+        prefix[i] = column[0][:split]
+        columns[i] = [column[0][split:]] * len(column)
+    if not any(prefix):
+        return trace
+    return dict(trace, cells=dict(cells, values=columns, prefix=prefix))
+
+
+def encode_trace(trace):
+    if trace.get('type') == 'table':
+        return share_table_columns(encode_value(trace, typed=False))
+    return encode_value(trace, typed=trace.get('type') not in UNENCODED_TRACE_TYPES)
+
+
+def encode_traces(traces):
+    return [encode_trace(trace) for trace in traces]
+
+
+def encode_figure(fig_dict):
+    """
+    Converts the arrays of a plotly figure dict into their compact form:
+    numeric arrays become base64 typed array specs, arrays of identical values
+    for attributes that accept a scalar collapse to that scalar, and table
+    columns of one repeated string are sent once
+    """
+    encoded = {k: v for k, v in fig_dict.items() if k not in ('data', 'frames')}
+    encoded['data'] = encode_traces(fig_dict.get('data', []))
+    if 'layout' in fig_dict:
+        encoded['layout'] = encode_value(fig_dict['layout'], typed=False)
+    if 'frames' in fig_dict:
+        encoded['frames'] = [
+            dict(frame, data=encode_traces(frame.get('data', [])))
+            for frame in fig_dict['frames']
+        ]
+    return encoded
+
+
+def serialize_figure(fig, name=None):
+    """
+    Serializes a plotly figure to compact JSON with typed array encoding,
+    reporting the size and time taken to every registered serialization hook
+    """
+    start = time.perf_counter()
+    fig_json = json.dumps(encode_figure(fig.to_plotly_json()), separators=(',', ':'), default=_default)
+    seconds = time.perf_counter() - start
+    for hook in _hooks:
+        hook(name, len(fig_json), seconds)
+    return fig_json
+
+
+def _default(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
@@ -0,0 +1,199 @@
+import json
+import logging
+import os
+import threading
+import diskcache
+from caching import cache
+from figure_encoding import serialize_figure
+from metrics import timed
+from functools import partial
+from indicators import INDICATORS, query_spec
+from queries import get_indicator_data_version
+
+logger = logging.getLogger(__name__)
+
+FIGURE_CACHE_TTL = int(os.getenv("FIGURE_CACHE_TTL", 7 * 24 * 60 * 60))
+FIGURE_BUILD_LOCK_TIMEOUT = 10 * 60
+PREWARM_FIGURES = os.getenv("PREWARM_FIGURES", "0") == "1"
+# send only the latest year with the figure and load the other years' frames on demand
+LAZY_FRAMES = os.getenv("LAZY_FRAMES", "1") == "1"
+# where the browser keeps the thematic tabs it has rendered, to switch back to
+# them without asking the server again: "memory" (until the page is reloaded),
+# "session" (sessionStorage of the browser tab) or "none"
+THEMATIC_CLIENT_CACHE = os.getenv("THEMATIC_CLIENT_CACHE", "memory")
+# seconds between checks of the data versions of the tabs the browser holds
+THEMATIC_VERSION_POLL = int(os.getenv("THEMATIC_VERSION_POLL", 5 * 60))
+
+
+def _make_indicator_plot(name):
+    from plot import make_indicator_plot
+    return make_indicator_plot(name)
+
+
+# name -> (returns the version of the data the figure is built from, builds the figure)
+THEMATIC_FIGURES = {
+    name: (partial(get_indicator_data_version, **query_spec(name)), partial(_make_indicator_plot, name))
+    for name in INDICATORS
+}
+
+
+def figure_cache_key(name, version):
+    return f'figure:{name}:{version}'
+
+
+def get_figure_version(name, cached_only=False):
+    """
+    The version of the data the figure `name` is built from, the figure only
+    changes with it. With cached_only it is None unless that data is cached,
+    rather than fetched.
+    """
+    data_version, _ = THEMATIC_FIGURES[name]
+    return data_version(cached_only=True) if cached_only else data_version()
+
+
+def get_figure(name):
+    """
+    Returns the serialized figure for the registered thematic figure `name`,
+    building and storing it only if the underlying data version has not been
+    seen before. Concurrent requests for a missing figure wait for a single build.
+
+    Returns
+    -------
+    figure : dict
+        plotly figure dict with every year's animation frame, ready to pass to dcc.Graph
+    """
+    return json.loads(get_figure_json(name))
+
+
+def get_figure_json(name):
+    key = ensure_built(name)
+    return cache.get(key)
+
+
+def get_lazy_figure(name):
+    """
+    Returns the figure for `name` with only the latest year's traces, without
+    animation frames, slider or play buttons, and the list of years that can
+    be loaded with get_frames. The year shown is kept in layout.meta.year.
+    """
+    key = ensure_built(name)
+    lazy_json = cache.get(f'{key}:lazy')
+    if lazy_json is None:
+        lazy_json, _ = _split_stored(name, key)
+    lazy = json.loads(lazy_json)
+    return lazy['figure'], lazy['years']
+
+
+def get_frames(name, years):
+    """
+    Returns the traces for the given years of the figure `name`, keyed by
+    the year as a string. Each year's traces fully replace the figure's data.
+    Years the figure has no frame for are left out.
+    """
+    key = ensure_built(name)
+    frame_jsons = {str(year): cache.get(f'{key}:frame:{year}') for year in years}
+    missing = {year for year, frame_json in frame_jsons.items() if frame_json is None}
+    if missing:
+        # only split the stored figure again for frames it actually has
+        lazy_json = cache.get(f'{key}:lazy')
+        stored_years = None if lazy_json is None else {str(year) for year in json.loads(lazy_json)['years']}
+        if stored_years is None or missing & stored_years:
+            _, stored_frames = _split_stored(name, key)
+            frame_jsons.update({year: stored_frames.get(year) for year in missing})
+    return {
+        year: json.loads(frame_json)
+        for year, frame_json in frame_jsons.items()
+        if frame_json is not None
+    }
+
+
+def ensure_built(name):
+    """
+    Builds and stores the figure `name` for the current version of its data
+    unless that is already stored, returns its cache key
+    """
+    data_version, _ = THEMATIC_FIGURES[name]
+    key = figure_cache_key(name, data_version())
+    if key not in cache:
+        _build(name, key)
+    return key
+
+
+def _build(name, key):
+    """
+    Builds and stores the figure `name` as `key` unless another process just
+    did, returns its JSON
+    """
+    _, build = THEMATIC_FIGURES[name]
+    with diskcache.Lock(cache, f'{key}:lock', expire=FIGURE_BUILD_LOCK_TIMEOUT):
+        fig_json = cache.get(key)
+        if fig_json is None:
+            with timed('figure_build_seconds', figure=name):
+                fig_json = serialize_figure(build(), name)
+            _store(key, fig_json)
+    return fig_json
+
+
+def _split_stored(name, key):
+    """
+    Splits the lazy figure and the frames out of the stored figure again,
+    for when they were evicted or expired on their own, or the figure was
+    stored without them. Builds the figure if it is gone as well.
+    """
+    fig_json = cache.get(key)
+    if fig_json is None:
+        fig_json = _build(name, key)
+    return _store(key, fig_json)
+
+
+def _store(key, fig_json):
+    """
+    Stores the figure, its lazy figure and each of its frames, returns the
+    JSON of the lazy figure and the frames' JSON keyed by year
+    """
+    fig = json.loads(fig_json)
+    frames = fig.pop('frames', [])
+    fig['layout'].pop('sliders', None)
+    fig['layout'].pop('updatemenus', None)
+    years = [int(frame['name']) for frame in frames]
+    if years:
+        fig['layout']['meta'] = {'year': years[-1]}
+
+    frame_jsons = {}
+    for frame in frames:
+        # frames only carry what changes between years, fill in the subplot
+        # placement so the traces can replace the figure's data wholesale
+        for base_trace, trace in zip(fig['data'], frame['data']):
+            for attr in ('xaxis', 'yaxis', 'domain'):
+                if attr in base_trace:
+                    trace.setdefault(attr, base_trace[attr])
+        year = str(frame['name'])
+        frame_jsons[year] = json.dumps(frame['data'])
+        cache.set(f'{key}:frame:{year}', frame_jsons[year], expire=FIGURE_CACHE_TTL, tag='figure')
+    lazy_json = json.dumps({'figure': fig, 'years': years})
+    cache.set(f'{key}:lazy', lazy_json, expire=FIGURE_CACHE_TTL, tag='figure')
+    # written last, its presence means the whole figure is stored
+    cache.set(key, fig_json, expire=FIGURE_CACHE_TTL, tag='figure')
+    return lazy_json, frame_jsons
+
+
+def invalidate_figures():
+    return cache.evict('figure')
+
+
+def prewarm_figures():
+    for name in THEMATIC_FIGURES:
+        try:
+            ensure_built(name)
+        except Exception:
+            logger.exception('Failed to pre-warm figure %s', name)
+
+
+def start_prewarm():
+    """
+    Builds every registered thematic figure in a background thread so the
+    first request after a deploy finds them in the cache
+    """
+    thread = threading.Thread(target=prewarm_figures, name='figure-prewarm', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,23 @@
+import multiprocessing
+import os
+
+# the app defers its background threads to post_fork, threads do not survive a fork
+os.environ["PREFORK_SERVER"] = "1"
+
+bind = f'0.0.0.0:{os.getenv("PORT", 8050)}'
+# loads wsgi, and so the datasets, once in the master process. The workers are
+# forked from it and share those pages until they write to them, and the
+# dataset files are memory-mapped so refreshed data is shared through the page
+# cache as well
+preload_app = True
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+threads = int(os.getenv("WEB_THREADS", 4))
+worker_class = "gthread"
+# warehouse queries may take up to QUERY_TIMEOUT
+timeout = int(os.getenv("WEB_TIMEOUT", 120))
+
+
+def post_fork(server, worker):
+    from app import start_background_tasks
+
+    start_background_tasks()
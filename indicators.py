@@ -0,0 +1,41 @@
+# thematic indicators, one tab each on the thematic page in this order. Each is
+# plotted against gdp per capita by income level:
+#   table, value_column     where the indicator is read from
+#   scale                   values are divided by it to bring them to [0, 1]
+#   min_countries_per_year  years with data for fewer countries are dropped,
+#                           they are not comparable with the others
+#   label                   tab label
+#   axis_title              y axis title of the scatter plot
+#   table_header            header of the indicator column in the outlier table
+INDICATORS = {
+    'education': dict(
+        table='indicator.learning_poverty_rate',
+        value_column='learning_poverty_rate',
+        min_countries_per_year=45,
+        label='Education',
+        axis_title='Learning Poverty Rate',
+        table_header='Learning Poverty Rate',
+    ),
+    'health': dict(
+        table='indicator.universal_health_coverage_index_gho',
+        value_column='universal_health_coverage_index',
+        scale=100,
+        label='Health',
+        axis_title='Universal Health Coverage',
+        table_header='Universal Health Coverage Index',
+    ),
+}
+
+QUERY_FIELDS = ('table', 'value_column', 'scale', 'min_countries_per_year')
+
+
+def query_spec(name):
+    """
+    The arguments of queries.get_indicator_data for the indicator `name`
+    """
+    indicator = INDICATORS[name]
+    return {field: indicator.get(field) for field in QUERY_FIELDS}
+
+
+def tab_id(name):
+    return f'tab-{name}'
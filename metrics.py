@@ -0,0 +1,223 @@
+import bisect
+import contextvars
+import json
+import logging
+import os
+import time
+import uuid
+from contextlib import contextmanager
+import diskcache
+import flask
+from dash.exceptions import PreventUpdate
+from dash.long_callback import DiskcacheLongCallbackManager
+from caching import CACHE_DIR
+
+METRICS_DIR = os.getenv("METRICS_DIR", os.path.join(CACHE_DIR, "metrics"))
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+BYTES_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7, 1e8)
+ROWS_BUCKETS = (10, 100, 1e3, 1e4, 1e5, 1e6)
+
+# name -> (type, help, histogram buckets)
+METRICS = {
+    'dash_callback_duration_seconds': ('histogram', 'Time to answer a Dash callback request', DURATION_BUCKETS),
+    'dash_callback_response_bytes': ('histogram', 'Uncompressed size of Dash callback responses', BYTES_BUCKETS),
+    'dash_callback_errors_total': ('counter', 'Dash callback requests that failed', None),
+    'long_callback_queue_seconds': ('histogram', 'Time a long callback job waited before starting', DURATION_BUCKETS),
+    'long_callback_duration_seconds': ('histogram', 'Time a long callback job ran for', DURATION_BUCKETS),
+    'long_callback_errors_total': ('counter', 'Long callback jobs that raised', None),
+    'query_duration_seconds': ('histogram', 'Time spent waiting on the data backend per query', DURATION_BUCKETS),
+    'query_rows': ('histogram', 'Rows returned per query', ROWS_BUCKETS),
+    'query_errors_total': ('counter', 'Queries that failed', None),
+    'figure_build_seconds': ('histogram', 'Time to build and serialize a thematic figure', DURATION_BUCKETS),
+}
+# sums are kept as integers in millionths, diskcache can only increment integers
+SUM_SCALE = 10 ** 6
+
+logger = logging.getLogger('minidash.requests')
+request_id = contextvars.ContextVar('request_id', default=None)
+
+# kept apart from the main cache so metrics are never evicted and are shared
+# by every worker and long callback process
+store = diskcache.Cache(METRICS_DIR, eviction_policy='none')
+os.register_at_fork(after_in_child=store.close)
+
+
+def _labels_key(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def inc(name, amount=1, **labels):
+    store.incr((name, _labels_key(labels), 'total'), amount)
+
+
+def observe(name, value, **labels):
+    buckets = METRICS[name][2]
+    labels = _labels_key(labels)
+    # non-cumulative bucket counts, accumulated when rendered
+    store.incr((name, labels, bisect.bisect_left(buckets, value)))
+    store.incr((name, labels, 'count'))
+    store.incr((name, labels, 'sum'), int(round(value * SUM_SCALE)))
+
+
+@contextmanager
+def timed(name, errors=None, **labels):
+    """
+    Observes the duration of the block in the histogram `name`, and counts it
+    in the counter `errors` if the block raises
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        if errors:
+            inc(errors, **labels)
+        raise
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (
+        (k, v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for k, v in pairs
+    )
+    return '{' + ','.join(f'{k}="{v}"' for k, v in escaped) + '}'
+
+
+def render_prometheus(gauges=None):
+    """
+    Renders every recorded metric, plus the given gauges of this process
+    (name -> value), in the Prometheus text exposition format
+    """
+    series = {}
+    for key in store.iterkeys():
+        name, labels, suffix = key
+        series.setdefault(name, {}).setdefault(labels, {})[suffix] = store.get(key, 0)
+
+    lines = []
+    for name, (metric_type, help_text, buckets) in METRICS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {metric_type}')
+        for labels, values in sorted(series.get(name, {}).items()):
+            if metric_type == 'counter':
+                lines.append(f'{name}{_format_labels(labels)} {values.get("total", 0)}')
+                continue
+            cumulative = 0
+            for i, bound in enumerate(buckets):
+                cumulative += values.get(i, 0)
+                lines.append(f'{name}_bucket{_format_labels(labels, [("le", f"{bound:g}")])} {cumulative}')
+            lines.append(f'{name}_bucket{_format_labels(labels, [("le", "+Inf")])} {values.get("count", 0)}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {values.get("sum", 0) / SUM_SCALE}')
+            lines.append(f'{name}_count{_format_labels(labels)} {values.get("count", 0)}')
+
+    for name, value in (gauges or {}).items():
+        lines.append(f'# TYPE {name} gauge')
+        lines.append(f'{name} {value}')
+    return '\n'.join(lines) + '\n'
+
+
+def _callback_label(callback_map):
+    # only registered outputs, labels taken from any request body would let
+    # clients create series that are never evicted
+    body = flask.request.get_json(silent=True) or {}
+    output = body.get('output')
+    return output if isinstance(output, str) and output in callback_map else 'unknown'
+
+
+def init_app(app, gauges=None):
+    """
+    Instruments every callback request handled by the Dash app's server:
+    timing, response size and error metrics labeled by callback output, a
+    request ID (taken from X-Request-ID or generated) returned in the
+    response headers, and one structured log line per request. Serves the
+    metrics at /metrics, with gauges() adding per-process values.
+    """
+    server = app.server
+
+    @server.before_request
+    def start_request():
+        flask.g.request_start = time.perf_counter()
+        flask.g.request_id = flask.request.headers.get('X-Request-ID') or uuid.uuid4().hex
+        flask.g.request_id_token = request_id.set(flask.g.request_id)
+
+    @server.after_request
+    def finish_request(response):
+        duration = time.perf_counter() - flask.g.get('request_start', time.perf_counter())
+        response.headers['X-Request-ID'] = flask.g.get('request_id', '')
+        log = {
+            'request_id': flask.g.get('request_id'),
+            'method': flask.request.method,
+            'path': flask.request.path,
+            'status': response.status_code,
+            'duration_ms': round(duration * 1000, 1),
+        }
+        if flask.request.path.endswith('/_dash-update-component'):
+            callback = _callback_label(app.callback_map)
+            size = 0 if response.direct_passthrough else len(response.get_data())
+            observe('dash_callback_duration_seconds', duration, callback=callback)
+            observe('dash_callback_response_bytes', size, callback=callback)
+            if response.status_code >= 500:
+                inc('dash_callback_errors_total', callback=callback)
+            log.update(callback=callback, bytes=size)
+        logger.info(json.dumps(log))
+        return response
+
+    @server.teardown_request
+    def reset_request_id(exc):
+        token = flask.g.pop('request_id_token', None)
+        if token is not None:
+            request_id.reset(token)
+
+    @server.route('/metrics')
+    def metrics():
+        body = render_prometheus(gauges() if gauges else None)
+        return flask.Response(body, mimetype='text/plain; version=0.0.4')
+
+
+def instrument_job(fn):
+    """
+    Wraps a long callback function to record how long it ran and whether it
+    raised, labeled by the function name
+    """
+    callback = fn.__name__
+
+    def instrumented(*fn_args, **fn_kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*fn_args, **fn_kwargs)
+        except PreventUpdate:
+            raise
+        except Exception:
+            inc('long_callback_errors_total', callback=callback)
+            raise
+        finally:
+            observe('long_callback_duration_seconds', time.perf_counter() - start, callback=callback)
+
+    instrumented.__name__ = callback
+    return instrumented
+
+
+class InstrumentedDiskcacheManager(DiskcacheLongCallbackManager):
+    """
+    Long callback manager recording how long each job waited for its process
+    to start, how long it ran and whether it raised, labeled by callback name
+    """
+
+    def make_job_fn(self, fn, progress, *args, **kwargs):
+        job_fn = super().make_job_fn(instrument_job(fn), progress, *args, **kwargs)
+        job_fn.callback_name = fn.__name__
+        return job_fn
+
+    def call_job_fn(self, key, job_fn, args, context):
+        submitted = time.time()
+        callback = getattr(job_fn, 'callback_name', 'unknown')
+
+        def queued_job_fn(*job_args):
+            observe('long_callback_queue_seconds', time.time() - submitted, callback=callback)
+            return job_fn(*job_args)
+
+        return super().call_job_fn(key, queued_job_fn, args, context)
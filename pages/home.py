@@ -1,6 +1,7 @@
 import dash
 from dash import html
 import dash_bootstrap_components as dbc
+from static_assets import asset_url
 
 dash.register_page(__name__, path='/')
 
@@ -26,7 +27,7 @@ layout = html.Div(children=[
             html.Img(
                 width="90%",
                 style={'marginBottom': '1em'},
-                src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAABkAAAAPTCAYAAADoxsXtAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAGoMAABqDAbDwXnwAAP+lSURBVHhe7P0HYBzZdaYNn6rOuZEDc04zHE6OmqxRGOUsy0EOa8lae+3196+9u95dp+9br+Palu21JUsj2WtJ1ihYOY9G0uQ8Qw5zDiCInDtX//c9VQU0QIAESQAkyPchL7py3XvrVgF93jrnWO94aHtVCCFkHqlallSrtpmyxdKfFfOzbIojdjUgVQlIySyzAiJh80QKVi0pVipil4fkwa1L5N5NbZINW2JVHRzNFEIIIYQQQgghhBBCCJkZx3HUIkkIIfOKVTVFp8xEFUVnDJaZdNfYlvk06yqOI5WKIwHbkpApyURMotGw2RTbUfwghBBCCCGEEEIIIYTMDgoghJAFxZU8IGS4U44lWsQyjyMsrmJZVYKmZONRachEJRjAcoofhBBCCCGEEEIIIYSQ2UMBhBCyAEC8cMSyTEGoKzPtYps1AXE87w/LFITLsu2AWJWitNWnJZuMieNUxFEBBEoJIYQQQgghhBBCCCGEnB0KIISQBUGdPCByQAjRHCDwAAmq+OH7dlgqiGDebFPKy7LGtKTjEbEqrjjiCimEEEIIIYQQQgghhBBydiiAEEIWEFcAUW8Qf85MqAeIeRwFTFH5o1KWeFCkvS4kiZCl0bHEpvhBCCGEEEIIIYQQQgiZPRRACCELRNX175jIiG6A3IGlvm8H1puV1bLUp6OSiYYkbGaxCyGEEEIIIYQQQgghhJwLFEAIIQvCuOZxJhwR5DsPSFla6hKSDofFqjhSdcwKiiCEEEIIIYQQQgghhJBzgAIIIeSicLqe4eYCscWRgFOSlvq0ZBJhcYoFCZgnlW3PSkIhhBBCCCGEEEIIIYQQhQIIIWTBgMCB7B8Ie6Xhrrw5YEHgQPirSknzf9QlQhINiISD5ofjeYEQQgghhBBCCCGEEELILKEAQghZUHzZQ3WPalXsqqNeH5hGfpBAtSQtmaQ0pqNiWxVTkAPEbOzqJIQQQgghhBBCCCGEEDIrKIAQQhYE1Tsgfli2lqplHkBWWQUQJDl31MPDkkC1LMua6iSbSEilUpFKuaSJ0TU5OiGEEEIIIYQQQgghhMwSCiCEkAUDIogjAVOC7gKpmIeQKdWqiiNVrK2Wpb0+KYloQGzLUhHENusogBBCCCGEEEIIIYQQQs4FCiCEkAUBHh+O5eb/qErA8wCpSKCKYqZtSyrmXyIakbpUUMK22SoQMMvN9giBRQghhBBCCCGEEEIIIecABRBCyIIB+cMVQFAAfvrF/HQq0lyXlkw8arYVqTiOWCqAmHUUQQghhBBCCCGEEEIIIecABRBCyIJgIdl51Q10hZ8iQS8Ulu1KItWKWJWihr/KRsISqFSkWi5L1THbWnhUYR9CCCGEEEIIIYQQQgiZHRRACCELQFUCVeT3qEhAKipl+LlAkBAdcyHLkahTltZ0WOrCZvtyQcJmQ83/Ybbl44oQQgghhBBCCCGEEHIu0KJICFkwIHzAA8QSx5vzhY2q2E5JWrMpySZiYldLZm3FLDdbIW8In1SEEEIIIYQQQgghhJBzhGZFQsiCUNUE6JA6dE5DYiG5x/iyclHam7JSl06qPKICiZf2w9L8H94MIYQQQgghhBBCCCGEzAIKIISQBUGzf4zn8nBzgeDTzQdiie0UpSUblXQCXiEIe4Xk5xBJ4AkCScSVRQghhBBCCCGEEEIIIWQ2UAAhhCwAfuArpDv353wRBGKHSCIo0pCwJGI+q2Y7x/MYkaqj3iIWHUAIIYQQQgghhBBCCCHnAAUQQsgCYakHCMQNF8cTQEypOtKYSUh9IiIBFTos89/S/B/unOsnQgghhBBCCCGEEEIIIbOFAgghZEFADhB4gHhznqjheYE4ZWmtT0t9MqZiSNVyt7dteIdAEWH4K0IIIYQQQgghhBBCyLlBAYQQMu+4EoYrZQDXscPMaWirigSlLC2ZmGQiAbGdiruDt7HrBTKxLyGEEEIIIYQQQgghhMwGCiCEkAVDk5qLFwQL+kfVTDslSYVtacxEJRo089jGLEepVitStfxE6YQQQgghhBBCCCGEEDJ7KIAQQhYEOHLAj0NFEBVCzAPIsiVQKUlLJi6ZeEzsqhcSqwbM6VJqIIQQQgghhBBCCCGEkHOAAgghZEHQQFYqYlTFcdw8H7YpQacgS+oTUof8H47r6wEvEBsZQ1T9sDUfCCGEEEIIIYQQQgghhJwLFEAIIfMO5AsL3h1VNxOIn+Qcwa3CliPN6bAko9jKDX+FdOmuJwgKvD9sM0URhBBCCCGEEEIIIYQQMnsogBBCFgZP/NBQWOrRETCLLEnHw1IfD0oIoogX50q3UxHE9RSBP4ibOcRdTwghhBBCCCGEEEIIIWeDAgghZEGoel4dkDDw0y1Vaa7PSH0yITacP7BWNzBTprj7qV+Ih7uMEEIIIYQQQgghhBBCzgYFEELI/GNVVdRQcQMyR9Uxs+5nc11a6hJRs9gs84QR3cUTO9yfWOYuJ4QQQgghhBBCCCGEkNlAAYQQMv8gjhVyfnieHbZTkWClKPGAI42piCRCZnW1YjaE7BE0m5siAU2CHhDHlLJZM+EHQgghhBBCCCGEEEIIIWeDAgghZIGwNQgWPEFClilOQRpiAWlMhCViVSRQrQjyfEDucCSon7qXWY51FEAIIYQQQgghhBBCCCHnAgUQQsi8AweQqmWLbcO7w9JE6AGnJI2puGSTcfX7QIArpDpHtCwfLMVyPxwWIYQQQgghhBBCCCGEzBYKIISQ+Qf6hSnVKsJg2eKYaYS8asxEJZWIiONYKnzYVcc8lODt4YofDsJmqSxCCCGEEEIIIYQQQggh5wYFEELIvANBA2gOECsgiGYVC9nSlAlKNIzgVhA5qhruCgUbqNeIWa5hs8aPQAghhBBCCCGEEEIIIbODAgghZOGAAGK7YkdDOiGNqYRm+oCHh6XeH0h2DgEE+UDE9QBRLxAKIIQQQgghhBBCCCGEkHPDesdD2xldZo6AiTYctCViStC2JBwwxUybD7EsS5yq29U2EiC4Jl/vE9ROT2XquoljAazFj3KlKiVTciVHihVHCmVHQw0RcimgIa3MuA1Y5v4oj8ltq+rkddtWSHPc3COVooSrRbPOjFmxpWK2cUwBKn9wHBNCCCGEEEIIIYQQQs4Bx3GqFEAuAIgaEDpCAVPMZyxkyYr6mCzLRKQuHpIl5rM5GZJoyDXkQrOAWKH6xwWCY/kXzj/ecL4sPaMlOdCbk+MDRTk2kJf+XNlc6KqUzQ6lsilURMhFQ0e/GbsViVbG5C3XLZN7t7RJqFKRgFORSLUgQSlLBX4gdtAVQcy0JkZHICwOXUIIIYQQQgghhBBCyCyhAHKOQGiA0BEM2BI005loUJbXRWVdU0zWNcYkGwuqKILcBuPCiNl2ocDb9fACKZiSLztSMZ/wBOkeKcnRgbzsOjUmh/ryugyeIti2AiWFkAXAsmxXAqkUpSEi8rYbl8mtq7JiBqMuDzt5CVYLUpGgVOyglK2gCiCQ+pAY3eZQJYQQQgghhBBCCCGEzBIKILMEwgfCVqUiAbmqNSGbTYGXRyQIsSMg6WhARY8AchtUqyqC+GC+ljOtA7XrwZm2qV2HZbXnrp0ulR0ZK1VkuOCGxuocLqoYsvvUqHQMFc2yqm7PgUDmEwgg5qkjdiknG1tT8qbrV8jGhqBYDnJ+WBKuQAApqeeHK4CEVABBCCxNhT7NvUAIIYQQQgghhBBCCCHTQQFkFmRjAdnYnJD1TXENadUQD0pTMiSJMLw9vI08akUH4AsUE6KESMWpStXMYomfG8QHWxdKFcmVXUEiGQlIuMaDxD/euVJ7DlAsV6R7tCy9oyXpz5XkxEBBXuoYkcP9Ba0fIfODJXa1IsHCoNy8oV3edMMqaQmVVBTB4A85RQl5IbAqlucBYiEElmP2rIiFG4cQQgghhBBCCCGEEEJmAQWQaYBWkAwHZUNzTFbWR6UlGZZl2YgpUYkgl4fprSl6wiSgUdT6UiD/xnChIiOmdI+WpHcUHhci+XJFxorOpBBU0B6KZSQvhwAiEg/bYptzxcMB2dIaVxEm4qomKqD4QOBwzwvcn7re265WmPGndSt3UxnMlWV/75icGCzIsYGi7Owc1bpiW28TQi4cM+6Q7DxeHpTX3bBK7tm6QuLFnPgSX6BSEgS9qprtKhLwBBCzj3p/lM0WGMO1I58QQgghhBBCCCGEEEKmhwJIDQhx1ZoKy9rGmLRnwnJ1W0JW1UclFAgI5AJXZJjs4TGV0WJFukeK0jlckuFCWXNwjBQdGSog/JTrcTGQK2nIqXzJMesqKlycibpYULYtScqtK9IaeisadM3FtfXAMRHSqm+sLHAYSYQDUh8PSUsyJPWJkLbtbKAeyCHSOVyQ7SdH5Wh/QfOGIGcI6krIhYIxa5XHZEm0JG++eY1sXdEswVJewliHe6sK3w/cEEh5Di+QgDhm6GoqdLMOgbAIIYQQQgghhBBCCCFkNlAAMYQDljSnwhreamtbQm5dmZFUOCCWPdnLYqr4gfmRQllFBwgcY8WKnBouyiEIB315OTVSVE8OuFmMd7CZmG1nw9Tbko7IfeuycufqjGRjIQmYOuG8AHUplB3pHCrIc8eG5fv7+qVntGyWizQlQtKaCsnK+pgmaUfukmjIlmazvA7HgRdJDVPbBiEEobD2dI3J44cGVQQ5NVKS4Xx51vUnZCq4E+zSiFy/NKnhr9rSUQk4FYmII1I2YxcbIU+IAZ4fEDx0H1PgE0IBhBBCCCGEEEIIIYQQMluuaAEECcwhBizPRuTutVn1rkC+DRRfC5gqDJSdqoaLGsyX1dvjSH9e9vfk5GBvXnNpVJwJ8QDhrM6XSNCWpZmIvGlzg9ywLKXixVQvjp7Rkhzuy8tPDg7I88eHJV92TH3dddgU2wdMsW2RoG3JknREvVrWN8UkHQ1q8vaM+UxG4eEyPWgvRJau4aL8+OCgvNo5Kl0jRW37hbSPXJlUqo6Eqzl5YEurvO6qdkkEIGyY8VkpS8ApmXEbkKoEzZKq5slx18I7xDHrIIBgfqbRSgghhBBCCCGEEEIIIRNckQIIPD5SkaBsbI7JAxvq1fMDOTawvBZf+ICYkSs5piC8VUmeOTqkCcP7x0qCyFCu4OF+Xig4I4SJq9vi8uDmBlnXGJdw0J7k9YH69Jpzf3t3nzxxaFD6cmVddjbgPYISNMdIRGxZZtqNN/E3tSYlHQlo2CycC/jn88Hhx0xjx4pl+dH+AXniyJCG80K/XHiryeWEK1L40sUUqmVJBUvypmuXyd0bmsWulDHYJFQpSlhzfwSlUg2YDd1jIBeIHgsCiK6f9qiEEEIIIYQQQgghhBByGlecAALPCoS5evvVTVIXD2p+jVBgQmAAEBkwh2TkoHO4KM8fG5bnTwzLqaGiGv0LlQlvi7kEnh53rsrIazfUa+L12rr5dToxWJTPv9wtr3aOaG6O860GvELQHwiPtbohJreb817VGtdzhgKWepBMFUIAwn3BCwaeJ48eGNAQYOQKwnLvCxUpzPBwJYqJsFXmBtKQVebpokXHkW7lSKgyJsuzQXnDjWtk69KMGdAlCThlCUtZk5871aBUzJQGvcKxDMgNgn1dAUQXEUIIIYQQQgghhBBCyFm5IgQQ2EyDAUvWN8XltpUZDQG1oi6q3hBTgRdHqVLVXBdPHh6SXd2j0jdaVi+LgVl6WpwvDYmQ3L+uTm5ekVavFAgUECAgyKBeOP8zR4bkRweRkyOn9ZwrkFgd52+Ih2RVQ1RuXp6WpdmICiQIo+XZoieBEFwHenLywolheeLwoIox89g95FLAwgWuvcjwzoDAgdBVtuiQNNvovVWpiF1FKnOkMMd9WJF4qV+2La+X+25aL+1mfAWKRQk5RQlbFbEciHnmGCqFBKXq5QJxBRBIKBBAOMAIIYQQQgghhBBCCCGz47IXQGCHbUtH5OblKbl+aUqW1SHcVVBFkVogMMDOenKooOGd9nfn5OhAXsM8zbdRH3Vpz0Tk9Rvr5cZlKRUifO8LX/w4NlCQ7+7pk5dOjGii9fmsUjIS0HwhS01fXb8kJde0J12PENOZqKtfL1B2HOkeLsmOzlFNxP7yyREpV5C2mly+mKtbI0RAAEHKftdHAwvcMW2bG0c1RjNeKqbAtyNV7JN7rl4id1y7XuJmTEWqRQlXC2JXSnpYJEB3rIAKII4gFJY5jtmXAgghhBBCCCGEEEIIIeRcuawFECT63taekK3tSbm6NSENybAaY4FvwAeliqOJzHd1jclB87nbfPbnFi6s08r6qLxhY73ctDyt4kNtsnN4nOw6NSrf29svL5wYkbFixVsz/0D0WFUfkw3NcVlRFzF9mZRMLDhev1ohBKG59naPycsdI/LE4SENG0YuZ8x9pJfejAG9peAFYuPGMv/NpxkbDhLjmG0wRMyDRkLVsjRZI/Kmm5bLdRtWiFWqSNQqSdgsFwggOBqSoJv9K/isusn51X9Ec4C49y7DYBFCCCGEEEIIIYQQQmbDZSmAIHTU8rqoXLc0KfesyUpzKqyGethNfaM9GgzhY29XTg7352X7yRHZ2TkqubLjayTzDoQE5N54cFO93LIirYKDLyignsg1As+Kb+3qk+2dIwtWr1pQG9SpxfQhvGgQRuyq1oQkIu7b+agn0D716vyjAwPy5JEhDY+V9/KokMsD+GHof/+6653kD0xforDNlC3lSlmQxyMUhJBRFbuUk/VZS95y4ypZ05aVarEkISmbgvBXFT0uBBB4fjgWct/gOJ4Agm1wdITbwkJCCCGEEEIIIYQQQgg5CxBAApve9pHf8+YXPfFwQLa0JuSBDXVy15qs1MXDKjT4NlMY6ssVR0Ndvdo5Kt/Y1aeJvE8MFqQ4hzk1zgZCA61risu7tjbJDcvSEg56+Q5M/RDyajBXkhdPjMrXXu2R3d1jF0X88MGpRwsVOdCbk6P9BQkHLE2UHg26n774gc+gbatHS1MihMbISLEiuSJFkMsGXGvvbsJdpaLEOBAoICCaTw1lZbYz4wE5ZDCArWJONrVnZduqFg1/FRLkB6mowKFHhOgB8QP5RHAes9A9G8aP9+luiB+EEEIIIYQQQgghhBByRmCrvGwEkGQ4ILetTMt7tjWrp0LMzKtRtgaEkEK4q+/v65ev7OiV44MFKTsLm7MCBuHV9TH56etb5Oq2pCZo9wUEhLzqHinKs0dH5EvbuzX3x6UCcqEM5suyo3NME7JHQ7b2OT5rgeBUnwjJpuaEhiE7NpiXfNnNsUIWO1AlXE8l/x8uKyQJt7j/VMywA+bDrHcckYoZL1KWa1Y0yFVLMxJ0ymacqNQhFkQT7GNDADFFhRAXcxqzBmHfJkJg+WcihBBCCCGEEEIIIYSQM3FZCCDwpoDB/Q2b6uXNWxqkIR5yPSo8izuMtfDu6B0ra36Kz7zYJXu6cxqu6WLQlg7LB29qlU2tSQ3X5YsfjlOVrpGS5vv49p4+6TP1vRSBSIMcH+hDeNMgyXzAXIMALoQHRJ5oKCBLshFZlonKscGCDBcq855Qnswv8MyA+OD+s938H7rITYHuelu5Qp5YAfPfFqdS0gTozcmwXLWsTtY0xcUql8Ss0HFSNZ8a1spsb+5mnYYgAsEDx3SFD5VIdL13Qp0jhBBCCCGEEEIIIYSQmVjUAghMoMibAU+Dt1/dKLeuzEhdPKRvjet6GFfNJ4SOZ44OyRde7panzGfvaMk10C4wqNfybEQ+eFObbG5JaPioWs+PjqGifHt3rzx2aFA9LC5l0H1jpYqGxDrUl5N4OCipaFCFJz9JOtoFgQfiFESS/lxJBnMV9bghixM//4ZlJuyJGS2uYCG6HJcYHiAY9PDgCDoFWdGQlG0rm6UpZsZIpWh2wX5mBwwHyxc23HPoIu94GvpKP93l7pS7LSGEEEIIIYQQQgghhMzEohZAYiFb7l9fLw+sr9O8HzDA+4KCKyo40j9Wli9v75Xv7u2TI32Fi+b1AZZkIvKua5pka3tSvSP8usIOfLAvJ9/Y2StPHRmSoTxC/iwO4FnTPVLSRPIdg0VZatoYM22zbRi+3QEWDNjSkAhKezoqhUpFvVwggtCEvQjxLhquLv4hZJWjegTGspmDQlG1RWxzLwYC4lQrZlVJwpWCrG/NytUrmyRplSSA5f4AwATuAz2eKWYacggCYbkeIC7uiJoQSgghhBBCCCGEEEIIIeRMLFoBBMnO71qdlfvX18nqhtikJOIAQseOzlH51u4+eezwoAoh7tvjF4fWVFjeuLFBblqWlngIoX4m6rqvZ0w9P547NqJJwxcbeNsfog3CYsGLpVRxJBsNag4WV+Axg8y2pS4e1PBkCJXVM1qSXPniiVHkAoDQIRApXIkCeocbAsvMmbFgO2ZBICgOcnlUy2JXC5K2y3L1ijrZ0JaWCPJ/eF4dEDN80cOdM//MJIQUrDE/8N8DU+59TgghhBBCCCGEEEIIIWdjUQogqWhA7l2TlddtrNfQSggl5YsJMJL2j5XkRwcG5If7B+SF4yNSuMiG9sZESO5dVyd3r62TVASigKml+YGwVwgh9f29ffLEkSEZu4jeKXMBvDoggpw0ZbRYkaRpa10MIcksHWjwCsnGgtKcCmni9F5znUYKi0/wuaKxzBhVTw+EwAqocAEPkGqNB0jA/KtUbVNE7KB5wFQL0hoPyLUrm2VpNiYBp6TSCXBU0MANobPKxKRKI940lvqFEEIIIYQQQgghhBBCzo7apb3pRQG8CO5fVycPbm6QllRYgrZbfdMONcAf7c9rAvGvvtojr54avej5JupiQfVUuX1VRtJRLzQUjMamwl0jRXn0QL88c2z4oobmmkvQ3ccHCvJdcw2+ubNXDvSOaVsnPEEsaU9H5L61dfLGTQ2yPBv19iSLArh4qCiB4goSrgACMcPMebk8nIo7nnF7Wk5R6pJRaU6nxDYDREUTbCMQUGwt7rHwE6KH500ySfzAdu42hBBCCCGEEEIIIYQQMlsWjQAC74EHNtTL269ukoZESBNswxAL8SNfrsiB3rx8dWePih99CHnl208vEuGAJbesSMtrVmekLRUeTw7uOFX1Unns4IA8cWjokk94fj7Am+Unhwbliy93y4GenJQ9g7gvgmRjAblrTUbeeU2T5kahbXsxUXtjuUKIShYQNnAhTcFYh9gnTkWkUpLGdFQaUuY6O2YcmF1c4cOVOCaOZu5lbwkSp3uSiredXwghhBBCCCGEEEIIIWT2LAoBBJ4Ub97cKG/YWC+JcGBcTACjxbLs6crJl7d3y+OHBqWE2DsXmVDA0mTn8PxoVwO/pcZ/lOFCWZ4/PiI/OjgofWMlb4/LD4T4erFjRD79bKfs68lNCkVm27bEQ0G5cVlKPnhjqyZPhzBCLm0gQSB8lS9FYMoXP1zpwv2J62sWS9WpSCwSloZ03Fxvc92rnhCmR5nw/HAxS8z94RZsa9bq4bANtkfunEWj1xJCCCGEEEIIIYQQQi4BLmmLIkyfyJvxtqsa5bUbkEMj6K5QLBkrVmT7yVF5+JUuefHEyCUhfkCbaUyE5cFN9bKuKaaGfQgfIF+qyJ7unHz11V45OVSUi1/b+QXXY09PTj75TKfsPDUmIwV45vitrkokaMvVrQn55VvaZU1DzPPqIZcsECP08uGHYwa7G67KFUXMUrNY15gZx3Ek6FSkKRmVhnTCbOrto/jT+HQLEqC70/5PdwkKgBgyeQkhhBBCCCGEEEIIIYScmUtaAImFbXnXNU1y55qsen74XhQAibYfPzwkX97eI/u6c+pxcCmQjgbl3dc0y7qmuOYomTD4W3JkoCCff6lbTg0XvWWXPwj5dbgvL5985qQ8d2xEhvKVSXlBggFL1jfF5Keua5YV9VGaty9lqrZYSH5urpJjV8zDoywhpyihSkWCUD0M+hEMqgBiF0ZkRSooremEwAEISc8hmLh+I35x7w8srVoBs7/tlglZRbfBkgnRhBBCCCGEEEIIIYQQQs7OJSuAREO2vH5DvebRgKgAYDSHkNCfK8uPDw5owvNDfZeO+BENWrKtLSGbW2ISCyFkj19nkYO9Ofnqjl450p9TAeBKAu2F6POVV3vkh/v7pXukpN4CPsGALRubE/KurU2yvI6J0S9VXA8MPDIgTkCYqEiwCk8PN2wVtAlzZaWMdbYlCXMLNEcDkjX3r58j5Ewj35U6vIJt3VvHUOstQgghhBBCCCGEEEIIIbPjkhJAfHtnPGzLvWuzWpD/o5besZL8cF+ffGd3rxzrL8glon1o3dszUbl3XZ1kTJ19zw/8PD5YkB/s65eXO0YumfouNGj3sYGCfGdvv3xzV68KV9oVMHSbvkLelG3tSc3zgsTo5FIFAgXAT1Mw8FXYgCjiFqdS0YwdqVhU6tMJiYUDZjNHrCo8Ps6GHtCdnIR7VkIIIYQQQgghhBBCCJktl5QAAhNnPBSQ65em5f719dKYCI0nPMe6/rGSPHN0SL6/b0CODxYvKU+K5lRY7l+XlbWNcQkH3G6FYX84X5YXjo/IU0cGJyUCv1LpGi7KowcG5NH9A24eFNNHfjgsiCA3L0/LrSszkvG8fsilCu5LM86ruHauAGJZEDrMUsvMOUVJxSLSkM1KAAk8nIpZRxGDEEIIIYQQQgghhBCycFxSAgiSYm9tT6gXQFs6LKGgG0YKxnEk0H7hxIj8YC9CKF1aOTTi4YDctDwld6+t09BdvlEfOdmR/PupI0MyVKjQ/OsxYvriySOD8pODgzKYK2ueEIA+S0WDcrPpy+uXJiUcmM4TgFwsEPYK4aj8q6JzZsYt8PEwjxPLlqCZtytFycRDUp9Ni1Mqi101a3VH3gWEEEIIIYQQQgghhJCF4ZISQDY0xeWB9XWyqiE67kUB8mVHXj05Kj/aPyBHBvKXVBgpOKhsbUvIHavwpru/zJ3oGinK44cGZH/PmFRp951E31hZnjg8KC+eGNHr6/cZPlbUReWuNXWypTUhAddqTi4BcCXgzOEKIfjEPeqGvcJaLFXxr1qWWKAiDemoJKO2WJWyhOAVwktJCCGEEEIIIYQQQghZQC4JAQR20eZkWG5cnpKNLQkJ2W5IJIgGpYojh/vy8oP9A7Lz1OglJyS0pcJy7dKUrKyPajJvgDqOFiry3T398srJ0Ss278fZODFYkK/t7JWDvXm9zgDXHaLH5pa4PLipQVpN/3raCLkEmLgUnuCBYhb6icuxAbw/6uJhaWtIS9g219Nd694YhBBCCCGEEEIIIYQQskBcEgKIbVty55qM3Lk6M8nzo1KtSt9YRb6+s1e2nxxRY+ulxu2rsnLbirQEx0WbquRLFXm5Y1h2dI5ouCcyMxBBPvviKTk+UBgPhYU+xJiAB8hPXdfCfCCXDO71gQiiU+NqCLxAgCUB2xa7Wpb6WFCa0imxzDUN2GatU5GqKYQQQgghhBBCCCGEELJQXHQBBMLBfevq5I5VGUmEAzVv+1uaH+JzL3bJyx0jUkJCjUuIgKno+qa4bGiOSywUUKO9i6l3viw/2Dcgx/oL3jIyExWnKgd6c/Kl7T3SMVRQQ7qfFD0ctNUT5G1XNenYAOPDg1wUpt6Fnm/HOI7jiF0pSVM6JM11UamWSyp8WOY+J4QQQgghhBBCCCGEkIXkogsgaxtjctvKjIaSmsgDYclIsSLf29snL5wYllzJDY90KREKWHL7qrSsa4iOW+VR74FcSb69u0/2dY9JmbGvZgXErZc6RuR7+/qlc6g4SQRJRgJy07KU3L4yLckwgimRi4e5JlN0DMgfSHCOT9y+SIUeC1nSkIhIPIC06JBIDI65h6fsSwghhBBCCCGEEEIIIfPJRRNAYAvNxoJy15qsrKiLjOfPAKOFsmzvGJHHDw3JWPHSC5uDl9nb02FZ1xiXZDSobYHBvuI4cmqkJM8cG5bRS1C0uZTJmev8hLnezx4bkr7RksChBn1qm9KQCMm96+pkTWNMPYbIxcEXnzTnx2mXwRU7pFKWdDQkbfVJCVYdN/+HZYvrwHXR9VZCCCGEEEIIIYQQQsgVxEWzSMbCAbl7TVauW5qSdDSob/vDRgoR4cRQUb0/To24IZEuNZCn5I7VGWlJhb0lLgO5sjx7bFg/ybmB69yfK8kP9w9ovpdCueKOCVOCAUtW1sfk3rVZac9E3B3IRUHFD1U/UMxVsyB8OBKAF0i1LNVKSepSMWmpS0kQoa+8zSb2IYQQQgghhBBCCCGEkIXhogggCB+1piEqr9tQJw3xkBq5FfPZPVKSJw4PyZ7unFQuQScKGHSbkiHZ2pZUDxafUtmRg715eeLQoBTNNDl3MAyODRTkscODmhcE+KGwMGZuXJaSa9uT4/lAyEKDa2FLFddE5xH+CksRAsuMeaciQfNEqUvHJRM394ZTVMkDa8XGvYLHDUUQQgghhBBCCCGEEELIwnBRBJDmRFge2FAvqchE0nMYukeLFXn66LB8e3evFC5RESEesjUfBcQPX7jBx6mRorxwfEQToLtLyfny8olR9QTRvvQ60xVBTN+vzshVbQl3IVlQcCnUA8Sd9XBzfGiuD3ON4tGoNNenJRKoqEcINnbMTpYdcIUQQgghhBBCCCGEEEIIWSAWXADBm/wr6iNyVUtcoiHXg8LNn1GV546NaOgrJMW+VKmPh+TWlVnJxELeEpcj/Xl58gi9P+YCp1qVXadG5bFDgyqEYXwAfCzLRGRLS0LqYm7uFbKA6HWY7MWhyc81/JVbsqmkNGazEjS3MPx0qmYZPEYofhBCCCGEEEIIIYQQQhaaBRdAVtXH5HUbGrwwRm6OBxi8e0dLsqd7TE4Nl9wNL0Ey0YDcsCwlmVhQE6ED1L9zuCC7usZktOjghXcyB3SacfDcsWEZypd1fPiEgrbcsSqjSdEDTIi+oMDDQ106FPezCt8PK2DuA1uC1bI0xixpSELYtMQKwOvDbKeXyd3X35sQQgghhBBCCCGEEELmmwUVQJKRgGxqicuqhqjYnvHazfEg8syxYXn26NAkY/elBpKe37MmK4mw222uZ4Ile7vHNPyVHxKLzA2H+vLyzd29MlJAMm1vvJgCAWpLa0LWNsbE9paTBUCHuxnjVXM9pCqOY4p5hJSrtlSqlsSlKMvjeWlLVjV/T9mssywbEonYug/8QHiPEEIIIYQQQgghhBBCFoYFE0Cgd2xuScgdKzMSQ6ZkD4S+2t8DAWFYBnJlb+mlB/KVbGyOS1MqrEZ3X+zIlSpytL8oXSNFmnbnGAgfL54YMf2bl5KXEd/v91X1Uc3FElhwH6YrF+1686NWc8Iy9QIxE8mwJc3JiITMBpA6KtWAe09ANLEofhBCCCGEEEIIIYQQQhaWBTMf18VDsrU9ISuneH8gx8Pjh4dkf0/ukjaPLslG5IalKQl44ofruVKVfabeEHBgCCZzT89ISX58aFCG864XiO8Jko4GZX1zQpab68JIWAuFF8LKdgUP9x5wTP9XJWA+0/GYNDfUi+VgK0fXibk2uDzQQAghhBBCCCGEEEIIIWQhWRABBDbra9oSmrzaUnOoS1m9P3LyaueojBYr3tJLk+ZEWFbURyflnYBNd/epUTnYl3MXkDknX3bkxeMjsrt7THLeGPG9QJqSIbljdVZCdANZEGo1DISqQ3gr3Nu2OBKoliSdjEpdNuWKI2YbdfxwNx+/ZoQQQgghhBBCCCGEELJQLIjlOBkOyNXtSVmWjarBFODt8eF8Wb63t186hgruwkuUTDQo7ZmIhAPum+8ABuCBsZIcGyzIWNENz0Tmh+FCWR7ZZ8bJcNFb4hrUcV2uX5qUFXWThSkyf0D0kKplxr/pb3MP28jxUa1I1K5KfToqsai5RyoVTZju3uuQPCGI4B6hCEIIIYQQQgghlz3m+2C1WPJmCCGEkIvLvAsgMIJua0/K8hrxAxTKFfX+ONSXk2L50jWMosrLshHZ2BwbN7JDvClVqvL8iRE53n9pizeXA+jr3V1jsr97TMaKEwnRQX0sJA9sqJf6eNBbQuYLv9fVv0OFECyriu2UJR0PSXNdSnAV8FCBAILk51JFKCwzXXvzE0IIIYQQQgi5bIH4Mfzl70qlb9BbQgghhFw85l0AiQRtuXF5SkUE4HtQ9I+53h+9o5f4WwGWyMr6qKxvio/nLgEI37Wzc1Q6Rya8Esj8gVBY39jVJztMn7vhl9xrEQsHZGtbQpqTSE6vi8g8gtsX3QzPD72VnbIEnII0pMLS2pCFa5QEzAYqfkAewbXCFH549z4hhBBCCCGEkMsY8wWweOSE9P3tP0vp2ElvISGEEHJxmFcBBCGjYJxG+Ch4T6gx1PwixOdQvux6f1QuXaMobLapSEAakyEJmvpjHqD+hZIjPaNl9U4g8w9s5yeHCnKkPy8jhbK3zO37aMiWjc1xvVZknoFHh/mwfG8oMx+slqUubkt9MiBWBX/r+neKd41MweZYymTohBBCCCGEEHJlUNh9QAYe+oKUTpzylhBCCCELz7wKILGwLXevyUpb2vX+8A2jp0ZK8pNDgzJ6iefOQHXhWdCUCOm0T8mpyr7uMRnIM6blQmK6XZ47Niy7To25RnhPTIOX0W0r09KSCrsbknkB94BtVaXqVAR5QCBsILdHKhI0fR8XRCGzLMesL+t2ZgOxbFeUqjjmXq+5hwghhBBCCCGEXOaYL/GFXZ4IcrzTW0gIIYQsLPMmgIQClqxtjMmqhphEgxPJw/FxarggTx0ZlkL5UhdALFmejUhbKiIT/h8i+ZIjO7vGZDh/4fXHUceL+XFaqVlPRD1ADvbmpVzjeYOQSxCqlmQiKoaQecTVNVxMv6O34yFLmjNxgfyEhOjVKRtVES5Lt8S0u5QQQgghhBBCyJVBYed+6f/456R0tMNbQgghhCwc82YtToQDcsvytH4C3/uje6QoO06OSf/Ype89gRovzUalNR1WMcKnVHHkUF9eRosVb8m5A4GoIRHS3CgQiTa2JOSOVVktt6/KaMH0tUtTsrYxrtvAwI9wT1cyyL1yoDcn+3vGpAKXEI+g6c8bl6VkqekjMj/AqQO3gX8vYD4AD5BYSNrqkxKqVswDxZSqLwxiQ4gf7g4TV4sQQgghhBBCyBVDtSrFvYdl4FNflNJx5gQhhBCysAQ2ve0jv+dNzyl4I/9NWxqkIY7wURPqAZJYf31n7wWJBwtFOGjLHasysqYx5i2BB2dVukdL8si+fhkqzL4N6IFkJKD5UFbVx2Rza1y2tiXl2iVJubotbj5TcufqjH5imVtSsrYpJivqoprjYlVDVOriQak3JRkJal4ShOOqFQKuBIbzZYmHA7KpJaG5ZUDQtqUhEZZDvTk53J/XZWRuQbgr9HbV3M8YcgGrKtFqUda3JOWGta0ScUpiq6eXL3lY3hT8p/wx6q4hhBBCCCGEEHKZUnEk99RLUu7s9ha4VHoHpHykQ8Krlkkgm/KWEkIIIfMHolLNiwCCMEQbmmPqAQKPBV8AyZcq8nLHqDxzbEgu9dzhqHFrKiw3LEupaOGDNmw/OabtyJXOHgILHjBt5jjwJEFC+PvW1cnrN9bL9UtTsqEpLivqo7oOglHM9BXChfkF/ZiOBqUtjfBOUVlRF5OrWhOmTmkNLwYhJGa2gVCDGiM015UARB/01ZbWuPkM1HjnWNI1UpLjg4VZXRtybrgCCG7cAP6eVQEkEajI1pVN6sFkl/NmI9dDCdsh7JV5xJhpQgghhBBCCCFXDDMIIKDSNyDljlMSXr1MAhmKIIQQQuYXCCDzEk8pEw3ItvakRENu+CucCJ4TyN0AD5BF4bBgIfxVROpjQW+BS6FS1TwU+bPkL4F4Ae8XhLL68G3t8lv3LJf3Xdss1y9JStYcEwb8SNBSLw44MXiODKeB5QHL0jwXiH4FYSQRtmV1Q1TuX18vHzLH/s27lsmbNjfI8rqIJMMBs88MB7uM6BgqyDNHh6XoKWkQ2QKmf7a2J2R9U0yvH5lbNK+5CiCOjjHL3NPxeExaGuol4FTMvCmeSDKeM8d8LIbbnRBCCCGEEELIAmC+RxZ27ZeBT36BOUEIIYQsCPMigNTHQ7JtSUqN9T7md5zmzdjTNSbOIlFAWlJhSUUmCyC5UlU6h4tSmsGFBYIFvD5uXZGWf3/7EnnftmZZ3RDT8FcIW2XPpHQYYMSfrkwHDNCRgCXxUECakiG5f11W/uNdy+S91zbLirqIhAO2b4K+LOkZLcnOU2NShiuCQdU80yfLslFZko6YgX05t/4iYboUogcEkAAUOaci2UREGk2fV52yBFT48O4L84GpqmY9x3NgXh41hBBCCCGEEEIWG+bLYmHvQRn41JekdLzTW0gIIYTMD3NulYThHUnD4eFQa7tHeKZTw0UZK1V8E+klDarekgxJKjrhxeJ/ugLIZA8QtBXCx03L0/JrdyyRd1yNsEBxycSCEjJ94u8/IWpYGgYMHgyFslvQR/AsmVR0mVlvtsP2OMpUcQSG/0QkKEszUbljVVo+dGu7vPuaRllWF9V1lyPo/t7RkvTnyqZvvYUG5ARpMNct7V03Mnf4Ia2kaqtHUkTK0hi3pA4ON1XHLLalYgXEsdzE55bZzpU+zJxZ73qQEEIIIYQQQgi54nE8T5CHviClY0yMTgghZP6Y8xwgCBt115qs5rbwE1TD4WN395g8dWRIukdKuuySx1T9/nX1srwuJr6GAMFhMFeWR/YPyNiUHBPLs1F5x9YmTZoO4SMbC6mR2McXK9QGbH6MFMryaueoPHd8WLafHJWXOkbkRwcH5anDQ6afBjW8E/rruWNDul3HUFFyxYrpU9sVl1BB97/iCywIO4bcIK2piOYWKTuOdAwW3fNehiBHyvK6qJcHxaVcqaqHyInBgreEzA0YcPDzCIiUitISr8r1y7KypiUlgWpRymYMVm14TFlimwGnYxTTCJllCqZ1HPqDlhBCCCGEEELI5ccZcoBMpdLb7yZGX7tCAumkt5QQQgiZG2Azn3MBZENzXF6/sU5zUfjAc+HHBwfk+ePD6smwGEAOj7vWZKQ1HdGOgoCBPCbHB4vy5JHB8YTj0DWQc+LBzY2a7wPJzH2vC99LA6VUduTkUEG2nxyRZ48OyVOmPHtsWF45OSr7e3JyoDcvh3pzarQ/Yc7hfhY0ofexAXcauUcO9uVlb/eYCiIVpypx088a7so7j3/emFmO5OkQQqC49I6VTd9PFm0WO0iGDnHt5uVpvV4+SAw/kC9r35K5xBU08M+ulqUlbvp+fbM0xQNiV8rmWthStUO6le0JcpiB7KHzZhqeIboBIYQQQgghhJDLk3MQQPCWnIogJzolvGaZBNJMjE4IIWTumHMBBB4fW9sScuvKzCQRYLRYkUcPDKiRfzGAqtfFQ3LLirQ0p8LjwgLasaNzTF7pGNHQVUhgfnVbUt56VZPcuDwt4cCECAFgAi6XHTncl5PHDw/KU0eG5clDg/LMsRHZ35uTnpGSjBUdKZhtZsopAmDkh8dJ31hZjg0WZJ8KJjk5ZfbvGi7KSKGi+VbgGaKV94ChOhsPytrGmETNOnjfjJrzzXymxYVnU5frliYlEw25M2YZvEFGzLV64fiwiiRk7kCfw5sjJGVZXh+VWzYvk6hVFrtaMWsx/gJ6Geyq6/Hhj0fLquq4owBCCCGEEEIIIZc55yKAeFR6+qV0+LiEVy+TQDbtLSWEEEIujDkXQOpiQblmSUrWN8dVAIEYgITne7rH5JmjI9I7tjjCX0HIWZqJyHVLU9KQcN9oB4P5srx4Ylg9NiA4bG1PyFu3NJrPpIohwBdA4C1ytD+vXgiP7B+U7+3tVw+PgXxFKrAiXyDIGXJyqCi7u3KaXB7zxXJF+nIVFTq6h00xnwgFBYEFniLYDiLK5aYJoMvRpQOmbV0jRfX+OGraur8H/XJ5eb1cbODNUa2UJBGyZMPSrFy1PCvhSlkCTsWsgxeOK4BA8HBvHPNDF5j93BVYSAghhBBCCCHkcuU8BBBQ6Rt0PUFWL5dAhp4ghBBCLhyN7PSOh7bPmTl8c0tc3n51k1y7NOXaPg3FsiP/tqNHvrunTxNWLwbgyXG9acN7tjVrfgkfhLD60vZuefbosNy4LCVv2twwniMEnQkgLvTlSnJqqKiih4b9Mn0wn6ID+hqCUzxsq2CjuVdqzof6Fc0fIKeGSpddGCwQMtcLob7CQbfd8DUYylc0Sfo8dvuVBwYakp0Xc9KeicoD166Wm5YlJCUFCVaKbqYPCzlAsCk8QixzX8ArBFeBV4IQQgghhBBCrgSqxZL0/uVDkn9xp7fkHLAsiaxfKdmff5eEVizxFhJCCCHnh+MgaP8csqIuJmsaYq6d1BME8BOeCkMFGEQXB/DiQDgp36sDoB25kiOlclU2tybkdRsbNMm4L36ot4vZqHO4KN/b3S//54kOefrokO4z3x4XODy8SoZNHx/tL8jhvrwc7p8o8PxA7pLLUfwACB92YtC01Wv3EdMH8Daa526/8tB72pGgVZFsIiTNdQmpmjGl+oa565GaH53uzgMz3ixHqmaBg1UTtxMhhBBCCCGEEHI65ntnYe9hGfj0l6R07KS3kBBCCDl/5kwAgRBQFwtIKjqR/BzAOD2QK2nC7sUC2oKcGcGAa7FVMcf8h8hQHw/JO69ukhV1EfW08MWPsmnf0YG8fHl7t3xvb5+cGi6eMa/HfIHQW+jrqQWhyC5n0Lza9uKSkbkGYkdFIoGqZGO21KeQbwXKhpvvQ+8Fc6PgrnHvHANCX5kPv0ysIIQQQgghhBBCpsF8tyzsOiADn3xYSkc7vIWEEELI+TFnAkg2GpSUKa6VEyKCpYbojqGCJt5e7EBYqIuF5I7VGQ2LFQrY4+IHjO17u8bkX54/pV4f8HbxuoGQywpLHIkGLamLhyVubvdQwIx0hMXy73v3YwJd4YoghBBCCCGEEELIbCnsPSQDD31BSsc7vSWEEELIuTMnAggiRbWnw9KcDE2ygCL3xe5TozJUWBy5P3yQT6MuHpJIoLZ7qpKOBGRpJixBs7hW/Hj11Ih89dVe2X5yTMYuA7GHkOlAiCvbDPhUNCQrWxsk5JjxX6qIZbv3iW0+9faHJqJLah4HuFdOl0cIIYQQQgghhJDpcapS2H3QFUEYDosQQsh5MicCCIQAeEW0pSMqHmjIKEOxUpW93TlNSL2YgKCTCAfcZOIeaCP0ED8vCObBkf68/GBvv7x4YljKzuzED+yJHCOZaFCyMbfUmQIPGvQf1k+ceQKcO12zz0zFrzuqGjfTODbOhbBeOC7OgW387VGXmcBxkhF324wpOIbXBZNAd4SDttYP5/PPdTawDZKY+32BBPRe104C2/jHrr02uq9Zhn39kGW14FjY3j9+BOqVAfunvHZlYyE9DsAnluv1MJ/T1QV11P3MMeOhwPT9YQrO4dcZ1wH9vrhxxKqUdZy21iclhBwflRLUQBU3zN+mKnwg54cLPr0cIUwAQgghhBBCCCHkPEA4rP6PfU5KR054SwghhJDZY73joe2+tfK8gWH+Z29olddtqFcjtO8d0TNakj/6wRFNTr2YgMH/p69vkdtWpCURCY4LOrVgyWCuLN/c1ac5P5CAfLbAYH790pSsboipl4kD87Hpr3LFkX5zzHzZkREkNB8oSM9IUQ3LMB83JcNyz9qsGvERkmsq2AZLOwaL8sKJYQ1BtrUtIWsb43rMXadGZVdXTmJm/xuWp2RZNqIeLMhX8tihQRktnt6G1lRYbltp+iEc1HPu6ByVvd1jmty9Fgget63M6PYQEToGC7L95KicMvWfpqoKRIk1jTGtB/ockslIsSwDpg9ODZfkaH/ezFd0fC3JhGXbkpTmYDncl5OXO0ZlIF+W5WbfW811wjmPDRTlJdNu9KEP+upms35ZJqLbIETZrlNj0pAIyU3L0tKYxPUV+YlpP8631Gx3dVtSvZlwDZ48MqSJ7dGXPqvqY3LXmozmeEHS9ReOD0/qj3jYljXm2ramw9KUCAuEs0KpKkOmvjjWMdM3vebeWGwEqyWJVgtyw6qMvPs1GyVWKohdKZp+DUrFy3czLnOo6oE+QQL0gJkKmHVV9SAhhBBCCCGEEHL5Ui2WpPcvH5L8izu9JXNDZMNqyf7CuyW0vM1bQgghhJwZx3GqgU1v+8jvefPnDd50v21VWg3Drgle1KDfnyvJ9/b2y9gUY/mlDozm17QnZVldRMKTwmBNMFZ0jeM/OjigQs+5YJv+esOmBhWMNrXEZUOzKU1xM51QI/+Ny9JydVtCPRf6x1xBALWAl80v3NQmm1sT7j4zFBjgYeTHNXhgY53ct75eDfIQBvb3jKnHxFu2NMhrVmdlvdkeRv9jAwXpGilNEisgPFy/LCU/dV2LnnNdY0z6xkrq9VJr8IfRG4LBL9zcpnXHMVfWR9Xz51BfXgWcWrB9Syosd67JyDu3NsktKzKy0as7xIfrl2IsRTXpfJ9pf6niyCaz7q1XNco2c11Cpl4Hel3Poi2mXu+91tTP9N161M+0EW3xz5kwffH2q5vkrjV1evzjA0XZ0z0mS7IRec+2ZhVBVpv9IOqcGCzKenMd3rylUW4w7YY4A28PHK9WHMLY+IDpExwP/fWq6Wu/P+DxAUHmndc0yT1r67TeuLbov21LU7LF1BP9OmjqDoFlStdc0lhORTIRS65e0WzGQlwCpTFtC0JgOfDwgIcLLi6KwR4XPMyUZUaw2cZbRQghhBBCCCHkcsV8h8899ZKUO7u9BXNDpW9ASodPSHjVMglk095SQgghZGbg2DC9df8cgUE66OUBADC8l8qOdI+U1Ii92IDxfKToSNl7q90H7QJls8GhvoKKO8cHCrrsXIE3RaXqqHgETwIICz2mDJhSKDnqHXH/ujp5YEO91MWDGkEIgYawH/ZBv8KjoHu0qPuh9OJztKSigR+OCx8BU2/sh4IWmQ+DpctREKLpjlUZ9QypBZ4Z1y1NSdQsxzmxmyssTDZjQzCCAAHjP7bDMZsSIVnfFFUBoRazWtoyEXnjpnp5y5ZGFULQn4OmLfCKgCcNunl1Q1ReD4GoOa6ho9w64xq4dfDzSWCxtsMcOGv66a7VGRWP/HBTbp3RbjPYzTJM+ysccyBsVXt8bAdvD+weD9kqEl2/NKmikg+2hYiF/eG944P2w0PnvduaZUU2qhviGqFdELFwXHjx3L0mKzcuS53WN5cyqGnVDKZoOCQtDfViV8oSssxYNKViljvYAhcX2+lP9JfXPiyY6CZCCCGEEEIIIeTcMd+xi/sPy8CnvySlo8wJQgghZHZcsAACE2dTKqIiiM57hudixZGOoeJpIsJiAOJC/1hRc5j4+O0CMNJ/e3evhpo6X9Qm7B0e3gyferZTPvZkh/zTc53qVTJkzoGcGhAWrluS8gz6rggB5eqk6duv7eyVv3usQ/7hCbf8PT7NMb5ulkN8Ck5UefxcNYsUHCsaCsiGppisqI/qG/0A58Nb/tvaEmKZZdjOPYR3oBpS0YCGmYJggOvuCgiWLM1GtP4QJwB+InfGW7c0ygPr6zSXRK7oyIvHh+VzL3bJx57qkK/s6JF93WPq+fLKyREN5aVSDnb2Tq0fp1dD67ypNSl3rclKWzrsLZ26/cSOmJrmMJOWQfh4cHODenH47agNiYZJzGHV3Wsy8qZNDZpAH14r8DT54ivd8vGnO+QzL5yS5007B3Il2d+T05BjBbPNYgIhylLxqDRkQhKsmvFpO6b95npXKuJYCHVl+gKhr/A5vo9bLPNzdllhCCGEEEIIIYSQGTBfwgt7DsjAJz/PnCCEEEJmxQULILBptiaDkogEvAUuRUc0f8Ui1D/UqD1ccNQzw8c3esNboXOoqGGRYOyfC+D9sLtrTHacHJVnj4/I117tlYO9OV1XHw9qeCmYjmsN72Omgw/15mVn16jm2qgtR/ryKt7UaDZnJRMLyZ2rs+rFgP3g/bG5NS6RkLmuNeedCkSBJZmIiicYDC+dGDF9k9ddWpJh2bokOSGqmE8IImsRWioYkGLZUZHj/z5/Sh4/NKh1//6+fvn7JzvkL398XL67p18KZhvsfbamqEBjCraDYPTa9XVuwvOZqz4rcDx4bSBkGcJyTQfOW2f6D+2qT4RUADrcX9B2PXpgQNuFcGkQt/78R8fkS9t7pGd05two84kvY7ktq+1VLHfXoRerUwYP2oix0JBGaDZz3atm7GsDzPXxri88YqY2aeKohBBCCCGEEELIHGC+ZBb2HpaBT31RSsfoCUIIIeTMXHASdNg+37ipUe5Zk5EVDTE1qcJY2jlSks8+3ynPHhuZM6FgoYDBfnNLXD54Y5sa9tEeAK+GruGCfP7lHnnyyKDkzzO3CUSDn7uxVcM1JSNBeezggHzsqZOSK7l5JhBy6sO3tcvtq7IaXujbu/vkn587pTkpfvve5ZKKBDTUFfJ8dI4UxY+khAwL0Gy+v69Pekz/L82ENf/F3WvrZDhflm/s6pVv7OyVbMzN13HtkqSGaEJ4JogYyBHyt4+f0GTpb9hYL2+7qlFioYAmIoeBHx4LX93RLd/bO6AhuwAEGuTmuG9dndbg08+elMZEWO5dl9WE5TjWRx87YfrN1NO0+wPXt8i9a7Pabgg1//pSlzx33E3Y7oPm+PZ3dH04aMkNS1Py/mtbpCUdlueODcvDL3XL0YG83LIyLb9y6xKJmG2QpwM5W+A5g8TuX321R35ycFA+dGu7G3LKLH/oGXjI9KlY8e9uafdyjYj8zWPH5akjQ3Ld0qS8a2uzhuBClUYKZa0r6vddcx2+bNp/VVtS/uNdyzTMmy9sII8KcqUgL0ifuTbf3dtnzt+rAo7PpHahTDR5QYA8AQ8Nq2qJXQ26yyzkIYFY5tazWg1I1UbCe0fzdwS1phA3StIas+S1W5bIrevqJe3kzPqCblsR2/Shtk6fB4rZzc0BAu8QJEEPmrXaaq8sDpzhUSmf7PLmCCGEEEIIIYScjWqpLIP/+g0p7jvsLZk/IhtWSd0vv1+C7c3eEkIIIWQCJEGfAwHEkl+8uU2uW5qQ5mTEWyrqIfHRnxyXQ305NSQvJiCAwJCNhONI5q2eBaadyM2BkEwPPdOp+TbOl6kCyKudo/LN3b0yVqjoOoSOQv6Ppdmo9JvzIKQVytqmmPz2Pa4Agj6FUb62b2F7zlcc+eMfHNXwS7MRQJAUfXvHiDywsUFCAUt+sLdfwzMhQfuda7JyfCCvQgsSepdNP0wVQJDE/VfvWCrNiZB0Dhflr8w1x3GQBwMJzRGK6wuvdMmj+wfU+P8f71wmNy1P6zRCX330seOaELwWhK9qTYXVQ6RnrKx9gKTkP3UGAQTn3HFyRPtvZUNMEqGA7DNtQ0gthMS6xtQlEjo3AQTC0Hd298l96+vUC6RvtChfeLlbt/+V25eMCyCffrbTtCmlfY2cJvDegSiC5OjwigC4NsjlgvXI/YEE6Ef6C+pRtFA4liNVU6yqLaEKcpTYUg4UzUdJAlVcT8uMqbDYwajp+4qKFzHB2K9KqVKQzY0hefeNq809EZGglKVSKUkoGDb9YKYhlgSC5piT2wPRw13iO5stXHvngvzLu6T3fz/kzRFCCCGEEEIImQ0QQcwXYm9uHrEsFUGyP/8uCS1v9xYSQgghLhBAApve9pHf8+bPC4Q1QrJqGKzxhr0vFgzmypokfBSxsBYZ8CK4pj0pV7UmJOmF9lLvj5Gi5uc40JO7IMM1RKNtS5Kysi6qfYZQTW2m/yC6wPMEicdhcMcpXjoxrGGUYIxvTITk9lUZ3R7eGEh2DiECXgrDpsBTA/lJnjk6pNunowHZ1JKQlfUxFRP2mXrv685pzo9rzTkgNCCJO3JTtKYienzkr0CeDgg/iXBAXj45qmGqrl+W0rrv6RqTg715yZUczfmBcFPI/4FwYU8cHlKBCKLHsgzak9C+NENEQ2OVTINuMdvC2wT9CcEEYka+xksC3LYyI2/e3KBhuJBD5sRQUfsHggquB3LL7Owc09BhEItuXJbWc0Coed6cB8AjA+JSYyKogg/6AuII+nOv6QN4p1xv+gAJ4HEl0WfHBwvaJwjTBbGi1/QvcnckI7ZpT0TS5jjwzkEfLc9GVYCC0Pdyx4i0pyOy0Vw/nBOeNOgz9IOvB6B+WI/QXNeaPoOItacrp32yYFiuBwiycdgO2m2JY5u+t+DD4V0D9QzBfewmlredstnNkZBdleWZkNy6rkWSQeR5cfRvWVxHtDFgmWPa7v0/GUg/KIuTcme3jP3oGZFKhYWFhYWFhYWFhYWFhWW25bTvhvNHpadfysc7Jbx6uQQyru2CEEIIAbBVXngOEEN9IujmWzDAIAqQBHqxhb7ygSgBYzuEAKBGXvMJwWFH5+icJ69G3o2NzQm5qjUpm1uS0pAIq/F5b9eYPLJ/QA73570X5ycMyTCuQxj5zItdGkYK5XMvnZKHX+6SLrNutkDAggfGs8eG9Jo1JkMaLgoixYnBvLx4YkRDS00HtoHHBDxmUD2EqoJXybZ203fxkA4weGYsq4tKeyasbTg1XBo/HgSXLa0TSdJ9Wk0d1jXFZbPpj3ZzDghGs/nTKWjOteeU6bO9/ep5FAvZKgC1pUKnnWO2jJUqmotkl7kW6B+IGNeZNvqGfgx3lJPDRRU+AEQViCh+7hMfCCe4vltMuxDOzLtlFgzUBmHSkKdcfyDsFT7x30JlII1gpmzaZB4OEDRM4xAOKxaypDGblJgZq45puz48cN310+xrDu73CSGEEEIIIYQQspAU9hyU/o9/TkqHj3tLCCGEEJcLNsHCqBoPBV0juGcAhXcEPBEWqz00GrSkPR0eF3VAVdtUlt7Ribf65wqEp9rTNSq7TYGXiR82CR4bB3rchOLa0TVARNhv1sP74KWOUXn55JiZHpNXzCe8PaZsPiNoIa7Vi8d9jwU32TUEA3h6bD85ApO5u7EHtglYlqxqiMrm1oQKFLFwQO5dV6f5Nn7jrqXqxeGLYUmzDt4WcfOJOvePuUJBczKsHi3wroBnRzRkq2cEjgXQD25XzK7DUU/Y4nd3j6n3EbxjsAztOR/9w98FHic4HvojELDdxPBT6BgqqEAGMrGgehAhzBZENIwjtD2h3kSmLebAaNfsWjWHVG2xHFxxCBsIhwUhCl4h8P+A9AEBxFTPwZxZg3qaKlu2IzGzYElzg177chkCCfoaW5ntzDIUZyHcmwkhhBBCCCGEkKmY76TFA0dl4NNfktLRDm8hIYQQMgcCiMtkUy7eEEdIpAU38M4B8FhA7g181oKQUsjZMB9OLTs6R+RPfnhM/ugHR+XftndrYnJwdVtCtrTG1cNgal+mIkFByCzkxrhxecp8JrVcvzQpm8w+MLjPtqq4XkiqjnwWyE0BkHdjf29OxZFJmIog30MTvDQa4xriCqGgBsz2KAh9NmQKxAdMY108bJt6pdUzAm3d2w1viqoKA/C0ed91zXL36qx6nrxuQ4OsN+0Cnn5yTmAfJB5/4fiwPLKvX/JlU/8LHIhow4snhuWJw4PSM1L0lk4AMWAwh5weOQ1HBkEIuUV+7oZWeWB9nbbr7jVZ2dbuhVQz/adNO4/2XSiumIV709GcIG4lUAK6Dg+EAOpnilOtSNlCSLuKJENVaa8310WVGzfMnXpGmWkUX+wihBBCCCGEEEIuCua7aWHPIRn4xOeldPiEt5AQQsiVzpwIIBoSx5tWYCP1JhcbCJu0qj6iAkIteMMfHhpzJeuo2dkzGpvuU68ZeHW82DEip4aL2qcr6qLqOdEQD3nbuefGfq3psLxxU7186JZ2TULvl1+6uV2TeCMnC/JnjDPFPu3PogoYBGMlR5OfIy8HknvD4L/j5KjWwweBqDAHGzhCVCF8FYDXyv/+8XH5H985PFG+fVg+9lSH9htoTkEwQS6Sqnx/34C8cHxI2xwJWpqg/J3XNMkHb2yTN29p0PwdOC+EDBTIBainb2Of0hTF70vXwA8Bp6ztQV4QhK6azkA/3XHcI3htrtkAgs2PDw7I44eHtH/0eO5/LajvY4eG5CcHB9UDBx5RyKPy4OZG+fmb2uSdW5tkU3NCPWfQJuRQqenahaOK9pkW2m5CdL2iVXh/oNW2GxlL5yqmTWVxzGfADJBGc/2yMVcgsW333vDFD18A8T1CCCGEEEIIIYSQi4L5flrYd0QGPvVFeoIQQghR5sRiCUM7jOK+kRm5P5BX4qIYeC8QeCXAAyQyjQfI0f7CnLYJngWugd9cCO908P54+uiQemQgQfbW9oTcsSqjhnMAYzOM5zDqw8iOsFFIzD1eQpaGkYLR2q9q3mzve674y8qOo4Z6RY9dVfHj7x4/Ib/7ncPy+Zd7NK8FdsBq1BPHwP4I67SuMaqfo4WKHOjNazJwCDd+gSiCcFc7OkY1yTnGB5K7NyRCmkT+C+b439zZo54mOCb6HeIT8njgmC8cG5bPvtglj+zvHxdyiubT9yxCjgpUDNcDx8c6F/cTP08OFeVL27s1uXmuVNHtYNr316NgvwK8RGrANnouv388hsyY/snBAXny8KD2KerlnxWgzV/b2Wv6rsucu6DXD55EaBc8ZTC/p3vMzddi2obruLBA+sDAcK+3FvSjTgW03chsblfdEFhiPpEnBGOqvT4jEexvOhy5PwBCXuGeR/HFOUIIIYQQQggh5KJivp8iJ8jAJ78gpSMUQQgh5ErHesdD2y/Icgkj/J+/ZY20piM6DZDTAm/fI0H32AwJtC9V2k07fvnWNk12HQrYatiFgRfhlODRAAP8hYJeWpqNqGdHOGBJ71hJw2vBIwJiA0JFoR4wnEN0gBhybDAviVBA1jTFJGT6+Uz2ZnhzHB3IqwEfScSRbBzG+lMjECZKuj/OX2/OP2iu1dH+vBr0ZzokhI7VDTGdhmEf+yB/R3MyJIVyVZN/nxhEeLDJR8B5cO42Uwe0GR4uRwcKOiYQJiobD8oKUw8kU4eQgwqgfgifNVQoa04SiATYNhO1ZUk2qn0C7w54luSLjmTMMVbWRTVnCfKzQMSpFRYgQKDuibCtIhL6GUIFPHyWm3MjPwlqfagvb9pRkkwkKG3psCSjAcmZ4+/uGtPr4oMx3mLajm3QY6gLBJbacZE2x1heb9plriFCXqH+CJ01YPoNIkq3mR6aGlpsAVD5wwlo6KuqXTKfrvChHiCW6R+nIqFSwfSTLU4wJDkpi5jtlseq8u7rN8iWlqSEqyXT1xA3J1/ry5X8Szul548/5s0RQgghhBBCCFk0mO/ikXUrJftL75HQsjZvISGEkCsJx3GqFyyAwPD852+GABJWwQAgF8QP9g/Il7d3X4S33C8MCAP/4Y4lsrI+pm3zBZDv7O6VTzzTeZqRn5w7EENqexGeK2FTAESS2j6euu18MtfngrgFzxaMH+QGufhDBwIIxI6qVG1TH3h/VCEAYRnWORIqFyVkB8SxbclXi2LbRdlYH5YP3rFNmsMiQUEOlMUlal4IFEAIIYQQQgghZHET2bhGsj//Tgktb/eWEEIIuVKAAOJanS+QqRIH3piHF8hi1AoClqg3gg1ruAHG63LFkXx5ETbmEmVqTyI0FUJ/oUwVmBay1+f6XAijhSTyaNelcS9UxbFNRayql+vDH+SoHMJZIb9H0NTVbOdUBGn0I3ZF6hIRMf8lqEnTL4mGEEIIIYQQQgghswLhsPo/9jkpHT7uLSGEEHIlMScCCAynEAp8EB2nNmzQYgJeH/HQRJJngPwXMNLT9ksWP37eEnh8uBII8nq4y6uQQQTRvLAkWK1IKlCVpQ1piSEPf7Ws2xFCCCGEEEIIIYsG8523eOCoDDz0RSkdOeEtJIQQcqUwJwLIdNQKIosJ5GuIeAKIT6HiaCivySmvCVl8uGMY6c5tt3gJ0S3146pqcKuKmbO8nCCpgCXLmxvUScSpXjmhrwghhBBCCCGEXF4U9h2W/n/8vJQO0ROEEEKuJOZNAIExddHieX74OHD+mLKMkMWGSh8a7krEcmwt8ATRNUiMbiYd5P+w3MeC5VQkGwlJcyYqVacslu7L+4AQQgghhBBCyCLE8wTp//SX6AlCCCFXEBcsgPh+HpMEArPQX77YQOSuMmIA1YCcIDFTxnMmELII0eTnpiD5OTw/LD8FkAobrgdI1bKlGghJxUxHAgFpzaYkgfBX8A3RzSmAEEIIIYQQQghZpEAEQU6QTz4sReYEIYSQK4ILFkCUKd4R4YAlDYmwhpNabCABNEJeAT+MVywUkEQ4sHhVHUIUV+iw9BODGcW9d13nDneNGfgqaMZjYWmvr5eguR1wKyBDiO9BQgghhBBCCCGELFaK+464OUGOdnhLCCGEXK7MiQACoaNW68B8OGhPWrZYcJyqjGm+jwmQGD1i2jPXoH9mKtOBxbrenT2N8fXeBv52/rKZynRgsa53Z8/IbLarPd+sj4tSu8/U4m6mYLp2We2nv/1MnG09qD3OTJv6y2ez3ZnWA90GBdt5ZTqmbjNd8cFkoFo1xZ1TzUM9P8xcNSB21TLFkYDlZgKJhW1Z3piRiNnEduPA6baEEEIIIYQQQsiixny/Le49JP2feJjhsAgh5DLHesdD2y/Iqhm0Lfnzt6yR1nREp8FIoSxPHhmSf37ulIwWF1fi5LZ0WH751nbZ1ByXUMDWN+HhCfLIvn752FMdUpoSHut8wPHWNUalJRUx50Cf1R4Tb9+LdAzm5XB/XgplJKgWaUyGZEtrQhCIa7hQkb09YzKYK7u7GJKRgFxl1seRwN3ssOPkiHSNlKTdXJdNrXFtx1Rsy5axYlmOmvOcHC5JxXHP1WTOtaIuKtlYSAbzZTlgztU3Vp5US5AMB2R5XUSvPfY92JuTzqGilBBHzIBjpUy9lmbR1pA0xEMSNO0dMfXvMNsd6ctL71hJt51KYyIkaxrjkgj7wtPUs1t6LU6Yfjo2UJBt7SnJRAN67kN9OTnWX5C4qd/V7QlJmD5B/bZ3jkrv6MT5INTVx4OyqSUh4aAlx00/4FgQwGrBsN5stmlOhbVN6P/D5hw95lheUxWsW5qNyIbmhDiOY/quIq+Y61A7ZuBJtKI+Im3m2mPx7q5R6Ubfe9fHrxPGYWMyLE2mz5B7Y6TgmLYW5IDpY5wf9xq2WW6uUzRoxulp/QMsPd6rpt0nhwpmzpGAJjI3Y8SJimMqXA7k1asj4AQ1JJYNDxEbskhOrmoIy4fvvEoyAUcqVsGMIXiP4HqgpVcG+Zd2Ss8ff8ybI4QQQgghhBByWWG+M4fXLJe6X3qPhFYs8RYSQgi5XHAcpxrY9LaP/J43f17AwPrGTQ2SQogoA4z7CCPVM1aRF44PS3EOBIOFBLk+1jTEZUkmosZ6PwzW0f6CGtDnoj3wKLl3XZ28dn2dXLskJVtaEnJ1W1KuQmlNyJbWuLSb80eCARUgciVH1jXG5aeua1GDPsSBQ3156R+bEEBgnH+fWX/T8pRsNsfY152XzuGibG1Pyk9f36IGfCzfqudwz3NVW0LWmbY2p0KmTrZuD9P/xua4PLCxQe5ak1VjfMdgUbpHS6eZ2JuSYblrdVZeb7Zd2xhTceGkOQYM/mjjqvqY3LM2K3esysitK7Nyo6kbzr2xOaH9Wx8PqeEeQkG5VkkwrG2KyVu2NMrNy9PaH+ibq1Fvr5+2mrqvbYhJvuzIkb6C9s2dpr6oB8Qa9E9jIqjLb1xm+ti0FyII6od9gNaxISrv3dYsN5htcG1PmLZOFe3qYkF5+9YmuXttnfbbyvqoCi2HzXl94QJgqNywLC0fMOfc2BJXEQkiVN/YhFDSbPrsblPP15k+29Ack+MDRekcKWrd4DWFvr93Xdb0V0ZuMW2/Ae037cVy9BnEHNSvYNqwzVzb15t7D+ecNIa8crXpI1zvI56wA58PHc3Idi5B/XBsM4bMp+0EVNxAhCurWpZoqCJbltabPs9KsFIyneUKc1daHpxyZ7eMPf68N0cIIYQQQggh5HKj0jcopWOdEl69TAKZlLeUEELI5YA6N8yFB8jfvnO9NMSDOg/BoFh25OWOEfmbx0/o2/6LiUwsKG/cVC+vW18vqajbJhh+XzoxLP/6Upfs78lN+679uQDD+8/f1CZ3rc5ILBzQ/oJRG+eBRwi8OQCEjy9v75Zv7uqTa9qT8u9vXyLxkC1HBwryj093yK5TY7odWFUflf909zJpTkWkWHHkr39yXJ46MiSvNe348G3tWmdc8KF82RUbzH/kNkGYI5wXXiB/afaBl8GtK9Lyzq1NsrI+pp4On3nhlLx4YlSFrVrg/fGOq5rktlUZU9eKfOGVbvnh/gFty2pTn7dsaZCblmdUSMKuODeOACN+KOgue7ljWP7hyZPqTVHLjcvT8rM3tEprSjNwy5gZR4VKVfeBDd4cUj0hfnxwUL6/t09+5/4Vsq4pLiXT9n99sUu+8mqvLM1E5L/ct1yaUmFtLwSah1/pkh8fGFCxI2Tbsm1JUj5ye5ukIkH5wb5++cqOHvVO8TGbyO0rsvL+65qlxRwHp0c/vnxiRP76seOmTRPjGwLImzc3ar1RR9TllY5R+eyLp9TbBfuuQJ9d3SS3r8rq+o8/dVIePzyo1+Sq1ri8eUujChlmiKgogj7DPQVvG4wNeKd8d0+ffNW0704zfiAS1SdCUjbHGjP9rt4mnmgHXw30/T8+fVKeODRo5iCAOOrpYTkhqdpVKduusGVXMdYhgJhtKjlpSDjy9ls3yy2tUQkW82KZywCvlitNAKEHCLkSafnQT0ny1mu9OZHuT31Bhh592pubTPMvvFtSd97kzYl0/vWnZPSFV725ybT95i9KfOtGd8Y83w7/2u+JUypJ63/4oMSvWq+LKyNj0vG//o8Uj3fq/FRaf+PnJbFts047+YIc+y9/KuV+PN+mJ/PAa6Tx/W/RZzIYe3WvnPyzf8SD3F1giK5ZIe2//SGxwu7vm9mC8x7/3b+UytCIt2QyVsCWlo/8jCSuv0rnnbG8dPzZx6Rw8JjO+1ihoAQb66X+LfdJdONaCWbNl27zHK+WylLq6Zf87gMy8J0fS8WczylM/H6ajsafeou2+VwZ+tHT0v3QF2T1J/6Xqbf7N0jxZLfp3z/R6elY+Ve/K4FMUqeLHV1y7L/+qU6DqePibIzt2Geuy9mftbXXfzrQZxg7w48/J8NPvSiOGU9nAm21Uwmpe9O9Etu0TsJLmnU5jlM2fT/ywg4Z+v7jUh4cxi9BXVeLHYvK0t/9dQm1Nup8qatXOv7o/5xxTPqs+dREf82Gg7/8O1Itnvn612KZP2DQtuwb7jb31wbTthaz0LStXJFyb7+Mmt9vg9/9ianr0LRtmzp+Z8PIUy/Jqb//F29ueoINdbLkdz4iwfqst+R0KuZeKR45IQPf/KHk9x3We30qS3//NyTivaWLexD9XjzZpfO1BFJJc43+g7nH6nS+ZLY5Ybb179vkrddJ8y+9V9t7JkpdfZI/cFj6/vUbUsa+NX2Gtiz5778qwbqMzhePnZQT/+vvxRk98/gLmOuz8qMT76Gdsf/MH4aBZELS990myZu2SaghY55Z5u9S8/cfrmfhwBHpffibUjFjFctmg52Iy/I/+c8SSMS8JWen86OfltHnd0hs4xp9pvvPzeEnXpCuf/yc6Rf32WqFQrLiL35H2wgGv/eY9H72a1KdZqydc/+ZsY16h7xrivu182//WcbMmJ6Jhne/UbIP3qPTGE/H/8f/1vt1OhLXXy2tv/azOo2+7P7E5037pnkZxjynA6YPU3fcoAVjzI5GtA/wDCgcPi69nzfjpW9A61hL7fidDei/nn/5yvg549s2SfZ1d0qoqUGsqPmeYyid6pX8/kPmnGYcYIzW/J4jhMwSc49BAMn+4rslvGqZt5AQQshiBx4gZ/5rf5Ygb0YtsL/CyL8YKZTgUZCXnOclANAehBvCW/2+R8iFAiO6KlBmGmGcvrGzV/5tR7d8d2+/HOzNq0EcIZw2m3NC3MC2itkBXhNVfYt/Aqz1a1x7NbAtwNZjRUe+vbtPHn65W8uTRwbVwG6bawXhZ01DTMLmCyAup386/ZixzfApcDfET93HFIR5es3qrNy8IuMa7c15IYh9Z0+fijlPHR2UU8NFFccQMmtakcwcx+0fS70dnjk2LF/b2SNf3t4l/7a9W75kyjd29cr2kyPqheFfF627TrmoaKPrzZefZEi9UeANgnntR/zzkn9r/ac0NRoMyLalCQ2vVa5UpWIKvJ50PDTHNeF/Lb5IhKXoSwhXt6xIS9YTCIGeS/+509inBd40a+pU/MAhc6bPXjwxom381u5eef74sIpE6CsIPxA8sLOOC/MfwhUEnC++4vYNyhdNefjlrnHxBb1ZsQLiWLaXzByCxuQmYwzZUpF0qCqtdTHdD0oKvrBObikh5HJl9OWdapDyS+aBO701k7FjEUnctG3Stul7bvHWTiaQTqpRyd+uPDgkFc+4BQPZ+DHqMuMG+OmAAbB2W1WLZwDCQvYNd0mwwdvelOSN10iorcnbwsUyz/nxY55LyabNzmd6MroGy/Ht0bbgxO8CAONhy4c/ICv/+ncl++C9El2zXA3E2D7U0ijxLeuk/p2v1/Utv/LTYkdcQ9dM2PHYxPnOocAQCoJ1NcvP8vZjwLR/fFuINjXgeOPrZlF8I+nZmNSf0xT0GQz2rb/6s7L8j/6Ta7yf4Rph+6ZffI+s+tvfl4b3PCjxq9dPOk7M9H3Tz7xdlv/Zf5XG971pegO5OXbAtN3fT8cE3pyYBeP7zLKccahNAfVo/OA7ZdXf/L6KYvGtG8bvg1Bzg8Q2rVVhcMWf/Y40fuCtp41LlynjdxbFNtufDfQj6jfd/n6JLG2V1O3Xy9Lf+w1p/8+/IuFlbd7eEwTSE/2OsWi+eHhrpgDhwIzl8W0xrmuukW3uwWB9Znz9TCW2cbXUmXsUgkX92x/w9vYw56htE84xq+8LZpvac8zUf7jvG977JlnxF/9Nmn/+3fpcCLU26z6hpnoVI/D8WGmud9MvvlfH72xAHc92LaYWCBu6L4Rb80zzl8MojzEzjpkMZifW1735fomZcTgt59h/qVuulejaFePbo73pO2/U48wExEp/+3B7i7T+2gddsWIa8Fz2t8XYmE4cxz0D4RRCTMuvfEDFfRxX92msk+i6lZJ57R367G799z9z2hiuHb+zKXi2A9wXy//4t6X9tz4k8Ws2SajdHQcosU1rtJ9X/tX/kPS9t+r2hJBzxHy3Lh48KgOf+pKUDjMnCCGEXE7M7lvaWUBIIRjs/T9WkTsjHQ2Yv0Nn/kP0UgVt2deTU68M4AsPCPeEkEtn+Nv6nHAN0i6dQyV59MCAfHdPv3p8fHVHt/SMlPRrRF0sLK1peB7AY8LdQz/OVA//wIbazSAkPHtsWH5ycFAeOzQozxwd1pBPakM3pYK3srxznDPebjDmIxwTQm5hHMCL5ZmjQ/L3T54wbeuRr+/skY89eVIefqnb9bh4tVcKM72p5h0TeVBe7Bgx2w/I90z5vtnve3v7tc8gFs22yugL1OvutVlpTUX08OPCkvmYehiIeMjpocJQ0JYjA3k5PljQNmaiQbllRUbi4emMBu5xUSAAPYBQZ+3mi4453qSm1pxzTWNMVjeYL2dmG3jTPHNsSD7+VId8Y1effM30ETxFIG48sr9fvm/ajv382wvT3Wa8QCT5ibmu8HBB+dH+AXnE9NdJz6OlanZwJGCKue29ROe2qY/r1YG8HyiOhMwsBJm6qLmeTkUs0wZX5KwdTYSQy5WRZ16WyvCEV0NkWdu0BrXIahjrJ7/FHVm1XMWOqSRvukZs/y1j82zs/9oP3Ol5JL5ts0RNHWuBwav+rQ9MMpTp87pU0jd0awvqOY5uM3m9bnMBwBDc/v/7d5K5//YJYQPnKXvHL0+8HIB6B9IJcYrT583ywT5T61itTH7JAPNTt5Gac80H09artkyp42wZ7yuvjL+Vb9sSWbFU2n7zl6Z9yxqGW3gF1D14j3oI+IzXs6Y+MDDD+Lzkd39j2rE9J5h617ZjujJbYEheYtpW/9bXusZ+j+nahvu34V1vkKV/+JuuoHgWpvb31CLncx2nubf8ew9G9sR1W6T9tz+s7VoI8Mb/afWp8VpAn0IYS989vdg710AcbPvtD0mjGYMQr8Yxf5dp/cw18YFghTENzww76Yqa58QMz7naUtsX54Idj0q7uR+n/s44VzAm6t58r3o41aIeGOcwRiAKNv3cO1UAP1cg0jd/+Kek6RfeLeGl8Pr2/yCf6D9/DEN4Sd9zm7T/5w9Pvn61YL+z3VtmG3hz4drWiin+fY3x4AMxpPVXPiCJa2f2liOEnAFzOxX3HZb+T3xeioeOewsJIYQsdi5YAMGfW/258mm5MWD8jgQXp8G0WK7KqZGShhOCqAPjCLwkEBIrGwuO/507V5g/e/VcEJHwiTf8VYww4IW2oJ5wcv+eD5GgrfkwEDoJeShuX5XRPBUw6MMjY293ToqmDuctXJkqopbLspHx0FUwzEOsQF4Ov30QmZ4+NqQeHQhL5X1HOCMwwKNgW/PhFtNFvsfF2YDHBEJKweZ13ZKUvG5DnYYAM99a3A2mAflgrm1PStpcd5wPYa8gHKHOUbMvEuXDM2S6I6BWaC/qjHHzuo31Kr6gDuOiiwJpy/Uwak54fTZalm/t7jP3FTw93D5DLhic+ztmOUJd1YaiwhSS5F+/NCWvMdf0ztVZzd9y19qsXL8sOe59oiKaBFQIgdSh4bDMchvZ0IGFujmm3ZYsa8hIFMuq5osVVnn/CCFXAOY5NfrcDm/GPCMSMYmuX+XNTRBdt0rfnq4FBp7TjDy2LdG1K8cNVpXRnOT3HNLp+QJGsoZ3vt5MnP7cSly/RQ1EPgiZhHArJ/7fvxkvCKeCevqUTvVo2JzabU7+1afOGuLmTERMn8Sv2TxeRydXkK6HHp44x//3t9L3pW9LuXdA1/f92/fMM/nMv/MQ0qi2jigI4VTL8I+fOW2b/m884q2de2Cc6/3c1047Z23p/cxXvK1nD8KBnfzLhyYdp/OvPy3FExPh02A8bv21n5v0BjcM2DCoRxDawuv7arEkA9/+kfa5e6y/laHHnjV19wQns13imo0aKmnO/wg05A8em9SO6YoDI+dZUGP5//NLGtZtvG3lsgx+/zE58T8n2jb4wye1zYrZLr55rTT/8vv0Xp0JhA3q+kTN+Jym9H35O97Wswdh3jr+ePL91/WJz2s4PJ/I8nZpeN+bvbn5ZfTZlyfVBeXkX3xCip3d3hYG00+p2647L+P5udL8C++R5PVXj18bGLxHX9hRcz3N/fOFb2mIPcVcT/SpzGK8TKVwtGNSu6crud0HvK3PHXjqwHPhQoTEyMqlKr5PxY5GVaicNaaf4KGRvuvmc76nMRazZt9xb0XzhST36r5JvyO6/+lLGo5MMYcv9w3qM3468Lvm1N/9y6R+nloGzLMdzzH/vsVzdeiRJ8wzy11/6h/+ZVLIP3jqxLa4oSUJIeeB+XureACeIF+U0hF6ghBCyOXAhQsg5rs4jOe54uS3vnDgbCw0Zx4TCwk8JRCyCcmrAUQQNKMuHpQNTXHNHTGXoA/RT/AygCEcCblhdAfwBoAgot1ofqgxGjNnMoLoxpOB0R0G/ddtqJd3bW2Sd5gCMSQRtuVIX05zSvSOJ1U/s4FlJvy90E+JiFv/gXxZwzNNrW6+5Gj+jNmcCSG13nVNk/zWvcvlv963XPN6IOfHL97cqp4YZ8TrC+QlefHEsCYDR2ixm5an1TMDHhcQoKYjbdpw84q0pCIBGTbt2N8zprlgDvbl9RogVwsSyUdNv04FosWx/oK82jmqIcAQxuzONRlZ1xRTMcUH/QKxsCkRMtff/SLVN1qSU0PwzJlcL3jTYCxMrS3q0p4Kyz3r6uTtVzfJ265ulLdd1ShvNQU5YFqRAwVo2DRb96/C9cNMWWaZjm4NiVU1aysSD1qyFO70lYoE7Kqpr2PO4eaKIYRcGQz9+Gk1tAGE+ohtWO3+oqpBQ45MMRzBUwHhdWoJJOMSv8bL/WEoHj+pMdHnExi3Iyu92M3m4ZXff0SNVCDU2KDhSXycsZyMvbxLRl98dbzkdu1Tw7EPjO1jL++cvM2re8f76HyAUGR7sdtRR+Ra6f/K9zWHip7j+e3S/ekvyaGP/Hc59X/+RXI797nbnoFix6lJdURBLo9aIOacts2xk97aecD8DoGBf+o5a4ten3NFjY57Jx1n8JEn5Ohv//Gk8YW3pREiyCdzzy0azsin1Nsvx3//r7SP0ed6LPOJXDEoji+EmbGOt/5hNJ1rKsOjk9oxXfHH75lIveZGiV01EWYIeQhgHO386D/J6HMTbeuEcPQ//07Pq5i2pW6/QUPGzUjFXMd9h06rV21BzoNzpYp765Xdk47T/9Xvq4Ff32z3gCcIwhHNN8j9UlsXlKEfPyMdf/R3WlcfhKrzw0HNF8lbrnVz6XjPWTyHuj7xr2a8/rXAU0/rZ54XPf/8ZTn2P/5C+x/5b07++cfPmi9oOmBAn9r2qWWmnEezJbZhjRd27fzEI4xxeFUAiHK1z47EtWaMNNZ7c2cHgkLjz71TRZXZgtBb8EDxrwlEUuTcOPo7fyojT7043k8Qr/Esyu06oPl2TvzhRyd5VtaC3zW53fsn9fPUUjzaoffF4V//A823AoFF7+vnd+j6gW/9SE7+1UP6u0Qx9TtbyERCyFkw91Nx7yHp/8TDUjqP32+EEEIuLebAkl9VA/dIccIw63tM1MWCEphjsWAhgDfLzlOj+tZ9LS2JsOZzgJAwlyB59y/c3CYfuqVNPnhjq4ZWQlJueDfAYO8nXvffwXd/no77N6/rUTDdJliE64KC0Eww3EPcqYuH5NqlSWlJul/kLtTOXRu3d0qKjPOgKkHT3avqY5pP49qlKbl2SUqnkcsj4l8L/w/+aUHoqao8dnBQw0RB4GoybUUorOvM8ZCrYyrom3WNMRUmsO9LJ0bkcH9BrwfyjmCMh4OW3Lw8pULJdPTmyvK1nb1ypD+vXjXw0Lh7bZ3Um/72wbXEda7tJnTfuV6DSChg7reQNKfC0pwMa8g2fC7JRD1PF4CzuAWyjyt6mGkvnww8QoJSkWTElra6uITVI8TcA+bTfXP7QkcGIWSxAK8DJ+e9UWxACCsrMPGswxu8MxmNpibhDjXWS6h1Iu9G3nyZrD32fIA46Qi5AvBmNMSF8sCQzkPIaf7gu9zpi4i+Pez/vsTvMBi4p/4uM/Poq4FvPXpBYsuVBAy0Y9v3eHOmi4PBSaFx6t76WvwxpNMwPPZ+5qsytmPv6X1vrsfwky9I9//9srfAJX33zWJdoobF+ne8XkOrKab+fV/4loy+uHPacQUvgu6HHvYWuEDgmSkvwkKT33NQxTof5Meo9dxaaKrFsji+R5AB9+X5hm6bDXg+ZO67Vb3ZFHM9e//16zLwjR9Oez3xXD3+u38pnX/1KbPtlPWXEub5m3ndnZJ9/RnEthmAmJ65f0KAhCg8+J0fjydWh6iMPErnAp4Nbf/xF2YVAg6g7n4+DvT74A+e0OtyWp+bWQjS8NA4+acfm/C4uhDM+XBPnPyzj8nA1x858/gz216oWEUIcSnuPyL9n3xYSkc7vCWEEEIWI6dbfs8R/LnXiYTWRXxxd5fBAA4DcnMypMbrxQYM0kjOjaTTCGPkA2P7qoaYhniaqyTvOHpLKqxhi2Ach3G/IRHSJOzPHhuSxw8PSe9YSd/+L5k/8GG6TkXs05JvYz4edgWNYsWRcnmi3gDLx0oV+fqrvfLZF7u0fHVHjxzsHVNPndtXZuQOUwd4W0xKam8mqzN9kTL9NAmvSkisDg8PkIwGNYeJb+PxwezsQm1Zpt1V2d01Kk8dGZTHDw3KE6Y8baafPzYyfp7TTlADVqH9uJ7IfwLvHsy3mX6/fmlSQ4ON4zUJIsXNK1LqlYN61ieCcs+arDywoU42NLrJwYO2LUuzUWnPhE8bD9gHwsne7jHNddI5XFCvHngQLa+L+l1lMF9QzMEQRg7XF8CrBQLN1BahHQH8mAIuQ8dgQR7dP6AJ4r9irutXdrifyLnSMXS6yz3q7zXV/axaYlcrErUdacokJBUNaLYQzQFizqmCib8DIeSyB28SIxyKDwSMcHuzNydS97YH1LAMYAgcfuw5nQbIuRBZOZF3IfP6u2pChVQ1lMdMYDuE7UjcuHXaMpsY70jAnbn3Nm9OJH/giL5hPohQUN7vrVBbsxv65CKC8Fnjoob5fYIQRG3/6Zcldet1GnLMmjYx9cJhRSLTXgO/WOPi+lmwbImuWzHtMVDUG2ea320XwqQwPTi0J3jEvETnPvCOGfzeY+PjYjowtks14Y8iy5dI6ALzGEwFguJ0faPl+qsm5fKYCSRAhleCD8Igaa6dM7XtiRcmhQwLL2mZJFZeVEy94Y3hg79F/Ou4oJhzol8gfLmJvl0wxubEqD0TAXuSNx0E3JEnX/DmpgceP/CKuCTBOPTGIl6qaXj/W8yzfp3Ozxb83oEIAlS8fPibKlKOG/rNcRt/5u3u9FmoFQ/wO6vhp95i9j/7c0jDkXkgJxNCCp5JiEDdxj2tZsAyz/r4VRumv/9NCTVPzsGF3xuTzmnuDYS9a/nVn9VpUB4cNn3zok4TQi4Q8+wq7vNEEIbDIoSQRcuFf5Mwf8siZA/yEtQSDVrSno5oiKHFCASHVzpGNbxXLUjuDs8BeLfMBeidgVxJPU5e6RiR5zRJ+YB8Y2evfOHlHg2hBCAqIDE6PA9gIF/dENNQTgAGfCTqToSDKl50qSB1+h/jaNOjB/rlUU2k3Sff3NUre7rG9JgQrLa2JVwBpOa7MrxFsA7iCs6H9Shq8Dd/ZNd+rUZbUI70FUy/uV/AGkw/3Wf6a2U9PBFs9TxB/eFxcseqtDQmQme1e0Dk+MmBQfnsC13yz893yv994ZR8+rlT8s3dPRraarYg1NSxgby2/VBvTiubjU8O04b2YL49HZaNzQkdv2jr1rakvOOaJvngjW1y++qsChwAfb+tPSn13njw26JeUN4MksA/dWRIryFEtEzt2EEfmm2RqLxv1PU4gvjx+g312mfwTkG9kePjpmVpuWVlWuKhgKnnRM9j+qBpz8Mvd8lnTB/9i+mff/E+kUD95GBBr4t6cphz+UG/tGCFV2fbccScRlY010kQC52yrkL9vE1cpxFCyBXB6NMveVMudW+9Xz8RVgPhaHwgMPT923cnhatJ3XGjfuJt9Pi2TToNiie7zhhuCV4bzf/uvbLkv35k2lIbumomGt7zxgmDsXl+9Xj5JRDGplKTsyN1183zHsLmTCA0SvH4hMiEuqRfc6O0/dYvy7I//E1Z9X/+UNrNdPyaTRfF4yDUmJ32Gvil1hh8JjQfy3veNO0xUBC3f05zKZjfq6nbrvdmDOaPGt9QHdsIg7L/G02kMIvQWxCqcnsOenNmjMYiYoXn9npEVy+btm9Q2v/TL2sOnbOBe8Oq+YNmNmHFqvmCjL0y4S1jRyIze4CYQyP0EBJtT1fm2nME90N4eW2y5/KkEFTzRfreW2X1x/7nRPmH/0+W/8l/loZ3v1HHFp4p+sz74re9PeYHCD61CfpLXb36/JxXzPN6umvrlviEkH0elHr6Jt1Hmp/n139eQi2TjfszgeTp8OzzgXBXOHxCBQaEA/OJLGublbiNnB21eXCyr32NNP7UW80gP/NX40DdhAgPYSO3a783d/6gb5s/9P5p73+UxA1XeVtOg6l7/Kr1svR3/4MEvd97EMtO/MFHNdwkIWTuKO49LH3/8FkpHjzmLSGEELKYuGABBPZQ5I5AzgOdN18MQMh8CYMhN3jhMZAuGvDAQN6HWo8IiAAweK9tjKkxfy441JdX4/4nnzkp//DkCfmbx0/Iwy93q5EeXgRgrOTIgd68VEz/Bs0XFHiM3L+uTja1JDQs160r0/jeouLFfrPdQG5y+C4AQzq2h2F/Y3Ncwz+tqIt53+eqKprgfLWtSpr2Xt2WlLvgobIGXipZuXddVlbXmy/B2HCiaxR8YdvTNSo7Os2XglJFE4C/xuz79quaNDH3bSsz8tr1dfL+bc3y8ze16bGiZ3ETQpsQjqx7tKhJ1btGilogGPj9M1uw+Y7OMfn27r5p+wjXGh4xV7UmNMcH+mW4UNYk7gMoZh+dNp/wFIqYPr1hWVraM5FJ/VYLBJwf7h+QF04Ma1Lz2u386QPmWu8zY61Ydsx53T57y5ZGzRtyu7m2D25skJ++oUU+cF2LOV9SxRW/5fDPgCC3uSUuG8x1hZfJRhQzjWUQXNxtzU8LoeocUyxB7nMIIK5fkfkCJmVJhaqyrDmrY0JDc1nm2ox38fjEFUPVjGFCrlT6v/noRP4DA5Kew+gdXtoqYd9o5Tj6FjnCctS+JR/dsFrjqyPJd8h/4948U5C0FZ9nAka2mYo+nM4APETwxrxP4dhJNZIB1K82+TremA81zz5e/FxTGRmVk3/xSQ1FVNsnaCcMzTAMQkha9vu/Icv+4D+e89vSF4zp66n9X1vOdi1qgRA23TG0zOFb/ei3ugfvkdjmib6C6FU44sbuVi+CGgpHz/4mJ962nppceM6TX5+pr3Gu2fQ1fl/XUJxN28z9WxnyEjUbIFaNh1yaAsL+QJhb+5m/nLa0/MpPn9V4PFuQLLvpF9492Vuno2tyIvJ5Au2EF8x4MfehChFe2+BhgXwL8x3GT6m57ppQ+xz/5j1XkCtnumuLsubTf35Bz6DK4Ih0ffxzmgzcB79Hmn/pvXpPnQ0IfKGWCe+kkWdeUXESINRbbRJ45AnB758zgdBw/d94ZKJPzffWujfdq+Eez0TtMwTXpFrxPNEvkGnvfa+c6f6PmX5p/+0P6z0DIAid/N+fkPz+wzpPCJlDzN9qpUPHNTG6//whhBCyeJiTbyoIrVSq+QMQRmMY2xHKabqQPYsFJJze15NXLxDYJlTcMSUeslUQaEuf/9tuMGD7HgLwzDg6kJfjAwU1rsNIDuNz7dccJOFGEm/UBesQRukD17fI/3hghfzKbUtkU4v7lljXSEGePzas4Z5qQd0z0YD82h1L5b+bff77AyvlF29ul40tca0HQjAhNBQ8eeD14V81hIK6b12d/OyNrfJzpvzsDa3y09e3yo3LU+oZ4V9efCHAJOZxrEcPIEzVkBr/IRpBoIHggbq+e1uzrGyIqWcJjPTwKJkO/9jA/cLhLvAuw6T+8TfVrWp29FviLnP3QA4Q5PRAyCgk79d17n/BKIb3BwQQvEiJfDCPHxpST4qvvtqjBWGmHtnXr542uErwzoAghpBYXhQrrbtfDZz15FBBw28hJBZELOCdVvsf1//7e/vl1VOjGnYNfXP76oz8krlGHzZ99uDmBmlLRUxf2Vo3eKbo4b3zbDLLfvnWJd61XSH/DeW1K+S/3L9Cc49gW0gmlsCroyJVrRyCXJmlmDZ1Cpjl2agtjWkYP9AyjFHz5Qvn0Z6p7fErgzk3chGymHAqkqsxoiC+OhJKwyiIMFPAKZSkYLaB0aU270J05VIVIxA6xjeownA4tmNim2kxD1F907nj1LTlbOFdkPw83N7qzpjnGkLGIMm5zhZLMvSTZ8w53GcZxJy6t71Wpy8WCDWGZNRHfuuPZOjRp1SkgSFvklHN/G5BKJy2/+eXtP8XCrxxP9018Isfd/+smOuAnDLTHQNFE5afx68XeGEs/f3flJV/9bvjZdXf/YE0/eJ7ZTwPhjk3QljBeK6zU+qM0DdnA78H7FTCmzPHKJVUFJlLkLB6ur5xS5dUC7MIazSlbeHZtM2MrdrwWvDiqvXkWgiCTfWy/E/+y+Tr+De/L9maXEIYi/1f/8GMHiD6d4r+XTMHmH7UEENTiv7haYDI1vLhn3JDLc2R4DMj3jmBXqf5Pt88k993WE7+2cfHn8m4ZhAcmj/4zjNfP9Puhvc8OP43Ga6HiukeCP2V27XPmxMVQPH76kxoCK3Pfk1G4OnoX9t4TFp/9Wf099ZM6HdBD1wTFSguEDyXzvh7r+ZFhFrQH9kH79EQegCi+vE//KiMIe8PIWRewH0XMr9fL6YHMSGEkPNjTv6Sxt+C8FCAYdc3PuMThu2zvd1/KQPvAoSjevrokIoO/h/nyAuxvjmuIaOQ1+F8KJUdyZuCN/7hPYPDT/xJfTrYBuGwPvdSlxzpy0u+VJEyDCRmJ9QN80hGj9BH2M7PXWJ203UQWXCNkB8Ex3KLqYNZBuM8DPpIEo7cI6gMtnP3q2g9IRqgoL7wksDhUWccR5eb7ctYYMBPJP5GAvDHDg2oBwW2c/dzz907WlIB4p+fO6WCyVQwliA+5M2XHNQT18I9+vTg/KgH6qr9YraGnwPqC1EH62DQ9+nLmfMfGJA93WMyUqjodkXzBQQeHUsyEc1bgv461u/2zff39ennI6bO2A95PTAuENYK50a4Kng8IV8J6ovz4dOvM/oL1wXH6B4umfWm38x6XwzBx+6uMfnKjl7ZcXJEQ3tVTPvxRQv9hnMgrNj39vbLl7b36Lz2kTkPrhGuL5ZNXNuq523i9jlA+CtbKmaZayRx+8PtE2wRMV8wWzIJQYSuatVcZysgtmWbLWqDZl1hTAwZQq44YGTSmPOeYRUhbuDZUffm+3QeIAxJbvdBPDTcN07xsDPgjenoxjWSuuOG8d+dMFL5huiZqIzm5MQfflQOffi/TVuQy+NMNLz/zZOES8RVb/31D46X5PVXec8zF+TbmG0IlvkCwgw8U07+xSfk8K/9nhz/g7820//oxpavMfiGGuq0vgtFqbNn2mvgF7zRPRsgGHT+7T9PewyUzr/5JzVGnisQOSLL2ySyaul4QQ6MWvEDoXG6P/1FnQZIFG1mdBpEZpEwGWJfbP0qb84M8VxhznM/5Hbun7ZvUA7/h9+fJC7OBMIy1eZsQ06As2FFw3qP+ECImVFkNMeG0InwOtMVGF9r+3a2IKQecgbVXkc16HrPDTyH+r74HRl+/Hmd93GGJ8Yf3vZHSKVpMcexavLpqLg4RSyqZfT5HdLxZx+Tjj+dXLo++bDXRnNIc7y6t9wvkaWe2DoP4O+/2twRKkDPc34W9PV019YvWH+hIHF57+e/MSHymuuTvHnbuBF/OhLXbDJjZJk3Z+pp7r/6d71h/LkOQSrYNCF4IKRU9sF7vbmZwVjv+sS/qsjgE0inVGyZiYrpBx+MuejG1d7c+YP76vjv/eW09z8KxPHpUPHFlMLBY1pGn9suBfMcIITMDxA9EvfeJpn3vPGsXmaEEEIuPQKb3vaR3/OmzxuIHfD2QHLwVMT9koFlMEbv68lJ92jpnEMVXSrAoB0JBmRpJqJih/d9THM/LK+LqGfG8cHiObbPktGSo3kbtp8cle2doxrS6WyHgKiBEFAI4QRPglNmn87hknoNwCD/3T392t8wvvtgGvV7sWNEy0s1BTlHHjs0qOGgXj3lCgGoAoQH5KTYaZa9MGUfv6AOPQhDlStryK2XTgybOuU0VBXaAVvDcL4iB/vyst/UCd40R/vzsqcrJ08eGZTv7OlTD5FTpj2+gb4WGPAhzKBeL3WM6jFGvfpNx1Ch7Nb3+LDsQT1MvfDdCp4wCMeFtiPM1HjSdAMEDohJqON2c44d5logtBXG7eF+15MG+TsOQ3Ayy1xxo6rXAUIRvHGODhT1GuLYnWYe+x8fNPsed/vI9dhxz4dPhIs70JfT6/fiiRFXgDH9hE2wvj9X0n5EWLT+sZJ6huzsGlMh7rt7+/W4EG/QZblS1awvjLdvuuuEsvuU2/9iOSqCuIk8IGqYL046oC2zqCKZUFVuWt8mS7JxcwEd9YDBastM4xNGQwuaqXcPXAmUO7tlbIrRhZArjfTdt7gGRPMgCGSSEl293DUym0dJ3799R/JeXHd4M9Q9eK8aNLEtDHbRVUvH35BFyJLhHz2t0z5Yl77zJgm3uQnW1UvjB0+44V6mQbdd4hodYTQf+MYPx0PRIKSVviXsvyXt18HU1y94499/UQPY5ssskkW7hvEJYNjKvPaO8bwGqM/gd358RsPpVFCP1O03jHtt4M16GLLgDeGjYo3/S8KAxLbl7j4pHu2Q4ade0rolb7zGHMt9IGP90JQ+PBvwHkls2+zNmd8dO/bOaFDXfBxe/8Eoh/6difq3v07zYYCp28KgGfXFBVPn4ceel1KNkfF8qb3+ZwJvVGMcdf7vT0zyaMBb1vAswJveIJCI6fUoHHJDZE1H5v7b9R7wye87pCGQ0C4YQ7Kvu9MNkWRAqKxBc97ZhEdqfP9bvCmITd0zGjlnCxKGo65+bhZ4KqA+eOt+JpDYO3P/HWZsufOFQ8dk4OuP6L01dfzCM+nE//tR6X7oC9L/le+fVsZe3DFpLM8E6od6+tdgOjDOq7mChi7r/tQX3LE15W9FhOQbF6bMvTH28m69b6YC4bD+LfePC6O41zXxvUdk5VJJ3nLt+Lgfe/FV6f+372n+hNqC/bBNfOtGPZ8ez8yPPvuKtqV2XMFIjvF3NqEMz8r6d7zemzP9f6RDRp5w/+bAyyexjaskvNTtf+QBUk+HnTPnnBgXgXxx4SzY4bAK2vrMNuR3H5Qjv/4H017fga//QO8fHwjHyLXh9yue/7XeFHi217/1teYZ6h4boa/0GWrWQzQPtTZKdMVS7UvtT6//QW3/4XcNkp/XipDwKqx9rqP4+S98wu0tMvjdn4xfA4gotaHxRs11xu8ueFfgM3nD1ePXr1YwQ33RLrQPhJe2jOfkQd0gCo298Opp49PHNs8YPCemelZlX3+XBOszOg0hRn/vmefouYD7BLm60E6UkadfnBCWCCFzCp47iXtukbT5O8lOzi4HGiGEkEsHvFw08dfmBQAD9rH+vHQMueGZfOMCEjgjVwTySCxW8PcsEpQjiTWM337b8LMxEZY3bGqQG5ZN/qP7bKDjD/fl5JljwypA7O3K6dv6swGCBhJ5I1n6d3b3azimb+3q02MdNtegVvwAEBieODyo5ckp5YnDQ5qX4tiA+cM7X1YjPOgdLcsrJ0dn2GdQHjd1xvVGzpD9PXldhvNDNKltBzwUIEDA0P/1V3vl33b0yDd29WooKCRfh+fHdOIHgJEfwgeOjVwsvWOlcW+JqUCQeNlsi3o9fXRYPWGwJUKzvWDO/eSRYRUzBnOT31yDaHXE9CWEmMfNeQ72mX5QoaagnitPHR2SXebaTO1TgH0hbqBuqCPChw3lKyqCPGb6FftC3Jh6XeENA08Q7IMxhcT2te3CGEP9IbzAgwZ99q3dfWb7IRW39DqZzXH+jqGCXj8ca+p18q8VxheEsgkwcvG1GlKGOZD5D1EEAkgkWJW2+rQEzDRsbRA8qk7FnM8xxexhBdyk6YSQK4bCwaOTDPZ4q9wPaVUZG5Phnzyn04p5Lk0Kg4Vta5JFq/FrnoAhKvPa16jR7ZywbdeId5He5Gv5yE9L+t7btB6n4Tji5HLmYTzxO6j2jfArHXgr4M38Y//9L7SoKOH9PsXfahAlTjMGmvX9X/me9i2AobPhA2+dPreBOQYM400//XZvgQsEqIVIxn3OmLb1ffk7Kv4AGJTr3/1GTaI/HYlrt0jTB99tNvQWGIYfffqM4g36E+LItOU8Da9Ijg2vL/86jpf/9mem/IV5xjw7fl1rgQHb90jAdYSxfdz7p4amn3unigc+eKadF6YOGHO11IYPm2tg3B78wZPatwDXEwJl9o336PxUIFQt+W+/6ibyPl9MG0+7ruNlIgzYBWOO0/2P/6peS2cDHhm4D88ViJsQ2mZD/sBR6frE58efC2di8Ds/mRTCK3PfbVL/3uk9RoKNddL+n35Zmv8dwvLNz3fh+NZN0v5fPyLtv/0hiW1a4DxRhFwhqPhh7vW0udfteNRbSgghZLExJx4gAEbiNY0xWdsQx9+DCr6A4p3x3V3um/WLFXhEwDAeC9nq5RLwDBVoXyoSkHQ0oOs1V4iuOTuO2RCGe5SZDPtnAnZ1eCWMFhECyQ0RNR04tH+eqQUeDeb/aWARjjfdPn4x/93tzAlql00HlsPbAnXFJ4z8M2w6DupdW4ezdVHttub/OJOO4S2bir8NxBg976Q2zXxirPG3Q8GmKBA9MI/jTodu4+0zwya6r99nuL7YdipY5B/nTKW2CU7VfAHDDaoiR1Vsx5KgmQ9Ui7KiPiy3rGuRuJTMvJj1yBBi7lu9n2HwnBO9dFFBDxByxWMeIKGG7KQ3Z30QagNvUteGRSn39KlBX9/m9f8YMODN4Z7/+294uHlLXObKAyTUWKeGTrz1DkrdfTL82LP69nt+/5HTimW2C3ohVwKZtHpFIJG7z0J4gKBPm37uHZK+4wYNbYUQMHgTG14ryLOCN81hzPTfbIZBtO/hb077lvuZuOgeIOb3EEKlwYAwKbl0TUHoKn372bTxTEy6/qWSegfAewPXbvS5VyR+9QbTf4069sLtzTqecvBQqvk9WDzZbfp+rYSa3AT4gXhM0q+5UeuA8Yk325EDoPEDb5VGGDu8MYB7YejHz5hx/BV33jDVAwTng7dAsC4zbTtR/HFW6wECT43Sqe5pt/cL7pWzCWDwJMGb8n5YN9wP6TtM25APwdynGkapvUWvc9NPv3XCC8O0bfjJF6SnJlzY2cbv+TLVA6TSNyg9//xlHSPoG5SyeV7A2wH3+ExAhErdfr2GOwK4fvFrt2hiWiRPxzhp/Om3uWHjvGdR2dzH6hXkeQWAqR4g5d5+7eep/R+/ar0aujFefEafeVnGXt6lban1AKnmC6Y9p7ROU4/jF7TzTB4goHi8U68X6og2wNsisW2TJitHcv9Qk7me5tkJI3zLhz8g4aWter+HGutl1NTrbPfTVA8QeJ8N/uBxnT4b5+0B4oFrgL5L3LB1wnPFo9YDBN4fyRu3emtc4WvspV3TPtcRygp9O+6xaO5LDSVoxtFMHiA+eK7iGYW+9ceCYtpT6wGCdgTMfYVniF4T0864OW5i6yapmPsYokfIXJPUrddKy7//GfUWUe/DlUtMvXeOj71aDxDUD+fH74Cp48QvENum3nt4ziz7/d/QZy08heAFCY+QcYGGEHLB4AWZ+D23SObdbxjPf0cIIWTxAUeEORNAYNRe1xTTpNZ+cm8kyYZogLfvu0bmNl7yQoMQQkhQ3hAPSVMiJEG4PeOPfNPU+lhIlyMMEzwezHd9Qi45HLG14IudVS2LbcapXbUlaFUlapVl87J62dyWkmi1aNabL3Ua+sqRqmX2sybCAUDWvFKgAEKIK15kHnjNuKHLB29mI+Z4LXYkJKk7bhwXInywLUJg+cYxn7kSQBCPX41k3t8fg9/7iXR9/HMangaG8akFxlUYhgHCS4UaszL0w4kQRAshgEBAiG9yjWhIGA/BI/WamyR9lyl33yypW64dN6wDJJvv/dzXJxlvZ8PFFkDwVn58y3pt00wled0WNTKezcA/0/X3gZEyddt17nUz/QrD8dAjT6pB2geG8xEzBuABgX4HGIfRdStN/9/o1umumyW6apkuV8y4HXtlj3T+9acneX9MFUBwXrR9avtqS+/D39Lj1QogMGT6132mgvweCM90JjA2kMMivm2TaVvGVNDtf3hjadtMu3As9c6qaVtu1wHp/MuHJvXl2cbv+XKaAGLGDu6tWiF1NqCuhaMn9D7BdQAQQpO3Xu/2Ja6hJxwAhBk69Tef1rf9a5kqgITaW6a9FipS1ogfEFqQ2wbi1VQBBG3EOJx6jNrS+6/fOKsAAnC/Ii+KPiNNW1BPiCJp/1lx1y367PBFDABxEALw2Z4VF1MAATDUQ3BKmXtmfDwafAEEy9p+/YPj/YprfvS3/lj7aLrnOp738a0bxgVAiAZjr+yS0qneswogILf7gIoV/jNGMe2pFUBA7tV9EmzImrFjnhFeeEKIixBS8YzCNUlcd5WOgwksGX78ufGE5rUCiB0KqxA03TjxS8Q8j2pDt4HUbWas14Tng8fl8OMvmL6+sHuUEOICMTVx762Sed+bxp9DhBBCFidzFgIL4M/d/jHz5Sjvvq2l4oABAkgqGhwXRRYraA7yMSAcERJ8I8E1PEDQqmDAks2tcXnftha5bklS20zIJQfuQe82tHHrm0HtILyVU5G4GbPL8YaZrse96xv53DHuih7w53Lva0LIlQOSDePt7KnA4DQVGJoKhyYbGGE4xZu+5yIenAu+WFFr6Bz45qPuL+4ZGHniBSnUeFLgLV0IBQsJEnRDiJhkUA/Y+oXbf4MZoP+wbedH/0nfMF6MwEjqt2u6Iihz8Hciwhv1fOar42GgIHAgNAzi8NdSGRiW47//1zLw7R9NEl3G61ljjEVujd4vfEuTFFdqEm9PC/4urGnXdGVa7LPvN114p+mAWHfCtK3/G4+4XjUeaJN7nJq29Q9K35e/K8f++59rkuvFBkSpk3/+j+pN4d/v4/eQ306zHGG2uv7xX/U+Ohu192BtGR+f5ngQgU79w2ek1DXhNTaJ8x0H04DE6x3/6++l9+FvajvGGR8zNcKBeT5gTJ/8i0+oMHPJY/pyBJ5HuGfNc24qyZuukYAnUmJbhJ87k3cDRNFaIRtjoOF9b5nUR2cCgtHJv/hHye+fOW8OgDfeqb//jHpMaQJ1b+xNXHdzPm+4aH4PU++OP/77STlUJmG2Pdszsva+9Rl59mXNzeODe78yPP3LA4SQc0M9P+69RdLvfP1pL/UQQghZnMyZBwhIhAPSnolIczJs/gZ0//JDmKXjAwU5MYT8FIvbeArPDgg8jploM+1EbhMbb/4YbNuWbCwkqxtimgsC+SfQXnqDkEuFKu5Jy3yxl6oELITGQlgwW4JVx9yzAbl96xLJ2GZdtaxeH/6XN0y4/668wUwPEELMs6NUlmA2JeG2FjW2oEA8gNHqNMxzxYpFJLpq+fi2eBu1/6s/EGfk9Lf7LTsgiWs2SyCZ0G0rQ8PqLVJruK0lce1mCaZT7rbDo/qWcPyqDerhgKTJWI63+4e+f/a3mGEsRLgg7IM24ni5nft0Hd70RlJchETSNnT3ytCjT5+TiIM3g/FmdjCT9uo7IsOPPadvNwOEKxoxzxccV4165tioB4xw2B4hdMZ27JFTf/vPKuic71u9eMMd3gw4JsrYjr2S333AWzsZvJkPbwlshwTs6N+ZwFvJfv8g5NjQIxPbxras1xBT/jnPVvSNb3Pdz2a0ne76w8BYS/7gEX0b298Ob23CMDg10TneJh97YYcMfvcx0+dF/SMPRkY99uCIJuBGXpFTf/8vop5O01x7GCaTNyNJvT3elrOV/q9+z9wnItnXvmba9TMVvK0+k+fOVNAnoy/u1DfG1asD92XQa5u5t4pHOnTdqb/7Zxl5+mVzHU/3vjjb+D1f7GjUvbdMH+C4GGfDjz6lRuXzAQZohCbDcdRQjL9WdAzn1Ntj4Ds/llN/80+S27Vfr/FUEK4IYY/8cT9TQb/p8b71qHT9w2c0kbf/Z5F6/tx4jfbzdPtOV5CLxg6H1IvCX5Y/eFRGn5/sVQfQN3gWYLxDqNKk2hXzrCiU9DmG6zny1Ity8k8/pt4RZ/Ok8kHIJ3j5IDwazo++xDWeDQgzBk8jCLjjdUcifK9P8GyHRwTGFtYjxBuEgOmA4ID7FcfUbbt6VRiBd0owldRl5cEh6f3s1zTM4plAXySuv2r8WmBMIIF9oD4jkSWtugwFIcIQxnEqeAYXzHVGWCtMYxyNPPuKhrabhHkeILweBBe0TfNImX7E8xvhyfT5bZ4bJ//s4/qMh9hYC0Jk2eY6+vU5W5mu/1A/eNBElrfrfQmRL7/v7HlVCCFnBs+NxD2e5wfDXhFCyGUB7J/WOx7afvq3gfOkORmSN21ukNdvapCAJ4BUzB+Izx4blodf6pLD/ZO/pC5W4uGAvP3qRrlleVqaTJtDATccFkQf5G7oy5Vle8eIJvs+0p/TPA7IxTBfoKdjoYDEwjBuu0CYqX1XELkskFNizNTlTHktFhvwLEIeFnjh+G1H6wqmrUjSTiZwTF9B8LDEkZBjvpDiy6EVkng1L9uWxOR9926QdLkkQafoCiA6TNCryAUCsQTM7g3Uy4X8Szul548/5s0RQgghhBBCCLkcgZiZuMfz/JiSn4gQQsjixXGc6pwKIMj58YaN9fJzN7aOG6MhCgwXyvKxJ0/KE4cnv/2ymImHbblzVVbuWZeVFXUxCQWscREEhuW8JrCuyMsdI/LI/gE51p/XZOpzKYQETX+HzXkz0aBcuzQl25YkJYIQCabz05GARIKusdpUSUYLFfmhqccPDwzI2GUkDNTFg/Kurc3Sng6Ph1lD/z9/fFi+vnMGV/MrFAggGJ8IDRLCOLRtKZvBkrEL8trNzXLf1W0SryABelEqEEDEFhu5QJA5pFoSMylVCZji392XPxRACCGEEEIIIeTyBp4fCHulnh8Me0UIIZcVEEDmNAQWXhFvSIRlc2tCokHbNbZ6osDRgYIc7S9osvTLAbSjY7goPSMlFRsQ9gteF9pesx6CSCISVA+RTc1xWV4XVVFkrOzMSR/ACwWCx4ObGuR1G+vl6rakOUdEmlMhaUyEJBsLakgylKSpRzhgy8HenOzvyV021wCC24psVN68pUFW1sdMu9HfYclEA9I1XJKXOs4Sq/sKAwKGakRmjNoO9A9bKlVHzNCUOzYtlWYzjsPVitmoKlV1AEG84YDYmgy9Yhab5RaWXTkCCENgEUIIIYQQQsjlC0ICJu6/TTLvfgMTnhNCyGUIbPVzK4AY4JVQHwtqjgwYqAHeIUdoqE5PMLgcQMsgJPSMlqTTtAmOF0vQZu8texQAL4y6eEjaUmFZVheVLS0J2WxKMhLQ/fNlxJSe2GemghBPjYmwrKqPyt1r6+TuNVm5ZUVaxSaILzhe0LbVCwJnrt0XF3ogX5bnjw2rCDWf4bgWEni+3Gn64arWuOlnNx8L2o+cM08fHdZk9WQCjAtceXyqfwcEEKcojbGq3L+1TZJOWXODAAcCiIbBCpgxhLwg5r6FMKKiiDu2rwQogBBCCCGEEELI5QnyKiHnR/o9b2TOD0IIuUxRZ4W5DIEFEJLpjlUZ+YWb2yUWcnNjgNFiWT77Yo98Z08vXkC/rIDOAw8PiBI3LktJS2oiCXwt2mzzo+w4cmKwqF4xg7mSQI8oVRwZKVRkqnMGjgIRJR11vTnq40FZVR+TlJn3Qz75feyf052dWIb1xwcL8slnTsrOzrHLRgBZWR+Vf3/7EllRF3GFH6/9j+4fkM+9dEq6LxOxbS4xI0xsc/kDVVcwq0hOblpVJ++/cYVknaIZb/DyqErFbFSVkFhOUJOiB2VUPUgcCZvlbj9fCTAEFiGEEEIIIYRcfljBgCTuu03S73lQ7DjDXhFCyOXK3IfAMsCAD4P99ctSKoAAGKYDti2dQ0XZ3XX5GOB90JqBXFk9DkYR5sqUZNiWqGm/L0AATMNGD88YhKhaUReVDc1x2WjKppa4rG+Kmc+EbGmdKPDwQKgrLF/ZEJO2dOS04wJ/Hp422r/mPLWiwECuIj/YNyBD+bLOL3bgabS2MSb3rK2ryXXi5l95/viI5gC5zIbZBVMVR9UxeH5YVVtsMx+zi3Ld2nZZk41KVIruhmbIQOTAP/iK2JZjfiI0FpbTA4QQQgghhBBCyOIFCc/jd9/ihr2i5wchhFzWwF7uWo7nGIRb2nlqVAoa3skFdni8qb+hKT7uuXC50Z8ry/f29su/PH9KvrOnX148PiK9o0U1zPtCBEDH14oXmMb6eCQoqejpJRRwPWn8I/j7+8dFyZUqsrs7J08fGTb1KKnxuvac8DDJlRwVay4HkOcEAhFCj/lA8Dg5VJQTgwWp1PQvmYxtIfdHRSynJJmQyPKmlIQsMzaqNfer/sQ8PEHMlFngPi7Yr4QQQgghhBBCFidIeJ645xbJvP9NYicT3lJCCCGXM/MigPSPleW5o8PqCeEDg/yqhqh6OtQarS834IGBvCBfebVH/vHpk/L9vf2y+9So5qWA9wU8FHxhwhcy/GnzY9oyaRuDL3oUy445V1GTmz91eEg++0KnfPalU+rt4edfAcVKVTpHilq3y4XWVFiuXZKUSMBtJ/oDfbvj5Kjs7R4znaWLSQ3oKe0tjCPk+qiWNHF8axq5UxwNcYUCbLONTmK5+YAPCJbMk2ZKCCGEEEIIIYTMK/D8SNx3q6Tf+XqxYwx7RQghVwrzYs2E58exwbzkazwOYPNPRoKaHyMeQhidyxe0uVypStdIUb60vUf+5IfH5GNPdch39/TJ4b68eoWMFh0VJqBJeLrGjGA1toGAgTwhfWNFOTlUkJc6huWrr/bK3zx2Qj7+9EnZ352X1fVRDb9Vy0CuJHu6xsz5JgSpxQzCXyEUGJLCT/Zyqcrh/rz2+1m69MrEdJUF7w/H0fsxaDuypD4piYAXTs0OTNyvZsrSgWmKJkaHAHJ537eEEEIIIYQQQi5PkPMjftdNkn7vg2Kn6PlBCCFXEnOeA8QHHgjtmYi0pkIawskHjgkIxQQhwDe2Xs5A4IAgBK8YGOeRm+LFEyNyahgiSEVFEPRHoVzVfjKzUq5WNYQT7M8QSnpHSzKQr2gi88cODmp4re+a8uyxYdnfk5Nec2zk/QgHbbl7bZ2GGfPzYqCPjw0U5Af7B6RvFB4ounjRAsM98qLcty6rIoivf0AcQl88cWRIupj8fFrghQWJQ8eW6bhUsCK3rWuTJZmY2E5FLO82RZfCAwQT8AjBfhBAvK6+omAOEEIIIYQQQghZ3Fgh1/ODOT8IIeTKAy99W+94aPu8mMTxlj4SfP/Kbe1qqNaTWZbmonjh+Ij83RMn1JvhSgT9AC+NRDigCc0hFiGSU9gTivwLAoMzDPslUyBclB1HBvNl02/OtOGs0tGg/Pa9yzWZOvKs+H3+4olh+bNHj6lHzmIH4+otWxrkXdc0q+CjKpEhX3bkMy90yY8ODKiwRE5HZYyqGTvms2JVZVnCkQ/dtVmWxU0fmgGINQHTnwHMmk/8K5v+dizb7BdwRREvL8iVQv6lndLzxx/z5gghhBBCCCGELCasEHJ+3Op6fsQZ9ooQQq40HMepTrhmzDHwSEAyaiSlxjQM8TDIw8thWTYi1y9NjRv8rzTQD8OFinQOF9UT5kBPTvZ252RH56iWV72C6V1dY+rZgDwfR/sLMpirTCt+wLOmPh6UVNieJH5AcIL3yXT7LEaQ+2N5XVQ9XGo9EtAv6EuKHzMDQaNiei1kByRYLUsyZEk2aUvQclSAG3cPqu1Ysw/CYU2MnkkrCSGEEEIIIYSQSxIVP+67TdLvfSPFD0IIuYKZVwUCoZ2eOjIknUMFb4lLQyIkt61MS3xKrgpy/sCb5KrWpHqUABWczCdCbUFAuUz0D9m2JCHrm+Iq8AC0EyHGkA+le7Soy8gMWLZYgbA4lZJk7bKsba2TAOSNqiNWpSgh82mbbq1WbalY5tMUzNsQME1/uzLI5ZFHhhBCCCGEEELI5YsmPL/nFkm/6/Vix2PeUkIIIVci86pAwDD97LEhOTZQVA8E3wsEb++vrItqiCw/VwW5MDKxoNy4LCmpSNBbYn7hm9IxVJQdnSPiLHIFBG1pSoZkc0tSmpOTk5+PlTDOhjXHCTkDVUvHgeWUJWGVZXljRoK2LZZtaQ6QAIQQsxmCYWmPV10vG9yh9hUW+ooQQgghhBBCyOLECnphr973Jub8IIQQMr8CCEC+il1do9Iz5e38ZCQg962rU28QcmEgL0ZbKiyrGmKaF8P3joDo1D1S1DBki910HQxYctuKtKyoi+i838ZixZGj/Xn1dEFyb3IW4OVhRgNy0LQ1xjV0GjxDqlqQ7twRy3QjilLF1tjIDYVFCCGEEEIIIYRcqqjnx723SvqdrxM7xrBXhBBCFkAAcapVefLwkOzpzrlvn3tv7sPzY0NTTJZnI2rcJudPYyIk1y1JSsDzsPE5OVSQI/2FRR/+CjlNlmaictPytLSkImYMeSsM3SMl+eauPukbK3lLyMxUNddHyKpKc31K0lEzYwYHfDtUFkGILDOt3h6eAqLCyPw/JgghhBBCCCGEkAtCPT/uvkXS73tQ7FTCW0oIIeRKZ0EsmwO5sibx7jOfwDfSRwKWeoEsSbtv9ZPzoyUVlmuXpiQSdJUBP//Hvp6c7D41pssWM+loQN60pUGTn0P8wPhBG/MlR47052Vv95gUyotc5VkAMCqsakmCVkWWtTabaWQAcUx/ijhW0HxarvcHJA+zED4fFc8zxN+fEEIIIYQQQgi51FDPDyQ8R84Pen4QQgipYUEEEHiBPHt0WF46MTyeCwQEA7asbYzJqvqohM00OXcQSmxlXUQS4YncHwDeNp1DRTk1srgTg4dsS9aZMbK+KSaxmgTvoGOwIN/e1SejRSbmnhVVR6rlosRNPy5pqpOA40jA9K8KZqY4FvoXidAn8n1ABMGULRWxqqZQBCGEEEIIIYQQcgnhen7cLOn3vpGeH4QQQk7DesdD2xfEoonwTLevysi7tjZJWyYsrgkb4ojI4b68/MsLp+SVjhGaV8+RTS1xed+2ZtnYHFdjNkCfwuPmCy93y/MnhvUN/8UKEp9/5LZ2086k+PnyYbAvlCry1NFh+fhTJyVnpsnZsatlCVbysq4hJh+4/yppDDgSDlSlWnGk5FgSNv0bdvIqgDhWQMzWUrZxrzoSqubFMgMJIsmVFBKrsOegDD/8LW+OEEIIIYQQQsjZqDpVKR3tEGd0ASJSBGxJv+0BSb7hTiY8J4QQchqO41QXTAABDfGQvHFTvbxhU4PmAPFDGZXNL8dv7OyRr77aq+GyyOwwXachxD54Q6tEa7wjCmVH/m1Hj3xnd68M5hevOJAMB+SutVl599YmSUURomnCe2hP16h8eXuPPH98eNHnOFkogk5J4lZRti3PyttvXSv1QUekXBJEDytXbYkGAxIuj4ldrYgjASlaYSnZEbGlLBEnbwYX8oVcgTlBFrOCSAghhBBCCCELTLVYkt6//JTkX9rpLZkfrFBIEvfc4np+xGPeUkIIIWQCCCALasnsHSvJSx2jcrgvp6KHD7xDtrUn5arWxLhnCDkz6Ke2VETWNcYl7LtGGBBubChflgM9Y4ta/ADLshG5c3VGoqGAih8AH0P5krzaOSY7OkcpfkwBb9rYtjsezA2unxCNkEi+6sCnoyQrWhslGjDzpbzZoSIBOyB2IKDb+9059T68ou9LiG4sLCwsLCwsLCwsLCws51C871PzhBUMSOJeiB8PUvwghBByRhb8VW6IH48fGlIvBR/8blxeH5Prl6Y0oTc5O7ZtydVtCbm6NS5e5CulXKmqMNA5XPKWLE6azTi4aUVaE5+HAm4DYciHwLPr1Jg8e2x40hgiLkhd7gsfgUBA+wziEfoNOTwSIZGW+rgEzLRtORKwkOXDbO8pH/hw0M/69yp8PRz9u9X9WTPQCCGEEEIIIYSQiwASnsfvuVXS73qD2HEmPCeEEHJmFlwAGS5UZHvnqBzpy2tCdKChjcwnjPkI6eSHcyIzg3BiyPvRnIqokdsPDTVarMjTR4bl1PDiTX4e9MSdu9dkJyXHxzjpHi1p7o/9PWP0/pgGeH/4Agim0Weu90xVhaT6ZESa06ZPKwW9+eF9Va2UzWp3H4gfuBv9rrXMcuT+cOUQQgghhBBCCCHk4mGFgpK451bJvP9NYieZ84MQQsjZuShKQ+dQQb7yao/0jJb0zXSfTCwkW9uTcsPS1CTDN5kMPD6QUH5jM9w8fQO36/1xsC8vHaZ/a0OMLTZW1Uc1JFoiHNB5FcgsS3JlRx7d3y8vd4xQ/JgBP/yVessgpJXXd/gXMvfUksY6SQQDYjsVERTIGlU3s4fZ0MwHzBT6HaIaPEBcOQTd7U7xviSEEEIIIYQQsvDA8yNx722SfufrxI7R84MQQsjsuCjWzGKlKvu6c/LiiREZyrmhmmCoRVgnGL8fWF8vbenwpNBOxAV9gjBhED8ak2E1bgMYqAfyZfn+3n7pHlm84a8gety2Mi3XLUlKwDTWN+DDW+hAT062nxyTQSbKn5FxwcOUWgGkUqkIUsUsb28Sy7EFUcXUp8Nsg8+gyhsIdWVLxcJjwZurVnR91RyD4gchhBBCCCGEkIsBcn7E77rZTXieSnhLCSGEkLNz0SyaCIX19V29cri/IBUvlQOMtTB6r2mMyruuaZK6WMhdQcZBeLC3bGmQzS0J0cTWnoE7V6zInu6cHOzNSdHv0EUGkrk/uLleXrM6O574HG2DuDNi2veDvf1yqC/nbkymxQ9/hX4DEBWBU3UkFo1Ia2NCLKcogYAtlobIQh4QbO+PGfh8wAvEEtt0vC0VDYPlPircYxFCCCGEEEIIIQuFFQpJ4r7bJPOeN9DzgxBCyDlz0QQQhL7qHCrKV1+FCOIatX2jLYzfm5tjcueazHgYJCKaw2FtQ0w2NMUlPqVfEE7se3v7ZDC/OL0jIkFbXrsuK69ZlZVsfEL4gvgxlCvL13b0yMsnR5n4/GzgHjL31oQQEpCKmQ5YtjTUm/spaus4cpyK3m+u6GgeA/AEMUX9QXAI716EF4hYuArutSCEEEIIIYQQQhYKzflx7y2Sfu+DYifp+UEIIeTcuegxbXZ1jcmj+wfkxGBh3MAKo2wiEpTbV2VlfVNMQoyFpaRMn7x2fb00JcPeEhckPt/fk9OwYqXK4jNTw+vnhmUpuXttVpqToXE/AxjoRwoVeeLwoPzk0KAML1JxZz6oWrY4GqrKBX2GEjA/8QmBEWKGY0EocyQVKsuSbFyCjuj9VEUKEHP7Yxs31hzGjSmWn+8D5zA/PBbfqCKEEEIIIYQQsphR8eO+2yT9njfS84MQQsh5c9EFkFLZkaeODMtzx0dkJF/Gy+uKJmxOh+W+dXWyrimuRvIrGSSF39gcly2tCfX+gEgEIBKcGMjLY4cGpbQIQ1/huq5tjMlr19eZ6x2ddJ3zpYrs6x6TR/YNSO9YiUZ4AwKCobg/3RTl6DENV4XiVNyb2gwFOxiRcjWgnh2pyoBsaAhKHOOmXJZAICiOY/a0Q6JONRakE+T8cIt7CAgo/jnUN0SXE0IIIYQQQggh84kmPL/nVkm/6w1ix2PeUkIIIeTcuegCCEyqA/mSPHNkSHZ1jUqlWh0PzYOcEDcuS8v96+tkZV3ULHf3uRJpSYXkvnVZiYWRt2HCED0wVpKXTo7KzlOj4ixC+3RbKiyv21AvqxtiEglNDEeEbTo2UJBHDwzIMXgH0fZuqIqN+0PvGtwMvvhRI3yZ9UHN7xFAVCspmx9BccTcPtKcDEqoWhZLO9MXUDCeaj1JaoUOdxtCCCGEEEIIIWShsIIIe3WrpN/3oNgJih+EEEIujEvCugl77N7uMfnxgUE56Rm7fREkGLDklhVpDf20JB1Rg++VBvKgbG1LqkgAzxjF9E/FqcorJ0fl0f39Ul6E6kdjIiSvWZ3R8Fdooy/s4LNrpCRPHB6SZ47+/9n78y9LjuvOE/z6+vbY98g9kcgEMrGS4CJSIimqJGqp6pKqpOqaqu6umTNzzkz9FfVHzK9z+oeZM32qu06paxmpVSIpUuIOEMSO3PeMfY94q29zv9feywiAIAmQQGQm8n4yLdzd3Nzc3Mzcn9u9fu3uPJKWLZ8EH9T3WWM05GDQbfrr8D1VhmV5hkjiY7/AxOgIapXosVYiGoZhGIZhGIZhGA83avnx9S9i6M/+wKa9MgzDMD4WHprPuynI/endXfzlm2tY3eupD4OBEoQOsn/79DD+8KkxjFYfLyFu6Ht4fq6OP3t2Ao1S4LRFAutlabeLt5abWGvuTx32qECFx0tHG/j9s2PvUX6wzXe6mfqF+at31x9JnyafHM42wyu8vhXHe6EShM7LafWRFSl8rwCNaqR6cXR2FoEfuRvNMAzDMAzDMAzDMB4y1PLja1/A8L/4E/gNc3huGIZhfDw8VPPb9LICL9/Zxf/6+irWm4kqQQiF4+XQx5dPDuNPn6EiINT4TztU9NDnx++fHcWQXDOVA4Md3TRXvx8/vrmjliCPEs6qp4F/csG15UHlRzvJ8K3LG/jWlUfTquWThgYe+3CDk1bRmTl9dkjwPWQS70tdhpI4yDsoeSnmZ8ZBd+imATEMwzAMwzAMwzAeNtTy4/d+C0P/7BvwKqV+rGEYhmH85jxUChDSSjK8cmdHLUGoBCEDwX+9FKoS5C+em0SjHKiC4NPMbKOEzx8fwhMTVfi+s4ZhXaRZgZ/d28OrdBzfy/qpH37YXJXIx9efGMV/d2ESk7X4fhvyujpJju9e28Z3JGy1U7fDeC9SXzrLlQQuafFRSNwgUAlCvx1+4Mlf6RtJG6OVCOONAPEBB/OGYRiGYRiGYRiG8TDgRSFqX/0Chv7ij8zywzAMw/jYeegUIGS3m+HHt3bwt5c3sXlAEE4FwFA5xJdODuOfPTOFsWrU3/Ppg1Nfff54A589Ukcp3Fd+0Dn4RivBD2/u4NZGp5/60aBWCnTKqz9+ahzzw/yio7h/XbRoeXNxD/9wfQuLOz2zU/iVDJyhD5C69HLnwlwVHbI/S9T648jkKEpUikgcnagbhmEYhmEYhmEYxsOAKj++/lsY+os/NJ8fhmEYxifCQ6kAIVudFH9/fQs/uLmNjZZTggwsQagE+d0nhvGnFyYwp4L0TxdR4OHLp4bxO6dGMFaL+7EOWkl8++om3lluInlEpohis800Ynzj7Bj+8Nw45kf224xt2kszXF9v45tXNnU5mPrM+MVQ+TEIRJ2fE6nPgv1CgpelqPoZjk2NwqODkNScyRuGYRiGYRiGYRgPB14Uofa7X8TQn/8h/Fq1H2sYhmEYHy8PrQKErDdTfPPyJl69u4PdznuneqqVQnz9zCj+8OwojnyKlCBUCDwxUcHvPzmKoyNlDCYtYnwnzfGzhSa+e23roZ8i6n65JRyT6/g9aas/ODeGiXqkVh8Dy48ky3Fzo6M+P95aaqofmMGxxs/D6a047dVBOPXVQd8geZ4jDH14eYISUsyMxigHHgJJZHVrGIZhGIZhGIZhPGi8MHDKj3/xx/CrlX6sYRiGYXz8PNQKEFoC3N3qqsXDK3d37gv9BwL0OPTxj2hV8NQ4jo+W1fHzowyLPzcU6xRRVOpwm9dJqCjglFf/9Z21+xYxDzMsNafxOjNZVSfuvydhtBr9nELn0mpbpzr70a0dtW4hB2T5xgFYL4P6+6A6ckoQD34gt3VeIPILTI/W0Cj78Av2mYGrdMMwDMMwDMMwDMN4MNDheZXKj3/+DZv2yjAMw/jEeagVIIQy3Surbfynt9bw/Ru0fKBjdCcGpnIgCnz87pkR/OkzE3hiooxy9NBf0i9kvBqp5ce5qSqqcaBxVBRQB7K8l6h/jFsbXWSPwNRXVH5cmKnhL56f1Km8GqWQDaZtxmtqJzneWmziL99cxfdubN9Xfhi/nFxuWQZ3C7DOpD6lO3CTgdNfqbePPEPo5Tg6PY56HKo1SFE8Og7zDcMwDMMwDMMwjE8f6vPjd7+Ikf/+T+DXbdorwzAM45PnkdAWUN5/b7uHv764gf92aQPrLacEccqBAnHg47NHh/A/vTSL3zk1rD5CaD3xKDFaCfHF40P4nIRhWT/IbjfF6/f28P2b2+hlD7+ioBL5+K0Tw/jz56dUmcPtgSULG6bZo5P7bfyHN1bwdn/aq4dfpfNwQF8fdOdxEG76VIKoIoR1LTHST2Lfw5HpcZTl/vA9ukc3JZNhGIZhGIZhGIbxYKDlhzo8/7M/gGeWH4ZhGMYh8ciYS3A6rKWdHr59ZQt//e46Nlr8op3ydKcEoZD99FgZf3phEv/jZ6YxWYsR+I+GFqRRCvD540M6ldeElPvgVF5JVuC1hT3872+t/pwflIcNFrvcn5bsz56dwMnRkrSLs2RRJEGrl6lfl//wxiqurXX0+owPD5Uf1G/kB1RGAwsQ3syB58s21SBAvVbWKbBCZAh9Z3ljGIZhGIZhGIZhGIcNfX5Uv/p5DP/FH8Nv1PqxhmEYhvHJ88goQAhFvmutRJ2AU4C+1uxp/EAJEgYephqxKhP+b1+YxYWZKiKJe5ih9coL8w1849wYJusRqLMZTBNFpc8rd3bwn99ex2Y7faitJChbnx+K8a9enMIfy7XMD5fUR8vA8oPX0+pm+K/vrOP/uLiBxZ2eXp/x4VHlB+04vAKFl0uluimwiNwBzgcI61QClWiTY6OolJwzdFp/FKACzaxADMMwDMMwDMMwjMPDWX58CcN//kfwKqV+rGEYhmEcDo+UAoRQvktlAKeD+o9vruHOVge5+sRwU2IR+s94fq6Of/bsFP7g7Dim6pHGP2xQSP3CfB1//LRTGHB7oPzgdb6x0MTfXNrAzY2Obj+MsMrp3PwfPz2B//6FaXzl9Cgm6s6Khdeh1yLpNlsJ/vKtVXzz8gZW9pziyvjo0PrjvfQ7BhcStP9I8GVjZnICkRfIeq7xD2sfMgzDMAzDMAzDMD6dqM+Pr30BQ//ij8znh2EYhvFAeOQUIAOa3Uydgv/HN9bw7koT3XR/eigKe33fw1PTVXzj3Cj+uwsTeG62hlL48FwuLT1Ypj96agynxivvUX7Qyfn1jTa+fWUTF1da/SMePkqhc3T+T8+P40+eHsfnjg2hWgr0OgZkea5Tl/2nt9fxzctb2Gil/T3GR4W6D599hP17oPHo/9XABJ6vzs9rXhdHR2KUkOm0WIUXSuB0ZI/sLW8YhmEYhmEYhmE8Qqjy4+tfwtBf/BF88/lhGIZhPCCCp/7pv/13/fVHjjQvcGeri+1OpgqPauSr9ccAKhXqsk0Fw3QjVmuFJAf2etkD/Rqecuqz01X8s2cn8cxc3VlJ9AtEH+e3tzr4m4sb+Om9XXRY4IcMln92KMbnjw3jHz05ht86OYxaKdD6HlQsr6krZb+52cG3r27ptFed1KZf+k1Q/YaEAIUEV5eFKjcY69ZzL0SYdXG01MZXzs9hNJT2yDOJj/Qol8cD7PyGYRiGYRiGYRjGp5s0Q/snr6Py4nl1eO7XKv0dhmEYhnG4UOb+SCtACEW5y7uJThNFRiohGmUn6CUUxFMwP1aNcG66hul6jN1Oim5WSDh8gXzoezg9UcW/emEaT8/U3mP5wZm8lve6qiz44c0dNHsPn9Pz4XKIE2Nl/OOnx9Vp++xQSZ3NDxQ4vA75g512qpY5dFr/natbqqwyfnPYr32pSlViyIragkh9c5uuz7ldLhKcn6ngmSPjqPi5xuZ+KP3LU+WJKUAMwzAMwzAMwzCMT4w8RzDSQO0rn4dfNp8fhmEYxoPjU6EAIRTnNpMMtzY72GwnmGnEqES+KhsG1hWUy8d9J+lPT9d1/243Q5IVSCUcBnR4/tR0Df/mpRk8MVFRp+0D5QenvVra7eF717fx3WvbWraHiXLoS91F+L0nx3RKMV5HOdpXNBFV4sh1rDcT/P2NLfzvb63pFF6m/Pj40PpWb+fs93SI7hROVHLoXllU0MMXnzqCo6MVlPwUvqTPvQCFtAOnXjMFiGEYhmEYhmEYhvFJ4QUBwukJWdoUzIZhGMaD5VOjABnQywrc2+7h8lobU/VYp8OKAk8tFAYEnqfTNR0fK+MzRxqIZd9GO1VFCCvkkxINUxlDi49/87kZHB8tf6Dy4++vbeG/Xd7Edufh8ZPBcjdKIV6cr+NfvzijTtvHaqHUq6/lPwgtVpb2EnVO/025Dvr7MN3Hx8v9njxQghxQgFCxwamxGmGO335mHhOVAGVkekxayIvngXSGYRiGYRiGYRiGYRiGYRifZlT+/mf/85ufOmkoFR5T9QhnJir4x+fHcXSkrFNN/dxUTQKtFbbaqVoqfOfaJm5tdJF/zIoQKhEuzNbwL56fwunxyv1yvEf5cX0L37q8qWV50A0yELIPVwJ89sgQvnhiCJNSn9P10n3FzUG4Sb8q37+xrYF+P9oPoe+STwd+X4GRgU7PaQFClUZIE+OCATgxEuFfff0M5mOgip6aH3fyQG6MEL6k8fr+QwzDMAzDMAzDMAzDMAzDMD6t5HlefCoVIAM4bdOx0RJeOjaEz0ugI3QqI8hAATGAfkHoUJ3TaH3/5jaur3d0aqwctAzpJ/o14LRbPP8/OT+Ok2PvVX5Q0bK408XfXXV+MjbbD9byg1VDRdFoJcTnjw/h/EwNc0MlCbE6mScH643lp5P2a+ttfPvKJi6ttrG218MhzSj2mMK6p88PKkA4tdW+AiTMU7X4+PzZefzBc9OY8FNUkEib5egWATw/UG2VKUAMwzAMwzAMwzAMwzAMw/i086lXgAwYr0U4N1lRRcQXjg/p9E0HOSjUb/dyXFpt4u42lSFdvLvcxNJO76NZZUh+kiGGygG+IOf8+plRdXzOUxxUfjDf717bwrevbmGjlfQPfjDQJwqtU85NVTE/UlLrGfpSGdTL+xVGvMTrGy18/8YOrqy2cXWtpVOQGZ8sdGnOjuQVVGIUagXC2FC2o7yHWtHDP/md5/HCkTpGZD3K29rvEoRyHBUgD59jfcMwDMMwDMMwDMMwDMMwjI+bx0YBQigEPjZSxpdPDuPMZAVnJ6uIQ6cIeb9wf8DCdhdvLe3h7nZPlRU3N5yT9V/l14JZ0QfJF48P4atPjOgUXGRwnkyVH111dk4FyFrzwSg/yqGH+eGyKjxmG7E6Zn9quopKFPRTOFhuMlDc3Nvq4vJqCz+7t4efLeypFYhxONDLh/QiWZM69wb1TgVIinLWxXiU4V/+4Ys42aiilnfgZx0Evo/UC6XtaDlibWUYhmEYhmEYhmEYhmEYxqefx0oBQig2LoU+zk5V8VsnhnBkuIyjoyXU4vcK/AdQ7k9lhU5Vtd3Fy3d2cXOzq35DaLFBZ+V0nn4QnuPoSAm/c3oYXzo5golarFNL3Vd+5AXubnGarR2d+or58JjDaAQqZhpyrWO1CCPlUC08zs9W8fR0TeogdFNgyR+W5/246bp6qhSi4uMVqYsPowwyPl4KL6BLD2lMVnym7aV+PbIeqkVH+nYNf/aVpzEZhSjlXYR5Iml8yF9VgPh95+mGYRiGYRiGYRiGYRiGYRifZh47BchB6Avk1HgZv/vEKJ6crGC0GqFRDp3W4wOgoJ9KACo8qAh4e6mJK2ttLO/20E4ydfqdSiIqFf7o6XE8P1dHoxSo0mNgQZHlUAfh37qyiR/c2MJe75P9Gp/+PEqhpxYdtdjHcCXEqbEynp2ty7VXUO0rfvqGMD8Hy95NM6w3U7VS+eHNbfzo9g52u9kvqibjE4bWH+yL2q+oAPGAgEqNtIt60cJXnzqGrz13DHWkKHkZgjyFJ4l6mfSHIJIMbAoswzAMwzAMwzAMwzAMwzA+/TzWChBC4TH9gcwOxfjKqRG8eIRKixD1kq/Kg18EhdC9NFNrDlqIUEFwcaWFvW6Kl44NY7oeoRS5PAbKDypOrqy18B/fXNO0H+e0UbwOnosO1uneJJB1Tu81VglxdLSs/k8uzPatPGR/LImY9pdpMdpprv5Qbmy08TcXN3BxtS3X7JQ8xoPER5HnKKQh6aLfKzLpwxKddDDidfEvv/IsLswNIcq6iH3pqaoA8bXtwiiWY00BYhiGYRiGYRiGYRiGYRjGp5/HXgEygLqAeinAWDXCc3N1nbpqvBqqEqEUOMXCgIP+MAZQEUKFBpUhNclHlScH0vGYd5db+N9eX8H1jY5UvOzTeGdVwvDBE08dxOXHsvCf6i9kOw49DJdDDUeGYxwbpfNyZ81CKxdO+VWLfFTeN83X+6+DW2mW63U0e7n6PvnRrR3c2epip5OhR/MV4yHAd23HDuAVKLIEbFov6WKuBvxPX38GJ+qhWn7QMiTPaSUSIJH2C0JaOFk7GoZhGIZhGIZhGIZhGIbx6ccUIO+DugD6A+F0WFSAnJuq4vPHhjDViNWqgtYVA8uQgQKBHFSGkIP7CK0mON3VRjORZYa9bqbKEipOOIUWp5f6ZRYnpJB/se/jyEhJp64aqYQoRwE4ERIP5T4qX6oRlR7Be5Q2Az5I6UFlDN2YdJNMLVR+eHMHt7a62FIfJ5lZfDxk+OrLQ9pO+iKbsch6CD06QU/wzJEx/PnnjmM6ShBqamnbNNOpr9jXeID5ADEMwzAMwzAMwzAMwzAM43HAFCC/BCokRioBpusxphsxTk9U8NxsDXMjZdUc9HUIP69UeJ/yg6jsWZZ0WM29SZprOlp+tJIcHdn+MBYgLFM9DhAGTsnxYcvwfgUNz8u8mr0MNzfaap1yfb2NlWaKpZ2u+jMxHk7YT7R15Y8v/SCnk/MiQdkHfu/FJ/C1U0MYxy4CWopIG2dpAS/gdFk+b3hV4hmGYRiGYRiGYRiGYRiGYXzaMQXIh4TWFFSEHBstYXaohIlapNNNzQ+X1LH4QCg9MLqgAuKg0mGw/f7435T3Kz4GHDwPk7hUBbppjoXtrjpiX91LsNlKsSLLu9sdbMi68fDDniatq5Y7fkAlWAKkbQxFAf7l7z+DZ0cjNJIm725qSPQIrnpBqAoQswAxDMMwDMMwDMMwDMMwDONxwBQgvwa0nBirhjoV1dHhEibqkTpOH62EmB+OMVKJPnD6qYP8IsXFh+XDHE8rj+12qoqODVnudlJsyvL2Vge3NjtY2U1seqtHklQ6gIccAbyACo4eonQPJxol/Kvfu4CjtVi22+rs3JN+yEnSVFnihdonVIHy63U7wzAMwzAMwzAMwzAMwzCMRwZTgHxMcFqqk+NlnJmoqpUIHZJTN6FTVpUC1CIPke+jFPmIAv+ApYg0gtpnfBSJdKH+SHgsFRh0bk0H5d20QFtCq5c55Ucnw92trio87klY3kskrTX1I43HqckyFJms+mVpZw+Z30Y928VXj0/hj148jUY5kL6RSP9LqfpASOWHajzcNFgFe5wpQAzDMAzDMAzDMAzDMAzD+JRjCpCPESol/L6TdCo4qBShNQitQmgtMlmPMTcU6/RZcSAJJB19gVCJ8VEE0pzBqBz6etx236pjda+He9s9bMn6na0uFne66ticihBJpksqTIxHnL4CJPACpGkofUD6W9RFLd3Ev3jhKXz5iWlEoaTgtFheCr+gAiRXBYhXhKpqy6UDmQLEMAzDMAzDMAzDMAzDMIxPO6YA+YTx+oLmgYPzwfbHirTeoAHpHeLgtvEpw6Pz/AxRECFJfWQ5EEUdjHkt/J9/51k8PTEEHylyP5HE2QELENksYukXEuNTiWI9xDAMwzAMwzAMwzAMwzCMTzdUgPj9deMTgFYXDM4So0CWfwKhn/fAysNE259mOPWZh1Tb2UPgFwiyBFMjDQzXQ3hFrsGXjkBfHwyDHqFrqoEz8w/DMAzDMAzDMAzDMAzDMB4PTAFiGI8IVH7ApzNzT6exooWHn6eYnxpDJY51yisGxntUgvS1YVR82LRXhmEYhmEYhmEYhmEYhmE8bpgCxDAeEajI8PxQloFOp+blKcoBcGRiGJVA4jjtlbdvATKAW7zV92MMwzAMwzAMwzAMwzAMwzA+/ZgCxDAeGTzkuZvqzKk0MgyVA0wORSiFEldkOgXWQOVx3wREMOWHYRiGYRiGYRiGYRiGYRiPG6YAMYxHCPXzkuVy4+YIvRSTQ1UMxz5CtfoYKD/er+4w9YdhGIZhGIZhGIZhGIZhGI8fpgAxjEcEGnR4no8iz4E8BbIuZkaGUAtDeHkGz3eWH94Bhx+Fl6PgP4kyPyCGYRiGYRiGYRiGYRiGYTxOmALEMB4RqL+gk/OQmpCiB69IMDdeRSXwZZ/z/0HnIIXe1gfsQEzxYRiGYRiGYRiGYRiGYRjGY4gpQAzjUSIHAt9D4GUYrZcxPVpClCcosp5TdNDSQyfIcgoQs/owDMMwDMMwDMMwDMMwDONxxRQghvHI4Px8BBL8IsWRmXE04jLCvvPzvKB+xEfBabI8T61BBlAdcsAnumEYhmEYhmEYhmEYhmEYxqceU4AYxiMClRgB9Rr091GkmJuZRCmIEHueWoVkRYG8UFWHpA76S6K2IG7VMAzDMAzDMAzDMAzDMAzjMcEUIIbxCOF7zgqkUo4wMVZBHBQIJT70eSvT3TkVIIMpsKgAcUoQdaCua4ZhGIZhGIZhGIZhGIZhGI8HpgAxjAfKQEmxr6z4ZRR5Dl+SjdWrGK36KIUF0qyHjBYeXijB5bH/92AwDMMwDMMwDMMwDMMwDMN4fDAFiGEcKs6Cw01J5RQThU5XxcDbkcG7v4dpNb2Xo5CQSXyRZzgxMYphSRvmKXKvQCrrWSHHFpJTkSLOUkS5HMe490yHZRiGYRiGYRiGYRiGYRiG8XhgChDDOHT21RH76hDGvF/58fN+O3LZWRQJjo8OYXSgAJHDUi9AJoGTX0VFKiFRBYinMZwkiwe6PAzDMAzDMAzDMAzDMAzDMB4HTAFiGIeFOuI4qIXg+iDOKTy8Qtb7SfoLR+FUJr7EVqMAo/UQ9Zi3b4GMShBZ8wLZ5hRYksf+qZwqRekvDMMwDMMwDMMwDMMwDMMwHgdMAWIYhwWVGH2lxACqJ6jUoJ0GGPqaC6e0cCHvp+B65GWYHmmgUY0kr1QVJr7nO2WHBF3Itst1YEPS32kYhmEYhmEYhmEYhmEYhvEYYQoQwzhUBoqJgRJE1mix0Y8dKCrc2r7iI/dkKZFB1sOx6THU4hLyNNNjA59TXA2O8yUt0zNo1IG83WRbhmEYhmEYhmEYhmEYhmEYjwOmADGMQ2ffAoQ4LyDvV054KDyqLfaVINwKiwTzExXUQg+BxjqKglYjPN4dQwUIj2eejHH5E1OAGIZhGIZhGIZhGIZhGIbxeGAKEMM4VKiYGKgh+Hff+kP9f9yHie7vkSA3q+wfq5UxWQ9QCYGgr/3I80zSMpWz+hhMmcUYd46BcoXnkIVhGIZhGIZhGIZhGIZhGMZjgClADOMQcWoIue1oncH/3r6Kg5YgTtVBxYWLIYMtv8gwM1pHI4oR0OIjy9TygwS+p1kSWn6oBYjbkpBLBu7MhmEYhmEYhmEYhmEYhmEYjwumADGMB4jTWTjlBBUXaZY7BQZjaNUhCUL+SVP4eYKj02Oohh48SRdIvCpHPB8+0+T7ChGXM29vp1zRc5j5h2EYhmEYhmEYhmEYhmEYjxGmADGMQ8T59aByYsB7lRL7+yUUtPqQrTxFWGQoyd06OVxGPfblxs3hMW3/cJ3wiundJjPqrxyESpb+qmEYhmEYhmEYhmEYhmEYxqccU4AYxiHx88qHfeUH1+jE3POp2hAkrS/BKzJ4eYLYyzFWL2G0FqIcMnGOTA66r0yR7YHXD92kcuTnzvdzEYZhGIZhGIZhGIZhGIZhGJ9aTAFiGA8Qp/hwVh/02wHf71t1ePDo16PIECBDmHcxPzmKerkE5Cmy3E2VBT/Q9EWRy5+sn+M+91Ue1IaY+YdhGIZhGIZhGIZhGIZhGI8RpgAxjAeGU3xQZZF7tN8IJOzbcbjprzLEfg4v6WJuvIpqLGnU+TkPl3Wft7Bs5AMLEAnv1YEoziLEFCCGYRiGYRiGYRiGYRiGYTw+mALEMA4Vaic+QEOhqgtOfyW35H1FBRUbCYIiRTUCJoYCnf6Ke2kdQoVGLkky+v7wCoRyKJUgPO7nlSByVMHb3W55wzAMwzAMwzAMwzAMwzAeD0waahgPGE59pbYbA73HwA8ILUDo7DxPMT0+gkatpIoOL5CEkiaTA2gJQmfoTmciG2oa4rQfXuFL4DRautUPhmEYhmEYhmEYhmEYhmEYjwemADGMBwWVFxqcYoLr1F+oUoM+PZDBpzIkzzE/NY5GVAZSTn+l6hE5XBLC0zQky3KNozplH+Ztt7lhGIZhGIZhGIZhGIZhGI8fJhk1jEOE01wNbjsqPvzCRyDLMM9lmSHwZOlTC5LAk/UiiJHkwPx4BZMlD1Gewcs92S/pZL/nFVxFXnBurECtSArVqlBJQnUIJ8Xi+fbjDMMwDMMwDMMwDMMwDMMwHgdMAWIYh4an/1UFwempXIxaflDnQafnDHRoTuUHLUDo56NaqWK0GqOCVJUk7jhJo4G58a/cyl7Qz5FxgzDgg+IMwzAMwzAMwzAMwzAMwzA+vZgCxDAOnQK0xqCqgqtUcjDwdiyKAnmeIvD7yoy8h5mJETQqJTctFhUk9xmsO5UIJ7/a54MUHR8UZxiGYRiGYRiGYRiGYRiG8enEFCCGcWhQATFQQgzWnSeP3AucPUdRwKOSw+Ot6cNLe5gbH0KtEsu24LydG4ZhGIZhGIZhGIZhGIZhGL8CU4AYxmFCBcfAF4csc7kDaf2Ry62Yq9KjQMg5sXLn2yOWNNMjPiohD/beY+NhGIZhGIZhGIZhGIZhGIZh/GJMAWIYhw11H2r34bjvzcPz9YYMPEmS0xIkx3i9jIlaCNqHvHf6K8MwDMMwDMMwDMMwDMMwDOOXYQoQwzgk1Nk56K6c9h4OqjQ4CVbuOysQ3/PcFFgSAok/MjGMsWoZEVPSJMQwDMMwDMMwDMMwDMMwDMP4UJgCxDAOkw8y4vBoBSLBlxU6RM8ytf6gsmR6ZAhDcQmRV6CQuNysQAzDMAzDMAzDMAzDMAzDMD4UpgAxjEOEPjwYaPXhrD8k0LG5/HcxHkLfR4gclQCYHqugGlH5kapfdB5rGIZhGIZhGIZhGIZhGIZh/GpMAWIYh03hoSjo9Jx+P6j0oMVHAV8CrTyo5PDzBCPVCCOVCKEn+/OUB5oGxDAMwzAMwzAMwzAMwzAM40NiChDDOFSowXCh0EDoFyST4Byd85+fJZgbq2O4VoJfZBpXmPLDMAzDMAzDMAzDMAzDMAzjQ2MKEMM4dKj4oIcPpwhR6w9agSBF4TklSJQnmButolEOZdOpSQzDMAzDMAzDMAzDMAzDMIwPjylADOPQGShAAl3XrSJDIMFjfFGgVgox2QjV+Tkdn9NBukdfIZLCMAzDMAzDMAzDMAzDMAzD+NWYAsQwDg0qL+SWK3jbeSj6Xs2dLQj9gEigXxCJmRhpYKxe1njnGp1red9niGEYhmEYhmEYhmEYhmEYhvGrMAWIYRwi+zYcB9Y4BVaRqyKE1h/8Nzs1hpF6te8ThHuIKT8MwzAMwzAMwzAMwzAMwzA+LKYAMYxDgrYdHqjoyF0E9RkFY6kE4c0o8XmGUGKmRusYKocIMqo/qAfx4OWe6UAMwzAMwzAMwzAMwzAMwzA+JKYAMYxDg9oL+vlI5MbLUHhUhwTIC1+CBy8DgjzFaC3GeC1CXPRQkkh6CgEVIV4kwW5ZwzAMwzAMwzAMwzAMwzCMD4NJUw3jUKH1hwQvh/NpPnCGLkvZ9osEE40yhmsxwiKVpKnEFQi9ECgCSWu3rGEYhmEYhmEYhmEYhmEYxofBpKmGcZgU/O/msVLfH8jhy13oeT7o6JyO0KfHhzBSi1HkOfIil1gg8AM5UI7LbQ4swzAMwzAMwzAMwzAMwzCMD4MpQAzjUKHPD1p9eFx1W1Rs9HUblcDHzKiPSpnTY2m0BP6l1YgsPcYahmEYhmEYhmEYhmEYhmEYvwpTgBjGIUGlR+H5yNWPB609qNOQPxKo4uD6aLWE8XoEP8/V8bnvc+orJsnUOsQwDMMwDMMwDMMwDMMwDMP4cJgCxDAOEU5oRUWI2nEUGYoil22qP7idY3q8gdFyBV7GOLk9C0mvShI3FRaVJoZhGIZhGIZhGIZhGIZhGMavxhQghnGIUH+RUQlCpUaewy8ynQLL9zyEcjfOTwxjpBzDzwt4EpcVnPpKblQJhRzpcjAMwzAMwzAMwzAMwzAMwzB+FaYAMYxDgqqLwqMdR/+265tz+LIMJEQSPdHwUQ2pIpEgaakoUefoOm2WqT8MwzAMwzAMwzAMwzAMwzA+LKYAMYzDgk7P+/4/1AIEBTyfU2LJepFierSO4UoZMXIEyJDTQkTSM0WeZzyYWRiGYRiGYRiGYRiGYRiGYRgfAlOAGMYhQp8fnpcjkDuPxiBUciAvgF4HMyM1jNSq8JhGLT+YxilKFPoDUQsSwzAMwzAMwzAMwzAMwzAM41dhChDDOESc5Yeg1hxy+xW+KkKCPMHMaIjhquzL1UuIBCpC6PycjtJN+WEYhmEYhmEYhmEYhmEYhvFRMAWIYRwSNObgDacKjTxDTuWG78OXMFKNMVGLEPsDiw+nKHEqjwKF58tfd7RhGIZhGIZhGIZhGIZhGIbxqzEFiGEcIu9XX+QS0jTD5GgDY9Uq/KwAp7piOipKqPzgutqDqBLEFCCGYRiGYRiGYRiGYRiGYRgfBlOAGMYholNbeQV835MND2leIM0yTI0NY7RWUSuRgaUH0/r9KbNySa7TYJkCxDAMwzAMwzAMwzAMwzAM40NhChDDOCyo3fCcXw9IoD8Q3w9QLpUwNlRFvUSlh+zzqOggTlkygN5AqBgxDMMwDMMwDMMwjEePj2M8O8jDfSLI5T6/KP/BWPqD9w9yGHx0+P7wi/P98Lh8Phzvv6qf55fv/Wj85tdmGIbxsGMKEMM4LPrvKHlRoMhzeBLiIsN4NcZYNULs5fBlW/YiR9gPfUsQZBI4JRaDYRiGYRiGYRiGYXxYOLI8EO7Lzyn8pliI0y0H/fCLxEQU4e8ff+BbPYnjUbJf4hjNGQzei8ufR++LobgeyAHc7ufgyfjXyySfVIIn4+MAQSEjY/2IkCNlGRVLvPyX+ExC6s4rORT9fPSf5MORs+SgeUBCIePrzJMySOJCxt65nIf5cKrp3JcRN48JAiRBjMQvIZXAZeLHSL2wn7Mbl7O04BTVzIBwXfLmkufmmXPZZl3oufxA8g+1jHT7yXJpXcu61gYTKpQF5FIlcrzs4BXf38ly61VJ/ehpue7q/L3twfqQNHqclEnOIEVw5x2k0XLzzK5uBulcYKJ+O/cDk7tLHRzH4NrhfhUwHDyH8QG4ensv+xXm+o5hGJ8EvPsMwzgU+i91sqTj81h+3PzeHuZHSphsVODnfHnLNF3qh0i8SF+aaDES5Jm89A2UIIZhGIZhGIZhGIbxYXACe1/GlYOggm2Vu1KCzVEmlRMMFOS7cavDCdkpIB8oAKiQcKNaOVbTcp358hyyJocwhSoDctkn2xT4czulgNznljsvihAFJf0So0oIPa2Me/NE8nLHBZJhJBup5MMxclfipBQIJW0IGUNTi0AFBI+kdoOKCD9yKgAZVwMx0jRAAokLIqSBlDGUK6FChWWSkPkBtrtdbHZTbPQyLLdSrHczbCY5trIA7SKSU7iyBDJuD+S6PS+Ua5Wz8vRBjLYUfq/TQ5alyKQYmZybS15qHsj43o+RF1JuuQ6f1yvHZ7IeSH1oXUp9cJaIJO0xEqlcXy6VV0h9S3LNhzWby7bslvSZBLal7JYysE6pNNLW8waKmkCWsRzGtpFak0YftHuhmqBIQihtxEBlCHNjHmxB19bMj23CdmZLu77B3N0ZBkoa5hvo+SVOy/r4wlrRe0zrZhBDhRiXrjHZ1rqfdcz7SFZ99lcqzgaHGYbxsRE89U//7b/rrxuG8QnClwD+xOnLAhUaslVGD08dHcOFI2Ooel156eBXKPwqRfbyBUte0wJ52eAx+kP5mL9IGIZhGIZhGIZhGB8FHx6F654bi7ogqDC8uD/G3BfVun9OAcEICsYlj/tCdSfMVQG45ilwhgNdkeMCSRFQ8cBonsOHT2WIZOj7OfKsI0emCIJIBb20PQgln7zIkGapZOEhiEuSPkLaS7XcaRihG5YkhPDLIbp5gFTy7RQBdrMQe3JYEEq5/ADdNIeMrNGW/Jf3Etxdb2Jlr4t7Oy2kQS6j6xJKURlBznqRslL50ezi1Ys38MqlW3jnzhou31nBjTvruL20jY3dns7gUC/HKIdyzVRwSLk5Zg+kPFSkJH6I64urePX1d5Ax7fAIPNmXy7V1ZTi/12XtBqhGPsI8lasvJEhMxLqUOpLj5TCU4hCRnGO33dR6jKR8oS/tVUi95RniONJ67vW6CHluaoy8SOqVH0+yjQM9joqOTNKnqpAoJA85Z95zDcr6DaT9WDi2rcS5UmgzK9xm36BCi/tdO1PFcqD/ENWmDET67i/zcD5M9dDHEEp9XHC4unPB1QinOtdYrVdGUPl1YMnVwT7DMH5jqHA0BYhhHBby+6Vafv6QyTL05MUoKPDsqQk8MVNHlCUSL28h8qPHlxLCrzTcmvtaoL9hGIZhGIZhGIZhGB8CCsY5/VIk655ThNAsg+J5Nc/glEoM/BLdCWaZjv/c9EiM4ThW9ss4luJutQ+QcStnLAgYfCo4eFyBPE+RpZlabHhRjCiU82YZirQl6XqSQsa9vpuiidNC+1mOIktVGOxL+iwqo1NQ0ZCpzLgXlrGZe1hPelht97C828XdjQ5uSXh3YRvXVvdw9c4iVlZWMTE1Cb8SY1PO//dvL+PvXr+Bly/fwJu3b+Pdu4t4/fIdtFs+qlENw5IuLDzEUYCtdo4fX1zE23fXsSOnbUvh9/a62N5rY3F5DTdu3QKnsp6W/CulSK6toH0EgtB9rphHPq7cW8X3XnkHQbWGublZVOIQ2+0Ub19fws07axiqljBUlvRpG9IcKEIfiYz/97o99OR8gVRgxDqW+guDwFkDFKwCT84jdci66CWqXIoi7mNb0tIlVMuaJCt0yZYt2I6SnqXMi67Uq2wHUs8BLV+oemE6trc2Wr8f9PuGtrdmr23kegQ3+mn7+/lXz6Pr+8fyOAbSXzx2UHnoLt7VyX7gDldnXPNlhXV8f9o0tWCS//14wzA+HkwBYhiHCH/S5J7TH7cwkNeYtIfpegnPnJrCTD1CSV50mMb9cT948qoqS75oMFJ/BQ3DMAzDMAzDMAzjQ8ERZQ5nIUD5KhmMNTnSHIw2KWhXpQe3Vfbqxp8qspVEPCaQDfqnSOmjwuNHeu4oWkikMr4tigSh7ItUISLnk/S0RMiZknNW0ZhEtjgltCxcxnEFbZSwkwRY76ZYbHWx3iuQ5CFK5RI8Oe6Ni7fwre+9htfeuYt3ry7i0s1FXLu7isW1bexu76C7t42Raglz8zNYa2b4ux9dxpuXbtAsBFOjQzh2ZAbDjTKa7S6WN/awJMeNDA+hUY+RJyl2Ew/vLOzoFFufvXAOn79wBs+cPoonjs+jWi1jcXUDqzsdjI2PYbRR0frxZExPJQ3rIZcy3tvYwTtSttHRcRw/OodSKcDiTg8/evM23r12V+oiwNT4COpVaQv5x6m3aJny8puXcG9hCeMjIyhRoSJ59/wy1lvASivFrc2e5JNhz4vRi2ooohic9itPE/jUpHieKo+iKIAnge3sSTtQuM6pujiFlu9LW7H9pb5Z9+wT9y0M+oovVYJIudhb6LfkoDKMx7q+wSBpFbef/cchWzwfF7K1H//4wevf/6MrB5b9NU591a9LKqLU0knuI1oksWkG+wzD+M0xBYhhHDb8IZNfM35Hk3ZaODM7hudOTqHuZ+oQnT90TkniXlPV8kNeqO7/VN5fMQzDMAzDMAzDMIxfBRUWQM4xZl+oTeE0pzfi9FScBorTQTGd+/iOaxyUZij8wjnj5kESRTG4Cmqp3KASg8dLbOhz6iVJIANd+reQQ3XsSmUJp6UqolCnsWqlzChAFMSaLvFirOcBLm9keO3mCv7hzSv49ut38dqNTaxtdiQLDyOVErbX1rGxsYnh4WFMzx7B9l4PrW6O82dO4avPncGFY9M4MTeLuBbjh2+t4o1LN/Vjw9955jS+/vxJPHt0HE8fn8L0zAzWkhRXlhaxtbuL+blJNKosV4Y3bi4j67TxuWOTuDBTx3QpwHgtxOhEHdtJjMv3NhGVSjg5O4JI6pEhTROpjxA9ucY7yzu4eXtJzjGFUydm4Icebm928dbdXaztJdjeaWF4qISZyWH05Hx5HOOW7H/10l00d5s4PjuNeqMudRvj5laC7759C//5R1fw8o0t/OzuNt66t4vlTgSUPIxWQpSkQYqMljS5tCFVTNIuHiUN6u5d41TBVEQSE6Mn9UyFVBiVpNw8jm3FPtHPg7YsXk+2OQ0ZP86UxEwl7a3/dJNn6cfrXy4HQU7lEkky148eW1htg5X7YR9Xh5T3yLpqOyRGbrKu9E0qqKjQcmkMw/g4oALkMX8qGcbh4l4QaBacIZSXg6nREkbrAUJqPSToFFmynw7H5JVSfyc53ya/4jAMwzAMwzAMwzCMj4SXIyhSGXPSsTgF29ROAJkXqBWCOuP2Q/Ar/4FoW6e7kvEop2R2x7hxKo9loA8PdarNdcm3yDm1FZ2Jl9ALK+jEdbSCCrbTAGspcKfZxeWVXdzd7KJNp+LdDK3UR9uP8Or1dfz1D9/AT99+G0m3ifmpBibrZawv3MPLP/gJ1pc3cOHMKfzrf/o1/Pk3PoOvv3QUYzU5V9LF7NQQjo2XcHysgtFGCavrPbx28SaCuIIvvXAOL52ewGTZRzXLUekleGKygs8/cwrjozUsb+3g+uKGlJl1wMmiqAyg1QQQSUVQbeDnhdSbj0qljK4sdxO5mFDG6FQ8ZB2U/EIdkjN6r8mpv3ooy8G1stShxO+lcp2cyqo+hF0Z3r9xbQl3NtpAqSznC6Su6tjJ64jqE4gqVZ3qai8p8J3XruCn11fRGB3F3OQIJocrWtcXL13BN//udVy7vYWddo6FzSbu7XSwIuvrPQ87Uo6OnLjnx0iLQMoQSojgxSUpdwVRqY5M6j9LPSm38ydCBRhbnf+ow+IWFSdsT7Y4FVxUllEioT5jVFmy348cRV/5cTA8vvzSGlDrGjglRz9Q+UEVViIdKaNnfMMwPnZMqmoYhwkVHPJLyK8xGpUKxhtlVOUujGifyq829IVCXjX66biV8QdR30IMwzAMwzAMwzAM48PjyzizlCeIJUSq0KBfBzfOpCVHTwOtB6gI4BjUjUWZLpDApfNNyQ/0ZF0CnWzTX0Xg03cFtzmpk4+9NMDdVo53tzt4fWEPL19dxbdeu4n/8J238L/9t5/ghz+7hO2dNkqlKgoJb93ewo/fvomddhvPnZnHn3/tefyb33sW/6ffOYdvfOYkPntmDhNDMSpRrjMm+N0E9QCYHY7QkIH03l4TXpogyJoosh6W1jbQk5KOjo/g1PyIXPMu8m4HRdpBOcwQJ22cagR4amIceSfF5k4HifrzoJ+NEFkYYccPsCHXv515aEnY2m1ifX1NzlfC5OgQdCYvqUtfzhd6VAbREoNuTlL90LEUsm6csC1Je9jttFAfrmF0chT31nZwdXEL3SxAKnmvrLXRyUso1cbkWDpCL7CxtY27Oz1s5wF++8XT+L/+wdP4f3zjPP78C6fx/HwN43GOoWoZ67sd/Je/fxX/n7/+Cf79d9/C375xDz+9uYu3723j9mYTm90cW80uutJ+7TzHraUNbO520UmkDcMSPC+W5gwk0Bl9WYLE5TF8CV5eltLTZ4xTijnkOFV+0FKEyg9Zl7zZV5zyg4L7VLalNjV+/0hjwH6dDKYgY4wG+ZPSwb70IcMwPn5MAWIYh4haeEjgrJ8TwxUMVyrwU74q8mWSX1fIgkHT8RsAIrfp/u+kYRiGYRiGYRiGYXwoBuNLTo40+NDODTAzGYJm8H0KXDMUKtSW/ZQS8SM8OSJH6AKtRKISdvISltoBbm0D76x0cXUjwWIzRTv3kPsBVtb38N2fXsO//5vX8VffeQWvvfEWFm/fUeXLidlxHJ0ZRyWS0W+WYbOd4bVLt7C5vYPzp4/it559Ek+M1zGKFPONEM+dOYLPPHsGI/UYRdZBIOVrVCI1tyiHBeLAQ6/XRS7j5rAUqyIjLWRMHYWo1GsIQud7E36OuCzXkHVVAVRJC4yVZByeh0i6Ug9SQYXvI/UibHVzXFnewSvXN/DytTUJK/jeGzdx9cZNzI7EODlZR5CmKDnXG6rwoAN3Ko2KkFYWJakvqWnJNspzdFtNtFt7ODE3jPOnZhDHId6+toxbC026J5G0GXpdaQMvQBRFKAe0OEnkeImLYmztdtDtZajHHs5M1/AHL53D7754FkdHI5SQ4OTJYxidnkRLmu71Kzfxdz98BX/1rR/jP/7V9/Cfv/VDvHbxGjYl/zsbXfz9q+/g5TcvY0+2izBCJ5U29ksoglhqPEYm1+/MW6TOcipG2O78GFPaVi1CeM2UXVDBQcWPEygOFGbazyjTkA1+38nJ0fQg4z3o/Sf3If3mcJVqI1dNqmJkJeqWYRgfL3xeGYZxSATyksaXBXnTwtzYEKZG6vDkhUnenOR3Tl8RJBx4Szj4zuB+Kd26YRiGYRiGYRiGYQhuJgHKTj9IeOoEq/x2n9oN2jvQisMrUgScmlnGp0GRIPY55MwkiaTxQ6RFqE7B6aejJ8vVdo6Xb67hv/z0Jv6/334X/8+//BH+X//HT/F3b97AWkvGtJxGq/CwudPCblLg6Ilj+PJnz+OPv/As/offfwn/8usv4ksXTmKiHsELCiys72Cj1cVYvYTnj49irhbC7/YQUYmROUF7HPK6EgQ+r4FlkjGzlK9eqyKXa97r9KR8IboU1kexlps0Wy1VCtCZOJU3SSrXHOikVnJcgE5XrtmPEQUlLbNOOx1UsSPlfvfuMr7/1kV85/W38c2fXcRrt9cxMj6JLz97HE9OxQi6LRm+J1K6QAb4ESsd3dxDO4+QRjWkUk5Od01VSNHr6FRZVbmGz5yexrmT87i3tIqrtxbQlDIkXe7volqOUSkFyHstzI3XcGKiKsf38PevXsa331zA5YVtNJtdjEqaM9MNDHk9HBsr4ysvncWf/tFn8Pv/6CXEUYAiT3H02DyGxybRTD1cXVxDV6rk9maBGystXL23Cr8aoplkuL28jsWtHbnmFLtSzb1AajyMdGo0qQaty0zqm/XH1mDd+dSOqRKNNjOq+lC/IrRcYc9TBVt/XbUgxvtw96nyvntVP5bV+/M9qQzD+JgwBYhhHCLuxSDXLzs4b2kjLvTlKOALl+xz7639H8IDi8FPo+pADMMwDMMwDMMwDON9DBQhB6GYGr6PrMiQcHod+oUIJFCwXUg8dRdeQPG2Sl7pIJvC7sz30JXj0yjE0l4P3/rJRfzdy6/h9sKSjEtzHJmeQrUUqAA/5HRYMs6tlkuIKjVkQYypmTE8+9Q8zpycQC2MkHdpGUClQUmtDVZ2WthppxgdGcVQtaTCqSLzVIiOLJHBs3PIrbMjSO50rJ0mOSIpT7XWUB8Xe61Ex9GcM5rTSo8PV+HLBa0srWBhrYmeqiFiuXxZFpFcTwmLrRS3N3YkHhgbHVIfHj0pWybnrJdjnD02ja9+7gK+8sVnceL4HHK5lqNH5nBkoo5Q8i5FAeimIfcjpFKuQjJQHyCdFHGpjOGhmpS3QLvVlrqVOu8lKPs9TDeAcyfnMD01jos3buLmyhY29ppodpqolHypQ15GiFDO94WnT+HF42OoSfxb127hv3z7R/j+6xexsN1C6tOZudSI1HmYZQilLKmcn4qhktTN554/jm/8oxfxp3/yVXz1y1+SOi9he2dP6s/D3My0tvPa5jb+6pvfxH/+5nfwtz95G6/eXsfbK7u4tdfFllxXu1RCS53Xl/U6WQdU9uRyLvYxVUhxxgpJ41EJJMtUypKxIEImbZLpR566+ZgxkOAMQh9pL7fJe5TBwSiN0cpiMDGtYXwS2J1lGIcEf8rk9UAdizXKIWZGQp3LlG8RfImQ9xFJJH/0/c2ZmlLhwTlbJZGE/R9JwzAMwzAMwzAMwyDOkTI/qHPhINzuZT34sZvSKKPFRB4i9cpIihB+1EBWlNFs5/DDsgxAma5wU2H5uSpBLi608fr1JVVufPGFc/jnX30W/+p3z+PPf+c8XjoziZGYfjh6qFVKqNUqaHa72G5JkDwX11q4u76NmyvreO3SHdxZa6NbUHFQgheVkMv5aEHRlQFxQefgMj6OfQ+1chm+lNXjNE1STnXDLcPipCfjZL8mg+s6koxWDzpxE4K0wPHpMk7PjiHIC7z86kXcuLeFtpSh2/XRSSIs7CT43uU7eHtpBfXxGqanKpJhgViuN/I6GIl6uDBZxpeO1/Hbp4fk2qYxUg5w49pNLNxdQRBIvUlJvKgi9VhCN/PlcA+JlDlPehiqxKjJNaSph46UrZcGqJbqKEt6ORBzY1WcOTaBdprilasbWJTyFFLH5bIneRdSBzESyffkRB3//LfP4Q8/fw6n5sfR82L85PIi/vanN3B9K8MOfXYEFfXN4kv5m81UpwCLJI/hkoexUoCxOMDcSBlVL8Py7WuIkODo1CgqoY9SHOPY6ZPIqzVcWt3GX/7wDfy/v/0a/v3fv46/eeMWXr69jltbu2gmkGsEtjupXA9dn0tfUxkFVTxyfdJuVAIhiBFGMSIJYUhlSSj7mcZwfFBNMM7FUxQ0kPiw3lyMYRgfJ8FT//Tf/rv+umEYnyjuSwmkHRyTF58XTk1jvCIvnCndtPFF1Vf9h/74qQLEmZlyWx3Q6c8h4+3H0DAMwzAMwzAMw3A43wsyVpRx42Cdwe2D+svQGQeCMhKE6HoB2oWHVu5hp5ODrjDCUhlBIKPOItdpmvOsJ+PXAHtJiEsLTVxZWMP0kTk8/+wJjA+VUKtHqA2VMTpUp40FkMmYNQywvNfF9aVttdjY227j4tWbeOPdK3jn4nXcvXUPR6fHMD0xjJ5XUsfcy6trmJ0bw+xEFQGtCtIEvpejI/lR8N+hkiGTMvkpyhHnUwB2Uw+vXl9Wh+GfPzuDySo9nMh1JMDo5BAWl1axtrqKhaV1tNrA8mYLN1a28NNLN/HuzQXMzkzha585ixMTJdT9DImM0S9ev4WstYULR8cwUy8h6nVQLlfVafiNqxdRKrqYl+PUubeM1ekFw+OUW76v01nduruIdG8DJ/vX15bj3r6xIvtyPHNyBsfHKygFBUqVClZ3u7h0bwXrzY46VX/piWkcG69jq1NgaauNIM9RjwJMjpVx8sQEqvVh3Ja6ure8hZGRScxP1FD2OSlYgl4R4J2FXdxd3cKJmVGcOzqFOmULaQ+FX2A3SfHdV95BGIX47DOnUS9HCGT9+Ol5HHviJErjM7iyuIN2L0VNLmd3Yx3XLt9Aa6eJU8fnsbWzJ214S/sF27oU0IdLjjwoIQlLyOT6lTSVtutJN6BDfclIOl5/z2MM78G+/EYXTi3E4NQdEin1xOnpGLpJphZOoXQKWln1jzQM4zeEv42mADGMQ0TfQXttPHVkBOePTqIqLyT6ksd3KNmpP3CevJjKq0JB82CBDtKZxv1ImgLEMAzDMAzDMAzD2Gdf2bGv+CC6zsEmBatxWYXlbRlhLu/u4vLCJt6+sYrbqxu4s7KKXppKmlCVJZGXI5JxaCWKJd7DWjvF9YV17CV0Fl7CdruLld2OTsnU7KTwg7IcF6IcB1jZauLmwgY2d9uSLkERhqg3SjgxP42nTh7H6ZlJVMIYfglY2tjCwvoWkiJCpVxGoxyhWvJ1iq69PMYVyefi9duIqyUMVzhNVCKXkqjT9dduraArZf7MqSlMVOVa8y6ytIehoQrGJyfkWjPsSNnuru3gxvI6bm9uSZyH49NT+OJTp3Bhvo6apC95XSS9DnakThqVACePTGKkKteTFihFkfrWSGV/mqWoShlnxse1XunEmtNO0S9GmuVo7W6jlHdwbHoUExPD2Nrr4PKNBXS7XTx5dAKzQzUU3Rz1WoSuF+LO+q4qHRpS588cncL0cAWXbm/i+69eRJp20KhGqEl9lMMA5UqIK9eX0OrkODo7jbmxCkpFDzEVIF6A771zB6tS38+enMPpqToaEh9FHlp+jItLO3j9xhIaQ0P43PkT2q5xidNWSV8JAqzvdfHau7cx0ajin3zpWZybGcdo7Ktvlvn5SbxzdQH/8JOfah0dm5uRvsGPN4EsLKMj10Gf6VIhaoUTSX0UgZsajAJ+ftL5eEsv+vKbA5XA1f1N7qOkx0cmy570h1DulyiQfiWVfOAwwzB+A0wBYhiHiP54yUtSSX7eXjw9jjPTNXlpySHvl3oz8ofPfc/iIeO8nvIjSOUHp8DiUmFa2TIMwzAMwzAMwzCMAQcVHzq+ZBA8L0ARltRR+F7q4c2ri/jha9fwk9cvYWNnF7vNJlaXF7F45xZOHJnFcK2sX/LTpwaF/IUswzhEt9PDztYWlm7fwa1rN3Hl+jLevLSEm3c2sddOUZI0o8MVNNsJVta31U/G2SdP4IsvncLz5+bUMuHYxKgqFTi69SMpb+hjfXsbN27dwV6rJ9sUqke4sdbBxcUN/OBnr2Hh3j0cnZnC2FBN/WfSgTutL+4sb6ESABfmhjBWcsJifjnP8fVQpYSZ2WlMTIxjXI6bmhjG3PwELpw5gRfOzuL4aAm1IkOUdZGnCWr1Ok4dO4KTx4+jVqMlCmdhkHG3LGvVEo4dncf01LTUTQlDsYzbpX58qReOzIs0Q7kUYXZqXOtvenxYLstDq9XG9vaWlCXCWTn3ZCVGyS8QSRmjUgnrG1L3m5uYatTwzIkZTDZKuHlvBTcYFhax1mxjK/GxkxZ498Ym7i2uw896eObMEacAUUFCit3Ux9+9dVstTT57ZhZHhyJEaZtFx14R4NKtVSxtdKQOp/HcsTGdEou+5bM0R6dX4OqtdbXEOTEzhq+dn8J0vYyzx6dxZG4S63s9vHnlLtZ2mzh54iiefuKIHCt9QhqwhxC7slzf2cPuThORtEApDJDkHvIw0tkvfCqJtCSPK9JGB+5Lwq39GLdfFSDS37pJIv2DCpBQ5UDvPdIwjF8XU4AYxm8Ef8j3f5L4yvVBP1D6KqY/evKzlmcYr8d48dQEjo2U1LRYj+nv509fIas5TUZli1p/VYL0c1ffIPqaZRiGYRiGYRiGYTz6DMaVOjLsM9gexPWFyBwsypjQ7dkfj+YyzuSQ0ud0RBwzUunBFDKepI+NXhhjt/Dx7p01fO/l17HX6mB+fhbPXTiLsyePYXqojtFaCWdPHEGtHCKQfHLJj6cLAmCoHGButIHp4RomqgWG4h7GRuqoN0ax1/N1eiaed4rC/yDE8tIKtjY38dSZSZw/MoSG7AsSGeumKVq9LjbbbcnXw+RYVS1OkjTHwsou3rqxjjfvtPDy1QVcW7iHeiXC586fwdljRxBHkZzDOQuPwwCNag0np4ZxdDhCqcgQRDW5XqmbbksVDbFc9wQtTyaHcHKmgROzwxivhaiFPVT9FEGWyHibWUZIkgQe61BrM1LH3rnUYZ6nMvpOEUUBSuWS1EOIMtqqiKESgBNh0Rk5W4QOyGPOZ0Wn7GmCUljI9UkZj0xgriFlzNo6rVGW+7IvRKMUoCrXMSTLU9POEfz42DCqQw2sdRLc3Enx6q0tvHzZTeXFa3r+iSN47swMqnEg1e0+k7y31carN9e1vb/6/HFMlugTJVdLjFYKvHnpDvaaGc6dOIHTY2XUip5OV0U/IN2kh5+9cwNNiTr/5HGcnigjTjoIpD0yyeXuhrTF21dRatTx/DPnpP4iqbccdGafyDXc29rDD37yNm7duInxRk3DVrOD3SRDLPlHbCz2Q1arrO5LTFRK0md/bX+939+V/vG65o4c3AGOg3sfNqRMvDEPcLDkeh28X1XqA/SSgxYgpgB5sBxsKcJ+tt9y791nPOyYAsQwPiL6EikvGvyJGgQ++FQxofHuMahfgsgNpn48GOQf/0Z5W01SnzkxgVF5efIyecmi4zLNy/2Mux8/ecuUPJ1FCIOcR3YylcvdMAzDMAzDMAzDODw49hsIW385HodvMnTj6I3h/l83rJM/TsHA8SRHf4VOGbQ/zityblPIzUQyCvQoiJdxoydxuYw7s9wJ4WmlwQwpjSdeiN0EuLrWwmY7Q6NWVkuFVI5baXbxDz+7jO1mC2ePTuEbv/M8Th1pYLxRwvGZMTxxbA7qujpLEQQ+kqSnPkG8PEGYdXV6qpnJEZw+PoPz507h7JNHcPzUNJI8wq07CwgDD8eOjmNktIKFpW3curuExsgoKvUG1rZauL20icu3FvHutdu4u7SM0ZE6RqolTI4OY25yEmoQIueP5dzjwxU8MT+OLz77JC6cmEWdPhFyuWZZ0kcIFQljI0OYHquhIvUSSzkTqVv6qShL1dH6oJCxdiDVUpJ88yTRNDGVFWlHp3HypW5zaQQqQHzfedxkZXqc1olj+byQa+K0Ti5fjvZDT8bvUh9Znjm/nTxK20fKxWMkHeshDj05rkCtGqMah4iKRFqTbcT2dB86jg9XcerYFE4fnZZ6iNVaosgKTIxXMTc3j0ajgWqpjCGp92NSpxek3j/39FGMSlr2I5q6UElzY3Ed1+4so14J8Lmn5nWWCZ2WK4ix1kvxvVffRZIWeP6pE5hthChLHYQFpzILcW+ng5+8eUXqtYznzp3ERFnKHNMHS6bWIxdX9vDG5duYmRrHS+ePoZKnWh+p1Flb6uzW6hbeePs64hKVZ8dQdDt49e3LeHdhE3t0Au/FyOISPKmDrF9HVM4wBLIuzaT1PpCn5FL/IetH9rONWV30MULn69rP5YD9+TGcvIR7ueSdpAfwL5vFrT5gpBByXYNyccm19xRN+xElQvsKECoFzQfIg0VlcoL7KJkdyvU618/4NGAbsa86KZ1iDfbQwmcPW84wjA8BH2tOmSFBf5QHP1OF/uzqFh+A8uJCnx2QlyK5x/QYOgLjIzRKd3F0NMT4UBnyDiK/hZJeAn/cnIaf6eQlk0vZz5cqDXKn8iedZzMMwzAMwzAMwzAOFwpZXdCR4S8PFIoP1jkolCWhACbI+3tknMg1netfho+MU98Ssu1ENXQkTaGwjCvRk3UqQXw5PkDI8aUbUOrYlNMq6dRQMhZd2u3hP3z/LfynH1/CVpf5BkjTHCurdJS9h2p9SB2AT/sdNCS+miaIZOwaZKmcMdUppDJVggTgFFhaEhmzpt0W9rbW0ev2kEmcjn2lDNViGyUZ55YlfeaVUERAebgCLyrj6s1V/P++ewn/y7fewn/+0SX85NoSFna76MoAN6PyofDl2ASnGgH+5DMn8T985Sz+x98+if/LV57EX3zhNM5P1lErpFx5D7FcP7Ke1BGvVeqB01AlHRWKU0DuUbkhhU2kxL1crlrqI/AyGZan7ov6NJMgY3IpY5bJlWaBjLVDuRZPAy0/mK9PxYkETvXEKaxZp2wjeraAtEXmh8jDGAWVJpy62pPrllrOKYiX8xVFov5CaAhChYYnKxSmUmlAYX4haXy2ZZ4gluupFF05X1e2eygFCSoSd6yS46unRvGvP38U//evPyn18hS+fuEIJkshwoy55aqg6UkRO60OotY6To9VpIxSpiBGUoToSt3ekw6wJ/VULgMTEz4Sv5D6cX2tl3lY2kmwsZeqFcr0UCj9qEAq5cj9DJvSzleWtxFJf5mbHMOwtGvFa0uVdJBKf+vI9dG5/OZegsb4NBqjo/Dp/0Pq98ZKE3/1w6v4X//hGv7u4hJeX9rA3WYXbS+Cx+mxKDPJ6SlErkPqNJX6zQP2PmkH6c9UXPlSh6xPSJ1lcr40kP4tbc36z+RK3f0j95N+UMqrckoQVX5wj7vlHhAsGe8cCbxX7wfdqTjZD+8B/mWLCHwWcFvjjMOHDZSrDM5J+9iGbCnK+PiUcM9mjS8CaSfpq9Jm+gwfHG48tJgFiGF8WOQhOMA9AOVXWVClCN+0JJZ/9dsReQDyx05fiGTJn2K+MI2GPZw/OoZj0yN8nXVf12gKPkjdMbnmJ49WOR3P6H4M5Yefv4J6BgbDMAzDMAzDMAzjsNgfDbqx34cLXFAo674Y1imXZHyXy4qO9+QP93EsyHgqOeDnOvSkEoXi/CLvSVoZe3qRWlt4YYw84LrzhUGpGy0nosBTHwItL8bPbu9gp52pY2tOM9VNM9xa3sTlpV3MT0/iMycnMBRQ2eFmJECmKg1EcYRM8uWZPRnL0uIklTKmfgm3V7fx/devYKXrY6nt48ZqBxevr+HatTuIJZ/zZ47j2NSo+qZIOz109vZUoVKOgOmxOp44Oo3nzp7Ci09xSqs5TI6UZb+cX8oWShkiP1OfHrXYUyuOMCsQ5LxC1gtLxKUsGCMVNGgFKmJU86FbUotUMnAv611iqF1yX9OzjrmUHHRb0DE983ZL/TBRx+eZjuuZTuP763qM/mVrHvzHPLVkGlzeXMo/qUP05QKak5ZVkET8eHLwhbkrn1unsJXXHsnpY0kTUQmkViQ9aTNnAcOPKalk6TTpfyPFE3PTODE1rHKGIE10372lVexu7eLIxAieOjmDktRFIP0plDrak373yvVlLK5t44ljs3jm9KicS/pSJvnLmRa3Unz/zVto1Ov4zOl5zDciVdZkknchfXBpr8Dr1zbR6fXw9OkZnDkyjGqphLHZGQxNTqMjJbm7uoPrt+7i5o272G4m6LAbS18rhVIvVCRJ21Gs7AdSaimTH0jN9ygjkTjZdrBOKGehsoP3EKdBk74pZWV9sfV4w1ARxRZwgfXMHQ8a11ccbjmI0S4tK7wKFpb9uNuj8/pIFXbsq8Zh49qI/YntwmeBW+tDWZ32RKaUeG3IvN/XZN/9hMbDBj8sMAWIYXxY3NNNAx92H6wA4cORL4/cpDJDXpvkOL68BnlHXhpiPH9qBtMjVficO5NfPfQ1yYRm0O6h6h6e7mHrXrT4cswY94NuGIZhGIZhGIZhHBZOYCnjMRmXcYznxmYfHDiK2w+M8lVwy5GemntQaKb7QskrlLwzBH4KBJmMJnNkRQ+FhAicuoljwzLyoIZeEWKj1cQ1OgAfqaMUxUBKJQLtHlzeXrmGhb0Cy+s7qITAsaMjeq5bixu4td7E7MwUzh0bVgE7HYCHMrwM5Hqo6Cgkv0zGsLQx4Og2zTIUfgnNLMTtzS6+9+5dvH5nG6/d2MA7t9ewtrWHSinG+ZOzeOmpI5irBYjTHDW/wORwGU+dmsdL547h809O48xkDbP1AKMloBbSqoNKD6kBKiyKQgXAHqfckvPS6oKibVqhEN2n9eWWbmzeF3jfF3xz6dYPqCHk2ng1A8VGP0hjuiW3++vvC+4Y5sh2o+CdQXI/ELS0Gs9SHwhSPi73c5Z1VXS5clE5IZcoSKq+LOHng6T0aAXBKal6ci628WAqNCqu3NXOTo3q9FOTw0MIpb3iLEFZ9rN+q2EZ040hnJqdweRQBSH7lC/XFkZYa3fxyuWb6Ej/efqJEzg6Ift7Oap+CD8NcGe5iVffvYOpsTo+I+03LH2pxL5CZZkf4NZmD69cXUatQh+nU5gZkT6ac9q0AuNjJelHHu6tbKIWBVK2YWy3Erxx5RZarT0cmZtBudaAF5akLLHUDZCkHblqaXNtTymDH6kMxMskz4JyE6k92Y7k9PRDonUkdcf+mvEekhjGFV6k9ewUiAwPkkFb7nM/ph896NfsI1SAhKYAecC4O5f3nnQ+CX31NPtlwaeBwOe3xOdyL9FaxN2J+mTiwngIsSmwDOMjIw81+dHVp1p/cRC+pmX89aYSQ17kOHcon4c0v+VL6dhQHePD8kOfycOSX23ow1SOk3R8gDKxvupxXff0T8NdumUYhmEYhmEYhmEcPjIi07Hgz6Ojt/7urL/kx20u9AWcsp7KOn0v0AsChWYU3NI/B7/mpxQ4T2W9KCP0K4jom0IOypIMWebLODNAkuX48c8u49s/u4jLa200c4D+K4KgjCILEAchYr/A6SMjKAU93FvdwNJGpkqOciTj07zA8uYetnpA1y/BD0Oo82+OS+XYpd1UFRsbez05n5SwoCvsVPOcnxzG1z73HL749Am89MQkXjo1iS+encM3vnAeX3r+LMZrUoZuT6ermhiq4NT8FI5PDWE0TlFOmqhkLVSLDsroIqIQP0/l2hIpExVCTimQcZws5eF00lQKeUWqS6dGGKgPKAhna2ity39Jz6ACYwY3BlclhFarXNsHBKdicfRzcoFZcr+M11kmju0pFNUxvp51EDjelzMeDJKSgmxaNjANcVYlhfolUWWTLCPfl+A5OYEccfD6XBioTSiA7V8blTWUITBeysf9tPxJ29KYSc5JoVRJwCnMqBSjVc38cBUXjs/iuLRdIP3Ip+N32Z/I/p3NLawu3EbZzzAxXFNlDi0rPPazxEO3Q4VLhijyUB2KkUqZ2z25rqiCdlpgZX0L6xtrOr33PJ3fS55B3kVcyHHdFBvLq9hYXcGJ2Qn8yVdfwB99+Xn81jNP4sljs4jKMe7t9PD6vR3cXGuiI2UrScFiaW/6T8mlXlq9Qi4rVP8kMfu4lIbXR6shWudQ5Ky14ElvkvtI65uCacb37znD+GiwzzDw/utJSKQvOSUHp8tjf3N3OO/LVPdR0Td45hsPN2YBYhgfFn2gyR/9715Q3GsHrTz4IKTGly8l8pMbBPKA5Jcr7gWHL3dx1sGzxydx4eg4wiyVtzvnQIzHqDJE0jlrkgMvS7omZ5E8mbvOCasPXcMwDMMwDMMwDONw4GiMIlc37lMJuyzduG0/6DbHbNx/IOjXwhrcF+se+MW6j9QP1K9BgBR08p0VFTlFRX0p0KG558fww4rspZ8JGXfmBd65ehfXtnvoSLqjU3XUQw8xJD31AHoOyaLkY2VtDesbHQzXR3Byuo4gDPDOnU2s73ZQqdQwPlpDScoWyCUlcvxaq8AP37qFl19/F8O1CubGh1D2EyDtqsC+Gnk4Nd3AubkhPH9yHM8dH8HTs3XMD4VyfhkVZxlCySygRYeUk4J4Z0uSqZKFGgJaO1BRoENmKl+kLqiUoXKBx7nqkmOkTtTJu4yj3YhbrkkOGoyLORan+NuNjpkvtxnl4vmBIae3oiKDUytpKh1rHwhS926dSzd+v5+OZ9V9IXI5nkJOVT1I3CDoVFuaZj84Qel+kP8uSKnYviyTL3UhqVksnkWVGu7aBksqMqTOJI1TqvHoPsxTj3Z9kVYSnLIsDAJ1EK91zOPknycNwPqTYrl1yTPwXV3RN0mrl2Fjr42psVE8fco5mqffE3UeX4qxnaS4dG8FXcmjVKlgeKQu/VLqKS7h9lYbL79zA51eigsnZ3BhfgRx3pM+2NW+u7zexqsX76DZK/DCk/O4cKSGqYqHkxNDODUzImWK8A9v38V3X7uKchxgbrSOmixZB5zaLeX0WFGEghZAVAKmqSrkqOwLWddy9awhtkMmcby36AmGChvWC3HrTPkg0ZZ3q30+KIalZ/8yC5AHi7t72CLyLPOkP8uWu6+dkg3Sz4IikXvI3Z/uPmd/k7vSHWg8pPC3wBQghvFh0YeZ+wHlw45fHbgH5EAB4uLlXU1+bfkjLFuSXF9P5EVgrOzLi+IETozLi0MqLz18AZG0+rLGY/ovNoMzaDb9M/ALD93LPPs/6IZhGIZhGIZhGMZhoAM3XbiBGXFjtINRTDKQg+mITv9TqJ3q+K+QwWIuQQXgFHnq1/0yNuR0K0GETlTCVuHh9k4Pl1d2cHWtjXs7CeJSBZWyU4D41Roure5ibXsXTx0ZxUSJVhwydpSTczYCnwqRIEe3K3nc2UKaFjh7bBwjQ2Vsd4A7CyvY3tmFGg4UPjYk7tp6F0oN6f8AAP/0SURBVD946xbevL6A0eEanntyFhPVCL6MY+mTgKXl6JdTEXEapSDtIJR9MRUUaQ8lTlGkliJywRKX09LAlyPkmqnfoK0Cv6BG4Pw+aB1RkK2D31zSOmUBJB9agDAbfvznalGW+nm1O44JBzWvo2Xmw20uqUShZiEMdExOh+C5H/UdkFOI6Zb0oUKn29xHG5fBNEouzi3V2bYEWuhQyD4IeT/QIiKnQkDOxW23T+K4pOBeAsviRvaFirNZhyx3/2IlkP62ygXcUndLvE6pLXWvtSB1wJ7DaXhUUiDlpVKASiQV0rKuuSeSgyUJHbEzr0w6R8pzhKwbqe2MwlugWmtgZn4ek6PDmByKEUljhPTxkfXkFNKXohDrzTZuLi1jvZ0gDUpoZzmub/Twg3cXce3OAo5Nj+HzT53EWCxlk+MQ+NhDCW/e3cU715cwOzmKF87N635aiERyYZkUYqWZ4SeX7+Lu6jqeOjqJ42N1aXMfPa+E5Z6PhVaC7W4m5+P9EiBgH5d65t1ChZnOtqF5sWtQoUTlB6+SteXkKPv1+yBhTTPssx/D8rkt9l9TgDx4BgpHnRpP7gf2phxuWkCdAku2+JxjrGtDPsPkPpdj9BEl9BfGQ4YpQAzjI8AH2f5DjWoP/mQN1hjpXmQZqy95nOOVLzxUdMjL4fHxBp49MYWpKr+QkZeOgg9NWfIFR9LxSPcYZeAPnjsP34Puqzz4Uqd7DMMwDMMwDMMwjMPh/WMwN+47iKaQPzqOU2G1O4YjuCjPEFFA7eXIZXDHL92dIE2CxgXYSjzc2Gqqj40fXLqHf3jnJl65voarC1ua3/xEHXFQoDJUwbv3NrCxtYP5oRKOjNYRyliUTsspMOeUUhWvJ2cN8PqtTWy3OnhyfhzD1RKGhytIkgRLaxu4cuMe7m3s4Z07G3jj5iqWtruYn51TgfULx8bgdVugb5Aep6XyaI3CKWB41fJX/tMqhCPhkEoQ+n6QsS39ZBYUvEsCOrSmEkKVDkEs65EKETmepbKGyhxCZYdmSIGjCh2pLOBIWGpOjuekR2pHokJvKiWcooH7VNkg6xSqJ1JH3SxHK8nQ7CYadjsJtroZdrspdiRwqaHnlnu97H5oJTmaEtyyQCtlkPg01Tw134THJBJkKXnvdXvYaXflPLKUsCvbTdnPdC0J7V4PXQlpLmN9KavHeggjWfJrcld+FbJK+fPBUoPsk2tWpZHE01G+ajVUIMFjnECWba51TNmCfl0J9NKuHCsnDGVDKjeXdujKDveBptS+LIkf+ohLoVpeRHJ8VHQRBilCOS7lGeKy9LW6XD+wuNXBxRtLuLO0i7elT91Y2cH4yBA+d3YO54+OIJQ+pQL7UhWL3Qg/ubmDewtLuHBiHOeOTavig300LwJ0pMhv39vE29fvYXS4gZfOHsX8WF3ap8Drt7fwivTFn11fwo27G1hYWsdmqwkvDlGqVeSapa3ZbXjdvAy5dzzp65yqiBYfrtdQccAepAkkPEh+vgwuhhfh+r/bYu2ZAuSBo03FdmHv4fOqJK0Q6/1I6zoqrN1zW1LwGS/3Je337ltpycK1r/Gwoc++P/uf3xzcdYZhfAiceaW8EMgNxJcRfjHCGKIKDX2x1dc/fbELiwRRZwtfPDuNb7x4GtNRgdhL5IUvk+P0Wwx5ceHLQKE/2VRyuAeprOo55BVHl30NtD1NDcMwDMMwDMMwDg3KnXXMp8MzFc1rPHHCTLefwmXKwjjjE/dwg/ujPNHphToyluwGvowgYx3zUXBNIfvCTgeX767h4rV7KngfmhhCdbiGTlLBvdsrqGQd/PPffwlnZ+sq5P/mW/fw03euYr5e4J999XOYLHESLA/dIkSWp6iXcyy2C/wvP7iOe8tr+PKT0/jiM6dQKUfYaCZ45/oilte20W63dBqjqDqE6elJnJ6fwIlRH+NoI++2UYQlvQ5O36TCZ7kendqJwnwZoxYJJ89S9YQqdXi1OhaW/QmXEqjn4Nf9WkOahqPowll60PKD66xCpukLtt24WPZIHB2g02qESoQkyfoKBWdZwsMoyGeaJMs09OR6elKuNE31GPpOoXJB4biaBZA/XHAc7som2xrh9ulfXTA9x+2SEU/GGF63nFz/Sb3odFtuhx5EGQA/cOSIviRtXQ49RGGIKAoRBiF1EtJB5Nh+XXC6r1j2x7G0YcSPKFkCflwpS2bJdHIenRVCAr9MZwrtk8xAjs+kT7CMtLqhvQd1T1pgqQM/KKGjSiT6HJGyyM486Uk/kTr05bxSLo8WO9LHOPWWL2Vs5z4Svyx9tYzVvQSXbi5jcWUTvW5HrTLqI8M4e3QCF46MYMiX86U9NbrhMa8tJvjrn15D3trEH37uNC4cm0GcApGXg2qSdSnzf/3Bm3jr4g188aVn8eVnT6DoZPjZOwv48TtXpN9I/x+uo1GuoLu3g2ZzE5PjDZw7fQzPnjmGWhghSOgUPZPrlLYpeC0JgoDTuQUoutKfozJS3l/SbO6elPqSeqNykOv8UJXbnzzs3WykAdzS3q3rDmkPKWsqjbm910K5UkFVpwOjItH4uBn0hQHcZlPwfuYNp9MIUs2RBthpSx+LI1Qrco+olZvzccTpruiVhtYflPtlvO8kGz7X3H3az9x4aJB7vzAFiGF8ROjoiD9YTjnB7wucAoQ/bTTZ5dcG8pTUH1y+rJS9FLXuFn7vhSP4Ry+cQKUrP84FnSnxeEnLR60+c/kSo7nIcQMFiAvuKwaXhi+chmEYhmEYhmEYxuFA4RbHaQ6nANGxWn9bA4WtFHzTIoGSd0lFnwWQcaOf8avhAllQIGEcypJniG5eYHmnjW+9/A4u3V7G5FANzzwxiydPTmNiYgh7WYG//va7uHprAb//tS/gpRNDkleG23LMX37z+9jZ3cWf//HX8MzkEGLJK/U4tZOHMAQ2ejl+fHMD3//hq5ir+fjnv/8lTNZknJp04UUldGVcmnT20Gp3UR0aQ6lSQskHorSDUrorFxOh41fBqbvioqtXmfgxehLP7+2pVOBX/ZxEKqCCR2I4Rs5kcMtpo6gAoXVGLEdyP6fDIiral+N0JEzlA5Ucko6j7FQqukclRpKqw/dEFS+0hAiQZh7anS6arTZ6aQ+yS3KWcTil/ZKHKmVk3c2u0B8zs41UwcHwwfC63J/3w0g2Kkv6XtyQ/FePy52yIpeyOoWHKk7k+qg44TZLGlBJUiqhVq3KMpS8Jb1cOxVK5TBAVUJFrQKk5vp5sE/x7KpEkY6oQl1ph6JI9Xh2Tr1qORdlE11pHQrYQ9aR5u/kFpQ68EinIuL0ZlToyJq0c+rF0paRKnSotOkkOda3t6Tuc4yODaMufYmKPipO/IL+Ejw5T4zvvbuAv/nJ27hw5hh+/zNPYaoUoSTlYB6JXMtri5v49k/fRE/67h9+7SVMzU7hh68t45W3rkkfjHHh1CROTg+jMTSEdreN6zfv4NK166ow+90vfxbn5mdRZ5mTttxfGbzQU6um0C8QB6H06RRxTAUIlV9SLJaM9SN1NhB8P1gFCHs6zz04vylADhNVePR5bx/gOp83QBqUsbjdw6tv3sTU5Aiee3oeYZoiyp2SkNYfVIGo9QdblNP9abayxfvTeOigAsSmwDKMjwpfMPQxxyecvrLoNl/Z1IZDHqj6ZYw89yL5lQ/lBXKq6qkD9COjNXWA7n7wmFf/p+/ASxmfx8xZX6jdU7SPO6vuNAzDMAzDMAzDMA4FDsv0AzYOx7gU+qMzQZYS5QTFMiqkUFiW/JKeY0aOC9MgQI9f3oehTs20ttsDYtkfB+pL4uK9NazudvDUmTP4/LMnMFaPdVzZzj3cWt5BVwpw6sQsxusRypJPteLj3uo2ljsF2ijjxJFRlKNQzuNhfbeLm0vr8GR7bDjG1YtXkO7u4MjUBMaHqghljEqBPBUbw2VgVM5FHQLHrryOIuvJskDuc+oX+v9wY12OU1VZweuV9LQm4Ad/FBqyrLTSoMDZTc0kCbhf9vmcIqs/Ti44jRZ9awSRXFOAvcTDRjvBloSdboatTobNva7UTwtr2wxNbDZT7Eg8nXa3pdwpp4UKS/BjKXxUknUpp+RX9JdqdXI/UMTvFCK/KPQb9ZcEWqXwevYDa+RXB06W4+mHkepXRIInZfSispS9hCCqwC+58lOh1O7l2G31sCntt7nTwXazg91OF60kQUcqtinL7XYXzU6ChMof6VN+JGWTfFkm+gLRqcW0s9IChf9cX6SjdGkK0IG4L/sZz94ZUbOXpaqQYRz3cI1+UijgpcKF8gv6ein7Bar1CkaqJdT4UWhKQbBcJX1wcIYLOf/mXoqfXbmNla1tnD99FOePT6CSJQikT9H3zZ6U6+VLN3D91j1ckP78zBNHcHslxQ/fuKFKrS88fwZfPj+L4yMlVOWyxobKODo/IZcT4fbCGpqtHCdnJzEUeTr1Gi1f8rAibV+moQ4KqZg4qkK6ivZF51uG/d0psQLWGZVtss34Tx6e473n2Y+RAva32A+pFrEpsD55qPTQqer7/WLQFzSwLfwAO3mEN+5s4Ydv30Bb+tLs5ASGOVWcPNxp/SE9S+9r9bkkeYXMjwpe3meH0q+Mjwrb3RQghvFRkDdCfeHjqr4iuOAegvzDt11ZkxcL/oCFkj5IWjg1XsMLp2cxVg7U+oM/cfpDpw9HCZKeuEeuLDU/tz1YY+C7jGEYhmEYhmEYhnF4OOWHGwcSFRYf2CY+BdxeoEIxLjmdE6fg4cdxvTBAL47V78Tbl6/hzSt34FXqGBquoVTysNnuYXljB629Nmamh1GtVbC61carl1bx1tU7klcmY8scza0WRho19yV/XMWl1T0s7SaYm5pAmuS4emMV70r6N9+9iDgOcWJqFOh0MT5Ux8zkGOrViuQVIY9CKa+MTTN6h+BUVDHU4bdcWVbI1alQPXTCdAr1JC3FsbQ44DfP9EUSepk6vs71M3tfBeB0zM0ZC5iW0zFxWiRmQauQjgyVdzspNlsJNmVjo51jvZXh3mYTqzs9bHVz9cXRSemDQvILIilqDDqHV5MWKZOzGHF164TGQt/Z+P15+Pvo2Fn+MNqNv39dmBFb/KMFlk/L6LMALIcrI3UOzNPN7ODitCfx2uS66Cg+kr4SlkpI5Lo6UnT2m/VmB+vSP7alr7SlrTtpgV6eYUfi91pdtSDww5JUj/O1olctfZFXTuUUFSERQlV8sOICCaEUxmclsnz9NqcVkU7zLcloURJL4rDIkEhIJQ9VllHxRaWCLOl/I5K29vyS9NkOLt5cQrk+gufPnsRcI0TQ3UPEacTKFdzaSvH61UXs7e3h8+dP4cTsJH789i1curOMJ+bH8YWzs5ive4h7TT2vnFD6mqfWSRdvrmF9q4mz89MYjX3IbSN1G2Fxr8Buz0dF+rt0Sylzv9/y/mSVSh0SrQsJZBD3ySPl0LDPB8VoP5FgCpDD4aDyi32BijEiTzR57pRwazvBd9+5h4U9+vMByrL/+OQQOCEgFcd8HlGhyXvXtWch9xPvB/YviXlvAxsPAaYAMYyPhDzM5EeUv6XugcaHHX84Bw89/kDJw5Amp/qC6MvLRIY4beHpOXkBODGt02Hx6xcesP+C5vLQTOQP360HuJzd2n4awzAMwzAMwzAM49Dg2E3/u/Ga+wBuMFqTkaAMEjkadFYQsjOI1AJBRn4q/OfYj9/jJ0mOi1dv460bK2j7NcyMD2O4HGC4Xsfq+iZuLm2i5ZWxvNHCG29fxbUbNzHcqGC46uP2zZu4cnMZ5dooJkdqEh/j5vIeVrdaaO0B12+u4M033kaedWR/BcdnxjE11MD0+ChOnjoh6es6xVWRJVIuTl/lHF8TKj1YbFp0cHTq/GLsC/FV+cCv6fuCY/qP4Nf3HPcGVFLQWkTSZEGglgk9ufadbo7VnZZadez1PKw3EyxuNbG03XbKjixAM5dxc0hLiDo8yUeFijwvFQFyLp+CSa5LEaiHcdM/SRnZFmwTKTSLqu3CgnG7X2p3HRJk3U1jxYMGS4kjP7d8Xzr+lbrh2kcN/KPrXA7WWZZ+GXkdKpCnMsEllz/uXBIpbSKLMFYH8rSYodULrUcg9dSTMtEiZmO3I6GF3XYP3YTTVDkl0143RTctpC1iaRpanUjwI/i59E+JZz8NpI0C2Q40b+mrUkg6KaeSieuZ1AktKAIpED/vzKXXcDpw1qcGFlTKH7Du9LKkLXPpV1LmI7NTODY9AnUh7XNaIWlvL8Zbdzbx9tUFzE7N4Lknj6Fej/Dy5btY3mzjhTNHcW5mGDGnGZJzhZJnKKdIpCLCSoR3bm9jbauN01OjmJX+zzrsIMYPLy/i0t1V9bcyNtyQ/s36lv7ASpfzs44p5GbYjz8seK73nu+DYtgjTAFyOFDZcdDyg/2CfYRWUokXYTsFfnp9Da/eXMOe9K8uzYnSRPpcHcM1uVfkOCrEackmGcg9I/lkVBm6vsVnvqwaDxmmADGMj4o8yKgAcT9a/CsvYxLBFwD3kyWPO77EBO7Fzc96aMgv93PHR3F2poGAc23qyxQZvJa53FyMBMmPv8n7MTwF3+rcumEYhmEYhmEYhnF43B+nMfCfDPk4POMokOJhft3PL+g55RItLIowQk/SFqET4oeyHmY5IhknZkEVtzd7WNpsY2asgblGBSMlH+12iltbXVxbbWK72UKtHOD8yRm8eP4kzp46ImPCEKt7GVY29/Dk0VFM1mM5JsPCvUVsbm2jWivh1IkRPHfuOJ4/ewLHJ0dQkrFnKOenVQCHqlU/Q+TJmJRKhILTuSRyIfxET9LIpUR0oE2BnpTXXTevh+Jvd6301UFlCK8z609FRUsNKTp22gk29jpqzbLZybHWTLCy08XaXg/bPQ/tIkQSlJFHVSCWEJX0C34qilgGDqOp4HCjZdng+bQcrpZdcIJ3lpVj8PvKAwq5Jeh+rnPZT+/oN9h7lrIYjM1VAcKM+8tBOv3Pfy7vXxV43P11OZZXo3IClslld7/8KnyVGFUwSOTA14Yi6Z10QYLUAa07qHpw03rxy3MqmiI3pVZckmVJ22Ovk2Jd6pyO7nfbdIdeYLeTSNt0kCQsgxwjJ8nZJ6hYovhCCpBIXE+qQk4rfYVKJ7kCqUAnGKYvikz6kYeIlSpp9Et5KROtQXTaN+0gPmqVsloaTQxVUZb0en3S5zKp5/UkwE8vLeD2nRU8I/3zzIlxyG2CN2+t4+7qLs7MjuPUZF19nbCC+DEp+24q90xTcnrt2hp2ml2cPz6L6eGadMMAtzda+G+vXcOVxTVp9xQnj04glrJLD5ViysX16zOj3xW5FtY5l4P1Tx6e473n+aAY9hi2tylAPlnY5oM+MNjmuipD5NmWRTGuS5/6zhs3sCb9NeP0arSK6nZQkn58fH4SpUDSS39iD5MM9H7gn7DfsNpq721g4yGA7WwKEMP4KPD5JkGfbXwj0Ncq/jjxBUt/9WW/PBD1JU5SpQlm5IX2hdPTmKf5pypAJJmmHByvubl/7jmshzr6K/sRhmEYhmEYhmEYxqHD8ZoT6rpxmgQdp1EKTMG0r1MEpRK3vrOHhZU1FRTHlZJOG0VH4LSwaIzUsNJMcfXeKuLAx9z4EGphgEq5jCsru1htJjhzZB6//eIT+MyTkxivVRDVIuwVNdxc3EJ7bw/PnZnBCB1nB1Kmzh6ePD6F586dxGefnsf0eBX1Ej/GS3TKo0hLLKNPOTe9TVCwSoE1Rey0AqHyhj4fVABPJ9pyRbQQ4DGxl7kv/GWfjHQlvlArD/oHaace1nY7ErrY7uTYkCW3N/Z62FM/FZKf+ukoIw9j56ODAnzJn3kVudROnurX/jwvz8OgSgAGTecElDp7gpRzECjEpwyTBiFsE93Pgboe6AL/Eu5zY3i5cl1SkcCc/X78e5dcG2zr8S5Kg+4/sPygwH0uHx7JK+WZNUL2H0gk8BrcNUqQwjmFj1yf1JMeJQ1FZQ59dzCGJVLhPQ/uZ0OLI9YDrWd0OjAqRKTOaf3R6qbYanaxuddBq8NprKiISrCZ9NDOcpSqMVKpyyTQ0yKS/NhXtT0YVUh+PJ/GyynlmCyX+vNL+tEnS8//Ho/SsshxgRzPcksIODVW3qMODXc32nj94nXp6x6++MxxHBmrgLqVW6tNLG7sYHKYVksj0nflTCn7bq5WLFm5hIVmjlcuLaDby/GZp49jpB6hK/m/fPk2Xl/cQRJXUY49nD01hZrHabt6UiiWm33FtSNh3Q2sQbj+ySOV4lrrPh8Uwxa9rwAJ5Z4Nec+aAuSTgMoOwj5AVDAu9wAVfxvSbf7h3Xt4d2ELaVjVfl5wSjjpj712E2NDFcyMVdUROu9L/ueUfM73jjxXua0PMONhQ9vZFCCG8WGRB5n8p4LDffnDB6a+lsg//mTJC5zs49sBnZLxDYJzqp6YaODFkzMYlRcBvtzpO43Clf3g/jIfF8M/7kWPz1WN6f81DMMwDMMwDMMwDgt+/MZ/Ttjej5TRmY7i5L/7Wl/wfXSTFG9duopX33oXuV/G6Pg4woCWGClodRGGAdKojDtrW1jb2MDYSAMzIxWUYx/rHQ9r2x2U8xTPnRzCRDVGJhnf2Wri1Yt3sbq0hqdOHsG5o1MYiQsMhRlOjNVx/sQ0xqtUd+Q6BZbnpZT/IqA/hJTaDtp4SFxGwTCQ+YGkoc9KWZfddHauxadEj9YFHv0pFAgLfv1f6JRInJZqr9vD2tYeNppdbLVTrO52sb7XQysBekWgUzbRbwe/zlfBM48LaDFCsTqlg/QhIuWS8tGvBMfH9JHpBIpq46DnYyEHY2GWjzEsFxUwHBu7wPz74T3rclA/ja6zDBKcgmPQZi6dWuzIUmdc0OX70hEd41MJ8/NLF6R8B5aa3s2RJtvMg3kPArddGFwHr4vWGLwebg/WqXigC3rng4MWO7JXAhVZmoOch0tasXDJmqNipwiooFC1khxNPyoVnQKLyrlmT9qv2cZGt4t2nqGbJdjc20NL+kUcxyhFnCZL8qPyQiegonDX9RXJXOJZR5IXLZkkyikRtBTS9rwHMjln5ixFJH9t11w6h8TSbwnLeO7YBJ6YGkaVx0gmXb+Eu6sb2Nldl3uhjrFGXX0ueHKOXhhhuV3gR+/cxY3FDUxNjOCZM1OoVgNcX9zGj9+9gaUukIbSX9HDhSdnMRLliPKelCLExk4Tu3tt6ZaxKhjd1EdU0kgdaxOx7P3ys+l09UDcr80H58EW54ncHpfGWfYwBOgkUmppK1WAsL37yVxvGvRJd7SLHawPlmQ/3p1vgDvW5eqCy++DGKQRBlnc3zxYDlljx+/vezjYL5vj/XUgd6KvnnCkLxTSF6g4DOXeyHBtZQ/feesmdvKSPO9KSGkhpfenh057V+69Ho5MjehUgmVa6aSSt1w/lSl677F2XCcyHjJMAWIYHxk+zNyLy3sf+3zp4Mshf1D42kaNfYFa1sKF2TqePT6uLy7ewMS2f9QAtyYPT74s9dEfpvc9PN/7A2YYhmEYhmEYhmF8sjghn88ZdWh54FPMlelXwxQx51mi4zyO1UqhjAWLHLdWtnDx3gZ2Ox6mJ0YxPFRCkUmaQo7NA5RrZey2E9xZ3kK7l+PY5DCGqhEqwzXclbjFhRVVnHTTAJeu38HP3riK1eUVzI8N4QvPPIH50TLiPAWnrKpGLJuUR8pAJYfzyUChXAT1y0DheUiH5HJuCs/5hTK/gKdmRUeiFLhTLRFKWl9yoEAwkhCgm3nY7KRYbSXY6GZY3elgZbupyg+n8KDTbXp6kDzcfEhOAMj8JUcKGPti3PtjWZ6e64Pt++m5ZNG5h4cwncRxiiWWmQooHS/LTncsExEm3F+6UfoB+vtc7P7e9yzlj1v29w+W+teVs5/ifcv3x5FBvOShxZTy89r4v79Lc+8v9eNKt+niuKIbhVw7tT+sQ8YxnQSpK03DWBWSO4sGogoiCZqP1hPrkooHScfjghBFyLaK1MfIzm4be90E0sSqoNiVdm4m0qelTb04lvx4Imf5w1V+JU9fMHnBvsM+J2fQc0o5WQYGJpTAfVTacEqrQOKjUglHZicxN1ZDhQ70c/bLAHEtVifu9+7cxdZuE4kXo+eXsJn4uLvbxY8vLuFnb19DLczxxWdP4fhEQ9Usf/ez67i6soNjJ4+ivbsNP2nhuTPHMF6Wu0Kupyn980dvXMeVu2sIynU0anW9R5D1pF6ljHT8z2LzGuRqXI/lCtWI/Sb4dZHrZ8voaaQTOGUVA9tTrpv3idxrOVVc0ha9IsROV9pDngW05InjUI7TmmdDStvJveZRacNSaavyJHoqV1Lev2QQz3NLu8gzQvPRPkFLL7k2Tjsn+emsJZLWXfcgL645pQyhHi+Qbb33eB65IHeEK4cv5eGawvO46P24Q4dn7pdVw0A6J4FVoO0SyLMwZveVemGflfqX+2Kx2cMP3rmLW+s96X9lff5RMUorIuZTUHkmHatejTElz2Ha9QVUoEjw5dnn7gvK/B7c1Ru/GFOAGMZHRh6AGgYPU/foh5fKA4/zSvLhKC8V8sNCs9EJv4vPHB3GE7OjvOP4eyHp3Y8Lj3Nh8IPj4hmpL38HHpyDtIZhGIZhGIZhGMYhUlCYG+gokD4VipAWERR0ydiP8TF9MUQ6BlTlg+A1xrDY8nDz1jqG60OYnRhG7AcI+0IyCkBL5RoWNru4u7SBk5MNzA6XEZR8bO31sLi+h7WdBHdXt3Hp2i1U5VQXTsziM0+dwvHJOqqUh+Y5NQz9YSNFthyfSjzLReGqBI5WPQrnCjcNkROEU/Ap+3Oux7I/lnUffhQCcYCurO+0eljfbWFtL8FKK8WClGmrW6ArY10vrkmo6PXyA2iFmfcHrPsjWwph3ciZJRmE/k7dUqGulHcwsuY4WIWO+k92S1qOl121MoVsyx9dDrbftySaZhC4/auCnucDlhoG/wblOrjk/sH2L4rj9qCMg3BgWy/OBcYP1rkz79fH/SB7BuznLwk1uTurBsoepLVVMaehf5DEap+VvsFpq/ygJO1eRYYIO+0Mm9LWu6mvyoO9XhetVhOB9Av6paAFEIW8FHJTqE9XHZRxUMBOVMhOK5G+yFw6oOujUjjuojIn0jOl3Atf7hn6N6FyZGK0LnUe4ubdZZ0a7sbaDq7cW8Hb1xdw+fYa6pUqfuvcPJ4/OYVGOZC4Dfzg0gL82gi++tIp7C2vIGs2cfroMUzUy0jyALfl3vr2K5exKn34+MkjmBgqI1SrlBRRGEsaisVZVqf+8zhFnda33AfaB1nbB2v8wyJ1QOUCK73I5Lqk/rUtXF7aFn1BPC2vErmntrvAym4PO70C7ZTPh0LKCIQS2BkzWt6wlFIuzUPrkBPsCSqD0iuQ/1RMsc51C8hShLz/ZZX3a0+uLaFPC+Yj9a7CevYVlpPHSBzbmdZD2p/YPhI0LzapHJczDeMO7NO6kpXcp8JG/kv8g0HOq+eWGue1SZ9jPdFqyt0TLDutP6S+WGTWiWztSnjj3jZ+/M4CkoJTX7GO+llJQl4lbYy6vRRpnmJuegyNWO6LrEAseVMhzlbWtHqM8bBhChDD+EjwScYfF/dg4w8L1/gw5FcVDJ78mBS5BIkL5CXz6HCIF09MYaJRlUP48OUe98NnGIZhGIZhGIZhPOTIoI8KCwoGu3mKPPKRhSU0ixBLLQ/vLDbx2p1NXF9rY7uTICzHKA87C4/F1W20Ozmmhmo4MhwhLLo6nzy/xC/VI9xZ2cPayhbm6x7mRsoIIuczY3FpCZvrqxgqR3j2zBw+f+FJnDs2i6mRik4vVKSZCqHpYN0pDRjcKJXjU4ovVbDJ8SfHqbKDafOcChhahch+jl39WP1CcIqr7XYH63tNbLW6WN1tS9jDbpIhCei/gz4fIslEjqHSQnJ2o2GeU874kaV+TD84ZrB+MO5h42BZP2h5kI/zGpjXIHyc9POUthz4EKFCIqS/FolrdRPs7rWk73aQZAVaiRPMZ1Se0HO5LPu6DQShE77ntHCStVD6AnsH5R8UnzjfOLLJeE4bJMtUTkjpCPOganGkFmFseBi1clV1aUXCea16qEreR2em8fy5I/jsuTnU5X7YkPvpe69ewcr6Lp49+wSeOlrB+sK6lLeDo3NzGG+UkEiH//art7C43cGpozN44al5DMdyMrn3WGiel2sRNQy0Zsl5P1GeIyVnmVRpKCu/JmptI8uc+eqVcotnln2sO7nqTO49WlFtNFP1ndNKUmkLHwnvuV5X0hWIYimfPHvUWIsCXMmJiifaaXHCMTfTGqVMAwUI5VKMYxvIP7kYTvHENujKjp1OihaVLD05h7Qrk1JhGkgopMycNkwVB3JO5hpKO/Fu57OGOIWcHMf+IkczjZOQFRp//9xu5YHAUzPk7Edabq11WWcpJZIKHqkXtnUmldmRtr6708Z3f3YD6+1MrrEkbUNrGaYf1KS7RiqYut22WvrNTw3rFIKsNWk56ePSzpKXHmQ8dJgCxDB+DZwpKR9+7nGo4f7DXl4IVQMvPzTycntmeggvnJqTH27+OLgfP/cYNQzDMAzDMAzDMB4FOL97UuRIw0BCCTtpgbdvr+BH7yzgH95ewiuXV3F1YRv31tbhlyJMjg+jEkfY2uvg9sICRks5Tk5UZbSYUWIMOhGnJHNtN8H62iYm4h5OTA0hrlRQqsT6pfqJmWG8dO4Injk5jYl6jLJfIKDgjkNRCjrl38Anhn65LfFZzm0nlKQsjqJWTt0SBJzuh4I/CgCp+IiQeiH2egnWtnex0WxhZaeFdSnvbi9Dj196RxEQxygCfnneF7AeQEfCnpybAlPjkYQ+MQZOwd02Z7WQLkIBOBUddKSeQB2p73Z66lS9rV/BA6H07yCUHi19jgJlnfKKvUKnx5J+SgGy9nVKQmiz4JRmbuolNW1A5FOkL/ukH1ZUqDyCU3OTci+M4vzxWTwxN4WnT0/jxGxdrUcocX752greuX4PU5USfvuZo5hqBFhe3pZ+3MPEzAzGh2Osbu7ge2/dRBSX8dUXT2N+KIZPx+osc6mMnUSuOy7JNfbvmywB9ThaDXKfsx6kY8vGr4dOlyT/OE0elSk+rWcKufaCCku5EtarnGJN7rf13SaaSaLWMPS3wim5eHf3pLxJlsqxIeKopPVLhQatNVQBotYehIXuB304sOihBL0YvahU8uZUe6u7LWxLg3K92emqgiuVPNWhPS3BpKycXkzbT+ohkF1Ucuh0Wgz9fTyJOyOfPoxze5xMjPKyB/VMkFJIvXCaQiprVAnCUrLuWCb+l7isSJDrszzArlznKxcX8O7tJXSpHJZno1OAuOth/+Q1UpZHtVkvbUr79jA+WsfoSFXalcq8VDKWunAdyJ3LeKgwBYhh/Broo+z+84wr+lR0yAOT2/x6oCQPx6fmRnDh2Chi/kipWSEfmoZhGIZhGIZhGMajAyWBAdoo48pyC6+8fR1vv3MZzZ0Onjx2FM8+MY3JRgVrGztY3drD9Pgwjk820OlkWF7bRGd3C2MjQxidGtcpaBLPx24PuHZvG3cWFnBqdhin5sdVURHLvolaCadnxzA3WoGXpOpP0s9SSqjvC2rzLFNBqwqrqbDgZ/wyNKXQlaT82l3i6JQ84cRDFDyHnPLFx/pOGytbO9hqd7HZ6mC7TYFgDMT8ep5f7MsJZDvnl+o6hO0LEN+HKUAefd7fftxUQa70F1p8pEWgU7x5YQld6Qy7rTa6vQydXoJ2tytpOUVWqBZG2kXYdwQqFopcIijYl3tHp17TOOm/chJailCAXuSJBOc4PfQLiU8xVAkxWo3QkMhaSdLxIMlrbXsPP3j9EnZ2W/jyM+fw5OwoyoGH7b0uri1uoTY2jtHhCD99/W1s7LRw7sQcXjw9gYqfyeUEuLKwhh9fXcC7iy0stQq0Ch/lSqz3TFSkUIf8kp8qQPQ+ctfyUXGzg/A+dSqCnB7j5b6nvwk5A3aTAqt7baw1W2jLdamyiYpJuUy2B63NElnvyj2c0b+PbMdyP7LOWF8+fahQ2aHQRsPJoaio1RNruRlkW8qQy7np54WWJh0pC8vQywp0k0TasSchQ49TggVs50CtTFz7sL0yrQ8qZTRC4nkGd5ZBGZyCxMUP9j4IpAxS984SRuqKoa9s4z9VYhROxZNKvXSjCFeXd/H9N66iXYToSshoKXf/WF+nzgqkYZwsj/2oQJJ0NJ/56QmUQ6kUtpHs5xH07fLgrt/4RZgCxDB+DeQ5qPCh6R6jfDhS4+0ekHys8odzuAR1fn6aX/rIDwYftup0bpCBYRiGYRiGYRiG8ZAjozwZwiUyprt0Zx3ffPkaFla3cGRqHJ97+hS++OQ8XjjRwImJIex2c1xa2EQt8nFqchjDQ1Vs7ezi1p276BQRwto4Er+E3Z6ku76Cn71zHVEU4rPnT2FmtIaYX4vnQBkpSkVPxpUUfmbUdrg57DmUlDGlWnXIun5dLkv3/bWMTCWSgjsKoZ3D6kAVH10/xHY7xep2E2s7nOqqjZ12T794pkIGEb/+jpAWVH7wOApr+7MbqNyTJxkIOx02rn30UQG9tCsD2zOQPsMlBd50ks5pz+h7hJ9ycto2n9vSG+j7pdnuYrfZRi/N1DdCQk2ZHB9FJek/7Jd05C35SzSXofRF/ZpeIigspgCZont1Ek7hsTrpT5BLv6eSj4q/sqxwPy00qER5892ruHTtDsZHh/ClZ89gtBSq4m9X+vLFhQ3kcYMdE2+++RbqsY/f/fwFTDekX0teN1Z38J1Xr+Af3r6Dq8tNXFvawuJGU69tfLSBWO45yU0tIgK5H2iRwXvq14M3De9DTvdFORHrLobc0diS+3Blt43NToq23F+FnIt1q9ZcasHFya04RRbrHVq/WUJ5kodQ6iOSOqaAX88hsYPAdqHlg9Ymy877k3nKko7Wea9v7HXlfo9lXY6R+5vtmctxPWm7tjQqrX14PtX9SPb0z0JLHmZF8T5XBvc9F1zTLRelcjFHP+LQkfPTMkbLJn9UGUE/L+x7csnS59RCSeqxLf1zS673e2/exfXFLWRBVRV+nPrKKUCo/HBKIO2nmrfUrkSkaYpuJ8HkyBAmhynv8xCzTWhNwwQP7PqNX4QpQAzj14A/X4O/+gMga/x9cY9EeUhKdJB3MD9awQunZjFVDVQh4n6k+CC0h6FhGIZhGIZhGMYjgwzy+BH37bVdvHNjGV4Y4/xTx/GZc7Ooc2TYyRCXQ2ykGa7c28RoJcLJyRGMNWLEkY+t3Y4K2W6ttXF7vYNL1+/iyrWbkrGHzz13Fk8fnUSNXy0jR04nzQFHlk7RwZNTtkxhNQWSRZGB0+Dww2MVDvPr7CJHGFJ866OT5Mj8CH6pgk4eYkXOzbC211PFR1syy5hWriEL3XQvnBIrUWGpjzDgF/EhOKtLIWkp0+QX+xR8DsJB3r9tPDq8vz0pJCRUhFBswSmyImojpGdSCUGBOhVrtIaiksALIulviU6NtSdht9VBs5dqf9J+ROEzBcLsWxQ8Sw8NJS8qQNTnhiypIeE/OliXLidrcmLpfyyXyljkWCpQqCRotrr6hf35J07gyEQdlRLvjRSbrQSXlnax2QVW17fRa7fx/LlTePb0FEI5L6eb+ttXr+Pa0jbmpifwwoWTGG1UsLy8gtuLm3IOT/IbltOG6Khj8tj1ed7bHxk5htckC96PhReDTrW7uYetdoKVnTa2uvStU1J/P7zeVJ4brHq1vKHiUS1FBjInuUYqmbo9VZCUynKcxEl2er9SGEWn9qw2PYLNyfpi+bXepRySJy0/1nbbSH2WR+59Ple0jJIFFaVyYCct1CKkJyGVe5/504cIrUKo1FLFAM+ifYZLFlCvWDb5dyDzkvI8ELQkfasNKjAYpA/KMpA49jcqdzJ59m1lES4u7eBH79xDBxX0MqkzPg/lOugzRS5Yjw/lIgOpd3VmL8dSuaTtKp2VTuBnxkYxJP2mIqfW+uaxxkOHKUAM49eg/zMkf/kj434U7/8ASOCLapC2cGqqgc+cnpYX2RRh3usf59IZhmEYhmEYhmEYjwY6zotChNVh9Ydwb3ERpVKMuYkRNGIKB4GdrMDlexu4t7KCk7PDePr4hH5VPtKoojo8hlYaOz8buzsqTJ6VY1+8cApPHZ/ESAhUOLUKp62SvDjljxO20QojdEJn2XZf6hdq/aHjS0nnhpcUyknw5YySVoqI5e0mlrfa2GglWG/2kEf05xE55YcfQM6kSwpc5QSSlxun8ktznfufU/NQqOei++dxvF/p8f5t49FgoPAY+AAZwOZk/9J+SDsEXUqcKuAo5mYCThVE5Zn0/6BEKQiavQx7nQTtJEerTSF6hlIlki4WqBCf+biuzOnbuC392ZczMR+qRjwXOFUUhfZJzjJQ5sLzFhgeGsbMxITed6VQjvcSOT5AR4599foK1ts52nstzI6P4CufPY1GSEG4xElf/t7FJbWCemJ+DL/72ZM4NTMqeYS4vbSF1dVVTA1VUJf8s7iETNI7WxcK9D8qVCpxIVfpyf0o19JKIfd9V0IbTVnvSX2l9LlB24JcalPva8qXqGTo1yuvWRUiUj9SnizLkac5ekmCkEqQvjUO7z13n1IuRaUFn1a0nPElUAEihaECRpZrO11kvrSVbLMN2ZYDizE+C2gBwXha83STVKc660kbUlnCdvYDtg/tIeQ4Scfj3FIvXGBbceN+xCGjpZHS8qNkqQW5Zj/nR8rsQQ4qsrtS/yvdAt999SZub6UoogYK2UElXMYPl7VO5XqpOJFNeTTr8VQAZXLN7J+0jmtLe45KWxwbryNOnWxQTvvgLt/4hZgCxDB+DfhQG/yllptrTgHiHqk0U675KZ4+2sDTR0YQZz1E8hDlVzn6JNS0hmEYhmEYhmEYxsOPE/JlhY84jnXKqsWVDdxda6LeqGNuZggriYdXri3jtTfexXAMfPbcccyMVBHRp4DkwHSTM+OYnxrGE3NjePbkHJ49NY/j0w1UQyCWdBEy5HR6LANNHkMBc8qv0amkIBRCcyipwlLv/hfa6p8hKqGbB9jppNjYa2OVwtZWooLXwRRXXhjKdTiRrn6lLHnokgJSOacKUhm4njmBofsKXuCf9w1jmX4QjEeXg+23357s8TkCyjtoccSew3gJ2n94T3BdonSdQfqpp0q2UP1LdJIemgy9LjrSrzmtWliKQV8hnO6JU1fRwbcn/dwrJC7jncapitjzBsL4QC1G/LSn03LRyqlaKtMXOiI/AbKuWoZA4n78zm20ugUqcvjnzp/Gk7M1RL0OYj9Xgf/KTooluW8plzl+dBYjlRCTIw3p6znWF25iZmwYR2Ym4Mt22ZMz96/710IOo7Ig9WLsdCX/ZhdbrR4NxXSqudwv6YRbVGrw7qY1l8qVpG5oicEtbQYNsoeCfNaHVH43zVR5yfqmdUYYyDOAPigkrcf58/icYK58TmhB2E6BPB+gZUjleaDnkHufU+jJWfUfFUmFtAOteyjkZ9CpsagIYUjlecP2iOR5Q0UY20jakGcJ9DnCNZ6RebPgDwg5N89OpQWVF/ok6zdjTgWH1NmuPCvfuLOJV66uyHpF6rIC+lmhlRKnEdNLyEOnQOHzkUi+mQSnNI4h1YFeR/qX7JodH8JQWfqhoNOAMRgPFaYAMYyPjD7ODzzUucanKn+k3YPWL1JMVn08d3wCx8arCOTHWn5X9Jn7wH8MDMMwDMMwDMMwjI+AjvL0K2zKxkYaFTQTH5fvbjpn5nmOV68u4o2rd1ELCnztuSfwxMw4Ikkc8wvuJJGjczRKPmZHyjg6UsVMPcZwBERFhkDGjyFFmjr1VV8EXBSUJ6LnB/o1OMeTnLuefhB0Ghp+wS2Bjso7RYCVrSbW97pY22ljfbeHFj9zjqo6xQ4FmerrIeeIdCDgdkEF3v0tN6J1y8G6/uVX5DzGRRifIg4qP94LRejsL1QC9JEVlQVrX9CV++vMh7IOp0uT3kMheuihI8fvdLpodnvoZnS0zS/kpYerQs75n8jlvqLwnT2RfT/MpL9JoB8MCu9juS9i3ic0HRF4Ht5PftGR3RTAS0mDEDeWtrG7u4cTkw188ZmjGC0FqMVSIDkvpy2K4jIWl9ewui3HhVXMTdTlfpV7shFjqh7hxJF5NMoxynkXIec34iX+BrBcO50My7tdbHcSdFk/nGKp8OVul+uVa+YVaS3I+VT4HoVqbaGqH27rP1p5OEsPKkB47zeTDIk0D5VS9JPipYk8a6RmCn546+5zd6TESRq2YjeDWq/x3HSKzng+nnQuJ03nazrWVZZLyQL6BOKx8hySdut0E/TkvPT/ov5R2GZSfzptl0AFFZUIrl9o1AOAyh73BOMzlMFBxYXnHJ/7Ee7tdPHtn93AcluuJaqDxkmRFD3PE6kHpuazXtpBrnPwj8/AVPapckjyzyRvzg7XabVQK0eYnR5ySig6qJf6NB4uTAFiGB+FgSZXHmp8+OkPEX8oNMi6PCC5z5MfzOMjFXzmiVmMl+VHLe/JzSY/avJDxZSayDAMwzAMwzAMw3gk4FfAnFPeo4WGLyPAsIal7RwLa1u4tbSG3WYTp+en8dvnT+K5uQl1gu6GjxRmUoibIc66COR4L891SaEnnfJSAcKvlTmupLBR5+WX8SNljBSSUini5RRSAmlfgMwv7buyXN3pYnm7hbXdHra6uTo6zqMKvJhTEvnq0Jnl4LfJKpp0w9mfWzoR5gFkB8/vQj+R8ZghPVLb3QenYlJxOqXD7+stjNFk0k9UNqJLCoqlrwYe6C+HQvtOL8duO0Gzk6LZlf5MHyFxJNk5oXkgedPXAu8LN8Ub77sMoSf3Cad24j0h25n0bDq6jlmMokCaUQ4TYbhRVUuq584cwexkBTt7Cd69ckv2F2g06mjUSwhKZSxttrG4sq733OxoA1Nl4Mh4HbU4dOem/1Y5h7tWvbKPDJU1nEZrZa+DjU6GRO5VKmlcfcq9JfdpIHElKXpIoXvak+dKjozWIZIiyuiFhNfJkniq6GB55VAtV8qQ8d7OUZc6pMUKJ7XKpX6olBgUm4oipuezIJHybDQ7kCtUAT4VF5KLtubgKp1qiaeRZ4wn67JDlVO8HqnHNHEO79udBAkfVMxD9rFtQnkuspwUNP9ixdonC3seFRRqGceaO/AcY3waBmjJ+k8u3sVbt5bQ88vwpE+w/FRY0/ERS85Hnj7vpZ14LOuB3SxnZVHhQ2WTtFcQFkh6u8ik/cbHGxgbKqk1Du8W4+HCFCCG8ZGQpx6fhoL7SedDlWvupVL1whLNH8yn5hr47OlJVGRdHrNys0lymh7rcYZhGIZhGIZhGMajAkW0sQz2KJjNZfBXqlbQKwLcWt1BM01x/sw8fu/Fkzg1VEE17emUNqAAMStUsEuXw0Hehe9RxcHBoRMzcnxI5Yqb9odfL1PozK+VZUvOxXGmfvbNcSQFqH6k513dbmF5s4213Q62OjnyuKZz+6f0C6BCVMlDzs2xqgqWZUCqsjt3yv7ZXHB/DjDY1gRywPv3G48H7IDSU3SaNC7ZazSu3zU0drCu6hHtXxShayoVxFM4zj1yB9EZOKT/psAu/YT0crRTSRsE6iOEWRd5ooqAgAL9QpZyBNWCVHoUEnjP8N6gEpI+akBLJwro5R6aHiqrH4+p0aoK7W8v7uK7P3pdnbIfPTGPWM5RH6oiCWJcv7WIne0tzI02cHQkQpi19VrUaoDXQaH+/av86Mgdh1Sue6OdYCcBUqkH3ktekUqgOkLKnBcIc9lO2wjBWUMK0PE5Je5x2pXnjVy1VEpKywrehnoca4B1wFrOEUs9DFdD1GRJtUYmaagAYdmZzikA9CmAruSxpQoQHuurAgRUxEo6SFkotAoYx3PpdTvlAcstUQrPwinLUknb6nR1aiyWj87yWb+cCqvIJHcW9IHgpu7iNfPapZJ5FdpnMqmXrh/i7vo2vvfTN6U+QrVm6fW6KEVSBT1pB3nAs+7YnwLVdkgtSN2q8oPtN2hDaSlf2ixP9lCOCnRa2zrt/bGZCZSlHek7x3i4MAWIYXxk+FLKxz9/EKkAkR8j/QnhQ1IetEUmD8Aczx4bwYXZOvykKz8CfORSe84fPac0MQzDMAzDMAzDMB4NKEIsigR0MsyvuykgjUplrDZ7uLe5i5mxCs5MVjASeQjzTIWVTEsHzxw/UlhJYSLHhTqWpGC4H9yUKhSweeCsAZzmSsXIKn2kEFLS+BG6Mt5c22lhdYsWHx20MorgQnilGjr5/pfPhQw3Kezh9ED65bjkIhdAOaaD2e4vNH6wPlhR2Z+suzK79ftpjMcCCpHZX50w3XUA9gEXZI90jv29TEnFB3uL6ylqBSB9lp2b08exJ/p+DD8saehkOfbaXex2pC932giiEFE5VsVJzq/oC2edkKkAmsf6KtzXSKHo8RwhSqUSirSDoNdVZUCRdRFHJaRFhusL67i5IdujExgfjRGFPiqNGHcXttBqtjBSi3Bielidi0PuI72SlAJuuWdZ/v61fDTknpdq4PRRu4mHJme3k7zKcu4GrTXCAKFs51mCqsTVY0+CXLY8L7pZgbLUwXDsoxZRpUELl0ynWKKFSkXi6DCdCiGWsRp4GJH0JYlh/fO8lDvxfOoLRC+Be6gA8bDZtwDRachkn+7RpZu2SXJXJZDOXSL1x/2Soz4jqKQd/GPGVIIkOZ2yd9HtduSafFTLZUnL8+pT4wEgF6MXra0gf/j8pAJEtjh1WDfDj199Sy2AwiBSqxn6YKpEcu1yvYnUtTrhZ1/tX4I+v7nBZ3/O6dh6GIqAepCgXHRQ9uQpnHaRtVuYrFfVqsiX3wDj4cIUIIbxa6DvoXywShgoQLimP//yQBxvlPDCySkcb0Twko78SMtPiTxsU3mL5EsAf1gMwzAMwzAMwzCMRwFK/yQEFAXm8odi0gBxKYBXLmFpcxdb925huuLj+PQEwKlpAhklytiw8HP4ISeaoUCVYkWn3FAlCMVvMj5UQav85yixyOUMuYwYKYSTMSSdImeyvrS1p1Ndbe710EoLtQJBWFaHylR8UBxKh8j6BbfkxDEn1zhqVZ8APvOkMK8feYD7UfJHR6qD/f1tFm8gDDQeH1SZtt879K/Kge/Hun42SOHkJOx1LvAjeEo/IioLpQ/rdEIqvOd9xPQUSlO5QYfpnBarg2avp4LqMC7d78tUfrB/MzcutU9SmCl5UhmZc1q5Ql2Kq08GtZiQe6EUeIjrDbxzbweL603Z0UGlUsduO8Wtu8tIkh6mxxs4NjUq93KMbi73mtzbkZSJchu9g/SaPipyrF5biJ1egV0J9AU0ORxjdiTGaE3ua7nPOZ3U1CjjShiuxVIpGboJMDFa1rh6JdRppjjt3YzETQ1FGKrKBdIxudQTP7StyrNlKA51uizWkjqOl8ByD9qGNzDje3Lzbzbb8iySZwuVJFIGtnCh0/L1/VbIuehgPswSaWsJnqSR8zBdwHqRhsvSTJWsOvUVlVVFhkzKw2scqVUlLVtdW5hnP1RcL+G//rpWgFNm8dnLK6Yj/TMn5nF8bhLnTkzj6VNTODYzhomJBta22mhnru2196nyg0sqdegcv8CTs8P4rfPzeHp+BBdOTuL07ASeOjGLJ+enMNmoY4jmJGYB8tBhChDD+DXgD7tq1OWRyumtGGj9oRYg8sNxZLqBF09NY9xz80cW8sOrP0fyg8/D+ONhGIZhGIZhGIZhPPxQjKhz7tMyw5MxXeoEmhQIVkox0Omgs7aIoyMNTDSGEYclZB4VExTQUsDYUYEhpwDiWNCpK/hlMkeUbjv0KNDVREAY6VRWrdzDxm4Hy5u7WGmm2E0DKUeMPIilGBR5ytGSnP5CQimPjjNlPMr57J2oWHKj4E/Go5wpiNO48IN8nsUJqwVZDlYp8Btsc51LDXLAII3xGNFvdO0P0gfYv9hfdZv9tt9dCR1Pa0/mksJ1XcpO3S99nQJ27Zc8Ptftgn1ULTrcHdFJcrS7OVoMvQxBREuR0FkqSH50Hp5BtiVQ+ZFlPYlPkdJ/htwzCGN0EzmXpOOUb5H0+3qtglq9gsWFBdy7t4jl9R1cub2OpdU1uU99vHjhDGZHypJjqvcOFSeF3OdU0qjI59dAr5DPC6kHToG11+6hJNc4NRRishqgJuVqd7oaJocjjFYjtQTpdNrYayUYHypjohqq7589Ob7bTTBNxUk5QEWeJ91OT+qpK+UrUAk9jFRKKpintRcVHVSaSi1oSbQ8qkAKINWqU2CxDlVJInVULZXUd0dIq5S+Mqkk+VS8DCXJO47ZrhmyNJFnVIBSRCsaKqg41Z6PROJZDuZRK0VoVCrSL1gDrEF3/sOEz6pQgpvKjA3o+uBAJeL7ESZGRzA9NIyjY8M4Nl7H3HAVs+M1uSYfb19dxl7OabTYz5wSh89NZkyrjkqW4PxsA19/bhYnh2s4NlzHsbEhzEt+MxKGaQHDac0ewLUbvxy1iuyvG4bxEeCDVX+89c3RPVT5cKQyZLTmYbwhPxScT5G75LlJU0TOHWjPQcMwDMMwDMMwDCcKHYTDQM/lMbit9w7OPB3b8aM2pyVQqZdLK4M/CnR16pgiQBzEKJIUYZZhLCjw2aNj+Me/9RKeOnVKhYP8yjjtW3FIEgQ5Hey6qWWcYE4i+WW1LClko7BWrUYkfz8uqSPz5d0ubq7u4d5GCxvtHD2/gjSsSiihxyOlPLTsoBDa2ZWkKNKujEF7iKS8gR+owCeTwOumEC+VwKUGuS73ZbMLA/QL/0GQcWwgQQXdxmOHuzNdn6XSwi3dOmG/YT9xPj4Ge9ijtVdL76YigOJz2k1RMZfC40eiPhV27KNyPIX2Ge+vEIgqKOI6mlmE5b0c16T/39lqY6/Hc0Uowlj6boQ8Z+DsGnJGza9QJWBbbqssKOk0W6EULs5TDMnd8rkTY/gnv30OZ0/ModlsquLk6OwUfuuzz2B+athNAZVniOnXoUjULwTn+eD1OHgDuJvArfHe5sVrlMBYJyzXIPH6nOH1SQydietSknBJsRCVFTzLAB7JKcXoF4RnlkNduVSGJM8GJhAoyHfWL1KKQo6XcvPcnB6Me/V+13bSlnPl7KOlY7n4T/IsxwHmJiOcnK7i+ExVLU+YPA5zHJ2p49RsHUcnqxhrlOT5BVDXOzUe4fhsLPsjjA6F6mslk+eVKl6kDdXaTM/04KD/jVDq0dUZ64u1wXh5VtLqJZH1pEBZnuFxu4u400VZGr0kx/jSZwj7tnoP4YH9KmQvj6S+S0mCiiSrdHKUWj1ZJih3M0RdOZ4+bVxy4yHELEAM4yNCMzg+TH39caIWOURX3iD5kzdRLfDckQbOTg3JQzSVh6z8IPHlk47o9MeHrwP8QTIMwzAMwzAMw3g84aiIIiWVLuk4yYns3sv/n73/jrYtOfPDsN+OJ958X06d0QgNgEgDDCfnGTAPpbFEa1GyRdmUvJZtai1RS3KQl//Q0nKQRUu0RFGSRckWBY5IS5wRhzPAAAMMcmqkbnS/7tfdL7+bTz47+/f76px3XzeAQUY3+tXv3jp779oVvvqq6tu7vm9XlfOXcyq97x1SBprRQHlpMBdIqShVoNLlqE6z9ZuY51r/fbFEDINq6ROjlnEi3WFUjQG12bApx8IA7VaKjc1VdLupKSwrLSnDlLUhsMwhUlZqE2O3EXkFLe2jD+TM/MF8NKuj4phyWoc4mJS21NX+qMA4q6HNjoOkZcvpGK1kmXFqkb/tsyA6BJ6bsnWhDLVr87dTO5eTIlAhBLFiieWpletevPLa476Ba0GLlqFGpMPi12k1rEE6LNqbuyPnlMFqo1L4L//MU7BG6fxMgb/QNqv9aqPtgl1vMs8xnmY8Z3pxgjgOzTCg/XjMJCkrivox+53p3pleGqkvVwjYD205J3pvr6/ixPoazp/awqMXT+IxuofPrqPP/p0yrIyGqNmnKvZPpqE8eMEflsFkAEF/mx3CPiYDokkP3gsD9mTJE4UmHZIxKoOMn4N5g0ml/h6gLAszwAzGExxmle3hU5QVRtMZDscZjuYVxrmWtwsxy0ocDOc4mDaYlkyT5R9P5gw3x2BWYFZrVofKGmC92zIZY/SKHtLlJIAU+KRKjj45i7FP+VJIljB4j8LswQ3KrjSwpbSKqsbBaIZWK8C57R5WUs34YDwmezQp0EkTnFlLsd6C7ZuRM/zRWEtEicM1+gy/1Ykp58Q3VYbcjxYqqcqtOnCy3vmJFmt79qv6FZ8KXpZ0MhAn5H+Br13Zwah2JuWIMtbFdNyU3GwzzqWtDh45v42I7StSfJZdct9ks9qKnMdrDn4GiIfHdws+WExsLjsPH051k/CgbafAh0+Ei6sttGq3XiLFJOWfexirw+mZ/qN/DHh4eHh4eHh4eHh4eLw2oBHVcokc90WyU0w557BUzFvYV9z7XqDktDyPVFNSXNpvuFRuMgd6mWrMBmwc6clpxKegUpY1JZKqsg3OKxRoYs2i0AyLksHo12QoqozpaxmdwH3hbnM1tNwPf/PK0pBSOC8qlEy/iVJU+qo9iXGYAzcHBW4cZtgdl5iVpIX3ELUWM080/iS9tcaYopvZGu+MenNOA6fxKf0Y3rjGMPblMwerS2ezOhZuCSs2nfYIsTQX1+ZcEI/7Ese1b+3CWp+1RHd+T/swHUmjviLHfmDX1n3YHp1CupKzeIyoOGysFqZaHBnHlCe8rcXG86CDYZPgxmCOaztHOBhOkOsr/SSyGSEFCZBhpGLf1CwF7QOSFfNF91WPlvGxRpTNbI+eN55awRu3u3h4LcVGXaDDPhmyT1ULGmU8iOgf2WyVwGZSmTGE/sqjVFjJLhkR9KHr0vDAOKJYynAt7aWZGVoKSbM3VJgqDFEEie3dkzGXUkvkRW36t1ieGDOWsYi7aFL68d4sZ/ja6ZkazXoJYpYrQFYxHv1KzS6TXFBdkE7lopw1u0azwWSEED9lrjWTrWMpIfkgP/V/beitmQ9ASkcxplKiZhqOamc8UmjtS6R6SXhOqYQWXcI6CxjHcV1mYfotZKWoeTUgebWc6Xa3bfLHta0lD1wd1SReYSyc2gt9tUyb5KMLqxauGLqpJcPU7humTy7xso5k/Fk48rzRc8EYYrl6vAZh1ezh4fGdQIJML578tYeyHh4UfnwIxlFIkVhjtdvGyc01PuwoTPWw44NOor+W+d9eBJZC18PDw8PDw8PDw8PD436CG0+ZSoljI6dgck7+S8OElJAunFP2u3P5fe8wFRbHbjaDg26pEJMyTIrLOszRBBmaMOONnH4585QKVgpRGRFEtVPcylkp7F+J1E7JqrA8D5m41LxNk3OsWFq4ME3ooy/HpcB0+3hUUYJ5FeDG3hA3dwf2dfe0kAklJpEx6dF8EabELIzU7xOuBB4er31IFtisEP5rFlTBnjWcF7i5P8SNgyGOZhXKqI15nWBWqb90rPdJSa0FpzSbIQsiZGHsDBb0k3I7LCtEdGlVoSWFfk0/iQCFiSJUMV0UMk+pvt3HrOys7P8RIvZbLa+lWWINr+XMEso8FU4yJVL+Omf6TMlMA5J1Ms5srCQ4f3IV57bXsarZYvTf7MlvBWe2e+h1YpuxsrkS4uKJNi6d6KDfkgyc48RKhAdO9nBpu2szM/SxbU1nm3OTfFs+S8zir0SVkxf6Xbrlwan0nYbf6bZ0bX66zxMzZPGoe05eKhzzkVFLfnQ6Oq6aJHTxLQEnr+30VYSJ6yVYTiendVzQ54T/N4WxRkeLdVy6JWT0+taxv/Udj1cfatMeHh7fESj4KEkp/+1rAL2QSnzanUabRTXYWuthtdeyKYoyjthUTLuvx/HykeTh4eHh4eHh4eHh4XF/wamTNDpyho3l3gK2XI35Hd+X6n+psHKjru9fsRQzmYTO7WshhajGabyhT9RDfflc0MkIMkPAo/YDiElbXCtsBJtBwvGdGUAWgzodIo79pBDUeK8uK1QF09FX4aJfAbQcThgjC1rI6eq0gypJsDeY4Mq129g9nCBjcFtWJ2JKcpYPOSE/JuHhcb/B7fEhJT97QBzTtTBHjL1piRd3Brh8fR9FFJshpAo77EMhI8VI4tS2xiiCCHmUoJQRhE7LzanfylBhRg+b9sG+zU6qbqr+XYURCvZXzdAqeVsbr2tvC+1BInNGVgaYzipMJoVt2F5qIx36B7wfIGG31YwRbdyupbqk/yH9dUlXI40adJIAvSREKjpIZEpieixaX3u4a+YEw7YZbqXFcKkmusiAUiAhwZ1WiF4LaMdONW/yRc4EhBMUbkadLlU2nfBHfHQhFtd2YhA/LNgSiwvpr5ZxxC8ns53fveGdn3wWzm7eG+K1gAVtxigdzfN7x2uteB7fMbwBxMPju4QJ+Uiv5A1fUEO+HPPltMjQ5wPp5FrfLOKykuhhYpPreNSagHoptimdXmJ6eHh4eHh4eHh4eNx3eOXnYDJ+OKWaxkgL1d1dHM8S0VEay+8dlg+dlHm20XntTBb6tlm5KnXpMm35Fzq3lInyXVDMwZ2Ui1rCZ0mx0Wz0y5jDsJXmePCct6VU1VflCp/XjW1sXqUpsijB4azCCzf2cWNvYP61lLSBDCwJ8yBNTGA580MU2J4Iixw9PO4XlJWWFWJ/itQ32I9knIhb7ENtjGv2oyzEczeH2BkV7EfsL4ulovKSvZp9Smt0aEk79W8nWVxP16wJLfXUhOxlsoTw2j5erXlkXNkuNfdLM7SqhH2WaR7lJW4djXB97xA3D0e4M5pifzLHhOFL5muOvbSsXd+VASWvAhSNZqCwX0cpw2j5K2jnCVvCKmp1kPO+Nm+fydgC+sWp7QEyZZiBGXHaCJM1xmO56Cf/uZbf4nUoOUYnfZMZT2XoYDk0Y0Nw+xe50ouPtryfgX7u3zl632tslTteVktpi4cm2ez6bhiWU/PenL/kqDs3+bjM6jWH1yxhHj8CeAOIh8d3AffiHJhlXwYQLQgZ8C06KDJsdVs4vb7GpxlFP1927UsfhnHrQvLxYGtA6kXaw8PDw8PDw8PDw8Pj/oJTnEkBdayE0lDJGRF018GFcXDjL/lIgXcc5rsH05BC0AwbMmZE9NKna1KJSIkoxaXW5tdX4AtloBzvmqLPFIJL44eco0uqP9ssV5+ca7YIx4ChNmZWOjKwhAmgTczjBBMtd7U/xkt3Dmwz4jxIkTOMlvfRPh8FM1O+JNTyMUc/KzX9PDzuJ2iZcS09XhSV9dcmSsygkDXsU+0VlEkHh/MQt49meP76LiY5w6rvMJzCm96GXdPN9mIvsr4vw0eJOuIxWhpD6HhfhtGI/TUOWwii1JbPOmSnvDOa4eZggjvjOfbnJQ6KGgd5iQHpmktmyFCimSjsrwVTq5RXyPyZlu3fwb6d5RX2DjNcvXmE56/dwc7+Ef1K7B9Oce3mIa7fOMJoPLOy7h7O8dz1Aa7cHGIgOUEabuyM8fyNQ7xAv/2jsa04InqXRo2l8cKkhvI36OiuJeWcDHW+S4PHy7C8li5rEW4pAyWLXOru2hlCeC1+M7wzJC+uLTcPj9cefMv08Piu4AR/xQeOhLs9LusCbT48T62m2O7zJZr37Ksf+3KH4dTL+DJsa04uHlAeHh4eHh4eHh4eHh73H5wqTjB1mrOA2LXzcQo0LUfjlGs/oPETk5GyU19Ka6aHfaS2yM2gL6kR06XmqkBL5nA8x/AVx3UWx8LKOWOMqfykOKWP5mho2Rvbt4NpaXNmfeVdBimyJsad4Rwv3DrCnaMpZto7oNWxTZzrpZI0ZNylU5lJny0BpFw5lrQ9KD087iewyUdRhFh7c2h2RsVr9plQS2HlNQr2o6jTsdkfo6Kx/UFeuLmHKcOp/6rTq4+6+QnSxzBBmxXhDCHabcc5WUkCBFGMMGReDKa9eLTU1o3BFNfpDuY15lEbdWcFZauLPJSBxC2vZX1XRgOmYXogyQWmKW2Q7QPCPLUHSIvlaMcJXQttnss00o5D828xnZTpJEGFNtPqk5YV3kuDAlGQo58m6CctdKMULcuDNMugY+Vh1iYeFjmLFoPKv4DuS1AtYIYNOmfIcEcXRjdcUMV1R92QO4b8LTeTS4oteiSzeLgrzz08Xlu42x88PDy+PWwqM0W9DCCa4aEHQVPm6MYBtroBVlu8yyezewzwl+Ft8y5Cv5Gie3h4eHh4eHh4eHh43He4a264B6/0kbpN4Zza0s45ploev1e48Rkdk6gCfcxWcaiWM4flHAzlphGbNjiOGUHLzDhDjFsCRtTL8CHFplP23Uu7wtoMkkbL3vA8SlDHMcZljWu7R7i5P8Iob1AnLTRRCxXTl5GksiWvmK+c8mkYhs6+SFeqpDekvx9GetxvsFZfsW+xu0XqneyLWqZKzmZZ8V96Geu57S4GWYHDeYEX7hxgbzJDuZQbTMt9h/ryPuuWx1Ifj8xgomXoZDw5GM1xm/1152jKPlujCFso4zYKM2ZG7OOUFmHCFBL2U8bXx7G1M7DY4lSUDWGzWA5PR7okAta6IU5vdXHu5Bo2VtqI6L/ei3jdp+ui3woYtsT2SoSLJ7q4dKKHlZYkUoaTazHObHZxfquNjX4LEfPQJugqj4oWsVgSSbqS4fa4lE4PpTAmsgTHDJ1YOMlEHZ1BxN2z8HS2ZKCdO7lnfnedK6dmwIWSp7qvyjKjiIfHaw9qtx4eHt8FJPQbPuRkDNEXCXqw9dsRzmysIdbsD7svwe8euPqCIODD2jqbfxh4eHh4eHh4eHh4eNx3WKjPwgilFIYLXyn63eyGpTLSKSRtw2LIOSOIG4V9f2C2pIEIlWqGqBkjxRitaoS0miIsM7dRepAgDmKGkSFEoz3SRrr0MVvQaHcAKTmdUULjQqPRlsDRMlYRqjBFEcbYHc7w0u0DHExzM7MgdnsUVEujihk9mIZoIg+cccWV+OVfkivEkmMeHvcLtHSVZjHIMCDHfsE+IsMBe5FtIs4OaAr8kudaZq5IWhiUNW4ejfH8nR1MdC+hv0yclCkh+2ZdKE0ZLzRLJKU86NqyWgdzN+Pj5jhzMz4q9v06QRC0GK/NvGI0VYSgjhGZg7mEZKRVTVchKelIS7QwiEhGqO82tj9QgxaFiFwSaw8iloeyKNUskITShl7SMclYksQB/RWOsWRkoBxISW4r1nLrS1ngjk4+mChZgNcWZhnu3nvuzH2sK4qOQ0kML6QafxdyR37G98VsFvorliRzLMOHFv6STKydM0PyK/L28HitwBtAPDy+C0iM68VZhg+97NaFHqUV1rsJzmys8kGnl9WlsNfDg48NXfJUr8ZuqrWHh4eHh4eHh4eHh8d9hkAK/wBJktiyNlJe2tfc9NOsB42zpHpz6jdnDOHoytz3j2CxMXKAMp+hLqcIqwGmBy+gGF5DUg7QiWokTYWwKIGiQlApZ6kEmb+ME3Ta46OuKlR0Gtk1LIeMHoVUslrKimWbsyw3dkfmRrk2Mk7RxK1FmRhHxg8bKvJHzuDGieZtHDjmhH1V7eFxv0GdhDLA+h/7gowfUrrL1BjWBa8Ldh8tA6V9N8D+x36omRxxG+MmxGFW4fnbu7g1nCBn38yDNvI6BpIeyiZFEHWQVQmOpiXuDGa4NZhjl+eDJkbGNBr221qzPZiWZnpI7a99NzQrwhljNPPCSSeZMyLKMjPO6EiqA8qKII5taS1ITrDzT4oGU7pZXjJ9zRqLMCfx07JBVrryznjUfiajufMLwhbmdYg5w4wpTzJtLcv8HF90LimxlCBOfuhK7Fv6WXh6SL6YP3+0V4niSe4uJYz85SSrLBWFpYwKzCCtRb0UdpGDyXPR4K4ly2qWXXoy+Xl4vNbgeoyHh8d3BGfE4ONAn/9QuNd5Dj46sb3SwvYqH2620TkF/t0X2Xtw1xJujwcPDw8PDw8PDw8PD4/7BlKO1XWFPMtQ5JnNckg5rtLQSk4eUrI55ZmcRk7u+P0q1DREKzPN3ojQimO0tYINJpgdXkM5voVqchtROUAow0hd6PtwW2s/bkKO8QK3f7IUhlWFOIlt9kZOvypIELTathdAEUbYHUzw/LUd7I9mZvhA0jGlrBS0UiY6HI8L7StxcxouqrROvegUrIt7CmfxPDzuF6jFO6e+Yf1Bsz40z6pxzq4bp5LXsk815YeWsdLeO4X26ECKed3CrYMZrtw+xDwEpuyvozpGliTYz4CdSYGbwzl2xzkG8wAzhi+CDvt1y2aM3F12j/lbf13uISKDqPVVMyHYPdeJeWZO8iHAvGjoakzmJXaO5njp1iFeuC75MMec92/tjfH81T3bHP1wkmHG8HcGOZ6/PcaztwYMV2Jexri6O8HXr+3j8s2BzSjTPkNBI7OLM1Qs9zXSfDUZZpZYnpoqyvjpfGSccZKFcR2b6acfzZSJkdMro2dGrznlWiZjUdhCznKVvJfzntsAvs0wWqRLG8GLd5rlJrqUqIfHawveAOLh8V2Bgpy9Ri++6jxpFKKTRNhc6aKX6IHDx4FkPZ96+tNUTbe2pHvUuMeNh4eHh4eHh4eHh4fH/QQt3eLUdVreJeZgSsrLmJ5NXZphxCn69cnZK/H9j6S0tEyapNJb8pyjtnyOmy9cwTNf+zJuXbuC2XRA/wraWiAOOY4LSItootNiWFEYmQ40imJ9B2dfhUftLnLenddSnAK3jya4tjPEuNCsj8Rtci5loJyWu/oTwcSdlvIe6FqDS69M9Lj/ILOCYKtoWN9YquzvdcfQXcHMEkGMIO6iaNoo0MbhpMSVW0McZDVm7I63hjmuH41xZzzDOK+svyJpIYxaTEFLY0lYMUVLsuJlRZnAlBdO1w1KOlGpBaVqVAzrnOJGbrl0HjXzLElTtDstdLoddPs9ZsW84gRpm9e9PtrdLmKGkV/cStHpu7Bx2jbX5f0e43X6HSTtFmnQjAzBCFyc3wOztrp7LwPllvkzQlHVONByX0dzHA4qjMkjQYabPQqxO+MKt44qHM1kCEkwrSMcTGrsjkvsjAoMZo0t9ZfL4BSkZnyqJSfp5+HxWsS3ewp7eHjcC3uOaLqg1jfkyzvPe3xAndpcB0p9haCHxuJRZAd1Mb7mM5yb7iw/Dw8PDw8PDw8PDw+P+wu2lj0HSc8/+ww+8qHfx+0b11DlM/rVSGR0kGWBY6ljJaeGX/qi2Tn3tbXz/16gGSgV09GyM4g76PXWsbZ1Gml7De3eGvI6grZFL5rG9imp6oo0M7+FQlNL4JSV1J1ahCexfT2qOMLeOMNzN3axM5iiSXto4jbCpMV8AuRaSot/Inupx73XHUNhOHZcOPuWO7DvuemUtx9IetxPUAfRzA45GUUpFVw3ckf1SesTrl/o1z4+XZzbR6h1zHCakSBjZBejrMGtwwle2hni9nCKYVFgXpfW3xvJmKpERJdUBWK6oM7pn5lDnTFNmxPB1HMSwGNQsqtWqELKC3bbkjKsiCgjKCtKzUxh/KCifGPYVtRgoxfi7GYHZ7f6WOtE9C+w2Y9w7kQHp7datgm6Fpna7AW4sJHiwe0WVtsywk5xaiXEpa0OHtikX8JwypuSQU5yRHsXqcySF6JDs2FkOHK80H60+jCXF8ZBnpPOqmqws3uI2zt7uLNziEPyJtIyfnWAO/sTXL19RDfEcEr+xKkZe7U5/PNXb+PFm3s4GM4pB5ly5Jb6IsecAcjy8fB47cEbQDw8vivoIaMvASjZKdgbvgGvdls4ubXCB5PWoCwXD2j3AAr58Aj5wOHv3Qe2h4eHh4eHh4eHh4fH/YZWmuLTn/w4/vbf+vfx3//D38ZHP/xBHOzu2MyQpsz4oyVtlgYQqemcMzjt3fcM2TFq/ukraxk65lUL3Y0L2Dr1KML2NoLWNprWOkrtDxClqKPIrcvFg/YnKaXV01flkQwbHNvFCcZSqB5McXN/iDnTzBotv8OxX9JCXulL8QjtVstWD6hL93X1dwf3MZ2Hx/2JxpT4cnUoQwj7IruDGQbNabmmZR9xCn4Gc/uyLsSFum3B6yBJ0MhAwb44zXL2aRljYYbXlJESfeBa54jrGVqYox3kSHgtM2di5s4CcVAgCSrETWF7fdiG35pSJgOKffDqtgnXElwyRDBpN5OMYWT8lSlTM980y6ydxjYpzM0oWYga/oT0TOivORQtHhMWpKnmllfCMCmvtTyfZORyZozZZxmeB/tZSlAZUaWHMphxSCEUgHwoK/JGco2yqa5R0slYK8NvQVmlGXmSWyqb9jvKybMyJ98qyTFXjpg/bpk+elHeoSqY2zJ3D4/XHha9wcPD49uCkl2ivLavj3TJhw8fUNtrXaz1ZFV307Yd3APGHjLu6cN/niuih4eHh4eHh4eHh4fHfQQp6ebTMT7/mU/jqa99Gb12imI2xdHeHVTzCZI4RBxpuFQx9GJMJeUaNPZaKNkM39uAKtByNkmIjGO5rI7QJKtAehJlcgpV6xzGzSYOiw5GTYx5lCCLYlv/viA9Ur7qK+cmcBsZa6mXSV7izv4AO0cjWwKrCmPUcWLGkUoK2CjiuLE0hWHC80QbIf8JsI/lzLG0C7couZ17eNxvuGv8CLS8VMM+But7S+dMEBQaNmtKH54CkbmGTpaQwPqvgqAu0bAvrrRbuLC9jtMrfZzqdenaPO/gzFoHp9dTnFxLcGI1xTbdqVX6rXTNnWIYO/Y72Ga81SRGXJEC9vWYeQZ1SBkl9b+bKWbGELom0AbolA08n1UBBlmFo1zLSpWUQwHmpHtU1hhon5AyQE6/UQEcZQ0O5g0mhdLpYsL0jxjmgP5jpqNZaIEVTGYVLbtVG69kbFHZTV4u3TeAMeMY3W4P586exMULp3Hu3Aa2T6wjpgzrpAkunlrHYxc36NbIkwCtJmeZazx0Zg1veuAkHj67SZ4kSKopknKGtByjXWdo2f5JLIBR5eHx2kL0xr/wr/47i3MPD49vA3v35AO15oMuCkKstyK8+fw6HjnZpsCf67nLh3FiDz9ZF+3Bozj6FMEgK7x/gfXw8PDw8PDw8PDwuH8QhgFuXbuKj3zw9zEfDfHEmx7HxtoKiiLHxsYWOp2+KfydttKNmKTa0z4hUivKQ180L79q1mx79ycTgRtyuR+Fcz4uFUHK0xjTKMaLexM8/cItvHRtF1UVYmPrLFprJ/GZZ27io1+5goMsQtTtkZ4YUUQKmI82HNaeAlJilmGIw3GOa3cOMC1IV9xCEyXQqVsmi7lyIGg5i2yOHW1cqOslOd8Md+8dB1KSNn6kl8r56kL5O9pEi9XJ4sp+eakv3qWadVA98fc4mgvDo8bMcgvvl0H+CqN4On8ZlIC5xfkrU/iGe87pclkHS/cNad8D5b28rXhaisnOX0H08nLpBEt34Zan4pWrP9d675J5j/uT6PkGvKLsy/IZXpHOkh63b4V8Xh5AfezYZxH4NQAzfpC2xni/pOm4t2uTcTN+qOQ8t9U3lnxgEJVbyzFJEZ9EDF8WaMUR1rR6x3qKjW6E1W6C1V6ClcWxz6PO3THCSifCejd24eQ68o/RpWygYEA5yxmmhXaiXYJcptpfyChkpy15fUR5MigjW06vzjPMRiOMhnRZA82XqOdzjPcHGI5yZGWNsqopE2uMRjMcjXlPcSl/NANjcDjC0SjDvGRc5UXZ0iYL1lmmmPwKm9LJChmOF23EZKUcw8u4sjvNkVOGyczcjhpc2mij34qRJhFyhtmnbGunDS5utrCWRuim2sy9wmA8wwrPz693TAfW5b15VpCeOSLGTYIC260A6zHp0N5JC1n46kAdzGrBrpamZGdIZm9c1hH9BV1XlOFH8xxfef4OxlXC50Wk2rEy6L6g2T4t5Liw1cFjF04gIV8URhCnLT+XpcdrEFrO8q6c9PDw+HbQQzVATBfWFJyUdXooXtzqIi7mfKjwgWOCnmKQb3+2HmOgVRH5aNNDqInofJfz8PDw8PDw8PDw8Hj9wZYJXkDntudGpX00gCgMce3qVRzs7GF2dIRsOMZwMMRzV17CYMyxVNRCpI2IaymVCsQRj1WOSEtJ8U9L2ZRMs2I6pkbmuCrmmExOYy1TRGnMpZkYvKeFYrShccRr3T/MavyTJ6/jv/n48/joswf49JUD7FRr2A9XcRSl+MyLR/jSTo6PfP02fvuPn8KnruxiiAh52CbxieV9VAIvHeS4djTHFCnKpI1CRhFRyHGgqcACU5nxjEd5cFwoNZrUZPL9VpC+0jmNG51zinOWXwPPVxFSnou/GsnaPguiE1r9gHVktKqG5K+6OvZzS0GrDM5ZeXiPt1Av3F3wXArrpd+9Rgid6dzSb5gvx90MSeeUmqbYNEW5aqJwYXSf4++QLmaisT5gFE9FG0MuIVrklljmq2PMsFrqyMpk5XX0C1r2WjMT3Ff3iuPKKJqWe1ZYSrpHuvVVfqyj2rf5uTK5c9FloS3Ocv8Gp/x3foKjdeFvzvFUdWNpWcjje86IYCQs0iLfFmkqd8eLJc/EW2XAVBY6C1eeVw+NPiIlvaIzYh262R0qq6NLm21XYUp+U27wXDLH5A77ooyVMo9oiSstzyT5ozJP5yUOBiXuHJbY4dHcUYXbRwXusIPvDGrsDirs8nqPbpfXO0fAnYOGcTIeM+wdFpjMSBvlgpbCq5m2ekdEmaC9OLR/CH3JT80CYxg6mUjWuwnObK/j5NYm+p022mTzdreDi5srOL/Rx7oMDqyP7V6C01t9nDnRQzeR7qnGyfUWTjLcSfr324mVzWqRrFDdu/bnzskZ/lcsM9sa87CWRh5aW1UEhRUf2RaVztJpuS7NlDF+81pz1u7e1ybw7He6p9YhJ17rs1/XbujUzwKWVP3xtQRrz3R2XNDqcV9CLcDDw+M7hh4yfLjpxZsv810+FU6tprCVYPW84D19iaDHih7Wy5cl3TNha87Dw8PDw8PDw8PDw+P1h6URRIaPJEnQ7XYRa6PwvQN88tOfw5WXrmM0zjAez3B4NMblF17CcDqz5WIyrUFfNRw9AXnlPi7TPhqgC7WEVCB1L9FIpadxmTs6pUZtyr6q1AdoIWLGnWYFtB6/lrT6xFeexacu7+LKIMDNWYgRuhg0HdyeR3h+1OBWznDpJm7NeX/a4A8//zw+9uSLyEOpiENM8gY3jjLsjHOMC47yojZpdkteSfW4LPfLRnu8cLpBKbQXft8FnHLTSvyqQmp0U/jrqPLyXGcqX70om6iUr7sjqp1afumjwiyNOgpJn5fxxHyVnru8CzNuOCYqO1Pg2myGe+/pXD+L8bdydb5O6emiL6iz4zdikcwxFIcHldtRZRTaDZeeK6OuFdVFd+m746Iki3SXsZe0yF9UWr7m5+7LAKSjNta2c90nlkd310Lec36s1pOuQkGbwC0l5zhuPrqpIATzNb4sE3U8dVeiSekt83i14Qxp0dLQaW1I+hWd666oXpSfp46PKgP7LWVQXTonA0DVaIZFRTkTYMr+PL/r6JfVdBXyvLzrsqLEdFZgPNW+IRXmRW2zLyw85UzJNAvtn8EcbQmqUMa5OcJqTDdFWGuzdBmBHW29doyNFS2v1Ua3JYNpidVuiNObfZxcb6MVN2Z0WO2EOLWa4ATD9lLNRKjQTxluo42TqynaDOcMo5asOfHD6mvRoKxlyo9OexipLTmDncK4uTO2VJiOFsNxUTPuXFswLi7SXqRlcOnbHfJYhibTgTUxqYzIA5l+tAeKwr0W8Vqly+NHgWNJ6eHh8W1hrxkU9DKAJHzAbfQTrPViWw7LpkbryaLHAR8Q9z4k3ONjCS90PTw8PDw8PDw8PDxeX9ASE4KMAVEUoSxLzGYzc//k934PH/roJ1AmK/jlv/hbeN8v/hre/r4/jX/+r/5LePgNjzvFZRijSVoomggHkxJPX72NG4faYDy05WTCukFiXy1rBkCFkuOxIqzpnIJPn6GZ+k3GEyUYpRhFIT5/Y4RPv7iH/VmBJG0ZjUphbzjEKKtx+eoQU3rMOdgL0zbGWWX5f+nyTXzh6Rs4nOd48dYBRpP53f09bIzH8qrIx+O8l8MUlN/q5o8RVATNzrA9GMyxPmQYkh/rWs6uzfEeea4ZMy6sFK9OCe+MBs4dD4l18nJ3N4w55s94MrQsjQMvZ6kLY6qthVLf2pKputgueChYXVkUINeeEEY77yyi3Vs/8tO9gi5nHAuvdmybWmu/CY73RYfCLmmjs+tFOnep57XSkwHF0lum+4rj0hkvyT+nqHbpfnPo5pI/ylvnwvL4cixnmriv9PXPcJYEj9JfWDznLF/6L6Fwrx5EDCuhWfB+QZe4LyV91BSIG7dRuY4ICvKvRBW5GTtS7sdxajJAMzRkg5Ahtdtt4+RmhPPbCc5uxTi3lfI8xUW6S3K8dq6Fi3TnT6a4cCrCuZMJzpxo48x2C6dOtLC6wrQXBoWacghxxryGdIeUfSMk4RjtcIo0yhFRPsnUUEhnRDLUXhiIZWJb5B3rW3SFJFuodN1y6prx0uJPi+k3pWQbs2E4NhMzeIgXjitKU3ks60xGMPYFM0yozbp27fqqZBbjMb6k2L2Osa1MdrSU2XaWbcaMGmovTGfhSpWHPHV7sqjPSzIrP1H/GsKyTHaku7fTe9xXeI21TA+P1zb0YiOxGQYVVtt8EJ5Y48ONDwBZ9vlwsYcVw+iBq8eEBK39Lp5MXtR6eHh4eHh4eHh4eLxeoWWvltC5ZoF88IMfxAd++7cxmMzxZ37zn8Ff/xv/On7+N/4M3vO+n8YTb38HVjY2cTgY4PKLz+P/+4EP4N/4t/4P+F//b/51/M1/69/Gp7/4JdgSU4E2/XWKTy2RhaCElsjRl/JOIU/fukISSZlXMm+GSQPsZgU+8vXr2Gt6QNyBlkeSGm+ez3FzbwfDYoZnrt6yNeCjOEFZ1hzStZhuC4dz4PPPXsfTLx0gayIE2syc5dEGwhrfLcu6GOq9buFmBIhrHOGq3DxKyelmfywd/Xk0P8UJl36LcIpr8e/l1nfGueN0l2mJHqecNWgcroPC8Z7u373FPxlmCjNmsAUx6HJsLiiNpRN0z5TRDCcjiAw5Uv6aojfUhtQyskhd7HiyjLNMU4YGLRPmKJBamr8ybCzaqJZwM0OHjHaMrnNb1s3ycXD0aGkht7yQrqVjOIYyc3xQ3Ygn1qpVfqVjBIk20SGDgUUinJ+7t4y7oMnKtSgE45iy+GV5vgoQnXTLNiTaVWpXy+zrVYlUBlH2aankSzOGuv4tY6m6pynj2beDUEtRsU4pD8aTGtNpifm8RDbLUExnyCdT5NMJz8co6TK66WSM+WyOWZ5hms0wmY0xmw2Qzw7YQAZIminiZo4kyClzxqirXRSzm3Q3UGf7qPMxxVSGSEt5kYysbDBcbG4+q7SPR4NR3mB3UmJ3RprYIGQkmeTAOKsxnGTMM2O9RJRtbtbKcFohywvVkHFBR8PdulO16Zz1yXZQyTG+a4PkHsOJJRaCkbWB+4I8c1b3rwTDuD7HNPnr8pZTe1PbURt2zoyLFuq1htciTR4/arg27uHh8Z2BTwoT+kWGzW6E8yc20NiUSj0M9FKudUbt1cweD3pAu0e0zrzY9fDw8PDw8PDw8PB4fUIGgeVSUIKMBbu7u3jyySdx69YtvP3tT+CXf+XnsLq+irjVxvrWNlIetV79xuYGbty8it/7vX+ML37q47h5+eu49cJzSEKOsqIIFUdUplgL3BfeGmHpUt8x6wtxKfkqXuVVgSDh2CsERgVw5XaBa0cVpk1XKlPUZYk4DJhvisPJFAezEnuTDEWguSMR4rhtxzrsYFyn2J0BN4YZqlbXKWKZhz5+U1ltbMfi3ltmwRTWJG+pWDe3uPfjiLCW4tlW+7ev0uVUIluaiOdSsNtRvqawZ7iao2D6uZkHTm3tlPzihPPT/XuxuGNQNDsuHa+laDWlq3Ky2QEyECwCWJoagdPdTchloDBmlJBjWSLWzb0063zpXhaWiehXy/xICW30q64tg0V4HnXpZk+4ayu3jsxfTuEcFoGW1zouHaFw2kMiqTTTSfQ5Himte3EvLxc52LU1eoPoXtCg+NL8K4yV1t05TiOmU9mWcV0cd7I4vgpwhiTRpHldqgPR72AlNp2LeOQ4ILaWZKCMVwqh+FqGT8s/2cbklCGKL+PBeDLHYDjD4eEY+0dDujH2BnQ87h5N6Og/mGIwynAwnNN/hgNej0cjzEa7KIbXEE2vYRX76DcDdJsxWvUAUXYH9eg6ysEN0xc1CWUO203Q5KizEYaDA9zZ2cft2/vMf4o8rzFg2nfuHGBnd4BZlmOazXHrYIgrN/dxbW+MoyzAuApx83CKy9d28NKtfZuhpnlwqjOVnk2F0JnjjZONvGIfsTAysNG5Nip+uLamTb2tbehccXV+dwaI0pKfO94LXbsQC1i6ytnhZfc8PF5DOJZyHh4efyIkyPXgsCdGlWO72+DkKq/5YNVXQLCvCtx0RZuSuHiYLJ8YegZ9w9PDw8PDw8PDw8PDw8PjxxxaDkoGDxkDiqKw65hjpDzPbQmspqnw2KMP4IELZ5EmIaoyRzmfLz40Z9y0xXhzRHWBN108jQc3u9hMG2z2E4QKJAUt/02J5zRu/JVykZ6LpXKCOIWWEsplpmAes6rA1y5fRVanKJrUloOJIqbHMV13pc/7Na7tDlElbbd8S1nqs2amxXFdSHrCNqZhilEV2PJYWobL9hXQp+XMJwhJgxR/LOvd5b+W2j/ddwdzNi78MYYMOtqIWgp6GRDiiuPe5TmdKVS1TwOdNg83x/AyJFj5F1iy4dgocAynrF9cEMtTKW2d8pa8lkJ3oWyVgUJjb83HULylotzmB1imUvDWpiS3r91FL8Mp73vzWdaR/FQehbEjEwmUMdMzIwHPnBHOpWd58vayTZpKnm3MtUlR5squ/GTMcEYVpbZI32Lpb7mKhPzFOx2PDTVLOJrFA7U55SfnllJy/rp/DGcksN7yCjgfpbHk1/KDTfHLKcEXuJdRP2Ioa9d+FvTyYNTYiePzUha4MrmQ0sPoTit2fd0MISXbQRhjZbWHU6faOHemR7eKc2c3cebsFt023Qlzp86dxGkdz2zi1Ok1nD69ivOnN3D+1CbObUU40TnAZnId6+GLSLPLaCbPoZ68iHp6E2F2hLRi/VF+1JFmklEmRhFanRQbq32cPbGOB8+u40Q/wlorwMmNFKdPruLEiVV0uy20Wim2t0nbuQ2cOLWOdqdDmZVic6uL8xdI67kttLtdM+ocQ6V2vLE2eNepZeke77Bem1of7i5rmrXuIjgsjjrovsVe+Ll6IKeNr8epO+679CgZF+cM78jx8HjNQe3Ww8Pju4AEey8NcWq9g5VEDwO+INiTIraXCHvRsAeE/NxjQNNb7z6wPTw8PDw8PDw8PDw8XkeQIaAstfSUW/ZK1/P5HKdOncJb3vIWrPb7SOoCqVvpHq12grKuLE6ode85ZtJyNJ2wwRsvnsLbHz6LSyc6WOvIzFGjKmrUHFBJYWuzPRb7MriV7KXWCJhnhDBJkXF8NuN47GA0x61bt9EU5XKuvki1GRxBGKIIY1zfO0BOf31RnZJurZtTVzVp06I6sS1FM9FwTx+8RRzQhc4pvpSr9+JV1BX/0OEU9FKaOsXpcpaElKJSmmvJIfNnWPHB/FlDpiS1cE5dylP+unAaM2uEbIpVC78cRzt/u8dfOV1JLb9UwZq/6lE3hGX6luOiXnhT9MqQkEgpLadEFtD+Dfc6wWjjqc3EMCdDhHx5YbOPVNYFDxR+kb/K5U7l62an2BXLIqOGZp44njk/0xLwqGvjl/0ptqPZ8eYYy3x0VBzFkNOppabLe+DSVTrKx5VN4ZfpOCzi342rSNJeuFQdXhbhRwjRorYg2h39qlebjWP9XnJgKQtc3Sfkc4t1HIvf9KnrEg2dZpgt01HfzosAM7kywpRuUjk3XrgR/caLe7b/EKOW9ZxyZBfB/CUks6fRLb+KfvNlhNnnUUy+iDJ7jnkdMB/NilrjsWsG05xuXpLOOkU7bWGrHeNEEuLouS/hd/7ef4D/9P/5f8Pv/O7vYjI5QrebokWZssr7my2G60RYjUuk1QRrcYONVoJtxu+yEWu+m9Uty+nqiCVe8MH4tKi2kDzUHJ+AsjbQsoCV+OFuWhNddJXj9usag9rJ0pDhUtTuHmr/LoqTuvQnb6OmvOsUbllfHh6vNSyau4eHx7eDyX9NdeZDdK2X4NR6jy/w9nhBUVZ8aCweFnp0LB447gF099I9SY6vPDw8PDw8PDw8PDw8XheQ0UNGgeWsCJ23Wi1cuHABp0+dxGwwwPzgwGbTBxGQtFsI45RDLKe4m04z7O/soZqN8NjFk3jw7AZ6LRkuGDaIOe5yiuUabk8GrTmv2QGm5G5KlPkcQcgwcQeTvMGVq3eQFRWiKOQ4rkJIuoqyZp7KPEV3dR0F09Im11Ie6kvxSGVQekw/Sls2q+RoPGKabqy3nOkhLGd+WLkZ//UKG8Iujk4x75YcktNodznidX+C/BbKWfPgjxkZ3H2l4wwkToka8J6rQx4Vz5Twzs8peZ2/wgqK52ha5MMw7kpQm7ATxl3sB8G8VDvmvShMHdZmNNAm5ZotImf7cizC3KXRjjKiSOHslL13t0Q3w4bSVSyVTWduSTZHntqmc45HDq48UiZLhyDnaHfcWRpkeL1w7q7K45wZTsxHacm5+w6653iie8ZX+rliW2ILmhxPDexTlg79bbaM6L03yVcJxlfyx9GrulLpRKlKdLwxvXy0F8hKXmNlPkernLEcOeO4/hyz/4cRuVsVmE3G2Ns5wq2be7hz69jd1vXNfdy6dYDbtw55pLt5iJ2bB7y/w3tXsXvrOUwPX0ALd7CS7qMVHdJN0U61ufoaOr0tRK1VM/FWbBuRltqj3BD9TU2pxTIkpLPJR5jcuowvfPgf43f/2/8Sn/3oh5EPB4gof6o8Y5Fl7GWh6AJWBIvAMgZmiDG5Sg/VucptNxdYnllU9SHFZX7ZaIB8PMSc8reaTenn6t21QKYk8WhxlKrb7HzZJpWoGUrsfEGUTpW/aHGhyW/WCq/N2MfjMpyHx2sJr9+ntIfHDwN8iDZlhpV2hDMbfTRFZmvIhhEfvvYcWQh6PhzunZ67hD0zPDw8PDw8PDw8PDw8XmewfTFM+XUMGRXe+c534rf+md/Cic0TGB4NTLmnoVOQxKYo1MbjwnSSY54DO7v7TKfEo49cQr/XAkrNxQgR1TGCKnQb+3IMVkVaGkkK0gxpUyBh3k1eM8/Yvrx+9qU7KCPGj2JTnmqT9JB5lrqIUpSNvqMObGaJZnRIgRgwnViDtjq3D9+0dJdm+Wu9fmFp4FlCqkinF3Tl1rlTUtvl6wINC6QN5xttPA9tPl+ZsUA7EdjMiZD1LAMU/2ptNK7Ca7ZERH/GW+6ZUi+0uhohm5JdX+ebYYFp8zyoSls6S8r7mv7WSuhvm1zrmv6mFOe5GRGYphS8WtonJg1qe8u9WeR/94t00ihDR8HrnPVbkn4pdVWuSnTGUgKzZLxfWdkCFAyvDZ0160fGioQurnKw1SBhHFMTq5iWT22TgxqWr6pIvzbsZztRm7A2xLgkmE5tTX2EZWD6FdPKeV9bWmv/ioLpirZCf+SbaLCNzZmumWYYT1/0s8MYr8QXtVf7ql/LPJF+hRF/nInAzZWQQcn4y/OGcWPmxZ6HhuVpGM+1ZysAf5Um02B+9zTzHz1YTmtbdGYEM5pIlQyN7Lc2o4gEFmbkqNDnsas9Nr7wabz05CcRZgPjjfVXxWO5I6a5vtLBpTMrePTCBh45T3duA4/K8fzR8+t46Nwar1fNPXKe7uwa3TbdRVw8c87JI+SUW2qjHcSdh5Gs/QTC1fcgWn8rgrUzmLKf5JRJK2mMixspzq4ENotjMjrEaHiAg2tXsEuX7d9BJ5/iifOn0GWNzIZjlq3E0bzBnWGN68MGB3mCLO5jZxbhzqjG7VGDEe/LyFLLcKvWWTnehGy3ro1omT7WM9v1nVvX8a/+tb+Gv/ZX/gr++l/9q/hv/97fc32GQbUJu/pqwXOKXdU8wiixVqN5HAWbWk5Hkcv2yHxkXGZDL5hHpX6qTCU7SUNj1im2MPrzRHc8PF5zkEj38PD4juBeIFp80V7vJtjkwzPVC4gexvZAXgp6vXTZKxkfACF/ZfW3Z7iHh4eHh4eHh4eHh8frEkvjgIweNiuC11mWodPt4ld/7dfwF/+ZfxbnLj7EMZKUZVLdcYBUzBBq43LGHxyNnC5Xek/+bfR6mO/dQTAfIZKyu2IeQYIwik0BV5aM1+SIgwKhlteS0pn3c8b90rO7OMpiTJsUo4zhGEdK7yAKkZO+8XRmrq5IRyC6lbZTvmvPEX09HtBJuS69vWaOfDP1iSkBX/eQ0r5i6ckX8jlgfenDQOdkMKqg1cM00UZj4oZhqjIj31gv5KmMEzHrRkYCZ8BwachwkHJsbfcZT8aPSAYPOaYZsx5kjJIhI2HYFhNIQ80IMrWvGSFs6/qFMlb7IoRBZGNv0WZ1KFroNOMjSkLESWSKcBlfQhkMyhL5bMwj6SEdpkNWAsyLpUO5LDfLktQZQrZXZHQsn9qePoiss7nllTABzTaq1GbYXiPSb36ML8NDJcMF74UqH/NOmV/KwkdijPjCfKXaNn6TxoZx1VVESxyxXPSzGR3MS2W38tMvTQIksSYpuXKJxzX5W5E2mwnC9p4wvrIRTXXOPlfnFjehZ2B8YP/hdSz6mL76572GvlcH6nMyyuh4DFFlBjSWJYrIq2qGa898FVc+9cfY/+qTOHrxKUyPbhg/8kyGTJYzZgsTL3TOBKo6QF6of6u9ynAmOaCZZq4NyEXKjE2hrJxup0YPdXCC8uU8qvhRxBtvR7D2dkZ6hESdZ4RzSPvnELbXzHgQsj434gaPrIV4sM82cXQLh7ev4cUrV/DhD38UN67fxv7tHTRsT5GMUdnY6m0wnuLO/gEOhxPMshJZXmEwmGJ3bx97B4f0y1Q9ZkyTnIxYt2kas251JT+2qzQh3TmGhwe4+vxl7N+8jgfOnsLWSo9ldHGCOGJrCzBhkxOH1eZy5iVDiFphzoQKtlG2eroIWU3ZyYD60NctRaj2mVAW68gGyHOzempPJqPCw+O1heiNf+Ff/XcW5x4eHn8CJML18rIa13jTuXW85fwGX8T4MrWcosgQ9rKslz4+VPS1hh4OBkbWFxdKwz8KPDw8PDw8PDw8PDxeb5DCVE7KXxlBtBeIjCB2nqborKwibrVRFrlTIBdzTG5fQ1AWSPqr+OCH/hBPf/XLOLXSxiNntrGScARVltg6fQGt/hrHVlL66UtlKez0FXuNNKjQkjKc+ZZIMG4S3JpX+PCXr+HWlH6tNdS2xwhHaVIeRyEK5lcxnXmm75wjRDLcNE65rLGcUyLynGM7GUG6rRintzbQlY5PGtEFguNTO7eRH2k0+84r3I/zIFCqX30X3o0CmwmhJXikTZcCP2ZdS6HfsE5lkJJmth0HFlYK95L113C8LP7qq3TxVfFaaivktwxMptAnA6V81n3Vbqj4PDODlJTdPG8qpsX0xOdEjvF0bbMtIvfVuqnKGSdVvcnowXRr3qtMqS+DCMOTTtGt5azbYYB2FKNFp306qtJ93e72U2B6pM+MNVWGXqz2prI4BXISJ0hJSMp2IUMak2S8iLRqU3PmwzhxzbxEvwwzpFMGHNMhsO3L6GAbkdM1PO+wzC2mn7DgMrgVaugLGK9YVjOqmDGJ8UiXZn3ongxRsh6qvCnbuPLRqm2y5eRMu2YcLcNkBiSWSUfXi0g344Xso5oPZT2Ft8RH9RFTaL8ajdeytNpk+ZzJS7OOhJTlkNErUz2m5HY1w+7lpzB95mn0yjlOXzqJ7QcvoWivo067Vm4ZzBIWLJtNzdA6HIwwHo0wGU+xPxji8IhuOMHu4Rh7dEdHUxzuj3A0muBwNMbBYMx4OfK8i073YfTWn0DYe5SN8DTqQIaRhHTq09cO21gbUdxBHLMd5GMksz3Eg9tolxOsdjq4/PxV/M4ffgzP39zB2tYm/txf/At49/vea3uGlHWME1urOLfdw0YvtbYE1vMDJ1s4u9XFOmUji862ofbG+gpKnFxLkY1HuHn9GsaTKSbTCeUt643CcnhwiGtXruB/8T//F/GX//I/iwfe/DZkgWbIhSaH1/tt689TiuRJEWJWarmwEJ12THpge6UMeO+oYHunPO/IKGf+wOGU/jnlqc1EabDajrDRFh8Y4FVoMsdQ/iLAESGZIrntlqwn/ezb7q5rX7quogRH8xxfef4OxhWlXKgdo9Q/GHOh09PzoYUcF7Y6eOzCCSTsMwojyPRk+bksPV6D0OwkbwDx8PgOIVkW1TlO9iO885FzOM1jyJcaIdR0QAo/e00yocfXB74sSGAuROFd5+Hh4eHh4eHh4eHh8XqDFAxysTYMJ2QIkdJXCkh9YV1IkZTEqPMCt567jBe++Clce/pJDA9uY2WlhU996hO48tyz6Ic13nDxDDb7XZQMe+LhxxD3etDSV1Iw61N9petmbNBJcY0YWdzFflXhI1+9iadvHmEatFA02v5cBg4piZ1iXQpuG69p9gfTsTEaaXTjNY3gdKIwGt/VaKcJTqyvot/W7IKlUtYOd3F3rGc/ryc00Mya7dUeTq22sNVvY4VulfW1Sbfe6aBH/kghL6RpilNrfZzZaKPbbqHW5hrkmQwGTAZ9xj250cUW00riEEWRo99p48TmCrbWO9hYYfo8rq22sbbCY7eNmO1GxigpbFVfm2srOLnVwSbDpEkLszxn/cOW9JGyssX2scl4Z9alMO4gTFvIi0Kf8puCv5ckvE8aVvp0TId5dhkmjhLT/qt5SOGuupRyuEXaV1oRzm2tYotlW1npYXW1g9X1FmlsoddiqmwWmrnEZkQ0aIUV2iiw2k6wvb6Gzc0O1tdTli/BaquNDvNJTbFKvrBNt5nHKZbpxEoXa70O26YMI2yboQwqIsWtRrHB/E9tk0/iXxQbT+q6MMNHh/xeY59ZJ23r5M0GjxtrbYRxBzkJi+MIpzd7OHeiw7bM/pIVKCoZUBiX/bKXRDi7vYL1jQ5aPVJfRnDL070KjVrNRsYmnduMgqUBRBudq3bIH9Ks2ToyUobzGardPax0O3j03e8ANk5gEvdto3MzfLIeFW6NdXfu5Ao2N1iH5GV/lY7H1fUVrPHYsfMe67lHPjDMOuub5ysKu7bG8Fvo9LYRtjaYd8+MrpJLaifa5B51jIgyJ67ZJmeHyCnbiqNdNPkMvdUV9E5fwGc+8yQ++8UnkbANvvvd78L7f+P9OH3hEuZ1hMGstr610WGfYhsZ5w0ODo5wim1nrZNCy68fTTIMJrkZm1dbMYb7t/E3/8bfwH/+d/8OPvD3P4D/7r/7bXzwg3+AnTt3cPbUaVw6dx7veOsTpH8dU5OTKapQhooaxXiEYj7HwdEYo2mBadGwHZfIZhMM6DcY5hjlAWaaPkfe56MBRoMjDMcz+muWSJtpsS7qCitJg80O5a06wSsF5I8UzNvkkWu33gDiIXgDiIfHdwF9eZJUGS5stvATb76ATlPalyo21dbej/QC7QS9BKY203MiVpMIndB18tBLRQ8PDw8PDw8PDw+P1x9k9JBiTkYQKRx0LWjZqpp+Je910xTD3R3cvvwU5oNbyCf7QD7CF7/4WYwHB+hGDR66cA79JEZelDjzyGNI1zdsjFVxTFUyTdtrkeOtsgmRo4N5lOLKYY7/4eNfxdM7Q0zDFuaVll6KkUrxoS/lA8UTNQEi+kutpeGblsURzQxmyq6af258x3Ecr+M4xfZq35ZBlhJsqduzuDwuneGeoZ7ldY+759aPERq0SPhGK8ZGO0Yvcks2BWGAThyyrkL0WE8p+amZNdpTYq2dYr1NXrHE2th+Ps9sFpBmK3Q7KTb7KXppiCIrMBmN0U5jM3b00siWytJeBgHT1hf7Xfr1mG87SZHlme3l0O91sdJJoNF2NmP6eWmrL9jcENJqez2Q3pPd2OLra/nRcISAcVdazJ/xt8zoIcNDgFaszapZjq778h2Nlg9iW3HLPFiemv1zerXDOGw32kSf+cm1SGM/idBhuiHbt2gpyhwrKXBKRqJeGz2WWctvBcqL5eszfj+KbMmpMq/Jh8pmiWwz0norIU0hRqMZpvPCyqU9VDR7RTM81jptbPQTWw6smOfI5nMzDsnYtLG+gs3VhDSGSHlfS2PJeNBdJV9JQ1OTP5n2M21Z2bX0m2aHaBaO6FrttrAqWpn/0bTCgHXzas4Akf5E2hQ0lCXig+usiBf1MtEUlTixpZi63T4unTqP3tYp5OvbOAo7GNYtNGHbloOSgaJmG+x0WMaV2AxytgyU2hvrQ7JF5zldIAOuGZ5UzxGbA8OQJ3KMxHYmRwIZVpavMKAP07YpM3kBDA9QHF3H9OAqZpMRiprt49Q5dE5fAJI2Hr50ET/9vnfj/b/6S/iVn/8lPPDI4wi7KziYVdifsS7ZP1qsH81oOswCDDP2v9WU9RnarIwRr2dMsyQf6myMv/Mf/S185IP/BHeuX8NsqpkqA7x07SU898xzYhd++Zd+ydp10u/j1nCKGXuOypCyjJ2a7XUytrIXMri1O2YwYuOyGUe8jYI8yHhPkjGmf1BqCa6aaSTkV4qafNGeTWstYFNGYs2aehWazDHUTkSAI8IbQDwEbwDx8PguIKHZQoFHT3bxjkcp8PjinfAhbA8IOr2O8/3HxGvFF8BK69MyjvmzszlZKAHqpaKHh4eHh4eHh4eHx+sL+jpfWBpB7joOkvKywrzi2CmObD+D1f4Khoe7mBzdRlKOkQ93sbm2jp/5qZ/Gb/zGr5tCTrNGehvb2H7wUaSrm8iKElEUI0hTZNLRRQlypnd9UOJzz+3hY1+7imfvjDCqQ47HpAQOEZYZHji9jXw64jhNfw1qbaLMP43RnJPBQ9tlO2UXQzB/jt/or9kjMoBsrvaw1WvxSh+3cVQnHZuV9hW415PnMoLIyfveWz8+aGz5q7VWjFUpzasK03mGwSxDlZEXrBNbcinVgmQcB/O+DFfdxM2wmeYZ661g4dUWgG43Ra+VIGb95VLgZ3OkDN9vtTluDpHP8sX+LFMU8wLxQlGrfQtmzLOsSvSkwCc9UvKXRY1ZXljdaaNmjbq1h0gvAtaZroxbmsQwnkyYR8tm8qytJrZnyXxeYjKZY8o887Kx/UH0oft4yjSZl6B2KD1ALwa2uwm0b0nGMg4nM8YrUGfaGL1Bm/TIcDDJCpa7xHYvxamVFB3yJScNR7OacWqULJMMSn3RT/rMiKclwpjmGnnTSbS8FewL+1lF7stQJ2MJ09ayX4639GP7m8+nyOZjloV1s9LHSl+KfvpPK4yGpG+SQ3uSRqnbu2FOftezCVY6qdWP+sA0y5DTaVmyM9trPJKPpOdwTH/GMYUxw/3oIeqUu7hPGkiXNtQXIrMssr0lLTxz9Qau7R3iztEYd/ZGuDUpcHkwx9O3B/SbMXBqSzdp9ksqI2xZYEbeDodTjMmj0WDC8zkOGHcwythOCvKNdXWUYzIsMR5NMJqMcDQc4vBgxLA5hiPNnKnZlrXvhkwJMsqQn3TZ+BCj3RdQ5odgM0fSWUF76wza2+cot3pmxConR2hHNVa6bSRpl/Uc46gIsTtle8xZ6WFiRrEZhdweaagor2QYzNjvhqyXmdp8qS4V4JMf+SD+0d//rzEbHJhssllBlLUh2xVrHu9+z3vxvve+l22zwXA+x3/4//6v0V7fxuaJU5geDfBPfvvv46N/+Id429vfQVm7gQHbSIuN4cxGHydWVyinuwjiBGPS1U0CnN3s4sRaD71eFzXpHOeU9+rbyLHeArZalLlaZu7VaDJ34Q0gHt8IGUBcTXp4eHxbyNChl7VTm2tmSTcbOB++2vSJN+lK+6rFiVLeo4CVwHS/FLoygjCYh4eHh4eHh4eHh4fH6w2mYAhDUzgKUgSXpZRh+rK+g5VeB5NJgRtHMxyGMfqPvRnYPo2o1UE4m2MTFTA6BG/hTT/5Hpx961vx8Dvfi2TtFIpGswYYjunleQHt67DD40e+fgf/4BNfxz/58nVcPgSKdBOtzhpPcoT5CI+eW8VDZ1YQY8oxmb5clnIs1PdrCKUc5lHfuGs814T6EpzjO47jpNZSUH3mVtZaqkkDOY7tvovxnBk/Fuc/3pDysOH4Vntf5phlU+wfHmD3cA9Hw0PM5jO7H+vr75Tc5L+MSE1Y0Z/jYN6LOGReKiIdc3ndVNCeFrGi0MkYVeUZppMRBkeHGI+GprDWfg+amKFZDzqXErkpmUNBeqqcYejoJ+WWlsuSsljLVnUSLV/FSmCbUdqapdHquK/3jyY5bu7v4ebBLnZGA9xmfreOptg7KjCaTGwjc9scn9ktFafSAWg2SJnnGI/HGAyOMDo6QDYcsK2VSBlO+5/0Owk2+inaLH9RzrDPNn37YB97oxH2BgPskW/iYUzatCSYZsWEjKc2aXzRDy+Ua1XXZjzU0T66FJ95I6VrscA6rnZaWF9pmRFjPikxPBphNNA+F0PsH7Ce9sakl/1mPkeezUjzIaosQ5cJbKz00O+2sSY6eN2Qp4o/m02ZnQh6dSC+a0kp7bciRiwpUTuTcTNnX722M8DXr+3h67dH+NLOFF8YBfhS3sNXJl1cmXbwwv4Uz7xwDdfv7GE4yegmtqzU1nob6/0uNvtaYi3FqdU23nBhGw+cWMXDJ1Zwfr2FcxstnN5uYZvHM+s9XDq5jUfOn8FDZ7dwcr2PoKwxYX2KThk+bANwNvyGMqZqTVG0WBdpD/HGKbS2TiGg7DLkM5SDPcyHbAPTIeZstxMW7treEcYF21xYo5hNMDnax5R9q5pPUedTTIZHONrftWM+HaNhuy9473d/5x9jb2/P5Fos4wfTa1PWxlFK+RvgwqUH0VlbRyUjGuv6n/7e7+Hf+3f/XVx/8SXmM8NHP/QhfPbjH8fhzm1bLi1mn4lJw/aq+JLg9HqMzS6QML82e86JlRQnGe7Ueger3ZB1lLNPUtY2GY8Fe4l6l3RiZIyHx2sMekZ4eHgQzlAhC7aMF86AIT83g4Mvb3yo9PlycXZrky/Ush7ypY5+2v8jimMe+Vamd5VFWu5bCSf4Xcq80sHDw8PDw8PDw8PDw+N1APvI6+6YR4rK0L78tw16kxhasz7LMszLGsN5gE8++Tz+7j/6KP6j/+HT+IefewEvVJu4UW9g0jqJMupCm0k/+/RT+PrXvoLVfgcbp7fQaqc286DR1+4hMM1rfObZG/jtj3wZf/DkFbwwyDAJEuQavwUNmskAW3GFN51fw8+88yJakRTlldGqJYu1xNLdcVlEehmvXFJPf6kxl+NCzfeo6hCllrf5JvjmvsdQOrZyj7v88YS0vCypeGO2AJ7L4FAWc9Z1xrKVvKevocl78ln3bMNx/pHl5KM4yxPeizTTginErEft31CynTRVgbAm71U/1p5cu5KxQ/t5aBPoKpcxQePvwGYQaRku7ediBIVSa0lZzvtMT/tW6At9zazQZuMyecgu0+nE0DYfWhJrkheY1Y3NIso4np+QrqNphqPJDCXzjZPE2onajRnNNCOI2cgpb96w/WnyLLd9TERGwjxShmszTC9xM1Hy3M2WmYiWKEZBSkfTGSaTqfGKXQQRmXFvUcQX5kpHnkrPEGuOAWlRNRCmh2D+tYx85LOWs+oyXp2xj42mGJGmjKFK9okp8z2wWQ4TzNlv9KX7JCsxJu0VE9RMkPV2jK2+ZieQN0x3Mmd5Qm1sTYJeVSh/p5NRmTUBREZLGSUzuis37tj+FHO0MQ26mLTXcUgZMo16KNM+yriLo6zA01dexKc+9xl85rOfxkc/9kf48Ef+GJ/6xB/j4x//GD71yY/j2cvPsi2xrbViUNSYIWilF6HXC20/jl63g5Zm3ajNsb7aMqKxbo8GY7b7lPWWsD5cBbZXV7F26gz6Zx5E7+zjqPtnWAct8nyxqX3cRtRbZ2NcR9PdYNhzOHv+NN748Glblq3D+j631cMbLp7AJcq+k5urRs+Fkyt44wNn8NjFU5SLPSSs9689+Tlcv3KZNNSUsbk1zjhOWM+aKcW21W7h/MULeOnadXztxeu2X0eYpLh25Tl86J/+LqZHe7j2wvNo2I52bt9St0at2SNs71o9TYY2mXXaTL+DHC32cfkJuq8l3GTEVO9W41SbDMwI8s0NZ+pGHh6vJigmPTzuL9gLmDPVLx7pmsvBFw99ZUGprBkdVZgir5zoblGIJ+XcXrrX+HJwYaOFVsWXAgp4baZl7z+aZs1XuYYPPz2iIz4IkpovJPRVGjYQ4APp1X+J8PDw8PDw8PDw8PDw+F7gVJHOHSsm3VJRmiVAfylOQy0xIqWYFOMcCenL5DDCi7sjPHdY4kbRw3NTfam9gc/Pz+LL8eP4SvQQbqVnbOPysKwxu3kdz33yw3jxUx/C+MYVhMWYw7Y5dm6/hH/ykU/h9z59GZf3GhyWHdTMMwoypBiiVx/ifDfDux9Yx5/5icdwejXBYDTnqKwlnTy0oXdDuqTtk6JbEzsKDugaafbCgmO+OUNWCCrSr6+oOcbTaSHt5cJqYvuF8NSU1ExD40td29FCOEhha8NOed5748cMUu5qKSktoyNjhcbBWk7ILU1lc2Rs2RvNutHCSlp8R0pULSKjTaELMkc81hfqbY6bmQx55/heGt9deO0doFlC506dxKMPPYCzZ07ZRumaBaKZDMN5CdWy6kMKV9mkSta96l9LVUV1jVh8DlmDrDuZEKKANNElbB/9DsMWQJI0ZgTI6xRF2EVWt1EnfaYdY86yaiZQzb+izlwlsny1NrUOWEaWlwwxetOY5U9TNhPGZ5vQhImwjtCLYyRSBpPGedlgRh40cZd80DJhPNdRm03n5B3DSMls+gixi3zU3iNk06I9MRyvC9Kk5d4CMk+GDxmTYkbQ0lgrrRaCrLJ0xizfJNSeODIEtDHXJtVRh7xKUbJvZSznEf12s9pmO3XIt5PtNlZ4rNnvjmZzzEiN1NhNmKh3M9UfPayrUZ5oGTwZxyJWeqL+pJk/5KE26x6Rf3XAem609HhKf0WpkbKuoyazWWKaXSHD6KyYY3VLG5+3ESVsd02JSZnjK89dwe/+4cdw+eYRnrt1iK/fOMRztwd45uYhnrl1hKfpL/fU9QM8e+MIl68PceXmwGYQzasEw4xyRHUfs74i0h2vIF19BOn6o5i1TuHqJGJaQzx3dQ9DrReVrKBz+lFUW49jHydQsT46SYLVNMFKxDKSJs3safNaG9VHrImAfh32lRbDJfRP4xQtNuQnP/EhzAY7vF+g3eqgrLQ6CSUz+1StTfh7CR5++AFcfOQhjJINHLBvZHmJcjrCZ/7on+K5p76IZjZjR6ywu7tv7Vezp0yys4NaFbD9hcy/XU0sT5Nnqh+2v0pL2zFS0LCnh23WgXo887cATEX7p1hFMk07V+fUNRklP4VRekunuNbiFO4HCK3YwvzckfkbTR73I9QCPDzuM0igOqF6V7QuhK98JA61tFXAFzQTkFXJl6YGXb58aZpkK9RXK5raxwiKw4eyoLVk3fcsWk+WD2k+VPVFhonyxUuyl7UeHh4eHh4eHh4eHq8bcJykWReLi4XCi+DR9taQQi7Qx2ARbg6muDmuMYn6mNGNozUcpCdwo30OV9JzeBbbuB6fwl58EvPWCVRRGy9efhaf+6Pfx3Nf/DiufekzONq5aQaVKNSeEQlSZt1rcmxFGS72A7z38XP4cz/7Tvzyex7HmdU2sqMCN69ed+O9IEY+134UHKtFUmADmhHScMxW1Tm0rIw2NI45dpMasKgqUwraZthS3i3K6RR5DlL26frY5+W4y5ofU6g2nUqUZ+RFFOvL+C42t7axQadjt98XI1EUNYfO4gX5xzpX2bX5tIvaoCo4Pq40TmaiUhbTX0Yk2zNGim6GjRbxZGfQx4aJlu5hRbXbbaTtLmRgkwEqTUSL470tD2VqcaZhdSFFsHzoz8RktGFI1MzbZnXQW/RptpHa611FrSlyI2d4CBk1Cu2rfxkatLRbzXai1GOGWV1dxcb6Jtbp2j2Wn3zJmV6Wsy1ZuiyH0cq0mV8lw4oSZR5S6hsLmKaWweJBLDIaxQOda7aNzbhhnrIRWRuVY1nSxG3gLcOIZiY1dJotY7t6qB6YuIxEZoKKEvI5ZPzjfjjl/aOswiRjH2D+PTJTM3Jsj4nZHFOmVyiO6u5VhDQpjga2C/GdZ5oBorlFw2mGUhWlUt9VbOu+2gDbGUOxGAgSGbhCdNe38K73vgM/9fM/ibe/671478/8LN7+p96DXn8N73rPe7G2voZWu8P2vIH+ygqv17G6soa1tXU73zqxiY3tNfRZ7731VYSdPoZFjJcOCrwwKHA7L7BXlThk/e7XbezWMe6UIe7kCfbyFGP6TWW4IZ1jNtyjqIdJaxvzoMX6Yj2yBKJXU0wKhsl5OqHnjBVZq22RDwULmDNMyT5WzCe49vyzPM5Yftb0ot+of2pje83kOX3mDLZPbJsB8ureEIfzErPJDC32i8HODXzsw79nMk/Lou3t3VETNgWx2hubF/nLPqNzzVBiH7B+wGvJ9WsvXMGnP/oRZIMddEP2q1K1wnDsG+pj6qPq19Y/TY7WaLXa1gY1O/CbYSkrFwcPjx84/CboHvcZKE6XkpVwrxeLX71lUVCbsUIvYHwC2FTc2r5/wGq3hbc/dBoPbKaI+fJxL5YvwRL0Hh4eHh4eHh4eHh4erz+4sdMSHDXRcQxlflKuOh/75XhpeU+z66X8e/LKPp6+OUQZJ/YlexOUPNYowwATJBhEKziIN+g2EW+ex6WLF7C50uKdHLPBHu7s3AFaK8hkQMlKrKYhHtrq4x2XTuInHr2E9735PN54YRPb3Q7aUYjD/TGuX9/FYDLD/mCEJm6jII1SHuur6dngCB2tW0Q6pdiTYtsNF0P3RT+dFMNRmWOjG+LCiTUrl7Ac/92L1+NYUMrVdthg3TbOloqzJh9ToN1CkKSIeK5NmoezEvu2QbOWjWbYVoyqqjGa0Y+8Fm/ivMRaq41Op0WmApNsznqcoxsmWGl3jf/6Qn04HWM8mSKf60v+xowgMeNp9scsy9BLgF4rRV2z3UynmOf6Ml0K/kUdML1eK8SJNuuU9E4rhstqREnbbdauL+XLmunPrH41S6khjVquTTWofRRqS09tQx61bYK+3klsk+nQZn20SBPL2U2RxLGVe384x9FkjqTN8tBfimJtrq7ZCjmdypcyrxbbvXgko04ZRxjNC0xn5AP9OjF7D9vYYDxjHLesmPZJAf0S1QPb61rPzTjRLJZ5UZjiPmWf0pJtI/mRR5q7oTkR1g9JRyBltGalsF/o407bI4fl7JJ29VfldUieH5GWQvtZsK+oL6tDvFqtWjkH6pg8IzPJF5iM0Tpmt/cOsXs4NGNPzXpSzbm/Bb3kRdmw0gKVj75kYae9ipU+2xnrcDYpMGT8jf4q3vP2t2KrT762Y7TCGiutwNq6XJ+s6CTsAxGv2RxY5bap/Jwt6/agxJPPXsVHv/gsPv3MDTz50j6+fnuMp24N8cytEa7sjDBl34g6fUbSZviBzVq5M8yxPwWmdWTLVWnPmcNZhX1tlM8CZU0Lh3Ngb95gxPhaZG6WNZRjpHkW2LJrN64+j3/0Dz+AIeVai3UYsf3WBfsL24H2I+n0VvGLP/9L+JVf/iVM2H4/+bUryNgHPvQP/4HNcKu07NXNm+xfZAw7wZmHLuFnf+VXKCcnSJMQJ1c0o4OcJL818+rWAdt10sLWagfBZIDPfuT38Pf+s/8EX3/6a7h44Tw21shbsrvfOjbwqS9K1sogUpI+yUydW33K6VRZ8ODgPL5/Oaq0F4nrN3DPItk4Bb8J+v0Ja3+Lcw+P+wN82OuhKMGk5q+XBL2sSwQvJaKuJAyXX480FIayUq9QmJ89ueK+xLhHsH2zl18PDw8PDw8PDw8PD4/XL75R03PPd2Y2XnKjKqfQmmcNhlMpV3kdaYkhBm5qm3mfo4VZsoFB6xR20nO4Fp7B7eQs1t/wbjz+M7+Kt/3Uz+LCQw/h5IUHcOmRR/Gz730n/sr7fxr/0vvfiX/u5x7FLz5xGk+c7eNct41+GNtSQJNJib39I7TSCPloD5e/9ClMd15COh+gU4wQzw4xvvUCOtUM7SaHtijWakdNqT0/NMaT4s59oS/lc7VQ4An3jv++f2Xdax8aFWvhIZVbqkQt+VNxGN0kATIOjg9mJW4fTTDMavvaPif/arJIsxG08biWaZIhotNK0G6zfmLeZxh9yS79q5sCEdosiawoWXdzjMbauHuE6XSGUoYA5pOm7it04zlp4Sm6TF8bj2vjZn35r/07tRKDFP768jwnIVLo502C6VxLWYH5B1jppBzfJ+jIINEU6IYNVjsJ1nttpueU5gqrj9VDU7BrNoeUy1Lwss3qK3ymnfE4mObYPRrhYDzFtKwwk8GF8XK2xXa3g81eBz3mqX0bEranjvLoa2fpiOEbzFg+6w/WV1g+ppvy2GGZOyxLq855rcXYSBDLrb08ZlVjy8pp0bFxXpLvYiPL1W9jtZ2gy/BJPTNjy0bPKa61jFJQ5eRVqGTIj0yLl6GJNOsgxJxp1lL8xondF/9E06sBm5BDgdKwTKJi6cggay55PjcdjQiV8UttUzRrJo9W5qjJl4TlkBFOxpxZFeOLX7+Gz3xtB5/58nX8wcc+h0994ct46fpNDIYj3Lx5gDu3j3D96g6uXdvDrZtH2L09wm0eb187wI6Ot4a4en2A23slBpMA4zLCrWmN23mM6/MEzx7W+ML1IT7xzG188qmr+OrzN3E0KVBHlG9FY/xWe9aeSKJXsyLE49k8p2O4RvXCOmX9TizcHPP53PWBPEOhTeznM15PsLu3g5z3tWSazbQgX6KE7dw2zGfds/38ws/9HGIZR1jvmhHy4ktXrW1p2au41JJ1Mq2IjgoZ0xY70cQIKzdrSd1MXgV52cSUkEnLmkMah3jHWx7Hb/25X8Pe1cv43d/+bxCzjaql1EHMftpBkqQmP8syZ5nYdknHktZvKzPVFX5o+DZ5e7yuIe2vh8d9B72cywDinIPZP3ihryTsldymyhJRSr8QG5T5J1b50uDeOwzLl18J8fvh5dfDw8PDw8PDw8PD4/6G+6TMuePB1OJIuHGR7i2UkmGAyXyOub5QTtzsirKJGKSDuu6gqjoM3UOVtzgO6wN1G4fDHFnYAjqbCNYv4NRb3otH3vUz2Dh9Eb12gnXeWg0q9JsaKzy2kdusjqrQZtZzXL52C9r+GkmCdtJg74Wv4Csf+m08/7H/ATtf/hgmL34Vxd5VFEd3UA4PUUzHqDNtKi3apYwn4bUzhpTMo5KxRn4s0H017rNqZD3WbvaAjBua6fDijRFeuD7B5ZcO8dLuCIMiQB5on4nYbTCu5a7iAGvrbWytrWCt38XW5gZW9GV5DMyltM9K1r2MZNpLUx8eBohaLXT6DL+2jtXVDfR6fcSp7cpiyz1ZOyM92pycFWJfq6+tMO31VZzcXMP6ag/tlr7ertjuQgRxizSlmDP4mPlNplL1awZJhO31Pjb6bWwz/omNFZza7GB7I8FKr4uU8WTAUVuQMljZNYGWF2I6sxy3d49w684QN+4c4ebegW2ermWjqiTGgIF2J9pLoyHtMdb7HZxcX8HmagfrLP/q6grSLuli8pqdNJxNtcuIW3aLfUXLGfXJh03ScWpjlW4FJ9Z6aPGejIdaqyhohbaB+7wOMZgVLFuOgoSu9iKWpYft1S7jtxm3jzNbHZathZVOG4EMJ6wbNmIWTbMS3B4W4kpOArRcktisGTCvNmQUMqfZH2of5I9dk7aqVIXI4OU+XFVNWRwZqNgGZVity5xhyJeKjrwbFjW+Trnwxedfws0jzbrI0dlYR29jDe2VPsJOC/3tLbTpl66sIG5rthL5yOuNVbYV1sG66o5tLk4C22B+xHavfYsmlEATtDBqUuRRm/UZI2O9VPPC9nnpsd4ubnXx+NkVvPn8Kk6vsJ2R6Ae2enjThRN45MwaTq20sE55dXEzxhPnunjr6Q7O9ijr2I8e2+7giQvreOwc65Z1OpvO2CY1a0l1yfKxWeQx+1EqA2GJMyfX8eY3PYIkDZAxfy2ldTicIopiUgab1dZnW61LbdRfYM52aBvPNGz37C8yAbKI6v681kyOmHxkWsxOHxH3VtZw8dIlrJJvn/jjj+H3/+nv8z77POmfsf3PZnPSV1ozk5FHx5jtVsaQVy6BJZH7Sufh8cPAUk54eNw3kPHDyVQ1f724S8jyAUlBLmiKqF6YtAmbAsoSn/DhcJoPmo7e0/UG5OHh4eHh4eHh4eHhcd9DGqt7lFY8aoQV2qBLF6aixFgK4fmcZ/TjMCustZ58jKCOEHG8pdkXCe8FhfZa1DIvFcazGuM8wjxcRdneRt3ZtK/rqzJHN67QT2q0woKZZ8yDx1aAwXyCl3YPUXVWUbcZL0zQTiMkxQit2R4mL30NN778CVz+7Idx46nP4qmP/z5e/MLHcPPLn8T+05/H7lOfw52nv4DDq88gnI9IWwHtEyIDSKkNqm30+HK83j+GU5kr1admXyRtM16N5xWmZLk21q6iFoowRRXzSD5o2auj8QyzomD1B9jc7OLUiVWsr7fMGDacShnL+znrOpSyOrK9DbScUchxd3e1j5WNdaysraLVbaMKQ4zmWhprjkJfkMsIYDMVIqStFP1uF2trHWxsdLC+2ka7pZkaoo1tRUsCSdGrZdjYpvaOJhiMCu37jH6/ja3NVWxvr2CD8VtJYPuCaK8QV80R6WP7rZ3OQJtLh2msbTwwL0uMSM9wlmOmWRwMow3ZxZ+MgaVc3x1OMZjkNutjezPGyRMxNjZTtNoJeVNjfzTD4WiMuWaAmOKe9PIYpi2srq04utZ72FztYaWrOUqN7cug2Tc108xkzCB9U/aZg9GUPJ3brJrVHvPa7OHsqQ3G70KbTRciiojFO8LyY98wHtGrZtmqKGY7D23vG+WlpaJeLag3NazruzMGZIyik96mLCub1aA9YrQEURS4pcJMttDPljhi+bQ3UYv1pVlcsl3qM9cx29Ekp0Rq9XDy3AW8873vQrsfsa21sU6edVZb6LMNdVcTrK6nWKMLwhxlMUBQTbC5ApxYC1iHDQq2Ac1YkrGjpvRq2Ma0/FRAviJI2aaVX2EzOmRP0t5Cmg2V0MWkTUtWyXijZfh6CWVgVZpsawU1VuIQPbqU8gfFFDFlUMxyufgxev0+279mdyyMhyyv9hJRLadpgt/8S38RW9snzFjUsM4ztDCtE4xL8kHLpTFkRXkWxJSczZxt+YjNXf1c+i/tHrP8XFi9gP6kzeQf20qVdjCN+8jbmzj10FtwezDD3/2v/j7+s//6H+DKtTuImH9bxjbSq5kfMnzI6LH8eNjD49WC3wPE476CvYzT2RdLfEjoqIere6UR9AWBDBw88kGhKZT6uuAUXyJ+4pEzON1PbP8PfacivN5fdj08PDw8PDw8PDw8PJY4Hvkcj6N0tI2WTV0GM364MRVHVWGEMkpslsAz1w4wLmIGSC2kYqAutQQ9zxdfM9cZYlRoNRne9tA2zm6sIIlSZDnTjNuI4xbDaumYAmVVyeyBjK5IUuyOpnj+1i7KtI+mvYJCyzHlOQ5vXcfXvvBpBPmUY7kCob6cpmuhRDU5QHFwG/nOS5jdfh6jG5cxuv0S6vkQp09uotVpmWK6305wdnsVCWnVTAhTNbLgUvLxh+UnEX+C0+HHE42VuaO9M1hILdc0JtNHdFLWy8DhxtXkiY6q0ipHU+YoSi0RxfE070qpms0bjBn5cDzHcD5HxvSkNG63OkhTLV4lMxbrNmQizLNm/LKucTiZY280w5htQKP2NmkxPT7bWVlqdo6obJyRivnMSZvoYZJmJBjkgRlsNKtHCnXtR6B4arkyqBQMo83LtcfC0WiOyVyzBpziXZuiS7EeM612S1/B15hX5EMZsvy8E8VmJJFyvdLMA/KAMUlcZUsUFZlaZ2RtMROtpEF7dwyGEwzGU2QyrkQtU2RrHw9RLgW/bYxNpyWc9Kev+DPyXptMywCU8d44q5HrvowiisP+oC/0G+bVkHc1+TFlmMPBFMNRhjlvyuARxDJ08BgG6LJdB+T3jLyVYcA22Rb9MkryPmvh1Wm7ImFxIjplDHEdiec85izL3uEhZYDqiZWz8Hf90H5YBeRNVbL9kq/kUVBTrpB//XaKU+sreMcTb0SXcmPGNjlj+xhNKkxmPM6A6Yw8zwpcfeka/vP/9O/g//F//b/gs5/9NDY2t9HqbeFgWOHqnUPc3DtinlruKWEtw3RFIetBvGfTR9JqYZ0yTHtj9DWhTUY20jHmTS051m5pg3Fn/BtlFdtujU43sbaruj9kP8mZ3mpXM6coJdlepnPg4GAff/SRP8RwMGHZArTIA/VClffhhx/Fv/lv/ts4ffacGef2ZyU+fnnf9tAZH+xgf/cma7Vgey3QxGw7lLunL5zBn/mtfw53xjla9Dvdj0gDeUa61Df22S+6vRZdhGev7uPpF25jL08wCFm2c4+gvX4SX/3aU/g8eZSyvi6ePWWGSMlfLYV1r87MnbvaVT3dlZ32Y2as7xNMe9kG7FdtmBLC/CSnXB5LnZ7fA+T+gAxw3gDicV9h8VhcCDI9oo5f3PWrl3XN8GjoQn3xQGlcFznOb7bxvsdOYyXiS0fgBKiHh4eHh4eHh4eHh8f9hqWOx8ZRWh9YZ4FGSDIMaHylM/rLL4jty/IXd4Z49sYhZo12EZbCkiHtq+ACUayUdK4ZAfTnZVPO8I5HTuDUShtVxjBMQ3tBSCGnpVmkRAziFE3SYpohxnmNq3f2ELRXMKtTVEELmsnfYbzp/i188ZMfQ5Bn6OoLfo31+JdKsR+HSKocSU1XZYh4DhlI0pZ9IY5WBznDatmt8zKA6Mtz074vYEUX/d8GCrc4/bFDXWM2m2EwHmM4mWNaAjnrVUtMqVS2XFKguocpO50itrAZHtOsxHA8x2A0tVlA03lu+2SIpzKgSLmopYImTPRomGF/OMXBiHmN5jgYjHA0mGCcVZgwzzJI3JJkRca0xhgMZtg/GjF9zX5gvOEMR+PC9pqZz2eYzyaWxphVqj079MV8on0SCtGlNGYsz5RxphhMs8WG7TLDhCyOFKVsyyyUyiVF7nwmmsQDnsuYwXAKY9oBlkVKUxkYxA+1Ua2dJWNLluU4YJy9wdzKOVM+dJptUSFFyaOMeVqKaDTWDJUxDsmDfZZHxosjHkXfnLRls9zyP2ShtNRYLeKk0G0Cpqf9Qchf8vjocMx4U4wYb0q/qmYeDDyXfoN1pxk0Fet1OhYfCtbt3JYtq7W8FssiFbHVrtJ/lRAuFM/qOI0MGKJKftLjsH6GRwO7LWOoMUKGM/JfJKs1atN47eeiJdJWtedLGmCzG+GJh8/inY9fxFYvQZu1p71R6nxuG4Kn7NvSB8VBZfsHfeVLn8N/8H//93Djpedx+8ZV9Psr+Ik//TO2mfm1nQHrdGYGLLUBGdckGSIZbEhfSSedkpZaW+tQIrLNaemqA7bpI7ZRGa9QzpFN2aZ4rVlOM8o6zU5S2zxUG9cMEpatLBq2mZL+DW7dvoMvfu4T+AxlWsY2mSgftjP2SNv35Od/4Rfx5//CX7DN8TVD5Xc++kVcPaoQpV380k+/B7u3rrJfHaAoc2NbRB498sgb8Ot/9jdxQDo6SYgzqyliticZZiZ5hb0h+dPu4Sbb1Yf++Cu4cmeAW9MAw6CP7onz2Dp7EafOnMVzl5/BP/5HH2CrrvDwww+g0+2afJRccEthUX7yXHVkFSu3FIy8t7xYen1vcO3gOC1vAPFgPbM9LySKh8f9AwmxpWTSrxNaTgTr1wS0vurhS7XutfgUW+/ywdnlS7Jkml7wPDw8PDw8PDw8PDw87iuYOmhx7sZOZvQwxZKDjAv2tfZizCQdnwZd2v9jVpaoQimOtZRUyYFYyXGXvtynT6AvkQOUHIdlIVAn2pNAuXFMFhcImznSsEHEtAMmGgcJyjo2N8kCXLm6w7At5psgjdscs4UMFyLmsd/uITa1vNu8OpCaUkrDVhvbp84wh9gUxNqPQkvYIIrta/vxdM44EbRMkzYYlqJZuHcpF51L8fn6RWCGCu2jkQda4oo8p5/GzKp21VAkYxbHzaZkVP2TT9r4uYw7jJNAmygXtswV65T3CvJTRrGaTrMmpHzUbJA56ySnX878Zry2zcvDFJoTVEYyakWMow3NGaahvwwHvC/Vr5yMCZppoU29FW7GtlGEmudDOmMtUxRizqpS/gXTm4UMo/1B5JQGr2vecwVblIexGinWk5g0yQgjXjCPkO2JbVXLaLvlpNQ21LK0ITvvkbZGNJG+KfPNpFlgnjnpy9kua9JVM1+F0Z4LAa/Fo4xuznLPSUdGejLyUfTlSov+Sk/8LNU3SKfrka6OjA8MM1MecYu8azveMb4t08Q8QtIgeo2XSk95VZr1ofLQz5r2QlH4Kus9tGF3RBpC9lmpo01tTZLkpxkRb3vzG/DOJ96Abkj5Md5HVEzZAnLe19JSOeOzVE2BFXbdd73pAn7uXY/gV9/7KH7lrVt44+kID24GuLgZ4ux6hIsn+njwVBcXNhNc2Erp2ji1ltrG/UU+JzUV5UOJFq9PrKZaDc6MGTLI2DJT4piMguIt60aby4P1J2PUZMb4rCs2C4odGSkCOskjFoZFUqFk0JWRQP1H0F46VdRlm+ywXtlWsxL7u/u4/MzX8ff/q/8S/8V/8rcx3t9FW62e8jNm/IiuLgt86jOfwu9+6A9x/c5tXLt5C//oAx9ARzxLY7zx8TfiX/83/3f4+V/98+ivX2DrXsHaylm870/9FFpljK7WV8s1A8kt6WYb7audxQmOZjUu35zixpi0BCu4U/ewjz5G0RrmrQ0kW+dx+tG3si+l+Ft/+/+F3/7tf4ii1PwvJyf1XLDiqn8ZdEflde3MwtEt73p4/KDhZ4B43F9YfMLgXhZkn9d3BO61wYlaHbXmJcGHmaz/PT6g3nrpBN5woosWH6RLAe3h4eHh4eHh4eHh4XE/wY2bpB49VmK5M/1KCRgglvKY4yipu6RgLZMYl28c4vLtITLblJojMAZ3MaVM1ojMfd2tMymd0zrH2x48gbNrKUKtg08/W/OfThtga/khtFs4mFS4cn0PUbuPSMprJmybajdKC1L/ohwf4NN//GEUWW5LCClfbTrd6nVx4YFLuHn9puWdpKktO6Mv44Ogwkavg8cePIfVdoOL26vYWunZ18s246NxY0J9+WvX3wav5pf03y9stByQb+SRKfxVSyyzqz2n1FxywPxYWNXnUtFuBjL+K67qzZTvqnOeL2IswrPu6F/rC3peazyuMbsUsYojR2br3+IpPYunOuW5M0To3F0rjPYccdc6qnmoTToadDw2Brjlq2yGAVNdQuFVwmUZXDrMd9Fm7+aj+wrAo+p6cZdpSpGs9J3TnaCRmYTnjVOYW3qLGLYPCNOWkUbGmAYyesgwswhHOo0vlh0z0pHxoPSkNF/wVXtSmBM/LX3lz3IrXSuD4rs6NI0IT2SAVDlk74nooXsW7lWAFY19jBSRumV5zQTCcql/Wi9Hplk+u7fx1Fe/hFYSoqelomrpc9zG2zJeaBP6Myc3kLBPk0NotSPMpxXyeYnReIbJXLNkCgymcwx4PtZMnHmFeRVif3+AT3ziE9jdO8Rjb34rfuYXfx1blx7HtYMZnrt1iAFFk4xzzgBGepmnzTCLRR3rMptju9/F2fUVXNiIcX6ri43VLnJtKF4EOLfdw7mtVazKT7OcmN6ZE12c2OpgpZdiXlJ+Fg0+9k9/B//4A/8f/Bd/5+/gyc9/FtnkiGUpzJhSlSXbI69iGfJCHIwn+L0/+BC+9OSX8exXn8Lzz17BO97+HjTkxUPnT9pG7k+8/d3YOHEWO3tD/Pwvvh//2v/qX0PB9rg3miNpJ265N5ZAS6INSNf+LLDZH195/ipGojMmvXEbVdSxNiWDScj8e50OhjvXcf3rX2aLa/DEE0/gwvkL5A1bKduXjMUyhrxMZtq5c+7v+4UazzJN/VoPtrZtPXPRjuQv6NrPAHn9Q+3OG0A87jMsHuQLwSfodUAC0QQlsXyFk3yM6gLbnQjvfeNFnOnyNYXXTph6eHh4eHh4eHh4eHjcX3AjIaf0XY6tBHfUGIpjJl4E0JJWHFvpi/U4wtev7eOFnSHyWF/yO8Wvtj03xW0Tm1I4qrVRcI2oqtCq53jbAydxejXlfc0q4IhNR2atiRpS9g3yBlduHEkNyHwjM45IaerUXSKnIS0FmnyMj//xh5HP57aUlhQhMnJ0V1bwxBNvxbNf/7pTzFU1wlDL2GRoVRNcWk/wm7/wp/DQRoCzm30S12aapFkF479xQHnq+G3cjzM0WhZXrA4Wo2ee2pmUgvK9W07+LJWGpni3enbxlgYOZ3g4bkPmeCnDhz5AV1zLw7TeMmoswy/i8N/yEE2m8BdtzsBg+S5o1L/ydFCLYP6Kq3KIFhkMrC0qDYXRjyubUrdfXjjDgFJQpSuMo8WVmrCDo83dJWWKTiiMGR1kwGDjdYrfRahFOZf5GCelJBaPFnxq2N5M1W95KKjj5+KfTr+Wo5Vf5bOjFiFaXDvDgQtzl78W33FRpGqWy5JnVjoGsKi6p58fMcgGFsRpZnQhw5RRa1UgjrCWgxKXvyYl/5P47B9/BNPhEU5traPbipHEIUqG1Ub5dVNibXUF7U5i6R4OJxhOZhjMMlvKan9W4SAH9uYN9rMAgzLCIAtxOKqR1zFG0wq7R1P89C/8On7u1/8ihlWCG4M5nr99iGnN9KOEPBInK7LaGV9kSNV0mjYz3OwmOEl3djXGejsi7cxjVtu+I1v9BP1UhrcAE+ajzerXV7RcF+uKgm40Y9lZjg/8nf8Qn/z938V0PLZl1SLmE1BWaS+bnPXa3j6HYPUE5olmaVFGsfDXnn8ez37py6gp9+ZHQ/TiBu946+OIWwmquIezDz6G9//mn8fDb3oXJV4HR+SB5rzlZPKYPNkbV9gZiz8hxlWE63tDXLm1Y0thaYaL1P+aSac9eLS8mtpdp9fFaOcabj/7Jax023jg4YextraGyWSimkS73TZDiFXkAtbSWP7jFrf8/V5hjYTHZVpORqmOSLC1f3fXG0DuJ3gDiMd9Ciec7hWxEog66tdekiiUJZfjcobzfPF93xvPYIUPWj5GFzE8PDw8PDw8PDw8PDzuL7iRkJRCPHP/hBtLLa80jkLj9lLQsj/zIDQDiDZC17IutuwP72mZKilaTfklZWUjpSbT4nlSZ3jrpZM4t9a2JW80cpM6qtDn6e0ejuYVnr22iyJqIUw7KGvYUkwiQeFqpaMNupsCdTXDJz7+UeTTGaQ+lmJS93trfbzzXe/E1778FTRluTDcNDxWSJBjs5fiT7/rCWyspGhYjiLuQ3cEG0uaQu31D6cwX4yYVVcqtuqLh9DqxvHDFOXGEoV1hgi7Y/5uNoSNtc1jEV9uoWy/a5xYxHG+8lfa5mHp6OTutc7NubiCO7dT83NU2NUijMKTPjvlXbvJn0XacoukLPyy3OZvvu78mzlLWTyxpFRe5ePScMYytXuGNaWqnMIt6GWkRnySxyI/MxAqXMAGbokulbc8l5/QRLySsUP1tDBkKN7iWpfqNvJVusrBQVyQv/Jd0uDqw/qllWHh/yOHa0Hi2d32J+snIRmh+RVhmeF//EcfwB/89/8dJod7GO7cRDY+QlDlCDSVIp+jyWfI6bfSinDmxBZZyDRZIPsLExRMsyT/6riDjH274HFSp9gflzgcV7h9MEET9/DoE+/E2UfeiDzuYha0cWc4w7Xdoc3+0NpWjqeaYSKaeR7G/E9sU/KAdJ5YaeP0RgdJ1FBW1Rjk2lsDSNMQMYsle8lgVmE8L9FuMy6FqNIc5w1G4zEund3C1ReuYJf5ajm1uWa5pG2gs4Hzj78T7/3lv4S3/vQvuw3Jt84h6PbR39xCoj04ogRrq2vY2FzF4088hqjbhpZRk0yTCj9MYszzgjxmhYdaRqs0erSc3HBeIwtiTIoaL946sL1KlnueyIisenLNRvUjHVqA/OAGDl98GqPDfTz55JfwRx/5CL76la/gzu3biOMY6+trdlTzcnD1YY3N3PL3e4Ua+71piVpvALnf4Q0gHvclnBA7fhFygk/iV4JSL1h8GIQhX7RrtPni/fjpPt72kASc29TKw8PDw8PDw8PDw8PjfsRSv7NUCh3re6RicjClEMdSUmFKsTTj8Zmrh7i+N+M4q8uQsSlYtcmulIUWU+MwVLzPBHge1wXedukkzq+0kdZSpQcoIjqb+VHjhdsHmNQxmqSNIElgs0OksGLcSilyPCcDSMV06jLH5z/zGcyGI9tXQPkFQYPOSgfvevc78eLzz2E6HtkG51VdMn+OFSMtNRRh89RprJ+9gFnUQx7KALIoN8PcPwYQldOV1akqxUN3Ll4t3TKE3FJproNTvjs/M4CoZdBPsyQ06ydc1D9/7agQd5XUCz+FUbvS0cLRUz6qRwu0SHd5xxkTGJ/pKC9dW7DFr66V1uKKzsVd6ghE7DKsK7+i0MfKyT+7L8/FPXMql0vH3XS4q3sQWQvazF/OmEMm2E3nLyicpWn5qL0W7lplhpbQUhwX0rnIlTew1q8bi/vsX+wbSyOiuNcs8jOeil6eWwzGl68ixmYdslOx4kcOZWl1S6jNVEvaQkkPWxgMO9dfwAf+y7+Lg9vXkDYFoqrE/rUX8dJzz+D5r34Rt5/9Gm5f/hqGt67i3IkNPHrhIlrs12nIFAoZKzRrjLJIWp5AxgBnRLp6e4inn7uOKzf3cW1vZPvQlGkPB/MaV/eHeHFngNtHM9uvRfsFia+SY2GjnVSc2U9LRxWUHypIUOc4vd1Hv5PikDLoYJrZjJMxhZ021x9Np/SrMNZG52WJrAwwnuYYTDKMsgzTMsPJM+fwxre/B7eGOXYnBcL+JqLOFs4+8VP4yff/T9DduoSqvYXumUex9dCbcO7Nb8Olt78Tb/nTP4N3/vTP4jd/6y/j0sMXsHlyHSnpKMirmG0viXO0EsnrCm2KvLiaoC02hwnLliKI27Yx/v5wissv3TaDkTbvpxi1sslorHYUR+qLMmizvY12Mbj2DAZ7OzbzQ4aPJ7/4JD74B3+Ay89dxlve/GZcuHDunr2TrLbtz50vf79XqE3fm5Y3gHiwninrXE16eNwncAJsKZUkCJcCy70ASI6bAUSPLl60kwhnt9aQMo5eHDw8PDw8PDw8PDw8PO5H2JhJA6Y/CbwvRYPGXDJCaMSlte21ybhTcclHStrFOv1muFD4huMwOafmlm/FdHQ8VtAmmBcBXrp1gEnOMV2rY18xZ2VlyyfZEkrM9+6MgSZA1EiRFWNtZW0xw8MpwxS24J2QaVx8+FHSGqHQEliR228hqwPsD+f4+ot3ULY2UKd929xYZTNSlP4CS7/XK2xmzqJWrIIX0NhanwjqjlSBpl5aaMutrehuwzvkjxT5y3uCzrShfcz7+vBwmYfiuVCK48K5vLWhtVt4R6N1+SvsvdQsKVLbMkXsPXfVbs3WQH/lFzNvHZVmog2kSaNtuG1O4ZjDwhoXstgy1tgV/Zd0fSMsIh3bdiBjnM7VBlVWpaG0HQ+tvdPTGSNcX3D6CUdnXDeORltsyLY9p7/6C29aqFc6p9Q1PhqfnBMdjqcLHspZucUjR+cSCuX6jSu3c68OXHNhTZKUSrwSbeyzDlr6KcOXP/9pzEeHaNc5OvUcnWqC1bhBMj9CPNpBcfs5HDz3Rbz41U/jq5/5Y6CY20wvbcYdSsHNdDsxpQP50SbTe60Iw8EEL73wAkazOaZkTZF2MA1SjJFiEnQwqlMMixBTEtaEKWmJ2f9Vt2bWZVuRiYppqt7Ja+07UmcTTIcHvF9ivddGv53wvOY9oJ2G6KaRMz4wbMr66CakJW3oxzZJutrdHtL+Cs6/4S3407/xl/Hr/8Jfxy/81r+M3/hX/gbe+et/GenJBzEKO6SvhTHl3YzHsrOJabKBg2AVg7CPMungXe96Ag9fPIOzG2t487lNPHaig4c2Yjx4oosHTq1he6WFC1trtl/JiX4LaVWQNyWqvMJoOENRqL1oOTdtqp+wsaXko0rNllNp83nXPzvtFL1en75suaX2VGrQarfpOtjd3cPR0RH5pjamFvaNbezVa3Uer3e4VufhcZ/AXsQXItX96gViCZ7T0x62/NHrVL/TwrkTmwgrxeINvRB4eHh4eHh4eHh4eLwOce/Y4PvB63fMcJdD34RVS2WWjBZuhkSoiSC2sa9maARhzrHWDHWQ05Wow8b2OZDBwhScUrxKm0h/GUOqsEKpde7tPERWhrhze4iq0rIzHYRhizmFpmDTB+syXGjpGS39Y9/JV5plEiOuE2z21xHrq+emNCr1FXMWpKhbK3jg8begjFMU2g8iTszQYcu/zEq8eOcQR0WEeZMwXbdW/9L4YYYeU0i/vqGRsRTmy02pj+HG1qoDqZakYjdfBpGTMSEyY4QzKsi9/N7S6CClvWKrFdBZPkrRxZGi3pwp77UktQxo1mIs3DJNo4TpiFZnVFE75A3BlPrOkOHuV2wXdHaudJdxlmmpias9amUI0iA7xT33XKmPjQcOvGl+Oso5OOOHjBmOZt2TAURq/Yb9oLFZG4syGR/IF7Zp8cbokwFkUa6lAcXgrATunFBcpWM8J6+cIWSZ9oKHVs5FWZnOcXmX6fDI9r3g7MK9OjCDqP7IB+374za0p39do8jm+NynPoXBnVtoszytMqObo9vM0cqn6GtBq/wIYXaEanqIp778BQzHA9SsTMkKcb/Iprhz/QVcefqLeOoLn8Blhtm5ehmTg5uoyzErjW1N22lEAWUFneRLu2ezzmrts6EWTIJqbYIBzQSRH10doUWvFtNfbWY404+wTpmnPWUf3uzS9XGun2KTYuz8egcPn1jFYyf7ONUNsZHUuLie4A0nV/HwyTWsdTq2WfsK08hZ9TLA1KtnkZ56BPX6WczjDkbMq0hbKBLWaKS6Jt252lyPvOtjXrQwGhVm7OlHEU4lEU6yPOdbwANM9yyJPd0PcG6jhdPrXboOLm62cGo1QUyeVpMxjvb2EUnu6WNhzWyh7K0pE9XSxAeUbFM15WtdoJ3ESNKUYph9R0tdkb5aXxfzpNVqIUnEJ+Ju+5VzcGfip4fHDx7uKeDhcZ/g+MVKQtU92J2zx789/PUFgIS3XlRW2im2V9o815RTPnz5sPXw8PDw8PDw8PBweOVA/d7BvIZay/PjAf4x3PunU0PdG28Jpf3N3L1YKsO+26Oc8hON99LJM2kreF/vvi78t3I/KCzL/s3cvVjSLaffheLFnLCkaRlP4Za0Oj7fnRmwKPdSKWvfrzdOOa6vraUsfHl6Ls2lsnDp59KTxzK8/GKUoXNu82SnlLQUmnjhjvluykdLc1ke1x6kpNPXz0VIikIpnaSiXChBLT8pUV04i76gd6HW5JnGNu7rddHt0pX/9w7Fdx+Uua/NRbflb4UTeIflVXZuA2bmx3tBMUWrOEQ3mEB7azSkv4pcuUorgyuz1o+3VJiAjCf2tT2PRRRjSt7cPhxhVvK6jhAlKRoZPvSVcuT4KEJcGXk0dogenjOfTneFV8xF9MjPCI8QRC1snbmIsLMCbWaclaSPY8FWEvNehOE0w0jr3gfaB4Q0WQJKWXTq16UnyuVezxB3zTixKLe4YIp8x3zntWCC1YQqwbyXYVwrlEFBl/Jx7XfBPfNnO+DR2qyFWdxTiqyvZf2+HAqsuMfh3VG02q1lCPt1cOFspocdFVbxXNhFNEKt5uU+S9qVxzE/5O5N38HuL+LqzPJaXAnLK4dlWOWoOzznv9Hogi+gxv0yD0JyRgYUl4qOim+GGwvLuyaPHA3mrLzunpx+zWgk3wXj3P1XAZbtscyyXYNqlc8ZiiaDI1x97rKZHFLKyFSK9lqbj+fotVOUcy28V9hsi4AyYjo8xGc/9XGel2gYppWEGDONf/f//H/Ev/Gv/TX87/+3/0v823/9r+Jv/Z/+DXz2D/4hjq5fphDLUTBuqE064gg5+WUmJemEKCNMr2SCRvJQMz/4S5kkOhU3bgq8+ZEz+M1f+wn83Hvegs1+F/PBELODAXpMc3s9RZI0GOc5xmWJ9moXJ85uIWBZlEfM+krEAfJCXNih/BsVPEm6qNMO6eFzRsYIyqmG9M1ZtqoSf1iHVs8h8iKwWXM39w9t7xE9YfgEIo0Mp8Yh/RjP2/STixmNrEGLAVfpIRk3z2ocHI5JE59kVl66gHk1uRmfId5ryUDSIUKjtIWQNGq5LPeMdC2sKDKsr61gdWWN6Uru6xmhPq27gipd6f8wsMzD436GkyYeHvcJ9LDUwEZOgpZXdG7arpxeLlLdLzNb+/DUxhralON6eCkE9DDz8PDw8PDw8PC472FKBhuwm6ZmcbV0blC/VEYv/R1cHPuV4teUvy7McpCumPemdq9b4pvd+/ZumS7j871Xm1A7t1CY0Rk1jZzCStHhnBT5x86V4fvFK6mTczxbUunwSn5IoSK+1U3MKw1pHY1LJaY5C6slO8TrYx4758otQ4TjhXz0VbT7wnwZb5mWKDA+8Uy/8nP1ZtS4sAsaRX+BxNZ/l5lCiiJ9je1Y5gwggbl78rdfpad2I8cS0UvLORVhbIYCjULc19vua3UpMt26+AzIsptjKDOKSM3FtKU40xfkqks33lHa348KYJG20csszC3rjCnbl+xadgcsP/lAWqKYIaY76E6uYaseol/NENX6PHkRt2Rs0qev8VtkUlwVtoGxvjZOmghpmLCcKXYmBfazBhOVI+IYzhS1bhkZpxi1WmV67ptkKUPt+3FeVFGE7uYGgjQxviIS75UX+VcAK6ubOHvpYZQyytQl2jFrpJiTrgJVwXz3Dm2pF0Zxbc8Kz/xJo/IUn1W/5nRvAQt7j/txxXEdv7IQ5LnVw7ETbxyPGGcp3+zatdG7xg3e1+wfZ+DjOZ1m7twrj8y4Yn9qtwmvpQ52BkTHb+aiSllALWDZ/nV0aS3uMXnXQ5c08fxlju3Kji6syTjrV8x/4acc5JZGG7klHD06U+tzzskOk053w1sc+ttSSTw6GtWn5EiXOfFuwT9eO96r7YoHuusMoMc49ms0i8l4taRBRymanbxwZTw+6mt+xRbtrm74Q+eWo5M8UfqvBsgflbcKKS8itFiWkH1R+3yofz791a8gn87IR/K3qpFXFeqYspJlnfNa+wLV5GupfVxZznI+x5Of/gTq2Rhtlk36oGI+xkvPfA2VZjnMBgjmB5i89FU8/8e/iy/8wf8P9XSIVNVVZvxhRkmM0gwAlPCU6wnlWKy0pPyvyUXJZ9WWyeIKaTvFic0OVrsJyrzG3u4eBjLijqbIphNk2Qx74xl28wI38xx38jn2SOfuZIqjrMAsr0z+yCgxyxtc2znElOHMqK7qp9xT7cbsQ7XCacaFjOW8V2jvI8pjelk974xGOKSs1fwpzcZTZautVGGP520+U9xSbU6usdUpD5arZB3sjjJM6wQ5w6s1dxLytJmSrgIhI0nizlnyjHUmuV8nLaDVdnKa9yISEZDfLAxOb29jbX3NLSdo7VL9zvVHFUq9V3d+oLA+oIp0feJVbNQerzLUAjw87iuYlX7xouRkn3upMcFLbz30Uz4QunxZP7217l6qLRzFt54gHh4eHh4eHh4eHt8SenHUEH6hYLLrl8P58MVTyga+m0rFpYG/3jfdcYllSIWQasUpsN35sZ87X7pXXt/rf8/HP6Z40DuwexdeQn66XKogjg0A7qghpNS+S9p+kPiTeCbYF+VCI4UgD6YFslh2TxvRioeizaXl7pvS23yP+as7WlbJLcHkeCNjg2ZwiEf62rzWfSmUeK1yi/eKp+TINYZ1xiApH93yOYzJOo3JK80mdzPLlacMFg0qLb9i+hel4vxFqaO5dumZOolpMF5ijrlLuaYwjKf4y7qUMSUkL6RM1abFy1pR+nUo5b82FVfejk6X7/cPx13XqlyO/LUDr1lm25CcNNsSUXWFtJljpR5iM9vBmewOzlcHWB/fwlZ1hBPhFJvlIU42h1ib3cBGuYPN5gjt2T5aYYGCaQxmOXaOjpBV4rnqx8GU32b80PnCcwHR4zhLWqPQ1tE38wxpq6sKMes9JI3lvEBvdRUPPPII7wNR5DZot1pnIpU2KT4amrHDldTj5SB/VQ/G7ZdXgmsldKoLulfW091WpD6oVs+2/Mp6VDzXa4/dnwiTDepk6g3fCNHiWu4rneuJL4d8vtH3T4QIVt46LmBlkPfiegkr693wL6f5brktGdfjjtP8ZjQt/Cw9uXto4PGV5T3Oc5nmcf04Trz8ufCjhvKuNEuBtMaUyzJy2obbdGVR4NpLL6HIctIrIu9pHyySWzqLJ+z3ZSnDQIQym+PqlecwPdqHLdxU5cyA8aXo1wbqdYmkydEJcrSqOTAdIB8c2pJOcZ1THjAO5QWFh8l4e94wF8k45aUZbzY7hM+MUgY93t/aXsfqxiblV41nb+7iU19/ETcmFcreOoqkhTJiqvbMSZiGe+7IhNJECZ9FCXYGcwynpc14e3E3wK3DOdMNba+i2sqt+uOzQHXG/EPG1RJVOk9ZdhmaOyxfW8+AqsD+YWZLUcl4rNlumkEyLWrcORg6QxEpkJHCLaFG+RdHmFUlru7touA50gTdfpcH7ZtSUj4zO8arypJ8YQtldHvuiQamX0les970PIgZX4aVEye2sb6+bnyzejbHhMhNB+fzw8MPM22P1zrU0jw87ivYwGUx4DMBSEGsB70DX4L1xQCFdD8NcP5Ez0QkvfzkDw8PDw8PDw8Pj7uQQurlA/cl9PbolCNOSbJ80bz7wkkopqlNsFCbMJyUDscvnC59l4eFDiJzy6WFKn29edfpK/mle+X1vf5Lp3QaVFKS60jnFPPHlNkXxPoymS6oNWMhXbjE+f8QYCodsumVHF1C5XY45oz4rBkRmumw/BrcymGGFFPjmJ991aovdDUjgrw2BRvDaAmRCi0UYRvzsIMsaDOO9paI7WtWW3ue8d0X1G4MISOFM17Q2awHV8/auDjlwKGl5Uyq0s5j0qSxhnhdhhWPWk5Jy2y5eucdEqdNvEWTZk+4pVVajNstavSKEp3KGViUf866zMIW6U7RsC7COkJCp9kMMZNya/vXlpa+AK7kQqXrlvR1M0W+dyzrRmUSE3W8O5uFjSgijXJaskZfFMuQQ0rRbQqcaw7xxvoG3phdwRO4hV84G+FXHl3FezYrXJxdwQPFFTxYvYALxQt4IB2in9S2GfH1ndvIpGSzXcyVMbMjX5dKNMEt+eKOx056OdZ7GGF1bY3kujDyi7RsDOtoPpug2+3i0cceRRiTaraHUl+Tq6QsXzbPMBoOeHWcl4eHxw8f6t6hlrdjV6yko1n0ad7B1ZdeQp7n0vcfYyEbXC/XkTKJfT+U1aQucbB3BzevvUTZ5DYj77USmwwmo4aeHZpJElJ2yRWzGaYHO+hoxp3kr+QYz22ZRGXAMO5Jovl9mhPiZPOcLpeJhffX1nvI+MD45Ndu4Q+/eg0ffOYmvnAwxU7axajN503kZvXomRpXsTlKdNJLf2ayO8kxrBKUSZdpSnrH5AfDiw/kgfsUgWUW3TwEpDHQDDjKtVZdYL5/G7OdaygPbiHbv4VbLz4vRjINPvMYXs+y3cMBPvixT2MykXGEzx0K7UjLfik/hj0cHmB/tId5M0GU1lhbaaMVhuApgoy8YH4d0tNNYvKHz7/SyXsZU/TtsHjVMJ1ShhV6nDt3DpsygLxMuebqzeHe8x8Q7Jm3fPbp+EPIw+PHAss3SA+P+wRumCQn2INDgyUJQmI5HVazQDa7IbZW+J7NMFqjULM/9LDx8PDw8PDw8PDw+K7Agfc3vkY65b1TIOudVIrybzYwP35v1a+u5BReb7YLc8V3dbS34YUyQLMCjt+F7eCOZuRwzhkR6LkwiLgvlReBfyR4eV4qgxT9psyw8vDP6F2Gc3xcLuli5RWf6ad4SZ3xmDMdbUAsA5CMGzHPXXkVT+G0+bCWwtWyUxozuPyUkBRmi3zNcuTiLWfVINQ98XtRv8p5yTPGlTHCjkxrQZ3VvaubZbkE+TMdlZV5aGkbrdauJaGs1syAJbc0oGi+g/6IRV3JkCPeyFDisOTR9wrSaWVfUr5IkY3GXYX8k2JOM2BkFCqhZa3a1Qwb5SFOFTdxMruBd2xH+KUnLuA33vUIfuPtl/CuEzEejg7wYHAHF+s7uJDMkJD3N/cGmOTMM+koRab8jfR/qzGaGUjoZOxYW1tzisPFmM6+3K5rZFKi8vrkqVM4feYseelqboksyzCWAURKxoWfh4fHDx+uv6pvU0ZLBlrfp1yOAxwc7tvsDsHk3T3HpYxTjNj2CmIcdt6gqvDM176ETgyc2erh7PaaGUFS3jNDCGWCSU/mW2jm1+GRLW+l/X8ke+yWHP/MmGr0UeJR9oaUxSYg5BgoChOMBg2+8KXb+OJTN3B9kGEYtDCi/5AJZXzIuKWs+GypGZ80mmNcTbbQrImA/iutAN2gxBbF33pSoF8PsR3NcSqZ43TKo1w8w9l2jjOtHOfaBc62MjQ7z+PpP/rH+MP/5j/FP/37fxdf//zHUU6O+CyjlCapWlZLrtNq4dKFC+h2EubL58WCidorpRs1OL0S4dJahDefXcN7Hj6JR7e7mN6+xadQgDZ5o1lyeVm6j4j1cQX9bd9czZRhOVUesUpGkBPb2zh77hzrREvZqXaUmXtq/Ojwo83N47UFdU8Pj/sGErFuoyW+mPPCHgAmdN2LvHuQRUiTAOe3+hT6fKhJYNP55a88PDw8PDw8PDyWWLxB3nXfemDNkG6cf/e903krPK/4sqmvRe9uGr2AC+sU4pYT31v1Faop5m0mg1ua43tyUv5rJgTTOp6lIoWEnIPokru7Zvy91Hyron7fWNKx4NECS14LojeRUp3l1wwM43ujOtA3p+KhQolfi+WjrJzO2KCwMigkdYFWM7clT2xvQDMGVeRNY0p7hY+bDO1qjrSeMdU5wsCF1Te/ruY4lqi1jJJmxLTom6IItIwWkGu2R+ScZpBIdS4DRFzRMSul4Qwvrt5l2HD39SGWozTjOCSLGxQxKQtVfinyWrwvgwbDBEqjQBVnKOnyKGd+mvHByDJ4NPqymOHrtjntO6K19Jf7EnxvcO3QlV8tQVikxzZi4H1neOB91VNNmqYTBLMxuuRjDxOsYIzzm21sdIG0mWArybGaH2B1dgsnql2cro9wMixwuHOAedNGHWvN+BZz1P4G35r+5YwQHZdGEflIidpb6SOMYltCxqgnXXafda2Ng3v9Pt74pjchz9m3Im2tHNoXy8V8hsO9PfLNpS1Yf/5WuOeewv2JYT08PL411Hn4zLONvdmdI8rEZR8v8jlqk+t6HqmjLZ8bzulXXbzhA6GpKDmYQFDkeO6pr2Cjl2ItDbDZT7G9RrlAuR4xDal7tKm3PootyhKj8cTkehV2KFcT5s0A9qyh0/OackUz+fQ8jSCDunPaiSThs+D2zSFu3hxQbrURpz3KmDVbQipm3qFm+vEZJKdnTUhHiU9ZRVopfsIyx6lehMdOtfDE+TbeejrAL7zlFH71bWfxq2/exq+95SR+/YmTeD+Pv/rGLbz/rafxZ95+Bn/2T53F+584jYvhPoLrX0Fw+ylkN57BdjvEWx59yJYTE3MkzyRNt1f7eN/bH7clqsRaK6MYwfeEFdL4jvObeP/bHsJf+clH8OvM94FuCw9srCMqC/Io56OGz5RE+4MEmNOVJH5EeT843Hd8ZR2Jt3oePPzwwzh79qwtmbWU4jo6GenqbOFjZx4eP2iwZXt43D/QC7MGGhrImeS34YgbUjk4YdtLQlw6uY5Y8xkprBXinu+pPDw8PDw8PDw8PL5L6D3y+F3SDAz2JqohmXPfXLkrXzcDQTMWpFTQ0dYuX8Rwx+/UMSeSoeWJbImiRkptp4Rwioh74Tz0K8OC2xjXfbv56sCVVgQtFdLOKKP1090MDmdIWoaTwYOl5qlbykr3Y+ShlgELWX7NUJCxwylqZDRRsmXoDBMySoSa4cEyuz8ZjBRHPHTc1HrvJfNTekv69GtLi6mmmJYZQOgnA4uMJtq7Q/S65cg0q0OzM5zxQ2uoK74zkGgEogGJFkDRsiRSts2RYoZ2PbO9NWQMEt2adcHY/FVabEs2+2Mx0tEt5uic49v3DqW4NH4IOhMvBJd3QF6IHpmktElwORuhzsbQJukl+Zx2e1jZPIEwSZlcg1YntY1102qKdklXTJDWBdOMMCsj3l9FVbN+yb9vhm9q+Fj46UrxWq02uv1Vo16fbZsBRG250nr6DdJWBw8/8hjiVIYW8Y/1KONUVeFwfxfz2dTS+rb4jgJ5eHh8W7ALq2/qL7IpHOZlMwycLKBjH3a+Syz9eZDsZTjp8yUNy2yCnRvXbBN0SapukuDhBy7Y/iDaq8iBcosRmrLEfHiEJp/Th1KDSZqJnUJaM0okRyTfXQzFdU9FyUYFrijn80oxEoobyhcK9otntnDm5DrSGPR1z14Z5PnEYUr6qEHLRwEdPlO2ex2cP7GO1TTBKsP3SNOfenAbv/7Oh/Fr73gIv/zWi/jFt1zAzz9xET/1htP4mTeexs++8Sx+2s7P4v3vewIPb7WRzA/Q4XPi8Ycu4qHT2+TJQlZLPtozz+2HJDJk2m+0/Jaep1qaK4qx2UrxhtMbWOPzphkdotcucOLMBqJuAlsNMyxR8l7MYxpLnma4fvUF3Ll5zXglPtcVw5QFHnn0EVy8cMGWMxOn3NPJiLFfh+WzxMPjBw/XYz087hNooOmEqpq+BO4rxSuv+fDrtSJcOLHCQUoGraUYafNDPjy/1Uu3h4eHh4eHh4eHx8uhd01npHgl3Fso75qy/lhR7RTXfE+V8pXRbFmkRjM+FMIZPkIpwpvKwkuBrj0sSjt+Z84MBJBiX3tGOBfpnHk6o4gzKTiFjoioSY5zblPtkmQulUXfHxZc4Nl39o7t+EYeSYG9cM6QJKdyLfx5rmvnt/R3cbW57DjpYhZ2yGvNyNC+HYUttyRllGZbZJGMJFKEay+QlOGkFCKftUQI3Frt2ny8CjVDo0ZOV5EnKovNImGRQqatDdSVX8mjFE4ytkQVz2vl3UYF3VM6MtA4XmuUErA+nBmF54GtLs/jHGE4Ze4jtOsB3QQd0t0qSWGZICo100OzPtwQX3VVs66qqGD6OestJ1FaMuY74/U3B8dDpHOZggwrOnetZVEvRndIWp2Ci4xAMR+hyqZsXDFmQQvp1gUk62fItz75kwJJG0hbjJOgcZYqxDHPY/Kf9+aljCqJmEG+udxteRwb2znIf2kA0dGWYSF0LSVowvS2NrcRsv3fjctwRamZRMovxonTZ3H+0gMoNeZTv7S+AGTTCfbu3LFzVdO9EA+ccdC5V9w2uL68uPDw8PiOYX3OepXr09a/5SdFvvqcSZ8FXtHJtPfPsSFUEqpCMRvjcG/HjBi9bhvvfuefsq2FBAWV1JLFpCkzVON9dv4hn4mUv1oKUQZoPQdJgRkL5OxZrY6vRBiPcr/WLBHSJ9nXNFOsdEq86aFtvOdNF/HAdhcdGd0pt2OGlZFVZdEsiZTpdZoYXcaPSUsoGUVZxCz5yOWzhX4KJ3oTxknpNLNFy1DJyeisOK0kwbve/lb8pT//G/jJd78TP/m+9+Ltb387I8nY3mA6nWE0OMJ0NKRsG5NG0hOzHCx6zjz0llFLFocxsqzAU1/6Oj7yoU/hd/7Hj+F3fv9D+OxXP4ubBzcol4dYX0twai3FVpsythigGN7CnWvPYTrct6XFlLY402538NCDD+H06dPGa/cBA8tmMlbnDsdnHh4/eLi3Iw+P+woSwU643itshZAPmBZvb/RTbHRCGwjpxd09PBlenw94eHh4eHh4eHh4fBu4N85juGv9SrXtjnoV1duoLeGho/yk9Fgq9uXoZyaJxbmGcLZvHc+X19+ZU1gXx3Q191zbLAnnyesFHXYm5ZKMHVqyQgogNwtBFLn734ilwum7gcv5XjgqXnZHfFHOPOrLW82acKp4KcVcSZbKFkE8koFIhgt5ai1yKbSdASWBMxxFlp6UR4GU3lKq8U8fQGmmh+pFMfTtr/LTxuN5mCKL3HJXSss+lmKocDETQ1+8yghRN8li2aaUHGOIkOlE5cLYwbgMI6+44t26QMwLzRrJSbeWESm13wfzKxWfdFo85cMw1lxq5lHLoNVC1jBM2LJ07TveQAq7OY9aVsWmtBtfSN73DWWtpiJa7dx+CfnxfKkY1JfblmGdoc5naAp9Za0ypljbPoekt4mKhapL8TlA3G6R/6bCM0VdmfA8Ji/IHy33BRneFnmZ8WKBe8+Fb97+SBHTXtvYZJqaKaSqZj4Mm+vrb6XLdFY3NvDGt7yN9xmG4c0OwjBVPsfO7RuWzivT/17au4eHx7eH9W0ZI9jFJIn1p24rWROmKc95suj/y14oI6Tu27ki8r6C6Nlghg7K2p07Nyk7K/R7Pbz9bW9D2m7bxuCymSod+/C1zFHNhsjGR/TgE0dCt9GzTzJAAY0og82iYHrafDzic0A6pE49xSoGON/L8J5HT+AnHj6Js+0KyWSEZjhCMMvQZJToeWEbhDeMpyW6gixDoucP09UTrqXZInw2tEm87UXFfJw53p5k9sGCnkR67iQsn2aQKG6n28P/7K/9K/jb//F/jL/1H/z7+I1f+yWbcSfDz3gywdHRAcbDI1TkR1nMUM3ntvF7LgPRaIi94QC7B4eYjI6wd+slPPmpD+PWc1/G8PplBIOb6M/38fhajPe/9RL+hZ9/E/7sOx/AO8738IbTXWywnAHlvYwbdcl3BtaT9li6dOkSkraM/8Zl4+Wiqoh7zz08fjhQ3/DwuK+weE4tHl50erNdeGoTqi6fGudPbAEFHzD6Cou9pOKDRl8cmBXew8PDw8PDw8PDg3jlEF5YqH95xuO9747S3Nx1+lJTCgy3BEWo8NrTgdeWJsNIBaI7mrVRhDHKMEUpxXvUsvMmioEoogt5zjhSBmmZEGl5zOn82Emhe9cx/fKui9wsBJ4bJbx25ZI62ylZYt6Rkl/KHTkpYew92hQZKo4r59Jv6f+dw/Fs6aSk0azsJft0qS9lxTtRJLobzarg1TKcONZUWoudtNHPwDDLuSr2xSn9NTtDzpTxcWRrl9dSfqncTFezbVpliaTK6Jejshkvykm8STCPEgzJ3xl5JqV6XDE805IhQ0YQkazSMBf+sp5kyJB6inE0KyNnPRe8LR61WfedpmB8rQFfmqkiIw2q47xhXTdtlrXH8D3Gk1Jeqq8WxyYdpiW/NuZJF2PSNE8S21i3DmSoyhA3M1tGyvaNqWVWkGpMPPt+4CqE7GM+LAPHSjYjZGEM0bBKlXF3JoTaZTbnuGrGmBxPFRVaSQer69tot/ukkfxTJH3J3OkgSlg2+s1koeiqjKQ/0vJfM6ar9fFf0acWkJ/ccs9GnWvj8yWk3JSRpbu6gjBmayZPXDutbbNjDfi0Kkur08Ojj7/Jlugqrc2xjpndbDrB/o6bAaJmtGzfykdjxOVsEw8Pjx8QXBej3Hb9TX2RVyZj1P3alA+Bnm3qlAuRcPzccR6SSlo6S08NPURkZNAzoMgye8YEfD5snjiFpNW1/q5oSl/PiphJ5/kEB/t3TIEvGaVniZ7Q+hM5+pBBz4uIsj8uc6T5DDFdmk3Qy3dxNtzFo+sZNvIdDC9/Cbee/Dyuf+lJXHv6Kbz41Ndx9fJlXHvhBbxEp+O1K5exc+1F5JOJHjksAImyZ4qeccwjpCzXs31RXp2INpN/vBKZklcGEhinHZx94AGcO38Obd7Uh74dPvNOnNzEuUsP4uTZi1hZ2URCuatN3Iv5GJPBIUaH+ziUG+xjPBlSjBfoJRUe2u7jp994Cf/8n34H/uZv/jr+5p/9Sfz6pR5+Yi3Arz20in/5596E/+mvvBvv/7n34q1veRwrva7RleUZHn74IVy4eMkqT/QKx7VFP10sPTw8fkiwfuXhcT/BTWXmEIZy116S+XCwV1YK47Aq0IlKXDi5aoMQt2GTk8QS1F4me3h4eHh4eHh4fGscvy0uB/nLo1OUNvZVql4vZQCJQ62/XXHw79T0UtJWdJpnIaOHlgfSUkx50MIcLYybFIMqxmFJV9DlkXNZhIM8xN4M2F24vTmwPw+wn4V274hxhlWCYZ1i1CSYBAlmUYIsYR5xikIu0kwCrf8dkcCEtGtPCSnPnaJHa5ZrjoFU+07ZslBkLN6XBb1fLxXR3ytM4cS076bLS22EK8W1LpS+e6cP+B4vfgW2/awUOdp4W0uWhDIqwC1ZEtSFKb7A8prhpKqRis5IqqUKecnwSWh5JPRPmbf0TFIKNdrQXIYV0mRKGtaxFPymANOyJCCPKm2YTc4wXq3aCwrm65ZMsa+DGUcGpKYhHRxrNFqKinWva9t8V2XINdPBLYdSl3NbM15xxH0twQXWXcCU8iZCznJUsVyAknyItNaIjBFsX1rGLGlkenEbq2vpqIYxtfFsLIXh9wEV3y075q6Fl42QVGe8p3pbmgSKbI58PqUn+c/se6sr6K+u8o540thSLmpGUbuDgPXHH3IwQZ2yLlkJboNh8VS8UKr35PcdQ4rQCOtr6+x/y8qTslMbLC+MVswrZP799U1cfOgRtgq2B95XU5xNRtjb22VdsZ4XPLQymhJ10d5ViG+Bb33Hw8Pjm8H6pKwRhFsKSsYPyjj587rfX2GXk+FSctWCsR9K3rnnhvVNhaXcKYqSCbpl8IqSEt8EGB3D91ZW8djjb2Z4ypq4ZfFMjrLjz2cTHB0emEzL6dfYzDxeMF+XPmU3nzcb3QhvOL+KR0+t4Ilzq3jbpTW85w2n8NYHN3GizWdmNkJa5GhVpEFlynPU2RRhPjf9U8N7+WxqxthG0wLtQSNDgchc0EqX54W5jM+K0XSGw/GUboadoyH26G7u7uPG7R3c2tnFHcqrmzs7eOH6DTx/7TqeevEqvnblJXzl+Rfw9JWr+PLlF/HkM8/jS888gy9++cv42tefxeUXr+PKrX3cOZzh4CjD3uEcdwYZTj/4ON7/l/45vPt9P41HH3wY/ZTvHreu4nOf/hw++kefxIc+/El88COfxEc//im88NWv4pHz5/FT73sf1lf7rBPVQY03PPY4Ll56gHXBZ5+K8yfi2wbw8PieEPyl/+IrC3Hh4fH6h17YKz7cbMCpAQn99HKrh6YGGEk5xcObMf7F33g7tjjwkDGkatyQRQ9SDcZsyqOHh4eHh4eHh8d9DSmV7x2oO+Xsy6H3RzMSWDC9R7rwpi9dKuWlYeX7aK3ZCnpX5btnyXdPKV+1F0HBZHMGy6saOS+qqrGvVQv+SCEkKB+9z7rj0tWW99IgIeWQNncNIynrK3SSwL4ojekXRzFdxHP5wQwdNuNDaTR8W+ZxubyT3oe1bFShUSTpvdfAc7e83yeUhtITpLjW1/lKO4wTp3jifVs2TLNgSINmv4gvWgJESy3Z2uNaeoN/UaplorQQFPnahORdgJRxVV9VMTEe1GXOnBIm12P6TiEfx+JhZntEmAYsaLEuEgaTkcItwBWwDqIgNt4GTLOutPQU06pL8oc8S9oMm6IsGb7OkZCuMk0xYj0mUYCWCshzKdWrMGEcjVHIR5ZBm4drKaYs6DCN2HYj0Wa9lYUlOY02CSdjGEb7VWhvi5h0JLYMixSATJu80SyXmnVYVzP8/9n7D2DLsuw6EFvv3Xuff9/7nz+9rcysyvLV1VVt0Gh4EgTJIQYABUAacgYxpETGhCKkmAhxOBNDxSgYYoQ4GkVIlETFaDgUxCEJo4Zrh250d/mqLJ/e/f/ze//sNe9prX3ey8yqrgZQ1bY67/7/vHvvucfss88++5y79zFaGZOVoeYevv0wQNIY34t2xII+4gVhLIL3/Z1CUkadfCZCa/UmLj//R9hZuMC4WcydegSHn/wZRMUJdBMPOTJV1Knj2oVXsXr+m8jUdrDmlTF89mkUpo+jnqmg47HeVc/2XcYr0/4wYCxJmr778rfwr/7F/5WNqcW8O8iVK3j6J38aP/vLv4qYvJRhrUZ7u3j+i3+I3/3//Ct+C7JYpF0rSXDikSfxd/7h/xaZXJE8RDoKH/4pceNH3Ssvd7kDylp+8u41/xRSSOEvAerf1M7UfiRdEvVFnmRvjP/7f/vP8NV/9z+hW9ul3I/YBtlfsi8zsSdBxRsdvp3Pa+Ub5W6iMFmMjo3h//TP/8/4zGc/Y7Jrr76H/+H//a/xT/7r/5qBKFMtHPsLL4dWUMHc45/D47/4m5RDJdeXxDHxSYgN5QXzyMUtnJgt4MhUBc3tCIPlDgZKCXJEQKvvOuqsZXtXvxJrjWfMvl56KAmFBG2mF1GeuHNE3JlEEt4680PG/JiyR32f7CbNdkgaZBGxr6u3KFsZV/Kw0WiwP8mi3aojDtvs2z2UCzKYxFha30M9ZhjSUmOJpB2ZsV6GoFZrj3g1sXLzGvZPTNmEi0ZQxW4thN+RTO+inbR5idCJeGU/ubO2yrx8DA2PohGpn2Mv67MPIL5aGdphms3dNUSNTZaJvS7fFYsl/Bf/6B/h13/9N9BqamtGJzP7INlogvJ7BuyDWNccGNiTJkJo/GJ9CLlH56CZ8UoTEgia8BEGRVzfquFf/ckbWApLCFn/PvFXj6bwAq3yrHb38PTxEfz8J06hFJJOvTSs/pSqdQBWohR+xIBjx25qAEnhvgJ9rMnUof0bs/zoVCeobQUEATugareBR+Yq+BufPokiO498hkJcLYRCT/v06sMmFWgppJBCCimkkEIKKQikfOjf6YP6XpDSQmBbd5hu494QunMzSBmAH80e4k4W7aSDZtRBK3YKDj1LaS+FB704LmVC/fFs1lQoSpr+TiXcf9ZV51popqyUGPf6K0+mhoxWSGQ6ZhTJeT6CwEPB95H3nFK6yHsdsipjggwL2s9bBhtdTSGjBOVv+NyFv7wRRGGE0QdDn34y3th4XOGzHrbqbSztNdEkXUgeppBBIiMJaVRgeQbzASaGitjbqWOn1jCDj8K1dThtIAV618b9uTjEA9NDKAdSIkUIYyDOD2GlHmNxYxfFXICxYh4jJdLBk3FDmWWgGf/tmPXE/Dc1C7fZQsS0A9JllOHHSgFKHr81SMTNRhsrWzUU8mWMVSuokJgre23c2q2zLExLnyVSjpFempRVLZYwzfjDfgQ/bkBneszvJVjfbWOqUsb4YAE6pD3je2ZQEchwMr+yjVpInGIplpyRS/jyYkq0kUoOB8bKyDBNqYOc+/CgbynRW9h6Qpx3/UP8rX7oR/QIKpjqI0Lt9hVceeGPsbd0FZ18EUef/CzmzjxN+lUQJxni6mGnsYvFq+9g781vwqttYt0fwvjDn0Zu/AAa3TzrV2epyNDiePo7c80Hg1DSOSsLl97Gf/dP/xudai7GQUB6P/HZn8Rf+bXfQDtL3qBfkfV79fzL+Jf/3T9HUt9lkUK0GXf/A+fwq//JP8TIxIzUaz2+FK9bUu/h+3uNIPJJDSAppPDhwdoZ21SWnY3rc/jsUcYkbfzub/8P+J1/+f9EuL0OW5dB2a+tBSUjPDtcXA2zg0DbHEZtaPWl+o9ytYq/+1t/H0dPnGRYD/VGAxcvXcS//Bf/NyBss61GtipNq0TqlDkjJx/Hp37l7yEuT6CjFZIywGuVoR9IICKIKf83bmPj+pvIRbuM0UUr1NaJCdrMN4rZ78Q5ZIictvvrdJvIF9lP6bxZ9jstypdQW69LZjK9kGlLea+zaWWklUJdRmutTvMpP7f3Wqi3I8b02Q/IaO/DZxlldM9l2bexVMf2T+DIRMlWslxbbeHmZhMR43f8HDsM4uEFZrTIJvTfXcLlV5/HL/3sz6OW+NjJjaDVVZ/nVoBmZfBnbgN5D7XV23jn5ecwVM7j7LmHdLI5BWaB5SkxPPsB0vL25Qs4//zXsLkyb3Rsttr49Kc/i3/0j/4Rzp172G05SBrdKwq/93IxNYCk8O2QGkBSuD+BHV+XwktbXFHyuz2U2ZF57Lym8yF+9twcHjs6iaL2WWSHpI5Ts4H0YeoGtmmTSSGFFFJIIYUUUkjhveCGiPy5M1bUJ7Zzdk9v+yiXXkbPvMqoESUdmwXaChM06Rp0rTjhR7lv48+OFP38CLc4Un4zDaWocan+dFh3h8/61O9fhYHU1MpD+5nf6y9EtM2GxrTCzs7bIMiw4VTZbiVFMfBR8D2Ucjk6H3ne+57bGsrTlNaODm51s1MFUgj3FcB9v+8EfZoo/x5WPejhRC/tz95PJ+lICWS54sryDv7Hr7+N5Ybm4BKIQyyFDgtY6IQ4MjOBz332FN69uIEXX38XzWbLwsUkRhzobIcEuW4Tx4YC/INf/CzKaKDrhc6g4Q3ixfkt/O7XXkHJL+OTx/fjJx/djzxJpK2YwG+DbLaAnUYXr95Yxgs3b+HK+iaibB5l4np8ZACPHprBqQNjKA+X8M03LuBPXzyP/QeO4bOPPYi50Tz+9JV5fPWNG9iKIjQSzcbtmKKo08nj4OQUPnFwBI/vH8BEOYOQOP32n72N85du4dMPHcOzjxxHIdC3DCkRhbbl117SxW//yQu4tFxDzQ5p53vPQxyHKGQTlOI6Hjk8hV98+iwGAqkUXR19eHDrO2SAsG299C1FMK6xeqcjD7nty2SQSlDIhNi+dRFXX/xj1FZuojR7CIee+kmMzJ5A2CnwOyzAbjPEyvYeauuLiN7+U/hbi9jJT2Hs4Z+ANzKNekfbshWYR8B0nUJQfx8GhJ2UpBsLN/HP/sl/iXhni7xKPi4U8cizn8Ff+82/i0jbirGeC2Skxsoi/u1//y/x1kvfshVC2vd/7MBR/MKv/V2cOHNOihRrUM4AotQdz7/f8CdRIB9dhfH3XtGXQgo/vuAM+GxqUmRrdYGnfoayL27hxa99Gf/in/43qK/eRt7TllUUiWxoasMyJmhlo3Q+cdxGkM8j6+UQsR+RMvuJp5/FyMQ0+wLgzbfeQqvZQLWUx82L77Lvi5HLMA/Krzbzzs2cwCf+g99C9eBZ1LWugzjpsHNtpajtBUvMt716C/NvfhM7t95hOkUUh0bgDQzZ1pLV4WmUyiPotGScoBzKdXHw4ASOTI9SHuucDs+MwAHT8qWXYj+rcYKMG5aHysxOt0WUwk4Gr79zCwurG7znC6avfm94sILdzVVkWNYy0/z5Z8/iqdkyQvYNr96q4w+efxvbSRah8vC07jBrqxJLXhtb11/DK1/8HfyT//w/x821PdxoFxEWB6CTl0CayXDksd+rZCJs37yIF/74d4DWNiamWMZKEaXxceTLMoD4aKyv4dJrr2Dl2mUU1BeQVtMzs/j7/8t/iF/5lV+FrzKZbo2EZ8V+e//ffzKpaXcfDVIDSArfDjKAOI5IIYX7CDLsPO0TkgJZM7hMUNGpfy0XAsxNjthejvrIkjA04ch3EmNuUPvdCOMUUkghhRRSSCGFFH5cwI0iex/ypu38gA/frhT6eqexpxtL6qO6Fuusji4WdyPc3GhifrOJlVpk21UkXhFxJsfPdo5Hsz7g8QOcTmNRbcmTcKyqvDQ0tcPPpUA3xTOv8qOT0lYKWj0bGhr3yiktjnE1+z7uSNmSkyaYX/cldJRvtoAmctgOu1hrRFjcbuDm5h7mt+tYboTYtNUPTJBp2QGzvLoxMj37Zf3QcA8d7UnXu+nYqgaOzT26qNNBRFy98hBOHp3Doydm8djxMTx+dBSPHBrDqf2jdr5H2AGioICRmTmceeAYHjm1H48eH2fYSTx4dAZHD84Z3ULRM+MjYtk3Wgku3lhFlC1iu53g1vqmXbVtlhRqhVyANu9fujiPr7103uj/4MnDOHd8H04fPYBuHOPylStY3thh/TH5XJ71UrStsHJ5XztSGf21zdnw4AgeZtynTx/CEycP4PSxfbYdy3Ovvo5Li6vY46e6DjZvBBW0i0PoFIqItD0L6z7IduH7UuuwfoMMEtJFW3PNzkwQl2k8emQcTx6bwGPHpljWORyanUAhrwPZe8zwkaBXH2Qu9ydOdgYzGeHkzM+qjj9dVkCnizAM3fkmDDk0sQ+FwSmWwzOlprYm3qiF2GqRMLlheH4B2oImF7htxbTRTOyTVzVpDTpMXrl9NBAP5fMFlEsVqcfoI14lL0Uy5BFXVQ7ruB1HKFUHcPrsWXhaMdRr17V6HWurq7ZiSocv9/m8b/hwbSCFFFL4XoG1KTU/e3DPUp3zBtMz08jlctbHWVtUOPpbFys/yh7JJ23XpPYdJ5pkEGFgZBR/7W/+Mv7B//p/g9/4O7+Fk2fP4YEz5/A3/9Z/yPbu0ksoE7TKLWC7D+s1rC4uMM2OrQrRSk7Di4gklBVaXTIwWMHIQAnLNy/h7Ve/hXfPv4ilS++gNn8Tu/PXEO4soZQLMTZaxsDYEIKBEZRG96E8cZBibxrZ6ii6hQoS5e8FJu/akv+Uj/Uoi3qYQy3KY3krwVo9xF7C914JtSSL3Yhh2I9rhaOMJAnjlqoFtNmn6b4yXObVjSW0ziRU/83OMVK/T3/JbT9qYMxr4uHZKvYV2vCbm+iwbM04QTMiLTkmaDDxxdvLWF6cx+Ktazj/3J/hpS99EV/7t/8Of/Tf/4/4/f/H/wtf+d3fxfbqMo4cOIBjx45iZGQEn//8z+Cnf/pnWFcF0ipSl0BR63ZgSSGFHzRoCJZCCvcZsDOkoNdYVp1hp8OegpDnALdaymG0mrOPikQdJ7s+63DVoyoOB7wppJBCCimkkEIKKaRg48Nvc+8FDh/pK81N1mZzag/uWivC+m4dCxt1zG+2sNrsooYCotwAkvwAQq+IZidre2tLYeHGpNLVa+6iW51hB0db2u/NVSHtWYogGSdsDyRGkIHEFDgc+9JJOaQzIzI2J1UKoizHxMyPeeqQbR1CHfsFtLN54uZhM+pipRlicbeJW1sNLG7VsV1vos0CdaXMYNm0XayV9SPD3ZJoxC1Vl4w9UjapCKKDlYt5abuu4WoeP/2JQ/jVz53C//yzD+A36H7tMyfxk2dmMOqxZEkLOT+LIwdn8dPPHMUvf+40fu2zp/Drn3sAv/75c/jJJ06CRUWL6TW9POrZIhZYH7fmVzFSqGBuchyr21u4fGsV2YB5i25xBzvNFm7ubqNF/E4enMSvfPo0/mefegB//ZMn8ZnHTuLc2WOYmhmHDtElcVhXPoJujEzY5lX1FyHbaeLE9Ch+6cmj+PVnTuBvP3MSf+uzR3F03wCa7TqWdraxxyzbLEedddHW6geWRWeSZDNtxFGd9RgizrptX7Sjbz4b4dFjU/jVTx3Fb3z6GP7jn3gAv/mZ00z3YTx5+iACj7whGn6PQfXknEwcBCMVGZ15yegQR5qFncDPFVAZHEeuOAJ0cnzvY3O7ia0632dLyOSqdsZLt0Pu05YuLFTIsukMEynydPaJW2nyUcC1i1wuj2rVHZ5svsRRK1Wk9HTPYjGdG5PH3KFDGJ+elp7TYutA5PXVVQvk+FNhHT4fRFe1zxRSSOG7ALahftO609bYILU6cHJyyg5CDwLKRgbS+SDujC03UcCBJgGwD8nK2NqxraK0nVSxyr6W8qWTpWyNu/ALBRw5dgIzc/sZXumzn7E/H+1mGyuLt9FJtJKS6agXZt+plW46p8lWCbT2sL54Fd36BnJJHXvLN7Dw2vO48pU/wKu//6/w/O/8S7z+1X+Hiy9/GTcvnsfC/HXUma4mObS7OURancIyxRQsXcp8LTiwTRG1yi6JnL6KbmnpthlirTzERobcIBfQb89kcN7PYKSaQyWv8lMmU5ZVypJ7TJCEk45LW2QV2Jd4vGpF43CBYaIdjLSWcLraxGf3+XhkOMGhfIRRlmUgrsNr7qDIvmZ6dBDD5RwOTI3i6XMP4sy+OUxyjPD4oRP4mac/jV/+2b+K//jXfgP/2f/qH+Dv/72/j/0HDqDZajJ/5iq56ftWN7aCziToDwNSwXw/g+v5U0jhvgFZ7XuHY/FXnYoOd9SesHl2NqMDFV61RFqGEXUpDEdhLWdC2jrVH5awTiGFFFJIIYUUUkjhewlS2t77Qayh3ge5/jDQtt/pO/vjK37QWxB94PeepaTRYdoyDmjf7XY2wHaUwXI9xsJuG4u7IXairG2dpJntOv9DB51rpUEnK8OF7wwYus9k3VhUY1M6KWJkwFCmUrLKuWLI/KAZsA4fKWUtnOLau55hge8VhkNeGwe7mftuvGvxNeGHTitETNnjSfmeR0Jc27GHvXYHK40IN3YjzNcSrDe7qCdSJmlGqWZ2arwthKSpSkgrW4sib8tbWCgf3ZknnSjnzurTE8fmLJQ7fN3WANCXKbDs2t5E4/g4dlub6KByJtrb+x3IBTntXML8tYe7Sqt90nMsQ5Z1kEGLYZWPDsn1+mGCIkLSfzfs4vLSHp8LeODgBM4cmbZzWC4tLLF8HYRdljETIGJcnSEY+2Xc3iQdlptokgbVfAYnD4/jzMn9qBT4NUGEdC6JMyxJSSdspJ4T3zjjjqikA9qFk7YXy8kepToXziornQ63lVZOh+N6UvYxru91obN9tUZCNNF0rpb4wpcxSukxFK+x6Mt02xEQhjIsSAHFwN819Hifv9paRFe1D6JgeZqCUBkJD+LdiRMUSxWU6LLaaorl2GjHuL3TQlNbudhh8cKta2XTvvMdrZTJkO9Id6HM1sKralk5fziwGEzEI4FL5Qp5SwY7z7afS2wyHMvA+pCBKs+2J2XdwNg49h0/YVvB2P78YYza5gYyceh2C2B6StdmoCt58RVvtHe/nGhidKKnDq1XnaTw0UC8pfMfbDWOq817QPzmnEBh+3R3jo90urp06LJ309JrgeLrfB0213vgvfkpTobyTOff9GWnEtfWOpLbfRnm0d+FcboG8ULfWXp38lb7UXg6srZPp+td53jqfgRRUoeMiz7qQzpZykzVp97IiFEewPj4hB1yrnNBOmhTDup0Kyn72cewDapOM5Q12mpSAlVbGGUkiyqjaGpLKLZ/P+dT/kcYmR7HZ3/h55DobAzK6ywZQayQiSnf12+hsb5g9Sn5FrE/1PZYnrYYRA2Lbz+Py689j6TVBAU1Ssy3yLDlTIRSN0Rz7TauvPINfP3/96/x9d/7V/jm7/1rvPzl38XuwmVk4xb7CemdPMpA139py0dVvK0YFV8yz7XtPaxs7qJBuWn9LIOon/CLFfbLMo5nzdB+eLSIEfYZOSYkeVZgGpVS3uQpexDbBixW+iydz7QHCjnkOm1kWtsY6uzgRDnET0wF+ImhNj4zsIunqps4U93BU8eG8Zt/46fw9CNn8LlPfgL/+//yv8Cv/K2/iYfPnMFv/UdCDsVJAAD/9ElEQVS/if/2//h/wP/ln/8z/Ff/+H+HX/2VX8Ev/fW/jscffxJvv/UWLly4wL6a/Zuv8YyqghWrKrEW8F7nav57Dfem+/1IP4WPC7xHvKeQwo87SKhq6XSGHy36+PA5MCmwQ/WTtl0108sGrDZo0YcRG4k6TvVBvLrZQXIppJBCCimkkEIKKXy8wY3r/rzPYYXQp7ob/fXHgX3nPqW1jY4U2u6e/j3lQifrFA71GNjgz+3tFuZ3QqyGHmpeCWEmb0pYL6PzK3z7MNMaCjNI0NkBqB2XrjMZ6Fdmiwzj0dc0ez1QvoYW4yl//tv4lV6K+Z6/XjgpfKXM09Qgp8RmSXmVEw6eGV6Uj4IbZsxSoT00kcdaXMCtBnBrN8JyLcZWu4N2R2GII6PZShNDSkiQQsLN7oWFwL1Tug5T5eHemEq/S+pJAyYFtZCW5sTLIjFlY8a2wnr7+jJevbKA164s45VLS+bWGh1EREEzfGXYWN7cxVs3VvHKlSW8eHUJL12+hYvXbmF7t2bKUDOCEOfNnQauLqwiCHJ48Mg4Dk7kUChWsbTewvXbdZuhq+1J8oU8xoeHWM4c3r25iz/55jW8/PYC3r26gqU1hgtZU6wDKTDzjINsgFYnYPg8S6fvCRbND7Beq+Pt+RU8f20ZL7Acr1xYw/r6LkZHR3FgbhpFH9DB6jl+p2hylg6k1Qodt0Uv04h1DC6pZ2Ugr3kFXFvdxUvXlvDy9dt47uo8yzqPN2/eRt1oSL7R1mm9KvlIYEzl6tWxnxJz/CowRbDwM34WYhHazYYZXwaHx2zGtpR9DUZeqIfYSVTIIstF/mA1eDpwl84vFdDRdjCkWaej7bJi+Dq0nzz7UUFtRtvADY/ye8/LETufdMugFelQXqbPtP2YbSJKzD83NIQDp0+jmyuRxj46zTYaW+to724hk5CO5D+1UfGO2oV419iUqVlrURsTnfgsPhObpfDhQXxmBkMnuHrXPhgT3gELa86FdU6/feWqeydjipwqrM+7AjOOqJ1YUL1X/fbTkePzndQUl4/m65TUlJz2RmEkUyUt3Zu7cfrp9c9g6qcjRb85vnWY3vt7/0GfJh4J0M3ElOc6j4G0khymvOuw/R45ehw5ygutistA5zPJgE+ZKwW7ZAXja+WHasijDMzFbZQoA/zCALpBqUf9hG2zC3+gjKc+/zkcP/swo/rMn+mwDv1OE42Vq7j5xnMogDKIaUVkELIJct02wrXrWLnwAsLNJehw8YDyPks5kmW+WrWpHNQXFCjDKp06spvzuPbcH+O3//l/hX/zL/4pNm5c5DvVu3RULJd0UUYA9nGyhgTsP/j++u1VNBKG8SkbJS/pdAC6jPRaLap+RsaOcwcmMUJ5Vog1tYIZk6lLBa2i82wiRsy+RxQRbaTrGiqXWNaY2SVah4rheAeHumv4VHUHvzQb4q/OtfEzhzN45lgVU/kQoyTLkdkZPPX0Uzh97iyqY4M4cGgfZveNI5djadnHxMy7WCzjiSeeoLyP8c7bbzEPytUosnrxVKlCwED3H+S+h2ANms6EMJ1r4Cnch5B2wyncVyBZZ7ND2PFZr8WOQ4cIajBdZM80OZKzTk0Dof6HoBPN+u27FFJIIYUUUkghhRQ+/qCPYKknPhjc2567R0kmMOUMx5KaICOFrs3azLjtMaKuj8TPI8zksNOMsLJVw/LWHra15YWm4PjuLAObWCPFdFe+HfjZjG2bJIW25Wk3Up9J4dK1mZu6SsGsGaCGEd8bahrXyjGm297H3ZvrhbHwBF1txnRvxrJUypo5m1jwrCmY3Fi565Klt9R6mtXcS5FO71lOunrUwdpeA4uaocprvZNBrMNTs1r1oNn7UiQxBcaXMsoZjAwLhwxD9BXIcm4Efk8ZeuVyMRTOhw5n3dwL8aWvvYl//4Vv4Pf+4Bv4nT/4Or7wxa+S3ttodxjDz9j+7FcuXcKXvvgi/uALX8MX/+g5/N7v/xn+8EvP4dbyhik8la62aFpfWUFrZx2jZWB6MMBYuYCjsxNo7e1gcem2fRVEcYzBYgbnDo7gqZNTGC11sLm2iOdeeh2/96ev409evorXrm9gV8RUsRleM5E9r2D1FjEzbWsmHlhYXsWffPU8fucPz+PffuFV/NEXX8DW5g72HzyM6uggw5DKTENaQCltQ6YpumSYVtJh3WnlBGksHbynFTqJhzfevITf+8Lz+MIffgu/+3tfw+9+4U/xJ196Ae1Wm3gwvk79NZp/VHC1YFXDq31b6a53lfJR/KdzNaQ81NmLURiiLT3ewDCC8gCR9bC22wb/4ReKjES6RLHxR7ZQgsw9ziji6tyMRqSjZitbk5DnhwamwfRj8t/o+Dhp6EFbqnlBHs2WFKfEW/wt65TqS0pCz8fY9Cz2HTxIPIgL/Ru1GtbIJ9o62bZxIU7ajoZR2ZTd873w3qcUPgqYrKVz9S6KSl7o/i7cyxP3hnPA2qPf3VUWrF9e3eoN17Z0n6VfQD71E9U2QcYPe9+hLOsZTMyHMpOMqFU9CROVDJFU0uTJrBDjv/wsDPlB9/14zrjCq9Kwd+JxF8bSk+vFtzz53I9/v8GdOu5dHaUIVm3qK32cOXMWxVweUT2EFyXItOvwwgay7T340R6yzR10a3sI6D9ZDvDwiSP4iU89jUqJckfpMEFru6zBkGkOTu7Df/DrfwflsSk0tALSDLkJwr0NLF1+A63lGxj3IlSjGoYzbeQb27j19nksXHwHBV9bM+aZLBPsals9nXvEv55OSTomGVnznRDVLHtc4val3/8dPP+1r6BD+az+VQYCn3JHMk9GAuv7GfP22jY22Le2WEatArSxA8PIWK++S7Knk0SYnZ7A9Ngg02K/I56mMyM5ex1HSD2JkoLExhyVYsHCymgk/VfQjZCnFM4nNZRb65j0GthX6WK8SB6PmnYAvFJwabBNMY0oCVnOmEk4A7tWkWprwYceOocjR47grbfexNLSEsWjYjma/GDB5euEg67mmcJ9CBpZppDCfQWSd+qG2FdQ+MrSnkWOgnukEmC4wu7GBLJCSEDqVx+HDNfrvJwATSGFFFJIIYUUUkjh4w5OpXL3a1jfx31n38l07oOJIbtyvXfmxXEhnedpxrs2I/LQ8fOIgzx2wi6Wd+pY3m1iqxmhEXf4XspS5ch4nciUFNmMFBWxzZqUAkFX7fed8F5ocQjKHzcqlQpDLuKzjBa25Q6vHMYajuYUx0rFEaz87wljSg5TdDgnNYac2/YlCzNC6J7hpWAxBZTNgO6lyYJnbcWItnaRMkez5rsWvs33u1GC1UaIW1t1rNVitLt5aAsj7ToO0sbzfNuDXTNutS/7+0FjbpuoxKsbdZOewknOYeDCETEp+4NcCUeP7ce5h47hgZMHcO7sYTx09hjKZc2iVcgWirkOpsaqOHloAo+emMNTp+bwJMOcOn0C1eFBS0vKmu3dOq5dvYKqn+Ch4/ttxmwl7+PQdAVBN8TS8ho2dlusjw6ycYhDYwX85CMH8FOP7MfTD83g8OFZdEpDOL+4iy+ev4bLq9uIDFeVhDQjHbU9lEodk8YhEawODuLUkX04d5q4nz6EB47OoRwEuH79Gq4vbphxKezokHbS37au8omrDx0cDq/IuipAh9hbfZFm+Vwe+yan8NADh/DwqUN45NQRPH7mGM4cPQQv8ZH3NNFLFpWPDsYSrAnVVr9ObNWHvemVV7xBZpQBr9ZootaOzBjYLQ4hWxnBXjPE1s4e2u2QZSFFyFc6TJ+FQy3KoKHDfcnolqbanDiBaen8GrFvL6sPD4zn+wEGhobQDnWwPRAmCUJ+FObyRfIUOZA8qvambeZk5JucmsKZs2fN+KhzQZrNNpZXVozmMtiYkVL0YBxrL0abu9BH9wNepfCXBNFOss12ZiCRbVUaQc1At71HvrvXybP3wnEpPLY5KZm1zZQZQSS7yHty4mSf7/Os94DvtYJL8S19S8EeCdILZBCRV9t0ast6ZyvmyMtqCWoZsd6xXZhRPKOt3Fw8M3pYuoqntiP5e9foEdPpWWdByC+509ncf6CSiyaiV6ZLyUWnuqWX1Y/MBGfPnsZf+YWfxU89+yQ+cfYoHj6yHw8enMJj7A8+cfowPv/kA/irzz6Mv/1zn8F/8qt/A7/1v/hV/Ee/+auolrXFYGh9mupUW1WaLGV/deKhx/C5v/Efojg5yx5EKy485Mh8tZV5vPon/x47F1+Gv3QZjStv4epL38RbL76ARr3FvtRDPYzQliFU/TxFreSECuKq0dW3yQ06GS/U1z/3zW9g/uY1aNtH9UU62UMdtrbB0plI2+xTb66so97mCELb84mP+T5fKCBiforB7graTPOB4/vYUBjGJiC4flNth6Ugdo7PjYJCiH1wIcd+rlQ0w68zCCqE6KGJGkyHV6XixRyrRCGyCfNj3jbJgsGzHPt4pE/MPlFnsGj1itDXlocx48zN7cPDDz+M+fl5vPvuu9Ch9bbF5g8arAL6TrWiawr3I3in/tp/+o979ymk8GMP/cGGGTPso5MdKQV7mSOhBw9O4MhkFQV+msg6r48t1wnQMV7/yX2YpZBCCimkkEIKKaTw4wd/uQ9jjQbNtMBvaWc40IzxHFqdLLYbEVb3mthstNFIpMwK3Dka2t7Cku+aQcKdkcDRpSl2TVViY019rMu4YQeA81HhpHRwq0PcHtqm1JAyQq7jZm6+32n2vVyWTmpyKUB8xtXBrUrDKQWEgka7yoc/jHf3AGsroTzpHH7y0JOUIk7JqLExsfF0SHVgW3E0wxitUOYeH34QwJcyRcViWKdw0jhcY2vGtwx0tRveMS3d899hJ4U944t2isG01nebeHd+DZVyCb/0mRN4/OgMTh2exQOHZnFy/yzKUrIwn1u3V7G5tYczxw7hZ544hkePzeHY/mkLe2j/JAaKORS8BA3iemlpGy9dnEemMoGgMoaVnToWNmtY2W1jaaOBOsMUi3nMzQwjSrpoxQl0+O7U2CCOzU1genYK3VwFG7UOtra2Ua14OLRvBLc3dnD19hYGhodxZHoIwyXg5noNlxc3cXRuFj/15BGcOzaOU4fGcObIJIJOBvOL82i125gZHUYpH+DdWxtY39zC8YkyDoyUkM84AwOJYlt8abuvt64sY6dWxxOPnMLnHt1HWkzjwaP7rKyH5yZRyrEuOmbuct8yjtwfGizae+KyVsX/9t3k8Ul/4q8u+bWLxVu38M1vfQu1egNHTp1FaWwfrq3VsBuSDwtlw0VGEMXSOYw33n0NFy68i8zAFEbmjiOTKyFOyLse8yBvOt74aMhb2yIXaU73+tKyO0yY9D10/CQeOPcwmdqXTpBXKUIZnkQO6ArZLDZur2B3t4bED3DgyDHMHTrslJnG266tWJuwfO5Cn9a6yv/edyn85UAiQ3Q14wf/JHZUP46Yd+nqlOPvo3Pvxr1zRg/5aXWFGR0kbpigrd5QODozRHjOANzfbuueXOgnSepUyoqltN3qDwvaiyfDhvhI8sulLdA7u7qLgQvfu2dAu+/79fx7l/sPeu3HVh8a0VxNSOmvCQTFoIOnHzqJn3z0BB49cQhPPvwIPvnYI/iJp87hM088iJ/69BP4xZ/+LH7608/g3JnTmNo3izAoYtcrs/49tOt7OH/+dWgbxKee/pT1435QwIkTJ+1w8b29bexsb1EudBC22the38DqzavYWbqOq2++gitvv4GoUUepzPS8PLp+3vppM3OxLmX0tt5V5RD/kSeMzyTLVMF+AevsI46dOIVDR4/a6o5YkyD0xzIrzSuL67ixskWfnK0wicM28uzjMna2U2SrOHLdEPvZN5w7MYXBvG8GDcuRsktnQ12c38DSboIoo8kIomUHAfuRuZE8xjMNvPLF38Ff+fSTGBuqEGciLR6XzBWnUii2ZKfOV9BsRXjhxVdRHRzGJz/1DG5Rvl+4eAHHjh/FoSOHXFtSn82r4vqBjPZZfP3rX0ehUMDjjz9uBpy+zPz+gcqg9F0ePbMj0dKz66/cWzeu0bPGL9utEG9eXUEtCaz9OoOmZI5rwaq3PELMjRZxfG4cgXaS6aVxR0a4LFP4EQRbZdq7TyGF+wrU32Qo5DRjSZ0MvwlwcGoEeXYWmh2iDtZmyRFk+XZNxcSfXVNIIYUUUkghhRRS+PiDxoRyDvrjPDfme69z37UaEd4JzicbT8I3xb/bCqqFpe06NpsxGggQejlEdPq41ixgpa5xpq8Pan6M69PZPsY9fmx7/IRm4goldX/ABz/DcWkSAtp6ImKKSQuFTISyn2CgkMVw0Tc3UgwwWqIr5zBeyWFMjvej5cDeD+Y8VAOglElQ1F7fTENbXdi5CkzT67R4DaGDe5WnnLaIdcYZRxGbrUzsZIiQOkH/Ri3+6BD3WOdQZFjerGbwe1jZbWGVbrfdQUwa6VyFOGZKGZY121NAMK6Nr3vjbkvP3jgqaAxuV8Z1Cga9SZDvtlDq1JCPiG+YQTHKIN/imL7dpr/OcgDyCRDELEtCfymllLhm+/MmoPO15w3zbSeJGVRa3gDWah18+YWL+J++dh2//eUr+Mb529jtFrAZ53B5pYaVRhdLtTa++eZ13FjeQUvHRxC3kWIWR2YqGKsWSLuY5XOK1MjLImT9StGazTpDlM7FCFiWInGyc0JIV7mCpeOjQM/drS2EzTby2u2LcTpRGwW/g2KOPJHTzHMWRdYsPpuOVSuGWI/KW+pWzXC3TdJYPinkyF58Yn1mnWL3u4H+SijVjXjfmdaEhLE0Cx6jyzJqf/pWHOP64greuHILr126iXdvLKEhYvg67Jec1OcDpqC2sNro4PUbG3j57au4ePkamo0GfCniZOQTUZmB45SPBpq5PDYxgQcffhRBoYShkQk8/NhjiLR9DgmpdijNpRSXMryIzydn9uHBRx9DyHIH+TyqgwO2kkRb8Lg0WQK+k3JFuIm+zt0rPVL4bsCt+rhLR5MF9DN6Oy9Hc7u7Jxw9zfWiK4wMHzE93OoNPugdQXFjGUbo1Hbdqgy9d2k4A4wC6pkyjDLfIy9rZYLTG7BF8CpDSB/ffv07Hujh0kvL0jOn8Er47rV3MbA870Mgaawe+kYo0dvRTHTiC71nHcbspwYLeZw9sB+fPHsCT589iseOz+GRkwdweGoYQwGlU2MHSX2XdKUcyWnbwFB2TrZhJ1u66pf452dzbPcZBAND+MVf/lX88t/+TQyPTSFfKOPo4UN48NRhFJMaNq69id3l68QnQqEyAK8yisLoPgxOH0Z5dAYdL++28DPGE8JOke7p0HLKDvlaJVPQSLbfuPwO9rbWKUPYw2o1nOJ5PnbqDdze2EMzoZz1CwjZp2klpQzMMoTYBIi4gcGSh0NzU2jUEoSU/SHj26oj5iTWdAYRG21YttrWTX3L5Ahx1wQJvjdJzCC26pJyrpsrsC2QKqRPQXhxDJKhbLeVeExf6chIlC+wp+GYQjg7ec42QRwla8MwxIkTJ3DgwAFcvnwZKysrLozRJYUUfvCQrgBJ4b6C/kBUItcOX9KMI7qpqo9nz0xjgB8mPjsyE+kMqwG9ZgdIRmuWgXUaJrBToZ1CCimkkEIKKaTwsQeN6zTs6z0K+iO9e10fnOKFzpQbOgND53n42GvHWN+tY6vRRrObRawVEdquSBNpMlnG5Ee/lAn2xyFoR8rVrM0gN8WrKQ6kRE300pTeUkzIEFEMMhjIexgs5jBYCjBUDDBQ8DBSzmGIz/IfquQwoPt7HcNVFZbvq0UfFaZRLfjmKlK0B1nnMs4goG2t7DDUDse8UngIJ2k5hBnvnVFCWOoqbz7R32bB0483xF9bCEmz5CHudNHQuSdMVzNBg0AHvt/dxkQp6drTZdmPPctfnuZ1N1/9awXMxm4N7y7ctmzOHpnGCMsqw4YU/jLgkHwIswFubTRxY6OOOt/Ukw7vd3Fts4krdJfX61jbi+EVKljc2MFzr15AuVzGA4encWSqhANTAzgyXcWBsRKGynmEUYQkbGKwWkKjHeLPXjyP66t7WA+7WNxrYn67juvz67biYaqcwWPH92FyuIyF29u4triJ4eFxHJsaxHA+g+tLO7i8tAsdxB2S1vPbe7hBfBZW67hwdR63N7YxO7MPp4/M2CqT89e2sLwXIZvLYbPZwfXdCBeX97C0tYeOz1J7Aa7euI098p7Ordhqthi+ZQabK6s1zK/vYnllAzOTI6Q9+cuo/FFBNS+n+ujVi9WRS1M+3UQGoK4ZLja3d4hTgFbi4dL8CpZ2Q3jVMRSrw6ZoixMZHjIIfFYm+WR7ZxvlwVFsNmIsLK+zjn2Mj48bHRTW2p59i304UAwZ8zY3N3H1ylXcun7TDtGfmpvD6XPnUB4aZvosTQ8nL6f8Ymysr+HCm2/j+qUraIUhZg4exMnTZzE4PGLn8Rgl2AbMOMPnPmaWH3/dd6Pz0F3/fQp/eRDNxGEGfXK+nwd6j33x/F4e6d9Lmrg6kfGjF9D+pFiXvwweZvTohXP30gNIlSz56OS3S0sgf/Gwcz2VszmfYX0yiORdL9I9su+u08/7/ZzUuxv+fgSRXkYoEcDR0T24NqW2ynbqJQjiGkaTOnLtGrpRiFxWBo2aGfcli9RIs12PfXEOrUIZW8ijlatQbvK6t4c3X3+DoqeLxx57Er5WgFAWtZlOMR8g3N3DN772dVQqA/jVv/3r+NSnP4vZ6XHU9zaxtLKKgal9OPXwkxjdfxRjB09g/9FTKFcq2KbcaLeaZhq2fpIoiyvyxZJs1ui02zYhIBMUXP0y2IOPPIrRqRnHg/SQAePa4irmNxpgqSgLZZzRtlU+MknkDDdJiBITPHFgGvtGq0C7jk7URYV9lnXZ7CRb7Psu3lrD7d2Y/aKZxdmPxhgqZPHo0Vm0Fi7h/Fe/gJ/7zFMYHqyiE+SQo3zL5EuIWg34cYv4U7L7BWzXIzz/6hsYnpjAJz75NJaWbuPipQvYf2A/Dh89wgpTW+HoRe2FIl1XrfzYI53feustM4QcPXrUzgf5/oLo7vhFYG2Xfo53WBaWx72VUYih+ZyuAPnxB01SSA0gKdxXIKFnH2r6MqI403LKgp/BwZEiHj8yiqJmwdkAx4VlCHY+WiitQYxmVGlGiPUmSi6FFFJIIYUUUkghhY8t9D5Y7/ze9ZHi/87b3s/dD2F68OteqxqaSRY7zTbW95rYbenci4xb7cGP5zvnathHN6GnIJXTigabgmpqLvrxnWnuuwlyXgblwDPjxVAxh5FyHiOVPIZLOQwW6J/LouwDhWyCfJYf5F7HlD45fohrWwufY1nfzDIJn7XioRfO70K2glKQRYlpmEEkL8MIXSGwbZLyfBcwf+kHdfA0kSdywph4SqOhUbHKxEc3mtZVykCPcQIbZ7swpBUTkZkniiMkdoh1Frkg4FumRxwZymiq1JWFKCzoUVjkMsWLe3J5aTXD+s423ro+T/p2cfb4flRypHWcGM7aKilkCi3Gu7y0hcvL21jcaeDi/Bpev7qMdxd38eqNDbx5YwvLW02MjIzgnXcvY5dpnjs2h5954igePTSEU/uGcHbfAM7uH8ah6RHba/3apXfgdULMzE7DK+ax1c7g7ds7ePniEi5eX8fO1g5mB3N48ugEzsyOkc45LC6u4eatVQwNDuPY1IitFLl+e9twW9nYwZWFdbx5cwNv31jDlVsraEddTE1O4cFThzA9VCY9M3jjxiYWdiIsru/inZtreOPWDt66sYyb8/MYqFQwPlrFjeu3sMb0bq/v4MKtLcbZwvmb23j75jquXF/Extoqzp08jKIOUnBk/sjgakNtwbUH42861V9GhjPynQwC4ouMH2Bq7jBmDp9EHJQR0Q2MzSBfrrpvMv2poi1eBn6+iIMnH8DY1CzKAwMoVcqmUJQBRPxnOtCPCB1mU6vXsLOzi9GhUTxw5jSOnjqJ0alpZFhXtvpDqLAsWV8myMQMJnvb25gcHce5hx/ByTNnMTUzg0CHt6s9MKwdhk4Qavc6a+2ijYHo43g9hQ8HRkI6x7Y9KurhHmKKL/ruTljjSQeuLtwKAtWvlMuSNOI5yXp7L3klIcJ7rTboyzpxqSZC2sHp9lbyjpEoa+UytuoqZnQZ6OSn8IDOGtHVcOghorxcynR6Z++Fg8PD3tMpnhao6d6gF/9+AqtPI3gXfqKtldiG1d5ECxGHtO50I+SSNoZbu6iwvWZkfGVdBAXSM24zHGs4qy0Rc2hn8qgVBrDFa5wfRMyEokYTr738CttwF5/+1KcYnL2m+iZtgRa2ceH86/jC7/4+Tp59CL/8t38Dh0+exPDIEC6wL7h05TpmTj2ET/7cX8PI/uMYmzuGocl9GKoOYndjHSu3b8FnOm7dpPrCLIplyjKWKWrW+WzTHFjIDhqNGh5+8hPYd/go2uwrdX7MTivB5fll7LIYcTbPsgQIfOmlYnRj9nI6rJzpH5qZwNG5KVvRKUNd1GqhxP5cfa364HaU4OKtdTM+awss0dRj2NFCF0+f2oeNy2/g9a//EX72009jcKiKbqGM3MSUGUKSeh1BFJrwzFI26zyS5197C4OjE/jkM89gZXkJly9fxMz+fTh67JgtRJQBxPj1DvPC+tkXX3yRbSWDRx55xMn87ysw/b7gsN/UAJIC65l8lxpAUrivwDpSXcX8FIDaE7kcZPDQoQkcHy0g1233hJcD+3jN6IgtfUxqZYgTkKlkSyGFFFJIIYUUUvi4g8ZzbkzXH9m9f4Rn3+k29nNOk2PsY5nXOj/21+shNmshaqGUFjJ6+LCDbumc8p5gyl2nD3CTcABfW17pY5xjUY1HZbTI+xlUCwGGy3m6HMaqRVvdIWOHnfvQjeF3tG0VHTFQHKdCYRrKo+e8TuyueqfrHadnZxyxra74PiBSyrfoeyjmZAQJUC7kUaILmK8nJa8NnjtOOcdbKRJEGClXjGJ81CG1d8bQesc8tN2StvPosnxRGCKJpSD0WHadC6KAUkrQS/RKNIOa1NX2H5affvTy7kVONSAaSiG+f3wURyZGUaA/USUODi8pPoSbZpnqsNsDE4M4NFrF0alhHJsZw8HxKg7PDPN5AAdHSvDjGuYmRnD68CwmygEyoeqki0ykbcK07ZRbLVPyEuwbK+Hw7CQO7ZvB+NAQZoer2D9cwvGJKh6YGcLjx/fjxP5JVPh9oTRU9kqRuE6NYHqoYKt5WkmMfCnAvokB26Ll8PQwDo5VcJh4PXRsDo+eOIiDEwyrGc4sdMg0hgcKODBewdHpERyYHMIxxjk2OYDjU6MYLReQJX3HhyqY4/Oh6VGWh2H2jTL8MMtewQn6HWW8vJS0faJ+aLCK6cV2iuR+rbhfAnnP6pH8FJHV85UBBNVBtJDHwOQcpg8eR1CqsuYZnnWkbzK3bYrqDsiVB5DNlzE4PIy5uVmMj49ZXdu+9ALL86OB+KwyUMXszCwOHjiA8QnW09AgvFwOHdOcZ9km3WqsKNER9sDo6AgOHzyIo4cOY3p2FoN89nxte8fS9nARt+vuXmfJ3aGPfvvXFD4KiF/6NO1T1fSrvDHOIM/ZdknkKZOw9JR4CiSXdM86lV8kOebnTIbLGGKKdXuvrZQ6jG9cjAwT06oBGSa0PZBWIMho7YzakomMK14xviQHKG85PUryMl2FSzzftk6zxmHvye/iC3rx9w472/37XC+K/Sjt+w2kqO/IwERiyZik+lK/arRQpdI/oTwrZmNU6psoJW07D8Mdbs7OmZygltlJJF9yaHkFrHtltErDaGRy7GvyZgB5/bXzVh9PfeJpxvNsS61sLov6zjae/9M/xaWLF/H0T3wOTzz7GbT5fmNrA9/41jdwc2kNY0fPYObEg6izF4qYfivsolQsYG9zA/PXLiLI6IyuWMnbmKFQqli/GzUbxoeSO5pw0Go1cfD4Sew/eoydGeWLn8et1S3cXt9lfyEVO4nBvPM+e28dRs4y6tDz/ZPsP9gfafWn+hpNMpChKGyHqFaK7H8zZlB5++oS1ppArFUkxEdnX+0fDPDYkXEsvXUer/3Zl/HTn3kaA+zTguFx+IMjJDjxaLXgtbX1FSkZ5LHZDPH8G++gOjKOZ599FqtrK2YAmZyewlHinyGud9ol60j8rX5YBpArV65gcXHRtsQaYj59uHc117et7PrIoAZmjGJPkgrio9QAcn9DagBJ4b4DyeP+rwZFWX5ADvgxPnnmIKaLXQSddk/wylGcZdhFsbORYJMBRHGdAEwlWwoppJBCCimkkMLHG/pjvrsjuzsjPLtxH75SiEoBkWhmo88PY97XWhHW99rYqMf8HNb2Gpo0I8fRIsNLyaUPbilhTMFmn9FMkenZSJIfYpqtGnRjFJnsQDHAcKWAsWretriqaCUGP7Y9jlVl0PD7RgyNSYWNFHkOQ6bFe6XXf+bVjVZ1/wFOYZU2ndLRvvXyM+MII+vQ8ryXRSmfQ6mQM+W/di23rbGSiFdSwDJxuZgqQfoG4UHqaGauhtN61qoWowXLrS2GtKhE8XI5KWqEjyWhwIazUw72cFQaeilFyj24lwsFHJ6ZweHJUZRFD+EjGltiqimWjU5bUB3fN4ozsyN4aN8wzs0O48zUIM7uG8LpfVWcmCxhPN/BkelRHJyZsq3CsmaIYZbMU4okrWhQGQYrRZw8OIWDE4MoexkU+Ha67OPYaBHnZgbpBnB8smqrdTxi2lHVs/wyXByZm8TMaJn1HDOpGIODVRzaP45T+0dxmjg9ND2Ih2eGbbXJgZECRvIJ8qp38LuE+U+NDeEEwz0o/GeJv9zMEM7MjGK8lEORWc1NjuPY/kmcmBtnmlq9wjJOD/CeYel3dGoEhW7IqnEKHSvkRwQXk7VhafSfSH/xEG+01ZSpm7zA2sZe1MXtLXfwubbD0hxtiyB+6eHh6o7cYwZEUZDfXKwLKSz0J3zvze+jgqpF/KW0mTrbq7iFaSp9vnKp93hPSDEsG74p8aQgV72a4Y/xjI4E29qOEdwT4T03/YdeWPtN4cOAFN5amdHfjuqubCOoPnTD91afdDJmSCbZYgxWmBYLWD1S7ujIHjNiUFD7HcohOinWWZ22vZAOllbC8ssyjGcGEr7vkk/Em+Rf2w2CfuJS8YbwsvOdxEPsIzxPa/E8ROJ/GQL5pKDiY1tdwPyFsvMTxvxzSb4H+o/yf/+7+wNIF6tEsA90dWo0Fj0o8NXXdtQlJyFGozoqSUshWJdqyexoZCRhnWXYe6nXbAYV7ORHsOeXWTd5tlkfYb2O86+8xljAY088CS8oGK9l2RFura3gS1/4PURJB5//q7+E6UNHETPO5vYmXnj+OSyubWPi2IOYPnwKTeQprZ3eSJMbdrZWsDZ/FZlwl5wgBiRm7FdL5QEinSBsNShP6Es/yXj1CwOjEzh6+kFUhkfQIPqXFlY5xmixvEyT5cgyrLbl89RXxi3rU7T11RDHDZJnopMMdppcEEUtBOzD/XyAiGOM195ZwFYog1ye6XXtDLBTUwM4OTmE+Tdfxat/9lV8/rOfxND4JErj03bguQwgGnvo7BT1gTqTZK3WwovvXMbg2ASeeeZZrK+v4eLlixjl8/HjD7h2Q3rZuS10+pNszOVy7PtjvPzyy2b8OHnypD1Lvut9/9rvD757UP5Ky6WXGkBSEJgBunefQgr3BYjhfRt0dG0mmk/BPFTwMFpl18iXklfqACXonBjjkwQyr31/XVNIIYUUUkghhRRS+HEGfcjS8SM44X3EUaQ+iEPea6ur1Z0GNhshomyAMOObYsQUY70PazMqdLRtijbKcsYLzQTVs7Zg1eGlxYy2oQCmB3KYGSpiquJjMNBh2B34McMlzvDhKzwHoEpZaiB9wkk9r+tddb9c//kvdv34mq3Mr3vDWU64yaDgE0993Ff9LiaqPvaNFDAzmMdEMYPBbIRSN0a+07FVEpBSxuM9nQ5D1fkPnowgLIcz/nj0y5F+AWoJsFJrkXYJYj5L2a01CVnPZxosQ6wV10xDyBDDe51TYihd5hc3zWVt9baLA6slqdxbyHcbyCd7KER7yEc1+DrANW7bLNkM88hFbboGcolLx0sadG3Gl0KjV1/KS4oc5d2J0GW8js6JYBpBVwfHM2/6I27ZQbRZpSU/0lB0NRNKh2VjvCAmXronN0gh60esY60wiYhr2EQhrCNH52sve81kJv375RYvFMIOyxEyLMtFJ9w9lklbctk5hQk5k/l4DONb2doM32KabfoRJ75z/OJWMH03IKw+EEgrUwVldSiu6pW1wcBr23VeA3jaU/6eyGS7OyBvU2jafV9d5XhdVJOfU2h9L6DHSfcoyATuztH8jjdvHT5qXy6Ow9G5Pw/+ovcp/OVAVSGFqs7OF89IJdkHk2RqbzK09p7FOfbtznaqlWXGlwwjI0M2r/NotEpJ9SNDnZSivGM46QKs/UipqfeSAZK/bC8d9QPkaZ37ovn8CQVbqxtRhmmlm+MLGcjV5jWr3/MCppu11QQZX+/JNcxHxjLlafnqT+Wh01kXcjFxSOisLcixTPcrH5FcDlR31gbv6mFEFx3Qra3K5dQPR5Q76oNNbvSuop5RnIlphWbEfijK5OkjOch0+KN01ccrbiLjmM6vIttou7xr1y9jdGIER0+eYD7kA6VBIdaotxHkyyiXBpCwwkzkKz75ICRe+eERFIcGyZZKXa/4y3dZ9XFKQ/kTP+NT9Wd8fev6VWxvrlN8BtipN7HXjBCSKRRfqzS1zSVs6ysZ1is4tG8aowNF8if9yWfCIeaPWkLWz2N9q4adJvtZxm9p8oEME8Qnz/TVx+sMsRz7rw77G0dPD0F5AJlCFR2vSB7PIVsaQqY4aDSWcSWJmBrzUPsRyJjns+9m9sSTZZOFmHhqDCDam8KZYSL2dTJ66DyQq1evotVq2TsZPO5sIag2xLb3vTWEpJDCe0FSIYUU7iuwwQxlKvsf5PhRNz1SRjVPD3YEdwfZcvSTDLcuQQMUPqeyOIUUUkghhRRSSOHHBjS0+6DhXV/hknAsGHUy6GZ9xFkP2/UQy1t72G7FiDI+dN6EFL0aJ2pmsUaOTmXRMzHog14KcKamw8b9Tgi/2+bYM4upwSL2DRUwUfYx6PF9JzLltR8zTM9wYoYUS01jUylhpVjWKhQ32/SjOjM86AB3M9zoYFTh3s+pwxy6KHjENwnhhSHKmcS2h5obLtIVMFrwiG9s545IMSODh2bdak/2rraN5bOl2p+Bban6aHYz2I07WKvVsd2M7LB4Uy5KucKwmvFrRgcpCxnfasIe3b35M0w3G5vrMHE5EtmUlaawJB7a49y2CiOtkYmQZLtoe1lzkSZDSTEjtKy2SFl+B4iydoZFV2lpX38plfocIn6QoUuGHNV3Qrp1ERL3theYMyOYwgphlypR9uk8ZDpyAb83fKat2ecdXp3qTXSDpSdFHR/5I0MXulKieqbg1UqgjK1G74UXrRle56BIEWgzoy2qo5P+nJKVYZimFHPiXxmdHEd9FHB0cODyUa79FUSWL/PJSBFJJ97arrWxRac2Ihz628I5bIWvc8LR4hJfVz6Xlq3QoFNtuRjfPSgdKawd9j0PQo+C5u6Uq+dDxOVj8QwfXg1siyXi3UtDod1fCt9TsGrp0ZbElrMVZny2tsz2m2ed5Flj2YjclrC1kt+1FZu0y2RHpwNgu9NKt0CKALJimxI86oaUWyFKbEvlOEHBjIYtk7KSax3GE0iWFZmPzpqQAbhEmVOi7CkTlwp5oMIEc8QzaVPeUI5nO20EiVvB15VBk+kHvvoHKaLdehXjK1Pkk+uJj4wfutq92gWvah/3I6jcanUqvpMRkg/2xp6tlVK2qrcy44b1aWqb6mvUz6ldKpRkoLbLouw3+U05zLqydismIJ9YHPZFOhxfsiuOu1hZWcFufQeHjh3CyPgoQp2FQZARoNVoIZ8voVKsUnSL/5yEUv8VMa/y8DCqdDpcnQwk1kXHDBAymBFP4UAeZLYqhVDA/K3r2FhbM4PBzl4D9XaMIF+0c68k+2XA95MWyn4Xxw/PYmy4Yv2WVmWa6c14Wn2pmfDRZt+ztZegzm6jRb63rTkZLoki9u0ZjJVybCsNM4CIB7u5PHLVIXY7JUpgcr+XB1S+8jA6OfqpDOJlls+oz0L5vs4lyaFrzKr6YFnZJhK2Gd6RvZ2fDCDDpMfp06exs7OD1dVVxvXvvE8NHin8oIBNLoUU7ifgUCPhRw05XwMfrQA5MDXCjzf2HTYQse6DT+qNrEs0H32g9EQ9f1NIIYUUUkghhRRS+PEDjfP6TkoUHW3Lp0Bb+WSwWWthdaeO3XbH9tLuaD9ujg6lXJGzsaI+5Hkj5YpUXRpvBlneJxFdGxU/g7FKAVNDJYyVc6jkMihIed/RSad0DKNVBVLrSDEiTPQrp5mdfYWwGTL47NQuH82Zkqjn3vtZ2GGmMTpRm290gLpWRGgFQ4v3MYbLgR3QPVUtYqTgI8+wtgqCV3e2h2lKTKlhCg46jaRtRjPvEy+LvTCx7TTqURdxNmfKldjiaGMZldrVwh3oPbjxuJypD+lEG+IvQwPk8uh0i/ST4wi/G9D105PyU4YlnaHijEwa5/de3rna7GFppvhgqfM7wM5MYVxdVbf97wXpgnqh6BzmziSm1ShamaKrOyTZjDUMIMVRwO8OGUEUU7wjxZsZMsxHYZhON2tb8Cic6oGMYWGlJHWzxEWDvsHA5SGKKA+l59LshcsqLKnGNES97wWInm7bM3GiUxK70ksR6bNuE2zuNVm3woxOYYmbOO/bcRDlXGzR2XFMnx507vX3AEQDubsYKGkZO+4Cc5RSzkI4f+M14+M+ToIeUnzQ3fcMxRS+DdQe+lsJWtvv8bSIL78C22sQsZ20YuR4DVjBasHiIrY88l7INhdjkDw5TGGTbVNeZSi9fbZpX0aNGNV2G2NRjCk2oBFeB8mLOcnmpAW/VUP29gIKl69h+Mp1jF6+gqlbCxi9eQtjNxYwu7SOkeV1DDUaGPQ1A76JfKaBareBImW7bYqlVX2x2j3bP/HXGU5aTXaX1xy3mRN/yvWe71dwxkVSh7JQNS3Qr6pe7U0bStr2ZJQ3kjv9lugMlHKOfpKtkYwDZqTuGUDsrd7rj1eFEcdQxifNFq6zrgdHRvHQY49aXWiVkHRCnThEHLJO/QDFYpkxyWvCh/GMP3lfKFcwMDBouFqvYP0J8Uh0QHsRXqFsRn9buWFc2kVtbxdrK0toNlqoNdpIKHR09pGMDOIRrVCsEvWD02OYGR1Ajv2o9Ffqa62UvGoLSetjWcZsUMJuM8bSZoKWLGk6QN3jO+JQZEc9Usyh26454xzHJcIpW9ZqjwLaCccF7Ds7mbz5ZUpVcNhDTAVO5qs/Eg1yQcHqR+fmqL9Xn+T6GQda1SGjjgwdzzzzjPldvnzZDCB944eNE3jfDyeXQgrfD3AtMYUU7htwXaf2v6W050ccsH9yiAMqCV8+ZDU/jx8w+vCxkPzVh47FlUCXn1wKKaSQQgoppJBCCh93kGLtXidNh8aA7pZjPs+3D//NWgOr23vYbSdI/AJi7e+u2Z09RYDpMlx0ul4aHSlndFhuBjn6V3IexgdLmB4uYaTomWEBHbdiwlYwaIawZivzKqWIwNK8J10pNyx9e+aLj+jupMFH54SzgHcaF/OqCUOm6KCzUbC2t9Iz8S34HUwOFjA5UMBQyXcHdsugwPG1RsoijVbPaFWM9lSXetzSV/5KhWNut5VYy7bn6PputYMURYaPlCC6yhmewuiuu1MQGT26WmsiZUqOeRboNFvVuQR5hpECKWuKx1wnRE4zZoWnlCyGlEolxZgzYqgEWiGjq8LIkGErcuhkuNBWVhnmmdF+/7y3LXgML+EuZPXL+rzHCAKtWGEdy1l6/L6weMTLtlYTnZinaOD4R0o1GT+Uvugv4waDkz6m4KITXR0P6FuF75m2KC0DiDDSVU71x9rge10NeXl+ZLD6oFMyopwo1q8V+jInlpABNncbqIdSrkmRxjem3BKucsLFgaXXu5fxI7BtvRL6S9HdL8P3CpQTeUt5Wr4ucSuL6s3qrl8mVy4XXrSmj13vxhPozskOe/wAuBs2hQ8Poq0OIVdbUP2InAk9Y8lJXlVvXpQg145RZpgy+c/XHkaJVkmJ4zuUv+SlrQ34i2sYp0AP4jZlVIgg20ExpkxY28DW62/i1vPPY+GFF7D04kvYvPAOwo0V26owCOvYuvgubn/lq9j+0lfR/OrX0fzK17D7la9jk27lq3+Gm1//BnYuXyYObfjhHjqbS/DoSs26rRDJx5TvIWVnrPwdzp5WqhB/x3u9AquADO947P7lHdHDzmfR1mLqF9j2RA9n/HD00jktCiNZ7Q6oV8w+LV14t/JD21+5FXzdLvsDxrMwCtJPzzzY5ilv23u7uPT2O5iY2ofTZx9Gh315wLGA5J1WXCRhG4GU/8UyeYz9vJzqUSkRiUKhjArfZbTqo+evs2m0iqRYqSCgk8HfyUOiwDha6bG0uIDNjS2E5OVEswLsnTOva0XSoekxHJ0eZVtgPOKpFR9ZX4Z/htPWbhZF5nKWl31UTLewumu9UMcj9nzvkY7qfwYLjBc2GFGrKbPwCiVA2xRm8qQZHekUybhUrCBbHbIVMpJ/0qEJb/4gFzgDSIb0Ub8vQwY4riE5DIS7/PqGjWPHjtkZIAsLC7YNVv9dH/r3CptCCt8PuMttKaRwH4A6GJ/C36zt/IgZGSpjqMxBEgV/lp2i+/C4d8ChOzdQd35pk0khhRRSSCGFFFL48QB9ZL/3Q7uvQNFVY8Io7mBjaweb2zW09M3v52y7jbDj1KPajkkz/KUMsJhSGECzJ6Vs0AxNKRw8DFUrmBwdtEOyC1KOxw2GZoKmVJB6Q04K1iy0RYYpWg0PpttTXLscnYJGV82W72/79GGcZqrqHA27Mu2MKdCVpmFg+UmB4XHMrFJpBqcUJ1LOa3uQrmbRSgGDEIMlH1NDFYwPVFDyPGjLLyWh1LRqJspmYNu5eEydNLV1E0wsIwMSfGw32tiph4gYp9tTsKi0TuHMG9UDf+7QhqXWOxk07MBVkcd8nQGgm01YPzCDQkT8bdav5ao4buWFlI22bUqWNZFhfeo+IyU9wyg06aKCOxo7o47eCPu+Ik51I6ODToXR6gvhqq2x3BYsCi3K9cqhuHzU90auq1U1jENcrWQsR7fLchMHrVbRNlkyiNhWLMpSUa3+rQIsvGbCSyHsZkfru0ZxfcbV9lp8z+CaXa4D9jXrvb/aRMpChVe8jw49pO7cSXnbw4+gsxb0VGuF2K01ibJ4meFYHqNEnwd74UUbKf9UgwK9C7ra5551QJC/rXiy3L57uDcVkcFt59IHEVX5MjfVOcty72uHg5XCebwfet79ty793sN3ipPCXwiqAxkvZSgQFcVP2tJOq5v6BpA8+UwrQHJhF7mY4Si3xXFZygBtE1TYq2H1pdew+K0Xkd3YpNhVWm2UtRLk+iI2v/o8lv/0W7j+/PO4/IKuz2H+uRew+cbbyO7VkSkUkZ8cR2l2AuWxQSIQYfH6NWyvraHBdrbK9ryctLEVRfCiDIKVOmqvXkL9/BUEqzuosrmXkwyKURcD2cC2y8qzLeZ5lWFH7VktwMR972qyje7+BVLC5JuTDyafjS6qW9Ufe009S+AQrK2JZnx2tLMQlMmUp+xb1BdI3ncoK0VtS0sheKM+0GPfkaXw9LsR9lZvY3VhEQfmpLCfpozSOVaeegD2hxGaMoAUC8iVK0zfJy9ShptspSODlnJlVEoVPjMT8q76T0Gz1USxMoBSdZDyxJAUEmYcljHh1s2bWF/fYnjKf5ZTfppI0CKfTnD8sH96FJU8e6JOCG2nFcbsm5mADAfCTbubyDAuM3soo0TORyOM2auxZ2M6MrroaO9KPo+ST7+2xiGMQ9r6LE+XvKn1p4xo/RJ7DsRBHn65ijzLqjM+4pg9u/BWfjKA5IgQ8WUSPVDvmDA+64me2ppLYwg53WsbrEajgfn5+TsGj/45IH0wQ0oKKXwfwHFcCincN6COkEDhrZkgcxOjKFDwavmpulF1DArTB925GHKpIE4hhRRSSCGFFFL40QY3ervr/iLoj/P64BTtUkK3OF5c297FVq2JRqSthaTMNVW7zZjMaFJNLwupaJWO9AJOcSrFClDK5zA6WKIropL3TLmirSy0DRMYxvbrtm05zJxhigopS0y901My3HX9EBaKeSjP3v2HuApXlqSXY9xTNrv3Lh/+EjcpYEyr4Sl0BtrKyGKTDjpQT/uSa+uukp/FaKWEiWoZ1SDnFJVyDKOUdfy2lD2WFJ+ltEpi+ngBdI7KVq2FnUZs5gRtZeJWYtwLGo1LVaVPVybSNTMK89Cz8hLuzCmj8XyCxOuY8SPU1mW5PKJ8AVGugCQo0pWR+GW0vRJamSJxc0YQt+KDTgYTnziwHHHAd4wT+XRe3sJJoSZQ3Wgrrw7T11ZoUvlYbbCQoqxwlfIoyRaZVpn8kjelnG3vRHxj8ZGUTT7x6+URa2URn0Mvh5ZP3EmfJGC+wsVzq1zcqpOMGTOgw3z9EtNmHsSNqdPfYz4Zhukin3SQ5zeOrVoRRlJSiX7mvhtwaajMRn851rc9kVfUPmT8aKmORVfm66AX1oV0Xu8D995RsJ+PnMP7L4YPDtXP64PzFNzNiY7B+vfiMOHiYupX+PWhX54eWKBeCcgH7m0/1A8W+vj3sbiL818MLuxd7HsF+zb4oDTl12ul3xH0ru8c9Kl0V/68P1/hIp4OyNMFXsvkqQI/3G3lhOK227jxxpt49+vfRPPGIspRRN4nJ3YiBJRjhUaI+NYKmjdvId7aYE7OLFrWKqXX3ob37jU8UKzi6YcewuOPPozTJ09gvFJF0GjBo6iOc0UMPXASM88+iX2ffAKjx46gRflWGB3FLMNPfeppzH76GVQPH0EuU0Blm/LswhKyNzdQaRLvdgcr167j4ksvYfGtt9BeXERhZxdDxGuE74aYR5XtpcDyBSyXDCJ29g+d5MZd+CDKMgCZ1miqsLxxTU4PffdeeC/tf3TByuRuvw1TyRwZQ0QfyeP+e+MHezDzhhm325SVdv6Hav2Ocl0RJWvId1o9QSfjdzYJsXF7Hh3y1NkHH2WfIGMAuZN1k2VfF8YR6s06/GIJueqAyXIdgaEaoGQmz2Xd+SDlAdu+ypT8wpUhwjBEaWAQ5ZEx62vo7cAK0cHirRvY3d6SRcAMM+pFQD4uF4vYNzOFoUoR3bBJHuvAV7/MttC3HVgfqARV+ZS7MqrE7Ce05ZatHGT6OtBfK0lmx0aR43On3TA9mHD08+xH2KfqsHTbYk5lYh+kPjmTLyOoDiNinCR2K6e0sjFHcupQdZPZknnKXiRQn8znLPPrrwKRi+MYD7GNafXHtWvXbBuse0FGEsH31wDSJ3oK9yOof0ohhY8VqHNxs8KcuwPq6eis03uPU4egV3rSZ56WyndRodA+NDrAj1C9t66PNwqpjpSOHUp/ppQ+tNSXvHeWUAoppJBCCimkkEIKP0yQAszN9tSTxnFS0OsTR+oGuf5o8L3Q95eyll//DEk/DgZ1BkU3m0Mt7mJ5r4XVZoKGzpXwihwh+gwj5bNiWmBTDsiIIXWAFGo6KyNIWiihhbESMKsDwysBSl6HY86YcZ2iwJ114TK12eYaw9LD/Hro9nGUuwMqKy93y2te73N34zn3we8N5NGDe9+Zs8Gv8hK+7sPR8pWSyFRJon2MTCdEIdvBaDWPiaEiBnWuCemQT0Lk+F6ztz2lYWNxJeLSU+IyptTiDNZqIeokaUcHqqoOmL/y4i/DuXrsl7ev5FH9ys/QVIL0lnFFY/eIdH7uzev4wouX8e9fvITfffkK/v0r1/BvXrmFL7y5hKvbHbQ1M5V1nySuxJ3Ax0qYx8u3G/h3r1zHb798C//f86v405shboU5hHxvihmWX5tbXVxt4t88dxWvXNuAzrfQV4ZA5pg466NNPnrz5gq+8Gev4t3FTTSzRVPCxZk8Yr+IjSTAG2tt/OHbK/h3L83j3z5/Fd+4uoaFZhZ72QDXt0J85dUreP6deWy2yF1+noXTrNwAbca/thXjT16+jOfeuIxGKMWR4yMt35Hiz9GMwIvVm9HJeX1ksIojtVhXWdaT7mPWh1bvJCxvSL/tVoT1etMMPDIkakWTlHEGhhvvWUfCydqvYcoE+aw2Jvro6upfPObqR2CKzp5zhVIY3Tr+uisL+sB61dkrfOHOQWFK4h2Gkesla0CMSDXJAuHnygjyrsKohcsEpVU1dnZM1x1Kr5VUVuNEQlvciD8M2176bkWYVJOSFUzXY2lJCzt0WGF1FW3Mr+ffu9rKF4ZxV7U4cpiupHHfGGtpKnO5HjCFO3Q115MxUuBKYWp8wfC2bY+caMDw4h2FV9hsRvzsrkrPkZv1qNnzLJOtQrJ2rboQjgzVS0v+uhpupKjFEQ3YbkQTPcuIF/DeDoVmHl5Wq36aDNdmPPqpIlVvjGPn3qh8jDzAMsQXrmLnq9/EwPwSSmHMNDrothvYvHIR7dfeQPO5F5C5egGD7S1Uui2b9Bh4BQxWhlFUHSURYraXQidAtZGgfeMGhvwODh+Zw8mnPoGJx5/EyNNPmVFj4tyDiKtltvcMWmzT9VIF7cEhJANlPrMs+QCFkVHkxqdQmJpFMDRo+EetXbT2tlDKF1AoVlFvxthaXcPtC2/hxre+ioWv/BF2v/IlNP/4i4i/9HXkXnoL+Su3UN7aRTF2POab8Ua1rnYhViQNWf6M6TJYU8abrt6kJPeSxLZblCyKSdOYeHSycnf5XxXT5w+rV9cizL/DjKT0Vl0pfVvNYLnf5a0fKBiuvdbDssipDDrPQzjpTy1avJLI8OoxNMsrflJMVwaVyafcLSHKskO24oinnLFa/UTHwqttiOWyaDaauHHzBorVCk4+9JAZ/lUDHbZ33SZqQ+Q7bX+V0fkX9HNmX6bLlGQMyebIW6MjCMoF+rEOmSfYH7IC4RVLyI9MIlMYYJ6sRyO/+tMW6tsr2F1fsq2p8ozjxU3ybAdHDsxidLBqO5lISlkc5hP4GkcwV3nQX3xihiG+63LMEZMAuSLlsPjJ19ZXbZQzbZyYGYcftuC12E/zXY60Qkf9S85WwmQyWqUYGl3kl2TLyA6MIkt+TuI6Ou0NdoM7yAWatqAtwZgW89TyG/Gp+h8hKGlzrwFEBg4dhl6tVtFsNs1p9YfJTYaT668K+d6CIUei9K/mmcJ9CN8P7kohhe8r2GCRgsu5e0FP38kJFF6zADRY72Io6GCKH6S2hJwDNFnFu+qcbIjKDkeDP0Xr2Oes7gj9tFJIIYUUUkghhRRS+GGClBtuRKjPfvOxJ6nxNIrTvfw+GFxYUzzqnh/GZvzoemjFXazX2litR2hk8giz/Oj3CoySY0ipRxmjG7sPdlM6SCmRsbGjzi8oZ0OMl7OYHshhJA8UuxH8JOaYU7M6hY9SkOLCVBnm+mW5M9Y0tPv4v9/1Qfcarb7fvT/8X/T+L3L8NbQ6vLoxsrTDorv2Lc92ZNhpo5BNMFz0MF7JYSinLV4iBHHEqxTHTIfRTIlnyhAmJ+Um0w0zPnZDYLPVRZvvneK0n7NAmfNJdSRavYdGemsqMr5mPIXpZlmHMV55dwFfee06vvTaTXzp1av445cv4Q/5/Mfnb+HLvF5a3EHEpLxcxlb7XFrcwB+98DbDXcSXX7mMLzLMH7w6j9994Sq++Mp1XFjcQlP79kvZz1q7ut7GF15dwBu3tkxZ7tRPLCMLp/3S2+Sti4ub+Oor7+DS8g4aWR8h+UjGi4XtFr725jX80UsXiNtNfFFOuL5yEV98/g28/M4tbIcx3ri+zPiXcGW1hmaH5SR/huTDRtbDS1f57rWrWKlFiFV+IUHMRIuYNGXtkDbiNUdBU0b17j8yWAKqP0drzRiGtn+h07ZdjaSL1d0m6jFfa9WN8Ohl2K9Vx/HuSeB43zmFJ8fw6r697mx3IyWapWMI3OPeG19w772bGd5lncgZB5sxRko2GSKVRF/xZrRiIDlTnkoekM6OWZUYA7Mw4nvhpEx0FoXWHUV8p3NPrLwZnWeTI03oPDoZ9XjV0fvNJIMmadOIgHrUQa0tl2CPrh526Nfluy7DZBASB8VRXerMoZhpyMikdBMZl3p17MyRxJ11IoqoLMLJKchFd1dfnu+7VWsKw3cyHJjWl+GNhnYrZarz6/9ZIqovTQhUyY1siiN5oHd3KGLPdrC3KZktFOuQjvmLZSRvZcTTmQGmqKUXFF6KYcoDUdpMecrf0nb1pm3t9K1eTDqIrt9A81svoXT5BortiGl3kfeBmWIBByhv/IsXsPPSt9C5fglDYQN+TOESBKiMDTP9Ftq7m8hBOgAfXdaBnw/QzLZxZXkBN1fXsNmOEQ8OIjMzicz0JNo5rfxyhr6ml7d23KJPTNbQAet2xoTOS5DOQP0Jy9FsbKMV1ZApMo9CAd18AbMHD+Cxc2dw7uAMRuvbCN94DZ033kDj5Vex9I3ncPNbL6C+cBu5sIVC3EZmcwP+7jaykbY7EpX7dBTV9KRa4QuCVaPxLu/5LAOaVSrxdH/myz8HelKNySmNu3XJUMbvPdeP8EMBh7/D0xl4rb2JFY0fHb/LIGJyw4ywKqnMEI46CqCVc1G2TFfo+bLv5p36ma7HeuWT2o7HNpVhHTZqLVy9dQNzxw5jcGKcaYu7KWHFz6RRFLEBs/3k8nnSnX7kuUB9HcNks2yRYgO68sAASgNDlNl9OjMsxwEtxh+amEZ1cIzpMU+1ZfWhMrOFe9hbug6/voHReAeTnToenKzi5EQVVY/lbzYZnqmRB2K1mXvEkzIVPRy9iK8puSKUggwmygEGo122h02cmyriyBBHLY0l+J1teMxHExSSDulHxvCyWhXasriiptsKK4dsropcucoyNNHaW0NrdxkBxzqBx/YSqUU4HpOcyLA+xE6uDbtr/14Gj8cff9xWgdy8eRM5ti+ByWQ6ve+H/Z6BhBap4pxrPyncn6DaTyGFjxWoL3eOwv2OcLwrJG1QZjLtrpCzbqfnn2FHxX4AY4NlVPkt66sVKD1eOuxIXLReJnq406ukkEIKKaSQQgoppPCjCfrs74Pu7j6ZQkBDu/f7c4zn9T647RwOL4dGDKzvNrGtcyk4LHSKPY0HFYGjSsax2YxSNmgcqnGlp22J+PEftVHwMhgdqGB8qIJyjv5JZLN5tQ99fya2G8P2x5cOp3ux/3DQT+fDXj883KWhrlIQS9mnZ5a9m0Dn62kP8oFyASMDJRQ5yJZxxBSi9t6p3fRnSg4+iQxSEOkA2529NupNzeD1+MYpt+6Fft6aaeoUf0xDM06zHcSeDkVmFTCqFPGx6jafR7lcxoOnjuNnnz2DX/rMGfzCUw/g7OH9uHxzEc+/dRX1MEKLqV3daOLLL1/EO1duYaQY4G8+fRq/9sxJ/NInjuLQWBXXr97C1194F1eWdmzbKlMSetoapMSPCSlIHX5y0j2SLaA5wZkgh0yhaspr4dQhr6w3O/jW2/N46fULyMRtfObBGfzyp4/hb/7EGZzYN4ilaxexMr9AHsrh1IlDaCUZvE68tttttEhznW+ysLKL+cUlDI0M4+SpgwgCn5kxf2VOED42K9+eROeecuq7BNW3+MDmHVt9si6knOetZkrX2xF2G01kSZMM6SOKmJJQ+wwrPC/yez8oTYFR0PC+G+bu957uyT09x4DmZ4YNJuBWCrjnu69dWE1+twnw4hvyo/jVrXRgTj06JcRP5w73t3qTYlsT57SaR0YIqTjDTB5treTxSoiDMjq5il21hVm9w7qlAFklH9/ebOD68jYu3VrF21cX8Prlmzh/eR7nr9zGa3fcEl69vHjHvXJpAa9cXHDPvTDnry3jdbq3ri3h8vwKbi6tYXFtE2s7dds2TgYVbc2m1UEyjiQyuGRlQHJ7+YdmMHOrRRw16FQPYlDRVfXJ8svZW7VpyjZnVGHaXUeHhO0r8SOWM0TIa+gnpEHHlNEinm2vpuSYhLagi7XywAvpWkyPrst75qEZ6W22jDZTl9EoTz4J+NfpCOcq06uwhlgGJqzt3IJswKvDTUr9Fq9q11WmFa2uIhuG5H3PZsaPjwyZEXZQdbuwhtXn30T70i1U2cY7mRZy1S4K2EO8sYiq3yV9gL3qIAoPnMZtyqqbC7dw48tfx86X/hTxcy+g884leLUa8sxXcswnXXSmSByRDuRzI5lPP+avwptcImmzfOdp6yy9L5KWrJ4uZUppdhoz5x7EiUcew9j4FGmUxfCRA5h75jGUHjyC5kgFSSlvhnKsrWHnxZew/rVvwl/fsbNCMqRr1yPtOlolI0U7aa566qrOS+TFIt+RbvARkH4F8oFoK+W2eF+rbogd6UycWA71bQK1L63aKZD5c7IzsEK10sJkhirVWscPAWTgED+S0A6DHh6GkvzUR7Ac4k+2T2d8VF3Yf48f1eLVjp3Rug8mYfjO89lOItGSPMR6Vojd3R2srK7h3GOPmaFBcoGU4FiB7YhyrCUjBOu9XMhTWLhVjjnyd471kg0b6LT2WIcxRgaHMTAwzpwK5G/WBGWE0ij4GXzi0QdxcG6frT5kJ2E8L8NBLo7QXryG4uIlTM2/jaMrF/CUX8PRaAvj8S6K3Tqy2cgMN3bWh5VdNGCJWGCVNpORUVCr1MierQgzJMZJNLHv9ts4uXUBj+Y2MNa5ikzrVeb/DhrtW+gE7D8DtknWOVEkLpQATM8ZiclnKjtpm80VyELsg8I2GvU9jn2yKBWLLJ/O+HBS24x0dvfBoH7j5MmTth3YysrKHT/B980A0udju/b5OoX7EVIDSAofO7AOTZ2WOUFfmL0f7oZ09/rVPJkOB1NdTE+OIccBi2sEEroM6YJZkkrRHP0+KPUUUkghhRRSSCGFFH540B+j2VjP/b8H+uPFfqj3Ol141cc2P9ijrI96J4P1Zoi1ehutUOohjhOlPJJSwZyUQnQaPUrRxOjaokSrPqQEkcFjdKhsZ34UfM1wlsrF4fBePH4coIv+LO07ClQpurscZ3tAuZjDgA58J020TZZmRWdIMDmrtyxpSLpr8G1bXpAsrVYT9WYbiQJkSDm+v0st0dB9vPav7nByjeE121zKWBmypASXMlyKmC5KDHhqbhLPnpzDT50+gJ97cAafOj2F0bERrGxvY3VjHRus7z976ybmt0KcOn4MP/PoMfzc6Qn8wqkR/MLpMfz8Y4dw6tAMVjZ38PKVJSztmWmDOEhFbBpD4iqs5NvjFSIu9lIZ7FwTUyCxjEkXb1xZxmuXbmNibAKff/SE4fTTJ0fwuZPj+KlHjuPTD5/AI8fnMJQP8MCRKYyPD2J+aQVXlzfRIP2azPO1Ny+hvruNU4f3YbhS4DeNFHROWefwcJS7i5d+5Nd3Hw2cAZBV3Zs0lvE820ZGs6jDpIOt3brVn/ylyJJT/SpOf2XBdwcqyV2n1ETX97u7uUgVJx7MmgJY59OYsS7RGTziSQaR0Yg4Gk/6Abq+W2ERyYjAugt5DbM5REEeUU6GjjzWGsD8ZgtXlrfwzs0V1ukiXqd7+5rcbbxF9871JbpluhW8e2MFF+bXbBXRpds7uLy0w7i7uLZax/W1Om6sN+z+6soe/ffs/UWGvTC/gXfkbjLujSVcZPoXri3g3avzePfaPN7h9R09X1/ETfLH8nYD2+0uWiC+fhE6wDj06KQAFm/QmeJXRba67NGw58SvRgsZTaCVLG6VCVsX6RqRj2PEnjN+uIP6mRBTcDLO0d4MkOTTjg76t6102nyrg5OlSFYbpb/xK+ujHaHQogyNSfNOibyTZ7icOR3u7zGgNmiQStUMIIGPYGQYnpdFbW2dybeZqVa8MK1yAV4+g+GRAcxNH0BzpYGbz72J7uIKcp0mqoUucmEN8dYq822DZEJ9eAS5Bx/E+JNPYuTwEZTiBI233sXmV76Ora99C3tvvANvaxt5ls2kkXi6zTI12s6wQDnvqfGRl7Iss4zcfov9QZ3lIi29Yh4JX7cpA+vEedsvYKfjYzfOYDvHd4cPIPfUgyg/+wjGPvkoijOTKEiHv7aM7tVryC0uo8T0fBGX9Is7bZmHkGd6xSREUXSXCCKPyrAhHs4rX1ny2pRObbY/66vUH8lJaZ5hf8eiyDFd1b/8/UQHsqtBiA/UL2odkRJXiB8OaAs562/FXUTDbXnZw4deUsrbQd3kl5iU0faA4leFFU/KOGIrqMT/1hurrH1+ZekUjn2/tvOTEl9G/LWVFbMPnj37kAjBcKQfw4gDojBCu0leqpRx4vAhnD12CIemJ9DcXENjYxmHp0ZwYm4c+8YGMDU2hsHBCURkgJi0jRPX3gYo1x8/fRKHD8xaW2tLlLKNepQxkk+bNy4jv72E2XALQ2vXsff2c1h87c+weZ28GDWJa8fOIVEVy7gj52ikMqn/iVlGtrGQPEL8B6IYg+wr5hobmN65jvDCl1G/+kU0tl5mf3uFbbVO2dZFO8v2rXEL0zIjs/0ZKS1lrfTzArcSVivb/HyF7a2EIF9mrgpELEjvLvsB0VJxvxOoTzh+/DgmJyfNECK6xLFbVStjlI0nvqfgSnHXpXC/gpNwKaTwMYJ+hyWxqCsltHvRBwpsubvirf+eQpxCVYdPap/iuckxdqBKxQ3GJXC1d2svqEvGvbX7FFJIIYUUUkghhRR+tKA/W9yNDM3nHgWHU0a7bXRsRHcnVB+krO1mA5tJvVrXmR86i8LjB75mOupwz/7YU8qg2JT+UvppKyfNb89xXJltN1AJspgdq2J8oABbDxDRP9E8aqewuRfLH49hJUvDYkqnLTWJphSZoSghjXRIKsuqA1uHygX4GfrbDGpGYyT9mdGDdBQtpLi3tJhCo9VGsx3brFZbCcKry0Hg4rIG7EmgulaIoNOxVTj9g4M1iTWrNImPJj4Jz4jpBqyTsWqA44f2Wdz1nQZurzdxZWEH5fIQPnHmCPYPVVinTaDVRLfdxtRQBo+dmcbkzCiubO7i4tImE2eZja/0tSDukpJYyiPhxB9XIHINOSdDTrEZ18DGVgPX51dZ6DwePnkUZ6YGUIkbCMhDmjk+UsrjqXOncWxmHGUmMFoOcPrYHHJeFy+/fRWrYRvX15q4sbiKSiHAif0jbqWR6MI8peTuq8TucpwwNKSce/+304cA6aWUlgwbqhVRX21I5d+ttbBXbyPQLGHWXaRlIQTNmhcatm3Wd6nYMsVcz7lEWSJzxElK977rZaNwpgA2x3s+s6naAcKKHGlLJfKEZlJr66o25YDNJM+RgwOdHeBhr93F2l4bN5a38frlRbx2+RZeu3QTr1+cx1t8fufGMi7eWsHV2+u4tbqDxY09rO41sd2MUU+0YidnB/B3fDrKlY5Wa7D+O76711XPXSkXcyW7du1dobdySKs5JKOy2I2AzUaMle0G5te2cOX2Gi7evI13ZHi5voA3tdLk0nW8dvE6nxdxjby6vNu2LeaUHnSosVbssLza/k1bp/VnkMusJ4Wwqk1b4Yh3bEWRqo30cwpy8j3vPcpIGQB0MLnjfK3c6pD2UrDLaKJzKrSlkM77kGwQ7emr7QA7OiepjczeNvZsC6jzCEizgOEyMdNT5bF+tNJJGwOpKWn7q4h13PIyKI+MIi/F99Y2srU622ho281lqhXimiAMOhh+/Byqp0+hsbKF2994DdmFDezLDaDYzqG1ESLTYhlIVx2t0xkfxsiTj6PyqWdR/KmfxNjnfxqFI8fR2NpB87U30blyjfjGiLta4QYUiVNeNhzyinATD8rwakYfOrAdB6yjMus6XyzaagHH+rySJu1aG3GbfcPgMBpDg9ggr+0VKCfHxoB8gCAK0VxcQLu+i4nZSRSqMgaxP+lmkYsDDLMuo0tXsfXyC4iuvs0ybSCXrSMbbaGQlYJc5kjpMEj3gLzHfHUvRFWnJLPhGmfdCh4zEmR9NP0caa6zdyTbZC6QYlqnnyi1HxKQL52El1pev06m3CkLfW37q0wOEduZDCEyOIt75WwVF8sUsi/XVeMFiT/bxlGGs0Q2z7xta6XzU9r1Gm4vLGB63z5MTM3I3mX1pkYg+SoDSNhsYmhgACcOH8TxgxM4tn8K8dYKrr32PCYqPh47dRhzHAuMjg2hNDzIdsa02fl1khBJ1EbSapHHgdnpfagMDjEPIqQGp/JQVl5cuIlgcgwHPvMpTH76U0gOHUI4Po4aZUhL5VObIu9K6tsEDTqVSSV2K+F4I+owX60MbJEeAweO49AnPou5h89iYDxCfesC2nu7KJXGMTx7Bg2217DDkYvaYCgjWs5WM2mrPCWnc09kAMlQHmUpR/yghGJliCizjfsBr85o4VaMCBHh8J1B/cfZs2dx8OBBe9Z4QIYPnREiOn9/wQiUwn0KkiMppPAxg75Q1PWDBKSE2gcLNg28sp0IQyUf48P6VKNQZ0ehpX6yVGsUow6kD265eAoppJBCCimkkEIKP5LAj//3glOL3HE9JbVmH0vh7cDFsdnOXoBWJ4OtVtsObt6LOCbUFkdenh/9GYbshWU69sd0dC89lw6dzXdCDBcCTAwUMVjwkWMe2VhzUrs2y/pO/uZczh80ev04ghTaRh+ncbEPS1O1cUytVR/FXAaDlTyKgUdaSFUlJT3pJ2WKKMK6cwemMgmNwT0fzVBbKDUQJk55JeoJHP0YV47xNUJ3ijHmyWdt4ZLrdBAwnh3ObAFUYz0jhA+b9Rz7UtB2ELebxEnY5rG82ULUzWNidBQz1QB5acWkxNX2O1LMdBPWLTA0UsF23MGtjS2+79cpy5QhZkzL+IlgBgiiLefK5hTMItPW9i72WL6JyQnMjFRRSlrw4jY8zbyVwjdMrBxlr4ugQxyTNs4cnMDUyAAWNvZw/sYeXnhnHjp69oFjhzA1VEBOyswoQqy96HXOQw8vUa1POTl944hv7/3W+bBgyinSVdvvqLyxaM08Q/L8xk6dNNMs9B4txB8skx1STZoaNlKQfReg2FYG99gDFYgltO8455yfyiwOJS6sA+EjOqhd20HGwo/tX9tHyfgR64OQvKrzS1a2Gri6sI53rsqocANvX76Jd6/fxpVb67h5ewPL67vYqjVRizoIO9omizLDLzKtImVHweSHGTdkcGDadoS6lISkB5mKV+YlWtAJUzOsfpvjC5XUeEfGALcNV1/Za6tSzGmFRw47rQTre20sErdrS2u4eGsZ79xYwru2KmUeb1+9hWvEfX2vZStEZGgRjjZDnmlLuanZ8MpT9axVW/wxftF2OjJQ5GJtr+SzjUmZr/av9z0ZZ3F0F/A+Bz/R9lUyB+dYA1LYwlZSFBjOzvto11G/9C52XnoR2du3UabcKGglRTck/UjXbIfllYaa7YeVrpVdMtLkyxWUSiUzMkdb2wiimO3agz9UNWXzan0HO+ODGHrsHA6cPIndxRXceu5VdBc3MZCpEPcCYgr6IvlA523Ut9aRsN6TyTEkx4+i8OjDmH78CczO7UdhcxvRwgLLIwMIcSYOPkuTJSIe6Sblr4wIOnsiyia2FV+kFSJtpp8vkh1IYzGraEPZJO1DvFdHt9ZAdWgYGBhEW8p51S0Din7Y20W4tkqeyiCYmUS3wvedthmhKpkCqrUQe+ffxPorr8DfXKFfA4VwE976LZS3V1Bu76FEymnbLrVVtQXjMfFav+EQH+Esw6FJLPJmm/JXjsRnHcjfJKcCK8YPHEyuOs6yZ3cn53wl//vbX1k7yOTtKj9WmIWQ8SdiG5RT+1ZsyWcZQGQQtbMqWCvqUySvW40abs7fwJmHziGb06Hgyom48L0kiWRZi2OFYj6PoWqZ8pn8KH1Rq44LL3wD77z6PIqifdzC4DD5dHSAoofjAfJFjqTVmCAkf7SabZw4+yAmDxxkFsSX8jORkc3zsLRbQ706hO6J0+iefQzZU4+geOwhlPcfQ7fA9GSc4J8M/VoxovLYJAurXLUyldN6W7RZzl2WPTt3GLnTj6Bw9hzyR/ajVSpjcPZBjO5/BsXBk6i12GYzJcZkWLVx/jFZsgnTpbySPBIFZOjIUsZlA4YNikgoA7JsAwHpYbTq0fHOpOI/B3z1VYrDtGX40LP62++/ASSF+xnY2lJI4eMG1g313L1AQXunVxfovu96dxy48HMWs2ODKBey7Iz6n0VOWPdTtNSt4+wn6d7YGCGFFFJIIYUUUkghhR8J0Djt3uGfxnR9p/Hb3Xt72fN1yiCtz2jHwE4zxEatZcpMKUlsuyKFY0BtwaEIWv+h2ZXSCki1EGSkOk8wmPcxM1rFcDkAdFhtGCLn9KimmJCyxjQJvZx7o8s7148viOikjRQW+jOlBcfTUtrR2+aAdzsokRCD5QIKPgnS0bZDpAmjmkKFN6JQotmvSi6TBasAO40WGnHizmJgskpZcSx9e1Y8z5RbUvTole5k+AiYvq76yNVsVm1lVE+AkP4REdtg/Cure3jz2nUEpTIGRobQ1iqRfA65IIDPDALP4dYiDiqjl5VixofvF6GDYsOw4/iOb8VbwkdnRQgngRWF5bMrnRl6xAJ80GG32ioqE+ThB74ZD7rZHNodloBp+KSBDGj5rOjXQhA3MJT3cPzQIaA0jOcurOHK0i6GRifoN4My8fXiGHmdRcC4minfP2fGYXfv5z79vtuPGRWE6Wu2rlJSG9Jh3TIG1EMdvJvns9oWC0t8TMHF+hBYHRpe3yUoHUJ/ZZVrZ+7e3D3FNB/io1DGL74UoTrLQ0aLwFZFuFUeCZY3d/HulXm8feUG3rp807aWujy/ivnVLaxs68wNnVzBtGTA0Kxn1Z1oznxEdzMaKFMrqDM4OZrbE5/JT0mEDJ0m5ElBfcfxnTbzcVzEq5678nfvxPHWXoQzXaKZ4HRu9rsHbeGnsz/M6CLDRlC0Mu5QwKlcN5Y2cGF+HW9eX8H5yzqTZB4X+by03UAjYRk8pkP0xIM65F/bUwlfKf41gVAGEFvJIaOH0ZNFIT5S/murJOFo7S8hDyeBrVSQoUTmgraU07x26e8lRZZPW3Pl0K3kUcpTXuyuobN8FYXaKkqok4+bLK9O+2gx7Yi4sewe8SGt/SSDvJfDwNQUuoU8dpZXkNeh1MQ3Wy6hy3bciENsUoZkx0Yw+tQ5DJ85jMb6MhZffw1xqPRjRNsrGGrWMLiyjK2vfx21555D+fo1TO1sYrK5h2qrBj9sIOOxHoriE1Yi8xArSy7sMc8kV4Bf1fk+lFusbNt6j/Rosh9otFi/xRJQoMwg74lmZnj12P73NpDZWsdgLg8vp/ekt1YAkZ7ipubibfi7TQxPHUR3bBohaWVb+7EebG3D+iqS24vINmIMVcZRYE8ULaxg+xvPY+9LX0bw5nmMrC1iNKqjmoQoJ23kyGMy3uswecnQoMO86LTaRkZjOfn3mpbrH1le1TGD/NCg30e4hqU7tTY9qK2R3kYxtuVM/3wet22dBWc0tQ0ZByNrM864pzRsVShpKoOfzq7wZciKItR2t7G1uYmzDz1sK6HUlm0rPyVI/pORotFs2AHog6x75ZQnbzz97Cfwd/7eb+Hk0QNs322mzz4l52NqH2V0tYJO2CLKqoMu6m0ZTls4ePY0znzyKZRGhpGVPGUeGm/IIHljeRXbzQyaSYn9UwHtiPKd7UgrLLpd9aNt4sPxhg4q14oflYU8lrX2p9UbOVa0T35j0EIWDfLdLsNt5wexmDuMnfFngf0/yTbyKHlwEqeOnmZfTT7s0ZSinKDGLQkqMqgvJsWZZoayJRuUKRCKzJd9JuVNnnwuEln/YzH/fKbpGzlk8OgbxUVnwXdrJE8hhT8P7h0RpZDCxwQkMJ3QfA9Q6FNkunuD9z/ziUK5yEHU9OigDeJ8Lf2MtS8pu04KYP31Y1i3ag/Mi1f2KymkkEIKKaSQQgop/EhDf8AmhYDGcP3xnHtjChUpMuh0SPBWI8T6bgN7bSnafH4d3d2GQYpADQJN6SnFgxJhetrSSTuOa8XH1EgFsn1oDrVm4uf4LtOJoL3Edfi3lDa9nJlG33X45D72P65gyl46KStsOytHavu4tLNPuiy/ViSwnMPVAsp5Dzp3QTNg3VkVUj5x5E1n+4XLj+N0KambUQftWAq/Hs35qztVo9ydOmRud+pF+QsBu5GhgT9+zrY0evPSDXzxubfx+197GX/0tdfwtRdeR6PZxNy+SYyPllApsfYi8kB9lzyh/fo7rE2Wy5P2qIs4IS6s4STykCfPVIolU4gJI5v1zqs54qRnKbSl5Nbe/Jqlq82FZASQDjVPOuRyAbZre9hpNpBo2xkpsFUOKbAY2teM5XZstNTWV9k4xvFDk5idnUGtGaIZd3Di5H6jq09eE+91ROtczg7pFcc6tbyjk2hkpBGWxOe7AxZC9GU6Wr0jQ8BOvYW17QbpndcXlSkVzSxBOmrFD7NHIAONaMXn7wbUfpwh0jlb3c9072x9Rie6SZkrsJU3UuSSv7RqRttIJdoKKldEgzyysL6NC9fm8dalq2b40EHj88trlAl11MKuHSIuw0LXy7HcPsukhB0N7gDvZfgT/9kKJ5VR5e7hJhOhU9OKB2Q8dVc5rYySk8HQlUXGBIWVP98rTi+ulKNSL0pB6drAHXOJ1bjajq7iXeMAKXxlMKEc01ZadXLvVpjF4k4LV5Y28fb1Jbx5Rdt43cTFG4tY36uz7ZGXWH9ZzcYm/4sflbfbNlolEbg6MCU5vU35Sj9Hf50lkbEDtUt0RfK9ZICLzbuEvJ3k0epSaFYqGJmd5IVtYG0e/sYiSp0G/G5IFxudMvpWZ3xtE5RlXfikgaqgND2FsFjAxsoK/Fab/kyf/J8bGGCjy6NNngzJ+3tjFYx/4iFMHT+Mrb1d1Dst5t0kA9cQtPfg7WwiXriF9ZdfxvLXv46bf/gFXP3iH+PKC9/CwsptJJOjqBw7SJmgDNwKngbLusk6qxdySEoltEUHo4wrZYP9xw7bbFQsIsrntZGUxZUACLstRPVteM09lIt5ZPIF40uxDFMn7WLUFpjv5h4GJ2YRDY6gwXJQaBqPSRbE66sYZITBoVH4lVHSnzLMr2JUh23fvI2d517A8le/jMY755FnGSbaLQzHbTunSjWo+tEh6TrvQ+3EGbhkcHXGLqErHpPMc9tJqVw/RGD2JmFZB+J+61PJG4YWndq2DIDa5kqro2RAUG3IadsrW/3RMxYqBYGqU+1Ufb3qVDJKlbCxtmbyeWrfnHHtHcMmaS8DWDsM0WiwJZXLGBwesn6+wPBnz57BL/71X8SZ06cYzOWuPmJyehZjY+TVsIOI7UFpNpp11Bs1ZFn/T3/u85g+dMSdA5LVaimtrOpiZX4B4W4TQRyghCLrShMs1NpZ+iQkLzC8zmjReTqsKdFERbDtsDqSteQp0Yt8E7OPyLAfSRi+QR5pls9io/gILtYm0PBncOyBR/Gf/cN/gKmJEcZhX2UrrpSBI7H1cHx2u3QRD8pDrQKR8UMYaRWg8uKPSES8xGWiwZ8PGjv0z4iSQT0mb/f9U0jh+wXk7BRS+PjBe8SiDcjULUpAa6DrBuUSnvd+nEko60O0yI5i/1SVYxAFlKBVh8HBnTq/fiI9UNIa4MlLuaSQQgoppJBCCimk8KMI7xvE8d6NDjmW683gdAf70nkyX3jYbrSxttdCjcPBpGf80GBQikx9wtuHkimQpcw1jYNTIHUjDBWymBgqopiXEilGlmNKKTR1yHenKwNKh/HcGFJO41PpD9wzH35cBpaiq64sj1013tbY2hS5orIMQ8BAqYBSXtvgkAoyeNgYXdGkNHGfpFZjMkCxnlQ3tpO9KVPcW3en+lEsOstTSljNwM6YC7M64Fdzx5kN09IB3fPzt/HG61fx5iuXcO2d69hXreJnHz2Fxw8MYyKXYP9Ykd8Ibew2W7i+uot2QP7wtFKc2ScN6GyR1bU9zN+8hQF6zk2MM28pvDV1imWVoYtFMONDJwZZAgG/NzzdZxK6CLblD4ONDQ1hdLCI7c1lLKxs2JkOUm5K6as4okRIKjUzZV57s8PpN1zwcHpmCON+mzgA+6arKOV0Dg0T7URmRBJ/2nYqBo7bRLG+wtyxnKPmR4U7PM18pIDXip16O0ErZhvLEjG2LWs5yk9KNIKUYoqki8Pho4PVuXAwza3SI81FdxZfs9ltWxv7NvQYzrcZy7ZCgvhKId7seljebeHirVW8fkErPW7gysIqFtd3sFlrM5xvs8lNWSp5QR7qb2+m53tnLAuICvm8XzbJB8tZFBcJ7CqlslPcimddes65NO84F9qcvVN4i+nCGTAv+77Vjd5anbvc5aec1K76cS09laG3aiT2dN5IkW2kgHqSwfpeEzeXN3Dp5m28e/Um3rx0DVduLmBjt8H2FzCu1rnJxCYlv2gvuRa5OrUcVAnO4KXtcST7PFZGOWmhvLGE4PpFDK4sYDhqkFZttEmsUErZmOETH8NzB5AZGcTOyhIyK8soNFrIM1+/4yMbkdaRj6BbYL2KPpLTHbSyHQQTE2jpQPrtGrq7dQRSwrI85YExZIIy2s2QxM9ij3mF4xOoPPIYig89jJ3iAPZIj9XaLnaDLlrTY5j99DMoHD2GHc/DjeUlXJy/gRWWNjj9AArPPINw7iDlCtsh+wCtiGiX8sgfP4ypJx5BfnqaskZmInceCrHGXquNxaiFermEVqWMPTaLdkBqsY/o1JuIGg20pZQeqiAaYBiSItaqL9Z5phEi3tpFt9VCYXgAcaXI98xXPJ1kUSRv1hdW4DOclPQR89hVO5uaxcBTz2LfZ34aY6PTqF+9jpXnvomlr3wZtW++gPL1BYzU2yi2KJfUVqTIjll7ZiDQofYh2yslD/s2t12dDB+s+0R8x/R/SKA6Nz4j37k25HzcVc/O4OjO+tAqEGfsc+1efQH53ie/y3CmWmI4gZqMFhyY8p58myVPtNstLK+s4PjJk26Fl9o6G5Mp9fkjA31Mmd6MIxSrA3QV5q6/rhkHItahbV3H9J1RMocjRx/E05/9eZx58lPYf+wMjp04jScefAj7hgbgtUMcPXIMP/H5n8PY9CHbhlGrPA6ODmLC76BAfLRlXIYyTekqTZ3IIgNEh3Is02F/KtcV17Gt81XEeGEQI/TF/6xT8hkbDcvBlBiu25HhYhztZBQbjQK2Iw+DU9N4+BNPWHlkbMywXZhAlSBR2ekEkudaFdNV3jIKM724k2UZj+Hcww+7PsigX0ffGSSzbFxG9x59XQopfJ/BO/XX/tN/3LtPIYWPBWgodwdMTqojc0LfPUswa0aNOmx5WHdnQjzXbWGm4uHJB+ZQ1uCJHxs2m8A6Qw7aKIRdMk7ga/CpG/m5blPgflNIIYUUUkghhRRS+FEEjdnuGbfxw10KTFNKSLmZ9VBrxqbw3AulVwpsxqPGkoqnEaRmMku5KcNJzLFi1s+YIlMz7oeLOUwPlFEKFC7iGNHUjsxWiiONKzWOdGNJOdlO7KoPfLr+VeB+P35wtwgsp8A8dMPyk166l+JIb0VDnbUQJV20w9jNJGUdwMbZTsGkcfodPRvT0l7rpUIRed8ZGfoz6Z2iRAFdfWn7HSnEbbsWq0MP2ge+Rf83ryyjGXVx5sQRPHtuFg8f349jM/t5PYijk0OYKmdQkILIz2E7CrC5uYnN9WWUq0UMjQ4io1nwxOX60haef+MqVtc2cOLQNB47Mwuf+d1c2cWlW2vYPzOOk4eGUSSunlYKZKV41xHCHq4urGF+cQUH5qZxeHoYlSAgThGW1tewu73N8gUYHqqiUMyTmXxs7kZ4/vVL2GyQz0YGEWg2rqwM8NEKEyzcuml5nz02g2HyZI74+x7pwfy0lZhoKXoJnOJeKmqpxl31yPV/PxJYPTuOl5FgrxVjdacOrfXpko5qAVLYK5yCqqYsX7Ydu+t9W30UsPrmX2IGRvGNyiZPfat5fGZ5WdBuJ2OGGW3pZId+B1kz0qxs7eL67VXML29gcXXTlPwy3GiWuJ3TwasUqX3jTt/oYfyonO6grRvlqTLy3l70Xtqt/FVO9+hoL7o4Y52uzum+53r53uvk13cmzSxdR1NkjMoEw8yud9qdheV/r9LtyhszsrCNOE+mRWZx+AsHoNWOsFurY3t3j67O+wbapE82X0CukLecEuabZBOyG7+bnUUEPtOV8c+4zmOdZGL4G0vYfe1FbLz+GoKdbQxWtF2UtuYq2Mo78Ww+iVHsxthdW0VjaQWj5QoKU/tQL1bQotCUEj4v5W6sAkhRTZeNmX4HFbbx1YUltIhrdXQEmbEhinnGWd/BysoGwpExVA7OIQw8ygK2y+oQCtURth2mOTGBztwMMrNTqFVKduD0wPgkBqdmMDq7H+NHjmLk5AkUT5xAODuD3TzLzvxUh0YrktCjjCgx36AygJj0kZFNci5PenhsE5qJXzk0C8yOoU4cYuKWY5n87T00L11BJgxRfOgs6jNTaJOWUmFn1X43NpC89Q6GWOLBh8+gPjGMOOdoXYg95DZ2UH/1NcSUHcPnTqM5PYZWoYCaFP6VEVQGhuEv3bZtsrSSLEe8lq5cx16thh2mPzw5RRp4COiylLFJ0kbidSmrrDId77AubbUR46qFSabw/wcPxpsuZ3cou1qNJIB42bUR9e2GN3mjwNtAZyqFNcr1lq1iqvlVumHsZSroassxhosjraBgyciLDcqFl158wQ6cP3XiON58+y08+clnMTAyzrQlT1gnIoDRBqjXdnH+1VdRLBbwiWc/S7rJ+Cc8O9bPS96a/kgypeOhkKvi0KHDePjRRzE8MYbtnR3sn5iyLcd05s7gyASmJvbh5KkzePzJJ/G5z34KP/nJJ/ETn3gCA0NjWN/eYV5FFEo6S4b5sExakSjDlW15JSeGFIa8JFltsyYjpQyRkYXJoMxyyAii2qQ8473pyRghCtsYqOYQx1qn1GH/lUXIPjqrdqxyk6fVtiVadEbHBvnzhRdewPDwCJ4mnXSuzUB1EENDQ0YrhhYmTEs4Oby+E0j23Gv0+N4aQIiwpefSdBJXMkTPjnfcW5Na9pywvWy3Qrx5dQW1xI0TJRn7/CbQGFBruuZGizg+N856tLV29s7kg5zLMoUfQTAdcWoASeHjBhJed++coKE8t6ucBpwmQNmpS4hrOaOcho5FDpoemB3BybkRFCi8tE2B3rl0ZBWnuOatnpSmda5Kk4JNdw70NoUUUkghhRRSSCGFHz3QeM0+WXt3/OAJpJh1syd1KPFeyx3YvBd24bbMcIpiaQpN0S5nMZ1Sz7a34Z1m2w8VfUwNlDGQ92yGv5R9/Y9ol6+79kHp9serfeewc+oBF/7jDveWj6UTHXtPbnKRZwYQqdikZLVZt1IumTLCUcPuLAnS2siXQcBxfKng21Y47iwEV6dOudyjomaqMl5fsaG8pMxuJTHevjSPMGzjsdPH8OihURwYHcDs2ACqOc0q7yJgvXYS4uflUB0qYXdrE8srt7G408SFzRjnb23hzetLeOPabaxu13B4/yyeOHMQ4+XAsl3arOHSwhranSxur+/h7RureOfWBs5fW8VyKwt/uIqbq7tYXNrG/pkpHJkaRDVLHhookGMS3Li1iPn1Om5sNXBhcQtv3djEm9eWbVuiLuk1MzGMalGbbrF83SxWdtu4dGPBlHjnTu7DaJ54RG2jVUJSyADiB1JaitIygLhaEGUE/eu9dx8J9H2UFY2Btd26bSOHHMtEnDVDOCPlmoLdU7d9d+/dhwZGizRzXgpjPzBlhrZGUn4yfnT4HadVH24lirbD8bDbatuWVjcWb2N+ZQPLm3uoEXHNCCexzNkKB+JtVJMsIB/py+9eXO9SUeD8+6X7SztLu5/mh3Pu957U+A2rdqK2Zu1FbYQXBfzAq256Mq4vr8xg0vM3X9arbWnT9VAPI2ztNrFZa2KH9VtvkdZenvVMurN6Y7ZrdNiOzDDAWyll2V47fJfttJCZv4Hm+VeRXbgNrG8h2dnCUKmAXLGCiO2tk+X3N+sy77Gd6zyNpRV06g0Ec/tQHx5EM0c+9rOokKcrrBi1by0aCfkt3/W0fViAnY0txDs1VmEAb/8kOpUC2sR7WzqAiQlU6KTE1LlOtoKjVEV5bAL+9BSys9No5nNoWkvM8l0F2YFR5MZmEUxMIzs0ipD41nM6u0Ml9E0JbFuqabse+stgmdW2b1JKm87AyIuBYgnD4+Pwx4fRLrLvyWqVIJBPsmiv7GD95gKKw0MoHD+B1tCwrVZz240xya1dBJeuIVeroXh0FtF4FU3G19bdI2GI9qULiG7dQL5cwMBDD6DJdELhxNgB68fb2sbuS99CXNvF2MOPY+CBM+iMDGGV/VQ8VsHI2BBKtTZ2b86jyD4sCNReiLdWQKr+mZbHq4yLbjs5534oQBz6fYQMIOJOe1J5e7hK5yPFu+jukZ9y3QiFbohit22rZmreABq5ETS9sq36VCuXrkcrPnSAt1Z6jA4P4/TxI8hTnr7y2uv43E/9LLxcCVEcwyd/Sp2kFToe+XF3ewtvvP4aRkdHcO6xJ22LPLUd4UiE7VdTKJzsldEBqHC8MDk3SRbK4Fvf+hZee+5FXHjzHbz48huUTesImfaJMw/gzGPncPDYEVy88A4uvPMOXj7/Mv7wj34f5994AUvLt9jmWC7Wu5PxkgEuV0EfA/PkU69F8144FEQ04qQJICq8OzOkwwYVN9tslz6qQRY54iEjiZ2hwrBa2aixjzhAW1QJ1tfX8fzzz2FwYAjPPPMptmH2yczYJiYogAps4PD44QHx6NFCIFqoJP1xQmoAuT8hNYCk8LEECS8JFtcdSyD1XvC5L3H0YdSl0Na2VjKEyMihmQFlfnQ8eXIO+0c4AOPgTHs4653S4vBLiVoqlj7DK205pWqdLh+c4EwhhRRSSCGFFFJI4UcP3Ae4Gy+6cZuMHzFHcvrAbcWe7e+/XdMe8ToQWQfMamznRpZS+uhJ8eWtWcU2OaYTYqgQYGa4gqqfsZUg2urFDjbWR785i0jXv9GH9h1Pcz01gY03+74fTxCdHa37FOuXxpXS3duZCaSBDCBSXGsFSNvOGXAGEBfLjbn7MY1uprBIMECaS0kqA4jeSkknpz3rNev2Tn1LK8t42qYmQxfx/aVLN9HSzN5DU5geLACtBnymK0OKlDuasW1KTOJVymUxNlhGqVLEaiPBy1c3cG21hvWtGoqlCs6ePIInzszhwEgZeeXNdBZWNnH51gp2623eb+P2Wg0L67u4vrwJ5MqY2DeKJYZZmF/GgelxHJ8ZQSFpouB3UK0yr4FxhEEV795aw7s3V7G8sYtcoYQjR47g+NEpTA0VkdPM5yRiAX2s7UW4Nr+ITNLCyQMzGCnloXNVVAzNCDba8MltuSRa8dF4UM5R1dWWo/pHAcXWFmUIAuw021je2rPzNHRWgA6t16xppe1q0tWmax49jrD28BHBkiffsP7M8MG2KeOHziJJpIgkj3VZnzqUfW2nhmsLi7hy6zaWNrbtnJKGrBzau763RY6wizuKq7RJO6bX/760zOj6d30wI4bR88M7wd2U//JOIFr2DbNOmef87r0K/ryr4ok3hIlLRwV3daqy24HQajt8dtte+WjGXWzXQ6zvtOlaaEZt+EEHxXyRX845LY9TIzelueoF2Q5KWpm0fBuZK1cxUxrCYKGC3ZVl1NbXUS4PkO8H0FZ7DpyivSRD5NIydhYW4I+PIj81YSvuos0tJIsLiNbXkMnn0SnoMGvWIeWBSqFmWPHzqI4OIzs7ihrbcMz2oxUeOiQ9m8ujzTCKqxM/Y/FOoYhmjumUymgkMTzyayYb2KqUJvuCPbo6eblNGoRiXDYrd04RqUU+E4vLYCD5JeWyzlrQhtohw0gx3VcIZ3Psa3z2OYEv6sJnN1HKFBBk8ihXKhjaP4vs5CSafoA289E5NaJhhTzauXoDDdKvmSOdxwaRz5cwwPIWl25j443zqG1uYPjYEeRPHEWtVCTuWv3go9CI0L58Be13X0dQyGPss59DY98+YGYcwb4xDNDlowjZq/O4/uJL2G3WMDI9xby13VNgBgMzbHlqVx3KHSl3WRhxSp+RfpDAPMWb4ldtKNVvQWpLUuZLlrgtlDrw6SdcbcM28mi+0+L7AI1gCDWvjFamyEoITB+khLQSSttaanLExNgI9lE+Ly7eRoP90wMPnrOVWjKuiA4uH0YnXbbWV/D2W29idm4OJ04/aDQTbeTMGEkMJSNkSNTqDG2jGFFe1+M6PPLvEvl8d2MHh/YfQWVsCiiUMTA2jOGpUZOpLdL8hVdew5f+9Ot49+I7uLVwDTcWrmN7dwtrG5vY2trCFHk7kCGS+dlWgD2ZaqtBiIFWr4oW+uMTm2TO5C+LS0d6ZSLiR1lCPs8xbre1h5nBAdIttm28/HIRMduGVu2pfSh90Vi01oQCrWI5cOAgTp08af5WaHPilb5c6Xv+sKBPF4eDJIbwSg0g9zekBpAUPqbQFywURHcEW99xQELhrCV62r9SgyqtGfV0JcMP5rr45NlZjOX1gcQBHJNwh9lx8JNxnYNSccYPdSoSn87PZzh7Z/nyJoUUUkghhRRSSCGFHzHQuK4/VONvxqlOpBzVgdhbtRZdiLb2w5bClGNExXBHCrgxn8Cu9sNxZCfGcDmHqYESqkHGDkDPdiNmlfSGovZz13E86T6y3+dP17/T57SuPw7glAN3S2Rl1LiZN301g8J4HJ9LwdJsxaSq8zNjhGrA6kHO0c1iJTEGijkUfSl0NA3casrCSkVr8QwYmvUsxY+2FrEDkeFjsFrBwf0TmJ0YwIAfIedF0vMiSUL4HnPzOkh0TolmlCOyszlGB6uYHh/GwZlhPHx4HI8dnsKDB6dxat8oRnNMP2zaYfc6xN3P5TAzPYzTxyZx5tAkHjo2xesUzvL+xL4xTFbzGC0GODg9gmNzYxgpeshlyI3Ewff5bnwIE2NDmBkbwFnm9eDBcZxj/NOHxjE1lDNlntYu5TI6VD9Elvw6NjKE4yzTvvFBTd0yOolupqwTbcyvbwDRMylnV73v+fPXuY8AGW0TpYPqu9iutbGt1R+etggKTBeudGUwFFaW6z1VpB9rGh8RFFUKDFcCp8Sysy2s9jwzfCxt7OL60hquLS5jeXMHtXZs77Q6JePn+N0nJT/x6DtLuEc/o1MfRFWX513HPO3uw8C9saW2Vx24evjLOpernKBPUMHdtP9i16uPD0hHPlLhJfxRq9L2PTKGiLZS5Drjlo8W67y2u4nG1iI69ToK9M+TroHntlQC27a2xJFBI7e+jt2r11AancDYA2fMMLW1uIr60qZtX1UcqKLDtt0kX+cZXls/hUtLqPoBBplG5/It7J1/E60rF7CzuoDS1DQyg9oYypVGdejrXKGxYZSmxxEVtOKH1C1UkKlU4RXYerwsWjLq+DKOkW+krGU8reXrkBdkUs2wDNpqS7tA8BX5hFcWpcM2LtWnyiPjh/hefMJXPXISZ/rLRXwO+aLLuJJ7kg1d0kQKVFtRYTnwXpaTgGUfHQQqJYS5AiKG01ZNyivpdJBnWiU+7W1torm9jXhpHYXNPXgLS9h77U3s3FhEVB3EyKOPoT09gR2i1WGfVEwSDG3sYO3FFxGvLmH2gVPIHD+G7WIB7SBAvlImnRNUtrax+cVvMswmikf2Icc0OsRDbTehvLWyy64lGUmGUL1S8rK4KvQPFpSlpJb0M6xB3qnti6Y9IyR9SHJn/BCtowh50t8n7vlO23i37g2gnqmQB0oWR7JfnC9+tPN91KewL0/aTWzt7GB6334Mkme1SjEQ35Am6nfUHoTP2soyLr77Lo4ePYoDh48xD8c3oo4zPAtxtTT2d3HM/ihCELBuJfdZ90GxiojjkEc+8Uk883M/jwMPnMbc0f3IlylDWS4yLiojUzhw4ixOP/IUnv7sT+GpZz+PBx58AgcPncTY+Iwdqh6w/3AEEoXcrQwg7NLYD/buWXNmH2GlavVqIN2XzngRNdVWfFIoEyLTaqCSyyPHtqeyaJs5SQLxrf7UbhKWxYyVpRJmZ2Zw9MgRFApFV15H0Z5jforTe/PDAxXcKGNPfZnr+Nj1He6tM14Yb1CWpQaQH29IDSApfIzBCSLXFfaETQ+0Z7Ct/LBOiG95lcVeA5J9IyU8eWwUVb729CEhoWYdB0cP/IxwBhAKMY7Wdfi5xjtKWxfNCBSkBpAUUkghhRRSSCGFH1V470e4qRxlBOG4UTOZtZWR9u1GUETYYQiO6aQkkNLAjfjcOE+TYGTgyCYhhooBpobKGMpn4ScRslr9wUhuOKjfvlOk3sfynY/vu07K4P7Txx9UftFaygRXZjkV29GxR30pdQhSImY1HZbhG2EH7UTKCPfOpcMYlo5TziiFbCe22eTlIINApGU4KWgE+goQ6NltNyJjCpDrJPBtuxQPIyMDmJwYRN7TuX8NTWw2RZ8MMVJ6ScUZawWPjCC68ttA+8hPVCuY4zfDkaEC5kpZzFTzKLLypNAqMqq+H6QWKZUKmB0fwuxoFfuGy9jPOAeGCzg8VsQE45URYapawL6JIVSKOTso39SJQp2I+yxvmQU7MFpinAoOMe5kBShmQ7ouWGzyTEy82qRrjHKxhEmVabhkiiwpTLN+wECkuNGemDEPnZHg6kDZyACi1Q4stynEeKdK6r3/MGA1miUBvAB7zRZWtvbQ9fIspdoYayTrVGbK377Set9ODlSYD5/nt4Hqr7ddTyjSyPCSzWBlu44LNxdwbWkN67UmalHnruFDWy51pYBm3ZG/hIWxE+O5czCULnmL34xS8olv+5iaAlFXOucnHrWbbwN5v9fxz74teU/+ycpgqjowSsopDPOyPD74yhK6OuuB8laKit1L+Ts7CTHd9q6uLLyRn0BBWF5TCuqqt2b8EIdLIS4+5ys+e+QhHfJdCndRra8h2NhEe2kTu+sbllShWEYQ5Fg3rP8oQml7B/WF22iUS6icegCjU/tQYJuv37iFxuJt+OT7YKDMiDnkAt8OfG5plcjSMuKVTTRuLCFZ38ZgKcDgzBjy+/cjKVWFja2yMBVt3kdiCn7yuL77yQuRz2eWV88JcUm0PRXpZ22CVzson2XRN74dLE2aiC4B42g1X8KUdX6CiK9zEnyGlSxReLKKTaq0P3pI2WxtTqtV2IHoEGhbgUY/rXbTeQ0J/ZgjnYeI+ekQeG2fFfrkX5WGbUYJ21aBFFBaRVIqF1AoFZFpRKjdWkbj9gp25hcQbu6gPDqJoYcfRXDyBPbKeTQYXas2RkmT6rXr2H7jDTP8zDz+OHZGhtFmOlrVI2NGudXE3vm3kbx9jbJxFONPP4pmtUQm8JBnuRgSWguTzUpekmYUlmYY0soZVfIPBUQ71RExIPPb6grJM9WDGkNC+vaQ60QJSkGAgP1zkbJcK0DC/BCatvqjwGbAuurRWStCQ9JE7UxbLeZIx3KliuGxGYYNWF7l63hGStOsr4mywPLtBVy5dAlnzzyIqekZ8pDwcDwkKpHziIkwziDHetXKRW1dpVm3lOgYHpnC7ZVVlFk3+0+dhl+hwCfviPcyXbYxr4h8dRiT+w9h/5ETmJk7itn9xzA+fRAzMwcxNTkLXwYr8ZXaLfNx8oR3fVnD+hb2wt+ACKrEMoAIx04mZ20jymgSR4QCaZq0IwwOVFlOtpmkSR5ggTpMWeWSkY48Lf2aeHtwcBDlks4Vcek7yWE3P0JAxHv0EVhd0s9knSimNtrzF1g/mRpAfuwhNYCk8LEEE7EUXj1RS9D17rDUQlinSEFnAl/BOeyg0D5zaBYnpksos5Px+CHR1ceOpceO1AYs6qg0mnEGEPWreq+OzVaA8NlS7GeVQgoppJBCCimkkMIPEThIM/ftoDGbPns12qu1Yjv0eK/ND9qgyI/dnCmOtCVGX4FgA7yuVAT64OUvx4nlfBYzQ1UM+Fk7cDqvD+IOx5C8SqEvBYEbhwqUSn/e5Af8aSzZC2X52c/HERzNNRpXIdyWH1Iq6B3LabRzyiMpTOQnNaBm5ErBqoOVG5FmxXLsbTRxY24pGRTGKSd0J4VcjHIua9tgaXKTKS/41vLlb+LRSbHVi6O1AFJCdVh3HNoTWL9JZOf++fyLY62bkHPKXS8oMCniRQSUgs4W0Kxvv0Oc2m3kfV5Z78zFzeRl3dupASqjjA1EwkuYdscpD/1OyOcY2o/ei9sMI0UcESEyOstEcTI2s1r0crymWctotWybNW3rxRxVPHRi5st0pUg1wwM9szHT77acP3GXcSOJtJWPmwWtGctS1DrqOJrqkG+l5/bRF60d/T48OPV91Mlgu97C5k4Dfr5E+kvJzLfM3/aKV90ztPJyLeOj5vftQPKoUK5cTH1tp46rt27j6uISNupN1Ilbk6SJSRetTOlv7SPjh8OAN+Ij46Xe1WQAL/2r0a5/rz8LYt+B4jE5cepdp7COj7/dufBK7y4FdOdSd573XO3y/qvCKgemYn68Nz/d953g3me+74e5cyVGdFqV0OcBYd/HRWwoBVG//mSg88hM+gbOsw0NRjVMN9Yws76IwduryK/sob6xjfV6HXssYpzPI1vMIcdUB+o1xLdvo0l+yO/bj8rwIKpl1sXWMlq3r6O7vYt8lEGhWgEKAXIMt762jpWNDWTLVZQPHsXgmbMonz6G4vEjiCpDaKu9CHePVKfsFb/n2KalpO+wuk0OdHMsTWDGThlK1O6c0Ysl4rNUw9Zo2VYz5CAZsq29sIzGEWqjpLQziMvfvdPOW04JT09CVnoDpUV8YrJ8hxE8MpnPcJo0qS3aEiagc0skm2x7OMqwDAMkdo4JcSadNXFTeOlg8iz7mLjLd2zvwdAQqjOzyM3MIDs6gczEJEpHj6By9iRyxw5jlzSrsTFoFUPQ8TBI3m984+tIVpdQOn0G/tmHsF0dQFPvSZdCo4nSygbmX3xDogxTDz+E+NAcklwepTDGYLOJ8t4mcjvbKNfbqKAIz686+UIiCP0fPLjWZ3Vgj+JXGa8kN6Wcll2BMkmHmhPPwKP0Zzkvv/U6lq9eQo33i1ttXF5YY38To1guwc8xDOtHpuigkCPt2QL47KveSauOn7e6ClgHJkuVL0FnpMj4dXt+HteuXMYTjz+BQVuRZJxlTv2OekJHLPKicGPdR4wnXZOPAgrZAoYHqhgdHWL+lJ0M5zO8Lz4lI3VjchXHHHGnhU7YNtzUlzljt4cW5X9H2IvBeSdW1p1y7LdtHbgvJ75LiEPsMb5tfSW5QWZlPPUxoqGXLbI/Ik2jDsolthsxvm3lxnIpfI/fJQeMX4mLtsVyO624dwYmmO3G8HBU+WGCmEY4ODzEOWrXTu45+eneOrz1nBpAfvwhNYCk8LGEOwM+dS72L6OF6xklb0wYm4DWgMaFlWAqezGeOj2HmTIHARTeWvre0b65GhSpI+UoxWb9WFoSkC5N5aM01R/IwwSn/FNIIYUUUkghhRRS+D7DX2bQZQM2d3sHNGZzs0VrYYI1M34k6AQF8+P3vn3IO9W8QrsPXAN+zGe6EUpBBtPDVTvzQ6oKvyPldWyDza4UAh19GkuhoDguFXd/97YPGlba9X3Ofvqom8eHgN5Q9QPhO7yw4TNdbxj9EUExnULX7nrKASXc93M+UgwISSmsOBrnrS8lXyfBbjtCRCRceI27nVLCxuWKzbG8z/hasV0t+CjY6hGll2U2Sl3pSsHEetBA3fKW0aSXp4IocYIpcvVtkCjtAt/qyu8A5deVkkMaTJaHfKGVKqpXviF/KLYUownxcooomyBlaTq8tXpEq1M001cGBlOosHxZ+klppHJIsWazZaUgpV8g/JmH24e+g2wcoUBek6pFSlPRwWaRi9dIo0Tb9YguTFflC2QkYTzb/sm+UxwdOwnfE2n7LmJa5sd0bL98gmigcjklkKB/Fag0Sudev/eDaB3YoefaaiqrLXy6UrIxfZbFZiQzb6OBaNMH4njn+0m42n3vuQcu916QnjNf3lh4YS66ZXM2o31jr4nriytm/Fja3kWdpApJncSTwlb8JpxUbqahRMQSVh+qZ9Yv7x3bqD57eetZAS2Wgz49DAUL58rmvj11dXHsNZ/d/XdyAmMqgp4+jHO5u7bmnt0vwVCmvyHZd71wLHu/DKqDHil60A+rd1YQaxlSyErRJ16RC8jbg1Edk3trGNtaQWVzA+UWv63zQ4jyJex4ATYYb75ew04UopILMNSoo33tGtPMYnhmFo1WDdevXcT68nUEbNNJLUJto44W42WrFeSrVbRYX4Nz+zDxwAMoHD+F7sGDaIwMol4uI2YbSEh6rUawM5tUeTIkssEI9cQnr0tGsI2bcUIKWbY317pZKsZJEpZHNGB5sp7M4tIH8DfSehIVnmnRMbae6EQTtl/Vs9FdtFP9O5pq9ZDkQWLKX+M4lk1KebcqSyctOOOlWi1TzKjvcMbzmH2Jzajnn61K4Z/8VC4dqB7m84gGKsDEOPyJWRRm9wNzs4gmR9Es5kgr4sa0ZUwt6eR5toPaqy/Z1lUjn/4satOz2GY66qfy9KvW62i+9g42r80jyzSnn3jUDnnPtkPW000sv/YKbr/5CnavX0f95irarJt8UES+JAMnSaniixwivSuNgTAXiK+siO5idWJX/XxkcJH7taE/TVgVl8pL9SMjud762tKK9a37rfVVrK8uY2F1A0t7Ibr5CiZn96FYqZA+rHfyq2Si9d/kc010MLnI2CY75OTHrMRmKoT6LhlF5m/ewNXLV/HMJz9pZ0OZqDVc+HePfFU7FVfJEJEJdFYT38eeta2BcgGlcs7yEzWtKvmXZT2KI+Juk/7arqrXBsVnxEeckwgvynjDj/Gc/BEwT+NHloHX/qQAshabBDFhhbC1GG5824tU4IV9izod0g5JC6WKtuJSGGKisqk8/3/2/vTZluO6DwV/e9e05zMPdx4wg6BAcaYkS7IVHiT3c0c4XrzQ+/Qc/T733+QPHS+iOzo6HN0Ot91+bcmtiSIokAQIECCGi4s7nXna865p9++3suqcc4ELkgApXF6g1jm5qyorh5UrV67MXKsyk4UUDloRJqOj+FZ0dHKZYPxvN4VzPFG8fUwgwpT46Fe84epGT9bHFv4CPVcGkC8+VAaQCp5IcDKFgl+Ci52Ijh5zXzRJsEkASVpTWHESg7p2z+VEI09wsTHFH331EpY4Y7Fl7haWwswEGtOSQLTeWh2g6020hLD0dsJPjsErqKCCCiqooIIKKvi1QZPSs6GV7kofOTdGc/cCN8V0dxqcceQnfYYf2XgtSRMb1klZxSk7J/8BRpmH/VGC/UmKST3AXNtbaBLECX/gM4xN5p2Cy7ZMzWLUk4ltd7W50MZKw7eDqH0bUc5NoWBfUdLZIafMRxgK7Py4Ws4w7qoBpK2G0JjzVKHoyiAFak0KGxbD/OmpsSgfTami7VlMuaSCWQzG09iXz8UT85bipKSSo5rdF2mJFiqr3thWPyyrpU/nUjhLW86l8AinS/HkYssVnvbepXWmDC7CCHchIWch5O+UKMM4xVT7zzCMjbvpJ+qUOIg+2spKRoB2I0QQkN4klhSYouUZFKVgEjoDRM9uvK70FNa9N3+9Fx30ZPXj4pnTD0G/op/wFA2lJBOORSy+k4rY3Tt/gft1Kag8yr+oFV7t2V7yTrjxzmYtFs2VWnmWypnyT7xySjtGsjvF570ZbyyElIC8swwsJ14V0KUnH6Vq/KYnPkiJI79TZZDhKcWfqyszFNBfxhTjH4c8gihivc1xnNZwOElMWQhtDcN0MlOIlbQrcXDpWGZ0hiHjyGiTkQLK3/iS6Wt7qIJS5lxY3jG8M4XRse0eTHK8v3uEn9/ZxoODPsbpHFqBIqMmEWdc4s947jB8pUJ+Y95yrvy6YZ7FVb7n/wzRUyeKO3AlKv11Kd4ZzXRVmPL9L3KC8vopgdFKPnAHHhdXldWezpXhNKxoy3s+lwY37YIgo6AkiEiU17RaiuEoL8G6baQyGSgs66SeU/7FWD/ZxdXduwgGQ8y6qxhtXMX24ir2O4sYtXo4CkLszFMcTcaYnPTROjlBY3cHtaMjzHZ2cO/d97B7dIBobQWXvvF1LF5/BjuDGB8+2GM+Hlqra/A3NuBfuAAsryJrdJCwXqfkwYR4m/GDJbO6OyW5482cbdkpfOnJQOQIOil9Xfnlo1+ZQiTnHY3oqwiFKHGsoFDiS11l9JSRUfKcYemnZ/eOziLoyloncyld1UVRKw4ftUwFNx5MGcUZP+QlWW6yxAyw4lXho/6gSIPxte4spVxEvYF52MQ0CjGTAVlJWn3N0WC764ym2HvtDZzc38bijafQfPkrONb2YGYMjdFCDH9vB4ff/yHS0Rgb3/s22pc24Q+OsfPqqzj66c9wfOcDtuGpneswOY4xvP8A8707aIVs9wvLSIhrPdBqs5gyOUHgsY2xDIkqxtM6PZZZYQy1zGSxowXBkftTA5Mw2lu9is6kkR3wLXnBuhCFzVDHbJwhigF8H+2FRSxeuIze5ZtYvvoU1q5cR2dpiZFlLmFSoimREr1lyBaWxhPE3/RLqiHrrwlCwvnwfo52u4MbTzPNzQ1GdFtx6b0B793qKifJHI/wInyZgD0RR/GA4ylHH7237bwUwHPvTYZZ7172E8KZWbKwSlZF1TvDm5g6PMyr9HF0olOp9SGv+FOgsPapgHhQ/S7poHZeq8Xo9dpGU9en8Ko0hKeITDlj5ZLMNtyFRFkwgfwcTqdejw2El7BwmBiN+efqxajj6EhKCFQXlQHkiw829q8MIBU8eSAB5AS95Iuvrzgo2N0Ek46MLcGsgbJ9J0Vh3cIUzy97+MZT62hSwKtjdoLRCeozYaXBTeHlfopfwql/BRVUUEEFFVRQQQW/CXBDKzc51ZNNUM25MZpN7Isxn54Vwt25OPpq3540wa3TWXSnfNJB5/vDGIfTDEOpAfzQ3slqIuW6IJWSgZFsSqxti/IYnWCOtbYOsI4Q1QrjBye+ljPju8kwJ8dSxsiPoPGjU5JpfHkOR+JluDF+acAQ2HBVigQ6F9JRwfDjxFt7yLsvON1kXe9Kp/D61RevlpB5iRbOX87C8pU5/um9KQv5TiBFipA+i/FJ7uy2eDoHKr1L4wwzh6UDRSoi61ePpIPKPYozjJNCEWQxmJbRtUiTuEoJU8tTNEMfjcC3FRmiBEtuYQSWOr2kYFJMF8LRq3hrvoaR4cI7GT8eClFSpQhSuLM4zunv9GXpDOezZ0u1qDOZGUplmJWdP0rTcjNkrdT2TnYWgcuFf8Wz0lLKLhcX3/iv8HfvzNehyqvxovPhr2Lpt0xQvu5NWTajl4tsIIWYbR/EN+IZ8YqLBQySOe4dT5Cw3ckkqDT0TmWzIn0UXBanoHNCjD76+pr+imMKJPKFwIKKN6WsnNOpfXs+JnGOe7uHeGfrEHf2Bzgaz2ybK31dLVWljFvWvoo2ac3QMOOVD+dQeARYqEe4R8GjwnzU75PcZwerjSIZl5IUwfw14wevZf0VFxfulAvt2cmSjPFiU17P5zIGk26cGzui1Sj/gLa2kOKjtmOq1TObR28c72Bz9wHmfgO7Gzdwb2UDdykfjxoNTL0GJn6EJNQpEnUk/QEah3to7e8CR8eYz2JEvUVc+OrvYOXll1G/dh21tXV4S6toL61gee0C6itLmHabGDZCpiWDlzCXcUsykNio8du2UZnjSRbIlLD0c/N+0ofFFJ1U+ZLDRgrylclJls3ooeC8s5Uu/PUZIeC9vscPGDZkWJ0jJBcwr5B8yl4DocLxfcD3Af30dT67CdsqT2nUM9JZ2fDPyTThIZzYE/GFJ/0D0RVWZlQV3dWHGCauLLYikXiqHDJUlUpylVZ0iIl8ojRUMJZP+oxIbjTBh++8g0Ner37728CFdYy1koVtqEHKtIZ97P/oJ0g/vI+1S5ew8p1voObXcPzqqzh4/Q3ksxQ3v/Iirv3uS1i7+RzWLt7AQuRjunULx/s7CBdWEC0sIWaaZDdiQyB+Rm/ip22epCzWvWpCH6eq/ckwJyI4o9FnACu/nOKLSi5vkxd0atfiU723bbpIH6v1qAm/S5yXV9Eg3wXkUS1yMOOHeIlgVKWf2pBlRKeW4u5E8YdB/grabLWwsr5uZbW81O5cJPqprGex5W0UOOVXhSHdLIyLVESlH1NXGXRlXatdW2wZZU7DujQsaOFX5m/FcD7OWZ6kj5LjsxmOFKrAz2SBiKs81Wo5zkniCckaY2WhbR8e2JaNlqjwYHjGFevywf2LAfTkkin8FUPucYMra4mLu1NZi7LwevpxCsH4uDKAfOFBfUdlAKngiQMJLwcSYOr42J2pM6GPCXRebQ9Hdhz6sEzjojZm+ObNNVxf69iycSewCyFVSakKKqigggoqqKCCxwQPj8dOJ5EFOFVBOfZzz2fXGrxA5zoknMzmtoJDE3QpzJIaJ7OTGHuDCSYpp7lSlta1XoPpcRzojAEudcXz8hTzeIJmUMNqr4WlVgMhh5pSP5iypcy1mFQrnsahTqEh55QXxRvnGFXl8YmPba80ryElgqaw9bUNh2EDne+QawuPOv00hqWzg6vt3ikr5CfDiK41TtT1NbcOa809qZvq0EG/9pW0FKJ8Z19tKnciYqsm+O/2xGeORMze2nj4zDncP+osqjkH530efvNREI0/+l5566v+SV7HIEmRcRhvCnYLqvG7cCZ+9OCTKfl0mGw7CnWOLMviau18uh/HovQ57/twiE8H59N7lCvho34ffV/AI7we6feJAUv3CdEMzsKcB8eTAsd7YhBTIxZBZaCyK5/dIbdSpDqF9DTJ2KZSPDgawms0rd6ylPXBwDr7w9pUzpB8VnIfdQ5Ud6rHuX3frKvjSeIhnhXvE59ZxmcvRI3te+94jPc+vI+72/vYORnayiHtyS+lsdNti2eU56PzlXvSQbpKbUWk7W3UeqUfNUpahZLuLL8rqHuWzHIaeSeXLJ4SkSyTvCKNa3nA11p/wGCeThYY89ltvWPqUtJX6w2ifIjO4ADNwQDJ4jrurV7CThRh7GfIQ8nVgHKtwfTblHURgizG0vAQC4MjZ2C+cA3L3/g2Gi+8iHFvAeOwgWkYAotdNDdXUFvrYdqmTAjmdph4KlxUJt7bQeZEO6YckJJb8t6+WpfAEB8IU+Ep3lH56C/fOmWqR7wk802hTBa3rezm7CuyxAzgOnunSQZq5xmaFETdNEWXPL5AtxjPsZjMsZzUeAX9cvR47fHaoaDtpECL8rTFPCPST0YSO0eCTqp2UVPXuvBnXpLPOpRbq2zUF+hQ+TppI/wVQ+8T6xvoVFfskyTjVaRc9PBSpKR3qhUCysPkIIvGAPUgRLDQhb+2gt7NGxjLWBQ1DYNoPMPC/R3s/OinJluvffObqF/cwGR/Hwc/+Hv2eQnWvvVd9Ohfu3wZo/YCsLKB3uaa4X//7l2k4wkWN1ZxErC9tVqo+RHltpT0wteR3Qz51oaVK3skolifq98TRwpnen9KcOVTbRZVS2dGv+LZ+Fz/zET8LYORFP4ygoqOOjdDfHLWD8mdwcefHvZ5FJQy7pPh42k8OtVfltd5fH5Z2E+CM3koQhmnkTZOmV+s/rC2PrczePSxQTqdYGWZPMB7jkAKEjMd1a9SEiktnXNYnWai/HijSn/sIARPEeOtK+fp+I1Xd+fqsjKAfDlA7bf2b//9T42NK6jgSYFSpuh7PElljwMZiiwTTjYUEEdzUJzmHEBzIBGyp1ytj/Dv/vgFPLca2pcSpbCroIIKKqigggoqqOC3BzSe++QZpE1F7c6N5RiOE9M801e2Nr2VygmZH+AkzvDgaISTaY60HmFe13ReShvGU/KFclfJ2V7s2cy2TF1qh9hY6qAbyE/brEqhw3xNicI7mwgrL+UtRZd9B1+Aw899he7SltJRyi4ps2T8kKJL91Ls6rwJKSAURkqVmC5JMyScVOuA9jSVgol4atJmaTOtupR7xIHlbUShbeOlrYq0pU3AMHXmISd8bUVMgZehw7y0tZZTguqNm9T/Y4FNNi2f88A6qgU4TD18eDjCaJaaQcfOA/G0z3+hRiCuOnvAn8/Q8jJcXllAN2IZOY7XuN8KVMGnBtOdih8Itl2L8QCvIifrS2YRgVbpiCelNNWWVTXy2ZS8+d7WCY7yAAi1fzzTEK+J25mWwqvOjT8/AdRG9af26rLUk0AtWrmrdtmmydPTBHiwe4B723voD8bMX4r8EHOt5CKcz0/uFysmn2yQcjc1JS/pRoI5BXPRCuzq2rrR1JyjxbwuBZ6AdZKrnkQv135qGWlpZ2ZklJkzJP4QYZJgYRYxTAvTOut4PkYn3sOlnTu4tH+A6cY1/OTCTWwHAdsrZ+M6hyLx4TFOkITwvQSt+RGePrmLje3b6MeUeRefQn7lMqKrF7F8aY3yirhy/h5quYnO45QM5LReZbQzfYibVg84R09eZQSWzLOykud0no2nMhQlltFN5yLMZQWmn8/w+updhzXX8hgNacZ1gDTLpxUp8+kUyXCEjHw1n0xRi2N4KePGfJ9QJqUpuwjFZeqMatRkmjXypWR3XeWn/AWvZgRqkmbtJvxOC/UW6SYDD8NpS6aUfU9CbJW8NsEyJSz5VTWmjzWVrlYvWPkIdti0vPmsppTXYvlavLKWJeMDEkwrUGQk8BlwxjLYWRiMbAZ23rcPDzH6z/8f9G99gN5Tz+CZP/wDDJseTt55C8O/+N/RWFrDyv/xz3GwtILUJ+0ZRwVeIs1a2/fx3l/+N6THJ7j6R3+IkxeeZ9wF4xkpfpuI7cwRlVHKYtWbDD81Oh3M7mfaIkr4q8wq2acDRZHCWXG1ykT8ofNSxP+OEcRHvOOPDptXeC8jzwgP+jlO+DKDax3kMtLJ1Y7JV8lK8qPkrXhFT+QWRNoaL51gpdvAhcU2mhwPnY6TGMedZcW6pHPpCVw9WBirZPUluspP7nGB+IZMIUsxQYZc8ZL76IQ04JhMralOOSTQRzNx0MQHR0P8b//1dWzFLcQcj2inGdHJtnsk+BwTducD/N6zy/jX33sBLbW5Ig3bxszK/7jLXsEnAccI88oAUsETB+5LAE2e2MFTzpQTU8ldCSjr9CSoJITo3aAwv9KM8b/+i6/gQoMTRA1mGKKCCiqooIIKKqiggscNpVLnF4NCaWDn5truXiBlkb4El6JMe8lnnLQO0zm2ByPsaZucesjwdHxfKsc0mdfe7lL0uIPNtcpgjl4z5OS/iZ7O/dBYMY85znTjRmV5XgFl6oR6Zq7Evs6BqfAwJY3+iA+zMCWXrebwiV+9hpjPE+ISJ3MkfJmmGWJOpGPioYNGFV6Y6kMeqSwsb41/mb+2rrGts3ivPeU9v4ZWFKIdRmh5PhoyhjCuz/BSErLQRi8pOdzqC5VBqRtSQvshepZQlvNRYPN8gkX7BSCcBeeNILqTsmyECB8eDHE8junpkybExQ46Vjk5ms9zUz5IdRjOZ7iysoDFVoBit/lfmncFvwxKU4cDV0PiC/GMmogUtuSXul/wr4/BZIZ37u0hby1hKh06A8rwYF8HF3XNyjP/R4HlwXo11a+U+UyfrG9tQ/vp2woo1r0OXN4/meD92/exd9g34xi5mTWvRNimmJIz5Ck71xYEpQHkPL99kcDapCnwdF/S2z3Z29M6cG/VTnWn8z3U1uuZtn2iRPGkpKZf7pkRpKYTxOtsV/4Ii/EUK8PMjB+7TbcVzoXxMW7u3sXm9hZOLl7FD648g61GG1qNlZqBJcH6DNgYxKifHKLrJdicT5Ef7GCvHuFk9RqOF5cw7rSwsN7DzSvr2Fhqwk+n8JMpZZbkqUzJcqx/1rGtbChlKXFP6bRyjE8sC3mIeZvNgHFqeWLbUZkSlzRokKe8WYKsP8L0uI/8+Aj5/g7moz5mkwnS6RQUvCb362RuM3YkCfMj/9DPncUhPlL6xINXI6FIJnoKBdWDZDrl7ZxyvRYEyHSmlE9ahr5tuxS1mgjabYRLa4hW1lFfXABIg0lYx4AZTNl2spDxJNEk/5Qwy2v1bI5eknW+mU/YV8nD9SFaFeOxoXiSlwyl9uA1IkynM6tnj+3JD0JMtDXWf/pPCPIMz/zpnyK4ehmTdIzhW69j/Lf/HZee/x3U//DPcNhxbTonbjpuOyKdNid99H/wd+i/8To2vvVN1P7JP8V9L8KM4dpEt025rD7FmWfch6cyRIhg0sdoWzCixjDy/Gxg/RbLplK6A75dWqoPgbV44iBbmvmp4hT69L34xt1/2UAyU7xhfF1Tn+mIYqsdSJdE4xXSUx9QpNMRQoZpajEg2+RXblxEax4zjqRuScBS1jr62gpBe3Tv3UU/Loxzjwt+kQGEvGqypDKAfNlABpBqC6wKnigwQaVPMUy4aEhCQaNn3ks4yV97O5rIoRDy+a7JQdlTGz28fG0JLT6rozb5XEEFFVRQQQUVVFDBYwU3KvvlIzONAe360OSSsW1cx3GghoP1EDo0dn84xS5d6gWcuLp97m2be0aTMkYTY20zYqsM8gQ+XSfysdJto9cM3N7XuZ0kx5RN0+swtMm/c4YFx5Xm+OxKoKsbj9YZG3S28sRz59JNiUc/SXE8mZni/4iuP04wmKYYzlLwgnjusQzafiGkc/jrrAMd9KyPf3Q1s4Am7MRvxgn5mHFHTHMyS+xQWttiRV8qSzmtK/8KlaiQ5Hthq3uHtWkzPgJleR4JZTR3+UQ4r4gu7x0JRX8fkyTDNM7soyWN461umKrC2BempK22stWZLVHgodUI7fns69MKPgvIHHYerEqM16UQ0r0zkeViC30R7oUYJwm29/uYzXU4sxTmntWXA8YTr7HizlX5x0Cv9CGbU1wzR6avtqgtdWT8StVGsjnubB3g5x/cw97RgDxOXrEt39QWXBwZOpSX8hSUhg9tw/VFBj/3bFWDFG0mB+VkgLB7hXBX3dojgUEJLk654ZKZGtiGJBMk61qUGb0kxsJ4iMWjE7QOj20F2qjZJk0DdNI5Vo/7WNzfI5EDDNs9WwERMJ7OTGphhovTY6zv3UXjcMvm20HUQJ91Ol5Yw3BxGSdRC33yzOFohOFwRD6ooRFGzL9uslkKbBk7pKoUlrrqIHs/dx836lcr9bQ9l0eZF9C15hlaaYx2HKMzm8A/OEBy+0MM3noL/Td+iuGbb2L2zjvA+7cQ0r/xYAvR7p6Vr9sfoDcYoTMcoDMeY4H83YlnaCdyTFPPaYJ25q5yrazw5/sO8+0yvO5bkzEagz6awyGa/T4apGF0cIRw7wD1nT2kWzsYMP/jW+9iePdDZEcHCJhOkzXRYEl1zohoqbNFRA+t5jAjtyqP5dU2cVrAEmQyeIjn6Ugb0VB/HtvoKJ5af6DtsBo+2wvrrEZ6Nhh/wffR2lhD6/mnMQzZH1GeTrcfYL6zhdXLV5BeuIpZs2VyWAJW1dBgn9gcDTG59T6ynV101i+gfuUKMqXFNIP+EWb37yIibrVQaw9VZ0SL/Ze2+pJoEJ+JJ1V3nxXM9KG2bqxN3FT0QsgIXSMH/X0p8xmG/8b8kmcOvpwGEPvQoXAqvtq9nIF50J98Jh+t4jLrnnjNxgvkNfJfm2MiV3PyET1dfEdO3kvuuMTMx13OPT9WEH5nuIgfVH7HO24M6N46PjGjEGVbtQXWFxv0UU5lAKngiQITK2RcXZ0AcxLGxku8tzcUUGJuDa7DeYp2PcY3n7uCGxRUEYfsGnhXUEEFFVRQQQUVVPDbAGfjuUfBQxN3wvl7TXKlBNWXiJnWBtQCnMwy7A6mdljzPNARsJrkMw1Gsykvx495TV8CwlZ3RFmMXhRgqdtCtxUi4jy3nutrQTqGc8p2TZzLfB2+bjQqRSzvpEzga634YEC+0cc4Mp949uVyTL9BnOFwNMX+cGTGj3GSOWOHwurrQk6+pWzWV8W2iQjHq+5rReHrJuxSJemMO/tKnnman+IyHduqKNOKkgyTWWyu7nMCr7296TQudkNglkXjZN06pHX3SDijtcpagu7P1CK/DErDh+DsnmViObXn/TRObRWMrQIgLdxb/YiuKj1xYB14zLLdksJUr1SrFXx2EE85dU3xZGwgRY5xGflKvuItndShujoeTvFg7wT1Rkvf0pJdQ4ZjGNaFErJzP8RgxlunqqDi16VX+okNFNS+wvUbrHYZWHIcDCZ498MHuLd9gOE0NQOgDB9x6vja17ZCyofxxUviYzkZQCQHpMjT8xcRpNwN7Yt/GQP4IBqy0rTVjwMnkeQU1inHJeOkKFc8j86nj49EcmdOeUP6t/ME6+NjXDraxpWtLawc7gOTIWaUndPuOmZRyxTrzXiEpf4RrzO0sxzteQw/H6OXjnCR4S/tMe7uA8u8v7iC7d4K7neXcdRZwCAMMKxTRns1hDLkTjMcybiV1dDo9BCEDUbzmJ7w1zZncnWkdKVMzTxtd63zSWboEOelNEG33wdu38XkzbfQf/XHSH76JrK33wFu3UJw/x4a+7tonhDn0QBNyvlQPESZH5JHpLIPZJYm7/jiHxm8+c7jO5mrjVKkra7u3CGG4VVy1FzZViw8ELHNhAyvw9QjyjMpRv0khhfHAPOvDY4Q9k/gH+wjvXsf0/dvI/3gLrK7DxCdDNFMUrSYbsSyz1m+JJuy3bF3CCnbJe/Vl2j3C7UlPmtVjIwi6sfG0m90Ilu9Ec9mIKmIk+IQn3YTrfVl1C+sot8gpqwLW0mye4j8/Tu8qaH17E0Mdf5KjTUta1Q6w7qMS9sPcPTmz+CznpaffQ7pyqqtjOwe7CD58Y8x+OGP4KcZmmsbSNjXOBkeMMVAWPIa0/FayJNPC6x2RbarjChm+CvKnLASbBUM/WQUcn27i6dA4iPFE+2+lCC6kQoiibsr+lJ7J9ryibybavUT/2Q81iH8Wkkk/2Q64ZiobT2yGZoZVf5uFMKHktZK1QRy8XgKRV6PDYSjK73A+jj6VQaQLzeIhysDSAVPHEjoSq6Ugsgmf/R10sYJYQk4TTt9Ds66Xozff/k61hp1CikdkmnRKqigggoqqKCCCip47ODGb58EGtOdh48+65NwGxN6EYZpjp2TiRkbMj8yRa2ULxoZ2hxd2XACZNtmMZmglqPJseJqt4HFThuB9qbPUr6TukmTWjdptminKBY3Sk8jUKYnH1PUaUxaU0wpraSwqptid78/xt7JkJPrGWbESYo9vZMCUkp/JmGKB+Wo0p0aCopMzcCiP07IrTxSDEopoZznKmORt9LOcyR0cZJgGsemJPK1Z73PMAWupYLboLh8MijA+UBnz78salmOM8OH7lVGRycZecbTBLM0YzG0XzzxYpnLVT6sHgdW5Tm67QgRiyEl5cf4oIJfCTRPckpBcZSjofs4zCl0BbY6gGHqXsg68jDJgP40NV7Wagwdvp9mDKN6EG8qOUZVtSnVEsS+RetwHnprgbWlSJ14uG2vpnkNWwcDvP/hfWwfnGDKdqy2m5JHpF6q+z6biowbytO13RKknPvoSpAvIoiCUvaqjkTXrC4jrrsvoQwjI4kZSlh3dsg5r/VcTu3L0VyyJ2QdLM+GuHJ0D6sH22gNhmiFEfJuB3F3CdOwiwnla15P0PXZ/vIE+WQEbzKFn02Y1wTd2RTdQ614OEA9izFZWcfO2iXcbvRw2F7EMAiRMFudm2H8kslg4IMiGoeDsa1+84IIraBBeSxjMOuR4WWgE0hZH+UpmtkYC8yzNeojuXsHR6+/geMfv4bJW2+j9uEd+A+20Do8RHc0RHc6ZdgEHbrWPEU4FxcRSC9dXdJM2PhXEtjxsMkpGSB05b/wFT5y2gjH6F3QX2mVymJxeRleRkAZSHTGjYyCqi8ZVBrzhGWgi1M0pjHC4RD+cR84OMb4wQOc3LmD0dYWssEJGqzbLgVdyyOvk6aqQ/Un1maUODMzI5dwId6xP8dUxhudB8X8tRpCeOQ6t4d4T8MAs2boVogwvtrPCvvL/ju3MWNdttaW0ek17AwI6UraSYol8sL0Zz/D1s/fh9dbwvpLL2G+0EZ4cozaG29i+IN/gL+1i3q7g/DGdcRRaKuF5uSvubZWY1r1WiLKEl+jOt2nBNHU4rny6tZWkNGpjpSqzkHRNmAm1xjA5cJf/jsecj5fOmDZHe10qzv9iYjy0A9pxpswoCwQPek8ylk7OJ70bJBntCpWKy4lX932WYUB0OIqHSVUut82IIbn6r8ygFQgMD6vDCAVPElgYkVCnDcSvBJGEmcPAV9KMNc0yKhluLIU4ZvPbaLDeNo3uJJKFVRQQQUVVFBBBb8dYNNym1yWyosSNO3UsO7M1ylbXViNA6X4zzkB9cIGxpyDbp8McTTJbAspfTmu7Th0loEOwi30Rqbc1RYjPu/9ZIa1ToSFVohm6EHf19akLNMXv3yvMadN9U9RKBKxWylliKMUsrmbUEN5chKt8yzGqb5oH2OvP8QwzjBlMjoMV4fMahsrqeI0BZcJxNJgWkrPTCLMIjClQ24Tbil/9F7f47uRL/PN6VLRjPlKC8YwOePpgHXbK51OO1NPZjMkWWpfeIbaqsTSYiyGk8nFzm8g7vR26fL+IZoXzkH55HzO/H85WN1Zuq7u7CB40mE41WqYnM/u62aRUYcZS3koGpOwdlG9dJsNNANtA+RoUMFnABJTXGS3BQ3tSl53XKB7ZySREUJfjA9YR3d2j8iYOoBc382X/GJBT0G3phCmp/jIbs1oR36UYk05kf+1Kkpbu1nasxS37u/i1p0HOB5PndFD7VrKcOVvaTke0Eogl0/pd5Z5eX/e74sEpojnX0YBoXMWzEhgWmEH1qZJHi+TXKpTVgR2lVCQfNLZQR5pmrKthV6EgOGaSYwrowNc23of9VEfR+uXsbN+Abu9BUz8Jpq5h046QXM+QC3IMGgFGDYCzLTnfTJFMBnC709RnwLTZhvHG5t4sHwRO+01nERdTIMG8ZYS0fGCeEMyTzUoI3DM8oziGMeU2zIgNxoN+DrgXnyjbe/mMVrpFMuzATp3biF77TWc/MM/YPbGm6jfvgN/axuN42N0KOO0VZW2ewpkCKAkkTsvu8nevJUxyHkJj5KHTHzSUzS1bdbMkc4UxDpvw62yYdgijkC8zAf9m79+lY5udaC5+gNnSHGtzVqMgikI/WQgUS8Qpgm80RjBYAD/6Aj59hamtz9Eeu8O2v1jLLHd2MHmWgKnQ8p5UStQ6Uxuk476hl+JB6p1FsRWhjDczKfjNanxhmHNmMKw0og0Iq26qWHrw7vIHuzhEpFf45tl8kd2dxsnr/8Muz99Azll7sq3vo7G1YtMN0b69s/R//99H72jE9uKrH7tMuovvoBZGPG9Ssm6rbEOPPWzDq95SZhPCaKrzgnyZHAlHTIZs3ytFMoQxinaomrKvNgn6L3rUxhHWIheqsQvK5C/jEd1yzu76rHkQfspPRxfF6F4zzEE+TJl+15Z7plsMdlL+msbOg0ZdFbZ6UcYxt26F7jW8PiBpTlXYHGF8b75EV+1h8JfoOfKAPLFh8oAUsETB06sOPFcCiObDvKF63LdOwlp7ZDcmE/x/MUlvHBpGU1OZrW0tZJKFVRQQQUVVFBBBb8tUEwuHzFvPB3zcdJSKqvcs3P2NXldBgcPh5MYRzoHI6+boQEcCZqJwcJJ6cObuibBumSmKOuGdax3G2jx6itt+tWc2peTfJc3PYurQLHPnPQ7pvSRgseMHz5mHJT2Z8RlNMYJcdLX8zqvI5PhgxNsp9hVmZUfU1HZlFa9nD4TU311zYm172k/eH2fTGA4+1Lfwgs/GU+k0uMknff2BazRg1deTEHmOcVQHE+RJFoF7SEKQ4uVMn2FtdIJD8tEP24y/1E4ndyfuvL3s4BSY2yWrW8GEB316xFvIi66cxx/vq51L8NQtxGibQYQ1ZNhXsGnBZLVcZBqwNHQrqS7rlYzrBepdWSI0HZJg2mGUUy+CBrQxeqOdWJXl8DpxRlA9KB24ZSRBceSH2X88O3QaH2dbged39nCg519DJmHVoTMtSpEcU0muIQNP/GEUimSfxSUPPNFBM11ZfzI1LblrKhlTZIu9KzT08k8Z3SSTJBi0kKxfr1cCkzeUv7V0wQ9tqPN/gEubd2CzgI5XLmIQXcBOsS7RXmxdHKCbn8X7ekx884xbHcwaXWQUYb4YRNRwGvQwby7guPlFdxfWsJucxEj+un8JRkOxAGmB2cBDDfhQ3S01VLO8og/kiTFyfEJakmOpbCBJYZa0Pka/SOMb72NrR/8LdLXXkf95+/Bu7eNdn+E3ixFN83sHBCdpVE3mSDZxRSZvkl8u4o+ytdxq5T+bjtDPSmMuzqjR/HMq1ZaSKwrDQFvXRS+dykVTjTm5fQcFkvPUrZfPVk9WBgnmy1NOtWMzv1o8aFD1FtZimg6Qa1/jPn+AbLtLQzvPcBsPEaDsrEnulNuzxnODwM2Jw8z0q7OdiXjFmQUz0gLinadTZVIaLIP8BFYb6hD4gPfh9ZlSN52F5fRlMH+/jaOb32Ae+/+HDsffIid9+/i+MG2pb/51ZfQef4Z1NhHDm/fwv0fvIrm0RgdpcE6jC9smAFk4svgNrdtw4I5c8hj215J2zLWmcdnBU8ygVcdkF/ztLqFdc4yy0iT7Byg3euwzyU/2wqjnPKFZTfFPK+iR1EfXzZwXOr4jr/GlwXbnULJ+86XzhiTbYX+NkZiw+20mvDJB0rD5AaDSIaIN0huS+O88ePs93GDK/MZTpUBpALWM2VUZQCp4IkCE+WS07y6wYQEmBM2Emom7CxMjpBdpbY1+Pbzl3Fluc3nlII75etSSFdQQQUVVFBBBRVU8DhBk8ti2liAfGyk5x4JDysxON0sXtn5F16Io/EMe8MJRhmKL8h13C8n7QwnpYhWPzhFbG5KoLq2RvFq2Oi1sNgKbN91GT+kWFL+Tg+v8Gc4lFiVzv1qEi1lo1Z1BLa9lYweWvlxxOssr9mk2r5o52TaKQucM9BKEJVByn/GdcpKpSclBCfk6bzYaojhRQOGdRNx5a8vfTXmFW4qGa8OKfsCWZ/8OKWRM7jMZjHT4zPx0FYXOuxUB6Vr2yC9l2JDpS2VRrZCRMrsUygSP3Xl76cHi8cflVeK73Gcs96c4ttVNfFk1sJDZ5sIRJlWI0BHxipT4VXwmcDo7qhX0tDaGgmuZ/1mrHd9Qz/3QwxmOvx8YPWjbdtkUHNf/p7FL2900TulYdsDyZP8ZsYQxaWHjB9qJ7uHE9y+t4P7O3u2DZJtgcY2JDWVnMDSs9RKp+cisy8bsNgZ68gMH3SqAdvuSk7GD7VZvtCGS1LepwyjlSLmZA9GjCgfIarN2K6nbFsJAtZNr3+Ejf27WNAh30ET7VEfy4f3sbr/ACt7D7B0soeFyQi+tdEm4qiH4+YCTtp0rUUct5dw2F3CXqeFo2YDsRcRC8mwhHXOvGx9Als6699tyaUCiN8osVQeyV5p7FOG7fdtZcHFwwHa776Hwd/9LQavv4r2/i7dMTrTBD3KwCZzCMiHKpa4zf0Vhg8lL+C1lNJ2tVvjSIYhL/H59FwnXXVbXEVFJ2V5Lf1PHX115Tu9L6/G9Xptf0X9FFfhpO2r9MK2JNM7KeIKp2dpk1UGrWDQ1mQyjNTYr81PBsDeAWa3bmN+5wEWkhTdVpMJsJ9TR8irEnYrrPToIWSKdrYJPSLSPNBSwDQ1o7q2IkuIkNkzWy00lxcRLXWRRnVMWAf7J8dm4Fp66iYWXnoey88+gybDZTtb2H31VQyPB1h8+ll01ldweLiP2oULaD7/AgbsT2tBHSF5Jdw/QJNywGc86/eMInKfDkRPGUB0zchHHgvkJTN0R2P0v/86aUK+vbSKtMl8ZXBjuVIGrgW8lyGIdPz0uX5R4Izm+gDkFIxJ6W+vivekm3t0/noyntR4KM/QaTfsvce4GiPN1QeoHdBXsto42EU1cO3C3T0+KMpZ4FBiWhlAvtxQGUAqeDJBArcQugK3j61Emfvyg3wtsYZgHmMxnOP3vnIVq81iuTwnt+eFYQUVVFBBBRVUUEEFjxPOjctscl6O8M6gNICYoqvQcEnRqi/GdX7A3mCCw8mMI0GttJAxocbJOseHmocrSV/jRvrmCfxaBg4LsdyMsNppQPuz2/iwmMTKEOAU74zBsaNbXWFv6HTj8tfVJsZzGTdCTBhdW/jsD0bozxIdS4vcC20SXW7no/CKfTpyZcJ2eDl9naKfzpQVClu37btkpNBVhosyb9FAuRtGUkowiikA9Sta8V/JabInQ0ZQDyx+EieYJimT9xHZ/t5MR0laeCkFRCzlrpSFx3koAp668vezgfCXYnySahucuZk0SgOIxvOqB91JvaCMpGRosh67DW31ohqu4LOA6CaecYro4rmoa92bAY68IuOHlJeD6RTbB33Mycsx25qnPePPhTfgTXlvBpC5ZmWsM8/XD1LlpTTVXrMatg4nuHXnPnYPj207LCZqdW8qKrXb09SshZmz7ebMr3z3JQMW2xk/XLvX2Rg+aefO+pAyjy8lq/hSh4gntZz1R5nAZ62vCrIJutkA0Wgf7XSEFsOoXpop58vjIepStseUDYMTRNMhGlmKkOl12BAb8RSzCWWa38G4vYi91gKOojZOghZdE8fkiX7oYUYn7PyM+NiKjIQ4EVHDWYgQPwkrKbMZMqAsblAmd5MYG2mCleNDNG/dQv1nb6L29lvo7u1ieTZFazxCm2k2aqGVd56wbFLCKk3JLaapcoo+JvdECqOHeOZMCS7Z6D6gVBjJO135rJe82sXFdFeJKPq7EMzA3ghUvtK8ofsyDz0zlOLZHYE3Tq5aLgzh+FiGFbvSyY6h3sfw41VB2QpJfx9ttqEW+5X2iHW0f4iTO/dw8GAL81mMbthARwfIkxaR7wzbUk6DMl7GIduuiIl7WoXBtO0cE585FtvYJUQg5mO4smAGjYtP3cTajevYePYZdJ9+Ct7lK2yaIab37uPOK69geO8eepcvY/2b38IkjnHw4YdoXNhE46mnMJszz3iG/ls/x8GP3nCGi6VF9scy8ju6fFpQrDnlhR3OXSdvpmOssE/O37uN6d+/hvreIeadAL2Lq3zv5AfIi5JBMvYHkj8M/2UF8VfJdwb0MO4zJnNeDtyDC+9agD4AyTJZzjIsLbZNxoQyctmYiOMM8ZnVq+R6wbcFn58l/VAmnzMIF+Vfls16F8PVWiFxd28df+i5MoB88aEygFTwRIMGLWb8kKAmM9e1L6GJX2eh9jMJpza+9cwGej5Fly3bk/CqpFIFFVRQQQUVVFDBbwPYZNuuchrPaWjnJtHmTiexMhLolxNXffXKyam259kfJTiYpJhljCMlq4VRPI75NCzU5FxbZPDB41hRW18tt0Ks9tpoSkvESb7ytWxccMtTxgT3rBfl+LEIZMBpb83jJNnHjP4nM+IxHNuZBtryCkFkX7VbXA5ay9jmDC+h5ybiWnJiW2DJWb7EhxNtZ6AgJnluX+/OOZZVAaWAUHilYfgqHq+2hQvfiwZSeGn7rJx0EeFkRJHCIk5zJNJOEwIdmmt5ChnRQHFUVkaRgpHeZ6AH54oYvz4QHxmOhvEcs1yGIiklRBWth7EAxZ2+KZ+j4eXoNTxENSlXfyMYfCnB1aJrY8Zrdi3pKZ707Yv1UZzZQdUznaQf2Fp6+8LcGIxQxjh/I+OcvSYf2fkEYlm2hzrjxeTFO9tH+OD+Lo4GI3vWtnFulRLDu2QtOccHhk2RfJnJaWZfKtC8V0VXm5QRIMjr8CVXTPlOatFf2yvJ+JHVcj5nlB9a8ZYiotzrJBMsjo+weLiNi4cH6GYpxmEDadREze9gWAswIK2nLd4vbWJ/+SJ2Vy4j7nYpk2MMKTeHTb7r9nBiKz20lR7rTcpmv4bYz5DQ6RDsehZS1lK2sELNcFXPiVdG/PieOEl0RZRvHcrMVcrMK4dHuL71AJfu3MbG3l2sz47QzoaoE2ethIjywMqZkQ8pBo0jXB/geM1UlCSMU26WTOQUnvJxgoy4Si4X60bIePT/6JXhiL+7ahWL+hMXx30Tr7hudaFZXE45tLgyHckrM+aVjs+S4ZLZ/GcY52wrLOJvRhvGFg51w4/p0FPGqZyBZIQPdDg5EoQMGFJ4z48HSB7sYr5zAH8wxHKD9GZ953nMtJkj60SGjphpa8WWzrTyQp/1w/ZIPxFNf8IB2sqI/VTqB4g7TeSLPcy7HcxkWAmawO4Rxq//DHvvvYf22ipufuf3UV/eRH97B8neFjaefQrB5YuI2NDrH97H8atvIt89QWd9A9HlC+QT0UWZfgZQNCIpXD0vQzOeYq0/xPH3X0Hz7haieIbhbITe6jKCXpc8qAgsO+WK+marR+ODLy9INlj5ix9rEaTLeZqcvXchBE6q8Jm8EgU+IvKOdGmyn2kLLIUS3zujnRhJoV17K135+3iAGBrflZhUBpAKWM/k58oAUsETB+7rDQkhiV4JGYkbDSwkgDSj0+RNe2qmeOmpi3hhs4umvkCxAZgTXhVUUEEFFVRQQQUV/BaCFEU2xitA4zyO+5xilf4cy8nQoS0/hrMMDwYxhjoMnH42t2UYG+3VPJu6Sk+lQ8B1OGxYy9Hy5ljttrDYDoAstsm8mwoL3LS+VKi5g8IJNtZ8eFarXObMM6E7nqbYH44xjFNo+y34UhZzWpwrlr7l1Ze4LgUpBMvRqIalztiTQdu01vMEOt9C+/GHdU6q59q+VatW3IGyAcP7HifyDAP6p4wjZae2kanp5HTDk6BJnnLWeFnJMG/lIiWbxtEaLSdJzDxkBCF2opVoSzBDCe9lbJER5Qx0f979euAUDzoI2cfJLLeVPFJaieJSMrisnZ8epEzVF+PLLZ94W2kq+Mwg2qu+HRXPaKlaqSPJWf+ez/aVYGvvGLWQMyk2JPG72p1t0WahCzi9ce1FPCYDZSbeY/35gc4qSHDnwQ7ev7eNo+HUjCnGjwxvSik5x4J2y393X1zP4OM+XwaQ0lxFJ+ub4aOes4WbZ9Gm+SLVuRqm8J0jImVblBFN0r0nl8Zoz2ZYiRMs7R8iGk3tgOs0aGIYdTHpdpF2Gkh6Cxi2l3HUXMKg1TNZ1Jz2MWZ6/d4S+u0F9IMGZY5kmuMjrTRJZeAw2eTDy3QeBHEsWEz1q/cyyuig8iXKyZXxBGvHJ7iwt4OLu9u4vLeFS4N9rKV9tOcTcaHxgZ/7TIdllSyWsZYCOwjoJ+OBtgcUP8rfZUWnP8mHMz/3WyjExceSubrVGxegCMifh64C3bjUJMdPtwtSx1KGdTenfOwMG7xa4k52mdxnvqqyso1YGIvp4vM175iLRzmocxfYhhiDPtq+KkGesm9g22ynOZqTKebHR5iSbsdbdxGyL1jqNBExbkIapzJssB+S7VIrgHQweWq5ENS+1bewCJ6MH0xv3miiz7Aj9iM56auVG1O20/s/eQ0Hb76JznIPF7/1LbSu37Qzrkb3PkT9aA8rly6gvbmB8d372P67HyLZ72Pz2tNY/eqLmCxQbjC982X81GDyn1yekV+Ic/Kjn2L6o9exNJsiZD84m42tjN2rFxGH2vqK+eXkzShivy8j4Je3r7D2JxABxG/uyerDtRD3imzgaCTmtJviyuc0mWHOcdJStwk+mFE15XhKhnClUTpFKO+UngNL7DGBGpPDS6DSC7/KAPLlhsoAUsETCRJAEtwSYk7IOIHrsxM0AURviShNcL/z1Wu4vBAgSKducsc3Ll4FFVRQQQUVVFBBBY8bNC572D0Mpz42AeWYz4wSOtMiwdF4it2ZDhkPODFnuFyKfw0NpeTXV6BMUf4c+mnjnk7gYbkdYbEdItSWGlniFP7nQco0xeOYUfl8dFIrJZh7qNlKjxMmo/NH+rMpdE6CthexL39zxWFo3suWcRbLlUhj1vo84fh1hoAu5H1UT9Dx55BtphPWsNjy7IySxVZoOHcbdTT5vqGPfqTs9LSNidRbZuoxg4UUj2b8kDIjA+ni2RYiogPJA/tim04rTLTvvj6a1WHrFlf4CW0ZQExhRw9ha18760Xx7G5+TSAypE2MEMfTHBMprgwH5euUFVJ+qR6Un7ay1eG6yySOtjDT6wo+GzgeLLibfCJWsfZF+qsOZOioyQAySXAyGpsiVQY9t6LptEWYMzh3o7ZjW9CI1/TMdMZxivv3d/DB7TvoT1PybehURqpvfclPILs5FKy+z8P53E4z+tKBqyP+iL5sj6Kz6KHzPnQwulv5QSLmqSmGO3mG7nSG7mCEpdEMjbSGOGgjoGsMU0STGN1kyoQzHLRbOOo0MY58pEEIL/PQzDIsTBn3aBeNo32MgyZONm/guLWEWT1iXameU+JFIUNUSnuAl/t0qlPWs4wikoVmfPDQIFOsDae4cniCa7s7uLpzHxtH97E03CUux2jXKI/YzrOU6TJZnfZjM3cyR+7pLJHY8K3NKXRloOW9jLxatWbGAznmrJjassdWcZSGD1OE01kg4UwZQ8eEzDkF6ZmTvDEZXTgmVsR3zy4dXc85+Rfhy6vkmceghg+fGIlO9CH97FfyjumatlqrOIgby2cykE7lrWs7KbYZsC2pHNJ5hJ76AHV+I3jDY0zu3UOyvYcWw/kLPcSkiXY0s8Oq2WdkjOOzT2JPST9ShTSxrbHUKbAuEz7rzCrlUVMc4UH+GB/uIp4NcfFrL6Px/AsYhxHSeIr47vvwD7axsbaOehDhwU/fxMmHH6B15RqWv/cHiC8sY6RVQaSjfZxgpf10IHRSyQem0UxmaG7vYPDXP0BnZxfNXJtMyow6xyhJUFtbhre4QPqw/6WcyoPAzjL6shpAxE7Gr3R2x/rVnY2H6EQT915XgXjb3Yu1XXg+kYY62H6x00IrdHVhPKkxhYt1msrD6QnO7j5/EAHOsHFtszKAfNmhMoBU8ESCyRQJZUlnEzVO4NqXIhRAOmhSpo6VaI5/8juXsMYJJGYT9uehdYSFaKqgggq+BFAqTsz9CoNgN8F0zg0E3YDJnF7qnYFuzqV96vjLcDYIco8VVFBBBRX8CnAqMk0Qa4JaPNpwz6SqvbPtOuZ1DDhRPRjFGM19zDlx1efmNU5GbdsnhtfXrvr6XIrCgDI8ylMsRh7Wu020GFxfNZriSeG0FY+yqdfcxJ4PdogzXbl1icIVJoLCeRgTn4NxiuPRBLOU4TjW1PZB2vZHil2vrowK3K1HkkJMCjxNmjOEnEi36olt67TcibDaa2GF+C22IvOT6xDndlgnzjW0eO1GPhZkEOk0EYS+4WyHldJJ6WEGBFO2OTytXPqr04//TpVHRxyyeMby1eEHIV3Ae6XlQij4KbgOsQCXrnNu4v9ZQAYYbTETk17H08TOApGSQfhL8Wf1z3w1rldeZqiZx1hpR2hotYsxhtKx15/6qvRdHnKi0Pm6Pe9KUFk1JnDjgo+//8VwOpawuM7n8YArgwNiY4qds8qWCdGd/ZFg92ho9SNVo/bW1xfVZuAg6ufZwxWloAdfqmp0vo1WQk3SHB/c3cb7H94DmwqbjVs94EmZS7C95AlOof/p6fppQChJIe/qW3mdqxMyhhSuUpC53FVC3isS353HzIXnjf24cO7p4fq1J5WL8Z3C/OzdpwZGUXqWn9HK4VoqKt07yhUpx0nThXSGtUEf7eMTeJMEaT1Ev9lD6rdYwz4aSYLmYI93KZJuF33KkWkYMm4dK/0xOidH8PgewyPMgwjjtSvY6m3gJGxRajE3T/WmHRakrC+5QYYIt13UvK42nNrqhyZ5YJGyZnM0wOWDA1za2caF3S2sHe1gaXqEbj5GkGsjQcYR87AiPMp0patVHrIg1OlyppfUMvLkHJlWKmjbJoqHKfFJiIKcVgNIZrgD4Ot0jtslJkv6693UzzGjwEwLw5G2DzQSMi0ZNvTg+EXpKf2a5aUzM3TQtrUji8OwdnVGFeknEqaZEF/F05/ooT8lWG6NJTxjppmy/jIplRlOKw5VtZLNqlHXXwh/0lNxhR7T1Ff42vkiZ034pH8zoYspzw8H2H+whZPREO1mE6vNDvxcxg/hpR0yfPZrpJ9ZxrVFmQjGVEVzvq+Tnrpqu0WtWNFqksXFHtauXkB09Sr2tPKHYYJ4ivF7b6N1vI9LK8vYuruF2++/h+76Ki7+wT/B7NpVjIifjBQ9doZtypKIaersJlM7q5Cih8A09fKnK/BwbcZd56xnbzbBNb47+rsfAO/eQm82I+7kLdKvxvKldH2+X754CWh1MSUdZ3y2/tzob6RnmvbvbgqnDwZ01aodhSxbv+pDt3pvPqU3QVGcwUsxGM5AAUr3+MFh4nAzLOlRls+VyNGllG9FKeVjTv2CfDX+0arUWpZgocv6p9zQNljGM0VY91/SQfeF/2MF1d8ZHmo9wtF4S3csn7uzVmXPvzkDSHG1mEX6xu/KU/4OjPRFGAvHeE42kPa8l59qwYHGQY7m6qP11t6Lz5mOUhG4NCv4JKgMIBU8caAGLfGhpl8OUvWFm09mlvCR34yDnoid5VcomL5xaRVddaoU3LbnpQYWpyKiggoq+CKDpIINnouBhBs2sPXbQE+gQYl8NSDSQMmmM87HAuT2JdqZzNBvMXSRQuacgun8n43lNcjh1aVTQQUVVFDBJ4HJycK5bVMoW01uS/kkTwsFHYZak0HB9+zMiN3hFP1kzvGdJqkcDxYy3bYWkaKnFvK5jkATnmSMlQi4uNRCR95ZbKsh9PWwZ1v6OPmt8OoDJPml3JKe3XTtuVNI6ZBZKVs0SZ0Tl4NhjJ2TmZ1FUmOeMn64XsPjvZxLL8tTlol9in3AG9NjhjbvN3pNugYWmyG6UYhm4KHB8mrbGVP4MzV9Z1luoWL3dNrKK+D7FsP3woBp+fC1HUzKfJih4Uenr/AdrgzMf72sqbzq2+indzHjJQwYBQHTI1K2hUjmznpgeNXDnB2bXY0uSkhOSjVN2pmJeZ2/PsqdvVMSVl+8aquVk2mKccL0PDdOt0LwzpQBWrtj4/fMlLVLrRANbdtlSREfIca3v+pVPGbzBSkBWV7xwZw/UrjmKecMrEcdcCydpFbOuO1z6V8jD9Sl7BCNWQbVtzGn+JUJ0tHbOeVndBLoyTlTVuier3QnfD5vUP6+ITA3imqFvJ2Xo/ogHcQ3MoAM0wx3D4fIghafZULUV/X8tfpjGNHf0lP1kK5FmmY4JM1y0lPn4dy6v4vbDw6YnofUa1qeRjNBWTdGK/mVKf7jgPGTcOO9OEp3roU6/nZKcPEKZQrlkMIIG/GLzksQz5m8MD/GsdhqJ24+qvRq4hNLi08aK/IdpRQvOhCc/6djx08HwsRwonNYCVfHRdoiSvmHdJJ3Aam8MB3i0t59NIcnGDRbGC0uYdxsY8J6mZDva36OVjaEP+yjNeV90MTMD9GmXF2/x3j9QyRhhsHSIvY2rmJ7YQMnUQ8T0i+zJQ1sCyqrqMA8NS628rJdSLnPlm0rtjppgo3JCDf27+OZB+/i0u49LJ/soTfro53PKMsoa0hTR28p9kh748mCRrrQ6XlKWTVthIh7XQwor8aNBnHy0W/4LFuAUUh5FnqI6Tem4J41IoxZVhlC6mzbWv2Qsl76pNtooY3jyMOYvJ4zHa2YUJ1ptYJW78mAN6dcTegmdMMwxLDF9FoBZkzb6oNhU+JUpxzOiF9COsxIjxHD9Fs+ZiHli9Kl/HfmPpmMWA6mnbSbGLEsI5+lDkLoYHfJGpVTnCUmMj4UTnoUnZWA+I7vpJZVW3VnrTAcmVpboyFOMNvfR3r/HhYnY6y1mmbAspOuiHeq7egYjF0nmyvjss+qk7ldnyD5p7ZBJ/k3D4lbA+i0MAkjxL4oSD4bjYF7d+A/uA9vOMQW88pX1rD8B3+M7KmbGJC3elmKlf1jZK/9DPEbP4N3uI8m8TbDp61miUhjlYGY1WPjlYB5uvOH1H9LvjIvNrredITGz9/F5Ec/Qe3gEC3Wh1auCMe6VrGQ54bEKeotora+jhH7UxKOZVLfKZqR3uQxkUcfSKgxi3Y1MqqvDyjEF/TPGMfCG62ZuzoBPnvslxRZ9ZOSr8Xm1s5L+aH6YHpOFlgtWX09TlBZxaOGid0bmoZX4Wt85cD5njoLQPpwDKCxwNy2vkqxzDajj0V80mkufinSPZeQAdnKQO8fH7h6KTA0FHVnrcjqSm1NpWUdy59+vxkDiMLJFf0L6aa8ZJR1aSgUw/Hf2rmNKfSJgVbLSY5QXrGNiBd9tgn6MJQba2gMY6kWbSOQEZBOUK52Vu90Wi8VfAwqA0gFTxyYWGGHJ/EswSAfHQSniaG+vNAyYA1sQk4sv3t9HS+s9yik2LFygqYvLEwoFOlUUEEFX3Q4G7AInOLBfOkkDZwscfKgHJCcSQcb1J57rwGhGxQWsez/9C1/i/RslCUnH3tZQQUVVFDBI+BUrhLc5O5MFstfikfbasXeOeXaJKvjcBTjaJLq+1fFlK6Dv5pOFooITmTBSaK02F6mbaVyrLZDLDTqdo6Etk/RRFKpapKq9J3BXMgwvk2M9Y5SXBN9Xu1gWVPQSNEXYJrNcTiMwX/6FV8989dNRN1EVxhJOWz6k3SGGl0zqGO508CKDB+RjxbfhQzjDB4Mz75Kk2zrs8w5JYtSc88ujL581QdAsuc0fA/NMDQcU07IdfCtaWlkxBAdGc72yme57CtjxhFu+tJQimzOsZl3DaHvIxC+Rge9UF/mFEeCskcVLnpn3hbWbs5dH+UE7l5l4BTffPRl+vEkw0gGkAI3l77oKHqqjqXgk0I1tTNAmjKAGOLEoUjaKUyF76OvD70nHZS2rZ5ROiygjFsim1bvzOIEXhCZ8lJKOm0fY19li35KhpTIxTOGLfEWfYuk7Wt4q3/31oLrqvfFvQI+/PbzA6MteUr42pZW5BOHrTCiJ8ssRfPeYIJhzlrySQfxEuPIMKd2oRahrXVEsDxLrT4tQRLHDH/1ADPS8YP7+3R76M84D9O2V6xrI9I5cPVS+v3j0sPxk2v5mjv6xN/KznJpXlm2f4Vwxlg+0qs0AOrefTGuOPLXj1TCiqHX4hEpvOhNnpVckCxwRhFt1yPeJ914/bQgGeXnrCtebburOgnMdJWvGQ/Iu16aopvHWJ6eYOFwG73BIUVmiJOldYzaHeLAemc7SiiDvIaMrRnCeIrWyRB+QkHWaKDN9PTV/rwVor/Uxs7yKu4vbOIw7JiRIBW/MzMpy0Uv4aMy1UwGSnktLkrRJB4rOrR6dIKNg21c3b2DqwcPsDQ6QiuZIJonTt5Z2Yi7GUAc7VUHjkQF3QlaCZJFIda/+gKu/+k/x+U/+WNc/N63cfn3v42rv/dtXPnuN3H1D34PF156ybbqWbp6GTf+h3+Fy3/4B1hdW8fxux8gTzLMmMbKV5/H1T/6Lm7863+Jq9/7Di59+xu48OJzaEnRP47J1tpRooYR8/Y3V3D9D76HK//8T3Dpj38fl7/3TVx6+Su2MmISzzCZTpClbAdC1PMRrS7jxr/8Y1z7N3+KS7/3PSysrSE5OEQyGLiCsD3NKPcv/MF38dS/+TNc+md/iGbdw2x7l8JH9SMZI55hP8M0XbMq2iavysY50V58yj5N7UpyjHjLaB6yLuvML9nbRX93F53eIhqtDssETKXQZvvUzhghr+pHyKnGoywFEZQkUFrEYR5YHzFlXqp7GdSbTCMaDTF6+22EO7uIxyMkiwtY//0/QvbsV3AYBRQhOdq7exj+zd/j6MevIdvbw/72A+wd7KMZtdDtLJJ/tX0js/OkJJYRTMSRorg0gMiww7JMR1gdMr/vvwLv9l00haUU8sRRinizxcmlNfRZd+HlS4gbEfmePCQ+Fa1UqoKlauxnPCsLacX6UjNSAG0laQZQEtyMQXR6UWfnrTrItEKRKbCG6KfaYNtTWEUm3uJktXUnQ5SX/B8vlLxSgpX/nPtFoHKodFpl47O8GpNojNEIWb98I3/x20PltLLTh3RQBiY/Hxsw8wIfgSuNq0P5q77+cQwgcgqrJ8fbMn6In+UvflUI9Tn28aXCmAGEfM1xZVrT6U0yaM853tEKL7ZX9an0s/5DMRhOqfjEQx95q67MsK9wvFf9KFwFH4fKAFLBEwcmVtQL8UbGDt3oixencJQAkACqc1AV409euoYLnYgde0I/WVUpvBhMk7pKKFRQwRcf3PCGAwt1dhyw2L35Ff4WRk6DBTesMCUb5YQGbXouJxmSH9pjuRxM8jWvCqgJqCaBUqa5yajkkHNKxOVQQQUVVFDBx6GUjk5Sul+nQKDTv7s4wcvJqFZ7nIwTHAzHGKdzjgWdglHTPYW1SapNWvVHWZ/r8PMEq90Glugijh3dl65KVJLf9QmKfDbJ1VX+Ao4rpSAq0k2kLOEk2b4iHk1xNI45BXWTTiGqr8SFr1JTT2FKc339y74hYr/Q8mtY6TSwttC2ray0ikPqUA1ppQh2cc/AYVXenzn71T/xkMJMBdJ2WGEUEBfSKc3p9GWtS9NwKfokW9FAT3396/CmP/vJuVY/MGSzEdgWF5m21OI74WAKJtJCabn+0SjOJ03Ky4m56PmrOKcA1pSeSZkB5GiSYBS7lTWWX5GXxu16spyKulzRGSCkoykurK9VciqfrvIrr0K0fD57X15Vxpq+3hYSRnthVMOElXwwGCAmXXUWRl2rYjxPuckGUIAUvuSxsr4NUZeXrYQo6ObAQvCfPoUTNZ3/5w+GF3HVuEZKVvGDoU8/1cicZdW2Vff3j4GoDTv7g7Gc0UohTM3Pq5LRGQwwo5kUilKQIogwYTu59eDADjzXKpC6FzJ9Uph5imbnCPm5QlETZjiU8UNKJqsp1qVba+XqRqxjpdYN32hMp4O+na8748fxUVmfAoUXZRROv6KWjHcqsHyKPxfR/D4NqBXIAKI2lHgZUj+1/DTGzcnEQiMkXdcmJ3hq5z0sH21j5rcwWL6Io4UV4pxjZXKMzviYeGXIAg9Tygs1gPakD398QrqkyKII20tLuLe+hO3FLg6jRYy8BUjlnNe1ikX5ikCiAZ0MOnMZm33SU3I3Jx4zLI+HuHRygIt729jcvY+V/iFa8cRWe5jMK5xRgm3NqGK0ZNpG9zMQyWSMnBHn1lOXsfStl9G8fgnRQgcR5WnUa/PaQsTy+GGA0f4eatpO8MWnES33UJ/McPDGW5Z+9+XncO1/+j+g+/QVNBRndRHhSgfhhUW0nrmBzqWrGN97gP2TE/SeuY4X/sc/Q/drzyPaWEW0toio20S40ETj2gUsPvMUIvZDw/1DeCnI93O0rl/B5T/5J4iIX9Bpo9XpYXRvCycf3qe8Jw2DAPt5jMWvv4D1b7yIoBsh2zvA4M59pMMhpxVsUyyrjP+p2qRWm6idikL8N8qITMXFbpmvVYnkJ8soI7dWr6UJ5erxCU62tlGPYyyvrLKfaCFJ2Ra1amSmdSGct/gy+GSsBrYHxpchWldL2zon8b3i5GhSDnuDQ4x++ia87SNki0tofPe7wPNfxaBJPmG+DfZ73js/x/Dv/94MMr0b17BEuhyeHOPw3g7WWj00WS8j5sssyYIyhweMK6Wz2gyzJD4N0mktTpC+8x4mr/8MDZZFRnBbh8H3mnPpzJtAuLFMsxnTI707a6uYR9peUW3XGbBlLNE6Nm0VGVD4p/pyXop9lYyMWLo624NkuCn4+T4js8oQ5Q7iL8cb/CMtXE8mKumOjvEEko5lH6anJxFIOY4hKF9IP0nGjPzjtsFq2UpTlVElU/nVPnV/KgsZx8YJj7XoJQIOiVI2m/g1nF3NOXkt3B82gAwynSXzWQwg56DI0wwTDCXjR8kzepbTndqV9JlKGfPQfdiSJ+T/hDKf7dNqQDJA7ZMsTNwl89nCiZDaLnFnm9WVgYijq5sKPg4ygLiarKCCJwQoN0xgmaCVXKOT3xloqJlyctTkRJcdKIVGTqEi0MDdfdFWQQUVfFlAAxXPvqzQYE2aKznKBH0KJGfdoHMakGhrAvuTYohXqYNsYEFnXab5F3JEA2uG0ERSadp2CKdOcudh6VRBBRVUUMHHoRzPCdzk9Oxq/hSnkqia4E2SFCejESacjEvRbxqLAtzkzykIbcsqTtalMG9HNfRaDfty0UATX4Z1E183oZSyqcxTYF9507nDhp3ctwkr7/UVbZznOBnPMM2kiFHewq+IzHTV36jfse1dshnqyRS9KMCFxS5WOk206lLYpGagkZ7FTdSZJceqcr8yaDLHBFSWOSfiEXFY7oRY6TXt7JB6FrOrMtUl7KBgYZZmyIQwJ/ein23bNfcwThIcj8cYzBL7Mtc+HGJ4gaFo9VRUyMf6NwvxKzqBo6dTB/CJyYnK5qMy0ZmhSn68mjO6FvSRcaJQbj18VbWVV/mVzw+/VzpSxEoJLiOU8paSLPdqpjQ7JB22TvrYGQxxNE0wU9/vNwG/zbpuMnvOMYo600Ws57aBkk9K/JyC6DyodFKKO8X4KbN87mBYEWlbCSRFJ+np/owqxI+cyyrWtmiZ5lGkkR2Qz7Bn8dkOpPhheXWAvuiqNGWQHCXA7e0jvHN7C/0JwwSkmxRJpCu0/ZvR5vGASiglvy8lrvGyyi9X1ovjR4HCOh50/CIeVTnLduHKILrJOEJa0emdYsoZHysu40l5Ws99tkXR8NcpvdpeSjw07mRKxF2yS+PPnH5aSRaOR1jY38HqaIhm2EC92UKDiC+MJ1g52MPC8R7qsxEGxOtB1MPO0iaO19cx7rQQU66OiPfdRgsfNhexFy5iUG+S56X8ZX4so539ofbE+BnzJyUp7Ug3Pgfkl+V4isuDE1zb38blB3dwefsuLp7sozfTOR/iLkYnnYwK4r2M7VJXPf8S0IqbxGd9CQfK1cngGB/86DV88Fd/h+2/eQUHf/NDTH70Jg7ub5MPZ5gHzI1tOvfmJrPTyMfl730N4XoXrA5s37uDn/3d9/HuD1/F+OAQtSRDwnb/4c422k9fxfP/9k/RePoysNDGiLS7+1d/g3t//bcY3L2PeaNh5ybllEXxhHWSe/A6XTSffRpYXTMemYcRsLEB7/oVM8jYx5uigdqSCCGNaMD4rLsZeVI6CydDGEzGc96b8V3PhbO2VvCQu1eSiqfD4MVn5DmtYGNZGky+R/qGW/fRf+UVbP3Ff0fz9j1cnmXkh9hW+6gGM/aTKXHQ2fU1GQUMvxrSOmlW14ddLp9AB4yzvDnbfHj5IuIrVxB89WUEz78EdBfRYL8SzFJExC8n/+XjPhaXF3Dxxedw5esv49JXngMmY+y/9lMkB7ukn/Jju5uHLJu2x9PX78ybssJDjIh9V20wwv233sGY8Wb0T2XMCMX3rCv+yXiTCn/5k2C7776PeO+Afa5W8rCvMz4lPoWRzbZvYk7i5SydsGxqT5JJ7ItFc4YXL9qMkXwpI4D4UysEdaaXtmebs9G5DwiIK6/lx3MlaKWV66+c7HgSQeMebVdmpSBd2UoxJV9R7FOciw/Ef3rHsC6Ga9tyv/VF/uUIFiz/mcD1ENZaCw5wz+bUpzB7JwHJQ0Y18RFlLPshyXSPvBoU4QSWlvEp26g5psjoLgeXjovHOlAfw/sKPhmqFSAVPHFgBhA2drPcqsPhVc1/Xk/YcXEYxsnoi1cv4KuXF9BSB6QvtNnZqeOzPRwrqKCCLwm4YYdbIcYnyQ5e3dc7Grhyom/3+rLCTXxtuwJN5Oy9wktmaJjy8B/HzeeeJINKp/DOnQ0FK6igggoq+CSwsVzxp3mb5LRkt3unH3l4SPjyeDLD4WiCqSaLfkN6cCerGczktZweTMGZoOllWO+1sdAM4Sux3H1dK0W+VmdIz6MpqptEPuyUqmS9JHlqCjr2C36IGREcxxkO+xPExCv1nRJSSnalpnhy+qovYAIBUjSZiB1u3ozQQIYgS2xFg9JW+T5q9CjT+GWgba10VoeUOlYSEkSK+Cjw0Ah9+wI4TwrFmielfd0UQiqLnqXEES20l718s5RjaSYVhQECjpmFg6PBOXysnAytLM1P0/BP6xzFpeZK6wGOxwlpKgOFvrjUO4axbFxfLDqJnvrIaVlngAT6VEFfVzq8Pq1TmXxmYdu/kH6m7GI+Oo9kTL/94dj24R4mGUaTBKxu0sWH70sRLGUv8VKdESdXdxxFsED60Eqcoj/eMi+V0jm3asCVRy/l+zjAym8oiaoqh/M1Qx8bxIx02e8PbYWVVjeZ8YL+Nu5RtaiMTIChbeVHnqamJKyFDSTk9tvbh3jnzg4G2houkFKTYTK1BdWhUya6vD9/CoivhLfKYuNBPckAqHKoXEW9OH7TWzeONJAnf2qkiRScbu911jTbg+mciri2JQ8Fgv2ZbHNR/SIZ124+AzAfzXXndWdAkqJLH+soddWH8NXB5t3+CVaPj9BkvcyjkHT30WTbWuoP0Nvbtfx3l9Zx1F3BtN5GwjqaNho4bLbQby9iRP9B2GF+LfhpgFrGMpNg2ste5jFlLmOPWpIZdtgq1RpVt61shIv9Azy1/QA3tu/hwv4WVsfH6GWxfX1v2BZ0MmMqkxN5zcDGW2s0dnWXgmT2mFGOJeTD1rVLWHjuGfjEOd/v4+f/z7/EyStvY/T6+xi89QEO3/sQB3v7aF3ewOpXniNfhhhv7eHBP/wUzdUFbPzZH8HrRUhmMd78wY9x+29/hL0f/xwnjL+w3cfRj36GmLL56j/9DhZ/90VQEOLkvdt44//y/8DgH97A6O3bOPnZe/APB5jd2cXdv/oBGmSFlII1unkJl/74u4g2NxAPpphSftSjAGEaY7yzg9neMWU/uYoFW3nqBrrXL4HCDMNbd9F/9za8mVqQ5Iv4jnKYfBQam/GJtHGy44wq4k09mnGbV7UzxZMxxIz4MlLSdVmGII6RsW2O79xDjzRZXlnCREYE7yxtHSyvejUeppOd3IwFkpBS/Es+M21Pq+KWFxFf2kT0zNOodRcwPxoh3D9GSEYP2pSVJ4fItrYxoxzpXroMXFtHstxGbfcEJ2+xrBeWkF9ex4TyP69F5GemTZy10ko8rq/bm8R9+613cXj7QxYugR/UWB3EMJ3ZCo1AcsmnzOZ12uthP4ywR/xmrSZam2uot1vEPGR67HWVtqhGeaZzWyLKcm2r6Bk9lSevvD9t7yIL7/UFvuSe+FzKfzPQMD+RV8YpRXMhJVl06+SGnpS01ZkSe9KA9LVycoyhsZN9UMg2G3K802UfbOdlFTQSl+gqmuje0VGXx1lu4WFY2JNq3+GoZ9WfZLnzF+j5N7cFlmii8Qx/Ga/sG3SuqFKRnkHbvDl/jRWdbFQ70JhI22bpzCjpLzS2dNtbCUeHv9NdKL3U0tQWhFp951ufIAzsp4JHgBkzKwNIBU8aSJjI2Vd5Ji4I7JlsGTA7ywbdd164gWu9BhoygOgrEUoDfcV0JpgqqKCCLz64wY8bltlQlH5u0GPPJgo4qOAIzm41UtWgTdcyNG81IHdXdy9//bqrsrCQjCFDSpE2nfK2VxVUUEEFFTwSTOzy6iaFbnwnsEv5jpNQTRsHSYqD8QyDWF+qhpjTZblktoJKpnuMwJRk2MgTtLw5FqI61heaCLV9DceBlqIlrkkjwzGym1jqleS23jllkus9KP8VhgE0ypQBZJLCVn+ccKKc+doOiyGFhPs353oE5pHGaLCPWe22sdxu2DZY+vqcU2t7r3yt3PopwCV1zuMXgBQwOSfg+tJVynfpsvRppvqrMGA5+KytrOI4YRlYHm0vYooslZVXTp6VufY5F+I6rF0KLz/w7VB0mUUcLZSwK6ejtXt2v492gvP3HwfR3rNtT47HMUYx6SWNinIQXqexXTnkp41SljoNOyxeNHYrUspwv7pz/bqj8dyTWUVnCHqm8JiQp45GU2TajzuvIyaDJMncXCZlMHPWqgdPX0rbeEJpEoikO6/GPZbeZZ4lzc752P3nDyViwoBO9at6rZMHWP5RHOPe7gFqQcO+/Nf2VTKsKaDxA8soXrIUmFQq45AfkX4B7u2fmPFDZ7ogbNsqEsUVvWpzUVl1LHUR8zrF4/MDV2K1OynwtZqLrZD42JYiVj+Oz5yyr8BSjdTeWenNuS1LNK8kT4h2cnyydi86MY74wOwT8qef8RujK7nPBEww99xXwMpJ2wbZ2Ru8l9NXw7WUco/h2spIFTMdoUnX1tkIkynrco7hwgL2VjbRb/QYRLzvYSwjQaOFadTGjPUWsy7rlFLBXKvmiHddWnh9Ie/KbzzPe4/0k2EnyhIszobY6B/g6s49XN2+j83+Hpbp15LiWvWulEgnS0G0cOQwRbZkrKNxAeduBYoV6dBs30N0aQO9556CHwWYHvZx+4c/hXcyhi8+ZL1I/rH1YuX5p7F885rj0b0T7PzkTdMFXPju1+Exrr5iX1pete2YFptd7N97gON7OxgfniDaWMGl7/0uwvUVxOMJ7v3gRxj/9G0sTEn7/gi1wRiznT1M7txHfTA1np5GHha+9iw2v/U7RIRt4afv4GhvH+s3riFoRTi6excnH26hSbrqUPaFrzyL7lNXIMvp5PY9DN+9A4/9SsB6zCTDSZdQcjoVtcmffHbk15XEM7q4q+S9FNUiqxko2I6LoMa1WTxDgz4LSnc0xMHWfZIpQWdl2fhfMjCXQVyxFIZO8ZWA5kRyOmh8JjbQdoCsh7TZgre6irTVxHQ8xvaPfoLBT3+GzlIL2WIEj/yXsn4O9iRL2OOtLSBf6rKMGQb7x5iudjG/uAYE5Fbysslk5SleqyXWjkSLBkuwubGOjWuXcOH6JVuhIxeyceUcC8wy4ru+htXvfAetl17C0osvoMZy1RY6xJM8k7Ou2U8by9lEjv1IkrAuE/TSFGFC2iQx2jM5tp84RZPvm7zKoBgyjMit85JiGZhYftF1ro8sRCJHaeesbpiFUVI01HP5/skCK0Eh952BjfzFsYTcQq8jAqh0VjLHh3KigSutyu5o87iA+JyjvauPz8cA4ugiwzhTt3jOz227qLw0ktE4zOFmI1z65zWthBJeomXO/GWEZOoMVohevtGzw8VSYVAnl1VHrkwmH3RTwcegMoBU8MSB2reEgFq17cXobgkUarWUgiDBcljH73/lItYbHLjRf64vdCgIxPAmmAqhUUEFFXzRgS1e21TYENVdT1d92CBVAyE5zpooPzS5kyEVdX11oX1x9R1G8SUUhxxKRVe3t6aGIErfpVXKFvdGQknvTDjZUwUVVFBBBR8Hycdy8laO8TT107xQvk62enbguJTSR5MpZpouavUH49hkUQocymVJZYG2sQilKI/qWO0E6IZSFFLGS5bLmGLKHcp3BpfEVn4uN6WnHN0k0uQ805UCQMphKes1IR6lOQ4GE8xyKU79YjLq8nbxhIOUoJyc5ik6kY/1xQ5aAVOWMpD+UghqBYrri5if+hE6zpct318VpCSbp4kpJfQlq7YAUU9ETw19zYghkEJN2xrZp0AsixTdKtppVszX7TUvJb+ZehD4gR2Kzl5QsVz5NXFnXH2RqDI7Q4Lenv0psV/2Z/1lLbD0pAzUuS7jmMhYugKjonMFbaSAEd167SYaAXEis5x9DKUe+ldx5ZhA6YvfWK66O9NFe89r//pxluNoOEWqtIOQpGqQfu5g9Nk04b24h5hZUsxbPMX0REqVzV3dSMBwd3fG3y5f5/Np6vk3DWXeOpdDT1rhof3Ok3yO4SzFXn+EuQ6BF71U31IyKiTLo6hzUYD34iFn/PCxdTjEOx9uY5+0m4fu7BB9Fe/rYH3RiW3B8mV65Tjpcwcb86nOa+Q9jQfF16VCyVRL5A4pqYryWlkf5httlaPVHwHLY+lZWi4NrcrwyR9SZgncGNPJGzmRW/l/FlBaOsfD0uQMt5bT6cvf3EOYqhVoy6IEaTPEpLnItu5jcbCP5cEB2uMxYqK/d2kTD9Y2cBT1MNNe88SXiSLVKigdzs04Cetrxoo1ucqC6KyFTF/lq7LZJjyOq30plZmf6BXmUyxMj3D1cAvPbN3B5b17WB3uoZONEHJsrXA6J0SUtTo3weMoWa4GcSD/gnCFZ/nOxtPkzRkvrSub6L34NOpLbSShh3ojxPKNy1h8/irWX3wKS5c2cHv3AVqXN7H21A1T3M/3jrH7ozdRm8zQW1xAuHnBjAQRZUn7xgUsvXATl7/5MsJ2A/e3tjFvNXDze99Erd3C9OAYD159DdP791BPp9YGGlGIZDi2MzS0Wu5Ea59ubOLyP/sOGkwv3z7Ag7/+Icb9ATaJR92+mKeMu7eLGfuOCWXt4leeRu/Zq9pXCuMPHmDw9m34wxlCksDO0yFf1dhudAKAU9aKI8UHIoi7lpJEBiWxlVaz6UworQSRUVxgq7dYVjPsEf8gnyHKYgz2djAdTbBMfpgFkuusV9WR8i/qIdQX5eJb8oFaR0ZeU7uZEZ8srSMiH85Zdk+7cNy9h/jtt9FYbiF46gL8ZhPpJEN/e5f5ZVi8fAnzpSXElLcLT91E67mbSEnfWk75wHyMvz3t5qF1Z+ypNL8iRkGzjVqvg+jCKnrLSzh4/wOwA0aL8TzGS0ijfGMD4Xe/hcnNa0jX1pAt9Ogvw0dDenrrozTP00ex81qMzmSC/LW30Li3jYy84m3toHVvB43727zfhc/n8P4u5jusr6NjJsBesNNh/0Be9sXHIpLmjFYJTFNXuqJGyrOz9OTau9wTBsLbeKdmK0z5b2USP3Q7bYTsg+1jk6KsLo7u7caco8bjAuJ0jvZOBqst6Vn8pjbl/AW/CQOIUlOo0thtfYvGNKSLrWClv7jajSU1dlS+xIvvhIvkukI4PYP6JslNjcGKNHVH/OWvnNQPqUxmaFEfrvwUmPlV8GhQP+ZqsoIKniBwTdqJCevQTB7wh8JDk83lVoDFhpZFOj8N2o3ZKRgK2VVBBRV8KUANXjLidGj2ENgkwgZEGrhoUKwJvZRGzs8dmOYGNk4Jxvc2KJHIKZ4Vp5RKilfGVZrn3lVQQQUVVPCrg5Oekt2clFJYaysRnU0x1cHnnKRqMpozkO1VfgqMofEeXchxYTusodeQksQd3qkvjaWw0JhQHzZaTMnxAh66M/lNkKhXmpwIaxCZmiEhN3zMEOB6BBfWrppUu2m/cGkEPrqthtt3PImBNOEb5k8nxWkJpuC3ifmngyxN4emr6EjHwObIs5gYpDYGlrFAHwJ1WxF6Uljo1O88dQYg4qayG66aUAsfppd7HhI+i9aDqXZYB13NFKMzpiY3rQWY1EI6dx0jeshNPvL8MVdTmBBTS09bmznDjNHP+ms6G7AXfnQlnqaM51U4OuOTjCjhp3AK71xSDxHXI8yYjlahaF971bqMHTp0uE4/KfxkFDBlOfluRjyOxlPsnYyw35+iH+dWBikzzBWKXikizspglCVfPuyc/+MCUZS8agor1b2+Op8jTlkeEkBKRxnMxPN2vgDfO/6kI+5aaSSbhj4q0RZmu/0Z3r2z44wfftPi6mwHKYe1zVgSk/fVBqSk4bNSehxg9cvMyxUf5de1Vj90GsNZKM0r6X9qIGGd6pwQx5vu/XnFpt0pCvnXKW6VruKyydMpT1N2WejPCqop4RAyIZ/O8ZfyLtCw7fiOWDF32l1sr29isrKBNGqx7hLKRMoGi6I6EA9mlB189J08SojzNAgQ+2wLDOgMHynrlzJDIcqMZHThNcqAbjzF+vAAVw/v49ruh7i0exsbwz308jGxZBxG0taFMjC6+EzB6CRJWfIBaUl5JPdJoLi2HZPm8voCP83Iqwn8bhPXv/cNXP7D72Djj76Nxe/9LqLfeRFoRBQVjFD0DyqveFyN+9X/73/Hrf/yF5i9fx/J0cQOz/YZPtpcxIU//jae/x/+BKMGsaOfMp6TmSUvfZZBBgIZGWL2J7Z6XHRimonk7cYCehdX6J/j8Hgf27tbGA6O0D85FAZYvXkNvRtXKf+AOGAdqP3Q3zTLpIT4xqcMCfyQZaR8orcMPjI2q6pLupXuPMhgIX4zEjJsnXwQsO35ohXfydCkcqhfa7C+m8kYHW1R9bM3cfu//Be0tnbQHU7QZP8aUh56xMNqWQlK/qkNZyl89SHkL62G8Imn6KMtpbSiZmFlARHfxds78Hb2EWjrq41NrKyuov9gG4d3HiClHzY3ML16EUP2Sfp0Vc1J+pu6ehvyqPsgTQWhbKGcHgYhhu0W9sMQ+5Q3aHUZhmMAMkSdMt2nDB9QDo9aHRywrz0IPExZd2nUwIxlNmVyqjGAlMXMjH3gfDbBh6+/jvdfeQUf/vCHuPvK3+P+97+Puz/4AW79wyt4/x9+iFuvvoI7P3gFe6+8ivjOXY4jKP0D4iWEia96XH1wcB6sbnQj9JWb1fETDKSdjGkxxxkJrza7JX8MtEKSdV9IzSKwK78V+Iku9K8LBT0kO9hw1XeoXyAriHr8dU73bscJBuVLrfZwH2RK1rJvYr8a2xjFjV3UHuyDD6WldlfQuEwxpUdapmNvvtSV8AuhWgFSwRMFbO8UAhqEs3UnHKBz5KZDCzWA00FWDcT42vWLeHptCR110BygaL9e6/gZT4MrN1Q8E9YVVFDBkwuakJeTJveVE2XDKdC/mKieuWLQwXcatyq0pIF9xVpc9ad9lW2gwYmJBhPugEk6C+TkkE2mTJwoD+e0L7SMJs5V8qaCCiqo4BeBk45O7ppBgPJVYz1NALXyQBNsbUG0NxjZl3l5ENnE0ClnpdyR3KasZTzJXM7Woe/Wu1ENm4stNGrua207m0FKOIltZUNZrW0+1C84RaWlZHi4P5ee2/6D8egk1bWZy/EoRn8m5aD2FneTW/VD2g5GygKlIjUlOAZdaDWw1G2xJG7Vh5TGylPlK53ycpNVuV8CVlDiw1jCr4jM/NX/0E9p6plOJNJ5H9r+o0an7YhibUlkcYWlU4wpNcNJCYk2UrjxIWNYKX3H0wTDmXMnk9jOYXHXBIdjOvrLHTDcAevIXen43hzvD2cpDnk9smtq1xGvI15PRhlG2mKKeRa9sxmoDNSns7zlVhwBx/Q6w0X1mas8LKTiafGIGWt4lfrMGW5+kavZV8z6eljPSkffS4tGo8kcM3rk0kpI4SZaFfUkHtXX0GmWYjKLMY21JZEHX4p+pmV4FzQUuNogiKCqI17dF7OCovIeBxAd4UvkeUPeZluQ0jvmnOrW3V3MtcLKtOPkb/G4xSHepFPdvgZ3q5cQNHE0TvHOvR08OOhzFhaawlttxvS6ptg8K68MA8bDj6nshrOc8BBmrAu1BDNKkfvkzChK+ng64Jrlj1mpUvjqLVs94/C9gVYVs6UzjLVH0YaCSYpy5WGGOk+rMs6MIMpf+X0mYLoyadbmIWWaVidLjgg38iMzz2x7LLYh4jph3cbKj/ISUYNVN0M2GSKcZggoP0ftDgaBjpkm93ucR9dZMqaR6KNuxnPnnJMnlL6agKEs+aK2yPAs8cI8wcb4BNe27+PmvQ9w8eQ+FtM+GvRXWClKtRZPV5PtTEtO/GCPSlKEJpxWSwnn7wlmTGTb77N1N69uYuHZGwi6bcpwlv14bCuN5knCa4Zk/wR7772LzoV1rF69jHqrhdnePh785E3MU7ZZlltbU+288gb2fvA6lqbEleX12V/UWpTpfH88PMby6gqiXpc0zxDvHiJ+5x4aE9YAy6OzSJIogA6JnieU7WtLWPv2V7Hw4jOUtXVMpxM726N9aRXNzSW02AfoMPrJ/jFO7m5jkKdYff4mlp6+auUavn8PJ+/eASgvxYIJiztX+xRRWEa1QCPJObroVnVl96SP4235sZ3xKi4lVehFJzKzHt3KJz3IlFZDmJBnBkNMdo/QbXVRW+gilkGDf1LukzIWXnUoCImT6i8jn2t1fMB3qbar8mtoc4IU7x5jvHOA1VqE9fYC+Yhy/d42Jg92UL94Adn1axiSDiO2LZ2xJES1O6VWL+rMDxnvM/Kj2grI58wRCYOldNqGspXkiN96DwHrI0rZI9NPfXfcY14vfRWD7gLxcR8myIkuEduJRhJkfMom4sq0fcru+fEJeu0Gms3IvsyfjSdora9gfmEZ2WrPttDqhBHqB8foLS8iuHGReJOI4kX28576evKB4Sqn/NwN83V8fWYEfwLBBDjpSzkQkCd0L9ol8ZT1P8PKcsfa36ncVBT1eyy6DJ+SdI8XiIjaRFknxFFtwdqJuJh1U5TQ3tsY7zewAqT8071bZejajJ3/Qac3opjGKSZzyZM5+0nHMeR1ji1kMKZYMmPpjC98pmPb0mn8YGNOrf4oae/KZE+GovNXPhV8HGysXhlAKniigK1ZAsLEKifEmrg5oaEBHSe92QTffe4arq90KJwoEDhI00TD9jiWQDDB/LgFcgUVVPCbgtIAUip+BHou/WxAIe/SEfjKyQTeaPhTvtIgXNsJaAsD+2qDA7iEMoQXG0rY4IdOCi83MNQASnGVi+VEcANBS9Nkjd3pRQUVVFBBBR8BSUedYyF5LGWbZGtm93ynySM8nExmOB7PMKbA1QRVSknJccUzsa9JpW4or6WQiTge1Lkf7UD3Z5POchKre00aJa9NequvEA58c/anJ8Vw0l1KFk1zY+JwNJphkknxI+WnC+viMm0VgU/qB3xObmUA6TYD4pXxmX0OA1sfxTAurov9SVAq0gUWT11X8WyKGD5YOnL62tdTyTg2lmKQuPqNJuqBJts1zDL2acTbeimGV+mNDhonW3ruRxeVRV/9TmcpJtMEk1mGMd0olbHCGSzGnMHrqAe7FvfueW7PU1bihDhMiPOUedu74v00zTFLUszijGG16oAjeXWomtwXij8pr5zSl6Byii9IgDRNMZ7GOO4PcTgY42gwoZviaKjrhH7OaRsr83+EOxyOcUBXxpHfYBRjyMKMxjHimDzjSUUoHIQAQZXLe1M6i34cL2h1yCyObUWQjAU6O8WUogW+oqYZmViPqkmrHZbB0dtR+rFAmbdwJG7ihLTuoz/NccS2Ng91VD/9VSeu2K74Vi9KgHXB8OOsjttbh+aSWoSE4e2wfabrUlXbU/ukF39KJZIl8djA1YRwqLNMUuafGkDoKQPbLInJlzFyrwZPKyL4XueYaGs5T5FY11odJANIotUFWY5G6KPhhZB1VqnJ6CEnpbOdTyQeIA0U/bMB05jru3Omw7lvzb6Wl4JaxiviwLzMGMu8UmYiA0yqQ+iDkO9lCKZ8HE1YFuCw1cE0ahhOav0mW9TWZLyi0zZMkn9zDYytvKxvyR5GbpAMnSzGyvEBNne18uMBrpzsYWk2QIiZYWrb20Er9c6MH0pPwCdznwif8FIHr88oyxaevoaF55+GT3r3H2zh+//X/4B3/9//Dduv/AgPvv8Kdn/0OkaDAVaeuY6V555m1jnioxPsvPEWAsrjr/8vfy5dOI639pCNpti9c5ey4Aibv/siEklKlvHog7vIJjGWrl1F0G7AY50evX/HDMpTtvF0sYOlF55Gb20dOwfH6Ny8jGt/8G3Uu20WHoiabSxfuoiV61fRbDVJX9ZXGCGY5Tj88D4O+ie4+OKzWLx2EbXIx/GdLRzeEYyUewAA//RJREFU3aJcpCwhrdKQskXthrhErBe3z7+jg2tLunGksr7SXljW9q509oLOPhLgrcKasV9+TD9kgSLybkpZ2O/3UW800On2rA3rIHhpWGRAp3QjHSkR8oQ84HoOrS5Ru0n4VmH1wcJCZwGzwxOc3PqQtB1jQNoc3rptKxUj1kVy7RL5TlvmqS3JCMOy0QlzfUBG7AxHrXrRFsYyXWh1jaZT7NaxQLmcvfUOwt1dBMRb/K9yJt0uwq++hCGvSkX8bGWk8zKWgs9pwPbAqw5O74RN9Ho9XLlOHllbQ0zZn83meOY730b35RfQefomVq5dx7IXYfLuLaxc3ETtqUs4oQyQUlw4y2gi1MWXyss+mtONQDS2++L5CQRhLtmgerL5tK70sxW2aoedFsvMGpLs5AsrsgvByzlaPDZQvQgHh4f1QyqR+VHuGY7OX6Dn35QBxFiCiasfkPyzvMUvvAP7iJ2TMd69u4N7Bye4fzyiG+PuwRD3D/rY4f0W29Cd/WPcO8mwfTTBUidAg1ED4if5b0VjaqK9lcnyUfoChXB1VcHHQXxcGUAqeLKArVkTD4EWZzrLP4UOO+WIDX/Bz/GHL13HOiebWuIoIS2btZSd6jxtEMZEKqFQQQVfDDClVwHlAM0GvubByempsozDAcoLKdTswEVNajWI4OTCfdeiZzk3sPX0bZR9JsR4UmYwbU18pFBySgHF0hBDE9JyoKchiA39KJv0Y3eFq6CCCiqo4FEg+clhGuUsHyifpaCT4UNfXUsxrvMIBrOs2KZIykjKXspkp3fQ5JzxmIDUJSEl9GLTw8ZiE4EUfqZ4Kya4Jp0LiVwo5Ky3oIfhYL/ln0tb783ZeNPDJMuxP5wgJg7afkmhSkkvUD+kD2/qeYYG+4+ldgOtSH2KlYghLEfD36ao7v8ToezPXFj2NYx33p19mU5HnHRuhb46zNhvCb+hjBZxjuE0wzhOMUsy28LLJctUlY5d+VjgUpZevZmUnvZdLvNO6HSV4tv6VVLcKo15Wj/IflHUKHtTUwjZO4ZxmjcN13ll/TFd2+eeqWjbKG1FZNvbML7CuxpTPaubdnjytfWtaaotyFJTTqR0Orcj5suYsWOmo5UdugpfXR/piJ9diVOcsV/nVduzqJ9Hjf0/y+j6eIe+AylP5OQnZMRxzIeRdD5IQpzEu/LTofJ29gBxsnGJaY+ltGY092PveOOS/rxB+BNXw4C001eqWhWzczQiXXQuC1sSC6qyih8snIhhdcL6Ed0Z7sH+AD+//QD9mfiEdS4DAIkghZC40hQ0LqLRTG8U30hgvp8viL90hqSt+mW9SIYIR1PiGZq5GTTqjQB+M2IJrGWhlsWI5gnCugwh4k+1NZbXD83gVdPHMrOJlhCRBr7xc7l1kaOhnMvD5fPpQWQMmKC+/M3rCWWhakxcJCWYyqODpAPKH5bRTJ7k53oDid9EHOoAceIZD9leahhGPeRBjzXWQCrDqOJQvtYzjzK0znyEMRurHX4uVtE4mkNi0mkxn2F9sIeL27dxfesuNgcH6KQTO+BXa98kibU9nepZMYUHyWBXa9n0Nvln14+7j4LJEIXn/cyjjL+0joWnrtqqq/rJCFt/+UMs7I/RPBqiNYoRxpkdkN6+sonlZ2+SJmzjh0f44Mc/wQvfeBlLf/gNLD1zBRsvPYvaxgIWrl1E9/oFLN64xDRDpHf3sfW3r2J8fwfrFy8i6EQIF3pYvnkdzcsb8G9cxPK3X8bVP/sTRBurOEqmwMVVXPjm10gvypXhDPGU8mmSIBtMkM5YFwHpSxc0Ozjc3sH2/bu49PzTWHn6KuuS8phtptFt24qQ9ReewqUXn6E8ihGfnMBjeSRtjX4mf3R1tBEtdSvxeko7XUtXgKOe85TuxK6sFd1ZO8gSpIMh4v0DtEnXcLmLGfuvxHhZ0lwcIPnF/oPVoT7GDsYm38uokAas70YT/tIiQ+YYH+xhun+I8fahlW3h5g2ELNNsdYl9E+OyD/AScQoxUFvhRV+v24oj5ufqnLnSf163WRdCsuIC+7Ds7bcQ7G0hyGUAzBgnR9zrIHjpdzDptC1/kzsssuKJWKlPHld7lE+iPFhPbN+1bpfvfRzt9HGyN8SFF76Cw+UF9JtteGEX3sEA47ffQ+/CGmbXLqAfyKgXMH1yupJmY5YBUrUjPnOgMhW3TzpYORz3lEynnRHUniPyRyNyss++WVA48oJoobm2C28xHxO4uhdmAicnHX8ZZ5Dv3Fs32vhNGkDs/DeGs/Es8zMKMjPbhtNv4K17B/ir197DTx8c42f7MV7fnuCN7Sne2Rnj/e0j3H5wD3e2t/DezjHubB3g5sUVLLV8W5UlA7vxNp3GlUrbtWn5ubz0voJHg3i0MoBU8GQB27dEq0SWr0mwJhSUAD4HRD4HpzfWFvCNm+vocFCor3HKL64EmQasJn/0V0EFFXyRwBQK58CUOhqs6Asijqr1Vl/faisUfcEETVi0R7G2R+FAxsfUrt58RpmhXb75ntd8rv3UExtk6KshDfjrHNhZ2nyjCaGTKPS3gYeTObrTgOn84KuCCiqooIKPQCEiJUslPCVDbaxW11enHo7GiX2RLgmdeyEnoX4xlrPgFlGHdGp/77CeoVHPsbHYRtuXgoIpcHJuk08FVSz7dxLagXuSrHa+5bObZJYgvb2UPpPEHYCug7NlBBAYHowpxYt6G1NwZgm6DR9LnSbxcsojmxBbKOXD/oOTa5XjF01WbZwrKPu0AjSJU8mk5hQu2gtWxnpt/zFJ5hhwEn9Cuh32x7Z6ZjBJ6J8h5thYKzuUsbY2OgWjS+ncrykKGMbObZDjsxRHUpZLaVXCefxd3DNwffGZs3G5FCi8nh7GLjyYnt4rBZVY5dZ7+Sh5Kf709bxWh7h4UjDXWCcyyjglnfjl9Mo47pBRhSnen7taWQpDjvJU/qp7kVvkkWqBmVrepV7LfYBFZ2hKgSJeJE6Gv2cGEG2Lpf3S5Vf3HH2ZjCuE7uWKH+NHc583KG+NY4g7eVLlk3JH24jd2zvhfCk044Y+GnNbpDkcbXUBn0Q7+CEOhzO8/cFdHA1j2wpLhjJrx0zTjIDiUKOZK6fycC1EJXel/7yBJS7GarwXjsLVsFL5VE2O17X9kOo7mQ7R5BiwM5/CHx3Cnw6Qjvqm1K35TVvFlGWUO0Gd7dyysHaptiieIIcg4LgyyqcIc44njUAFz31KENZaCaAWMq+ndMqpeCNjjAwgOhjaSM55MMumLbO0Vd+Mc2ZtOeQRyWmzhWGjhzTosMCsN8bVFkMy2gUslzN+SE6xbBwjiyZ8gybfLaRTrPT3sLl/D5f37+Py4BCL9JPxg4UmzZifZAR5RwSVwlyKYpOJhqxuBJ+m/Cwfg6s8UmT3rmxi8bln4DU7mO/3sff9n6BFHlxgvdVj9/FjPfSxduMqOjeusy0GmO/sY/DuB9hcW4O3ugi/HSHstbF4/QoWr1zGwuUNM1qn5P/D//4D7L/xDubHQ/S3trFy8QL8bg9Bu4MW7xeeuoHupQuWl3gmCgJ0Lqyhs7mJ2e4Rfv6f/wKv/7/+C+7/zQ/pXsF7f/sD6MD1tUuXWZI6epQ7k50ttNdWsawturwaGt0F9FbX0L1xDe1rlxAQp6EOFb+3hTCV8dzI4ECkLa4GxbNVG52uujUobso2rHoQDvJRvVpLpGfI+opY/nq/j/7hHurNEM3FJcRa5SFZxv5MRhB9GKat8VTHZBDjNfUPOhg85VVbdy2Qrhury7byJep2sXiT9HrxOcwvbmAcsa8igj6dl4tv1W8yKcZz/Yte80GO4OSEto+kxMpq6LK9pT//Gfy9HQTEiaEZd45prwv/qy9j2CVPkOdstQrTloyTgULnIygfX22AmanfSPw6+8QEKdMc7xxhem8fF65fx2xlARnLE6UMt7WD8e3baFxax/jyJiaNBmVbyEYu2UGcSYZU+TFtGUV04z62LUnvfp9UMJ2b6lc84xohS0TfhPNkzqWXWNfamslC8LWd70TeUP/ndl95nCBmF/3LmnAjr39sA4hAvKHQyku8rXxdTmw7THPMMZo+wgh7S/C6y9ibMIeoiw3Kp43FDtY6EZaXlzBIfJwMxvjdpzZxiePaGvnOxkbMRn2sGqHar/Jxbcfl734reBRUBpAKnjhwDZpCQoNyCg7tWasBrK8lurMJvv7sVTy33rGBpk2uKAjqqcJLqOnLLhvy218FFVTwxQCnNDkDm9TL8c+ba0LHgSkHykE+M+fP9aVan4PgAebZEQeyh5inB+bydBd5ssvB3R6QHDE+J3bpCH5GmcLBXn2uCU9mBla3lzfljL5UokTSANFkCyeBNvQhDho06b+CCiqooIJHgyYkFKTQGRruC0LKT1/b68yx2x9ilFJM+xEnd5w8Up5LpPrlpFIKTMWVkkQT8maI1V7DZL4MDlJUShYrtIlihrV5Ix9ssmh9xcfDOJC/c1LOSFk+ilMcj6YU8c5AY0kIf5P2Lr6UyjJNLLRCusBWpcgYo77D0uRM1bbEUXwlL79PAvYx1o8QjE7nwKbzQQA7vJhjXa32OBnHtvXT4SjGyTTFjP3RjDNwrY6wNShKT/2WEDdFjXARzrqTO/tT4azc9FfOpqAqcFVY0V5qUlWXGQfobIVE8Sz1q7apta96ee9cEcbeS7VVpu/+BMpFqJVOz6aoF28oiDLnC1O8SSkhZYtwM6fnwk9hrLwfvRbxdLX0SI9C0We5KRzjlgo50cGuBfCpiMta1vYqfK+DkZWn+DNNMzOGpAWz+r4OI/YLRZLKWxRCODwmcCtiiUJBU7Uttbftk7Gt/pBRSfiZ0YkBRH/hrJUxMkQO4znev7eNB3uHhWEy4Ls6ch00zLrVNlFGurKsurPy6p6/StPuPm9QecTdqkNxoJzwEQ+yflg+U46mOjcoQ0/a++NtvPPX/xU//d//I17/y/+MD974Efonx1i5cBmtXo/xGFMKV7Z5rVZy2115lD9zNLIJeukYy/kQXY49ZXxJSCvX/j8dWH2ptdRS1ovD22TlXCuxAo5ppdxV22HbkgaO4GmezCg6i2PqNzHodHHU6eGk0UBcC4lvg2X2kASSTSlCjXOZqs6+Szi3zn22UOLbSCMsz2JcGOzhwvZdXNq9j83RITosXyAFqHBQejIKGkEdPYwupIOU3cLWCG0gqrlnveGN/T4ayhAMS8HfXV6Ev7yMVNshbe1hfOsuksHAyi0W04dKcRKjs7QIb33dVngld7Yw+slbOHr7FnbffBftGeNSPuoTqGSWImE/M7t1Bzt/90Nsv/I6vP4ETZYgOerj6P0P0Y618kGHEntIE7bv3SP0//ZVvPO3r2A4GOHizaeRDCeYvX8Xgx+/idrtbWwMUnTHpOdwjIg4Re2epVFLc4zv3LVDtFvLS5iNp4gHU6abE+8U8TRGLr933kd6fwt+opU+pJhoZ/RzNBQXn5cgJQWtlSmoroWT/NJVBgszDPBPVZJSzmmbtlqeounVON+ZYT6eYHxwzDg1tNdX4WlbP8oy8bbOldEKQOu7KC+kU9GB61qFMacsFP9pG0Cdn5FvrgDXLgKXLyJdWcE4JO1Uh0Kf4SQzdSu8DGc6yV1bDci81fQCyh0pnO0dO5aWjPjvvAVvfwehDM3kbK1ImSz0UPudlzFge5ThTu3EGQv5w5s5524y7glfN8Zg2+QYQx8qeFqBc3yC7NY9LGvLyo1FRCxLQBr0b32AweAY7advIGU5ZgHbS+6MOKqHnHyuelFrVpMTZWWYtzIpf908saDSSJ6QwCyIPbFMxnOU85KPKwtdM05p+1H1FY7RJEFUxay3x1r+sgIcEk7Ws+bNTzymObvzF+j51zWAuJp3YeXcGEJSWuM/5c8/jsd6jQDXN5dx48oylhc7ODk4sDPr/uSli/juzUU8d3EVN6+usZ+NcHTQx9durmOzHVreJjeJio2heLUxmtoNZYytOrRc9FvBo0Dtv/Zv//1PxaMVVPBkgOs1Kc/Y1XCwpa9uavUUEQeDjWSC//mfv4yvbzTQSge2LDljr+gnlBOBx4EfO0kKa5+jOnWKFVRQwRcHpMyxTs0GNkUHpy+C5zH8POZQQG7KGd0ImB4hHR1wknGC0eCQYiVmPE3+OLDg4MIB09MMkHImbC6gtcBBTm8daC6jFvQ4w+pQnjSQcsJpBzxqNFIMN0xMmZwqBioVVFBBBRV8Ikhe20cr/NMXhNpeZ8Zp9d54hrtHfcz0xWXQ4phP826txoNtuTCfF4qhLLftphrzGa6u9rAYMa2M75SuhZB81leKpXxnOuwr9BWrvTW5X06Mz8ApffVG4d1awd2Tie3JnBKf2BSZCpBa32FjU4aWMqnBvC4utbCh7VPYB8lMIWWNpTXX5JhxWU7lUeb/KNCXlCQJco13iZ+cKdJZNm1bM8w8U0b3x1OMJ1PbGkorNOz8Cn35zPB5rkm4EjNk6YgrL/JzfZdoUPZdjgYWiq9sAm9BFMGF06O+OzJfRXIRPwbCkf+fAMKJNaIAooHhdgZSuii+0LHkpcUlwnYYOif7KpdFPRet7P9/ZWBknRXo+GQOj9EdvsyHabkzSBROJRYueiklhiuXOMrxLXlWXwTzrdJQ/WvLJFIf3UaAXitEO/LQ1KokBnIKSJfO4wBhylJD6ketbhUmCcc6O8MZ7hxPMK03kdTZ5qTH13bCpJEpTqX4ZFsck8/f3zrEz967bWd+aDu4VNpUKXfFm6YMU05lGfXgaKqSO+PH4ym7A1efao+6mqJUvMAak5Ezo3DJ2Ga1MriTnuDuP/wlXv2P/zesppRK+QwzlnG4cAXX/un/iKe+9cdIvcjo6LONawVWajXPsSPHoEvpEBsYYMUbUmaluDvv4cPaGuJ69KlpYFQU7YwP1c6VgubDIetIqz/4XJuSXSmP5M1gOsxcuEhlJ5lHqWGetnYsBXFsqWIx9Wasrqmt8pCcmHFcm7KR68D7JsfCC5M5Nk/2cHn3XawfPMBa/9hWgwQ6E4V5yEiilWix8jDjTGH8II31vk4ekWJYYqNss+W13JLpE4FxbbUO3YT5DZoB0mbE8uoDJ/LxJIYXJ4g81l08Qyj5FwYYM9wkijAiIaJZisX+GF0vQJ/j/UnE2m2RJhElc6KDsUlJys5mnKE1ka6AdGYa09kMHuOg08QwrKHP9iAlfcSCtLWYXIbOUMaNJmVThnQ4YV4ZFknbFtNS0aZBDZNWw1Y/zMQnsh8wXas9ppuQZjHx8wLimrgzVFaCEH5/hGg8RtvmGFrxJ1o5Sp2nmW7V/D7KTe6tA73TszvcXuHZZtkMtGLDVumkpAH7mCbz1TlNh7UIg4ubCL75dSz97suYdXukWx1jpqQVIFothJR1SzqJ1/SRqW0hzLhz+kshPvcpW8w/MP7MZVzzVRLyQsrWRlmifsSMCEqDdDC8eBW2Ift1X32rZL/aJfu6NY4Jxv/x/47Wm6+jN9HHbOQJytXDK1fQ/PN/h93NC0yfdca8zNApfiQOskX74lGmEQtn9jkNHWjO9hyxTcx//j62/8N/Q5NZX/vuy2gt9nCytY/333kXUa+Dq3/0B5jevI4jysV5psPvZXRP2Jfrg1t9fMH0WQm2JSNx1WoQfXwnwssY+dG6eVJAYyZTsOvO6MlysjT6mFAr466tL2KxQYZOprbLAkNYHarN6uMHt0rhcZWec/ACF4EzyKo81tsX4z9yI8eRAsn+OGjig6Mh/rf/+jq2Yo7xPLZD8qDKb6ueCD7lenc+wO89u4x//b0X2M7ZVxRpuHZZ5sl6t4GSWq56XNGBfcOcjuNTGQonTP/eMMF//OtX0Wh28G++8zwukglTytwZ5cp/enUHP3zt5/h3//wlvLjG9kJ6kn1ZLsfbDqRrIL3tsRjxspxG+go+BjkHkdUKkAqeLLDGLQFLBrYBNP/YsdQpjNa7HXzj+TVsNjgYStlF6ysUSgPtl6qJ1JQjPX05IlnkRGEFFVTw5EHZ4QvUuxfP1tGzw9egQI+atGcnHJTcB0bvIDt4G+Pt1zHZ/imS/bcxH3yA+ugeguk2omSf7hCNtE83pBuhkQ056evTHcKf7SMbbmN6so24v4c8GdsExpMWjiMMTgfclRk7J2TcyOM8thVUUEEFFXwcJDc1ljOFOZ9rXmArLfYGI4zSOfTV7FxOijDO/vx6zSZ4GSem2k5pTr/Ir2GlE2K5zQmr5L/6A0ngujSBktUa+2kyKlfKak0W9efktc3uCQohTOxRhmwL65mytz+aYkKccp2RoMmmBpRS4Ch9KYUsitsSRytAOpzEautF7Z2vL8INJwbWBFwYFaoFi2dIPnQVKLz9W//mMQ8pNmdJguE0tgMztUXYOMkxYzLa7ka4yekrfimny62eNG7WVNlNnIWDlBXuvvyTgcNy54+jVvFnuEtZwFdzTuZzpmTpSdEhnJzTuLt0UrFLcWWa9MLViJNtkSF/I54bk7Ma6adS0kkJa1i4Z6krHLZ0FtDVm26FT5m67n9Vx9iMQ1d3qxzowRdKmrmJxuIrepiyxF7rj/krvuEizFhChheIRmawUdoqF51olmmLFSkE+cLnwCHQFiziE6Wp8I8FlLnH9kOeJDFkxNEh7vf3j5B4Usi6bTpcmcXlpK/oQELo0Pf9/gxv390pVkJJm8vSkR+sXRqtynK5WrP8it/S53GBlESmkORk0J03QNzNkYPmMhR4ZsxRWcJsimC4D2x/gGu1Kf7VC9fwL772DL7z0k3jkT4CXH76BehcImMDtgsZb7X1GhsAx5IxNjHGTX+Ca/UTLGGEk3mIPXRMpn16OiiGVqhouyGt0lBhQnhSyJqMyzALJoiDGcsjgynbvJS+4ti61qvRUU6orZR0yOs66F38ybomISQbZPhMGcibe2inPnqUM6uDfVzev41r27ewOeqjkwBNvosYUG0i93LyToLET5kUpRsTEU4OL+Xj6O22xpJTeQrQvRIxEM+VwDvGt9fkG7UlKZ51QHed5YgmKRqTDCHvxYW2KobpWFVI0aktqmRYmGYcy4NUl2IxI93YNtXOp0xvOEGPabQmCZp8Duk6TM0jjhnrU6tJGkRtPp2gHpMfspg0nLH8KZpMu8W23c5I0+GY+UzRoOxvkXa1eUJ2YqYN5kn5X5sqPGVAzPg6EJz4+bMYtZMxeWxmK1I6KeWJcCDewWhG+tox8sgyGQFUQDqCa5eOJk7hylfE8TQIb+yefs6fkpx0MT4XF6j8qmc+18knMtmZUpu0TZh3PWygFgSYDYeoD0dmmEjW1pBoyzH1Lcq3LoM+8TLHcjItk4Um9yPWU4vh1O+I1gFlChFiH63619lL+nBMBjvxorbwkRFEfa0rj3hKvENsxRbyY5xsHnBuNsfsnbfh722jSZklnU7q1TDtLSF66euYtXsMz7Qke8n/1q71qENGWC6t+PHrMliyzQhfKemzBGta+cHMRgd7GNz9EEcf3MLgYBd508fiC88hvHEN46hlhmJtB2cfFjC88FZ/oNUqwtU+rCA+VoqiWy+q6LGCUPi0aLAoJs+1itZ9rMBn8oj6fhkMtQWWVuj02g3ymcZciqR+QnH19HhlvfK3QhRYqB2ozbgPXXhHHN2dqyg9/+ZWgPBq+UgmiTaOFuW4T2fTSR7rTUw5+/69PcRxhhcurWCJ7SSjTInJu6/d3sfByQDfeHYDax2N4cjMYlu5Ij+T2/yTQViGN7X5Cj4ZNE5zNVlBBU8SqCdR49bAnbca9GibgwvLHfRCdZqahFCcOQmsftR1rDYhlrB4ckHjw9J9MkgIO2ekOu+MAqV7NCjck02lCn67QMzK9mc8qXvx1nk+/CRe43CB7Vdf/rivf5xfGV4DFg043DYAlAUcfHnzmBPWPhrJDicztxD138Tk53+ByXt/hfjBP8A7focTnHucsHDgnO5xIH2AjjfiZGWCZn2KqDbmoGbo3HyEkNPbsHaCiBPXJq9Kt95/H8nOa5h8+APE26/BZ1oRBjaQccoMOeGrrz1U5goqqKCCLytIXn+SjHdgwxnNsiXRKUMlRtVjjGMp+HXQb8gwoVOo86V9tW7hZACZU8rmdpZTs55ipdu06aWt3KCznE2ZXk4+S3gUXkq/DMPf04GW/DVRJn5MNpYyQFt+8M+219I/+yoFd2p5xuBzwDJFdFKKFMXTC0vPBqYGUvgoATqCxmhybpruQp46KVY9HxNOlg85Ud4axLh3OMbJLMeEtEmIox187tN5HnRYecpE1FPKCFSeU6FyKEW7csCnfKQIc2NElsmUUVIe0Z9BbGsopiW6q7+Vwsztrc7SWrpMqe5WQlg45iFluZxA+1WXzgwmqhrla073pGfxJ2yUNi/2DBkimI6d88HyWW+v8BZGtGPRzrka6+O8O//uo06ZmzKU9zbWkBcJYXip6xZRmF8Jho85RSUuplyr2ZkfSZrZFldBEDAKyyhlEGmlD4xlYJCyyGdZfCmPSC9tDXK22vQxAPEuVxG5cUuOaeq2dtP2TCmd6leKHnGqKQprPpK6j0E8x739I+wdc9wTNexMGRYKgc+yi0r68rsom9Uo3+kqEJXduMjR8fFBiZ9rb+Iv54idyi2c1baJbaPRxre+8R38n//X/xP+/E9+H//ia8/iW8/fxFOXL6AV6jyAALG25SH9LEXWtZuH8srG3wkSrAUTLAczSrGEfKmxoSX9mcBRTlQ8o6tA/GnjZfIbf5k//fijr7b17JTCKQKWUasmfDZwpZDXdcx78fUyyyKFsWggQ0LEOAuzBJv9I1ze/xAXDu5gdXREP51pUrQ/8kSdfK88ZJCWwUw5Wl3zvWSnzcmJqjWpXwFcGT8KxFkGRKYRTJj/KEabCbYkgzKWizyaixcZ2/Mld+dosr21mXePJW2Y/EmRakU4y+XLUME6XmGZlxmmO0vRJYlaDKs+w7bvISJSYltaTLlLf7ke7/0ktlV+TaYVzaboMkw3zZkm80lm0DfjM6+GYZaYsrJN3BvkkTbTDyUEJ8R/7mMlaGEBeke8xxOmMceCzrpQHSWSt76tROENc5VMPV/ndI+g6amMewgKnmd4vSrrwmQ5nXhFW/bV/dAZbNMYq+SV1vYORj/+CbJ330Ojz3mQ0YU8w+TEKx7rP/QCBMRNqxTZ+i2nnOWo5x58ltEZ1rQiUTt3sH8nDdWvnCqJ6Vw5yJNGc9JCYeijX4ezwlmJLZzbethu6aN79jnMWAYR904y2rVnz1ZbMe+U3KnzVBhGPWGauHQi1o3k1MbTz+Cl730XT734EjavXMWVZ2/ipe9+G5dffB5+p2Or/LS6SGf9zPPE+g/rSZmGldGckLLWaP2nK9fjg9LIK7xEGzPUFLxwBkLSISo+MHqfw1v9AHsF+GbscWOgCQs3yeo2RlN5tUpCK74EJnMsSf2IEpIGilkkajQ6A+HmQkoi2QjO/P9x4B8z7TNQEY3uKhVpKrCxmAGfKbcSlZu0jVhk6TL3D09w/2iMY8qkk3qIvWmGw+O+7IZsV+yf1H4UlbLOxmN0artGP2bmSqbfc7Su4JFQrQCp4AkDZxX1NNGQYOUAJk84oKBU//Yzl3BjpWVL8mQY0Vcv6lwpMhhPX6TQU4KDaTyJYsE6L4lPCTsrgMqhP5XIhgb019V6f5adna/RoRg8sNMuS6+0lIgJTktKv24wXYYTsewdwQ1m3d1nBZdaKZTpTi9C5sydbqdw6hROWFfw5IHqlLwjA6TVpWrRdduqWKtV67TJHWbIKHnO8aANHmpabs72y0G04oqpNWDw9R2PrbXOODnJKA84OMuHqI3uAnuvIbv/90gfvMqJ0g6CdMDJ3pjvZwjmlA8Mr7ZkeQlFl+npwM+eNYkkzjpwVUNFjvcoVzIOfmME8RAYHyAd7TPOFH5rgRPAVQ74NaTmIF8TQOUj5Y3SLzOooIIKKvhCgmR3Kb+dEHVyvpT1/LUu4FFhdM+RGuW6Bm/a/mIQJ9gbTjGiTE1qTfo3kHG2KKVVpAEeZbjULDr/Qv1BKx/j8kKEXiOEtr7SFNpWhihJymEGJkiS04/pW74aVwgf64OEgwWifzEO0S2dvqpT3yNlz5gdwf5o5raHsXjqzxSK4dS/EUcZAHTfDYDVpo+o6Nv058ZkiqO+gqM3vtMHPMrOprOcFOfqc5Q90fWVFm/1mNJ/PK9jb5LiwckEh5M6Yr+NmCFKRY/i2YoOjeOkSbLxoktMIzyNH3UGgSmJ6JxxgeFJU43zcn0oxNl2wrDKT2UUSKlbT2OEvNdk3IwZMqiQxk7lISqIlvQq70tHPAwHw0PAvIpb0US6dY1MDVc+G9WJk5RlOtg9UQaevjpmKNGHHvoqW3WssEKxdIrn4ipRl9r59w874s7y273lzbKpTOq0SUgz6NDXUBe9DGdLkTQW94nmnGcwjh0SrNfkvXrmFN1BHqPJMcNqt4m1xa5tgxWS8LZ6hnUuOrn0Hgc4nhEewilleUeZh4PYw6jeRq4zS4ibP59x7DSztjTNyG9ehK2TMX7+wQPb5kU00CoD16ZIwYL+5gj6Ld4U4HycezygnK0N0OngcNe2xQesQats1i3bmRn7ZBxIpmg1ImzWp7icHqLhpfjxB/fwH/7+bWx+618By9eRsB2Kdfw5W6MZBly7krFwY36Ii/keGv4cW0kdH8QtnASLzshkGH1KYKSSpu4wd9UBWxLr0T4W4rPHP53JUbfy0YeBxZ8yzJoMKOI7nqYssjrU2NXFlQFL28V005ltdXV5/w6u79zCxuAQbZbPeJ0/kpMZ89VZIWpHzmhGR0FnYQjWvuToI98z90l/KsE5KOrE5rQcV8sOELFc2nrJ5KmarIXjgysQL241gw63tn5AnEo5ZFsmUtbVpfBOyfvE1acEk3ShYGE8ykCGl+yTEjeo61wVCUrOGRjfDu1mGRVGZbC6NoQdTVVmk8W8s23UGFYtKdBeU0xPB3FndC6Kmy2oJ5CxLfH4js5TH8d0Q/qpHNoeS32io63FZFIFpZS58zInehitzzn+G066K2IZCFeW5NTXVuWp7vkrIquG1DeJPvlkhPjoAAvdBoLlLmaBb1sDoR5S3jGkpnj8K88hUFw3YxMlVCdKVXQsuUBlsWwKvFXH7sGoyFs3VlC9y1tXPQGdJAbeeguNnR2EWWxlTtj4tAKk8ZWvYtxtCWOLp3eseObL/DzK6lRzOJ0rwjmls+Ag8j2EswnqowkaSYBGZxH+6jLaly6gfXET/uIC6ybAWF/5hyHrj/GEPHHS1/ihZD+9tP2V2r1WFonehi/zopeCPhZQm0nFuzK8m0GKMp14GZ+L0ix7RiRl+Bd/kco2DrP2QZzl1BfqA0NteaU2IJ6OOSbK/QaffTQDD6utGpr51OosrYlGIjzTJ630IYLJV9JJNaj5txIWvyiUxkrCx2IwjDNA80ntjuEdX3xWKOO7NFQPlo/xmGuxjs+UF/3p95tZASLeY/pMu1z9q2e3hZZaGXmWV22XaMYMyoq9/hh39o+xN8pxmDdxfwK89t4e7j/Yw41La3jx5ir7EA4qKfeki5BR1slyUVW4OfxKvpNvBY8GjfcqA0gFTxy4PWj5L1nDgUJIgdz1c3zn+Uu4tMiBRqavcNT5OUFjykhJPd1TKpTC6UmDEmvrUPkkJ8EuYSepbu+tnOU9aVWEs6GMgtnf2ftSQLpn+2V6xeDDntxV4Vys0vfTg6O7MHJ3H0tNuBv+9lBcBS7kQ2EreIJAEwQ1VtWgG3DoWtap40G+L3j3DFxHbm1XAygO0DxO0HwOuNWO3ReGKcIg4YThGPPhPaT7b2H64HUke28jmD2A74848JhykKAvUzRxoiygvNBWAHaQuQZiNg7ij1wxGLGtOTREMZSIv70T73LQoT1sa9obWkaZGabxBFnMAaPXRBB26MdJpzb59pg+8S7LWkEFFVTwxQSNDtxkzJ5sLCG5dyb7zj620A/vGVQ9gJtQ0tHfTdw4FeXk+3A4wck0Q1yLTD3F6Qr/nEKG00jGofyvO0WTZPJGs85JeIhIyUlmW7pMzybRAoebA+VT3jl3+stgNsY6915KxBrlurbsGDO9w8kMOntDxgFTMBIPTXSdUpUJsL+Qwq3rz7HS8G2Mega6V/8i9RDvbSLLeExPB3oLW+XtVlywx9GXuLyXsnkQZ9gjXQ5GMSbEJyNttOpDWZpi08bGrtx6Fu6qCvWVxJCUoiOeUjY4PIpxHdGRTUmTelHUDqElEoqhrchEE2Fm50AoTdJAX/AqBdvjm32he0+nZzoz6lg9OcUAp/qWtqnX+M4m78LA+nbhk7Nv10jVYaUyGC/wVrHUJ0uRqa/npYyUQsHKIboxnL4wZxS+0w8vwt8Rxp7dy49c9c+6sS2gDCc+M0OFYFbEhZxWlFP8ZApIvSjA8jXcSD+OMWR40z7gERNq1nMsNEOsLXXQ41XboXkcB7kzEXhlJDcveVzg6GtKfuI0S3X4+RTDXIc8N40AdW1vQuczDEMh9Rs4GMzwzoc7dri+KflUYyLAKV1/+0E1qvaqSaT4zbUYlUS8KZ5V3aj2XR2pSWXa8ig+xnJ6gE6jjjv7B/i7n91C++rzCLorlibSEerZGFEQ8Mm39lzLplgb7+BqbchxYYgHcYiteRtDv8f2K/X3ZwHxjeNT51xZnJM/685klivZx2rn9EHtTnxMjizqUL+K5ZGXW5xLb0zHuHiwhc2du7gwOMRCTj5nu1IzEw1ttYnG1EZPxT/7M7BwutrPOffpwdIxwwTLKLHING2lm55ZFG0tJ9AqBNWdBKP8ZJyUDTtJOXaXoOO7ua1MUMVS3lGmpFoBQ5538wrSTrLUUtFh+PEp2qbENNnCt/zxmbDKaspkxsmyORIm4UcN4qlIbPeZVtxIdjBd5p8xP8UJ2M9JviTE17bbk2WZKemg7khyiG1Scs+MH37A/HhVxgUo+Y+6R8GZ/1kA8Yxzpa+7M5lmdXUujOgoskxGGI6GCHsdNJdWbDUYUScdGYphbGWbeMJ4Qf+U0fasxPjeJatXxmPFY4GfBSrcGeidcy6+8unErKu33ka4s4uAczDlKWPirLeAxldewrjTNs6W8aPkSxl4dVX1W+tkO28yVFd988EuZh+8j+N33sX2O7ewdf8eHuxtY2v7Hrbv3sH923exfW+XBQ3gL3XtDBfxoeqMyQlL4xRt9SYfUU15ufxdiZTNYwHDQ7Qj/8lQJUMH+VBaMhnWdJaLZJXmvlmaWltoNjjmYvvnC8bTqh2ddyKlPWU+6SgDiFb+icbaLk1z4Sbn2Ysh65qlzYJIUVnl2myM/arNn3kn+thOLGyfGuswf5MhDKs+UX/laKHO/lPGFrXxXw+sELy6dEqeLuvIak70Ya4CycLf2BZYDKqc5K/xjsYxZtyhn3aMsJIzbTMysqydxUUc9PvY3tvHg+0D3PrgHo4P9rHW9vF7v3MDq+0W82T9aLymcUTB06KeUrRsDURRK2FxX8FHoTKAVPBEgjpnzZescVMI6GvA1XaAbzy/jqWIwoQCVgJFQuFsguEEXXn/RALR1iBOHaqs6+VARa4sp5VSMpH3uroJuXPy03sT9CbwJbApghX3XPwynAPXnevq3K8DBQ7Kzp4Kxx9dSx/3V965AYV7X8ETC6pktT+bkMmxTo3FHD8a3+rRKtrVvgvreKBeCznI4jNZN+dkQsZNfdHi1WeYxw8wO3oDs/v/gHT/DYTTHYTejG0kt+XJ+rKipomFHDPN5gnjcwKikTD9tMzdsiM+pkThxEhfBdpAUZMQpiP8tH+s7mQM0UBfwxkpbjTZyvVFEsOFzR5qwYINbTJfeam0rhwVVFBBBV9UkIRzUk7yuXySk6AvxhWUv6eGkOJ9GVYTdAtJ2T6l3N07GWE4o4z1GzZSURgpn22SSblbToz12/Dm2FxoohNKoUhZrcmNJt0EZ4RmuCL8KTz06HAo7/Rj4yLD2/VBNX3xyDQnWY6j8RQJ/bQNkr4fVrdhE13Je3UklneGblDDUsO3rseBS9P1gTIlFHmo7FII2JPSIf5KhznLX+tZhkmO/VGM43GMaaqxoOL7jGBTXzo3VlKSVmb6Gy345/t8y1emuCTtnGGA/1LgKLL6SeYuA4cUE0rDfWTAdImb0nE46Zk/BCnvwsCHNr6J6s5EJUOPfV3LMAH7w6BOx6u+B5AS3Rz7WwvDeFK9eNojiiDFiwwgylSrS4gcQyhn5amSaYyg+JnVd8CrGUDqvtWL1ROjWwRd9eOSKzzLqwtk4aVEyNxhuTroW8oZtzpUvMY6UYLGRg4P1bPFZaKisTjWDk5mvFD9P+vcFGus8NXFLlYXumiQJ7VdihQm9hU5r5Zske7jA5sJGF9I6Ttjee7u95H6LfuCV8Mvna0YGptKwajtr0Lcvr+Hu9v7pshxyqDHWYbPBlIIZh7bgc7EYNml2NPKDat7VrQMkqpwO8hdHqTUnHzSmQ+xVJui7SVm7Hj39m38/RtvYn1jBTcvr2G55aFBgsZphpkU60ymU0txbT7GNTbVrN7EXtbE7ryNsd/hGJXjTIfS5wZSyubk1UzlUhsjM2rVga7CRfNC0aOVJViexLh4eIBLO7excnyILmWQztQkYR5PtRNHLaTQyoo5x/+ZnAk2SmGzcGRm8NCYX/ODhPiyqLY92VzGBoY1ecDx/TzTjCJAIwg5P9BqhpIGHuUU35kdjJTQXkkBJQKTtzNX2J4ll8ybeQYSoKKjyWm2KT9gtACJtkPjBEAHY+cx5YIZZ5zs0A4WEtFCOadsTlUEylL1XvV0TvkRkgeZdmHQ5tRDHGi86STR5wunVc2spzprqj/G4vIK/E7b5joSJF6oDZLE85Kt9KC/Ox+Dt6Srk52/BihdpcPs2glzevtthLu7pG9sFJEx0RlAvoqxtqqinynX5URna8dO7ksG17MYzXSM6OA+jl79AQ5+8Aqws4N0eIx4dIRscIT85ADzk2PU+lN4Mw+tlTX4m6uYkB8y8owMb+p3jaeIG7MhmsyhKG/pVHTL/nEAMxfvCD/M1euqzZDn6GK2B51dJD/NfQO2GzKrtX9bDUX+VQk1/pCs12H/PtuL2sVU59jQrxmxXU3HCLIpVnsNMzSZYddkqT5WYE0we2c4FELq/3jD9qKeVquFRCMRSP5ztgcZlrRVn7at1yu+tN/PBkXZi5S0G4X40/IkqFzurTjGPf/mzgCxGPSnj2QOvbVCz87cYXwdGK+xksYxcZwgbAa4fHEVa50Qi/UUF3shXri8jK89tYnnL/WwGMgQObMVxbmMssqHZZMZv8TLnsiQyldtpoJHQ2UAqeAJhUIUse1rKCKB8CwHn89fW0SDb+3wS416JAAMJBjOC1AJpycPJDzd4JUPKnzh3J8EniuZnH7dahcn3FV6E4gmFMtppbvKOUFdhimvLqXyWj59VvjE1TefmPD5OqvgyQRVbunKdqh7tV/He845sKs6co1Y7dnda0sR8Y+MDdoSK+LgwMsOkQw+QP/Bj2zlhze5g0Z2zAFFbO1f24xooKbVHzaY4mBMhg/xugYGmgTrixP7Sk+DIBtAkEPtWgzKDHijtsZBkL6cMYw5MdbqEyk/dA66hnLJbETh0+CkYMUO0NSSbPvii/enSVVQQQUVfOGgkHH8sQ8yPibxOAksxmROygr4exqMN5qMM66+DzweTnEyiTGVsdsP6U95zFCaF5vxQ+nogXJYX+/bl/adCKFkuybcBI+y14ATHcnhj8Fp3gI9OA/7ZTqm/Ob1bBzllIXaBuNwNDUFwpyTWq3TUF8hVYGwlErTnolHL5QBJLCJrgNdrSR0pll2ebEs9oZxVCwpyWSYVy8zD0JOxlNb+XE8STnlZjxtB2V9JPP0iJlwZQL6OtPKSxykhKGvsGb3p6+2peYQXfjeypUxfMJuMbZVMzJG2PZXjKcU6uw7ZSyxvlE+UvgzQSk9tE1Ut9nAYruJbsMj/X305Bohn+lYHx25RmSrH7qc2HdIh3bDRzvifeHafBdFoSmSUuJo5VCpiKv7AptlYKbKV+XQQbX6+rHly9Divjy18wxYppB9e0CK6SpjhNRxMkhE9RwRyyulwfmrwjTomnWG0T3pGNCFHsvnO35LyV/CQ32+4yph5PhQ309ICSLjScA8neEDWF3oYGO5y/L6TrmuNOSEP52KqDSkAXUjH3t6DKBaZd5kVhl71NZ2+xMgbJFyLAjrRPTUuSUxeT7zIuwOpnj39j2G1diJTFOMmZ400JjPtRJ9MCcn/lKbZw15as9zM9YF2lwuGWG5UcNGs4bO7ASrmKJXS7BK3u+srOOVt99Ht7eA/+nf/Ct873efx9X1FaY6x3A0QJ5M8czmEl5abqExGmLKseB2UsMhZ6pjv/VYDCCSTW7Fhp4KWSUs9M8yi0e1ddt6HOPywSHWt+9i/XgHK4kUxopMqcT4klufN8hgMCF+M6IhtXfMxjQlf8541ZZVM+I/pjyLybt2UDr/wlogoWdhM23bxHiJDB6kvYxUKYsxSygHGUc0kCJYrXXG5ynDjtm2a4G+7teqNzqmY2KWP/qCfkI6jImT5gd2fpCOQxBdZZzRlcJC+U6YzpS0i022MSPiNKS8nXraokjytQafyETMP2WYCYMMKFtmpLXOcnL9i3qhz5/uAlGTEs0MNPFkjNl0guUL67YyRcZ40dVtCyY8pWDWHEz8xh9hzovuPjOQzp/VAKLMZchUHas/1wehjIEm52zDn7yKA22nFTVw5dnncOH557Bw+TIWL17G2qXrWL96HStXrqO9eRG4sIJ4uYM4VN/EfiGRsZClK8YXVlIhwxuV/fTZeT0eEC6kkCu3jH68iibsF3M6o4kCsf+VoV4rEZx05C/j+EHEsIHxrI2pKDuT2RRRyHGNzzY0S9gu2G+Sx1eWtVVYxPYVQWdVyBA451glYxtMdXA+24T5MT2t2EllfGG9aURnqzuJi8uZeLA/rbFumSHL8Ov0M67+y/jqh8Wjji95x7Tdnevhf5MGEEkSLVWzje7mLLd561k4ENiPaoVNwndoNNj3ir41bJKOT13exA2665dWsLnSsXGEVpnm6Yz5uHYgHYfo53a7ETj5LX2EKw9zsXJW8FGoDCAVPJlQNHaNISQko3SIb714jYKobcvDtLejBisS4mr6Eg5u6CBxUPROTyK4AlgJygf1Y/KxEp3+SPDySsFnXudAArhcLXIWr3wWlPeKq/syBXf9aHqfBgwrdcLMT2krrbNU7e0j/lRv7u9hPCt4ckCDBtWxG8S42mb9qwc3PnBOvOkGFy7E6aCF9S6FiDosnzPVqD5GbXYX6f5PMN36IerH7yJK9jnRGXPSo51fU5uoeLnOCeKAj4OoGicSysstQdeEiIOaed0MFfb1i5QcHJRpv3G91x7sWnaeadCSayk78fI5qPCJKSc+OSdZHgePTJ7jGe0bzEFgwqkZBzRBswM0uxxctoi9tusqBjsVVFBBBV9QKKS1/Z717qXPeV8n992rMgx91QFQDo+SHLvHI4wzyl9Opu0bQBmpFZyyVAYQ2x5K44E8dV/bd7X6QyoJfXEoOc/wlN+m1OK/fc1v/c05sARLcDiUd9bnmJf6KTcO0b722vphnOU4HE9sUqyxqH3Zx6DqIvTlnXowGUqkYFmIfCxLEW6TUYGFpFMojWOZjylmeKtcGM2l4crAnguDZI7twRhHkxyzOTucekTctJ2ES0uKA/Uw+rpSFFbW+gJaqy5sMix6mTKBE3Q53mvyroUXTU64u40AC40QDa2GZNkY3JwzgAgXlV5ZWer8I52ZSZvxlnoeFpRGWEcnqKMV+nQeWkzcroVr8r3zr6PNMO1QBhAXVoiO4wxxkpIErDOjO/MhfVVn1vdnMjAQ51qOCxznbyw2sb7UxNpCGyudyL6YlFsvrmvts/vlpmdf5q981NF/pR1gpdvCYivCUqeJXqeFNl2Lz9r2QzjZ1ilGV9KUeLma4+RZ+LDfD+m03dUyeXB9pYuFZkB/bSoiBbpGF04xojpVjSu+sS7T1bhIfPp4gGUhjbVKVkoUbWmlLeeklDIsWT6VU7ylbdbGWR3vfLiNnYM+xz2h+5r3dLz2JAHxZZsFZ4teHtKxru3rXI75KH9mprhOUE/76HkzPLPaxD97+Sn84XNX8OJiB/7JIcIkQUAaHMY+vv/WXdsG6A+//W1cXGjipSsLeObqMjrNCCd7u/idm6v4F994DhHb7vF0gr00xT7HphPv8awAUfvSGRSqPqMF/+3MDta3Pi7yWfZOmuHi0SGeun8bmwdbWIhHaJNfI8oF24JOq2c+b8QJUirnjQj+Qg95t4tsgePspQWkCy1TTKdLXdTZnkEZk4x03p/KVTPjx5jyLe00kDDOfG0Z6fICct6r/CHrXXLSJw9oRcaEcsm/egEJ05y3IySTIeuPbZrp2VkJMpK1GphvrGC4xvxbTcoDzh2mOVp1+jOdCSkcrS9j1mtgutRAttoDhS1qMvhSznosx3x1kXm00Wy04I1jNGJ9UBVgyD5h2mO+F5cQr/QQNZuoyYjNeJIjjwO0kiVIySN22Pwck9EACdvB2uVLGJO+M/ZXmj+5Xqjs78QkxFhygmirf/vMoL6Y+ajb+3QGEEZlvyF5pi3hfLZ5GynwXXc8xf5f/Q1qTO/iH/0xgq9+Bfm1a4jXLmK+fh35xeuYrV/E7MI65pdX0O+FGLIP03zR1xZq5AWPf+qD1aIk11Xk8iM7GT/Ef17h/1iAeGibR1PYsw3ro4D6fEZ0ipUe85j9lFYdsafnvFZ9rbbdzFU2L8RoMEIWTzleUF+hDymYlsrGOtWYTbGPZ7rWMWUbOpxQvs1SjldSHNAdTTL65dgbJThUHzNOcDRiGDp92KED1BOOcZoR5THplCUapxBP6fZUdyX/fGYCqi4U18V3oyXX95a86d46ntXzeQPIIHMGPvXh4myHi+r1lxlAlK2TkxoNzOdaOSMZK12EwmkMV+eYLsCIY7p+XmdeCUYcCyVsZ9IlxGzvMtLOSJNZzLjCg3VSD2RM0uhC+KsvcyUQTsLBVg8r33PlruBh0Niy9m///U/VNCuo4IkAm1hq8kcBqYlcmI2x4U3w5//ya7jGAU3LJiRTdkxOGDEUBz8Ni2d79ErwPdECoWyuKkl5J0FX3vG3eKEQ1g/bkzw5meGD7pyfhLC7O0vXgeimzsHdy8rs0tPk/KNhf1VwXyDYzUMpPDq1Eq/yynAaxFTwBIJxYnFvQ4jiesZ/ZzxwfqBTXNl2ZWDQ13j+fAgM72K6+zMkR+/Di/fQqMVMYIpMX4swur5OtS2sEg7GNUvXAer6XFODXg4y9BVe5jVQD5t0bSQcOHtBw5b2moGETsolDQJrCQcTHMwl030mxcF2nfJFskRLc+3rFKbPfw1kcr/DSe0ysPoVdG78EabeFfsGVV9jnC9hBRVUUMEXD0rZrjsnx53cd/42cbb3rh/X5My9oeykDLapG686YHmrP7ZDxmtBhGlCWevpq0DGNi1/zb761/hP5y0st31cWG6jrXOdOIHnKzc552RcWylpemtf3H5EBLsxUwl6KHAlnjpMWNuOaMKqA9C1n3499xGzb9ifJXhv7wixrUwJUNcEmUH1NaVN3JkOexxCgivdADcWIo5HdaR4WXY59k366k99A/G2boppyydPXWytfDniZPjByRCH4xwp+6xa3RnjrVyaTHNApVFuMaXX0MqUeFJc6zBuGf51Xkfo0480CPjO93kNPURhiCAKELJvlNoqTubY609xNJohZh51fdkrpZHRpcCc5VNXqhIvtgJsLjbQDYmLDslWCMazTtjwcfSUM9xsYGpEpVeZpo/daY4Hgxhj0tX6evW/FoMpSlHocYLP8byMW1LeXN1YQIf4k/rGA2bcUd4fgdLg5XL6JJACgfXFctmHD1KAM4ZUFAf9FNtHJ8xRRic3LtCWmBwYME9hnqPBuus1PSz2WqbAEa214lS0NoUyneilFaO2qoX0d+oWlZ1lFLP+Egz/8YC09nxM09zq++7eMU44pInrkdGhREvnGOjEs3v7A7z2/2fvv4N9u7L8Puz7y+nm+DIe8JBz5+5pdPdkTqDIoRhFSUXaFs2SLJVtmZJtyeUaSVWyXCxKLMvWH7KrLJdNsiiJMyRH05zQ3dPTOaDRAbEBPODlcHP65eTvZ+3f796L0D2DBzQe0bjr3v075+yzzw5rr73Cji9eVLOXBttixjvtLAV7j4Hp03nPxOoP9EXTT8Z6niurY3IrDRqaG27rweNT+nNPPKZ8u6G1axs6PTehr3/ui0bSjkqFjM6v7ei//9w39OCDD+h/8W/8VU3XSjp3z9mgn4aR9MwrV6OdfvTu046jrwtXrun3vvu8vrcx1FZx2bon3OLdxSC2HFs50a450Dtt92VatJ48yHQ11W3r+N6eTl++oPuuvKql1p4K0DHbS5kXQrLdPINm737Ns2XPTm6oB37uU5r8xMc0nJkO3kBrMkOjoWl4/bquf/85bX3rGeU26tGZ2C2Z3915Qnd/4kMq3n2nVCmbUZaCD3W+/6xWXnhJGy+8qMHOTvDw0pljeuDf/Csazs+qvbKu67/9z9Q5f1mZpuWL+UTDZZ86c1J3/vovaPDIvcpcWdHq737J6b6oouNsmzdO3n9GZz78SAykDGcmTF/O28qqGq9c0s0fvKhqqaZjn/mEdHJR2YvXdfmzf6TGS06jZ9qoZnTnz39MC5/5qIZ05v/xk7ry+a+qvbHllnh7WlzB9Oxqt52TUd3sYdsyuTm3oNknnlDu8ce0Wq7Y5kEm0rocEPowXTFLHV6eBgNGkd0KIO9MfBYJWmIF5m//U9WeeVrl3m7w0rZl487JM5r+K/+aVo+5bdmPbZDZ7s2NMPQB1rDkBxXzL79zGz+xtqob/+3/S1Nz01r6N/+SVqcm1XGbHAzcLgfl0AG66BVZc0Dbfl2XC/ngVmMewcQGZBXSxwVzeWPirZNjAIRVVrH9uBFCsaOZpZK8q8D5XLlhW3m364rrELnECqluoaBukRVRLg9lyVqXCenkP7+nW/2Vl17S537vsyqX8vroJz+tY3eeU8n1nEdhcHna1hmu7w307ecumKm0VO43TCDmI5YNcZ6XZaGjsnMuQIDrL1YVgjH4LzqedbZTC1P6uQ8/oLMLk6GPxESNbsP5amvAChLn7dZxl9JKuknCBzhIq4pzrmPzf99xRigAvXYKFb26uad/8Ac/0PVONQ77z7P6wl+nQ8zNPqwHTA539TP3zunXP/GAqh36J1Ic9HWlG5cfWhhWnH7RZGjqydQjPVYP9zLEXdA1613PXdzUlZVrTqFtxDJk4vpwG+OMNVaZspL1CfOT5flp44yG6NwYx1ERBkpDuwudKCjyoO0dwRvBOvTwaAXIEby3wAx03KBp2oVBS+cWq3r0zmUbYhZusfoDBgBDQzFiJjdLxGDtMCZ++Pq9B+QdVo2IirIccuM7BnqiYyFcvPAV5Z6rXTwf/hpI92B2DAf36V0IK0uy8Re3AhGTfyIP4XMAkdd95599d8j/DV8dwb/8QMVBb1AtT9AQKuMBFeATNBl0+VraJBxtuWjFodC/ruHms2pf/7Z668+p2FlVxQYbgyMW9dFBkXVbp/uHvUtREIiOuNmde2Blo5udUt+GZ2biThVm7ldh7iFVjtkoWrSRu/iosvMPK2s/XH7e76fuVK60oGy5ZD7StW7XjM4sDjNFxw/DMW+FyGnQYdTzO84YKVYWlHM6Q2bsHhTnCI7gCI7gpxYO2NyY6SWfg6ekQ+AOOn8T/8c1OtLaXlN125F9OlNyDFqHhKAPI/htnFvBs3W9SiGj+Rqd8KOuCPP8/fgJ6zQIH53hb9AnDsOBZ/xa2Uo6iePwTWhdNqBZAVLv9bXRaEQn8TDkDbKL8vgSAwQxFOA0+5op5zVbcpjQRYGx3EPOYUiTDh0sJGZ/OijQbDMF7fXSmR9rja5apJXjYFG+Gemy/ovOTKcWM05HojPOrLIcAj+cj8eKi8lCPrYJW5ioanGqotlaMXDGeQXMsmRLqEI+G4f31luWcxGR07E/gy1Ra5av+Cc0Op+DXpy5MlFgL/x2wj/+4QhDdwHZ8pUO1HhO72NVpB00sBHbnaU0x3QQ9y4SmHJyEQfbXdWKWc1PlmK7qkzPcjab4mWQARQedpwbks4OeeO7scOGwF6IAZZYNeTAkY+MWp2u6q5nIoiBC2eIMmNjVPMZTbluweXiTC0GY5h1yRYirEyK1Tb2o6xsvZnOEgN3DhBudH+bAfyyvUnDtHZldVv9PKuLyLVrAAQZ2Mpkpy29ePG61l1X2aJ1IdNphr3aI4L3IGR6xn/Lju6/Ec26LJQYV+k3df9sQX/+icd0csp6XaujrWZTzWpVnzu/oR8Oynp+UNSV3KQe+9TP61/9i/+KFqYL6rQbWpyfM11lVDH+WKm0PFONNgaRludmtGmedn6jpb1+0bgm5LsLwdecKgMfxZ75piuRjjP8875faNR1x42rOnnziubqa6pZn41BEjrcaLNmQeOZ9e82sP1UE7w+/KBq996l3CSzoU2HMABfcznzscUpTd9/jwrNnq5euqS9ck4nnviQ7v4Lv6LKfXcoN122bME2cHmsnpfPHtf0g+dUqOa0cuOaCjDB6Ukd//RHHLYS2z1df+YFZTb2VDKlwMk7BfODhWktfeAB5c8sadBqa/35C1q9uabBdE2nfv6juuMv/qKKdx9TppK3HLNAy/Yjb9VzZzR3/LhuXryoPbU1f88p5Rbntbq6prWr19QyfrN3Lmvp5z+uiTPLHLqhi1/5tvYuXI1BiNu1YozZ+WzlODTumnQiOxvZdk+7e3uqLMzbVpq2fWX8sBLEeIp+ChMJ35Hj/U7hWwX4qssOz7mlLbDcKpnIAP+N7mHL3cmtXfW+8YMYvC5/8H5t5u3vfMKb+322oHRt249az3S7MbmAg+7RBYiPKbWcR8O+AxSSPhKAojJ4MtZxbkdbGQOyudxwO66vaKK5oWJ7J7bmYzu5fqEYqx0K+XJadcBEj+D/Q23duKx//P/8v+k7X/if9Moz39IPvvcdLR47qbvuuVvtjgWCgZUIa/WBXr6+rZ5xUi65PZq/sZtCNs+S3KJ61uN6pMOh6baRh9YZMr7vFcrmgVLT7W1iakp3nV3UZLXE/ALXQTofg0khqS/r7cjKVP9RQfEb2sWobpK+kd5CMdSZ69M4eftbYHGT0oltqkwvaGvpRDfSKajuGJ67tqff/9oLeu6V69a9Wmq0O2p2MiFzd9oDbTd62qm31Go1deedpzRj/kJbYmvKwwCNRaqBL575gd7j9RG8DrAJ3g5VHcER3BYIQ8LshH5HDKCTS7OqFlh2jqExNjSDA4zugTBF3vvgMoXu5sJgkKG80oj3GW6UE6YOhgiOIYPiYLwYP2McjJkySgNGPUw9jRYf4CwJiiQsYPajGNPLWwC+DKUEN6qe17j9d36I+/R3KEtH8B4FdNC4uj4P01Gqb9OeCYDuAmaOjMUSM0bZWbY42FWudUP9jZfUuP4DdTbOq9TfVinn9t5n9YfjtPKF4moy5THixChi5kgjP6Pd4rIa1TPKLD2s2l02LO5+QqXTH1N2/lH1y+fULZxRSyfUGCyrPlxQQ/NqZRfVLZ+QFu5V/tQHVTn1IWWn71B3kNPAymJYTzHjyc9WmHo99uhs2YDaUnvzqnK9euwNnkp5BEdwBEfwfgLzveh8CC5vN5b+I+B2rKfYMSOv3rHx1xvaTEwz87q+T+dCpI742MrB4mFIhwQd0cWcagW2ouCZ+BPsz/73t+9Uh9E4n+FS9AGH70NX2U9urJUdDvBGAD2xnZct/zjDI19Q18bxZr2rTRu/HDzN2VJdv+txToa/obOeTgK2L4rYrecNmXc+TBMC8taLa6Wc5iZKWp6Z1MmFKS1PVTVtv7K/y3e7ynbbllUd5XttZXqt0J1LhWycgxESmIEBRw4u48+F4eyENPM/o67zyxYoMdBkh46ITpq2q+RbhLEdnf+je2bhcmVlCWXt+Ps2nVl8hx5gjDF3IZzv6QAhPG+Iu1LgQPmsdWCXu9+Os03YpotBMhxxjt342Z/9SEf56MjjIFK6sZh5yuGvcd6J6YtVJ2yIlKMTeNCJs0ImS2kQ5tjMhPFblCV/DMhwCPzQuGTlDRMk0GhIhO4VJmeAN1avQxckHWXm5jYC22woxyG3UhcdjPxFB6brzHXFbGva4erWnm5ubIfNgOrDVjdU6XsZYhDORWUrHDorOb+AVsRgGPX7Mx+8RyemCirbr2A/toYCF+vZCV3LLuh64bi2rVc2/dyB3npNq4MMJSjOlaByOay/mmewhZnATsztZmZyRhPVyREB3h6A3cCdQusOGpXKruzpdkeLO9taXr2u5ca2qm7HA7eDHvmnc9jloVv49uUcFMJ/fGP1e5i3zLixqpe/9E2d/xdf0pVvfV8dy5CM+d/Ehx9Ve2lauXtP6dQvfUrFxenoD9z64ct65Q+/qJc/7/BPPa1uu63sVEnzH3tEd3/6Y2q67XaMoCEHI5XzVvPzKlaqwU+GxhHiJOjGsmiYJyNp8KhrOdSqFjTz4Qd1/Bd+xrZCxXlpx+DJy5/9vNP8klaf/qH69Y76uw3tXFvR9ede1N76lszYdOJDD8QAzYZpaO6R+zV9cinOf1p58RVtXMKeMEcMWXabsG+c9GzP1C03spYTRSOh1LL8uLmmne8+rfLahqqj1XEgaEgPu20lkHPQf/BOADh4awC9w3ljdcKwYxbXUaHgPCHratOiPz+3uafFdl/Lzu+MZdKkbctp8/YZ8/Mpy6kpE08xVkyZRToPMWA6WhUVW60FP3QpR/oGv6mfJrnbBXF2RGtP+d11VXZvqrK3omJz0zqAZT75xcpmezXbs0PbsXTPI6+GnYaWyj39b/7mv6p/5VMfst19XWvXr6hnXAQd2rlJGHdti7yO5qdr+sgj5/SZjzygn/vQvfr043frU49zvUef/sA94fcZuyfs94nH79NHH71P5+44pXKlYtGYs8w0zZBh8AVHsqxBXQCttxF9bwPArcthurE0tXMpTIjhOyrjTnOgp154VTfXN+Pw80988CF95qMf0Kc/9gF96mOP62c++pie8PXTP/MhfeZnPqbZ2oR1tdTvMXT9oaOEbjRKMa1qgavHtJDEJ4/gR8LRCpAjeE8BSmQskTdTD8Nj0NSnHz2nUzNlZXsWalbeEwtIbAA2k1aAYNQhmN+brDQAmWNBm648j8ri57TnNC9Gzq9iyacVD+sqYv/kZLGAHeMQJdLhcfiFRufv0iqPwzhK8aa/twkpquQMwZxHjhQjL84XwhWjFtFHtjBQxzMrjuC9BuNK5jcpwbEfq6/Uf+r0YEFsokVm3nA4K8tU87meisO6cp0VDW88o8a1pzVo3nS7byhvRZw5vyZ87I/0HXTjmFlqy8ycoflEuzCtRu1OafEhTZx+WKVj90sTJ9XPzamXs3qbm3DYig1bZuM5LujNuYnOkGgzjnBQsKQ0fylPqVCtaLi7oUyrbrq0Mei06KBiNjCdWKHox5LnmnK1ZRtQzERCEUk4OIIjOIIj+GmFAy43unvNxbzR/BFjN9gqukY+H6sO6FjsDLJa321qp93TsMBpbuh55qlWAJLWcnDPwd1ls//jcxOaymdjW4XQIA7pd4cHPg7fvznwPoWJX8eT9BPH6RtSHa8AadgA3Ww2o7OAwz+TTubA/ved+X/6lkNXp4pZzbACJGQeQP5whKRLxveWZQzs9Ps95XJsP1TUer2rlXpbDcuVFt3wKEJOIG9XNA6GTJMEnzn2ogA3rEzoxlY1NeNjtlbW4vSkZqslVXNsO2Epi1y1wZzOpDB2nSdqIuv0yWvUB9tiOPP1VjuyiB8zOpmYQF85nSQMXnCQugYdx9fVdJVBAAagjIsIh6lvjPk+AfXiPPMJaWQtT9nSwnSw7TJuNLqxFRCd6/4o5DaKX8h08kd6zjuDEfNTNdVY7eNyFKKiwLXpJHR8rgfu9c9v5sAp8p6oGGCDipi5ivrZcB23OwwoBSWqYkV6xvJ/wXmYcZmhvzjk3O8JE/UAGeB8nyBKYOcrONh/sx/wtgL11TYNbzSHag3BSRrgyLkewAp6zU6rp+fOX1G9M4iJHnFWD8SxX8b3KkCjZfX66J+54Es9Bq9yfT1017x+9qFjsa0edmanuavG7raytTk99fKGdntsXVWzzelf131lsKfZUjcO/h+YtgslVtJAF9APmDRtW48Ec3vNgV6+Vnf77prWadHvPlBzZgsGBiI5qyaniV5X8ztrOn7zss6u39Bcy3o2IV3VbAkYGbXbX7l0GzIeK/DcyBbuu1u1u09bvy5p55nzOv8HX1f9B+d14/yrWrj/rKqc8eF6WFu9obOf+JBmz510frPa/eEreuYf/rZa3/2h2i9e09bLl112a+unlpSbq7rt57T6/Ku2G3I69ckPKlOpqLfV1Ob3fqjMzU2VggmyFZfRMl3T8iP3KzM/o+FmXWs/vKh+Oa+7P/MxVU4tGrN9XfnKk7r4jz6r4XOX1XrpsjZeuqTcblfb331JDaejRlvV+XlNnlpW/ti8Go2WGuY5Zz/9MU2eOKbByqZe/OwfSReuawL+alq6LQQT0Df+TS/GUUyadFbY3onO/77zzYHwlRPL6hbcBuhItzyHg0NjsW0gzDGeb7EAyOIRD53ovLUVIHwXq0Od6azbtzIMcrc1AaNfb2pjdU2tnS0tWP5ODNxW95rKt+wae8rXd1R2nQw4q8J10LM8h6dnO0OV3W5K5gGxjsvpjItGLhkoYeVUOnA9PG8LFAZdFZs7Kta3Nd1ruL6Qty5jbUat8nRseYhw57wPVrSi09CPNp1r6mN3zenRs8tanpuWihU98omf08zSSQ1jtwPKm9H6TkM3V1Z197EJ/dmPntIjy2Xds1TV3SN371JN9yz4fr6s+xYrdlXdtVDxu7Lpva6rF6/r+PSE7j2xGKtl8+h8wZFNXyNd4u3Zzymf4woY90OkOE3HoWckf4Dnd+oQ9JQuaXBPv0IasIhBNOP9pbU9feeVq5qfndYvfORuPXbHrE5PV3RitqilmaKO+co2o2fmKjru61TWel6/qZKvoXdEeimtMY5CzyCPJEnZj+BN4WgFyBG854AGjcLGxAtWfMxW02GKGHXsOYghApNKDMGsZsQEojPzpwDYV5JlwH23XMqWHEzOePF93GFk2qFaY6CxVUB+0AvDuewwzJakAyHtnZpmLIXRCuOEWds5WODNgeIaitc7AOgCY0eMY0dK7PNNwvszPf3MFgZYo/ilUEfw3oJDNOS7RFPjeky+zGKlIyeXt/HdaTl4W6W8BXx/V8POurorz6qz9qyy7ZuqDOsqMkcF2jVNxnLl2MvXZkwP+rHyna+qk59Rt3ZGucWHNXv245o8/rhyE+esuB1TL+d3uUkrOWW3I/YXtRrhNoRLtI7iioJDHnPqWCluZCbUL55QpnxW+YWHfb9ko9Bp2oqkcwjyZOAjlDa3tWF7V73WmuNglk1qZ0dwBEdwBO8/GPH8MMzML80sw4cOR/PN0DcyOe3Z4Nxr98wtmQSB9pL+0Ebi1yw0OjDM+9keYbpasqGe8T3Gsv3fqzoeOOm7DAyo+L7ZH2qn3VVrYNlDp3Q2de5TfozofuhuaSUIg/B0x+Q6HU34fmmiHJ0JCxMVTRY45pnpBRjLzMzlG4xmBk/YZ4KZy9zjZ6wTofXAcjEXq6tJju6HsV5JBkJ3Q1fE314dy+5OdAqmSQx0AaB3Rz1HqPRtdEBFxwEdLDH8opbFYr3LcdPI3/RNSGAnkvRQcpCAeq8UcrE/eOoYSfkDuI6+fMsuSkihQC6dHFnTGeXr98Rhv9lBV2UjZqZW1dLMlBamypooZlS0f2HAyRhMtUh0F5OHcBHvKHfEa6Bs+34RIrnkN/Z/dyF0cDva4PZePQ5apQ7TAKXzZ7rjbJCVzbr2mt3oujGSYiDMxXS2eX6vgunL7avH6KshthNxu6pk+joxUdTj546ZxoYxcGjF0vrmQNW8G1Svpy57vVtvzBk3bina2NpTvzfUQ+fuixnhKxcv2jYdqmea7cVAm3VMlh44CVBGy7EV51RB4m0A1zntkYHMtHUPvLOvyVZdJzZW4/DzqXbbNJ5oG0oNXZh693dpa58U1bsNZCNW6oBIXM+ywCys5noouS7znb6rsWs9nwFQ4z+f0fTZE1K1rPZeU6985wfKub7KW3UttAcqr+3o2lNPq7+2FbEXZiY1f+q4zQjXNTyXwW1XVQzGxmAzNqn9CG1eFNvE8W++QV5KUxOaOLEYK0d2V1a1/ex5zWz3NNcYaqLh/K3s6tIfflU7z7yk6UFexXpP2z94Qc0r15Qxf1t44C498suf1szSQjTMraeeV/7CiipNtz7Hn2yS2wPIpp7LSovJmYfT65K3X6nbVW17T73z59U9/4qmGZx3O2E0mC0sqS/Q+I5l3W3rluJyXoJ2LbM4U4HdM3qFgiYeeUDdxTmtXr6qZz73RX3/s3+oV770ZV340h/r4he/oEt/9AW9+Ief14tf+ro2X72koukh7waQ5yAMZ4TznWgnKU8jGeAHmgh+tJXb1V4AtlrKlGdj8DY0pbTczTRrfcN8i8mmpQIDtBx+zopKeMIwzg2r5a1b9Bo6eWxBf+0v/yU9eP99MYmB3Q8YBGunpW4xmaKW7WnKbK7mbyfdaJIbxHXK0mPG99PmORN2NX9TczaynaZ5pm160qFTz/x3mGFg2HqgdZNYZXUbcfd2gfYaEziMgzj8HMLwU9oau6BdtpAzv5qfm9HSZFXTLmvV+KgOWsYRZ7a0Y9CjZi2p0NlRJccqVOOn244B7MSJqGPiPYDg29TTEfxYGOPvCI7gPQMYYLHE3MxhaXYyDiGMGWJjLc2AgpTmbWE8o85z994GBAEGSxddyy4GQRAQ8S6VG8WWAQOW8JdtyJQodbOpzs6OenvbUmtXxWFHZX+L4RwdCv40jFMiP4SleIpoR3G/TYZ6WJAdjmmsILBtwoDOYxscsYWCBfIAZcr3LorzcyiCI3iPATWO6pzoNd0FhSlHB4+tahTTYo5DZNum313luptqrb2k3bXn1W1dtlG5bddWPg53NV1YiY14+3SJlC3NJtUZ1NTJzSk7d7+Kpz+t8umfVWHyPhu4y7Zj/b5to7dt49fpQVtso8GenFl17BynuUbKo9sDS1dtBKEvssN5K2M1JHdSmZlHNZw4o6bfxWGSbiRZK43RjtyGuB+0d9RtrDkOK3iO8QiO4AiO4P0Bb87xkN90FNFdkHi/7y0ImPHfsQKw02yr3jPv9DN6jDmw2P4q5L55a3RUo4OYb1ds/c3UKirCf0c8G0BfGbsx7OsXr3PvGvxJaTkzMZBvOcgM/N1W10ZxT23rcH38LWditppxEVtloQ+53GCSLaBY3TuVz2ixVNRytayFaiGeiwwUjVZpxLHeDHbEVjzWq/x9TKbhOsoffXgMlFSKGZWLWaeXpHT8EgbdMu6Rj86z89Xxxw0GrWzMcyB8GgBhwCYbqygoe9QkPWCWoQyUsNqnl8tqt9uPPa57oy0iXg/jemTGJJ0I1UpJpTxnrowq15mKQ2bBh8uYXOctXaEdYnMK/h3lwWmhG5fzOc2axpZnp7Q0VdVstSijNiYT8S14Je1xPhM4Dpc18BM5BU8pboIkf9JJae1/dhuB+q03Wq4v8mnneu46Y2hFu66fq6ubqrNNGW2RbJsW6Tgfd/m9V4FBVsprirROab2yXdeM9cB7p/N6aCarCVARhF8wSVg7pLMw6s8v0D9NQ90epyEMNDM3Zx2zoKKNsoJx5mbltsqqplLMsGbGdccxtezqma5tOD8lEnjXgVpzEzRdujwuHzyl1HfZd9d0eu2mjm1vuhyu36BbtwXTeNFKMFv90OZAye2sedpTWmVmsGGYn6goO11Vd6aiyolFVSYnlDH/VLur9l49OnT7bNXnulm/cNVmQ1e1yaprncj8v9fUYHUjwhcc39T0dIiZTDQCU7kZmblmrHDokbZx0zXfZQZ83zyWEUEG6QsOXi6XlK1hi7gNtU0fuw3lTTe5ghlHuWj7Jq9qzzzL+cuaR7Pd4MUXX9b1C5fVb7U1ubygpYfvU3F6Ut2VLa18/4cqbOypYj7LCobbCcMYyLBsNh0UelnLl3ReBPKn0m4pe+2G2s++oNzNFZWMMbbd7oO5+M54g95uE81Dy1h4MZPfcjZHB7TR2SpaZt19WvM/8yHNnDtt8WSJsLutzOamdPOGcqs3VdpcU2Z9TdmduvKNriqucs4DgQN280O1iyYdf8fgUNDNKE3sRvpp6K+JgZeR/7sNPeRybVHDqZPqVhfVr8wqW5lWvlQNHliic6XTCh5YtH7Ats1s5YgMLBaj40X5YlkTU7QL8wvzuWAgDKAYpw3TMm2sYjxMuqyxHWnfdm+fbTXN5/odXy1rmbjBFpE9tm5CC3Syfu7aps+VTd95dD/jNd8x3tx2cj3b8m67oYe8t4C6DkmBLmHH9pmpfwHZmQbFkaetntuIabJULsROLUxWzhkntB/6OoqukwI46zbMp+mvcDxGXNKjoSsmeSc3BtIEvynE7aK69wYcYO0IjuA9APuzrJA03aaOz0+pyhYDSDMY76jBY9CwJDItc2fwA2bw3mOkrwdULWZU7K8AwW9kqFJ2DOWYjo7SZ6WkbkG+evmyVi68ou1Lr6h584q0t2GlrBWz2OhMTiPJmRjZf6OCMvZw7G94987AvgFpR14KNjzZ55k6DgHiF8lUSeU8gvc+HCYllkYzEMeAZtlKTylrBam5qs76y6qvPK9h64aNy7qyuY5pMCkRCfwdvTb+3pSsumw0VO9U+cQnVDv7aeUXHlWvsGzFt2Ylq6g2HS92sY95EL3TdHq2luy4jvkDA6d0yjCrNcXP9Nimg3Qyk8qUTtngulPtXFkD+7PqDPqM2WIoHxysOdjToLVhRbnhNyNj7QiO4AiO4KcaRoL8NZC4ffJN3ddJktNZnouZtU0b0XVm78JJbRCy9RX6XBzQ61s6oZI+AJsenf1RytpoTLpO8N2I/70JsV2Ty86M++1mU60+++7jbxyBg37CA4BKG/au9besZWbVOFienEgzCI0XVn3kbEgjT5m9zhZXfnBcdGraAI94MZ6ZFoSejO6HDKZ2pJJl2kSxEHhmIIr0QXFMrnENxWpg6sQZYduyRrsfB6CmMjiM5eV4BQiAfHcUBt7RcZIGTnZafTVcSEz11wN5GeUupDGrfKrOEytA0rsERJvuE21w3cfTa54P/MfhxluTkAr5Dv2XjLp8BeNgisGkKc75qKpayKVVp8YrHRnkLVab2+1H/KcCwibqf627DYC+4joDDdGxVSg4J5lYERIdhnQYbze0sdNwjhmUdN1Bi5F/vk+X9yZAo9bdbGsMcnRKWefMtDVVlh44PacJ1/8+a3HZe7mSWg7fdV23TB+pM9f3nbY6tqWqtYrDun0ZeWXOhTNu1naburFdZ+gxUI0aCco46LbVZjhkTMXvPjBrHWBQtdLvaHFvXYubNzW/s6WJNtN90sBgDOS4jefdXrnHD3f7wLVhRKbtlFwHJsnymUXd+Qsf02N/5Vf00b/8q5o4fgw2pcErV5Td3LV639egaXy7TpV3W6eeKIvjyFRK2nUb7peLsUoE1sa5OHnTehZ6x1Yw32ElSccIGBZMM24nuUJJhaKJBd4FLfjD+IMf9Enc/AHe6TQZOGn2zCM5PyTq3In4M85QGvQsy0xX68++qPqlm8oXzb2JrzPUyvPntXfVfvB+0nZ23hqveafBZc/S15IXu0hlY+DHzmVhEG2yawPp1SuqP/eCJpr12BouzipwkVnFmCT07aN5gDVb2aHLYHtwoKKa+aJuuP1XHrlHp/7Mz+ncr/+Kzv3SL+qOn/mkznziZ3T2k0/ojic+qbue+LhOP/6Apo/NRz2Pz7LCjqQvhgHhmAhHGqMq4kIfTfDX21hs51I7rIqqTmrxngd06vGP6txjH9TUwjHnKxfneFGWGAi1nlAadlS2q+bdDly5betm1F+GgQ/LvoH5Xb/TcrPws2V5o+W4HU+cIeIQSAieY4cE/Lhm0qAJceQKbmuOFw7YMr/sul3ki6YpBmJMM9F57/wkOeMYby/JvC0wJlJ54pqwE6vo3IbQIirVSqy2Xd1Y0+Zem6mfyk/MWsaw8aLxVqqYfxTUt/zJl6f9vmBnnBbYvYIBKPo4iT0haYw3JoSn+xExHsGbAu31CI7gPQUoFhzYWLZRtDxTi20QaP7M6GZLANgOAx/MNOMKE0gDIDAfYniPgouGQAXGetBhBodfzBI0R0U4saw79iZm9NkuZ8HV3rim5o0L6m9cV7azp6IFHjPaWO6fBpZSXGAs2Kfjg02MRHu8u1Ug7oN8p9gOuzjAHqY96vxIW11Yx8AwZQZPCJD3cgW+fyE6RMIl2kpAu/WfFSD28y6ZOLL9pnWsbfW3Lqh57WnlG1dV4cwP0/HAtBqGJ0vRORi2b/o0jTALa1CsKbf0gKpnP6PCsSfULd5ro8MKQ5/1JDZerOT2nAjHefSs2HUzLK9Ny2wH0TFEd42d4yef0Hso7GYY0CYrUzI2kmPmWX5GmclTGlbmY/Zqzm2HARB/ZGcazpkP5To2vLZtyOy5TaLIHcERHMERvB8AfjcyXvfBPBXeya2N5v4wdbwz+MGe0/WmjT9UFRvHMWMencR8nWFoOqqDC/sbdD9myk1WCuKMWkzy6IjgYgevfq8BspEOgq5LwyBQvcNe45Y+OZfa8gg8ROepC8iOE0mOWmYZR5XsUPPVkuZr5TgMnjNAsv3USZ83Mvg+5Fqkc8gZs4yiIOe4D7OZjgiHY9vUKh0SfgPmh66f+B7djPjJE/XrfDChgEPruz06TO3rTEZtOExy/oYrXUQD5Kvr3YVpdAfa7XDYMB0lr601UiP+ZMSzwiUNeFUsv8PUR8aOacnxIafH8pqypDJFyNHz4etBuNBvuXd+okPUeBmHjFnN1qOrhXycLRg4ZdsU3oNXu8BjZGJ0f8gRU6LGeAjgLrnAtl3K0e0Eyt12XWTzBZfJOLEHftl8yfU60LW1Te25YXIODHkdxqCYy8DPexhiINDl6Zk+O9YDe3lTbTGjalW6/8y8ONSejnZmvFNTvXxebeNgzzyo5aLz3PczZ0bQceimp+3tDe3s7mp2+ZjbSEbPv3pJn/2j7+r6SoN+Q9OUk7Br7rS1t9u9bTjEzmNAGVqmC226uatTtgtPbN5QjZng5imDmBDEALTbXKz8GH1sgCfcPnDLaVu3hhe5jnol19Ppec0/8Yhmfu6DKtx7Rup21L66pmtf/rby17aUXd1VMZtX3gLj1CP329AoyWxWjf5QWy5r5uSScic5s8N2gml+/caK27yTchjKPXDFNbN97Q7b2rHbMj9om1wGrA4BL9CJ/wY2Vputput3R/1eV5WZSZWW5rRjU6VjfupWZFqz/JqfUoYD0m1T5MykOdtj6+mXtPnUC9Juy2VzGVe3tPr8y+rs1ulyVpdBuoLduHf9dgByoJ9z/lgdCBWYb1g2wePBEdtrV7d31XrhReniJc30WpyuaDz2Ak8xgHqbABFUdJ3lqVPbjX02Us67DrIFdYzhTef/2sKMNu69U83771H7wQfU+8AH1Xj0MW099JC6jz6g8iPnlD3OmRmWTQzEu87TGRXQAbLKpDByaeVYOgMl53RvZ7Vxfk/evK0wUVZl6ZhycwtWoGpquB6ZTJtjcD+Xiy3Sq87obGmoY1MFnVyc09LSsipTs6pMz2luYTHO4Jr0+4oRySqRTrsbg3b50kSsKOm42Ayf9jhbyTZ6O2O+acc5vJzJw5WJyWgoTA3s2CAfqmT+WbFeZ37q+oEVcw5I3vWUN+/ZP0PlPQmp4tMv5YBq3JTMUjmrlIPjl6arunrpir73wkW9ZF718mZD5zd7urg70KWdni7sdHXF96+uNVUflkWrakO/w8RT0CJS7BGzr3Ym+PR8BD8O0NCO4AjeU5Aa9yCY8fxk0cKGmVhmMqGNuNmbH5iHhqGIgQP7gU2M2dB7FxCmSaCimOZdXutF+0IXKY9R3Lex1rECRmdupVbRzOyMFfuSEcKSuob6WzdVX7mswd66v++EEoxKEAdb+pvogLDP2CUGO3Zvn2U4iXCHIfy4wfrqj5QJe8Sy31EHQGQvQh/BewdGNGNli/uDaj+oSQxBzs3gYPPsoKXB5lW1brysbOO6JrWjMktkoXkr39kBHTcI/pwV15za2aratSUVjt2v6h0fUH7hHvVyc2r1rYAx68SGPR0e8AMSH4QSjwHoZytYjE2Qkxj8S1yDF24DdNbQceTn2DKDpcFWLHzP6ulceUKFyrJ6vVLEwTfhrMEN7LK2oLK9uvqtPV4ewREcwRH8FAOc/YC7vxGCywZ3jVUNY93M98wwbDQ7se0OHY4xUILMjxDmy/ZPM3LpTrCRXi6rVkbvM4+17kdM/L03gZwbL3QKuAhsA9aNGcqWWlZ44twOcEGPu3GGlLEEcti+CoWMpidKmquVQjYNB13LNyaKGCfIKvqbHEcfYTcStwlLyGLjcpA3DpkRy0QZYxp90jWUY2ClkFOJTnF/4GTtkOFJRjIpJXBOHWbzanUHsYInAo6B7+ikDPmZ6ijeO45ub6jdRkdNF5jtH2ImvsONZywirRn8GDsGvCYqZRVzdL6h64OFlAYu9Y/4yzdcuXmz6/h9+jZS9Tv0EPb3p8x02mUY+DDu6bhmoA10Uqa+9dM+gznUSS5ZFn86iIjT7TjztxEoc8/l2N3di3u0HQa5qGXqZHOnrpXNXeeY9hpTPPyR6ycU84TLREvvPaCOobcBdhJXl4eDfSdrNc1VXN8mWwYCoTV0wFarqWdfeEVPP3d5v9ro5N7e2lB9b08bW9vabDZUXZhRbWlaXaOm6bbx9JVV/bOvvqBvnN/QpUZfN6x7Xt3paZfFWW6gTjVF9i4CdTuwEostOd3e0/zOuhY31jW3t6uSbcQMvZAZNn2irY3rGJfaTKi7twmQBeZK0UlqRqKMXXN9S+svvmL3qjZfuqDNLz+ly7/1+1r93guqNnvaefYlDffasd3U2U9+VFOP3KvmyXk1j02pcu8devCXflbF6RllW0M1Lq1o89qqi28cxEoOOxNLbmlK+bOL6p2e1+DssjJLM7Gyh+2gkGG0B+TTzvUVrb1yxbSTV2VqWsc/+IiKD9+lxolpNZcmlbv3pI7/4sech7vUq8BtHb95fsW8cLiyod7GtjKFohqrm+qubqmQko8fVpfcTjk3REZgM43oIGSM888ksp6vtKVqr6fizVW1nn5WhbVVleEe5jFsDWzuCvu4LRDyhQFsExDbL7YtS9gAsdDt6HizqZmbK6oY58WNXeU2dlQw76u4Xgp7deW3d1XYbSq701DOco4WwfkvTFLohBxw2SwLoqW4fK9xt7Ox7AP8rRsDaIOy64CBQ9MR2/cVhy1NZDuaKSkO2T53bFIPnJnW3cuTmqXfaOmMls8+qDsf/ICOnzqlO07M6Z5TczrL+7IL6Dg65nv5vPWFSiWoE1M/zovxfTgjpmO/1siZ9QUPaZq2G72YqmEzPRcTC0InscuOnfWT2FnhPQmmOvBgPs/UErSraDhR+jTB59hkUQ8cm9FEMa+nnv6h/skfPKnf/tKz+p2vPKP/6cvP67Nf/aF+7+vP6Q+++gP9/pe/rbXdelpNBU5G+lia0uE2Fs9A4hKkfQQ/HnIP/Ma/85uj+yM4gtsKNFqYBn8Jks8BJH9+C8OO7j8xq4fOLsQsOLpEYwEeiizswEwHdsATi81C2cUi9PvbzxYoF7kYuzGM/Q/DGAfkO42GZxkEsX8yGC1k7eCrYUgyO56ryxkHZPqxYAuSM1M466BqgcW2Cb2eVS8zzFyuqGyxHN852kgn/aa8gMu4jphp8r81GA9yjMXZ+HlcRox8ZpYUcPbrtRra297QoN1WqVw2t6KWgfTVrcE4/28nDr59vUsAfnhKWBvDwd37D1LZQ2GOOwM30JOFeLR2jGpUhGFDqt9Qa+VF9bcuqjLcNC00rSgYp0PTKQMgjiiTzanpFlAvTqo/e4fKJx5Xbv4+ZYonbLNUTNem/bzD5ZPRkA6rtBt19jC3NWdeYPUqnqNNkY+gcaeFYh/EOepIwi/iQYUZDb309zRsbau/vaIy53wMUfWsDNti6eZsqMTMlaoytVPKTJ02BypGsY/g/QRB6Ifc62HMi4DD71//3eF3r4fD7w7HB6RvE0eipaUnuuxCaUYmmM7H7o28/c3STbG8dXizb16f3pvBraR1BLcHoDGMr0Qj4w7ngLgd3xPKGgyzq62rbO81td3sBE/v5QoRB7qN7XTfjzqY/Q2dFwyUz0+VNVsrKs8WUDYiYxvEcTqHYez1Jq+A13rzlHzG/kwgAShVSAjLCvZcbvT62mw0NXBe6RRiECHK5A/5lo6PuLdjS6qZMtJn3BNCnDjyjEv4wqhlO6itRkf1Tsd4sS8R+LNIP/RZg9N3gpZFPU2WclqcrGqKpTAMzKMd+V3aEpWwKf8BxEU8dCg43Rj0OHQd45nBjRiAQsZ2+6p3rTfHFhZ0/7tOHCqFSR3l5If9rSdcWROVUuiUpJu2fSC88UIdoZM6zp599jp9re+21HI2Y2sNf0Odk7/IY/zCkxyH4zH6tDRT41xh6wLMHR1hjmLud8bfIvCt80aZgw+SLnlx5MzujQER3pMr8AJuwet+kuTkR6VPmZKjo4IyvdEBP+r7nyzQ9pjJfuXmpnrZUqpntyVqjq1JXrx4TWu7pqtCmaJHfpOscBg6NOn4s99hSCVK7k9fqj9FyNfg/CDV5MXTwV26J/03izeFgOL3V4+5PPiX80V98NwpPbRUsX6HveT69yveXr58Sf/1//2/1de++0MV506pNjkj9rLfXV1Ve2dLzZ2bWpgr6ZH77zV+rCGarl7e2NUzN+q63szoh9e2tGGcXtwZ6unLe9qC+E3743zfKkRpHMWfFAtcJoWiUy51yE24LZ3YW9GJ1as6tr6h2VbTOGE7WFZbO7zLkOJNV/r6u7ABAzzuT0rzJwHYqIN8QUv3nFP5zhNhM24+9bx+8D/+nq5+/hta/9r3VH/2FfWurWoCbmXC3djZ1uSxJZWOLylfLWj+3GlVTi5r+cEHdOqDj2j2QdeZ426+fFUXPve1WD1Snp7S8Y88at29EiyiVClq7uxJzd57h5Yeul/FqUnbpV0dv/duaXZS2jEtPPeKbpy/FP7z83PKT0+q5nRnzpxQ1ektPni3Tj7xAU1+6EFVZ6fUXV1Xa31bRddHplRQZWlek+fuVG7K7y5f184L55Xb3lOp33M5XSfwEOyfoN53H+h1yJhuEtHZxoFOspYDRlD0HUDS/LlNdVstDSfcjo4txvZxLiAf+XsHeh3w6Z+qPKZJZCK8qMaZRC+8oOLKivWATmSJlQXtqWmVH3pEjYmJSCnOuXHkoetio+Us10wz3Txl6WtyZ1O5r39NE+cvKssWZBevK3/hsgaXLql36aL6ly4oc9HXi1fVurbpdCzvZqfVZBDBzIHVjCHbyBdvnRHkBjQTCfsf3Ix1g8Pw+ufXw2t5658U+kdDTG7NWV+oljRVKRgXqRawcScqGS1PVXV6bjLODpsomC+6TDHwaceqjsLErLI526/0z7ihMJDIOWETDg+/v3xjXc12R8fmqpotDNSqN7RXb2kbh27Xamuj2daOdaadelO79br1nKaubPf04tVtbWzv6r67j+nM0pQKriLWGjLLMGgtNA7nB350y+Bvo0ISDseyeKyfpgkYyR/guW/dbqvV0dPnb2qvX4iJGugzKS9wC+p5oJL55en5iu49vagCE3dHcSSOSbuwD/yWQQu/Jd0kYR2Tvy/k+pqfmdDU9IzTKIktrup9tuouqtPPaNe6Usuu1+3EOUZ3nz2hmVo5sML2rzFBZhRflDMgpUJ6tMgjeHOICT9HAyBHcHshMYwYrYSxBHMZsw/YDcwKl/4AjKLioK0P3ntMdy9OqWSjuBAGF5CMagBlnQ5Lts8B+mMmRFLhcztgZAiF4QlTTXlJ+YFRc4XJcjFuYPx2hGUTUDpz+R4/DN7YV5CwCGR/xBL2rBWBEMLMTrDxmS0UrfjVVCiVlanvRbTMCux22tZ1mUlo/1JNXWu4YXRHusmYhoEiKCI7o7r60wDMJXUoJ7Yc3/uH3JM3FAWMy4B4mVT0pES4ljpNta2Y7165oN7WpiolC+ByOZadpw8OYCSrQ9GINB0RMaPiBHCxX6InOkxcnlHeApwP0j3k82OAUAcufWUXdcTMRTrybeZ3WbXgtFwvCKP3NQQ9QffgYbRPqJ+hhfjrs4WABXn3mro3v6fh1itu09sxIIKSwJwvsfKDdmxUd9wOGnkbHbPnVFh6SIWF+zQoLJvmaq5XK9pOgG2xWDqOcsofpIxSN6ZB8sAPW3agEMaLyE1c0ssA+9HJ4kdWW+UcjlVW7Bc9YABk64bKIp+j9pL3+2h7xFXWsHZG2dm7THXFUXxH8H6AA0MV2gqfkRvT1ZiXjp+BMa8gXLrGn4OMfYAx60ph7fyc/BIPSrHg4Tsr3+mgPMKwqyydHDsqtm8o17iqzN5l5drrlp8N5bI903pwYDiZox6lyLfjm4g5xf6avI/yOM4bW/SQ8Sh/uFSe8TexsioKNg6X3o4d/JwbLuPfw8D7N/oewe0DamNcI9DdwfMB/aZ6hgK4G+Zyapltbuw24/DzbnQIwq0d3h9Bu7QSs1OHRrb2VLKcYMuAGtsh9dPe1XSsp5nKr4Ox15u8At7onXz43W+3ceHPNO800C2b1pm2Gi31nG7a1oM2SED0zbiM6HeoKQZASuhtUZKR4+VBe4gOJONiu93XTrNrnDgsuHAkKR/ggStP6Bd9VdxW5yoFO1Z/0FFv/CCn6LxwrPyEToP883cJ8yN+ZEjXsfMvReCjqDfaL+d0DLTXtI5onSu+D52OIM6F75MubcwMuqpa7tWqlUg3UnN5yXVoVi5Pjv2qcyXtWcdcb3S06XLGYfcRL7ihIw1d0xmB7zgecEadT5fzWpgoWYJar2IAxOXlu0Rj5IEcR6nfOvjj+J6y+QIKAwIVfue8sBqH8lKfMUknZxc0B4Yp7/ijHw+jmnkd8O2f7vt3EqBROmWaRv2VtW1lS1XXuWnOddTxu/Wdpl66eF2crZbJc6aFPUdkHiUxbYzFwxjAYNTJyHH/5mV+PYwjGuPiIOKgYeKIdNM1Olsj/lRnDIzSLiDiZPvBR9InfJuu6T7q0FdWFsU7v7BJZYWxq9liRp9+/IxOVHJphcGYGGj3vmxt7albnLI+dyo6W5mOtTw3pTNLc5qpZXRivqZzp8841kTLlzb39Nzlbe3mJtRya7hwfV0vXV43/zDdB05T9LcCo5zFoETIdhcisBby9EC3DnCZh7GqAwwmHkvbXOg2dMfaNZ1YuaHF3R3VemwWy3ZFbnfOPzyPOgw3Soc4oJ3R7bsO9BM0XXeLd9+p8p2nlLHtmn3lirafeUnV3bZmOhlVmj3V4J3BRzO2c1vaXl0JG7JYcN3OTau2vKDK8rKKtikzW9uqX7qum1/8ulaefkGFbl+l2UktP/6IMpWycuZ/E7PTmjx9SpPHjql68oSG3Z7qN1a1dMcpsW9axu2l/cNX1GHlxtaOmltbmrHNzbfFhXlNnDyuGgMwHLq96TBXV7T36hV13faIiy78uRPHNH3/vbZzK8rfWNOO48P2jbOHwLvLH/0A/sV+frcrAIpgJSZtkoOp0yCZfWknrhe2hWKbQwa0faOG3cTSMeWnptV2OPocklyHplL2Y8CAyCkPcKhMSYYml9qu//nWt29tAOTQt85/v2/6tzwqOuHaxrou//N/quHVG9rc2FV9Y8N1yCqgK9paXdXe7q52XZdbq2tqbGy6LBMqnT6uNqsjzSuJk3JF9iOfCU/kfb/t2I0nHoyBO8oeHBKcRjh77sdBG07P4QL2b94SpMkIlqOWz1Plots2PNNk6/ZQqxQ1UTAunH4MPISsTvmLPhw/pNWf1DP8kjr09w7LvItJI7FtHWHVuOo3mtrd2NZV0/bVmxu6cnVNF6+t68WrG3rpxpaurW3pyrXrump3+caGXr7R0JXNpgbdrh68c1GnF6aUd/rRQwCtkPlR/b2zAyBJJqSBjKRzpLdQTPJ/pwZAwvmf+h1h1Y9R8fG232upVLJ+szSrYyeXdPLUCZ0+taRTy3M66+e7Th3T3Xcs627T3F0nF3Virqay62RIWm536EjkO9qc0yDOyL/bQpq0kvyO4I1wNAByBLcFUueQm2VIgBGDC+aA0TdutIgLhAALFUcMK4SIbAj1Vcu09cRjp3XMhlGp31HJjLmHRhmz1RyXibtg46kwMpiIv58pxfVgxtm7DaTpMtHwXJY4jMsaLB2rqYzMqkA995Nxk2ZXwNxAE4orTBiB65h4zww5M70+y3UL+dgfms4AZrhn/ZD3fcdpZQslVvQ7vYLUHaiz1/ADzNrmTadjgWec1xacM78304yZJjkWSfrO+YPRMoMitlbgL+qPPL/WBfgGpSD2ewbPMP5RAC4o1rEnJgYUPs4z5RhQnpzTtlfemS1YOc+uXlZh/Zq0vali3qWanrYBkmaSgCVm7qM0MAujb2sshIw9iL8ADsATyMJo9asQYFYmcwh1+/UsREJoYOCDu8jhGOwxctDnmAYpO/VAbHxBmijlJI1A5DyVbMuG0sYNqdOwwlt0ZpgZmcr//gPXE3Rq2qH9SmxNNbCCwSCCMem64mDTXH9b2vy++mvfVqZ+zTTciTpKXUqc98HAVU/9QlZ12vHkGU2e+pByc/epk1uAI0QbYeABUxAWgHFIdSW8jyogeMH43v/ORNQsFTj2HNUtVyiAA2KJM++rydbezq/5Ty8Oar+i0rAd7YPPiJsv8y5rn/1NJ+9Qdu6ceU8x2gNAJ0pS5NNztJEj+KkClm7zFz0HY1oaV3Ni6PYyn+UK1cQ7cyj4fxiZcCNTnemZP1oBlEqbAdLMIlziQZBQmsEMX4c38gGDH/BUv7dHTi0VuytS/VUNbn5H/avfVueqr5vnzas2/EE79qRmP3gUaFt4jgM+DtGTNvIn5YS82ctXwDcUJ3ydH7/qj9b+M8M8zCUXkLARnjZIvCP5FnEjp5AXfsKwRh6MEzj4MuGSUJQp4ZH/FAdXQqWwR3A7IBnyrrGod6gh1Uaq236cSwbb6/FTKGqn2dP6XseUB42attDh+Ddtc04IceUtH7IDJhQ0tTRZ1mwlHxNe2EIg+Cg0aZ46ppd9N4LDXofd6yHJ+dR9SqyOLe4A8hGNzPnqOo/MbqSjmJmR0DdthPLRQmgjfQclvskCAyAFx4nulLbPgJ7T3ygdN+quy75e72iryaGxSU+NdgM/cNthVSO8Imtdtzhoac7JLk1UVA5ZRGJuAwinQEFqh5ECjCX8ks8+RNtJbr/9+DUTaKLDw/hE7u2x0sUhAjPUiePhGbwTnicGJYquArYmK1iXYu4MWmScQeIr+R8YT+1sUavNvm66vlv2Q++MSSL+wJ8YZy6r/aAD9Ef4GOeCHZupasLxFyxnzZnsT26hjXQAaMqdy3ILEBiB98T9KCZwZrymcgf6KHqUN56g3aDn9PenA8L9KHfrQM7HeaA60UMOco3zU7zep4hRWenEzMU+8Ks7XeXKFXVdCcNcQU3TwKtXV7W6vRf1RozRvnwhxkjViVE/3BMn7TUNPuCbUgDAGXek91pnP6e9T5cRnDiIy7jHi2hG4bmmQRjTILYFr6BBh2Hr1CGDoaabvuUudEEdIkVZtYteThzkkSsTlGiLce4b9ez3RfvNFTr61MMnNWlijnMlIxHylFO1VtWHP/iYlu69X09f31MmX0KTVaHfVK3Y18ceu1s/+/iDzp45gNNBSq5s7Or5S9tqqGJ5Zv3PvgV/R84ow4ig3jLwVZLvFtuwTOOkgB1JM46zOyg3PHOERAceWncOG0ulqJ1Kv67l+qbuuH5DS2trmuk1rGV3jT/4lG1I24qx4s146NlAxRaNeE0bfA8mbweQn04+o8rsVAwaNNa31HnlonavXFWx3VPJtjAdkeCfXl62mIIiW+ubMaCQte3baDe0u7UZft1LV9X49vd09Y++op2XLsT30fKLBVXn57W3sq5dzsFZtVvZ0O6NVTX8THrbly+rbPuuvdNQ5+J1tZyP7saWCp2emtdX1Lh8TZmdulp7zehE31vbUOP5l7T71e/o2le+o73LN1wb5nWuS85iYLvqQcHtb2tHnVcvqn75irqNehxEjXxBlwr54vBj7HN9Ky7xgluDWAEfdGveYdyip5Kj0O2ibbocpj8GBJADjYblQqmm6rEl7RaNVWcc2mF7JOoRGipgrzlKyDl0B/snpkH8xEe0tJxRofH3TY2Dud/KAIhxSKtnALBirOfNLhggm6jvqfn09zQ3PaP5Bx7V1InjmposaW1vS5WlZc3fe6+Kp8+oaFnb2V7V5IlF5c6cVhe53031AT72B4OcJhB5p7B+H9s4OeS41SATg8aiMiiZtQPnDxpArjCgG3wrSjXKf0QcEb5lSKUeWm+qarpimev4GMDOG5doKxEGFDmN4MlcI4+RHV9TvoxhywM2O3OMLhNxTpoOFqcqqlRKmqgUtTQ/o+mZKU3NTGpqoqaFhTnrNAPzqbLOnjkeZ5UtTU1obmZW9ey0ru9YJ+y19cgdCzoxO+E6cduFn5sfxzZ8wejAQSDgFoFC8H2KY4zOoEbXGVd0K8oMhO75Dg2AJDxShvSUqD64U9AIuiTbhzasTPb8aaXQ13S5H9swzlUzmqtlNF0axiSa+QnzJOOGgSd4RuhKURukSb4cv/PEfT9TME1Su0l+ppIfwWE4GgA5gtsCY+YQs1WCOdBE3arNVBOTh03QaOmgxkAijH0s4Pi2YGP41EJNj965pJlC1gZhJ5gxJhPmK1+SAoouJhuxo8TGJllmChhnY6Z0WyDKg9Hs8oS04TkJunGHViicURIYLYwtzdxh9rmLYobs9y5uAYOgZ+bptzLTDsz1hyqaOeayeXWN41Bi7ZfP+cNu1wrbpqNuW7FiRp2FDHgtTylXmjCOyIfxE4ZURJq4LXVhbSSM49GbNwN/HWWKmXJ2YSj7j5IQY9f5YFYMRm4Xjp+jhjBGXHbfO2AMXOVaO9L6FeV2VqzlN5WzQpqbX1KvPOEwFiEOF7nwTyj2vsZWBRZCZcdPZ0BSN5wjR8tKDHLBXpXse8xgWdSCw2KMYLiEEvcaGJXTF+7SE+U/wAFCjHoDLVBeoddRb2vNyvI1K697DppXoTrpPEDR70eg5lMblI2qmN9BM8/Zj9keKMs2vFS/ru76DzSsv2JFohUYDuRCP8YvA1dDGwctVnjUTmri1OPS5F3q55cs7CvRlmJgjXT8GfSQBkCSypFqawSveTC84eUhN6Jf4qAdhunt9sQATb+xYoPnSmyBBRVHO+YT/hx2OHReJ+9QZuacKZzZQsSfINr9oesR/PRB0DwyDvqNavYzMLofUUC4cWcQFJzojfcjrhlxmPIcNHzMbNKsLP+j8EKSxAL/4x0Mz/wtBhVMeXQcl3vbytevqrv6gjrXn1V/4yUbgWuWEw2/b6jV2lanbrnQ27Vh1DVbht7NL+FtTiAUbqfh1MLAHXeUwnOTTICf8ud3foT+Ub9TGf3lKJ4Ae+LP27T9XOQ+fMLQGTl8oizxHsBn9OsfUkv36XrwNt0dwW0Aoz7VMrU7rhfoMNU/70K/MQflQMztZlfbra55eKKB/S8sj6NDwY+xIpRtlkqZ2PqK/ZKD30L7KEOED3oZ0dctQGqfxER6oxu7sT8QrdLtomV9a7vBAIjTpiNkQKcr+oZdfOC7kAVDTRVymi0xJcX5pS2PYho7gqPzIfFYFdFo036SrkeJUqkwaB3Q/0WnQ4fP0kQ58JB3fsYTepJLMScY3x34vBHIJ2Ue4c73saLG8TJpo97uhJ4W+rPrY9w+D3JmxwxTI61aKqicZ/XxwPmkzunIcB1lLeEtt7fa0lqzrz30VceFvsRMfNJke9OYwESMvoBLut5nayXNVhwvuirpOL5EPwzsgveolcjHrcIbsDP24Dp2/9JC4rGpM+0QHvwY/tGugNH7UT3z1DNv3WpntNvtu66RK2y94TbZaOuli1dN3wnPUecR4fjblE6KOb1LnUKjcHb8BW3h+NR3B+8BvuEFbsTJR/EnLuH3ziuHjJPlMbWxdWkfwvR9nv19/bJvnRs9ijLADxj8gJ7pSKMEfEcHFqtwkZ0Ei06uuMe+iWk5Oj1d0ofuPqYaB5v7qzRph+/hRU7Ptublmxv62lPPxxY/g/qWBo0tZS0zTy9O6v4zJywPU/cW7voGK0A2OcXO6dKmnROnlyg24eVWgM9w2B3whcALHckuM+fPoSsk/LtOeB8fUBZwmlep39V8d1cLazd08saalpq7qgw4fLsbYclj3rRB/aSJduA71XcMrESEhtHl3QXny+XcXlvX1Se/q7Wnvq+ty9eUbXZU411ntEWe7a2e891xHWLzVcxfBvVmrNq4+P2ndeXJ72vz29/X7tPPa/eVKxpw7kOPzsVs6D7tnR1t/PBFXf7WU7ruNEjr+ne+r2u+rjz5Pe289ErEtfH8i9r77rNa/8GzaqyuG2/Yr/Q92NSuN7R26bKu+91lf3ftyae09vRz6l633tUyP+si12wz2q5h4GlrY1M3n31eq9/9vtZefkWdXddLvqACdOq8QVsH7dlg/FMzfxJQTfvh3kadhc0NjTmOnnFEZEmHi1rxX9qmKySXlUB4B/wkNzetzMKU7/1NyBaXgW8SqYasiW0sR3mLy+ieK7fR/rmHJv3tW18B4jbiJGIcrz9Kn87kvR3Vn3tGx0+e1NLHP6aZO85oslbRixde1fG7H9Dpxz+g0pkzlrVFNV4+r4mFeQ0dpmmZxjkvpBt8a2TfU8RxnmmPiS/Hkx13tE0crTb5R5+PcUA+iYXvwvnt/ufxFDdvGUgLOmOLyqkqAyCOBySSbrwNdKg/UvKZ8EqR4sH0FjaqMwIv7LvSYlKV65ZJrHnzjKr1m8X5GZ1YntMdx6d0fHFKJxandWp5RqcWJtXodFQqZfWJB07o7sUZnVmc8/uZGBh+9YbtjfaOHr1jXsdmJlK5sXXQG4I/g5dbK/cBUA7iSPEk/KcyRxrG7U9qACTZbQnLBzkAfOe2fXGtru+8fDO2AruyWteFa9t69cqmrl4zL1jb1dWVXZ2/vK5rK/a7saLFmUlVLYey9OVF9JZxxtl+nkgnEqEVol8lWjuCN0LoF6P7IziCdxncSseKFADHRRoGc0oNdsw2UEARq9xHYx90dXJpwQaxjU8Ypd8EP/dfdHyOmOaBOxAeh1K8bUCx+9Yaerm+FYmBHc/Op4UoeWf2IIDwTIqtPcCNBXbWWkjODmWDjvt2p69KbVKV4oQFUTkt8y0WgqH3hEJrJZAZetWS43Yc7NPMNj0Ztjtx+pmuWhZA3d11C7Smv+NoN2smdHBZCY7tgQLvFgDg8XCdvQ4ipMMzey9m8Lk8cWCkHUpesVpR1spFN29/P7PUlwOicoWS8lZQ2SrBWIia7rWa6rT3nI2m091Tr73h9y0zdJg6wsdp+R6HcA/DeNCLJc59l7fDcm6XM+NnlLJ2r6uu47fOqR4IdlnIE4IEPA4sSMYQpBjlxCUWyWNSppJAi5nLrg9wFYITQWQXVGoDI098nbYNpD1lWWUT8Se6fn/BGIe0Q9omdIGBEGpyKKGZ3rbp77Ia26vqdcBrYYSqrumJucGmy5zrcFBUv3hc5YWHlZ++x/W74AiLyrs+Yws8Zow4PgYH4QOjkRYiehswyj90HXU/8iL3GM/xDEE636P6jdcGOoOdwaDr16/2GD8fwU8nDE2Lg1zbJNh2pbOvNlPOoG14VuKnmQFGhB28Nfzga/AyHHzFhl22o4FdN9ezvEiyAjk4NM+DF3KyDHPQ+XZgw65nZb3H4YH2Zz/vUn/LRt4F2YJX6+UvqXv5KWV3r8imovleX23z5i6DJEMMkcsarHxH7Vf/WLrxpHI7LyvfXFfRfLdo+qZMPecF6x7eGm3C+Tb7jAESBj7YqY52nYtDDGn34IL2yAxUnHm8w+YcMN+zcd8rKWeXcTtmKJSOIuar8W3gCD4ReEllHDWxeE6xH0DgZXR/BLcPqJc0aJcqbMwPoQzYHhI+k89bRg9j72joEMkfMyAPAsct8hS5jpytlMsqW79hbMSUxg8x+pdI36WadzKw8OT8s58u8g0Z4dt9P/Q0LoQzVrjwfgT79752u26HvX7EwTfxCfeBMOMw0kpp0kFRjq1ZjEe8Rzrw24ZxOhEnk0XyKhWZuZ50HHu/KdCp3HYVsVc1eYF3sSUXM+vplO5nC2oZMWwbtttsp5XKlC0KRM7pNghtwA+D0JWYmFM2j5nmgPfoBCc8+E12QNCW0/hReXq/wOvLn+hm9DAGoyrRUfwnMB7RSNmPPVbc+COoCF14jdnyOzumMxram2A4Iknh9+OLG36ilsYe+1d8xw5bjnoMW82MPK10N+0EnTFpjRDOHfRjYukjCzLYennBCiq5ksrWvYa9XtgWyIxcseosWV44TgY+ivlIJdKmw65nnbIXA3FltTNVO9shvmdSHAjjHIb5qSmVsMPIL8W2zM3kLRttp+Xo+HN6q6+8pKf/4Lf13d//J3ry8/+Tvv6539HXvvAvdOmlF1R0fq25QsUuh8Wk2yed70DCAr44ntP11oDYKJvbim9j5YeBft3AqeOOGnAb2ecbnJ/nl2wpV+21tFDf0fTWhsrNXefbuDbOmNud6CcwEA5sjG2uXMjkNDg7Lse7DeRl0vr+THOghV5e092sJqxaVdGhsAON86HtS84qYZUC+MD+7cVkyIGKja5Ot4q6s57X0o40udNX1Spa1fRVxDChE7PT01SuoPxuXfNGzbFeRscd5kR7qDOdnI43M1qqZ3R6WNGs76v2rxhxTLyLFY6OJus8hH5mxjjVHui483nC3846YwUYoNsZg0kmbmXN+yv+qOoKnDQF1awblV1GaBxdMHZ4oC7cZkB7qqNU1+P7H+cOh3s7AL9OuhwENXIGooV7Q3RMZmGiJSuF8m4ve9evaefCBdXM+0suM0VHtyu4fHwHzaLT4sjnPpdwudHxoDsyju+tA30oA+enq1zf+rRaGhZsKzrynv3bjr9dKml7Iq/V4kBb/oKJdi3Tesu8hnc9Zy5bdz31rLeaj+yv2DBQ1lgZFXkNL4um1G6gueAo8DdwB69zwFQfCZ+sgOQsh+isju/5gi+ReybkcEbQLQK4Qw43ugPt2bHtqFOzPc3g90A79tiod7W62VS92Q3bIhipXchpismj6TsbOxkwmMwzeTJPMA1XfTtt1lCxD0ehl5171rGiPVR6TU1165rxuyr+g7ZKtMd23YjeUdX1UHJc4G+EUd9gC3DGCNZN4qHvGASSTayvuf5kIOqQ+nQaTBSJySL2DVqx3LpRz+lbF5r6xvldPfnKrr77yp6+f6Glb77Y0Jef29U3Xt7Rkxd39eXz2/rjF1a12mIA0vViWmHr0UgDWehYk6NdWQ4NWSlM3wk1dQQ/Cm69VR3BEdwipEEJ3wS3g7PCg2AQNF+Yg5mSXRhI44bNN/GBBWu/q2NzFVU43Hvki7EVccZTCosSmJTB9F34Oo3bDyhmVmxQqs0JEfwwtYGFXOQOhuzCpI4yBIOFjN/QATXMdG0oN8P4LRRKvpa1cn1VX/nyV/VHn/sjPfv0M3rhuR/o+z94Sru7W9gEdsxa7IZC6I8ktmUKpm/maIE86LfU3VnXcG/T4qZjAyKlP3TGMEoZBIk8ENmPAysECMyxa7fbTqoY1ye//W39zu/+jj73hd/Xt7/zLV2/diXOIMEwY0ZXv5eEP0osqbZbzlO3bZy0nZ+uDZ+682mGv4+XVAQECUwMZYPZynSW9ByOQ9OhiVan5ZdWylxutqNi8lg2XzROcupYsWw0m/7a36ZelR8L0CN1legS6nJewwgn78YlHTmthoV6M7amQAnIkn67ETQNFb4fIZocQjpwhxLgFh31ZSPRyt+gcV3drQsadLaD3kLhoY4Dr2lAjrNfOvkpFefvi3M/etklv510fRdMM9AnidCOqKNUT0G7UU23LuYO+MWozqExCoIx4nySy9fQQ9z6HVce/H3wHbcHAHqPzogj+OkG6CSMnmT4QB9JxvEKeqVzP29HpwJUxJ/fBY2NvxnTCbSWlFtojThTGAZV2CIS46kfrug0ypYTheGGhq3z6t38jpoXvqLOtW+qVH9Zte4N5Tvryg9aNlQzIUPoYMRYKbEfbWtbud2ral16Mr7rrTwVW2YVuhuqON6S8zqwwQ4NW3K4ZfbEftBDjCE75DSNLw3ojGg+8pwcCjllpDRpmw5kG+VLAx+DoY0eDD77MQACRhJecHzv6wgt42u88YtIDncEtxEOeFvUz9gFUIPUPHSSi8GPdrunAcw61az/RzTEExd4pWVnHLxZKppW2ZrFL2gmBCdM0NVBuj85GBfGNOl8jrIZkO4PeZAjB2XbnsjZAbG+Afiq17PeYn2EVj8qVFwOf0V/C1tXFI0DtgRla5SkMxPqR8f/p4GIgQxzdRrc0x9YLNJBnPLITSpGhOYmgQ35Dp1FVq7GbZw6o+ysZuHddrOv7UZXrS56OmVzrl1YZCmd4WllcM76AIOnXfOvriYreVXYki+wQtxj+km5QeYHv3xfw7j842vCzeth3xeiCjxCn1nt1hsxMSid85JVu9vVzZU1h0mDIvFJCm18j+LZp2Wekoswo/pIYbl/Y+dL6M+0cb5xNAx25UedhcnZj06iYc80jh5oGcMkKn/LhCq63iq5rnXrlmp5Di7PiW3oOi4LZyD26VAedpwQEw+QkaR3kEfoiCfoLrbLsqNc7IG/NDUVs+3jPfgcWndnEkI4/zkfuzev6fr3v6GrT31Fr373q3rlqa/rh9/5ulYuv0qkzjvppzToCC6wSmUMkZdUU0kfxL11iLxEOwNXDGqAzxFu0Z1djy655bJLQV78IjMwv7Ar2z6a7tY1u7Wmue11TdquyjNRzjhHTY6Z6P6LyXLOKXZL6uClvghABm4t3+8EgNuCs1bqDDThuqs4X/m26YUVAeahsZLAPIOVH13TFgMR5JlzNirmU7W8bWaHL/ezmsgWwq9IHI4zafPUjXHmm4L1GVay0XFe7HZUtryqtLuqOe1yx/pWy362G9O2PclOhkbYJirva9E8rWpc1fyu5jRK1ptqblclvjFOoWdoBH6b65mWHbZs/ljuDlVxborU60jXytl+jXrxPeDo/tSQvnj7ELQLOmm4hn07PF5yRSaaHn3HQGAZPDQaal66Il1fUYWBHPvF4I9xA7bZ9aFnkrWFn2g14k1xOqm454HyplRvDSKPjoF6hdaN2OAzBfLYy6jZatnGHE3w6XdNV275Wxuacr5qtuGz9T3TCIW3NKJp0BfiuqOPIcqD1yjfcY2M2/Hv+9DnrT/jEW/Ih11aXZXa2ZhvUFa2tUMuEuNYj751QMbmtF1v6+paU1c3W7q2bbfV1OWVPV26uavLN7d1c2NbbSbrgSRclMp5cRYD/zHgk7UMH2qz0VOjb3o3LZNrQpZdFiYiFmwT5Ec2CYD85pwyYIAf9oLjb7aa1nk6KrJCFtvB5U8r7hwWnPm74MM8/8Tg7eL2x0OqY/izHUnhfIOcRFZAPt1eVmdPHtPPPHpOn3j4rO5cmjFfyujuO47rQw/fpQ8/eo8WlpZNm/QomS9Z5qWJAtBVxBTxEzn1nJ5TYknmHcGPArB2BEdwm2CskiaIkdFouuPma+bh37HDFyV7spzXfM0KhQPEjJtgnI7FjCUYjv0iThiPGcQBMxineLuAHCAqKKXzyOBDLCmEzZN3N0fnF1mR8mpGx4yb6AjiCwtQK/WDgYW0wTqWn4f6rd/6Z/q3/5d/W3/rb/wN/cd/59/Xf/p//o/1H/yd/7W+8Pk/MHPlLAWzSzitDechSzfL1VBU6LCPg+LpUGtsq7e9omy/ZWFFPTjFyIf/wGMov+TqzYFX1AHGSjKerTwWi3H90pe+pH/73/7b+pt//a/rf/av/zX97/5Xf0v/5X/+n+jbX/6i+s2Gija+CjaUOTchywiF06MzIB3ExyMzwWyEWNFInWXgj3cpP1HDZNZpD/oWvgX2hh6o1WsrbwMeJaVjJRZBnrHCmzLLAFIxBkVKpaLfoZw4fuJ5AwQ20mehyEBhQEoX6oxBIr/vNutq7e5Yv2pZqe0q225q2GEABKPuzeJ+P0DUonFnOmcGDLToenbNKDvYU2fnggb1S1b4W7Zd2OYu4RtaZ/ADbHcs/AuzZ1VcvF+D8im1s7NuDWWHLRivdJpAnyiNVgBMN8lASHQct7cMKe8p/zyP6jA9cONX5BD68P1+FY/e084wyvYf001S9kZ86wh+6oBaTTLL91Hl/MDbTd12B9dDFAq920hCuQ16gnqD/7OtDI6Q0Bmz12zwZzoO2bJn28a6W4OfS70d5RpX1N54Sq1rX1Tj2pc03P2+ir0LNvSuW6Jsq5g3Xxq0zWt97VldtgHImVT5AWcV5MVhw8XBho2+l9W4+hU1Ln5ZvdVnld25qkq3qak829fQ2eB85rrOi3k+g+tue8iJccfZGNITfDKwYUd7wQgauXiDS7hIg0JjvHAFD/D7g2/TXrcOgdehcCmOI7g9MJKH4UbPIS/jIXgyOg5bz8Tex61OTEJIOhr1Zn3H75D/AL/UM12zbAVSKrCtp+OwH25MNX4INvuTh1EivgQf/3GJ8mrE36Fw/hOMbw5/mwk80BEdNBztJzlC4wKn9mKCR6VkmWecQu3g53BMbwfGOYPz8Eu8dODStNMz/qndjQHfNMOeLazozHP7jfp0uGxO/VxRe11ps9FVs0/YtP1plCX+XAr7jdst/ZVsd1a1Yj/jn4KZ3ritEwbjHhkPPwifKP9r8/R+BEgmyCZuEi4Pw7hTd799uQ7AXNv8P2rWOgqdWetbu9re3bNeXDIfT5Qwhv37EX+Pdht1nZ7TXaqP0In9AY7wSSdL/DmFR+ZYB3TVsYKBQRDu83RIMiji7wfW+WnvyTFLmBncW1q7/LRunn9Kq68+p/r6jeh0ZgAtwxbAjpqwGWbHWudOnY+JbhlUSTNjOdp91G7Ig13FYY7NTKpoJR5ri7Kk1wy+MNAPzzFtdzqqNLc1bTlb7e+pku3EFqj5biO+Id1xm0wrQKBtx0NkzhzYTjEDB3dvCYgnygS+7FCTDUyiC/7hEsQgkx9JDXmcGbotmS5q/Y6mGzuaW7upY3u7mvYzW0pHu47v+ca5NN/OoIu4LNgt1FEaBEn26+0E7EBW42Dvka9iLhcDwmgIsT0nf6633pAV5Axu2dYzDsh/r22dyUXoFmxjuq77LlusInJ8AwYC7Zct5tTqt827bHc4DiacFPIc+pwJWmHiFio9hElT60AdprmsX8Q78/KC21WsCnEAnunoDfQ6f2zT5QyGbEjbDlFjrseuv+sOVDItMxhCvsMC9j+13Y2yuXaI53XA+x/pRt/j3g4Qj9G9z17IBrcxwOaX/LF6IAaBTJ8Fy6op6OfmTbVePq8Sq0CMOLpvGVQjQ+x8wWoKtiujbIkOmSTDRLnEQwDKnPjGrQEtkm2Mhjnr08Zr2J9967l+VytWzEc2rDOvqNKpW9e9qczOhvrr19W5+JIy519Q89KrylQK6lYqapN1V2ZkzT/IO+QzeU3NMn4CEu/BwYtG/MhYS3LM5eF9lNc+xkk8GsF9h2GbSMKOsGx3awAvyOZL6thG3txr6dr6ti6vbOrK2o5Wd1rabPW02+7FipCcdQvq18VJju9x9ou6dz03rLddWdvWla2Wdm07sH0luQu+Zx5LWfiI72Kxk+V1tswJQ362rOc8JMq/Z17a7JoXs2OJ2xJclgmScf4HGID/MGgU9vV7GaAV6hCZizxA9mFjMSjbV9U23EPH8/ozj0zq1x+f0SOLfc0M1vTYqaF+8dFpuxndd3LSdGpuYFQM3L5oYwB1mwbKwDdyAV2sZD2rGLpW4ixH8KMgYe4IjuBdhcRW02+CUB7tkkEzfp8EgMWgn+kUSSzk+MK0ps1QUZQxBPdjQaD4FmY8VsxxETvv9p9uM1iIRKkQFlbUQi12pkIgOv8onAedY4zmJiZGOAyZnJW9rpWo+l5D3/zGk/pH/+AfauPGdfXq2/rWV76kr37h87ryysvaWL8ZSmIhU7BCUtDABmp/WFSxMm0hAzNNMbN0O99vqb+7rsHelvHKwfHGfaAVjosSPcbea1kG+caNgVl8Y+hYwD355JP65//8n+vSxQuatLYxz3LyrZv65u/9U/1X/9l/pG//8R/aqLACbn7O/r7sHZqxoczMpjyCkxz6ecBsg5HynZR7mP2oXsHVqFZj73orVMwuYDYQ+cHoK9mge+aZZ/T1r39dn/3s7+rVV63QgGwXEgX4zSDNvBgXbpTOuLBBdwDXEWaclzDujSLqKvbPB68dG0fG8fsTqCPasTHEP+RjlLFsNovpwDka25eU667HzPWgHlDqegyk+oPusKxhaVGlxXs0rC6r0bOAz6XVPAn3iU9YpaVVQS7+Dn+UaAK9HdwfpnfzpFHckUk3ihjEoBN3X0lzgNAgR48uRyjIURh7p0YVfkfw0wtBj0MroMOCH0zV8NvD/CNoKRmzQU3QEHQ6oqXE38a8n0COEUMznqAv7tirHEOZ2VZbyjRfUW/jSbWu/rHql76q3tYLVrJXbeTtmN7YRs6KM1YaHQPwKHhSv2NlGoPc97Q5x4d/Ps/BsA2VelsabJ/XnuNrXPmyuo4/s/eClfYNVR1nyXkl/JCOtL7LiElpHtjL0ingeHlPTp338bZW5BsDKM6mymGY9pwvZE7bvqxowRCCOydHDGyVEO36EIxZcGqOKRxu5H0EtxH2ay/qxuQVpIWxluqerTs5/BHth7PLop4djquJ1TfQFZMG+tEpXquW08w36NR6X8QdPJSPaDfvZq27jThtqJ1/NFVyEtkO/p7aaeQI+cAFjzHwcDi7/rBneRjjH8hKPxNjxEp8vvAUcszPlXI6yJiOAqJ9J2QJsaMvkdvYxmqUHrOgwTuPKUfwh/gk0gaiffqLrrNnNhDtn5UfXeucdTfczWZHe65vao3tuwCKNdbtueby8El04r5KuaFmKpz1woqQ1KpJjbCpEz3FkfLBu/c7gIighERaOO7xo23E+wPAh05xtN6s64lJUcwn7VihurG6PqpD61JBywlSbLTJRAPJnholdgiokx81KJViS+G5p0OSranQ4wkP74+1C36mo4htZ3KmvVrB73dvauv8d3Xp23+ob/7T/05f+If/jb7yW/+dXv3e19Xb24xuJQYcTMKO3JQWMtTljLaEp9mM/QsMfuAsA/Pwlxhs6ceA2/J0OQZAAHKU8jqSVY6DQdtOl/MmWYHSUcXXKmfT9FomfFaLUCq7VFDbHvkYAAkdNHCS3o84QoS5VUixOA7katTByIXN6NxH/SS7DRzAd7Gpas2GZnY2NLuzqYVOUxVsPfDFn9+nP7czR8MgS3Tg2hFbgnFatweiqKxKKxdiK+fQofqWI126V00DJgC2VOTsmJzpC0aTJs4l3gPO4HOjYZK0Zaf5TLZgZ/qBF7OKiG8YWIltjKD5kdwBmLDYIQ2H79GJTh3bv9O2LmV0sdtA0J6pZkCnNy2Ndgj9OVzB+CV8bIWE/hP0Tlvk8H3nww892/dsfUUd+Fc9fwstYdu+GRAf7kcB+QncvQ0Ad9CFL4kPjF28TTmIFX3cubyc7zjhwBUOGn/1ggYrq6qYxxQdBvoEMzHVh09pdzHakdxr4iZ8BIqnW4Codbdf8zg6hQslZQpJTx2ymnJxUbvbda18/bva/Ob3dfEHz2hysqxcSfrm17+gF775Zb3yyvPamywoc3JRQ7YRNz3QBwOdZeyQ31GMyGtKFZ2HbKc2lHhiKkGSe3F+TwQel5Vr/MZ3qQ3yDNLTl7cK8PSQtdjN5rlt2yYd87Wen4f5snmxqZIJoea1o+z7OrqjDOniL9yOnKedRkdXN/d0caOprSa1CDhEyGf4unU83+/2WD+XUxGcOwRlw8qH46AvdN008nmny8AUaAqEuX1g++wPtvLlexOi6l2wMLt8BwUwASj1XZnPGDuD3o4KmY6deYOLm8u0zLf3jOdebC02aX+2IZYd/Z0mFUdKX55fBP8nZvMj64PZgV0MIOF3BH8SQF1HcATvKgRToBEHHDTTxB6SA7ij8xSlhLfBWq0InFma11TRRmA0dotROEKECR4aDkhX2E9i6m8McXsAIcmMp6KFKAd+Iw7HeUplhGE6t3YIijgfJDLvML4yOyuXK+izv/sv9J/85n+q8y+/aCMhq7tPLelXP/NR/frPf1x/9Td+TX/uV39ZVYfrt3tmrhZ0TH1RSfnSpFNEObTBYAZKXtiTMdfaU2dzRRlWLzgdlEYEcyg+fk618uNhfP4HAw/nz5/X3/27f1ef/exnra9awLbaemR5Tn/7z/+i/r2/8qua6+/pwg++Y81xPPPfyh8KvBUL8pS18GQveQ6TzmTLzhAdJUl5SMawKQU0kbARhMKLnopyEsaHy95q0cE30Je/+EX9p7/5m/q7/8X/Rf/7/+Dv6O//vb+nr3z5y2rbIEBpjvNNDKD54G7kwqhAaeUPH37HkO6ZeYR6zDkn5Uo1BJVFvIVbU8Nu03EkBX0c/v0GtFFW4kTp/RM1OKirvXNZg73rbgeuh2FHmV436M0IDHQNWVCbn1V+/l7lps6om51UL4sSB74t6OloddAwUulcs0tJYATTtuARQSG3BEH9/jwZkqQz4k/mO+HI5AEz8yP5tnN+oNVQQ1B2aEejfGDEvBOdVkfwLzNYoWcwYJicuayfoQXeQQfwVDppTFH2o3M/tm6zP+QTsi84UXwwIjHLQFtF4fo2ls2XStBia0Pd1efVvPZVtW58Xr3Nb9jQvKZ8Z8u8dM980LyxUHG8o8GYuPriNpblPA9WcrBtiPmVG0vkg1mKefNEVllWrIyXepfU2/i66lf+hZpXP6fe2lPKsGqr53eWw4VBmo3JVht0YPVyvdhSgNUqGMPIs6zfcdbH0PigK6BrY5SZf2wFOeSsn0zTJa67lPBKIJX9Ne3rdZBejXnz+O8Ibi8k+qYekuYFF030HBzT9MHgR9oOyTSBset3HIJNOHQOGC6dTnyBUVgrsxqAj+G7o7jhoSM++m7VOVl7fdrO9CGgnMntw2vevxF4jWyMDueQXyO5Mfowpecf9Bq32VKRzj1Lob6NXuPkdam9TRhxHidIPTAAwjkGSealkh3AKNWRF51ArCigS9nmvFrDQuwtvrHXUhztZf0sDmBFSQOceWR23wyQFhx7oFv3nKmUNDdRNn9zec1b8B994FwknhhJmnfi8yci+KcaKPu4/IepgHvcQZ3xBLboOOm4DmI//gKzRc2vLVO2Gx1tbO1adWFFtEPbHcToeBz+4NngZ2Ifz0BNdJjoZ+wOQ/qWX/yHqZPMdgIz8VkNH7N/+bU/g2eDbEmtRkvDxpaufO8r+vo/+X/rqX/6/1HnpW9rtn5Vpc2Lmu5va5IVkNavBz22y3UMfbZ0Qo7BPRjASCnHk+0cwjI7vZCh06gbmlqpMND8ZNpRADkGPSLD0T9x0DQrtJpsSTSeRNBrBb32WnX12OoWQG9NyYV8zfMc9DtytHHH+HaBjlOqCMyHPrAfJe2WNNP7GCDwlY5+ZPRMfU+z25uac54n+qwCZWU9X9EBaWdFJCa/+e9QriPHxJfg7ef/VoG8NK0fNKxbNK1bsEqDwQtIENaStjeyX+jY6ZvobAcfvs+iC/kO2TIwDWBH9Iy8jmmhY0SwCiRrHJRNf/mObfQ+51UYvz3iM35Mrx2HSSjGVjfm7HJONs6rcH1zykScNGFaa9uhT2FPx6oHf8vEw2CD1A0DIPmwFE1jTp9c+mUMRvsdHex8TFrj3RV+HFDkUbH3wcmka7q8A5A009RPkXwAbsE1DmzDm9muvEZ7vHlD7StXVKw3YuWxBViUK74iHr71X5Q/wFe/jjiTx9sE49P1F4MglkO4rommN1HT9AMPqDq7oJ0fvKobX3/GNJDRqYcf1sIDd6tdzqnudlJYnlXlkbs1ODmvtsvHOSDkGeSytTiDYgf5TPKbvFPHBy3IV18obbjAE8+8B1IM4C5NqAMbhHn7GGClUazNgCeib40GPrCle7Yjhtl8rMRIK3ScEydJ9VDGVDejK36OY5ArqW6m8vKNXb18fSt4DI2Q85jgqLiOv2AABD2gUEwDIECqZ8W5YZ0O/TYl6xkFf0Ha9APBi9jq1FfX1yHG856DNJl5TA1Aqs9YNes20Ic/GFtth2mYVvbs6uYhvVJOey63WVDI6+benmWN5ZvlZJYJQ8hoY4vYklxD0iGlknzLIZ9C7ozTPYI3g2jDR3AE7yoEs0wNEyEA7DNHMwI0smAT9kzM34pAMJKktB6bq8asIGbvYEzFt2a+iU+OmQ1iBIbvp1EawPjd7QKrUthtsUS21GMZnJkWzmWGiaUl4BYKDhOCwgKJVYapNGaGXStsHDZpwfLHf/QlvfD8c8aZGd6gpZ/96GP6zf/w39Pf/c3/g/7dv/U3NF+rCLFTHJpRmpNGB1SmZL2+YnT5mikap35HWk4/jzK8u63O9paFnNOzdkN9hDg3Uwa/Y8V77F4PKJ5sfcUAyM72jra3tmN/60G3q5Mz0/rVT3xUv/KRx/Tnn/iQ/v1/69/Qhx97QG0bD5g+6IcBvY6lY1PDlg0MekzM1vOFWgz6kGbMiOGKwI3cWWT7PrGzJDAZAEHpJR/Nel3/6P/7/9PTT31Hz33vKTVsAPzOb/+P+j/9H/9D/e7v/DM1Gw1/YzqC9BwD7nDR4j7y5hphMMQuzWbGG4qC9kameMGCu1KOQRhmIg3tBjaShj1mNhM+InpfAUo7+IluDlcyM5zinJn2pvp7V60Q7/jZnn2raLRpqAE6Q5wPTKsTp5Wbvdu4nXcVpJnAzMai45bDlVE+0yBhat2oV1Erfoi6I61bBL4Phd43sUdt8BLHN7ASb0U+5rKgaPjdASQ6ROFmJuUoF/Ft+j7B65+P4KcIgk9Q9yjz3OMJhzBtx7aHDA7Y4IWU/RqKjc4aOgSDfvyB6QqDnu0cIC9aEBs9FG1ElwdNldqrGmy+oNaNb6l+/Ztqrv5AYlBisGMluKeSjfiiDTWYJSs0wqiw4izzfmb90l7guWGI593e8k4n13EY03WBF/Asy1y3M1ZnVTNtlbvrTvOHal39mtp2/Y2nVereVCXTEsMadDBFe3dO6Tii/Om8BMcXgsZldvFi6wPaLfQfMy/9DRMa/D7NcnJejBVmUGIG4uDnHDz5erlD1ADt/bBBfgTvNryel1EZBxUCjUPf7NXfYIarXyE7+W7MBuOL4LN+Ay2YDkr5rB20zzM6iWNy+OgMirDxUXz/roATjP3enWYkG3kZZwHJ4/vABe2LMNB9esdLWkcEDUhh0uCH30cQ3nKT5ENsX0RQN1Y6VP3vZ/ySG0X6tiDkEElGIcApcdr5ytZj6IGRh1E6ESp+aNtwJrdpy2T23e9ZPjesa261B1qvd1TvukSUw2HQkuK8NHBifsdZMJEwgzlu/6VcRrO1svV7Zl8z+MEUoARjXR6dD89EC2McvF9hXPYxJSSq2AfqdeQDjYU6De+1T73dsfyhEyatbljb3I5BSbY0iQ5jZkjH95BBij09cEs66DjU6zjV1JrRyFPYlC62Q9Cx70OmMKgVNE27gLcz9G5Jw0oUO+QgOj26e6VYVnNnRy9+59tqXLugqf6uPn3/Sf3NX/uU/q2/9Gv6xCP3aGGiZHmH7DFlRMd3cil/qcMPB92Q3/AnLwZyhYQpl0sqm/agxkSRzq11zYwd3XL49azTt6zzxeHaLmicoeWyFYwv7LoECV/Ez4QsygDnC/sicpBcCnFrMP6aTkeu4xLFIeD2iFno3FNW4xeHIVXstzVt+252d1cTtsloW/CapJtbN3CbDbsmypLKGIfUOx1WYMZAiuNJuvntg9TZmmgqMACtosjwhL/rJLZisgu6Q7/wP+eChC3ta6x68T24i0l7joOO3agz/xXRXRw452vedjL46RkJqFFxniQz1t1WrMrZtrbt7mvB+j50wEoOZtNnWAlCWwNvvgbjdjphUzu7pMvKDnDMwe1JD/QLX3ED81IGPeIx6ojPHZY4fA+Npj9exMuwrahuvhkD70kP/3cEHFGQ1OgRQCcL/gzPiDKDe/LTU8W0X2411L5kW29tS2U/xzl2ziRnPrHtNfijJNE+/d3raSyV99aBeqaDnf4iZA12edf46pbLKt19p6Y+/AFVP/CYcg89rMUnfk7lhz+k8gMf0p2/+K9o+VO/oNOf+TnNPvKA2rbtm123Hdc/55H1XX84VgMdxsm4HGOk45/qwHfYA+TFV7gCYVP/he+JC+7MZEAm7+VC8406fzvA6qGcbVEmG8D70yoE7A1SIWMZbW1t6xvfelLPPve8Ll26qNWVm9rZ2VKjsaNWu65mY09b61taX92JVRtstXRjp61LNzdchiA/x5xRp9vXzdVNvXzpRri13abDtfTC1XU9f3VNz15Z1bPXNnV9p6OO48lVbONbZwh8mYA5FH5IBz7nGzKByjl+bwJ1Nm4r43YfUiikQNcaba5kGWNecWG9oYuNvq51M7rckLbMi1+8uqMfXN7SM1e2dHVlQ+VCNiYKo2f1TMNJpia5kugtWlBKM9JPv0fwoyH3wG/8O785uj+CI3hXYNwsg2mOHriE4mmP4PVm0BhHzImgWdNBmrPyuVDL6WP3L2m5YmZAh0mwc74mPEwdQcL3iQkkhsA1hUmQ/N5tCP7ufMRMkHZT/d2dUNrz7PEA03LB00GAfu9yxF7ZVuhRkHIWUwySMAuFjqWsBfDuTl0vvfC86ls3dcdCTXcem9YH7r9L1aJD9/qq1qZjtQdK3LBvI9b4jMPaLFwGzbU4myJv7Yx+KZDODD1Q07CWV5hZCPzjD2MNvAZOfzTuYMgIapQ2FH+UtpdfeknPPvusht22fvbx+/WXfvajOjFh5cHPtekZHbv/YRUXl9XJFaKm2X8+39lV58YFDV2u/KBjBcOCYmZJuWN3WGGZDHGIDpGWkLpeYfxcIxPGF2Xxc6iMxhkzczZu3tCLz3xf9d2tEc0MtLW5qWeeflpn7zijc+fO2W9MH0CinrgEQEE8jFapBICLpOCG4YXCbaNdnaYG2xsWVkZs1J/rqzqlYXki8DiOMhTZcb5/iiH2a7eCiGGAUZL20TX9b72g/vozpoUtqwKuE2ZHhQJtgW4lujcsqJOdUfHEB5SZvsfG+ozrm+XHVhJNtChK/FEnDBTyHYYe9ZsOlUMpNf6p11tGs+OIOsNIMm06nZht0d7SYPeqBjtXTLO7LmTHaZCeExqSn7yN+aqys/coO32nqRoj6gjeP4A0S/wUhRclHkqE2WLaoezDC4K3OiQ0mjpu6Gw0vbqdMBCQxSCAlh2CDmC28Mj1dzXcvazu2rNq3XxK3c1nVehcUzmzayqD30GHDL7AqxK/gi6DfyFffSVd5Evs/R7e5CutmIpzG/yUCJbccsOMLMsP56ugtnLdbXX3VjWob8SqLWau0yHkKA2klHcb9zfEgNFJfH5HWqQUxj78z+08B4/skTYKPjIqH/KNLSuYsRkDRXwT4QnlFGC9+5A4c/oBXvPyCN5ViBr379hR59QYnZCmNddrozPUxm5LHRMDtQ7vhnBM7aMqNA3bQe+sAJidqGqqUjI9uR0E70/xHtQz8QP7BPDWYfQpFzoquEntIrwNo/ZjOu8MMtptd1Xv9N2GUzvHpKXdJOpMbQoirflxxvoYAzjWWFCnop1HfKMrnc9bTcfXSx214AFMwBlSiIRR+EDZyU1VS6pkme3nNP0urawkbzzdGtBZmtB5gFPqjVU5XZd3r9kOXhErAxw29JZo1+Nkmbgz1ETZ7d5uy8b8ym5TO8ZRNs9ZXQQin8hr+CDUwepeOmacmvW8kqlhcaqiWZfPUt51z7Z4xJ3Kn+gocsZTXIHQASP+9y+kFnHgwA8Q+DN9BI818QUO6URxiKtrm2oMiuq7fuqdjl569YpMhn5n3cUyg7Bj+k84ByBgrimdoIW4G+fA10gn5SDOs6F+0r/bVpKDtO84LwNaIJzpHj2ZdAfIK0KTb4eX7ZRr519QNdPSyamc/rd/4y/qL/7ZX9Z9j31YG52s1trZmGU8zLNyxd+43ZEse6DjmJVMWUg/peW82TEQS9aKljF3n5jV46dnYhuSVCZuUusjDHf1RkPf+OY39fVvfnW/tKRHWo9/8IP6hV/85aTj8s4fbbcHevHGnq7tuu34OVY4RdyODeQQ8a2AP2MQgJg4uytKhkAMuW3fQLxrMc9gM/7Yj33NN3d1x7XLOsXh592Gv+2FnhoTdQZ0+5MzahrdBBxGJiPvXBNwxX90exuAcpN05NdZCbV/hMsYHDHQKU3INHBgT4eL0nBrmRL1QDX4mkg0KDLCwFlYg8r0JmZgN+3fdvtpm1F1HJaO87BBo31AA053HDl+Dj/WV8Z+KWGmgyTezpmcDKRZ4bG3/6ANAtgLbYeVKTRe/qC9vF/tl9Muqpskxy6SipKGR/jFwzsHiR6Ie5Qv2o//8HWTTTpdhEltOooTeeEmq23LgsLsgmrHl7STG0TfRlBcD3swcpzSsIvBAr+jLriL/1F88JQah96/8IKKKyvRR+BX0dbbU9MqP/SIGhO2tcmCP8LxXaIVtwv6JogVnLuOGBwoLs1p8sFzmrzvfhUWTqpdnlSzWLWwnVV+cdnXmgauq9ikNR/SyfFFS3H88DTi9y/5I27XH+Ue8wnu064ebmvwI/zJ1ygEmaW8yU5g7UTHOGGghniCFCKeW4NIfXTn+KJSEo1SL8Q66LT03W99Vf/N3//7+v63v6kffO9Jfe+p7+jpp3+g7/j63e89pe8++R195Y++omdfvqjpk3doUKxpZXNX3fqOHrzjWJyRA9/Z2drRK5du6NK1DbH6s22cb7c6Wt3tanWno2ubdV3Z7Ojltba22j2dOz6le45Nqlp03lyXWex6VqehT1HpASn/twaUk1Im/AUO7Jf4Gm044QB/gOd+rqAt5/np8ze11y+I7RqRW1FjtGcDfQwl19Pp+YruPb2oQgxWpjio8QMg/ZQ6aVAu7jgPpW0b6cLKtl65sa0t638XViyHL65oZm5eOzt7On9pQy9fWtfm5qYePndGD59dDN1vn7VEWUgh6Y08kMck91K5juDNgf63owGQI3jXIS0Jg9G4+QYTot2ORB1CdeQfe2M6LAwj5gX12rr3+JweOj2n6TzKMaPDKR64QSjREV2K/zUuaTm84sE/7z6QDzgXnaidrU1tX78SAwNl9iC1csU+pnQwcfYFzKvncCwPR6lgv9pYYmvG1u9l4gDvu+68SyvXr+rFZ57Uxx65W5/50MM6d2pJxRhNz6tUm1W2UHWRmYniNBwfMwwymY7zsafWzlbsx5ntmyH7fSDHt32U4nJF+WqNHAc2WaKLEQVEOd4EmNESTMVx9Xo9VRwHh2hubW9b8ejpgRMLeuzMMS1Plhy6pxZLHxdPKje3rKbLTIc2e+tmdm6ot3JRmb31MILpJCksn1J2dlm9UtUoMHO3NhMdYsYTSq5vrSyktIGkDFIe5wNcnT6hXLepXL+lgXG+t7sVM2x2d3d100rUE5/+jKampuLb15QwbsfizAIF+sTFE0LUSQReUAitlBu/w/q2ejvrUWdU2YDOvMlZZarTod6Q2cgf9Pg+gVC2jCO27oiZnf0d9Tae03DrRdNgK+h+FMQ4dd1CQxnT38Qp5ZYeUb922v4VFn5YxwKLpmNQSXiHTYouZn3qxMU4YkYbHbGEId5bhciWv0+zYtm8x+l3Np33ixrUr/m5Hv50jqHEYpqFMV+YNm3frczkGecodQYfwfsDgg5MLkkhHg8sYDZjMPlingGPT7Pg0+ysMOktwKAgZBT8C7W2aMu3mHUb6a+bbb+i1uZzat38rvrbLynfvhmHsKZzQNI3MdMo+B/RQL3Ow/iKn12EdJhkBCTelcxNP4+t2RF/Cl7lTJOvZES6DeMc57DXUbuxo25z3d9sWy51lS9mXaJCklduq4EIt40w/EgzjP2BDVHHRXKWFcRfLk9odWVT3//OU3rq29/Qi88/q2q1quqkjU//ZcNwTfnFHfyNYP/mCG4fpEoIOuQ+aIhWYAdPN0VvcyZEqxsDCfhHR9IobPBY6xF0R7EytlKQZifKqhZySQeyP18lSKkQf0oXd4sw+jRig259E7JlP0pKk/SyGACxcdxw440tvELGOCfR6RGtZPTdQDXT+GzJupibN50l0RQQXISjTdiDHZu3jY89N5WBDeIR5pyPwI7v4yM/Dx3PUDM1BkDMG4wP2kPKrr8IXN8awB7S1wmjtPkY8HCZORtit2G9CaM60nGqBAqeYucrdcL5CSXrWu1+Rut7He12mHGdi9my8CE6d6LuHC51IoA7Q7cV/Gu2WtCsy8Z5DHTRR/kjQKrncccDED7BI518ZCYCvk8h0UfCQcJDwhg2Umor6P5Rd5YzDGh1XB/X1nfVy1fVzRW1ulXXxesrpm3Tt/l/bI0Fnx7RFPGldLimdNLgH3WC3Igaijfpx+m5EUAifMENAxOci8eg5qDTVNayI01is+RDX4If+Bs67hn8GPQsS/yy5saTM31M2Ww4MV3SmcWa9pp7+s6FNV3r1bSTm1YnP2m6c5pBb5ar2DTQSzi3DmeCdAKcP2xFuAmyaMJM5p5j07r/+ITp0HmwLtpu0VGKvp+KAx3u7ezoq1/9Y33ryW+FiGRlCCXuml89+thj+uVf+pUYAImUHH671dMPb+zq6jZtZxT6cD2NcPuWwZ+N+VJuYJ3BmUlb5iT8U86Q+35IXXa2qwYdLW2v69yNa1re21ZxwKBMsvXolKXzNjq0XeDx4AcuInGMtLGUJGUYIeU2AMmmHNnBSkbPlCVwYgcmYjUHeTZPjZUxfhHb7/FP9n1PeNoEE9jYALRhWmi4+nqTVfVmasocm1fu9LLyZ44rf/a4inYF268527HF4/PKL9u+nptSf6KiVj6jumm5aX2HQSfMGWZrs7VPVI15KHY9NnTUiDMeq2p4MnHxRx5jNW7gPuVx7M+uEJQXugv+6Qt1Mb4QJgaxDfHL94fu3xkYRQqd+A85OY7f2Ut1MK6Q0SV4tPHBhLYmW1pPTNqem1XHOOtbnxt0rd+CF8eFtYzaGUX0N5Q8PaW6SvE5DYd96wMgSG8isYM/+I8B2NrQPGZ9VZVWQ5nduvJ7DRX2Wso3Gso1/dzYVb65o4zfD9vsOGDrr1RzHRMVmUEGI6ejBhIO7E+ZQ/8d5T2ViXrjzCN4BH7IQ0LY3++wjdlAKt9vqJbvqcKK7J7jN09BZ6A8hH7rkFJJdMIPGSNfKS54W6+xp698/g/0lc/9ns6/8Iyef/r7eurJb+urX/uavvDFP9IXv/hFfeVLX9ZXv/x1vXr1uhbuuEunzt2nG2tb6td3dXq6Etvhbt+8qtb2hmZmZnXHmVM6fXxJp48t6MzyvE4vz+mk3Qm7Urmq65stbW7u6t7lSd1/bFI1E3jaASLRV0zIJd/77lYhKsvXFAdykZpI5afOqLvkD/D8Tg6AUP8p7ahph0lpMNBfrhRV36tr3Xi8fm1dK8bt4kRVn3n8fs1YD9rb5SzbjI7PlPShe09paaLg9mLd2HoW25qRXpBhlCPRlSnP+SXPY70rCPEIXgdHAyBHcFsgsQLMQZhJegJgzrAiBMnBAIiVeAuwopWLwqAVTODupUlVWBpnAqZ58zWNfszQkxBODT/F7l/+zYkihN/dLkAJo+OoX99Rd3dbfQtZVmQUrOR3mo0QkrnYlzdnw8SMmAyPjF0EaoZZtWZsnY6Zb6mg+dkJ3bj0oh6587j+7M8/oTkrFnQ6sYdurjylXImNbUuhWCD0e2bYWQvXbLGv+s6mio4+04OJOqFRJzSDLi0rJ5XJaQtfM9KoC9cNAok8REneHFj5gePcDZS906dP66GHH9ZDD9ynB08f0xkz8kqOrRIsKGYWVTp+pzQ17zRzZuwdFdqb6l57Wd3VSyp0rIA43wMLo+zSCWVnlzQolp1N6t0ZcT5RDKJW49H3zqtvzdx66nU7aTCo01HZZb/fyuyj996p40uL6nbbanfaarZaqjeb+vBHPqKzdzovIwU1CrlPJ1ydSkgyqJMUUx7w2h8A8XOh39OwzuoADmbsRRzsNZqdmFWmNuNcEDZBWq7vmBBS4P+nFBDgY0BgW01VtrWq9srTytYvqxCaPRiMAMbpwMK7qE5uVsWF+5WZvU/d4rzxZDowPwg+EXWfWnhSvumqYcZowjAz3zl7Ab4Q9fh22jz1E+n5lkMPc24v7VX11l9WprmiQob9n1Mb4s+twO3Fba5sI2n2nFQ9bko4GgB5P0FQG5Yvg3LhGKxHOTbPMC0h6eiAoROUrf0wjjGSM7E1RXrLoAkzwQrdHQ2aV9TdfF6d1Sfdbp40b7yi8sD82wZDzsw9Gx0hGErQKpIVZ2PC7SXcKO1Rzpwu1Jjolb+QLU4tHVJOCxpdR8p+lCU+x7/kJmE+3ONLytZQr7OibvOa5HaRYWs4M0aMWAb22UJiMMzbkT8r5eQRQ89xhgJvuZPPlbWz29b/8I9/S/+Pv/d39bv/5B/re9/5lk6ePKG77z6nQpGO4ciI85g4cPwh0x1fvDtqYLcZEj9OlDWqDiom+LS5Np2vrq/Nvabqbctn0wODItBYfBdygjtkhGlj0NVUpRA6TdE6UMwehxcT6Yh+k/P3wXvfBow+jtgiz87JyCUgfqfsvLJyhRUgTetNDAqE5PdHyKCM22J0SCLHnN+a/acZAHE7iHZoWkVPiXYVeBnGtipbrChxe3rNAMgIF/vg+Iv5TAyAlN3G4ww8e6fs+ovAya1BtKBxFCErU1lTeRkAaZs9kb9UX5FoQMojnbvIyYH5EKsIwA91zeQE8paNmazmR44/9HTi8fuc/fODtpgTMz9V1VSZodOk71I2gu6vIrBP4h0jGhhDynS6f1/BITyMcEBH+xgO8GRa8XvwzoBdx/yWQbera9vqlWpquy5evXJD69t1+zO5iFnKbpv+lGjHnSjJjWNObY77g3e4cT34ye+xVZiURN0zWF5ytc9MlLQ4XdOxuUnN1aqaKNdULlqm2G5hxjMT45n0RpOJA117reg0GzS2TR/Sd775JX3ha9/W55+9psHifcrNnVY3P6mudUboM1agj3TryClyyDg4yKMx4nCZfEEcoD1he+Sxu5Z153zJpWdv+oF2d5qqVUf71qdiamtzTX/8R3+g7z39tJ8pU2qh7W5Pjzz6qH71V37F5Y2WEOF3baP98NqOrmy3AhcROupnVEeBv7cOqf2kb9MsfPuhQ4/KBpBaTEgzTy0MOprtNrS0ekN3rdzUfGPH+WT1GnYd+c25DSJTicf2i+OiyeERq1F9k57HeATS7+0AUoZHJ50FfFCfB46JcAXbrUWXK4tty+CDc07d0J8A7fdNXD2Xn/McusWi8gtzqp09o9L95zT1+IOa+cADWvr44zrxMx/U8sc/oMWPPaaFjzyshQ8/rMWPPKKFx+/X7MP3qHrvWZXuOqW8bdv8sSWVF2ZtbhfUdZpt252YudQQNEiDwu5ly6G0pRgyg7fONPfUHzIw9EOXg/IF7VJe6BmNkLNCeME3yfGHDRmrBfAzxG+6TXD4/m0BEUWOow64ibw6k0Ej9ogBB/7Im/MVWbLrm8ZsoSnvtpxdmg27eGg/tg5j1TJ9HcRD6Yl7lErgiFueuAUvtzIAgiMuzlZBR85Z7lR3trT71a8r8/KrGly8qr5d5/JFta6+qubVV9S+cl7dK69o78o1ba7tqJ2rKDczZ/rJK29ZzFZasaVfZNCtw3VHCxnLRPJLO3MW7AcHYLIEbW2k+1Io3jBJkm+6u6qpodULz+nq+efV2qurWK4oWyj7W3Tv+OAtAumTJ2gpamsfpwCD0q2dDX3h935HNy6djzMk2GqTrf0oU7ZAWdFzmHhb0l67o/L0nB7+0Cd0bXVTw9a2losddVYuaOvSy8p2WlpcnNfCsUXNlLOax1VymvN1tpTVjF3P7ePC1U1tbuzogRMzemB5UiX0p8CTcYS9jC7kSgxqupVi7wOREkGKJNXQCAdBX4n34Q/w/I6uAPFt+sY3kVZ6y/fwsLlJy8BCwXjJ657lGX38/jv0oPFxdnZSiwvTOn18To/ceUxnl6c0ya7C/U7QOpMZSC+lmdoJ8TIQwlaSgbeU4/A/gtfC0QDIEdwWCEaMwIbRhAKGaMDBFPzeDdn8MRoywouOEmasTFh8fvTBkzo5XYoBEQCWngQLzCX5jBkcj+E1YgzplxtHfhsBQx72NOg01G/tKtNrhpLfbTSVK1nA2iCA4bICBIWO0hWsPKUZBA5qpa7AWRNG2PHj87r3ruP64D1nNFNwg47tSGxETs3FNlbZihWBAoMpLDntKlPk/IymesM97W6tKxvnLpgRgyMEgnFjncSKoRWT6oRyxQm6uBjZ8CvjNGk5bwoY9iiY/Zi1kIQEsLx8TA8+/KDOzldVrq+p367HoEz11L3KL9p4seFCZ0HZgn+4flntyy9ruLNu4YIh4zJb+MvlyLo8Ge4RRKaJVK+ufedpLFa6XZffegKzwFguUC4Vo0Nu+9olZRsbWqwVdc89d9qd0/zCgja3ttXq9PTpz/y87r7nPsdJvinjYRrhHkcK6W08Ow+gI5RuP0LJBc5RsTKhPTone8ZJ2lhGlVllJucd1nh0+LFC9n6AcVlRH1hYXlRT/e0L6q29oFJ/M5QtFB1oL0L52s2U1S0dV3n5EfWrJ9XJ1MBi4DMGEcNIMP+gAkbfjTtNoAc0aYz9IFe/T/V3q0Bdjy+cieA6bq2oe/NF5Xubrnfmj5mfRVjnZOj2lq1I1SUVZu/SoLxkSj4aAHlfQfAnDBw6/VBSx/QH3ZpBWXmN7QzNPBhUozOTWdBxjoZa5l/Mit41I76h7uZLal/7nrorzynXvKaJXMfh2jGTFrqD9mlAbMwQ/JmkIn1u3CKC8KIhJBf/IwPM3yUF2n4EjwYTrcgOg4ur/SJe3hnczmK7HxuA7FHMfsX5jN2woV59Xe3tNQ3ae8rkesrHydXmzgx+hBGfVnHE9gP0DjDjy7INznr5ylX91//Vf6m1Cy/pX/+NX9fPf/oJnbvrTh0/cULlai06EzhbKQ16jzh+ZGmE2yhA3IyuR/DuwwHuofTRjUnHLcA0zyzQzb2WWpwLYR2HlacxU5xA/NvRWc52nxjiDH5MV4upsz9oNYg0wvFNMuQTjfru1mH0MZf9jp2RS0D86KNZdU3HdPA3XBZyFIOCobgmHS06OZ0vJmFUfIthWx5tgQXEStxIiQQs6+y22z01u9Z79w1Xh0sl9F2SnHT+E8/MRFGlGACxPgfunFZ8AS7eBhC/xaoBWRZcJbYsY2b+XqMttupC5lJnMShBkSNZh7brWy/tW3EnPJ2LsVKX9+iNtHM+CTowvvw99czZDZPWW+eslzGwUwR11DUpOTPMxicvqeOAKMBEusY9eCZP70sY15LBeEiDH1Eh/B7gCP7Ke/tx9hNbP9EBe3PT9kd+wrTc18sXr7p+WXVLx0oh7C9XQCJr5Arx7ANywT6Ok2uk4/r3Df+jVEO6pNyhHKOLm3ZPLc/rnrMnddfpZZ06vqClxXktL85qfrqmWtl17DbfauyZjhiKcSzdhnXEumrdbd2zNK27Ty6pXa9rba+nmbs/osX7P6RheSoGJXvQiPMODUcOTVux7VTkb3xNuYN8abv5fkuzmT19+pHTOl5lpYnikOs986jpyQqoTODv1tdu6Auf+309/9J5EGncQKzmB71OrAD51V/91Wjb8Yl/9roMgGzp8mY9BnoT76Lt8N044luA+JS6TrKUvDFBbWCeQDWkOhsNYBnnNZfxWH1Dy6vXdGZrQxNt21k5wqd6ohx0xDFZo59jYCTRVPJPAz3RiRsYA48Av2+jDG8TDurF9eiHoDUq3vdFdCtWAHWtdVvfYEIegwYth2q5ghv5rBq2iYdzU5q4905NfehRHf/EB3Xi0x/X4hMf09zjD2rq7jtVPnlMudkpadI2p/nTsFy0Lp/c0HIp43el5UVV7zitGduTCw8/EAdnz5w5rtypZQ1nbHsX3d5gauWSslW7ibLypqtCzc7x5KNz2Xn0NVdk3Zvt+6BPl8Xlod1CscB4dQj2ebBfHC8choGT8QqQfRg/vs77ViFFc/Cb7lJbGqcBlRz0EaQX0eZMSxwcztlfmp1U6fiSbSTkpvlNDL6Zslw3lC9KHDTMn1sNOBjH7yvs5FYGQGgx0ShMG6FfWM5Mbu9o7Q++qN61Fa13elptNLWzu6PN+p7WOPNirx5bEW3vNc0nnf7krEqLzjvxOb9Dy2Am6DLRh3adtpWNVm79nATJQyoJbRb5h7dDJt4UFZi1zHTbMu+btG1884dP6Y//+T/Q9778ea3cvKETJ+/QxNyS6YLh2TFu3xpQ+sT7wGEkmsD35HVn/aZ+97f+sXX39ehvQz+PsyYcNAZ1jbeB5TurOdkOM1+q6KEPflzbLZej39C5uYJmnPdCa1uFvm38QkEV0zv9WmwPHefJRtkTF1zfaeiFy5va2G3owdNzunt5whZy1zgkQeMVPkplp1oc3d8qpDj9E0+JW4za2KhO0ttUYTy/cwMgfjaOE/0GVfg6zofpxuWsVMs6eWxW955d1n1nF7U0lc7uLZtHzc+VND9b1qR1o1jBRhquAybesAIEzhYTg6Ie0z3xIpe4WgqMMH4ErwdoLdXkERzBuwbBQsY8IHhTYgV4JM/9e//DIIJtMotloqTpSi5GrPfBTCE1cb7hN1ShkSPc2P1LAM6ixYiFpJmUhUNhompBYcWg11ZnfUXDxpYZlgW7FVkMFJgmDKxAp89Iy2DJdnSpc/qaGV7XAub+B+7T9NRkNGa/tpCygTw1q1zNSoBlZjvTVbfYUqfUUD2zpRuN63p1/apWWbKotnolY8t4Jn/EGfjuttS1IgDq0BkY/48eqB8DzDjijBGEH/cIrZg5gCLXsfbQsmHTacS7fHkiVkUMC1XXrQ171292Z029mxeU2dtQiW2SnGasZLdy0W821GXAxnGwBDBODOn7G4wcBAPp8edbcMQfExh67T0N+07b6VYGLeXaO6oM27rvjpP6yGMPa2FmKsp7bHnZJTAdGc+JQhO+QcA+LTldlCmUNO4P01cK7d+eVW22Mgt/h3FeclYkhlYKBhZeKXyCEPbvA4hijosapwYy2Ldmmmi6LRvnrn/IG9xGwNDwbRCU56XKogm65nomgL81XdCG0vYKVkrsmG3OHrnMIoqZUvYLRZNZbtFOxonfGkC/lAHaiNm7VpyHNsyHbj85Orgj/kQztBB8YoZGYUIZ0/eRmH1/gqk6KCMBNI3ya+frgOluJpaCjaiCeUluwHlMe+az23abUvOyWivf1+6FL2vv8leV2X1RE9pQFQW37Q878Cro3DypYKOy2DWtOTUmDQxSGik9OJOv0KPfJUOAXEGprEqhE5XVlDwnOo4wEW7kiAdBgmXn9JS3wZlrqD/cdTts0U+mgttGwXyv4nJU+jc03P6+mpe+rMalr6m39UPlemvm2W7vNhg5KyBjATc0DjCM6ejMuZ1OTxX12CPn9Od+6Wf1V3/ll/Xnfu4zOndsWdl2S/16w3hiNcmoTPADX2lzifsC8JFxOY7g3YbE51JdjGtkDFQXneHMlqaTPKSn6zNkpiHIjaurDnlM52UpnwsjcPyMwRkc1mFTDfNRctEh/xOGwym8xiCPW37QQw2H5HrMzH1d3l4j91/7KiD0mNH94ZImIL7RLb7kw/EftIFbg8Pl4Z4O40jIjme2n0vpRQh+0mOkT73DG8zX7OAqUbd+R4dyqjP80uoCDt1mIJPZ/WWHnq3kNVcrxAxQBnViUJQ44ktwSvwABU8t/uDp/Q4g+M2wQL1Qj9SDb4MOk4uOKDfGQrHiastqc3tPjVbHdWc8Z3NpoMsfjWliTI8j6h5Biv/1kOpkRI98b8ekKM52mpqs6fjSnJZma+bltmK66HFSKdfXQm2oB07P6JGz81qs2YYYtDWVH+ieY3P68Lnj+pn77tCDx2f1+D3n9Lf+1r+rv/Mf/Wf6i3/5r2lpfsb2U1OFftPfsPKQwfm8Oj0n7bjjjEVsCfhHaGbo8EkvZ7/5sm2B6eGelkq2KfjA+GGFOfvWB1njFzJloG67rfqOdT4sE78Ej7HV5DgcFxzF9nW8DRMz82NQNb31Px+MafqtQ2TJMjlWZ/g+DX5gl/gxRj/APrWFbixVzXPnt7e1sLulku3FWJFKDfkdwRNeGPgwb0ZnBj+0Rb/LWU6zwnRsf0aCo7LeTiAHlDfK7HwxCBI0By9Ev7DDZqCTsO26axoRezYSdhhkO31Mc5/4kE7/+V/TfX/9L+jsX/t1Tf/Cx5W595QG0wWIxlVkR3HDLob3GZ9OFNqg8xsHFkk3qpKJHuZhMo3mP/qQjv/GL+r+//lf1n1/4y/E/fQnH1fh/juUv/OYynccU+3UkqZPLmvh1DEt+bp4Ylnzx5c16+vMiSVNLs+rOjdlO37C5k9Zg0rBdjoTGdPgZQxe4WwbYy71nS/cPk5wIzwddm8HAr/hKDDpwCdGbvQ26MkueAZ1EXRonPuv4DZVajfUvHJZw9V1TbhurFU6YpdpFDbFjxvdjTId+U/etw7GD+2hYHLPc8C99eRKP69as6dauaZjH/+EZj71Sc0/8UktfQL3abvP2P2cTn70CZ199FEtnjyhUonuaZfY9jzlpr0kDCQcjcs8LksqQ7pP+Ep6DO0uQvs926Iz8LB27VV994v/QuX6ij58dkHn5iuaZCIROnqkcGswxuU+CiNTpE1OB+p32tpYW1O/xyDEqDym7YzlfpYBRRMVfTn0q7AKdWftpp5/+gd+53KaJidnpjQ5UbU8H6pk+7jr9/WXn9fexZei38YRh+yxdLfEl+q2FRp20BBb5mbdNpnAxSBsusKnY62W3XsbEkUkgD5ikAy+Yb6yZ1vu+mZTG9v1ONN3fb2htc2OVnZaumm3uran7Y26VrdaurHDtqK0fabJ+XO3/8SkzO0t33Ks3MGxa8CgZZusHf6kegRvDuN6OYIjeFeBWWHRMN1+YQbhghztor3ywk+0bzNkGvKJxVlNVCx8/G0ImpFikhwBgSSCcKOIAt628HxHwCW08IDpd83gUW6K5ULMYCibcRV6bYdhAMS/digycSbISJmjVPA7lmYPLGT6DADkraDahSByGLasyuSKtipqcuQaFM0Oc11t9bZ1fe+KXl59Qa+svKRX1y5po7+nPb9rWwshTTroEdAIZlYy9BsN58fpOiMolX8iEv0aITce/OC+13N5/NyzsGtbAR82tl0eK9nmy72mFYBuRiUL2GLfgveGFaMbV1Rs1VVyLlgK2c8UY/knhNC2IO1ubypjJR6FgLNLMHAQ4OAWnBRcXnDRMy5zMa3JaYRh1FGmU1eRFQh+N3Qa5194Vk9/7xlN1iZ16vSpKMIBxYwh0ZFjH90jmJPiw30yjlwzgTenhlBvOy3om0LacfCaMyQO+uWzsWE5NkhxP9Xg4rmagj4yGBf9XanleozODrdh01WgBKWMMPy53kuT86bjaXuwNQH0kOohtnJDSXNwjFEMtHwYankbbBAznbV0xmDEmq6ijm4N0qwZ0iIODF4rL6afvul42Lcx6XZL+Q54kHNpWo2tQtwGM8VK5PMI3l8Aq4wVjNCFaZHBCptepk3z5qF5NIch0oFh3pDPdFXK95TL7mnQuqHO2gtqXfiGOpe/pezWSyp31lQa1t1eLB/isH0bQzY6GBim3cTsLPPY4EnwPGajMWtrnP4+bY4gbhOtRkbjeihcEKx5lvOFQWIG5teOfRzNmGfRNty2YpsSl4NOl2ymEIPTZbfxfPOqOqvfV+PyV9S8+TX1Gs85e1cdZktZG3WZXN5xMuPdHNzxLS/O6G/+a39Rf/nXflkLZcv5+p7yLfN6J1k0T2fGeLDccZ73wW3Oedk3ROEjR/CuAlzyoE7g1Af1wz2OA7VbnW7MdhyHjao0RBcJdOUKhqbhueViQaUCxjcTKxxmFHYcH6GgBboTUntL73/i4HQijyM5DnAfTya9w9RHMwkZP3pOb8MznvhmfF7PGFLow6X08ygA7TzaOkHCkKZRcp8utwyj78e6SBLFzgn6ld8xi3ocKPxp906bcoN/m99SvmB91PyNfLmuOWw4Vu0En3AbZ9YiLvjM0HrfUFNsiVEtqGa9uMDQCR3Y8ZY4HW6URmrS/IwdQMhRxo8gIFEMMKqr16EnOKQrtNU2dvN59azzr66vR0dxD/bqRpRW37sOR99ErEHIplW7H4Vxwu9TbCTs+ouGCd1aF7P+S+0z4F+0HCtZnjEZiYGLTLcVNsdSraiHTs3pU/cv6lc/fFp/9hN36zc+84h+/ec/rE998qNaWJhTxTbgZz75Ef3az31Ev/DYHfrEPXM6VemohszpNYJfsEc68ijlljxAp2xNSg6sG/oVZ9FVhw0t5mxvNDaVcx6QmJFlM5zUbq23+4842p1ebI2VDflN2cBm6sQMXT/aDmFTqqxSxiyL98Znaq9jmTzK1y2B24SjhGcCyL2eK4ZBEGwTEB4d83YW3aqY505vb2u2bvuH2fIOzwAQNYztFHVrnYLJQhy+zSAIcTCxqBC6NRONSJP0KCPudkLC3fgPOIzRsDeZOYceXsypnhtoq2jKPL2oxU9+UHf/hV/V/X/1N7T8y59W5o5TGtKxaxu66/Bsy9QvmD7sxyx06DlK7LLHgJZt1Zx1tzzb8aLPhXZi3oe+j87lb5hMGFuSTZZVeuicln7+EzrxZ57Q5Ccf1+DcMTWmi6qXTE9F49S0XJyoqlCrKl+rqDw7qdrinGaOLWn+1HHN33FSc6ePa+LEkipL86rOT6s8OaFcqeh0nN9+z872tHMZAyJGQDjyfOj+nYCEi7FL/CEGW+LOvr7AH4JHkHDUBgGYyug72/hMB+uurKp7/aaqZjRMrMywTTUNxd9EfY6+Hcfn//0JodzfGrB23/RA/0i26Lpk1wlWYMMHXIsTNc0/9oimP/C4Zh5/WPOPP6TlRx7R0qOPaO6xRzVrN/PQvSotz0U+aBs4mjVzmZiWNwbuwFHCjYHiGOj3CV7iNgafoE8rTepwOLdBZN/GtYs6PpE133tc/+qnP6yffew+LU1ynh5DB7de+jdCyiWObbzq9V01WXlnHg3/pA8lbedn52CxHZavPeeRrb+2Vm/qme99N/gMqz1L05MqmZa7bfOXbk/tvYZWrlzRjYsX1NjaoFG63AkR/HbMS9EF4Yc513/gYPQ2rpE1fO3SZ+9BIO+Jy4LEpCnhonBmGTld2Kjrc09f1Ge//ZI+/9QP9bknn9EXvveCfv+75/V7T72sP/zmc/rit5/T57/zqv7AYbbYXxSitaxkxYdbiGPkDrk21q/Q1UgvpXMEPxqQG0dwBO86BG+DQdiFAuaGOuZ5aXTUzTeYhn3NdBEYxxZnVLNRPG7T6a1dRJPi2L8N2L855Hc7wewP2Zej2TmvVs5yHIBulsVWAFkrCCimCE6CAbBP9kmmAKwMsWixa2iQ66jR2dZuc1sbe5tqmCEOrPQPckU1elKj3dLq1qourlzUhZuv6FXc9Zd1df2itjrramc7auUH2sm0tTVoqO37VmGoTsEGEJ3UTjc6fa1URV3YQOJQQCDV3RsBBRFAAcVgxnANQeprz0KR9+VKOeJrNNrq7NWlbsfSsKnejUtqX72gXGNXBYdFj0dByRWr1k5szKAgdToxCNJbX4t9JsuWyczsYm9hlqHSWc2evllrTRjckFUIV7t80coOgyYOw7ZfZZfrzhPHdXx+Sg/dd48mrAAlenktoewX1TfRsTbySB1uB6ETJVoRdV4GzmckbpzFkkXo2FeWlPLF/lJlvw4aHz//VILbd9BFwhBFHZhmM50tkzSzQig7BoSvdtGhk2Ebg5IK1TnTc8X0BI/AGV9+HYN1I5TF1/ZkNk+ub+V2YIdhQv3bkBvGLJJxa7oVcDugroP+UQJtanSbVvA2nR8GuoJQnWbWf6kMWL3DXEHDQs2ukso9iu0I3irQwnBjAJOH3U8SHP9+Egf5GOeGlQslG6LMCMOlbQnh2P7I9JjBxUAHnfwjZwUVWkFFjZmpAwZz98zbVtXaPK+9a0+rfvV7ym29qFrzqia626oO2O7KNGz+wSxNCwsb7aY7jGzo3A1iyIoKOh1ZRp7tWRFGqpjnOb3ID/wo2sEo99EkKR85oc3ZxQgH4DAhc90+s123t56Lw71pn/RcJsqW87dkwczdP75hD/YBy97zytu45XD2qjaV75xXc+Xr2rv8R9pb+aa6jZeVz25aRrQdl9uo2zaihlmb586c0b1nTsWeuAX8es4HfNR57Vmm2faKWbVvBrCSJJte/54yj8odwPsDl3gLbZRrQs04fIrvdXA4qkPAt+8MjCNKPPPHRRt1O4b9gK8t363B+LvXX98cxm/D2LMDl8Hb/Z/yyKSEgdrdNAASHUXO76hq48twwUv5bKiSZXbBshulKWTmuN6Jd1Qxryn/TwJGON1PZfSMz2Ey5BaXtNjRQzztf5AgFTF8o0nulyvVM7+YtNGeTFDj78fhDztCj9NNIV4PI799wnyzMAnShA2n6QqJONHb+LM32WObSvK2HxVZNNBJgv6Cd/o8BYg48EBe2gtuklwKC5VUXb9zkxVNMgM0BlHNDx0XW8JQbmRu6H3ooJF2cmMYT5x6P8MBNhIENsJz9GY/gHEH7x7JgL1mM2Zds53J6uZ23LNlGYOUxSInA1Kfh2L/kWh+fQ6A5McvtBGH4LsOe9aN2aJ20Hd7Nm0w6avSbahsfbxghY5tfk/PlvWzj57WX/rkvfqlB5f10FJR8xYp0N/C0oJOnzurxRMLKhcHOjWZ0c8+eFx/5VP3689/7JwePlbW9LCuXLduOoHaUucQLapvOmJ7Lw7lZzsqqJBzJOcsg85NWXO/+bLql1+Ojr2tHdsmll+JzSQ9H+hZFu01WqZnZHtoe4ke7VjlEnCIHvOU3eSLF841kLDviN8Ma28FaD+pLfrHN7SDcT7JM13iPOaM26pxPrG7qwnLT7aiYzJDvIOvGudgiUERBk8YBAk7x/+cRUbn8LhTO8EokdsEpI6sZkJgbDcY14QLthxK+TXerZe1bVtvZrqqT5Q0+/j9uvPP/ZLu/8t/LlZ/ZJZmYwLJoGD9qMgJkVRU1jp+wXU5rifQQMG5SVfSYUJipGUXKpj9Ur6ol/THituhbeBYkVOyz0kGXz6kUz/3Sc0/9oAKx+bVMN/bc0oNx9vxJ728aRTnbzquj46vXdTHmnXL+UlVl2c1fWxRs8eWNOfrFOeWzEyraJt6WIC+Xe/OCHQwHjDgnusYuCWfbwZ4v/5VlG3kEsUnIM7koL2ElzFNjvUp36VAoyvvC24n+XpdvZU1DXZt//u5bxe7Kjgc7SrCp9j8j3+Cg7u3DlA8uiudw13rrz3bmJy3RSvpOqld323mMtqw6bhut2VC2nUd7PjdhlWQ1dJQq1VpO28dBn7l/CW6c7xMOBoXNdIa1YFdWpk0ynuEAV8QDe0MT/sFbdnLYe88fUJPfPgxPXjmmE5YNh6fmVSZcE5zFPyWINLlOnL8kjMcE193trfM790KQLuBFZrRBswv0dsSe0t8jhVtnVZTVy9f1Pr6uvLFigqVSQ1Kk8rVZlWZO6FMbU65iXnVZpdUsJ/yqY0RDa7d7dtsSKt845xWZyomiTm91CcAtY1p4ScJCRs/KTCHdQrIG+jF0shyKVYjWt+B1Ne6GT19Y0/P3tzRS2s7emVjRy+uruvF9S29tL6ry1sNXV7b0ys3t3RpdUednvm1v63YNstZnkI7HHbOmR/dbEndTCloOx0tcAR/EhydAXIE7zrE5JnQCHNmBmYMFggcEpvY45gtM8JuAg2/rqYsBT52zwmdmSqHUpdUFIBmTuj0vM8uHT9/IUjNUMPfP+PruwskmFx0pFoBp1tq2N7VcHtN2VZdQwsDmFaOcy6q0xaczBTO0tdlodRXO9u2a2ivv6Ht1ppubl0Nd2PjkrZ3Vs0IWQ2SU2uQV8Pxb/Trurx7Xdfq13Rz74Z2O5vqDNi2pDPaDcX5sQTv+bk1aKtvZazjJFulnHacZjtXVXHmmEpTC8as821Gy8GCCKofhb4whP0+OvVtsLBkksNr81YEWZlRYB/UiWn1azNWOmvicC+W6/VXz6t9+RlldldsBDFr0JGZNtguIVuuKmMFz+qCCtQpswY67bCJiT91jIAjDC0rOLFnloWncRBbbdgOYsYOYkj9tp9dfj+xlcpUbVKzMzP60Mc+obvuvc/aGZ2UdAgSAuWfjPDkBExDseevHUoBdcVh8ewNSbkRbsyu0u6W+ltrYh9M1C3Ij3L0ShPKTs5bDygTG0iCRBPEzY9y73U4aIfQUQEja/NFDdafU7G3gzoaxUzmGvjOWohXNKieUG7xQfXLy24zWAFEBZ+AN7h+jf9Qsv0cRqhvg2/4OSn9GHThEzo0NRqBArj+KDeGVPd4kTe2HChiIPWtKtcvqb32rEr9FT8zKz/NBKNTONqUk+qXj6k496CytRNuY3R8Q1dH8NaATgzqISrfjlaZ6jHR1Li+xvevd8CoHt8quK4xXjAEmMkJFdBZH9v5mc/QMbezs60vfvEL+sqX/ljnX3pRzWZLE5MzKpWqzqV5OZ0LJkY6nqA/TArkFNtOZTNtG1F7yvduql+/oPbqc2pdf1bavKBSZ13lwZ6/T0uY0zfOkuncHC2eo6PR+YtZ2IGVxHP3BxsxJnyNlWlYL8HLxrjg2/QcTSi8+OVbnIFvRl4uRmpD5n1h3DKIA63HlGE78OG8OFv+hHbpj5yeWaP5Mvzcsqnfshivq7O3oUFz0/ZfI9o+g+p5x4dEtB2mTSv/nfXVWEY/KFZt/E+pMD2lbLXidMwHoqSUbZTPyCS8lPbuDAQkfPOOt8EDwh9I2CKfWbfJgWUEHRYxm88ZKLheGcRmVSWz3bAIo7Oer1JSDk18jmc/Up78Rxyv8X/rkLgkdZPyifNtAPoQvvwxeyy9cxgMKr8PjET94/ho7IAx/xlfD79/rTtcltf/gSvCpCspHTzTXmIbHaIhj3Hlzu9MDHudnrYa1mPcJmIWtgOkjnYXDMPaz5Tc0jLOuJifKMeuIshRcJ90xhRnRB38nWtKiK/T3S3A6EMuoX8A48h8HZedsiDZKQuOVQ3gNK0UTB9GW4j/viqObLpSUMX0xHPCS6QyCku5s9ps9rVnvKQYUs2nNpvkj5UboyhqXJPVksp+JmWbutG+E2qI9zCMvieNcft3wNeHivTgc34dE0QcJuXAzm2EK+ekNVtt11dqe5En3yc+xJPLZmUrxT5yQQupVmgT4ctKZ7upQlYLLsdcteA2Z4pmAIT0TQ9A6JCE58cvxs+Hfl5/eZ/CqE4DwcZdMB9qAXxBW75GvZp+qQvzO3TXyxu2JVTWq2t7ur6+a7vA9cqsd3+fZwY8E3ccB7VBXCmZcV0mjKdruo+7cR0Z4o40ubP/gK1VrHtXSiVN1ibibL6CG3WSb0OV3D5OzpZ1x2xBi7b1ODsHrQpHHhj4po0VC0XVLGNzhRKtLvh3yfGcmJ3Q4tSE2GJxbXPTvJscRCtyeRkQIE/m88EfB9bdWprXrh6a7OjR2p5mmjfVtty5dHVDz13lLMaaTi1OOg3HQ9r+u3Tpgn7rt39Lmzu7UeA4u84xd03P9z/0kH711/5sGuxxCvzYpNOLN3b08tquuvanapA5ib8gLOPmFoCy8W3qOI5JQ64/yos/OgJQMl+Y7ra1uLGqUytXtWA7ky3msJUISyZTDcdt0AqxxgACkzcovQsfaYx7+h0iaG30/bsNZCFP+uaFiR6ZFJhmrNMpnQHprvuuaXi9aF385LxO/cInde5Xfl61h+5XxjRipSPxU4TKCIgL7KWS+d431Dtthnfc8xN/XMdVF/7pNoDv9j1GV+oHnPu7/OS0qnOLKk5MmiYsR9pNddkZwGHYdivVXdIBojb9DauRBs5z31d0z3zJPLNaVrlWVYmzRDhrgYEcpxGDCcQyyuDh7OEVeo7vo/aI21d4Kyg9yPfoO7+McKMrgVOb940909djILeH4hhfDl1xyAsGWwf5QpyT0pmbjoPoQy/xNcI53jHvAhuUi78kn8jvWz8DhIhDezSe+xiIvuZti07s7Wrru09pUCur9KGPaNd8CVnGKh4mEXEOK3Z+Nz9Uh32W3X5pG3nb9OAtrboiU6FRxn3CUXjx6/gM4Wcsun7MXV0W6sn4yHG+BFLc5Td/PFYZaoHz/1iR5m8b+Rl1bQtzbdMnZJkLlUSUpoV0k9IDEhVzTY70E5Cv5BeDcqO3ob91Ozr/wnP69lf+OPpfcujRBMkVHdbOt6zm5JwaVm1jD9Cx38uVNL14TPefu0MP3n1K7bbxZp197ty96i/Y/l06rqkTZ2wHL5nWS7L2gLUf8OrKts5fuhmrQB+8Y0HHZmpBZ5FvX9EwyETIlMhqyu+tARFHzPGU6Mu+tEunxDW9Jc3k/86cAWLnwpBeGvzgPtFH0Ld50IVN4/7Gtk7OT+nxs8f0wJljutvt4sTygs6eXNC54/M6e2xOp44tOA37zVp+Zvsq+vvU75HiizTH+Nt/gI/s+xzB64D2ezQAcgTvKsAC0gxuOh3yZhqwbBQAlsPB2oNd+M9CxkZZnk6ITE8nFmr68BkzSgxijKVgLDTt9EUwuYBxg08u/R2C1zz85GGcy3FeLFEsQNNy/8HehvpbK8rRoe8QCEJVp+ymlc1z2LeFqoV0e1DXSuOGbjSu6OrmRV3buKiVrStq9rfUHjbUGbTVNVMsWPhXppeVn5rSSntNG4N19WodCx92Qe2m/iOEm3OFIsJoPrNNuoWh9rJdu75NgowNI6uSE0uaXj5toVe1wuAvYN4j4/THwqi4rABh8CO2TjCDzlrhydRmlZk9Lmtucf5Dpr6hweqrGt54TrnGigqgJ2Yzu45t4LCFV6Zc1bDojFv7CXpg8MtK/dDfc9YG1kS+aGXdykAoBmOBQF6trFjbNW4ZfKkoY6O7y1kkVp4YWHIKeuCBh3Tu4UeUZ2DGSg2KTwhdO2ZHAUmpwN9pWItgexkEIh0hSTlL+SoxwLK7oeH2hooYdsavK9BKTs7KU83K70IM+mBchhLtb8cpOMNvpJVwY7p+jwPlpR6Y+bDxnDIbT1uIp5l6oXC4/Ci3tI9mdlL52TuVnzmnvhU/ZrE7YEJH1MUIP/GcFFx02uAroZCCM5QO1xqdtimggWviGOP7+B1FHTPKfA2w51hxZsQQ9Yet2/I9ViA9p8H2S87/pr/BgHdbZRAE2nD7wrDJTJ5VZfFRK/qzUIf992M+gj8VUEsocHZRSVGjITeijdsjGeKjOjx03f/AoZJ765CUXPMD85w46DvioX79m89rd3dPv/M7/0z/1//iP9c/+yf/o77ypS/phy+8qO2duhaWj2tpbk7Z2PLO32G0+Du2ZMuazxaGLdPRhtS4rLZpqbnyA7eJl1Ru31RtsGu6Yp9u847gYZEsOQqXij/2JI+m0zGviXBOi84LhyEY8UTnJPmIIozjtAKePSgX7S6+jY9GbYZ2BY+CjbHqg04y2hN8NRBBXKP44INxi7/jsQERssbGKW0EfssqR7Y5GbY21d1biYPSI1998+iCDdZcRc88/ayeffJr6jR39crqpnZs9E0cW7YsgMdTH2QXfoAhCAaME+Ig2XFDjrLAT/yO8nPFKwLxReK18HSsOQY2OaNqx8Z0u74brlarhOE7NoT75tl0bbGaL6UMChI9cE0YI/EE3I3d2HtErvtu5A2a4z7lKs0Zg/7YRg96JzUkGcYV8xYCZ35HR4IL5/pxnlwUyktHGCFTjvxoR5VG4tyEx5u4EYw7t1KHqkt06Bp0R9KvuY78HUkMgCDvicFEAz93SfwKeZnXdrOtrXZPXddfyE77EyYMS5chnUNmKUEHeSmj+VoxtsthADI6aYiYuvId36QqTTVJ+vhzd0sw+pAL/QNcSS+Kzwt+/UC9MIt8t2N9qcWqKNO5hU/kiQ/AAd84Xy61ytZbJss5Vax7xJYXgatELSlWaDNnY7tvQ9vfupwRl7+PP7+jpBl0E+OINKqloirmQUU/5Njek7acYoo4A0/8gk67VIX82Ht04Tfozj/gMTqYSW/8Dtpzmkg3Ds3u9gaqN62z2Y/OZdoEnYhxlge3lutR31G+EbW6HaY6dv5JJwY/2nHo+WKtpLlqMR16brwE8D31HDggb3jS4Mloej/6Cdj3et/CGAPUZXK0Nbw45yFqE1wakdRItEzrMN1sUa9sNrWbm9BzF1dV71svRkQQzoyEfeCRJ/AaaAIIXje6AkFtvt2nl8NVNLomBy07bejQhgSrKNDnLBnVarW0u7Otbquhk4sTOjOV0WSmo7wTZnVC6NrkyS7xRiLkbuSCzzttJ0DZFqsFnZqf1LWb12JyAjRMWnQcoxui30HRBcukye6WTvbX9PHlnE4NVlVtbahb39Ol9ZaeXc9o4cRZ3XmsFrZaajtDvfrKef33/8M/Vt2ygryQJhuyMlB+z4P368/82q+rYLkXuLCj3bx0c0c/ZOYu7dcfcY7VeGIV1XVLEDINu5gBED+b57MtF7puTPyxHUf9Tbiul4zbuZVrOrm1qlm2WHY7DfntMkWdRtki0vjjTD2s78C438W2PdYT0IUJRphgLHF994GUOdh8yMpQP2SYqBBcKquSK5k6YSsrZvCXHz6ns3/+l3XiUx/TYGEu9AccZcdRr2NHvPuO176+poR8g8/4xTjw+HnsRgCeDv4SPoNiqLB8SYW5WZUX53yf1d7ubqyMIt00EA2v9HeQidNlJQGrO4ITmufHlmdQHgFKOeWrJRWr5RgMyTPJsGD8+BXbGXFORdiylBFH+n4eRe16TRzWGUweXEePUUQHDIefPcffRfs/9Bc+4+8JN7oGjJ55pN0SX9eJZs4sq3diPjqbqTniJhBxs0Kib7pjJQu4i3YYiRNXRjUmH7yFARDyz6pkBoDY5gwPzuYsN/bUePUl5adnVHnoMbVMH7lB6l9KPMZBIw7id7tzPrLOFGVGFwALPMXAEv0FzluaCMJ7kolYgpfhQSnNCaIg6HboEuRb5g9I+gnbBqXmpsq9ukmjoL3svBrV4+oWptRxWIZNkLdQQ8/5942THNWB2/8oZ/HLNbau9SvyBd64DUQmz+Ct7Fjxw6e/p6e+/lWX3fyX7yLzTNzjMPNK7LIRq0KcB1YJxvaJTm9mZkZ33XE68nJzu6kVs5hL7YzON4a6Uu/pynZdr65t6/LGri7c3NRl31+6saHzF6/HmSMT+YHuu/OY5menTIjgCr3R+Y82AJGkspDXW4dUL+M4KD53pIa85Bo2gtMGoj/iHRwAoYWRCjQSFBHfO5xxyESE85ev64FjM/r0fad079KE7pir6dTchE4vVHVmzm7efgsVnZ0vqcr5HuQY9h/xJ5aSYoZ3YNOBt9fl4wjeAOiZqSaP4AjeVRix6BEjSkwiQdzZMwgzCNRM2gJpyQpDrVR2UJj+ODzXsTsM40Z/+xt+ysHhPMKcLGB7HAS9o/8/e/8ZZVmW5fdh/+dN+MhI7zMry3VXezvT09PTM2gMBA5mJJICtSQuLZGiqAVpLeoTxUVSJEjxAykIIIhFgQYDgAAINwMCmB5M+57q6uqqLm+zKr13kREZPuJ5o/9vn/ciolx3VVZPtUHuiPPuveeee8w++2xzbL/dchltPIaWYaHWrZlB1qzYMVNyVbdXb+jy3HkLj9O6cuu0FtZuq9ZbV6/QVr/QVS9ngybPplhtbRiPYwcOaGzPbrVyPbPKpn1bEYb4GcVHAe7bEIVJcrBlxoyeY5MazsWaUbvc6Ck/MqWJmf3KFkedF9cVTNUWsmMYlOGdYbtSOYTNexi/i99ZmFfj6gV1rp9XZv6qivVlFbs2KrrOn4VuL1+J2Q79ypRUnnC+0+yNOLzPnD+Xbdt6WlNr4abqt66oMX9drY051Zp3tNFZNH6WrSwYR8Zhv9i28mDhne0oVx1VqcCB2nRWW6lC0FlocUB53wpzDAa5DsI5LQaVUMI6eb+z61pYs0Q8jEN/x6FuOI6kKlKnnAnRrIWCA7YCTKuIolgm63uMwMAGP9vQ+W5w+/MLLlu02USDHD5JZ0icnwGugj7swA+U6brPVKwQFRmiGiIKNwgXDhj6D2H4PPQjHBxkKObS8xu/p3aS0hC+oaQkGNZhbPNhvpPr1dVt2lBevu57tu/xuzCofEP7IjCrjfLjypRY5TQaSmIYBvfgPUPg06gLpTPVzqBOhi7VW6pDMy9fh4NfuGCpDnE3Lm1xYCPaxgnsBgOMLZ/obOh0+nruhZf03/0P/6Nu3ryJHqu11UU9+YNH9Vf/67+k3/u9f6il9SV1ih21zJtb5r8NR9ihRwkjpdNWZ/6S6hefVv/myyqvXrbBs2geUjdPNr+2EcSgBoqtgwdtRZlAQdCSPaNDxfzLnijUPfiL7+lATZ0V0CPdM/wlTA2Qmd7Y2o74B95Bw3Y844ibjlcO1owVLwQZ/MDHyMKQ7nk5PISVey6Rm5DVybHdHXK80G+ZX9pK6qxpffGm5q+c0cLcNbcT84RyXsv1NT398nO6cOOSvvm97+ixZ57S7KJx6XRzrCYsYCwO2jOdPcOSORuknDqYB2WMP67M06XTNvF4OnToQuiYXxddN/l+Tb3mklZvX9Di1fPqbKw7f1KJunehMh0MGGYMYmAO0+KHMuMcm103cBAvN2EbO3lXgMYD3kmRK2WCIhNEjdgwNk7ZLpPJAKZRVlhicEML5IU93IeOzjD8kFsMwG1eHfoNDr/he7uu8fLma8T5TlfLV7ZQga9HZ3jUeZKV5JuBRPYqZ292Fg5hKoKptN2IkWR6jJLaE0OxbL4KvqM7zs9MYjAF+Itk5AOE5V3Ue3z9HpH9nmEr/qjmqOr4eQMMX0WOaCsDn/R1yu8bgW2H2FKONzaUB6+RG+CGa+xpb3wwmLpes15HZ4Sjjdm0Lj10w5ALmlLSlhwW5gG/gY7Nu8Lf4aNjuWcai/cxrBe5S9wUCguNNK4Rt9NnIAY5SEngMf4wXOh6/qNzjzigwSG/CX5giFhNqwW7MVZ+jFQ0WSm4jv3VZnsZXrfD2/ndg+2QdIuE6AG6t7AW/NEQPWbUOX0u1q99pQ2umo5Wa3W12g7nMMFnXLf+Te022u72OhimMAC/H1LNWyHlizfQKR1NrJZa2Wjq4vVZnTxzRc+/clrf/uPH9NyzT2v51mWt3zivlSsntXHjjLq2CdgZAEg52Ep7eAedDQc/gvotqKfKbT001tJD1bom+ncsb9bNT+AZFX+XUaFT13R7UUd0R5+YaGp/ZsV8vq+adc65bMWurEZlVN1yOfIesjUwYrnf6qtes63g+OI8G2je9+SPSU1sv2ssb/IGFhqgG1AL4DfiisK8CY/vGUgFoMUNbWS74IXkmbZnfHRbGqltaLzetH2FHOYryjL88s35SG05VnDGe+fd8WzpVADfvN/8vz9gwClTyFn2mC86K3QUU/aG9ao6AwojBe34zEf00G/9ae355EeVGatC/pvt4IPN/zA9O9pqtFeD81LasUO7P/YR7frEh9WfHlPTtMyAcc60Ba+nbOh1MVHOjTZRWtJn4K24OPwcX2z5UkFjOyY1vZcD1XfFFlmF0YpZPHFZ98EZBQwGJtniq79Pnc2JMkL++jrIZUpxkNZWa8Rth2Hot3+7CcFj+m6TlkTNthp37kgbG9a/zEOiMz9yNHAJQpcd5G8zlaDj9wYho6y7s1Us5SSOkFVjo5r53Ke04+MfMd4zGrGcrTgvI52Oxk1P475Wre+PWh8ct9paalkqGkH0EbBVOPXCwErR8TFwMJCY4fx6oKPgtuFoQIPsqMGAdMZ6MSshmOAJsumPaZoXcWIpq2VXlpZjAKJqmi+AD3/DhAUbIiYncPFWfIRvFHQLUjseQsoDf0yEXV9fCx0ttkn0q9At/FOuVHXg4KGIL965rOCO8rVqK1pfmrVs7+rpp17SP/2Dr+uffO27+oNHn9dTr9/WEyev6/svnNNXv/WE/s4/+Of6e//wn+sf/KM/1B9//0U1ai3tnxnTsb07NMnqbhc95cjgJLa409bdTww28cB1SHN/MsCAEefYMn0qbCrTGOVJGEzygMk/ZMHNPCbnqtlQuddQqV1XoZ3OyKr0Wr5vhG4I3TZct0y0ZGvHIeaIl/gB7Ja83U8Yc79w8KYmcg/uwQcDNFdmq6TOCNp/YgjRmBM/GDhmaPZ1YMeoqiUUTvu+gZH/rENid7hgtlmEVkvdxpraa6sWYswmsvA3Hvq5llRoqd1f1dL6NV2fP61zt07qyp1zWmvMG19NZfOOy0wPRsdB0CgmKBZtC9FGm84zp2imW291/N4xI1PxcyoIuqFZG0ZB10pTxwZwp2huytZiI5oc26uZyf0aH52xIlQ0c7bS4vjoWKJTjph+HAwHQDYHPobAAEy7Zsvrjsq1RY2YyReZkUS92xBnj3zmHzQKVTXzo+rtOKD+2E4zeQ59J2UrfsZTxo7ZlXnHlVlbVGP+qpZnz+v6rVO6NPe68XVGt5YvaHnjujZaczZulq1QbET6uUC1lR9HyN6fbWspjUxXTf6MfwaTukUbM2WnZdfxfavQsWurXepYIWXGZUulfkuVblNVuxBO3Xqs/ujWVo1bOvadkItPRyNYC60pFFxKwZ/L4/dgKGj6HQBS/7ki97cByoi6ncmw/7PxxEw0MAACcIENV3AKaGe6tBHKEtwA/N4HEHviL6kVBhipyQRIBvww6QRbd9F2UFJd35n+inqrN9SpL/jetNxneTDLkonVbVemHTqU8tMqje5SL1+y8rMtzXvwHsF1xoz20OSTbMAYChf0QhsbOvPPaCxcU70Cw5mx79Ux0x/Fnu0WWRRPB0PPxg97RM/PLepb3/qOLpy/GEZT2worbX7/7ikr8zk99u2v6tWTz5qPmMfAO8wzGExlOT10mEXJXZ1TbvGCyus3zUfWnYbph7wzkOFwGFfR8YyMxN80Bhqi5CjSjqdrDzghZ29wbs7mzCRkSabjsG3zHuJxmRxvLAHEiHH5oHgkAcr0gBvZwan8rcseh9b6HVtLpC3AeOd8W/7EQas4548r+RzuP803EbbnNu44SC/NJCtaRhXU6Nqo69vgKUyoPL1bld37VJyadPb9neNo92taXL+jbDWjhfUFrTc2YmOG5f4AAP/0SURBVGZjuTpqFlpUjrNBijnli1lxGGNs58GnTpXZedjQMdMx2iT5cVnssNvoLKBcaBxZ45ftuTKWqb3OulHT1NR4Ubt2TWrHzl2u55KFAzQg6x9p+7sgLzvKmDqZEta4hov07PAfuHcDw3BbcSU6SXTv8sVv4lMM1seKGtdx3nRBtcZ3/tC1Y1k5qPtYUZsGJWJW8OZ1u3+qv+1hOGOmB59+zw45zuDHwNGFTkdVwog4bJl9n0MfCZoAf3SKYgTS5WKe76DIZvbOLxdKLmPe7cth/U3gwIjCOQJfKXh6Ht77a7ufLqTSbgOylX7eGUyXZdN1dKD4PrygAfATGKTNOhZHwzlitUbduHQ9WadAxqAzdUJ/ghdY/sSAB2dhWV+2/tbvGNdunEwkYRUX/sjY6JQe8JGWcRznI5i/ddzO2r5vG6f4oc3UOLw++EXqkIuOF2cq/iLL/pYOJr9nd7zeYIN8trbNdJxD0+242+3MSFVTbs+siIlVCkNd6R68L4Dygz+5BoZtDjfUwdGfCQVNhWRwO1tYXFbL9Uq4pN+bM6aAwfffor+/CXg7lMWxYpEMBOBDWrRt2ybQEW2cyU2mk1qjo9X1ui5du6FXTr6mK5fO6+aFM1q8ckprV05q7dKr6izPmp/DUwZAXuJhUK7wC9aQfpwGPDnXr+u+Sku/tEt6eKKuPcVVVVtryq+vquLr7uy6Hq7W9Jnpjj422dNYr65ar6KbuRmdze/UWVW0ZDnZLaVVKnQWtx0v7bDd7Km+7jz1aVt5l43yuK2RkY7x2GYa2QD3/s/7WzfryBttjfbZGQ48Ro3dLZCG43S8pE2azEZm0Co1y8Rb4SXVWl2jjYbbn+s2NdRA5c8rgEpzDfMll6dYUN36GTLfHMk2Wlar5Zymv/AZHfvt31T14RN+4TKbptmJINlZCQc/LYhtt6h68uI2mBmtauYjD2vfpz6u3My0y5XoA8nJNEXaKjlm++e8v4mJOY4ALo6KE02OuBwvW2AHJzXhlcZHNbV3p2YO2JbfvVOZkbJt4L6a5rnYvfDo7VuAhdy1jBiw7YgbgP4ZNIltffnufdGOI3Veode+28vGLet5S+sqWznjvKi34zdRxsH9+4HgGOY/ViDN25CRLox9myW34YN7A/ftO0vKz84rPz+vwvycSrNzKt6eU9Z+Oee1eGtJxdW6W7xxga4EDn3NsnqHCSnUGm3QXCFWCoNTu1RnBlcWfDH4IPi1TsRWf6PWqUdRNOsrevLx7+uq02sWxrTaLShXLmtx/pa+9tX/Rc89+QPdvn41VshWLEvLpvdiDplOrYOoVGn80k7S0xYMXm9CenZdODONpvV1aChkuz8G6XbVsVEdO3Y8zgHhA1bnsfUf/KbbtC1vd3jfLvWbG/rut/5Ir73ygqrmnQ/cd0QP33+fThw/qvX5WT32L/6pnn30m3riW3+o7uq8funjD+sLn/qYPvuxh7VzYixsrcTDUtIwqejMd1t4c77fPxBhKk/cR4I/eUiS0XLEuhjnT2EfJTshKCTRggF9jIkssQNJgcES+5me2M6RJhq6G42vax6GPmalv1XIq06/H3qivyeu2Jbdz7Etu/GWpfGGrLkH7wT3sHMPPnAIJofQDoPbzd2MLolFu7g3wAzNbDGQxop57R7NqmxJktSBn1fA0DBb7LfU2lhVxoZsATxQJJeXGU90AM0vX9elG6d0ff6cFlu31chvSCUzw7yN3j4O5p061hkEQTlB066MW5DkLeQtYDn4G4XIIaOzH4EY52SYadLBkLHS4Wyo3y6opDGNFqY1NbZPh/ber+mJ/RZyVePejBmlyMrjIJMD986Akvn2Hfr4OTc2Ejoue8/XtKWWlYFM2Ux91OUc0ZrzvpavKHfwqPKHT6i/84BapXErbgW1YO4uL6s2EB9Fl6Pia65TU6t+R4srV3Vr6aKuLZzT5bkzusSAiN3F2dO6Mmtczl1Rrb5qBbCtLjOzCx2tZWq6VbutS/MXHe6cw5/WJYe/Nn9WNxcvaX79mpZqs1ppzqvWssHIgcW5htHdFlvVFBqryq7ckRZuq2vXd/xp+wE75I+FEgotewPTeYdQhMYDI9EGBgrHW+DH4/rnC1Bu2hbkDIA0/OyyQZQW3mlGDDRNuGQo900DbF+AsjB4cZeQ0hiooIZoEfblGmrxZuyJtyScp041zEu/Nb3lMw31G7PqLF1yvdetrFHHxOL3UX82gLMd/5bUL1qhru61MuKy0UN5D+4CwCm4o+OAK8/D+hlifus5DX5Qg9SrjWPfhxuEfM+OJPPw45bJwJyW2V62xhgMuHzxvB799rdUdJJsX7inWtFnrez/+V/7Vf3vf+NLenDHhGo3b6roSHJ2zBDL9syzMtCIZV7MkK/beKnZoOBMIuQaGzm4fTjZLIaaIW1t5bRDRuDwNEXSkWkX27vRoRlXu0jHhhiKs5rOcjpDJH0IHt0GTJNsYxPbhxAXbS+agn/II84eWZRotG9exmBG3WHYmsvxRyc5zm2AjojANSEtk3zf9buueWyf2a9Zt5b+iFY1rWb1qLTrE8od+oLKx76oifu+oJkHPqvpww+oMDLieG0uFLpaWZ/XWnNFlpKqTlQ1Nb0jBj9Sp7AVe4ywfMY8mDOmjGMbgsioOGuFjrYhnuyYecdgP3VRdMlKzlTB94FDZI99+6VR5cZmNHXkhCYPHVNhfNJtV+b18HBoy3LWMjS2b+E7p8FWIewFnbXLd/MmFRurPEd9OP27AaeTtr9INBzbXcSdX1AertEW7FyHbWS/88jKCtoCHC5tnUEekostTVz+rWt+4FLeh3mGTtM3+btyEfcgh7TCaKGuDzo8u5bd9U5fTZMi98HX6QQIo9DykXr113wFb867rRVdr6z25Jm24ZL6O2jN7Qe8+J6VJzGBZkCDqeJ/duFH5a6YpzODmnWNh/5EjbqekSFgFhzZnw5qOizWak1tdCx1WMHrtsEKqS4cxG0f/pIox5+jX9sfvTN0T6LEQVK+wjcZpFeuZHwWrRvZWIe2fK1Z91vcaGluqa7Vmlujo4ywdI6TN9NfOujcNGq6w9jnXRCB64TVxtluU3nz0LFCRjMjZc1Uy6q6fhkkYyVoGgBJeb0HdwNDunfdUr9xD6QrPJyt0zhHgFU8bF8GD2Vl6p3FpahHeD3wzrr7OwPppTS3fwcBRI6cfmrbIVVMV2bYpjXLn5BD5gGWNxXTw3Qlq4ptn5HuunL1JevRyyY2VscTy5shpYl1k7b8SH74oEvvKvd1KL+kL+5s6DemV/Tl8Xl9eWJWvzE1py9PL+sLO2r68ERPVcvbeq6qq9lpPbNY1PNz0s12VZ1iGUYcVMmvKToGbmv1ljqtjmUJndH4DuSpr2zJ1G0lWR6y1ID4pLOQxgaeI5zbSeJ15PqtJXtXgECK9B0nfNeoBw+buHB6Oddp0frAWG1Dk82adZWUJ5rve63jnyUg59B0s9sO2zdb5PBfxcqPmvnLrl/5jA7/ua8of2ivac31U2SSErzT37Ekh/r4qUJqiwxShByjGkslTTx4Qrs/8THlds+o5vaJrZtnG2jaanQOuxRux3H1J1DddrsxZIMdccNRm8gClzVnnFR3Tmly3+5whfER9YyX2BTbbQ9+zVmarG6mT8Zkn2hoQCJQDR236ENc3xc4fiKmBbDaoXtnSdmFVVXaaAmJNjcTNtBq4g9693WQs7sC9ISWde1mrmm9jolBlqNOqr28plsvvKab3/uhVn7whDYef0Jr33tKy48+pfnHf6iFJ57Qqt3S40/qztMvqnN9TiXyywiGdS9rHpablqEuQOwcYQS2Qz+Bz6a0qa+0gscerhPOJvVrzsZXr7aqMy88pW/9wT/S7/29v6G/9t/8Fc2u1DR9/BGNH35IOw8fU3WkpK9/9Z/qr//V/4/+9l//b/T7//Pf0amXn6dr3RVjOep8wHdILjD8JjQNH7dfSX/4DOfsmn9BT8iKGAT3S+ipUCho/8EDGp+aHFTfYOKNMRhbhTXrWl+a0+z1y7r1+kmbCo3YEmtqfEzT05Pav29PDNjMnT+l2fOv68apV3Tx5Asqdtb10OEZ7Z0eU9l4SAeDJ7xQiOCPweNMLcOM/onAn1zkIaNcroJ1Ms66RUNL+pZx63ZNWSumh91jBY0zh61jm824jW4x604hO8zHW75YfXYAY536MUJie0cSGbSNgTR03DmxxWzH33H/J1m+XwQA1ffgHnxgEM3VjA4VMGYcYsRGA2ZcPTE8wsS2SwgSM4JdFtpTVmToHKC9R8P/OYRgUxikrZo6a6sqtM3kKDOFQqD6/cr6sm4uXNNyfU6dXE39sg3PgoU2M1WjQyAJuryVOYyLUE6MKxSUYqVqFBqPZoBsbYXSzoFfdLgz+IEA7tGJY26a67GHdMnGx5jGKxZEM0d1dP9DmhzZbUN8VN02KhYrQMi5c+bISPfdwpuV7Hh0GfudjkWBlYSYaVi2slfWqka1khvXWnHcCuBBjRw9ofKRB9Qbm1Z2Zq+Kew6qOzKhRqGiZr7sMtuAih43BKZxYgO706urX2hZuQNXG1rvLGnBOLy1cl3XFi7r2twlG/LXVe+vq1PuqlFpa73U0HJ2VTfWr+vi/DldnT+rK7NndPnGa7pw7RW7l3Tx2qu6dOukLt86rau3zml2/pKWV2+ovn5bnZXbas/fUPvGZXVuXlNmdVE5tvIy3caMaNcPM7HYRzNXKFuhpRNvgA/+QAoOQTcA7sLZOwYJfwGA8tDeUZrYJqwHjvyMcp96YVyPxlkYZygGuYrDswUBQj1Cvg+IVmfndAKpKHoxVzryNcxZcCTeM/3JqQLRIUgHtsPme2vqrl5Ue+2aFbpGKIGu4WhbKGt00/Vs1PQLY8pWD6tT2mlF28+u22Gd34P3AltUEx0NRmLCNO6NVJEGFLeQzJtgqfaPiTNvchidP+4as95yNm8K1vHp0KfTrogCauOpZZ68vqZjNij/9d/8iv78V35D/4bdr334IX3+yAH97770BX3i6DGxoK/Uzqts66hsXsUBgzFP3yza7NXx8pS3wTHoBDat9Jx4t1tUt182Xy/5vZ2v3XD4VdXujzgfNmR71fBr9RzGTpxFI2c4EGA8Qe6mwW6/oGasvrAa3iv6+4pdNeLq+J44uv6+Rxp+T1r4NwlrAYPBRvOhfXTMvxleYdZ50/KBrQqbTrdFeF+bmZJdXnXX2Zrj2chPqjtxRJl9n1Lh2K+p8sBvauTEb6p84IvKjD/sOHc7q2mwnYOQi85+oZzT1My48uW89h86oGK14vK5hbksdOxgqFG/8IxsnsEQG/B2xXxRhVzJ7BRj3vKO8MZn3pWaN+spcGXAwo6Vj1nntZ+rur1OKFOdUn98j1rFMTE823H9ZJy+xaTljevM5We5BR138Ar4AvEP40tpMJjwRlocwha1vjNQX3RisSUEXYZOOXCenMvs9DLZonHBGRoDQ4eBH/MdBoRyltFZ11cq99YAzXaXMw3knE8c+U5+KWzKP85hnMZ7uTIIYmRGHhnwZ3UCcjpmv5km61ZQ2M6BTtBezuGpI3h9lBzeD1bNk20sFwvWPIpUMFzVMp02wz08N5x1xgFe0oBIGhzBfVCwvZp/ZN3y8sdUPnK+6LZfZVDPZWIWKXpXyCXwCm9AVjrBWN1kWl9Zr+nOak1rTDy3LpVhazg6uf3XNQ5pS8EnHR/bTMVcYvuxmjFWQfm+Z3wHHv1dx3XCQArteq3V0/xqXbeX1zW3sqGljYZ5h+N2OuQDuRzF6vkOvZL8IStD9zRSIv/mEtbL8k6HlR/o8NNV65u02U7L1dnxdwk5rkXQcA/uGoZENnRDoA0hU2hf1pndJulIQS42bAesbtRQodNXpkEcvDX4q++Hq0HeGaAr6NXJhLxJaadf4uDCAAsD+s6Hn7FJWH3CgPLE2KhtIQvJRk0jlrUj/aZGLEVy7Q3rUc475ES8REeDGMQ8lP4M1rPdXmyNG7TktGwfjI2WNdJb18HWTX06f11fmb6t39mzoH9l5o5+eXRexzILMdhSK43ptY2inljM6dX6uGa7M6rJssBtoWIZFJ1RbjdoIci95bVlSqGSbY6iywD3MqeNK2cttClL5Mwu8oPIcAhwmh4N4IUS4TY93yNQfgQyetEQR8QVTMPPlgdOo+Q8j9bWNN6sqwTyI034yM83MAEw7zrqsOOBcds071syj5n6wqe178/+hrK7LMurTKKi5pCZaZAPejbHS2j4KUG0LV/ZvqtrfSL0PiYtlorWi45r5mMfVX7PTutQ6G2ETzIy6pgBC5eBbS+TNEgu2q7/WOFKX0DosI7b4lwt661d46Y4MaqxXTs0uWeXRmYmlR+xfWX8oFfR+Y0sRbYAZtEBXCDVMLUht+R915D4C4WKdfMqrNWUm19Sod50U6dMlGKYTuoHGg5+cN1qQ+8VjHO35W6uacdq1dTZz6SZfMtpXltQ7spN5a9dUfHGdZWvzyt3Y0G6dUeZW3PK2rbv3bqh/uKKcnVr7GyJ6jqIbQKpRxemme+HY+vxGBAZ4s2pk21KQU2mc0Lo7erpytlT+id/72/rd//a/1f/41/5r/R7f+dv6sK5c85jRSP7H9BGYUqF6V3Wh80I23VdOXNSTz76Lf1P/91f0+/+t39NTz32aKzAKLquwR00Qj0CoTPG3RbwKuE0XYeQeD32cLrGd9AmtGR6m5ya1iHbM/Ddnm2Y2AnE8ht7nm3cX372h7py/owypjMGPI4ePhhjj2wLCN/eOT2h8ZFiDDhP+3r59Vd0+dRJVU1TOVY0d1g1zADINmwN6v3Ntt3PG6D/lHpsY8VgPhNTjGPsPOu/rNrev2NUn//IUT1wZEalUrJXe0XbYLmysWU7zLKza7umW7B9Fv1H5hXYHtg16PnGU0x6IjFfwVfsDuP40xmGkY178A5wDz334AMHiG7Apw1mCG6wGHppu5MBs/OF0XVWRRywwJ7Il2w02bDi7+eMHyJYho4tVTq1daYT+d4FQUsZdB7QGRxbWdkMTWd3WFhnu2abCCUKjSKX1ISOBUcX5R8D1IIc0SEbxmGgmvkVyzYuzDzTFiY2WK1NddsIGSv2/YIN7YrGyju0f9cRHbWw3bfziMYqO5yfgnr0/li8hfIFEx0YQigN7xZCKbN7A5D3YkWFHfuU23Nc3V3H1D/wkPLHP6HSA5/W6ImPaeLIA3YnlBmfsEGeV90uO7VLpd2H1R3doVZh3EJixAnQ2Vd0WbOqGx8bxhInnkRnVc6uYFopWLmz60dHZk8tf9IY7Wu13NZCtm5X03KurvW8MZ5vOkxDmULNaKvZCFq3MrmqWvuOVmuzWly9rlsLF3Vr7oLmb13Q2s2Lat2+qv7CLWl1QZnGqpWilnEdFOp6QADRqVBSbnRSheqYqzcptSHUg+YJN8Rpog+uW+4XAFyMULhcVrpO0mxyZpHzjp+48a/fgQ/f5fIMgKAiDzpa7O4eHD9tK9JBhTNt2FnVSHH7HTNXMXWTwkqdDOsF85aN2Rpur7PqLl10m2WQy23XdIYCSJkYrI2VPq7rzMhOGxsH/Dzi+rby4kTeX/7/ZQUowi1is30A3CdDaVN+mGcOXTILfTVPSEAgxxKK9db13Thm2rSsjfYLZVOL27E1STp2WQp+6OBBfe7Tn9bMxIR+9fOf06989pM6uHPSbGfDKmtDu8bLmrQzM7UzFdO5jNKaGr/JsWL2tUf9sfuVGTshlfcrZ96bq06rX9ql/shRde3fHn9ArbGHwzXHHtrm7Df6kNq+b4896PsH1Bl/SP3JB/yt+WR+h/M9o35lr/qjR6WJB9SddNiJhxyXr+Mpzk3nb7s4x4VrO+7O6MPO24PKjt+nXnmvVN3j6061i7sl/Jxmz3F1Rx5Wb+RDvtrx3YjjmPioepOfdjqfkGY+p+qRL2n8xBdV2v8xx+O20R+3c/sQrmxnpd6KPZ3i4+NTKpWrypWyGpuoaveePSrYAMDmCkpw9QzFCtwiwEYoqx3T9licE+JrDIqYDsxzk0GAbGWLLbdVZGLR7x2O1SPYpDjqnBnScfC540b/6HQa6nabjsv0Y95OZ3usOohO97Yz1faVVUKW17yLjvhBvrYBeU98cMtthyErhAfxPQMhccZUvx0zyOBXGNbMDG1YnreNr3ypYtmMnM5HJ0/SE4gY/kU85OWN162M8JzSfIOL74dlSN/hl67bn4fppCsf01STDAO4o/0O8G9jGIOYzngOH6XjMs6DsTxgO0kMxKJ1n4LLXWUwy98yoEOHgav3LbgLHkAqQz+eff1JQirr1vVuYfh5XN+URx6J32So0VJBjPvQAYVJm4Law3wnyse76DTLqGHcLG40NL/e0loTuoUO3AasC+Ysd4w9487hzXdyfpdW6PjPicWf6yU6lXzt+n293dfyRku3l9Y0u7CqOysbWql3VLeO2jJ9da2HsT1WdJMMGmCq75TFtFrMebSumI167KjqgkyUc9oxVtHkaCkObafjhF5wQpOf96JT3oMfBUFJ6XYTzK/QqYzj4HG0Gtdl0zJsYWUtrvHe7REYbnv1Fr39R8BW2+DG36ZLuMiRE95cmUK8tH2/Gxup6sSxw/qtP/Pr+szHPqwxDnOGf9muKZovM8Fri9Ejk1Nnmn/8l3QDZsSGHxMLTOzRgUaw6qQ6lQmHzaviOEYy66p0FlSuL6nYtpVg3jmfn9TzGyX9cKWg12tVLRZ2q1HcYRlhvbPV1ajbWdIaE622Wg2tLN9x2+IZfsw0ABwtwvpCx3ZaB91yAHxkMEqjM5DtvGKGM/j1S9zdA98O9Bzic9mHqzFhgqRTcBurNFuq1DdUcd7RcMFdam/vJ+2fLpBzOv0YdiqYp3EWkqtQU5/4kI792T+l4r6drnbzNRCP7AkS8r0B2QqlD6jqpwIMOMRqUt+jZzBZkYyxBU6/XFL5/mOafMQ28dRUDFL23EYL5r2UJ/WT+EP/DM8NAIKmqFdsdXvijJqInxV7dLu2XPK2aaM8MaqJXTOa2rNbozsm49wQVrrGyjB/T/uNNjwEpxGPPwGkRdZxTgu7qtS07jS3pNx6zfRJux60b/LgVLcGCt8mX+8VKIfxzjZiTBXisPko89Skpj7zGe3+ypc1/aXPaeZLn9WeX/0l7f+VX9aBX/mC9v7qF7XjS1/UTvvt/OxHVT64Uy26a4jD9MXkGzqZ0SsBaLNgmclKmiiD8R+lIv/GM3KeXTCeefxR/e3/33+jf/L3/pbOvvKiOmtLKrv9lotFzc4vaL3d08U7a1pCBrdY5dFRxbxntJCJ80JeeuoJ/U//43+vV557Vp2G7dEBb8Rt4QmcJt+hbsR1eA+8EaUpr9Ba3jpm+tDmycioDh07EbQUW2QRL2VxkGZ9VSdfek6Xzp2yvj6ug7aNRirVSIND+Dk3bGpyIra9rLrwI3az1y7o2oVz6rv+WYMNDzV1Oy3cVuZSOXjeluGfExjmGBqgjyoGOvlz3Q3tA5OgiuWKRiZmVMuP6dJ6VicX+3p9Jafz6wVdWJYuLjR1bbmuq8sbuji/rIaRkskVY6JTIfQ66mOgT1secV4I9kJsXBoTPanRe/BOkHvod/7CXxzc34N78IEAdhByICluMITBAIAZLCwYxRNllhlrZYvuX3pgj45NVqODOfaahSuH+3mApEADKKa5Tl2txdvKrqyqRKcOXBCwMs9S3qV8V0u5to1Ol9/PrCRgND5n4zO0N0SFvwFTic3mQsmDER7YdVDjxRnfF7TaWrYBu+LvrWSQB6LxXylXVrkwoZ0T+7V/1zHtmtxvwTRqBQSmakUL7GNw06EbxosfGZ2n0gLeHe5j4CW2JUlhIx4LgWy+pIIFanFqp3I7D1hhPabS/uMqOe9sPZIrs0S3rAZKYZZZz0aC42J1S7YyYqXDxj1rAtt2Fq6NYlYLhY4WTCc1tqxx9lEUySMCB9zwBE1h6LX9t9avabVX13quqzWrhxvGdddKc8/lDGHiMGHgZG1UWOmIfdXDWcjYQBuzcTFmpaTK4YI2qKIjPIS3wzjt6OrPFv1dWd1CVaWde5WbnIkBEWbgRedDhEv3CbOIyi0Y3tNOgC2l5ucPUm1AQ6bF1oJ6y+dVaM2nDmFjjwEqa6QQmkMxiHBA+YnDVs7ZE5eBkC18vGeAfpwG2Gb7HpSCpOYB5jump+g4h2aCtySgfVnds8LcUr5zR+2FU+rYlftr9jUfglbIlGmKkH32Ys+OKTP1kAozH1I3NxqzakmK1H+Oq++nAqk1GK9RL/HPUzhYUeA8KoC6G3QGRGtJIQef2WfQrgbP4R9t8E3XFGTTYZj23YZj1r0bH2cRxDZTjrFgvjN7/aqe+ONvq2SaOnFwr8k3zfBheyYMzvz0Do3uO6hOl44dOiTNi2LmGfmlo7Ic58TkyhPqtjtqd2vB0nLF/Sru/IiyMyeUdRvITxxVztfcpN2UnZ/z48eUGz+o/OQh+x+0n++nDik7auPfcdcbDI675G4/mcnjys88qNyO+wffOs6pI/6euI/YHYq2RhoZP2cnjzrdYw53RIXJvcqUR1XfqNmYMR/MVdWtHlDlwMeUGzvhbwjnOCecxuQxFRxXwfEWxvA/odKOh1Te6bSdrhM1UivGYRrYjM4rWkZUgHHi/GJQFvM5vfzsd7V/97jbflkPfuRzOnDovghHJ26qd+rHLtox9Tus++TNrFs6imNrF98jJ/q21jg4lW0wYntI7k1IvI4zfhx/z7w9ZKvDx4G25knReWe+RDrEHvzafgyCsBIhyYaun6lf58fxRNbuAiIVx5NSSp0E7CEd25hFmlk1GVRnqyK/ZYBncbkWqzrJK2WhEyTyEDhKcXFNeULXStftMHxKYX0lCp4H3727qx0PpAFvBOeuE7hjHH5ca2ij0Up1YXzCP5PRxiBPGkzmC6hieqRkPYZtxeg0tL/LHPULjTg+kgnndLmDD0ADkfzdgj9OsTkl34CDhCuDr6RAGvAZuj3XWh2tN93Ss5Yf0CVh7RJF+tb36LB0aoyX83GAaW6gtyW+hQMGuINW3SZq9YZarvO0/SN+VCph0OH43jqz48kXWZ3VU63F7HTThmk3BhaYMIKuGNgkDWQc3UvpGtsOOR3OZWi0e64T60P1thbXG1quNX1vPcptHfpitU6XQXzf00VB/qJ9ONo4wHWQL8obMpRf6svysey2MVnKaWasGgeeFyP/QQ3Og7HgOGKVt79K7XeIj3vwnsBoA3PIOe5ihVr4pa5efjkkOlbxGem0xflaW0++flnLbIEL/fpr+F/opHQK0j59jw7/o2GQ+OCyBXhA1cMn31HXQRs9jVbLOrp/px44OKNPPXhIx3eNqNxaVbm9bHnKhK+8bQPLtLFd/hh5QUy0LMqHlE1xBy+gsM5m5NlBoMgV0++5G7etz5esl42o6bbSCJ5Z1XK3okv1kl5ey+u51byu9Ce0kZ+23VBR2+0IbEwWMvrk8b3aVbUNYx4DV9rY2Ij9+Z9+8nFYWKSffs37LfsPHTms3/jKb2pqasZ5cb6sB0DdlxbWdermsprOG/KIYZXIK0wmynQ3QL2kNkPusInhwXTEIoeQGSPNtnavLGv/7SuaaazEdipsH0znZso7X//8ASw/bQPl2jevWzeeqw8e1f3/6p9V+fBe247JP+mDqYQh2/0N8w3RMbbefPAQqzSoAdqXHWfLQbfYrAzQZIoF60/V2L6subQqNZtx/gdkzuoV9I/hSo3gvHwTZU3UGAPRhHc64fAHafaLyYx8YN2oWCqqVKnEFkd8z+QEzpcK+5XoUxJxHeKLa0rpLiE+dl7IlGNEvmVKVZUPHlB7asJtFLt5kL4DpSy4vLQn/0U50I98GeEMrNOnVZybM72zp4TxY97WHJ9Q+UOPqDY6Gq2Lb0I/cbniYOiuy86kEX/AgFDXMqq4c1rZPTuU3zut3PS4dVzzgop5x9i4/Xcqc3CPtG+XejvH1R6tqmH9kVWslCEmvzlPvqM0MdEpraRNWKMM8c44ZxZPq7amH37vu/qHf/Ov6+zLz8SEWFZ/Zq0D2RAwj8hoZs8BffgznzF/7qtUquj61cv6/mOPat3tOU95rBfljaulpSXNzs7qgQce0tSOGSeEfgKeEua2Q8Ig15SfdGd0+sIZhidffE7nTp0MOwaex/uWaXBiZpe+8Ktfijb11A9/GPmEg9CO0Fna6EFrq5qfn9f+g+aBv/lb2rn/sBrmwegIFetxizcu68xLz6qxsea897S6uqKjRw/pk5/8hMZcT7GiJGprAM7T25Xh7sHlifhSnKkVQBc8J50uvU154LlrHWrZ+uqrF25rvWv5GbybFgd+UytAv+MEtoM7Krr/4E4V3IYIA2zVPLoXGHMerKNH35Rd2JSO88rtNT372hWdunxb52eXdPrWik5fXdCVmwu6emNOl6/f0tVbt329qctXr2mv6XRiZMSV1kWjMzg97ErHj5bG1nJco5/DjAWblXzcg7cC/DHV5D24Bx8opAaJoAuhFjBkGfwNRoXNbKctcCbLFtYDNhKS66fcnpMAeSskMZhgUELnmUKaSbmxhWBp1pSpr4Vxn5aDOhiaT99C1QhpWglpWiCgrKGw0PGGMOUwyzBmfR/LqhGa6eNQXkg4ZyUfho6wr5RGrFghWJOwZ2ijYAUhn6nq8L77dWDvcU2OzNgwLSvbcbwd553OFodLTIGSDJk5PmCf9HBvD6SLG96/EWD6jscGV3Zsp7K7jiq784g0baV1ZEr9woiVn2pyHC5tJQK5SOdHj26SfFW5kR0q7zqo4p4jyuzcp/bYpNYKRS0Yt6tWQlg2zDL/REORoouQhEPPivKaBcK8I8Ut+tWq34TShTLjayjHgzLgyC40Chb6cXq6FZRMy7lpGW/pkCr2248DECOzzjMdVMZzi9mS5RHlJ3YqP26jqOhyBXYTjeASjoxVNLpN3zfC2/v+HIKLGgqG6T7aQ4xM4ZnqilJGPVmAyziMjhqQ/35Lb+KnMyDSJslQCIYOLys1GKsoPW4roQxR967PbN913N9Qd/W6jZGrynZrpsc0OEY5UKhj2bFNGg547pX2qzR5MJaqouhkQtF2fL8QFfjThK06fAMuY9DcdYaSacMm8O17Zj1nzT/i2W543kHwwne6EmbbNbYRcmzwbTifScRXK5jmM7euX9ULzz6jtbUVvfrqSV2/PasGM9wLZa2bvOvmEPnKuDqmD/ZaZzsgaBoeTj9UN2/6Nu/NTByWKjvpt1S3XlOnxpYk5n0j+5SbOK7ixAkVJu6zO64CAwxDN3VMxUn8jio/eUTFqTRIkpk44DzYSDMObJeoyXhffkK5sX3Kjx10PEcifJZBCsdRYHBk8j7lfM3apSvP9/l6zPGZls1z6y5HzcbZBh2jRSvfE86fv885f7mpBxzeboIBFscxdchuvwrTB5yv/cqO7DZfHDUeK3aWT27XGQaxjWP0dDexuCZRmNXO3Qe1b99+s9K8Du4/oImJiWiPedplKAyp5cIrwqgYusRE0hM/9uDgd7bGyg9WheRZ9VE0bRRcpzZGUqIOh9xwGXummR6rfqCfyKNlpuuO7TaQ0dksW5JhXjBvjY7h1Hn4RvfuIPF+8upSpAwb8IOenQ86m0P+MIsLo3NA+5Yt/UJey8bZszbOvvfiKc2u1SM/cW5L8MyEA1oN6YDXuFJO+4f553BpP3rCb13jz/7pyd9xJc70YTzjOwwHRHi/jrCDdGDjyRzMmRZZUUVZohS+kh75S2Ig/Pja75H34Jt3tG1oBXyklXppmCR1oxKGq5FknIA3vk/pb7l3C8P8AINivRG2+UF3ca4af+DF7wJFfhdpDtJNHVUJH9u/fytECWXSjANEi7CLkD9gxoizo6MlQXDBoA/O7KBjdbHR1vXVuq7gVhq6ttbUjXpHt1p93W5ldNtt7GajF35X11u6vNrU5RWHdbirdjftFmst1dpspWq85orWP5lPCK5TWjGLkUJEWeyc31SkhLmYfU7nSLelUTPL3dbbd45UNOk2V4I4LC+RtWa3g/q3C6QRF+4evH9IdbHlEtkF5aDn0h6Nc86PWa83XcfgfaudbPGhdwcplUFdDtywLtOKXzvXPXTMsAUrPHLWl6dGy9q7a0pl00LHcs8JR8cw7ZsBGjreGMgJmbkZp90gvwBphyylHUTrSe2/my+pXZ7UqwtZ/fGtnL57p6rvL07qsaUpfdfuO8vjenxpRC8sFXWrP6pGYSziIL6MaRU6p2PPYsO6gdPqWVYbZ00L1KU1y2jLkmbO7cR6oNxCKFe0T+eLfHccloHqhJu+CpZBJbeH2KqLQUqutJWUot3dQMIKTCfwYLTEtjt0DvsNs9zHLPyr9Q0Vuk0n43TRV/nGQKifZRjS4dvTpe8ptwVH068LM1O6709/WdWj+9R1/XFAcBzuPfgk7Lm4G+Dsp1h2Uoa2GISC4ljBEp37pjm2NYTeIbnMWFWjH3pAo8cPW59jgJ3BK9eav3OBKH44f8jPG/DjmEIWJz+3CodBlwIPeCG30rmhfijlVNkxrvG9tqtnJmLbsHRIuunYztzaUZjrG9ds+cQZJNvl6vZ0t/u/PaT80FJcaOexp4qVgv7yirpra6ZZp+N2QfkJGatdIjp4Ac++24x+8+ZdAzZBoVdUrmMd0LoEAwg5tgdjUm3e5WvUpYuXtfCDJzX7ve9p9vvf09z3v6v5x76j2vPPqLQyb7nYU8Nh2b4sqMno6TH5wNeoV2eQboKSM1t0GjRz+nHYjiwGYdwGX3r6Cf3Tv/+3dP3cydj2r+Q8xMRYhwsbw2Gfff5FXZubU6Y6rusLG7p6e8n8x1q9I+SMPzTPaj6rilneuZOv6A/+ye9rZXHBCaFQh5SOukjVA/3jk2Dr7k3gsDEhwbRIvabJr+gazp/t2T0HbDNURuh3t59jifqWGo2aVpaW1G42tWvXbh05djzpeoRxWTqOJ1+sqFQdsdxpgDJVfX/hwkVdu2abGnp2uok6khtub7rl8/MK0IllknUpJpIg36B7+o2KvYbKpr18fVntxWvauHNNddNYa21RzZU7qi/NqWFXW1jQ+p1FrS4uqraxFgNOHVYaGr3oXPD8aKvRXqld2n9yYUCE3z14JxjKxHtwDz5QCAYZ163fYWMNY88GYL7f1L6ZcU2Uy2YdyZwOpv5T54nk/o2ZSOWx2+Y9EJNmRjS0JOi6G+vK1NddHhRTGJnLynrJmEmaVnyEgEUa+uuYtWCrEWUc44XyR6P1DYKKUDHj1QIY5SdrMyNnI6JaGnF6qUOBQ2CRSmyDlctUNFreEed89K0MZLpWBsygrSL5jzjJk6Uc7BQJB3CNcqU8vVvYrhBtKkuUwaXnEFRmyLM1CeeXhNGAoOih8JWc74rr3/n3Z6xGaTmfHDveK44qN8lsjQPK79uv1sSE1q0kNoscpI6JhQD3NwheX/OOm22pOJy3aaVh3UK55nANf9Mwbjo5p8dMbwuLJDj8gb9DUDNLsu0ycJYHGOHsCOZ/0muXZjNSJoc37umEbbuOGi5bK1+WRqZUmtmnys4DUnHM5aJ8SfkFtvDBdXtrGPgP4I1PP98QOo3rJcpMG3fd42IAaKBwJbxQacbp4H67AvfewXEM6Zl2QMer6yq1SN7SOcfMJ+6dvrOFsZDPQknrUvO2mnfOq7c+a3pqORq3D3ptyRL04rqPZebZURUn7lNubK9p2fHYL+3PSX2/n/z/ywrUW6qhoaO9JUxyB16pSzt4CnjGkPR97JEcuCc0SmfqII1O9zdct/xdW5tXaCTF7ni6rei0Qf6IzgTfz83N6qmnf6h62/6VilaaHb1w9pKuLG5o14kP68jHP6fJA8dstJq3OE+mrmQkQS88mzaYxc8KMYxeQjDzlVnSsVSaQRDO+tCoedCYOhpTSyNq2Y8rZ3fYfHSTMc/DmVdyVgiL++kUgjdhLMXALJ3Dfj8816MTYSuOi/jsiJd0MjZuwpHeqPNYcd5LpuXYmMTZJG+dyDtbD9oEc/4clvxlxh3HmJqOr62yDb6SxAGeeQY8wLFddGiBd4Pz6CzSJAPPuJ7lU8+Zz+bKOnbsAY2NTmr3rn0aHZ2I+iXsoPIHkGgCb+42YRgmvTa+tzmHBtdDF2cjuMHDX3q2VIOmLIPIKysuOfcqzstyvSFX4fG93mBAPgY/XC7qlD+nRVsfDgr8KAjDkg5087fYh5rOj4E/8dHZzyxn117oAhjQDKQhp+pO/9zNVT1x8pq++8J5vXp5Vqv0b0Ue/ec4Igf8OE+W6JEO6cUMYPDAO5AeAd8MA0/KEYgdBBw+xzWFid/NCjD+grfjkYLAG+HjDA6yncdw4CI0OeOYZzrcuxk63HE5FTjrzfjge2omtvHwA7hgcgPxOYDviQOZSq3auQLSn8O5vEl2JACv23WRHwXDrzavb/os0iB+GvTgeRg3v5EW14ggvaNO0ts3wmYO/R69K28dcGKkrJEig7ht0xOzMU0JDIa4lHQW0KlA2elsBYe0MSZcrJvXzHdyul7r6Mpq066hq4Pr5RXfr3Hf1GX81xoRbs7ibMlteZ2BPQ5BR/+KeqEjjs5o6ivhGB0ssuq0KUngIErgJ8pHW6J2zcfGCzntGq1qulQwR2JQhIkjDh162KBTyHUHPxjGew/eL1AruE2qCqC+zGni6kpwbfRVb7IhDv7wvLfCkJ63t6F3Amp9i5mk74aQOKqdeQKyNGy4niVOMRsdeOh9pIWMZCUKNkELPswgOWkHjRGL4zWdENuw1ZHiMMlIBT3MbQM+gfy51R3XC7UxPbY6rkfnx/TonXF9Z2VKP6jt1On+Hi2V96qVHXf65iXYPOj0zl/H+l1MXhnYX444kmk125pfWfc3HEpLp5P1fxsY0HzX/K1jWRFbijks9kyb7PueiWox8INMpi34Hs7GXvspxF3C4FP4EzHFIAjZtSs6LxOtliq1dbdH13h09JJ2arOw6Z9l2E53b6FBFxDWy5Z89UJeez/1EU08zDaiyI8kM/giWFL6IgAbuWA6g4q2+3/QQN6Y1GirPEz/IZAn5AQr/2KgY8eERh++T9mdU6Y55Bt8khpMcbwJK/Ecbcn4om0wYQQtNuSQ6YFrpMFLaMWYYuurbsH0OVbR6K4pje3ZoeLUqG1syxe3CWRqrIA1raZBTEdi4nk7voDf2/lvhyHmqRvkAYMefc4hWl9XtmP69PekN5wUG3XpsKDpR8f84wGpHBNCjRUygD5EmUaMg5HVFXXPntWdx57Qyg+fU/3UKRVu3VD22iVtvPCMVr//Pa09/ax0ZzFWcQLYjDG4RL3Ytufsvh72A7YDk7GsN6b6hef6xmW6cu6Mvv7Pfl9XTr+kkZz5AYMvbAkJ3uzgNNDGtWvX9M1vPqZrN+9ofrWml89c0FqtHjwxVj85D/0O52tRJz398PFH9dJzT6nbrkdfB7WLfpImtLrWBvl4OxziFzpK2NuBmk1A3+i0O2q5LGM7dmrH7n3meawupazQGvik3nsql6vas++AJnfscp2ZwOzgM+hupZFxFTnD1YxqbHqHpnfu0sVLl3Xl6jW+JmubQH0ngA7I+ND9/AI4TrRPDUP3HbH1a6GzrsM7yvrSJ07oN3/5Yf36Z0/oi584rq98/oT+1C89oC9++iF9+fOP2H1EX/zMx/XFz35KM5OWWbRebDHTECvQTdb2STwi6W/YJkyGpq62IfcevAVgh/fgHvwMgNkEvDD4oRm3GzYCYu9UVROjKMRJiISgHXzxswJDwZ4AwZDymR4R6r7wY8bXb9WUxfUZAGlaOeWsD4vIPDMvumpaXHIAr/VuCxCXmaVujoquuZAoAyBF8DS80tmHwhPDIFaiKsWKhaHxFno2ofyt/9uOb3W95mdizIfwhoOGMRJ5tuD0Rwif5IZpEsePhu3lHhpRQ0ABIX2A7ITSbg+6sMg/wCwXDm3v0QllIwbxzfYkse+1UUEnJ4Y/s3x6I34/Ma6NfD4GHdpWPLoMaERMxoXDZzt0LJIyc/Q7xm/Phr4NFBs34DiKHuEHZXdZEfr4x/JY3tMZY6EfSoLTJhwdAm2Ha2FcGtdiqy67drasXnlMuakZVXbtU2nHHmWqE065ELPBh7W15d4JSCPhaeh+sWBQ4yg4tOnwScCqp83ZH4O6e3/Fh75s3NKRhALSN23RMU3nN2lD637fswEcCq1DcTBbyW0z255XbeGsOqtXrays+r2pNrJGjkwcVjboDG1nKsqM7o2Z+L0sncd+RwgXDzq8B3cBQxqI+ks8YotHDfFvX9cFvCGWZOPvhzhI2rTF4ahxYDJb2cU18bat65Z/OkzZV/yoOD9zILNbuPIFMw2WN5u/ZHIFHTp+n37jX/kd7T/xsD76hS9r30Mf1fFP/bKmTnxIa5UJdaf3KDu+0+3eZi72Ub/h7zkyPGNqcR5tkDKQQIdN1/lsOT0W8Ycia2bfK9DBwsBwyambtzDgYJ7YzprPmd+whzkdx3HQnV0b57xFR1KUm+240pZc4BA+mr5P38AnUZLZXq6Nyxadh+Sadm06o1Ce6fwxKjiLIm+FPe84017DFIr3RcfN4elcUbgpIc7tIVP1+3IKR3iXLQwau65xzMwlxI/Z9qApufZoNr22Hn7wQ5oxDnfu3KdRG04BvKTqNwEa2O6IPy4R1OgNEho6kosJAQ7EAbHZjo1HjG5HitHdszzuuoyxbNz1k3V95ym73zOjFsO01exYphrPTo+BjtSxR+cWR0cbN5beQ5y/HURehvd2Q3mJMc4ZGdQUNAA+WAWBfG71XN/5qjYKY7q8kdFjp27qG89d0pMnr+v2quk4Zzy7zhjciAOunR+cpZerD/qmI8N8K3CfEMH2K7EFi5kTsxrD0Sag+6B9OvKIg+7S9K3JJpxzmOLyXfBpu1SvYMVtJjra3FZ4xzNXl69tQzpWQtAD44hiYNBXZGNaU2nadLh8wXiFLsgf+SYfXP1M2mxTaWylvEXHpd+7naZ8Ovj7BHL9dpD80y9q2JZ+N0gUP9+SywDufRt0aJk29N4OEd6Ol2y5RufcaKWocbuScc1MwXAuP1EQocnEF3A4wKVdzJbPMdiYXMeyrdnJqG4Vc8M0u97oxBkf+LV6GMlur+YtMfHDuGcgCocBTTc1dRN0GAiF1v27zW1Beh907D+yU3Q7LuMcMDp+TZPQBTRDWelchvfFVhCUIxCAuwd3C4nuhngc1Fe8gVYGFeYLt9Buy/wtra6FjtLru4OUHimkPGwHckSCyO40AML2LRZ59nPbxT/kGRummQZj1RG0RyegY23YRmnU41vihopYXUGUDEGjo0G1HIQejcIFI33otgN9FZkYNaWl/KRW7WrFGa2UdsTzWrZqWcd2jJZzbhex6tgfw8ZKhaJ5kG0oeJDjIv9mrnHGB3ZT1nyZlfTIksCjBTxnSXE2GJ2FQdYU3zf80W7zUSa3D+Jz3mmu2DR3DxGRL1tlHrYp6r5ofIy166o01gN/rH7f1KmNpx+/tdlPF4Zn0QxhSMP4QR/oTRsu0+Txg9r5mU8oWy0FSggHnaXA6bIdQEFMihkE+aCBLIF5XFQHYhQ3gGGW0dd4Udq3S+P3H1Wjim5GazKvN91R37igzwEQ39AhOsPhbxdpDp6BhMeQrGpZb2D7Z3BYmZ7Q5N5dKk+OKcuAktMMPm0XcdNM3B6Gkze20xF+0Y7eAeAG/EWO/C16fA5nWu2sb8RWX+hZSb+nbKZtnMNHlZGBTdh+/+4AHaiTa6lTbBuX7LKBniKNu22Xr97Q7edf1J2lJVVPHNPOL/6ydvzGlzT161/SzKc/q0J5QjdfuaDWySuaXrVt2DLfcRaC3szDYpcKZ5LJnH14ge/ZcjDZJBFQayuLevTbX9fpl5/TmPFdApnmgwm9rlOCUV7XB9tp/+N/9E/03LMvaHl1TecvXTPvaQS/ZJAsBkEIB746LTVr6/rON7+uteVFl4l4rSMhd6MdQTNbGOO6nW4A6KFYtN5OZiKw403MKgZ3642myqPj2nfwSMqr/YNGHZ5BFqpmescOHT5yzLyN8vOeOLCPzY+qIypUx01rWe09eFg79+7V9Vu3dOHixYgbOoqJLMQXGNuWQSJ/Q93/PAH8qKVSvy7Ou4vJVtuQj8464nZ37MgBPXD/YR0/vk8HDu6KM0FKU7s1se+ADh7frwcf2K8P339Q9x86qFG2yON8LNNz2qUCe5e2nfAWZx1aJjHcHnW0HZf34C2wxcHuwT34gCAJNH4gPzdmGikCwU2We5oshnQ139feyaKqRQsUN3Rz1GDqP1sQuR244QVmhDBLjJui4t/ttNVrNWwUMiPORkC2ZSWjrU7BQiZvQ1XNEM7sJd62go+ygTFAV4gfrDSDm0Gcvg5FBTMbYvml/xjxZ6ZxJV+1MWrF0ME3w1mQdDodra2thZwLRYjocJHJBOHlPERnRwA+DvJmyfkOMFRgQ6AOITJAosMEyRNGDJ1GqaOEThM6ZmzOxKzXvhl5y/nt2tBgViiA0sZKjrof68ZHt1i27U9nmxk+2xDZwEchKdjFntsW4F3jO3V6WkmLGIa0Zpz6msS068tKAwMlsa+74+5ZUWHlSByW1jV+2S6HLrHofCyqmSmo7msjU1K3NK7ijn2q7jlkd1DZiWkrXGmLCro20kzooUD6UXgc4ucXBFzUzRo3/UCfAO1j+Caw4dvADDQZf647aGUY7K6Bj4Oi7Jw2AyAcdOlWFWCayDGTD2XC9W+1X/le3Qr5glpL51WbP6N8Z0HFbMP0STzE529NA8y6bvZLaufZ5uywMqO7TTts4ca2CSiplI2431cB7kHAW3EIdjEcYDPRce12nuvTYWjXr7mlrqjYX7Tyufjur710LfQWlG/PqdxbUqGzrGx7xXRRMwW1NDpa1a/+xm/o3/v3/5/6N/7P/64++Wt/Wn/2//Bv6f7PfEFf/f7T+s//yl/Xt773pBqNtjPZNC/asFtznHbtZZW77HXOgNqy871uEWieb9KMTh7TaTcLD6IFYGzAoegsNi+yUZKcSTjaSTIaOvhZNtKAiIE85mSDyTIm8dv0PjpJ/BTcbvA93G/4DuU57u0X8pkvLXfYrrFovBbppA1LjRjJF99zbxj4xUpEOmLNF0O2b8oMt2m3H2YuxUHh1tqHA0+3bl/T/J2brks6tHs6fN8DGt+xVzM796tqwykqmVyjA2wC8cJLhtftMCjlgH8MQ8TqoK7zhIVGx1mvZaSvK9O+4/qddf3Muf0v+LrkMi+p6Doq9F3v3RX7cVBn4gEDzDtO84zg7vZz3o3lQdqR7BsgqsEwNBjZlgLAwEydgc6lcR4DwJafnOHCqp5OvqL5ZkHPXlnSH71wUY++flNnlyzDM6Ou91HV2w5v+Z8tMGufROy4GsfkhWrEoCZeSATDmNmLseoNuWaHpB/y3M3q8jWyPHzmiXv8w6W0UidF+pZ3TCAgTQx5tuYkfspI50iQFHj3u63tjyx9s0mmQnPFYta4geKJz3EwaSQ6TO2MEfAOnnGpdZhaXSc5yhj0YfyCx0gswY/rnHm3ELhxvNQXZaLAKRX7DZKD1W9n9+hCdIQMPSOKuHsjhL/zD1WMVUqaHi2rknOZOqY5OmsoG3E4/diOinyA9aAnO7+mUybpgpjDOQdFD/MVnRn6ssv6mWkyoSuSadoWUQ+wGatqNnPE3dCBdyC9HeQ47sgHdUqY0FedDjoVg6WxUjbebcVE69n6PsVxD+4WtuMw0ePWk50RHk3VQJujPbKdCnVAnW8S7l1Dijx+3yYqmmG4lFrQRw87yLKEgbs4utXyopcrxz3x0J57a8vqtzaCdiD7gdgJiO3hmNQy4CVJz3KYeDY1mobLrBwslK3DsyKx6LiRbdb9WJVo3muTwoB8op2kQXp0fF5wEDtbXbKtiGyPIZnb9Q2tzt9WsdVRpd21XLANkK2oYX0yJhMwANJE7joJf0bnLuVlIJtBE5pA8Fu3i+CV4e4W+BZsDDGSgHomy0XjYaRdU7GxZj/zYLf/ZFVFS3V5wRbuZxdCLpnPct3Oz+F7TVb8j1W1+8tfUOnwPhc62bzoJnQGUkZKuwlvKOpPt9ykDo1ELvh5U3aC+/KPfyGn8YdPKHdob9rai/Zr7zc7YBjVm6KLAMP2H/e+hBvIBPRNtt1mAg4TA3Mj5TgkfdKu4Pu0vZplDs4fsq3osC6om+F1ex29HQy+iN+Up0G7NR9orK6qX6vHAAj0m8KlNs012kwUYvD9ewbjzd+3LU9b1q2bTAxxJSCfSus1dc5cVn9+RaPHT2jyi7+izOc+o9onP6HGpz6l8ud/RTMf/7x50ojaZ2+oOreikvGFbRrbkrlO0jkuICdpJqxaZYAz6Sq9OCz89Csv69knvq/2um0Sfxv2YR69B7xSRvsZx3Rq942T+WuXderlF3Tj+nXVzFdidv9gQAEsgCe6uNnhotdu6PVXXtKZU6+p07K+YH9WniXcOVvUtR+hqbew+0BpRoViTM1KtDJ05N58rd5oqDIyroNHjkb/UbTNCOIvzGvRhXbu2qX7H3jQ/tYh0Eni6yhVbH9VGh2LVXFjk9Man5xSu9XU+QvndfPWTeeJHBM6uV8EAH2UJuzRfiOuCfA1jlwnMYnNsqFpv+WadObiip558bIee+q0vvvkaX376TP67jPndPLivBoMurkaUWNDlyUBXznvqdB1OoFz67kmjOi/8t8vBib/ZAEZfQ/uwQcKW8zOymcYwekp2KAbNnK0121pZqyi6SrKqQ1OWjOCBaOOSH5GYVMRCAHiSwhJymUFw4ZHr51mHlDQrhX9jjW2pjXmdQvllUxLdRv6CJW8FfW8BSQzDCxhwmAIrIWQHETvZMAFAxPhHDMOTaXgv1K+ZB7JV4ZQYlCDm1pvrNi/5bhgpEQ2+N7pDiE6NoaI3kR4qp8fB0McDBWktwKKAR1HYZaEg3lj+OTp/Ou31LARwswUFyIGv4ZKFgMhhGZuNntV79q5T0f2H9O+mYMaLYyLfT77LXBhvLkAcfgdBpMfmRHOwBOHYXOlUyEUMQsSzH9ma6OAxCAJs2J9xzYoCJe8hZWYkd23MeU06JzqFceVmdyl3L7Dyh84qsLeg8pN7VKmMmGjoxSrPhD6bKGVljBHbQUGfhyA++3u5xnIf+pYgT5Tx8xQkRviI37tEduFoATaQSepY+VdEN2PgGFnb6ijRE9i8eP8ELWVOvZizXVrVijWnYc1dRcvqT57SsX2vIr9jehUpwMuSJqZs6aFlg3nZnZc2bHjKk4fdT2nbURihQnZhlKTRn8P3iOEHMBFzRnlri+u/IBRHB0e8ClWD8DZMv1m8I9cxipl/ZaaV59Q99I31L34dV/t3vHqMITbdF9X79IfKX/1j5S5/IeqvfZP1L7yXdWv/kDXX/22Tj37LT18bI/+tX/1t/WhDz9iw+C4Sm7zbvi6dWtZX/vaozp3+pwmK3n1Nua1eutVrVx+UmsX/1j1899S5+I31bn0h2pe/CP15l5QsXHHfIv1IgzaFm0UsuKRQYhhWf3HYEEMGGAMJhf7vuJM3+ZSDsXwIh2P8NTUIc/3bnCp/dG2AolbeOUavae0NeQBd45zuK/sZkUMIL5yPF3zx45dN9exIs/Aht/BP2349cwqezHAgRuUIZLm65D64eAG5OE7f/wdffu739R6bd2BsipM7VRlco+qk7uVK5b9BbLIeRvmk482YUtmJXohDKsrG/7GMsSejHdsdojQgHs2RrJ1X+fVvvm8Vs5+U43L31L3+td9/edqXPsX2rjienf9r139plavf0+tlVdVKSyZtlZd/LrroxPlSwNGbB1kfp8pO3U68Qa0ug2C3WwDygTQQc4WWMj5ruUM/eptZvD7edXu9ds1ff2Fi/rGsxf04uVFLbRLqtkYr8F/6OArVuLsKyRpP2PacSWwZWbBLg7j7JomohfDaXWMc8e95dC/7Bw2tm7Ajz3vTYfcO5YUxneuUNMl/NKOOOObrXA5VhX4rm30I+vYOi2tKDCtuJ2G/gJd9pPc33Jd02uSxXResU1J5MDppC0wU3c98pd79JS8iY2w0QHAN9wbdxiEDDBhgA/1rqHe8JMBxxPJdNMAyDDeYfR+l/az9k08u0W6PLF11RD8altzGoDDEQa5Z73HbEPTo0WNlwsqmubZho8BtkjHNMGBpAxsQMqBN8JA91FWSzm347TCxzmhTaL7bftLk1uSfCVKXMhInO+B1JbgKCluHLHgouOK98Gg0PVog9xTcv4G6dgNIooLochWtFhfST+5eLgH7xEST+Enbt4WeJO2YBvUkXHdbNDd6fthvd0lBD+HFlyHiXK26nFIT9BrUJFfde3o7GraBsINO4EYAOkUqpY5TD+Br3TUXp1Xt77kDxrxjPY8nFAShE8adES6CNk8fKVh/a3pcH7nZPPMaie0E+6YxKB23mFNQq+kw3BF3zaShIwxD3d+mtYFkQ/4BljGMUEh39vQnmxT97td7ivkNJL3N6Up1bIjyhRHVSmVzW/bDo69YH6GHWe8FAsllUqjvkcuRCnUZVIXnVjvByxzU/s1dk0IrGxMDl7YUbG7YVcL2yb4O3WB/AQ9tFmQ9DMK8Ow3D34MeTnnUyy5TnZ/4sMafeRBDk2iQEETrNIEw5QMR/vAbXIYfuLmpwfR4sgDGdze/Ib58jW2wgoZZl47PaFdD96vzMgoQ34RfogLXOKyW8/ht83ZY+vdIBxA26CTnq2PnKB1pJ5ld9ft0XislDS6YyoGQUoTo+q4LTUtU9LZF1sQaW2rp+0rQt4eXJeUj/C+MoiAazIAslFTiaZGmQeJJNqmzQ/QNMTVewZK7nZn/YzTO9GO83lrFfSrrNe0cPG6KuUp7f3IZ9XdeUi1wqjW3WZWrdOsj0+rf/wBTd73gBorq1qfvx3ytZunT8rlt15j9qOSdaICIrqNHeIyGFdM3mAtdXN1RS8/85RuX72sknHZ6bTUcllb1p2iB4Q2GlVLLsGPtUi37wuvv6SF2Zsq5GwPWOajT6WtUBOemRRS8HclP7IK5InHHlVtbTUGP6ChOBsWPkMDGACoHbaLIZA2OmjQhh94FZP27KjfhuXFyOi4Dh0+HJhkQCVNwCA45exr58xOHT5sG9h0y3vUGfQk8lCpVFX19wx4835sdExT0zt0+tRpXTh/fhvdRMp2gYW4H+oYP29AjsFPTFCzjGN1PZNmY4qL6zDkj+u1kSvrTjujZ0/P6rs/fF3PPPea5mdvaX15QZcuntcTL53St589q1euLGvFhkyv6O9sVLFdPKsQGfxgxV/RMqvQa9mxkqrhVOp+z9DKtsq/B2+BIeXdg3vwgUISaya/MMLxMbMeCDsEP8sD9+2Y0FipZEZPMJoyAudnvUG7BBQiLv4ZCJIQJlZ8GVHHdKfczB5gS6aWH9csVNesvbYRHmaOdCy02igsKBY2/q3cMfMQVCEP6HCKFCKd5PiSl3yDZVCyUk4eSJ4Asc1Fru14V22ArNvTwhql2LHGN8EOhrElF94BUUnvCobKENc3QoqTP5fGLt0lZ1w01tVrrqhgQ8NYce6sHoSx73xYcFqehkOARIeLlY5KflQ7x/bo6K5jOrzjsHb7Pte1oOmgKDCzzHiOfIQKNHBWOFBS8AvkmO4chHBBY4N8xWFp3YwVG993rcr0i87PqMqVGY1O7tPozAFVdh1SbtdB9af3qFmesKJoJcsCiv1As6G40DmW4k3l/5cPEuVQdmiC7i23eZ4D57xN9Z9C0QmYtqSifngeKu13B8SbDM/UgQoB2ZFu8B46m91yrMgW8y2HXlZ/+aJa86eVr91Utb/m1tp0Htp2dLiTbyuu/o7VH73SLhVnHpDG9qdBOdqulWziphPoHrw/iAHyYEKJPqAEXGqnvnM9ZrD6OejTPCMD7+iuq7V6VZ1bz0s3H1fmR7kbXL/v6xtd9sZj0vXvKjPr+8Xn1L39rNZuPKfrp3+obn1eDz9yn/mr6bbbkjrILrbPKKlarGrHxKQO79mrkpXVcjmvYtUGV7YmrV9Ve+6kOrMvqHfjSbvvq794SvkWKwxQif1nwyv2EKZIjjRc0C0dKlhYDGrwMhlavjMkGo92ZVwl/ubvBu0GmoT7hXkV7xPfSz5+a7kSfNHxJYXZlMtKRMuLlAvipQ1ZUPkeZonxx+rFrvHdiZWMzhfiA4Pa/zanLaNcR85aDI5ETImvpj97Wpaz6u/WtctauH3dfgxMOE3Lu+qk29XopJuRjaZoc0TgWAbWMb/kK/GOgUdcyXN6C4SRGt/aRe+r64u6qN9Sd/ZV1a/+UK3rT6g/+4Qyt1z3Nx+Vbn8vXN/P3Vs/UGP2GTWWXvfni5YJq84zfCINLqXDuTFsyvapxD2y952AMz/CaLTRwhXXpkPMz7H1UL5g0yWnq8ttPf7aDX3t2Qt65sK85hquoeKky8O5MZZ9WQwhJlBwcGnOcidjg8rGfa5iV3adOD95Oz938lXfc7X/wLXtkFVD13C8dZzz31BJjaxdZuDM52qWfRu9Urian+uEsWs6XMsurgWnUR5Ru1RVx7pHq1h0nJlYKdlz+rHSI8rv+sdIt06HoZw6aDPKF1w2v2dlHUv42f4tzqFxvvp2PfNczmDhbJ24xzkcKz+hzZxxMcQvMmO73MDvJwV0WFBfRLmVwhZsTyk6mTDwaY8Dv7cCb4Ka/G8pYmPWbEPTYyVNjhRjxmgMjviPzoakq6XYksRJ7Tj5EE/ijunP7Tjc1lMMHPuKnh0xpQ/fAJu8x+GojVjNwf1bCjxo1a7TGLR13cWALLTsa9S1c0gS0Zc8GLyCR5HPJJPfEuk9eLcA6rbRQ7rnmi6J7oZ/4REDINTA5jfvA2LALehkSH8Jko8px/lhexiurGqDmuottmRDPkAjDIKwBZb5lvkHW8qywqNfX1Fn7pJ1sZtuDxv2S9svBmeNhucU3K6imG6L/om2T25WGm4jthfgDjnOwTK9F/PZ4NCZZl09p88AYqzsJkbo1vyDw35zpYL1e86/gsNDoaTVcDuUfvvTD+v//ttf0V/4135b/9vf/l/rl7/y2/rSb/15/dbv/Ov68q/+mvbsmPQHrchryAdnLmdeXSqP+Qb+5UbtdJnExZkU7xcC56Rh3Ea7CmdOaDwVLaNGi8wOdjq2YYxmh3ZpAnX+aEgfP4MwlItDF+A8w/tia+LJqqY+93HlxpCFfmceSzVFWJcLnAy+imIOXXgOX/y0IDIyAPJC/sn+MF+RR//gTM/oSKP79qq6Z3dsbcO0lq3A2+BtvADYwdDFM45+BDtYL9oTeAt7nfbkAG3aX8HtZXJMY7tmVOGA9ErR6TOYaAnib4E31M+7Aced9D/6N/jW6bvszY0N9Wp168DoovZzJkJVi/zR5kmPnKd03yukHBqX2O/WI0L7dFpsSc6EjNWVJcltv7zrgGqZqr2z1jwKDpW3/pLX+sSEcsZ/12E3VheMy471L3+PIHO+uBSctYLtftoiEy7pu2Bwp5TP6ebF8zr10vNOs6V89GM5R+hK6GGOP+cwedMwO4SgF3FfsB6wOntNizevWiVgQk+a5ELvRbKhHQ92R4+JJawyyeiVF5/TwvxtZwn+5wyRRfMb6hSIi5NOubYb3FOHaQCEAG8E9NRmsxlbZO3evVsT4+Ohr4FT+Ehqc8aBaTNbMB93HNQx74Mvm17KZdtF1WoM5Gysrmuv4zl6+JDOnTmtq5cvO7S/sWxIk6HtuG4+k1bE9nMISQ9KK+wZALEui31gWrRkCrlX87tXLs7q2ZPnVWv19JGHj+vLn/uQvvzZh/QbX/yIHvnYh7XU7On7L5zS2etLWmfRur9F12U17xA7yEYmErHSpGD9cWsL5LtrM/+yQO6h3/kLf3Fwfw/uwQcCoRyHRgaj9F8o0bgB67QCWcq29JkT+3V0ZjyWEIYAR2jzdQjdnx5TJA8p/e0uAXlDreaf+yiX7xFsnUbNCv2iihZovGOvWpa2rluCLiGIXc62BXHs32dhmrEbHx1TsVS08mfDFcHmNIbLQUFDzAS0gmszWYd2HlM1P+V3GBZtLTcWtFhbsKJv44G+IvLib8nVeHVSo6VRZbp55YnDb8F+dFZRBvulcoWvv4ORDsrK5R2AcsWMVieY6snxDQUl4Ggi39R00ADp2DAwLTQX59RZmVOxXLAhUlKn7e/szwyLgsPl2ObDGeVgWqfguIJ6EAcxQ3S8MqqRclUrKyvROcQWVuHAl/OQBachWMmD1aC4T8ZPqFl+tsYQ70I5NG6KHWO2XXDFWDns5lQpjGtmco+mpw+oOLpTsnFD51LL+GLxKbPI6JzqMwPWeYu9lp0eHT2Jbt4JyJR/E3IM8bP5RXr6+QVoNrYFaK2pu3pJuebteA4eMKgfSoui0CxNqzB5UPnSlPHHzDnXy5B+3iPwLaZwigMc2wiGCOMl+54WzF+skLQ2VMytq7dxVRtXX1Bv7YpGMuvKtdeVRcN1+wsrkrZimmmzCqiwQ6WZ+1Xa/ZB65R0xo4eWmGMKvFOMAUdnO+r0HrxnSK074Y7fId+NjmLjNGSI6zSTxSxI2z4xr7NXX9Ta3FkVG9dU7i/H6p282BqLVRbbrtl3vhIP2zBmYJwMpOarunZnXZfv1PS53/zXNLrjgKmIOejQA3nI2FDY0BM/eEzXrl3Wb37lT+nEA/eZjxVVGptUaXJGxZEpZfPm7y06c2qmlHrwXmZodvtNsxiXsrzLtH9ImdJExB/8ysyoZ3nI6o806x4DCT7OIITpG4PIvKnUMwdauaz+2g2HYWCiqszEfcqMHrShNer4zFf9i2HJ4G7CLnQdnMrOAA0Hspld31CmsazO/GUVe5ZdvbIN4f0qTXPWTdWO9sTAkz9wOdjrvBAdvuSN+Jz3cAC55S75hY/x262v6OWnvqtbl06quXxTuda6JiYnlS+OmOmPOTsMLvhL5yedK0F7ok2nVkwJolM2HPkh7oFMAX9+jv3XLVUz/brUsQHbnlXn1muqXX81BkJGs+umkw0VOnUVoY2YAZy2/bL4CJxIIypVdymTp14qTop6SCkldDldcEoeA59k6I2Q8IAaQ4mcO8szAPphRiLbs9xc6+nla8t68tRNvXh+VrfXbUrnjQu/61j40WGA0Z5BptOxZ/qsjoxovdbSzYWaLtzZ0Ll5O9Pp2dtrOj27plO3VvX6rZVwJ28s63W7V28u6TVfT95Y0kkbVidvLG5d33C/pFcHYV69uRDPJ/nW7uRNv4/rwM/hiZP4T91c1Zlba7owW9O1pabmN7pasR2/2uxro9VX3WTTtDzm7C5aHfv/syFmw5XK7MiGZXzD8j1OVzFNtVwRrAjtFtz24dc2ADtZO1+7OMtbkEpnQJIng3rB+Wfz/k1u+MuFOuFpWKeJd/tmANAtlFRrdbVcqzv9pDfEQcrxxnWbko4JK2zRM1bOa6JibQUDNd4Ygnc54og7tWNoN2g5vGiTJn/0KDt4Xdv0RQdy6lAmEHTg1P1dxBsZTW2MP+KHJln9QZtgP+7YDivaR3QBxTfc8U0gKb5MkGKKNw5hnDpsCpHc8DeVw7ERl/NTtKysVooaqbClxiAO8uK6hG/FtlvEh2MWO4rWIK6t6z14VxDo4ifRDXdQISimzpIH9QZFQyWmI9Pka5dndc18hoHJiOKuwXTnCBhoJ/1ELdQ4F+fDaVO70BZ5IieRJYefGBvT5GiFlu/XaOBdVbobKnfWVOrWzdsaZgQN20z1WBWVdTvIsKJ98H3sL+92T/sjLQZX16yvX19p6dZS2zyhpNGxUb81D2k6nrZ5ufkuUo/tGdmqkVZLvtEI6bKkQzTO6jK6StWqun4sdLqqOi+5tTuaWpvT/TvHdPzgfpUPPaz6vkc0feCYTuyb0UePH9R9h/aoaLqP1fNd84jFDb16BZ67oWX6MM3D6axngg9liK3x7hoStilf6otNK+NYETfZ3tCx/or2tmsqrLZUMEPN5YyTPrguJvYSVRU19TMJwTMGDsD2peO1XSxq5tMf0cwvf1r5cctF87e0wt60hr7GN4kso4xBL36ipDzj4uXPANAmUkY3L/HLjgch56FOJkxazhR9WZmfV6/RiFn/UE60p0Ghhtc3OGKE//ua5AB8gudtYLyG7AqcOVy0Ldpuwl2hbPu3wuQFN4229WzL5SAb4iKTEQUe7wIcjFWcbsnxDX0MLetAi46ncuCA7ajdatA+HDcxYnaFbgdEebjwrbUxVpCdPq3i3JzpnhVtzp/lcHN8QuUPPaLaKPouOCYdKIB+BAY2jFXzQDqLrbFrpLmq1ZdfVL+UV/WTn1K9XA69lMkCLSeUK7CatmN98Ya6167GYfG5I/tVR8+FmyDT4HVGBX0NTNRlRTQTW61uhzx8/rFH9fg3/yjyycqwtnnKnsP3KT8yqdXVtfDLMvEBHgRPQE67rZppqdnq6M78guobG2DN4Zwn4ysTAxxu184feqGNVDXqdd334Ud06PDRsDPoIOcc2Khhoy/xYBzYSvikBuGvVy+c0XM/fMJ2BXqy6xmean6SK1Z0/OGP6OGPflzN2qrOv5oGWdA6iIFzM5kQMrFjRvc/8glVJndGWwz5Hu+NA+Pj0qnXYpuuqvH8xS/8kjqtup599jk9fP/9+uSnPh2TdaOq41v+BjmMrMbd+wBHEnGkeFLewAnPyMvUKgbSKp7RKZcbLb164bbWu+iXTGwMSyTeA+g7JWuoB3dUdP/BnSqY54fcNaQSuPx+z0AEA/txTiLlc3bYUq6bL2huvakXXj2r1bUNffqR4/rlR47owf3j2jNR1u6ZCe3ZPWVc9XX72pU4W+3ArmlV8qa8SCvVa8Tluu4hEyMd59d8Ps6ndah78PYAD7o3AHIPPnAYsqFNZ45AY4YN4ZPLdDRm4fHJ47t1cKLkZ2bcwfCtKGPo/szAW0pihhTiJpgcSxFD0PuPAQGU+c7qSijVKMJtM7RGPqcVh1k0Q6sHA2NlQ15j1SkzwH3at+uA2lbeV9ZWQ5qEAgADR6g7wTB9HF3eTO/gzqOq5iftjyjtaK25ojvrd9TpN21IM4OGGcTOmKX1eGXczmF7eQs7C0k4KYqPY0SAReS+JzXuAK4/qjM3yaqtAZDtEDVLgHC+Jx60hnApzmx9VeuzF8X2Z5WRSqSXtwBnGw7UDZQwDost2s+5VoaZTSaLQtaCBRw4rnKxpDuLc2q0G7Fcmv0QiScZ6EMK85V0wZ0FBx2IDH4gutizl4E2Bs/HCuPaN+k6mNivnZN7NT29WxOjMxqzK5bGnR+6yZJwTAIo4S51zLpYRAiTtd9AV9wGqcybEI8gB4gcp1vDG5+GYd4MWyHeDqj2CLEZbBjr0L0T/KhwW3kZdugk/A5DJ9pJCrLbLjTbXldv9ZKyjVkrB0nhC+U9eo5Mo67bdmFKhckDypV3uCo4DN+0FNEO00uxD4X7JoUOCrmZB4I7fszeoDfzlTgXgfYTCpxpi44ZK6CFnA3u1ctav/mK+qtXVOmlff+tWqRvSYVqdUXSMd3OjCs/dZ8q+x9Rr7xLzX4hGbgdZuFR36mdhuE2zFH8JFxsgd+ZNrf+8BqE2ewcopxct7sECcdv54bgO//Dlwa3AxjeDUMnl3JgN2yjmzDwDyB/w/v0PX/J0NgOb3x677DVaOBMpAudRQldGVnzzuBpriNkBit1sq6zztqs1m6fV7mz4BpuEDriSL9bkHKX4k2w/eoU6WTtl9XqlHVtwUr8Ylc77/uk7v/4r7m9s2d5Wk5vVm5UIaOaevnl5/TMM0/q05/+lD728U86JviLlfv8uDLVGeXG0hZ53a4NoSZnSmCS5dQ2j+7S81K2Ij1xSJmi+Yvjh7+Tz7TtFXm2UdOzI4t+hu+wIgneVowBkIvqr98wHlo2wqrKjB9XZswyJDvivJBStCaTGL9AYDMcESZ/UmUApCk1ltWdu6xit+7madlU2avi9GG3UwZACEdnfPoOw4zZa9A+ecZvmP/0ky5xG1PFujbol6TabY3n6qr2G9rN1gt7Xf7CqPlqxdVghd50FZLJH8b3vuFKS8SxpSGTJmIwBsORZuMQyZBr+b1poGf5Wb+p3tJ5rV9/Jba4yzbT9nYcwc2gQvAizPNo8s57dJjRsQ6fr6pfmFbR8iAGTv0G6iRfiTbJk/+iDTiCgd8Qoklz9Ueww+B5ToNZfZliUQ3LslNX5vTEqZt67tKirizUY/VFpjwCdUenGQM5bG8WMwldSNtBlpV9rW00de32si7dXtWZ2+s6O7eu8wyCcI17BkaSuzh0jv/iYl2XfL20WLPzdammy8tNXxvx7vKS/ZYbfq7rit3l5eR3xWEuO8wwXLgFPzuuy3P+5k5Dl+80dXWhqStO66bDz621dXu5ZreuuaV1zft629fbi2uaW1jV7MKKbiws6+KNOV29taiL12d1AXdzXmdvLOic/c7ftP+tZV2ZW9UNfze7Wtf8Rkd3Gj0bqx21jIuOXaw0KZgf24lZiaYhHAZhbM0V96YcZD8U5Pskv6CZRLGJx+AXteZKc7tAR3DYWquj5Y2GOFuAuqEjJ3ifw8PvAQx/ziQaK+c0USm6PSZajagcbkgdySXa3gLnyh7RQWo9qmD6iMEPyhakhSw1BfobOo4TUIbUdilTek5XiC78eO940iAI1OorTIV7X9KXbk90rNAJB3dDibEb6psJ0jfpzlfHETTtb+nwGa3kVS27HdGm+NbvwOnwqzSZhkYGFt6IiXvw7iFhK/2mGgWb1DM+Q93Bv9S36with0OPX7s8pxvrbi/mfMGH7hL4knRxCahjfE0P0JxvE59LflxYRYvsmxwb0cx4WUhRqBPRV800VWILj3AtcVZIt2U9fmNV9fV1dWw3FUrlWKnRs82SVo9ktN7u67Z5wfXVTgy0brR7qlQrMXlsYqyqYt46ZcP6HfKW/CFTTLBsL9cxX40e5aBFBghsMzh/t+dWdHt2UfXbN1WcvaT+9bPKLt2wXmg5aF31andMp3rTQnpUug3NFHua6tfUW7illWvXNHv1uk5fuqUXry3pep0VeqxiQ18hDbctkhzg6q4gvnebjHZnmWvjKA2E9DTZXtP92Zr29Y2/hQ1lzK+yBeuitp1ydMJZP41KizL/bAL1k2aaO6+RTV8LeTWqJR38rT+tseOH/Wy+63I0TdnYXUGL4CXkv4FP7RIkbKe7nyK8KRPDGhh601fAb2yLFLzTb6jb6ohW7syru7JiPQ89AAll4Gf4sYHbFIOdEcLn0Q55aYiVweB14ADoOcmb9Ix/6scgDvtZ0SjYri663fVbXatY2DUJycM4SCB4vD/CZ+j9RkBmJbnlCCyTzY8sn5ecp7GDB1TZt0+NPGfrkH6KJ0U0fOAxyZr3OgACbZQsP/POe+AVtS5rDb62qs7lc6zxV+H++9WplN1GeEcXAOt67TY2VLtwQR3jf+rIAfUP7FbDOgbSNzLmDLF1WAwS+dEmoHUD+K3lZ6uuF3/wmF5icIEwDjs5vVsf//yvxiSPmzduhM6MXhf6nDNNmKJxQPte21hXrY7u3bEqMMBvVIz1P9s/pXKaHBuDIK6fsR0z+tAjH9HIyLi/ycTZREn+J3rZHFDyUzxz223p+qULeu7Jx63zp7OVGCDmewadTzz8iD78qU+r127qxoUzOn/2bNjBkQ8wb75WrIzp6EOPaP/RB5yXwLzjgCLAeVuzly/q9MlX1Gs19Wf/zFfirJJnn35K09PT+vjHPqGdu3dHuclVipccbmaWh/cB5JEIUiRJEiZbMlIxftJdomme3+8ACJgF66zIiPN+TVX07ZEVmhQsuG+5dMl67emL17Vvxw59/pEj2l3J2m61HLQRAh5KJorJkarm5xYsj27o/iN7tHOsEnVB9m0KRj9i2zKNrbbSusc0AAK3Jw9vwOM92ISQMYP7e3APPjBgBD4PQ3cLR2Bg3JlN+o0JcjBKvmtqUlPVskrsZ2cFk31Vo/PRjOgdpOsHBkPGmQDmAtODqQ6EqxsWXC58ET7ONywwbyVGFtBrVuJXrVCsWPgvmBOutF2uzIiqhRntGTuiE7se0X12R2Ye0nR1rxUOM7WemRvczlGzfJPYEYBxSKjxyOFkMFVmH7DtB8r2SGVShX7JjJqZsOQQY9mM1W51fdl59LMVY76hFw/2TlybZcIf3ygqzBXVwALKkQ0Vn7gPXzuXO2+DPSkpjgs8IJg3wfdwHAIPk/Ezy0k5IDc7wbYdXd25flrNuXMq91aU76xjr6jubxp9G0V5Kzs5zgkxnil330y+Y+WsU1W2XTKt5FX2ByUnwv6IbGEVKz+cUMojznf+DvYHJinjllFCp1cqKbOqxipT2rPzuA7ueVAHZ+7X7ukjNu6nHMoCxyiiXkNwO166+4b78FI2UBSy0nEHLgIiF8nRGYGm9RYgbBKkKCxRJQFDf1yqy63nFP4N8YdL3yMEw0Vc+JPudrcVHggcvTlMtNNhmEGarrc4j8BPSZwg+MEBnShpSSY7nTLYQQtRvmI8lxNp+Qu+5BeFDoQxc67frDnqVvhtzVold8QQH/qda4itT2KFSDKEUicxjkImurRv1C20DynCZ2IPdRRMK52xaqC/rt7yZdVuvhwdpJX+slWIDSfvPDAgNuj8AnnWWf2FyzBxSKVdD1sT3692hg5S07CVIWUbDopCTl451YFZ9y4DdRDlcTmteKeZ86mDKfZwplMbF/jza4fBkXNWEbHqZOjIj78w/7Ti7EJyMHM2a8XVcWaiw5eBHtq5+avpzs3AvGGAA5QxkG9cs7VedIqhONE5yBfQpHMQOQna3EYHQRPDOk/1AD7DwecIG3H7vf94+34gBhMTNuI5xcgvz6aG2EKJPJvnwQd9VWtVjaVLyrXmXa9WEslzEEcqZxgtXCl3vCNS/7zBka7xBsZcVfWNvC5dXtdCY0Kf+JU/53qh44i4Ur6ICxqtVEc1MTWludsLOn/mlLo20sAJNAP++tBqZbeK+z6u8vHfUP7Qr6s1dlz1fFUtDA6HDYPN1BR49nfROpx9Zm7me0WXibiYUUR9kn/o2DUW/kPaB6CpxPX4ZWAAfgQzZTZ5x3nux/aC4MFfIjyMmwjvZ2h1CLxK5104TeiXAMYTKxSHgwHpfCXSpr5MD2xPxHuKAalgHPTq/mbFfpy/kcqYLWR1/4mD+qXPPqKjR9yWzFRbLbeBwpjjwzA0BcSsQ8rhvAK0I8uCrNbVWT2nzvxz6i89Ky28IG28Jq29Ii0/7+enYwu03qVvq3Xm62qc+bYaF59Qb/akcrWbNm7pvmo4PvLi+BEAvtLp7MYxKCe8q61ec1nN9TllWivOU91p086oHWiFuoP+/Rflov2BC0cR8fAOMCL8nsUerCxqGD9rzsHphZa++sI1ffXF63r++qpu1ftq5kqx+oX4QzZReujMdznXIVtD0j7gIou1huY2mpqrdWy0WbY3e1pr9bRhS7xunsLgLHtfB59i0D62ybIRZdfHmf5wvfxIbEPTLZRdrTb92ZKGratwhRGzWrviSNx3fO362i2MquO66sR1VL3wr9ooK8cM85rTX3Umlxod3am1NLfWiM7Km0sbunFnVdfmlnR59o4NQTuufj51Y0GvXF/S81eW9NSFO3ry3JweP3Vbj70+p8dem9Ufn7ylb796Q9985bq+/tJVfe2Fy/rq85f1T5+7on/83FX9g6cu6R89fVn/y/PX9C9eva1Hz63oySvrenG2qVNLXV2pZTVvfWrF7Xi9UFSjVFSrYLxgNNqvyxZjvqfNxYAY+lPw3cTjOm7X1ENIOtdB8AnfQynMTIdK6dAouN4KoVSYVxHO79AHeR7qTWm7DxzP9jGhJAnKOxvYfjdqI3jvWFEHxkthIE+Yz+c7NWU6tCMMbLcHt0/aX+hldkGXjjO2Exs601t6TpI0wqTgThEubh7RrqvguKtuF+PWD2dGCto5XlalCK9wcm7PsarVEJ1p8Am7ZEymlkDnDTp8vHN5kQbwkMS7k/4Z4LxgrKcOhRTnPXhvEFhzvYPZcAO+E3IOSgo6Qya7jkyY5nZuk4R9//gOChokxwV6SFswmVfZAypO2+04HO3KzzZ1zIP6Wt1YU7dVUyXXVWt9MQ7w/cajP9BXH3tGZ+/UtJYzPzEP7JnGc/U76t0+pfXzz2jpwkvqNjZildjsWlcX7zR0+vaqLq80dGejoSY6ATaI2x+TIiZHyzpxcLc+9eAR7ZsaUaaxqlKPszEaali4M2Mb/ZS2yqp75aqxFeAtx312dk3nzl/TnbOn1blhnYLBEpeLAVTOY2DFWrM4altuTIvrG1q99Lo2Xv6hGi8+q9Wz53T75pzztKZ60ekUHbfpPWtlrGTU50PWvA9wPlIdmqf4ykAQ2c/YXmb3BHN1VYsFVWbG1KqwDSHt1qH9w7ofvqTOhkA9bs8R74ziNwDv3xzubmDAeQZPQPJJd07bfCObdx4dJFarumBwljXTTcU6QuXgfnoGB6HRVXGmOfPX0HUGPBc3/LPvzw6kosZl6IYQz853yHp0M3ij+X9mrKpRl7tftSymNPDg6Gj2xYjinC2+jW2jBkwdmQOgGwYG3T43YYgfu+HAB8BzslX9zroL9gP2bdb8vzI1ppE9O5SbsL5qva3pdNv+lP6Q0M9Ixy76P2jzjoWY+B5NiWwjByJOtzsGDTjHp2oZVlhbVq5h/dBtZKhPdVyfHXSnbfkLePPzu4DIk21RdLPYvtVxdGGIbr8TRx/Ssl/dOHNa+fqqVT90ZbdT57fSaKl9+bqunzmrlnlJfs9u54sJCZaW/p5SInuZ7BAu8OG6c0ErLkunXtd6bdVtE9vLep31oY98+lf06c//ijJF63jmcU3znJZ1M1YV8x2UHdtFmof1uxuun/XQU+nahrZp6+jvaCFTO6YjfWxtVrhdvXhezbr5G4V2mUMyOF0OmOectFQ/iX7sHXVEqykVsFNd9xYVWexBkvIzcrzZsD3ueiiNjuvIA4+Y7zmf/i7sWa6mk5W1dd28edO4QxcJz+D3MUjtx8rYqMYmJ7S6YlxYxz9+7Lh2zszolHF+5cZV68PUe9JKoBp0mQHVpEz+JIH2kXJuF5m1+0lDksmcCcowCbjO2WZB1kCLUQ/2XG/1tWx7Z3JyShOlUvSLIlkYhEf/Kxt5eyeshxarur2RkVXowM2wLZEOF3hCnL3np8RN6dsY4vMevBNEO7kH9+CDgmic5rLsc0zjTR1wFiQDgc6ssQxLBHfs0EQFhmB2G50QqWlHZ94mA/vggaRhL1vMB2Zm9oMwCIGQ/ADUE4R32t7BHxTLqu7aq8q+Q8ru2qPszl0q+Xlq71EdPPigjh94WIdnTujg1HHtKh9UtT9lDmqWaSaZRuQdn4UYyhEzP9OS35QSB3/633eY4w5vVlstjEWnGXvKs2c1fbkJa301WF6OgLUHXWnM9OAgNIQOxhL78NrHLilWxDiQbAMFyX6+pkPQYMoYW1ndnr2tJ3/whA2a01paWFSnA8OP4P7UMREZPQQwcCdVs9FyZ+6Orl88q8Wb19SycdO3QdS4fk79xes2OtZcZmZbOpK8c+Ey9K1M9G04oe1F57bphY5bOjYxrREsGD8xq4J0oz4GAhVDx4kPO2xRSqIzNzqQfbVCBq3xtsMS1GbHeC2q37EQaxedH5bI+hnlxzgL5Qd8OWUUEA5kTXtdOx++H+I7pZ/ukm+oF+k6UEjSuxQqdS44pya0NBgBkOMk4MjfoAQpId46GEpv6jhO38Qr/ySfQeoEDLctFr4ZJjOApNQO0g8jJAGdobEHqvGfOmx97/+t8NxvpUl9YJNER36efd7LCX+RV+qDuFLioRi0m9ZV6dyhXn1xLPaN2Lii4Ec4PvCVBPlLZw5EbHjGHwYBOCIPYVC4dvvGaTpArmHbYkX9lbNqz76s/tIFVXrLrkNWfpgerJRB8ym8PzXxNbMVtYozKsw8oNzkMbcZZhqZNugQxwgxDfUYuICW+IT6jTokHwkXqeM05YnyRRWSV+cvaMKe0anvPGZNSHkO4aTTy8ZtobehYn9dpXCsJrujfGvOivvt6NTN1maVrc/amLBrz6uS27BbVznja3bD14aKsVKiqW6n6TbYVdvKFrOI6Dhgz3raNIMLb6xPcshNqnM87WXgPXkm776E/7Zwdwkp7lSfCZy6/cJx75s4DwqZYTpithErEFr1NbXX5zWSN+78zKybLrt/Z0tq99lz187XDrP67Yd/jy2uCBezSumoKdjAMC/JFdRyudZX2Qe3qnx5n0rVPc5KMgDYHsl2oO+DOJQvVDU2vsN56+nll0/q5CuvRjhMgOCj8E/zDmUmlZ18SOVjX1Lp4Cel0V3KFcbVa+fUNa+H1sC2ixXtLHDQwzgyL3e52WIKf7b3BrgkPm2aM97BELTInsLUJfRm+9XQCR7PJAJCty0T4jBn44lZtdA3PD0Olw0sU4cOb8dKunQuCGkk2mb6UaZbcnKpc9Qe/ibVDR3CA890cRnqa7dVX7ruYDaooofM9FYeVa3Z1GOPP67/4W/9I/2n/8Vf1T/4n39fy0trMZhOFymdRQzGddrmBwi5qHdbAt11rdx4XfPnv6/VC9/Thq/104+qduZbqnOw+fnvqHnhUbUuPa7utWfUn39d2fUbqjDwYWMEHgDnps7p/O64HbMvLwMF0AKd4JzlFLzJOki3sar2xh0/MvsKOetsuE6R7/AycMV2ebHy03HTfkMmk11QgPCiI9B01TTNzdf7eubsrP7gqTN69MyCLjYqWstPxiAEwhoewfYErEQJWobmkU6mvw730BNbJLnNspy+42/oZI/Zebwj31ydN6SNb+wSjwm+ZJxy74D+s39UFHWIVMAXN5AQ8HOXJarN94mvpj9iSfFAefzB39KfBXHISfZBjq0hXfY4mwuXsxzN+zpwXZ5t6LWLI2qVxtUsT6tZ2hFbIjZKk2oUx7WeG9Gy2/Oc5fGNek6X13o6t9TS6TtNvXi7paduNPX4lXX98dklffP1O/rGq7f19Vdu6BsvX7W7rK8/f15/+PQp/fMnXtdX7b717Dk99spVPXv2pi7MrenmakuLbli1gnFcdF0VzB9ypgfnu1cwbbik9Y5L5jpnRUbgznSac/7p5E16LMZrOsej6LoBn2AkOn7ACg3cjtrEDSUrLS7qy9ehzIj9/M2fx0xbM2UGQgraO17UzEg+VklzWKrMx9m6p2cXg/am1dBJHV1yqYMwDZBQj27fod+xqoiW6rbQqcP1VLWOtaOa156xsg3vivZNVTQzXhJ7jPMHPW/m1ffQArQRmbUHuhN9vVkGPPGOdgGtGi3By+AnvHBo2o01tBjUvwd3CeDfF/8keYvjN7Ve+EZMDDDekRl0hDcdBH3Pt+8LggYM8DbqGIg6h0jgEXZpxrfbinV0dA03lWgTjY1VXb1wVl//6j/VX/lL/6X+yn/9V/WP//Bbbo+n9c9/cFLPXV3TvHXtXmnM7cytrrmqUntZjflrthXO69L1Od1YqOvmSif46IZlESdv0L6CV5lnxgS7TsM03dP0aFGP3H9UDxzZp+bavGm0aXlu2nMD6bj9wK/hYfDXtjUkBnjZetAtCalgvQne7ncui7+MDkhWQDJQvZod0QbbA9WWVbXtMtlc14RRkA9Z4tZlZtmxoy2gOTDDOoTC+6gB+Aw2D3YMbIjtM5HRWeeO2cM545vtNctTo9Y1KmqAE8ufqJMB79kO5CSapd0m2JN2u+nF+8H1fQHfOx/pL6VBzENdc+gfAyH2RwugnHXz35lHHlKJra+gN5cZnBZcTk5sIOzQP5yf0/e0hOTw/VmClMstoFUmXdt/IS+dewZArGxO7N2t3MioZanDESaqcFAZRlzYi/5uOJg+bJ/gNOs2Gbza+Em4NY7t4j04M7zd8zBvDGKQbn68qpE9M6rumLDOYdqGlgPXDo+uOfiLfLjOIj2/HmoE8P42V/gS6VhWxQCI+UGmwYQlpGGqb2JjlchwIGcTBvl8T0BSThtRE3IokGC+VB5X8chDKuw5FPyJ7U/JZwu92PjlbI9syxZBdVRjJ45Lu3epxeQU64Zy+w59ynSKRk1Xd5f+Duc977jzLdq7qc54subtP+PQPice/ph2Hjqu8b0H9dFf/zN64DNfVHZ0pxq9NBmAukWVN3NyGvDuptts6gdjhCJsfNMGEzBzVuxzpg12Sem1Glqan3O+nRL1QhT80Y4GLmHSv24zISOMS6qvbF0H/ASuobsIB0311KrVwk4ojYxr14GjTrNqXSN9hx7DrhwLy8uam7vttNt2w7QHOqvjHJ2aUGVkRKtra9pY39D9992vQ0eO6NrNG7py/aoa5tPoJhA1fSnEG/TIDL831//7BuKzA89xDc+fKKQcQ8NoVdCLdTDbHDjKl+qDakZGVNzWoRljDNrEWcdP9QMurKlly2rlR+3vujF+c5ahyPZoLdHuAP8ah1hf+Uhr0Md6D94R7m2BdQ8+UKChJnmJQHVjplPA97HszgyALmwUuE88tEfHdxRVdUNGsEfDt6Op0+iTGP9gIfhlwCa7SeUZXOPXzHqYwyHj5jfdZlTMl1QqjyhXLitfraoyPqOxyV0aHZvWSHXSSqv9beBnzRhZ9tjqrmtu+YZq7TXLazqEjSMb51xZEp5DCHetAJqJHtx5XKX8mDNqldG4QhDNLlx3HBtq9zfSZPaemWafcz+q2jG5WwW2GWEbLKdKnCgu5BUFGYEUzwNBkXCeFOc3Kk19Fayczs3N6e/+3b+r3/3d39Xjjz+u733ve/rOd76jb3zjG/rGN7+hr339a/raN76mb339W/rGH31D/+KP/Py1r+vr9v/WH31Vp575oXYWsjo0UlVhbV3d1Q3lKyPKcJg76aEQOO9siRXqXcYKAZ3NOQvhnBWMQlutQlM3lq9orbdsocFewB0rUWzAiyJBXsk3tGTFIJxxGgInKWp0YoVx4KBZ46VUHNP0+N6UrnEHFlIcuHcPW9SaYkjXLd8kuLimuCOUy8sfz1v0lN5F2Pgd+jscZdh847iJc1jkgEH47S4CDMJG60qQ8oYbhvSfw6DAxqCFPblPeYGmknEXSra/430M/NGR7CtKIaSSpb5Wr0pr15XzPQoadYuZErm3UDcHUH5kRrnqHtfhSHTq0f5D2Qx8OJ6oTxvGHGrs+2HJU37Ih3+hEzsU7dgD3e/7obhxTLnN2M5t9VfPqnXjGWn1kgrtFbcL8xs6eyMulFHHaxcGmNtlq7JPhd2PqLDzQzbOdzuvVgYpudMhf6xICRXOcTBQh+IPViFdMhAGgfFAVxHcjk7nLh2Yft8Gr/FHCYrOi9tpv2lOsGrnvPXuKN++qczGJXWXTqt153X17pxRb+mcugvnfb2g/uJF9ZbtVs6ra9dePuPrBeXWb6jQXFaua2Xa+IIHBzd1ljP5lCoDquQsb4WddsCsMpSsBNS5sRJ1DviXSh7UxxbghxuGe/P7dwnx8Rb9RSwDugs82ycPTdE5bCOR+lenpbU7N9VcuaGS2z44jk5tBj/M5+jYZgBkq6ObQY90OF3y8zvz0bbrmUOkO6a9VqdivtbQbM1pTRzQhz/5qUg9aNYVieGRBrJMK87P+XMXzfce1+zsgkZGJvSpz3xS5VLKb4aB1B70SFjzkyxnHeW1duu628SS7SSe96o4dZ+yhSnTvGnJBkB0EAx6ImLAFWQEapKcIV3yUjCP769fUmfdbct03C2OSlPH1KvO2AhzeWwxoZIzsBBnFPhrZruZsCwfumpT/yjieWQyA8gN9ZtLat65YPpbtzHj9Kq7Vd5x2Nkx3bO6kDyQH+Mh7Tnsb51VViZG/PzS2er6WFu6pU59TeXKpKtwVOvrdf3AMuLv/52/Z3nwx3rhlWt6/cKCzl+5oc/98q/owIH9Ud7tdBad+3EHLba0eOO8mqu3lOlsSE2XwcZVu1FXq1lXu9WMQew0A9Hf+dtY6WQXB+9S70OaMH1E3btcHRlvHIbJQIhpoZcdVTs3oUZ2XP3SDpXGdsd3tPtEi1RHolVkCh1S1AuTFqK9Y21jsLp+2TphqZ3XqZtrevL1q3r+wqxurnZVhw5jII5YWD0H7uyi+AwgwAPhE44P2iN+hwTHICSMYtJyGOg+DZRQ3sQ78ec5uWFYrlBE8t9s2faPSO34c8DkP3CBe0JT5xjVtAFjirxshUwQfsYJsSespFhTmChh5DEGFMjrIN8xmw3ZMeD9Q/0vyhfvra9s93M46pZrJgZZGMg0zk3eHLq83uxoZaOhxbWa5pc3dHtxXbcW7BY3dNPXq3fWdGFuWWfcbk/fWtQZuwu3V3V9qaG5Wler7awN0LzW3UTWfU9dth03eaUcnK3AILJZuXUqt8VeW1Vfp6sljVhfK7o+GcxgUkYYv84dvDQq2N+AQeok8OIr7SrVcZIUdNAygFEsZlUuF1QpFVUs5MwzbFg7PPuW080Cx6MzhnRYNZ1zPtLsUM6MsTP/Z/CvZNlZctsPCs/1NVYpaaJa1tRISdOjFY05jaLznS/mojNoea0Rs+6DTpAJkddEnyFMyLHTYwBlarSsIsXwe2BIqUNaoNjQXqr71J6HYe/B3cEW/hKuuSa8Wmaa3hD0nFmzbnl58sJtLTRYZwivJtTdQdSoPw/24B9aNzSMLhNtEm//McMceudMpappsdBp6tqp1/XEt/6Fzr52UmMTM3r4Y5/Vpz/3RR069oCavaL2HL5fU3uOaKUhraw3zYMZpC6bT1bUKExruVNSrctMaLd5ts2J4jsd6An2RD5c7iIj/257qItsjzs1PaliOafbC4v2dn7pPDJe0MWgx1gxY5beYwauCXW6u6pDmUWNZ1gpiM2aVy1X0ZX+qC5mptTIj7hdd7Xb9sbRzLLGObvE+dgojOpWv6rrvYLWHKavSkyKossrZBq4s+N6V+B8gnd4dYzD+ortXO7WnZe6jrRrmmLgCH7o9tlYX0PMO69UjssXdZRSpz2+IRfDh23XCDdwAZs3dwHEZ7dZfnAefyla8gXdkC90CqNdDft1pse079e/qPLBPRa7LgCRDL5Jd784gF0dcnjgooPUdF67flPdReuKrkvYLoMSZvj+dxh/w9luIGN7/frWfBoiwQ+fuwfyxKHW2Pvo3nT4x0ps3vkv6UGDhLmP/HOfgNugN7fTJPNs97id5icmVThyVA1fG0Odd/BdiMhhtI6PorzXLbDIB3IrzkkAdzEblDZky9OyLzM5rtL+3cpMjKuZY3JGIdqOf5QpWRbumtL4kf3qTU7Gql0mcdBnQonhsWlWfta8y5H7e9pZtt1WxXL07NnX9NIzT6nEYFYvr/se/rjKew5ryTrwvgce0c59+7Wysqg789Zjic80H2dfsloXPhp6Q2ohwefIFxfjo4AOYDndtjLSsLKDXvK/+p3/TfQnWdOI7aiY1AbSKSv6FJNRGLwFL0l345yRW/rud77uL8AVZYnai7D7j92nz33pT6lUKml9cdFl+aHqK0sh46l3qK/eamvP/oP69Gc+r1K5KsaPYiCItNp1dZvrOn/qNV0+c0af++yn9bnPfFovvvySXnrlFR05fkwf+chHNDZG3xX4TBCyI3SNeHgfQJmIJMWcyhwcJry48pp6BJBdP5kzQEgFHcdyCRq3S30oKV0EzaIZ29XZRY3kOjq2d0LVAmZsI9lRLjurJWdXa3rl8mycB/OZ+/dpZ8U6H/h17AxmU4KkHyNnk05OPUYuo9z34O0AHntvAOQefOCQ9seH7cIcUFhpsGm7AIy3yWpOn3pgp/aO2ACzEhed7ANhhNKavv7gIbG09JPuYWzxO3jDNbmkaPCOP/vAg/mzdRBbWVmZyRQseNmCgpmm9rPO7fIXzfxYYcBsgZYa3WUtrN7wddXFN9czMKoeW/jY2e72NyWVs6M6sPOwyvnRUBoxoDtWhueWrttwXVO/2EqrJ7BOrJQzyMJ5FhzqzUHoOQvcNPOEfBq/CMdIDaCcXBEa9ne6GBpDJQ2jgU6eJ554Qn/5L/9lC/yzun79elxPnjypV15+RS9b0D3/8ot66dWX9dJLL+mVl17WK6+c1KnXX9cZh7t4/ryunjqjozsm9dEDBzXasbCo1dXe2IhOwkKl4hIxA5rlhKYZGx1dGyVdOtTzFlg2vNv5jprZum4uX1Wtt642Hey5toUD6wYReiEyojwIBgY+QthTskF9UT5eU69okYXciGam95lGc8YRRuUWVt4LxFcpic04tmIKz8EdaVC+YV2k39TR4yfyFXl1PUbPIy6F4T/V2qD+on5S+VKYN4al7FyGAwhhnBF+u+O1/1DAgKRQJsUbf/Iah5v6XXTa+WW8R3hbIcXoTp1T9vT7vGk4s3FL4qBmNZxq1++oE6vwdJT6j3NVevlx5cf2qleccAjHEUoHYeADSP+2+Uja7ilqBVw4YfBDyFTWAc/wHeUDH2mA1aZ/Z0GdhZOq33xG+Y0LNsptVDhl0k+dgf6G+Oi8dN67marWszuV3/khjRz8ZAx+1HslJ8OeysRP3lLnaig9DFY6n9Fv7fiSMu1cgB/TFTPLh52aGCvMrKczmlmL5LHoIhYYrGjPql+7pMbyWdXmXld9/jV1Fk9LK+eUW7+i7No1ZTduKFe7lVZ+1G/53ritXXP78bu6w/i9Vm6rs3RbreU76tRWrJxvODttFUrUndN2PuHL1BGdxqAvBlqjbNQ5OE/KFj7beQXY4il8XK4gnQhHHRDqLmDbZ8RCGqGwhw/mnn3BJWlBY84oh9mj65dKfRXHRpSbmFFucpfdbuXGd9nI2qXChBVV++V9xeGfG/d1wmHC+dnX/JjDVmeULU9qI7btaWutP6pPfP6Xg79SPhTpmKFDWeENrsubN2b19FPP6cbN25q/s6iDh/fpwQcejBLEgFy03QSxRUyrqdtnTmvpxhWVilWVRg84j4fVZ1shpxKdSb5C3/BciC2G1Fz2hBW/g758xwCI1hgAuaGO65etiDR5VJnqrjCmCEcM0HTflhRGW9Z0ymqlrnkhaQGkQMwMvjEA0r5zcTAA4nZc3TMYABlBYjtdhww+ihEI/jEcoRMGnUnD+WSgEllWWw0jnjNRHn3saf31/+5v6u/9z/9QTz3xlFaWazYencfSmOXdho7cd1QPf+jBMLqGKz6Z9RSDCZQ30Aj+1lV1MxyxwVse2aGCXXF6p0oTvtoILJoGCuMzyo/vUM7P+THX6WZd4/aYDuzGca738X3KT+6PZ8JlTQfZyX0qTB9SafKAiqN7pOJUDIBEp5kzErRgB33GKjfzAAxs6pdVVn6pQplZuHmdu7msZ05f0zNnburM3LppqmjZxSCqywb/DDxiSMVnjsv+djEI4PaZ0ks8jjQTDHIQSCE8/DZ9l1x6F+8JElec39HmN/3558axh2xJaQHpN5UTwFgMQxJHPcQ7/Ic5TxAGmd/hBrm0bwqZfOGB5I3vhnlN9yncsIxbsQZ/GfAC7lPcBgxQcIh/6CjOva+xNQplhW/kimJfa1Yhdn3lEPa6CX+1k9Fco63ZWkc311u6ypknd2q6vLCuy3OrujS7pEu3FuIcE2SamaPrmnykXDF71NXuNO2HztpuaKyY085xyzHTQc7KndWUyGvio6A4yVJ4GHICPAzxTbjhZALoPHgNZfZr0oDPFfO5GAhh8KLqtEY5yNXXaiGrisVNJZ9J11zf77IaLWQ0VspoopzTVCWv6ZFiuKnRknXBiiaqrBrOWpc07pxn0gZvcej7mssd9GJH/ZAtHNkFv/ZisGXM6UyNlJHg8f1QRwQivnDpicJwP3T34O4hcB13UE7CaKo/6gB6s5Q33TIA8vLZm1pqoNOYYAd1czcQlBnfJ7plcJbDf0OfwdvpMnCXN/0xHFnivlHTmeee1fNPPK6Rckm/9du/oz/95/51ffiTv6QHHv6QqubTTEzYeeCYytN71bDe1WUAoTiq09fm9K0fvKC6dcPxPYfdBt2GyYPTZTIO7RwJN6SwYGFgwXyBdwz6c5j6yNiYCoWilu7ccWhnuIgN5hx2OiFjzD3dttMg4nh3TXszqxq3LUF7pCNs3bz/am9U1zJTsSKYjq8Z22f7M2saYeKBk1+37J3tVzTbLWsjax3W34AxJpGkiSQJb8ndBfh78A8vgIeAfwZiOI9kl+X2ccvfan3d5bENzQQR8yRmcqOfgwu2AYpofIlcDK7D7KQ4txyw/X7r5v3AIMbgA/y5PM4HaVOwZGMqOnHpFB89ul87PvdJy+LJVPD3Qbs/y7DJL8EL9WwkhG5Avc3fUXNuzipV2/IEyUu7N+0T1gIpVStt2+1iW90CXIbubiD0TDtWAxTMSyrVqtuPNbsmK8kdq/MTcQ/zbD/qj+eQxa7YyA+//ucdHexMVZLbZP6IqXbKbQo9z5mOTweONhk0GXHfxQAIuIr8Wy8z0+AsWXhX2xykx0qwqTHrymNq2L8FT8Cu85UVcy3LyNzMhHqVSpzT2kSPR881kwtdnPwOcsv2yqz0hPXgmy/mtbq6rHNnTml9acF6gdOzLq4dB9WdsR5dGle5YnnpOG7HDhi1aJ/0B6FfRh3a+S7wwGBn0i0jOUNPe3fv0Ua9qbpxYq6lP/ev/nmNTEz5W7Qv00Tg0+V3psLmtAxP9jucMumby4u39e2v/aHxY6yZj1Bf8HAGXHYfOqZf/vU/Ewm21lZ1+exp3bhy0W2VFdkO7/xS4vGpaT3ysU9qyvp3y+WknqEPdhtgJ5czJ1/V2ZOv6EMPP6Qv/9qv6uy5c3r+pedVKBb08U98QocOHhoMpvlL0nesUXd+fn/gOBzfMB5ipuyhD3MHXQz8AZ5/UgMgST6akkwTxnzIKeysoGP09HxRN27d1q2rZ7VnuqpdE2Mqu76oV6aHblivfPHceZ06f1VH9u3VR4/s0ZTJk60MQ9elMYAr5wlMwT+D7vwe1EX6KQv34E0QPHVwfw/uwQcGsB8abLRMDEcMRNqpGyuHne+0IBovMbs0iRWEAEA7hsHAvIKp/dTg7dKnPEMH+yO3ifMgBvCnA4xZo+wx3c2WjYOSlbuCOp2CC8mM78HKj7Ae0rfdbsu/0RXmFM1gzfy6FvjM1mZ0nFAcosWMJRQgcJbEEbMRbfDaGPUX8UzHZiiXdsyOqtfrUQyMBpglndwoyOGQlgNIgiEJYOqIP5gHs6cAFLP5+Xn94Ac/iGuFwQrnjVkixWJRJRs6HNaFoMvbr2y/iuu3auO9VCjbz3Xt64bje/z5l3X+2k3XOUdUO6U7t9U886p6V06rsLGoUreposuP8EFBYasSlqy3mTHhL2TFIcNB1HaFroWWn8MZ76lz1gj0U6qPATLC4cc7h+NqBQcstlqdOFg1hflJwZtpx7GHtTZw2/LFbTwGcMP7gRuGDzf8hriH8W9PZ3tYgHfgkFn/YUYO/N7qQmgP8kDdQx/s8xwDH5EPWiRUgmLFwEcuBj94jizxjk7/SNvflkbVL3HIcz4wTjKoS9H5hZFsZalTW1SnueY2gaLP4ZUNf2pF1wpa8A9/SQcsKy7UZWsyzkhwfEG3KDes/GHrAbcbzoKIma/9UFiy61fUvvmsOjefV37tsr9bNr06fs7uGAyocPgxNhZ00NGIDfGdKu/4iKo7P2alZZ/L5zJY2+hwUHrG7SjTdODUGQ4uGGS01U5p/X6ggDrmcHQikU1/H2wQhdMGTbHdUrm3oVJ7VrmVl9W+/l01Ln1bzSvfV4ctfG6/otzyeRVqN1Rs3VGxs6Qi22DJeMpu2Cipbboi61V666o0V1VprapoAz3fvKPM2iX15l5R68ZTal79gRpXfug4L7hdrTo8M4SpCRcHQ53R1SEtohg793Ef9Rg15yfzHeMM/gQP2To3BPd+YTsdDtMPFTRuocU8s72dx47beMc8tDy2SyOTB1Ws7lVhbL8K43Zj+1Qc36vimN0E9/t9xR2wc9iJwwN3yO9w+Pm7iV3RAV+ZqGi9ua6FhTtOnrRdf22XH14S+HGZoV3f7dm3T8dPHIv6vXjliv7G3/ib+sEPv+93hEnG/PDMIHDYXlxTc7Gu2lpOd+a7qq1Y7TXawWLQn7+E1wLMAiSS2HYwfCJKx2VkOAx+iA6yxKoYjAmMUPhumh1Iir76+4iJb6hvVkWBS7dbrjHo92MA3CMLIgNvAH/rf2QKMp2CxlYOfl5ZqelffO27+o/+k/9c//Ff/Iv6+7/3e3rt7AVtmAW1bHhyZkTTfIOOtH/2z/4XvXbqdUfgHA3KROtyQ/Wzc087d3sfndytsR37VJ6kvl1fO/b6frdKk3tUmtrnq+vb1+K063TqoAp2qc5xruthnW/SQHL5kb3KmU5ykwdiILY4tsd0sM/+qYMO3kWZYkCTfPk33dHOyXBCDR0TTOxou23fmpvXy6ds9J2+qOtLtbSdXq6qpuOR6Rijk+XsGEvE1HFZcfBUAKOHznS4CIY3h23SKc17pH6SZ/GlHYNObYd9s4O/Dd0b35Fz8B10zTVRSzjukY3p2Tlwmikn0fLjGrrNwMGfwUDgyHe4Ldh6Snfke3AftP5Wl1LaSi3J/2EOUkoMMESqxiGzSTislRV/vvgr58M4ZiZ52xwznYliFyu9KnZlG70j6uRGTYujatitZSpabOd1a6OrS0vrOnVjXjeWN0yjObWcBtuSkB+2u+JcF7LUdR1BCaxCYYJL142APbs5ZLXld4FlVnZZB+w5D2yv2UWG9ZmEAtbJqfNuucdZUlZmfJ/qJQZBfZtzmQpOv5LpajTf0Wipq51jJRvPVe2ZGNGeca5V7ZusaP9UVQfs9rKl1XhJ++y47h4tamc1pxm7qZJkSrRe1VbJMqBAecCS0wWf/ZjliyygLgBj20jHuEaWpQaKryWydVG2IgyPcPj/aPhx7+/B3cOwOUVNgGh70NE/rJv3A9BA4noD5+foeLWDFnLWb1gNFboXg+Dtms6+9LxefPIH2jUzo8/86q/r8Mc+rYkD+9SzLbDKLGZ/2cwXtOz2sOj2WLccbuw4ptqO4yodeUQv31rSf/27/5Oeefml0J1YAQVtmnMGJ+hQYNMjpYtOJusw9CeFfWTf4JT2P3Fknz505IAmy3l12HrHkeUsM2NWu+NjMgWDRy3z7hW3U1Z9xPlJbrs1t4rGAH1caCV1t2E0sXrOPMWNhnMV4dFMmiqEXgq+Bh1gg1YOzu4WBtLeN6lMUQNmQHl7o3XGxAO/Q1fI5fOa2DGtwihbgHJuQ1rhDAxzsHn199zffc7uHui8i3QH+Q56cpmgqY756I4jB1UeraRM/lRy+MFB2PbUoSHo2DjBje2cUaZSDvlDHWaMl0QLQ2ryvcOF1wB4T1i0hm3e7xn4epgS6hfbL41MTWhsZko25J0n07zbC3ka9k2Ql9h+yxlAKgQMykL9EoaByV6rPeBL9hlkMpUn0cVPBMiDmVPBbRIZiq3CeVg1v+oUWBVsyRsNwy0KHbjjtur3dTOQOue2mi9tMGjsNs5kHzqmQDX0iVynJcZAK3f2Q1+tu0j3fejj+vCnPut2Z36Vb+vq+Zd19cIZf8sWYmypV9Geow/q6MOfUKY8qiYzYd1G0QMY1GRrJHR1FAxwiIv6NF2wRfeu3Xttp5RDz4YpEpQrfDiPX3gYnB44pfmELTBwbB9XpQ/GZeWMoph4wbvAQVutRsNlMd+wf3l8TAeOHom6jkFUJp/2bWs7n6trq5qfn3XbtS1bZMISSZv/Oszk5IRGRqqBJc4Babm+77//hPbt2x8TZa9du+Z3kTuH8K/Llvh3opU/OSDNP1mgvUDrW6WgHfnJiun0SFYPHJjQZLWgbpstq0yf2ALwbWMdGcQkql3jBX38xG5NlDmrxXTmcKldJJwhb5GAyU7Hy/64e/AjYZMn3YN78MGATUa3UZhCzGg1U6eRm1eGItszw903M66xAUNOnYcOF40Zxoya+yfJEN8NpPTh/wEWLCFc7ILZ2cHxeB/syVfKgl8sw8wx1zyntiUUh1Oy3U3OxnjWynXs64oAcplRIthaASUQFcaqoF0nVnLEPT1lgZaEE4QvKxXYn5GBpJyF9ehoNZZJgj5mgqUZEQjnrmqNWsRLHERDfYQQjDz56vxtdqpEYVKBtwY+HM4RM2vq4sWL+v73vx9+5J8wQ8dz2q7LxkAoRo4HZcl5ZOYksbGMvV0o6OVLV/TqjVtasxBoOL95M3ytLqh+4TWtnX1B7ZtnlW0uO56useY8WPvIdtgCrKw8neDtrPItGwHdrA36Qvixd36G2cU2RGIWSjgSHZTP5Y3O/BAt1OPwPTLKmGqz0iDh6G6BZBIMIraLpLdFCv1E2pFSciEo7TCc3hDeYcMRbvPKy6A+x8N3QKorlLPkHGfEwfthZxK+0FDyjTD42KNnzXW4bzffcbAygwzp0G7wScv1N37PgEPXhl/UpwMTX+w3bIculfLoOqsym4Yluhb0TjtmMfBvJEOj+YwVwOaqerUFK381PzddM3QTMkCRBvFYacEWPL1+JdVtbFHm+nM80bEb+WElQ8MKRUslrt0l9RfPq3H9adPR88pvXFFZ60orP1De6cwnv47DhUClaJquNoo7pZmHVN37ceWqVv6aZZOv8eDyZjgQ2fkjbwwG0DEXsz2cyZQfyuw2MFCWozZcTjeDSLfQa6jab2jEanipfku9Wy+qdv5R1S99W5r/gXKLL6qwck7Vxi2N99c0ZtxwwCXnzcSB8SA5qh/jAQWKqxNCA0dZN45dNGXbxmGPw/SWnOas8o1Lyq2cUufGc6pfeUat668qs3pDJeN7xFoxHWxmPC4TCTg+u6gfaGizg5S3hKETcGDSU+6gY5yDvB8g6aiMQUQ8A3j5Et524DVro6TVNe9j4MntXaYLdUri7J5w5gN9/H2Nwalu2Y7t/4aOc2mqjs6Ob5n1s9HQxtycWp265u7MqmlDYJCT4HuJKVBq48P35OnAgX06cf+xhBOj/+lnntZ/9V/+Jf3wyR+47t3egv8BjsmybunGDa0srPhxRPW1nOZvLfq66ujg5wnLFJAyRuKRTooBCPQM7gPimTpwe3Bt006Z8YZlR62xJJ0QdPbQ4jn8nDqNTm+TDm2b2X3BF38MhJHiPxIlf2HU0tCpe7iz+QMd0MR96vVz+uv//d/WX/rL/63+zt/9+zp97qyT87t8TkdPPKB/5//27+krf+7PqWB51Ww39NIrL+llu0aLwUXj2Mk4dKJBkgS5bkHZXFXtbuIFQesuL11AbF/FBAPmaPXhE4Rx3fdcryIsq7dc50EH1Df130t13/e7NuGGYU1X3Q6dVi4P50HAe5wn8EdWEqZ874wFXTijHGLoiFS0XGOCAh11E+MV08YRHT96SNWS68ZBiaVPWGLzM/VOPBi3GORty3RW04FgeGnebT4OSqSDzeGDRztcam/wG6iRuk4GUeLvtM/h9Y0uZ/nGXsFsk8Q9/DPx0OSGcgYaITYGW6LsA5dWsQ2dTXbjBr+YRcfV3yS5k8DZDRdIirchLeI/8RLKP/wqyaaUMvfpmXcA+eMufZfuwQeIjHbmPLCdBAfO+yc6N1oO4BJbrrkuBwMRkWfai3WwNO3Ccsn+ubxpwvXN0ZXMCs1VRlSdnFTFhjxoSVvZtJ2PtsquTL4MndVx1zp9Xby9qBcv3NDVtZbW8iXVmUFaqqpeYCZpSc1+0V+bPrNlx+H0+dZlhBboLKWDIW03SfncZv2eiQd0csZ+0UyC6Vr2dBquuzTLki2tKs7XSCGj0UJWY6Wcxu3Gihnr1PhlVM31VEZ/ot67/tYGNlt2MZOWvaMZ0GFLLfDKOULNZtPkRx1QXoPTjjsI1r5REWDVMqdgeidcWnUwCP8jINHCPfiTg0FdDcEIZ8/2H18zPxr4Plpi8LvQmk0GUGkih1gNbFmAvGFINNer69KZk3r15Zd04NgR7Tl0SOuWNbPrHS3XLRdNq3SkOXB0FHY406hQVr1YVWNkh9YrO3Vhra8DH/mMStMz+oe/94915sypkJHRzm1TDQ/4xwaJ/FiHCZ3EeYKFYmswwMFgZcH5fvDoQR2cmVIRZa+Lju+rA6PbJV7eU8vhVhn0sJyJc6LMFzb8vGE+Enw3cSnV3H6XLDdqnGfktLDZGIyBJ6MzJ32ctgyPGuDtfULIW8dJe6TNpQ7NmAamTstt2XYf7+FVhUpB4zPTFnMM1oTk3QTqa+g2n7mmx00g77ifNGxPG+AWuxEbltXjnHHVcp0VD+xVNs7/SOF+ESHqNGhl6z70LOjF/7kdU8qMMGgPx6U+fBMIgwZMjTynoL7Hhwf0J98xODGI624ceem6XjJuQExSoaM+VypqfMe0RqcnlLVO0za9xTlzJGu5G6uunL/UsU5rMfDOcYW/72mLvba/jAma9oz3FA7nhyjNwO9uYRvhhk1m+Ux8rKbAnjFLtB5m/JreGPxEu0STLPgZHLf8DSs/WUUXE9gi/0lH77jMIe0oh2kWzTt0GOMJy7VfntC+Ex/S6J79Nj2yWluZ040Lr6m/sRL9FzUTd6a8Qyc++nlN7TumuhkItkKOyX+OnZVoUb/Or0M6Idq9/5we6vXMzG5xhh/oYVtdziYLNdzPbGcMzqOsdgzEck0HouOSvVo2vy07jphEG+8S78yaZ3barahPBk9LYyPasXd37Lrh2rKO4sit+xStY2zUVnX9+hXjtG8Z01abs5ViILivsfFxTVh3gldvbKxr4c4dPfjggzp27Kju3L6jy5cv+3t2JTAO4dPgz/fvr9J/BoD824E/cEVpgjbsaMEl4/kjxw/oz/zaF3Ts8OGQXS23BQbu0fFGiwV95MR9+srnPqEPHZhWBeUPHDlOMEu80B78375xhbzjkH/wdw9+JAQ/ugf34IME2n6wV7fPmLUCW7BgZQCEVQG7J0s21Nyg8XMjRpCGAMYo+xlhiFvZGDIZmNLg1pAGGpJLbM/O94hKjsOKQ5ItiWB4GI4E67TSrMWBdR0srd12aJTBYGZW8M0YmXmI0EHJBmKFgpH50skX9cOnH9f3v/fH+vY3v6E/+vpX9cSTT1mwMP8wF8I+DrTNOE4buvVWLXKTeshChEd8UTF2/KXykZf0dqiUDQUUSlWtXtdrJ1/TuXPnwh8ol9O5HcPnZCD5hvIhnYktkiEuxL2FpgXwstN95vI1XXeI1vSU1vy+Y2Hbb22oN3tO7YvPqnH2GXWvnlJhdU5VG/6jVugLzkORZcHGV7Zj52Ri8MzURUc7nTEAQsJYtHOYuNIdQsf10Bm/xnG8M56YRdtqrvveOIoC3B3w6dAl9LrcgVEwkXC85RIk+sFoMnacl54d1zdE9ibga4QgsSZIotHI8LfxOIBhh0ZyqcNzWOeJ9oYOYduLrcScF7/L9pihkDo4g1YJFduM1f2YVmowe6FgXBatCEXHGlqX8wBmUQj71RnflyL5ENxOY0hPDCTkuqbNjfnYgidvmuHcF3JFvSXVnxLYOCIlZwHlIhmWGH2hJjqs01bDyt6acs1Z9e+8oMb1x9WdP6lCazEoIzUhwg/K7vTpeIouyb4V+oKNxukHVD7wcRseex2+kGa5YjBbYS9accwEPuzfs/Lstsr84hgQASfOAzSEIzEGB/I2loudjErNlsqtFZVql6W5H6px9RtqXv+2MgvPKF87r0JzTsVe3XhkJhDKKwWlU5nZw1XnddTlrYBpOzCeMEOdRYe2lWHlbTDmyoF7Vmpw7koh5ytdep01t5k7yqycVefGE2pee0JaOqVc2ziHLKIjwFcqKS7J2I/OT1+pOSD9EsaOegwf6iK9uWuIKN8cB/FDB07BdNVzWyc9tnoI5d80ycxqW2Yuv68Z48AuVuLYMdM6cIMzFnDRZQzd2I8BaCiH3tL+0oo6tbrqdrfn5xw/pSJLKP6o/wzI0TbtGW+kSSv69x0+orFROtb93nX3zNNP6S//5f9KTz39mOMYtIV+W7W5G5q/flkNK/7RX04nig2DuQtn1F5xvcCPnBaO9gErpazRqetE7bUN0gN5iUF01x2DHwXjxEmpUCwH26VztjQ6Egc6q1RSv8A2QOZ2hHf6rKJiBV0qTyrT20FwrwFvT/VNe7F0w8+Z6DEY1XFcDMKZXhYX1/X88yd18eJNy6+CcjYEGczct3+X/p3/6/9Ff+Hf+3/o3/y3/k0du/+Q0Q8/kP7wq3+oM2fORtykQPyh9IeHfVy/bO3FUDjbTgWdR51Sh7Rp0ueK9PHVYTLQw6D+A09+l+qdDjTaEIau04kgLovrioNImcnPQETfbT+V2rCJHm4S3WBUsv0PW9nRAYFsY+Cs06xpolLUQwdn9OVPHtevf/KYjs+UNK4NVRhE7dQdCzKG9pUoPKg8KpQkkAPgxS74iKnWvCbYqsNEsHCDNrrpUjuMVsN14FKeB26QBimmGYdp5iHYQDYGVpze8Iu4A3fg0W9pP5FXu0GKEZI/ypJ8iJ0rMaS0iDcNAqdVf8hf3kZI0humSXSUMd681aWcEpOd6zc6Kri67mNWp7+NmHOuezrUHB0dOQyIUN80bFYtZK075FuOyXpYvu12SgeP8VBwEIzRstvM9MS4UyRPLtWwEwFjtWNe3m6o0IbnZ9XoF3VmrhaHr//eU2f19584q3/2wnU9eWVdlzboVHXeigyoBXaNJ4qIvDcGTad9fw8lbcky58XyJNtvOG3OI2Cwm7qAr0HTpvHovEi1zmAZjsPIQ5+xi5UxDhODlL5lkgJeLoLLCD2ZCTlcWvnnyMGdw7ZB1ICGUppbkHwSPhjkK+ThTf4+IuazRA2b30NrPNpBu/fgTxqQFwMXT5Zd0ER6EyHeD9A2o2X6GrOJXfVs30lHG4N19CzCS1buzOrMa69obHpCH//iL2vm2GFdujWr18+cD/mqdtNcvKcxyyQGTVLnnGmvwRaCOZ25dENXb6/q45/7Nf2f/u1/V816Q3/87e/ojuVyrDiio9JX5ButJbbAs4O4sSsZ8I+yu53mnekMA35+3r97Rkf2TKsYZ01iX/o78wlsLgcy/8jIWlJMhEEf7Ph+3XrrhuUFbTUw6PzV7LeQqcYVOkdT5gB0vof2A2hocR8cJLzuHmg8OIAU7WiDTsOmc7RjJ+/kkNNMd+urMjGqyuSY5T52YPpyO+BFfQYMr9tgmOKgCb8PiJQGbguSj+udq/EUxbCIYfVHpmwdbnI8Vhq8zae/MEC5t8OmjmX/eDdSsR1SVbbk1kJQvx/W2fBLrlAm1+TnX/8nzN49kAzT22JSoGkNXSi287EcG9sxpYmdO6yS0UZM+8gRpxmrWp14GoyBFlNE0X/gW3IE32AAhEkjibbSu+H75PX+uBV6SLuQi+21euYFQ72E3Ss4azFWg9A3ATLpZzJ/QI7RzRz58LtS120Lu4Dy+33o8uYR5DdY3bCujBs68eFJqxtNnbps23Nyv/Z8+POqFydtghQ0d+W8li6+rjJ1mp/QqsZU3nNCBz/ySyrPHLS+iVx3HAhqN+TQ2fgnM+ZNsRrc9+gH5cqY8+Jy0ebDE72IjBjjhCV/fOZXSc9IumTq90lpsEqjVDGPIyRxuSyE4a/VaTpUmnDbMp++s7wUNECemq26Ouapbfznb2n21nUWhVhXyqloHZ9RJfjvSLWi0ZGRqP/l5WWtrq7qvhMndPTI0cjbqVOndOPmjSgHZUh2BHQABfz8A3hn0JDqCbOCUoNf64sTxayO7p3RSLlsGnJt5fOxc0q2Y/qqtXRobEIf3rtbY/6Wgfqm6ROe2DV+O46TbgFqGIrmjv6aGCCNuo7k78E7wC8Gdd2DnytIB1WifsLk6MI0L6Czx0x2eryqiXIx9i0OQWOhQ0c2nINZITDzEAI/FYBVDxyCEgYTT85baCH4WYRw9sSwsxp1IDrJEDoIVJ4tXC08Q8CF0YnRyuw5OmkcC8qFvyQ0B1C2zdcCS8yuc5hYWWHhEEpF4CartdUN/aW/9Ff0H/wH/6H+X//xX9R/+p/8Z/ov/t//pX7/9//ABgb5YLstTGP/OX+ONWY2W1WJfNK1FHl3SMrFD+Xyy+Q3gKEihgvlzP/zc3Nxrken4zq0AMM/jKxBOO5joMdxxcCE44FVD2c3JgyCw5za+ZKeOntBi6OTGv3UZ1U+8aByu/epZwGa6zeVW59X9+Z5rZ95SUunX1DryjnlVu+o0rMB1W24CAz2MFhg+iEv0eGBA0+ksyX06VRAaCTBYWe8x8i8r/E+8tax0N9wplM+f6JAHodxIqk2pZVxG+lBN1YgoKec62mwRVNyqQzkabOGNvM4eAasDEV83A7SS8pP+ja5lG4MgvTpwOCbbZ3FBlZ3pPriybXlMLFqxp+zXUZRG6awVRUzHCS+5rpqqeD2izHGbBObLZELOqvY/qpfmnacGJX2DfonHwYMVXiC67pbn1O3ccd6Gh04g04eh0vO4PLETAi3pU7OvMLZRsmPQQa3q5JN13J/UZmN66pff14b155Qbu2M/Tjvg+3fHA+d5JTTlhbfAWw7085ZGSnOKDNxVNVDH1N/4pDafVYJuJ0aJXH4NQon+OpZWYlBEGbnuiwo0FFH4Jl2kDoS6eTD0C6ZTkudNRWa8+rMvqqN899T6+pj0p1nVGydUzk37zQ2HHfLeXMckS/qIdUHSi95Tp32FHrwzsY/nbwY5tHRaSzFbCAKlfdT9P8legffHIZetMleziyp2LmqzuIrWrv2tOqzJ5WpL6hovHIOBFwjrfRJDhyHMh01EW+DLhKPo+1xpYailt4HpDjSoMQWpFiT0h6Hgtuj0wbf5MMPNjDaprl0dsQwvH+D3MEnV37sR3g7mg7hEtZ6ardqWp27IbYvWltvan5+KcoXH2fNv3NseTbY9gw6ikip954OHdylA3t2OCnzK+jTht2TP3xc/9l//p/oD776+9qor6tmnnX21Wd1+9ZVlUoM3pgbWeGFtmavXtDy7DX1mnUbXm0bFImPkg59l6REikD6BSgAjvuM0zUdwNKzzGbPamVpUX/zb/6u/u1/99/R//Hf/rf07/9H/6G+9u1va7XZUK5cCT5p4eLa9RWZ6/hIB4ir0446Dp9tQHqRJnmzcwYtypNthXIOpfnD+x94UA9/6OPGW8mOIQKkW1vra0sqFPIan5jQ5z77GX3q0x9T1Ua+W7GeefoZvf766TCgSCJmlZMP32OrBi2a5rOFirMMrzedMEDhPFBVMTjAJyAt/Lbl3rhKVc+V8sLviRRTzwVwO+FcHu57RBRlMS8OI5NwfDNwm9GCIHgCnWtuA+TXfmxH5s/FAdQjLvOh8bx+6cFd+q3PHdWvPLRHB0ZtMPY2zLMaDjfgG4N4hwNdJJE6yB3vIF0MKXhrGrRwmnas5kjPA2femlZ5dNLVvClPx76vcUB2OMLh4Nk1FXH9wZUBWOerMLgWbYCxBWXBLl3b4Rg04cwiZDD8jfs89O88JA6RuAXyNTrnSY+8RhxpW0sGzJl5SHnhT0FWAdwNn/wG/gaGTa84VuTEahPT1dYAkFP0J4lPDQGE+imcH8Gn30ZnTuDIvB2c+tVw8IBBJoYhiq7AUeul0xMjQY9BEo6GdhbzRU2Q4Nvkp45pseav5upZXa/l9PpcS89c3tD3Ti3oG89f1Vd/cEp/9MQpPfHqVV24vaF112GzUFA9X1EjV0nbcmWKph9SNo8j29CS8cV5OraMg89QiDTcVvB761cmaDp94wpPC5T5Y+N8qIvxiDxJ+4MbZ86/mUTQauzn7ThDN2fg1O/bbsdN81Z72vE9kUYkQdORhuOnwzW2PLJhHu/Jr69boX0X3zr++EtA2e7BnxxQP0Ncxw1VFfU8eL5L4NMh/6M1EjEzieOgbbsCSZiumW1Np/z1s6fVaNR05KMfVWX3bo3t3afd+w/oysVLevnFl9Sqt0xPjskNli1AouGa9oqFos5fvKJL127pyH0Pa/+hE3rwwx/Tn/4zf1ZPPfmkzp89F4N0DOAzlY5JH0n2J5oHkD8xccyNk045JtKhxfTNt3ZOjuqoZXUlb9nrttul04lBFLcPgAHUjUxJLc7wIB63yQ1V7awf+p0Lb++MatmSlrJjqmdZkZyw0iQvlknoznChoHvHEdT/PuieZhRFC/6VIHimywzeme7BysOO7TFedF1eJFnfBRyZmVRpfDQN8JONQVa4RjzpEtc/2bY5TCmlM6QlHPwkdjMwgxmuJhiZmlJ+vArD3f7pLySEfW+3ybMHflHb1pUY/GDlBVQVbSzCpVaYajOhKPA6cJt1/T5wF3mxi4mXpGm9hrkyTAVi9cfYjskYCMmWWSWb2iC5Sf0E3A0gyjTIiL3hGzayrTqhsKZwXGiBW9ndursbQHfCLuk4t1bEwnHGas769ajTnmp1NWUZPtlsaqK+oemOr9ZjJloN7bQQ3NnqaKrhsOjoYD7sYcfBoKmf02Brqi9kKddGvalLV6/r8q0FbeQmdeQTv6Y9Jz5p+7Ki+tKcZl97Rq3FWy4a23AVtJYp6//P3n8Ga3ak54Hg83lvrve3vHcwBddoNNuS7CYpeq0Uo5mI+TWKUGyEFLG7E6vdUOyP/TN/NhS7E4rQamIoUiJ3RTa71Vy2SJHdaANvCkABVShfdb397ue93ed583xVBTSaIgpYYHZY+d2855w8eTLffPPN16Q9cO4JTB86avVMK8TSUtkdLTieJDwpO8ltaSua2KpBYKcjsC54r5akb+w8R+GX8dWOhAc3sYQwM750Xum/GiAOs96sJ4jPHZZL21pJ59WgR7vZML2iWCjgzs3bOHLkGP7xf/eP8S/+z/8C/6d//s/xK9/8JvbNzaFZKeL1l15AYWcbYca3ySO8aiVKRudbJJPI5wsolctIpTM4dPgQRkazNgCic2Otn0j9YCzZXZr//2MnOha+VQoNuuknvV3hrA3Wm+qBNKTJNwyTLLEVkLzXOTWxfgDRVh9R1kHM0y9tlZWuTEQTo1WvSmvoHa1TljHOJ2nvfxfcw0PQH7rP1JmKQ8ZtwpHCW/qMOolstiEb+KG5SZyZH8FoiEyBz2aced9aW2aD9+4+J+cpHLxq5YWYtSsTy0NmJq+OEwlHOwxW4RQrUgLUP6Nn1+nCsrF8ZrjyN5zt6GYOmFmOXrCDXGUD5eYeRXXLhK7bB56fEima1arOTx2cXs238J3/8Ge4fXUFhb0yCoUydvN7qLdr+OJXn0M4GSVMZLbS7SnoAxS4AXLI8ZEpRNQp1VfnMnHtodd1tuheZXNXU4DsVoY241qZ/Lh48V3823/7b1GruSWM8qb0eHHvfuc93+2otHcsN4tktSwjhZk1aAyde+xJnHr0McRGdYBtBqHJCQGFrlaz8Ko9fRtlzdCuoddqI5KJU8HvoelrYKWwioaP8WgEqJtNeGaxmb9wLCiIb8vbAPJgUfll9CtMsPBKKeJDBKn4OLKpcZMowtGDOGWlShMu/Rq9l5IrBUSKviFYOGDavDUa8LlOuFDET2Wkg7YGd/gc4LeiDqMXL65b9izIHb3JuXLqv965e1N+rONEeHBxXTwFkZZET55nzfK9yqrvlI/aqgaxVAzXwxkkLOrwD/Zr8Hf20MzfRr20ap0gIc3G7mt1RJh5MgHGV0tQdiw50+nAR9r213fYhpSmK4+iCE8BGsG2nUE4jmBiGt1ghsFBgiya11X1R0z4TR2wOtRmC1onoo1Fgr0iAs0loHQdzfX30C/cppKR4/sGY7nBVjm1J5VVNGXl9QWJb6q4oVGEJk4iOHcWg/gc21+CsVkWG1DTj+1T8RlXB/OrFTucEhYiqUfj17ZZYfvW8m/hKcxUgv0q/K1NwvM+GlsX0N65aIeZ64wObeumVNgKqNwwNWk7Pg3MDBGjji+tLCHu5FlO8Ui3NYyxDUZTXDnSiODpNwgzv1OHLl9JwRXdWQef1T/TEN8iXWgmSYftqtusst6aiERZtpBW+ihN8QYbQRlWEb+Vv/dfMA75hnB6l7YexNmnTIGJqV2IEo1+LFW+dH+Eg7CrPak+GRBQu+lWXLlZ1uEMLeHDXT2nj1X3MjRFe4YvZ8z0+y3UcyvoN3Po0TC4sprHj1+7gvT4In7xV3+dtKk9w4V7fcukxFT5LaCB0gbapOlL77yD67eXrL1qxYc6YDbWt/H+++9jZfkWRmNBRIjj2t6OdfwGzRDpWidiu9tFlQZZanwSsUSSUBNY0j1BtUEf1Z/Ad/j1KoJlCA3qGJCWetUN8qom6SeGQGYR3XAWf/3DH+H/9i//Jd56+wIuvX8Z7169issyOjZW8fj5xxCNx9But20ZvDM8RFMNtusi2nt34GsXSUPhu4egD5AkWbA9sH5s8F+egOiAf4UJTjVVzUKSsRaPaZupAct/mXIpR5wJehpajSbFmh+nT53F9PQsdPD+pXfew872Lvq0Ato0DM6cOYvJCfJfwxGxwTZl5RdC2GbajT2jV6KaV7Ue/obMxOpW94KO3t3yRvAOPZ3S5r3ol1CbYaJOekuFbVASxEd8IqQN6FyHs3EONQTRlqUrWpVsdc9GVeQR4hkykBVXEkmDDmFe07EwJkZTGB/NUAYHUS0V0NKgF7+xTjjlwOStBGwAEv3WMaIb4xSOU/ts9nQLgS7NaA0k9Mhnht4GGHRP/PQUp4VgV6viWh+MZ77BMPJHDWAM+KwJB13RQN290wCIfcfvlQbfhXgVHYc7NfKwOqIaKGFc21rJBkDU2Si5TpxoYJhl1/ZKtgUX8av3glGDxlZetXQrtEpNd/cfvfFnvSeWeVVcGwR2WLibrvBvbf+uZ0zVL9O0gWslY/VNmBhf9We5kb7V3m1tBenQKKFHeBk3EvTZbPExGvHaKEtyUJqX+L7pI6yTDvWNll9nAISxW6phdbNIWaIBackNygM2Buk2OlB8t1jDRqGK5d0yrm/ksFZsoulPIJQMWyetBm9F3+ILgl80abNWNRChtKzMLAiLYHSvMgjHHk/iG0OZnA0I6jsGuMFxzzOWpafvzSuc2JPcovxtke/XqCvmKw22Y7eKVt/diy+sMRXmqXrUllujqSjxozDWrwGmsri0HZ913uAyKBXHHh+6T+CGOHU1L4SK6ymM+GaQ9BBt9Vbt9XDhyhr14yjpXHX/4Mh3udyrz6EOMkxRtCR+rs6+a2++gtToGI48+Qz62iaKsdKUbRF+oEGQRos8MarVqiHki2Uks6NIZNK4vbqF9a1dzM7vx+Lioh28rAlhU9NzeOmnP6Gs7GDhyAnKyy5qDaYR0TmK6jxi+Y2XEx7xS8HmlVWdllp1TwCN1fg1+EgeWqqRzknzmghjk3CIHg1qRjttzAX7mO7VbKur2/4xLHeiaIbS1k6YjKFd63Dn/U1MUv+o+OJYCoxhGzFUyQ/6lAHGLxSZDWJYSw/iLD8rkLuaPcrHCPlpqtPEXKBLGKqIk2+7TlN+YDoe4xKWCGV8u95Ep0mbgu/V+dmlzmH3tGe1+sXsIyXPf7oO/afh7qXjpWp/womrL1avMTXTQghTl/ClFucw+vhZBEfTjKzvrPD/q3TONr3n74YJPaTHTm4PrZ0c/NQRDW98p05x2WcecfDCMN4O6czpNc65GA/iCIPaEr3BxT8DSbd81kSPSJj2Al2HuqR0FSmtBhcj20QDxeVHgkFmhb6Xvtik7AweO4ru3IxtO6f3KsMwrrx7UJv1fexD0CXDtbVjxGxDrSpTf0oLiTZ1p1vLyOSKiORyiO/tIbazjWh+F8HcNp/zSG3vIbqTpy1ZMfiRiqFlPETthPoDyyWN1E1Go44h/PDX5auNvRJ2q8RFiLwumkWMba+0u43G3hZalRxGp2YwMruANtPrE75snFZsu4Ti2g306yXDjfQd2RG2wpq2pBi6BnPtbD3qzufOnsXKyk0UigWqMCn86m/9bxBNjxhOtFmIDciYLaq6YLGFD+lKxEmc7b1dr+L6lfdQK5fwrV/+JfzWb/4Gvvblr+DZLz6LsYkpRFMjePLZryIejmJ7ZRnf+aN/j2P79+H/+n/5Fzh5/ATefP0NvP7qGygRP5ubO3iX+vsbr76Gwm4e89MzSCViSMWD2FxdYfirGJCffuHpp3Dq7BnsEBdvvvUWbt68iS998Us4deKkq2+jL1G35Iv7PbhzdMN/9iTOYilbmNOF3FvjPPb8aR2C7sqgKlRJ2FZJH/paENiAiKJYqpLF1JQNJL4jP9ZWxEF/xOygAeWcBpHsPeve7HXj0yqblYIv5Fy6CtG9+//QfZRTn9PDAZCH7jN2roGKTWhEWWamT9vkUHlUR9Dpg5M4MZ1Agga9Y1JkDJ7h5JjY0H0ezdrl6ZgzWZ0UWQo7E0wShIE+GWWbVyqTwR6ZnjpmqaRQ6kiZ1lJk/refFGwxJxnQ8tZBQKzIYFBamqngC/ewU1pDuZmjJKPiQzy5DjvxSApKrQhRZ3AvgHq5iReff5nXFm13N1NdqSidL375WaSyNC6oxPcpaLUiIxKI8rsgsokxpGNpp/QzTYdplc8xVBP4Vm56WQtWDYwj5sFC1et1/OQnP8H3//zPjSELH/bFfXV1/71L23kzoHXLckswCBMSHNqXPp0Zx+lzjyFNAdyNxeCLJxCMp22mV5dUE89kGXuAJhWYeruDxPgo/Ikwdup55NsFtIn7dq9LhUxGhyeYmJeUFPOEhdiwctgqBPXWUeBIwVO57CB6KR7+GBLxEQrwEcInfLvyfVxn6DTcMRvhyFWiy4swuAEAwSFlRTRDeKlg1dtV7OY3sUPf6TYQi7HelBRf20wJ4dGSHmbAC50Tfeok05WByo9C09oRy+1F41V3qnvNG/M6VSyM8BAm9x09adg6ZGhkBdVRr3M5aBAGOlQK6xvo7FxFfe8Wes084oksgpEx5hLntxoAIbCkO6VjZ+Aw/XCA9V3dgo9eKxGM6pit6yxxvsv6k7EbSEwB0THSM7kF6991OCtuB6EQn/m9Bk+1P7463/zdPaC+jObuRdQ23rFDw6PdEvMhn2Hx1DFjHWD8Rm1SZdasdNFVqxchrc0iMnUSgYnT6Cdm0fXHqbxrlEZKCpUQa+8E0OAIkV55ZV1q8NPOQGEe1pHEcOErrJR9TRosefQKN1Hfvoh27l0E67cRGWilRcM6W5koyyT8kBsS0L6MeJGtVw+iCw0kqdNXHdR8oFd9yQhnm0eU30TIg8Lm1bnlD5PW+W27p2EiUoMMcaZr7YH4Uz1LEbSZJKwb8aFem3Xa3GNWLX6fQCBC3qEOeMLm16Ai6UADb9p2Sm1JUAifNjvdvPJ0bczR28d3SlP/3c+V0gU6ArFQ4YXlULWoE96qRHyzU2bTqVsZnaSR+yg4XBhB5a3iCb/kj60yarlV1kIVlWYX7y8V8JOXL5OXJPDlL55GLFhmvRQxYNv0tWqkf+KruoleeQn9yh0099Zw8Z138d6VFfjVkcq01fWtTtAtbfvx7kXMTmTx9CNn4O800SgVECZv1uBNT7OtWUfVFukmGkdmdIx1pvVTbMuiN9EZf9aZyAKLPxsP4HNw0AAqS+hV1th4GhgEIwikF9An77p6+QoNkwsMb9E41XYDA+T2tml4XMMrr7yMy5ffw4njx5AkrzUepMFXyrE+23Nj5wZigQbDaD6GxhEbWSSteAMg/JlxLUIlxmWwOVnGdsA2Ln4qiGWkz87QuKVhrAGYWq1iez+L62yubuHEsdM4dfoUFhYW8f57l3CF8MrAW7qzgvOPnccxwqaBOtfpyjStbTAfhnXqu+TxGgDhO2MgqlAjFu/KuO5yz1vd83u7lxPMwqkLss48yVo90bC2bdWCCdJ/nO1AUBMK1YG+se+sVgiZuInu1QZMuyGeGENg2ZO4mONXWl0Qi4QwlolhPJ3CaDphhk67WSevJ+4FnvDnwWt7aBMn6sxuaw9r/sIs/0w2hoOTKRycSGJxLI3F8Qz2TWaxf2oEB6dHcXBmDIdmx3Fkbhwn9k3i2OIEjtFgOza89/xx+hMHp3DiwBSO75+ikTuJk4cmceowr9TLji1MMs4kzhycwJkDEzjJ++NM5wS/O8W0TsyP4/DsKA7zepB57Z+boAE8jumJUczxOkdYZqfHMDs1xjD6sSwmR9M2C3sim0I0HKJeQi5GWtIgtg3cmJesadmZFTqg268VJzTgh2eXmEzifYQyX4cta7WdyXy+G64sFi9w/IAVYXxD+BN+KfVUT8Rrh/jVAIhmlKud3ZUTTC8ZC+PgwhySkbB1KvjYflzHEylHPJu8sM34XbbVNp+396rY3i2RBjy+yauow6iAeakzuk5Zlid/2Sq3sVvpYGO3jKX1HeRK5Cnk39F4hPqgtuNRa2IebP+kGsofyWnxcfJ30R2BcOVS+/Dg5s+tVqKOrVnvei0yUkwjKF0Fj3FWi6cDbNXhqPTVmUROinKjYzywy7ysLPrW6JEXJipaN1omntLREEaog2k1kOHf4imG8OjiC06Dlc59bS/s6aF7cDfEqatPId5qlF58zVG76rBKYnr76hpqfR3oTXlitPBgTl/aADBvSOLmxKMEiXQJ20mR19zKLWzcvoKFoycwfuAodSy1B/JQtuGEZouzzdxZ30K91aJc6mJl+Q7KtSrubOzi4vVltq0ogpSF6uB7/vnnceXWbayub2L55nUsLd1hmYCry2tY2dgm3xxgPJOmPGV7YfrOxqCCILwYKgSvbogfwar3bNCabLNbqDJ/Vy6VQnqeOH+KwmB2UMcE9YoKIriKceQj4+gEY+QMLkkzF2ifTTPOoq+Nsj+B6/0UtqmPNcPaFitEvVR1QkhE77r5RE5puERkR+sxyvIOB0DGCYe2BzZ7Ra8pJxiF97RiyKskJ9VJbavz76MBouEDsNnzp+xU/CHXuUt/vAwHzwSn8jW7jPSjc7Ayi3PIPHICAW3hZU4xvW//V+ZMn7uvTuTcMzFDpaBXKKC6vo1Ay4YwjYvaqgB1ivPn8Oe+F06FJtPR3O0DY82o9z647tKKF6b3Jk9ZXwppafs60pnC1UcigaBvDCT7TpA7WmhS7gaOHUV7bhZthrsU5SxX92zthmkwkY83AOJwpLN+fNqmks82KZX6QqBYwsYPX0b16g1UlpfQXF5G584S78mDNteoTi+jenMZtdUNVLe30Q2xbNRl2tRTbJCVKdkApAeX5DxJ1gYqZB+1yEH2qm00u+R3/hgyqTQGrToGlV38wvmTeOaZJxBgmjovI0oVs1Ncx513XsIO+eWgWWMeYaajCQ/i5ORHxK2woXvZYeKjJ0+eRG5rGYVCDmHq+r/0a7+FWFZnbBIGwqKtvQSjBmA75LHRoM5MZfuv1/HiT57HH//7f4+fPP9D7O3u2krxrY1N1OoNbIjHrqxhdt9hPP70c7QdBnj/nbfxg+9+B9OTkzhy8BD+7Ht/jv/XH/2/sbKyihbpsVCqoJAvUc/vYi+Xx87mNkZH0jh4aD82V1bwxksvI7+zjS899ywePf+Y1enbTPPy++/j7NmzOHP6rA3Qysn+t9XTQqgj3wd0jm6ENzlhT/X2mQ6A6EuW1dkMemZu9o4xqddJxzP9y75hKvxIemhbIx6sL39YfROsc4YLH/rprBqXOj8RkSthhrt8HS9wOTx0H+UeDoA8dJ+9Y6O3gQNeTYCYBek6BVKhAR49MoH9o1Ho7AA1ZBlJ9zdiMS39Pl8ngUK4ZBDK+JSWQYE4CPTR7NWt0zpX3MJ2bh2laoFMi4KWCrmUAxmuNkuWqRgj0wxB71np2ACFcEJc9Pwt7JbXUWnk+B2VHSrqIearJYX8M+VV/DasGYHtAX74n3+CRqVuW2mJxfqDZNjBDs4//QhGJzNkqFSIyR8jwQh4y+8iiEdSSMXT4r6CwOrnnjOoPuCHrzXYEYlEsL6+ju985zu49N4lvlMHjRMOH+W8MQWr0SAfAqIDY/mEk+/U2WPb1hAnjUYXTz3zRcwvHqLhRgHB8JDgjKXQ02yK6XkKe+0Jm0AvmkJsbAr9eBj5dhm5yjaafSoZUgE0u7TXtjzUYa2ZWKZMKhsqRGYfqLOZdSkjyGb4U7AJtwHiVfUVDacxmZ1hOsNOjI/v1HGlWcDqXNTqJ9WxGLAAsRma/MkwUVeHDDQpZx00sV3YxMbOCpWKHdtnM5sZQTisQ1PVccM0JSwlFQmpymRKoqVmD/wJ2yqv8vA8712npT5TeUQv9ErP4rtXNlNE8axjX7NRSTPWVlvETRm+9jbau++jtvkO+qVb6DeKCIXiiGcOYBCZJa7DNF5ZHnWIMB2pBtpHXx3B6jAJNQugVglfT6sUHDyqf5sBLUhp0LWpGfTDIwglJ6ko0liWIk36Fi21O9oTvY9wVzszq6OsCH/1FppbF1DbuoheZQmRbhlR4lGdy0pVmajDSHXM6mD5FKTBgSAVbyrNif0ITz2G0OQ5WpSTxJYOqVUntr4T9kQ3+oiKE+tUnZx96/gaoOXrMQ2mzbdai6KhqrBWnBBPvdJNNHcvo5W7TOX3DkKdXUS07c1AM6K9OjN4eCVgUtgDUqKJNzszgqCrpUjF0qxibcfV9cXR8aVpiGfRCY2gGx7jdYzK+Sja/ixa/iRqPa13iTCNqNGL7XPd16J1DUip+qmYqzNioOE9nRmhOiaf6FVoILeohIbYxDLwhxzNqeza61bXoGY/OtDoWGqW3Rkcgp5GtspjGHtQJ8q1CvIexSekSjojQDOY1J5YMIbxSvgMn6xzf7/BOB5evat5A0rwUcklD9OWghqgvru9DOmkU9xFt5ZDxNdGvtjE7eUmXnzxOuZHw3jmbALh5k30c1fQXn8f/Z0ldHZusx1cRb9wHdi7w/dlXL22ijfeXSHL0cCU4A2zbUQJs2ZcNWkEtfDE449ibnIEBW13RcPM8XXBJ35HY4i0Pzo5jUg8TshZO4EwOmwT1pZVHCuX2in/qVmQ1gYaAKmuUxw1rc5C2QXSTBS7S0tYpNEynoijREOnXWvY4EOv3cDy0m2sri5jZmoKJ2iExrUXMI0PnRMz6BRYtluEvo5Gm7Qdn0Z85jDbT5xt8MMDIKwTyjLq5XzfRpuwatsNdXxqgC9EeXH06DGm3cOVy5eIB8oq1kW92kQ0EkcinsRffP/7+Iu/+AuUS6xDQqADmMPhCM6ffxzZbJp1Jl6i9qEGofL30GsVmEeDsYkX46miSHrSg2Ayb3gdPnuX4TP/vH4ifk966AfJV4bfiydrOyKW1QZAtI+xR3+iIuanWIoqyrS0WCbHT51cEa0ZzSlceYoH8mqgdjUYMkAyEsD0SArzUyOIhYKoVmtotrXqT9/zM8ZTPqwWBCW/yZOkV4QHLXzxkf34wrEJHKOMPzKdxcGZDA5OydPwpD8wmcL+yST2jyexbzSBxbEkFkeTWOD90M/TzzFsZoT3jL/AODMj9FmGEy7zDFvQd7zOMXw2HeM1hoVsHPOZGNOIY99kGgsTKcyM0TO/DGWyVrdkUnFk00mM8Co/mo5jLJ3AeDaJMdbrZCaJEwspnNufwbnFLK+jOHdgDGf3jeHUXBYnZlm2iQQOjjMP6oezST+mYgOMhTrIBlpI+ttsQ5T52vJBqzbEB8jndXaXZIQhm9fhthySdWpnqhPxVekXlFSsGsknvmKo8V7pbkxrkuXfPz+FMD9TR6cNjDCe9jpXA1RfsniQdMJ6s4vN7TyK1TrrSSsnGNFkhfJV+qx78xp40cAo23unj0qlit1iAxvFGu7sFHBjK4+9OtOnzhNORFnvIWbF+JQLgk8rMEVOogOpXeIDRv828CG26Hif2rJo1WQ53+udOfERIy49CC9qy5IX8pQzfJkrtanTMg/RseHMfecmrLj8NNgRZv4jhDFNQ93hjLgQKKJ95W6wML7yZE5yGmyxAjx0n9gNcSpc60leYab3Wt2Szkln1V4fb11ZQ4387JMOgBhN8aotAtVPY7JLORIEbf3UZbsPhcPYuv4eyhtLOHTiDGIjs2w/QVKYdCrCRZoOpkZo71BGUQ4285so59ZQpgzeKjVQD1Ani6VRajTRalbx4588Tx2SspByO8h2uHzrlm0ZExubZL4sE2VmOZ/H5Nio2UtOtRJNiq8LRgYQXhvkF/zkr8KQ2mmhUrOzRWzgm3nIVtCISKLbwqy/gWlfDaVAAu92xlCkrtVkO9S3fuXDuGpvM9Tp5vwdlBnvjj+NbcqRttqEL0IeTonG7K0NEFXDGvu4Tli2YulO7c9LLEJYtWXPHG2HMepAsT7lh8Xma5PPiiZ57KeM0ZayoHxt2mB7SIMifC/dzmb5K6779FN3StYl7e7MBKEbUu4wTLxDAyDaknb0wD6kzhx3h6B73w1j/91xrBvSZr9YRHVtCz7qkdpmyGSb8VX305+zUTwM2bOjNj27Nw/i7qVvT8OEvKvRJHl6iG1anbM6EFxb03ZJXyYjWY+CS/UsWSWhZVAT/ibbj+/kcXTm52wA5J6zHF0WKgO/V3E/9goQ5UWiUrdSNBjjuwD5E+Vp24fy7W3jDwO2CW1DFK51UCqW0EnG0KIu3Ka+JROsT76SmBhD6OAC2hHZTQxjmxP8bqUV7Wfpa2Q6bhIR7alY3CYz5YtV8iLXaT1GfelXvvwU/tvf/iYWqSv5WyVEaXfcvvQ23v7Rn2Hj/TfJK2g3Bqnvy3zmd6ZbMAv1I6is0iFkH/gDERw6uA+1wia2N9eRGp/HN/7ebyM1MoZWp8O6IK9k2XttymR+q3PMerTr8ls7+LM/+RP88D//Z6wvL6NZI++rN7CX28P6+iZWltewtLSCfL6EQ8dO4ez5LyC3V8AP//qvcPXSJSQzGdrfHfzJn34H9VaH+Y0iNTqKYIQ4I1ypTBZphk1NT+LQkUOYn5tGtVjA6y+9hFu3ruHpJ5/EM1942lae/+gnP8Z7F9/DJO2Pc2fOYnx8nDaEJqJ4g3osuOsreVDHb41YjYr43/F+10ZEk8zDC5fT86c1AOImQ5IyCMIHbAXRMfUpTaysdwaUPVUEqVxKx7OBNNoDmkyjAbeB7nltMTH9IvxWMmqg7RoNIs8ZXGpPyotxVGyjlofuo9zDAZCH7vNxbMBi4Jo+JyNViqNWf8xmo3jkwAQmE2Fo73PXtMVKjO3wng1c31oin5cjJMZTCIeYmJgp7Qh19NY7VWwX1rC+s4S90jbKtT1UG2WU62UKBSor0TCi4STL7JRNmzkgwUvrwRQCci63Vy3vmWZ7QEFV2kCzVWZ4x/BENQF9ra0kEEFGFEPstvtoVVt44fmX0Kw2rFPJZmTTjO37Ojh++gj2HZwlzgkthVNE23h0qIzTEElFspjITjE9pWQmred/1jF76yBwS+98tgLl/StX8O/+4A9QKBRMaP1NzoQBrxI3GgCRsiFmrXB3loMP2lbM7wvTAKrjC08/h+PHT1rta/Cio2uMCnAkhXB6HMF4EqHMOCKE38/7pr+PUquIreIai9NGIhamsG9S8JPRmUBV3Q3LxlSdRcR7elsBQaNHQaxT1UeQ32irsFgoiWkablpp49S3j+9UTslG1YpAsG1jjJyVnqNpu2MZdNh539dGpVnCxt4q6adodac6Hx0dRywap3CjAUlcaaWK6NF1nA4zcrcO0+7OhXte9woWIKIV/txMftGTXgnjUhK0ZkCrmOh51bYoEW0t1NlFr3AN9a130cpdQ7CxjmivZN/4SU/hkYPoR2a9ThNqnGrnTFeqgQaZaJkyH81Yb6JfL6DHcrrVDUxBgltgEUa/cEEloz2gQk0jOByJ20wJhWnlRzjYg/apD3ZKCJRX0dl8Dy0NfJSuI9TdoXHQYlugkmADf0Z1ZiB3NSNGg4SiZcHEum/RWPVlDiE6+zgCY2fRCU0QdtIElRBm5xyRM+zIIeYtXPWolRra51kDoDoYT1vHaDuYUKdggx1tG/i4gnbhJgLNLcR8VcLWYXLEMfFu1p7oQOVmuqpqU2DUScDwNhlMexBGaxBDJ5BlG5hBaOQA4TyCwMRRBMYPIUhv17GDCI0esPeh0X0IjswjnBhnWnH0aIBrOa3y06CfOuV6NvjGZ83KVNtjoQIsB1uLDVQ3NWuR9RiKkW9peyTiTt9pJYhrK/yOBGhLwa09CTNMW2naTzT3gM7w4X5ydhaDObVD5aC8mKc3AKI2oA1s/J0KQZHxr7K5b+2//XOwWccn69/27pWjEeWjMttnvbXz2wDT6LfrWN+q4NpyE+9fuo2nz47gl760D6jegK+6hlCjiAC9v0ne19pFqL/Ha8E6A9e2injz8grafa3E0Rog0ggRFiDuw1SuKzQGDizM4NHTh9Fp5NCs6OwccmDSnOxFo1Uaecl0GsnsGMsWYQlVK2xLhHmIV8O28TC3AkQDIH3C5tM2YMw3kJjB8o111HJ5jJJvzI2NYCKdxcqdFfRpXfV6bYTDIVtJNz42hq999avQYcYaiNc5PmB5Wru34O8WSTY0ENNziGhViS9h5TJIjJ+IlvXEwvNbkzXkn7lyGZ1WG3HmPeh1EU8kcez4cSzMz2J3YwO5zU0aZTFsbm7jwoU38cILL2B7e8fo0maukVeoY/jLX/kFzBNfji8N89GV7U7bc2nbJcklY4aiDNIf8WIUQPQMKUFY052anL1QqBdP39lWkOStojGlb1fJBZZVK0B8QZbDwgwC50TzjGppmOcbpuWuLk9HrfIyYDXIzncGP9+QP4aIsyjrNh2LYGIsTSMwYwZwvUp6bNbECUg3bpCeWLGBZHXQR8hDnz4xi6PjUUyEaHjSJ4M++oH5BPWSGNtmjDw8ZkNhPRpt8i4/d+95xtMKi4CW29s2XTLwSHW810Hl2rYrTFj9NHyln4XIK6IsRpTtL8T6t+2ubHWgmx0ZCdNIb7dRr9VZSmKB9SPdRZ04doC7hw0bWCc8+0dCODgSxlQyiJl0BLOen8tEsEDdcHE0gf1jceyfSNrAzuHpLI7OjOD43CiOLY7h6AH5CRyhMbp/ZgLzEyOYzMQxGo8gGw8jHvQTVsoOySPS/b2VJG4CTpA069chydK1yA9Ubl+ngWwigkP7ZpFJRAk75Rk90W98p8syq/7tmfgQvRZKVaxu7KBOWaPOWjuLTK/VRngnuhzSpqMFR0vSBbQ9UJM6R67Rx1aphfVCHau7JWzlKqg3+7bFTzSmQRM/OjS4bQKO0hLrJc5tkoX3M/2S9Sfc89Zyk3OrWnQdPht0iqXaNni1IrDK/PKVJnSYM2vJ6W/6UPDyE4OZVw2qx0ibo6kY4iGiRThlSi5VZcyYAsCenJdzHRDyD90ndUOcerVi3uHa1b94j2jx3gDIp7MCRJ4qqOlAyk0/7T3eoX6hbTwVunPzPfTzmzh4/DRC6WmCQ72KH1FjsE7HbkArnchdyru4fuGnuP32y3ZY+djiUcQn96Ptj5JWpKO0sLG6hImJSUyOj5KfdXH7+jUcPHsemakF+Glb7ezkUC0XMDM5hmQqLjCt7JrYxMZimPAFKJtIo+aIE6lEgXAYtUbLtg6WQm1tlnI6yigJ2m6TfvKBYBs71KOuDCZQ9CctjhAg+ddm2jozaBKUo/4uiuSc6/4E8mwrDaYvmyaoLWEZX7JR7WhYYw/i7Fuv7oYDIFHajlnaO7OBLrKa+NNrWju1yIRRP9GHuE2I+FDnqGZZN1vUjwU/27DVGHnzJ6GLv8kp1XspuyfhQndDyjV70AFtOFaH+OTRQ0icOoxBUtOKhjH/Djox+nIVleUNgLpBWDRozN9e0qvF6U5X1qY9iN5c7QvZxrM/Nvr4vb7z0rRk3Yu7tKwORZM55AXqdNcESU1Sk5eMktP3+nNe9ch6p93RoI2hAZC2NwDiYsvZF+adnsly8fJxB0BEXX22v2AgZv0tXebXJr0HyXvGEmOYPbAfo/vnMT05hSzlb6FRR/bMCYyfO4P0gUPIxmg/ra0hMz2J7r55VMUfBAjbnK08ZnrSE8XXBKBWYdokOw1+krdVqm20WuQ5DI9EA5hKhzCbCiJFnT1C/fWNl17AT3/4V9i7c5X2RIU8iTyKugBTZ9mIA+Yh3Nq2YkxXOrqcLxTBU0+cx+/8ytfw67/6K3jyS7+IiYVD5F0Rs9FsRT91LutYZxtXH1KjVsV//Pa38dbbb6FVrxOeMGKxBBLEWSyeQjo7iuzYhA1m8B/2HTmBc09/AU1vMOsg9ffzTz6F7MQErt26hezkBKYXFnHg6DGc/8Kz+Mov/TK++OWv4Etf/TrOPfYYRnVAvs72TcQwPT6OR8+cwZe++AVMz06bHZ7OZnHsxHE89uhjOH7sBFK0EWQr2QC5oyyV1Mr7YI7fG/25NCQT1To+iwEQx9uId4KgmtSqD+lW1u+jQXnKnWtL63jtwjvUG4sYyY6wLiKoUc28tZXHhSvv49raOkodP9LEYYzyKuzJGlGc8lMxZMsy1HI13cxr567suj50H3YPB0Aeus/F2eAHXZ9GtGaG256JnRZOLYzh5Pw4jXbHXIYtV8aUmIhm0lkjZ/Dn2aad8SoljTASEB3CXG+Xsbm7jM38Ckr1HMNaCETI8PROh9426xReA0SopMdCKWNSSsUGQJiMdcSJY5EvWrpSIigsN7ZW0OT3OhgwONBMJj8Nd3XMk3ny2wAV6xB9o9rCT7UFVqnO98QZv9X+1cGID/sOLODosUMIURBHtGy7QQUikEKPmnnIF8HkKI0SKgXqPjQABIfnDUaVWVeVW0JJjIPKg7Yzeemll/Cn3/5Te6fBEVMKfp7z0gtQww2I+VNZkDJrM8jodbCT7ZmuDt9WD0cPH8FjZ8/ZbCXNulTBNKtCYkadeywQBZU6+TKmLAxCxNfeKlrqjPd30KLipZ4JN4uWeGO6muWumdZED+8ED5GlaiQ8YabVbbVtKw6967WJP34TDyUwnpkk7mnAWM/Zx3dSPiSMNKOBBG9olnDXjFRexI0ZhyVjuAatdJ5JrrxFelqlMtR2MzkIy2h2gjREw47w9okwlUkrJqySmJDNLtOt/Xf4dU8O98N6tdf2T+9ZF8KTgkiMtm0I89T5EDQ/mG+beOsirE7V4k201l9HY/tNO1xcB95GfepAEtWS5qJxhLJzGEQmSFLCF1OVMLbBEJZN6VtOUuKUXRud2h7zqxtfEB3ZFjo01N0ZOn20SGfaRzYYzSDI9mOHbaKGUH8L/coVNLcvoJ+7jEBhGYG6OqI1s9x1wmoGsPCicjJHwsD612oIv7au6qPZJ+TxGfjHTiIy/TgCI0fRC40S53zP9tYnrbql+ARF9Ec8OE865n/N6FfB+uo0o/Eb9zcR6+eByi00Ny4QTxfQq1xHoLltKz7U8ah9pcXJTAkibcoIl1LleFuQ6altEEPMu9KPoR6iMjpyENGpUwhPP4Lw5BkEMieAFBXd1D4gPgvEJuEjzv2RMSrdY2z34wjFeI2NIpSeg5/fB1MLNPTHSGoyTHpUjEXfojnCIhTREFFvhmhGdG6dFMSRVoKEacwEqCQbjyAv0oAhdTCWn98Zzd3Ds7zDjihMYQ/m9L1L01GMM2aUneu4sZlXaj8EQhfFUSesr+vOMFHeDoZhCvIqoniO8C5YGaqOTrY5faNVTK3itg2aNUl3m2Xgjau7yOU38OyT8+RHC0Z7UkJD5MM+66QX7yO/D7DNaCCPdbpT7pryvF1ssx3okHHSiNqUjBDCrxlZg14LJ4/PYDIbQpPK76BF+lKbIe4kH3RWk2ZnJidnEImlSJMskXqLxabvw6sZl3zUQdWDyjL9Ok24JtESQrubwu2bWxg0OoiyTimSMDEyQWV6DCM0cnZyOdSaDeLDh8nxSfzKt34NYa2KIW7CgR6/y6FbXEawV2H7YXiCsGTnGZ8GJnmw8OoMUxIs7zWIrvarjlnNyNX+7T/6wQ/RrFYwOzdv8WVonaDB89Rjj2BmYgzr6xvY3t1Bfi+HSr1ks+plR8YSCcLzK/gn/9t/gscefwSxqDqQxBPEq4gERVIdky8NepJ7rHuhwupX73jvqti7ElZHsIwj6iCdeu3O6Jb4vTsgyTi8cVe2SfGyQShGsteKHktMqVgcR5fDNFU5Mjxd/uJzlqPiWFrk28zTDTz6zJCVLGLq/JJ4Y7j2+h3NxDE3kcJYMmEDEu1akcZnk+1ah/wSB6pL5hcnzZ6cn8RkTIMhNdKN3qld9My70rnBBnln/HkwmXdlMD2M4doaQQMfhgF+r84wN1tasVwrJ8GTZRFi8i21I+WiwW5tA6VBL221o+2kVD110nS9wTYg2UZ43aSCe7Cw4twsSpYxG/YjLkuxp7ZBT4NbAy2SLVp5oUGWEBuGBlwS4SBSNNy16mAkFYPOnphORTDL63wmigNjcRwm/o5O0U9ncHQmS/1yBKcWx0zPPDE/hqOTWSyMRDAVI77DxF+nYfIsRh8mXiNsrxqYmR3P4tCCVoC2CbcGP9RORYda8Ub80BsvZ3vo9ALYzBWxkduDDlDWykAiku+1pkL0KTzomRiQDGfprJNDtMNyDfEp/qozSTrkMXuVNrarbdzeLuLm+jZ2qlTgwjEkEhFEQpIX/CONassEdeYqbbVf0y1YB1opQk3DwaHIct79Xc94jGEDbD6m2eG3u8UmDXENuao9EV6jb1GttZa7V51vlWR9jBCesMrnDYDorbUVw437zvJn3vbghTx0n9wZXs0Na0b4Vm2pHsR7Pv0BEDmxuSEvdTXswtzqngDtDT8K199GeekKfJRhGtTbZfsoFEoolivYKxRt7/gO5UN7awnLF15Aae02wfIhkppAkaSeLzVQKpaxt7GG0vYmSpRZzVKB9xvY3NrG5METCI9M4s6qtsDqYSyVQLtRw/T0JMKkS7IegsKy0onXqP0atTMPch5rJ4Eg8UETY0tnT6ntEH7FDVFGRxplVDbvUGdqIBfMYsk3hnogZpimlWDlta1a2A4SjNMjr77DMm62mG46a7YJtIKQbdmtWFV9yD047u17r+6EdzUpHZKrFSAz/i4yvTJiNPQ04UJSeQinySe7of6iGe+U9ZpooZWWcuogtW2WvbQ/7MTOPgHY9ql1zgkmLw+Boxdi/RbCf6ohlU/1IM45cfQQoscPAckIX3sf/F10bL+oVNie1uCrys5RIBHHipG8dZQlvDksiUblhlsXOp7wgM7qzTnR290H7140I9qxiT60V7VaQZMkO6T5pmxxxZOT/jL8iGkG+NikTTw4dQItylmdASIaGWYwvNM5CpYHP/3YAyBmp7GN0nZpUbfoUia2QgwjjLFogjYS9axMAgnqFAPK1zu5LSTPHEXs8AEMsqPw16qoXn0fMeqrrX37UCe/kE0rddJWV4nfyb6kDJZjssyfspP1FY3F0GYUnaXVYpgON+9U8oi0G9Q/kthdvoXvf+/PsXRzCX7hiW4QidE2ZTrMx8FOnKoOVVLeu7Pu+D4cxz/4B38fzz5yDIuzOk/kELqRFNosq0hF2x0LlTpPkhwAbepT0XgUyUwSTzz1JL745V/A0899kf5LOP/F5/DUl34BT3zxS3iK4Y8+/QzOP/scTjz2OPy069VZv7B/P44cP46Dx45jgvr8yUcewzNf+Qoee+YZnH78CRw9fQ6HTp7C/IFDGJmcQoT1IN03EQlgamwERw8cwBeefBILczMGl1Z5zM7N4fSZMzh86DDSqTTLxTpjMbVrit4r4s/jR387p/rX9y4NyUTLw8LEh8QjXbicnj+1LbC8/04Tcu1SOp699YewVenizSvLWFpbw77FOczOzFLt8+Gd62t4+a33sbK5is18Hiu7dQQiWYzH40hTNZQ0G8Is+pYOqdXmsjscx3c6/33N6KH7kHs4APLQfebO2iKZgBiQNNOgOoMpEP0UYuePTNEoTdksQ2NajGXtV0ojb2xGORu6Qu37z8lZZy5/1pkbpBJNQ7lQ2cXa7hIa2n4l0iPDbFDoNSmEqFWrh4NlbjRa0KFGaZ0nIYNS5aSgEnu0Q/nEPHkVe5YSoc6QcqmEdrOBGo2ALhXqQVsDIOSAXSoWDcbpEJZuALubRbz+4pvo1qkuagsPddpQ0GsWhkbgp2ammE4XO5t5rC9toV5q4ujBk9Qn08gmR0wx0DcSPPc7q6+7uHaCSQMdGgDZ29vD9773Pbz55hsW9jc7pTHsWOH/AfPyDH8NgMjr59JhrswoSWb/7DNPYXxyBIOOZvEzXAK9L9bOWISho07bgOavEiX87eQ20WiVmQfTJF4i4TTz1JZffhrqEQR7FB06zLzDdNo9dFpUUxo6jHeAWqGFar6GYq6AnbUdbC1vYfXmBtAK4/TRc9CZKRItD+I0SKEtiAS/bX/lCS7RkPb1VMeQcC0lTwMeCHZt+6u9yjbLx3omzMlYFpPj0wj7daCwOtmC/I60IHy6ihJyhzfmPwgvw4bveWvC0cKkyBGnpphKsdJM3i7hUmdPi9nX4avtoL15Be2Ni/BXbyLcp+IJbdujLk+Wpa99wvk1FaVgdpEK3DRDNVuLbwUfhb3NNB0OSKjaaBiK7rv1XfRaeSoUMk4JD+FQm7dOJuIDVBj7mpnLeg6oI14rqvJ30Mi/h/r22+gXryHU2EJIBp91MKncxJlm9DNNPhLnwrfaWYSwBmnMSslJwJdaQGjqNEITp+DPHEHHn2Fu/F5wiD6FJCk8elRnF3Ej3iN1SCuw1F0VHNQR9TUQ7uaBwh3UN7QS5T34K7cYtu0OOCcvMIpnWjZbSCggbNqn3fpxSQOaYd/TigHSqz+QJA7HEJg8icjUKURHjyKUOQh/Yh8G0Vl0QxNkAaNU5FPQVlhufje/paGtbbugM0F8IaYdYnlivGYQiE7An5qCn3SkgRYbrNRMSOHdijmkF8JHGFVOHbreJW/WNmtBGgr+OA16baulFSM0bmTQS9lyXaP63sOXPX0CY8uc6t6l6hRPhrAyHfb1ExJFI+Klisf6VVk6NZKZBkAEl4Phfjhc54xLT6M4GvzQyh10axiUt9Gt7iFE+g+EQqh1Y3jj0iaKpRx+4elD2DebYu5t5kMY1AalzIaFAeJIK40MxiCK9QAu3crh1noJPW2DRRmglTU62M7XI2TE++7uJvYvpnDqyCT6jTra6tgE+bBmb5H3i44rzSayE5NIZhlHdBOSISP+4cqkMiieAkJaAVJeRr+yjkCPaflIC8Ep7Obq8JMX9rUMPsA6I03Uuz7cXFnD8vYWjTJyXobX603G6dkKs2Q6xfZG2mgX0dy5iRjlWVdw6xD0iQMs78+uABFEGqCXRBOda1uRWDyJC29cwP/4L/8lLl18F/l8AbVaTVVmndkjKRmqA6xvbqNYJt8mnhKpFH75W9/EP/un/xS/8/d/B+efeAyJZBydLuvUOpvFh5mLs/iJzxrhrpIGvAEQ0oFuhB/9++ir/g89ndGPfvpWASqP4z9uRjzxpm3gtA2f4tC5dPSpZJioTd/K/BjmLfobeo8OLV99xp9gVEXKaDbeq/cujtikto6aHolhYTJpHf6NegVNykF18tlWXV22esqKM4dmMJ8N2XZYriNePEapKXF5/mcDkfey573KIIl7nxPPVaefdDJG1Go5G/RimbUNpYZ4e9qei7wzV+9jo9jE0m4Ft7ZLuO35OztlLG2Xsc7w7Xwd5XqHuCNNqANShfV4uzVYwcOLQNKgQCYaZDlDpluoA0U6kr3lN+pY0JPEgcqgtm8DoMIt3/up64Spa0XYriLkVzFCm2CbTrLNZUJ9jER8mEiGaECGMJkMYyYVxdxo3LYDOzCRwuHZDI4vjuD4vnEcmpvAvskJzI6PYDydhM4UyCbJ+5iX2/db8EtOip/rWagTRFGUay2sbueQ14HKbK/aJpFv7RszSq0OrMQMVYh4Ld+SVnqGDKVHnFs9yqglDw+EQVUPlU4fpWYHu6U61rb2sLlbsD2iY4RNssOv/cmDrCPWrUjKZnQzq65WDCtLOV4Ft3dj9/Li/x422Z4DqHd62C1WjdZVUsHi9AV946TEsO40aJaJUa9l/en8D+PBRvsqo9PxXLnklIuc/rvc3fND90mcq1M5r80YXl2NCueitU9/AGRYk8rTPQ1pRHJAbVZb9BSX3ke7sIZDJ88gNbkficwoEum0nWen2a6peIxtP4R2aRfVvS2j2+n5/Zg9eAqjUwuIJtK2rU46FsYY2+P68m0sTo8jy29WVtcwc+QUCm1tEkx+OTPnHax+nbJ1DskU5ZR4pckMYkOrt9TjaiiSbipoWQLyJ/W1rW3u2szwAXlgmOm08tu4/MoLeOWFH+LizRvY9iUQ2XeS6jdlOvlYQAPBTEvaiPhxbW8Tr73yIn7w4stY08HK6RFEklnGi1PVUG2wLthe9LM2/oDOge3hX+mQr8RYABsAodwe6bszQDRZziSS5LO1Qa/OxX8JhybFaWscTWbrtjQRhGUxvsvX9v+eG7Z3cx9++bd0+sxNDhCfcfRyj2Yc9erZtuJiuaR/awus8QP7ED12kPo6bR+P3v5OOuKlt1dAVQMglDGaDyO7ynYUEB49L9wJSyYv9Zkqlt4wp4CP6fSJ9EzZibpXcnJeslZnCmJ2zobjjfQNTZzyB/02wKaDndkSvVj0jKf6DZI0G9JLTx9Ha2HWVhxKcrgU5b20WUbJTpHuxx8AYcmpL9o5pVIdhRjp5KStLnWeDsNaPtq8nQ661uG8jdjhBXRGRtBS30ixiPq1K0jNzmJw8Cia4ThhdPaPKWvkJVQQje/ZsKrkX4B1pT4uvovFYqjUGyhXi6ZXZyN+3L70Dp7//n/Eqz/9MfnVCuU0bSzm5QtGbBBINqtQafqNimBI0EAIUUd9R7Z3h3L/N37z1zET96NRKRGPCTSCCZYtzLxZdiJL+qsmzWiVm3AitXl8Ygzjk5MYox+dnOJ12gYsxsk/0wzLaiXMxBQm5hYQy4yQt0pXIb5oswejWhkSpr4RwagOOR8dN54ez47SxowTt+Slng6hDn+dOZJgedPk91HWcyIiu4G6pXQo8lmtArHJuaQVoxvqK+JBemd80vs9uBsiz6WhvCUbP5MBEPdHry+Fe/WWeG+Zx9JeE+/e3kImncDpE4cwkkkiX2nj9Uu3sURZlOXz+NgktssDFGvAoekMMmwwPbYlaw+CiYnZSmPmbphiuLUfhvO/A+Ch+xmntvFwAOSh++ydmLIYAhmQhKo6XrNkjk8dpeFJQ1772w1b7VCYqCmbMUgGMhTqn59zDNMA8ffRGbSwW9jCXnWbylqTzKhpHdiS7GJSto8hGbo6EQddCoCoO/BzoJnH6kCj0FSCwocOp7VDbweaQRHGaDqL9ZUN/MH//Ef43rf/Eq+98DZ+8oPX8aMfvoJXXnwbL/z4NfzoB6/g7dcvY2+zjF4zgEA/SqM0at9LCO7u5PH+1ev46U9exasvvIF337qMa5du4pGTj+HE0VO2KkSd6YLPGefOmd5ABquZOSqqcVPVmRnWPlylAvL7f/AHyOVyVo/G1n9OxSjYiVAJHs0SDZpiq05zJSyxoHoPEt7hVipaNfP0F5/CwSP7qNx00bFDBCmAterD0uN3vJECr8EiGTMXL76H7377e3jxR6/jtZ+8h1d/+A5e/cEFvPajt/Hy8xfw0vNv4KUfvkn/Gl6U/4F7fvmHb+P1n76Lt165jJf57dsvvourb93EhRcv0agZ4AtPfQXJRErAPpATxWi1gDv/Q7TBspAubJYm36kzRzPJ1WmmGSI9XwvbhXXUtL0LbRbV58zEIkYzk0SXyk/Fki+0d6nVC9NwFebaiupJYfrpqhk1ThFUXDnVAy+Mp/pQvGFntgY//D51elfRbebRKd5Bc+UCQoXbCDX2EOrXEAh1jXY163RA+tcB4zaIFaWxmjkERBZZhogJGaWqTmGtNNCKDGUrxVdbDGhprq9dQL++bbO4aXpavZryIyWS7ctWM3XrGNQLCNR2aADcQWfvFu9XEW7nEfPVECIMQ+XDlZ1lVTnUsa17lcvKSGOvT9oLjSA4dgKR2fMIjJ1CLzJFZTJGmAkB8WCKMuP7pczpSyo9KomQJiPS6F3GdI8KbXcDyF9Cd+MCBjuXESC+wrYlUtU6hKy71gxwVqTKLUIVX9NMYsHHq5bFthBCw59ELzaH4MQJBGce4/U0gsn98IUniK8MIdBABxUy8kIdrCniGK4aYWIiNHq2Whn5wjd5idbLCIqOL8xyxzGIpBBKjCOQGkWn1WUdk1/1NDgrXFGxUj2ybeocmqBfnap9NGgYaKAxFB9nEeK2QkaDpjbTXINO/NJWjTAf1aCjuk/iXJ2ZUiqcC/9MUJ6AMJw/RVE80qFUQfEMmz/drbJetP2Do2di3CUnZ7QhaBXGdyybrRrRMECziG5hE/62BqxabGED1Bp+vPDaLdTKNfy9XzyGhek4cdXkeyYldIkRacUW24twZ+Um3fcCKVxZKuLdm+vosq3b2R30AZWF+ar+m60a2/MAZ47NYDQeQrdRJ79mffWCjCdjyIdmr8+6SiM9oZlBMdarj/SrNkT4hQ/+ZJSqfWsAxFdetjNABr0GDZQ0gpPHEU3OoFppok14q602fvDyK3j+zbcRHZ/Ek1/7Gi68fxVNfq8V+u+9exkvvPgyXnzxBfi6NRw/Oo9u7jYC3ZLJ30FsCtHRRd7fvwJEyHAINrObxlm/1zaaC9Lw08Dvqy/+GP/5L/8S77xzET/6yU/trI8/+863cfMajdhIDCUa8xX6b/3qr+H/+M//OX77d3/Hzv0YmxgnDTNNlrWjFTS8apWMcnKry3g7oMxtVdXTazUro1GVY7QjHmK4EoU4J1nmvPiirm5AzcrCb/qke60gJALse80ItkOgQ1EyYm0KpZguNiOYl1FkHMPagEJcHYkeTbZ5HsSL6EAdF+4MNJVNtE2aZlvVFnP61g4SJZ/QjPpMLGjncajTT0KuTeO/SfDUSRQJ9Gh8TWEmFUKcZdTAmniXg0zlF5wOTHVMSG47HCqUsbxwuzJMxrr6yzs9BsjIjWpLJmCn2sdNbet2dRVv3dzGmze2cHE5h6ubVVzbbeDGbh3Xd2q4vlXBne0aVveqWNmhQU6jPkb61YDG3TyVrbJ02QsAq4tkJEhdRDoQvUUTrHxHIe9W2tmfC7cbr06tPRHX5NVMzBLX1pAqvuIM4w1IH0Yj0jPUvlj5MbaneCiATDRgbXCKBudkNoGpcZ1P4s5Hi5M+RcPy1sHRd97Ou7EwyXXNVA5gq1DEynYOjZ62AAqTh5JeNPObbcEGNsSnHdTOsSAqyrBuVBR1GthAL1/YmVeMLny5OJr04Uep0cOmzieiAX1zo2Cr1XT2WyzGPIkvFdXwKgWJV6FC6ajJMBW7v+fEQ0R3eu+3s37K5Bc1EpkGr0S5jkZdbF2Uhj0SSHVwjKdjSIRYB5QH1joNbkf5hn1+r/Yw9PapCkXvJfvQfQI3xCkxTz+sIeHaap53PzsAog5DI6wHdMpRdSjeaXJN+fIqe0HtS9NDoqTZ8tpV1HJ3sHjkJEYWj8OXTFGF9SMW8WOEbS4ZDSKf24E/EsXYwmFMHz6Fkfkj6FNXiSQSthIwFo8hlUkhzuvq8i3MTmRoCQxwZ2UV8elF6jUJjE7NI6bOuXYDpfwuJiZGMDo6Rt7DshoPcDhRk3ADEbwh/EHRPtsv2SpWtvKgdmso3Fu7jdf++vtYvfw2KrRx+tMLGDvxCEIjk2zXbM8qc4B6VY8Mkz7OdqAVYus767hz8xZ21zaQK9YQpE6c5jcaiBnYrHOHP8PXgzrmLbzLuYkr5GWEIdtqYpbyKzOoIEodJqgBEMFpyoo+Y/78TmJHTrpDmLzZ+D51PNsuh7LHmA/d/RBac7Ube3wgp08/PABCNmrhksXmFEb+YZOy+KDtirKLC4idoF2RdtuauS/+jjniR7ZJa3sH9dVNBOqaiEPaJf4kJzQJw2jK/sRv1RZdmIdy1bw9Oz3gb+/5z1J0tOQ4ixI0OeXlK1tWupomMPTYmGybXb7XKhDJIe2ooO2uZOu6n9ISr9AKENoNp46jsTgLrbMUDxmm71bP6pFfKD8+fNwBEH0nKaytNzXxxtelLqmOdiamlqGz6jSJKS7Bub2H3dw2kgszCGQ0eBlFoFBA6fplxGdm0d13BDXq+I5wmTOBtdUgbN/6mRCXLRWQPsr6YZlj5EEx5tFtlDCa9OHgTBZv/vSH+MFffh87O7toNmW/Uu+hvtCi7jLoN8lP+kjTjgtTnxa2bVss6v4h4ltWnXTEBuvjqScex8HRGPPpoBnLohlKos1iaIJaKEz+1JV9Qr1BdcKf2rtWlwt0rdJpUs7LLtaqXU0olZ3Qot7WJZPQZIomDQPpViqjBolFRZLr2vZPek2HxZUFaOeVMI7kvq0kNZtXxMmyaAAkGmVdM7Lp6SwLARAfNl4syPjNsB9J5VVZmaLVnWjhwR0Lel8akonEsNGWtQjTTVy43Kc5AKJ85IdOcliSUe8GrIdbuzVcWtnF4swUji9O2/Zotzf2mO8WwvEMfuGJkzh3fD917zaWN4p49PAYJqjrE1EyIJiOJsOxrtQ3ynRVJMvP6F5lsWwfuo9wDwdAHrrPxUmIO/Zg7ZRMsYd9Yyk8un8UYxoEJmOVEaiG7AS2GAjZkzGqIWu5x1Q+vtO3Q/9hDqFnMRYXLvhcfp43uDwYGE17QDd7NcrMNVTbBW/1R5svySz53jruVB56u6e0kEGdSCaYPYWyP+SlJiOU7FMcS/HkiZdINIT33n0X3/nj72Hp+jr2tsvY26lgb7eM3d0idjbyKPC+nKsx7QCNAhnrZIYd5UeRz/QaFK7FQhl5xm/QsC3lKyjkymhWW/jmL38LUcIjpcLq5W75HJNX+Q08MX9eVRuCT8vD33jjdfzhv/939k6Kj33Pz4Yd7S4dd9V/KTW60yCWtofQmR9KU0JDipy6LwYSInwXoPJUrVXwxFPncejoQabLume5qK4zAUGhUXA3y9sYGQW0yvCdP/2P+PZ/+C7uXF/D5p095Dcq2Li5g731IrbX97C9RuVmPY8d+l0KlPx2FcXduvnCNq87ZdRLLdQKTdR4rRe76LVCOH70FA4foQJuNDN0Ks39Tu/u93IeBlRQUTPxO/ATZiKj3q5jZ28T6xtLqDertre3X9ogEdGlYN3Nb6HRZr3y22x8EnMTB2z1h85vCQe0CoSYEy4kDJWfVZauvJhzmDcnyejFsfrhvSkAVHz0Rp1u/kHHOzejCl8nj055FdWdG2jtXkessYowwwJSHNUxyPjqpJIgDrA8Wr3Rl0EdpmGa3kcDd5JpasMxr61b/WorLSrtyouKqML8VBIDgSrQ2KXhynwJl8XX4FCfChsfFGY00qvD19iDr5Wn0ltGeFCnIqjtsTrEhVNObKWJLFzly7KonILLZ4OBIbRIP37NYp89jdD0o/ClDqITHEWLCm2HuLTOXKUkWuZV1eboWOpFh7ihAkofZJv3NXfQLd5CffNt9HYvI1C+jXA7hxDh0sCBVqPYLGUxAtaVSiEQrY255kVaYDtgKZq+uDe7/jiic+cQGD+JfmyR1TPGdpKich8lBFR77UMp88I5cdfXfvWa+9jmWxq8GkbxNXilGU84/F1dG8Qx4/k14Cp88TtWlT9MdT1MFbZVYTx6Hw0JbyBLW9mIhxluiQvVuPIPhtMIxlJMj3iWga06Jd1IGVS9qcJ01cACsacQPXnXj3J658r0Qe85jwFZ86EbKq0yxFTLqit18Fkshtn2YloBQgNCmLX3Bob9YySXkEuHNorBS37drWJQy6Fb2iSFaNWTBn6CKJQH+O5fXUAkFMDf+9ohpKJd0p6pmsyX/FVVq9UWAcJDnMnYIfKovI7h5loZr168gy4VVa2GMCOJ5KUm7g6276JaKuIwlefjB6bZtpo0RggKFW5hRNsAyajVjLiR6XmEkmmrF6m8bia5SkA6sBtSUb8OVDQAsml1Iz4bTM8gNruIeDxC2bHG2KzJUBjPfuNb+K1/9N/gkaefxrWlZdxZX2e+AzQrdcqVXdy+fQPN8i6+fv4UfPUd0nSV37IdJWcRGVskTZJeSQ9ebbv6IRxWLKGG/5S/ZqhPjo1ge3MNb7z+OirVCo3LHDbW17CzuUW/ibWNLTz+5FP4Z//7/x1++3d+F488+giyIyPWjocDxKovV06VW9inPLBM+Z4GVo80rLMZnM3t2q6DbOiHkMq5/3eJ6q7jM9vsQJ1FGpxkCVURyludMD5tgTU81J5hnpjje/F1mddDQ8oNfogq3ZXJiNcRLrvnP5KL8W7+8QPJNm2F5Jyxc3qtilCHmrZeihEebfc0NZ7F+Ch5Aj9s1llm8sxTB+cwm42QfsQvmZZwoJ9gZFKSj6KTYXnk3JOgk2M+zEuxBWGXMqEXDqNBmG5RJr58eRmvXV7BFcrOOzs1rBcpm2p9lNoBlEmr5W4QVfLWBs3BxoAcmbhoMY1yvYkQjV4daqlONcFifMJ4ojMUDXd6w2+2tnewsraNPdJglfqLzgagtW40L/zb7Dl5a3de+QxPvLIgpjupFIxjOHU5Os93VheGE4UzV8kgXsVLxTfUkSI9xN4xz2ZrgFqtRVwzhPxbHKdH/UTv1fmgVU4aALEOHXqtlNth28nt5Jg/KZQV7eVu7TVoeQ8xLs/61x3Bke6kb6TnuPf88VZ1qZVNoheHQZPU9ORSgThKxP8e9bhCPmfn6BRqlAXxNGI0ksU72j0mIFwxvaG/3w3bLTNhPOKVOC/V28iVayY31SmicMVxzcVhz3nRZw/JkB/jqQgi0gPEG60IojXWHT+ymray3/tOzvFgF/7QfRpOmHT0Iwpy2BX2VXfqXAuhSvq9twJEEygs8gM5l75kMXN1ZGw0Ilq3MIboPJhmYR25zSXEslNIzyyQRzj+GqEg9Otcj7VlG8DLTk7DF8/CF8siOTlLPgS2px1EIlEEqbCo5WlbFB/TvHX9CnX2bdTqdWRmFzB38CgisYR14McjAexsbyJFG2tuds5mFmsVlOASbUo2aWsa6dXWjgU3+RXJHsvbeVSYsQ5ZbxR2sbVyBwf378f5r34D+x5/BknK0oEGhknbKmxXPITpaTa24NIKxtGpKSzsO0Dyj2LlzhrCyRFM7TvMtsVv+F6zwuU+KeWL/1lTYv5qvxGmm243MR3sYkSHoBO3rgNckQSu8iMCyCz106C08KJ04sSxbLoWbUWLy594qtwQStWpnD0PAz+mu/uZwWIoNK8nRzPu1VAu6qoZ5em5GcRPHoJPh6Dbp/ZPgN69NT5D5z1+4J25Dz9/Xu5n4FCA3IeA+5lglpD01tzaRn19C351mrPOJRu0KtjogU7/VevSkYXPIY4dnoeJfnzn0mfKTEJpmVOa3rOjR9fXYZMq7KWLFo5oGzig2aDN7sl+OcEpGm3SnhicOonW/Dz5kmC3l+aMt9gzaZLvJKo+/gAIPyfuyBrQ79IKJGI0UK8zySKEzbYLJ1wJwt7ZyWOdOM4szCMxKt0ljG5uB3vLNxGdmUV/4QAaDLOBQqbTp/2jIkkX0MCCANSrjm2ZKblNHskmr628xzKayJjEVDaBC6+8iOvvXjQdSZNhpC/0aDtIbgY1eY86/Bcef0IZ0A4pUx5L3hoLYWFZfl4QiePcI4/gwOwUorQPapEsYYsb71H76XSoE7Od616rXfS99BA7P1SIJO41eUOakAZDJK+1ysNNxHXfuS3x+C3fa2LJvX4qPis++RqjWL1oQqPTkVy4nS1EPCSJ8GwiZrqWYBd5uK2DSQFKSmkpH6VHOJ3OynozZUIF/iSOaSkTL52h5jvUP6SDujvDqD1/egMglgP/eTBYXgpl/pQxt3fruLqyh8WpcRycG6HeDbx3ewM3l3ewf34/Hjsyh8l0CBdu5W1L0seOTmEszjSYnqbKkjisHBqI0lV3bqcNB4dyf+g+2lm/4cMBkIfus3bibWqqvoA6s3uItst4bP84js9mESP/lxEogSJmoo5VxR42brVnmczG1B7IMWExB6YjHq7rPeZIxkJFWI6smZ7/LUvHINWBL9Y3FM76XrNFa50KdksbaPQqjER41YGil+pcpkC7m6YEmHUW9pCgoh+NjppxbTYvmb+VmQaotr/yRbpo+8vYzq/glddewqsvvoYeDfKwt2RZW6moezlEoR+mIRMkZILSdRIJO2KMUoqUr8L9JrD1TaAfIkxBFAtVnDv3CPbtX7QvpEa5WakSQuqwkwGr0WWWRweaCm+sM4nhwt4evv/97+GVN15iPToFwzF5FV3CRbjiz7PiJThMISMubIajIVHdLU5oqNNK4sWEEr1G/xVldnoap06eRDYzYkJWxoaWTgpe/TQDyw615rVcLOL/8X//H7F06zbCxKMOO9M5Biq7yqRZpFq1YGeB8D7IMqqcukrJsVkO/MnYCkr4M3919MqoCkWC+Po3vma0KQVPS995cTCoPKo83esjll9XpaWfkKItR+w8CZWPhl8/0LUVQxu7t1FqbqPS3kW1WUQgGoAOy1fH+F4+j1ajgXggjoMTxzAamUZoECPsESuXc1I4RXPK1+Wm/FhaK/Mw/+FAibIXrIxt+FAvi2bxa41AJNgmbeQwKFxDY+MCejvvIlyl4drNEWTtJ6wZJPySFeM6GZUGaYV1qm3Y+n0qOJFRBBIT8Ie1ZQiLykpTp7x1yPsaDFPHdJPf1Om1VVmJZFdCoFtDv1VH19sDVQqSOpaYqMGoOrROX8KpbZnUWa+BGM3fcR1fpFfWuZVX9KFtxNR5z/puDRJo+DIYxDTAcAyh2TMIjB61bbo6/gS6rH9NeNZ5PQJaaLFDnNV+DDd9tjOWwVclnDn4yjfRJW4am++gk3sfweo6wjQ4w1SG7DwN0TK9GSX8Xl51INoTfWs5soolJbUDKurhaUTGziIyfR7BsdPoJ/ajE8qiZ7M0NeOcfFJAWSpqMxp0IA61BRkIE3EY6OfhJw35W5vwVdYwKC6zHm9jkLuKQf46untXDdbO7iW0CHt7+z10ee8r30Ggye9YH67zl23V4CQiBLc6lQNsM6xjKcVCbyjCughp4KXK+lX+qk/Vh+jQ/qzuGWCtQFdTyuikMMtJoTYn/mBIV80pTz27FKxtkRBsyzhe3Y+wMBthY8gzZBEodX0hGh2QlkhMjOsU3XvOwcJYjMwy8DutVFAn80DbKOVXiUO2wQG/Zzpgu1vJdfFH338LoyMp/OY3TiDup6Eknm5EorTpmaYp8mpv5v3EURLrm3m88d5tVLpRKtAx1ndIYx7EG7+SnAj1UK20MRofwZnD01R0WaPtARpt4p+41gQfsiqUGzWMzS0iMT6FjskS8i62BZ3fQuqXvUSZ0SSVVFmfa+iTrwy0SosZibeitoPGHmm2to4ZKuvnHn8M5579Cqbn9mEkO4bDx45gfXsDt6/fQJQZCm8t4i9Fo+XXn3sSaX8dwU4RXZZ7kJhFdFwDIFofYxKHhSEAhMlYkPIjLsggDfuS7zq7g7o+bt64jrX1Nb7ml4yTSafwla99Hf/kn/4z/Obv/n08SrhGRrL2ztWakwtEr+Vk28cpHwXYH/9pQCfQQVe8k/zADVy6987pht7oTrQl5730XjnAXT26+lRM5sWiGG/nvdqgL0ieFtTAj2QDI9m3qm+V3z07eI3q7Z2cotqe8mpbontL03n73qIxM4vLcGsbCtQAZI/0eM/HwkGMpaKYzcYxPxKFv57HgekxjKaSxJvaqdJjPQlGldfSZwkEl8tRWGV7opHLq+SZDG+tZlN76wUj4ii2ouPHl5bw08sbuLLTxFaDMp90qQFkrQSS7FB+w8EomtfWRkWe8jLW1XYjhHd0JI0G/2TlAAD/9ElEQVRkXDMmWQbmIS84jHbEXUlz2pYtX23jyso23l/P4dZeFZdWd3F5LY+VfAs7lR5azKtPPYTM2AxSzepWCurIsJmwwhHz1qGkWmUjhcrkE8vHB6dXCdmEy+pIuGF83euMMdPNmIC2lSixHe7WOqhqi0zhUjyR3/NCeMnbxR9Ib0bLLFeQ32cjARymEXt4UbP0Eoj5KTN0OH+3wjYvfi2YNNtSuhk1n7s0IYwIVuLGeBl/Brtg47OV02FMIlF6mepXqwa1slKD/vV2G6VWD2uFJm5tFrFTpvwLxxFPUJ8xutCgrfgBE3CJuPTofWQgooc2ZU2+2Ueu2kGtSzllXxCfxN9QZ9DAmzpU1CJ0kHyEesxEKmLnt2gQSXgWhRnNC2YrA4OUj+Wm9xZgIe7uoXtwJ3yKYkhDImZzpBcGW10L46IxPmkFSIM0fPHGJkqdiA0wuhpQvJ/jjAnq+rNeeQRZ0a51sb55Y7N6+c46HUUBbCfa5nhnfROtzgCzBw4xEmUu9QXtt7++toZypYYp6vnJVAbNZhuddhfRWJw2kgY0BsjlCgiFw5Qj5CHMKcV4mxubWL52CRnylkfOP8Fr1uvMVxsKYmNzC5lMBtNT1PkiEev0E81q1degK76qyRIsBovXp/I3IO3vFuu2fZ22k1Na8XgKMwsHMXv4BNJzB+FP0V4L6Fh0NxHFbBU6sy+szEyHbS0QTSI+OoURfXv8DCb3H0VQq17Uc8m2p68c7bvvH8SJN7hOQtW5eAnLzfaYIl6nqKOMk+ckO5og5uAyahCc/KltukbJ76WL8qddCgIh8VSd19BksNo7qYbRxIOMlowPiW/yU6Vs17+dE63cja4bwjt0zhZ0tKQ6ka2iLcjETSBeI3ssm0LizBH4R5MW13DnRKalpbhD7iN6vJs8oxmP8x7vup8J+AzcEKb7YHMPjrfK3QVLZbNAF+LaEwO6XbQ2NlBhewJ5vvRAK+8wLd7o1rV/72t+q8Fwq3fGcSl+fCdwlI+jH+/qbg3fLtijb0X0Ag121mc4FkOHtnqjWpVFQ0fZStmps2hqIYYcO4ke9Vzbgpi1KfpTAiqLBklcwq4ECfKIv/0ACG8084ghsuvcVqnEGxEkmzLKV9FOn1cfwj2dCZLEyOI8YpNjtg2udIuQBkioxPqmptAaH6d9Jrpka5DMk15g5XUgulamn9OPpGQYVvgnHhanThRmfbz1xuu4/t57CLNdarX3cLtmwSUe2iLg//C//cegiYDbd26zgB2ELJ52DGD1K6dQFMdOn8W+U4+gm5lGPZA2W8O2oRJSWGbJb0Y3GFVexzcYoszoTN+0Wy9MuNGTbnnVd7q6e/7Tvem5CtNVpfNwoJIyed06GiRfom6ZjgRtC6xhGvpe9atnS9lgdViTc48W0Xv4JM4DaJibHhkmmUmC4FX825VBznSzT2kAxDnLkBfDqtGjTbQkX9ukbru2VsAYZdXkbAIb1DvfuL6DwnYJTx+fx+HJFNsIcOH2NkqNBs4fmcZsImx5SzOVRic90uGJuVrhpHmJlgSLy/Oh+1n3cADkofv8nAk0deL3MYIaHl0cxb7JjC1PVCeZeLQZ/fcxHTVjU8Q+UYMWg1Aaw1T0X94pkrq9x4bvsTExzCErkXdMTIpFD41OFXvlbbR6NSpuNHIJs1RGDXyo41D3ylNMSRsl+KkEJOITVMzHLaEAy6w9303NVNkp5LrBGraLy8gVN3HxnXdw5eJ1tGiYWic2czDhIhzpK90rzHBDL8anQF0tXz0qHpVcBziZY4j6U8/26Pza175K4a4wftNjfMZTp45mN+mnHoZ+kMzWmCwVhGAIa3eW8Ed/+AdY31j1BKTqRzhUXckzT0rx4N2OesHnoJSRpFUQNlOM8Aq3+s6FCw6WSjDyW/J5PPnkM5ibXzDBbzBaGZUUqYO36ozRIMDrr7+O737nO6hW1dlOyuJLwWaC1pPcgtT9BK/zBqwl6WBRTOt4YN4yBFrtJo2uBL7xja8jFnMrdyxPpcx4SsV1trg0jE5MSPLJslV+QTPMpIDprJJeoE2Daw27pRUK1wqVvgZa3QYVxB6SsQwioTgadXUsB7AwtR/TmQUEumHqQKItgcufFCZmo45cYUVOOQnHhibeCwq5IBW2PhU/nQsjQA1W4l+dFlEflbteCSgvo7VzBZ3dK/BXlhFu7yLSKzNOgym5fC0nJe4RoM3mtVxoFKoj0B9mGKmmVUGvuod+NYd+fZN+A93KBnrlTbSL62jnmVf+Nlq5W+gUVtBh3G6rzpR61llqHXZK25Q3UbkrtS5qd5a/rsS/aFIz+IQMqz1e1bHUo0Ve78fQDE7RgDqG2PRJBMePw5dYJD2Poa3Bj0GYdczU+ZmMZBvkUee5ndnRRkQrYvpV+CrraO5eR33rPTR3LmFQuolwawtRlKjMt0jnbJs280WwEUsevdnMapZBbUdLhTukSw0OIZRGc5CEL7UPkelHEJw4684gCU2iPdAWU67mhHetPAn6aOz4tEVYCf6uG+zwtXbQzN0kDm+ivXODcGm1zk109m6jS7oaVNYQqK/BT++rrcPXWOfzOkLNDYSbmwjx+2ArR1TWiHd1HitD5eu1P9W5FUfKH8vUJ+V2SKf1HOp7rMO9FQQqO+iXd9Br5tFv6zBqDYrUSTP0pOmgr4nQgLgkDWmOeHDgrRpRmdThqG420p86B50CSppWHdCrvyAcICyib7ZDowPWlajBeJ03AGb4FZ7ET5jWQKs5WIcaaL7XMuisShSiMjI3tVnxY3VKdmukyTVX132dxSE6i+PaRhPfff4KpiZS+I2vH0fCOtn5vQiGecuZsecSN3yZohsIYzNXwNtXV7FTCbvZ7IynwZsQ42jgvGPljqBb6+LYYgqHDqQRiKRRawfQbvGdLXFmuYNBRLMTiKTGiJAE+Yi2wCP3YfnUUSCvbeu08sdXXke3uMFnzbRrw9euAc0CCW8P8VCPhogf0ag6sflNOMK0AjZDPxSN4wd//QP0m02Ewzooso1jB+bw93/5y6SfXcT8NfIphocnEJvah65fnVGkC81YY7t3nW+sP9UJaV8D+1rBFaWxp87osdFRKvqreOXllxBh+r/0i9/Af/9/+O/xD//r/waPPPY4Uum04cdWMAiHRKfr1lC9K8zhWJ1NrkYVLsc4/g66jbLVo9EP/w/5oPMuxLnh9aOclzG91bGXpyxSW+0SZHsNxol3zZwetg/Bps5Hfa3yk7ocgOZMFhKGn/X8wMprsczrVv/lLZh3MnRcCVwcrZDUYPVYMoop+plsAtPj1JtIAwSMNWIQuy8scaWldJgqYZOclFEvXuTaOssmOclYOuhyq9bHq9dW8NN3b+LqVgWFfpz8M4mmj3SqkTbKXEuPSStllxfTUTlVcRoEFR4It8z+EGl4PJNEhrBq32oNTgzLpPyt8588UdthtklTK3t1wtBBsefHTrNvh0RuFRpY3y3h9uoubq1uY3W3iHKTaVFGRuKajc320hVA1JtIeOqk92uiCNuN5LdknnXiMQ/JSv2Ehx7p0mZj6x3xp0GcLttWkRbnTqVBA7hns+RNr2E8bVlI5kCDU9zG8RZ5vUsSNTMZ1kk2hmnWycxoEodmsmYYH5qdtAPCfd0WZVzTBlt09tUQf+og1orXrvFX8kS+C7OOBLO2RBPNKyKLwip25dBAiYkYBoovqyOkTlpssj02iIvtfAUr6zTe621EqbOkU5pspHIoDcLMP83WVFrqlFIdtH0se3OAQr2DFtPSFpUGg+qb8RwFOphtBWe/jXQ0QFqM2Aol1atiOKyohhXT/b+Lq7vOvXvoPom7h9N7K9DUvhTu+KPVA+vQ2jnbSZ38490bWyh01Oa0haGr1Z/rjBl/tLNVmN5rsUup+hoEUcaWJeWTtjyNRmPI7RawvLKOVDaFiWzStoNZWVpFoVjFzNyi0ag6CmvVBnT2UCKZYpsMIhSJWVst5HYQJS/JxKO0m0LYWlvB9q0bbP8RHDhyzAZMtH++JojpvIGd7W1bKZeh3j48v0ewyB4QTxB8tvqTOOkRD5VWF1fvrKLcaJOvRBAMR63tB5MZIJJg2xDXFb9SO3Bc1vBtBXXO2T3SZMiPxDdiKURHJhCMa7vIe/HutfwHd9IrtbOA7AqXL/mtJi1QD9UAyCR1sWRXmxeqPTq4Ja/tmVm7Vs2fVT9LJB6k85doJyioXqeuyTDT5YUvBmqVi9lTMrqYglX937YY98WzrXKZoNJU8NBEFC0FTBdn2uRv6tjTnBuVrxcNIf3Icerv1BP4FbmfiuIc0xPnkZe7JwPp7ruxW32jm7vhn6PzYLB6MMBUn54b6h7DAN2yPVGYoULbu7K5CV9H6wDV8Fz9GEoYT/qHefela5eiP/u7L48HcA5K5+93SvOu/3AGfLZvqD/ojKoA5U1fclD6Odu4OFWTukfg+Bl0ZrQChLHZVk2f4DvXd+FS10U0+3FXgDigpDXTEV/STzTBLUJ8Vm8uIZgrwbdXQq9QRLdeMxndrtEuz+fRo+9XKvyaNnx2BIPRNC2+vukaoryQyWO2MeO7XlZiiMaTHdym6+iObccm0jLonbcu4NqlS9QsPRnOShOf0mSDFuPEx6fxy7/1DynTfbh2hTZnp255SV/ToeZaFasy7T96EvvPPYl+YozWVIyZhPhOZSdPUJtlLD6RRgSB5wws4VOw6VYBunXx7LVBf7cE97n73/N6N77uvSu94hnfpS2hAZAkebcqT7a99CjVgYvvYg+/HJL+3WC6+24fwCmTewkO4bb/Vi/iOfpv1MH8P70BkKFNYK2R9aV2qInJNgDCNMvVHrZ3ysjncshXm7i0tocN0uG+kSzOH5jCVDqCQqmGi5RNoq/HD05jIhJQb4vxZbdVtXRy5aBcdacWJS/n4HjoftY9HAB56D4n5xql9ChtJzOb9OP0/gnM0Wj0ab9CEqaiSFx9kOkMG/Ina9D3M1y794TA3XSNK3ueuTsB6hib4iiWKWVibpRmjU4NueIWFd8GmZEbAFE8Y3rm6ZiGsVqVjQItFhlDPDpqs/M0w0ADE2JjXd4jPEC+voXlzRt2Dsali+/j1vt30Kq1LXcPavN3hcXdEHu4z90LtzcDzVzkH5UFnflRLFbwla9+DSPZUcdAPTybwcuy9ahM93xNNLsVt1dsTytOgrh04S38u9//tzTY1YFIQ2VAY4rWjzoRlJNSUZl0wJnVoeFQRWe6dhUwriROmVUd0/OqTiU7kJ1xt3N7eOa553Dk+DFGZ10QP9YJJual6Z5yQimFwe/93u/hrbfesndahqkstP+o7lWe/5IzuqOTMqD4Q6WgS5pMpZJ46oknMTM74+BguOK7wR851a/7xjrPFGoKisrGqxQf+6pPpb5DwLrYI80Uq7vwh4Ukwsz0GvUOFYUsUoks8RdGIpLGZHYKoUCY76UwMh/1v0npVwco6dL2+VbaytKDRqJ36NRdo+059I06W4Rv/Q/6dHAsFb/mOny5S+hsXUR39zp8da340DwcVyorE++cgiBYe1QQuqSNHo1ohfGdIhMvPTTR6RTQamyiW13BoL6EXnUJncoKerVV3q8BtXUMahtAY4t+B77WHvzdMtXLJhU81hVpVIeeW6eTFcewTS+80rAUrZknrRmuh+XV4JKPymMUbX8Wg9gsfMkjiM0+hejkWQRS+9ANjFBlSRHOJHEXZ2zN8BFdDxDqdqnQdBjiBj2CzRxQIuzrb6GXex+94k3CvYpAm/jpl21wRIMTvl7LA8/h3hzRIowZDZGmdbZIX0Z1MIGGP4NBYh/C048iPPM4fKkjaIenyD34nuWRMhYiXsO+Nuu9xroowNcm7mo30CpdRit/CS3WV2v3is34D9S24K/vIdDMI9DRapAi4RI+qbR369BSas24DGjwgfWqzSTk7TwW0ZSqkLC6/45+zehwT/aeIDG++FeTxksJg0bB5VfbxaC6Tdg20C6volXUgNZVdHYvQ6tO+oVbGDAM5SX4iDt/U2dskOY7OaZfYppV5lUlvITTp0ETlldbeBG3kgUaLLZZS2w/gkgyw4wNdbRrsINeAyDWFolxDahoOyudCyEF1ehCdaACeCUU/1FT1zdBbanBb3qdBpr5Dda9ujnII6kAN/ohXLyZx1++fBv7FtL4ta8dJ3003ceGtHtKptLU/bCjHoRxr9HEO3d2cWunTrrTACHrlZ9pxnqPNMYKoYESQilfxsJsFEcOTyA9tYBQasLOxKg3aSQyrjpU+oEEslOLCMTSqjlmIZqi94ehfXslKyNa+VJmu6P32Zk4bA00rJSbVp9EQlHjye1WFfXOHvlJDeF4jDgPY3ruMM6cfRynT5/AF770LJ546kl88xtfxtlTh2gALpEeK2Zg+pJziIzNM18dRqqZSOQ9xtNVbhaO7dc6TFgn4qHqfA6SP0VDIZuRe+zYUfyjf/SP8A/+q/8aj9nMXcodjzcLrXKGQf5zbVpXV17Lwp69qwU4DPWaGrhSOzTs3I3zoM7Vo92YkaFt6sC2awMgxLYycEaG6Eed+IJkCO+Duvu/d7qPiig5KLmp7Z80sNbp8h1hUudUhnIpRhrWVjPay15t4K7zAFGIo0/3E6INRww0KamBLZbv1l4Tz79zB++u5LFRatuZSIOQm7UpuRtg+gF9YbSv2hH9ETfqRBzihJm5iQ28srFqhupYJoFRbV1CuhAm5S0ineGN9zIMe8EANvJVlJpdyhXydh06T7rtdAdotvuo1FsoVFvYLjWwmqvg+uoOrq3lsVnuo+GLwR8NmveFw2j3A2hpMgfxpoEQXqwMOgRZdKYJEdojWx2gBhVxOwhGUSH72GUe+VrL9sLW4IoGVq0NEVbJYA2AGM8RDlgAbX2hc1omEmxJfB9iOeN8PxrToethjMVimB9L4shcFodnJzGdzSImHLbYXtkWfb0G4ZKprJVSQeu00OBht01Yxf/8mm1KA1x1Ti8at5V5lOnEDlmN5J5WhFA2Kg5T6rLd1Vst5IgrnWuwV2HbCMYQT0ask1g13+u0LB/pSF0qZHvlOn0DNSavVZFuAERt2+FBvNfaqnQwlZP5jKbjyLKMIcnq+2nvofsMnCjQOeMNfHKt0slCOdM61cZ4r3baID2pU0cDIB3W7z1+oZSGqX3YMfwjX7lv3MoPL4SZKT/jA6QVtRmTe2wDe5sbaJbKmF9cwN5uHoW9KiYp00bHpviNJG+AdgZskEbngQR0gHLIj2iYbZg61vbqLWS1GLZRwqVXX6LMmjN5eP3abdQaHaRTWdIzvyV9Fna3MTU+Qrnjw/TEKHUG8QLxGWJE/IH0a9MnSPtV6n23NnaxWSxTB/MTRwO3v730DJXPCjYsoP25G+/uZ5175/iDw/2n7Ya2iTq/HGziO9Rse21MUceboS7gBkCUv7jxPVhVPxbK7+6F8o5/muUu/jAgHrvEi85ysE5UxtVuAKpLVizT8L68l4C5n1dWC1fcobeLexDtCCZWEeuOQQGt85bNGLBJeJqA02IRsufPIDY95spuDJ1x5S0ZJ9v0Ewc0+W3xXD1YFHr3777rZ+0MEZ67C4Mg9B4Jt+k7eroPRqsz0STrJH/1GprbOcoatiu90AC/IrGx6dGKzkcLU/ktzAU6bHz2TvnrvMiwVnKxzXXqVTubgg3Tth7uJFIInDiN1tQk2oKT8lFtVcDKFrEa5J+Vhel97AEQSasu+UkvQl2WMl00RpsoXK5g/T/9CP7rd9C7dQvt2zdRX7qO5p0b6NgzecvyEsPW0dmrIBJLITY+jl4oQltOE0LUxqkPsC5sRRl/wrC29+6KJfNJdD2E3Q0WMC6r+PJ7F3H90ru00WjrasKXJjUwLpseceDHwuFjeO6rv4R4Iol33nwVtdIepbxSZBo2S5C8nbba3OIBnHz0CYSTab4Uv6f+oObBcouS5AXC5+EMGyyfznlKJcjT9Uy4xFWHAyfWTs3pKiS5pyHU7vFu4AM4VYyXtv7L7mWY6kNhok331ji94e/TGQDRjaNjt31r0N3TRnK7VwxYtzEUS0Vsbm9gt7CLfLUIf7eBL5w4gNNM0865ur2E63eWsY+64/mDM8iKSLQrSZB6nOqYeAzIZrefV07mJ9l/F46H7mecZNnDAZCH7nNwaqD0EhpUbA9NpnB6/6QdiKeDnNhy2ZClEHmMSv89pmPffiJHliCBKhC8tOyqWzKTe56MjGHqYHZC1MXUh1JQBNNwAKTZoeFY2qJAbTIelREy2LvO0h3eilkxTUqncCiNdGIcEc0MVgeWOnKJj0Goj+agiuXtG2SGO/zGh/feuYIbl2+h1+rT2HUs7q7jA5OkE34+8MZzw3DmToatWRfqQLRDqsjUu90BRkdH8egjj9qzcGMzG/gJZYCtatncWUaxvIsIGW5cHbilGn76gx/jr//qh4ykgY8gQjrwk2nZdgoefpSr7mzLCL8EgepROBVceq8fy6Oy60p0mrIjjZj1rdkhlWoVJ8+dwqkzpxAJqevwg05Glva5rFCR+Vf/6l9hfX3dDHo3y4up870NhqjC/xZO8UzJ9+7N4KeLxaI4c/oUTp48Yfg2peduXJXCqxfBz3B1FZmS7hmmEpbqaoHw4CeNUFsq1fZQqOYczVi9MoW+tjeLIhXLMD7xHY7THtB8eSpJpI0Bv+vyiakwDeGJWbJ8LnOHUXfnymBOcfQsHBDX6vSWuRnqldAt3kZrWwMflxGortmKjxDhUam1tZT2LbZZsxoQ4XeWktoDCVlKnpvZxhqnEqstd7Q9VX/Q4MdVhpVsZYm/y2u/gmCXaWuFwECd+lol0KAC30DYT0XU12F8epv9LwoSHok7De6oDQp+4VSrTAi9bStnFSEeQa+GZXgPE4XEXWIWkfFjCE2dRChzgHCq41gdRGHSh0aQWBfdFg3rhg1kCCbB6atS0d25germVRoZ19HNXYO/fAuh1ibRX2bcJuF1Z4H4pKkOaUv5O4D4J+qX0ahBvDC6vgiavhjqfiqoyXnE584gOncW/vQBKtITaBNebXWlZELEX5jtX3WjQYJW7joauSuo597n9So6pRvw1dYQbG8j3CnA3yJeOzXCprM/2lSsdcZHi/hpkM+0zHC1KmKdmeKpdsVHwegaImvaeI+8o1X7GR0zrkbbyA+sY1n1S7pRHUdIwxHSSYC8L9hvEI81BIifUK+ACOEO93YRaO3C19iFv7mDQX0LvcoG2qV1tIoraORXUKdv7C2hUVhDu7yBbpVx6rtAcxf9hs550XZp6gRkuajw+7U3rUBhgbqSEwE3S0yDuSqLqsA6V0lj2gLLDYAMneqGjgGqHX5k7zQTW52JfZajVd7jN1JiGYd8rURL7JVLa3jl4iaO7E/hm88dYflqQiW/YT5W53SGYOcsVeJSqyBahOvd20VcvFkg2QbtO/43PtDVICjbFUFk+VqIhhs4eHgB0wtHkJo+gBZlRKmilTniZX60aU1N7D+CYCxubUKHoavzQ2eL6JBl7V8c7hO2yjoGjW0aexpI6rPOyH8lqchTbRWa8EUa8UWaaNT30G93Ec6MIRLOYP+BIzj36BkcOX4C5594CmePH0awVUAnfwu+zh46opHEDCLZeeInQRJSR6qwpQ4RlV5yQx22bIfkB8pRskaGrvhxKBTE8WPH8Mijj2KURqTxZhugYQqSPcYDh+hUvepG6SslC6QjEi0zhphOQASKP7TrrHcNepE+7e0nc3fzI75Eb+pc/vkDIK78HjUMv3wg52Zvq+xKTVxPT27wwwwo4qntdeybnOto6IK4FT9jO7EJFsYLHTRO5sobRzXDm6SDnuqE7wPhKKqs15ViE3/9xg28t1FGBaSxcIItXR3j6oDS1jFMlle3dYHj+3Y4POHS1jp2RgrDxEE0Jm6DIAKD32dTCYyPpOxe7dPKJiR5OHOdHYSR5SlUmihqFji/V/ran1qpasvJQDjGfIKok0/V6MvtALZLbSznari1sYebK5vYLNbR9sdYVSEEo6oXNzjj5AdrivmYfOajVopIotlkECo71bbfVn7kGy0biLYJFoKZcTVRRbJeK0bMYFbbE64ZLxaOYDQRxmjMjyjbW5Dl84s/tSkzaahq1y4dkJyJRjCWjmJ6JIEDsxkcOzCB+fEMoozfbpBfd9yggk8dWsxX+WsLTmKTbagnNZHtRPAKt+RT4r/0agPalk36kvQtDYzZ2QaRKJrkHXvlpg2ALG/soNbqIJZMI0pYNKjidBWCSkTsFCuotFm/OuhffIXls5/qydBH/KmNEgeCMxHRdmxxlo01xDBR6kP3WTq1RO9OuhKfrA5EH169iXYUSTWjDsImaePSnR3sNcXTxL+tYu/zH65DL1xt9kNO7UBb62g7Fjnlrp+1+/vj8z6RjFNm97B07Sq21zZshcXs7CLDR0hJ5GVsQ20K91qrTZujj1gipv490rjaD3lIPELZ28bqjSt459UX0Gk28cyXfwn7j51FpdnBrZtLuPnue7iztGTb826uL2NncxXra8t47LGztupRtKxVlY0m9U62R8F48d1L+KsfPE8broemOpW04kSIE60L9A/gQ/j28GH+83OC3bEf8SFBQzxRj0mQ70zRVphp15DQVlYEU+3b5AL/7tYVr8QAr65Ni7epfhRHq8UT0TjtqratSLNBVzqtRpMTb2E05x4EDUMYiGcnS0RLgkdygzAyVFsjidnZADR9nc9j504gNjfpmKBqR0AoLZbBflZnvHr1p5cm+3gn70rhOb3+rJ0Dybn77w06PQ4DVYoPOhVJuOnXG9i7rMlY1LWJuJD0LOm51LP0kfFr7xtzQxzbvdL4wNvPzClbO6SddRfhlRLXzv1papCN+kMvnYX/2Am0JsfRsYpy/Muq0vsZ5Kp23nz8FSDSvzXZjTSl0QHyFfWFxCiju3fWMM73cSpGWpkWoY+RP8Rt0lCIeqtWhFFekjeExycQnKTNFqKdqb4OlYm5C693B0BIc7KN7fgthmsAxOSsysJndZJrq+QbVy/j2rvvYNCiDaXKlW6kC3W1DtM+dvZRnP/CcxgZG8NrL/0E+c11Rxn6Ix7V1yL9Y2JqDueefBqxVIaQqG1KX2Q6dmcoM/x8Hs5qjfaNdIWMeDqfRY3CwX95AIS3quxh+AM7puHxAznlL7hUT8KO041duNynNwDC/5RdZp+Q4gfUmsw+omZtNGB6GvXG7Ch1MspHhqXiUTxx6ijOHphBgva2Bv9li4YTSRw7PI+ZRBRxwce8tFuIdHJX45K7zE/4IhFpwpTK5qD4vGr/f9nu4QDIQ/c5ODVHMQYKIgqgULeJs/umcGJ+1DrUzED2Yg2ZiT15zOrTYOdKyTneeczX/nsvnMCU98I8Lxjcb8jGGUyp1+41USjn0O7XGdZmoJgeXxqswwS8O8uPzHQQxUhqAvFQQpNm+U4Csod+uIvd8jpWcrdo7LcpfGN498Il3Lx82x1rYIxtmOaH/T1n+LrrGeBdbBY3jSXNIrXZi2Ts5XIZ3/rWNxGn0uvkjVgqhQTLVmsVcWvlCmqNPEI0iseT09hY2cKf/PGf4PrtO9bx0beOUyoxUrYomLtUxrpUAKS8aLlzlxpAz7QAhzXrHBEsDixDNaMbA3cj2a6G1XEngaED45966kmMj45a3KEbDnKoQ/vFF17Ad7/7XVSrVVPoHZ6dE6O7//nnOcWRV3z5odO9Ou9OnjiOp59+2maBmlNcwcCfFPXhJ5qV4YwGCVddnFqilT7WGWmDQTK4GijXS+ioo1e6DH/apkwDQolokvcBKmAyBH1o+xpooYpyo4BipYh2V4c0O5ito8bL+24pdTP0zF2H92pLKNV5yN/FoL6J6uYlNLfeha+6jGC7aJ3oqhtTqAmpCHMg4tTqAYpnKyBhkvqqFRiwVRhBBJiuZskOt2cjVhhOw4Ve26BZfbO8pBTDgW1NRIMmMNCgB9u892wKEenb7Zuqjh+VSziUQLdU7V404dMgktoaOlSweLXvmV84g+DIDILji/CPzgDJLN8JHuLY1ySuGkyzCH97HYHmKnytJbQLF9HZexvtnQvo7l2Cr3Ib4cY6gtoiqrOHSEAd8dq32oNTdc5y6ael+uqMtm1RWOVW7+phpBOZdHw0JMMTGKQOIjZ9DrGZx+BLH0I3OMJ4ceJYlCHFqUNlqkUlirDVV9HffQ+dzbcwyN9AoKKtq3btsPJot40ocRbqEacsl22fR3qy1RzCiRR7EYPwKPgcJPRDYlC4cCocqzuehMer4pvnO/PCN72Ma93zj1elTL7BslqbYvl0Vo46KF3Ni1ZUn8QVDXE3mKV6oRGtFUikL812DvQbhJ/XDttqu8RyscyNHHy1HQxY1l5pHd3SKprFFdSKayiWtuxcnEA4TjxHCJ62blG+omcppjHWcZD5CRLSqc5iIi+2WiDMw6vhgQ8KMXhVxp5TRkVD/U7TOoa1EkvbPe3Vevjxm9dwZamAo4ey+PqTh2hsaaWKknJpGWJ0dQ/2czgmTlm/l24V8caVLYNZfFXYtW5X8USmIU6oQZh8sYr9hw7h8OHTSIwsIEWjplZvoVauEWesB34yOTePxFgWXcLaFW6ZXq/HdsafTnTQIF63QLlRXbPBMMlSbT9l/ExwEQduBn+L5dSS/o4p7a1aHZF43Gbp+jTgGkkgHkuYPPa1cujk7zDtIptkDD07R+cQU0kwzRBTdfRifE4EYW3TdVpYvmwr8upU0TUcpQKfShks/Od+Rl9sQ2pXApMpW10xXcOn3uuZvMM5+0oX5quSMZy8tN/RIBzpzov1SZylbzcsg2D7jAZA1LFl3xt+5Jg2/8voEq2oD0p8VqtqtD1cr61Vc+KUxDNpWcQpPmTOYNJ3SpGBLIcmlWjQVh2AXSasgYStagd/8cpV3My1UQ9qewfNkHbtX7JU9O4MK+bBtNx+4oRF9MerG2RRHMb3wFaODKaM7iGZiGNsJE1eIVx57xTJSqayedgmLJ12B6VS8e5Ag/biF+w9vusyfRuUYdvv0SjUoAU5oQ3MNajPFPntdrmJO1s53FzTYerkOaEoghHBZxKYGbsJGurk1MCHts0RNPX2AJv8Nl9vo6kBJg2SE14dDKzCia+r9IJpoIED3fNdhPejyShGYz5EBuJvLZKpZJNoQ3yZubGtG49RI2YdRficioYwEg9jIh3H/skMjs6OYVarM0jDaGvLSWGEehQrU+XT4K+26RLOSI3GqsX7hUG1G90YhegFfZv11VIFs4yBSAz1Th+sZqznNbmG+gPldphGdyDEuibutsl/ah3paRHWZ5D40besT4KhOhyudDFZyucwb3UWTTpCOlQZTWdw9fnQfVbOtWy7U90Y1ShM9CZa1RvRg66Mw3bTIE1cXclht86qFE8bJvAB95GBdAq/50mWTEN568n7qa3Yj3RJmlA7doPbPlsBqMPHl67dRJw0Obt/H2LZFOm0TR24jXAkhHqjSvKvIqm98iUzxN9IizHSvlaEvvPa6ygXS3jqua9gbP4wAslRjE7PYlqyUdsoMp9arUKaddvbSW8/ffoM806anNXWNraipN3CrXfewr/+H/4HvPfGm1i9dg353Tx6nQ5G0hnEwmHSPNuZ4dMKSO9hV1f6YfDn5Uy+ki8J/+IvEfKWOHWDKcr16U7dVoDonepIupHu5eWMPtyt8fihU7E0yc4fogyXXUHXblM3Iq+TzBEPEm8Y1rGcrvpueH+/s/w+5HWRM5j4JPmhBCTylKP4rHXgsr60bbBYZ411P75/DvF980DEbSdqbpgYnW7ve7QHlZGfmxMvdo4vPhDxc3J3YfBoTP+Fh2HZPOdwKPywznb3ULp6nbqy2oXUSEo1xZcdQnod1q8u7t4LuJvDEAefsTMYpaWop2CAONuX5Fat00WLsr0/MobA0eNojY9B2zcJJ7YltpVbsDv6VTIs8oMdgi58GQ1IplN7Jc+U/E9MTSF++ACCRw8RhiO8HuX1GIJHjiNAHz5yFKGj+4GjM2jPjqCd0fbFpCebeCTtz8l5JS04XVtz8HqB7pl5mrbIsABttts3ruLKxbfQIb8SXJKzInwfYarz9vxzv4DHnvoC0pkRvPvma9hcXjIacGePML7yIRPOjI7h/LPPIZ4ZZZhpAcabVW5r2YLjc3KE0HSipM4ASWjVuNMTzJZWnbhI3j/n790N3QefPr5THdxLw+lmjrZYi7wO9VLHKT6NARClpjRlb2kVtAbfQK/32kwxxG/V12U6KHWwBOXg7Pw4Ds9P4cDUKLIR2YXUa0kP/VgEqck04omIDXiqP0Urr7WVrWx+wyVpwfDKtG2SEjMXpd+1Jx66n3FqQw8HQB66z9Q5BuIxh0EHqWAfjx0dx77xOPwd7XNP5mSM6f7Gq28oJMl45BX2SRq1RJYYn7tnSszHexBbZF7eM52DwLEWxTUFhQLbvaOjMdul4VtpFFBvFfktrUxNgZQzIN333oOlr44wkKmOJMdoCKfIwFyZ+v4OBWvZBj+KzRyftb9kDO+8/h6Wr61gYOc/MKYx4PvTlf+QuxvnPmePDBcIYuiEQ+dbaIunL33pS5iZnqFwDSBC5URKrrZpqXfK2NhZIiwthP0hTI3N4zoNmP/5934P5UYDHeLDBAkZujpV1DmqA/k0A0L3Ujbu7vlK5q8OEjPVxKHt7x6DVreC5IeMeAn5Tl/bNvjMKPr6176GhbkFMi1GkBCgAFBdmFLB+//p3/xPuHjxoo2Ma2BkqNTff/9fckpLbpju0A3zOHrkCH7hK1+xjg83EOWc6kQzSwW7faUC6VlBLLfOGgj43Wi9fnbGC4WW7ludBho0VhiLH7F+lQDzi0XjSFKJE06rjRLWcnewnl/G9t4G8sUCypUS9vJ7aDZbSMTj1C21KsIoVBB8wKnjxwapSGdh4jXkY51Xdmwmfr++A3+3SjLW6gEZfNS81Imszk+jYymLgp3pmlalkRp1PqvjSJ3OGujwcrXOESFBuAkyVwp8aysqlMrm6pqkYd7aEqMqzO5l5Fo+/FMy8rxXkCGGN6IlQ7TP4dPuVb9WH8orAPWZNVtNVEoFVHfX0S+qU33Nzh2pbl1DdfN9NHdv8Pk6mntXgMoNBOorCLXXEersINApUKmuEvcd+INMTNtIWRmUhysbCZQ07UqmIQcp9+pg0Azl9kCdSHHqO6PwJ/cjMnkGYZ3zkT2KbpjmaVCGugwADQA1EEadylOJcKyhuXUJtbW30d27jHBzDeHOHoKdig1OhVkf2odZBo+GCdV2hEdHNIJCeHFtzNqQ4cRThgx/Dk9O8bNWeO+qML6zV+aUpmiXdWb1IvpRsZk3y2oDVYri9YDoTB/xa81sUq42wG1wCha1D+bECtXWW8GBbdhC36YiyHIJB1oJ1K8h3CPevasOd++T/7TaLcQnZhGKj7M0EX4pQ4p5CgDm7WeYXQWfDYgRl0xvSG9ygs0KIG+BolnyKbZl24+fMGoJeo/EoxLosNPdag/ff/4NbBVaOHFoAl96fB/rqmnxjTgNWcpDsOied0b7umc9BWO4vrqHt95fRVsDNBoEYbirJ32putRurkC12UEoGsW5M+cxM6+VHmmkRyZQLZRRK5cZY4DJuSkkMlEqvn3oaA11KHfbWvME4rHJdpxHW1u1VUnHvjaz0CCUwCRMKiPzlbIsWglS1oie2vU62s0q65RcgvkjoAHXqLU7HXkNtoXG7nUEentWY77EPCKZeeInRYg0g5iQqSzmRWvEqdchqw4TvddKBeG31WxYWCSmg2TphDMVnldr94JQPESDefqSvMPhVa+sxt298SGWwl1YND0QVpWDfMz74hM5y99uKLuI55743WcxAKKEzLFwykPP9mcPhid1TPV7XXRb5Nm8l1GlZ1sRYjghJF4yXmuk1wt+z3jqjNS2UNqnfq3Uwfdffg+3ij2UEFOLZFnZdhld+Qjn1gGuxJi30pMO5tKVV7jagDcTje3CxVIw70lvw4PQ3XkweiGvEtmNxTfexLJq4CxfyBv/lo6iDnw3SCFHXBMwydQOYRKZ6ZmtiDoH2TT5b6XTs06VWnuAjd0irt1awdpWEQ0+R5M0wFkmDWDYjAN6TQQpVerYLVZRaDFd5qdZ1VZigcVn23KTUIoqbb9lwc6yRQhHOhrCRCqETEQzQLVKUgV0cNmhx4xjEzn0NenacS7WgTqGyWsifJOkjjMeC2HfRApH941j/9w00pTpvXYbXbYZDZwIr0pjKBSlk9iEE8KnwRrpOXamAb3GPaRjataq2n2L+NAEiCbbU8sXQbnVw/LmLja2C9DWVzosXVt/tSjXVX77nk4HszI5w8NQ39IAsTiWtvwaT0URI98IyQC3cj10n60TVXp3ks98Ulty7U/EqzdeDNadVo81yF+vr+xht95jXbNd/UylKUDeI4K7bhh+z4t01BaVtjr9xAndO8FDOJifdAXxI+ntmk09MTbBsCBWrl/HzvYGIqkYRjJxW8Fm7Yf68KBRQyocQIL0F6MfaLDi+jW8+eJL1K2Ap778VUwdOIReJIluiLKK+STSKYxPTZqfn1/EgYMHsbj/IOYX9mFhcdEOVLcziKhzRYmqdrWCt199A0u3VxBPpdHs+iijqdVGE1jYd4A6pMo/5Ov8Z1fyKJZ1KJP03919Do7t3+Ff9a75xcQv22GUOBzjda7bQJoy0dle5Kv6xgAWjfDikceHa1mMX2XW6jidDxkmbzFeQx6iVRmSz/pIPNHS+ZB3/+5z9z0rXT0Pg0Qzero7AKInAaQb8U6yOsuFbI/sCaFsEskjhxBQ57biK97Pc3yn5MWNh0lamzDHp7/p2/9fO+VNP4RGziu959071a/EooJ0kcBr3byD6tIKgpQdOkuD7Jd8mm/J523VjIdLeVdDjm+7iWXDV3r+bD3/WZ2pPqQThEln0kE6LGSh1cFgfBLRY8fQzGbuDoAIfNWhSiKnYCVFcnyAFSBKkXKUCFMaskk0oC/93/SCWBgDXcknEKNuG0+hl+A1oecYBqkw2qkgGuRLPcrVngY/yD91pocGW40Psg7U1vQzLmwAD/N2wJvtRl4onXVl6Rbef/sCmuWS0SZRwohqfwHU210890u/gtOPPmGTHzaXb+PWtStoUy+S/aE+BeUheyOSSOIZ8sTUKO0jynjXT6YMnRwQPJ+XEya000Ii7EcmSf1Zejxht/Ma9V74MWfI8vw950J+NvzjOdXBvTREhYLL8XHhe8jLRDGMzedPYwBEsewcY8bT4Ie4tJGJ9D/l6I9gs1DF0m7VzrorN/xoNqn/7tawtVfADnXSDernm8UmCo0W9vIF6pph05E1bS+omU+yd7QNtGVJnGpFsNlhgoDQGhE+dB/lJNceDoA8dJ+tI9MR6xMTDPbamMvGcO7QBKaSIZs1LHXZ+JKxGjViOcd0nOHtNWwLfzB3TyCICbqrOTKQYdouhhijYBUro6HNq77Vz+CQwKNQ7ZHp1FslVGp5BmpvejI8S0DvvW8sC7FY3oiBUoCm46M0JLM2k0Aw9AMd7FZXyfCWyFZ1zBYVcl8Mb736LlZurFCQCDcOlp91ylDMnFeHwLvO4UyO/yVgeZVBqw6/DhXlMIX6+MQ4zp9/3KXPaB0y7h6haHZryJc27T4aiWE0M4HX33gDf/zt/+CEvvYf59uQuk7Uga5ZkBJy9GL+OmR72CnihJ6w4cogWAWb6sDqgf9sZqbwSsVdEOjMi1azZVuyHD58mAoEv1M6Br+p9Xbg4b/5N/8GGxsb9k5uqHh9nAEQOX2v7/TN0OiX1xkEBw4cxC9/85umfDDQ5eUqVihz/xnuvISQBjm6hrs+BVWP3sYDbKBIVaFZmk1UKkUqYm3mJ7z1+K5rwi0WD6PWrGJtZxVbpRVU2kV0ZNQwf529UqvWiP4AJqk8BrUVmXDnQXK/U4jA1KwDzcDXTLpgOIRIMkslNAotbdeByerw9PmaxLkG8fQl8Ux6sY5bCnCbxWCpiUYsVS9tJi6cqEdKIawj1aEpGurM5L0ZTPzGfhafbU/xjTZ4VU8t8xv+zCiy7bc04EI4iH+Xo+iXSOR7GX/iC0qOQDIfAa29i+s02KhUtgsIdXK2tVeotolgfQeBRg7RdgUx4iHcqSLcoh9QqdQqHBrHtqJCHX+EWUagDqYNhFjXNDJsGxq1H5VFsDBflcV1FKrjKIom0miHZ+xA8/DUIwhMn4cve4rIn6RiHyN0TIPlVue0ttIK+qpAZQWt9bfR2riAQPkmDdmcDYrowHDtFTpc2WG0wRS0j73N9hIa9dONcGv4FQ70Qp1l+pZhDFI3oVCqB1OKhDM9Wl3qTvhV/amD3F1tANrPOmDZLJi6lV6p3KouVx/8b/yONGOKmFZ78FslIbikiSsvqyR60YmXuVq/G6QQPggrYbaOQXk+q0OEBTW8xiYOIBSd4D2ND9Zzl7jQIJgA0lZjSlKdABrIG/SLDCYdK33Lh97aqZcvEaE3zih0vET0ozMB1Ikc1FkZ8Qx2Sl388Z+9gmp7gLPHZvHcI/tsoEYU6MqisvNCHHu52H9DkMpE2l3fq+Oda+soVgUnDSnBaj0XxKq2IBFDIF3p7IJ8qYRjR0/g5Jlz8IdpwPmjyE5OoV2rolnNo8f2n5qI0+CrUFbSi4aIK50XExhUgIb2Kb5qgxXQlm6sBOFG3R9GI+LFKrmqXI80ooOhEN92Kbty0LkB0eQYYY+QxjRDjvhv7KJVuIWov0KwQwgmFhBML1BWZVhCrQCRIw0qQaMDPWuFAmuDfEUz+GWg6ywQ7SsepvEYCutAZtGBqwNdrWOFzvFchhixunf2xtLXnwtX2N2VDnR2Dk+zRBBkEHiBn8B5NWn5/k0DIEImKcieXQns9sGd0hONKH1LkPVlN8qFV/4ZfvgT+WlwQKhjy7HOfTPRFJ2RpLcM8XWvLfDHNq1VDuVeEM+/dRUXV/M07EfQ05kbbJ/qjFRb7He1KF/8UDPN1LqEcJemK7U6LdVONZBJPil+Q0j83kD6sE1r+6yRTALxuNJ3EAkS55meCUXesx0EQxGUqlUU2BbsMHOWQwduB0QvWlWmQWCihyLU6DvItmfbuulHWWgrPQTrQAPRJF/+KzV0kHoVt9d3kCs30Q/FEUoQV0yjXO+hUKmh3Oqixe8scbVno0/qGAxz28yQBpi2DcqwLUmWpiN+TCRCGKVxLz1H35gMYj04dknexaTEHzRAY4M1RIb4f4+4FexaQaK+PvHBEJ9joQAykRCN6jiOzqV5TSIdojxsldleSeP8VuUb+MPikOYpoCgqNWmFrwmHOlk0OCo4RQp6L4N5QDmuUmmAQzPxS/WWbRm2W+sgkh6zra8UV7KaYLEtsf6llxC+4WGqGkBLRgI0xKNIs9wR0xtU2ofus3euTdsdaZO1w5/CPF5hL+2OtEfaIF9pkkiur+1hp9rxBkCGKXzYKXzoP9qZ+JPXz9q1+8kpnFRLenRw2AAdYdH5EuPjExgZG8VubhO33n0ThfVl+No1JCnPA9R3W/ltZCPUJKpFrN6+iYtvvIabt24iOzuLE08+gwnq4d2ozlILWXk0caDZZrtmjrFU2gYEw/EkAowTCsdsklAyFkOMMokSmOmWsLG5g81aFyOHT2H66BnMnXoEM0dPIz1N2cbvdAaOndtmBRTlqxgOt0Neairr5+Zc29ZhyMKz+JEGIkNsn6PkwwudBlJaAUJ+KXt0CKvZh+JDvLdJTXSqI+HOdQjyWf94r0etrte5DfpcE1HEN7TFpemTiuc5yZzhs652z3+6ik7MeVddCBZviEn64QCIwUSv+HdRO5QXZJJN+sypYwiPj1D2O/jkh+l+2CkdKwudoriWIKcPvdv/hTgrpQDWhWCKowpaBQkn6mhHu4v8pSvobu2wntnGGRQkAqQfWB3qczHrodOzEtCt4dEC7Pkzd4TTDcyrniknqQva9o60Wwtt6gqT0wgfOYJGKmllF3Wpf8GBb5A7z3/Cz8ceABHNaiIXfxLVhmPehFsN4NZtRDe3EN7a4nUH0Q3ajNs5+Jl2YHubeWwCOzn08xXKP8r6KGGUHWievCDAPEibXVaUzuUTPVvfhsHueMWwDJq9LxtIK0A211dw+e0LqBXynt2pOLRtWJGDSAJf+9avYf/R43YGmw6Nv/TOWyjl8yaPlZjZdoRBq8u/9IvfRHp8knTg2cR8Lw5hUkHl9+jgs3YsCQadpg1oZ9I6c1O6pWhXMspzKoPV+NA7nKmunbMnd/tAjuW3xFwaBoPgsjDhSnm6cDk9f1orQGywg3JNfZeiTwuk00TJDvWtK7sV/OjSMt5b2cPNrQpurpZwa7uKm/kqrmzu4s76FtY3t7HENn97eQWL0xMYSyeNB2vysk1yY/qy8ZS0TUJTBqI/XXQ/zPSh+4BT2304APLQfaZObMFYAxXiULeOw1MpnF6cQEbLkiUUyVTuxrQWLIajBixGpau+HgqVB3RK2Lz37FgGs/Ku8mTKYsbKV7PY73UmyHvKhqd8apugRquCYmWH9zR7Kdz0XnHvfePurHQSxhoAiWWRTYzxXotC+U2ghbW9myg2tskg1RkbQsSfwoWXL+LO1TvEDWEw5muJf8h5+XzolSuRc3olg16dS9rfVYw5EOR9tw3txf6bv/mbCNL4btPoVRl0PElnoD2599Ams00nsgj7Y3j+Bz/ET376AsJRLUUmTP0OwjSEg/2WCXL385Rslkv5DQePBIXDKwW1nolzN0tJb7yy8aLZ8VIsdLZDr9vHzPQsHjl7zlZFiHFZhx6droLnL/7iL2wrL3VG2wxZ0tdw4MM6PBnPdar9fDeMP4w7/M46LCjc9u/bh1/7jV9XBPO2skMd9MNv9FM5WCYJIg1+yHehw1t3kaPvaoSe+QRCQYNTeTTqNXR7MuBYJ5rSI+uA8WqNKvWubZQaBfSCLfhCEqTKW/UYgLYfSsSSGMnoMH11pgp7KuO9cjq8UjwySR0Zos5Oo8JgmH80EFWniRHWD/VrGk9tKZPSsNSZJFD4s3MgSK8OfcpERpVXZ8KTIipNvWPZfCyX6VsDCmd1iAs3qn8GWh0ruqBSXNGz4Z3qB+NokEGz7/skvo5P23MQdoY7g0vx1DOjxD2vewbbO8Kk5KRc2lkYOlS9V7FZ+8Fe3QY5dL5JiLTqI+/RAGxQdE7Y3cwUAaZ6FRxMSG2FSqlqUuXRNiBG19YRxjYrWAeEsR9Gy5fCIDqDyNgxJGbPITx5Gr7UQbRDM2j7slR+wkxT+XQRDqjDsGxnY1TXL6O2fhHByh1EO1S2dYA5YbVttgy31NbV0W91IpyJNhmk4uq9efEh0ariG3LNCVZtddKjV2e1OrD7A+9KrMgLruFWNqr3u187YmIiVnA+Ch/KmOEengwOy1/xCa+UvbudYfqO3+hqEeSUpr7Vs3dvz/S6uH/utd0rTcGVRnj0AALRCbT6IbYDwq5OVrUlxtEqCmbPmKpLHexbIgNhe2EahM6SE68zp4i66B+zMNzRuLRnlSUah58+GB/D9l4Tf/jtnzJV4JET8/jCmQWEtLUW2/3QsLSyebd2o3uWSXF0fk6uNsDb17exlRNv1MoHdaCyVMQNWzBBcHjv0BcbdUxPTOKRM+eQyEwwagTRSBTVvV0Uc5voNPMo79zCoLqJXnUDaOYQDBDnQR3MXkJ/7zZauRvu3B3Sv2aZ+XUSY4/5sZxql1YVpC2rVhpWkgfqSPZpwIgwdzo+xLJjbBfk7RpU6BXR3LnBtpNntQdR948jPnucdBQzOjI88HvxAyVtaFEmvBFuxeNELtZpwmdtSaLzHBze5EUjjk4UX/TEj70weefMiKVzK5EcnYq8lKtRv/hWvUB4WA5L45M5RzW6IZ8jf/q5AyAenFZuzz147o6/6GppKA+PXp3je+JouEe9+E+5WrOBglCMcJnS4dGyB5dScnzXhYgGSBlo8NtXryzjtRsbKPsTaEfStve+zmIKsl2R7TEuv2A8w7VDv1GsBjrU6RCm17ZPUbY5XcVXdVqVDubWoIjiaOtAyZyRVBJZzQBkGpr56+By8DndgOViUXW4Z7PdwV6pbB0m6iRRuDrrhp07bkUFA0mvWtFk24Awrq1W0wCF4Uh1ogENyRGd79FDpdHF+m4RK9t72Kt2GeZDrd1HneXuqMOTMlGDFkSoJ5spGcg2VAM201owCC8sV5Q4Go8HMJkI2r3Rn1cnglffaOsf6RRG/1ZevlfafNLEBZVGW8vYRAAlLBwzQw38xiiXslE30LAwmcGRxUmMJmNok0doJZXiKn2l3GO9q3/MOhLp9N9mpjJjYsdCxEnVvjVYZHVLHMkIr1G+7pYb2C1WiKooognpdIxAOMQXVPtqXw7POvepj5F4EFPpGOtZM+pVx2z/Lldl/9B9Zk5YF9E4utN1WAuiN/Eu3Znjo3SaJknt5uoeNjUAosEzqzL797GdvjI/bM96sgbiINO9QFAcDYhLR9bqQOm+yWwG8wtzmBgfQ6vVwu3bd3Dl4ru4deV9rN68gVvvX8aNO3fYZhvITk7j+KPnsXjiDOJj02hT1+1oBa10VLPBnC7qp1xpsz2po0mDhNo2Tytt67U63rt4Ed/+wz/Ef/rOd/Dnf/rHePvqdex1KY/Gp5GanEM/Ekc0M45BJEYdQzyfaZteKs1TfOYehQ/95+mcjcF2rcZM2LQ1Ski4ZTsdYbtc6LaQok3hJuMNB0BEJ45irDymfzMNKxDrSvyePFa4VA2Kp0j/1SSJUJC6sOSg8KvVB6Qlc4w7xIUl4/m74d5Vaepq3qMJoxXeDQdAhu/lxBM1EUm8WLxfMBabdYyfOIbYzAy076PCrFh0ltTwQY7Pei8+LGc1yTI7xxeK/zk6QXI/bA6ge0Dpvbyq1953KCeaLeQuXoI/X6RsdeVRp7niWbuSPGD8YSmdc2k67Ormg28/M8fsh4OJ0qbsjCvBG6R+GwgDE9PwLy6iFY+SVkiXBHPY3zOE3jz/qRo//goQ4Yk/ynPtTaCJTqANEaDtff0HP0D11i3UVldQXqFfXUWJ95XVZTSW76B5+zbKSwzbKCAQoy0yNYUuZWWXcEry6b+ag9Wn5aM25Hifk528SnfRO9G15DCLvr2xagMg5dwu9QHCLxnLMqg7e3R23gY1Jub3mT6RjIZx4bVXsLu1oSbK/JgLr/2e2+ry69/6VfLJGdN7hitAVF6je94TIEH3mTujzm4TqWjQzoITroxu5b04ivVBf5+zx48I/1jO1f8wDacNOf5pNSR688LlPr0BEOXLZ+ajM12UhsKUrWzuDmnwVqGBt5Zo98dTtvVilLZng3W6WS4jnk1hShOHqBNXWh00qBefOjCPiUQMvm7XdgGQfmaw2yQiq22v/t299OqH7qOd9JGHAyAP3WfsjAWQ0fcR69Vw7sAYTiyOIdiV8UzBoNZsgsOxJMeknHOMxzGWe6EP5pxiKAZ1f1pK2/3UPeVmzzomYh2AbDCOj8r8JgOnwihjXB3W7W4DhUrOBgzU2yxQyeqZD1+T2anzR8vATRGUYk3lOxVOIRtn2bWvfXCAfHULWwUK3V6Zgkyz+GIID1J45cdvYPX2Khmuyj9kdB/lCBPTl5KqzgLl5w6klbKh/Fle4Vaw9TUyLWPYZzN/w5EwnnjyPMbGsxho25+gjtpukZF2bTuKWr2J6bE5dEod/Pn3/hNu3bzFsoSYRoigd60T4NTxQ1icm8XtpTVTbLSXZVdaNI2QvrpOCIeGC4QP6rUm8E2TEw4Zw7BuHQhdxqEyQDyaQOk6ZenZZ5/F9PSMK4fnuhQE/89//a9t+yuVc9j59VFXG6Twnl3HhHu+Pz09D+MMnZ41m3lhbhG/8fd+3cL0hc3AYFTNbraZqrzXvsFa+dFT50CIz74OtnJrWNu9jXxDM1BzaLQaiESjNrMqSuNC20pUqiXWeUfjDsRLm4ZcC/V2A61eh0ZO3zp81REuBUlTnzU5PhGjgByfQTqRYbjrjBQOGdFgNMdbPdkBbaR56w8VTVCB0k/15w+nEcjOAZERtAdRtDp8I5qx9sGvpYHxWx1+DTRZtg4VBKZBLU4zW21muZEmH4hLfqmU9cJwYkTv9mZRNbtna0+qA32owYEI04pCZ2a06bv+BOkwDR9hC7KdaMarZt2I9pXX8MB0KSFSqc3AszQdDkzptNgarFCnvzNoNbDnBhRI/xoV0r3KxrhD/DkaUFLCj5Q1hlKjDMjbOw2ZhNAa0FgOsL2kDiE6fQ4R+uDYUfiSC+gFMzaAoz3qpRaJJwR0po+vRkVpD/3CbdTWLtoh65H2LmPVSePq2JMaplaitsUr4RBUw9IIf1YtgtUeVYt6xfJRUeqqzQUi9FTQgwm0/GkqXxk+p3ilR4L4db6le3+c4cR3QFd1KqgeQtDBay22LdGj22qMeRqutNKjSy9ACKsp7HqpfwrTHz/y6soIQMjUI9/Y4JqeBTwvZpDLM9zVj/NEBl87ntDxJRGcOEjjY9JWg0Bthj+9V+F1AobOZOGXvG+TXMsMbxFHwqbDnutIFuJ0cTAMfwpUh6C91NXoJYrLN7bwp//xx4hHA3js5H6cPzZFdqUzQJiuEKMk9blXtnv/VStsZ6yH6iCCd67v4sbSnrcljTosiUPCFqYCrKK2+dwmwfrJD3I72zj/+JM4cPQEE2OZuj2UCnsoFnYxaFfsUPl0qIZ4Pw+0NtEoraBdXoGvtoVWYQXhTtk6omXcCRoNrtu2daIlA1Rl9NoycdzraRurMMKqEw2Atmo26zOY0HlLNDK16qxwh2mWGJffx+cRmzhMGokTR2Rw5lTvRpSGWuXj2hKDrJ4ZzvKqQyPEurOOWwt32HLtzbU7PhlajX/omcmqHfZJufpmoIFYi6Vwh2nXSdDFoJZn0TQAwpcW48GdwU3eomREj5/WAMj9smU44D509ixZxD/Jba/4TE/fqISUhmZIBVFrtJErlCk3dH5LEqFIxD5V85I3/NHbGUziQNI9+FOr6UZCuLpVw4/evoGdDvlYhHxBZ2r02jToOupbskO3tQKPotfkaoh1F6QsClMuxajjJIjnbKCLmVQEByezODg9hgPTI1icymBuJIGFiTRmsnEkibYEhY+MuFg4xHRUmgF1G1d2DT462hG8dLqSRnKlMsoNyj6dXWWDx+rUJH/i1zo7R/H0mQ0YED5tqaHtAa0i6J3OpU5XDVLTG95C5HtBlNtdbBUrWMsV3fYbxF84mSJuydeZtuCztM05ncIN4ImN6/ylNiaSYcyOxhC1wfQadRXRAPMjthVf20JKXwuyzYR4H+S9hVEOypSWPjk0wFUWxwdVLvtzjnWmAfo4m24mEsDcRAKH5kYxmZYB3LS9wwdazWl6qGpZuBX0elZCgoX5mIx0Aythtmliw2LZyhYN/DCk1mgily+i1e7ZWQ0ifW21oWpSqXydJiL8NhPxY3okiZiagG1Za63f8nroPmvnaNXuSO+inHsUoDC900AeK8najJ1khqVt0n5B29e67RfFF4JaUqU70YoIXU/6xmLIOR7uwpgH01Qnls3XUZuzXOmNju1RsZibBxPj6SoYdD6gtqvzUX+NjEwhPb0fE/sOYfrICcwdO4WFk+cwc+I0Fk+exfyRk5hYPIzk6AzlI9soOdSAMnVAfuxmWgu0IeXzWQGka9fulZ8me/hQq1Tw3quvYndtBaVSBXu1OnZ3aK+x3JNTU/DzKjzoT8Qve0klYush7Aq851znkhXxc3NOrgoWPZBlko8GxS8Ib7zTwAL5dEYTGNi6TSNX0fheJZKcub+1qs5Un1Z0ocxCWXfkK/zIfCAk2a3NNplip4c+vfFbfSf7QPGUji6GL9UGHe/dK+XBR/F7QWEv9U916K5uYFzOOIqlLz1eoXZeGvWlaCKG5MF98Ce1mlYpMbbeKX1+ZknJCXRe5FVW1zr4pABFGsb7nJzA0H/BZKCoMB5QWg0rmhV6DW4+ix9Xb91B/eZthGiLS5uzds3v9ZOzp7uCS0+iYXdnkzvvvvucHCtdtGCD8IRZVNjTAGU4juD8AjAziSZ1E3vjEaK7OLpw5XBYS1CGf6wzQPhTvn7a8WHZgkO5SRmmVZOJiTHEJ0cRmRmHnzpMfCKLkWwaEcZv7RTQa9BeDCeQOngAralR1KMh2ksqwYBy0Q1Aypy0M0Hoh/rvcHKGnhVgYbqSWHe2NmwLrML2ltWPwamCUCbPHz6KJ770ZWSnZszuTcYieP/i21hbvkM1nTqH7HfxapZFZ6M9+9WvY2J2kbRDiDTBiM5WgwqbhjTl/Nk7a3PUHbJUYrIp6s42eOrwIB5g7+2Jd9YuHd7k7Mp/roUMQx/EqQLupeHsSuFbz9LDhu3E8Z1PYwDElcKlbTYy60nmk84DEa3orez1lXwVt9a28MzJaXz17BxOLab4nrrY1iqePjuLr5zZj8NzE2j0qRNTX33swDRm42HmRT3UiEX5EX6b5Oj0ZNll0gc0KOLgULyH7sNOuszDAZCH7jN3Etxa7TES6uDcAZ3/kTQh5oSiY1NiTh/k2XwgM3GizDGQB3U2+HGfG6alq93LOGWUgax/hog9OrjE0BhmHZUSLHxmI9IsjN6ghWq9gFa3jgEl4RB+x96VgktD30lBD/QDNGzjyCTHKYjV6dhFrryJvcoGjVLigopBp+7D1lIOb7/2LnY3dj1lkKmYMB1C/UEnePRGgyBSdDXD0OCj4LFOFYOABgOTMaWUaams+mhx/zxOnTuOvdImak0KfXXYUiHRzEANxsxNLqJRauL5H/4IN28vkdFSZKiA7QaOzE/gN771NcTCQbx3+Ro5PZVlKRiER+qODBGVX53p1lFA72aYUpmmom4z8BnDBm/IyiNh/u+2nPJAoZ7fK+IXf/GXsbhvn8XRDE1dN9bX8fu///tYW1vzZm1+NF7khBvN/FC848ePo1BgGZmGvDrmnHH30U46/sL8In75l7+JUFhxGWDV4PJTKRUWCLKupeihy/L33Pkd28vYq2+h5a+ybntoNZuoFMuIBqnMx+J24LAqodWs2xZX0gy0HY9We9hexKxHdbD0u3xuEU/9oK0emh6fwwQNyGgoTgAl8IaUep8TjLr6+6xPQeno0kEt4ax5nDG0fAkEkxOIpCZo7MTRJe1326obxuW3dhYGWE9+lYvfsU5VY6xEpUj4uyw/rMO/H0xbh7s6q3uIM16SbYIKqTpN/draJ0UFw/luMEO8ZGiIjmIQm0IgNYdIdj8i40cQnjyO8PQx+CcWqCzESJM9NDsa+BBFiU7ojYZVZtW9vDp7HQ6GM/VNAZGBz2CtwrCD3Vkmt2JB7ZnlsMbqsGKO6Ro1CKc9zZJXhy/VHQ0QDXgfnUJ4/DAi06cJ4wkERw5jEJ9HNzzqBhSIBzcDkZmSDnTuSsRXg190sHUZ9Y3LCNTWERuUGLPOMqmDl/lJ0fLLvGEbFtEZSA42KTXaR1SdsV2tPNFqDuGQ+GwhhYaPeAyNE45ZBNILCI0cRHT0CCKjB+iFU14nDhGvhHvqCKLT9FMHEZlk+OQ+REbm+M0MgukJ+KKsl5ZWUbi2aVBoprPoWsq32r4viraP9cj8NWDVIX4U1u+z/Kp7KWIB0rE6H9W2RW/m+a2Qq3pSWYUj1aPKynAz6kWppFcpdU1fEqHJQ/BrCywwfQ1QMJ6jOxk23gAIH+8OgPR0cL1hzq52Y1fL+APetWHPG+0ESWsDvPT6e/jpi2+wjYbw9COHce7QGGLBNvPsoN/W0mPRGh/5idqVWh8zpqdjPfYIe4d4ubqcx/s3NkwJblBx9QUJc4h4IR23acyoF9EO0ie9Nqs1HD5wCCeOnUE47JY6x+IhZNIRJCJsqf4SxhNdJIIN0lSVxkWJ4JTctVmkwdYgLmgQWoeW5IyAU5kIneSVyk/67/laDGYctrteh/EkH7Tyr89w4iMYzdLgI4zdEtp7S3xfZBoR+GNsn2P7rb5Fhw5rrFGlqwf+c5gwrNMJ385LHmnf5w93/LsP7WOLKfpQ6x7OEnPtXKsq+USveraIfBRlui2QSJf1PMvQZByX1idxloIYGm8+7QEQlV+y5n4/fCeaFviifNGHcSjWUz9AWmJbKpMHauuicq2NCq/aHiEWT9he7dJHtF2U4BbmrBaIGzP8lSblXottMk/e/uN3lrBUaKERSqLJ9iT4g4rb76DTptynXGp3ukZ/iTDbV6eBYKuCsXCfRtoknj19EM+cXsCjh6dxfHEcB6ezODCdwcGpNL2uGRyazeL4/gkc3TeF2ckRO39KhwyLL6tsknkqq5tIQrgJu8KD0QjL7cdeuYZGU3yRfF08hDSq99IbtH2nTTpQGZmOPtdh3qIPo3PhTXhgnL7wTS+6AvFkg7v8Uqs/8o0OdstN6l11xJPUQ5mPVp24lUZMjylZx6EmjHQ7iLDtTGYSGKURqhUwsVAfIRKkzklRPTEHo091gkh3MW+8yXmLwfao+pFXCWzQV+3Hc4JZeLF2RcoT9aletM1NgvrY7FgShxZHsG96gtwQqOR3qcOoQ0eDPvqQ37McIgV1DoeJK7dVmePf1kHJP6Vu22EZTkPEXw/Fchl7+RKSqRSi8Qjj+skNWcYBy0r+v39qBHEWStvVala4ZpxqVZHSe+g+aycqpzPacXzI+Afry/FN8QHvlWiYNNEiDS7vUCfdq1N2q11JTjAmaWC4alp8SPQsUhryauNNnpcTCemNOvwc73c5i3bl9H94p/age6czkKL5oc2AlS7jj9I00JZ0GUTTowhlyCfS9Jlx95zQllbewfzKkfTmJoIpUZVO6Ts8WLtzdxaujkTpUGoH6XQas/sWcfbJp3Dmiadw9Oxj2Hf8NCZnF5Fkfm02BOlWWtFtB9MKL/zQK5V5S1r/rLze4+fglO8wb01Akk2qjlY7bJdhiU4L82yvWfInH3UV4yF8IbAVQ/zRykPn/tN5iepi+pd10umGcZiuJi1IZ9HWueIzGgDpUJfRuROa2DCkE4d5fidYRBOWgfDlaEcperVjYbpzNOPeDcOlcopDiiYtlAVo0U6rk++MnDmF8GiaINLmYFxZ4+J77uclQu99ad5B55VW+Snwc3SiNvcbwuj+uwkBqgMXIhxotrdmIuQvX0V3fQNh6WpK474yDNul/bd/rsS698h12Fw+N+eyl9Rz9KipALI/K2Har7Nz6E+MoUmZopKrjRtdGLxD7NDzn2jq464AMfwQtxHyQD/xqYlsHcr0AeXeyMQM4pNTiM9MIjY1hgleJ7JphFpdbN5ZQr1F2Tc1g9nHzyFyaBE1yv+m2oCVgOWQTq968mA1zwfVj56MJ9kz68TaqHQy1ufutg2A5DbWZS64gvEj2daHTp/Do898EfEs7TmmEGISWv1x9fIl6ycIMb6lw5946eNfeA4ziwcpi7WCU7aH4FE+TFdGPNP4PJzo199tIh0NIpNQP4XaKkFkWe1Kr2JbDRsCXV3L2fXuv2HogzhlcC8Np1eJLvQsOnNSQ+Fyn+oACOvHKF78kfWhVXoaABFMGtBdyddwa3Udp2ZG8dj8OFIhP3LbOWxtrOLEgRkcnxlHknz3zm4da9t5PLpPAyDkw5pEp8mxpjvSDh2oT435sO6Vp/JXGeWt/A/dzzjJtYcDIA/dZ+/IeLRn9+JIBI8dnMRYTMclu8aq/2LgNpNHIYrrQu3ZDFz3xkIeyA2F4t1UxdD45OUp41cKnWYBiTtLCbNzH2g82rkOmgEtx/jWiMjJNXu/2iyi2iiTF6mTX2VxjrfGCk0h1JXJqmMq4osikxxDOKRl1w1sF9ZQaeSsg6xZ6+P7f/rX+ON/912s3tpAkDDp3AeXoFJzbE0QO+g9LyYbDCAa1UwpMnrCrk5/m/EgqckyaIWFyqbVBIOumGUAjVYLkVgQTz37GJbWr6NY3UahssvwJmLxNGKxERoFYWdILMyiWC9jbWuT39JApgJyYt8UfvtXvoLi3jbeeed9lt8xfHWMy5CQqiAlWh1b3UHItl8QPFRDyMg1M56gEZ/hUIRmiMB0Yc1GC9FIEk898yU7f2NicsIGLFQm4fPHP/4x/j9/9meo1TRz2XUc/zyngY9Op4OZmRn87u/+Li5cuGCdvEOj7292PizML+Abv/gNJFNSrlSfLB8/MzpSHUuLIc7dFh0UTryWq3nicQf9SBstX53paNUCUdLqoUcFKxZOIB5NEHZ1mPfQJDzaa1erFvzEtx9RerYOWjpBhBHToFlsFJOjMxjPTCIaTLKOCb+N9qttfLAcetJh+u0AoeFVW8y5ThkJzTDrIYIu89Hs2j69OvkCsSyiWpkUTlr1dToNdHua5SpjRwV2+ckYFQqsA5LhA22bExtDaPQg/Nmj8CcOwJc8iH5qAb3kHK3QRSDDsJGDCIweQWDsGK9HEZo5jfDMGYQmTyI4dhz+1CH04/uJs3kMQpPoh7MIpMcRTOrcAT/rrEl8aPdz5isDSR1f0qKGZdet2ivxKdpTXbHVWpgpP4xrnav6RsqI4supvbOd2ZZfzIfI4DONb8TZPpNoBycQHDmKyNx5hGYfg2/0OMu0AF9iCp0A45DG20yzS7zYAJHaKXlF0N9AZFBEoLSK/ub76G5dhb+2ReWJONUAA5Fs2xURPnkzWvmdO7BPZXJpScHXyo5+IIFOkEZ7aAKB1EGER04gPPkoonNPIDpzHpHxMwimj2JAHA4S86BmD390Gr7olA0i+PgdNFASGiUJjIPWJAJRXoPEM9u5PzFOKo2hXCyQVnQAPInA4CBstnpGrZZwxGYQnjqDQOYIBjHWcXgS3SCNGJ884fNrRQ/5lm2zFSX9kT5MQQ8RzZpNSPyo/oh/0aV1ZIiW+CzlWB1zLX5b9yURmdQKkAniM0FciHZF66JBmQAaAHEKqjsEvcJnneniatGcEpUXjagsVp6hd05Gp57VAVKqdfHDn7yGC29dQjISwhfOHcSx+QR5UkPjf+5LtQHeaYxBThANiclmeJPPhZPjuHqngJffvGODcNpnv8VotuWYPH9Gk6zvKPm+r9VBr97D0098EVMzszYTP0S74f/L3n8HbZ5l933Y98n5zaFzmOnJecNsjthIYBeRBGgBtJhECEosV5lVUrlcLsv+y3ZJDqUiRTPItiSSYJC4AtfAYrEBuyCwcXYnh57pns795vTk4O/n3Od5u2cws8B0D2Y0Rt/nve8v3XDuueeecGOtgTGzrXx/Q/W8efmgbcO4Gx3eobhbnuZHHDLOoBVyiq7RvNs5+AWhARRo8zc6a52P6yPfOKJ+J+d0zQehuVHXhqFxYT6QrxvX3T11Vl+2EbPjcjtN01Fx/rjjwgMZAEnSM7qXnQ1l4h2/a477bPBZBnInnSWT9+maHNgL77Ybax6GlMftwXFoU4RNeHaYcTLJoHK9t7ZiZvx1yd2wS7pA3DgfTPbXHgCJQWcA8XOq+bh9XTeRM+gN3OOvyR9MJZCYBgIYoMqYXjDGdvoZrTWHWtvpaqPZjUMykaV0YNbrFZVtJBUNBvED+64Hnib8zi/MO/Jul3k9+fKWvvnj02q6PN182TyLduO8XVbOXKLDMbafctrQz7C1oynTywPHFvWpR+/Wg8fndGqxpsVKQXVnU3UFVF2GiuusZl42Zb7FEHDF6TYKBTWsi7BCo9/rqM/sRRAAvhhYT2C6vPBAQ+v82tZzkKDbOzu23eOUixh8YMYb52TEYJiN+uiYc12wVSh1lCkabsrpfFlRxkQE9DbSDlkduCV349U8iJWp/UHeOo4sp9taX18nhCpsgWc6jW066Fz0W87Z4cBvVrMs1cuaq+WTzoqM8ZVWSMrJp3qMKvUVjz6Ytvr0sz/4zjByP/kOaCleaElB/+kbKWbNLznDg5WzvKpa11mqlXRivqq7D8+rZPh2t9bV3N2OfIO2jB/gz6BfRZrGhfEUZ4i4nul1YYAL/ZVEWa3L4E+r09XKxo6a7Z5m5mYcvxcrPw7O1S0VOEQaBuF66roOTJ/Roeq0E6y33FvnaOtQh+8sZ1N75x10hIPKICzoAXpjACSr82u7OrO64/tCdGJDg1Awul3M+icCFA1dmDBpk6kT3OlDu9z7U8H1nkjY7/yM/MReS7RsaPwNXZOWAZmnMBZVtHdf6bQvmGzydIr5PppCOGAgn4zlJLDxyH/DiIzKmIf4SimD/45jQJbAFbod4Q0LA6WxjanfV6dnlK9OWydtqDC9qPKM9UsmkGQqsY3pKFcx7zCOLACZSR3lJWv7cPGQ8Jve7X95S10CI0EBLuEb4Dnqwr+aeexR42eaSSDokm6bqO0R0zpLGiwIrIbjUwx6RJh0SfLIzriMH/Xj+maAqFKuxFku7AzQpTM5bDHLSOsqxAr5Tnx8xCe3VB/Bl1LC6TtP8W7yi1oNvZAqJF8qlW24oNVd5zl/YFHVQwfN752Pv8VZEcQ1TqAD3watTVzSGnDkyZU848Xb5gxJeBwwU3L+Bxv1LZNhqKecbV0/aLSyrrUnnpA2tlQGJ44dfQwOi0+xUzqT9ni9S+0whX07XMp2LGsoJPTkkrMic41VngcOajg/o04QarJlo5RjepmADclQ/Dc6AAKdwCOLpt9hqyXO4mpBO5arRdvQQ7f9nvWHsmXiFGeCPfmczvzR92Pni8KJI1r+2Puku49qZ76hXYfhrI2cbXLKw3mEfYvTvpHcN/ycA8IuC5N6oV3GBAyAtwAP+9OVvrO5rid/+ANdOW/92oFiRYd/rOh49wc/qoce/YDtsobLRp2y4kr6zh98S80t22XwafiyeSc69z2PvEdH77hbhSITDq1BOC2yC3QyABLy4a131GLWtsmMdcWpajWeQ1K5PIAGklINuzwAjONKnU0e42b8cEOOtK6l4Vq3B288GyL0l/F7HM9vzgAI9YatwBN5snWsy4/B6DSG5psvb7R05sK67lha0MnZKdHcL6xu6fzlVR0/elAL4MxJPX11R+eubuqR25d1sGbd1bwQGu4HXQF/YDpgS3oktJR001vutR2y5dYAyC33Njg30H5b9x2Z0cMnFlXLYuTCIPji/2YYidHwBmYTb+M+vaFR30TDDuYaYiU9jq+TSyj8MDLCWatOh1yZYaNF+DrIpA4Ziz8HMesxc6S3rdOz4GxuOKYNwxCATnACJln6Xwhj/3EGSDFX1lR9QZVKXdutTV1eP2fBxSG7GT3+vWf0lS99Q5fPrCjTs0C1wKeTPJTL67QY7q492aFYON/jx49ra3MzyoJjGS1G0JAOTAMAw9zvOM/l1GVmpo37j/3UB9TsuAy5jpq9Xe21WzFAMzO9YGW3p/bAhrH94ROH9MBDD2pudlraW9O7bl/SZz/0iDbPndWLT7+ofnsYB/Q2cn1VjY/YesG+xNkTVp7BRWHUVHXY0ayldMMw1y3hixaMs4WM7ji8oIdOHdPHHn2P/sqv/qr+yl/9azp24rjypWKUiTKCi3/4j/6hHnvssWBm+0r76zgGTsrlsv7qX/2r+sQnPqHf/M3fjAGRSqWyPxDyeo591tl+69Of/bSmZ6ZAaPhQ0KFILq4XrugahSIdSdLqxhVdXbtsgWqBRR+aDbas63NzZVvf+fb3tHJpTUcPn3Sac7EtFjMv43A1K1eDrvGRqVkpq6lRmtLSjIXf/JE0+DG1pEqhbmKlHvMWxlBN+r3aYSAwCAK8ae9YBDCd6nnTcupcRzmLrUJUtHJVVc755cp15a1QZTA+bOikPdFN3VbIY5YcnWUUeGjacX32Rq7X6rLyS/cqO3e3MlMn7Y8qN31Y+dmDcc1NHVF26pAytYMa1Q9ak13WsDivQWFWQ/tBbsZKJH7aimXdikdNAyvIvXxJOZeX80qKGLGZknoue3SP5UoacQis2yFNA1hSh9eY9k1fHBaIcpl+EyPQIVEgotIKjsuWVTaGTbFd1dWNlSnzhvmYist3qHDkQeUX7jHsxzUoHtCwNKd+oeE2kYtOYxRfVjRkNB68AkfZrkrDdWW3zqpz4Sn1rz6vYn9DpQKdu22D2A0FhyXNSVOmfaIcJmWrxyBC1vDk6layZzSqHlR+5nbDc49KDBrN3q5sIw10DIvLxt+ClaI5K1dzxgkHGzfcllHwa8ZPzeVlAKFq3NrzzGodl3nkOh8Yp5lsxXTacB3bQFi/olJ/yzRL/UJfScFDverHKphDhuNBZadPKVc/psLMURXnjqm0cFusLCnPH1J59oCKMwdVbLj+q4salWad57TrtKFOxkZHhhUdzhtvOFjhwWAJMHWydXUKczaK5lRduk35suNDD1jrKM5Rx0YbDQ30OQW2GRsN9ozXdrBvaGHf7fOH17qm++DZpqON7Za+/Dvf1LNPn3ZbK+tj775d95yYMR2x/343NX9UeYePjkw7uMckJXgReMrlqzpz/qp+8PiLarlqe/4WsiExDHHgNOcuxJz0flNHFub1y7/4S3r/+z5uvlRT17gf5Ri8ZuC6KXXa6u/tpE5hvPPmkH46hPIMULp+WA0zNB5ZFh0rAmLQKgCO9jExCqGLwvRtNuIqyrR33E6gOxtzBo0u0/L0lIbm+d21C+Ybxqnbd9b0V3AdD/KuB7eZxDGT7E4QcQGe5HET3ozRlmbYjsOlEqTb61xg0+XmDJ/W1bMO4nplhZ7fYMTSdnFcaMPRfujk7rIlUMtvUru/GUe66SYZSpT1NQdAjAF84DXFmMT8iW6CgwmeUplTCkGDNsBY6cRKhe2utLLT0+pOR7t91435N1v6Ia8K9nUbSUWQQMdCpJfgI73o9PYtA26cc7FuPeJr339e53f6NvjNU0wrZMcaLQzqnmVA4LnPrP+BCpbPC+VcrPT4yEPHdGKurFkbXhXXD1tBFR234AQwBguDnsquq6JxxsYz2aGB9TsKVyzm1DctNVucdWXwGGAwmBjq/BI+wCPvs6rVK1qcm9GR5QXVrIMVunvmm22rY+aZNqg5UJ/w6F4ceA7/7bst9FyO0HFCNjOM4jZheNhyi24VfjHLFv7heAx2Z9hiy8+tdjMOX2+1OjERo1yicx/ataGLjlIuaGmqFttR5W2AcpArHXXw6djWNO6S979EE/YMfGDzUq+wrnS4K3Wd6puSQ2fcTOKj46Z7nPktK0HtmH1Npwa45eD5Kbf9uXpZS/PTOn5kQdM1883mrnWHtstsMqIeHJXOldRBPVmNR+7UfWrBtFG25DRCTRNDdZ3f5vaeNrd2NN2oa3HG3nyw4swHvU6043zJ/BudgQkp15XnlnurnOkElJsefuIAyPiOuu+6vq5stnX60kYMhrgiLe4YEIQ/U5e9ff066tN/+zzKNAIdkWHoT/gUxGlD19CX30WI5IGDqwObBxEmeV6yYoHt60JmRZBUmBhQi/LgxunBy/w9KNftO9lR6Froc8GBw4+TDg+PYICPYjK4x6Bfy+l0HI9JPx03yi4Nk0kZbBtj3S1Yg1NichY2oMF2WsDlK4nuu0kub71LOaf/k/MToYNYAeh3VfPZQ5Ycs+bdBevm2F008xSHjjwwhYMqkptcJy74QqRJfaS6ZzUN9U8dF8wrKvWaA2S112zFVsSsCCMLJq6ETI78rk/bdyCRuuQxEJooZBI2cO3vyCLkG/kneUjJ4J+2nZp7mr7jlEpztgMA07RAitFtTtiUVOTLbfgAgvy5XgvzdjnASS3pGgaoyElbCy0begcXnb62n3pGuy+dVbHddbvh67W2xD3lIy08z7jJlW/BJ+y4TN6/1Y5yxrkfyOiQy0z/ymuj0tDg4CENbVf3otnTr8INdR+XfUf1gpI3OgACf0SfIiAraoBgVGZLTetFTVsdbvtly7Hhpcta+95jumR8o4ssPXCfFj70qJqHF7VWzWnLhI3Ms/SLjuwoDcZAHv7mxMcAQ6dxUD/5+Q2AB2+kbRgI6ra1t63Hv/89XTrzIuRtBxUjfzP6+Gc/r3sefrftuQQj9deolvWH3/qG1q4w8TRJcXABX7/t3gd0x/0PxQAIW/9BIbQluFjohTTIBMlb6igr54RNWWeqV5nQmcpP+74GzbiNv9qBOxAYIW8G9kjI15QG2AE3KU9D43pOX6EY8GnMvkkDIJM7aBA9EnphJTB5swLkzOquzl66GpNYjjEA4sDnr27opfMXddvJAzpxYD7yfPryli6ubeqBo0taZAWIFW/ObO0Dv/lk5OI8Qi5aPsbZq+jB4YDglnu1Q6bdGgC55d5i5wYK48j0Y/XHXcs1Mw4OiOWL/4XiC3tKjIaGDWOKw9Ffi0neiIMZ8Rt3GsMEE5Owt6Rh1hACesCB5jkzETqfcn0b2S0rzHSUE8NwWlDFwaORxFD9UVvbe5tqD2zk+xnWjUtlgDG5hCjkSC0nW85V1GAApNqwUWLBu31Z3V5To95Iv/Ovv6Ef/dunzWArqtrQjDiRBogiz5TeGFPp2/iejul3vesRbW1tqLm3N34XYgeRaRgMOw/W9tluh6TpBC6W83ro3Q9qeqHuMuwqV7RBZEO73e5Ep0Qv09Ra+6LOr7+kYi2rxYVZ3XPqdn3+gw/p3cdntDBq6mApq4duO66PveshffSBU3rfnYf0/juP6YP33KZ333+3PvaR9+vTn/yIPvrog/rQfcf1mYdP6Oc+cJd++tE79YUPv0u/8vmP65c//WF99j336qP336733nNc995xQgeOHlG+XDbKMVIAXrpq5ecf/D//gS6cvxDG25/GPfDAA/o7f+fvxD7Xv/d7vxezPifbYP3EAZDBSPML8/rEJz/u65zfoHT7Z1jAJ1tOREessR2GgimIjvfd5q42tjd5HVtYdba7euyPfqx/+v/65/rm735LP/ju4zp06JjuuecB5fJF47qrgg2yQ0vHdOzA7Tq6eFLL04c131jSwtSiGpVZVfJ1lbJVk2oR7cvX1LUTiuOYlsNgjDt76G6EUARq44/Ofj8loZw62/1CrAiKwRHfB3nZSMxUp5WbOqB8ZUndrhVWK+OsHkIhGzFrHBEM6k0nvaGVtdKyCrOnNKwfU6swpXaxpmGxbAWxZEFdUZxNweCF8dVTWglEZ17MTHXeVG10KhleZuBype+Hpb3ZXNV1X7NxOq/czDHlG4fVyTW07fI3nUbboHO0JxvHAFfCif+zPZjxRMcwbRaf5keYvt1Wwhg2XM1sQ+38nIbVoyouPqDKkUdVPPZuZQ+cUm/maGx7xaoJOc8RZejbsGZKLgqIPfXHOp3hAIRwNo7b1GhH2d0zal14XN2NMyoONuMQ9AxnVKAEGma2GLNWPvYoMVajhlbmB2Xt5WbVq3Huwr2qHHpExQPvVm72Xql+XKPSAfWM4x5Kb8G4Z4WB8QAehy4zs5SYRYlKNllRR29Aqnt/o+3bKKCzi3cxmGtcR90yw3zrssqtldjqhb3rs9E74HoZuYzM8c4vKT99hzL1w67XqVg1kCmYV/k6MlwqzihTWZCqhyJMtnHU4Y+rMH+bCnOnVFy6S6Xle1RYvMP1eVsMmA1MN/3KEfWrR9TNLJtO8IuqsNKGASDjHWhzMaXN+GJwhvuoc2iZAZBd17dpkzYAQVF0/hm3qZPG0eIxPowfxsFw5iVXVrb0z37zX2p9ZU0HZ6v6qQ/eocMLVjxHTjtLW6KduJ5Jj4ZllwYWuTPdOn9m/OSKJa1eXdMzz5/TTtNUZ54APy650RTdZkrDtgrdnupO85Pvu0P/4d/8Nf30z/6s6tPGX6wYSSSbzRTFNoSlXN28iI4q28XOY5gzveft6eRwWbNDRxiYL7iNR0cSchMKcPqTc6/AFvTZz06rMH27slXX3e5l58H2Xg5Dm/C1XHPbNS76a1ctrzvq9fypZl4wd8Ttpua267zsKP4YBYFKkIARH8/g345nOk3TAAih+Z7CvNIlvpVlksFgXVtnf6xsIWt5U/dbBinTqpPUGUaHxzgV04EtWbOhlh+gg5tz5JFuaI8Yty7rmzQAMunkmLiYpGA8RcnHAx9sT7PdGWplp62r2y1ttYbRWRA4p9M++CU4GNgwLqnEwR1I98RQnBLQGA+8Ns4H5r97Dv3ky9v67jNnzKeZ+Wwe4TZN1LxpMSDKlix/WN0wUN74nC9JD56c06fec1zzxYLKTpdhYuRJdKoP6UpweVwRlAnezbabYIPOjhg0d8Lw265vmt2BOn2HMfy0M2Q5qzTYg1+sFAve4k+WSzO1om47UNYDx6b1rlNLuuPgfJy9UXS759wseG+fMRY3kkyeGcLdMAyLTJV0KqweAc1xlgVlG7MCpGRISrdXV6/5MLh3KYwIVtQ0d1taj+0xh6o3puJ8NMYGluerqhg3JUdiZUzIKJcPIoQ1kkfg0I5+VTpEmKHNmQeIhJjNPvZkHLzJjrrCB78av8HxxB3f2D6MFY9pQIlyObxlp1XFOPi5Vi4Evjh75fBcQ1nL5tbutnECDMjXktsyOopLDu6dFmQHJ2OPcfKhU6bTasYMb8Qa9druDKwjbUQdLczWnY+hQBY4TaqZchfY9tO4uOXeajemF/97vQEQ6ifqlnszAzYaXt3r6dkLq2pR76aJWCUVgwWskHYbcltkNTX0D53FSm3TcHR+05KDd/FM4qb9yH8MjZ8jv3G+ON8mb6C4EoImEJ1F1n3CVoo0iDH2fhG8Ndqon+Mb8Z0v9/EeKUw4OAbv+e9MSNz36dxDyuZy0AYdgC1vGAzGDsrl3RZZCWms9KyPDZAhjjsyf0HGJ9044TPyHuebcJ3K+XY48qXc3MFnmFCR6jswq6r54JL1ihmXqWS+zsHo1CNUwZlgxOUp+NDYRWo8jl+hUsUqDJcZuyh4O599haao82KlHB7+1zcjxsNbYtAieKoD+j4w5b+Ij8xKj/Et3Y2hJ7hDRdlcbyEnzfeYfIZNFXVt3O+22lqwLVZhFQhzX4juOo2D2QNmnie1lnLA7+cXD2+TGwMVuBiDkvzkDp6aysBANwFHl65o5YePK7O5rUqUzzRtZKXBrxQTimQFVMJhqh/Snzhu8de/e6tdnI3hK9sQ88vZ/uja9tqdW5SOHle/gV3o9mYdAJs2UOUIrygHz/7wRgdAsDF7DHwaMaUSK1zNc4y0ovOruq3PdNvSsy/oyrf+QDtn0I/ymn3/I5r5wHsDvh3zxAEz7sEvK9mN8XysOncebmNY/um8D5cRgIP+rGcYCOomypIoO+Lwtddu6sff+yO9fPp5q/oObThjNbH1u09+/qd18p77zJnQh5yOeTNnBj7zxGO68PJLGvZYiY4mCmfP6egd9+i+R94bAyDogNEmXEZL/mhvwBLIfIsdvJkhnGnrDVXrjwkKY8NtOmGIF/4fFes3tOFJGK4Q9DjWjTsq7VoawET6Sd7Az1O9JDkCGOY5b8oASNwkXXDsgx79o32yAuTi+pZeeumMbj80p+P2lkA6f+WKLl25qCMHD2muMW06zejF1U1dMq2/+/YDWqiVgh9aSIdeSXuijJzVGQNjtp1iAMTvEvWNYbnlXuGQRbcGQG65t96ZcczZWHvPqQUdb1hxsQCL12YssW1M8D6zIxiN2y5MHKGfWKLf3aSDOe0zqOvSi/RRyGEollxsddVTW51BU91Ry4zICp6VZhSzvI31WD2BFCU1h0dx3u3saLe9bWE8CAWFAY80iyZY7VhJc06DjArZshqNBRVKFV1eO6+d9pYqNrYf/8GT+uaX/61a6xasbFUUHZREg8HxS3jBcZmUBEejZibfu9/zbhuyZV04d84wjr/ZYwTkzdypAxxGArP6495C//ipk3r0Q49qdeuqhaiFp5lv30Z3hwO5h7u6snU+BoPoXFA/o0Ozizo529C0Ya/ubWrG8B+YX9ShmXmdODCnuy0Y7j15WHcdP6LbTp3SAx/8kB760Ad1/12368R0WScaOd09X9ZtczUdnp3S0lRdc6Wc5i0w58pZVVzUXKGo/MKSVKq7Llx6M37q4Bvf+Ia+/OUva2N9Pc7w+EkOvLB916//+q/rfe97n427gU6fPq2nnnpKXfY8/xPig72ZuTm9973v0fGTR50eNMn71BkQhpFhy0cneEZtK1TbO7s6f/FlPfvcczr/8iU9+8QL+vL/+Nv6+u/8ga6eX1Fnt6/NtT3Hy+nUHXfr0KEjMSBTKpQs+GZVzlZV7JtG8tOq5CoqmObo4Mz0rRwa9/Q50Kkf3TlhlAUljq/jSrfjPpRPK4AZOosQimHcJYFNjDjcmzgkCm34mcPU+s53MKpbJ5tXcXrJNFJWrzuwsZMUWOKOWAGCgii2yFlUfuZ4nOfRzlTHB226Eo0bDqZktm7sWUn7YYDFaRiBfk5KCP9oL+Gpe/8LvuByjlCM2YYnW3Hb9LVYV2F2Oe0Xbdjy1RnDh8JQN2naq+72W3fVsJKkEZ30/cK0BsU5+3kNy0saVhZVnD2h4tztKh241/4+lZfvVn6KLbgOqF2YVbs4Y8Xcaci4CIUUmIDPPhddafELFYntuKwQs9tcYdRWdvtF9a4+pv7aaStIWyrljXcbpmzxxqyhsHJooOYVzELuuH45V8PWnXIzp1Q++KAqy/eq4Pts9Yjb3mKsTOmqpj6rQ+jcNJ76TiMOT4yOKJShhL/UMUkNcKWuQ/2ipu3BqavG/AU8M2OY0tG5R+d9ZueS8s2zVurpzMe5bJE+VFOJlRmj+mHl6suGhy1ajAvjg5U0saqDFR1Z4AT/9gySgP/CjEas+MmxEsT15frIsDVXlTNgDrk+j6k4c0zl+ROqLh5XZWZZpSm26OIcFqeP8hw0Ct8yrC4j5Qn+arjpCI+tk6Ic/pKAt/PThBna7Q+AXAsQbZoO+iur6/pX/8NvqbXb03y9ps997E4dnKOG9/zduCFraNl5o+DSehIFk5/zdT5xUKH5ZKlYVr3mNoRM6PZVNPwMeMyWhrr32LQ+88F79Gu/8H598TPvMR84pamFg8pX6qHgsj1RHPosVhVV4myOQm3WhXVNuc7g2f1YSeR6cT1maeOYY1Hn1Bdx7Q0jnuJHx4LD9UdTUv025aZtgG5d1Ki343cM+mMKmA7Y3qbodrO+YkW/o27PZawtq7B41G2JVUTwk9zY6HP6duAvbifteezoRGGQetKZ8noufaGFuUybp7V77slY3VBszLutYNyZfznQZICXGFB0bIky6GjQafobfG0M0A066jPdOHVn+GavAMFFB6JjIT8CL27LPeN0tzfS+m5XazsMfPTUNE9hsILOOwbwov6oWzq3DN9Mo2JZ73rIucYnNG0cRAe9b/tOn62v1to9feOHz+mq06YzAApBanCwN/wox2xDku31VOi3NZ0b6O4jU/rEe27XlOVjHgPPvD5mpqLHGGYGyGK2Y3g/M6hKp6rhjW3e+G6DvgeNmJ77fm52oWn4E90GiQdxjckY8CLTH8acMPJN1zPlYmxNUXJcDgOdnZvVocMHdfDAAdWrblfoRz1zIHrt+i31O51grQXjK1bA+DsujEaX+Zp8AQN+47zYbnDgZwZVYHHgYa/V0dbOnjqkbYY+1yiqymCc2y/dM0w0gZ/0oEXnlzAPPY69X4aR7T8GoBNNJU97SeEnb649JzdusH5LWjGoBM9zWyBgbA/kr8jG0IesQ5sDx4qyKRvIxw7PanlpyfyprHZvaL3J5XMcVE/wHeUnfV+hp+godh4lpxW8hICuw46zZIB8fWNLG1t7mp5uqFF3TvQEgQcngQib6JO33FvpoAw76CH0P3hRoj4oh+8pxPi/2xDbdG51RnrqzBW1rTjQbvO2F/r9fvAgXGyZayJBR8Ylfu36Jh3uaddR/U7flW+yCp8onF+AlNz4ge+TRzez4DuEjFQj/Ykfu2hT6V36jkt8htLwLba6cisYQxb8J9rcfjpJJ+IJ2RPbNZkPxoQlvjLxzvYcelzwHBc/z2CeeWusHnF8fIISOMAPLd+x09/b4tBbJpP3YjWpwQJF8d7QVRgA6Tc1Zx2ILQkL5u/YcnzNus6j3VMJxHHEV3tSDkclT9yE7/h7rJr2MzsCMHBds35UwFYwfqEZaIcUoL6gC4fl58TH98mBz0SpfjfOCvgjK9cb9AU8KRzU7bC+AfR2q6mpUyeUZxUIDCjgTi6tICKta55/k9LE89vhJgDYcTtpE2MMxH8ceIMmY4C8P9DaU0+r+cIZVaw7Yk2BLHR+OlGpD36T86WiDv1L9XTtmV/kEohJ17faB11RcNMiqyYYwO/YBmwvHlTvwEF1bOz3XLbUr4J+QjkC7H3nZIIs3+gASFC9Gwq45pxOdPZer6OG9fOpzQ3tfe8HWv/9b6u8vqYjSwu67/3vVeW24+qVK9Z7h8pbBytx9gr2tvX5oe1vJoWF/uQ2lvhEYDh+iVdQJ5aRBo7Wxw4FifcFtKFz/ei7f6iXnn3a/MdogfBd4Gp9Wh/77Od06LZTlr9wI6dFwa17ba1c0fNPP6Hm7kbYa6SHNjJ/5Lgeef+HVCzb3qW94C2Tw54LpBkmw/BWO2iYrUNnqwVVzCvAChAn3j12wGef+DzYw42hpf7iLr29MWckjdPGgVGwkfJLuEpfkw7D85u3AoS86Rt06uTnCksrMxzCevHa5o4uX7mkQ4tTWl5kgl8mdgI5sLSso4cXNVUuBR88f/mKttau6oGjB7VYr5jPOgnjM+HJFOJsEk6D0vweT/5J0t5yf9whp24NgNxyb72zIXpsaVYPH1/QYikd8JiY3Lhzkft9hoUQMWMxswnR4lcp7M25iQKZ1CbyQyhZ6YJZWUA3u02tb1/VhdWXde7yS7q4ek5X1i9qZ3fbAgVBxt7TxdgqITrA4UD5odo2wDfZBouBFKeHoRnCHz44gdz3jm0FvGCDcsFxc7qydskKJTNYB/qtf/Vv9NxjL6vQr6ZOLSJZyYttI4L5AmtyfEo+wT9AybdkfPD++3Tn7af048d+aGWxZYWeAR3nmWHvfcNroZ2PmZLE8zcLSHhqfWZGP/sLPxezKTvGQX/Ycr59KwHbYoULCi5bZ+VHRc1VF3Vk5ogWwOXViyrs7CpnRaFAR519wTCXShbCaAB0zlSnVT14mxpLh8zkS8p3Wo6zoUrPV6DCiEPBwLD288ACqGdDu52vqjB/WNnarNgYhX3K+y7nP/7H/zi2v2IbK3D8eg5Gh3H3kY98RH/7b/9tNRqNKAeDDd/61reSwu74XF/PkTwz406cPK73vOddoVywX3LUh/ERVDoYamdnT88++5z+9b/+1/q7f//v6b/5f/83+t2vfFX/9lvf0xPff06XX15Va2PP+Cs5hnGQLevFF89Gp9GpO++KstRKFQu+ugVqwTRQVLbrMg/BTU75jOOZ7sATM/0ZhJh0JLlygxZwiR4mjvimUyuVURXMTKdNOUwS5ab7gXFoms0xkJdlmzc8ISyAx53Yo0wlZmIXZxZMk1W12w5rOFj6Dn2hnmeKsyo2Dvu66CaV8iy6XePjrAbTzSi827rLQxkGxh8DHNAgfiLGUykol3FvWDB2BzbqYr94ZusWMNSLKlQWla8cVqF6zHmfUmHmbhXn71Nh6UEVlu9VbuEO5ZdOKbd8j6/3Kb98v98/5O8Pq7DwoLL1u5Wpn5Iqx6XicnTQ9wt1DfKGkwGcXsF4K7iu3I7dkIdZK9/AEp0+KEYuN20CGqEjKttUKb/rejuv9uXva3D1cZUHGypmusaHWxkd4W4b4UnP8Yx5p2g8Fw9oNHWXcovvUeHAe2J7KZUOOGzD+LXiPeaROBQdZv6nejds8Jn4YiOUDmG3FkPpq/NkdqOvdMJHPwdGI1fw6ntmScde0aQHLQzc1ndflprPu9y7BIz4wE6coflIN9uQGgdVnFpk2CHyQQmLeh1SNwyIMOCGMZOeWZXC/tpstwZuGQiLVV2+cm4FB80P3SZ4zjou2+XRNvrQosPRKUcnBocVcwAv9BNntjhNqBUsynyU8zHgaKkdGHbADxi5SX78avKY/o1fFstVnTx1Srcfn9dthwq69+Sc5usD59sxnvoORkDgSXUY+A+EOj9/StvcRFJqWGG97cQhve+RO/Uzn3hQv/iZe/QLn75X/84X36tf/OJH9L77D+vE4ki1imu27PYzc8xomVbXeKSfMWbHu9KixWbd/vM15aeXHW5J+fqMes1mHMRIx2XwMQZosuyT7joPfZz4AIMft3njiwGQYfU2FaaWlNm5ol573XTWtYdWTFuug1x5Tv11G1scLu7yZqoLbk9H1TcMrEYIw3uM+zDYnUUqtzEC0+QOujT8MVhIj2nAMfn/agcuu67DbbXP/0j9tTPO21Q/e1DZ0owjXduWKFE7mB8r/NYjBpYp7HsOPDfj9qmDegzcv3kDIEnM0HYR/Wnggshty/5189Sre31t7Ha114MHm7/H6jnajWEJPQidAMOWJjxSuYj0NMogFkBDl3E4ziWj3nuOu2sAr+519Z0nz2pYcN0ZXWwLWHLZ2K4KucCAAQOhFadRN686OlvWx951txZrBZWcXnAew9ozw2rjnSYrVTD/e26fHd+3Hb/nMrUNCFu+tZwP2+70nBcHMLd7yaf27/bj9gsGM+g55jsMXLL6w8kYRsv+3kgtk8P6dlu7xk3L4Zjbhg5QK5XcJis2QBu6bWlGJfPeXN8agvGW5JwxZTjDYHXZopOYujR+GCgejLr2bWOwYzDMLwnneKySiO2CBhltN9ta2djQ1asr6rR7mm3UVTOjZyATHQr6AMd07FHzqXWRs2Uz8pnyGQYOi2agEJ9mwqbwEx/Pk/fRbkiH2kUWMohkzgbPM1xhSOMY4LJntWOQkPEVZ7gY/3vtgVrtvqrVqhaWFqxHof9lrWMO1bHuZAQYz+bKEd80lUtneTDAxSZZBZex1zMfKVTMD2zmW16vb+0aD2uabtS0NGNdwDAV0RN65olR/lvurXVJmiXSMW27JqHACRXyHVkdEyBMM6z45Eyu7e5Ij790JbaCmp6d0YFDB8w7eqFTk1jYCvbQTt46FnTAt6APGibp2o9MdKxuMtkmOHwT9B2pJGfyj++8GF8cxh6lJ0KmQXTazH4gu0nHZVodgicfShYp2JMPMFkXczK0CTqpYlUb7djXGHAHVMuP4G+OA83ynBmaa7mMRbcn1Dj06360aadvxkynISRN854ABX+Iz/6G45Lu3lpHyalp7kBj4MpwTnhIrd/RfG9P8+ZrU7RllxV9lWrLDYwTl2OygmACf0rtmgdfgQC7GOjC8+BXSFsGtrOmjZBJ9rVKRfVqLQZR2S4XmRZx7EMPgE6IjxtnknLnJtEMnlDE4Z6Ow6gAp8UEr6gT+JaLsrWzY72/oNpx7MKyS5doPKXkNNNf+MjYNwH3+F28f5tdNAG7BPEEKvDlOwjX+tzu2bO68sSTym3sqIaMBKf+xhkT+AjseNH6HYUnXKLT8YOvUZ+T57fJkT0gxwoQX9HdO9ZnewePqLWwoLbVGPhFTOKxJ8IER5SZW4prFLzhARAskIp1ZFsbMakI3sW5YnPbOxp88w81+M53Nb29oemStHh4OeyZ/nZTnXMXlbt8RcWVTfUurpv+bMvW0c0NC/Ld4TibDN13wofw8IokzYHMcEQtM7BD+ahj61PmbT/6zh/qhaeesLxNZWOyxvLBw/rwT31a8wePqs3EQfgZep/5Vdl4+OEffVsba5fD3qSJoI/WZpf1vo98QtXatHUa4vA+NIfIk8QTBt9qN1K9mLWexjlwbp2GhXIGNNzg4gX3E8+FgNwE8GN/o26c6TiNpLdDFzzD0/e5aXzn+WYHQEiNVNGv8CmeKznydjiDxABauVDW8ty8Dh1cUrlS0sA6fNn6/sxUw7Ipl/Ru68WHl2f1yF0ndahaUr7XU5FVTNaNY5cBUjct4tEYKQs0gYfmbrnXdsiZWwMgt9wNusQEJswElxp53EYjnHj+JwU22I2KNnLvPjSje+wbWZiGmREh3eC5knLwJpiE/8HEeSANWPrNujTz93rv1M1wJys/+mZqq5uXY9BjbeeyhdCOFeuO+qOOmq0dbW1t2pC00HXUUPQcb4AinunZaG5pe2/LSqMNagxUckDgjsuQlmObWdkY6fcHmpqat8CSNrZXLeN6evrHz+hbX/0jrV3ctmDP6vixw6o1qjbEW5EC8JLmvrKTwLeLnKIczOJ75N579b6HHtLjj/1Q21sbMUNf0aFbVI/pjYaZWU8YO+wrDbPmfbla1y/84l/U0vyiBazrprOnfL8d+4HnzHBLw1L42dqCji6e0PLMknLttpWDcyoHU7eQ7wEL9WQDxdoqs6DpFNXUskpLJ2LLFSo4a8N5sL2prHHKntpJQXBtM8hi5hRGmw36pk2X4tJR5etzNsYL2O5xZsff/6//fqziKBWLMaCBm8xi21e8x/fz8/P6T/+z/0wnT5wIw4hD9Vgh86UvfUmbm2xRZbyGjyh/zFHXzWZbC0vz+thHPx4dQdQEq0eae02dO3tOX/ofvqS/93f/a/3jf/SP9I1vfkMvGraNzfXYU9w2iUZtexeTmaPMunciztfl9e3zz70Q+Z88elRLFohVZpkY34ViyXVkWsrZCDUNQl99ViUNffXz0O2nZwUw0a7TN6xRhLEClp5SK0oime5zcO2QfELj3C837RBhDX04PALb3+msCqPS8MbBuPm6svWFmInOVk3NDrBl1c1WlCn5/RSHbs85fsVpsmrF9ejskodGE2wxeBTpcm8AfI9xFsvoqUe/S+UJQH1jeowohtCJcVgcW/0MBiwJZXCAsy6mNSyYTgrz6hfn1C/NaVSZ06CyoGFpUT3DNyguql9YUD/v91lWIsyql51yGepux5xBcW2bBCq+YNxheMV2L67A2GM+YLaiTseocRTC1O08N2LP5ZbUu6LOyuPqrz6lcs9Kuo1RSpNWBhhul4NVG9G56vxaw4aGleNuH/erdOgR5WfvUq9wQP1sw3BQvvGQ1Rg/MRgx5i9gMzBqGHhOdAyf8dVhWXUWHab+hgKWOBHls7oGP7J1RKf+cNB1WIrGV9NI66JGOy+YD7RTvkEk1AMlycW5JGxtVZ5dclp0Gqb6i04NnoHGf9RhcsCFJy3CQZeT61hho0MCORB5OCyzm93mKSlGMNuvBE3SaCIMF8wb48Dlp1Tq7ynLAaDcR4gIFBdIZuKuux27yRu2/Sjo8NEjuu/e2/TgQydUH2yaB+4ZP71oa1kGbwxLJGt8ETd+ELkxHCtD+BY0MYhzEqrFjOZq0lx1oNkyy8JHqtXzrt2OCr1tw+aa4QydmRO2qkyP0JXrjzpMnRAu78gWWrZoONyu4OnmC82r55XpbJuld90+jC/SYRCEmobvgl+ngWyYbOsB7KyQGlWPqDjr9tLeUKe16rbNAA+0Sigr29UZ9TfXjM9myI9BZXa8AgQDMw1wBgpI0zeTejPQ4zYc2AgwGGjLI7jGMa53154YtNkx3Z3T3sUnDNdadI4XGvMxAB6rxigf+ZnOIqbxFPFHXfXbu26rxkNQ+Y27oHXqMpKHkn7SAEiiV2DiP37igjTiJl0muInZyualdGxzltGuja213bZWdgfasvzsRd3Tae96Cv0h6Rq0zeDhtFEnhdzjfIidvY42d1va2Gna72pjaztWL2w1O9rwtyvbfac9VGPuoA4cPKDDBxd1ZHlOx+wPL9sAW17SweVFX/3uwEyc93D7wQXN1Mpq7Tq9jU3tWo6tbTsPXzfbPW227PfaWt9thl/b9ffdnla3nafLsuV8N/i+4zi7XYfta6eDvEpSyM0ChJiWU6ccAyClmNXGGRR90wu8Nad2F56bs75k6gARDht1Y7kIZ6iYpsr5jGZnp3T00LwWZubMA6yLNXfIxTLL9Wc8pRniYw9pUmfgMUt7cXJuX9HJG7HGP4dhXKnV7WllbVNXrm6oYKN1dr7utoLshgbw1Au8jJYTyUXd8wbJm2Znpy+Jj+JdDF8mYScuQjoMr0LnNUzwOHCw74jnb7Sn2Lpo4DJmS2oaWA4wX99uGs8uu3WNQiGvxcWG9Z2acW5aMm5j2w4Dx2ATvCVWNoYuCMxsLWY+4faOfO04DpMUWBG2TT1vbKlarmqq5rbotBgsQWeIjh2DBryhL0Q5g/uEbKSQqZ3QZsAMxUhxuLvl3qgzhQQ+Jzj1f+SN64I2FO/9B40F/7dHbLoZ6scv2K5xyMUD8zp6bEY75h3b2zuRJBNaFuamdPzE4ajHdtd6uumfSQfwOpOG03R+DMhRf4BBbs4IKLifOGh48iLC2F9rJYkOJrxz4ujsRFYlekn0sd9O9mMnWY8s4C4md5FWhHK6js6gDpNW2P7XxG1adzhWN/lb0W0iRJE9nU7YBKTNWUHYHdGZzvexI+2AIGBN7hrtvrUudEj0IMMSdet3lJzKZWJe2Xx0erCnOesqU+geLjO8jL/Y9o94YxxP4H9FOUgq7FTjwfiIMoMP30dc8uQK7/M9uMIxmF+pVWMHgk6vZ7sBXZN8HD1l76v/8xw/nic1mhxXbNKQdU4Peh1bJOPwrjs/kOe51Uuavu2YVSbrBtYtIkUCppDxF3mOrxN/fX6v5wj3eu714r5enFeEHwcCJt6n6xj2yQsCGU/Ddkdnv/8Ddc5fUt02ViV0XuMj6o6w9sQEh3y6DoCoI2585T1lxl0X5G1zljgBEFMquhzaffS4erbPu2MgmSAQMti4iCLaJd0VH6h5gwMgZGeaQi/0PatR6YxmMLSyuaNLv/d1VZu7tjMyahqGi60dnV9d05WLV7WzsqbNc5e05jrYtFzN1ixHD7ItL7wL3LoUzpwBReqFlVHAHWW4Du+pnmmiQOpyORxy87E/+gM998RjKoZKaTlr9nT4xO1670c/qamlQ2qjfJCX4xUcZ6pS1Ld//+tauXwxJphSt9jqDMp89Kc+o/q07V6/6zs8bYRBEngfOtNbya2whxMtDzVVysa2TZwXZ+z4I/or977F87APG2/sqOu44fn67zfiJrCkNCb6WpI71Ne4LoNiHNrPb8YACI7nGLQc27XQS9a2Wdp+FVmT08xcXdlK2Xq/rKP3dfbSui5Zz9yz7p73dybecuB5pcC2yUPbkk7VdAJ3xZ6jZifppVyhRXRFZNot93ru1gDILXdDzmQTPhqexVk0xRA0sBU6Ts0mmGEDgbkh0tdL4+9jdFkpm9Oe3n20oTsOzybm4FRorBAkClfsZQej8NtgVGTqlpzC3VyTRmAEs+A+SuA74GamUZz50VOrt61zl5/Xbnfd1kBXbIM15PTo3MCMpW8B2lazuxsHl7f6e8qXMypV6AQhDQuxflc7dOwDsRU5DhaMTk8LrNBhbJTCvHrqa2ZmXq1OT1ubK3Gg6bd/74/04+88rWHPimtJ+rX/5S+pPWjp/MUVy42CPdhITI8ypNkGCTdGn5+HqlrqfezhB/S+e+7W0mxDz7/wnDY7e8yrNTwltdniolRKNYdha6W5GEqHdOy22/ULf/GXNVOd0XyhoINOv951Xba6mhlWtZid1fHF23Vg8TZNVadUwrjY21R35ZJynY6FgJ+dFrPzWVEwQig4j6xFRWb6kPJLnF1QCZjzxVLsUz3YWvVX6hwBYcOEe0NnkgmFgjMjSvPLMQDCrGM6KS5euKB/+k/+iVZXVg01VWg8GAGT5fso8JPBEA4+/43f+A399Bd+xvi3wuIwKNjMRj794os6ffoF1xFKgqvbynubA9GtfAflOd2+jfxisaK+62TDCtPMzKxmF+b19NNP67e//Nv6R//wH+rv/t2/q298/Wt67vlntbe3rW6n5dhWuhCcw4wVnJLhMm2MbJSZVti6JlMACdSilTIruy889YyWZxf04H33qWyBSP8Pgxzt3I72Ruu6untGZ1ee1dm153R+87Qubr6oy5vntL634nB902AljBRm1vDL0XHsciU80D5tSkCj0ItfBe04XGoDk/ZF28CjXOH9lZULhoPVA+xPOhL5NJQtzio/fVC5+oJ2e3lt94saFKdVmnZdVWaskLpW6bhxHaZ8wefEoyggwMmd+iYfe4h44v0uPCgizv6bBCc8I/iG76NMLk/MwPGbSN10Qupp/g9wj1d0xDPxgIv0/JtYEAEPfowJw2nOBRn4G71Dzjdg8dehGyiIjMDGjfFDynTA9jefV/fyd1VsXbTiZ2XdgWLWkBUZDs/NRL0UrMgwO7qh4dR9Khz+oIoH7tewYgXbbY297ckz4c2ZhE/wxo2fYzBh/8db/+BvwAVeYjZVmpmZOufBEYMp4IIBLUM2NH8acQ7TOC5Xvxs2L2hkOsuP6EynZI4NngKCrPq5hjKNI67vg25X5ieh5Ln9AqdpnfoEvwmfyRM3+YmjpsbPqQBjT0RzAvMEVo5EPfPOjmvqqHQ880MGcBJOmJHVV878O2OeyexQFyilN3b7ycfTq9z1H4wDzkaoFjinY0vatsHBoALGBHyKX6Q9kVO48Ttg8ZXyRoe12z8dFnFWD7g0bl0J9uYNtlayzFo3d2Zm+6ByxG3qhK18G3DUveHABQ8d80feIHezakmty+pvnFG2vWFeDN+DHgMzBiPRBmVxBgabNmjaA+dOK2igMqXiwmzItZ3NKyoNdv2W4azUTgp503jL5R+1Qn6osaji/Akkl1FfMUzkkNp2qh/TQOSLHgAcQ3WNt77lZ9H5M7scPNE2oaqAE5cA9hvzze557T77TeWRvyC320udHub/KpUdjNU9SMGiy+v8QbfTMyLVNx5iFYHp72ZcSEPaizP6yQMg/KBNYqXSJMMmtUFe4/lO6dCFYmVd3rBbvu71s7q63dHlraY2OrKmkVZEDeDjhAOnVKnpjPyAhJqLOiRlyxcORY+t8/yFoSuee+YdXfu24W6aztqmm2GubLlSU61UsFE60nRpqJnyYHxAZVX1ckGNcjaeZ+tlo7oY25zsdYZxXkCTwW7TV9M8q4U37lt+7pC/6anr7z34md8xgJOufuda5+BQPKWAdwA7MhuPCz5hOo1mAe5M+2AvvHER7NlhIeXgh4HNFDdmM5OW8Ql+q+WcThye05HlWZWsbw7au5aD5sGuT/hJ4tLWARjQMx/OsYLMOVFn0flmngiemZBCPq700EG62ZpW9gY6u7qtbX+qTTHrmbOe0HEcxzAw2BLgweNJx/I98nU6qT7N0xyOchIwlcBX31O21CJclkBRFHYcwhDGd9+jA/ov+KwDsk94a1TUSjMTdMTgVJc8xjqMc40Z99OVog7ONbQ43dDmuvVJ/+ik7JK46S5nnQ1dlYG52G7NdQjndTGspmRcn9ZfzA/W9jq6urFjWqpoaabmb4bfOOBwXjgjs/BZGURds3KT82UK1nuoNwxzZDEMCRpOXIDiUOBb7o050wn8N4gF2rV9hX6JngbFGbG0DdbX92OwghUPg2ib339+RTu9nOYXqpqeaajVMv/Z2HSdm06qZT109wmVTdu7vY6urK6YwpL8YWVn1nyEdgZ9pkkHzt3P1CM0PdHzuELP1/zY+QbYguxwhI+n9IZ2/YrfuA1EMOcZaTnfdAcv5i7xWmg9Op3sbW5FinDK0EG5givu/ZBsJ8fl2WEDjRFq4khx4id3/j4uV6hCb4MLaIDBN8H3aKcuUFpxVlDBbb0w2NGshWa13VSVdulv/Ogwi4kWjptK9RqOb2N8TYpIWPAfdWC3X+/pMegMz6hqvlJSuW4bzxXQs/xgIAoOCP/CMxBFnSY+lvBI+nyLiuFC4Xw70eHD+R1co2iejW7WMq/aaW5p7tTtKpgXBTSTinTcaAXjqKSKhw9DLePXr+ugmWtxrl2JF6YLL65LZPKdPPE43l3vIjg4QjfxHziAapFrIR8iFPC5jlzGq088qa1nnlel2VbDieZsS6eVH2A9IBmnMUnbsSd+8s7u7aLT6120GCb+8WDZiOxi+6tuY06DA4fVqk+FJKAsuKhGw510KHiJX/pF2Pl+U2NSxBs5BN1CbGT9mDXxHKw3GmRjxeuw01a/ua3Cwoz6S7Zjlg+qOzulzPSscnMLyk/NqOg0s/b5+XkVDi5JszXLQePedcGqpJDv9PP4GbpFJy44m0J09ri4AXvS37CPYhKnX9bNZ3/4R7+vZ374HZVjwctQbcc79eC79a4PfVyV2UV1sRP9hW6W4aCjqtvWiy+e1kvPP69hrMozPWADWff5zOd/RvWZ+cAjq2fj7LPoBzEAxmPg8IYcbR36TFSV6sL/gmGO2xLt1nRNXoSLlWGmU7ZKny4yAFKwDpI0fqJGlEk64YJCrvMTF4HS7Q076uFaOkFX8dbwB3+BL5InFANcrkvX0c1vgZXKGHofnMt1QB8BO2ykz07LOGJV5tXWQL/3o0v6ne89pyfPX9W51Q2dPnNeT50+q63eUOW5aeWsj8P/ko6KQed0bPNEu3BGcEdW9UGHaGLky1vwecv9cRf9zeP7W+6W+1O71NGRmhX/J4wDRj9hXZMQdPomJuCGiOA2E5yv5rRcK8ZeyhhZHMKIIR/k6PCkt++DsfKXGNWbQrKhwYwd3NBu/7+/DUdd7bXSlk+s+sgyxE/nipndMNtTpjxUL9+0cbCuK9vn9PKVF3Vl85JFa1+Ncl31Sl2lfNmGiNlVGNg2ujEeyYTBDyMkKTwYI6wsYRuGfiiA66ub2tjcNVPs6oOffJfuf8+dqjYsMM04OezSyYXwjBFg39OIDZwZuNVb4xcBxB7eCxauyzZgPvuBd+tv/uVf0OHZuo1QZnJtq1a22WnDxoVRpVhT3xYwHR21RkMf/9jHNFetqth1Xi+vauOHTyl75pLmdy3Idpr2O2psbmpqc0u1rW3lN1eV2VkPIzc62ikE620zdKqO9wun2lH68sZHseRvYVZbQygrW5vRkFkgCBXoauKjRijgwOnQYexnOhX8CVyyaoPtoshzsvoDZYAVGczmwk/ce9/7Xn3xi1+MWd0MhqCwdByOM0F+8Rd/0VUS2kfE73Rd34HH5HnHjKa0zVZWly9e0X/+n/8f9PM/9wv6jV//Df0X/+V/oa985Xf08ssvaWt73Wm5vJTZ6RVd16nT0uk4T1YPZIoj3fPQnfqrv/6/0N/53/4n+uTnP6RS3aKrMLQBuqp/8c9/U88++4xhZcuQtrb7Wzq/+bKeOfeEXrz8vK7uXdBm/4q2RyvaGl7RRv+y1joXdfbqc3r50umgJ/pzaFID4yvRB22wb5+MH9opalW0J9+Hj3aFB2/XYEYZp5OCDlpmlSNYe5mKOpm6eqyeKFjwz96u6ePv1dTB+5VvHFSfVRSOCQzMXh64/tIASPL7ZoLhcYjIY7+tv6bj/eTbK+F8RRki/UlekziUM3V4hbE8YtY48XF8T3H2YfIzLhQK+2Q8ACvvUSbG+bteKSD0GIdwOz+2o4q0ei0NN68o11qzUrTnT24bpseYsW/ajRn9GQ7tNS8ozKgyd0pTRx9Wbv5ONbNzavXTVlDEId3Xd878FW6Cl+uvhKEspmeQFA6cJdxRvhjYoh58jXpzXOgjKjDKmdJAWYx2SnqEDCbkBAJlhEnxkgzg5U/y5Il/vfJN4DCcMYiTZvuHMeO7Sf0G3RCctxM4cVFfN+NI18qlZYFseLB1WUoZvAIL1wRDGLST+31PaLejWIFBGMMaPpWfDm0whTyUDbjgc+CFtsIVf13dp5LxS6mTLEYd233FXuaWTxm6mqH9MJqcN3WIN82FrAgeSgJOxTIpZq9R933HydYNrg2/UTnOGBrYwIzB7e6eCk47lzfMNvpi9l6AxkBMwkgyMlObA7aQRdAJ+cKbzQzZqo+Z/sQYWKHnrBwwAwwMKmUxjgY7bjur6p35geXKGVWsI2SRF8O2eutn1T/3mEbbZ5zhumNuOb095VlBCt+AFt3OAC7xEfzNuChJun0jjij4aBfGCZ565yXMgk5pyxsGKVgpcX5tRyu7Pe2OiuappeC0YTDbRSmIM6lH3H6xaItQDCYXhk9OfTN+tkmiI6BHWubTvUzR12TAIcugOVYkFU3XJYZHLGNYncbAoUOFQRcrkkwX1E3PaO2O0+s6LQ4t7TkfttWio5u80oq5lAfn0uAH/kan68Snb4bXMETbpX1e7w3XwN+i/MhM0w/BxqWL9hIrf8ZtYowip2U028O5up09FS1HS0VorKW69ZyH7rlNH3n0odg+YKGSVz1nY9J0UnbcfhsdiLoxVlwfMUPPsHMQNPTEeWx0crAydpg3VoyDVr6mC82hfv+JF/U733lWz17eVTNXBmPWocZ15p9r3UmPYjsYYKYzwomGj8k9QRPJcZ3ESfFpNz2TMzrUwG2UOnM8vw/dJm8Bb5yytVizn9Ve13rJZldXt1raavfVGSYaSLycfJil2rMs6qhqGX5guqyPvOcenTy4oLLbD4e60zHOag4MclZzMouUwRyGQbOcD+M02F6LM726+aouWB/81pNn9ONzG2qbHtLEAuPU5UVvYouckDF+Cc1Rj1xxUXJkpytvXJ233A060JdWQxqfpgnoFRuATufQYY3jUqHitlMMGg9NyJUSq76tj6ysbmh3e1d71j37zU01ijlNlYtqFBzXaTR3tkOfZVs1JxJ6OB0/kbfzDc5E9vEmwTPxr+f2wzjdpA+m9v9aDvog7Uke5I1PbQaKQhAiy9I3eBt+EgYHvRE2Bp7hP353ra3Z+90bcaEzEfFtcglm84jA3QR22hdPbrumg2aupB14b4GWi0Pa0gpdcvOAP6nh/aSvlB2Vd6z2RtjgwQaAMxz6/pCplNRYnNPc4QO+zipb4hyoZMP2kYkOD33GgLHjwfPCRranSMiqoDd7dIkYNCEf12tMtjSvavjb7vNndfXr/1b9jV2EAAzIgbiJ6BEnznWKN8RDrqUnHN9f7XEJl8m9+rof8Foy4XgV7eG6+0lQfDjaKvmPy8ct7Yhyxit4sHWj7edOa/OpZ1Xca6tKStaP4rwdt+1JtpN6mNAil4mfuLeTTl/toqVT2eFtq7tcg3JFI9vXgMlseDpxo40GbdNyE/W+wl1Xf39aR0oMkwwtw7DnnYtls+mkWtGJD39ARz/5SR345Ke18PFP6vinP6Mjn/y4jnzsQzr8EX/72Id13P7Io49o6vghZUzLbKGJPc92mqzk77vuGJgK/YYMaRjcjWGFU4Xu73AxWIJ3eZlEUDDPZbJFyEnrSdXpGeWrDZOzeTA83HF8CRppWyG77c67NcXgiDOl74Iw/XbL3rYAdEI6EFNQ3TV6uXGXUriWktMN25D0k0OW837yHzmE5/xC2iycJ1HAzUPzznGmXuom6ML4sqM94uFB8LyM6/7qdku/+62n9ONnzsWkovr8nKbnZkwXBTVtK/34+Zf19e89p5c3W9a9bHvaMykX8yzVs90YrdA51Ebe8TLa0S33ei7Vyi13y70hR2uzH1/Cjdvh5EUoMHbp8EfILDFlOs0WZqc1Pzsz/n5deBQbFKBJmjBMN+A0qxa3n8lNuUgtGMM1D4OODio+OQAzBoE3VjAwlcjhGcwhQChheBvT3X5Hqxsrunj5vFY3r1rB66pRn4qD4VDm0iF8KG/GQdzbkY/zoFOyZ+Oy12/7FZ2nQxuvHXYd0PKxWb37gw9p7uCsCvWiDdKe+Z4N0mLZRnDZQq9svLAaouCUbcwMnQcGCekYzOlGScPulmrZnn7ukx/U/+bf/2t617GDmi60lR9sqZLpqOQ0B80WXNRKSEm1xXl99qc/H3WU2dtU0WWaXl/XzPaWZpvbqjevqLT1grovfke73/897f7h76rzR99Q/5kfKbOzZkO947R69vQEOF37DHvK5/vqMiWiYsWjVHY5x4aIhX2xMaV8xe+olUA+CJpcqSm+XLtSJyjEOzs7QTvQDQrA9de+lWCueA43/9Vf/VUdP348lvbzjtUhseTd93fffbc++tGPxjMDKQxWMUjCQMpkFQmdGOTLqpG8aWF3a1uXzl/QypUV7WxZ8XYNVCscBFjSwAoKcXEo3hiiRStMfStMrPj4xKc+oF/9a7+gD3zift3x4AH90q9+Xh/9zPtsMLh0xaGefOFJPf/ys9rtbmt9b1XPn31GZy++rJWtLe11e6HAiQ4QZqCwesS4Hgxbare3tLV9Vf3eruFmvy1mSYMHpxttbOJvwNnAjFmbI2YRYmfYUDGtYujETGXTY7GxoLkDt2tu6TYVK7MuLzNtHTpmnRPr7XbXE9ef1hEeA7tgHLr9jvlQhoPo/Zx4Bp6uJl/pcho21dm7qL2tS0YUK2ecBnRkGgJ7tC1TsTq5olrFaeXm71J++SHlpo8qW6z4ezorBbpjgBQl6Ybr7XUd6QGvr/6LjijapOHCp61g7Ck/8F+Htn1W7JDxGtoav4uL/9HxF5GI+6a5pH6Hnn2dezNzeIVzZsHvXbecLZEMsUldvKpOopzXQ+J700fsbc7ADVfCR8eDeUPW7dO8csRqB+05uaa/+x3t1WYaA8fUe8yo3Hfck4bbM+/DW/50SadnvuXWxkqN/o7lxLgDCDDpC2DW7oAZWKXwGdNztOmB67qNbG4om19SITPv8JYbfo9MQfYxy6zNGSPILtPxwMZ5bEMV5ZuU2XVDkQM25+2MGYhJW8K5uEM6qMADZxcZBsssqDw3GCnHILbllAZXLa9eUvPst9W5/IzlnGEu1c1viyqxcmS0rubKj7X57FfVffk7Gqw9HduzqXtOo/5lp7vmPFoqs1x8DNVNOdCd/u1fXttdX+8TR4cL9Yf3o+mDJOiopNXttbu6cHlVl9c21exaXsAP0AUwkmwdxcCbaeWa8Q9y6bpkIoQ9q0RiEC7xpDiUHxqIlBwXPuQQMRDvOoiOQceGP6WOQaBBmnKXC+NsMrDJLP488hG9BzmKTLQcY4YxswlzLsMrPe/4nvJJNH6D/noXBGWYXsOHruOSXmsGhsPttJI3hqxLZeG72XysQNntGP58USePLOtT779PH7r/hA5Xe6r211VXU3XHYbABQ52Bjtgao1CxDpVTq0W7d0swLTIphkkdDFaydUY2W7KcXte//taT+uYLK9pyHmxjwPZeDAw5kkG1nDAcdHCNnAcr6RiIyLmuqKckO1wkPzFAH+cj+d6ZxlY8BZKhPl2mOBfF9dd3nfTJw3pAy7Sw2hzq5ZUtre3u2ViGF5gqrKfEtoBOr++2z6ASRnjHOCpWed9XpVDSvScP6YMP3qMFN8ui9YasdVlafhzKb5rtdVoxQ7bi8sML4wwslz8GTY2v81c39W+fvqCnLjhvBt+sB+RLleD/ieaon9T5SLmgt4mbsMw32vl8y13vhtZvoRf4rmnCiGY2adf0AR3vmiaG5i8mN+v8buOMs5uuc45Tmzat+re21dNXfvsPdPn0ixpurGqulHebyGtrdUetrT3trm24Hp2e+RL8DH2edWrRnYhcDFl/y731bszFow3FY9QPMnjg+7b5zw4y3nUZAyXYeISjbRI4Yt+8I6WJC3jsQzsyWTLoUZmua3pxQTMHllSdn1G2VlLPdktalWTW5gTosg1N17DHGWHIS8OJ/WWhmfi7b/Hk1y9mXT7TfNd8bLerF3/7W9r87pMutHWoEmV2NNK27GLSB7o0nY45s1L21af8pBOwT4CeAE4eeD9POivRYSbeyUbECc4ncSfhgTE2i7Bnfgqe9CJtnGFBOtNxzooErj3z09gue2AAKffKutZ+ZP3myqYsqlxOt1Rn3LX9SLneqS5w5LrFfkc6dE2TDECoyKpX6Be8JK0HtE4cs9pDtxw/35jLWcI6r4H1AuucRrZ1Zsth01LTcOyVK9qq17RSr+rKzLSuzE5rdXZGawu+n69pdb6q3VlrDKbpLroSkxsZ+Hdd9g0zA3/UUc9Cr2vfMQF0TQhsixW2ocuXbCpfE0DWOwYqFS0zbc9Dq8hIBmmnZ+dUNV5GthWjuqEJtwPkMnba/fc/qOnpqTjvla0q+d7psBX3Tuw+gs0S9qMRRl6hf5DODblxItc56vG1HKXjzDUax6QvBtvXL+Pb/2zcpEHGlfLdOHb+JAc990xfwdtcIfCQvBl03nhiQthWd6TvP38m+ngOzOb0Mx++S7/8yXv0K5+4T7/2Mx/Wpz/wiKZqFT137pKePb8dZ+KBz+CYtAnjGo6O/g7fD+7uILSwpGOOAbnlXtO9g9npLfe2u8Tr7MLU4SauMN7g+CYv7hEBqVGaAVjwzFnATNctjFg1gHBA+DtgzOT8M3bAO5k9E4ohDuDGWafOwIyKNmhh2nHGhxkOe8eynQFazmA8WIGylrNSMrLxzrkf5y+d18XVC8qWbWA0amEIhvhz2nkMZDM8DrmKfMyw2Oah1+mo3237hYWl1cIH3n2PHvrAXfriL/8F3W5jvWNjI1tk1h8KXTs61OlIYYkjBk+kh5LIgI2N7KLhq5QMZh7jvWODu6lGtq9P3H+P/o//8a/ro/ec0kLBeofLbNmvvDmy5aoyhvldjz6so4cPhGIwaG2oe/WcqoNuHL1ctjHMYeX1YVu1zrbqexuqsXXV1pqKzb2YRciIf1LCwasFs2Hhma4NBliyFeMklzqT40Bk46BQqxpf5JCqAKYeBx86bqqXZEAnOsONbPSlgQyELG6y2iMJfcPhbyjPDGjceeedeuSRR/YHNHgXiog9Yefm5vRrv/ZrcTA6M0MIx/kiDILgiMOg3GSJZKfdioGoqr+nsxWSch2z4SLdbKw0yRWsrBg8cNHtsYooo49/6mP6ub/0BR08PusydzTIbSlb7bquP6cP/NR7VZoxbiojXdm9rDNXT+v5C89oZfeK2q7DoetMNk6ZPcKqih7KPWU2XuhkCJgqBRbZmJSMewaxHIIBG4MVqLwxB+IpCPVmb8ENpVKrzEAfulycVTDoF2JLrEJ1SfnitKMV3U5o8dSHM79xAN5ehyUXnY02rIIG+cfsdxBtPGO8gGvqwFjJ9txutl/SoMuAoOmGDjC4HLwOGnI9dYzDdn5K2TkOZn9Aapx0fVbVszWYzxYdj06zxHOg9zfLXUvJcESVJP4HzbLNi7mz6zgKmZxvXYJ0Q+xX8Of0PoWmbfjJ/6hvgsXy22gAEeBNcyT3Jif5mo5aj7LBvMdtbd9R0Fe8SVh4hQtBA175Zh8X8G1uyOo489gRA8bmp6OYmwZfgockGZn4zSRd8nLcCV+Fp9jwieX0yBC/ZjA5Z+MtU3CbazOoEr1dKZ7j05EbA5i0yTBSkGeOC4mJQZGy+d+MyZztCfMhWwYOxzkMGGkUgG0Zo0x+R3ppBjew4cEYDlwxiMN5MijhCey0DSL5JlmV4VCk/o7DrTv8mrT+jPae+qqa57/ntrNBdm5mZVWmZi37yGtXxRGrDZ/T9ulva/vpr2vXvv3s76t75g81XH1O2lkxOl32V9Dpzbjr8f+T3AQHXHy1TzOxrR/QoeMrB1OyncHq+oauXF2LbSjpyO4a0ZxlNGJQ23IsZrfCV/brm3SBw/wmBpHwyDvqcwIfrTQNgqT6Ti5BlMLAtScenSsc+bqNxmBK8Gpipx9JI7vSoBYyOF0jOb+7dh37cJPrjTgSJD5Un2CeXF7tQvaPyz7JPg3O9E2j6FPQvt/lig5hnua2wuHoFetHt8+V9Nn33q1Pv+t2HatZPu6t+n07zhEpWa+gU4Ft5NLB80Vj1XzR+Q0cf9TvxmAA2KfeOtmKLuxl9bs/uqDffeySLpv0Om47KjBhxXXu+maLDHCOjLiGnzHsfp7UR7yBVxDePjBO+6W98Iw8cJlZ6dN0uld3Ojq/uqvLW21t2ShmRin7RNOmGfyJAc6hvaGFR+QKDM5Iu030F4No3bA4aOpIo6iPP3K3Ts5XNVsyPoyLntsQQzEcrm9tLPIOGNAxjZEc8s7kNyxU9eJKS9964qwubHXVL5TUo/wUxfzFSEv6iQMHnYU8oO6MhzHf4P81ir3l3oiDZnrdVsgMpoPSXTYyzbMK7Hd/96v6v/yf/s9aM69hxw16RxrlkuuerVilcsWxGdSzYpkdFvXcU8/p8vnz6uzuaGNlRU/8+Ck/X1YNvdI0z1ZGvWHPdYU236OfWRz+e8u93S61INpQ3Fl2xACIZeeOZUXXMqUf/DuFgOeEHLZeg/1zo97/9tMIHWD8Pn6+Mvmva17a832uWlJ9YVbTB5bUWFpQoVE1rzAnMW3hh/YjvJkFsId64l+40L9cPutg3MNNbcnZvChqZIZW7WdVbw70wm/9rvaefJ7DmmLlHHoIq5w45xK2mviQ71Pi15wf9x33E08Y+xDB9iH6xvfXR3+FG8cJPw67/zx2US7aqgFqj/pRNzFJCpjpzF7b1sr3f6zexStqmFeyS0bonw4fg0aWB5M6eCd5/7N3vfmK7oh12rO8HdUrGlrOMIhA5z8yImwHlz2qxjwG9IVexPONOstjtvFla1e2ow3bxzpod29Lz37/h1p78SVV27uahrZMV32H4QSxjVxeG7blN0sFbZVz2i243pwctm3fSVA9nLPF6shURv8ZcEePwSrIjXIwiJdw4fr2Nbasc50WSmw9aZjoF3G5YdWzs7PR/xDyP0pNPPI0TkzTBw8d1uz8ksq1WkyyZDXKYNDV7s522IyhDxmfgXdoixTS5QacI+5HHl/JYJ/3w1H88yfaV5TRP2qPfhHqHDAmof88uSiz/0VXVjzZx0tjh7rMFHTBOtyFjabq9bo+9OAxvev4jA5buM6bHy5Uinro7oN677vuVb42rWfPrWjLep8JIfp7WPUMhaDr0W6SfmVvx44FMSEphbjlXsclbN1yt9wbdrTqaM2+4wpzNDlNBJX/hbqFMDOjhwHQQV+z9TXXKMkyz0IBA9ECBOaJweTGGp2EYz77Z+MSfOGdD0Z98PMJU0Iw2WCslauxVQczXeEjUSYHpPM3LGD7dIoHs/L9NtPTTmtbl1cuaX1rPZY21mv1KEvwoWhqdDByT1LMsc1bBndsJ7aMI5hZTw89er/+vb/91/Toxx9RedaKgdPOmyHmLYQxXHM5w8egBVstZQ1fwN9T3sZJnpmMXTNIZ1JynFLZIt8CO9Nh4GKgBw4e1P/+P/gP9R/88q/o6OKi9cqelcmOOqM9Tc9V9PnPfsRQ7inTXdPg4rPqDjY1dBqE63WYwVjUsAfUJRVyDAAwSMRgBB1rVratjLLlBvs/91G8DXDXRnh3UFCxOGd4po1HcJAMc5SgTKmUlNlAVGLXKA94XkSdMNAx8aYnhCxKAq5vJRvHOwYvON8Dg53OJ+4PHDgQSwlZCTIJh4uBDd8z6PHwww/rp3/6p2Pgo2R4QojbI9AZMCFMcgNVrQgxuNDvGR9WZAtZC5++FX6H61uh7Q67pgWWerO1meEpZjW/OKu//u/9df3Nv/U3NbfIOSZWvDJNK4AtGwJNlaZz+pm/+Dl9/i99Vh/4zHs0c6imleZF7Q3WrBx21Mu2jQ+nm4XauqY5OlFBB0qdlXwrdXQwLkzPq5QvqmjcR4eFCY+mdPPtyXjf73ijTVvpYuWJrzFjx8bWKN9w/ZfV7RVtKHOiC8ua/c2w0rn7znWUHdqBZmn/iU8kpQYKpuPRfMy45gD0bvuqWjsvqZjZTR0E1IHrKeoqaE7qMJNn+rDKhx6WGrepm11wrU45j2rgeNQzbt2WOZTvTai8cFA9/A4ehncrCo7EIyXBx1va17iNsXotRUouRU/x44k/lK5IKX1Ldym/YHvXor/DXKptBgoyrgvwlYy3P60jJLQTWAY5vgZ3863TjFnvNmx9HxIJOenw+4fjxRVacyp8JhVwT1joz+18mDPvNE8dFqfUz1ZNakXLEscr1VKHQt70lmOg0rLFCWFkMhOcGZgdv+shQ6olhErMki/NzatlWd03v8ywGskKOgcEZJjdTSeyjbSi+b4sC/bpwjwgXJTTj87HObll9J0n5TSnd9iCwc6xXVf7imXUOfW7p9VvPaXB2vfUfvrL2nzqd5TZfE614aZYSRizmSxXMuUpZYMnd9ymdlTPrqsxWle1dUnZ9RfUu/y4Wld+pOHOi1J73eCk9vj2uDFOnH/wvMCN8WG8gy6oh8EOJi/QGR2Qut7TtglQGG0voTaFp85TMkF73PsDmIYmgi4IZJcGK4jjr5a/0B75RVuOGIlnpe1h+nGfnGks/vPCMtSXrl/0DBMHfbJ1FZ3rzGJjaySuvL92ndzTgUG+lhOM1ocf38eKo9fzyJXxNeD0bZQfiIAfHCXPc0BqXOAnONgvoe/zubzlvtOzY9YkqZaMm+KgreqwqflMSydrQ73/tjn94ice0EfvO6bDlZHK3W1lmtuqFBzDZWoPnU+BrQihfetShYrKbieDdts169p1Hs1sUc18XVdbBf3hU5f0le+9oLNbHe25vlgZaZRYX2oFDEXrH9R1bBUWstG07YKy2iadIYIsIWuXxm1pYCMXGhlmHa5UcR2U1HSjWNvr6srmnn1Ta03nRen57npCE3KRg77YJjXqwjCyhWCTLe2qFbGaOWvdxJJa07mBFvLWOY/V9en33qZjs3lNZTtq+H3ONBITF4xP6jUTeg6rV4xr45OVYD3Kn63ohSs7+uELF7TZG6jJCjGXM60IsgyLuqTc1FLSH/zG/w1oVHRQs/0tdyOO7a6op36XVYCmLbPm3d22fvdrX9N//0/+if7bf/rf66WzL6pcCs1Fva7r1pUyVy+rbP5cMv0dWFjW8dvvcd1ldPHKFT357DOaP3RAd91zux59z3268/bjmpmpq1gxLeZNAaavtBVWapG33Fvv0sA0LWl8tU+dxG6bbk6sANm2Lbbntts1/2YWPW0OLSO5m6s5c4bIc+JgFfBirrj4bl42NL/p+iUrNoaVgsoL01o4ekjzRw4qX69Y9x2qbX7Sc7jYFgj4TVfwe/TmHAO65h2kSyeymZkL6j/rI2wxzNmVZfjdlTU9/Ztf0vb3n1S2w1AgfMi6D/qVbTMmCvILyMCX77BK8LEKZewnAzBJoDgjPBlixLuthD5P2rzDT8IEgMQZe1jdhN1NWNz4G+kjQxiYps54oi0NN7a18cMntPv0C6q7nWY7XcPetw2JfZxgDob6jnRjfmE5BxKYnjmyPBrWa+q6jsFoqg8j6lUyIdH3zZcbmcqq7Lzt5ZLbBudT5Zp76r30ota+8VWtfelfqv6D72j55Us60rFpNnRY9JIBsjuvtnXqTiEXOg86c9C34aRlsZq55AIU7fORz7i+4mt6iJUYxgEDG846OrGL1m1z1rWz1i8oOxPmpqano++CthpkRVtA9/A98h1c3HXPvarWpwJvfCd9tgWHXiK/MX0mvF3D5Y059K+UbziS599++/B7voEPX2I41u9jVRN6gAsxjvnnylHmWPFhdMSkDwanzSTRDfump4HrdL3d18truzp88IBuX1rUrO2Xqd6uCvY52zzEPXF4QeVGTS9f3dBOq2N8Woczr6Qa0HzRJYOXRD1BM9Y94wtvbrmf5G62Zdxyfw5dyOxwkxs3M99OFCAaHSyP/e8wfiIYjHDY1cJUVXNTtQib9b/UUAmQGuuEx/7ZOfKyu1aIcDyGwBlmLRgLatRm/ExnOmXzFzMYYvQtwOlYjtnvZmj9Yc9Kk62OWPc60F57WxcvnYvZUo2ZKb9z+W2kcIA2CWCAJkWMNM0Ie6xM6PjezNFGZ3WqoOpMQZky82j9s9FZiu2V8jGzZdTbk3o7Zo57KmY6qmS7quaGmi7YqKkWNNcoq1JtqDbXUM8wtdo7Tt/w2bBnxcLR5QP64mc+r8/+1GdVLZRsivc1WzKMu9v6B//3/6u+/D/9M+3tXtGV3lXtNEZazXe1V7QBXK5aOJcMt/2oZEFrZdVlGvURuKyUcRhqEAZM6ah3M3l2Fmcv8kxjMTqzJmyZmebMJxwwc8JlI15EtItOjzGW6O4B95lC0Q/cc05HV4uLi/urNCarOlAaWN7KgEXfcPG+2Wyqa+OQw82BcdJ5Qng6Gxg0qdVqsQrk1KlTEY9BEN4zSDJZXcIM/jh0zDTLPpsD6g2NxI7VHmn2JceaOI+8v+egC8N5cFZ/6z/6m/qP/1f/ie67/wFNz8xFm2BLLBdNOXBvzWn2wJT+3b/17+hv/6e/oaXjs9rprlnR2tMw39KoYEXY9TB0ehnTGINhBTp5XAcj1tz2CpqtLbpdLVvGFlw3Ode1FSj7wCX0OsbtjTnDGB1VvoZzud1gUN7p2GC/cQ6JHcgKbYZDgn219h9bITlMdKRw/050Sft2mSYINAVHUfiH8ocKbBK2wpcbNtXbu6xh54oKmVbEYHAsBhLAUd+GKdZpZVbVhVPKNm6z8TenTrbueq4bRaZxh6HjjMG1UGxv2pHGK9NJHfluhb6mGqU9woV9neQJjdtH8ffjUw779Gf4mGFHZ6O/u60EH+e70wi+/6bA//a4IFe3m6hj8xFKnGZk3YgDifbg5tUu8ASPoUO0aNpyvTtY1nInZ1nEM7Pdo0MxmYdEUs901O4X4sydjU5Fa62KWppXazRr3jOrXm5KnVzdMqBuA7OuTn7KbGJaveKMOvbd0oxaWRuf2Uqy/HNut/V57br97g6rcQ7N3rCo4ewBdfiedT3Dh6MsgEA9j/ETblxGnuE5sCUjkUmNUQYbZqOdq+qd/7G2n/yK1n/wL+3/hbae+rJGm0+qMrysbHfFYnTP/NTlrSFv6Bi3EVqfU7ZSN8+1nOw145yK4qip8mBTpf6a410139swL9xxVTE/7zXwfDPuT03H45ZCeJcd+RHbcNBxYlmTtQxm4H5+fiFmpxKGDkzaDZ3Laf9mOgLQNZzGOFv4J3Wf9rd/NQ3S1tIVCkmd7Mk4D1lrvpMOw06JRSjni2Ga3vCFwdtkrKbkHd7pxGQFrk6Duk8t/LU8ZYEy7eNKyvjxfTCR1/PEue75OsdjMryvPaeafWU40A2v5G3wNPvYKGzQCUOyYR3poPWq25amdHKp4fui6jYuj06V9Zn33a6f/djDeuDQtJY4P8Th0bGGo55lNMYqnf+WqW6LowFbarqNWs9gm6ueBT777Y8KVe2orO+fvqLf/c7zeuHyTgwIDR0vXyxH50WPTjr0SeOKoQ7wNinH5AB1NJ6Y0elvDHowkMm5I5vtodaafV3Z6ujC+o6u7rTj8HkVK87brcF1xs4IVF0MFBlR+3rTGIEFDOZeHLEf23CVrHMuVK0PzlU146RuX6zp5z56jz5w92HVhza+u5xdxTCe4aWsfUOed3qmxVjZzMCIyzPIFc13inripVU9dWbVugw50OYHsYWXkSb2/Z+UPdEhtUioN7md/jl00H40WtMX8yVKpk9mk37uL/y0Dp84pv/yv/q/6T/62/+xXnzuRa1fXdOoa5vBzdlVbx7qOspnrJOY7mcWdeyOO3T6pRdst1R09NSBmMh0dbWl1bUN7e7uWu92XZofMPAVg9PwhVvu7XHmm9F6LIPh37QldDcGRtDJO5miZXlJG27/Hdqq22xsbUz7gz84TPDMPwPvfwbPV2xdX1m5wPZ7PSvOQ7bTY2usmYYOHDuig8eP+X4qBkk6cEb4B7qDZSEnDsZECKfDymkUYz/C2cwznbwRwKSiovMr2xYdvnxVZ/7Hr6j5o6eV2bYeYJ415PwiR3Vxw3YfsYtD+gsOPHFg8JWexH1DIK7X+9dzk/DXxdkXb35M3M4PwGF8YAlbsijv9jda39LWD6wbPfWsyu2u8rZj2X4SPYtftG88YF2H63eSh2JjEpixwCHTmYb1Uet5MUAXesY1TyduIC7cNezdjEMUYrJP5CN9FKVyTbffc78q5pudsy/q7Fe/que/9CWt//63VD59Rkd2mzrc7Wq6adnZ6VuPdXuj/gANeQhxod/1+tY3Mparo1i1Qz1FH9cYbIKHrucbVoPimVRUtH6QLZTVMWDI8fr0rGoMbIAnt1koET2R4sdkM+sbdCU98NDDlsdp6ywmKTBYuLa+av2XSQdj7cI4T9lP8HiTblyW13XOb+ICdpehZBwV7ceK5Z87F3zK9MBqjDRxNE1Ei4lFvnZNM6NsWZVSVXW/K9sOKFpPKxfcBlyJvU5XtaL1N6O2bxpjSz8mMHAfPBy9ylf0qv3mYmcSCP3tT660P98ud8/P/cb/bnx/y91yf3rnxpa2UKGl8T9YbniYPC6Z1gg0N1pMqUFLdx6a1YPHlzWVo8PQwgQFjvgoaOPrH3cp3eT5fzONGkUx3SEE05UXwUIii5h5bUbV7bbVZIm5lSY6kQmThJFLG8wnxUxbH/m7y8mMd84F4Z7ycKAmIj9G/R3HcspPpOV7G7F0d3BIMvFili7h8sDYiw76vKravtLUuefPK9PuxUGec+W8ZqqlmMV1dGlGD91xSh9997v08Q9/QJ/6mU/q5/7Sp3TgyHzqs7LiGAdlMbXTeTKLc63V1T/90m/rwoVLOlir62/88q/oC5/8lO66+071iyNtZZu60Lmq7pSFrfNhZ3EGhqyzGQ901DlNOuecYtSfy+AA/t4zvAh/K3cxE8Ff6Bgvz6tw8HZl5w9rmK9YLoJkl9EJZDMu9+p5ZTevKm9BgdBmBQWzlhEeZlHqFRoqHDqpXG3G8FuZN92wquPrX/u6zp07R6CIF7PsiR8dlsm1Wi390i/9kiqVCrUQ7yYDIawKIQ7PGI3ValXf/va31W63YxCEdPiGMsISbAQ521ow0MKWZpAE6cS2XcZBj06TTFf9rJXuYlYPvese/cpf+Uv6yMc+qNm5eVVqDStgPe02NwOW2KfcShD7eDKowdYnw2HbdWblf9QxHRqnWTqh6RVHaWKOp/OHiPoWgi2WSFc0U17W8YN3aqqyqEyPARDaIJ1W0Jvx4XihPN2wM15HqfMjVky5baQZaEH9hssK7IC8jM+xMobBxc82NLEdn7D4d5oL6EN5jkOnfU2UjzGJNz2ZrNgXfdi8qs76M8q2z1oRbsaYaMIRvMVp2LKjQ7owf7tKSw+pUzhkw7DqdJml63AOT3tgZVdsBwCvsSPuDbmIRmzTg9NKj3Ajv3F+PE94KU2NDirKVjAMue6mBttnpb1zNtJMixGasCk8XYy9vHnMzO3KN5ZcNtMBnYEuL9ssRa6RYQp/My7l7ZSA3bdBi/6h9sGLsXCBP62qM/56Oy4mA1C8vTEX/Nx8LGOZNdpblTrbzi8ZF/HdeV+TQwmT+ARpeorrOLwrlif79ByzdmLWu9uLcemW7HZKp+eS8lNHzbtnHKZEAv6GAo33PUwTaUr7Ztm8eeZ/+9/9d3rmmdNOipUgU9psZbVu3rDVzmq3W9ZWr6KNbkmrLenq9lCXN/o6e7mpg7e/R+X5u81XD2pUbDhvtsLq6dzL57W61lSnaz5XnkILZ1cftcx+MrVllRZPOv+q24ThMd1HGwn+4FvjjfdxIGS8t/d93vxstP2yWpd/FGd3lEZXVM1uuITbUnfLWLDibx4Ib2+alvLTxkN1yelVKK56zW0Ne25TGJ3mfcESzdMYfAYluZk5ZcsNGxgug99P8H+jbr8m4XPwM9eR8jXzZgZ4DZA/B305L3SfYG/j8IGGRPzhEg9wivBth0d2VetVl8UG7HigPlG0a9phmTgSOOU/9T6uf/KLVIOm4L9usw7PlU4DZoElWEgt0Ql8hDARjvTiC3DTNvzG75M8h0dA847l+PABgqQVJ/5df8/1VT797IAtRbwxH1DicZMWFi3A3jmMwwA9bR88+y+aFwZfwbob2/NUzXwXakUdnavpwHQxJojU3GTyll3MHi65DkrW6+jQmK4UdPLonKbq02rv7VpnaEbnAp38bDsFb2bFQ8DhzNrW6aCJYokVV9ZfbIyyDQYDBTt7LW1sbseElblZ04tjoTNkcgwMED/RADDjgJl7trCLLUBcTvgwW2/tmsbXm32t7HS0uteL/aLRsDiQPVamGBVpkgGJOU3DFAfJTugAjPHd1Iv+XXLZC6Ouym48S42KFq0/1owXti8tOI2Kje6l2brqVfOL7V3ttA2N2z+Dreg5bKdJx11ggi1dDXOsBnDcTqcdeZw4tKgy+bgEOadL2aPMIRugSSAdQxd1DuxjZNxyb8jRKpBR6KOFbNn6IAo67Tej+QPz+sYf/L6efu4pXTh3Vt/+2lf1pX/1m+bDQx2//W4NijU9efqCdl23PevBhaprrLOjc8/8QA8+8KAu7eR0Ya2jq2ub2trZU7cHXy/GSkOu0HLSJG65t8sl3LsmgpdP2hFUAb83fxp2NdXb03xuoHqvZZ2UVUKJp40j/5m4SdLYTaHDmjlHRzGyyO9wIS38XCyXVJ+aUsM+V8AeCsHu8OYtjpu2kfbP70KO+o8tYiky7wulgprNPVVKZb8fafvqinbOXVK9UFaRw9edfshi44OOR9IwewoxApxwpHGycY/jHhzuewdgFwvg4h6tP9F/+p5i4Cf/r7lrX5JLq/LpxPR728s5y47h1VWtff/H2nzmeZU7XbQ+9TnHyoIM3YZO7Twy2TI60gLgd6ALXPvHxMdW0bLz0EF1lxbVypVcN4Wk94zrh74Ai/Eob9he4Is0/B2SqoG3Z55R8Sr9BmwhazyZLjpT0yrf94CatuehtGSnQj+WOMjFGA2DeEyb1gNyhYrmjp7UwuKSKp2WWmurlrDWN69eVvO551RcuawZ2+RTjleyVCuFrYa1P4oBNYBix4UYnAI+gANWLgCc/kF+UYZEwy6joWOSwPqVS3rise9pbW3NkQs6evIOfejjn9Lc0gHTSkQNh5ad5Dv4Gapuuv7uv/0DrRpOJsvZ8NbRE6d078Pvss4+1s0hHsMDvd0szQTclCM9xjXu/R4w45vbRzrz1jD6Iyu2StYp5qyHNYrWTwz32+P2KyOeJi03lQm6QCtO73E8M0C32e7q8dNXLCOtaxm/1FniB8arHfVA79jR+YruPLqogvX40K3DgYWMaSLp7hBEOssmpc+qZ7YzvWgl7/SFVS3XyrrjwGykRzOIMwEdO2/DC7H+2OlLarVbev+pQzpgWZ12iHBAp7WPf98AGWULuyzqJr255f64Q77cGgC55d64c8MKJjdueomJJHGVWAr/UU9gFjbILChYC1AatHXPsRndc3hWFTrJYesmQphlSDWYA1e7V3QgRCPGpXc06xt3TgNO4WuC9to1vLPKmQOxYgBmtbO7G6/7MBwDGlspTbJPIDscL2B8ZqzMVjGja5tZxUHqFo5cwRnljMMEzTiz0YkHppxuiFMLOcpuNE6UJHhYeTSlQ7PH9MCp+/WBRx7RJ951v376o+/VL33hU/rLP/8X9Iuf/6w+86EP6dEH7tddd53U1KFZDSoDNdVWvygz764N5rxyxao4oHNk43mnO9Tf/29/U3t7bf3FL/6M/vJf/CXdd+8DetcHP6zFk0e11t1Rr5zRthWLftHKiRk1WyCwRJkzHxDMMPaAMTrArBL6G4elRt+H34AczO5O0YrI9AEVD5ySphY0ZF9ulzMMc5c1l+lptHpemTULcpAAQ3eaeLZO4UT4bmkqBkCyVRvjLgMDOuT3o8ce07PPPhtK9SvoxWlTT3QssSLk4x//eByCTl3gJgMgfSvbE3pjNcnS0pLW19f15JNPxrfJihLCk2espHDwycqP1NlP7bHXbVoFlKtIB47O66d//jP6hb/0RR2yYOz0W45jYVmsqDbViEGJ3d2m4TbmTBp0hJFHu910vl0V8sYzs0ScGcWig4nlutEJZYM1Nywq27fROqxqoX5IJw7epdnqsok0r2K2YjpDhXPrYsDE9JjE9jX8vFGXOr5c5qhcPPfQPUoNXWIF50m7AG7qnfoAP9QFOKONvzMF8YQ7xOyNMfjggloPZQca9Yd8pqve7gV1N55VebiifLft+spbpy04iFuKaYYVVJnKAeWXH1R2+pRVnbopx+3BKUVOTirmy5mWnJsfyHvC+27AkR7wkQqE63rbP/fIjS91XPqdn1CYqTBCo4SxDV5384wyrUvm3Ryoj4Pu8dBUQf3ConKzdyhXW3TboN0mOQB2aMcJdsLfnEs1kOqA4rwVAyAJK+ZrnNGxc1kyTwx5FfhLeMMnB3zJjyGN//v33ATgKUx42gr4yaa2SplGbBfEwfizB5QpzrlOytEpimMZeZTXcenoNsNw+06y5f/xX/09/Zsv/75+72s/1r/56vf1u9/6gf1j+sq3H9fvffsJfeWbj+vLX/+evvSV7+pf/fYP9C9/6zF9//FVffQzX9DS8Yc1cJ6tflZd87qrNii/9fvfUaU6o80tGwCPPWWw+5pqWB6afguNAyrUlzQomK8HfQIT8BcgL4c1X/Vzb5RWoLHqMA5P5kyQ1kVltp9XvreiUmbH8mLXvMz8zvUXLQCGaMNjkK8pP7VkQ27eSadVfr2W5XCv5fA9tyuHBi+BT1eN4+WnZk24c5Zv5aCDhLUbd5OapFA/cQAkcoLuI7C9eR/8DismApFSBOZTXDBk4fflcj7OWaAdqpcOr5zMhASX1DdUsk9rwOKg8PPIb0wbkT6f+fk2rRri2WGdV1oV4rCk6ZeEI0Xe48mJ8LQldJfo7IlnZLvrzvlGHsSK+Dxff514MgUnEfkN++vTm7j0xi5lHEGTvmUfr/xzEZD/c9N1zU9VtDhV1kKjHCtb6zm2+elat2Aah1MjHUdFF+CsEN4VnV7Jz0s2ZI8sz0eHxtbGhlrNZkw2iLp0POJA8+gCuIHbCxOTC35PnbHapmc+v9tsa3Vjy/oc219OxYpUzqIG/MC28UwJeEM8tsXi8Go6cPCt/kirO21d2drTWrNrHc5Sgc5nh4sJILR/6jUlErAldCSKoR7TajUGIax7u/2yPSpbHjUM+pGFaS02KjFQMey6TcHn/L3g+uYg+cWlGVUb0y6D89/q2AgvxeQPJvMEoVjvYUUL+aBRsbUIsoNZio1SRkeWGk7LMHAgq12+YD5mgqUu+QFlEPgtd5POGDXvZEV0xrKgmLVeyFvXY75S1OzirB577Ltqba2rtbKiUXNPHfPRD33sU+qXG/rR6fPqmN/mXOe1wZbm+ms6XNjVgdlprbXzavatv3dSG2H7Nxoam0HCH+BLweuiDd5yb72LmjZvdtvFm9ek1kg9BSeOQchyrx1nPk5bf6liwzIhDUUWHh+h/owcsgTKCIGDj1fOEZiRKYZ/DGe8M3+p1CqanplVqVr2cx4VKSYEMlM6JgQ53AB7wrYUA84Z26LMgOdQf1boU/oSvGl7V2vnzqtkHllaXjJrMm4AhSt5AY8z5oLjAjYBNa4ANf6GSzCiDYYID8fn1/IRcOLixbX4OAY+zEhtv1lnsR7TP39Jl7/7A22fPqNSx9aAdRn0/wSzoaXvxLyVAZCwVSOjccLvMIcegbxruyztSk2Dw4fVmp3zswnUco0OYQqI3c8AyKQewAMkS6lvdAAk4c3XPvojK99c08Zx35W+0xuoalrJraxqd2tHJ+5/UNXpmTgPafvqRa2fOa3tC1dV8Y8BxKx566hgeUh6zjkf9JQ0Fegs6Wb2KdPw6GwxiRbZbSojDlrEoNvU0089oYsXrBvnC7r7wYf16Ac/rOm5hZCZsVLYDh00OK5pH32xVi5pdeWKLpw7ExM20RLnlpd19wMPq1ybNr7oszGuTE/Q9E3TjKO/Zgr76WLvpbJD4zFhx+WtlnKarRZVMRCpBG+Ho/6BLsFKbcB5/qwHQEg1cvS/RBeJDmOVP9vDOp3N7lDnLl+1zdrSscUZzVkviy37aAvmZezMcPbiqp5+6WXTy0CP3nk4JkDDx0IH5Eo+Y6KjXNFxmELEu+RvuVc7+OmtAZBb7o27aE+J4XPlRWIKqcFHZ5t9dPzx3gp5wUJqqZbXgycXdGyupiLKGIZXxKfR+mKHgXqtM5uvidkkl96nODfhxswwpQabSrBPXDQMCyMOqMoX8mp3Omp3Uf0d1nFjAGMMZyhThidmx8eShbGl63cDC9r+gG0tJgzX3rjgSp6pAxJmxTtfAofO24KLjqNMt6CZ4qLuv+1hPXLfIzplAXdqtq5TC1M6OF31t7zqZoI1o6NM/NxIzWJfa8NddapDbWV62h721DYj3bMGwQGJxWJFu62B/s03v62Td92tv/Hrf0MHTx5XbfGAtYop5arTyhVLYeyyOqFnRty1otnMDdTOD9XP9Tn9MJY0Z60EBMOn48rpJ4zmgnkPrMA28yXDMavq0btVWjxhIWLFIWExyjkyvIVsX90LLyi7sRJKnqW+LWa+GsdOts966KklFZeOKlOZEltPMCOTw2W3t7f13e9+N5bnh3JoN6GdyTMdTSdPntR73vOe/Y6L690kPIMorBJhoOTxxx/Xig1GBlCupeswKN++5xUwuAQBJ2e0lOoFLRyZ10c/80H97F/6aT3y6H0qN4yLXNdF6mpvt2llJKPpxpTqdeM4W1K/4/RcxuisYJUGdAUWR+PD2lht4/IzWJYbFqzomR7tc4OSqrkZLc8c0eGFE5qvL7vqbfwiVCEk4OOfySkNRgB1qp0bccSLNjfp3IosDCmCnEwiT/vIx2Ggb5AUdE7wKJXv3nkO3IXp5Wt0+FJMP9MlGmVzO2XWbW7UVm/3ZfXWXlB5uBEdQNRfLLd2QAw+ZtJmZu5SYeEhDfNz5hecoeP4VvajjlBc7OnodwQS9/ebwFtE5R/1giMP6tAu0k5fw6h0O6GtqN9VkTNnuitqXnpa+d5aGNLROe02H2nYCBhkKuqXl1VeuNNxp5QplA13MlJR8pmFjLtpXm03wcFbugJkjKsR9bpyTtlB2zzZvC9WUyV4rpVtgknofAxTmjKffKQFtMHYIiTlAKXMdIzwpoGc+XObgbLpBeVqS+Z1VfNMFGW3NjezlDY4gPpsiJkvMyvoH/yj/4/OX7gQW5nsdEbaaEpXd0Za2Rrp8vpIl9b7urplubDn792R9hwmU6jrI5/+eR06eb9V+IKyxYKuXl3VP/vv/7nuvvshHT1+p+689+HYZ/jb3/qa7r/nNtOr6bk8o5J5MYMzdJ4H3cKn8GMssD1KbJHiQjLjmPIxAJJtX9Zw6yWpu2no6bBwfM5/iK6LJINjux3TVmHmsHLlORNn+sas5kHb9Wq9IZ0T5pzImhzzZeXYYrG2aFqmEzC40k25WDEH7GRj5P/pBkCo3ESZ6QX3/kXYyS+iEgNxrXI+p3op76vj2DhnADl4honD1Rvh4Knx35YlMxi7DoNGUbBugrFEh0GGAXuHypo+i04qazqKg2MZuHe9IZMDV4BofYCzSHouIxMS2Mau3+nHdpxWewwv5UZu0LlGTjyb58W7697vX/ETOMkFnExKer139uRP0HCGe4wvaJuajs54f6eEIcMCeXg/+RpG676PP7+DvoaaqeZVNdIqRmzFsJVGHeud7KNs2osqcXxWK9LZQq5+xlhngg41XDQA09WCDdG6FiynB609dZpN0xQDU+P45Ag6XBC4EGw66XQ0YXMfQLbes9Xq6tLatttVSdMztRgkYfuyguGijBQNWu9bBrR8bTvunutgbbulle2mNlt9tVgxaFjhAT3zNuCGFhlAA4V4/jtro8PfANLPlJXVF6zmcgoqmW/VzI/mayUtGZaG9ZWs9cJR4AX806liCs9SJmQQZ6zVVK1VtbK6o551X/Sg0H8cnmxilZXfQadMBGGgbdBta9Y6/snDs8qblpmRTd3G9lzIBOAMfw36yZtb7kYcbcL1DW3xgw/wjoEt+9mphr79za+qvb6iz737Hv2v//2/pnvvvV/5xqx5+JJ+9NIl85K+6sNt3Ta8rA8vj/SxE1PKm29sDqrW8UtONRtbZZX6Hadv2oC3xDAIe5HTim7V31vvwDftye2LnQJgSH7GmxoIEG2z6PqhHTYsaw8O91zPfdt1DOCyxmCsy92Ai9ZrECYecLjgxo+Ga8Lb/Rtnk1TaiXRItBsfieCX/mTZZLnGFlm1iir1Wvgi55RZPvZN00AdstlhiT+wZz6EGViUGeAYFGxymP/Ll6StXRVnZlScsux22gxmg61glWN4IlJi4MHbuQesSNY+4Bu7iOZvSSu59pyQMvH+x198TI9s5cUj2x1mrKeNdlpqP3Na69//sVovX1SRXQCcUGq7KR79KLRp+gkSzMZa4PSd6ZDyTI7ZQ/4uLGlw8JBalrPonwyAYIPgCi4skyGRcsnuitcJ3+DA6dS6b2QAhLgMONm2sdwrOxxbl3dznLras76QU2V3T7pwReu7Hc088j4V77pHjdtvt21f0mh9Q90r29q6Yr3V8rx6YE4tgzqwosUB5JyHFBMhoU8D2bcHRn4TfSVNKuHqUlmOUhZa61Sjps31dT13+rRa2zu68+F3612PfkBV44XtMNl2MspBAe0444wBQIyH9777Xdre3NDpF59Xs9PVxYtXrft3dc+DD8W26dGgGDBxexhHv3EXdJcqItVAuos87MExzYe2GdttWk/HzzRKmq8XLEPYEeSmobhBF4D5OoEauQVd8GxY0WXG73FhX93kAEjClcOO9SWrb+YT5r1GEjtDxIQ3+nXKea1vrurl089qxrzu8PJiTKpBd2egpN0d6Ps/flwXLl/QA3ed1L1HDxqXob06EWBPbSTnsDGRyjw/MSRcKt8t99ou+nlvDYDccjfk3MgmHav4a0whWERqhBY0NFLMTZbjHp0u6uGTS1qs2eimI+lPYIgTZW7iyIn/f1K8P9GRkBnGNYaernEHozfMPQsYOgSrtbpK5VKMvHds1LLlQbFohtg3M0TwOTxGJNCGlAq8RFJjdx2s/hY/f4OBke/+YbhjlQoBGR0X/ZzqhTkdmT+ppcaSyjDMppW55qbKg7aVBBvSxiE+9qU0UxxkB9oqdLSV76pVGmrXzLljFLKXL2Z3fWpBy4dvU3V2WXfc85A++4UvWFjeawWxoWG1ol2nSUcJ20Exw4BVCC0LVtSLvrnyIG8hj+AvlMI47wBTvqxsqe4yFX1fUb/gdCwAW/WytHxA9ZN3qHzodhfHajhy27gCB7HCwcyag54Gl15Udoulp0YMKLQiwbfUnZlXbv6wCsvHNYxDSS2IXC9svQCcX/nKV2LWMnWVlFmqIeF8cp2fn9cnP/nJqMfJO9wk/PWOPdofeeSRWAmys7MTK0lQmqOO7ZkNWSnX1LCCwoDJ3PyM3v+RR/WLv/Jz+twXfkr3PXKHFg9OW4vrqztqmcxsoORcXtcpM07z2YJq1SnVa7NxzWetjLF9hGEp+ltmaN8vuj7Lxk3JSnHZhkxVuX7ZwrauqfKilueO6OjySR2cP6pasaFBhw4MZlwjBMHduPyu+3RPm+R3Y44aSx1hKZ30H/qlfY5TDrqfhLkmhMdf37GOjjE6+qJUdEb7Lrap4r3/p3ZrZXa0q+HOeQ02z6jEzHa3x6R8TPCFAVNRZuYe5Wbvs7LvekORiY7OVEcMoLLyibAJtwl/N+pSzOv/k4fz8sM+/+HBSjWz7AxhdExnB9tS65I6K8/bENmyeZJgIj43tMHuqKJR9ZBKC3fHIdwc3kfnH22bdgvfx1H6m3UTHLyVAyDgAnoe9fc02LhgPttyvXP4N7QNPJNaxXGlvMZp8Bd7x40rLsInWohHhwlDyK8w6YcYB34Hn8GAyth4ydUO2UCbTp3UGMWWnwwvMSMMnJpzRrrrm9tx2O3GxrrYlm+YKTlO2fXDtgIcjswgCvfUMbVLbRZUnzmgL/z8r2jh0GF1bagUCpnYSuKZJ5/V5z73RR09eadq5t97rT09/oM/0N2njipjoyBTnVV5/qD5Obw4DXLYLPMV7s0P/pPKmwx4l9WPWeqlc1n97ZeM0y3zu57jUBba1Bg35q9Q4DA3pcLUQWXzdb+nfTFwZP65t27e2HRoZqKbJi1DDJThqCpbWzDe5n1vfu20SPFm3Jh9xc2fZgCEZ9z4sn+duIQbbmgfxgn1DX6MnJLLXSlY1ygV/c7QYyTBG1xmVvGxLRh0MbJ8oNN80gnuZGLQJDr9TSOuZWOqZ5z3HH+kso33pg2oZm+odt/48ztUi44FMSsOOEeCw75DLjtM0XKqWmD7ItNDlJh1XlztzZe45k2r6HOmpnimk20ShntrDfaDOHg8Dll2PaV7vx/7svlcxSjEV3MZ54nPqlq0DHOh+pz1Apati9C+/WcUQwd2EBOInPi4EMBlZLDCMtZJhRFJ1wGcgXYF7TJwC/ajZRqnbCnJU97w4HMDx6V8DrA8W9ORg3NxNsvG5nqstKIeyArqYvun0B9cHnKH5mNLKNcfqyMKZbc7h7xyZQ32pOWFmkquY2iWs8R6bjecIbJjlrK2N9DabkebzZ62O9a5BtHSXc/JJ6nqRCgvmeHI2nnSsQKesmx76TShScrF4Af1WXFhqqa5Q7N1zVVLsQKEQ9eDEPw+BjOcKFtgWUlJvIhUrNvOTFU1PVXX5Usr5g3mpwVq3SA4T36BV8L6GvzIPKpeyunowmxsOQb9+HOCH17hn0vBk/9TCzgKdcvdiIP1sm1uknvGbvBi+C8dw+B+qO72uh49dVw//+H36MjstPn+ko7e/aA61vefeemKeru7Ojjc0YfnRzpVbKvcb2tnUNalzILWuqzeS3yczh7qkI4g0k/6D9nRLm/V4VvrwDdtj3qgvbousMXgGbRj3ruNU2dQRm3Y06HRnmpszWw57YY7rrFJG3xjLshsfOV24nGTe9TMcH6YvDPZpPbvK88TRzqTNOFH7IQQnd75nPKlgoqVssr1Wqye51xNJibmikXJ8mJoRp8OfycNeJHTtkxhpv6o2dXKhQtau3LJfJDz0uoxoRE9AyDAX8rWsUEF/B0HDgOPdpNy2BENag+Kn7x3lOuC+CHx1YRjX2k35qs8EW9o+dQ3P9354ZNaffxpDa6uq2LFGZlFu4qy+D50A8d36wsY0c+xnXFjyN5xDmxzZtZesaLh0gH1FpfULLHKOcmGKJkJIQY/QujbjxE9oQ9kHp/e2AoQ4oFLSynXS9c6Ud401LGeQ3qmJtVabhvnr2hzfUdL99xjXbJiPWqgKbetets8cW3TvK+o+rEjKp04oFYxl+bmOJMcVW4ImKAS/SPOj1qLMrkyg8q4nbwjmvUx+kAK1gnm5ua0trGprfVNVaZndcd996sxPRM7Q7ADRVC34US/6HWtnxSth/sdkypq1bJW1latw7n1V6q2A7b1oU98yvFnQ18pBB365yQmOLwh5/xTf18UxQ6Y0iXaqu2UqDK/iK2uXDbOrK2X2AKrZPuJNpDiv/UOWAPIeEJHAn9vyQCIL+TG4CXPwaWDL9PgcyoVrf8XWSmT18GlRU2Z18X5dXxG7zcNdJxIqVzUPaeOack6Gbhka1HOoxtab40czPgCqrHcT/Z3shVvudd2twZAbrkbdDCPYOvhExNJTZ5ml2ZiIMwTU6TRF/st3bHc0MMnl1W3dsQyxAlDfbVLKUdz/mPuzWjQmGEJ7uSupcnduEQwEHtmd5eLdHqb8fjXt/DsdcbbItEhZOYUMwBJg8ISPZgdV6dGGSfeLjFQgiGUeErMGGYIe2SWXTFX0rCV1dL0YR1fvl3FUSE6VJsbV5XZ2/IznWEwPuKRamQah56vZWxIZ9tq5Wxko4UaRmY9lvI1HVo6punqQnQsHTh6mxaPHNLInJaZEE0r0iOEuuHsdFvRIbMwY2WiWI4y22Y3UgoxmNJi257aojL1BRWnD9ovq19qqFedCsWjszyn3uFFKzjz6k/NWDGouKxFK6ZWdIxWZiTE1ZoOe8MPLp9RjjNAKArIiY5gw+5AXZc9v3xC+YXDFkpFo8nCyIIB43t6elpf//rX9eKLL1qZSIIHd/3ARhq8yOrnf/7nValWg+m9nosOBXsOWP/oRz8agyZ33nmn7rr7Lh0+elR33HmX7rjjTj363kf16U99Wn/5L/+y/v3/8G/piz/3BS0enlXLhqRKaeCDs0CMLmVcJ8wSYdYyB/LRsVA1nhochF2sWaHpqt3c0+Lcopbmly346haADV+nVC3MaKo6r9nagg7OndDBxdt0YP6oZqeWrNDXTS109rH/M50xLiuKx7hDBnpLyl/CS1KDbsxBwxPlwE/2Ts31FCtAqCZo2PkkWo4ukvQ9fuO2dqOZv62OcmPoM1iHaoPi6dJnMDopUsIF7T4/3FZ/55wGW+dUdv2n/U4dgs8OFnWSqyk7f1+sAqGjmkMO6bDHEya2o6H+jNTozMISijxu3KU6mMA6oYf0Nr1z+zAvo3OUchazNg66axrtvKTexkvmNXuGhc5qKtrh3Zb6w7x6mapUP6ri0t02QjnA3UojbZAw4YGdnF6/vf1pXYITPIIbPwevhLKcNnD9mQyAQMeul962BhuXzJJazi/ReJTPLv3HcZfqKsFKvuDLl/hHJ/1+KRydb5QFzwA4hln61ne+7P+aM277pQX1kTHmxXRMck4U4cBp6tqVLlx4Wf/qX/wzbW2u27g3r6dr2viJ8wTMq2OAwIYzNIVxDZxszZMvVvVrf+WvaGa+oXKJum/bYGlr9fKKedJQR46fclX7bWdLp5/6ofl0W/PzrLKYVWXRvJgVIJYDDHzEChCXMWGBtBIt5QxzbHvgJwYR1bmo7o559WDD4Zi5SpEneLHzPd3vmcK88o1DJqHx9nAuA/ylv3tF2a7jWsYx8zXyydhcYLAYeWReaU0j0t1P8wbdPlTAb5qni/+1BkCgOQYtoMsIHvEm3Hb8ct8l3MTKA+5Nu/BsBomKDGC4cqsVzqbw135HQ7YcIlzMsLfsdeyOrc3oTEauOW7F8B2aqerAdEkL9YqWZ6taaFQ126ioVMjoiedf1rMvX9CLF67o6vq2rq5s6MLVdV3e3NP51S1dXNvW2vqW9jY3NVct6valKc1VspopFTRjWGbKY+/nuUox8qAjfR5fK4efPDOxZcmea/g615KW4so33zd8HT8vVgtaqNlX8067oFolL7ZLY1XLiJWzxkv4wB0IB5/pCRfY5TXvfGXlTM+GYcuGa4dDcY0nE7pxVzTPyliHSfyAPbPzOTqdqAvTJbro0Dod3jgtlUxvw36syjl6ZF6Nal1bG+vmb66LLLh3/cAHDVu8G/MDWD7bXfHct/GPDGg3d7R+9arroqD52Snnl40BqO1WVxvNXpzvsb7X1W5PMRjFmg0G2jkTBJ06ld9wAmtkYtwECib5UnAGNUx1LkfO7YRyxbZXpphZ4/XQ/LSmzUMYeMJ4jn03iUSHmssRvMl5Uy62nPEr2S6PbSsWGnTCjHRxdU2sROEMOQcM4zwGqAwVK1+AZTjoOv2OabEaAy5ZBlMC2BQOaFFJ4XeJv47hv+VuzIFzqIP6Mw8CuaC3H3wenpLR/SetO29v6Fg5F9vrlGeX1LDuz+lLK+YFpY0t3V/N6t5iR+VeR1ea0mMbGV0qHdSWw0AL0SFkfaWbrcQB6JPVPHTupSGtW+6tdam+o0UxGQfGgxwOCyq1JwbBQw9xmy0OOjpk/aVqeZKzHAkqcRsMvnkDbiLrcNxOPO766/778cv959dxdKSSdvL+Z7YRV/gUik/O5bZsrJofV6ZsJ5nHcIB6o9EIX/K70lTV+mxepXI5tjUumu92t/Z09czL6lrGNWr+XmUrI2OPtCc4cNrkwwShKJ/vY9Y+7M6PYavDI+FnsC67sK/8Hf2KgRdWAMQ+/9EkjHsbzTRFaoqTqweGY/OJZ3Tl+z/SnmVybq+lmttSgXxdh+QXIBmmaFkTZPhpQJhI1083Vm1vqzP2zEPSgfyt+rR08Jh6s/NqWr9lAhZYBrUU0aI59CN+4DURjW+MTOqMcG9sAISE0XuRq6WEy9ApGeC1LdPtadZ1W7y4qublK1qeaSizflVrj/1QZ7/3Xe1urqnL+XiHDkjHD6i9UNOmZRvd3SXnWUUPdlrw4pioYnhdk+kX9Ze8cw04kenogJypRWEahvn+hx/Ww+97n+598GEdPXFbTLSc9HPQ14RezY/y039CQs1mU0uLC/rQRz6iT3/u8/ropz6jD/3UZzS7dMBllQp5+qeY9MJAzzUd9Yac8+UXt2MfbZNSja/hoWP0EAB0vkzOmbcumrNOR/nfHud892Hkf+J9CW7wknQT3uPezAEQ8k2aG3m47pjgiI+fdahMV1O1nJbnF7QwM2MbwLZB6G7gKmOZW9TM4rRmZufUqJRU9vuiaYJzkNhhhrOCaRd55AEMYkzv2IdB45HK24X3/3k72uGtAZBb7sYcLWt8TQ08NTa6ChD+dPLAYGwfxuzBqhnFg8fndO/hGQusnhsrTIkEXsulZvtn5mywRfoIRkP/SgaR8uaAavrz+ha0dFdUOb+hUotR114P9pKLQ7SGNmYRUnEQldOB/e0zv7F7ZUkS6yPrSUdYCgBMZntmokUL6VJ2WgfnTmq2MR/LZpvNDW2vX1Kh21TJuJsMrISAhZE7+7b1iPV8V5vMbci5DvJ549kK8IjOiWUdWjxpxa9hZl5WllkYMHJny85Jzf6etprrOnP+Ra2tX3F+W2awXdWrZR1YWNbczKIqlYYK5Yp16oZO3vaQFhdv08zcYZXnlmKv1dzBRXVnKlop9vRyd1tnttd0dWdbu7ttlQpllczAGQyA8cR+mKgQ3R0NL51RdmvFpQczqWwowxhabfadP3BKuZkDhpP5pUlMgTLO6HjGShBndnQ6dIoFIuN6/T2DI1/4whdidcf1NX29AyYcKz4Iz5WBkHvuuUePPPIu/dSnfkof/8Qn9PnPfU4f/vBH46DIU7ffrtn5aRucbeNuTdvtDWXKzNa1wmH8U7cccE5ngfX2MCahnUp5StVyPWhoa31Dg05PB5cOam5qSTP1ZS3MHtHS/FEtzh2yUFzQVN3CrzyrcrFuhc2KGMYOmqHrHjJAiaK0dBLiopN7/z4uzgvc3qhLtBakFqlA69ylFKmvlPeYLuNLqPDjMBHxHeliAMRlo9OTTlBwwMygyQAPL+K8muGWhjvn1N+4GFuvBE/BUkmoin+jXE2Z2bs0nLot5lizTQmpYsTSWces33GFOqqxFwi/WcSl+NQFyaWD2MZ8w2+jDLQRHpk1bIUq11vT4OqTGu1dsqLVNRyUl+AugxXBnvln3zwgN3tS+bk7FAejOgGwlGiFzjvqPimaN+sSDYFq5wC4b8kACHF7GrW31d+8qMKo7fSoK793Q04wUTZfkSehFE8gTW0hHPUXiil0wnfaquvAaXEeCx6+wBJmog1tDLbNkAtTx5SvLhu3lIg8HQ96YrUf6ZCfk37huaf1W7/1P2pvZ9O8ARkCVkgQo9JXI4zcGFQGJrYmQ57NzS/qb/yNv65GnUNC+063o5INJvpGv/r1b+m97/uAY5tKcy2tXHheLz31uHnh/eZvDdUWDpnnlV0Cx2XFGh3NdokHAB/y0bydgV9yD1hNQ91L6u08r1GfWfHwayB1WcaoAl4GVXLlBeXMB5Upjsvhghr+wfZF5bprjue4rACJeJgKlmcVVoDMOmgapEz1cONuUpNkQr1xTsNrDoBECVLbAhx8xE1/r3A8GxN2iQa4D33JeKITHh8rQizXqqWCSuzJ5Px71glc7YELcE3Hc2x3YwOz5LgL9aKmS9lYBcJWbbHOxwYcqz7+6PEXdWHDsr0zVMcyY3evrZ12z8Zd3/Kqr10bee29vdga4qFTR3RsrqQpF7VasM7zKl8u2OA30CWDVc6N9u+ZrRb3riN80bKPA7d5x8BOwfRQ4P34Pm9aMKVFWwVWBh5Y7YIORYcVs84H/V5MDgBDzHzERXUbPxM3uQOX/GeVB4ND8Kem9bLdTl97lHvg9EyDOc5boe0S0foHcj62n/QLtpbI5a3bsTojOgyM7lwuHWY+1dDM9Iy2trbV7vbVtK5hqR6daFmHYwvDotOHege9tsuKzjs0jqTpWtH16artWSdzPRJ/y/rQZqur3e5IbeqxaLM2xwHT486gADC12wmdQFP7NOPPwQPijaNAN4Yb3MeZH8bpVLWgg9ZNFqaqKpuGcm7YbI8WnaU4w85KjugEgHiNo8lWVkzUqBT8rmfj2mWbnq7q/OqOVk07Q+OI9oy+FJ0+5lvo+MGPGKTttrXYKOvkgdlYpRw8kzQNOTIH+JNukuos+VvuhhxV53/pl3AactwOrgTnrLpO51gOZf0aep45eZeyU3MaFPPaunRe9dUremS2ovlhW7u9kb51bk9ffuaqRgdv16hSdVUxQJ8xv0/0mWZrmxW6/qMub7m3wVHfSFZu0UlcFzEAQrejv7mCgh58HbjtFczP5vstTTkcfIpdA7C90uDkDThH+2Mxxy8m77nGvf85230/fvUKB/uZcITwfg7PR7v4Fu9cKhNdzzwsNpY2/8qYttkmKGt5aSNT+WLRNmtd07MzKterqtVrOjA/bz5cU7/Z1MbVq+ps71ifMzyWF9EPgXCFmM2XsEthZfvAjiELXE3wha0fYfDJ5o8z+8Cpr9QCn9mGUrbt+qub2n3qBV347ve1+dwLym7vqmjeyiAzki1xessOOjTjmWTJL5X5elxwsw/aO8jBlxh42DMP6S9Ytzt8TJ1qQx3zkyijwyR9ENQmuZcGo8Brkh0pTKqGNzoAks6oTX06WSbW+IomXHJbmOl31Fhb0/D0S2pduaiVy+d15rln1NzbleoV1U+d1OJ73q35hx9U5tgBtRtVtZ0muzkU3e5y5pvsSMFu3ZST+kE/y/mBXyoN0Dhv82Dqljd50y1n2LB6o2xeOzO/pKUDh2Lwg0GOocPRx8EKotgSCX3D/LzV7CpnPalcKsf5H+xEUTJ9l2oNTc0uuk1Yh86Xot8hdp2AXpHZENYNuKQjUDNOhtK4gKk2XG5qK+rPYQwfWYBpJmGwnXLNCuK88RUTniPO2+GcL2UI6Pif7NIoV8Cf4E4ylPJaX3zTBkDiz26MJ+g58McbpzfsmJ1krFtXrbObLv0BnbRn/ZfdWBgAaTvk9x9/Ss8+/4IWZ6bVMI+Lc+eiDP3UbsImJg/ekR8QUK5JXd1yr3YxEDm+v+VuuT+9Sy36OpdeRKN2WwuftIhkILpBN6rFmJ1YsZGGUh0NNZqmG+2r/Gtk8Ka6xBR8RRDZp441RlNhTnizQitFMJVirmJlqahML69qdkpHFk7qzuP3aaqyaAFXsUhlqyIzSNuKab9/l8HlT9452Q/DO0P7NIsEEeFH54XATOzY5XY4DjLstwdanjusuekD4oDJrlngxbWz2uqsq5cb2RBJsynSsljHt2d/VPaeDAFs5pinI6hrgdnOaLYwq4PTh6xw1dS2lG5ZmPWtN+esMHS7VtCYaTpq69yFZ7S5c05b7Uu6sHVWz778lF44+4wN/w3VC3UdcBrT5XkrDTXNFpdtXM0Z7qq6Ztx7laxe7K7rO2sv6sntC7rY3dBupqnd4ZY2ule1qzWNCi3DZsUlZ1yzz4RpgU6fmN3ICIFpIpDExTiJ2YZlG2HVmg3vgsvmMluo0/EwWfHx0EMPxVZYOBSEVzvCMThy+vTp6Nz4SY4zP1qtlutsFAMgMfPCaZJ+qVSKPbFZllq0L7FdiXHNdh0sZUVx7puur93bm4aof7amgd7Zb7SXaWuvs62eDc7+oGtlpuX0rLzkppTrm55GddNTzR66siIzKrneykEbcTiW0wdBKEhpJY3bGID4XRxwPcHh2CU6/+N4eWPuWjulDq6lDuVSD/jXEbSv8eqd5YxB435yH213Ymz6nk6koGM6elznoB/Fg2gUPkw1BhD8xKwfOm4HmW50oMWe7ijmfCSPcdrRwe/nwPpN4o9ZyMBEMvuerAK+5GhTKFHMHqYjfDjcs5G4EivNooN2n64cLzq8DJ8VtmJlymUw7+OdoU0d8xTHT04THviOdsbdKHjjuCCBs+sQd537Y29BBHQQ7cakYfwlIyhqIPBN/Sb5QA8pgwkYCiUb6j3tXb6k7O66yjbuZB4DbWVZAWd+FNA4Pqsr1tdXY0sdyBBDibbIPR3p1AMDLQkSaMr06iAM7t9220mVy/Aw81Qb6YVM0XyoHOcTcfCtOY0DMnA70MxMXc3dljo2vLIhsJz2hF5lmCgj5Qs6oYxcE58CioSdCQ8yPKZ/MYhhycbgXwo7wY1jmF+yctGApqj76KcshB/n4zzj6noyEhwiDbgQ5e1zAEtZ0Cnw4MVv8ZMvpqfUgUy7cxGimMFdY+VH1rKhZhQsNEpanqlpaaqi6WJWZSsZZVcgHVps18REEox/Rq3YqmnUa8XgQmyp1x9qrznUbsvyPVvWIF9Vc2h5ny25ymrqmOYY1ImzQByXsyKW5ixvHJdtVZiFxkq366+5LAMrw/CxZZR5Wbwfh6EuEDV0TDETMukk9k6TDis6rnqGn1UGhjjChGcmJGzQ9FvytxnL1nnL2ulyKXXe+33O4aG2qF+q3R7eiE/1nXXaGXVcpo51tla2qs1BUVet/1zY6enljbbOruzo0sZebDXVHqBfuPw5ZrYXjZuidq3jqTrvppg6ZvroGZa56KwPnGjoZz92n+4/saypgss/aMo5ifM1GHhii6+pUkaHrOOeWKrrgdsO6uE7D+uhu07o0fc8ouO33yGVprSXqWqDvCzT+5ybZCO37/abOr/8oyMleCeewmVC30GHhpfT5kP6+BM4YTsrBuSLhqMwbAVsRxamdNR+yjoVAx8MEcJvQNQIXDuB2ArR8dApApfAAXEaJ0EBvZ5K+Wyc1TdTKuuOIxj47cgznImW/j3oN7U5w0fnjOtgdbcjswrXLTk7DLDznXi84EKm6W7sb7kbcaFzGZfwF1gzV1dI8HVmiWbKMyrPHNSw2LAOXVGmWPHHkabNex9druj9s0Mt97fUbnd1uV/TS8N5rRTmbHG4jTKRAF7t1jpwG4jtNsxf6DTOO7O05dot93a4JFfQIdPgLm02tk1Crrju4r/tl47poGV5etV2xHa+ETwtGvxNuCAxJzHxkOBYLQj6G78KP3m//93vXs9FXHsTb3g6DCdxwnNv+Acl86cifQt+a77ZMTNs+TlDx6B5VaZYMD/vqsd4ch3+bv3CsnLavK6+vq3O48/q7P/3a7r6O19X59kX1dvc1mB9U9rdM/4YqsWjk6AFmUeaT0ZBx3IqDTrx3lLMnokyTF8qOjSdoBnbdP2NLfVePq+97zymy7/tvL79HZUurGqxN9KMkyq7fAyadKxjd92+YKSs52dghrblDKOusOljS6V4n/j+O9X1TY89181oxtynZh2EiQ22f7CX0ZWSveMC2qMvsxtFOk8DB07wN+YgFeQoqM72LNeore5Qxb1tlV98Rjvf+6ZWnv+hsv1tZXp7qizNaeaD79PSz35RuU98UjsP3KNLCw1dMU1tYIe7tvKjgnWWpJVg88UELBMpqzEndYXcDr2OMvkubEB7ntneivY7zLNW0/GtDxgktbo9dS2M6TcK28xgQ4sxsOa4xXJZnV5fbX8rT7FNbk573b6K1XqcD9fpma7Gk0dYkXozeHstF2IgVcrYJXoNaWD4YvDGcFCfrHwNPebPqYOeJ9sRgjN4dTfaNX1/RqRtLmUr1gH9rgvNm5MUKupYVndyTFQ2TZkpnF3Z1uMvXVEL+mXww+kNbAO8EreTe2rC+He+cJlb7vVdNK1b7pZ7Yy41NFhc6gSBAXIfr+0w5VDCkqfTdrbR0FxjynoDqz9QGq5vuG+1I28Yg6+hzMDReU5+MiuQMiHgcszIVclCzSqKjeRGaV53HLtXtx+9S9XSVAx+MFgCLtCVogP0FX6CH4wGC8EhwgKXYNgfQbdnACWfK2iqPq9qecrRbVBuXdXa3hW1M7sOklbPIIRCWSAFwz45gKuNcEZi0qnWz9lAr2tx6rDmG0ecnYWhlQ4OT7VkddnoVHCZLEBRurrtHcPRtmC1kpjds5LZ0Xrzil44/6zOr122oM7FIeqDQU7tzsjC1uy1WFLT+Z9dvaTTl1/SdtfKZNZGt5XUInu0DvvqWRkd0vFr5PRRGkObQ1C63IYhDhvvM9twjHf+Al3GRa2ubLliZb7o+BnlbGRT7DTAJt19990xAyJ1GiR8TNxkQASF44UXXlA3lILXdoRFWWDZNIMfKCd4ZmBQM5E+nRMouAGi683lYU/+IjOQUNqNB5Q57nnPFmm5TMFxMsYBHUL2DsNKm1Zn10bnbgzOVMtseVVz9DTokfePQ/Bj/2XnM7Tynsv1lMkb/qxxSQf6qOcq7MdAC6p6zGaIjmic6ci4QuAGvfHmlah5g86lNTzhAxskRk7Jg4t4xTd6wCLM+NX/X7hJuZKSKw5uxkftuJQZBnSNi6ivhHsQPjLNQyNp0Ao8oZAws8N15wYMF+xHlxKdyMzg8M+8JuN2mjoXSP0msRhVkdJIdcdNKgtg8gpDLIUxjfdbGuxuaNTZMhV2XAzDHkTlgPv8xvRZqrptTrk0aUUIyn3qyR3nMb68ox1Kq5VM6iEVi7qe4CHhYt/x6VWv9l3E4ToOxL3rIFZjmD9kMqwqaGjQr2lvM6ONS3s68/hTWnnhGRU6e2qYvxjj5iPwApvmGF3GOdS2ub4V/DPJHL+OfLjjHasX0wAzdMtWiA4ag7kf+vAHVCwV1O/ZsMoxW8yGiumOwxPnFxf04gvP2zY17WY7qjjc8sIBXTh70XzXdO/6Tz0B9KTSFqh307p9WtUCyYS5Zk97QOYZQtNRmhlHx2zez0VHm8Q3pTs+smPIygdmrYWBjArvGgB18aOFpbwjfdMcWgZd7DEDnUzebDeh6Zt00d7MIziklYFkzsxJ3NPez3SGZ/P+jnE0aAftTdkAOjhV1eHpqpZqBdXd4jiQuGDPljZx3gXL5u1jEgE4on6c1uZuW02jpZctaVgwfeVsaBlvk4HXGER3fGbrzVStc1SYNe6WbFiQmX/s6rRxE2y84uoKSqRNoV7lqbx9T9iAMuIRxyCEz1OeQV8V09B8tayFqbrq7Pce7dBw+fv14fcdbSndOL+xHuDyZwqUu6yWS7XdzWi9JV3e6ensWlMvXNnR6ZU9vbzV1ZVmRmv9ojbMhy/tDbQzKKqTKWmnPVTHlcRWV60mKzeLeu8Dh/WBB+/WkZmKpvMDHZuv684jC7r7+KLee+9Jvf+B2/XwnUd0x9EFHV6c1tx0TWXrQazGHeULcb4HB5733I7CMyPWuEVxzMWAM4NJLqcLGq9dlHS2EvLB9Rvt2DSOHm2diUEwzn6pF4Y6ON/Q0aUZzZYLKrqhx+HVYIYZzqRlvSQGo+yRSbEy1RnkyYg/OuX8Hj2I/OiAYWCEFT1Hlzh/DF2mF7TKlmwAF+fNuN0yqQka4T0DTJt71lVId1wvqRUnOK65RP233I052gITuCZ2AI47dFkm72RMb9EOlg8pt2z9f/6AND2rjNtUcbCnue6aFnOsHNzTntvJC01pozyr4tJBbW6uqcIEG2yaoD3qjpVRyEOGM1Oet2rv7XKuEbcvJsGlIVG3VWgBOei64o7pAOiZdLitZ8rayJbNc2jo2DDwl8TXb8QjE673k/eJNyDLXun9cd9fn054ftdd9x10PZYfyf4aez+jMpBunIXleBAi++Kzyi6mF1ln6fnTVreZznrII58s/WzTVdod1VotdV8+r5e//k2d/Z9+W2t/8F21njuj9rnL6l1ZU399W9rZU45JH10rTeGNW3zHvm3sdsyzmY2/1dRwdUvdi2tqP39WG3/4A5378u/p9Je/qsuP/VjDdbelvsN1mhq1m7FKcDDohOxlVSI3lAk7HE0vre51mcZ4AyeBZ/jxBFfvMO9/pldDX60qMzWllsttDLhclJ3qg7/g/UB12sfkCF9jPOimnXNAXlpPKlrH6poO4JOZTlePfe1rOvvSS9qyzjE6dVKHPvwh3fMX/oIaDz+s9uGj2piZ13qxol36BSzf6Acqj0rWYd2+IAkDzOAO7RE6TEWA3vAp75is6O9MtABjaQAA//RJREFUwoSWyZtWSt0zsYmJKJb8VsZs/5fL0e8AD4f8mQTLxEu21WTFR75AH07Z37Jq94Zq2TOZpWm6DL3OcQvWfciavGLg56bcpAImV1KOgqXCxjVKHD9oubm3E5NDK9XKftA/nw4dJzhxQtXYVo63pv2W7aeNfkkt6+Qd00jTYbZNC0yQafrdbgdWk1GnUFerMBMTl+AC0fdUsEboKkmro7C7kMquAaeRJp3Q7/DnGvl/orvZlnHL/Tl2CKm0r3jig8Eex9eJopIa4EBzNhhn6kVlo7MGR6N1Q/6JPoWcOJTwUMTfBIdwCoHrXCZ+MmMzCoOz9OGwKmt0NvI4h8Pewo9Z+QVVdGD+iO4+dV+crZH1O7YmKuQtRM3kxhraNW/I4+d7OoOikzSc8+I+mJgZo4Xd7NSMKsVqxNve3dal1QvaG+1Z+NIh2YsZkSyvZesFPGmQBIZt1/hhD/jhMKdaZUaHlm/TwtwxFbJTrhOM1r6K2V4cUJqxElDKc7ZJSW0EM4ayxXChZJOnZFwUOxqVu9rObuuFrbN6Yf1lK9ND9Z3M1rCtTlHqOexOd0sra+fV21tXadhRkb1m210rm3TtFlSls9TMvG9toT/sWmDvmrHvaK/FIMCe7XPDsn84HTgBF07b5claKbHWEiYXCoPtuf16Ir3F5SUdP348BnVIBwfdhdJlh4JMB+GZM2cskOkQTO9f7VAUYkaG00DJQEHBO7GYIcugBkooW3QMHM4BY5CDsOTHYaE8M/MhvOtnZMEVe4abdjI504WvsQzYZd5rb2lrdyNgqpRqsdIomykaVitCxh8K8tA4Hth3B9vaal7W6s5ZXd08q7Xti9ptr6szaMeACi0KoYqhmjomQRJXDFj8a5f5T+vCqLFiHiseyCeSo52MFdZwfum8gCE8ChGv4vuknb3THAW9hsOExZzvXadj/FIuDi/HZmE2Uxhk4zLTGQwOgqytsAyoL3vfRUctyj1bSwxGNaeCYuNajLwwaEkH/N4M7l6J+6hH5zkhh6RIRQn95HB0INtgbK1eNI9xG8i4vcRgcAS2SwoW26TETNJKwyxyAiupvLJ1jZvgm+BSQvukNinP/h3uj2d27dsbdY5JckYO2xyCo+R4abr2i/TqJxTwujhxa+AjVjyM24nlSWZUVb9bUXMrr+3VrNYuS811qXV5XSvPPKWtl06r0G5Z2hi3EEzgm8EKjKO8trZaMXuIrus0IJEGiNnOLEwz83rqFXnM6kMGkGdmp/Wpz3xClVoJNuZ6Lpnn5EyHeS0sLuvOu+/UDx/7rsMa7NxIC/PTOnroiE6/8JIVbudBHOgUGFwWDD9489D0kgZAUPDTFlnwDXAQ7Qc5auFR7FV8rVn+NKwaWM4NSw5jnGQtHyzjhiWr7jbymBkXkwrI054Bo+AxhnNg3IE/+BEzBemco2PHgEXberPdpKbHtTl21+o/0SbP3NDuJ961TrVd76P+U5sJM8VRJjwcQ5g2lrMxxHZGWQY6Bi3NWtYem6nqyFRZy9Wipi2DC6OuqxZZYby5nfacTh/cZIvR+bO+11ZrmLZU61r2cBA+RjbnY5ALM8gybHdkfHFuQwHxGXLLML6Gh3kkXmjZGHww3U+e+Z83/OFdBcyA5MpzwXFN7dYHmH05DhffHM5p55wvtVlwRnk64Y2nqXJJc5ar0zXDhvw1YeMnHQtBU74ynwI+xVZabOHHweusiEBXiskVKA3mV23rZruZmrZU09qwqitWYM7uZPX8Wk9PX97VM1fbenG1recv7uj589s6f2VPF1Z2dfbqls6vbmtltaW9zXYMfnzq3Q/oL3zgET169wndd9sB3X9ySYemrHOpqarbHFsjxBk4rlVjL+qTji3kQ8xSpkODukdmmM4ZuyqJjRE7bjGunzHdsA0og+Q9112sqBgzVbZOLDNwVc5rsVHSkeVpTVetf6Lf2VfIx+GY5IL8MYqcOvohAzp+9jtmUNOCGWCCEZhkjEvyNn3mitbTTCO5krLWrabrJS3Nz5g+zEscPybZGBbKWDSe6XiFB3BQP6uOtnb2fA+slJvcEx7w8QRMUZT07pa7EQenSH6CQ1AeuquZd6Zoeim6XVr/nn7w3Zq+/6GYZTza3dXgxWfVOf+c41oPz3W1WqnqnPl5f2paU7Mz2rh4PnX8DrFnmJABnVDPtgmyXfNp6zCR4y339jjXtxsQrTYNgqR3vKFZoaPRzhnU7PnFrnkfA7wd3zNJ62Yc/PZ6T354HG3a4iBdx562PvE8/zE3fsclsQr/s+d5MsCCbVWw7lJgshlKi/kQZ1xiTxWdYdk6UM5xBi7bnr91DQPbQA8shDLmkdyzKoSdB9iDPw/fsuwrNdvKXV3T9lPP69xXfl9n/+WXtfJb39D6V/5Au9/+oTo/fFqdp15U5/lz6rx0QZ2zF9V50dfnzqr7+Gl1v/Ok9r72Ha1+6fd08Z/9G135n76mve8/rYzDFje2VWi1lLU9h40g6zVm2qhvhtPwO/9RDBwnJGK/Aj81yMSOkKtGWODY0cdoekc65BZ0WJiekhp1S0mXFxni8qUBEuQClZ88/1F3J3RjSrCPmxty0UKM31zQxMCysKs8e3eiU+brmrnrIR362b+oxue/oP673qWt5YPaiJWhDuIww85AhX5etX5RtW5OFStYGReI9tctFtQumDOaFqMtUh67sH2pd19Tf4S/m3ajX8xh02RO2/v0FzgPVm+ETujvnX7SXYwdx/U738Pb6X/osVLASMkWbDs6/0K5ZvXG+rRlbxfdjvDRFwIWXV63h5t3fxL+kxxK2zf1tbG5FbtpVMusQPnz6oyPsIeYHJb4cmrP2PqmO+tzq82RHr+4qx+d39FTF7f1xLl1PX52XU+d3dKTL+3q5Qu7eu7FHa20CmrGCj7TomkI3gG+TYWJZzrx63kr36DORAP4W+613K0zQG65N+wmDS0adDS0SVOE0buhwyv5bqbuZm6jsKeHTkzrroON2L4hCbtxoJ/grmvP4dIz/1/95Y25iA3XCM7BdZImJbHSAZNhhYTfMPLO50HPQsSCKQwLvwhxYAWlmC1rhjMaarMaWiB22nSYhSiIJOk4R6DxZl+IkCAaTag63KPocF4HXQhZLcwua3bqQChE5y+/qK3mVXVHe9E5sGBjpNY3DI4d6fmGZcG9XEZ7eWnL6XaM94IN/eXZYzq+cEr13Jxho8MNKFwOlw1lsj+wICUhK4ndYVPbzQ0L3l0bv1YQBq3Yook9VpnVF4evugh+tJDtx/6quUpGW3urOn/ltLb3VszPXSYrGPQ3oMDSacLZAKV8SUWWJff2tLZ9VasbK1pdu6zNtStqrl9WZuOKyr1WzGaFtgJK42TXmfWmG2rVyzbSen7XUcdwZYqGG3Oema/G74tnT+vJp56K1RR0NATqnQ4zgqgHBhk4/+Ozn/usysxISMjbd5Qr6jSEi+s4DEjqimJYxXAepMcKEOqL7WVIl59lmBWRjFqGf2uHc1NQaBMM6OmTOmKgEGhoJdRzrWph1umr3+3H4efM6GDLrCwKe4Faamm7varL6+d0/uoZnV85o5WNy9rYMe42r+rK6gWtbZgu+i3l8hkbBkWTEfnS4UgF2Ec5J0LwVYV+Q86t3GUmBdp7uPEz6YKVlP7ET/5P6N4uvXgHOojD/6POQ91wc6FcJm4rNrGayU+FUU/DnTUNti6qpB2/g8+ZjjJu1yjQjt0xcQ8bh5SrH3H1lJ0aAympczfcWJNJBhEzbVGcnDfVGvn7wWlOauKa5xk/cRPeQqdg4lXAHkTstCP2yIYknvRMqJz1kRtsarRzTq1LT6g63DAFGQbTFG04pZIzv7CSnWsoP3u7cnN3GAucq8NycJT1NGBCzqMY+HM8GtcNOcprvBjGVDJKgLkBblw+5IwRw6BcnBGQUGdvvLOMfWATK/D5xl3kx6qeficGdfvt3cg73JgOwnACnbT1wA3eL6JzARhJhcHABG8y5hL+OAB/lK8YRw0rslVtbQy1vtbRzo6N9K4xnauokqtq0O6q2WqqVKuoPDVjGjAtuaxRKpI3X/rmN7+pH3z/hxqYj1BHgSHT5Mjwk2+sJAKEvr8aVvYOPnriqP7dv/7v7nfKBh06beyvQomB5I6+9e1v6MMffq+T2FWHc5w2tnT69Bk98O73qTJ/SMNc3WUp22B3XOfH1m4wfNJLA6DwoEBQ0C8Hl+dalzXafFmZLltNODM+OMwox8w1VkYxIFhSbuaYMpVFf2Kgxy8NG7Q82L2gEYegOwcGU2IgEip1NrnqlLI1xzHu0uDkjTnQClypjUFnvrgNQOPZXC3qJmkGyUWTMkR0xhMrvaSN8WESLl2pt6g7EG0Hv6aNxJOvdPRALyEniGJaoiTIH2QOrIbVBJUi8t0P/bbf9TVVK/sdWzYmqNmSbs8E98SZVZ3Z7KibNy1RH06PbY0wwPNcbRjT+T1jefrI8Xkdm3O7hoICfmAD8mvXSByGBMRcJ8/xR+mTcZ9qNTmu1/uJ4z7K6DvKHbzCfAj9kfJPZkkWyy4rA2HGWRzmaXgnaQFl8i6L4zNIgtAd9sy3HI62EttlGiaM8nSYfNY0RkeF35tHsc8yV/bKnww+GTJnkIvnjvPtWE/q4kOgg2P/SN+QsmUYM4vdAM1r7Q0DcI8syzmThxl6BjzKmra3om2ap/kF9R7pWGeAf7JPNuWk84s6hIeSCzyfzhRWWTDwwVkfjWJWs9WC5qwbLUxZv3L7K0xwgN4TuASvqfwmjsiP6gK+aPt+gafm+MWhq35PhwyTaNB12XOc1as9w7O63dKZy2tWAtGhrBc7XCbK5kT9x4oRiIUBEfbFPr7ciDIlqg6sRn4Ei6DjX0S+5W7ApVYHMqMu+Znmot7y2CmmG/+gMW2vqXv2rEYrK+qdP6P2hReV7TRdzwN1qtMqHrtHK8VpnW9Lu72B1lYu69DBI47NpCmn6wxCrkCRziukMhV6y70NbtJm3LJSxY+rglaGMycO/uVnVMtRV0WTQNX8c8H8o+I2yVZL8K8U3Ff7lNaEA/Kfqnda5ikx4GnHCk7qn8+T3GjL4bjaTx6vd+NP4V7z+zgeHv4U9th1IWPSCbwdHmVYkIlwFgYM4EOh5xAPnltiW1bKZjln/oVMQB6wb37wRKdMeomHW1txerH9lKPkbCsOdvfU3bLOs7qmjYuXtHbmnNb+f+z957Pl25nfh313jieH7tM534ubA/IMMOAEUGSJFC2TksqSSypZZcuWXX7hcpX/A5dfqBxUfkGrVFJJJKWiKHHIITmcgJnhIGfg4ubbOZ3QJ4edg7+fZ+3d3fcOAKIbwG1e4qxz1v6l9Vvhyc9Kv6vXtHXlSoqX7ZNfuabdazfVuL2i/tqmHe8D5TttFax7WGWSvgMF+KlbgmvoNctLQny3BLia/3jMeexq4PqBAeBOAAZMJAj4ONoUf4IB3FNH6IVKceQ+ugVbHX+HOic5genGABVJ0NG75ap6J86oZX93P4e/ygQgsuWHFAk3hKCpIDTs00QJoTF9Arwe9RsgwC6+3ej6NLot5U0jbPlbto399KRtn6WTZpCam+Dy/TzL6gXr0VK7o5pjudlSue1rZ1pArjo/bIeebbGO68kEzUSzlJPOw2cjUg8q43O+x0Ga8S4jcdtl8m1ZwEn/QZr8kgb9gk6dBriSu0k98oxtpnpuT+SD7h2o2W6rVC45P/IfPTPtwwNRBzJ6jBAywJmiA6gx+B3fjwkcvmSCH3TOk0arq5XVDdUqOT11alE51xMPOEHiSQQqSOMTAGgDZ9Q/qJW2je4Twv76hXwDhLwCOD4LSz6qwBNohJU/b93e1Je+9bpef+sdXb78nq5ev64rN2/r8vVVvXvlli6/946u37qpe13s06w+fXZRJydMu3l2FenavhrxZLQjWpoKiJqOL1J9D8P7w9hXOQyH4RFDYioEYSgVBIOZHOUMA9LRDsPHFku9jo5OFGMLh7yld9dEh5ggIBB/Whyx8/0wfvLzhqQUyY8WuC4IEEc61CiSWRnoQTp2BnRsYmrhyfo6KRY/t0Oc7xZV6k6oPjyipcpFPX38Uzp/9EVNlRZtDjBn1zAKJZaMHORtjAjnDC/ytyDF6InZkK4XToXdfZVKNRWKGW3s3dZ2Y1WdYdsCmEEBCz3L0b5jbGMRRgedYjjyQ7V6rBoYqpSp6tj0aZ2ZvahJzdrRSbmzNDJnhQUMwdqQlRUW4ij9XLakSnnCbXclnQcDJHkL6MHAedsZzruerYM9rdkx6g731equWelvauPgutYbd9Ur9NR2uzp+nZmodDQMLaSxKne7W7qy+qbeuvs9Xdl6Qyv7l7XbvKO91l3td9YND8MnnH3alZQMXT9tGym3Wvf0+p3v6IdXvqTXb31FV9d/pJvb72h3uBlxP7urV37tZVWn2NuYd1FuUBiGrSFkmCHoblqJsC8mhgedFKlzwPUjJTgPmjXGQLyfj/clDZynmiVjmrT8RHLuO3/DrF6a1OLkkpVgyUZ03o+c1jADLyxDJy+MmHAcndfe/q4OmgcqlA3nkuuS79la5msve9psLuvavbf05u3v6717b2itu+x2NtTItdXKN9Ut7KmT39De4JZWDYvLN7+vg86WjRHTlstkhvRYSVNWzIz+OQLYGO9lGgAYhQf8OI78prspHXyW4kc1pFa4bf63WWR5x8wLBjcYHEiDnZlh2aieMnLrpnnzDPxtWMX+sD3jos9+8nm1nL7b2lG+talKrxkznQNqZG+6C9ixxUSmPaJl045hRyQ/6gF1wxuxGofBk4gYocgvzK5E/3zYOtXXvGB+HhvDkGyaWUa0TEAQ2XErDg6Ua62ovfIjO3H3LFncRjcerEdnHG3J18zzZWVrR1SZu+B21ZzAMsUMxEzgPLzl0vkbYZ/WPVZIVGSZQMc8RrbvpRnlwIjOcraCI41d11H7GWRATgZegjehPf8+YkxOpvP2RZ9vJlTnzG+T6mbrvjYMhixZLziWnbZqGFUsL5i/jmyF/8wpToN5HPVHFtqg7hfr6tbm1J5Y0nD6vApHnlO2ekZ7B2XtHgxjCfSwyEecTTZ2vgqG68Hydd158ztqb68aj9YDffQRzqXlheUmMiT2CfZfrDyjzRY0zNCFhpxj6JecvVFW4SHrnnn+eWWLrj9yLmBkDWc9x8zIQn4YWxeWyhUtr27qxt0dvXVjVbd2dmP7gveuXQt8JKPb9bTz6Us7hdA5vIBOAwqsBulHGTFbOMvMYeQT9Op3XZFhpqFh4cAk7DaY7lnRkc9N+H1WDBZNc0gc52ccoyHZ03xAz4LhnLUSDP5yXtR76PrDoRkmB7i9Y1w+Sgwi80myA4i+5qbpy4W7zZT8sDPnNvjcUIhnedcpH3VydIq0QoEIz4UqiffCkeRG2AWhiSOOz6PTnGwDey7NeUSHvsuhk71eGFrXFHVspqaj1nsl6sRgBvKk37EO89Fku2Yd0zEd5Vww32+gY5otKc0lhp3zcxkM0FKVmYmqcZhkRhQe/POTjjTk/UesOn7dAOM4RWB6/5y3R8dxNLn6aAiaFiKS1n/IL1a/5Gz3sNXXhOXpyTnbNJMlTZk+S25H1s5fyDSn7pkA+6aPPj0uyALaZLilqkGLDEYATeBreei8oRkGORm05ci2U8CJwMBHy6ct5xvfAsngAJuffQ50+s4zZuo6gjMoEt0OIwS+aIjrExMmHH1m3BjezpN6IbtZoQvcWZNTZODE8jM6+Zwbgw5QWtqyziUyQOI6Vgp9TRYHWqgXdHK+Ht8bmS5kVDbeS9jabE/Vgw+csStEXekEZbAnZPhIVyQbzzTl+tKJw/OwF1xuN/jMxJNlhZXTOE/fUbmQ06Jt+KphX3J9i247fII+6JpXQXbYls6/0elrp207BXs1cOPy3FgG9IF1NBweoU48OwyPH4LW4WHDEoRzi84xcArdMWhom2Nw/ap6V95R970fKnPrPVVaTfNQzvb6lErWRyfPndLLz55XJYmu0EPp2wTMUrdMMX5DDuN8uBx0PtunHWLvyQRYCHkSE1wcsRHDN8R/MaZC55sGkPbdQl4H1hmbViyrttn2c/O2McohA9A3SF26cO29mX/TJJa02s72gXl4/L1JsM09CIS3OI3LuJPq9BPjQ88/GD74LooBuenKxPMIlI+N7BiDMJaNWMzQ+hC7IJQmeZnq6Yj0+9g8OdskJdN5wRH7BD2OjMb39iHEEFst0XoqUnD+fN8qY/s822nEoEap21G11dKEba3awb6qBwcq+bzsZ5VOy0fLSPNZ+FkFF5G3PZXrWZZaHqN73IySebRk+4bttNlQO29ZjH6iEza+B2BkhnwMuLv9NN3ttOoLmAPnnuNDEPnQQ8Dc8IvBppANCJyQMq42+gKd5jSu5MD2CLsTdMLGBCt5ZeeOac9x1zY1/Qv0o2B3EpgqG7rRv7GVFFdGTD7KTKUkm55HlP8oAbo1XOnXQecbIV18COwl88Da7TXde/Oy2t/7ngbf/JqG3/m6el//suRY+PpXlfvyl1X69vfV/c4P1Lt+Q2W/2xMTS4zhPFMxnQ+06XaHTRW6FrsEHUxNsVH5pSEJg0jTwO+obsMuG4L1YtCMb6ExcYzBPkLABNiYZmOQxXDI2A/lm2wmfydwOtN7yTZ9TCIx/SPGeRSTPsDHowHsAwHoY9+BSepkeeHG4gdglQaNW0fkjUvs3dWthlYPBpqYXjQ8TB0ju/ZfmWD8gIF0THj45QRsf/IHd4ZcGIDGJDIWGDoFO5dMT1a0ODepxemKjszUNT9R16yvpxenNDk/qbmFKbHWp2ibFy+Tbz7GpBbDn8leyJQYJOWZywgx5/KwJRMVHIafFA5XgByGxwhIaUQ4zh8CEQPJIte3uQ4Z7x9GsRkAOTNb0Ytnj8Z+1kkYjvL4VyJQj4fjOEQjHsSwzrjPJQYKQgcjJin9NJghVep20mcnxV7e7XZLLRtIBkN0njPLI+WRFBtqPGRiGBTOA0OtUNb87JGYiXv33i3tN3fsxLYt0Oxquoy5QUETdLSEsZByocOr7frtWXE2c0XNLp6Mra9qxTllbRVjIA8tIeP7FH4Lx5ylCzHoQJWQkTYg+aDbfoM95a3SfZ5mDtoIYS9hK9YeAwgWvnhahaLrUBzqztpNtbsNq2478Mh6Z/W+GHBjb3gbCjYK2eMdMIw7TYvsc24Dso4RGR4cytaOcz6vnXJe29WMDkp9dQo9dWxUNTtNbe5saG1jRXsHO2mvTDvxf/onf6KNexsJpo45ty2WkOLgGy4g4W/+zb+lmbnZSDM2LoAfKAm/IQKlO4C0aEFcGTem8T6Gh5+HIZKwSG0jlemf2aZ0SDZaDcPH9bI10xuAO8p3quiMckHOa9AbqNVsxXZn8/PzgYOm4bi+vaLbaze0vrNiE+tAw4LhxrYwgSPMkLbpoeUKsy2Xy3aeg15WC3NLKuXrrqdVJIoxauX6hpE6DqktjxNSfr+qAbiN6MRwIGLIpD03obZCbD2i9rb6jbv2VNZ9x3A3nhMZmVJ8MsyV1O3b+anOqFCd9QN2b8/aGIfmkIvOw/QSAyzkm33wgelx+fwGhfIOhvCICoO+cBAiPsAVZD7+JgCUEHlgrDuN3QDTpB28ko+tNXVX31Z/+5rKg12Lg/TxU9qI0c1ybZvnpr6qSvOXlJ+9ZJqcsZHP9kXIFYw66kCz6YAZwetBVR4xpNYSgQu1T0ae88/xrQi3YcisKfjOjbTsgEeyLG3vbivLSjGgF7L14dx+tsgvW9MUyhUVJ42v2pTxNq1scVLtTkbbWwxGVNTvGYe9olpd49FmaoaPzZYm1ctPaViaiW3CcrVJ5euW6ZPHVJw+4Xjc98zzxWnlC3VZjFpGd9TpHKjNrK580fqCPX85l3b399z6rGYWFkNmZ/lIuNtfKBb1R3/0R3r9NTtmbDvINoLGEwOhoALPB4cV2YVDBi6Ltar++r/9N/T8Sy8Y766v5RkyBDyFk2hcMkDc2NvTD7/3Tf2z//nv6ea7P9TOyjWTygFqQk+/9HwMlBSs4/IIc5Ntr833kKwPoT3LWxwwHIu0/zfd0y1lW/fU276jXGfX5UDjpkiQGjQMnsq26aeVqx+1ZzBBDvcdytjGq7PsOqzbMTY0sPKdiws0LZhGy3XDdMnX1VFe/D56jDwjOhiO1J+VN4OMYZWruV5V07wdP5cLvcUsMvQBNoD/0KfxgemfEFIZPzk8qAeBvEenowC/o0JicN/HQiEXq0KYWRhyxs+ZCdlwou++s6xNq4o0e406gWTS+X1+LByYvT9tHfOJi0c1VzP9oCt/GWHcjnEDx5EwOg8/9KF7SKg069CXru5E1Xxhnux2exFJlBnN6iVRdBy5fcx+p7XYOzET2PcxOkbJUhydE8gbMo3tRH3Bu8mWSfQbMnh87XQ8h2Hi/VH94DUGItmXO1Y/wafUxc/9qlGT7F5WYDEpJgoF1pZboISih+DQuGL7TFpA53Xd9yaMlrr1/aJty2O2pWeq+djCFFuaAXlWn2SsN1gVBO+6FtFkOkxixUu0w5kYLmbamN3YGRZia7SmbdhWxnLddW66pgxYdF2HMEgIzgiqopNx+6Ch966vmWvzapv4B36PykN7dGahjSizaHv19HxFF07M2zlHBvPEWQI54Osy6BAjBOwOw2MGoGc8gSsQDoVC5yOeiKEntt28d1cH199Rf++eqpmuZYdtyoF5iHQz85q69JRyU9MqWcZdWd7W6vau/YCmKtVJFS3vyCnNTjfOwTXMYhrtG7fw22H4sEPycQL/6CjH8A+4YwGFvuSIrKJzHxkaWz5Zz9fM93W/XRswIG5/bmQvptyQkWRkugg5hvxAjvAMfw1KSCHuj87HYVSjnxh/EWGcF3XiJI6c+oSac4nfCl3yDcWM6XRoOwp4cQ85y5gyIVZYB98kf5pJjXQeF3LYs3RU+okbyiAEk3vYtBDJhXxFf6SOa1vFTocvxsSnbgyEWOa5MvBMwDRyQwOnq6g67wJBp2NyZeDT+KEF/EVnt/9Cp/lu7CDASaR4MgEYIwNo33gwInQj+g6a47FlTkzkiEEdtxtZP7QkKlbUPnFG+0eP25fny1SpFcgpzgINjqHL74dxqlGATv2ctI+6AgQ7hxWZDP7n8qWgCczPwX5T1374hrbW17SxsabNnU374Jvatwxs3dtU6/ayWtdva+eOn/lefmZCxaNzaluP890PygUUMeDoC+6E+RftcLxPlwmP72vPKIzvPxz/YniQw09K9/D9h5+NeeRxAzYuZUPBtA8Lg/bFBApH7jFJgr6Wrb2WLt+8a5ou6dKJRR2fsm+MgxAIflLBZY/xEb+0Ae7zdbQN2h21ywHe+8WsABkB3ocEw1Q2cORdZE99qqanLi7p2Qsn9fFnz+qFS2f13KXTeu7pY3r+qSW98LFTunThhO5sNrRn+sNOX6jRb4AMSjQXbQl8ICfSMVYhjQs/DD82HK4AOQw/ZwjOHp0Twj0PMYHQwSjAAZyZrmp6gtUEZkoz6EeXJam5WWZY9KmjDRf2LR9kmr5u2Lll38aWOq2mFqbndf70RR2bP65a0cq4a4OgY6E1hlcCURzGAZFMpxajwrt729rZ3UrbUGFcITARej6yTzO9TszyjtmvNtyY2VLOTej4wmkdnT+hUnlCHTvYPWbcsbaXveDt/Bj8ZnzX2zFwweh0L2vn2TiqH9FMfUnl/JSNg7wK2UKs/Oi0dtXr7apcNv5cFz4g1mw3tXuwq2azYTxbOeLU3w8fxDDXCXYoTJbFMlIde7W7ftlhGvxgOw8MKFaB8MHwrp2tjuvQyxbjyMftOjbcu0NiQ9u7a7p87U3tNbc1uzilXNFv02bg4bIYlAgh5zbwfY/19Y3U5xA4SHUcKz7gGoMbfvVBdB4xq6XgNuZViu3QnHowSLaq1T7f7ZASPVRrk5qemndaPhZqumCPV+OPrXTSR0J5ZwTDPjOi+6rVq2ahXmwNdmv5mm7cvaat3XXDAKPOsGCZY4CuJ7aK6RvfwIf6YG4xs5NZHtQrqIlnfi/a4jvjthyGxw3J7OP4cEyqM9EQfIvTxV6sueqUOkM6TI0XLGwZ95l2rFyomqhLzT0Ntm5InQ1nY3lhvDJbjBn9zEwu+IizmmUme7es7IAVDtn7pTIYwHZCsUrEcRgz6x3N2zglpKBurIyg01bFmjrmg9hfls6R2BqDWSI4v/vKF3b8xj31tq6osXZN2c5BzIALWZGLT5z7OsmOYKvirIqTJzXMT0ZHcN80HB+uNk2PZwkG3fnMjOazxwvBk+Z49hyPNo9omvwHQ75dYX0STjodoU7n9jDTrhiz8HFckZN+BK8/cjS0zfey4ZvJTprN56TKCWVmLioz+7SauVO6fjerGzf6unqlpatXm7p6o6uVnZp6sx9T8dLnVXrq8yqc+7TyJz+t7NFPKjP3ojITTylTOun85o0H5wvfFk0X9aHmZ9n6MKeJGu3raK97oH7F5wXXw3C99c5b2rh6WWX4umdd0kemOStXNQvujQM89Z7laK+Ps1Lxswm/WzEGLXetA6AzBlROnjwVbey0jNMeHWJSyXoHKus3e5qu1HTx1HG99e0v66Sr+X/5j/+m/t2/8jlNFw60UD2QNn+g/spXNbj3HRWbt1WyPGYf7oLpDZizR3fBxFIwzeXNAkFOoALcIT9dDrILGuXD6+jTnI/50Dklt8epB22/55qbF9jqSawGCFigBX3PdEeI75o40nERHm3QA7Q3xuUjRr8bfIQD78txfRnSYf/dvmW7udS0zwcx847oKHO5PZGOY8zy+iUG9BnbaDC4Twc7e0IzKBDPRvYVqol5Ct2ubQNfs2IBGkqJSMMJSAEjxoLfr1XLwV9PNoxlFzbkuL5GtXWzIW9dan1ZKuj4/LROLFjXVkxzfdtd3f3odEevdi1DG9a3zF7PmF6KJdOT2xdNC/ymiB0G7TA5JH2Y3+VQMvZVHEc1uX/N0fGhY1AG8OS5bZW8eYhBhr7zY/CyYz7tGidd0ppRUdl9163XaRhXpm0GavIVtTJldQpldfNF05VrN+io6vYcLQ11stjTmXJfz83VdKosTfjdimVD3u3ODBzNB4yHIrPZ0oNVLNQX+mVApWcaOTA/rjfbur3X1OWNA72xvKfv3drTN6/v6qtXNvXn797Tv3hvTV9+b0Vfu7yhH9zc0ZV7u1rbb2m3Y9pmtZVpvMSkF2ygkDnWigYa8rfntsAn0BnQhQ57bjswT3bJOKRz7JEnT2v/OoTQsgAZcQqjWHeYT5DpzHYGxt229rfXtW952q7mtV/Oat86p10vqLA0p+mL1uU1y7PVW+pde1dHens6blo9PjGrlZurpt+c83SEluEr69lYOWg5PRxN0DgMH3YA60h5IvpqdAV7OcJfqKG8bxTMu1nrVXTWQa6o9VxB95ymnTe/mmb4VhRDs8zuz1sHD5lrHD6XdZ4zwS/CNyuYnhhwjZIp5wkG6hA/cZK4gMlA48BABwPfPWxAy1gmhqADBqZrBoTYYqjoewXrTmwftugp2D8vx2oR32jxXSOfm7aZ3lOxnWupZ7lmHjBwu4Zd27Dr+ZipsLIXv9a2J/D2O3y82oXbZE56mvSUzZbN6AEGmZi0h29NR3x8Z9QOZSHujYBr3h03EfyOmvpEQ9j41itBBdjH2N/xBLuLvgU2gkq+UGyz6CfoyJbh3ZyaVmZ6JnxVAj40tgxxfP3LDFgQnQF2QCm+5VHE3rQNl5+Z1cwrL2ju1z+rI7/5W1r4wm9p8S/9jo5+9nM689IndOrMRVVYuWN81qenVJmdVtd2BR3QWeOt3BloopuxTmaAELjQZvjPti/2L7BwhCc/qiHawy9tMF9xTIdk+6QBg5Ia5p+761va3NxSvZzT9ATb0UYW/2qFkBWOcQRhv6xKkjd2IvhPZSSbkX6udKwNu6qbjmYtF5hqULPvd6TQ0xE/O2oemrOOnSkXLJP2Yivm+Hao5VbX/hV81reP3nVMu0TYxkQGuVnIfzTzR5nuPoxwuALkMDxGsCK3oo6tVUYCkI7tdD85YHTawuD1QkbPn5vTucW68jYImPWfBANi9aMZYlYrnYnRBAQPwVLHDuF+Y1c3bl7W2vpd3+urXq+oWq371M4oBpE1R5rR/XBEUFlc2dKp1SZUn5rQxuZ6DDCwBRcforUZpaKF3mK/YIFpQYdSpR6uBB+7U76s0vSCpo+eVr4yYwFpR9x2CUt6qVvfTrXtEFBkI8BCGS/WF7EnNYMPzidfsBAuF9Vo7qvLh9ssvHkWW2j4mVuMeWcn3kab77e7Ladr+dz5OU0sKQ2gpDaNQ4DJv3SQsp8sHbrR6eA8qr2OZtodTTiyRJXEdB43LeS3bFzulAo+z9vwHMObgYSBiiUbMDZE2p2mdcxQy3dWdPW96/b36Cixw+56xgAI7TO8y+WKPvXJz+j8+YthAFMQ+UVtGRWhzlwEblJLiSPPMnCD1ucJ+caAj9vCmz3/8gcLWF+p3W+o2Tkw1A1z38vb8GVmJvnGNjHOD3hPTkxqbnYmVo3cvHNDm7sbzqUdHZV08NFhwjdBWI1DBGUMNrHVBB8jHtp7yWcqmp86qtnpReO6bNjSdv5oD/X1wWUljHB1GB4tALNEA/AchgXn3E6OCbTBEAnLkXvqdjbV3lu2EdKGU/ysG8lxFtieh336O52WhuUp5esL5gk7UEYsBhGlJAcIujUh+cgVnXVppkfCa0TTaTxzpB4UQicUtBUdyzJ9kKP5n02ToIWc+YX69hiMc70qNrTygy31N66offdNZfaX7ezx8fOm32gneo6y7CgP8+pkp1Sce0aFuafUz8/G9jADVwz+GlMYFRrXLP0+bqDByJM0qwYQpq0AmHXEAJOdWl/DgTkGaMIiL4UTkutuW4g0xoB5KHBNPX+WIxHcptLBTpa973MVNfb7undzzU5y2WClA7+UZkSX65o6elLFiWlTAyuxyo5Ft8HvDa0DVHNk26w0YMmgqNqWtXuryvcPQvaWJ+btSU+mLXjo6LZjxfZSbHG0t7mhSm1StclZ5VwXZrR9++tf1ts/SitA9g8OVMgVDQ9WJloe41hDO3kjMkeHbEtTM9P6z/6z/5OOLhyJpjJLEhk5YNAEOjS889bZneamXvvqP9OF+ayePWU5Vc7oxafP6sTipIatDTV3l9Xa2TSccypWpk1bfMgfTcMAHYY4GDMNGl+01e6nMq019XZuKmv88M0Zlxr6gIqE/nN6Oa/M5Jzpq2wUICfJNNGvMvtqN9ZdX3jLsi3eMU34MChUlLUcVDZtPZnCGJ/jML7+Kccoh3oZdj4GZbsNffCYNw5dDjMN4VkCJJZWgRDjjo+JA34ZgY6FGAQxTIKGHMcdCXT8cE39tjpZff/dO9pu4ZxCg6mFceIz+Bq5hR5aqGf12acXTZmmx0j0JANwpI5jCKYKRa2jzejTrEpFvoVSiG+a8PFzBvKMubDN0M3QTUxUwAjyk/TtHOiMRONoHBqByBFuIFNTGJf9wSPh4XvpHGwje0NecHRZ6ei8fU59kJFsP4Y5Ft8XM/2wp3OsbbPR0LMRx2qqstNNFnNaqBU1T6znNMNAT7ZtQ6Pp9xmwQlOAe/Dt982DvVxB5n7tdm0zDYz/XkbLex29c3tLb1xf0/cvr+j7763qO2/c0nffuaPXr6/o3Tvrunx3Q5eX13VteVXXVjZ05e663rp2V29eXtaVm+taXm9oq2V7z/bWerPv9AfR0WGr1G0Grq7JyC5igDzsyF5Dp2creurUQmzjx3PqGzQXAW2Bzktnh+HxApBLNA/cfYW8MqwtNZmaE/RB6PFtvIrt5UnL7npdudl51ZZOq3j6rAa+3n79NTWvXdX+5o7teb710tL+sKjraxtaPHnadkCyV01m0WlOgay8RM4/YKjD8OEGc0/gPNlf0EBIIPQ9qxZCppnjSBbpjaURmkrDjuYybZV9RE6STSFGNSynbDvAm0FX8Lf9jrTSbPSyM+QZOH9SWKe+lI2JwXEEhriI9rLKrY/udovcQHzcrvWDrUQ/tA1uQYV9xK4FACcmGDkzYJcm8/Gi/WrnQT5IN/JiFQZynb80aO4z30pbkMJ1WKP8wYOGqdOij1itzDdF+6MBkRiYoQin5z/0gesTdg4FOcQqah/HHae0BhT5/36aDztAZ7Qtqg3BRW2gv6CWiAGi0T36hfh2aKNU1eDYKfWPHNNBkdnrfg+9ACwdx+GD138hOHOeA5JH/wYIxGLdlLMfY/8LughfwbiZnJlVfXHB9mNdxRn6X2zHu46ZO5u6+qO31DR+qhdOa/6TLyl/9pgaFSZj8q0r276OrB5KZUUVA7cJDpykI88+sgGYuxVYUHzrI7Un3UsyBvu4oNWtPV27taJ2q6VTi1N68cKCavYnGIx/sgFkUNeEBCRYotFx/ce2CFikbdjMv6AVIBCCQ7IPKc3+VcAw3QeeRdtzSIS+5Rbf291vDdTsWl5gG5Kj5dHlG2tqNfb17LkTmq3X/N7A71F38wF+Mr6TffQo0nlD2/RVJN8kijoMHwj4TAmTh+EwPEKAn4KvQxDg1iQmC2XDH5zn80G/rZkJOminGQuwTQFTQnTJcPjoBYRm3+3rWGARUfK4GiW3p+Q2WhViTLmNHQurjbW7unPzuvZ3djRVn9L05LydXDrMEgwJ4yMKEocyV2AbpX3t7O+EYHOG6g5HswVJ45/YzoSXQqfbwLKRkc1VVZ84ajE4qUy/6kcV5elEskHLaoRMbzSDh4708J+Zx8HqEgZGLEDZK5jZDKUJnT9xQcfnT9kZr9uBZXauy45ZKj3x4dQsS33tjLda+8qFEE5CP76fQeMi/sVAW1NnQ6if+I0Zla5XWDU88QEFwywzZtcy65ZOAjogKYWtxejMa/f2bFzt0x+lTL6r8xdPK1tMcMnl8zYynT+Kze/TwcfKkOWVlZEe5Mc1oEzS+RBLqH0MIzhq6oijF88ANK+M6u6bfKys2+9Y8Rs3xaEKZcPB9SqUc5qZmYqPvtMmVucw5se2Fmn1D+8ym76nvN/ZaW/p5tpV7bY2rWSbVnbOr5A64LpsX+Ay6PRg0IcOQ2BGDfs9Ip1Ak1qcO6aScR1K13VLCt4x6u4iuQ+xHIbHCMCNiMwCjiNSGN0H5sCYD+my2iJXndOwPKc2c8dGRk8EiGBIx21b2c62ehvXlGnwwXQb46ZB+oh65uNun5UNdLSbSfPJ2OS7ArF3cD8d4cfYi9dOW6xQ8jlHVouwBRrfn8k6cr/XMT2ZdlgMwkBdF15zruw1m+02XY+bat19Xbn926rl9i0/mFlsh8LFI99oKZ3jsaqlMq/y3HkNCzN2Jgtus3nSjQcesR+s25ucROcd/PRQ+x8rRM7Bb5ym7PzjutD+OMUANK+kevgeexHHiiyMQSdANvFeHMeROn7wOI7ja94BB3xwzrC3POJbKfaeYqZehe8jdeFv48DGf4aVC7mS5TcyF1cBmqB+mLyGFVvTmV/7XV+3DVMaEzg2v7r+tIMqT84f0ZnnP65j559RkS238hVEtfj6Sm5vXXfe+L7u3b6uHB/b7A1VN93191rqNxuaqVVUsswpWtaxpZbt6Zjdz2A1na8McM9OTalWdt07TsOH0aFhtzM+fOw2DkuWuf09TVX7+jd/65P6a194WbX+rgrdTVVLfdNrU3nLrHJnU9n9u+qtvavu+hXXkcH6huUh+Bg5/aYmBuPCMCf6inYOcx23veVbjtY/rIRjZlPPcB8WDRNXnC13oncVoczony9VrKtfnFbXsO8xdRNc4SagyyxTgx5ow/vwyBFcchzHDz7nODqPThFWWLmOlu1pRQnuCTLVMAt9RXL4PvFfovWxLkPO+5VfUhh3EqBrU2eAaYmOk9EzXwbc2qZNtqiJbS+5TxpXLAZL/AdIYqDKf8VCMUCdPtD6S6z8vyRQK+RqROpMJSNQJwYIoCbzge1KvpsxYTZnW6jj01UdnSqrZv1fdBoGCzM92zPWnVgPfIoM8kk4IiayGgewS5mBZZf74Ig8G1/zPDmqD44pRn0NXjrLqCrcj7gw+GPlHQOZfNcnfWgdfBnO5GuGb/h0s9HW1lZD2XZfJ+ZqOnt0Qkdna9btdo4L7De+rw6r/bAxSgU0RsjjTK7uGtZsOxR1vZHRazt9fflOS//4tWX9d3/6pv6r3/+u/qevv60/f3ddr600dWV7oNV+WfuFabWso5rmpf2s3zdXH2Qr2suUtaOydnOT2shO6XKjqK/faej3vn9b/80fXta/ePNAW9ZP3VzFcsl8jUxx7YBCBLeJkDSjL7kIeiOAW+48BPjD8PMF+Dn+UifIfdiCDvsiIXNzNdWOntP0M5/U9Eu/rumP/6YmXv5N5S9+UpmZM5YRBe1vbirXsczv7+tMtqXjlslM4Mgium2vsDUuK5nAKl8wCNnn64Ttw/BEQuA+2OsvBj8DN6xqy9s+YVIUHZQN+wgbhZKWCwWt2S7Yy9kuMT5zfh5yDP610cI2QVyD77FeoyMevUa+2LxPNLj4kaiJOlHTCL7Ah+7a12XQjs5tVqWF58Qgg9ucK7KSP239yfcvY6ULE+ysILpWCqzwoDvdloyaVhwty9uO7SZWcfSxOUz3ZcO0br6pjGxwOkf79s/ZtSC2fQqcJEgxyMGAS3xovVhUvmQb0Ue+Z0I6YJl8T6cHmfEuYcRfbmjKLjU4/T6BQPWCALDHqRPyBb+D+nPfMLecwJd30ww94J50XG9iSt3FRTXKZdOh20p0otRfkMLYnvnlBdfGxXXtg3X43mYBb8FtsT3ftb2wb5uiY787k+1qsLmq1R/8QNe/9V1lS0WVPv6spv/q53Rw4Yi2p4rWxuYO8OkcwG/Ql2GT8OR/4EGJpifoEds2YPcRDokKH25DUG66Y1u90R3o9r1dbTc7sSJ5ppbVJC6wKeH97/2KBfsI2IdIKTg60QYKGt7wfdM8OxkcWD7fOOjrm7f29cfvbOgP31jTnzi+cWdLa7sdXTxzXJ947rymKuXIqWiZ02t3o18rRIcpMVm5o/ArDPJHCQ8k0GE4DD9zSAxtDjajjZUWHIcSGAlFOnhtmC9OVTQ7wcx0WBRRgNj8aPMns6xYGREzEn2dZlrZIBjkVSlNaG76iIr5qpUkgw/S+vo9La/esaDrqlQuJEXvd9LR8IgjpwjDnrZ2N9TqYYL1kJ824vpp0MJGXHxk3AonOpl8C8UbW88wy7M85TsV2yjMhPY1TpATMYOY7ZvAFx/ojX17MWScf97HAp0GKHWcGluCtcKMzi49rfPHn9Fk+YhthUllezV129TPOKQu8T5dpIaB6xQfF8dA/CmYje0mHKMDAlrAsOY+jYweVyjEVOPGdhDwbi+diAAn5ez6cR2GRVe9ATBqqe3jsdNHVa1XEqzcPmbcoGZQxrzDSpWVtTvOwQAJI87PjT/SxAyAaFRk7hsY/pQ4DrTRdcjb2PV7fLhtSOd0sW/jt6X9zqa2Dla1sXtX97buxDdR2K6lkC8Zviy1LUaHLa0Iow88+6/VaTj9ijb37rnpNrttmPXcHpvwTuIUhg8DLdSEGSvAzQVq0HV9+yVVi9OaqR/RZG3WUCu5Wb4f4B/Rp3GVmvFwWw7DowToAypNgx9cOfg05NyYRnzAYeRjsNnqnAqTx+0sTfieec68CkoiLZ265u8i20js31Lr3pvKd+6pbnxXoEH/MSuYjaeYaZm2iBvVwJmk0pCvIzo11uHnkD28PTK8kwSm1nZv/WJ8WI+BuC7DFqzKa6vQXVXn3htq3P2eBjvXzOP7llcuy3xDPeKDtryDg5epaFhaVHH2nDR1zHxpPqOHLyrEj2kyoksOAiSm2v68IVSM86IjEseL6wcBLoKjqSMShT9Enq+BDUnG6RFSXMRxfP3wMR3G15SVOizhQ+c04lsQwQFHmu3EcGTbliOdvmUBHi14dowZk3asqETMLjRO+WXFRdEONeAL4cwAasFHPqjI1n45y+KFRZ185dO69Oqva+r4eQ3ZVs0v5Mo53V6+of/qb/8X+vKX/1SNZlOLS8c0McsH+BnEQK5ZNrLaz3kO6cQPp5R7PZVc7qkTR62jCpb5lieuAUZ0LmdXrlCkq0tt00DXTmClKl04PW96abgtB6ajhqu667a7vs6LzTLq2Z5y7Xtqb12W2neVz/G9I5+6XfFxSLbIAZY0dXzGgAKrPxwzfh85zDBfbCll/hkU6n7OKg7zDgY98AzZDC9NKV9c9HnN91174yYNLBrvDM4HL4zx5FPCCJ/pyP2Hrx8+pp/oBHI9U04PjszUYvUq2zVyZE/w0GOOdDTFjCvwGe385YXxYMcHOwzGAyGJA0y7D21BxJ10P9UtWhjPHN1Atj8DlL/suv+0kEQp8De077crHflFusR3NAz7gmmGyRzZXksl09FUJa+l6ZqOzdZ1pF7WbCmnyXxGdZNNhbRsI9pthuxjm6j0EXRsCaKlFjJrVH7QFSGOD1+nuozr9MEjHSKsTEl2FDzC9n0MnhnyDFKyysP03bad0+wNtdvoam1rX1dvr+u1d27pe29e1rdfu6KNHQYR2ULLTq7zQ2bHBI5+Ri3bEAfOYz9b0ZZ55NpeTz+4s6tvX9vQ7371qv6HP35b/+irr+vrb9/V9a2+ts0njcKUmvkJtbNVdfK24dhyy7KRDotm1xam65YtVi3THbM19fJ1dXzeyJZ14Ljnd3YdVy1Klg86akUbTOmWaeztHjootdrHpINC5/gRkIPOEozG8ErhYao8DD9HMD1jhwckDfc0AYtTw3sE+0ypZl1lHW666avsIyvZJv2spmy/oJqfI8+K3X1NdnZ0rNRT2fbAVNlCobUZ9gqz1AfYl9HpS64MfMGPSR4dhg833OebEVvBd+nUlGA64A8egwfxr/Crutaxe/ZJ7jneNt9v5EqWSSU/Z4AEf9LvWK6iDLBPQgL6fugZX8S5/8L0G93/sKN/qFUc79/nb3TOfToF2R0BGMV3IE27mWLBsmugvV5XfFFtz0bxfjGnnfzQcrJnmcq2YLbnCgXzB9sl+drPW+W8tsxQW1m/4zR7lmv75NPvqmlYNXyvVSlaHve1ad3Ut7+ZN3yZGME2gDFJwnkx8N0wn+5aF7G+2uLUdiUtMRfxPStXne9DpVWc0YzQzampqW1+EjfG1x9qjIqYqgwLRItvOVIjywNfJHqB5pI+hfI6prl+2bJmblHtqWk1c752m2PioUP4p47gaHzvlxWwS3uue8u0nSuVwp8AJ9jwWdNCzXid2t9X55339O6f/Jkuv/m6evN1nfzNX9ORX/+M9mantVfBGraspa1uO4NrrDttWyCGv+Z245MAqrDDHa22PwSr8JcdQBr2ZGrF2CeLRjm23cBl2zLLG/vqDvL2M/Kasx3G8Cr+5K9uAECWP6En8UoT/OANekc7lsf9XM0yKacrK/v602/d0D/50+/p26+/px9duaWv/eBH+sdf+rb+/JtXND1Z169//CktzVbtKjIFZmC7vWR71jKDyTAjOxWaiwG3+30Hh+GnhcMtsA7DYwQrPmuBtA2LmdrKJM5CK/LPsreuajYanjo5o4+dnFYNo4q9aRGiVvLBmk77UQvRUrczVZ2OrCR4wuD0KU9oW7PV0l7jwMaXTYQYe2ir2dlVt99Ge8Y76MtkWnAN4Mh9GO/2+j3ng+q0QTFy0rPsQ9kt2m0pMxbiQhGuVsQuIFOeVmFqwc4O3/6wIRd5u6gBc3wo0jBHSMZIiuvo+2CBQYu0hYGdJz9LHXUYcAWVi3VN1hdU5OPavlcsulxmwjAA4LIZ9Ijlv842dUVSaIoPdyqMWmdD27CIzsBM7I2ZtzXE3pmTBkmVnYJc774N82a+oP1yQbvlnJrMSE4g9nvO07HXo/MMg5G8KDyrQr6sd968qpU796LuzGomLekY6GEbscVji/qtL/6l+IB7GGmAnPepKulDiYxry4EHSZkww45VG8Po7erb8Glqr72p9d1lrWzctPK/4eNtbe6sae9gSx3XMW2/4bzCAfExPAfa4IN5gJUg7U76SHrgmg4ZDKm46hk3xgaDXTYiYpaxMcmgVrZfikGqIzMndGT2hCr5CcMuzUfB+SU8wIUzhC8Pw2OF5EJi4Kdu9dThgKwD0HBNQiv8Rmd50BYrg/a3bKgcWNSxJB48sA1NySwLvxg7w456fp7L2lAsTEYnNE4bKwNithp0AI+ZFsDj2PGIGclOlwYDoKdUB2o6plcLCh9TfZkRnWEU1uXScVgaNpTZv6nO2g8iZg6uqdTfFfsRp5VOjqaZyJXXMhV1CvPKTF5U5djz6pcW7dgUXT9kjKEDP4/5xvmzhVKaFUYe6fbjBNoa7XUGOFlwf9wAFiQYwSRSBJMHJzulXcvBjuvmdgKLcRjX431H8nvoOOYTYOpTZvPBmbQLlFAyH5jtNpva3dxUq8PqBaezbOF7A9XJmuYXF5S3sx060HmMZ50zAJUGRCzs1HL+rme2G4MK/YN1DXwEr93KrPLTJ5StL6kyfVwTs0ecf053N1d1/d6arm1u6e//sz/UH33l6zpy8pSOnjqpL335y5Y/GzEQUywXnTe1ZntCthUsxrZYLsAw6WlmdkYnjx9XrVaLc3SIyda0ZFk7cP2clFVAw60bam/wQfw900YraIrBioxlMzoibYFiGjAe2nz4ky0JJ+csq6uxco8P1eMoIVeBBXlmW8vq715VrmPeUBtomr7sJrFqJ1tRd1hzHseVK885f2AI6KFnZDOZueyO62H5WmA7IOgaxjOge5my8jPnzG8MoPDmKIxPf+zRPw8f4z2X5yyDhkG9WwsFQoM5t532j50NUgd+/UKS8EGZDpFZOv0lBWyQcQcC52k2JdKCWa1FbbSHdqLu6sAIpasymuYfeAU6ZqZm0Kfjidm6nl2atL3mBv+S6/2TQtTvobKBZYr8+RhwTimSI54cSvgSHNigUblQUL1U0GSlqHqxqJJpM9ppmLB6JGajINT8HvKDfEOO84wjmT9OdKBusQLIvMDEH3OGH2F52BbsDbXX6min0dbG9p7urm7o2q1V3bh7T6tbDe13Bubdvg46DafOaW66rolSzvVH1ztf43OQg6/K2upkdN3vvH57X998b1Vff+e6fui87jUHOrDMZcbtMF9y+pJ5Kw1MhOhxpK5pVazh4goH3QAL/w8GedumKS38xnaJEAfbJYYG83mLwRgf4fvga2aQ806QTaItSqzaNrp4tK6LJ6w3euiDB2Vh/wftPgTAEQgPwyMG5GvYAuDTcEXSxvZH/NmOtuCOdKHWoU0jnadMxuCITAUPnbW7Gu5tqOrkDIyz/eztbl/X797Sztod1WsTsRqRlYy8yyAkm6CxEhzUJzwehg8zhHQJoQnDwl++A274C35L0tK3IoXJIujF7Oq7+Odt1f1wvp9RxbKTbw4ibKAh3oT3EYvQFXnwHhI4bD3ypOgnFKJo6jA6H8dxnagiOwUMmQQwQNbl1cKftk9ZWTqi3tSEhvOTGszWlJk2bU/bd6772nK63WwF27DaIzdvO2TBNk29quzMhMpz07bN/K7fz0xNqWebZ8+2ftF+ZWZ2SoVJ/GTDvNmxrZ34LG/bi/36h7WKskedn9OV6k7XtR1j+5GBRb7rmLeNF3VnEqJhD18Tom1uKDobdI+a+ERCsrepA7RhX5R70F1oGSYl8DRqGn0SB3xLZmZRw9NntT81oxYyyc/GHekPB3QC8acGykJ3+PVH3QKL1ep9w5rJCAz42SyISTPYBVXLscLKivT9N7T+tW+rcNDUzIljWvr8p5W5cEbNal0NKzm2koXH+HYIRNb1Pb7t0jWtMBGKtqP3E88Mg2fGfEe73z+p8iMUXO2EVcRCshGZqBL+p+G5Y9vj3Zv3tL7bDPwcqef0/MlZHZ82f7Ey27onyaMnFUwdQVsJ/tCrW+A2RIuiLelp0maxat/0+/NsgUVuYe8ga8MK5D2X4gi3YKN3syW1TLPX7+3rK997W1dvr2qyVtTp4/M6fWxO9arTmJZW1u9pd2tXS9Mzmi+xtws+rmWVfaHQ6PR3mR+D5vC7LMeDVYPeXNfU7MPwgYAcOhwAOQyPEcadAjB0cFowd4p24SwY8hZ8M+WMnj01r7OLEyr5nqy0wlCjg4RsPnKMSYUt2GzcxNExOXMIWH79Z3lTqBRiVkG7lz7YzQeH+8zwp2MyZKfzMaDGzR8fgR/Ld3s9O5r+i45SOp1cHJ2hDIBUu3buMzj3fo+ZLpRtZ79frqlgI6NbLKltxqbPqGSFj7PCu6Skk4stuxDAdJW4uOj4RJhScUaTBz1aRWdt2TUqqFAoa6I+o8mJWZVrdqyzLXW6Db9iDIJL58G+qZzgZHFNSAd+Uzv5jU58Ion8j6FQ6NkAb2dU7mI6FNWy4tkr5rVbzmrPsYmtQTkjxcKqGozGGMBweWw7keHesKj1lW1dv3IzvgMSDqDf4tsnNo0Mw4Em5qr6wu98TmX2Q2abFZcfFfH70RxgEXUDnyg78GVDNWJXbE/VGTa129jUysYt3V67rrWtO9rrbKo12DOe285qoB4OInWkvq4HxaTaA2rqaxj4ec+4ZqiDgZzU+e0r8IzzgbHma7bOYh9xlqlne2yDVFIlP63F6ZNamjulifKs/Zb0PDqKAwGjdjlSFvEwPF7A6QOOYeAbV9wZD0ZAlcAb8Jo142l8TNp4Gx7sSM1d05Xpz8/jo/U4NxCD6cvoVb/bVL/T8LMudqRyfCBwZIyxpzf4J3PqEAMf3KOw6JlN+dDZHR39oxgDEFEz05XpkIFonF1zlgqDLQ13Lqt59wfq33td+daqKsNGrADzK/y7bXCq84prG2jZKQ3qp+wM8u2PC2oPmDVoeosGYOBRX/gm8Shvc42jEGF0eOQQ7aatKf+UL5n5PrwZMRL6j6HBgYq0JbNjfthw3DMeOq6HeTE6bB71aOfUsjtn2Z1n1QID15bn1GrY7qi1taXm3p5xyjMbooZ7zfJxbtH8WHF9GdywrOToFx2RQ3QyOB/LkYwNVWSF+k0N9jedZ8P3LeyqR+1kn9IwN+NYV648oeljx/TdN97S/+/v/X398Ve+pR0b5uvbe6rZ2fut3/nLzquojc0tbW05H3SH688QSLHIzN6aiwdG0It0a3lZX//Wt7V/0IgO44U5O+7Im8BhgNvVM+x2bmu4e1f5Hqs/DEc1TctjvYSsdjQtA6+u77OcuzyxoGxxJs6R2Qxos+KP2cV5y81sc0WDnZvKtXd83zIVeUWnGmUbg2IwcNLwK7GdH3kbVnTMQNtuE/XLDlpSY0U54zdmq8IHeZxNy/SpY4YpH/P+cfj8GY+ua1pJBQNQLjwVHGg4W8ba4Y2OpqBPB/jRb0f6iONr4i8+PCzPxx0J49UgXIIfYLHZGuq1K7fVMOdbuvjPz/0aOo73oj3+QxefnK3qmWMTqjJzLGX5xMID6AX3O6RjnNN2OnFpv/+jvVHfaLhpgw5gVrzZnjCe6uWC6pWSqqWSymytZnuJ73HxXTS+a0aeOPSxbYc5BioELgEb4z0GNB6KdO4/fD8NL4yo1xWxdaSy5UDFRVWKzt0O8erahq7dWYt4/c49rdzbMe/ua789sG3IgIVtrrDL3GLXb9PObrWc1+L8BM2NGck44CuNrq6st/TNd9b15ddu6bVra7q729G+eayXr6pjm5DOHfaQ7tuW6xke8V0+aNb3xzZ3rHp13aED7AxogRbwLnydvlVme7FvXjdfs/0me1QnfUSHEXYGoDS8nD80BF+QDyohN+xqwjx7aWlK55ZmzbrAiAANhtSItnI9wuro9zA8cjDg6FyD93OGM98lgAdCrtqGHsa2PWCTrV9M77Zzk+w27P0eeGDmf8t6LLu3rXyHrf/69iHyurW7qy/98Zd05Uev2faf1uzCidAz2CBs2cgHj9Ms+wd4PAwfYggeSjFkpfmdW4nXEm7hd26O7VUzrI/wu/nf/MvHvWedqGq5k9YdpwmK8HrwtVMS6MSFTigLPcIx2V5PKIzKHtdh3GYC/IBlEXrS1UdeWYip6/sTx47o2Oc+o9lnP6bZp85q/twpLZw7rdnzFzR94oTy1hVMaum2mipPTurEyy9o9pWXdOT8OS2eP6vZs6c1c+K4Zs+d08ylSypMTEYn+kmnO/LCs5q9eMEVsHmyum44WtphGroeHfuaU0+d05HPfFwzH3tKkwvzGu7tq2EbEiyFBLaMje1sAo9ISleYf65pWODkCQcqEHWCNtI58Ab+DH5AIrSG4f9evmg/3npp6YSGx09qp5C2v8oFHaWQJm3wnunK52O75icGYOA0wOjRvwGS8i5az8UAFee2G6v2wUq3b6nx7e9q++vfUq3R1tlTZ/SxF15Wvmbfx5n09xuqGpeFA/sEmPMF21S01XnG92Yo3NfJFnBZgcQEG2jU/45u4xNlmp83gCMfaJt5KlbcczSd3763p6vLm2q7fdhSp2fLev7kjGYr9MtgW/P6w1z6YQfwkbBASH7qAzvklzUAkv7GZVGOZVE8YtDTdp9p8cDE840fvqurN27r9LEF/dZnn9dnnlvSpRPTunBqUXMLC9q2rLh5e1mzyKTJsuW2YWpji630kDPs/EEL2G6tjw1veqeGSOvUxsPw40LYrIcDIIfh0QOMzS8xCXtkezCb/3EMc72mTkxX9PKFY5qxQ5fr2fkMuTEWRg6jw0cphPKPOFLYjknJMuM1jb4y+zXDFiBq66C1rQ6dNnzXgU47M110DhoM48DpOEYALs4zRQtUC1peKfinPiipZuFZcT5F3+ct9h/dNczblYIOnL6XM/wdsxaUWVYvGO59WygoLRQWgjEtW3WmziK1hZGGop9hGjArl8EDtxPDhGjZ3Rs2tXOwpkZ7Vx2+LRBGi+8zA9hHOkVpH4EmpF9oJcEM4yeMAxvijLlwv1asaaowrWKu7uJr6paratUr2i4MdVCSWoZbLOfDaaeTjNkbQCpl7axoD7NRCuq1pR9+/3W1bMQMexZudgBx2t1652Gjp57RK598UUUr5mIh7e0fe/GjKHyMmoezgCJxm3Jp0GOQbYvvjWw11rUcAx/XtL67otZg105mSjPMpYESQzvoItWR8snUZQAoDLHROap0fJt3Am7GU3rXAQA5ATgCP0XjplKY0FR1TkdnT+r44lnVCjbQOnwglRU7wMavxGt+h4wfclBHuR6GRwxjmRadYnQlmDYwbANZgbAE8qAjMwn0WDRfFG0I9g521G83LffAIduaWS4Ejk2z8IPz7PW31O4sm16bzghc5mNQ0hRJN4azx4hJZlXQFGfIhMgLWsPATHE824TOvJDBOLSDpjK9TXX3rqu7+iPH7yuzc0WV3rZKzoPviSCxexzMa6xugtfMAOplJtUqHVf56PMqz3/MaabUQRC4fTg89h/8vmvoI53ENI5WIazimvoCv8cI6TV+DIsY3BvBgbbHgCTdOi7P8OK0NDDPN26o17imwcFtqXnPvLGnYXsU43zfR/PsTztatkXazlZEdbbjmrwGnaaGXco5UGdrW63dXeVt9NoFsmzrq1rOaMo6D3nR725q0N82fk0DPUvn9o7z2dbAcB/4uheDX8Z580A62HeTLEeAW9mG9PRJyxW2KOGDkcaxHa5v/uhd/dFXvhOdp+VyTR+3Y/6//0//E1166il98uMf1xk75u39HXX2tnSw5/rnLDxVc31LhhLfRLHssbzrGaTbBwf67vd/oG996xv6tPM5fmzR7egEnWLUVwYHyu7fVnfztq87bptlfcZOJgMNpmscnxjkcLuzfkanMts9ZEvTytWOmESh46wdU0ccR9NobtBQprkq7d5RpuP2It+gPeudkJbmj3zJuCwYx3Zo+70DDbo7hqFhx7ELbtyuvuHlfIaGYXBFgbnIrpPleSZn2PNnXA7A4328/uz4H3Rcrnl20G75vGH+5d6+69NyG1lV42eGEXt5hwPoWkCHrolDolek7YcRkPEh5x3GepffQa6otYOe3ri2oj176sM8W1xRQ546vdMy6EWHe978fGy2oudOTJiHGKT7cOr+4wIlQwsP66pUG98Jehs/TSmRCUlQxJkjMhOMWAaaThmsYIZn2fYR275N1quOZdXKDIoUVC7kVLKNUDQsSs6g5GMxjuyx7KN5hhV0BcvZeG5yHR/LpvmK362aXmtOzIqNqXJB07Z1Z+tFzU1VNFEra+Xett67vqztpvVBrqxupuQaQjvjgQ9n5hrHR9rNEwxA7O4caGJqQhXnsWZb5q3lHX3lrZv6+nu39c7KjnbskA9L9ZhF2Gcmro/IZLfYEEhyMhQNOB7BCmkZ97geHSGZNIRDHYAnZ37DvIg8y7OyzXBM93phGY4Hf9jmyrfvv4d8IbeC082Vh3r21IKWZieiQzWlo5WUljjFL5FrnPB7GB4jAEN42XY3k6MsPX0zvjKmA9Ptln2u7W5Pe72eWv2BWj5vdvpqOu1ed6Bt39syOrBsOneWLfcZZLYMKOZs67b12vd+oJXbt00HJS0ePaFSrWaa69uPQCsxAGK6we45xOCHH0ZyD7ZLEsScD59BE458f4Dtd2LwA05zQiacJYngBxnbmcZ9pdtX3dKhgn9kG4DhA6iIvJLNRceauRZfzxmj3SKMDk8i3C96dJJkilvpNhKRhfAFHc5c0oahZfTAsn/q0nllq5ablt8t216Ipw5bw05MqLgwr/JEXZvL+HZ9zZ4/q1yskjUs+QZm0/Bp29djVVt/qMamZfHOlmaOL8XgiRVFfHOte9DSweZurAJpg6f5aU0+c1GFI7PhR/M9zt27K2publvOuq6W02FXuRV0s0bDAr+0LcXA2/2GP7lAFaAf6pTgDYxt51F5X/foZ7BcaGfKas8eUf/MOTUnp9W2nR5vOt3DdssjBb/Me1BwrfOoAyD4Kj0VrWMrpot8v2td3lNtZ1Orv/8H0tvvacK4nbCMK9Sn1Nhpq3N3U81bd3Rw55a6d9bUub2lHIPAUzU1WWFkm5PBj5wLitYFf9E+/0SN0jXtDlocXX3UQrTJPBWBZhmXWFkMiG/vNfXOjbvaaQNn2yLdhi4s1PTJi0u2BVoBE1Y3Jfv0SbXfZQdSxthA4yXahbuwl9JTKAaa+fkHQBKuU3khj+Hz4JrxfUfD5dZ6Q99765ombDv+1ief1QXnNYWF2LM/ZphNT5ZVnZjSjXs72tpr6Onji5q0DIlvy5iu8aPwxVO/BCudqB/0luT1uA6H4S8GaPJwAOQwPFZIrIVgSTKR33Q04+FY9xo6vzipVy8cU43O+H7aFoA0YZCQ9CPGm1FdKm4ZF7MXLBQRiT07jL1M6gRnayQGCdZ3lrW5t6pGb99CiU6jJGh5P80E+GDj03UYcBG5ckF0+BF8zQyvcj+n2XxFxU7bBpYZ2M5Po9fWav9AN/Y2dK+zpz3HdndP/X5afdLN99QuDMLoo9oIer6hwfdGWIFAmTGbzw+Z1cXsYf4yfidb6qvT39P69h2trN/Qxu6yr9nGxcFpaRLvjCp8P6SrsdJPx9guzGW5ZA1cl8Ego5NLp3X27LOqzBxXcXpepcVF5W0obg7b2hg2XXfaT6csqscuuJWsAeh7wChy9WnOtFXQVH1Wf/6nX1dzvxnlsQUM+3KzkkbGzfyJSX381142bGygNg5UtZGUtaJjq6piha1j6NIzTLJt8T0OBkDahuv2PgMfN3Vz5bK2m/fsTBqnOdKAV2AJHE0JKNQxGEK5cgyVGcf7D8fJ7qcF7/dP4/f+o1BkWVUKVR2ZXdKJpTOanVg07suMalkBFmxEjwY/IvjN+y+jDFPehtJheJwQeOOI0UQXE3gGxPAznVZ+5iT5og1jn/Q7dA7lYzYsxiArPDKsJGBFgSk/XrDRQrb4BLmiuaHfUHt3X73dPWXaB+bzVqTNDtqmX8vNbNfGUMsU3vEzzi1f6YRyZBC0QCcVnVbml/xg37J3V9nepgade+of3FDn3ls6WH5Nvc3LqnTWVM42nbZnR8x1yZbNWtCJ2wYZmZ4x6rvDgnqlIyotvaTs1AWpfESdLNuqZN2WjN933Z0Qxwf6TvSLG0A3GfcYFPVDn6X46AGaNfUnAqYU0zODT8hT8u66+nyUlc/C5dpb2r76FbXvfFvD9csaWF4NdtfV311Tf2c1xd33Hwc+9h46xn2n57pvOTfcvut8lo0X0tsB2nF+eztq7exq185vp8nKDzrwqZ/hn++qXGirv28ZuXNH3R070turau8YD35/EHVZcR5ravm8u7ulbGPXjvWeebnpPCzPKxPK1SfT4G1ry7TUsngb6Jvf+Z6++a3vatDY07nFuv7z/8f/TZ988axKwwNlu7t6+vS8vviZ5zRdaGprY1n3dvbVHuT8fsEyHwfb9bLDlwbCDUPr6Jzl1hf/0id15vSsRd26ReS2jfgDZZrL0sF1aX/VkKUzuWtwM4A3wmToPXCDSU9ngKUfAyCWUYVK3bLJsLCMjNUjvR0/35Z6627nHee7bBqHJ5yT5TZ6B14hHwYY+oZFf3fD+FhzvDc6JrgNDMuh8ZSxPgLemSxbZxWgtPQR92bbMN9wOqcNnI3i+PwDxx+H/8A174On3btOBy6XjfMVNfxsZ3tDnZ4d5Zl55QoVs3NePQM0BuIMl4DPEwxYWAyAbLWGevP6ig6sI1gVgLEfcitskNTRnTrcs/EB8eeOT8Rw2wPN86QCMuNBGNfnfc5jNAQByz0CUmJEi45juyl1+CG3k8Obs8xgYI4Bj3I+r3o5r8lKSdPVcsS6ndCpSkETjpNVH1lB4jQTJdLlnabko9NUi44lzdT9Xq2oGUfu14opbbXAqqfk+E9MTarRzZgfm2oN85arppOiZS72FvIMRnLtYkWo36GjjW1F+V7I2k5fP7p8V999+5ru7rW1Z1pryXrGcpjBN94L6Dj9+Jtf6JfUEZMgFhNEwhbhHpDyW75Oq2gonJSmGeS4YcOKDwZhYotUv8u2qWQb229Gas7BUcLT2JaPDkfDPmceXprI64Wzi1qw8z5k1TcpKNN4SDjibfRnypHfw/AYAcBhSzjGZAR6V/NlNU13Vzb3dXlzT7f2Wlreb2l1t6HVnYZWdtu6u9vT7X3p1n5f91p0eGe0fu2GpoqWCvZXWJF8YOX6ze9+X7eXV3Tv3qbWVu+p6Of1mbrFtgtG7xFjNsghBj/0cJ93Ev+kDtbE42ZZ20nYSolPuf9gZQech+y0Tgi66alqu2CSDuFYyWl6sAwY5WpbAf0RUiP+0BsRniDKo42jIzEGWX0SJkVE7poVRrTJddfydVivaOrcWWVKZdtuHV3/rm3itW0drO2oZJlcmJwIW2nYbGq/11H95DHfm1Sv09fOjTtqsLvAyob2V2y7ra7rYGVdjU5XsyeP22ar2cYynIulmBx4sG7bzXbBnmE+8fRZzV46qz6rR23X2THV3l3bhhvbts+oKXI4tQFeDNiP2sBvigm3/Iww8KEH6pV0KjBO9cWGQ7JzwT4TfDevnS2qUbKcOHVOnaWT2sVPskxisAdlEu14nAD9Gi6g+5FXgPiPyWUsjaQfhW90+kJd2/G779jWbVkvVapq5ItaabV0d2dLqxsbure5oV3b/BvG1d6B/a+5GeWOz8f2Z+Cbpf9Ftz/hMbUtwYfrBLOYpT+6+qgGJv3E918Nw54bx7SIVneom+aFW+u7MbED26NqmD61NKlnT86ojM8cdgn2V6KRJxOgVcoeYyHZg0lOYIck/HCf8IscAAmryDzBdETKSs9SZEu1d29v6J0bqzpnWfPcmaOayDNI14rJ4mm1cValclnvrOzrvTvrevHcUS3Y7uyxWszwxRMbb7kW3/4YlYN/RfMo5zD8+HA4AHIYHjPAWQgCzhEJODYwIQxOB1lf1UxXz5ya1XOn55TrWHGQxkIEnRFixIbGRzFQawxJ/7iVVgpZK86CbZpMS+t7K7qzdkV3169pc/euHV9m4lrYWvmPRJXfRxUgkMe5pRCwfAgkycBIwjQFnGq2ispqOl9SxQ5KzobW0EK3Z8dktzDQ+rCh3UFDO60t7e6ua3NnVRv769pub2tfbXUGbQMfY6GtbN7CumgBYJuA72Ng+Hb91/HzQXSUNdUebGuncUdrm9e1un5VW24fAz0467nApTHpOjMYhDDBaU7OdmoKbR3/cQXeLbZj8GNo4d9u9zUzsagjc6eVrc5Kk3PKTM+qVczo9u6Gtpn1y+RlnHJDzS85HwQ8YQSbAByzxPN+kteVd6/o1o3bMWbCB4dTyX6/ktHnvvhJXXjmjG8MtbvPIFFbhWJRlWo5nAXgwCBWL9NWq7en7YMNrW7e0fK9W1rfXw6YMPAR05oDZkSqAC8kZUddUqHGn++gpO7XNR584OCfSD6Obs8YXuQFtcS1C2JLmTxbvWTTrO700XOiU1Ac6eLV8ftcx4Oo2WF49AAUE1ihbfA45l3oEXcwyUGMmQGdEdAdnbox2DhQv7OrXnPHlGmeG3aMR/LwC6ZpPqhPZyq0WjIe86bHQeOeert31DPtDVq7Tr6lYXdDme6WcnRO9Gwc+Z2cHTTkarbVlNr7NsSZ5b7l95c12L2uxsa7at573fEHUuOaKv0dG6cMorRcR9NvkCQjHvATdaVlA7X7rhMziusLys89pfKRl6TKkh3IWgzhIJfgxVzfPBf87owcE/1bEA4ZAEG+u61Beyn/Rw28mjrMxgFD0qAy3Bis8a/Ldv0NO2Z15QY2wpe/qVrnpmqZfXNHw7VhJjNbWLGv84NYcMyNzh8+PnyfrsZ438e8mnaeGMQiDfjNq2MxcHBgjs9VoQyzZ99yJKPJaT/P76nkPIr9rgoDPtrcVdkVZZVKYei8In8/G3ZVjAEt45IVZ05H920Mhhwsa8i3Wix3DnbW9D/9g3+ot1/7kR2/lr74yXP6jZdsLA9X1N6+rsH+DWUci83beupERUfma/rq99+LTizkT7fbkApp1cyAyQh0YNmAnqrm9cUvvKLW+tsqD1aUa9yUtm8pY/qR82IAho9Gx1aLOD/GMZhEh0P3UL9J3PdN76aboWly2Guou7+ijvMZ7N5Sf/em6+d4cMttcp7NddMfAyp2nJHnMA+DK4YHDkXG8GKAj42bisOe+QKHoOMI7MANg4JoEr9nOQiFsHKmYB2bDzpgYsAIZz7ex+dD8afhv+D3itrz+b5xTh4NFbNsU8egOpMGrHfLddXnjprnoHdW2hTM79A9bQGBTzKYi82/O92M3ri6rL2O4UPdjDRAfX8AJBDJdUaL9byePzllh/XJDoAgQVIMSI5+U0S3Urc4ug0pFdJhdAwZZLkAQaaX415yannLb9CpH7FvWmHg2NH3Y6WH05Ycy36/bN0e21jlhzKLqFbI+pyVHwPfHzqN3zEvsZbDrrHp1TRBZ6Lz4vsfdCpiAzOxgu02S9WKNnZbtgn5lk7RNlZoEyoYchd7Mj7IyiomZhA7r/WtXd25t6n1nQM1+9Ye5pUBnQx5DCK/S5nIYh+tZOKcfFjxEvcpgWdsNcdWVuap5FBT6hjOjjCzs8u6XEi3jz7yPSan8O2RTBZn28DAyHXCNKswBWYuY/+wwphAXXL9ls7OVfXyhaX4CD1bM1ESU5/5cD28Tf3h29QBkfJ7kOth+FkDMKPjzWRp2GaiY4qZ1js+XjPdrFn+NwtltRgkpnPQx5ZpqJEra8+xafz2TIB9+xG7m9gXbU2Zrrvttr71xlv6H3//j9V0XnSmH2ysaXP9jiYWZjV39ITloG1m00VMajoMTyCYF4N/UrBYMm+ne/AkM/E5kgQ+jwEyomkFD31ofu5bznRtdyD353oDVVkBNJpcAp8jOen4g3/5Q3ZgOIZv6ut/VQLtI/BLm5Er1A54EJl93TWjZCZqmj53zrKuqMFeV+tf/6EGN9aljYbT51Q9thi20dA29drOpiZOLKkyOaV+q6fNt65r781r6q5uaW/L/vX6ppo7thHKZc2ePKncRN3AtW4qWU4WcrZ/9rS7uqH80pwmX7ykwuKcYUlN/Wf7e/fWirrr27YvqCmQTm0YDzCAuARltyGOD9qYEnz4gXqgXqkFdnis/OhTs0y0LSbWmF7282V1F5aUO31B+9UJtQ1/mhmD7uibxw3QJXBxFo++BVayN636oyOfQb0edoT5oGfrvLp0QsUTJ5U/sqCp08dUPDqjyhnrsDMnVJqZU23pmErHjyp/YlH9uYmQm2Yg2/dZ2wApJLxRJhjlylTFKmiIkmsOH8EQEytc92yOwQ/giXWTs01zoCu3lmP1BzZnwa2eL0vPn5rVuYWKZQ52vtPzeuiJJwWAqICPqXwkW3Bi3IMGsC3TfcIvcgCEVb4xiOyy0p1kswXXuIyb6wd67/a6ji7M6OyxOZUtqNl+FAuSlb1F01g+n9O3LKdu7nT0gu2qYzNM3CWzZGeys0Ra/eF2mMbxrZKFDFcchp8UDgdADsPPEcbCJDE1DDcWJnz/Y75e0Itnj+jUVElZOu1sWLBkuo92QBik1z9yYVzv7tBKlw8OFToWlPd0697V+BD2bmtdnf5BOOLxke48ItGCEM0bcAJeCMkEufvhA/CINB94HKPB/azVdUGT7Jc+tDPte2x9tTZsayffU69kPORdti3dfoYVDE0rqB2t7a7p3taKGnub2jtY135rW63OnppdO9i9hlq9A7WYie64393Sxt4d3b132fGKNg/uupw952thGx27SN9kSPBHCCXp8OMGQMZXtoCS0+wrIkvr8yo6llXO1X1dc5q87VHX92BLLbeJVSpi+zQrEb8RyhQ4WtzHkZCc8ozT8OH2ijZW72l//8AGCoaPadIGyLMvfUx/5W/+lipTdCC4GOOmaUN372AX39zGa09tw6DR3U0rPu7d1u17N7Sxsxbf/aDt/azrw/Y7fr+Pwkml+98ZhBL1X1SJM05GSoibARfi+DCq+wciPJRCuhO/fhfyaVkhHzSMo3bHOMiqUqmqxDJclmc7zQPY+5gq4nvUgXuH4ecJ9+GXSXSHwwQ9gnceDuw8xgxj00JsRUFHj2mMZLGlDh9ENz3HyjHkpI2gMMAyRb+H8chGbm2ToWWH+bLf3lK3sa7G1h21HXs7KxruOe6vSnvL6u/d1mDXceeGetvX1L73rrorb6tjnqXzWY1VFTrrNqC2VBocRAcyq0SCLsyDYUE5xsAFnWO0wQZuK1NVt7io0uLzdgpe1LB8zMZ+3QaZjUJIyunyljlpVhN5sQLK77pdfIA3BlSi49F8G4H2OsEjhqDbyMfBZaFXMCKpAhKVXFmObgGBuPO1+WLlhyr1Nu2H+r0e361wOgZsLUNiRc3oyHYu/7JjdAxG6c7LecS+5zZMqUAuUzIPZixjbPDSCe97A+O2UumrXoc+9izV7CKYBHBoCejH6OAfrQRii5mcmTrbM5ygFepM+/x6t9UwflfVYSChuacrl6/oH/2jP9P63U29enFR//G/8wU7GIbw/i31Gis+mh527tqpXzOeD7Sxtavf/8ply31aYEg531KeGdzOPD4ebpcvW9CxuXn1m7v609//Xc2WD7RQ7ii3vxHf2Mh0N1yttH1bdCREPjiRhslI1nGPrSDi3PgaDFpqs+Xj/pr6B/c0OFh1ndyOg2W3aU3D9qay1i90QAcm6YWnw0WsfnFlKSuXHI3UYeu8yR+4xSAJHfTMKHNLonfHPGScMLDIljw4FnRIJxin778A60fBf+Cad8H7yLkIngc3QYPWu3Xzx/QJsb1YrjDhuheDBpKjCL4Tzp9EgGJx1vZ7WTtvd7Xd4RrpgsNnfCGvXE9AH9ui+MlcLasXz8yoRjufXNWj7uOQqgGXc86Rp+PjOBJGx8ARbRzdQaCNzqFPjqw04khXf+oMNJ3Bg3ZcGShIA3OW4z6H/sLNN03Rcc+AAitu+dbQ+DpolLS2d2OrKJfJtoSDPoN0PqcOLrE+YTunUDJf7qvRbFucsfWm6woeqJTrY6vCNgVY8jsjO9klKZMvRRzaGcY2iq0o4AfXPeoQ0Y1xXpwH3ca5NZTzY0YzKzrg1pAvo3LZEg0Yhy1nmuhZDsV2Ya538BK1coI8ZfsYMPQx1RZ5D3Ty0elEacg2Bn7K5p2njk3p+VMLyncZ2AUGSX6z6pA6OqtoZ+InSiJ3cj0MjxICH/A0uti62xJOTcOTFR/rtgm7prme7wfsgTj4N+yZkcq2uWF/9KAlZ2Y/ZeXWTR2bmNDmzp7+9t//+7q1uaWe8Vr1s8V6Sevra2rlizr39MvG28SINpDfh+HDDnAVMXXiwd2JHuKu/5NNltIgH8ZblcYghokgOjH9sG1/Jm8ZOGM6qPMq+i50bcobSUcOaYUJvAuxOBMI6QmFaOb9YOmDgHKINnPiegMLOqdTO6zd8679ZFUzZ88qW6zavu5p663LyjVtK9jmKM/PqHr8iNP31Vnf0Nq9e5o7fUKlyUnLaluXO7saNJrKlWyfVAvW+7Z1mQg4WdP06ePKV8vqdrtqdlqq1moaNp3/ypomL5zS5NNn7VN3bKukzsyBZe3+rRX117ZUdD2RfWlQKeGH03TlgKz2X7JHHdyg+88+5EC9qAedrTYvfO72G+honbb1Rt9wZJD1oD4tnTmvztxirP6wMjRKks5JOvExg/NIOuzRB0DQcSEHrbf4/hdyC3+mXJvUxMyCppaWNLO0qMWjc5qu5zU7V9PU4oxmjyyaDs6ocvyYimeW1JmpqG2/jvLy/ayKzpOAPg/cQIOjI9Ett97zyej6oxhoa7TFsp9BdiyPtvXLlZvLWt62v5orQ6Gm5baOT5X04vmjmuM7iD1rpAAPDR/HJxHAzYPyE8VCF1wnukhPQ3rE9S9sCyz/B/qhXb+dbDQg6tJcxvJOR9dXNjU7NamTR2die9Xwe1yeszdtD11CTt+4sqLNRlevXjqqpYmyeu2WYQs/4GfTFmjSMikobmxPEQ/DTwphfx8OgByGxwsPmCsECgoghImZr2+hMF/Tq+ePaa7IrC863qwgLQnCWQrB89EMdFzyly1LzeGu7mxc1fXVd7S+f0dN9ivP2aBC4dsYiI4aG5YWTyGs0tJiIoHfdIaAfBAeCK6UAuFMxIA17GzU1Qo1VTNVFfITGvIBzGJJe6Ws9tiyKctCVLvTdjbZ3iptv2VHnUERG7u97r5a3T3tNje1uXtPa9vLWtu8o7WtFa1u39Ht9Wta27mlzYNlNXqbNnQa0aZBxo479bKR0bflEB/SDMf6QeUfNm5S3R88p424SolMDBcbQ6V8RZffvKZvfuW7un7lrm7fWtXd1Xt689p72j7YiT3h2VM1P7TR4j+KjxUVGDRRF44cxvDJ6Ojikk6fPK3tzW2trtjIdF2LpbJ+44uf16UXT9lQNQacBx+cY8VHq7WvhiODH7HiY/2OVjdua6+1ZaXXo3/aCt4GX4aNu5h57oZA43QGoghdBTcl/ILYRoxqjes3DmOwxEMOiQZSHGN3/JdCukt70xVGZ9Rj0FOjcaC2DW06T4o2xFHH8Sb1irc4H5U/OkY2h+Gxwn2Yxhk4BKY4hhgc0JPxaRnHzqh5eGBA55APpt1CuWIHy4Y53xmg8xfUYCORTa5omVD1dd6RTjQ+QmonKeeYbavAJ4z7bceWCt0dZdrrdsLuqte4oe7+NXV3r2jYuqlh+45ynRUVhls2yPZVUSv28y/xrg2kmHUbROp6un5sn4LBlKphWVbkyyEZy7OyMhNnVT32cRXnX1GvcNz3a6Y9utqg2WTMs+1F0FPAgdlgzt7woNuMJ/c7jiPVOD5a4A3kDfBOxh11pv6GvI1CHEVkCPXnmyk5w25/5bKGnQMzog1WOubiPbTTuKvwZz2CSRv7hiRb0QScLM/jPjNsMoZwO6udrbaf0AHo+hrO9Qm2vCn5wvrO+QwHRcMmbxkalOH6MGBGqwxt5Ccv4i35OSHxvA1tO8iFDJ34dEbk9KUvfUvf+eYVnVys6f/wH/4VvXTpiJ2NbefIQEvT0bLAOpfvFTAgsG6j+g++flXre4aa9QMDw8NOX0em6lqcdFkHB5qt1HV8fknvvXlVa3dX9MyFaT1zZlGVGCAxrWYOQl+xrUpsc2IZywBIGNimb4brGAAZWr8h2WNgPEeHccv0ZtpzLDoWBk2/0XRbXUexOgNKQ466bYwQ5TvWIziwfLid4QtWdTDbHf3J1k3pPO1D7iOdx4NSrLiIreGyLs9HPupKj87Q9Uy0/ePw+i8/Mlsrvq1gmFGPXswQhBZK6ppX24OqBoV51WfPut6TRk/NOsbgCZnukyzweHIB+dJzGw4Mh9cu3xUkCg3CT8E8RGQPDDTSQzO2ZV4+O6/q6N6TClFHh1SrpNWwF9OT8dMHIezOSEGdaRSywvKHNo7f43r0Lsf7ufmHc+AFVcdgkOUu5yGjuQcsgJFjmpk7OvfL43QMJMXKKKIzJM2A1VC2L1iVhG1C1abYDsrnaxvbscXVeIsabCjsyUgWeZOH5YBxOI49+I/a+jmdaLSXdFF/500HHrZIxFRzp3W+lpMx0O73IFK2Sop3XG5oL1+wSrbkRlQLrKDqKG9dM2zumxP9nuVQWrVNng6jAzCGJ4M3LB+du/ke7u1arhT00rmjOjtnvdezPuNhyGJ0B3U3j1A9/8S2sK5JwDVyOQyPEgIdxk34GcZTx3ZGwzRw07ZvwzTD/FBkNCuUCrYvGIACT9Fp4mN8A8KyoWA7pGsf4dr1W74ua2O/pf/6d/+pOtYpZ48f0b/1m7+uZ88c0/XbK8rNndDTr3zeerCsTpcJAK5FIPkwfJghsSLyjogcSNItTVCAP5NUJCV/zETnCB/CbTxkK7MOgqDXV9Xv1S1H2AYxFx2X6W3oirzZfSBW+44mgJHXuBYfehgVHZ2KxBH5xRYwXPCMOru6UU/DopN3uyeqmj1/zvZuSf1OW/fu3tKAjz3VK5q+cMo271TYEc0bt7W/va2F0yeVrVVisDBTLao6P2nbeFa1Ywuqz88Afe2Zr6aOL6lYr2pnY8vv7WhqdkZZ+50MQJeOzaty4ojuraypv9fS9NR0rLhq3FzVYG07vkdBR+q4TWmFDmwNrtI9QpyOzkfN/dBD6sRNuotBVCZBxQCIKwx825bzzUJFmeOn1Tt+Svts9WhbKvUVGDf+Sxr4MUPgG3n3OAMg9D8BZ/qjLP/sR3fpsKYdeVbI9u1b7Wjn7lVtXntbO3eua2d1VXt7DXUKJbWnatquZLXvdrJyqmC7tOj2wxKhy90s/KDAmUP6FgMDhw908vjZRy0EzH1k8COXtx1s2l6+t6kr1gexJaf1ByAu9g5C7794YUnVnG0NJoeA85BFCQZPJiT8j8uHhmkRPAa3gaf0FIoBh7+oARBy556jiZbiYlWugRX2k/3U3W5GN+6sq9Fsad7yZ2qiYv8funEOls8D21jv3tnSazdWNTU9rZfOLGjKcrqA4Wn4Pmgbfih+JG1xWS4HqKc2HoYfFw4HQA7DLyDAbDhWGB+wXNbKoa8Lx6b00tkZTdqgYtYc/W98VHu893G8lzL4CAULm1xfw3xbe+3NWCFw89417Xa22cPGBuXASpa5fP6zA0y0lGICRDgKMVsKYyBaPo4cfhokxumcSSxtK+rksTOamTimUm1Rhal5G26LdkymtGoF3uRL4Ax4oJHCS6Y8R2b14ARZcMYAgA0BIltf9Rk0sWE7YBsWPuqddz1zXCOoR0LUeKNjEYfV+j8cd4wHcImjjVAfC31C1Bohfv+e0wfuTSMoA79TtbP1zS9/U//df/n39E9/9w/0P/+D39M/++d/oK9962va3N5QuVjQZK2mcrZkYyvVO80YTuUBt+h48B0cPcor21gp5ot66423dIdZNtYRbI9VmijpqVfPKV+3Y2i8gKeYYW749Ad8rH5HB80dtXoNw8JwKGDoAaeeKdjpUJJWPKkTcNSuUfmow6BpquQfIs+4en/0/TjjPIV49wPxQfBVtDPRFgMgwICBmE63rSYfUDYcJycmjQvDduTk8F7kw+tRn8Pw+AHogSXHAC0SzpGVDtE5C1bNFaYjtj/J9IA3xk3ezqVTMoBXrIaR3e321W02TMvmQ5wqoxZbPOgCmjPPhZMJvTnGrFonSt/9aDt/R74FkqGzu6dS3rKVLYFie620wiNrZ4CZ7sxIjtgnP1fSvBsdUa53dJhEreksdZ1sZHXys8pOnFd54WWV5p7TsLCk7qAUaRhkgL7pDM9Fu6FJ5L1p0WBJHdSpc59uF+ADBcIZP48BhuOCc5G2vgMHFGHnw0CPq2BFapcNHdO1/MsUyuqXp9QpzUiVIxqWj6hfciwfdfwZjxXH4hF1C4saVhbVLc+r52OvvGCHeVGZ0lF1VYsVIL0eDhHOl4ubnlF98ZgGZTvHxTmnXXBejn5/UJlXpjxnFJQ1sKEc++LSAWi+lWkjVggaX8CO7vhY2WAa2j3o6h//kx/FQPq//+9+Sp946YSqBT5sv+3XjOd+oqeETVCT1cp2V3/4jSvaOBhY3peM5K4dkp7++m9/XH/l189rrtzT+eMLse3JtWt3RRVefeW4njlvI76753KdHwA2XrNM9RuJ3PsBuQ5ZIXMwxKPjISXynUBLMvpNCzicTjLerodhstj+0u+w6WLP8pWsB7mqPaglZWunE/xLixoYzgNwAuyrxoPx2fe9YX7R5DwZq6rk9kNpvUFZqp6Q6na+A5cP4fNnOA44kr/L7pWXIg6KLsv4HpSM91Ecul6F+kmVp08ZS3WXyyCJQWV9oRjIMc8FBJ5EcB0MZwZxWsbNa5eXtd0xf5iOxlvVAPsw/F1nAO/kmrS+f9m4r1rHRKf/Ew+prkha13AU3x/CpuEYjh7yiXqj/3jnwXtxexRoGpcRfYEMJAK3RO9+531xlBfHsFt41/d9xOSJa2Qp/GC4MgsU26JQKPp1vwOPh91lOW5en56qqmGnemV907rcz3N544py+CfnQRo04YZR2WOiieVqsjt8j4JdRnTaGL9JjtN6vh/i86iv38cuo+aWJwxGFqwTZss5zVayWqhldXwyr1PTRZ2bK+n8QkXn56sRT03ldWLKNlcxq2opp26PD2ZbQbk9aXUK1Uj6j/yBbUDcbc5bILBt3fH5CX3i6ROat9ih0z1eMv2BLeRaTA3wi5ELMI0cyI+Eh+FRQuDYMKRDruOLtmlqyzbG2n5THaG7+UaHZTj6MokG3kiwR0aZ6Ht8o8UPKqaNK1fvar+b1a7Tf/cH31XJvsR/8tf+sv7jv/5v6OzCvLZ6eTXnLmju7HPh1TGAZSIj08PwIYbE20nmxeQTy56YjW9UEEmB3TTuRE+DI/yNeA5CQDfbrEJXxLegfMuWiSZ7HdXsNGXDhyQrPCvnnXL1D/dTXpEn5x9yTP6oa+B2IC1D2nEf8ceRGltOxqAPctF02sm73RM1zZ47YyC5NTZKqlMVTR+d19yZU6ou2aYo5tVd39LOm++q12xp5vSJ2NoqWy6pVq05/aTKc9Mqz06pVLGdub2nvcaepk4sxUqR7bV17azd08zMbExMq0xPqjgzGXyycfWWss2eZhZtQ3Q7aty8q+HqlmEORxquEVJ7iOmboald479oG9dPLIJ/VzP0C5MqfPQ1H9qHBpvWE73ZI8qdOq/GxLRaTFKxD9+3DhzYnuWbWPF++nn0YHxTD/Tuow6AoBrRmchCyD+fTzq66KqU7Uv37tzS8je/pds/+L7W7txW+6ClnXs7Wrl2RwdrW+YRt3hqQtkS330zhTmPmAzmP2x/domMARCqOWpj+ktn8GFcfBQDuDd+2WhiaJtlr3Ggd6/c0J5ty07W8LAMYZC9Omzo0tKEnjkzp7Jhi61vxDsD9HswZ2T34QfXI5CSykeOISWSb5pkYnqa+JDrX+RH0JHTvJdKSxYbMIsJCsWitnYOdPXWirYbrmehav/SudrnBb5vL2/raz96T2tb23r1mQt6ZmnKnierjS0r4CfnitSIraedJ4PAyGi3KmLUIRHkYfhAOBwAOQyPFRDm4whzMasIZwvnC0avF7J65tSMnl6qqcJWJChA2NEWF4wfTlww50cpIETp8Gtos3FH11be1crWXfVydnBLdiQslBgs4PsYaNjwDYjIKN51m1GcCCSUOMf7Ma7H8KCcJC7j6UjJJjOPzIo6euSs5mfPKjt1VJnqrLLVSTVc/u31FTvhODQYfuSc8sFQZG4tMxXtU7ueGM0u6X70zRjwoA2sGkE5OA1YsiAeusxYCoHTQ538zrgNdORR56CFuJNOxqsyRrejHTwl0BlQdKzkSrr+1hW98f231Wu5FPYObXdi8OOdd97WlffeUWuvwaSjaH2pYqMrn7otgFlUwfeZ4Zw3bbVstNy9vaIv/+lX9OU/+5qvOxp0XUc3uDJZ1Kd+6xUNi8bUoKdyqWCFbtp0e3MFqz46j61D4uPwhkN07hJDWfm+2zMw0OhgTEDzTQPDdkHAFRi7oKDr1Epq/HDkFvVOz8cdCYSEY07iMg7piX/jnh0deyjs389MafapZYZWp9VS385KyUYZH/GjUz5mnKYS/EdZ5AGORpkfhkcMwBTYGVth+BhvQfOcp4752O4uw+xK4ybS5tNycMsCviKhfEXF0pQN8KqGpjn1950NgxTQjTFjGhwysw76IFtwh0VN57Ppj+dpQMPPI3LbPz6NuoFiR6gs+PLhiJcbAx+OzNw3H8e3M1wwTks/b2OrOKfC3LOqHf+kshPPqjeYdtYl5e28sLUTHfPQMJt7hQxyHWK/fZ/GzHzgEOUhe8xHrl42vgUCzHx4jBDNcsSRT84W+RvOLjttwWXK9jV7Effo6LHBWipWVZk9psL8KbfnvPJzTys3+zHlOP7USJqnHhxnn1Z+9qKd1/MqLV5S1sfs7CXnd0mF2fMqWvYOspPatIPUaltewnflCc2cvKT5pz+hwoLTTV9Qwe8V5i4qP3NWxblzKs2eClnNDPBOx7Kp7/rTDtedFWmwbhooB6EY3RXrmKblYVP/xhef0q99ymUX2gb/vo3fpHODdoCX8ahiTa1uVjdWD/Rn37mm7abr5j9WXUzkO/qdXzuvv/HbF/SFT53WMxfP66233tX1O9uWiVl94pPndP7MvB3yNIDP7KSM5X6G3n3XB7WNYR2Bi5CFTmnUExlIM7KU7ZdcJzpnufZ7QQDoDYRrUKjfx9Wg84ZBeHQnK2Wmla8/bdi9qvzCCyPcXVR2/qIyjpo3HuafMjwvqTjh+5V5tRsbhmHD2RfVzc3Eu7kjjgvPOe0zI9z+LHGM93TMzzyl0ozLmb5knBnmM+eM83Mqz5xRceq0ChPHDOs5tQeGlusfMGB7xEwrgScBK84/3GDZ5GJ7psduIacfvrdsJ853TUt0mge+7ttfxgTXjhP5vl49f0RV85NTjfJ6EgGYpUgNH1yPA3IXncbAAimSI5scV9LxDt1HxPSX7qUY20eBLyJ8ZjokImojFzMgXfTJRXUcp3UMmseYg7Y5577Tpo+Rc+28KMbHHDLX+VNHttMqINd9XirkVa4VY4b91n5HXeeBZKV6WM50IkRTzDNs75e1XAgZiKwfgSG2UKQsv5Q25EL2Wj66HnyUFXuAb4LwnZLZal5L02Wdni3pmZPTeu7kjD5x/qg+/dSSPnVhXq+cndFLJyb03NKEnj5S17MnpvTcqVmdPXFEc7OTUb/b6zvqWBawioiOJGrMisKIDHz4SN2zph22AztztK5XLs6p7HrEHuDQXdQVDUJaZBbNTHDlmHD4JOnuoxkgCT4sHHi3rdE0rG/v7GnPMpsVa9msbcIBcjwXtmHQrmXtAEMX2e7rQomVfJbO/az2bINf3WvrwLiem6jr/HRd/9Ff/k1Nm5Zyti/78+e0u/CUmuXp+F5NP/TPiDB/xQKtHscPBij5lwmVkH+UYrxE56vxjqxjtvm4UzYGQHyE2dKzJDOSTLNuxk7DaER+mD4wNfP21ee7PU1ZXrHxCuWw4wA+BSWE/seXCJyHsHP88EOYFA6jFsYRqLuq958ZNDEAEtLFsrFnn2kwWdPsedtuZfOAbZ6a6btYr8XHz7Gtm5ub2nz7ippX76hg+p48fdx2wDS5qbG2rsbtZXW2ttTa2lBvbUOtu+vmgYGmTh1TsVpVY3NH6zdu2Q4tqjY/pWytrHytooPVDd174z3VS1VNHV20Od1W49ayhmubKgNOwzkGpRw40ISxbko3U3tGV08muGL0E8Rggukl17cMcYX41gz3mATQmZgabX11RAeFStiQ2Oj0EYQWCF1AKx6zJZQNXAyLRx4A4Q/ydT0HPfQmfDBQtddSafmWNr75DbXfvaq5cl1TS8e1dO4pTU4uqNQaqLi5q/2Ve6rXpzQ5PWt7HV2b8kLvUk4/b5k7ahY2WOK69Ed/y5guP4qBqge8WGHY7evarRWtmB8GxnHHdj3QRdfPmZj5/seZI+YZ+zbJkko2ZkwIiZyeRABZlJ3Kh9+QGYm/4LOQbnGfwPUv7CPoPqR3fOIYNpD1ZpLF+dgSr1wuacd09t6dTa3Y12Pi2srmvt69fU/fevemVnYOdO7ovD556ZhO1PIqDFqmYZcVehyhRx8Fctz+PJ1lIx88fC+qkX4OwwcCdHk4AHIYHjkkQYHSDrUGJcWIJIYU3yM4OlHQy6dndHIyH9uwxH7DLJOzUGHbEjrQUBJPKjBQgTAaC6kUrB3dGmIothCKdhjcNjomh8yKzbUtjG7o5vq7Fo7r8R2QTPTr9EczeEeGKRoaoe9zTtN+zy4JQxVBSP4uKdWAM9JSpXRMxs7708QfHrYdmte++5Ze/8Gbumxj7Y0fvaHXXv+Rvvn97+rO8rImqpOqlmoq5UupHeQd+dpgoFrRIQreolhqGOcxSh11i//0Ywcpzf1xeucFHjGAY5Yo/4FL8k/1A2LE8d/YaCNGiHJ95YqEgLbTtWrD4tbt2+rhTNmYanYarqPP/fL21r7eeuOy3njtDd2+fUczc5OasWFZNC1Z74Rzlx9UdO/Whq6/fUff+9qP9M//8Zf0za98R43dbgyM5KLzd6hGb1+f/8ufUnWyGPUi8JFSRtEZtOKcpbpunBWLa2+FR1V5Nz7y60jr0uxLH7kGBvfh4OTAj5YZT7Q/zuPoGDggkmmCT3rGJc/jNMD+cIjb/PhBbLXhAtNeqty3A9TrqdVqqlqpx0BIKD1HVoTQzphpnhKT02F45DCCXYAv4XCMSfAbhh24Nf8HGk0XdIzhmKZZsza2baAwE79oviyUY3MRdTvOh0EJ+AtCSlazecO0RMcx+drgvB/i2vg3XlM5Po+YXieOHowiLzmvWALldHkGCUqWWXwG3cdcXd3irDR1RrWjz6u0+JwGleOu85QG7OlqGmeVFHmQNRnyR2AAMjlso7JGT1J3FjIQHhjxT6R79EB+9x0X4Bx/5O9n5i9yZYAy2hZOPDyZV7ZQVb8wYTHpdhRn0jHi5E85TjuO3hldK2+n2PcypWl185PqFyc1LE47/wmjpaZeZ6DtVTvFB83oVMiUa5o8dkZTJy9EumF+JjrJ5fOBYZ3J1/1uTX07ENvbe2q0GbypqK2yuj52MwwClA1/PpJcUCdTtXM5oXx1Th97/ikdO3YkluzTCRvbcw1LLtcOyACcVp1+Qs0+eKvp5r22fv/L76lhJyTDoKkN5roN59/8wsd18vS838tpv5XTn33tu7p2Z1eVelGf+czzOrq04LaV1OzxBY2a82L7L1No3nhgVSC4DXo3bi03Y5tFBu5Cd6L96WyrRDtajh0ZF460pZl1Pd22XsbtdbreAM2SU9HtgQc6g6py9YvKzz0nQYeFWeNvynCfiDgw/JWfcj2mlGUlTaGg9sGyOu0Nv81AT0WFmWeUmTD8K4aV8fYvx/sDfI/xP/T1MOdo/EMDAu++J+5zdJ2Ghbp5w3xsOKQJD+j/rmGDrsgHfSYK/nBD8KAZg1m9HePnjRvrWm+4buAR5W8eic57QxxHDH5Cv1Vyfb189qgmClg8hMTbY+4bh3TmZ34nzkc/SeX4xzGl+fnCKHdyHkX+xueE8ZFAuemYrIp0fv/3QUIH2jX+/UCIuvuPY7TF9yJhgkXKZ3wzLkZpuTIkuWXeQIwPut1kD/o+dgId1MiI2FqtVNK9xlA31/bUtpJgAJD34nsdjgwRsOdz2Gr+SfaH2+ajb4BBDZEDgSlzju8VGWTp72uq0NWxibwuHKnruZPTeuXCUX3iqeN69eIRXTo2rZMzNc3XCqqbn5ndX+i1HJviw+XMR+y12zFLtmwdlbdTvt3K6sbKvvkWWYMMhlN7UYc0A91n0HqA3W10vaYnKjp7dEqTrCYyDNj+MWbM8o5blzoInJPbFJ2xvpPwGsA+DI8UDDczfHSwmbZalqk3dvbUtN3bHY1MIw8CtpmYReQj9AjRJk7HX4vhaWzKUlnvrO+pZfv65InTunjpGeumstYtW1ey07pdWNRqfs7Py34fO4i8IfyPYAjbYtQCaBgYcm9kcyDUAFOsMqAT17ET+s9qwbwYlhtH+Na5BHuSn+0mInrzvl1PjFzTxYOOqccP4a85E8ogv/BpODrf+x2utIWKOQSLOm0kC6JA9nOfyW2sXfbBtmLN2rloXZ+3D8Y3kvJ9ZnczSEaLGXCxzicfeDdiqkOURx5RrvO2zzyeSHe/5YYzgzQBl6hJCqNXUx0/ECJVenmUd7qZ8ERIuSNHGACJm9R7pOeQoy7VOt2Oep2PoJ+xbeBnto12L19T3z5mc2NDByurWr98VTtXb6nUtoU1UVONb3tM1tXZP9CdN97Uyg9/pP1rN7Rz/aYObtr22N5VdqKqidPH4hsgpFu/cl0F24bTRxaksm2BXlebznPtvauaXliwfXjEcrKl3bsrsdqEDQSxgFjVH3A07QDXsKR9fBBG7R+1OuE3tT7d81kC9v1wnwZ8SHKAM7c98k3wT/BNaSIdqSLtKPoCeordIHwNnLFxYgKSdQAwb7tiTQZIj51Q13Jj175o2/YetgYdtaw2ZVsf+kEStzxmoJ7AyGU/6gAIwOMPq5NJYMCB733VGrvq/+gH2nj7HU0uHtOZVz+ppVdeUfXkKdWOn9CRE6dUMLzWVpbVbTc0tTin7uREfFsJ9wNYsh1YrFR3/sAlVmH5MrQet+MywfhJBUofl09dsBuSDBnzMHrB6eg3gAajP8uywMhjchZaf5AvanlrT+9dN+2bKLr28RjmgJzYeeD4ZE6vnJvXwkTJdI8l8wBfwP/JhYT/QEr8JlwkOZT4LT0Fodw3Tn9BAyBRYpymUhM9ctNlIg99v14vWzTVzCs9tRo7Wr59XbdvXtfO9qZKhazOn5jX5164oPPzldgOmwmJBetqVuiOy4jBJhNkbG8JvUchyMCfg9/+NQ/Y1IcDIIfhkQOqMGb+IwisdHBw2OYCZmNvzUuLZX367Lxm8zZE7Jz1MTBzo48p+j0GSyL5EwjIhYghOELdc9e/Fh4+WhzGXX65k5R/1+bJgXYOVnTl7hva7mzFyg83zm1CUaTOz9SHmdqWcuWEM4yO8V1KHP+lO4Q490/o6oee3T+PzKy+uwX95//3/4/+67/93+v3fv+f6B/+3j/y8Z/qD//wj3X57asadqywWjbWWzaojBe22smxb6VbE4ZxCMWU6/gvrkNgckRgAgGOvEDBCNaRgH0ITqnND+Xx0F8Y5A8FUlBEfNyJP55b0ZbKZU3NTen0+ZM6cXZJ88dmNDVTV32yEoqhUi66/nm12i2dPL2ko8cXrZRLafCjV9LG3V39T3/39/R7/+AP9Z2v/kjry9vW28nQpi+5UMxr4ei8zj19Uq9+5nk79qmuroLpECcRW5i2QMvjNqfnhKAQnye8OB0V5xkGhNOlTpDxu6P3H8J1hEDeOD787KE0o0CKDwbgiWGV7dMuX8crbhwOhs/a7XbAtVqpqZBPfMbMQEIaLPEL7y/mMPzMAYAnrID/FEZ4C0RwD/rh3GYIRn88S+ljD1h4CvyZ3nPFmnLVGR+n7BDYfKITzIyJoxZpjDfShXEaBg14hGd57kTI3fvV8Mn9OhCSMUf50VUWdUgrBGKHdpfXZuCjtKDM1FkV5p9R/cSrUs1OYW5evUzFsi4fxjyOTaIuivBF1CPdSQ50PIlDkJdvIf9i4CM9dCBdyuPRA3xHPsCPa35G5fv2eGu+4EHfjA45wy19+4PtP+xaui5jif7T41iiPUif2mBYGnd8UyFtRePovxw2rh2wvfVNbW9tJafVDuCcnb/6wlF16Oh0HfieBSPkrEALdiVv59ftG8YMsNSMh/qiVJ2P86HjoLqo4cSS7x3VsLygrO9BL9nKrHI+V2VRWT/juapLGlSO+XjcODyuQdl5led1a62pP/nGj7TJRzst4lgtViyX9O/9r/99zR274PdPqKlJfenPv6Xbd7c0YSf+f/m3/hc6euq8Mq7LoHZUuYrLrkyo32s6g/G2akDK+IUEDe+YgESHiPUfdJ6nzYOi2iXT0twFt+eEhtVj6k0uqD8xq0GdNi66rUdjICPf6VqGs32X8VaYVIGVN9UzdjYmXIQdauAfMg5ixGFFXjPz2OdsRTnYVPtg1SkbfmYHpXJW2cnTdl6qCWe8B8z/pfED+Pe78FE4hcZ7iuDUZftImqAPPGD4kZKgRT08+EH8cAO8AGvS7obrfnV1Wys7rXDm+j3XOsdAiOtphmHbPLbto42lTF/PWK/OVq1rQ8ePYD5qB39uaMI/dkA8pf3pOXwYMs+RZz9vSDl9MHwg30jwoPyEr/u3HJ0+0vzF8L5kEVMLH4REETQvOto4xr33H1PgGAl9RFbRJYA9mGRRdBxYN3d8vmdZ/8bNHf3w8rq2GnZU2YbDTDSGLx0Q0BcyOHJz2QFnBzqRyJvhc/XppLSc67UYXtSRmnRuNq8XTkzo008d12eeWtKLJyd0erqgaQurimtRtoKJPbmjfpw7kqfzZhYz8n6QM89kS2r0srq12tK3X7+j9V3zJzaFE6JZ2NIOPUSd0XWJH7gC3hmLxYxmKgWdnisrH6BxxpYPwIT3KZAy+Q1d5ZhgOobnYfiZg+kjfePPtG+dstMYaLnd0UFM6ikboYarcZuNTpFW+AHI755twpjkY3wB/Wy3rWosIKzo9Zsbsa87W3CsdfO60a/rvf6k3u7UdbNfUzNXsyiGgqADZwt+P4oBvnYDqD1b5ELfMVs97sVd06Z/Y/VWzLayzjH0+uYlw7RkGA5aB2rt7wac8TPgX+g96DpgkyidAOT5e/gs/TxOSPlQ53FuyH0fQMmoLVw+4DcigTbzbOwLpkkLcCZP+uqxFWuGLTNNDz23075UEb0G3ThVN5bj80ay89J7oxJCXkUNXEYqh8iz8eBHgu34frx1/+hXECGRA4E6PniQSiGQQ5z7h5rwm2QJ7zhdn20I0f/IVOQd0sc0W6tp6txZN8y1bLR05Xf/SAP7zLvXrmv35i0NNrdVMVnnLQwHlbKqJ5dUmLIt0mmrfedOrNiodPoqWo6XHenozk3VVDl1RAXbUK2dXR3cuKPyblPlWlXFJdtBthG33nxPjZ1tzZxY0MRx20LdjnaWV9Te2FRh0LfdFD0qCZbwsoFAe1IrU6uT751C6mwfBZ/HXwDUEVg5BOwII7glk91nY/s8nic8hY5Ld23bRqr7MIYfEr2Y3n0HmslbnzG4TUkxmcb2RffIEensee1NTesgX47VH+Dbv5FX9BfFmQMZP06IuroOrtAjD4BEgwxjJgW5Vm6B8dfXxPaGdr/8L2JHirnP/6b6Fy9pu1LSTqmkzWLBtuuEio4HO5sabK2pOjul7tFFtZhQZiZnJSnKmb4G6IyPVqP30GuxJRaPKZ4KPrEAwF2ZoJXEoxy5CynFQJVh1zXu7w+A2MZg8hwd8HS093NMiOjprRvr9itaYaMwkB67izAJqNfW2ZmSPn1pSVX7CgyXRj5O8zC5Pplg4EclUkUgB85C+rvtHBMPQDHAw7j7BQ2ApPP0m/go0Qbfz8n7Yvzx/PnJso7NVrU4VdRUNaPZellnj87plYsn9elnTut4PafioEkuVjF5WQy56qZivxs2nWV2bsDKD9N3+L3wOVR+GH5SOBwAOQyPFR4IT5R1YrJwjs2IfC70qaN1vXx2TlUz5dBCNFxmZoIFo5phn6REdNEh+HySjCcEiOuOY4+icpvoTGa/foRVzsZS14Jna39NN5bf1V5vx44i29WMNJrTYNyljjgi5whW8h5F2hsxXScVRHxQlxQ4IsIeTpOgjVGEod7c7urP/+hr2treVrVaifQFC+tioayD7YNYLfH2m2/rnbfe1d27y9p2unptwmnrrsJIICLskcYYVXEcXY9CqlEqmWfxnGMI91G7Hw5kweujOD59OJA9xhTfICFtj72lnefkVF0nTx/XUx+7qJdefUEvf/IFvfjyc3rmuUs6d+mczj91Ti+/8oI++/lP6emXz7ObkNo2IEvVaiiPK5ev6vs/eE1d09nU9IRmF2e1eGxBx04f1alLp/TCx5/Wb/z2Z/X5L35atTk6JJn5yh9h/Duu7cNH2s/Zw8dxTKYgTtEDeIzPRzEsTt8j3r/vkDJ7tOif+x1rgY+Ubxh2EUyv1oj5bEmT9alIO7A3Bn2HEULZkc9hePwwhjXhPmIcEn08uOcYNxJnY4owYxAjJR5ki/awJpQpTys/tahhaVKdXNkGl50GGy6xl7vTQ0+xssiZJNZMdJfqAT4dnS5wyzNkMR0TPkZHmu+yPUqnzwz8KfUL83YAl5SdPaPS/AVVF55SceaMeplZdTN1p2cvV2YDQi+jYlxi8PU4cH6f5h6EuP2+M8cHN3+O8IAz74dxvvEgnYzTACHanzDy88X4A5Y+9gCCdUIYlT1D1TzV73R09d13tWoHrFStqVib1JEz51SZmVPXcO/bAURKpNmSrhvR11nL6erErOpzxyyPTtqhOuF4SpXZ045nHM+pPHd2FE87+pnTceS6MnfGxxRLC+eMy7MqTZ9WkWeL52ObrVvLe/pnf/QNNVsuG33kFi0cWdD/7v/4f9XS8UuamjunbGlO3/jGD/XOO1d07PgJ/af/Zz87+ZRq08dVm6ceJ1WwzhjsbGjQbSlv+YrRHv2fdvJwBWKf8BydaYYYTtTAcsjOQubIx1S7+DnXxTQ263bMuw0LJ6ONZceS21aszqi3v2m/aVf9fDG1ZfF5DQtLdmT58L7xGLNIkXUwgXUXzjvGva/zWddnsKfW9m3lu1uBs37puHJsT5ar+H0cgJHMfMyYOiJGNEV8OD8OBPNDupP+7j9/AoFSaXXPZ71CXtfWdnRnu6nOgA4s19/4CzvCCXOZjvEFFqWadfLFBdPvVMX3ofjUpnGrUuBsfN/h/gm0DYzSLSD0oQUKjHo8VJknEgxF/2MDM1kDmLKatFgsqmW93LN9ttvP69vvrulrP7qu5a2DGFQImRKvAtdk9Y0d8dikA51h2NI+bOeCgVvwMdttasKi+vh0RR87MaEXzy/oM8+c1MdOzumoHel6rm9nvKNcJ30Xiq5AtlBEbrF6lRxjRUkcfQXvOlWuWNdeV7qz09c3376tt2+tqs1q2/heFdTvVJQfNYIaEi9yFjNGfc7Kl2k37eRsXWVXOGbIm85oU8JSohXaBY8fDoA8fsD+o2MyZNOwqM1GT2vdtnFmGuxj64PbkZxm3Z1lAlvVJDnm4Md0zkFXlYKxWc7r8p0dtfvoPcsR0+ie8z3I1dTIltVUwbLFwbZtmAHG4QP58BELhhs+H3KRlTLAsM8gR6JqP4c26TjHDmup2GtqeG9Zd370Xe3duabmxl0dbC7r7e9/U5vLt1SrVTU5YTvKfg2slaeD1CfkD4Xfh1LQPic/L72njP4CBkBMICflf7+4h0K69m/YBhy5ho5MT8zu8LHoQ3WQVd1HOvZY4YguHphg6CQv+Blti1XOQQcMHHA/0RTX3E8TadA5jqY93CL4n4kNJCLd/eALqhLV4ZyHowQPnYZdQF3pYE93k16Lb6H47Ty4o98BmRXyOCs2p8xOT2r6wjnlSwUNdw7Ue/uKKo22qbqfvgXhty06QyZmK2VNnDim3PSMMmxXemdZ7fUtt4/JA5no6M72/F6toqmTTjc5pe76ttrX7yi/2xTbLPdcx4Obd9W7syo7aJo8uqDaUdvg1gntW8uxjVahywagqRmp/gDMsA1YpfagF2gpOAoNO4J3Cj7jP4CWLsdHTlP03wiolMFNrtE1oXN45jyJ8EEkGEenDz/Tp8nXYODA+bn9GcuHAwYdZmaVO3tWTR/3ixXTRMyMCT6ibyXRFi1JWT52cD3SAMijboE1ehephj+MvkOP+b3p/T1tfvWrKlRqmvjc57RRn1DTerlVsNwz7XSZ9OR38vu76t64oeLkpIZnz6hpX4tJhtE85ww3YB+nviTfdJkhXdJpgPdJBWA/qoX/gAN1TPeDArigLdEe5F3PtoJUKtqeb7WVKZTsQ5Z05c6GbpsHWl03CjsibAkyot+vr4tHanqZ73/4HN81Vq9Cb088gITUfsLYFgm68NnYhuE+IXTBL2wAZBSBtQ8xQOtcGCSDv5kg07d9hW1WKuQ0PzepC6eWdPb8CZ0+fVQLM1OqFQppQMk8N4ytxZw7eTkP/6ciOKMdIz8pY73tEnyPFJHqMHwgHA6AHIafI5ipzLTBZDAkZxac0+WsXrQQvLg0Ecs/wzGyMRgrRSwgYvUHSvVJ8eRIEMZARfwlgRQ6wH8xIoyCpJMZKZXvar+1pVsrV7R1cM8GBIMfZMR7/KX2fzD+pL/3pYtCx5FbH7z3/sg+vr1mRu++cVl7u3su2YrZkVkNDNyMFc7Bwb5WVlb1xo8u67UfvqnZ+RldOHcxtjdIRszIiXW26Ti+DpPhoYiiSJHzcbWTwvTz0fUHQ1Is6Rjnce1crDDIJ5dzzXnma5b+xq8d9S7bpWX6KlULml2Y0skzx3TmwikdP3NUM0cm1Mk31C90lbW16tTxN+V0DHZceOasPvbiJb3wiWf1yc+9pM998bP6/O98Wi9+6hkdOT2rQs3l50yP9+v9qEfDAfg8HAMmPyHybBwjj1E+8ePzRwp+J2DuN21RxbciogyMO6jKNNDxVS+j2al5Fei0QEkb+LHihqKj7MPwYQcMl+gKNxLgsl6mqF7OTgJb+/BdkKlFFfmWT5lBiopplI6xvN+EV22AG7t0aDKLeGBjHCM/Zt/4WcyrRSb4HjM22VqIlR7DXNk8Ulemuqj2xDlp6qJKCxdVXnxKhfkLyk+e0KAwlzqa+S6JjdvYyw/BZo81HK8g1xHt/oqGcAbgI8PeIjaYiMFmtrh57Xvf09/9O39HN2/fVq5YUsvPJ48sWU7RgW8D1A5SH9lm+MVHv/1u7NUOSBkEy5SdP5/AZBC77sIm7sehTBsZxywDAT8+9jN28HKTxlA90g2zE+oNKxrmp3Tjzo7+8A+/of1dCwXjs9fJ6IXnX9Zf+7f+HdXLM75X1qBX1P7+QDt7bf3mb/1VffY3vqhibkKDQdGihdnDJWVwdPhA5MGecj0GQEwXOL6+nS2Ysoe0sOe6mFLydnuyFTUGVfXr51Wae955zZniaUvNNGo6U83v12wnVJ13Ru2DFbW762qZJ3IzZ1SYvKBe4YjTs72UYR+zUZlpiEGfOvF9w+XSycHMybbaW3eU66zHVobDCltWHDcMGACBh361hB6tRc6jsXt23ld22rq6Soem4YddQwrTsonMkU5RzjKqWqcsTRR05uhkSJXoKPAvdtH7YBgF+F4okwf3k4M9ehxnv3qBiT1sY8WsSDpOYXmc4UG+pNWDob7+9oq++e6qVvbNkwW2qsup22NmuanaMI0PlhvuzEpN39UIgYMKjyMHHG722j59pKrnTk3r1549o49fmtdpO+BTFt9l80yerdiGdqsZdHB90ix012Qkv+LD6thhI9s9JjBlS7YhrUOsOzbaQ33jnZv69pUbapUs10wDfHOMgY/Y8id0A/WJio0QTlmJLnrdjoq2447NVDU/WUVDRdsSLSXKS+2hbbxMhArTk8PwCMEwjz9oaVDQyt6BdoxoVr8N+1nTI7xumshBXz1Vy2V1OuBpRF2GP3TCcAcDyuVaWfc2O9rZPQibMQaoQl8luQueoEcmBuBvQD8f2WDYJTlHG/hWgWEW99A2ife62FqGUYmFh6u39fbv/QP98J//fd384dd0++rrtrd31dxc1vXvf0d7jX0tHT2qasU0D08Fj4x9zFQeuMBuB2dB+unJhx4oNU8nWVxRF+xT2jxwmw0BfON+RhW3Y9L3CzHzuGVQmY+Nd77BxioImtRH0PkpHb0MfhRw9912oBoQJr+Ift1pLHH8Z7mYXvN5ChzHMe7z/H4gpwfQwqbi/VhRMkpIGQyqAHfc9lj5zhtuA23qMsrH926KBdsMO+otr2m4vKJsp21aRka5nbSbd9GRRactOW2jod7qhvpra+rs77v++Nou2/nnegMns+A1f3QOWurcvWc62VCp21fX7927cjUGOiod18U2Y7Zajfp0Vjc1cPm5nX2VDDNgBfRpAz49cEqrBsANbaddo6OfJ9oahfsnDg+dc5piugmYiMAtbFLy933wEc99Fnac8TuWywlvPCf6XvicdPKSWcG2Xl6N6pR08pR6S8fVKNfie1EQd44BIt7z++Ot0EZVefxAvamTs32cARBwxzntNBqMw65qu/va/MZ3VJqcVvmVl7VTLvm5fSq3I1axMNCB7XtvXf2rt1Sem1f20iUdmEbiI9TRzoS3aG7AKE58N0F/3Oyft/mPHVyXcYCGCFBSuvKR5/ybB2Kig89jRbNpoW1azpRqWttp6LJpebfBd72wb/wcvWCAoj+milm9cHpW5xdt3xteqeUJXwGPJxoSPqKR/CLvghbSdRoA4Sm4S9e/yBUg0frRJToHeMHf+NwHg5y2Oz01Oh012301WMFpmBvcOujkfG+o3f2emj37S8jkvPVRjrpHBhGhwNRfAO9xTPonno/p8TD8hXA4AHIYHiuggJAdCMixgRxGca+pY1MlvXrpuOYqFgF9Porr5xYmDIDYywohmwIM+uGHZEDQITC+DpEWZ3RXMqqKWVxg9HvYVqu/rzv3rmlt+46bYEXIB7NZUh5v8DdWJQ/HlOcHI2YOxySbgMMYFj+LgEppanZiZmYndOLkok6dP6aLT5/RyTNLml2Y0PzSjOaOTmp2cVILx6Z1/Myijp1a0rmLx3X81FHX3Qo7DCmCIWGDjwsMLgMl3R8dU53HwnNcP+4ibFMcn6fVCe+PPBtHYJ4K8rWzYj/y+IYG9BPE5Ed5LBIn84E6dO3odwZtO3M9Kx+WZhvmBRtT1hyoIegOU7pip216dkpLxxcNh+M6cnxWU3N1FRnwyHTUGbZs0HSMWt6iHaO6PFJM4cHZ4wSX+2Pg9LNFw90Em4w5t2M0ABIOWxjtLL4tYtlpbnpR5VLV8LVTZ0JjHk4yQghjPB6GDytArcgTZl7FdzWMC2LPeEvdXNB9UcWyDffJBZWnjqg4saRshe2NFmNbI4790oLaxTn18gvqFrk+ol75qLL1UxrWTqpXO65+9aQGvs5MnFZ++pwKs5dUOvFifMA5Wz+qQWk+Os17mZqdwrLrwdYmls3UwbQSA6hE1yoZiakFPyfhfyRDDNI79vp2csuVmD3baLR1++YN/emf/Kn+7n/3d/T7//yPdWdlWXfshF25c1fzx47rYy+8FANWDHbAunQ2wn4MiLAaiw5ocJ62GrNhzbZRGbZXYtsABhH4sHbZz3lGxwz77zMg4GOsKknHjNMdNLvOr2T0+Z7v4wD2+zmVynXdunnXcmGoc+fO6BOf+rh++3d+Wy8+/4LKlYp6lr+l8oT1wlN6+pnn9dt/+a/GnrLM9LavLr6jQgeaii6nnNHB5orFTSMGHbJMDYMenDcDcq2h4ZKpa6NR0ddeW9aNjaIWzn9GlflL6ioNrrEapuf2YqBnfJ1hkMVKp9m4pnb7ll0IG/UzZ5U33Q4yk24fRjxyLs06dUVcHgMgLjr0EwY+nRYdZTs7UnNVHTvE2SpbVpzQIM8gEXT9q0W4tBZtC/yY979j5+mt62uBo5jpH/RnukZ5GsI4sszeKw17mjOeP3ZuXnkmU0DBpA/wjWHI0foEFTK6nyyF0ZlPw44Y3ftVC4ZsTO5hv+zoVjVv0BG91hzqG+/edVzVvaYla66svPkK2NG5mjM/JXwYcr5OHxhndSzWofEWzrbvM8DX66iaH+oLn76oT39sUUuVrEzpdrxN+9jafbZAwMFmgJA6JQwFypA3lIlNgCxilYAfIPPFNla+3mj29dU3b+tbl2/ooFBWJ58GItEHaWa3LbmY+W355bre/5YAPOl6khWGWabX1nS1qNNL0yqyLQMy0H/YMAwOPWw1QzdcHYbHCEEjlpTGbbOf1/LOvg58k+sYAAldY3qwDC0MeqpZ9jfYGte4ZvUXeAhzO7bO6Gpiom45OtTNWysWt9ZDpDCC+J5cZsAAQSovkMYFtOTDRzKYZqFrGjCwfEyrkfBUQjv7Praa9alPi6bzytaqyldf0/OLRZ1cLBu+B8G7z730onb397R67XrkcfzUKftZ5hvgC3BcDtSd4ASlA0fzNLDj1hMIsC2rOFCt6Ne01SoPMuqadtjABv2Bxq36jK95laxrGQRNOz74zzbEmGtDV/giPD1ucu780Tl0uKfH5ngLCOxLknB/HEavAPV0/tAzAjonRA0PnYIOfAIrTlx1v5fKibJ8nzKQVQXsCNez52umUbQODnRgO23v8lV1764o224yzmHZ6nyibs6DdtkOanW72t3Y0PbVa2retI2yu+c05hPwSf6GFd+16Dvdzu3b2rt2I7a0ovPXVo7r1TfMMqqbhkr4u2a01taWNq9c0/5t89fugS22jE0s054LZiNQpgLSgrRSJsGSu+legl8MfozgQKQu47+45+v07P3BrwU+eG5o+dpvEP0sSuVREEGSxmP5TIo4801stmi/MY2tupuraHjstDKnzmm7WlOjUDQOoALLlejnSbQVeaPGyCcdHi+4bHiKJj7qAMiI8xJ4fMbgBbq2ur+v7rvXTQQF1Z++qKFlZNe4Y+USk29K/Y4mGvvq37ihzt1VTZ09q96p09r147S6gTyBy6ht0V5K9lU0Oj0Afk8qpHqBQI5AIsVx4Ao7kP45Jjsw6EO/TEzWype0b6fg3Rt3dW/nwPjFJwHDCaL4OcD/+FRZr146oZminzAQwCRXZws1kP1DxT2BQNuj8XEF/VP7RO+2W4Jm033CL3YAZBShXco1TQX0rXOy5h9WaX/zrWt65/qqbq5tOm7ryvKWrt7d183Vpm6s7Ory3Q1dWdvTjdV1zU1WVS+6FMM9rcBJwI06uZigvTENRuT5YfhxIeT44QDIYXjkAE+b8RgF7tvQw2REMRX6DV1YqOrjl5bYUIXhBKcduWHmQwxLZiJxGcZhyuhDDpSJABsJDwuJVAt+cQcwhF1jG0btwYE2du9aEF22AGzZeXXdGX0dzWhLLXj4+NMjwiicRQTh+579bO/TKYmptHhsWpeeOa1nXryoFz7+Mb36mRf0/CtP6YVXn9LzxI8/rZc//bzvP6fPfuEVnX/mTKyaSGYg1UgKjFL5jRD4oBzucjkSnPdvBMYdw2V6f+Td90WEMUceu1zO/W7OxnUGBRo6AiVrnQtYRukTLUXSiBghQxfH0vSxcch/GsCyOWMNHQ48wZmivIexJ30yJ0P4s0ey32UvWKt2JxxHwqMcDSuKirY8YhwNfCQl5euID5+T7OH7XL//SNHhNFAJFFsEjGQMDcN1kFe5UNORuSUVc2W/YPjwzO9HteOXeBg+zNAzzpiBNrBBGIZ4xORkszVW8LXxxCxcZapmiykNS0ek+inlZy7E4EV++qwyU+eUmfBx8pxy0+dVmL6owswln19Uce5pFReeVeno8yrOPxP3sk43qJ5QJzsZHzwf5Gp2WqrhuLDP+yBmPSbZHHWI2I9OPIw0HB1ojbv8/0oGI4sPj1+7fkPf+tZ39aU//pL+7t/5e/rv//v/Qa+/8UYMKB+021rd2LJUzuhTn/2cXnz1E4ZikmV0QMVMWYMythtC7jrPcAidPc4iH0FmFiXbbPV8TANkfmraCM4lMeH+MR3i6FgsIE+Rbda/dqY31zd1985tra3c0cRkWc89d0n/m//tf6jf/O0vxB7wveigTXK2UClrYemoCuWi60BHmmmVZ3aA+gXTCTI0xyz1jnrdfbW7bdcfh72obr6mbrYuTZ5QxnS41V3Qd98+UGX+Rb3w2b+iXoHvsDhD1ys6J0ZtoWMk5Lflcmv/XbUbN+x8llWdN63XTxhOlAuvUJ+RDGdmU8h82mm42jmJbxi4LflBS529u2oZD/nJYyrGCpAJw/BXcwAkjtazbdNPa5DTD68uxwBIaL8Rv9NJz+Aeg3ysOMj1upoo5fTshSMqWk/mwkaDoiK3+L1/9P0H9x6EB2n/4rN//UPiVbZ7hb+z+ULw86aF/1feuhODHxvdggaFqviOELIAnmcwgC2j2JZqaL4il8AHHOprzsY2A+mKeevzfkdTpaLOz9U0ZXuUjkkGHJzdSN4Yw9g6YWSNOJD8zXvjbxSE7WT+4VsQ3O/5+Xqrr2+8taxvvHND28OCOuZJFoCVLFP43hG7pmNrhFXvPBjQj45I6wpQTkl0HtIpCBzKfu/00VlNF1yfgenJiXgvuqHu01a8Ovo5DI8c4EXHnmXdtpG1um9ZSKev8Svbgwy499HlpqSS6YoBkINWL57TccXrrOqh0yZn+T85WTGeO3rn3WXLbz6HDd1AT04YNqx1Ax3mPkvf10KmcPXRC9g7UGPwFnwIMHyHe8ALPhkyCcHtRyYesS/4l5bq+o+++El99vlTmp+b1npjqKmFY6pNTOvqm2+p2WrbFpvT3JFFmDH4gz/KAFbJj0g+JlfEJxGiFhYPlE/nO/oZGQEcmBADt7dD/mAPdlS1Hq6bflj1EHUPmUQGD1qFAIJMEhwZWDOPj84jEWlH6SPEs4fCKOmDBOn0QScqMsNHYBn5sA1VgiPyJHzFUZ4xeGBZxPcnLJQCFyXbSVW3r9DmGy4MNNv+jsdd60O2LfN1oRhp+86Gvo28X62MIltkURl0Jp27HcthbDy+h1GkLjz2O2Aaf5MtbZDoeacBPtyjsmybVHA9ik5LB2rXZbesb3t8nydPJ6t1ALYNifmnXLeXc/JJO1c8uJ+O74+kII5vEWLrK4egb59Cm8AMmQyth17w01j9PX5rVO4Yb7xntnd9M9rPVzU4clLZ0xfUmFnQDgPmtjt4Af5hFSI0QkesWz7CjXMeZf1YIdprCLtajzYAkt7LWgHmoUzohnPXpY5u29jVvfV1DSZqqk5PuI1O43YyjaTU3Jdu3dbd114z7qTZZ57RwdyCGkwiAB7kbzxG66gbbY4/oAjGaPWD3ycVovQx8KOyxBGNuA1p4hu0kSiYnQXYiWBoW+bG8rqu3FmzPYCMyMeksLSqHfvFfDZo6sJCWZ94+qhlZRpoIgIXpN0YZ08OBNDxuNH8gi/XL+651UH76T6B61/0N0AoD/8l5GbQhf0T65eba1t6/arpa6eptb2erq/va3mnpf3WQOtbO9reN222Grq+daDbaxt67twRLVpP06TEs9SIfKm32xXf+2KnE9v4xiv37/PzYXhfOBwAOQyPHUJ2EExECEUcqclcR88fr+nZU7MWihZ+MJ+ZNPaddbq8GZQONlgyFO8TYUzKRSwTkkBKtfA9jHwEnS2jzrCp1mBXN1be1UFvU5lSX71h20aDjWOacL/uHFObRg9G4eHzFAyGSIWiSYIrXb///MfF9DzydH3ZdiQ+fmgLrdlr+rqrXCmjUr2k+kxNE7N11aaqETMlOzt+GeOq0+tYwaU8EJo4M+SdZtQ8qEUoBhwcDOKAFeZsctAjyY8JP+H2Q8F0YGUJEHDUCdAMThozzPpWqrE1A8oy/jCeXKMRmUA/Ng1H0WaMaS5WnviVZOzZwY+ll07nPCN//mguOHX65MSlOpBnOn7w+scc089Dv6NKxfHhGOr+A/dSJCtn6JhyeRDG16Pj/bId4zi65gbwIMYjw844YvAjO+AzhRUtzixpfvqor5kJjvlFuw0RDLTA8WH4MAMQj9nsRBNycuZMn2EYJiPRrBi4xGWMD9ENy+pmK+plaza66uZdOqeryhanlC9brpbn4pgpzdiGmtawMGVjzcY+3/EYVh39LpFtkmJFAYZWKo0PIMOCQVBmDOgC6jTnjOjD18iGoLNEejHoRvpfwYAeaBw09Hu/90/1//5//r/0T//JP9X1azdCVlWqVc0uzOvZF1/U0RMndOb8Rf3aF76g48dPJHAF8Kzz7ESwNQ7nYwkbznBE4wBD1fDn3iDO6SzEgTQ+IjodR9LHMUVwVyoW7YzY2PX5tatX9Wd/9mf6R//oH+rv/J3/Vn/wB/9MN65f0c7eluYXZ3Xu/NkYIOaDhsxQ7aKf83nrBLawMnUwq4jKmSAGdJz5JPZJzg1VmZ11GWV97fuX9U++9Jr2BrM6/rHfUG7xaeVnL6ly7HnNnXhBr/76v6lnX/l105xplndd35gpapryb4ja+I4IO1vlrMc6y+od3FO+uKDqxBnlWfVk2oU7oi4wR7zJXNSQ8KZLv4dscz503sk6ubm/7DTOt76k4sxxq64Jp/zVGwChufA3M/jonOnYSX392pr2e6EVDTsj12mAaLpOHUFZ01A5l9VTZ5ZUtwpjG6UQAONMf+yRAC2Ow/j84ee/KsG0ycCFYUnHAFtn7Fgvf+vKmr769orWO3Qr07nGBJA0CIkkyBjmYCKkQYbVFnTZJTiiC+iQjLz5dd7MOh72O+rub+vM4oTmaiUNe+2RTW0MhJExkjI+T9KGW+YXTsF1nMg6wvkxU90yYO2gp6++uaKvvXVDjXxFbfMv36MiMJM6P7D9R36uT8yKt3ygqHC4zWnkj24hsFKFmaOw5pHJsk5Ol8yrOOXJDooOUsf0Rw2dOOqf3j8MjxAMR/R613Sz0uhos40sN18jGy0zg65s4xsjqhq89XJJB52eNUySAzGwYWTlbZjkLI8nKxWn6+n6rS1tW2Ygx6MYp89CA8bTEL8DXGJ3Bh7HfP/RCoaSaZsz86NP8HlS5zKScdTRZSLGZmMoYKq3r6frQz09m9VxH1vmjx+sNLVw7nlla5O6vnxP7e5ACxee0tFTp9XqG062u9CliQ+BWTqGHI67YOjDDwlnLtvVsETwDdfRdYtvRMZgedY2KGuC+qanfvjtVcsLBgTQ38ib9O0Zt8FNolnRmR6R/Ggn+UEfPuc/bgHn9E48G8X4kPT96/QMTPCXjqY/7vGQmvsAvvAEecrkIvoT0hu0ztGKsOB8gTWLWdlukO92MDs9yNftiW+JMKjh9wmsjOtYNsdWUNhHfds+xiGDGBa8hgY5UwE/sz+NT00+bPkV9fdz2hJd/qYdvOaM06IT8E1jVYrlLXnHYJLrE4NkBdffdWCwzVUKe5E/8owBqoAPFUztiae+Dj/9/jHFgKHRS9m0irQ8jwkP/sOLjyYYT7EqffQeK4LiuwTxDu0gpmuKp4282XX5+/my9qfth5y7qPb8UW3nmBBTdKvBkRtgSKXO3lQWuaA7Iu/xrccJQTuuh/N4nAEQbKM8u5HYfhyYDvgeacn4pe23t7d0UCpoyrb8sFQxHRh/Juhyb6D9lRXdvnND06ePqX7pog7M733rTkgdHdh3jH4M5x+wi7bD9+CKevP78zT8FxGgXSqY8EhNx7/IO6gW24DJVHYRzAts1VzQ5t6B3ruxou2mYZwrmUaBvy1y02usIHaYsEH/3IkJPXtyNtGQn0cp0Dmwd76U8ORCaveDNlMb8JRa/8scAIEGOAaMTRchKynPzMUf19WJupZOHNPk/II2Djr2LWt65anTeu7knM4cmdSJJb7TWdT+7r4+ceGIFquWIbzoOqW2GGEEw5o6QXkh5Ny+VAt+D8MHw+EAyGF4rBBKCJ5CYSNErHj41seRylCvnpnVyZm6FbmdHjMjWiIJGBObr+mKeyBEngRjWhyEoUs7HlbUqZ60C8Ooq6a29pa1vHlDgwIDH0QcORLw9rizmzhuC5EwPv9ATP9RHELpoSej6x/39yBN/IyMNEQxdcFI6ds4w6GlIwvDtN3FdDWsi8XoCMkVbKBYkVNNRojHqyMwDNKRJvknjrRr3D3LObM6MJt8jEoYey4jdZI+iNwfR5KB7xQfnKeQ2sSMRsoeXcUvipJBMxQx1SEvjEXeZV/doQ2VTN+KCEs7XsfgyqpIx4LP48/vcUw5u/60x0Bi8CXKiCfvP6bwk+/fD5H5OH7w+l9yL/L5YJ4P5T1+TtIfc4wDR9qJ8hwPfvSLhklRc5NHdXz+tKrFCcPGTkqWzhTTM/Dzyw/acxg+rADOMH0SvsxVjjg4MdvG/JqWtDuNEYRUxIzBYEozEsNkCv5FzkY+0DJ8EDTNEYZOfBpmT5YONq7HVOzHlg1cRdnOJ2/eKvgRqcJYCh4cRd8P0Rb1Gecxjr9aAcd2MERWWgbZEV6cX9Srr7yqT3/y0/r4Jz6hT3zqk/rN3/mi/ta/9+/q13/j8/rUZz+jZ5973jYpPGeJaZ1oJMYAAHhGktKB6f/oQOCYlkMnozkGnuLo67gPPkCaX0xE8yCCM7+PozUwfq9ceU//xf/3v9B/+V/+bf2LP/8XWlm5q06npa6dxLn5Ob308su6+NQlFctlv+v6QUvWIxyhIZw3llT3+ug3Wk8nh5/boC9ad/S7BQ3zc7qxOtT3393X1MlX9cLn/20V5i9JpQXrI+ebrZhWc9ZFFOH685HyaDcyObWFc5xKNuzjGyK3r76h1Tu31OnWVJ48p3LthOtRDtqHDqlpqhDAIg+6IAwLwxZXPu88cNQ3Vm7p5vKqrq7ua2LhtCqTi37fdeb1X7FAm2NvZhNYx0B869amdlqsKIACTVWA0o4T2EA3FE1DdJAyk/XssSXNV9D2DMIFIfCGYzqHXsb3x2EsKZAtIczi+fvT/OsfEmSAAdzcsLP6g1vb+pPX72qtxYdUy4ETbGIGFcMB5trvwcjB+cgLYyJBFIlg/CDfR/kC0n6/GwMM3VYj9oI+dmQm5HmRrU1HuAmexl4bDXxTN0qIyUgun04f0vR4Zv65s9XSV1+/pm9fX9ZutqSm+TPPN0osu7CzouM76kJnbt42Zpb+I19jN1JzAr9pWxGE38D6rmtBMFPO6NLSlAqGirOL9iRJmF5Jzjr8PIbgYXi0YOgZpi3j5s5eU3uYCr7H9xtyo0FoxrHY0q5uGLN97m6b6VMOIQ94ZoyETulpslLSVD6v7f2+rm/sxSrA1KEKBRg/xjfb0UKzfAOAkGz/j15ApjHbHe5g9SOtiJUDcSc1Ed+CrYyQlhPWZ3PFjhaLLU339wzvrt5s1lU7/axytWnHKU0cO6mzz7+iTImNo8ANb2K3Jd4k07Dj+Au4PRnYRec2uhQjBH50uwfwuusVg0K+Tec4Awcd0lr+sMqhbBlVNl8zu3+Qg6fxN1NEr5j8/B7ZIXFSPumQdAT6gXTcYQIDp/chEPcTTAI0kSbdTngJqMX7Sf6ke8CUAYuwY7C3yCH6HPzIZTDY3HWjkLvF6LSVZZ/TMOhA23zu1+0/Ow2+NQaM38d+y/fS1IvwofLY5H5mey6xQJKDfaePCXx+nzIR1ZQf9aX+YWcZrtQPuPDcCZHHcCB5hr4mPzrd/TxsJtrhZ8Az2kudo52+4CE/o3PKHQdOKZe8OXInyV7OuZ/gGwMg8b7tMT9Mg1sjKYxdadhEex1jUMZpkP0HuaKafBj+3Hm1jx7TVqGkdgzsQ0fO2+9CW7wUxQck3HYLooeq+XjBdXncARBglXjRdYXWjbM0KGLdWK1pOFFV/dhRlWbn1UZ/9vMqYWP6VSYOFaZrmjx3XEPb0+0c33JhIKtnujEf+TmDVjkQFXzlMoGk4QXggWm0/ecGwOMG2k/kHDgkWHAfOYQOjlWjPPbVMFcwLxS13+7pyq01rWztxipDbBsSoef57iwXtHvRNuMr5xa1NF0NGoqttJwUGidv0vE7qsATCAn/4/KpDRAIXqK9xlN6mmrJ9S9mACTlnfKnrzENrjKBBD7PG071ck4LC1OaOzKpylRFt1d3NV2v6vPPHNVLR6u6MFvRyflJbe50tLmxqRdOLOhIzbxmHFg8jfCWYMwf8I+yh6ZzIueH4ceGwwGQw/BYwXwXEfmBouUEQ/H0VF4fPzenWTM1HW+kSaOU/NnZic44FORYAD8J5nRdwhqw0EBRoxiiHkQLK//1LdR6maburF3TfmfdAqvlyH7rToXjOECwhInxgUibxu0an7//Xko5fp6u4jwsMY7jFD4iOLnm38ekuBLsMM4HPcPUgpDOC3BBpDXFYikUOxex6iJOUEjk6vMwfH3GC+M8wUnkkc55ElV0SFVC0FrA+2hTg7upMH7iGclT7dKDeOjDuNbkTfR91y1rIyHsvrhOCjMEOfVGgfo9iod6AtIYh/7DtCTvtAcr2VOXVB/y5DFqKs2GTCHBizZR93RnBOH3xYfDB59Rd87ef3/czp8WSfmg/T85jNP++JDKo/V0IObdZNOgFXM5O2nHdU7H589opr6g3KAYnRbMPCdPOnKB7U/L+zD88kJ0fkeks2dEBxFHXBEGUuI5iBfHajwoAS+kTvP0JrM+4GeoGJrGsIoOd96Pv8C4r53akXzgeaRVLG13gjToQt6+JiPKHZVNrSJfvzGuLU9+FUPIJ1vweQuZs2fO6jOf/rQ+97lf0+c+/1l9/vO/pl//tc/q+Zde1PyiDf/jx3V06ajfMbwMywK8B87NeDjPyLeQg4EgS6c4Jy36ALgj5zkf4yndJzk4SeH9R1DHChXo4Stf/6r+m//mv9Xy6orqdgBPnz2jV156Rb/921/U/+o/+A/0ud/4gqrVSd5Q11ZzbCFlB67T6QVtgX+2E2RFCfIiynA9aDvyhj3SM/maLlx8QV/8q39Dz730SevDijrOi/2ygx5Nh+wp0B90rcqSg0F7aAsdLbSFNtGymA1o2P7z3/vH+oe/+891625DS+de0uLxizbqTXuhDEbvI/0h1Ayr+9IATdAnXn2Egb7yZ3+qf/C7f6A//Mr3dGNlR5OzR93eCetB2pOgOF4V+CsRgtCsImwXXLNDdW+vbcgZZtCbwYYN08feMG2W0KF8QyKf19HZCZ2cKdmpG9FoyAWC8TyiVxCQcg9UOCZKvZ9ylOZXLcTKWrebraNu7Hb0pz+6pffWWxqW6vE8bCcfmUGZYfaoQcTqDeRBIc8GU05juwcExeAHMOTf/B04s53HyrMcW2gZN83Gvk4cW1StXFDB8oVZ6mAGPDH4kVaQJJqnLMV3HsyXvtdz/o1MQdfuHehrb/DB87vazhTVZtDEvJlh8MP0weYugyH87bJ93xawcnxM2HcYeEU3UTcGiOnEC9vRNMU3iphwM12SLh6dVLUYhhrE4fx5P6RA+APAjbYmCiIehp810IFJp9++yebuflMNwy+2FxzBGYpkBn8h29eMdVKRwY121/gHV+BgRBtxp6+pUkFzjr1eVm/eWosZwPB3msBBh2jfuEWfGYdRjosZyZqPWoi60w74DXD5XpJjKUaCoE/TPD5Ut6F+e1tzxZ7m8j31Jo6of/YVHZSnlK3UNX3slKZPnFPO/A5/xbfViIYTKhXeCP4I/Zr8HT/k50MP44715OdxkjgyuDLogXqZL914tvYkYhcWrZvrhkXRcGEQhAHQnvV4gNFv0CToJN42fYWKdoxn3PQJB8pJsE/P4mdER5EW2vQldip5xrdsXC71DW/PieJenyvsA6ePeqXOfKatMEmwSEcu9pZlJ99roRVs38NEofARfU6aTJdzxoPLMQgBb7DShVUPbJWELuQblZRGvYvmOeQsZEH/xtB8xbgJtaf+1IH6MYgMj7bZmcDyk10LGGiBqIATdjkAp47RIe8/fl2JgBHpYiDKeRLJK8Eg1TFsGmcX9SMtVXBIeEiw5NdFBC44Blk7bcDMN7A3Y9CFdpOZH/UDtykj8saH8K8a2aIO6jMaHj+l4anT2i5VtG/YZgr4nCRPXgN0EYMOziz+DLOgs583OM/EQ48zAGKf2LyYBvQJ8ICj6aTk+k/O2I+enognDJCUDNuKE+b6XRXLOU0tTqs0zUfei6avSuhxU7/LdFtt9wY+YapoO5H2ovcSTUS4f/Ihh8AFLSaAS1fEcOQsyTxDyvWHntmik5UebcNqeX03PnzeMvHFNwnjbfOGYcMACLKMLTvPzBT0mUvHVKX55OGUbC8XNpHzhZaizIhPIlCpB+XTXto+9rnTAEW6T+D6F7UCJCZzkZYyRwMgvJ8GQIC/09t36phWdmwO8i2Qkm2sZ4/Nai7TUaFnrW559c6dHd1Zuff/Z++/YnTLsvxO7P95Gz7i3rj+3rSVmWWzTFdVdw9Ni8SI5IicESVhoBc+j170pCc96E3AAKNXQZAgEuBQwADCjECMSIjUzPQ01V1tylelNzevD+8/7/T/rX1OxM2s7O7KzGLeysxYX+w45+yzzdprr73W2vboG09d1MWFqils+RftijxTDuSX2j0V4XoEh1Tkc/gQCNl2PgFyDh8VYBx+sWWOezs+3PjsakPfvLWqVgkDiZaYmiYCKA1oh/jIBEgSEE8CIlcrqZgAyQQWuIaQ5CVHS42OdH/zXQ2mJ362AcOCXnBHgdoQTALnw1xeLpwFVKT7uLOi8ZuUV0YRK+eIm11jQPN994/Ft+DjA+IMJWEAxcSIBWmkCsntWJmAaOQ+BuX8YwIgF/MJpyx9/PAG4kr9ZAnlhkxMFJEmZlBKNwbw/MNYPXX+BWYWzLHCh/xD++VxSNI5mheCP9C4oQQyf+4jjuPaYmMlWzFzGCVhxVFtWfxYmRMoOxKGri9BhsjT4aGNr/HsNDBMgwqBT+bIh5/vwR78M5+zH+n6PXzuGzIg1+wtV3CyN2WIe9JK74Pu1DV0JW7mH+H8L+8Y8Qyc+qfHANIugxeWvzunhWnFxn5DzfKSLi5d1Y31Z7XYXDXb8oFhQmJ8k5fxgaCBb6RMcufwqQHtJRmJyQBK9U87DsMou8ZAVfBAqjMGI9IwVTI5w0UY1z3MQQcmg+jghSzzX2pgp1fqnY5JtB3apMMH7/k1nBrnuNI+iAyGTp9uWUhqywf88fliAuU2LX1hF9qUwX73chmEpJNMR5rVXwxG0omKYw2oGmhrP+oyrnn7PnXUITKGzlHSJWnQyu125s44jvZLnVA9UWup5s6uToeOp59ZgdhstdWem4sdKH/jb/xN/b2/9w/0j//x/0L/6B/9z/XCCy+5np1mdNpdx8g76tl40kknteATdDkdb/unSRgchYcHwSaQcdAomfmDQRy64iOnj2Z0p9m8GMWKRBO+icdtpueoAzb4i+40/vGf/IX+xf/jX0r1BX3/b/2HunjtKQ3hRxM9WDzo4meWXBaHxju1hzjd2x0Uzs+G/995+139xU9fV6GxrNsPd7TxaFvt9rwuXryoWq0WepK6mLiDEqvUP89APYYudN2Ua9o6GunBzmEc2cJxfH4RYVzV7qQymOOaG49cHxUt1At6/sqcO3UEQ46cVRkDULFS1RAdR5zfUhv2OQ13Ztt9kSC1l0mprL1JSX/81qZ+/N6+RhUGVJiccBuxfGDgiUEajsLiWKgKDkYfD9RwF3iOrXlOC8mPrIj2hLM3Q0vI/7AH7cFRds16S1dWWmrbXi2zu8NvkNvRJWYALuN7sqBzTztkZeegWNOr93b1735+V68+PNZxsaGReSXh5fA0Y3e6kT3gm3Z+kD0+bnMcu2VMK/CD5Qm+wRPmOWQX4Wn77dI4JtRWF1oOB5+YTo6D3km2mx0CJysT78/h/ZDrjQ8D2trYtN7tjbUzmKhnHkSmI7/jY/em89h8VXc1rdarrpGi9gcs7rIH76MOEOrmnfJMC9WS1hqV0CmvP9jTycg84xDEgyc4BIhJECbPOYY2ag0F+VkEkxQtzA28Gxo5s9NMmkR32s9krGatqtXVJS2szGmxNlPbfaFOfVGDy8+pcfGqWkscTToXkx+zArvt3c6tqtC3TiWrw0SrtIsRPQY8GX6nfHH8EfXn6kuWBP/t5/YIjiXrfbCfmL8YnOv7ie9qzBt1t2aVJxyTONUo9D20YwzADsWSpZ8P2FNK+l6Rt5+Cn4I2CZdAIt5QJ6leot+IznF8MBxim1QqIdPi+zXW/66gUGd0C8u+L9lGI6lJxWFCzlCbxiNsmJS2jYE49o806O2xar/kopSxe51n2j2S2gc8X4lJFD+WS243zoh0HQ9sWYHNNxJGJcrqtB2H8EyeoC8Z7OS7buwsYVKGHRSkw0IRBpAZkKe/OWb2BLvE4YnLbAr9acoWK8addthRTouBWNIKjvV7JoGQ8Rxnij0KGlAcsZqAOkg04koeEcL5QGMG7ZH54U26jhg/MieeMUResMus05jX7OotFa7f1HG7qSNQdZ0QN53ukSbhcWQPHtAq4Zr4IP37mBDtJ+XQGn60CRB4Dh7M1I1pZSqW0mTedG9PxW5Xs25Hs15X5X5fhe6xCp0jzfpHmg5PNBl1NXCYEduHqnOmiVmBeqS9MLlmZihTdzFmAiXRkKnc9k3wScr+SSDLN10S/dJd5vwv+SYbcTQtaf9koLfvPNLeSd90qrpM2CTwfYoTO15M4app/+Kltl5+as31QJ+Ady656RoMbCDlZBc+KcgqPTDnf9J7YbO4dsAtvYVj4BnLj9/IBEjcBKRd/ckGS/IyWkWEHperOhhIr767rfcebKtsAn7pypIW67a93D5ZmPLjd7e0tX+kl5+5rLVWkl/gQn6UhXKQWbRlP8eYAhD5p3o4h/dDyM3zCZBz+MiQNWIEHEdfcUYokx4vXeYcwEULBQaGImCEpUGGYEBj80T8aJmZdPiUgdyTUET85HhkDhxLU3WHR9rauW+lOrSflbuVHINeCJqk2JOgyYXpqYtBmiz98DNEuXEox6SQeYGiDMHMfYTLn0mJ0PyyuKG5k5BDqabABt8jCsmDkCkl58slC5IySv5RLxEwf+n0qCO7LHX/UlnAgPJZRcQ7Vk+UxjbwpjZ67PjWBNdC7EawgmTwPfwr5om6O8gNVUtN1Ust1Stt1cs2TiqLalQW1KgtqlldcudiSe3ailrVFc3VVzVXs6uuql1f0zz3tbV45h3h2nXCP+4W7Zbj2qwuOx2nWVm2cz7lRee3pEZpwc9zxqNhHBqqlZuqFnGNwLECroWGca5ZqVdtyHBudSpHHDHlctmKNd1c90yAxSSYFaKVE+9ihUsMYKaOYWz3fczFkV0MZAQ9E21ty2b32dU3if6GTIkl3jI7+n+Jo7/GmOl1tWrzWl24pPXl61pbvKwF04Y6oT7ijP2I5bTg74zX0r/kfw6fHkSn13UJ6eEAmmJeu3jGlfYXz/j4RyAYwrxD1yxxhh2GWvBaquM0kA7wLm7ikrsA82RMZtgjZLbjMBid8Mj8DBhmxArRwDVwOsP0iweP1ZKJxS+IE+0pKBePOXGoISBeZXGhcXSMIww+KYmQpiHLqV9epjrN6znVv29JJ/gnPT7uqPnxaGw5UtDa6qp+93vf09/9gz/w9ft64UsvaGXZMqHiDuFgZJnPKnM6+NYn7lyzgivH5KyOcUnWY5yz+pFVSoTMWCRu8jJFMYF4adkU8s+y0i5iRZxEt/SBdadveYQdwKq5oTtIrfaCrl5/Sr//B39XL778DZUa2YfXkXvOiDRJYxa7L1mHCpC28zD9IBmDG+uXbuiZ57+sv/MP/mO9+JWXVa3Utb5+USsrKzEBgm6LSSy7z/sECGwV5aTMplNnXNJbdzc08H1MLrnjz+BKcJArkW+AIJdGtm2alZm+cnPFfubQmGAzcO+bRHsD9R11fnrxu6SncKlzmL34woDbIoMvpapeeXikP/zFQx1bHyNTC7OR9fLQ9WLON0/HUVc4050jseoaaKE0sO28qBdvranT6akziEOKIgxnbccAHPVVKsfEB8ciViqu28N9PX1pXisNjupwB5uBPvJ0aI5+iR2ADJg5gWm5FoNYu6OSfuLO9L/7xV29u9NTtzwfq1qRDWXH5cgP+CImUvwcg+VmAI5JKrmzX50NYtcQHwVOE8LmoUpMmYUsikkW5JrjVaZdXVqo6NrFRZc1s30cLwaxglnMi84XXgyZeA6/AtDqLwMGOYaup63OSAdjpqKRw1kcCBwNl09aT3Wh0QjZfzAcxUAug1nUVACTGr5fqJa1Vqs6nPTwsK/to455wPXisAysmItCjjMBUgrbhLjO8DMIwX4ZaZPuolzsMqQNUVLT10Wfa7d0zbrkqacuaXV91f0LW/jm5W5tXoOlS7H7gwUIC4sLWlxYUKvpfoRlJxw9Hg0si0eqsEvXKXJUMXIVfo8J5b+ibv99wmn/mz/qz/o4MPE90iO1Rvs5HBMg7BZkYQwD5jEp4Hdptbd5ggF0BvPROTYMUiuOhNMl+yEfcv988iMvPvUQzzgH4y2LMci/yASM7/lGRsH2DOPPI9Ow7/wmvvZM03ElTRKg9yalgk6wN6p+N7Z8sd2TdjgU3LPj4+VT9RwWvi6zU82ytly2PeF8jodDzWwvDPx+5PzyCYyRkRq73k/cTrp+N7AsH/r9wO/65YJ6zm/ksExtIfcYnBy6LMNKMd4NysbX952S87YbmN5xtK3TYWB14rR6loMjyuB0KLdv7TI56fbH5AfvB+RTdn1AH/MQPc6w5/wOmR9x7agHovKfNMK+z9LlXT4Ay/s4xsxECq4PnWPZAM0dZmraHDtkp9WUrt7Q7Poz6s0tuFzWBsYpurYx8Gv94OTiO1hkG3WcsMhzOoX3PXwEgD9dBpP3I+8AAYOSmzYLfSbwNpuzLDGrR0fa/8EPNX77PXXu3dfg3j3133lHs3t31b9zW/27t9W7d0fdu/fV39xzVTRVWlzTpOoE4DP0LjzLRBo0dqrgAh+c9tPCx+7jlvsTgzMGyfw+cEp31BCoYZmXzftDdw57ZrR37m/q4fa+2Dk8Y1dI6IEUj5jUd2E80Gq9oK8/dVE3li33oEX8nBp8YP5BooRuTxGfEED7vMT8h0fhi0SBf38TIHaRpWNBjxiPiafgDSRpd1rSm4/29cPX7umnr7+n435fI+vo5YV5zS3OW25U9PbuQD9486HNxqq+9tQFrbUr1lVFjW0LJjlNmgknZDku2iXtxW8yJM7hA8AESOE/+ae/yFvGOZzDrwUoVJgmOtpugMwCX2oV9D99+Za+e2tRpVE/AtEoYyAN4zIGNlJjTAz3pBqlcw9lkAmHKEwS0AlfjK2Rjvo7evPdn6kzOdBg1lGxbqNm4i6GjRlWTiWgDKlM+TVTf77DD5fe5GEY4IkwmRCNODyGALMgjij+B17GhXch1ADuUap+F0IPhUN4BJ1dFIVGHWHjRVzx4ZfSireZj1/H20Agnultk0YyhvBIUVARpVlDteK8Dcdq0CFWm9no4BieEo6OUjiXxkYUg034E4ZjN0rFug0QBsjA32EIG/f8JxxXv42y2z+KnTAFR1afJZokxPDjlwCMMUi4TWWOnTF+TtTjvM6u/flosINYIUU5T50NKHp+j/mxujvtriFt4g/sn+jCoCJh05XbLB7Zmz/wj23bEZ+tj/1wthYj3fQOHFI4VutBk0jAkBuyDJyYcu5wtNWozqnRWFC7taS55rLqlTkr4RoH9ToEhj50SpBoxVbmVPrg8eCxc/h0IaM/ENUbHB7XYHP+5XUejv9+G368o87wA1JsXmGsRfzgeuDxfJJPyDMM2Cx+yhV/hw2+yDLOgXYDD2bhI4UI8oFwXwAII9nt9JRyvuHpjBLpHpcolj/ZRVhTOaNl/I8E7HhAhscN9/izCi/lkQXwBX3JQChp/ipQhyEvncdozLcBmCywDLMRXiqzapEQxsLRLVoibOwKcLIWxRlkJSJQBuDFpC0DXPjGh9nNT3xfKlD1++ikRzjnH846kStWN3FK7pwWLescmsEOBi2mReNlWcdRC1P3lEfTgurFpmrWEXyInYNZJqyUdz6kw4RuiR1tRmJc7jhOz2mBa1nTCUssrHey43gKg4nq1XoM7DEIUKa8yFzTApkMhGw1xPdOTvX35xDcYGN1vXXrsFDXo35B/+xf/UAPJ22duLPl2ghemDC5ZDLEwQYM4EzGutqe6Z/87Zd0rV2OnSFFBtGxeUxm+DckhnU5nWWoCu/gS5q5HGKYnDdfJAgKlGva6E31//nRXf3JWxtSo+02SAc1G+R3fTCYMOTbCbaBoF110tWyjvQt28zf//LTWlxo6v/9wzv6s7d33fl2HbrDW65WNXBHN3bn2Y3HU1Xcfli5Wu5s6h99+yn9rZeuqDkbus7GMRg2cXYctZK+Q+D6smwYWiZsHI30wzce6ufvPNTeoGizoc6UhktQMB8YO1cdg1nE5RzwGJxzGjFkO+7F5MeXblxStTzTm28/0NBtdOQ0OGKGleMAu+NiWM4s0Bru6feeXdY/+O7zmjN+TASFhChWXBbLD47lig/uw0+nQukcHoNcbuVyjGvux+6PQ9fBG9vH2poU1Ddd+XBzhfY9dvs1SaeFgZqu2xfXlnV83Ne7nUFM1MUxquYhkuK7gOXZyO2+qi/Nt81v0h+9vaN/9aPXdFKad91WQ/ayAyQ++Otf2fkGYI/791mDwJiyWCZybGwMXxfdP2Cy3cD/cr2pF565patLbbc5e0yGmjdPr3R30FTqttfUY8eHdRw0YqCQHvHIIvWo09ejjW3t7Oyp23dqbk9MKrJrgCNNwrZALjwBiAmQwBndTklMB+twaBEOXitaH1uWjI2zSaOq5c7cpK+L4xM9NT7Si9MTLQ27anBEkP1Lbt8xwBcN3CmiLxz3TB9Q3mSRIirQJ/lRSekbIrx3dBy1YSLGsVHVivrIlIplmPVR3/EbKyuqLC+FX8HKHrk12t9Xtet++/6hWlcvazbXwhhSYedAk809NY3aDDujbpwurUnz85Z57jPtH6mzu+c6sw2xtKDK6rLGtbLLbvnsyprs7mvY7ak7Hqh1eU2zFvtf6MsygWjcXYfsvKCMJedRPulq6jRLC3Mqrcxr7HSR3Sw6YvJwhrwzHeoj20APdjQ47mju0iUVFhiwt410fKLeoy0Vun3bRy77cCgZn1KrodL6BU3nmlE/Y4eZ7rjMQyau0UFM/tBGk05O3/TghZ8sjMdMkgTtE/2xy6gNbDO+68PRdvBjlQUyrmvsPz5sflAu66Td0tQ01dVb5vn1mPzgm6NTZzy2LqDfzERMxa7M1ggwMI8563DUK5NQ5M/zxwbzC7IP/XbB7Wv83/y/1PrlL1QfH7vEMw2si46uXNfC//I/1fb6RbdR7FbjaUdtlTF1TAvHtOHj2hv1tPRwSxv/7L/RwmCkSavOZ7FUPj52U7f96odyo2bedBfbvDAuNdT+zu+o+N3v66jZiLYzsd0UR0EG65uY2MvGJrg4FvAASULC408O8rx/tQJ4w5Fe5VpDXbe7exsHeu3dezoewFOWa0yCOhTjOgFuj2HLD470/IWG/tHvflm3Flz3lo+kFUdbZjRIOxGeZLkB5IzxMM8DuU0WNpU5g+M9actF60AAuTWsNHR7/0T/4t/8XI+GTQ1NB065QfsRHii77udmx/r+c8v6+997QU23VfQoEP29oDVlp036at6II9OcbywgNr++sXGo/++Pfqm7pvmFy1c0t7Ks9+7d1VytpWuXl1SsF3V/p6t3Hh3qq89e03/01Uu6VOyFrGHXF6sV4C44nLZVDM1FHr44V+T5h9X5OZhKU2up8wmQc/jI4PaEyscYZwyiNjjUCxeb+p99353nOXeYRjaIQvDR7BkqseJCAEQc+z9RRWDJgbYKYBDHAiIEY2aEocAqUwv/fd2+84a2jzfdSbTAqVnIxEfQHZftk6TzAaCk/E/w+L0B5eFix6A65Y9XpkpmpCC68jAItEgr/vgHXtCMl9k1HGrf14yeuYKNDlLmnSZWSMOO1MjLeWJkciV+fFzc90xS1EpMUmDg2Ty0AcSW3jij2sZ9qVCLnRMVh6naMOUseQxBBDHnC1Pn6YiUyDFQTWXhajwoa+CT3nMf5cuegg6Bc+YT4TPcSMcdNeifdwZ5hxGdjGm/p9cdcbJ3JMY7P8VEAKtcsro/TSKAB9OE+Dw99o680o8BumEYvAQ4u5IHRqAVqi2zCJ+9j2fS9v3YinGSTaAQh8E5BuJSeNLKMgRcV0wKxfcfmEQqlNWuNuPIi2q1Zbpz1JVpb5Mzdqe48xu7UZwIdQ4tMPpSBwMcTOng8Zw25/DpAXzvC6wZz6lzwH1iVSoMX1oIRhhvkJfwNT4MVJwZ0qeQtfXkl7sMch53Pu5S4cFTuHSXy+MUDkjPQGqfQEKP/3H3hQJKTEcRiPZveqdH/p/RBMnEHb7QFYBkKXyiagqNZ7w2ZHH9nGLjTl+GPMvDPO7/QUBO8x5ZQnhkDrGYkKZTmiambRgz6UCn1s9gFEceMaodPOZLwGOYhKww78XLvOzpmoCrw0e4xJ+5fKfMsQvSncPoBFm/xg4Q+8URI3YcCcFqvaI7y7OR5ZN1R7HCSvWu4xCPDkI1mwBxuUo9dz6HjstATVmjEQMjdQ1mwyhTxX7TkfMwPcrulBNuMh6EyssnPJCz+cDh5xdcL64jSsn5wJNCXcd++Gf/+kd67biszsyduBiEcf2E3UMdmgdMw7HjrZQG+ocvX9PvPHdBheFEdQZFOO7I74JznDz1lvg6yYlk26UJEJ5S7p93Or8f6DD3KnX9+O6e/tsf3I5dFnxkfDoxL5veQSn4z36jWSVWVJsp1bY9+Z3rNf2dL1/Slbmq7ZOiXtka6V//+I7e3T7RAP1eq7ldYDO4PqPZ2day7TUb9FQfHeqllZL+8d/6mi62y6rRGXZ90SmuVKu2Voo6mdCZr+qNzRP9+Wubev3BvjgCa2Bbi8ks5MPM8qCW1ejI7XOCHcQkqn+z6ViV8VBNY/PCjUv6zldv6PDoUP/qv/uFreKG0+abB+AF75kLIt2ipcJM1eGRvnJlQf/gu8/qZmuq8qQf/DYtcJQNQ2bIn7QgBXlzDr8KyCxkF5Bf8eM3sv294ep+betQx6rHswW9bfSyJparpZLlpeXwvK8vri9qwzx1pzeJCRDXfErP/FmyvcBZ91ebFX1psRWt97WtY/1Xf/gTbU6blr318GOgmrrGvIijc1zH+fedPmtAV8P/XXwG7pgAMa8XbZ8XhnYuoNvihYsX9KWnr2neOmXYt5/lYbswUGvcCRnK5B8TjMjOMTqbPi/tyVekYt8ydGNzT+/dfaSTvvVf1W0FfUh/C7ngfmSg8amDpbnLTR9hYr06Y+eL8SpP7djJ7wqduKxxTBa8Nimqan6yBLJE6mt9dKQvjY90fTTQ+nishXFP5Vhc5rTgOefAkUAmhv3Q9egi+/kpdhf6FXlgT+STH36Kv3hnewW6MFHEIGXfD+OKLQPj0lq/oKUvPafmtSuWjezc8EvLFZ0ca7J7pK07D1RsNrX61S+7z17V+M593f13f6HKkfFjsHptQet/63sqraxo5raw/cOf6uH9+7pw/YouPvOU3y9LpOt2pJHd4bF6O3s6PtzX8lPXVV6/ZMTQneYHkLRsRu65EOFGDzfUu3NPtcsXVLvusAEOD1Ew1xigxG7rTPTwBz/WjsPe+M63tfD8007HenlzS/f+7IcaPNpRzY/I/onto4vPPa25r70krcxLw5GOfvwLHb36toouFzSNHbZ1y3rsK+MWx5GBGotSoB84Rm0k+mPjxQSXX8O/TIZxjFnV70oudtE64sih9xpNFW7d0OzmDR0359UptYLX0y5R9y9c3wwLI4/YZVOhon1PDTLpE0dFUXSnS/5x+bhgfv24EyDgUHT9U1d9ulPm76bfX7y/rc3/63+l9YUl1b/+gv1Ng61tvffGG2qvrWj51k1NGw31H21p+xdvavl3vqfB3/w9bTesm01rWDfGuvKCOS/nakc7YmAdoNzweTw8cTiT2OkuJuiskwfmt8NeXz995R0d9cauO2tx6wom8QiX7Ge7aMMTNS0DvnNrQf/x772kOddACV1ufkVOxO4wt5PY8erYyT58UuA6iTqCC+DHT3sChFvoYTrSxoN+7t+UmvrBa+/pp+8+0LJ57blnbqrRauqVN97Wm2/e1dbusduzxVGjpdX1df3eN5/WNy7WVe8dRb+G3W2Y8rS+mGhy2KC9XYJU3lMczuF9wATI+RFY5/DRIQRhalY0sdroRC9cbuvrz1yy0qVx26UgIQJitUsoBgZVEB6oyyfVKDEWEIjGgUEAdwXiakTBKZSXBV2ZD1XaCB7Y2OBMXI6/YscCmDMYEFcL1Pe5PC0UH45BafuHiyOikitNy6rMaqoWGrEKtlmeU6s6r7bdQmtJi61lLbVX4tquzTlczXaTDVaMUGiJyONqEoIHpAysnI8LhgRPlYM/9+iecK4B2wAcpFS1gdOoNpz+gpaa5HdBy+31+KbE6vxVXZi/ltzCNT9f1+rcVYdbjyOo5hscNzWvmgV4maOjEOZTGwRjd8A4DstXPtCdjsPiA2koD45HMY3AwTjlzmzhsC4P/kYRCnM11qcONZUUFHG5Qm+/cx3Gtmzi+Brjbn6fuwibx/P7GcdVZR8P57ioM5ee07v3u/Cf+WpXspHAEVTpyCyO+MqO0uKYr3JLjUrbbk7N2nwcU9WuL9otBM0WmmtabF9xnV7SUuuylueuaMU0XTGtV03nZe7tzq5+73crbd+3L6lRbpveLVXLNkiNPz0KOibBA3aJRhCTik7GVgyAs/LHyhE+gZbn8GmCaR6ygHqiYwwXI3OQg6nGYoDDFZO2x4YpYznDChpWwCUjzTcOS326Xs34caV+wy93pJM5p4LfKUT4jFGcZrrHP71zFLv0PosdLkEe8IsFSQoll9M40S+nk99kZAzZ4ytPIYK5mqjpl8IE5A+naWTtNZyFF9+6CCPZ9UW+5pVMgv2Ki2MRnAznR6cdH45eKtlV3EF0CPCw3IvJD14aR46TYMI6+uykEcg4PRggywvtkM6adscbPODT4KtM5hrn1Ik2/pQDiHDWnO7l0t+mPHHEAnI6FdjO2tHB6QinD5gj6a1n7cnkevRNjRifQWDyFwi6+plBEm5yPVsqWKe4rONp2uEWn04wPmnVKAWnA8A98Y0xBTbk91w/nwDfpImvKQMRrm/ONL+309F7BwMNGPCGtCY29ZKOQnMtwCelgirTgZaqEz13Y80kLFivmeamcRxr4eRIPTganoj8zvg7yYv86YsFfG/jcFzWT2/v6417u5qV+Uhl8o+zmjN+SwMlptNkorobwrOXW/qDr13Vs0tVVSe94P96u6Wtw6429zsxgQHh0/cyMsr6OX7u+VI/o15HF915Xllou1rTMXF8z4Xxx5FtvO2u9KO3N/VHv7ivt7Y6Oik0NSg23LZT3ZXQNa5j7Ekj6nZv/eT4IYNGPVWGJ1oq9vXVq0v6m19/SrdWqxp0Brrz4EBd221D81TBHfHYzQquWYsvOU1WJoPj+kJdV5dsL2UfYs/lIxyVgPtz+Msgn/jIIeSafxPLza3uMI7Amriu3fCtB0xdt2viUBtMYy01qlptVXRw3NWRRSHHGhGfVN3yo6+Gvdx2Xa01batT99ZF97cPzT8ThosiZPo+gm1hPzGZHSlEPX5G6y9QhxLwJOyf2hvqqWqlcmVtyX0e863bBZPAFJyjAplo5/tKE/cNguchiJUj9loMPs3g84n7V2W1WrbXTbdOp+++pN+XHM/pMYBucj8RoCixO8AQevuUDhSDWjX2LhN0QC5YGrhfbz1hndutlNV3WQfoWNOLD4IzfYRGQPdMSy6j4+RjAFgAiUZOn/TICmLjB5/ZA5e/Q3qwIKyMTDGdB5YrcfSTiVWdn9Oll7+m+tM3NKmW1Dk8UP/4MBaWlZcXVGo0LHdmuv3O22q2WqovtVVsNdQ7ONLR0ZGmtbKa19fVfP4py0j37R9t660331TR9Xzje99S+cKSBub27uG+Jl0LTovC0uKiCpVKyNkhctjpDzs9210jld1W7OGwA/X39jVjp8jeng5OjlRy3vXVeZdoprHD946ONep2NDo+0fTkRIXDjg42tnXU72vh5jU11xZNbzdO80yv01F3/yAWhxRr5pd6VQvPP6vqpZXACcKePNxWf/dQlfE06B8L7qgBiOt64QJbJlsK4iZ5gPzlERsv2XmJB1JdOYyZGf11YvvypNnS7MqN+ObHycKKTkpVjSxzGHzNj1FFzsQH3F2J5BnfMCEn8rCLrJOP/39CoAzwjZP6aEdg+RpoYec4nOt+Mnb7NDGbByfq/fJ1LVy9rNp/8F2X94Jqpverd++qduOWFr/1TQ2euhUJDN6+rfn1dQ1vXTMtkAnJkXnS0Ni0ziZ4Oysx73N47PbThmhjvoIVg//5gtrgCOxE6/x96xK++7F1cOz27ZZbsR3DCDslyWxAorHIFVtluTrT164v6LkrSyoxhmMqRNo439N35ePpRPyN1P/HBucd9ZAqANzAJ9kgyKe8l5L6CTz/xo7AylzwAy6l4LjEdz5Oa8X229eeu6IL1tEL1anWF2tam2vp0uqCbl5Y0ZdvXtD3Xrip6/N1zc/4dpwtQ8vioft+4EI/kfxSnwvnZ8at7A//R/nP4VcA2XU+AXIOHx2iIdOsLAjMRAulob5xY0XPXF5GE7jhRZOPK5CEAo2VGeEkPID8/acJSSHmQioNbmO+JQ+Qt5CzcRe7Gmo2fq30q7VGKP0YOEGrYzVYKKbV96wEsAnCNmpfixaJJatWvilRK8/FMUXN2qJajaUYCF9srGi5eUHLrTThsNq+pNX5S1qbv5yuc362W1u4HPfL7bWIM1db0nydb1wwWbKgVoXvWiyoUWYiwkq/6GvR+fmKHx/IblWXs+9nrDnuBS00Lmhl7oqWSdd5MdGxQj7zV+K6YnzmjGOranydRr3UtvHr8riMJXfwmUwJURsK0PSAXAhcky6+PeH6ZWt9Osoqd4Tx1eEQ0AyAoUrSLw+V331QbQBnfJTuksAP3vOV5+TnuPCWcQhlF/d5TIC083x4+jCXcvigC2XlOyYcYqeFFUxsFee7HFwpH/f4M1GSTXQRlsku/4/n0/jZtZS/97sS8Uw7fqTDc8rD5SA8z343G7usDBY6NEZoKj3GSVSGnfnXCIdidPlZzUAIwlGWc/iUISe66yaO96GuGKS0szR0vSajCQ7O+Yz/TKKmyWLAcYqpjhOPZnwa6WX3py7/5c9+TyclnD3C70N+WRuN1sgVI8rX1IZwXzSgDuyiDeV6AxmUiAilcoOTX9AowkLx9D4Zozg/E+6DLsVKjuinTwmift/n4IF09T/rJHfobIS7Txo6Cz5hVV76zoMxZZDqtLPqt+6kpA4riVMeEOMNmae8Q67GTLKFDBDFDe6Ma+JQu9DjjuNypDTQqQyKpd0AiVfT65QXz/A5SZq3wavMaqlePE8nTMrDcxy04rRAg6h+Gx0V1wU/ZCbyNgaFOcaAdX4TvkvgNMdOiavLTxR0NuVNO2T8HDQDg88zQHt4IOlI9MDRqKRXHh2Y0tYhrguOtkKbmNp+X0o1Zv/ytK+5wkjPXL1k26UUu3sLHIFFDTFCQhWTNi5qhhoCEscn9wUE89Sjo7F++u62tk/6GpjpOTudiQQmQCBducgkn/nQNGRQ+sZqU3/769f09EpN1dHAtQHPVySOvHKIu9snOupnq3ldD9ECnQ51OnE7LvthOkkrEjn+7tpKy/adbVCnMXJeXdfrO1td/eCVu/rxO4+01Z3GER4DsnEbIc3ZdOgmO1SVASHjya4VjrygPNPR2Hj1dKE21VfWF/S3vvK0ri2mAcahbZCdk5E2j06cF0dk0KacMDKBgQLsZybOzCd8pPfSQk1PX2zH6kh4CXkakiDYJcmJLyzv/BpAe37cBUR9FfXwpKfDselcrNkra5dUR3DKVBXXxep8w/2HovYOOzpxDXCsUdJbMWQdaTKA1bS5sdZmsZLlg/s/h71J7EQaFTjaybrD8WICxHmbs6PK0mDQZ6/uKD16DHt5WhzZ2XPGxB+tc6ZGtahn1umvMXHPCmiHQ7dm8Sg3fVnHjPAmov8sUe0HPR0lXLlUiW+EEO+409V4bGnrdKhGUnsSQN6xgMH3UaehCXgyRr6EfM/sQfpr5q4YOB65beP4LkbffuwewIaw1FCVgTlfoRVpI6wiB+jiH1YDOZAafimfMxfe/oUNjDxxGL5dhIUwqzply6jWqvuzzz6tYqOpbrenu798Q7vvvqfO3p503FX1qKf9N25Lvg7dLuaurqvUqJmXa9ra2dFsrqFrL39F5YWWJg6/+7M3NTjq6sKzt9S+fCE2RZ7s7undH/1MnYebGuzsq3jckw6Otf3WexrtHanzaFcHj3ZMj6La62uWn1Md3XuoB798PSZUjrd2NLZcbl1cVd34qjvQ0bv3tPna2+re31J/Y8vXTQ2dTn/v2BQravH6NZWX5kxb07JSVt1648jhBuaXkUkxf/2yFr78nG8aMfTAjs2je4/U3dxTuW85bQKGXECOR50E+aJWw/4MskNzczE2oz1ilx9h/L5imlfp2/uenSLHruPDZkO6el2Vp57RcWNBJ4Wa7a26xbVtPOuk0BGOx230+uEXBLvjh3y3y+1LOCFd/e+TgNOLtuXkPtoECPk7nssVux6tHznprm5C1PYOdfzKq6qvLWv09DMaVG1Md0/0+huvq3VhXe1bt3RSrWtkvui+9aYarvPhzWvqYx9l5UF3puNuw6IKF31v2oC9g/7AJyz+JwLjA+3QCeBnygQ6yDF2NHRHMz3Y3tftB5vmDWSgW7UrmDinIh7CA8g5x7+6WNN3nlnXhTYnUjhdvyf95Cg/uysYX8M/i/tEINV/XgHIs7yOqB1okN7CMRlNfmMTIPyn7GftAlxizMjejWZTrXZdDbfpGn2kqfsy5sGLK8u6Zhly68qqr3NaaRRUZ8f7NO2YjV11MUaQxnZKlr+xwz7LnzyCJ+krPlHa//bC+QTIOXwsQKjToJGMCIErcyV96+aaLsw13cJpcKy+jBCp8YfiovEjBhGeIXZI5NMHFGIRHBFAaZY0mQjgacHtd6ygZNsfBm2j2Va7Na92e05NG14LbRthrWUtMjHRXvXzmt0FLc5d1MLcBS35urywrqV5rnbz68nN2c/vLi5c1qVFVvj7uXVB83U+AL6kZnnRHZAFVdVWZdoUH9/Glad1+89pobmqVcdfbK443kU7x2+TRnLLLSYw2FnANe0uYNfG2tw1X6/EfVwXrzmeDarmRbVqK853QZVC28KzaVdznqbJmMF704XBJju2tjJggtxPwtz1aeHBfdQlkhyIV6Zt5mIlAGS1d1KO3OeqIf8Bj/8HiOR6SgkmLwO8g8BPjtwt7s2MsdKA98FfOKeUhclXD4eLtAj5QZfKkt5/uON9TErwc575oGYyMLNr5k79s3sjYmfMoFm4ZCw87sLwdx55x+T0Pp7NpTbabOGarJFbdBJOB0YDv1SWeIosE32gScLH+NrnHD5tcL1ghIQhwkBsNvERXZ9ksFDPqX5oIameo64dMsXL43N9vA65/2Cdwj0Eg2ucrsOTamp7vmJ4xQ/+ya4xYpIcE20pLnIx45iU5BcLMjqFkey/sw4dvokk0a6CfilcTH5kV9pvmuxN7TePFVe/TynkkD+7DtxeudKuo74DsroPl/ynNng57on7mFAzq3BcDXImJkjgM3fAIrkMB66sriT7KEukld3bkxCBh+MzqBFRwzcNkoBXugZnxZW3KT/imJez3UuRV+ThN76mYwiQe9CHATXHKw587Wo8cqe00IxBXSZQiAcdc1mY2gF8yaC9n0HXvhAYuUe+0zEDuTWbH2d6Iz/6ih0mTAQFBO0/DIjzl737rACEofSmHTR2NTAhxAddf3x7W50Jrdr0cDE57gJCThnIyHQlg1d189Wl5WWtLrCr0ylNRk5y4rpxTMLDAxmPRk7Oj7svMhRM47s7x/rzN+7HJFM6FoeJJRolrSdxF47dSq3SVN99/oK+cWNJLfuWzKdMZjAQMbL8rc7VtHU41MZ+J+LE0Z6+S6v7U9uhfcburnJDnU5Xz19dtN1Xi8mXh8dj/eLOjv74lXt69f6ejqdVh6tHvfHttpnbCkehlbM2CYQNZV6IAVHjUxoNtFaf2a5f1e+/cFVPr7RVs3xhDqdUrepwONIb9zc0qdRdTgBusM5wfCbYGAyFMwaDka4ut2ICpEoHPuNPck4DMr+dbQ4cM+l26n49TD/YFn7d8j2eF/DBdKAX9eM3fpVPWN0/7FuCVlx/DFr5fSbm4gP4ri8Gpi8uNVUxD+0edRwWznE9EZC0CMet67zh64W22/1spJr5jI89//LuroZF16b1RrR78zZyIXaARHwyzHF+shAUMypn9QbYFzy5DdmfOyaBoCdHDHEMlGXjlI/5W5vYz2TQl64su+810djtBR7nWzfoEex69CgDyZCR7+Ukm81tiDShL8+E465SVaVa03A00kn3OHCJRQk5wh8KZ7hS5/lj6L0APD4epKRCAzttZFSy9dAdHFdJnabFXMYzdMTUOoR3DmP/mPipcjTV1PIG+8O841cN48a3QtD/DMQzAEwe0Jndn5QjHwRMZUplSX0YQiagmsxiTtU3pjkfCcdSWFhfU+sSH553Tg4wOeyqYJ4+2drVwZ0Hqh50NNrcV7070ag7VP3ymspzLRVbbfUGA83mm1p95ilnO9PJu/e0/4t3YhB86eplVZbmVWTw23JtvH3odLvaf7ihzsZWTICMdo5UPOxpapk8OHYrajc1f/2K+8szHd/d1Oarb2t6dKLhSVfVSkXzl9ZVW1mS+iPtv3NfG0ygOJ2J8e0fHGq811Fp4HKbN+auXVFled7ldHFd5Jgsdx69444mjaoufuVLql25qB714PecQ3B095EmOweqGt8afObK4rgndu5CNlpl6oNmdPU/eJUJkNNJEntXHJxjq8r2QP53rB86c22Nrl3T7PoNdeeW1Sk2TP269YX1h+XJxHJl5nBMxLBWhsWPjBEglyx4In34iHqMHQHkb0jX/OljgBMM+9r5tMcjTV57U9WtzZgAAVjWMZhfVP2lL8cECLsco/8P+J6FHmFDus5Zqtqwrq0fn+j4tdfVWFlV4amnYmJLhwe6d/eO5i+ua/7yVfN+VbO9fR29zQTIBenWDfXLbiOk76RD/zFA7uewWV1E+gAxWcWrIIzhExT9r4O/Nmnjg+w4c+YBZJ15jf1qD8zfb5uneiO3fyZAXNfYzyUzJPjDl2EvuihF29PY3M+sNfS95y/aZjQT5GU0UH7aNIsv0wLMJ20jOm+QyqhErUEDeIkn5F26S7YQz7+pCZCc3vzAIfqI9kEmRl+cBmrORWZiG1mrENL62HHtyoWx+zZ91Qoj822a6OObbhyjykKWfFKLxSXUJH1B2ja6CTlLbufw4XA+AXIOHwvyxo2yK84GurVU1feeuax5G0k8hyAJIeFGimIMpYvQ8c/tMdp8rpg+bQB1S4j0Q/AhJYyLjYdwFhghsni0mC9bGfANhpo7mq3anJbaq7F7Y6m9pqW5tdihsexrPDMp0lrRQmNR840lzdUWYsdGs9JW3fFrpYYVLxMbFlxsUeM6sdEVkw3cGx+u/iUDFCFp/JBkNrTo8HL8B8dXVZ0WR1DF0UvVdsrH+JEXrlFpGWeOaGq481OzcLQBY9OJtGL3ho0eBGxMdCCI40rOvkbdQSieM2UZ9UXlpXoNhUK4UCK+gichwz856Jvu04UgzspXp4pHSjkuaRAueUVS2cNZOKfn+7Nf8uXf49fcJY8spPHM6zqVh3tfKbfzTZ1B3wcKH/6LMsb1MQdukQfpcI935veYSy8SJDKlMO936X1KA5f88zTCvgA/o4GhxWs6YXibMfBMtCKsE0i0958zBPMna4B8kYHK/FWghvK7qExfqbdTfo9LVunhMv/3OSC/fgDsfRYqu4M3In0gvz4OmR9hwjnfDwv2GQEoenoX5eBfcmf0f384gHpIt9wx8JOuQEiBSAwZQqtKNEVE453nE6QLnZJomN75X9Qp9/ind+9z73sgDyByCZfipHikF98SsnBAJuTgtyEv8m5HHIdkYPAmySOn5TTO0vZd4OYn5GDgzW4OYrvEyMkszFkcOhC+jTjW7aSXXhoSfgG+pmDQhDvkEjqGe3ew6FhwfAurmfiQqo0DjgoKXUT2Dpfy4QHHvf2Qd360hgx7gvShAUZtko9RU04PBBiccm5OKNGdK44QAH6JHuk5/f+sAeWBQqiDkmkKTRiGn7n3+vqDAx326SCZXtBmxu6BdIQYA/iFYjXxiRNYaJT13KU5lYcD2z9T1w90dTfLneWx48JX6My4iwEOfBLVoq4+5wCPJf5NZaaT/+ZmRz98b1fjUi12zuQrZUt+x6pTm2+ui5nK446ev7yg33n+itZqBTVIx+kRLiY3ICCTTa6Pze0DHbvOxgxAk4ZToC7KbpvpCCJ3mx1uMB5rfWVRjVZN724f649/eU8/fHNDj45HUmNefacZh2OV3UU2b0SL9yPtzLlGORjYAI+KO9L1aV+rtam+9fRF47muG6stldwJx/RjYKRQLRmvnl6/vaFhoemyMfgDLYK7otwMwEMXjo9dm6vq1kXbqJyGgWHtXEkHqQLDwD9PChAHSX6AShqg4NhQ8EslYmA8c1l4gD4NgwxRZuJH+SkbDwRKMpJ0IxW8eEj/op2QBoBP2PrY5fHkmG53vE9pEI6Ji0JMerBKm10Ex4OxHnWn6vAtCqjpqKQAnrjqdKw5p3FhoU5la+uwo+Gs6vpi9zp1hhwmVePi/Ksuz8V2NY7YYIKM483u7PR02BkaF/Mg/QV0AfUbOBmzoNPHg6QPU3nzcifI6Zb7pP/hm8V5PAYObBigZ9A97HoTGByRb/yY5UEu0sbc2jSmqhwCulCBM/Np2tE5Nm16WmqWdOUiJxpQz9YfphV6lh1N7J5i0Ilvp5Dx1PzP932Gw7E68cFz97Uq7t+Rv38cVcJztVLSSfdEfctVPhk9o8+V8RUJ8UNfBWqUwaEoEzsuONqIwVwGHnPaJ/fxIJE9cddZSjndyZn/PBsrl/fsjX+U2/wZ/BjfNDJNWRxmXmCiDR0+sxwhLtxBXTAxhI1EeXDJpoKOpo2LwyArbSKOZiIcfv7l8mlknmNAmV0dhVbdJK5pcWVJ88tLaqytqtme0/ikHzs/mMQoWAh3zcdzly46bF21xQU119ZU40ipwyM9+PHPVDo4ScdnNqpqr1+ICRC+nbR0cV2L6+sqzrf8rqbjXk+jXl8NCMEiE1dY3bwxf+M6ZpIGW/vqPHyoWsYTVePXuryu8sqyy+T+vttOdXne4dfVurKmuSu+NtoaGdeu6dC+cUVtl6HbOYndI5w40ai2tL29q9LSgpaff9plqGp//9BsXFHNaXbvbWrMR9At+0vURWFkGe9ys1jBtGNXByeqJk5Jv8RhfqaOTG9427eu36IG5t+jSkXdhSVNrt3Q7PpNdeYWdVyw0C43YuwAW7NQyvqcbk+JRwykRdqR1uN1S92f5c/dxwZHjeHlkm0Q5zdnN3zlFVU2NkyDOCzSGNQ1bC+p8uUvqzM/p4FjMHFbYWGMGQpcsA35cDltmKUEteOODn7+ZpoAee66JpYHhf1jvffuPdUvrKtqPhib16bsFHnztvniskqur5OS87dYYPIDLq2gz0I+UsakG4BoA9Aniv7xy5/LypyOia54ZS2TKiBI9i48/Y94KYbrDllP00W/WWapwvB9Rbudkd6481C7fMC/ZDvQZUHWlekvWGhGGew4UpV2jG2z2JjpazeW9dLFpvVMGvNDbsURmn7KfyDDO9J4cgCxEhUAcOEupJPLyjXIGyWA1r+5CRCAkgdbZI53tB3+zCkxycSAI7olJsYxxoL+Dm95E9/oAku/GyMcM7wDZ4c7pa89wC36NvgQNO7O4cMg+orZ/Tmcw0cAmq8FvpVtxVp20QbEkg2FKsp7OrJIRQi4mWMYZiYbRlwYcI6DkAgh/QQgBlYy/JPQQIXZZUd+RJOwkOd7D2ztnI0cko+ujqtWtC0VBzUVhjUVw9X9Duf7kQ2dUSU5hy2OuebOxqFdyekwyZEsSoReEk0JF6TZh4mqJMDocIfJ4biztMTCBs6Zi3THDvOYXwl/yhtlRmBnnSMLWwQqLoeznPGDLrg0+BedMStPapVORBIbkVLm/IxSCPzPXF5EXBi1OL9JLq1YIU1STsZZ+iVw4NydppvhFrHSfSbqjUG6Jv8M4tHxnHl8bB4HrvmVNKmLuPoSfh/mUjnPcnm/C7r4Ls8dl/zOMAUi248IKT3/z+oj5WTqseoiwIlaOec1SltLOPM/93kci3P49IGKx6W6SXyUaic534fhQljqOW8l1BuQtbH3uTzND0LimOAav/4gr57BWbgzl7V3ruEST39+IKdZToskF4HHKRNAW8t0A6tz8tpKeitPw7Vkj7RqMtGQC2F5i1+8d/BUk1m8CAtwJZ+8fT7mTmUUjvpPcc/AXRrL8TR4nQ2cRjh0rntm7ijTkQFrwiRDP8XD5amlUoB3egskH0sOZLqBMMgQ9Ebobj/nv+CUQAtfdE2G7/uEXaaDGCgBN0dIK5xqmo0bvlpPFZj8QB84VT/HxHxQ0thEPQwdjcHgiR35kp7zoafpdFkXCT0YmEmYOf/AH4yRmA7mjka0M79LZczRhP6pDs6o8FmEVL7owJq+ULA0Hsbq3KfXl9RErkxm8RHTWM3LDhrTNA2Pm8sLDe2Pa3pv+0S9Hh0v8z4ktP6lBYxN51jVFyk7RnS+eMNQ2Gebch8V8gkQYDSe6mQwUV9VSwv4e+yO8UgNnkwWeJ4BZDq1dJifWW/p8gI24cj1Yd52fVBfDCxzDEJtPNYzF+vuWNuOnDGBVXOHvKmpr3SO47gD6O66iUHIckM/eXdLf/Tqpv7NT+7rh+/uas+d9kGppSE7A8wPTH66f20wfqxoLXK+t7NmEMw4Fm3Y1V3fzfGxLlQH+r2Xruj7dteW6raBu05jkuSYZRdycKFaCpsfHmDgM/1MF2SSw9CuQn44r/3uQAf9kfGnjbr9mXbQ7zGR88SAWgy8444+ijk6cOcKV/OG1hGihSaTynf6QxIRk8LwMpMlvyLT7RWy0U+kbz+kXZz7b2DwjI9Qn56hT7jTdKLioqUxAcKOLr7/cdwfaOjwoaHQKXbUB99rKDkKg6BzZb7T4LRcyeakKMupjHY8ykQ2fPCWdMCLoxWZIG1Vq3rmyprKk6H7E5Td+FFY1zH0SfrlkwEYUd7kEqS7RIEU4iyX9JRCpCKnd4nfUr1xb46Pd5SUSZDYseFn+J3aZII8NIUDV6yH0kfd+6bKieYrE60szbnAbq2F1FY4Wo78WKXLBEDB9InJX/J3GsTmiMmdvSO993BLxz0+qE4NOryJxiDWykJTl1aXVGUXVoUgQ+sAAP/0SURBVOCN/gJPkDQu1DUDyH5GX2YtKsobkzvkTax4T6SPD3AtVZ/ukCKp5xDHFAeN/Nb5JZYFE/s7y5D+9OERHqZNr9zWZnlRb5UW9bqv71YXtV2dsz/fGTJ/WK6gfdN3N52U/4E5deUH5+U0KXa8TP6MFfBdIXiVo9lq1lkNR+oeHOjhG6/r6OGD2MWmZk2VS6tafv4ZXf7mN7T81Zdip8SMD1SbYY83H6m3vWX56TaxMKfm4mr0k0ePtjTZ3VXFOE3Gfe2+d1t7b7yp6f6hEbF8bDVVunRB69/+hq7+zje18tUvabY8p6HDu9k5DAdzWW4zUBl8419U4tD0sR0zSx+DnvjdpNqMY5SufPdlrX/vq7r4/a/pwve/pfZTN1Ro1t1I0aWuA+uQ6VFf+xu76vTMh6urat+4quXnnlJtcV6Do45GO4equNhxRLLznFmgj/0b2nYaldAT8OPE/DyLnR3BI75PbdWEdWUyWB/fAfUrdgizd+KkXIgjr46WljW58ZQmV2+pN7+mbrnpuqgGh4QFZf5MuxDNDZQ9FEriEYsumMNgPvKr4FxI4rhn7uMDHElrZhKWXKMtUCZf49t3ll/INSZoXXTjQn7GxTwIH8F3gSKImTcmrsORbR+OchtUGuo6/shCc1p1lbQXtX7zOc2tX9GIIylNn16lrE6xpgH2z4RJTlOkZi1s+Qqdqb8Qm84KvQHQXpKNFIT4DUBKN8C3PCWX8gh3mtVjYQ1oiRm7eV1+Jn9HtlWGs4o6g6neub+j7cOOdYptAuPO2Ay0JYWwIV3Xaee4/Vx+bJKVZkk3Ly65sOw8QBaymCYdy4guSeMRyBQmp6ix3yIIWZO74FS7f3+Qibaom8QTPJmm/pF12GDQ2bo97frgsHOD7ch0goMpaL4eWZ4w0Q57BZe7redSHFmLVcjO4yTJCQNPnMNfBYlS53AOHwFov9F4p0PN2bq+aOOAwRF6VI+vRD2VxpnAyf8/6UaZTwokQAglIZIgYRmOcHGPkkvubGfGR3dZNyqjXyILSiMM9PwahiL3ucvCxQ9AORk70MpcXPwyCdb3Qxgj4Xhp5+vjv/Dj7n154uyb3WNs4LiPjCIOkNPtLJ2/yiUljTmVTCr8Is1UgscckMXBgDg1Iuyoqw9z+ftfcWeQ6OiUHr+akOn64S7G1yh/Vi85HZLDL3eP+3+4+2TwV5Qro1t+Tc4QwX41/Dk8STirq/e7HPL6+mC9faBuf014nJd/PYBXCZ+un1WgucUqVwbSXZDkzqiNTAw/jErCRFgKDoUdJsLmsiWTWafxz2RYCsu75NL59+kdBEzfUrGL7hfCBD1CZy3zxwWOucvexS9KkhyD/PGOq9OKdLhm7yNt4qc8gMAhOh9MIKRynMlsgPfGnzKyOszv0qAO3uCe8oiJc4LY32Iw0c5Bgsb+odsCH2jpa3y7KPu2UayKwwWeSQ8lmrkOIs2E82l9+D5lb/7LrshcJpmSDHYn1Y5rcgzGpTBxvrWvIBfpZ3nRWYjOQJQtUk04gBBPDNT4KQYJPuMQR325HFPOCnbds2qMoaSnLi3G0UsM3kKNGCj0O45AiWPDbLtxzOLIdbBz1NP9vRPNKnxXwPSduCPmjj60dqIGZEPSeRA7qOn79Pz5hTRo79I+xifcj0cjjUZuY9DS9IthoZLpZfqOLA/GdgBc1q5VNV/jezfu6LqqppxTZv/YZcMKwhlDEyMtVGe6ttLWUqPi5jtwuq4HOJasoy0lmoMK/ve2jvTD1x7o7m5Ps8acJrW6Rn4/dieaGmewqlqsiLPaWe3OQBh8D24lt5sa+Q5OdGWxqr/1rVv61pfWtdJyHoOu8UnthkE9JxYoNKpVLc/Phc3vVm6f90O0MujlPLq9gY67PbjRKRE2l20prbOnJwXOn3JlMqNsWqeFWq4by5hJTLriXFzQN/1DJsaVgR5qNnc8u9y4TK6kUiYapSaCL7WGjMvajYOEbZlC+S+Lh7xKr1W2HwOPTHDTTnujqTgKi3TAc1pgEMrt0mkn57KYD1nxDZeh3oKLHDb0GvmRsFPIUIi0kJPErVemur7WUKuceBweZbV5/IouZ4wmfnzI6Z2olLt485hLwDu4h5IkuU4dpbriPqcp+otdbwy8gR56hTpi4rfOQoCJ/e2aloV1ZomGHU36HaczUrtR0vqFRT1165ouX1p3RJfRMpEdHP5z+qX4pgdtEXpCe8IwqohcqJSrGo5nun3ngTa29zQYOpTfl5nw4Fg443NxdVkL7aabjeUz+qyMbjM9qQ9kAOV0sWOywV5lJ1H2lUFIyhKUiEo7o80nAxJNLngA95g//4Gkm7ni4xDYBeh3y5NBoaydSl3vVNr6RXFBb5aXtVNdVbfQDD1TLLLifhg718qOnw8C0n4YiCftqD3TMSZNw15AQtk2wI88Lb9q1kMHb7ylh3/yY23+yc+089PX1X2wbRk1UMHCtHXrqlafuSnVsZOMe3ege6++plGnG+2GeYvZyUB7b99RZcAistTm+Dj55qtv6j2nu/GnP9fJm3fVf7gTg9rVdltrN80PV6+6LkjD9QiO5oFwhvjWg6+MfWC5MfmAnC1ZYJR6lh+7Jxrc21L/zoYG721ocveRTra31TUfzjjGlLZuZJi46PJx8809iKKLz97U8tX1SHf39l1p90gVt0MGPmPCxURkUQffCRk4/7EZfloum5+QXEnCMHE28jMfkecYM5gq3lhdFdkNVmzpqNBQZ+GCSk9/SdOrN9RrsnsCu4yjjly+6VBD19/EjBj9YfuRfQJu4JP0y+Hs/W8GQi7T5icDVbH7xn1V3X4Z7sWGYSJ45DbEJMbIsprFMjXTac7lHw97QeLga2xzGphpQkMbt5oqv/iUptfWYjKIHZKDuaZuMKHGMWDlitu05crivC5+9xsq3byifhWZ4IZp3Qf/hlx2WvDS2EnnNIp/djTX3wQ5IjnSIo/s+rhfcq6FJCgyiBDB625VSMiQjhy32TcP3DGfP9racXpneivaeoocgB43sdLkl0PUzBSrrYrWFpkUNsHI00GIRVwi5/gFkHng8VsCwZwQhGvC/98XnNIghzxbbrN3HwySSJVone4BQj0eMnt/GsBPUU+PhTuNew5/GbipnsM5fDwo2CChM3d5bckKhu42jdCCFAPBrS8d0RO+0ejzJovZ8CuC4QsHjwuvnCphVmf3ucvfPQ553I/rgA/zzx3w+DW/z3HK8cQ/v/467vHy5Pc44APC+/Tdh4X/uO6vg/eHTwM6j13fh8cHr3+dO4dzOIdPDzDHi8lZ2dCE6fidyRIckIdLsid01en7x+XRByG163zYK3d0I1I3A2AdTz5hgcOX3lH2nL+PbmbmCBPvziAmNeI9adHpYEibrnb+I0yGa8TPJhSMSyrL43olhUvY5pCXF4cvYfI8uU8Qg1XhuE8hYjAq8sJlv6B3Vp6MEqQbuMTgGy7PCwfk+eGMiRONYz8cC1zPgMyY+GCwLw344Ufx04pkMMk6+VEeX22HxMCZ73OXaJMDd1GazH12IVY4u07iQ/AuSjq3vqBLy9VYtVdhZaSf04oyU4GVk6Y5349hVTPvj3t9vbWxp26RFfsMQhHONHN6iULQlTpAJ5rmGd15+sIBfAe9pxPF0W3FUgwusC5yyNXvoVMcYBSrxh3W7M8Hwlm5ymAy/FxkcMr37O6oOHZpPNFTl9e0Nl+LQdr4FktQGHrnq/xoZ/Cy78otdUYVjTmvvVyLY0IQBUxusmqdQbvpaJQmuqZOg0ktp1ZmQGzS0VxxqC9dWtDf/OZT+sazlzVXKarMoCMN3df4ZszUufri5NSoNbSyxBFByb4/A3CEX9I9vNPt9nXU6dgviGH/3MGrhHtyQPbgCzZBD9Oz7DLFB9vtVBhZrozTBIhpxQAX4RmgLbPTeorEpz7SNernMYc8S9czgF64VIMJB+RdTICQPvLTdRSLpqhEswhDmuysL03Ixe3X+TIBAt8VmOAOWcguHXCcikkbBtXLVVbDpxxjWiNkJ4PvqVwJA0sA12/sDI+JH2NkHCp+c6Fd0rW1OXEUXlr1zipieItcE76fBBLv5O5xeDzhszChf0wL8M0n61NM4295VjaPUnesSJ6MjaHpWLbOLE8KajKxOO2qPdxXe3yo+dJA60sN3byyqmduXNIzN6/q6adu6NLlS6o16mmCwzwbk8oG2nlMcDK6l7VBJkaciZuIcSpbvlbL6g6H2tja19buYay2njCASnnc9lq1qi4sLapaZbXu0PXEt38YWE60ZHKFQgU3+Z5dPPGdBucZu4Mc6JPS/JMCQ9HsZWPhRqwON1p8O2Kz0tQ7tQW9XlrSW8VFbVSWdFJtaeR3LFqAd9LkIvVmjoSvXa6wXShXdsV/bBqi/YMu1klMcLSbLV29ckPN7kQHP3tTD/7kJ3rnz3+inc1N9SYDm0ZT1dYW3eRMbVcMO0eON7d1/OCh6Wh6mh96DzZigqE0YlLLODSsF13fyyurOr63qc2fvKoHf/4L3f/5azra2DFOjlcqa2FxSQ3XSpm6dLoVdoow+WUsYycEbQx2QbbjXONxxBy73967p9t/8XPd+bOf6cGf/lSP/vxn2r13Xyfjfpocp859hXc51mr0yPkO+qovNC2fnfzhkbrGu3TUCZ6P7Vi0R5g/dK9lu+nGt6cmhdAeGlpvO0XF9wJMj7HTYQJk6HbBAD0fuj5xu+hWF1Rcf0blm1/S+MI1dRrz6qCBxtQP8hAGt+yzrECmUEVPAih3fTTUgut5aTLUvK+1KTu2LPMslJkK4Y9ZrqpxrQ4HWjAPNftdc6plJLOJtC/XHSTkaEZoNltsa/47X1H1xVumj3W2A+1XLNtW59Sv2kZym4XMRYeb+9ZLGt28qG49HWlZNg9VLBLJFpnIRObENI4dIImVA5C9vwkw5nDbKXBPHu+/xn87JoZc0NwvJnNtH7ixxu5Ph9/cP9Dt+w804MNeTuDxHwXIU8oXyqQjg8ZqmfVvrS/H4mfG/cLWIJbTCDvBT7kuI2tS++2C05Jl7hy+qJA0+zmcw0cFCzpWui7Vilqdr1qZ2MuKFqWL+RYi1AohOs74WBpi7MQgxW+fRPwUwdSwgkzONAtFkeiUr2g9c0mJ5OFDlSSPlNTjEJoGNZScA32oy6O/H4f87WPuNG9cCpfgV0L+mg5lDG5JKScg0Q864IPPebyUxsd374ez8v2qo4/zKylQJzZ06FiyGjlWbQWdHqdVcudwDufw5CC14bO2ymD5lI5jNlDEPR3suCdM7hedPPzoyLBSiu8e0LHE0ZGPoYlwacViLnHPHHKLM9XTREDenQhRkfnxnL2LcLnL/CiAU6LjGSus4tG+uWM4xeFdrDQgZJfnTmRURZ4mK5XzFHmZcE9nds/cAU7PmIGkneJwpVzpeK9sMK0I/TLHAFroqscddM5pmesuXKLxLIvLgM+UwTe7Ccc2ZPVxFp4igic40bVMu16K04od97YtokyUEec4hGXCJXbHpDBpoIwBWwaf0sBeHOGVubSSNQOnR+jcBS0+o8BujliJapqy0pvhUVbRzrsTe325HYODrlXXR1onHefXm6djVMA+LJLu2657Z+tIW13TyJ1lGGo84WgPVl+niSTaUerkpoHAx6j5uYV89we7avJneIVV9hwnwiQStGIgamS6MtjAwAOhgxdNpeFkbPrO7ExnRkcdnjY+GY9ixXrYOaZ1cTrU2kJNi42SWpVCHNcCv9PKIyXXKXybU57vNYxLjTjGglXozsZxqFc4mgkv2on5olxWuYwtPlJ53Fd90tdCcaiXn76ov/vd5/S1m2uqjBQfM64yWcJEyZQ6N26Un8xsHHGMz/JCM9pSzOh8AAhJWPDrj4Y66Q3T+dXITKPsWATK/z1BcL1FnVFC5KnLbP5PkwGxVtZBcvkUweMfMoidBdRJDkl+5Loh1w/4pTyIT3DihMymbuxIMw2CIzvtjyNtJkGcVrTnwMsyjEFJpxErldmO4ujItpCDDsMAOjIXCpMOH2SmN4YXfAA/xPuQ4wy+w5nI2SyPSIvyOfRkprlSWc9eWVWDTM2X7CxzQpbj5jFw/wSA1M1dogw8mt4kSG9z4C7Xd4Sl+OloZerO5ZyUVeGoYQbVSSsGf9FzRdWMe/NkQxcHD/XUbEsvLUz19VsX9MJTV/TC01f0rK8XLyyrXudDNU4XEpKhaV8pV3zr+qYOoY+vHDvJcUkMclfKxZg4Niqq12qqVhvaP+7q/uaujjt9J+JkTNvgBF/X+K7D4lzQkvRIN2HsWov6s2WCzUJLd1kZu6VM6PugFnjYPRkwpvCG9XEMtlsOjKw02CnDufmdckMPyk29Umrrl/UlvV1f1WZlWV01jTuciKxwe/Iv3TnFKB/lhPfMXxXbETXLyULXaU40NI0GznPumee1+vK3deX3fkfLX7qh1pUVjZtFHY17GpifSYhvj7AqvzgYqm2cFks19fcONLMMQj4PT05iJ0e9wj67iUb1sta+/pIufOsruvH9l7Xw9FVN5+sa2/9o2LEMJ900IcMkV9n8BLfhaEs49AGONsgkWXyvxGVhh8/E6nNYLWhQmWlsOT6tljUwnuWFhkqLrTg6ConuDJAaqo4mOr73QIPdXRcH+SMdPHjo5z1VaZ8wmWOMjcs4O0KRY8KqlhU120fsOtGERTJV8ylTmNiA8BGWgHFy2x5YR+xVa9prz2t89YYqz7yo2eo1nRSb6rle4zg88zWTJrHjzVkWXJ6Y7E4N9FMHJmLa3Z6WXJfLW9taMn0a/V4c7wf/lC0vy5ORmPBY3j/Wpd0Tre4eq7l3pDYUNp3yJsO+Fo4a6psPDl2g3tqCjlsNjcscNVnRsF61v3QCl5q/K67zga+7zbJ2akX1/I4P1dfMk+zOQqFZ8rrNIluTbOLPj4Yk/4OInwhSuo/byUxkoVLzPgh5ZLn7Fp809gbEd8gKVder263b6+bBkV5757aGxp02iO7iG1RpQjKiR8z4HpbfJT2G/1DL7ZKevrhsXnMsZzsxMvHeeFBmZFaOZ4KE228n/LbidQ6fBoQcP4dz+CgQHT8r1aY7UuvzNc1ZycfqGHe4mInH0AkJ7TChneyTBi1yQfhFFzofpAOKInehUR97PgubjN7MQd/3weNp/FUOeCydvxbOwkWW1GfU6Qfx/OvcaSqZyyFPP3eZxRXuccjj5PE/jsshpX2qnz8Af2mpUOp+m65JwRP2HM7hHH7bgPaZBoPSJEjWXmn0ON6703w6QP++Kw45QJc0G9D6EIc/w1FpaCO56CzYP8mY90kPu8fhg/7ZfeCGVMmGB4zLmUR6HB6XUo+FD8cz2jbHI4ccR0az6BxzJczjMpeODBM/TIA4JeMT8i4cdBk7iNMPvBK+SQ76yi+e/cbXHD/iUQcM8sVxHwwMZH5pcoq0svQyHJJjgJHJj9xV3LnylQEYgmbgbpf/p/eFGeVCV8Yr7uyXdQ9tj5x1EfHPbsMX2kToeP6sAnYWH1Jk8JPBNVbnsemDFbBPX15VeTbQZDxUkTPWS6xydpntYtDV9cCKcgbvN7tTvbNxrEmZdefQgwH4kamUODzVa6q1oF/YJtTD5xfyCRCuafIjPFWuVFWtljVjFTJHThVy2VCMXSFwVqzUd1MbOvzd7QNtHQ80raRBVJKKnTus0swY1zUYR2Tdun5ZS+2mm9vYPrSyxKPBr8YlBjmcgFulxhx/EnkXVCnRFtyGh64htxcmvIrlkoYcpzXuq1GcqDHu6EqrrL/9jef1N75+U9cX6zEA1zTflM0jHDXC5EeSIpTdCNGGnB/H+Sy0SqpX/DbD7VfA5YIt6Bt0+hMNQBL68aPQ8GjGS08KoOHjUoH/4EwZqbei64VBnagVcOZCmcIZ/3gBnN4YaAfQKsmUSD8C2mXBuJym61AMliIPk1xN/iHXAhnXM/iY9q5h+8/UHxc0LNT8rqS0GyIrQSbUiA8n1M1EDKAjssEqgnB15iF//cT0FrF4GQNYvpICebZLM11faWqh5nRo/xmOMaEWdflJIeGLS/8TvZKUSVRIpXn8LuU6Nj+OzNehb0MnoBvQGbQLl4UCm48XNNKt+kRfqp/oOysjfXNprOfnJrrhcq0sNFQ1gRggZiJvOqV8jl8sxOrv4+MTjQZ9q9WR2xQ0dVi3CXZQ8YFg7svm//hOivOquQ02G3XzfEEHJ31t7OxrTNtmV4Jx4sSjuWZdy/MtmaSOT51S037hYkEFWnlaTc6CAvS54/sdpaL8UCFR4MkAEo1Jc+jONxGYhMr7pgzGHpXrut+Y02vVRf2itKK3S6vaqayoU25FfeVh2UUU3zZBX/lHdVHrU9fXjLO/LKMQOVRkodZUafmCtLioyrVLWvnmS7ryna/oxte+pLUra2pUK5oNhjq8e1+l4Ujlkek6nKjqZOqkzoyW64k6hq+dSaRbrFVVXJ5TcXVOCy89rQvfelFXv/VVXf/yc1q6sOaY0qjb1/7mlusRfPAxO7Bq3vVKAOTAmA+v08ZcNvRv0Uo3bKV6QYvX1nTrGy/oqW9+RdfsLr9s940vq7Eyr+Gga5HqiJbN6OC60x7u7muwsSkLTc26Q3UfbWh6fBwTHUyKWqkHP3C0GlNKTPjUnETFsr4yYVAef3OV64Z2X2Aiezw2j5unXTeH5Ya6pmX52ec1u/W0DufmdWB9MbY9oEJFpVLVF8ZyONLJebnMTBowCfekgIkGJoYe/slfaOcP/1i7f/JnGrlOJhzN51/ZdcFHqCsHRzr6kz/X4R/+ie7+4Q+0//ZdTXt9h3Cbgn7QC5mJ3mViwwzWNx07Lhqf8raacmZVy1aTmQW9vhIPvd1xnQ6Y7HMdQOPiyDLG7xIPwPu0XvvZ5TIXikV75eaTQpYGbf/MIQtSu0vy8nEghJGwf+xa4/g+47973NXrt+/pwHzNDiHsFWQe4fJfyow0TQdf+Z4N+q9aGOn6WlsX5031kd/Qlk5lcGrD4RdY5XB2dw7n8NsE8Os5nMNHghC5NiTmGxVdW15QNfzo+GFM04mzwYIRihwMsWylYEkagto+vxFl8FkGCPAYEaBTUmPZc3af6Me/PPzpGzsUEi579wGX6P+4KsuB9x8S74PwK++t4DL/hO8HXPj/JS5+QBToNM4Z+MnhUj7Zcxbi7O7s/tQ9nseHub8kbBJ76c37/DMXz/H+A3AaJt2ntM4g6HLqn6Xz2PM5nMM5fHpAM6VjELJrhivbVdI1ZIC7KtFxycPh8EfW+RpNNhp7uAjBbfgDSR4zYZBWQNH1weHHABGOSRWc9SMTLrl732TL4y6Fjd70qZ+fOcA6HHHz9yADpI5XSpfdGQ6HpvXrED3cRDrggw7OhrHBOytMKiHv+Z/KxKqxRLNULq6sTJ5By5ym0ywMev8xl+idaBk7TnL//EqnC1qRXvY+wme6KWhNCCOWvkGSVtsxLpKOazFGp44BLAcO/CiT03T6cc3qw/8C6JzlaUM+rkCQEmKd0vSzB6CePvrpMvphYhuNVeEcgVT1/fXVttbmKqpwDAZ0ZneHO/JBC4eJb8EwGGP/zrisNx/saG/AYFw1DepA59MJNvILomUOnsH38wux8pv2A40MrPplIJ9Vue1WTbW6qTMdBDnKDCSZthXzLaubp1NW20uDUlm/vPtQr9zfVM/x2TEdMomVyg4w4LnSjEEYZNKNm0uaX/Qzg60ZE0f7DPc4uF4sF/hAK3zAUMSU5bvGo1AyLs5rPHbqlg3VaU/tQk9fu3VBf/+7z+m7z17SWt1tbNiPXSHlqR3DX2O+o0Cuxp82GeUnZ+NiXmnWyppv8qF2BuVzSHeBG4g4LG2x0x/bIb9o9w5DO3R6wOlk0hMC+DbpAJz7MKDnKzIpdpNZxpUnvlrOxQ45AxPqYwaoLXNDFrucQRfK5eLEStoIyX/aRrqe2YLpfZDIwIVJEO6idqE3rc0vwCtNFDkPp0NOnfGUr1zYP+14i0L4Gqvz/WNQnalgV2vITcbRWeGby+/YoYKsNO8mHQg2gAMHTi6vbzgCbaVZ0c21uZg0Y4A3ZAe5nMb5+JCV1o7c7DJckkvP+OdAMZE7Qa/8XaCBnJLy77TQE62NTzS480stbb2i7zYP9AcrXX1z7kjX2wPNV90e4XVmJAy0aXZHlcoV9YYTbW7t6Z137ujR/Qea9NIxOsVBR6VBV3W35YYrrsIuqlFP5f6JysOeaparFgHxrRF2hvDR2s2dQ+3uH8Xk5mjiNEquMTfx+WZDS81mfPchdncYaXQcP3Tw2HQf2Q0dfmy+iOqN8uKeJJC7OTAmEuzMVzPjz44gPsQ9KA3iWxHjUlX7s5be05JeK63qtdqabteXtWXZNiiazi4jO47YUT9y+IFpwmpza3nTsqjqsKK6GokuLjxhd958XXtvvK7ew/sq1/1+dVGLFy9qvt7S6OG2dn/+WnzfQwPXC7NVxnM66KuNzHF7YcKK9sCCAI3GapMXk1Q//pmO3n5Xve1tNZaX1L6wqsbcglw7Gr5zT5s/+aWOHz5SpcyuydRGY8KRiTDjBQs1zauWhLG7JH2E3DVF3ZoX6vNzmjeejbVV1ZYXVV/3dW1NrVpd8y5b1QIHGqInqpOxyz/Q/pvvaOcvfqbNf/dnGrz3UHNOuw7fT0yz0dT8WFLVOgJ+YAy+6DIiq9HmfHC/6IpxC0ryCHwcf1pq6KA2r/HlW6o996ImV6/psN3UkWk1qHBMltN2HCwnJhSYnEMAxVFnhXxHyZOBaKXG6WhjS4evvaaDX7yi0eGxsHRdjcZ7bBqYlsOher90ff30p9q5fScWgPBtj0LFetDv/Udj95/LF/zmOrMIr1m2F7PFCFRxnFji9/HtLfM50rBiHVCbVlWfsPvDNLEcJDhHDo5NbyZAQiLZM3ch7+0I90kgWj51eepI2y/CpfTJKqNUBugb3sAJ5mXLlxPLttffvavdk44K9YY6Q9OtWnMYCy6Hi+/1oXAMIYvtjb6JVMybi/WSnmHC0UE4aiwWRJj3iRv5g5tD53owpXsO5/DbCaUX/tF/9n/I7s/hHH49sGRji/7V+Yp+56lLcQwWEyAs14gzpS38oqOMdRTi00IVZYFAtUNYWlLG/y8eoBAwzoBEgUy9+A+a+BqaJLl4jjhJyUC+5Jc74PHnD7r8kj+ndD7o+A+cXT/4nl9otPA5e2d4DN8zhfe4X37J7t/3zuHfFx/wNbvN83z/+xw+WJYP5n12Se+Si7IFHwJ52FTC/Br3WZDskvzi//t/8S5HM57t+74ypTD55RzO4Rw+BaCNux1GtzAGh7IBrXwAhwZ52iYx2mm3Z2HyHQNh0McV6ZGeuX/cAfk17kIgpM5yXBkke9ydAu8fd+jN/H3m57Tig6n8QkfgleeMc3nc2+IdcZPMtI6J10yK4O+U0L8uW9LTpAwu5Dc2qYhDsLy0lN/dQ+gHXeLn93Hv99AnhtkyuhL+fT+eU4qBX4TPruHQgXmdpLhRL1kZgma+TR8axoGRX9Gxz+wKIPAOWU5XNjAMWjCIiR9lzr0Jl/9OPeMvfwZ4ghaJHp9FiO9/mC6UoGB7jEmR4tR8UCppuzvU5lFX3bE7+8VqrGCslJg0sv3mGDGoWeT4Jj8N+7qysqCVuZqqHC2SUswoA51OKR50fpyKn0eANgyKjOKD0JYqpicDp5yRvT+a6d3dQ50M+FZHWWXTlvPGGTjhI+PwdNrxVNBgOlGvN9DS3LxpWzePOx0GSB12WixrUq7G0TIPDob65Z0dvftwXyej1C4TjfM2TitItqSxMtvTlsGzpAl42b9qHGdT3o2dz1B1DXV5vq5vPX9Z33vpsp5abcWALqvYK25X6dgn52Q8Ix/LQOQFq0A5H42JEBco0j4eTvXe5pH2O0PTIE06ggk5M5lGe04DQUPNN8u6eWFRKw12pjiEacl3UGi+jNH8JgbTPz6YmrQXu3zwPZ8ALhaqxq/sMAz+UT6/c6HyIxNpM5Q4ypmVm7pJpcn/P1Y234bIysKEfCKmPbmLd5k8JNQkBph4Rz24vktlDc0jjzojHZj+TGYgg8eBt+O5DsCSwamG+eFKuxnff+HYtZ2jgQbiGBSXh7p0uJR3kq+t4lhXWgzkUr5K1AuDvKwIH/nh9v0t9czb46JpwaCyZQe5g+nHg1RGcEh4QMGQ8plfom6QyJCHhgXBOdHOIY0bd5QffVYr9tUo9PTwtZ9o+9W/0JdaM337Uk1Xy0cxubc5KOndzkyDuXVNavPqDTmibaD9o44ebOzq4eaudrb2dLi7q2m/o2tri7q+Nq/5akkLjbKalYraNbt6RUt285WSFptVLbgt94cjPdjcV9fXOEJz4nbltrw434bkpmmSy9C00+nr5LDjdmDJyuSU645jpPOdRQw+cqXUeVnj2S49PSlI/Bgf5I/C2KdknuHjF0wU2b80gQtrGhVq5pmSThyjz+izy8fuMSbkaQOUB13NjtPgw2nJdVQ271YZWY6JJNrjaDLQ8ORQvf1ddfZ2dbRlt7GpgwePdPjefZ28c0fd2w9UOe6pxmQHaZccz2mPxhMd77lOdnZ18nBDhaNj8X0jpg8no7H2d3Y0OD7R0fauenYndx6oe39DJ7fv6fDNd9Xf2FLF4Up2sD27IvrGv9s50fG9h+o7bKnbVcV1nQZ+Z+oOzE+7+9q7+1BHDnN4764O7zu9+/ftnP7dBxo/2FbZfFdw2M7mpjobjzTaP1TJOmTa68VOkNHunsoDJtYs08cjHR2aBpTj/kPNur3Q3+SJLmLBA3UTwgge8pVvFsVOqWpN3faiJjee0/TqTY0Xl3VSrajLpA7fvEA3ue5SvboOnURMzIUsglK0LSdP+k8AwGe12ZL291XZ2tCc6YOEKJmfsG3QhLQbJoEqzAgxmXnrlla//S11l+bUN33gCXbLsNsSvV0uc6yq4wxnqlqmwWfoPb6zVDbNYqLMcWh6UKFqWVtnUYOzwy7lN3X+o9LUfEY4x3X6fLMnvY/YweOkEcl9XCB9Lukp6JEEY+Zzekk3cQUHX9hjxiKWo95Eb7/3QA/MP3FUptnF3OMyW567rvkF65CE84t5EF8pPeWvTHq6uVTV91+8pjnL2boLO3M7Cg3IuF/kS3inan5KkHyTe1JwWqh4Ch63X5KpSe+ktwlnnjkK7aA/1C/e2dTJpGL6YcmFZRPvARYE1WxPXVtp6Llra7EDiTBAqge7lOU5/BZCLF46nwA5h48MVrScoPmMO0/feXpdTToCFojJeLWgoN2jjO2XC24Uaaw4tdBBpiYR8vmDvJMcHWM3sNwPSM+UPD2zIiE+nAlN7G+RbNqke/6neHZJE5muFr50iCL9JNQJwxEDQXQD/rxnRUiWu4026oTOunNw+mz/nNpIiJl7lDWWuYEzTsmDuESmHFwxGOIeDJ1/3KMkKKPjY7inDwVSBoD/Gf6BOu+AVA4Uc3QE8rL6fYpnIL/sCVwSbRwevZLfn4Zx3MjXfv6lFRz4Ewrwf9Ml/PxHPnQu8Y4QEYh/KU1oUnLZI5zzotwYVJEVMSiH7yOMf+CXv6NM8cz96f90TTYE8X1PGSIcdZV4BHrmfudwDufwmwDLQYxw5KUvyL+yf+lDomHG+pIPpjPoh9GOoc/kh9uy22ahkPnTMXQ6rFoMMYtuC/3mB/sje7jlHfLIXQe7rK2HJ1nS1jN/ZEr4+SHC+TmTU8SN98YzHU2U3oXoQZAQiXisRjauyM/IPMDp04MhPB1X8nfZYveJ30U48Itk0mrUGQOn7ulh/Cfd4jt0i/PmGwIMesdEEANh9k5pkkxKJ57iL9EUBwVwBCBLOpLGJvAOWUi5fKWTSCkoLnQOmyGbAKIcMbnhvCkX6cXHd+moh13h8AzEOtlAl/cOyb/oDkMwOzo5pBDoZDgEMSN0Kgv/Eu78CID7jAIEMeQTQ/AHt9CXIx/GlYreuvdIvUIzjiSqub7ha1Y5Uv/Eidoj+th2XnGk564vqzwYqmqzAFuD8+/5iHq0rSxOHN8U9Pv8Qq6jaafRDoJWDBSUNChWtHnS1/bekWlQcRuiHWFbwYfwbPo4NXVQKFd0ctLVoNNXs9rSwkJV0zIDKUUN3Vge7Pf107cf6C9eu6dX39vTXoePW5edDvIpa1vg4ZzyIejiqK+a41I/RdcxR3ZQPyyELgw6qk96Wq3M9PzlJf3ul6/om89c0HLNcR2v7DoumweKdvnkBJ38ZM/QlljhneWMn/8od39a1N2dE20dnvh9JeLYYkqYkZbvkBmsRq6XZ7qxNq9LC42QJbyM1alBSwfM8vr0AXsYOqZjneBj6hN698YzbWwdqjm/YHHLhIGlKSj7Ln20ngFP9ILbGPoiQpBion2yX5E1wFn5eJ8c96cxnC9+UZvxP+KYJxjYjIkV+MM056izzc5Q+z3LdfQEA+gVvjvjUrgMtaq12LivRTfY9VbD+BV0NJpqrz+OM/75Lgb0DlHhK3Yot233467Nl1WFX5nwCdyRz8nd3z7QhnlxzMSpIzhYpE3cjwOp/QBJdgTfBT8kDidlnlmFTchk6wfLmKmoBfSa6wA8TRfs8kZhqMH9X+rdH/53evUH/70urszr8rWbKjfaOjS9/u2P3tFG7bre7NS1Palp87Cn7d0Dbe0fatPl29w71NFxP444Kk3Hapam+sqtS/rSlZbW2hWttquxCnqxUdZq065lv2ZFy77OtWw7uMHtHvTiA+hTt/PQP6TTrmuu3QpaQ/Oi33UHIx1bZoxjsqDiMnKljG5d2a4PqJCu8AQFD0rZfVyqf3KAz9P0mfExyqgCFynac0x6MpnD1e2IF3xLjMmPE8uIQ+uOkesr9Sfpa5lmToqPvYesiHLi3EeluA4bk6m2YeI7SMOeJsddjbYPNdzY0fDRlsYPt1Q+6qjh+uXD56HPjM/Y8hD6dzsddXd3NeAD40fH8S2NInYS+GNn+DodDjQ+7ji9bU02dzS2G27vatbrqez2F2nCa6TpOhwM+urs7KnvcLPDI+PvNCOcWdH9yM7RiTpbOxoYtwk4PtrQaGPbOBgPx5lu7Mbuk+J4qtHJkdPaUe/w0EiPY0dJWHfOp+a+eZn2Z2IM+10d7xPO8Y0rx3xVTecyutdhhrNRTELF5KxpNnbcE7f1k1Zbg0tXNL35jIaXn9JJY049y5Cx48W3fILXrP+RMX7G/i27DstRD6kO0zFnoQFMtycB7JyqqGE5PHr0QLWTY8s4jp9LdEcY8XWzmdsfO6c67aYWfvd3Nb5xQyeOxwIDdtiEHQSvujzmPMeXqpkcY7IZmR3HHjpHFzf+BX+btyvjYhypRjrQxCSyLFXs0oLP0MRhkQdbOROwtn8kE08fH0jFSWU4JZ9kj6SU+Y+srLhekY8xvuNflMTyujss6PaDLb17/6Hr223QmKLLypVaHPHFmBBjT+CObk8LApwO2DtBdmAtlMZ6+eaaXry6oCq757DVTTt0Pu04Ivgp5ep4gRr/cvekAFzOcEh6OtUZEud8AuSLCbSX8wmQc/iIYOFmRTtnzfHilSW9dGXBBoJ70lZAIezD8HGrt3DAsgmlaT8MojQBkgkPhNLnEGhUOAAjL3d5hxnjPglHQ4QNDRLAGwzAkJr2CzOX8NAM2mI8G0ruLBMlSGn/6PRaQBMuTWak9M9wcTp+78oIBYohweA+H+/kNTikzq6vDkuMqYV5fPCNTOzB++go2XBIyae8It0M81CCWd6BL/kTmShOJ1ABB9/HpInzj/QxrrIf8UiBfCIlh8/LwP94b3omvEmLUNDD11DA2XvfYbLm8YL2/CLRBCl07lwClzfSNW0Ih8vLz3teRqfWP8LgG3TnHU/gE75Aep8i+4pBwc9pgMvjPJHKdw7ncA6/OUAmIhVSRwAdFGPr0dbsR6fFHdoCnWoc7RRxgdpyWDqy7hq6YxCSJd4jfxF/DJjRfkkhIGu/XFL75ol2TRrxhkf7J10QD5ZZTsl+7ni485GeU2ggpgY4csBB3Z3NVvc530gDY5xDDeiiEhcdYNQdNlaZk3E6B4TCOB27yC7JaRBLZUCOcY6v9XTmkPkhrojMQCWr69hRwKpAkrQ3WHJkQ1zJw0AeDKCWTEsmhyLdSMehoAk5Z7iDPXSMARNwi46UHXrI9cL3QThqApSL6AgHBn8G6VlmwUBhrBrl3o7OP2kn3WRaENjX1PnkB5LJhR4CscfhfY+U6rMLSbfmD4mr6NQC7AApVMq682hXewMGc8ux2psBBOqRuG4YrhfT3B4ctzEeDHRjfVnrLevGUToAhNbCTiJWSZax8Zx+tCBfqYLPM+T6O7/PmadYr+mo19e9+1vmV9otU4fYu+ZR83WYRqY/HwLnuyslh+kc93V82FWpUldzoa7N455+8vp9/fj1O/rl7U3dP+irX6hryGp8p0W2cDQyDaAjzsCOs1DdbaY0HTm/kgbUh6uStlgcnKgt1+FCTd974Ya+9+IVXVtoquXWU4n2ypFZrPxNnJ/aCnhnC2hoQ3bkQx2n8karC7we7J3o/s6BxQ0raKOQdo6J3DF9OKqOAUyOZXn64ryuLbUcHSHrdLAnIwv/5+YJQZIQyIaMj0vVmADZPurpj3/0C52wEr3ZUrnJ5AiyyPUH0cdDi8ax7y3RLBxj9TDldZo49EXwSNDFz/GCnLjyl4W0X0xuZ375IiieWMUOLZF9zsBysRQfvN/t9jWw0C8WWcnLCmS/rrjOLEerDl8cDbRQKWqlUQvZeGgxvtsbqTtlsJS0mTyh7jnCB34sql0Y68pcOQZzGcpx7bmsLpvjmyN02J/o3e2OpqValI0qRKN8XIC/oBaOjzonPvBz8IxvE0mCrnFn/9BtfknfocSHpc3zfBehVnKbm4y1896reu0P/2u99af/Vic7D93WpDt7x3r94YF5ta9/+YPXNb36ssbLt7TXn+mg09Ox2223P47z/2PixzQlR44KZJLjey/d0tV2Sa5+NUy6ermgll3dz00/t11HdTsGriv2PDrp687DPY2N0+kukGpFc3PtaB0WpKGLWT2+d3iivhtssVizqk21TvWg2QIJ5LBvqIFEheDQoEEK8OlD4OCs47s1tHP7pQ8om1c4SohSUEfmIhZgYBsw2H5cqeqAnS8u09BF4IPMhULVFGehhaO4yEy9JTuG9PmHrCMd22IaOexE9WlFjXCuB+uqpl3ddReTKCAI9YxC2gVqP9cBx1Mx0F33u+gtkhl05NlhkdY1p9dwxCb85FcxJUUaDhsLRkKRggfhrfv8yPHfNcIFTVLdUHImMPBvG7eWs2r4vuHwNZe9bt1JPuTBwDvkQn5EU4/4dubzKD4/3yc5Sji3u8nIabCLxnGI4bbIrpRZ7OSYaOx2P2Tyw/38/tKKCree1vDGLR0urem4Oq9+2bxG2jSwWLzq8sW9nXNnVy4LhSgHf4RloiTVO9cnAWk3T6vZUKV7rN7mIzUt0yrDNAkCDWlrA8vAw2pJleeeVu0bL2u/2daItuVCVKKcuFQuip4m3fwQcoW//GrI/FiMA09X4G+nE5xtf46pG5oZ2NVJXUVakV7CN7cz45JuPzaAV0o3AfZZ6AkcHs6X8ZjRkD5NWiwROzKtl/tubLcf7ur2gw31x+afai0mP8LWw05Bj2Sp8//UjqYwrm/0Q8Uy67JtwN976aZWG/D9MPoEJo558szWIXzgarwALgnD9PxkALzOcMhlaKof6HQmW4HzCZAvBoRcPZ8AOYePAiHcJgNdaBX18jNXdHXeBrYVMool3iNMUNYIHYSBBSLCkEElhGSuFHj6PELqFDPJgElnClg55yv9T10YEwhlB4iLKWO60JHC7/GBcciVFNIsDYIF+RDEjuh0UppWahjUWZoY3LyPyZCEDohF2Bi4y+KEHHd4ViiRR2RjQR/v/YsBsix+jgN4pfI4e6cVA0q+DzvVQFwgVj4aAre4zVUCNe970jPQoUmrohw2U6Ap3ZQWjjwoS4QjNjxGgAxS9yCVK487sXKOMvohgmZXypV48wPO78ApHR/iNIwzcdkVwzXRgvQc3OEjrcAv1W100oIIeZpAukaeWXmBHHeueblSOc/CnMM5nMMnAOQl8gR5EALIciuao/+VLQui45LC4DBqmbwnTJqcZbCL0G73CAN33HkXXXG/YDDZks1hSItBk5LfMaxkcH4l/FICAch3YxL3SYzxZB2BXqQf4cRp//wsCvzMwBMDqchLBn4oATLaz+48cy4zLokcp4t8QX7En9/ZNGdyBPzBIz7CCy6ZiEJe0nniPgbwmIhJkZM8c/nG45Gf0S2Oj85Cx7hsI8eJAVJ0hfFJ2ohfmpJg8AEacJxH+FAg8It6iNJEHqBDuuFDvq4T6oZV8tCZ95QNulB+ui3pQ45ld/RZweb0oQf1ZRdpkxfhIy6pQLOUd05fCsn/KOzpJbDhxpD5fwYh6jTQ55/rMYoELaGT+bJcUnc40TsP9sxa5hH0F/VBcL/PbmLABf+RO8wN193zV5ZS2uaFMats3bFmZSq7pKD51JUOR0PqLxrQxspl+Kuo7a3jOEpnYvuPlc60AeiYdLv50m2d47FKbtsj18Nxp+vwfW0edPTau4/0yrsb2jweqeP22y80nEbdaVRdLcSnFlMDJs98QRFvGNzhaK6x2wayiAH60qirC/WZXr55Qb//4jV99fqqLrY5woPjsCaxOwQBEruGs3SoQMeM9g0/8ES7i8GUeAdDJTtoarw2Dvp6l1XOJQbVsHlJlPDG1eniE9ha6D19aU43VtuajbGpjKb5JplF/hfXJwHIjLSLA9kKb6cdFUU93Ovof/zxL/Xe3om2OkNNa3U13d8hLOfwM0BaZdEMdEHu+C8tkCHZVE/QNdEtlZF3qajvl0QBcYvPWSjs2KJ5K+Sf02IiqjcYaWdvP+oNnJGdrOIu19jZzce4R26zU621G1q0H32DjjHY6fTZ72dRyB6lkcruxzHZwcA9g3dzpanW3a8rIxPQhUVW4fvZdcnxaAML6LfN34OJec/1CU+T/8cFSGaBFLzAA7RjUVbiC9PMZUeS8z6C8M/5QVOoO7IHeDK4ba2gybije2/9WG//6b/V6OBhfO/hcGdL23fuaPPRfW3cvavN/RO1nv6KKuvXYicLA1tRf+ZvJr0SD4OD25Tpc22prt//8hW1TaSq8UpDfagp4+pnVuk7hZCN/CrO87g70J3NQx0NY39l6B4KMT/X0nyzYlqPrEudjnlsz7LiJHbyuASma9XhaJtn39VxqvZLiwhJBqLhgI9P+08CaUeY5QJ4+blsBmTHAN888pPxRNf4NsYE0o6EsV8xKD+0XByYYl2HPzb9O5YbQ+uSGSvQIz0KOTbv8b0gJor4ykNocwO5MRmcZBFZoL/ixnQ5m0TMHP+yeyRZ1e2FlezJcsM/hScu9U3eTGrgYszCz2mBRhbHcYlHW2GMIw9LewHHGFyPhFPGYJgmLsDN/BnKGOypT0Lgn/g6TSwk3gr+99MpZLe8r06m8cFzcAiGgDYOn3jCtlmlqiPL5ZP2gsbXbkhPPavexUs6bM2rV264LqoOSv1At+Qib+cRi4TiuL8k/8fmW2xkJrqiHYZVBjyG26cFzpI2ykTtQsPl29xS1TqzORiHnolBeL8/tvzora9p5fvfVX9tXZ1y3brZOpSB/7zMOf6+UG74GBkaNuipS/XBNRw1E7LWYX3Lx/vHrgTWGSE/qE/qOw38I09SmvgFn2X5fVyAL5xoJAHOKeWUJI7xpsGQcThzDjYydel2hY18+/6G3r6/qeOBjY8Kbc11az4i5ulpH6QCH/nCWEXQIxYxpYmjlns2z6+39b3nL6QjM4vmhSCUY0J7x83pltoSSUEHbhIVnhxQrkAknhIvgy/PtIXU2vAHeD6fAPn8Azx7PgFyDh8JwkgY93R1saLvvHBdCwwmxaCxhYylXRINudJPDkGJYkBwIHSSTECUfP4gjLgY6EGB0JGAFi5zOEqNELUARj8RPgWNDk4oEUbHCGjqBP0sZHEYO6GrfJ2Y3tE5SMFSGr6isMghOnTuNAUeTo8rExJTJgX4WaGle4Q16VoB2C+enb4jWYmS8EzjMZ8Qw8AIlRHlSLtNrC6sRPNOWAzwG/84SsM/8oMHyMd2b6QVxbBxRTlZFZnys/P7OIaFvMM53Sg3+bkM9oKWESZZfuHnl9FRSo+Uxe8J7rjgy+RCem+aTRnMcxAMOnB5nyO+U5iYfgS3H9Goizy9hEu6B0rGhUEPzmWNwY88nI3FD6af0oxM4kp9MLESR475Pt4Z8us5nMM5fDKgTcequGhTaK2sfbndslJphKwsp0kLzp8ulNjtVnE7Rra5fbq95wdg0f0txiSHO+l+b22HhHR7Jx+nSeO3vHMCkS/+6LwYVONH+qCBDAEbjOmYcEBoIA/9Hn8HQoyCJ5MSyMo0MIlnkhORnjsdseLSpXIKp+lH+SxP6GLHRyuZUcjSBzFSAidEuwVi6v/Gik3ysqdlefroI9SicJP4mCgTHxwPEB0DHAKbTpbLEauJnS9yLlZVRu+HFXLujJMKSYE7SsBh2FlIHmRHWDqUoBcr6pxnxHHZY8A1RK1fgAoK0ulQB9HNcF3N3MGzh8th7NFDUVvoKnQStZaqJWhjREiCskHTVG8p+RDR4B+PmednFMA/ynBanqiAGNzjLiYtSlW9t7EfH6ZO76LqE7m5MY3gq5gE9M102Nf6fFNry03YJujHTqEJC1+mQz8nPoX3orK+YBDc4jbZqNbjvPn723samT4jBvwigOWF6Urz4OPoFQZeR7Qnt8dqTQfdjh5uHWjveKCh2+241FBvVvG1bnbn88vIGvP2aZ1CZdoNfEyrNm8zKOG0hpxfbrlWdW0+vb6k779wWb/z3EU9vdpSzXZ7eTJUpZzC0w6Ra/kESFYSty3SdRv0PTs38I98svplxwi3s3JVW8d9vXFnU+Oi8YzBY9ouURhs5CnFnzjfWxfaeubivOkAE9FWQ1RErklOf/pArrEK27QIeTxNw6MT23Rb3YF++s6GDl0XG76/u32g495Ic62mltpV1eU6duMZUpzQH9QTDYna8Y908QuXcuMSA0fZNZ79D6/cUZ8RJuIjt6zHLMiogxTYuqnfs8AcJfuz4rZtu3MyYWh55rqfqOJ2eXGxqTkmT/w7Ml/sHJ2EPGY1b33SVcv9CFbU83FbR9Z8paDLbSZFbcO7/tkRzQ6KgnmFXSVMcj086Gt7/8gV5zZvB7YfG1z58Bg2MN/JsHIwHhwBRN9iFLKb75ew+j7oGnEcDr0TVIL3mQCBjtYehaG2Ht7Wzus/U4EP+LNS3ng3SqZN90D9owPN3Eaf/b2/o+LShUwmOn0nS3qxawu9Yz8GypuFiZ6+OKdvPbUaq/U5+QA9Ebk6eHzvAZztF2xuf+Rr30Ly/nZHWyeDGEhDR47GY7XrNa3O1Vw3rqdZ3/SbRXvdOxqoN3R7cf6BkekdFkaQ1rmZF2JAHhTBNNokrecT0P4TAIO/6Ug8tx3/q1j/MvmRWySJTwkJ0ZgAQc+bCx0vTeJVNLBcYwJk3+FPzLUDlzyOKcI4caIc28nkehyjTUbYMg7Pwg4GneHpfKFlPNuFvecf1REOFIjqh5iwcLtkwiq1OwfgL+IkIMwZpPekETTP8iJdfIIHsjS58oJXpy4F9D1lZwfMNHYMxKC4XyVMU9jAxQ5/B3H9WwKBYx7AEFLU93yDgg9wI61G/s+eTMrPd316uOa8JheuSjee0fDSNXXml3Vca6lnnc+xlWXHjQkbeChcyiBNsMH7cCB6v2h8oSsWMrYUPEnYRJFPH9ChKd96o+a2PVb3zgPVe8g8k4k2Zn106DZW//pX1Pjyl9Wtt61/4RlsXIeJ8kYSAYjYGOiHn52ISRB+lJdrcv7nv7BPg+/zOK7LSCzJ8GifdukJPidMyo68uaa0Px7AfXnawYfJOwM/GU9ss6JpwOQVNjJHgr313gO992hLJ5YvE07+oF7NX6SQdpLDyY5nf67wbRp7SS7s6HFfy5WZ7YgbenqtYf3hNk3/yXmycy0/MSPoBjagAzEDEuaB4xMDYxUIJhxCttov2RxJXqW3JqCB5/MJkM8/YFOcT4Ccw68NITT9vz7tuUNV1zeeuxQrIBAclp8WCJkxgPDE2HEcZExSDggWFEMSHr8qxD9fkAbMbRgyCA9xAApsQswwCkOY+mdaxSuHRXlEWO4djlsU0tjqjFU0MfhvPwwqyBiONO24kl4ir+Py7OD5rhHeMxmBkiqWUVwOywC+O022mxzD7xgcdKcI3AKNzEVi9ptY6YXa98vwx9vv0r3zdHphwFppRn5OKwxYG3/E5wOaMaBH+fDHIHHcWB0zG5CD30GFoIzTNf3Iy3F4ju/MmF6siksDWeRLfsQx+nQSncrYHZ/wtv/EnRbeR36BZ5ZvONLEpecYgHQY6ER8JnNKaZlk4MKVo2OgKRMqKVe/Y4AwDALyydM7SzccIVldaO980iPtaPFrMjuHcziH3yAgozhioZw1x2ScMoiY5AvtO+tUsyqOHg6iITqCdAIsOxgMyVaWjcdJ5hAvyQKnxWvfcUSUkDm+MmAYqzeZYCBw5Ik8ceLI4kxuoUn9KkRoxTqC+QHecywJV1YOokcjDuEdiR/+FfLn6I/ZMHVMkYvoiCiXZavLxbEgRtyJOo7zYoojrSzNPojskPiVxYcgfefs0EBxxAK6gWc75C8fOmSymwGxAiu9HRPapR0zzsPhoK0lY+DMhMsk60hztnB8R4lOkuUd5QwVAaZxjVcGp+ew7FphgKJsF2s9LYuR6hHH5SYXwhoR+9n5R05l06BiWpShh2VxKqfp6EKQV+hjp5lkbe7yu6ywAWfvPpMQfEJ9UG5KEpSOTjEeUSvlmjqDqe493HSnuB6dO0hAgGSr+IE/bv1uOhq5Hga6cX3VOstepiXTd+yWJM1Qmr4J0qaEvmDgspv1K6ZDvdnQXmeojcMjDWy3sFsqFozA0+ZVjnuZjSwP/CtVyjGgwqQfE4YqVzWrNMXRMHy4lp0IEJWdWNA2xE4GbqnxLnk5E2wf6pH0Hd6p6D/42k198+l5rVad16CrWtHt3m0buyO1I+rMOMW54dgipAe/wD2Wg/ZJ7ZqskBaEoB3Zz3nPKhVtn/T02ntbGmYTIGkA2e/cnhhEZpU8fQEmnG+uzunZiwvBgyEXHQ45BDy5CZBUUmiSZFUl6sJWsbY7I73isvUqdXVnZR30x9o7ONHB/okmY7610VCJXRe2e5mMRRYitrFXWYATk8mUD1q5eKmk0BTI22f6F5Mk2T0utSi3M9qfq4ZaYFASurPLoO62d7TxQNNeN77NU3VHjEmRuuMhoZuW4+uLbTVcDyy06Tvx/mCopvmkOTYvnOyoNemKj9/XXf8V1xvfDFltWKKih1yGsPPBzbqGRVKqVGNw/+7DLY3Mo+jOvEwfByjL1HoVbmNIN/Sm8Ynv0ViDoKeCL+2wu1M/AH2BnEJHIOcZmIXWfuf2MxyMtL+xocHJiRvW0O2yp7Jpg6xi8mPhxvN64ft/R5Nq22U842nsgqiRkGVMgEw053gvXl/Tc5fmgqah54lAQ6RCwcbtiSs4mGBRj8jMB3sd3d7iOyB115t5xJVYd3u/2K5pvjBQY9xRw3QdjabaOuzEBAiTnej7KJPTDZ4hPVMn0jekyY+44V+6/5SB2oFG/PiOVwB16dv0mHg74ZjRJP5cj8FbHNlk2Wj6991uTsxLh6WqDssVHduPHW/YJVUnWLUdE5MrLNSYJtsAfmCSIJM00R/GYcIBtOcEfuvwPFFNsRvD4VnwErj6KQ/JU2AIH6D4/IJxC/yjho0zJlUMbGe0J00Hj/uwLXyfJi6wtfL8CA9+KS5hk2/6D0eTDjqVOHyTIk0o4ZyGr6SZcEWPVDU2HfiOw9j8NCxV1DHfd+cX1Lu4ruG1GxpduaHJyhWNanMamm4TIx7HhDoFJj9yWy2wiAL4TUx+II2pW+eHv8tMmBQ2p1ai+qcPztO0wAZnMqnVbmmwvaPR8aHfTEPXHlk+Ta9e08J3v6Pu8koc9cVEHYt3LFSiHihH1KvrEL6MuvQfVMhd4p+8xOlHOHYxUYf5B84BkuIh1X3cBsBCibakB5Bf3HxsOIufeIdrAvSrLe5aXWMHQqJObTC/e29L79x5oBPLGI6opD8zwQ73r2KeQarEMY3ZLwrhhBn3IH0W0cLD1clAt5Zr+t5L1zVnWvMtnrSA1pRyuuABTwU4Ykx+uD4iPdKN1BLGTwYo1xkO8Au1m2Qr8imv8VSG8wmQLwacT4Ccw0cElPFEC5WxvnJ1Uc9cXg6NgCBNc84YJUmgxupQBEXIVASk/fwfBcoz7vMMMWAVAtYkspLBhdws8UHLNFge5CAcP66Qy9dYbYvB7ueCeztMmDCQn84BNi3tz0BSrOKLyQDSd8ehgkLKJj2cfH7OO3nHB76s0DCsOTeXXSQlh88nBljNycRIGD1Om3Pxx84zVKP96IiU3EGiE8IRW9FhpFNkiGcLE2MUeMSKLafLBEQM7GE8MqngjOKYLzoQKArnwaQOODGCwIRJwVZfPghDHvm3NmJixOlQfsoYQQiVXocfNMQfepRcFnBgB0vshgkDyHnYRXmcHlfSTFcn5LShMfFZRcmgIuVncgM6gjp4kWe1ypE4LpP9YkIEI9H3KW2XN7vmaafONQMNpJFwzfnjHM7hHH7T4PY+say0DKlY3uLKs4El0CAGWDhqw43TodypjsmPWQy41ywD+EQg3Qi2kLuRhs5jYILVnTE4w/OYVZxDh0/pl6b9eOaj0ayqJX3aO9/QKDhPPuJZsuxhRRW6MFYbGjdWvcYZ/AyuOH6xMHJcywuHY1UrcjLt8HCsmFRh/wWDRKRpV3QcjopAfrkYTH5QriQfyQfdzAQBg0XGudB3PM7vZQLFcs5vLciifIVIpx9hGaQsO2/KxIBMxR2qmAxx2NnYNAi6GE/nUnG4oLHpFoNSyErHhqYMeOBXIm/TqOy8SZPzvGOyInB0tshv/7AOiu5IMJmBI15x6vBFp+uwaUDMBQUPOhxOn3CcSVyedZ1Hz2mBd5roiQUZxPN/BvRi50IudkP++l32nC78zwN81sB422iAjpQ7unV4uZwM6lKq8Lei4kz6d+4+1PGMnQq10EWshKceoFboeRMmVgOaR0fDoZaX5nRhsW4aOwR1QhuCnq4HSPlF1mdpwKugeqsm1evaOOzpsM/ikqppysBdURUMujH0xHZKlnKf1feVsu2T4HYNES1Oh8nG2Jmbtf8wmQzY1KcddjecNBnh+rC9zUeVY2DDbbvudnN5vqZbKy21Hb9GW3BafGuBsJUqQ+X24WiQU1nhNJ03P/KgvSE/w/YKX2I4XDhjVqpqpzvU63f31KM1ZxMgEdqB0wQIgy/uHfh6bbGhZy8sqmahQbliUtOBo4k+Qd6JnI0DdEY6x/EvFl/bx3397K0H6hdrGnGMCsf1uH729o61uXUYRx0VazXV5xpYfyFfaDfQh0KlhUI8IWOikJFX7oLsBuQPA2vQgPtUF7RTyzrLUL7Zx1Em7MhC/hWHfbVGA3Ue3tW0e6R2taBLF5a1Oj+vOY7pcrilelVLjar5AD3i9Co1NSoVrTZqWhh3VNy8rdrgJPj20sV1Lbbm1HZ/oF1GptvTNJi47m06R91Bl7Lt/5Lf39860FbHfq5/SvVxAXkRR145lanLU2PAzWWeWrfyQf+Y6A/KwqPWDOgfnsg0k/vsXokjXYL3qppvzunyhYt6+sZ1zTcq6g+O3S56MVCsxqKe/94faO3mVzQtNx2e+qK8Tgd9Cw/aceVY5wXT9evPXNXlxWrYBW6ZYO14tF2CUse+gQrGIXZO+ZZ+2MP9Y716Z1djFgwYNybW+E7IWq2gC+Wx5gdHavW72trZ0yPLiqHDcayjhYPL6kSin2K6RHtCy8JXKc8AcA2fTx9MHesRdAw4uT7A03SI3QJBxxwzOC+kSDwhC2ICxESCK4Nmxap6LvuR5d2haXRsOTKIQXuXmwkPa3bssHxileKTIlThGtRwntGfczZJB4FAcjFJY5+EBe3QVlXkS91HBELHldXxMWZx6g/epONqMS/SRtktQNtIJfcvC5eu9vcV2oQdYwfC9iJk+mXhI5lI3WGhpXGLI9VciMA5/CxDjUvYfo4HH7FDcGBZ1LH8PjJP95vzml26qtmNWxpeva7+pSs6dlvuuXVg0TLhbnPI8ZG30ACbK6gf9IqdNZFT7hJeTAgGzUJ+ZJ78i/BPAhLdoMXQfMbYxXy1psPtbQ27HVt/BR3OLWrp5W+r+PQzOvI7dhpRZ0yYTGInS0qFH3yTJj+cKrKaZxc/r49UaVmefg4byu9pmrGTKEuNoLyLOrcjHf6FzPfv7Dm7+bjgPMgnoZZSi8aQ+aPEY5LGvDmwznjn7iO9c29DfRMA2YhtETrGUUrmf2z5GJfCdjMzMoYRC7tIK7vwaONOC7a9v/XMRb14bSl2FjIRjDxjohAbMfonyGno6Hs4B1yyu6zU6f+TgUSnHIfE/0kWwPOn9lRIdYf28/kEyOcfzidAzuEjgpu1G/16u6JvP3tJq3M2IhGAFgslhKKFIAIA8cKqF8QfgB9hHhc2IZQ+p5Dv/siB+3xQn629LPNgQD6tJLYxyICCf/HsuKHYHDwZwFbcVt4pPALYisbBENbxcT13nhmsj48BOn4M/jMw4TAM3COrk1JybeBvDc4ETBzf5DojLtqcyQKnGHlz/BXpjJ1+ucoqRNKy0eH4dIqiJh0mzy+l7edQyOk+JmtsdPHMxAaDYkx+WEc4tDnEeOAmsVGTyRenSVbgCx3o5Tg6HR8GCwA+kEvc4LAgAgYRlDAOzm9MeY1jSt/voSE86bKO3KFRLKlxGtHBIP+UXzCkHcYFMYJeTovz0mMQwmFiosm/kWkSH2D0u+FkGHlVTCPn7nAp3UgLqzNP344zSFllwwBcGB4xsBAZBm/k9+dwDufwyYHBt6oN98rMXcHZkcrFExvqx+4MHlks9dwkRxZ71ltuh2zprlomVmcdi+ZDi8hDv2NCwnIbOTAbqm7ZxCr4agzyD1SxLOFadlol58HJ1mVfi5OO4wxCDBgFiwLLvpLTcPg40sHpxSSIm3uI4who2VEwPg5TKk0cr+/nQdyH7HGQOKbGPz46zSROqchAf9c+OCZBkMeWLZYxqJBiiUmcgcMycUOefctf41Y6sfwynkUmCJDRlj3kT5gKxxkdq1zoqjh2GMoz7TgvBrsdfuK8XDZ2WwQtjDOryiuCbqbx9Nh5QA8GOjg3fmTadk2XE8c5Sfm7LoqiLsCBSaO+3w9jMiQmjmamb4Fn486ERtCB9dh+hkY57ejQW/aWXXbqmDwKzoMJnNAtrlfqLjpnLqNJYrpaG3Dj1OzJjSHRlT/u003+7rMGyb4Cf6wvWItBOVa80tnjh1riWqmUtNcd6u7RUH1347AQGAjApgjd6Q5gUAPbxP4jOsh+99TFZbUq9hu7PrAHnBMTIGyURP8HeZ3aFw1Q/Vi2g1lR1VZN5UZdmwfp48qsTo9lP+h8tw12XGA3jWyzFX1PTJsHpl852jDkg2PDbqZtIkiIH3ycrGnCRJ1h3/gtq+IrlVSPmvSj7ZV8ffbqBbWrTL5QZ263xarbRDmO6qKey9hgLBJxTGotJgwzHuKZNhZ3tBe/SgN7xodszCO7vYnefnCokxGWVj5QSXD6BEkOsBiKQfQrc1U9d2FeLePDAp8YxHQ6/kvpPxGgdMYDu9HF4oPiNoo1tb29czzQK+88suSx1C9UbdPVTCA0QEmdwVhbxyfa2N1TvzdSu91Uu+XyW8AwqcQAU0yohIx1GSlf/GV0dp5B0qzNpMEtnJ/sGFBicqJgulJnIwabHA7qsqvj4J03pb0t1S07r165oNXFBbVrdbXLNc3Xalqo11RDr42NrXmDb1YxMbLqcs31DzW++7oqvWM1Wm1duXpdc82W5blUQ7YHXqYBsiAG4vkAcZqQK1vuHvSnenu7Gx/BpywfF8IGNtFZVFBFGbo99DsnGvU6qlbcZowIogjdNnG9jKgb5xiTIcaJXYIMEI8DiVmUd959q9VGWXXjORn1tH94osOu28jSFRXnr+jrf+cfqtxasQ6EV5025UVHw9NRF6mGmABZqhf07Rcv6ULTbZo8snbIQDQyNedZ2mX4+R58TWI92j/RGw+P1C+wd4SBfHuO+qr29jU/PNJq50DznY62tve10Z9oUG1ak5sraNqueCYTGHBNaSNZUpuMPhUcE1nj9+kDuaYJEN/Ar4EPlIOGiY4MtkLfCGIHD6bdDAwkUn/s9sT2IBBxCVjSyPXCmv4dh9njo+l2J/S1YEr/nU4O+Zq+T4G326/fpQ93OzkGd+2RfuDKe8KCF9gnKRbyNCNhCpsmH0AJGRjtMd6ndHgfebgMKa+UBkeCxfFezjcmgImXIsT7POXylHi+pwh+TZg0cZSeYSfSGbmsE5zvx77iwDv/sPlhs6EHlYredV47rWXNrj2rwqWbGjSWdGI/dteEDYRuQG8HbpbX5vM4ojnyhK+Ccs6ZMmW0sk+S2+geHL5IHcrBlecnAcbVdAN3yjYdj7U419YQebG9ibWu4jMvaPEb31a/1dK4Wo1J49jRw6JT2jh0sV9wm/0peRoS8L3T5hkqBHdQR9CE8mftHL+a7aGqG3pMkjhc8Dnh/TtNx85eZy5CnD58LEh1ZcjTi+QCyeAjSsMRZ/2R9fHdB3r3waZ6E45nND+WqkYYwhlP04Byspgqvoti3iixiIVk8zTtFztDnBb9o8sLdf0+Hz9vmn+hNGNB9DUs12Kig3LDa2BoZNh1w/djwCrsh/Dm+UkBdIrCxZNrzQ668ZzacHqLbE24nk+AfP4hxmn/k3/6C3PHOXxRIeR7cEDOBjTws1YbK1XjXWrSfAD9Kxer+l//jRe1aKuQWWAmP/guSKyEdWIjGwhjZt8tDgAmRmLlR4gHjEHSS4LiMwsQIydZQHoIcvklRnqsloUKJsNg2NO2OyyHvV0L14HlsT2tnLBMqnRa5uY0v7CgiulWssJiR8X+0a72DrY0GHejMxBKiUZLJ5POgCtveXFN1VpVu3u77iBMVHPn7cqlq2rV5zUaMsFRdud6op29bR0c7od2nptva35+Tvce3LPSHEWa4DAaukNu5QewerpF52j9egz0P9y4p/FwokatrQur62o35qJT4l6MSs6DDi7HQtF/Hwz72tnZVqd77PIzYeO0mm2tLl1UvdJ2HHdeHGc47mtzf8OdlC0XxbhaETuZcJVSTXNzC1G+emUu8Hm4eUdHnd3QZe223y2sqWU8gDiiBsU1HevR5j11To5iy/n8vMMtr2rozsedzfdsFA0c2vWD5YJBF4ZMUoC1ak0XL1z0ta47d247zkiNRl2X1y9HnWDm4Lqc2b1x3+UfBY0WFpe1sbWhsemUrB94exrGUbQbe5XGda3NrwftoDedPyZ20upZh3mszb0fcv/3Mds5nMM5/BWATqpOT9Tfu6/e4R03R3er3dtBIs8mNmaLLbVbF1VprqpAJ9Jtt7NzR92jh6rXimqtXFVh7ml3HpqaWHbMLIO37r7l1j9Wc25eSxfWNOkcq7P7SOPuvizuLUpsTDPR6muxtqBy07JkflmVOXfILJdO9nd0crijsQ3rucV1zS9fU6nSQIRmemKi0WBPB9v3NegeqNmeU3P5hkq1FUsq42wZOent6+R4Q33LQSZKGMCsN1tqzV1UyfmNC2sazjj6iwkDy1Rkz3SoyWBXvZNHlsm7GjMQU6iq6rLNLVxWsb4oWf4Phoc63HtL086B6tZLrLgdgRyT5AXk9VT1uQsu+w3LuWboNY07poPTPt7VsH/ksrgTUGqpOW+5vbjk57F6lvEdh5HxiMkTOuJEjZWeNaffUt110JpbNc2avNHE6Z0c7Kg/6FmO0uFynbRMj5XLDr9sfJqOLw1Np6HreHyyaQp2VawwAcS5xOUYEG4trKpqnGdVd5ZnDF5ydEuyTbBDwoUOcDmdT7KFkt3y2QO6oC6Xy1B2PVC2EZMU1i0MrKLzSu7p8t2HrpXsG4d9/d//hze0PanFxEgMEmHAWC+xC4HbCqosdPhYl6oj/YdfvqrfeW7dHb9uqKSJacqupJoZbWx9GQP4obP+Mn0GBJFPr+/XcH9ZPL/NjVVfY7IleyZGihtd8ICUylmKlOUsnCEFMJzeGE7f/rUAnYNtIj60Mk4WAkxHPjgZ66d3t/XD21vaOjYvMwjqpNltxaA23IUcio1nrpvYLR34kQ44MK1EuUx8tz/SZWAtDTE4UpTZ9gMDEW4r2Ojsp+J4Oo7/jAlb9bRU6Ovvffclfe3GmuYYDAdr8jMyabELAwFOw0nOwlhJtkoMADg/+Ac5mnJLuLFYAxk4dhpj24Jv7fb1L//sbb29O9AQWel40bacdnkyNv+k426mxunbV1r6j752XZeX6m5qTCu4DHZM3jCQ8qGANySJm3T7YSFhU+ia0rELeiaI6AEfiOlH4lEu7FECjiC5ZUjXOL3+4Ej/9X/3Ux0XOEO/kfo0pG+axAS65S/f0lgqjnVzbV4vPXVVz11Z0zIDRUwwufzIdHKBhjnuDCrGz/niBx/Fe+rGMoh6oW5pe2VTaTx2bhX211nWM5k17Or/9L/732rn3Tf1zPPP6D/93/xnal+64X4XAzXtqAPsYKQc33zBtuy6Dri2nFfhaEdbf/FH7i8MVbv5Ja0++2WNzKOwHrsficvuDibp4A++/TEo8m0QBr+Gem2nr//yj25rdwQ9oLr50nGD9L6m8hjIixcfgBgg9hVuRu+CZ6tS1Os/+Qu997MfyYpKFXabt+d14eazuv7Mi9Yl1msmjXsYKpgWJFBiUZHTGZn+TOJvv/eGNn76I42sZwejrobuc3F83M2nn9PaM8+rV27rkstadXk4empq2YgcgZ8pALst4F24kv7s04tF/ZO//zXdqPPdBdoJuxcY4Mt3vlCv4JBoEG082mZBf/z2pv6ff3pXm8OKhsV6EKc66WlluquvzU307dpUK5O+XhsU9Ef9im4XF7Tvfg47OEvuE6R0DNaRLqmvtDv8mJRilz15RohPHdCXplxgQ/lDaEAR8y2/VL/ghrPdYluCD6VH18gQoYgTZTT9TXtC8p/2Fbvp7Rruqy24Hi7Y9rrsdrbu9rRsOdKeDuJDzAzuM65QMx9ULWdIBzEWEwi+skMlH+Am9YnzQ45ylBY++UfJkW45DiEPTNoMs3gfuyAclKcA11F2kyYWIhjtmRQAYhKH9BPkE0CkCx7kPbHSJT5SoOL+LbZaHA1GX98tET4cWfazY4Wh5IH7x9vGf9M6dqNQ0Z5tuFFtXvMr67p06bL7lu5bQ1PsPloKiyIZ6DZNp/H9B0qa5Hkqg2sxcAY3/kPP1AISJVJbiH514JDKFY390wajyW4DqFUx7cqjoeYtI8sPHujRv/nXGh73dfl/8g9VfvZLOqGd1irqmycmbj7T8iBkWcm2Jt+8IxkowU7WKL3fAfhDq7wemSyhdcNT8SF4dKiDlmMLcZqoGpqMY8eBlSqWT9CPt6l+4UfnEeTK001pf1QIvRNRSS/hC6SksdeKOhmM9d6DLb1zf1N8Uwc5NQRXJjjcNuFxvqmErYewQk4x2RFLO82HjBPFJLfrejp0+3J7W7Ac/trVtv5Xv3tL9dEAjoz3E47si1025g36E9ZzsTPYIYbmT+xOaFF1GmAJV33Mov8GgDZAQ6OhwtXIDmQQEhVbJ41JcmwugB4Yul92e/9E/+Lf/FyPhk3Xc9Xt03oxwqf2j30zNzvW959b1t//3gtqDtmFntLI6zoWNKRaOoffMpjaED7fAfIFhhD4IQYRWxj1qfFblLmh0wGiIdufGwdGoDULI72wPq+v31i2UUMcBEc282khTXohbFAk8QsxEP9x/P+sC4REN0Mqkp2Vnl2U2S9ZIcIaTFPM4fyzgd4dH+rR/nvaOHpPJ6NddXpHOumeqDs41lFvJ/y6wz13dmdqNtiePdP+8Z4e7Lytw96Guv0DdfqHOhke6bCzp173SINeJwbm6+22036knZMtDSYdzbWbapSbFtAlGwsW5rOe3nz4qnaOHmnYtxG+suja7uu9jbe0N9jSkdPu2b/bOfHVeDn9Tu/Q5Sjq4soV9dzhur31pnY7O+YNaXFxWY1K0/XuclJstH95qt70WBsH7+ne5rvaOtjQ3smmuqNDHQ8PdDTYdz67jt9To9awwuTjnlM93Hugh/v3XK59dU4ONRp0nfe+DnrbOh7tmy4nqtfnVSnXdHfnHW2d3NHxwPQzHeYac2o1GiY7VDbvlqvacufu4c5bOjy5r0H/WK16Q/PtRfXd+Xh343Wna5z6++r3OzpyeTvdnk6oC+c9djnXLiy5via6/eAd7XQ2nJfrpDpW0zQtce6x8+qcHGhz666OTjasTWdqtxZ0+967Ou7tRdonfdPPZT4xDY9dZ+TR7wzVNM3m5+aNKazidmPjIbclzyZATpkqOZR2vPpst5lzOIdPE0KLTXvq7d7WePuXKhzd0djtcWKZOe7sa3a0qcrJTgz2lxoty9uOhls/1+jgjmaWG832kortdU1KzWh/0+5DHd39M80si1mdObe8pHH3WIO7r6h6+Lb9LXsHR5Lbe6m7o8LxA02O77tdj1Sqk0ZB/aNtDTdeVdk6oFapqza3HhMsrB7FxW6RrsM8ek2zvduqsgNjYV2F1pI7Xseabr2i/vZPdOLyDA8eaMZksGX3xHJ2ePTQsnigYn3FabZjEhl9zQ6Jae+BDu7/sfr7b2hwcKDp8bHKx/sqdjadxsOYTKm2F1yGA5fnR6rs31a5ux/06o1PNDjZc7g9DUwrJkXaC5dsE8xJDj/b+qn6W79Qf/ddzYz71Dpi5nRLptfY16nl9ND0ONq9p9mJ83S6VdOQ9yPL0X6nZz3GzpKR6ost19mJRg9+qsnDn2mwf1cj4zbt2nW2VOjd93XDnbiKy+kyWq+Ojh9peu8nqh68o/Fgx2ntpfq1jpidPDCOppHtk3KzpYJ1wRBah23D4K7tFvS1qUT9pCM8kLP4hdD9bAJqA51oOyzvOKeu3sydV57debcnx/dsHw10cHDoSChy08Wd1zFK3uEYLI8Osq9hE47cuet3tb68oKVmnR5ExAlw55l0Y2FH5OS4jsN97hg2CzVGslZ8hMLSTOeSM+iV3nH9VRddaN8QL+WQX3lH3gwa5b4pP4InTMIGJR+Hw4W+zTrFYQPnuNs7j8GPdBM4D0MMJtmfoyboOE9K7uyXy9odFvSLhyf64Tsb+vPX7+mtR7YDBuxKPcMlgPSpgzCqjZVxirx54WssQCHPyDdNfASl4jlCEQufRF0G1fwOnGJ3k9snK36Z1GAAYzro6Jnrq6oaTya4KAX2K8ejUqY4fo87p4F/ANfAAUo4Ud+TZnryf+wW37OKu9Mb2N7b1WZnZHqwqj4lEgNJ1IOvZMVg3FK9pJuXF22P1RhtibPE2VHAYhBQD9aI6NAskEjp2cXk8ul9Km/Ch2fTiAG6uCJL0zPn5DO5NGWhie8nvsZuFJ7L6cqH6keVsnrYyeWiOq6vA9flwVB6d7Ondzb2LDNqio+8w62QIxUr+IgVP4OJ6/+or40d2/KdfnyMvtmuxy5hVuWmNmE8kTWOk7eRSIjbeJv+cUUExcrryIj6d1xuuXN9/fkPfqD/8//l/6Y//cnP9ep793X51jO69fyLSYe4PNQOO5hTv8T0L1diAJCj7JhI7nS7+qf//J/rl3fu697+sV786stRpxxHFd/XAwfo6R8rhoNDeHbh2XFRqTYsBlzeR7Z/y/Xgcb7EZARCJERLdZsgPj94kQ+bU4KJw8QEjfFkpT48WXGeg90NvfI//Ld6+KM/1Mmm7fdH79rd0d7dO1q7fFOt5WtOtxyLrUYMMjGTaBqVShVNxmNtP7ynV/74v7euLWv9+Re0/NTzuvD0S7r+/Mu6+dI3tHT1GdUuXtOIiZwgOmVLbSENhLl9TNMHk/FD916bn+p7z11W0/UY1UQZUgSXyVfH4i//Pg7lZLCd315fenuzr6Mu9eA6d7gYXHZ/eqFe1SXrrrmxbZFqRZvDqQ4nBQ2YWHEbKhWqDld2lyqtKo94roV0pK5Tz2jJ/ycBWfYZLi5YQIYT/oFbwg/Jx5V3hIR8eHCf0vG/zKV27XfmCwZWkbHo655pcug2uFNsaMu0OTY/99zuODZM7v9WXGfR22YShEV4plOMRzgXS5fIlPrlsE5zIpkmvMmWfwY4IAHyKO32TzXpu6yc7DiJ4OCaIqdHh0mvuNq6oFNnXE4Hqh0+xG2U0Tm5bIlutCx2GLNQBVuE+mXHR8U6paFOpa29yrw2ynO6W2zrdsHOz7eLTW2VWuq6X3xseuz2Ru6nDjVw/PYitialNx5uY07Obd/5OLvob6JT7OjbB0r4B38lnUJ46ijJW+yH5ChdRHCYFDF3+P91LoXl8nEh4RS143TQk5YhvjKxM2o0NVy9oOazz2tgu2RkxZgWFziiK4Z4lDe1e4MLjf1xihBX4xlyFnxzCP+Ub1bjdikMk16kTy3yLiiUh/eFMPEu5H9owiw+jv9AeiJs6FTjFLrQ14iDf1wdiknRmPRzeZhocPlZyDOynIAGu8cDvX1/U3cebas/cx27XbBACLlNGiBDvmmXivOyf4z1GTF0g8wjSLHY3YQeQT+bL5frM/3uV25aFrqV2Z6IcQv4gfScLu2D/zEG42c4yR4BQRdwwCPzezIQyPqakEg2YWDth8T5vE7Sh7qztD3fAfK5B9rZ+QTIFxhCqdD4/Z/ZTYDzApPCY82pGcTGQLRhBy5ZAC9WZvrqrQt6arXlBs9RH7kAJK0QeQ6cKdfMJ8mA9P/zAIluZ4DgjPKGIeGyMzFgxYRhHN+dKI400LH2WIE73rORLs2157XQXlJrrmVre6LOcFcnvR2N2HVQN23dieoOuzroPrKIPVLNhv3cwoINnAU1W3NabM85/qLarRUtLq9a6TmH4YFG065a9ZoWakuqOSNWHuN/b/9dDWd9LbYWdXl93QJ9oK2jDXf+emG5ryyux26K9lxT7fmmWm272rxWF66oO+7q4cltl6GrSq2mtaULqqvhDnaqZ47PGhT6Tu++7m6/rb2jHZXdqVxaMa7tqqrNmo2zvg46Vs42+uvGq1mdMw5T7XS3dTjY0aw80dL8olYWVkyTujuoQx1PD2zYHbnz3jZuNgb7D3U02dao0LXwGtmfM3/ng+MYpOmYVx/tP9Bh757L1A3+XZpf0nxr2WUfa+P4rjuyXSvwiVZWV9VsLDovnMvNTo65thaXFjWcDvVo74HG5X7k1R91Vau5xLW5MLyGft49eGBaH5lObS0trdvYmJhuddVa5oZCz8bZMDpj7TnX88Jq0HLJ9T3nurOpANuEQYrB8/4jsIKTTFRKld0DNjDO4RzO4dcDd1HcGe5q7DZfPX5b9VlH1daSmvNu962WGqWZKscb0qjnDpM70W23t6N3NO3vquoORbW9JrUvaehON4N/xe4DFbZ/rGrhRIWm5dHaRU17fRX376o53Va1UlJl8aLqzTk1GqwYPVSxd1/94UDThmWx5dC0s6fy7utqjzdVd/rFhZvuvLQsu9L5+ezYqA62Vdh7W43ehursXF+5pak7wrOtVzV+8BcaHb5l/AaWKWvWIWtqVKqajYcuxqGqdcvk1mXLUmRi2fLRemhyosOHP9Nkz7iP960bFi3n1tQqu8zjgQbdnehA1VdvWL93Vd78uVocWVUqq7Z2SdX5ZdXZnWjZ2GjNq9JadVnWZYGqyfZbGm3+RMPOQ9UaVbUWV1yuBVUt1yfdfQ3H7ti3FlRvNYM+7UbLdBmpPNhS1bKd+mitXLOOWHadEGam8d4djR/90vR+pCoDiYsX1Jp3miXrWNOGCZZxXypXmyq1XN7xscoO3xhuGzfL6BXrD/Riw3U42o/dKSwUqFm3zWoLGrk+02RTsnkYRC5Mmdi2TzGtVqPzkjownz3IsY4jOSiTHWVNHV/rENso0VF1/apiLqmWdecuusx1hmHDUBKd5lLSTezbZVCZwWU6jkxWMYV0/dJqfLyfznh8qyBsH8cPBD6oq/BMLqk53p9Zi/HG/8In61y+HwhP3A/XgVFCykptRgbJ5sTn7Oq3LlPkDLr4EzbyY7AnPMI/jspIEQ0Rwz/oaZpYVkzcdljl2HGkB/sD/fStB/rTNx7oR3f39MqDAz086tsew45mhbzp5njx/S+nwRrCSNwufS/NdPN92n0zTYMRDIKQfWYX8BTPoGOgHhNqpGP8faGenIidbc6oCf9skwx7PS0vLdt25DsVaTUxq4r5AHFMBHC8EiuJGTBxp59dDnzgOiZ3HIb7WIWMn8vATpMpA3QOxyBKfzTT/b2O7ct+DBqAS071ZNPgMVZhhO3Z0PUrK5qfZxDSODo9cGWQk10GnNnOx1rBYex3Y/NoXDNcwB3HYAQTF2PX59jXk0lJ3antv3FBR8OpDnoT7XaHdiPtdAbG7yQ+Sn1/50TvbR/q9saB3nm4qzcf7Op1u1fu7bkOH+mXtzf0yu1NvfLupt5+uO9wh9p3GhPsaOcPj2GHwUWng9Kmx4RhENOnO5pq+6CjRzuHMflVtzyqWYjPGMh2XFxGGZ0eJRv8x11Q6vQ9/6FjhHMQBjErZZd5PNJ//l/8F/r//flfaH8wjPK99vbt+MbH8y++ZJnpejFVOeIWCN4xX1AXOCYQ3rv/QP/7/+N/rj975XX98Gev6L2792Llb8t6sdZg4sb1YJ1SdH6U1ijYRjU+5jtkQdW04CSAe482dTR1HZqHKAL9nRhYc1jWmTOZAl/Th+RbMi5E4MQAsBN0BOPpNjA/dR39+R+q+9oP9PKVlpbqQ60s12zz16w/Z7r8zDe0sP60laHrgRXFZdaxu19l/meAseo8D7c31awX9OJ3XtbCzWe1dP05LVy4qbmVSypaV8Dv7GKhPSIAKBlU5t/IZZrNKk4WbYCbuXfT1dPLZX3zlnWgaUMbJQZDmayghpY0t+Bx7rOYtETi7w+KenPD/YSTLq/tg5zkitgtaLkwUMuuZ/592B9r33TsF+suEzvqqtnkh4sKn9nF5Ic9Qk6RG9kmcj4R+PCsQQ4anV3TfTwad/DPypA7A2nlDr945Qeoit4Zmr86pYb2Sk3tmwdOLA9OTO0T11lXfP0L+ZTkQuxUMH2R1XE0la+kQe3QLyeTNLnhSvT/mKSIjOOfn+3neKdt1fcxceBryNrkS9Dsv1N21MRPqY6ZJCRkVDyhiG8/i6iMOxINeA5c/R7ZOyjXXM66jotN7Rbb2ii2dK84pztMfrjs7+FXmddeta1+2TxdbiS+nkzcrx6q0++rN+hb5jRsT9XN00577LZn/rWqh3PdJkErNLWbAWVH//AOH3CDZi5JOPDm6hfxOpXx/ZDi/dWQwvw6If9ScOS8rcVEgb04WpIj0wrLKypeWNe03bR+gJ6m8/uqKj2kxS6ZVw5+SGX0DdfML/lzxScvcwpHvUXd2UWQzAVk/hH31Jd8oV0WNs+EPLNbygS8fywgAXYBWiZJJuKZ3132pLtL2tzv6J3727q/tacu3+er1B3a/PZYYUJe+eoajWfqOF/0EJMapOxXTGXjNBqqXR7r1lpN333xqtxLCRxSSRzHJIWPnUqGb067Mxrjzm6eJBizDEcg3YG9CwGP+woNKAtwPgHyxYDzCZAvNCRBiEAPAYghQPO1cRFCltU+vqM7hSLFsbriYruil5+/prWGO8/ZpMlZG88a/ecdXMQopWkSchWKYTjFq6RmoGUyIGyol0YaTTs6ON5St3+saqWh9ZVburR8UwsLF9RsNm3oH2swPHGHdaB6taVWeyk+3rff2XXcoZYW13R9/VnNz13Rot1y66IWmxdUryy5w1IP63v3cFPDIWe2F7U8vxqTKAN3LrYPt7Tf26XF6/IK8RdtMPW1ubetoTsglVJLX7rxTa0sXNJ8aynyWphbUqu2pEZ5IVYBbx7fcefXxpWV64XFi+4gNNL5xBjl5Yn2ulbAu7d10N2NMNcvPa2rF66707vs/FZVtmHXM269/qGm7tQwoVFscs7yQx0NDkzHgq6sPa0LSzc0N7eiijtiJ4Njd7A75rOClhbmYjfGfm/PRE4TThwlw9FhpUorOlW7nS1t7N3WYMRKZQzTohYZ8KwvheH5YO+euRlFXtUzN7+s5cXrzmtN8+1ll3c5aMaOmqGNiM29TdcbW2dHGrijWbBV1agtqGHjsuO62tp7qNGs7/jLWlu9FUeOLSzO2/jkw4tddXs91dzxurB2Teur17XUXNFcfUHVsjuLAbQp0y508+NGT+KidOFKAPzDvDiHcziHXwPiY+KznmadDcmyi05gae0FVS+8qPLCVZXYOWZ5PLJM6pTKaiw0Y6cBx2ZwzjuTGbP5FXeoaiFHSiePpK1fqGS5WWitqL58yeF7Gu5vaDY60qR9SbWnvqvS8lMqWr4WZodS94GOhmNNm+tqLl/U5MgyeO89VcZHKlnWavGGptYFY8uqqWVafO9iYLmzf1tTyzo+VF1ZvuHe3FSDO38mndyOQb/2pZfUWHtZ5aWvqFC/KtXXNKtyPNQVFWpr7h+588vAtOV1cXqso/u/VLP/UO1KRfXLz6tieVVavq6iXdlx6ytPSe2L7vQca7jziiXNWEOXp/H076jUumV6OdzcRV+vSY31mNweH7+r7sZPNOkb34bl4o3vqHjxK9L806rMX9bYemPavqb6hRdUnr+iWsv6aGHFBR1qynFVs6Hr43nVLr+s6uJVlZttTQ8eqLf5uiamZ9U6o3L5mypd/LpKS7dUmbugsuXkuNfV6ITviIyNz7Jreqrhtuk1cr25DLUrXzXNnlO5RXjriRN2g7CAwPrG+BRLi46Bjsa2GdnuQbyip6fuOOf2TPp9VoGygX90buM+dXBT5yx10NCgRSZA6iUd92ba2t2zDi1pMkGnMyA40ySUkzt+pjurm0mTc/j3j05sn9S1vmaajm0/QGe/5xtdcoeQ7waowGpBd5j9LukwBvHCZLIDN1uXTpdufawIt4vBKmOJ7URuZ5g7UlzTQFas6o/wyaXhJ8cgX6fIAoeEQ8qbtkV3l/LEsTdM3BiHGAaz3cs7BgNGRi4oZz+GcOEx7uN9uSIzkY6nJb23N9RP393Un792Xz9566Fevb9rv772Bo5RbqhUMy8zmG9LI76lkJULcvomGyQz/bG77WLluB25MyVgFP3sgDOXgcFj+xEOjNPkR0Yb0s3Sxq5J325z2cKULxn7ku3Kqe2rmV69/Ui/uL2lV+7t6/WHh3pjs6O3tvp6Z2egd3d7ur8/tBvowcFIG52JtrpTO9uU/YK23bR2egXtDovaHvg6KGm7X9SO73d8veN49w96YvIiBpLAkCrPMItV7PZo1KoxQdyfOP7RUFuHA20cD3XvYKi7h0On09cd43J7p6N3t0/CvbN5orc2DvXmI7sHB3r13q5+cWdLP39nUz9zHfz0nQ39/M62fn53O/x/cXdLv7y3He6Vezt69cGu3tw40Fubh5HOW07vna1jvbNt53ze2+nqzk5f95zX1sFAuycj49WzzdxTx/Yt3/2gXSQehAuRHjgGg7jaz2WFY6aue775sNMda2O/q52jrquhbLuyER/RZhKI+o0KKpZdX2lnRkr5g5DoyIBYvlCGlekc1bW+fsm2pm340UibW1t6tLmpX/zyFd25c0dXr17Vot/RfvPBNOLm9iX5vf7mm/pn//y/1Ob2jo7cll959RX95Cc/0b/+1/9Kf/qnP4iB0We/9Lx5Dn5yJNKxA20mR30bz5snfb13aCZpNMXH9Ucu25C25iZZKhfMx8bX7dDawjwQLT3RjXY5cfuyrGmOBlo53tDo5/+j/s7Npv7JH3xdX7+5pt//3u/oq9/7fa0++w0tXHnOOm5ecTyQ+5zILMpRdttixz1HRq0ut/XiC8+qOdeKj2j3xm7BttnjaDfTAr5kAo96pMUwgQVF0kAgg+MMD1ObhJ2oWRrqhUtzevHqmsoUOMB87fChPZwmxxQHXbK3KRSNT9ofVfTmVk+bB8fRRpGjaRfVxPZCX23bJ7VKSQfmlwfG9VDuqxUaDlsJPIrR/4bgpmcR3RSiw8DkvTEg73j+bYPEt/nv40KKmxz0SxMaTHC4f2VaHRXq2rXbsq22Wappy33OvVpDh1X3z2z/9O3PRGp8a8R1hvxBJ6AbzHjBgyF/4QVfXTvhqFt4ilXy8ZF3E75gmc+Vo7yiemkUVMapSzUDcDvxe6ZG085JNJKvLgr6B/nN8WZMfAzc/jvuu++7/7pVmdej6qLulpd0p7Sg28U5vVdo626poUd2u7YTj13GLjRg8YKvgYodPAkGQ7elTqenk04neIiTJJjMdAD/mX7GC4qG7vE1qGz/tNsLHJ0m/Gy/kOPxl2iUXyNO/H+/S/8ehw96pHgfG7LI2A95SnHMEPKoanvd9nzSPVmVZOEjaNxTp1yfFDyGEPWVPxq4xV6nXPF9I/MIO/iC5uaTkN3GPWrAPG2rVYUKx7mWdOfBduz62Nw9sF51WmXrK/P82DKc8MgnciAP0gXS5E3kav80GQxPpA+iI1MtY6cDLTWk33nhhm6uWX8hr4Pb/iogzQSRX7r9LQCXO8qbMKLtQ9vcVuGa7lL54P/zCZDPP5xPgHyBAQGQGmhqqCg3BAGGBo2Xjl8YBn7NShvC8LHS6yt1ffuFdTUdHqP2Cwkh1IJKvkDH3DhIlMQUTkYv9BxZaY1jZ8bB8ba6vY4qNnouLl7X8twV1crzqtlom1rhDIcnmrjTVbHBw8B6pz/Q3vGuRepUC3OLmp9bVbO6pHqpraoFNOeKVm08kV+hPNP+wZbGY3dEraz4nki5Rud7rAfb93U8PI5jq26t34rJh96wp629LRs8U9Xtf3X1Kb9vGTe2wpdUtoLlex1l2egap6OtODO4blz//+z9d9DlWXoehj33l25OXw6du2eme/LsbAIW4CIaYgLBWC5L5UBCtMpll/+RVWaxbPoPmaZku+xSlSmqqCrJZJGqoi3JLJMivRQIgCCx3MVigQ0zO6FnOn795e/m9Av3+nnec293z+wAWOyCO+jp+37fub904nvOedNJW/VtlPkXZJ4pOomXYL97gP3OHhlvgtXqFq5uXaeQX0cxV2W8dYQU4CbpAL3RKVIq5cqDVkwcU/npjXssg0+cXESzssM482acOZOB0s6W8bDabKA96aHV6zCPEcvuMZ4R8lSqq8SLZlY+OLmJ0+59RHlqYORDEgIb1VWmxe9sz3snd1jeBKFXwLmtS1RAaixrnvGFdAHjlHJBxYnt+vjsEDHrTIODPkLEY9VtiEKlgFE2QEvbjaVjFItNbK1eoZKUZ11Q2GTCvX4Xg/4QUVDCen0XzfI6Cl7JlmqboCOGa/1OIKGH7WUunOjZuQ/D4vsSlrCE3wtkaAmmY0z7+0g7t0kH2efWnkfQfAbIN9nFSCAG9zHStk9BEaVGHdmwh4RCr/bIL63tIC1vIM0VbQDWHx4BR2+S3CeYllZQ2NghrY4Rt/ehczByGiDYfA4olNl7Y9v+Khse2pZU0coVRAyTts+QI33SoekgnUPjMlKtALFZa6IzMcLJIZLWbcziLkKt6CCfwHCImQZfZl34zSvI73wWufw1unOYRqvIldfglZrurAuf/EBGV9IwjbXmkh5G+++hFLcwjWMkGhwxx7jrzHOhybyvs5wRsvEpxqfvMP8Z0tIqiuuXqGitMB2WySeNCqrkazX4aRdx6xsYt98l/yJ1XH8O/u7nMSldxiRUXtbhFVcxK+7w/hxjq1CxKpiimgzbmPUOSe+oLDSfhbfyAuNlGqyz5PgtfrtjykewfQP+9qcxKVxCHDThF8jPSKfHnTMEkzOSwyEC0f1sxrzctzzPWF/hxrOYFs8xv8LDGLOzPYRsB36+xvI+RypaNwVQ9S8Fxkk7MqLLKOGUF3fw50fR4CcBFnKI+7WSkIeZMk1nhnb2BQ1kSJmWcbdSzePegxOMKG9MqQDTA+WI1AZCNCHAeBZxpfdqVP1JjE6vj5V6FRvk4WZMZLIuHSnuzrhIjM5z4X7dVe+Vk7kjb7cDWVkH8qF8Ln4XId1V7lGYDzzTmQ/KOj77p8m26t+ERQ5sBq8GPngv4+mUSv6MqZoRzKLj95yMRcyH4idetAoiZr8YziIcDTP8FpXh37x5gN9898AGEe61JjgezmwWckLZKaOMIwOEtj3SNmLKp4xLlj5xKEOcthkSr5eR2QxzxPeUdSHjtuGP2bDBDuGbTrh1xju9U0wOJKsrflPi+cEwKDya4YMYZN41yKTz+DqjDIcabOhSTusl2GvHuHc2wZ2zMW7NBxzunfRx57iLW4cdvEd3c79tKyTM3T/Bu7xqW6+37vH6oMXnFt6me/fBGfEwwEiHrUqOYU4E7k59bI5fXsdxgrPuEHcZ9817x4zjmOm08M4h0zpguua6eP+I7pB5Oe7hNu9vHTFvpwPcZT7vng1xn3l/0EnwoO3Kc78ztlU3B/0Eh3THrKvT8RSnoxno1bnxDJ3EQzfTzPEAA+QxZt3qJBKt3phRJhdd1KxaOQ1gyZA0Yx+wlQZCM8skXLv27dq4DVKprmR0MqMr65/ytA7DP231cXB4jEG3R7k5QEWrKxiRDWioDWpgQvEsKvUjQG1F/VVhFs8a5Hj++efx+qc+hc9//vPY2NjAYDDAl7/8Zbz33nv4qZ/6KcrEOk9CuHfhtB2OnkejEe7evYtvf/vbtuJDE4g0AWs4GiOeTNiGcrh48SJeevlllZZgBWfC7paN0y4h5e5umsPNY/JPfVbjJHGxrklarFU/SBkfdQattqwWQzQqJazUymjS6VonTpqzCV6KJviJ7Qg/eW0Nz59rYntzE6vnnkGnsk23Q56iLWy1bR+Tp04Ta7DbBgb1x2SZVpnvr1+nHE695bgzsMEPrYLUmKzaoUArU1R71i7npZO+azov68sNhus99acow0sXV3FlvW44cShQm3b3cZxSb6Fuktch54/Q4/yBbczDzaMRdY6O0VQZwcV31I+REWPUk8ZsVyfTAPtqlzqfKpdnSN/4j8zbMti7gXlpFYpXqSuvysMipacHrMSsq5jywZh6W5/9tUd622bfPeXzGfF3yj7dYR/ssE8P6CbslxPif8y2GZP2xuwPiRzjsRVlvGZyahHsZ9YySDdVDw7XahdzZ2+UEfVJ4l7tQm1q7jQwr8OftWotpqyiVXWxDNVaMch8TvTMvI9IWzp8PqZ+eOCXsOdXcdev4Y5Xxz3e35+v/jjh91ZUwCAkrYpCpKGTUywfTMdoPfOsvm2DleQxWnU1Zl/udtkHyFdKJcqvDO+2YiT7Znuy7fEIWg1mA+UMZzYeTXxg3ItWpTv1E7uKDumLESu5D8F3vfpuPx8R6nsHBnblFdpZF8yHxcd8meM3e7RftRPnDObXj3cARKCMLDL1OBC/LA+bEG/Z5yUL8FZ1LNqv4sUsjAbj7Rwq1lt3nOH23iHuHZ7guNW1wSuPfUAr9Fjt1hY0mCIZThG4enTtxZoCE9CzW8lIYBj5UvXOpjEKuQkurBTw4y9fQJX9RpOdFzTzyQPmWwWb417lVls22Ul3bE/ubt6GRA+WAyCfeJA8tBwAeUpBBMB+50RAv0Ym+axvmq3jlF51djJeeihSwXx2u4wXL63Yvq1uAOTp6+ELjLkrSaIpRQ7cW+GMjreaVTrzMyTZEJ3eMUaTDqLAR7OyiXK4jmkqoSOg/jRFv9+mzkAiSyWt2lg3waTVPYYO7tbhlv3eGU5P7+Po6CY6rbs4O9tDpUwBR0aoSDNMYjt3QoeWS0HRuRXj6QD7x/cxGg+w3tzEWm0XOmjdVjG07pOhdpmHHsaDNlqM7+j0Ng6ObqPXa9sMKx2WG09HOOzeZ/w67LSEdSomVa/B+pfBQAYAKp+9QxwzryGFtI3aDtaL5xDGJTKFAjMWkTkH6MUtKuMnNqOmVKDiVSugS3y0uqdGjDYb26iV6laOUdKbr2iJUYkaaNY3cDbsYDCh6krBt1IoIUtHxEuKSnUVw2SIB0fvMa89NJtNjMcTaEZkudxgnJvEZYqjwS0qUT3iN8aE+Dg8fkDhYQ/HJ7fRaWvLFQ9RQQJEjMOzfYzirg2QNCobGA0T5iVBLmTfYJFOtX3YdEyldgWr1V14rDP1l5RhO6zHgVaAhEU0SmuoBA37bt2FYIfYuzsKKOxzknA+AHr+sFvCEpbwvUJA2umnE0xJl7Le++xzKaLGBXjlVfs+SzuYtN5Bqo39/CJqq5vI9QeI26coBR7C2ham5atULOoU/ikwT46RHH0HU3+KSbmK8uYGknEPk9M7KGYt9m1Swf4J4pN3kB2/hWl3n/QzRH79OvIr10mLSkg6baD3gPRwjFnlHGaNZ5BENaahY2Bz9D8mzdynv1vIJRooLyJXO4eYCo7Xv0cqkCFcfQl+7QZ5igz5VLal0JL++5EGUpiGDviksA6WIUlGtv1INBszP0fIpQMypAGmw0Ok3XvEzQNM476thvFETwdnyE7fp1A/oN8+0DkATu4iOXgD48NvYdrvkXfViEvS3TOWc9TmcwWFNeanco18p0DaLjORZhOGpG1uAH2WULkjCWOOEPePkPbuE19j+NVL8KrXmO8qMm1FdvwmPK0oKVC+2HoZaWkHg1yBcVE1Ic0OvCnr8gR+wnxlPYSNHdJcH9P2HcY/QsZ6CVe3qMeXmI8RMN7H+OSO8VGfceXqzzKtCutQyo+Ms+TWMyqIxJl4tck7Bo6zP2lgNhli39SzhUyil/yXnGIKrIR+KncyJpixn20lLPja8QB39w+QBQUz5ECzAaemIisI26bu3axWbbfTHWq26QCbq3VUSwWHS/I37V0vtzgHzdfs2ZkUTNcGbNamsjV37sddzAzFOpDsaXm1MrhyqBiP/Kq3zB/54+5ZLjJYibNKz4WSDDaXxficmYLKfOhJeKAvzciXkTRnBhSGkQHL99Fj/u8PPHzzwRD/8q1D/Pq7h3hzf4ibxyMbDBlS9pnIKafk83ITlk0DS0pHhgvhTKZPT7Iy01kcbMzmaAYn7dM9o3yhLaVkdNPAi3xopq5wLsOW5AMzlPOFzdZleIGrz8V1ipD0TenoLB22ZjOoaNW2H+UpP7o6ywUR0eEGRrR9iMxgCa8xiz6cpJQJtRXrFD3KoL1xhv44RXfuOqMYbcpAZ/0xr5RxRglaQ3dPdLAcLANzo/w5t8iffvgroyPLNKAMtYizzXQ6bHfatkpp9ulBRyaMshxGU88GEbS9jQ50nR+/attlacsibYuVEn+a1U+hzQaedAg8mA+7UsbN8V4rLWQY0rPRRV2t/HPMsZ4N94xLB6BPNDCowQLiyozjqgjlf97mFi3LWpG91xfduy+S5bRliUDGp/E4wVFbsjZlbJatXCU/Cdkv1B7YNjS4xRQILq4Pw2KijOLV6g+1BblCoWADFdevX8dLL72EL37xi/hjf+yP4eWXX8Yzzzxj4dR+FmEVRgY1vVtZWcHrr7+On//5n6f7BfypX6D7U38Sf/rP/ln83L/1c3j1tVdtUMRyxnj051Y7qI3ynu1MOscsCG0lT6fTY9smbtj/XLlm1G18bDdruLizgZ31VexsrmJzvcm0a1hpVLBWLeLiSgkX8gkuzVp4ruqhSdlb9d6PVnBzUsZvdPO4NWtgnNMGLGyvKgM7q1aUhExPNEEDStqaOaE8f+XSOdSY5t3DM8SpasgNJphRip4zlp+PRmNU+0735VfVv/lb1G+Ken6G169sYqdB/cr8OTBKxsdOf4TTdhv1Rt3ey4fqUbqg4u2Rdr572MPdozbZS94M7hpw9TVIRH/jVOd+eDglrTzLWG5ou7xHqzvYkc2xCzAUcW59f2GMVxzyoxSfMjD8uoEhGYy13ZTO9qBkhBF11Z6ns0IKOCLOD6io7ZMuyx1S/joOyjjju3FYxojPfcoJI8pYmgAzYVsWPdHgBakocc52IPwyjcVKRrOJ5EiwpNMbsyOtpx9tuzShG7N/TKiIj/M6v6OILuPv0LXpziibnTDNu0EVN4M63gsbeJ+y1G3Kcffo9ikDnXhldOlGzKPyo3OKJJ6wgbMdaGA/ZVuUIdYNVIjKODrGtqdGyTxYX6XTSs4+5dlWhzIf+3xRZ1iSfljbYv+1XT3kl31B/IYFY98S/bIiG7iY3dXdCxmPP8uzc+6dbl37dj+ChzeP3X0fwMCOFrpYHJ1d5M8+2v0CmI2F14fXj3sARHU0x479zjmGc8ybJi2pAjSRQfYSFU+DWNqadBYW3OAH5QGtLHz7/ft4cHRGPh0b7xXtUAu19iAawXcaALH6FL0W7WSibls4pS+uRVpKD6InesppsESsjLpMI8zw2evn8fxuFUHi6Lry+WSCkCCML3D/Qfq/HAB5OkH0YzkA8pSCCIAjaOqkzj3esd0SYffOFAQ2ltViDq9eWsOF1Yp1dhf+aYU5gTO3+J1fhUfDpxyFDc8NgLR7JxhNugijwIzqlfwqZREpYAzjxThrH2A8HIkCY3Vt04RfM7TPBrYn73jYRzLpYzRsQ1tdjYcDrDW3bAWJ6scjhz/rnNhKjYTCUq3ZoMJ6hHb3jOEzXNy+inphjdmjsJj0cNLZw9QbMq8JxhSWkvHIjGaDQd8mtVWKdZTzFaY/wkH7PuNNUKAQuVbdRMXXAAhVkZmOUx/jZHRGZfjMlLSN6jbWizsIUh1QN1eMqYueDQ/RGhwzrwFKhRpKtQq6ow463VOia4pypENwpxgTRyetAyoZHaRUijfqF7Ba38Fx79TOEAmmTGNlw+V13KeAF6A76KLbP7GtOVZW1hhnRw0ZlVIDjdIuEuLvoHuTCm4XuXRG3E3QG/SIxyEmkx6yZGLniZRKLG+a4KStFR4jhq9he+MycR6z7vq2KgT5DO3BKQXHCar5FWzVL1LI0FJrEEc66+TMVvpEFGQblVXU8sKVU0YllAgyCjYS6MzoISllCUtYwh8YuMNDU6Cvg75vUYAf21Z5Imw67FsrQ7ont6lkst9WtlBubsLrj5B12ihQEfRIc6bl56gskNeZMX0P8cnbZjxPy6SLW1tI4zGS0z2UMtKgqQZVeWXcOR2ETho8y5Eu57fhV3fZ8SNMBy1k3fuYMj6/fh5+7QqVlypFZg0kS42fIJwcIG7fQTYhnQuptK5cxqQ/Zpx8T/obNq7DLzNcQIWICpNWtMlQkgOV95RqCunJlPnXijgZ4mRSyUdUhrKRKbha+ZeR9gfJGRLylmk6Yd5Cxtkk8RoiO34fYULamZHnDDoI6R+jFmLS9umM1LxEPFEh1yBGwnJ6VLzyzcuYFXbgkQa6SREy3ugMMT5nOV6pkFGZ14Hw8fCI6d6z/ISkm35dOCiTzg+Qtt8hno+RkaZGG9cxK67aQIq2vgpZdt9Lkenw9+Ed5mWMcOUq04vgte7BT3tImYYXUokjH8vpPK3TtxGzPhKviuL6deQq5zGNKoxzvkpBhnrhXlgSD5ahg9zKKUZyTxYo7zbIYAYJyR56pz/3zZxYjdoF273YjskorJ9qJaKsMcR+l+2DvCpPRVvVKIVa58HI81RtipG5MDkMJDPEMeo6I6bEeiJvk0GZDYrfWd/mzGTIv0d5sDeWt7mb30t5lJMfpmJXVwaB4lDh3J17J3+LZ/l394s3xl/Nh+RapirjkRkGZEBSX+HV0wzuEDrjYsL860yPb946wlfePsDXbh7jm/fbtk3UPtl+d6oeOl8hQP+2pQ5xoz6nUqkgalfaMieUoVO0RltZsE9INtCqD20zIUN0IEMbn9NEwxAsJ+9tlYgUbX5XXIZrfuUnezZnsCiXw5GccqCZo6p/GVD03WaBBm5w1XCgKJgXN9Dn3urOyamSQ2VEcfK+216MedR7ySzEm21Bw1AaINPqIc2cll8Z2AQuT0zJ4ne5W6RhPUu0Sf41CBG4wQtbaWGGF8UpXDoa5kwJORuccektvimfTFe4t/d0LLMMevzgrkrLUmaZ+Wxnutizft2fO+fFGb7VRk3HEd5Ylhz7hqhYSnw6tD1qk65Uer34VTjmi2WWHw1oWM5ZzzZ4onpmGmftHo5PzzAibaqVi2iUC2x1WtOwiFHuu0GDaRq00ADG4n4xM9gG9HivFSDr6+u4fPkyrl69an1b7/X9cXB9fmaDGxo82dnZwe65c9jd3cW58+6qeKICaSrDWzskqNkt6lL3asN6o8PeYxbh8MGx8UK1QW0Ru96o49LOBs5vrVFXqKBWK6JcimyCkY4mkSuQjxapV9RyA1SnAyJ75A67jpp4swd8q+fjtr+GI7/ueADzEpImSZu4dm4H9WKRcvvYBmOqzO/h3l2mXaCONcBb791j3soIc3mrE6s71ovOBVg8u5KpFKp74lPthM9WRsoNK8UZPnf9PNZK5GF8qW+qfdW4qvXorEP9qY2tjXUX5qFjP+RV5wO9u9/F7cOWGS/VOtjDDX9yGtQbekW6AmLSIA2GemyDGtCx/NK3wLboUszzNqyV7+rjtuLGiPnTBUQrwckYAYuvXRBczYkekT77efRIW9phHq2wiFPKSWd8d0pcn+XYPtgmOuRRZ+T9pwxzyucztTu6thz761ADGIyjz7CDMLQVGHoehBF6dB275tENiryno79OWGJ6GuQo4oBy0iHTOmTch+QXh8jbu30+6zyPO2zje2EVh34FJ0GFeS3bGSdjyXSis+rvrjGxJYjnikewzKQBNvghw4Bag/VPtg9jEGpbogt0ool8P6HOPxzH6A5HmCTEF8sivhNGmpBInse+o8EPDYwYfxJ9UYwmTzIGNnS7WioL3NvPI/jA48Lno8vjHj7g9fcJFrMyqRtH8HnrcOBo+aPYXT4J86uerbu4x48JlInHLw63zJ27qkwEo+3iJ3yriQvizdruSqsLh6zmu/uneP/uA5x1BuhPUlvh6bEtavBercMolOIgTsT/1TYC4k2TuJSWViipbYlWq5X49CM8uiEOyQ4zhOkQF+o+fvK1a6gyX3m2hwU9ejJBlT9Hvv269u3k/Dn9n78X6Hk5APLJh+UAyFMMjvjO70gInEhIZsI7t3swGS69aBsA685ZgvPNCD9y4xzqfOXmSSzieLpA5baZjA+J6oKZ6XFB8fRdxHQxADJCq3eC4WRAXTJAs7aBSqnugvsZBpNjtLSFVDKmIJ/HyuoqlT9tGXBEIWWMarGM1eY6FScK/9Vdhl1DubCO1cZF5P0alV+KRoGP3rBrqyFGDFOo5XF8doBkEpsR/tzGFUS5ijHGYdzD4ekhhaAUBQpjG7WLaFR2USquoUhXqaxTUVMaFTP677fv2gCIttxarW2jxDASzsiCkQWZbbHVG7SZjxTVqIKV8io0G1gzr+0Q+NwQx90HNuCRm+VRZ9wrzVWctI5t1YpW98aDIfrdM/T6p8TFmRkEdH7HduM5VFjW484B892Cl/osy3kid4puv4txPKSgN2C8ITbXdlAulyggnFIBTVGvrKBR2CFepzjo3CG+Z1S+GthYuYBadYPK2Rqq5RoqxVXUihsoRnXbvuK0dWIDHKqjC5tXmdQU43EH47SHftxl6x/xe4wyhdnzK9dYVionVOpiKnPauqs36CJPwWW1yngLdeKBirIJauxhbCpO3mG/svbyeD/S/YedYNGulrCEJfxeIJE+NxtjrK2odAZIpsHUHpLeAeLWPSTdQyp8pE/5DTR2XybtrCE3IA2hskiyC79xFahoBUiIaNoDeu8ja79DWk7huUI6sXIOyXiG0ckR4x7DixrIkw5EjUsIK1s2+zie9EnXKTSHFUSlPGaDE0yZlxlpRFjdprtAhadMQZrCNel3NEvgj08wae+RzvQxpSIerjEPU3Lk0QPS7SF80sGA9HfmlZBRiVd+ZKue6cBx0RJfs6OdiUCG8IJmRpPmeMUKcjrovHkFnuKgnJ5OxgxIuqYxFNI/neUwPb5J+srylPi8/oxbpdK4jESDOLVLiJi2x8DJ6BDjIcvuT1jeBnxtXUilX8YIDbTkNFiRaNaiZppToTBdPcZ4cGCDJwHLEujsj+p5KmTEzWxi9TSdnJLPBHYIfUQeMZsVECR8Zn69yRnGh28CyZEZUKOV55nXPLyzPXikyTnGMdUKyLMHmPXvY9i+SXzkENZZL1svYhLVkESUbGwAhNmZ6TwmmdSYOb0gnzLDkvtK92SBDXww+zZzVfk33uKUNXvPPz1laiuUFTTjMEsyhJRHSoUQQamMO0fkb8OE3zUwJHlQhlOffI21SB4dEJ9pEvOdJj94OO2OyBdjNOs1Wz2p7RUyn+2I1ykT1UxdN0BHx2fJlyYrkQG6mcwEyVJ0llO9UL7nzsmluneKqkI/Dh94En9d/DGJxWHhMhhaSViAhH1mNNW2KD5GLNfxxMPbhyl+4/0z/PNv7fF6ijfut3D3dIQz4kH7assALyOLsOqZsZ/UxR6YHvv5VA8Z+wFlIc1G91Vmpm1njshYRT+2JZUMGjJI8H1I2SSPCarsJysl386ImOmAZ9aNyZcsu9tLnnhhH5ah34aHmA+HC5bRVao5DVaoPjTgYeilHxneNWCggQrnzc1itm21FLOi4p2sX8KUtiIzeUQfDF8K5NKTs5mj5tel6epH9cpbw/Wj2jHjgsWjC/OlxiP/Csx8Ky/aBk+ZVTh7swhD/4bbuSMa6KbMsfy5Mtud2hcfnGylwUylofpheMuk0ieu5u1LzgzdTMOcfXW4ES+wiSgsX6a0NFCkcywChec969QmhimMxeOuJMqsU9aZ8s7wGoQSPdZWZzKcq2zCdUgquNGs4ZlLW9her1MGpSf6tWzO8fRRoHgXKzkEelY+5XS/GBjRva56ljPlnuEsX4/Bwo9Aq6uFL22bI1lbz6pPN3OYbY/+FuEdTeHVcqxysoyRGzg+Ou4y7ASbWxu4dOEcdrbW0KxUUDSDK/FEHqWWnNmwvOJnl2B71/bAyDMu8saOX0SrsIo2+ct48zJup9oaKrRtyjSwGqm+tIRokuDahS3K+XXK/AnjmmFncwO3br6Dfr+PN99+F/lKE2GhSryz/AxieWb9OR5EvOnRisUXhnu1ITr6kwFLZ12ulXP48Rd3UGUbUM+XL/kTaNvFveMztJneuV3y+vkX+XH+mE3Gd0tbuT04Q+oXMJ0PIjv8aQumiH4KICVl36ZThoRUgmiE1S1fLfq72q6jY6p382VN+mkD4Un0WAOzbEVEqXCjWnP0w2a4s2+ZH97buTH0G9NNiPOB5wY6Tlgnx3JBEYd0R0EZ+1EZe0EFt/0y3verdBW8R7nw3aBh7m26d4Im71fwrr+Cm3Tv+U36aZi/2wxzm/LcfYbbU3xs04dh0dI40YCMBkz4fhiUbAsvbYel1YZa6aFJKzM68UzRH/fn6LoG6Mkx+KQt0tTC1I54x/KqLTjnaKW1YBFMvRQOiJuYPL43jNHu9Mgf2A5FKz3KPvwug7vRK/KjHOmY7Dqicw/pOaPRnZ0N8rB1M4qPcAauw/Gi/qRne0uYP/8AwCwZWF+lezjwMad5dk942C/mV10W7gcBi/cHcHPUuD4s95Ae6DvLxIoQ3xaZ0+CH1T3basw6bA1TvHtnH7fvH6A30gRX0jbyeskFE9avBk0CysSiFYYLIYtOdDwUHyDtVf5tQoNwx1ZlTt4Yl1ZXasKUthCtBwlev7aFly+uIhhPEIlWKz5l/okE5X1eCfYraiH6Oa8NtaP5e4HJTssBkE88mIy0HAB5OuEh4dUdCcHDTk0GaKoWhX4TNsQs6dWngndlLcQXrrOja39oRwoszNMGwocjbsKZo3AL4ulgQfyEVxJNDYCkY7S7p2ao12zYlfqKzZaSMWbqjXHUuotW94BCSIZGvYFao4nRZISutiUh7lfqTexuXEStsoW12nkUi3XUqqvIh1XWldunm/Ie48pw1jvDeDpmulMMB33kEg/nmpexWtoyI5WUu3g6wdGZBkBiFKMqlYrn0ahtolRaRbO5iWq1iTwFtogC4yjp4rBzn34T5KMK1hsbVG4Uj5hqCi+vmcVDdNonxI3ahodSvmCrMTRQMItStEdnOGjtYcIyhdAh8Odtn+IzhhkONJOYDCmmkhKnSCZkumTmNeZhd/MalZEL/J7H6WAPvcEJCrkSzq2fRxRFVHrcQeli9kUKp9vrF1ktU3Q6GsBI0dBATrRpQuFB6w7zq+WgJVy+eMO21apW66hW6qiXV1AOV4mfiOWc4vj0EOO4g4iC6+4G05LBJx1hOOlhMh2ytmXoAGrhCtYr5yhAShhPKayM0Oof20BUPp/Ham0dZeLXDmMUs513GZvpwfYjocMY9Lwd/e7wvfhZwhKW4JHu+rMxJt19+KMHiNgvtRWS9u6epqLWeRQbpKOr1xDR5UgXZ/0uRp1TeKQbYbmOXGOTtHXCeFpA+yay3l3S6wB+9SLytV1koxQZ/fspaWyxgfzO8/Aau/Bqa0yf9HdwhMGYyglpZrFWQTo8dds/zfrwy1QualukAzrLaUr1Q4bRBBi37FwRnRmVRXnkm8wbFesh6a/Hdym9hKRXflQyI1Ju1mW4HpL+KSISJD8MqUCRTpC+kCvAnwzQenAbOp7IL9WY9y0EDKu91L1um/Q2pnCfR6D3/hTJ4XfMABQXmihefQ050ja/cQF58p2ouo4gXySuRKOHGPaPSAMHzLmPPOmnDJDOyD1CNjzGlHQ5Ih+YSskXvQwmdi7KtHOPPIk4qJ+3g9WzWZ66OBV1DY6MiOs0Q8EPEOZZRobVNl5e2mMd3EJyeovKIflOcQ35zRdsa0EdLJ8jrdYM2oSyyUwDL9MR89NHUCijsP1p1sklJGGEmDgTP5bx0puGlmcn/4gPOyXxofLyhMFCwVb+XZn05NRtySLGZtgHgjx5XJwQXzKuBpQvnAE3ojwyYV3sH7eJR6cImgmeEWuiRBBQvcuoKlPQEO+KM81SDNHrDzAcDbGyqhWUasmSQ+ZczYQlM8soV/asq97pXncu10rP3tIpXeekqqsMzo+V5ENO7xT3/KvyTCejv4z/2jZCsydjllN7wfcyD/e7Kb599xRfe3sfX3vnCN+8c4J3joa423cHfY9ZJoWTgYiZnMfMnPLWVmrM05XB0gzepDUyEsjI7VYAKB9yDC/DEXm/5LqQ3wqUPzTDspqb4OpGFZ99bhefe2EdV3ebKFDGiCkLpaOBGY61koPYt/IsVkZYnVie5jVrhokc/WmlgW9nmdnMf0tfxlUnqSuE/LttwphvvtDqHhlELA1zDGLRKaxCLByLOhdc3DYpzrAifxaGv5YXOudL4fWG4eZ+ZJMTHuUUtb7KgCCZ1e2jrzr+ILi4CJYp/isr9Oby5z7p+ih13vPHheMbRU6wcLq6i10Nb2qpxIdWCyq0+VNaSkOWIb5zh9HOw9A5WLRLvtG/HPFiB9baW4dnnZnopwPKrwE+88JFuvO4vN1EJe8ZzV+s1PndQGVdGPcWK0EW70ISdV0XKzUE8qP6d/Ilc/JYXQl01eCl/Jhf0QMNmkun47O8WRjFq/DzMAqt9wKVUyDDva9zBtXGwgCbu7uoNGrUSQJDrTvLhhSEbT6ly+wl42O7k76inQcnjEpnNQwLDaSVNYxLKxhXmshqDXSGYySkU5Yqw7DZEm/sC+IHfoiDkyPUG1VbAfLN3/4tHB4dorlG3WVFqxTzTEf45R/zMbU2b6WxsrgSMB+Gl0fv1OPE/zdKM3zxhR3krexqHwL3q+2r7h+10B2PcOn8tr2TOX4Rh35ljN876+Kdey0bxDGj8xwfqptMegbLrUFKV1f0wjxa+MWP9SHV7bwcdqe8qH+rdT59oPqyQWXizRoTEWGPdBo8EFZY27yKx/Or2o3kEjrZMhK2mxHbxoD6q1yPOm7fL6DNa8sv4iwo2dkbx6EOJq/gUCs1whoOzFXp6jgMGvxGF9VwHNRsFYecwmo1Rzcqo8O4u0EBfa0eodwxCvIYU6dVncvgbOfRqAjKM534LLks79W/VSo61r/yrUka2gtLZZHOaf2Kb1VKldddRBMW5bfQbD7iX+wvfK2tGUeTBO1OH332K02UKWoVWsC+y75PodhtY2eh5+2Q4HiP3jo5yUXt0lz4+QA8fDm/eez5I/3/PkFZMBCN4p9AWHqcBhpeBR9K8AdO/weMwPXmeX3xKrqiSA3HvIqOWhul8KSraOpwkuHBCenI7Qc4anUxTjQwRn/iBeoLjFGTMjQQaANgRru1RWFAus76Z+XLLiGSbQOE5PeqCdvW1/LAOCRbkJbboH0yxG7Vx0++ehV10uwKm16WTizuPwAMfkxAPFvDcfl37Zt4sXfEmfUz916g5+UAyCcf1FeWAyBPKTjiO78TIRURIGOTOkRyaMKDlEht3aFl89Ugw4vnV3Bjp4pQSsFCWHsK4WG5hR9xWxMIRGTnBJQdS0vpNZNKsyxlXMlmCTrdFnrzARAtO9XMMm2JpVUaJ619xPEYpaiEtdUtVKgE6BwLbV8lo0MxLLJe3Cyi0WSISdZDmo0Q008YMh9TzcoEgjCHlgZA0pEtEdcMtyDN49rmDVQCHf6rWQUZ4myAg9P7FIQYnpJPMQqZ/ghjOs21S5iX0XCIMpWLYdLDfuuBKb/ac1XLtLWl1HDcwWDcphKVoFQs2uqVyahnAxjjyYjC3hCjWReng0Psndy3szECP8Lm6jmsNTaYX+bVBkD6RKGHi5tXcOXcDWysnac7h9XGJmrFJiK4Lb5Oe/cwGLZR9EvYaGwxzSqSJEV30OZ3H7trz2GlumGHJLYZb5bO0KiuoV7YoFCQ4KD1HnE2ZPgiQm19QQYmHCVk+mmcIh4kKOQj1lWMo5N7FKrHdl7L1touQgoJhXxIRTFmen0zBmnVRzXQFliXob3OtYWKzktpDVoUMvvIRzo/ZIUKb5VthpKEtRzXehYKqbWb7wkc013CEpbwe4ME/IB0E91DQCsOSBzDtRuIzn0e+c3PorD2MsLVK/Cqm8iiBul1SBI6RDw6wix7QNpxwh7XhR/v28Hck5NbduZHUNpEce15eJVtJCPSy+NbKGRnpBPsoVQqZ6S7mLSBAeMYHNnMqqCwgnytiXRCmt29T74wRJAvUCkhfxjR76Rlh4NjNoGXdJG0j5AjDQuCMqL6s0xzAzmmDbrpuMv7YyqrA9KfI0z7b6O7/y1MSMsjUu6QCrjOwJBhLyBdQ/suenvfZrrvITc6JJ0aMfwZvBHLJxqZ0SvpU2nzIhk+0z55g3EzHPGhFQE50juPtMwjz8kNOsTRCB7TyIU1ljXDRKtaxn2ExJ2XY9mTNmbt9zC6/00MO4fwSDOlaOuAdx99TFX+9n2Wb2Jbg/m1C0hyJcM/WRAS0nJ/2EVEvpKbMI/pMfO7h2nrXSTH75MvjZBEW8hvvYSwvkPFbYJ+5y2WfMS4LiHYfRXh5jVS2YC8sUM6m0e+eMFWvcwibSVgqg9bCDkjeYZRYdLtmbcYAJGKI4VoQZ+fHFCenZ4neU7lnCtrdO760JfhQAYW987xIA2GaKua3jDDSYc8kXGYDi2DG/3I8KnZ9Jp56YLwSqU5oZLd6lI57/dRpdJeLcqwEhCtTIk8kr6Mf6tNyjAl47IZ0hWNZodTbtIAmcwDUsQ/qJiqFAIp8jLVa8CBPhnG5FQ+a7KOZDCV2Wb7Uu6aMB8jZv4kzeG9zgxv7A/w6+/u4ys3D/H19w/x1t4Z7pwOcdxj+6EMMWY+My+0g/plCNbEBHOWsnDAJIRH5YFOii4lBTr2cB28bn6ZU6ZteKfT4ck6q0Db4YWU1YrsexulHF65vIE/8uIFfOaZDTyzUcZuNcBOLcKF1RIurFdRL7JklJ8kf9lWmZSZFqVdKN+mxDNNvrFnzRTV1qampJPuKW3LO/GpCR22ksJ8qiwyt2lwSNtQaSs9yf7MuuTWuR8zIukl/53RkbHxfhGHfXI/duWdwUL9N9mYoDrVsw1yKH7VvcLxXuchKLyl+nhccyewmBef7fmDTh9cf9a9i19Jzni1Mli+527e1qS7OFmd/vVMfUZtSvlRSzS8KizxJgOSWrBricIhaQbxZluA8Z02p5Gsr2RUZpXNy1JE04nto666/qnXruAl6k679RBltpcwJZ1XG2I+rQzfAyzwsYCH+OFVzgxfwu9j7xfwUfcLv5ZvPRMP1r9ZZL1TaZ3Ry4WRf33UvbAkBOkQ7x7bZ5tI8MpF8hHihfKyVj7JCC19UopkRrzb2g+GlZ6pbW21daIGKaZTGYV1fhX1Gz4rbEr/QUHbKbJfUtbuJwnSQDgXfaDOlI1x3D3B0ekR9Y0hZvEE773zNs5duITVzW3mwZ0HoxXoQrAZxFk+q3urRfXj+Z3qTiu4mK7REroC07/Mfvn6lTUUrLxqA/LCO96MqCu8e+8QncEAz105zxbBPi480QljKr1C6TD2m/t9W+mhnqp4pDsZKtnnqEnxWWH5VYi3dqqI9CM6IqO3/Cms4nblsLLw2Xl+ukAlDlgJIetWtE/nc0zVr8W72Tbc5AYNB7vzDULxH62wNV5v00zmPIb4lZHZ6LV0YrZbyWNs12YQJl/TmTE2uMd3Wk1iZ5Hxmw0sixfM27MNEKjvWIdWvM6JHig9xa+0YHlgbaoBWD3zleqS+XfPKpO6lq5u6EODsybLkhYpJvE/tTDrgwS1KReOESgOvbN+q2flkV+UjrAlvqjVIKMJer0BRuPYvoUUvGT81r3ReTVyPahMKqO9Ys75zLfmx+iNJaY3BIUjuJZK0MVu58+8Lu6+b1hE7RJ+FCMv1kP1OH8lePg4f/fYp+8PvocIjE4SjE7OnXCjoGqviwPObXCL9eRqUnxETnVEIZhymGjrUWuA2/cOcHvvCO3BiDWvtsi2aThXS1DcvGM8RmsdFiwdS1v0ms+GMN44Gx9bFR/VRySTyYdtZclQorcrkc4+2sLLF5ooTBNEap/Ms+Qai+SJBJVfeXf5dxhnXdg7ll14mb8X6Hk5APLJB/XV5QDIUwqOAMzvRAiMCLBBmHInJkuCSZabsj/zF6sF4PVnd3GOyppPBetp7teu7A5n7olOQowRWv3P3xlx5R2VAK20OG2foT8ekYnlMJkM0eu2cMZ3cgmF/HxYwub6BWyvXEAhqmA4HNsKiQnDIJ5hokMnOy20Osfo9k95z3AUxldqWq2h2awi3sCYCkFv2KOgQqGF2VqrbmC3cYUEu0jmKgaaURDq26BLhjEJQUyFO7Y9vdu9Ns5aZzg5PUMWJ1htNlmqFIctHUhOv2SGY+an0+/itHWMTldbVeWwVl9HgUpKlsRIUx2gOURn2LJzQdqDNobjMQIqjjoTY2t1l9eGsINW+xTDwZBKY4Dt1SvYaF5AMawTF2WEgQ5XJePRQapkxMedB0y7iwgFrDc2UciXbfsJrQLxp3mGv4ZquWn7EbeJU31bqW2gXlxDlsU46d63QaNc6iEexuj2ekyf+VM5eI37E9Rr2q5qiv2Du4jTIeuhhN31y5b3SNtLkBGOiKtkkmBGRa6W37AtsGaZ+lFG9TZleTuWJ+VvpbZmK0AoUVt7cO3i+4HvN9wSlvD0gTvcL0HWPcK4s4ckl0du5UVEa1rV8Axm4SamQcmMgAnplgwhottT0sMsOyVdbWMyatnB4DHptLYR9EiXosYzCGpXkdPh5WmM+Ow+vLRlqw5m4wRJv4NR5wTjLuNIpggrOyg0LiKsrSOejBD3jkgGEpvJNRqMMeydYdg9xmDQRZAPSWNmll42Ir0MqohWn4Ff2SRfFh8mz86GSCcdjPstTPrHvN4n3Tol/cshDBuYRU0q7UWE5E1eSqWpe4C0v89095COTun3DCnTy5FuJ2MyBx043riAcO0c6fgQSesuqRTLQXqWDScYnrHspI0Z3ZC0WtsKRtU1+NGG0USt+JuS3yTDPsY6+6h7iEnrAWbDDkleCK/ahF8omULmeaSPnUNk5FsyBgQrlxGuXmZ+tZ2iZqCxDFIgyTum4wFdi3zpmPk4wqh3TPyNWV81lDZfQ3HzRdZhGeMJ+dXJ2xilVCEr15DffhV+eYstIE8+oO2ZMkyTCnHbYFkr0OHJMkJowFw4NapqRghNVJB6I8VRstATSG9dYYhL3hDfZrwwLjsHyXh6L4VcsgvLqzK7rTSc0lyOQpQrEe4fttGfTGSHg7bk0KCAjDuPjDj6VZxSrHO26qjTojxzyPbNQOVq1bbIkcFYA4O2HZSMUbyXGimbo7bYMeOKZc0pojIyfgDzyq/S0HdT/imdMh/a2kPbQNjKB7YzbTMzYns8mUxx66SHN+8c42s3D/HVdw7w9fePbFur+50Eez3KYaMUI5bDzvCw+IkXTWhQ+SjfaC90yxXbo+FJyj/96Z0GFrQCRnKyBhrk3wYOZEhVvjRzniUI+B3a7jTuo5qLcWW9is/cOI/P39jBSxdXsFvLoxlOUfVlLE8Q0pUDYL1Wws5aHec2V7HerJuBdEh6wMbMPm2lZamJVVuZoLScwi2cK4tm/KPQp0PdJatJ1be+59On8qa8hyHzysSIN23xpTNRJPM/1lIsjPBuFWzPD3/orIU9BNWY/txb3altLb7Qt+pZeLWK5juLR0NhZpq2Ojejmt3zOncCvVW+rK0RZLRxKTknX7Yiwf4Xb/TLmC1OZ+xwBiLdz5/pZCdUVogaviWuzGBE3PKl6liysw6d9s14qTwL28QU36tPeCG/BawN0h7lUa0xFw9QYn1f313DH3ntMj51dQ071Qh1L0VB26RRD/A0I5f+lT8HDh+/Eyzw9Tj8bu8+6tuH4aEftW9d+Kjc6K190z+vtlrB+oPwzDYm/BM3vUEf33zrbXzj5m2UmuQ7Ielq6FNmTm3msfqEJm7Zwb5qj9a/ycP8CKEGPrTCLFVL0aAHw87bIBs6K4Q5YX2VojwGwwGGiYfxVOGVdso0RiiUIqxvrDMd4M477+D0+BiXrj2LqFjDiLw1SVW/6okCtgPlgVdrkez7ri6dH+kJGlCVMV2ruQqM9NmdJl46R36v93PMWKth8AF1rpv3DzEkfXz+2gXqI4pNzrUrgdJpU8d474A6VSzawLxItyZO5UP5djyd7YjvXbtk1uy7a03iUQteZO2F5ZfBnGTU/FlZnjIQnjWoQYyy9OyIRMGUyBReNJFB70QOhFt3Poi8CPe8M9w+wtoCgw+d2pfdsy4YXnVktJ3OrvpOp3u1Hldnj7tFeIF+VXfO2b3RkEf1aInMwYWbh1TeFRfTcWfZieowfoaxARMLJ9+Lq36VJ5eaJcOyLsDaHp0ZbtnPxHPHbLvdXh/dfh8xZdcwzCMsFBnOtVXHn5VP8vp5PxL/UFjRAU2WsIEWfjCaoPY4T1O/lge7c+90Xdx93zCP4PFYvyd4LNwPBL9LBOJXi9V5wpfc4r3hxh5Yj6KhfNbh5gn92/pCnf8TkYoEIeKpj1Y/xp29Y7x35wEOz3om7+icLLUuG/yge9jS9PwYuHbgrkyQ97zSjwbvrAuQ4hj1Y770yVYiWV5nNmi/Ww3x4y9fwgpZXslnGyVNVlsw2cjSfBLB4WCR/0VfFQ1Vv7T+MX8vsPa/HAD5xIP65nIA5KkGdWQRAJEIEm0SOw12SDAXy9XqD81AK1DV3C3P8CMvnKMgzy+2AuTp7dmu6A53AmMsJpRI+HLMj/oewcgs0TmF9tfVuRBjXm2fTypDdgAtBfsoqqBZ38TW6kWsVXdRCpsM72PQG1EB6PGehFXLImOqB2lChuQOL4sp6Ed+hYryNqKgCG0hrVlUMiZ1u9oWimQ4zbC9uoPV4iaCXGRKnraumlBRU34SKt5TxpONmEe6GYVuHWyYxTkUggJqxQrTStAZkRHLyEThM2V+tNWIripnIahScd9BtdBAtVilUqjtsXIYMa9jhfHyqJRWsLmyg+21c4yzwbyEtvqi224hGSUsXx5r9XOMY41ybEi8SPifY1nloOCng9G1JF4DIBpwyUcllAs1lIt1bKyeQ6O0hpAC3mjYR7vVoYLloV5qMr0a8wCGf8D8so4SCoHEldp2ZkYMPbAHzEKsNFapEEfodLv2vRQ1sV69iGCmwRgqvJqlxroZDWIKpj4ahQ1+P8/wrHdfB8/FaPW6rLeJDeJoBUolqrMcCwHi++03T29/W8ISfr+g+VE6bHw4OiPNHSALq5hWLpJYbZPGVUi72F9JyKUAZOxaZnAIKvDzNXh5+vXK7MMJ6VxA7ldBUCRdXn8B0fqLyFXPkdKHpAE9jKhEioYnWQHxrIThLMCAdEeHp5dql1HafAmhtrEiDRiSJmj12JiKzyTT/HGd4zHDOIltBnqpXLUDy0fDEeJJhpny09wFKg3mv4Qc6VxG2hrPIgzHHiakY/CKKFR26OU5pnMVU/KRXKFq2x7q8HCP8eUbKyjmy0bXRuMBRvHEti7K1TTw8TLyO68A5TXEFPh7p8csM/kWafoo0faH2tgnMkWtL15R9BFVVxAU1uEXNLixSp5SRkyaOCRvS8iEtEKkvHYFwfoVTBvnDPfaxkEqxGQwRr+n8paJxwt2AP2M9NzsXsxvUKrRrQOku9piyQ7xJH+asPz5+nmUtl+E33gGyK+TH7L+RmOM+meswwJypfMosky54hrZR5k8LqWCP8EwoVKaJy6LzHNIXkAdxRk3HP8WQzdeY06qi94/ofRWwgmdU9Tshb1egHty6pnBwxv1ACrB5J+FUAMYEe7tHaFP+cHTdpfEmRucIB+bGxAFMt4pHTtAm2Gpu+PuaQ/v7bdx3KOcoAN+Q4azrXKoSGq7Tg1G8l5yQY4yieJ0xj4ZnykLMB8yYolpawZuyni1V/6YzyMq4kO6Fv0fjnzcamX49r02fvtuC//qrX187c4Z3rjfwdv7Xdw5HuCwyzY9oWzD/LMZmVziS5nVgA5T1iQRKbTajkirAKZsv1JhNVAjY5EZgthHNSuXBIV5o/LMZzNG8PtUxly/yP7O+Pg9JD5Cnb9G2rNdCfDqlS188ZUL+PSz63hus4YLzRBVnxIahTmduaMBFZNDGL2MT6q+POWIeiHATqOIK+sV3DjXxEZxhlpujCBxK8F0so4OhVb9WViCTV7SahM1cMpeoQZ1+N4ZZ2R8Zf6JYxlihGtmmM8z+lf7l/KuUvGPzzYoxj9dFYuK794srvybp0uB1+rfDArEpfMjoAfGrzJqAM2MQsS38mvthXWorYxstTR9uwOgGR1/5BYGScuD5UPvnB85xe2qhXWo4qghEiwMf+VXcdo75Z/fVXfKllCkWxn0SO5ID82X8yNZkN+13VKOtN2nrKoVC4uZtjlyhBxbJDDh99T1G9LGymyEq2tFfOGF8/j89R08s15GM3TfNHClbdCUuOkIypZlmsDnjwuETWXFUYzvhsVAlLUJlt/OEKH70pf+Gf7D/+Nfx7/+ja+b8XR3Z8f6kE3D0hlBRHBe9U6iKsOS+o++a+KQjPoyoLo6d2lr9Y3hld3IZjqT5wSkOx5pRLdPXSNRn0lRVN/JZdhcW8PO9o7Fceudt/Dg/h7WNncQkM95+ZK1RdeGWQarfGsgKolSpWObtbK5NqSmaf2BrsAXr1zdwbNrBUtL4GgfdR8G75AnvX37kPxphuvPnBf3snwoZmcMttaHCdvlrZMRHpAGaSWW0Q7lienZzH4+W59VGMub8qo7hWce1U6UN4tTToMfxL/lVfEoxacMrA8TAca7hWWHa7vjO4c/tTjSGbYpVoF5dYMGbANqB6pTc+5Zvl37EMgwSr9WmQv86rqoYcZCv4Z6Xt05Vwtn2Zs7xaFcyb8LqfdareIGbJx/fVA9Lkrh5A/3wV0VZu4UXvE+BvMoPuAED+8flsGB6LxPvqFdKDTorImJvf4IZ70hOpTNAvYdaEJQqGE98SP2TUbh7BvMH/ut+KFNXqCzOIXzeTKL1NwzS2Dl0e2iNN8/KPz3E8f3G+7DsIjno5x+iVWjcWIs4rfCj7b6U8lldxGvEaGxVUMaCPGJYzpNytFq21Zvglv3jvHevQMct3qUW7VSk5ye4Zyxns4lRnD4XDwu7kUv7J5Xa7EKyzeunYqeMI9qb/SkOKX/CGT3K87G+PTVDbx+uYmi5AXKKJoYkhr9edT+nzwQUgwr9qT+LirhcCqaod7n3guWAyBPB9jg5J/5L77F1rGEpxHEpCRsuQYgwkilSgeJ8ol3ZIIyqieoTvv49E6IP/sTL6M6V7CMmD+lIOIpqUomA3syIUqCckqnb/JFgZeKkzhSRsE+JaHs6RBtKvh6jdnQ8K2Du5ErUCgpohCU4achBX0p3z4maR8jzS72hHMSaVUYP2kPdEuN0ngwK6FZWrUZwJLpRNR1RFZv0kEuLyFvhJJfQnm6ihnj1mFrma89eYfMT4uEfWwCTjgVgQ+ZJokCFRp6ogIToBqGTC9GJ+uxXVCxIQNPKURptqNY/pRMOkrLWC1tM/Epvw2Q5FJMvAwTKoQxmaoEqQLzUPBCKhdUkZgWaQ/jSDHWti5ktjm+z/t1hF7VmLYTUMmADadiODP0kzaS6YQFz6FWWWFyUqq1Z6b2JycehRTie8r86lwQCSAh30dUolSG4YzlnSXwUjE8Kex0VKhyqhPiNpoyj6GMo0B/0mf7z6gAFVGN1u1sEt9nXoj/mJjoj9tMZ8QwFTTyO/Y9R/9pkGDE9+Nkwvr3WO4CmWSede3wpfbyQVBhrcHM4cPPC3BMdwlLWMLvDaIbQW5sKwi84QHfkOaUziEXbZFmltnFRLETkjnSZm1RSKYXzIoI/SmCTCs6Tklf26RV7PPTiIpNFV5EmhPWMbE5nwmp5QBpd4/0egg7wFiztEiGTG0hjfFRhlfaQEYaohmoWaLznJifUKvQmEfGq8FXrbCbzvKISg2bUZwOum6gVuak0hpGhSoS0uMCCXXEPM3ijtEbJClpDOmSzvQIV2x1xJD0RjPbyxmpzTRBQj4TkI6G4y5pbo90sIVpIMOnVr2sMf1NzBh/7JFepdoaa58FGPK7DgQnvyBO3OwvzdcmnYy0TdAa8bVC2qrzp/hlwjgzrQ5heI9+RO+8JuJ8HWPmTVvG+AmVBdJ5rQzJ4hHTIPcsN4AycUq+JAt1jrQ9R95E1sfnAWaTfdLwDvPLsrJMIfmDF24wFwznlRBQNrEyDd9n3nTmFfNU3kasLbXIIwPWYRazLolfP6iR9+2wrlknmtlGvEmZUUtxBif+zg2SZjT5MJl+YsDxCXEQlcPueTWeym+qL4EpgXYvPktl0N4xDB8T1teAfPNX3tjDL33zNvqsT23NoJWe2obTme7YvogvrcPIJOOQ14mnB4xLPnKsm3JAPl3wUQlnWKuVsL1SR7NcRCWKUC3nUcx7tnWc7PjKsZuVmNoKUu2zP2Qb1x7Yw0TPOZx0+mgPxxiMJd/wW0xZh/50yGvMvPWZ95Rt1adTGzJDM3PqViCobllCKvzOYOPyq4kkUu4141+F12QVDWzYlnj0kGkASGVSUH7T1CDhTfKPDc4wXU0ECdh2y6QMmjV5fnMFz13YwDkqxo1ihGbRs9UdXhITuZILiKdAAwBaGcz4GJfwawZ25dLaod6rVbLXsVwjymV9uvYow3E/xWFvjMN2HwetHloDDShqXYhmd6pOGIZp5YsltnwPk4xlZHl0ZoS2J1Xd64yR8WiEMv1oAEZyo/UHNhYphu6Pj7xXPmT85oXvHB7VjuY+2M6YqgY0+F5xK32VwxDMex2yrbanMius9qpXmYU3GXXlX7hX/EpfK6Z1a9jgvxmSbIBGdccPdrWb+VXpEhQN/SldZ7Cb52OurBg2533cDWKx/pl+Sr/yJ7O7raQjHrV6VxPABmxn0oVieta4Xy5Q3KRHojdTysNsH5qRvl6K8Oq1Hbx0eQ1btRBlxhtkboDEBg6UnsrG/LrBHGWWbY0pyyCm3H08sJArHV4eB+FKTmfZTdhu7MwQ1tlXvvKv8e//B/9bfPuNt8gaS1g/fxk/9wt/Gj//5/+HqDbXrE8K5TKeqe6kL6gFaAAyJ/5E3UmDViHbpHQG9T+dMTTTeVuRBsioc+h8JhIG7UBw694Zbt0+YBhK3nQ6+y9fKPA7ccf+FJ+e4Ku//mW8+tkfQ1RftQHT4YT8WYMs6ufWFjSEL8dn8j52OPZftim1UeYlRz1gSn7JHoImO/u/89Ov4LPUeSPSI+HI9GTWm4a9NMD7T37tW2wwPv7cH/0cNkXDlISrTV5Zl0z3LAH+26/t4Z9++5g8rMAYxPSF10Vbc+1Ov8wC2yHLPjeQKn/6FhBxFrf4ldqqDOiKnu+0Ov7pBNJ31ZndExHzvi7Mi9eJH+mNBioE1rsMX0K/vjwOxL4CPQT6WDyyDhw83j8px2l01MK5N49uCA8DL8LM3cP34i8uvLU9gkry4bge+2Ll4sVeip/p5oN5fhxcnhfROdriwPgK+9kjei5azz7OPs0ftrMZmuTTu5ur2F5bQaXI9i/5kv1C/dRNFhBvJV9VWNF18VWG5aMbKJknrDZqmZ7nU33HBp+fEhDfFI6FJ5MaWHThQDjRgMaUbVir3hLej+IMDw6PcXDSwmCU2Ao2TdSwuqOzs6wYn9WVQ+dDEEblFrW8wL/a+gJsha7FpRXWjncrGvGkRDSQ1LlI2rtTAv7CH3kZ15pFlKQ7TPq2Kt1kpIcpPIkgvDH/8/4sOixZTviVDc+di6L+yHZOkDwTh0XcavXx9770TezHJcR+RP1Qk2OILX4XBNT5qtQ/fvTZFfzxH7mBUkx5YB6H65/qL4saWsIfNqBsMlsOgDylYEvpBCQK6qR6UufVzDQpMxOvYNeQnX511sH/4IV1/MRLlxBlY1MGnyJe9iEQrlh44Y3ismNIeidBWWK+BAIJAxGZn2Y8yvxCocOnck1pVnuQy5dPZVlzi/nSBH4RS6rulHPJNDMRamecn/qqDxJsCXxT1RWFYAkkmt0nLV+DADJ2kRhr9YPlhOnbfuZMz/dipJMplbQmY2d+pLzxm4R/sjjeaxYi4yLTDUnk6ZV5dUwvkKMiTXaMrKCSScCfGw2YtmZSGqGPyRyykhkavIBxsz1ZOXNM21QGzUYWAyG7ERNnFiRMaZJljvnQoeWSpWZa+aGZyZaKGpgUFn2Q4kzwE1NAhT0WwBZuiIFpRpCEjSnLqtUq8qFl+IpFs9X0LC1iSnyYMUNhpzb/inlVrTGPGRU91YNpF8yBbJOezlhJkZchk7gTqOxajjrVoEluTPRFFBArlt0Zy5vx/ZR51DZnMmKqOWjuM2tJMiRBuXocLHcfgo969+FwS1jCEn5nUIfMEHkThLmOPWeosE8WEGggmD1ywn6aycJAGqQB31yifs4v7Nc5b8gux6vIwUwr53wzrtrhpdPQBOjIn8DPhqS7jF5GfM1uD0h/SDeQMj6mlQVlC5fzJXQPmIsB4yRdpn8/kyGGRCwSj3CHH8rQp9wFMjjzk1Y2pKLHopcKN+2REpDueNp+SgK26K14kVb+5UnR8yI5ovTMM7+JxrJ4BfIJW0IYDOhfA+gyDmvlRVE+SetYVipBRRZmRjlAqwzFL5RPI87kOzMNnhMfOjNAq+V0zLp4khKYEVezYMxwY+aRtJ64ltI14WfRvoCannQBPxB9F+0mV6QiHfPeZxwB8StFUTqKthLEbMR3Q9Jx5lWGN/rxM+0LT/yTj2iPbinfHum6N2U9kB9mxHlKXjEjvjQgFbKOglD0OkZMnpplTeY3r9RZBxoAIWczZYb8j3nT7H2lrVm+jq8/qaB2wTLMn4gBvnGFcrzVfNjVGJQ5vVM18z35uqYeHCYhfvntA/yrN+6wxbGu2eYUh+Obau/Ev+FRf/rkpCDVi5uwQf7Neg6J4pBatwbwdECyeLPOCOGF7Zj+1YRYp54M4qpbOfJh1bMOb00yGdFhAwExbyapZCCl5yJwsxN5ZZwyPIjvqt+aAUL5YvuVIdZbfFdJrc+wPTPjao9zndbKZPggHtRO9FUrGATi/TarnGGc8SdjWdiL2PY2qx6e26phd7WEzdUyqoUCihHLS885lsvTuRwyFBl6XZ61DYYGA2z7PflTPpm+cLnYZkT5S1hYzSBX+dTdYtbBkILacBJjFCfoM/7/32/ex3vH6gds+/zTlqoqY06DspKN5g06meicOQ2mMt10TLmQ7Z240fknbn97lk3txLzrx4V7HGxQxNW4+ZXBOVF44VEe+CO8OzmZ2LZ2YjXBvqpnyWFsR2wfkhl1CLeytzCQKX75lVMc1mbtu16pTnTDF/SnOtIKi4jvbRUPlRO1LU2I0QG/2h4rYpuT8T6UY2PUQJAmxthWTQHbasFjXWmANUDEOtOqkUES4J3bQ3z9nbsYgjQyXyYd0ko/rVCakPbLWB6jyesLGw1bMXBho4Iy0xMV1ro51bfyqDp0g0SSSYkHa0PCw6LnfHywMKQ6Q813g8nV1n/IXfIRvvOd7+Cv/bW/hl/6pX/OYrBMZAgpG2V9bRPPvvAiLlx7BoVqjW2VuCWu84UIpUoF1XoTa1u7aG5sISySNxAPOrQ/k17DNEajIflfgkK5yHqh7kl+pcEp9e94MsPbb9/CwVnLVnLNgiL7BPmTTVYYo0Ha8q9/7V/imZc/g0JzDSP2K+MzomUEzbhXuyF3YHnF38QrWQ/k+9b+5IlpJRrQIu/bLvn4y3/iNVyvsh1J12I5raWx3qTNvHtwhv/PP/8tFCo1/Jmf+QwuatL8vM2KOjpgvtnm/9G3DvAPvnJo/UPpi0aqh7sYhX/6pNMAspz0Jqebs6UwTjZPkzWsrVBPShjIVBTWm1YLPG1gWDb8ODDaIBwKm8KRHt0rOmLavLon/YpeaEDpg839UXzufu4kjDz85t5J/9YqHNaCvTXQpw/Ep3ACxeHCySlN3T0MwLhE31w+dVX+5VwwtSaXBws9byuujan+57EY6N6Bu1u8f2jnIVhYCZX8aBMAXEzsx+JxTEdpJ+T0vK2XCtharWFzpYZ6OY+88Sx6sb6gVBSJ+JmcKP+8PdtX10YtL64C7KL8f1LB8SziWHj8EGi1jA1okCZpIo98Sn4ZTDIcnXVs8KPdG5pc82iQSbalOTatzh2o/T0OC5Quvi/wrd/FO9WxaIuelbrohkijLCMaJAynY9RzI/zY8xfwUy+dR4VtxLQC6Q8MJFnk8eb+5IH6F+tl3peWAyBLECwHQJ5iWMwMcGxLhmkZPKisUghMvTzGQQXjOCMhjHG5NMa//WNX8cxa2QmEJOhSrp4+cMRMpE2/Wqb9CCgIUKyXImvKnixPmpVHQqv5TxRdKYgTb1LCSUB9E7ZlPJCpKuKVpFWChBRiOonlUno1W1dMT+dgaBssj9Ky9h92ghJzQeakGRw51ov2fQ5Yd1piIgPWzJuQ2ktkV9gq/TG8rzRl6FEbUD260szIjKUYaqmfBlD4hjnT6g7mm14yKjOaXadtSqTESXGRYmTIYFl9KhXaPmImkxbzbQY6SZpUMsRsNXsUMgLQB7UjBhL+GF4DIMyHFBExIw12KErlQE44UU7cG+ZFSgyVCa3S0JkcMp5pNYcGhWb+xCk7TEuGOasLKhQqq5i9/KjVBmZl06YExDsFu5kGMxhzxHCafaqZFrlIjuWhUOKl87qkLy3J12qVmc10HrOumZeJM2D4GuRiWWyJ8JwB2mwZCUdWHFeyJSxhCf9mwZQ79vHQ0wZOPb7RujgZRXwKrurLIYXcEBOjVzJORiRFJdJISfpDR5fMMiL6Qv/s35opLLrh0ZlBJafZ3OrYhLRAWqGZ8truYsBv9DfVAmmK26JDpDH+bELaRXoiY0hWgJ+IwtJ/kCAhzRQHFlUUjRSlmMrwSdrqkb4pnM5q0hZBQaTVgeQqjNdop2gkaZrmLuvsC5EbmWpSDYLnSZ9ij3y8yPywNKRrRiuJAVNaSZO0HWMu1DYjjNuj6iOLXZ50K8shYljlR2dkiDdkpOs2G1uDDsqnBt81QMMMzyJRaNLE1EeYkX/5OcOvT5wG2haMedTgsfAp+UEsMmZeNOs6Ir7MAGRKn8zv4hWsAxngVBFWbzIIiZ8y/yyqzd42fulB+8oLZ7ZfvfiaUrHBdPrxxhYvZlpdqAFrlV3+UsahIXbhmFyS/My2GeH9J4FUm3zAxuCUMBVoLrNZW1mASvvoqvYsfqUWOPbLuD0AvvruAX71t99BGpboQXXtJg8QWWb8YIQWnxR28Vk9KQW1E4FWV2jAwCZIsA25EKwrhrWzHxhYcoXap8w6Fpph3MCGy7tiNZB/+lMYGdHVjqwsfC/5w9q03qnd2Gv96iq/5tNi0gQFtUMZLvhv8SmM+kVO8TCc2je9SVEyZ/GyTDrfo8gmuVYp4tz2Gi5tN7Db8LFe8JEnWjRBSDmWnKx2plIYToUPyUHz/GkGqNJ1+dZqU5eeup8MJEaKpGzTBZLNGF9KGUr5DwINkFjm0GU7/2ffOcUvf/s++mPGFeRZTaHNghd+JdepTlROYaXEKJv5KV6/ftFWZCkOrTCR3Oe2N6W0SlqQyiDDZ8lvBoxA8bkK0Es9e+hSrjyJZWSReUVvWTbDgSu30rSt0uIRmuUCXR4R5TSSMda70OFkK23NolUiGhBR+YKAtIcR2UAFnVYf610Q8h3xLyeKV2XDkQQtQ57StbZERMq52c50fM9c0beeVSPWyvin/E0QaRTbEKRIQ/RStvvvtPFLv/kWel7VygjSGK1YQtxDOUhxlfX++uUVvLRVQokJFFjxvuhPOgaLYnmxwTyT5SUjMjBfqi0pLbU2ayfmPh4w0kBQO/wosMEu5lkDSAcHB/ibf/M/xX/+n/9tWxGiBqot82akvya7BxGiUhkp8SB+oKarbWFVn+J5QVDA1qUr+Mk/9ifxqS/8GPxqk7TZbbPcH4wwYpzlShmlfIl4ASbsFxH5FxGIVnuAN967g/ZYPMatIvHJ34JkiGIywNe+/FU88+pnUWisYqxZ7mozLJvKZ/PJ1L9mlP810D4rWq1r8pVmUYkjSa/QKnFN+LuyWsRf/qMv4ULENDRpgPl31ED8DHjj3iH+wZe+hvrKNn7hpz6FZ+ssun1Veuq0ckyRCPjS2y38/a8cYBBT4mA7lUFauGHyBGKNXn3LIHHIbzbAQSd6p7YhnqeZ+QqiX+NXatd8XgwYPk1g9JKVajxtwcd4JTaID/VpV+cOnD+RXL2SbiicqV1Y25h/t6joxwbH6E9xWvuwTmEpzK8WghfVr8K6eK0eLBL5E3wwnKstgn13z/Lu+j5lN7UL/fGl8mNlnH91/h2lEn90b3SjOF3eH09tAS6scDW/ITg9VDyJcbN/WHtiVKafq43Rr+iW5CC1VW1jp/NwGrUS+dyWnUkVsj9bUS0eycAupxq819VhkN8tXf64G7so3CcVFgMgGkgSzZccqnc2sETar00QE9J/TRDp9Ec4OD7F4Ukb/dHE+KaTFAiGKGLyMVwJg6LBgg8PgHwXWF94BAqlejb9gBUgG58gFR3kR7WJ4rSPy7Uc/uxPvIZzZU0EnbD+WZPMgw0SSMa2mJ5UYB9jORa4WQ6ALEGwHAB5iuGDAyDszOy4vjkKgl4BQ79GJYwMMB3g1Q0Pf/EnnsFKQAGS4aQUiSE/ffA4MRPxXBjmCTkpuiR+5BrCTU5GsikJqxQf0kutGJCQLUFHDEVCbUgmhFmeBFWz5yRaUeAng9M3zbI1YZcSsmacaAWIDEVS5CwOfRNjknLLq/aqnaasF1mVZPjh92mOzFXGuJAMNsvbPrral9c4G6+aYalZkZKANFNTimbK+o2prEpJ1IG0IRVhMeaESoAZE/RNihwZhwZETInQMxUhO0hQRj6WWzOiJRjaTFslac1FbY2slH6ZJAmQlHmlRX8aiGCZTTxTON4xlOFCbVRvNBNTA0qJzRzTrFKZBhkj/WiVjbbeylH5MoMhFQdTvol/sfxEODfhLWOcyqfMayHLy1SIY/lyS9L1gixSzM6XSVKzwIRjYp1l9cgIpxnzP9Us8RGVcuFW7UB1EhMHFiHLQkdcqmwyWlibMMZpiFjCEpbwbxBkNNesZhkY8mmfvXOMCWmDDCMR6dMsYz/O5UlLZPQesC+r3xaMPmhYRP3UGd55x3e25Q2fRTe8jP3Y0/64GnDVjGxSLdJxL42MD+RIB6RITlMq34xXaerQYm1JJUqjFPxpgTxXhr8x6dYAKf1Ag6uk8RrI1jYO2kIkyDxEpEfyacZIDd6QriQh6Y0GbpSeKKSFE/2UKVAGGcZBepyQ5on2KS3bJlHkx+ii6Ktolhug1wG2OjMpIG0jMhBrEIJKrRlgQuIiyDBhXrJpETJO2lkDot0k7FoFZzRR24lpJQnT80gzkddKUsZNPOSZI1Fy8QwzhEuOiDTMwe+ZDId8Vp6YPylb4hQqh9RrKRPat1jqo9JLNHhNBKfhmEUhz0xYNr4TrmVEyGTUIt1XPetgrJR4SsWS+E6jLqEGscSAPNYf/QufMkyJ58gwoskGTyqoLTjM8df4sa56VsWrjS/K5uS+Rwr13C/xKdkh8gsYyyge5LHXT/HL37qPb947QZv1rC3WFJuBMXbxbKXMuBi9jPuptoTkFxlOZVRX91K8EiGMD9oLpeqiEPZtxrY8WN54ncfJ5ipfbLPmSw98J16tt/yTBysj/ageWc8mQTAuzai0dKXQyzhN4CO/uvAKYwYsy9gcN/ygHmcJ871kDLW9POWLjWoB59equLBew1a9gNVyhGpBvmVMnSFi37AVJ4mGPjUhhWVhHJYWf6wszJ8p0mz3Kq1kH8kqNjuX+TGPzKRNpOEjMWBXQ7WezQvjlDfGPwkKeKeb4R/9+k28/+CMfaMAv1C2bZsmVMoly2lQRRNGlKcwHWOjBPz8T76InQrpCyOc0YPVBfMh53CnhOh0sW+6nT+b4w8z8c39Nv7p1/cw0Vko+ixayZSUP9WkVif7OheFvf1zL+7ilWc2UOT7iH5Fn4Ui639WIPZ1C+ue9co1Fb7nVfVszwyzqEM7sFw39iQ88ovlXcAcG8JUOudDeXJ3/KU/4V71lqZasZwjzfLRJZ3QIfpf+o03MfAqJBsFG5AuzGJcWi3itctbuLFbx3o5YLtg+yZN0wCXzpFRnBqssnZOuVm4ZyqubQpxMtDLKQv8caVw+flhg3WbDwDzYxlT9aotsCZFS6MQv/Zrv4a/9Jf+og2EqG60IiRl+xK+I52FwzIO4wlmxKVIKDUMtivRbOKcOokZ4UpuNcgX//Sfw8/8hf8RyjvnSM9nSCYpxkPSbfLYYl4rdFw7l+6SkNdocG7vqIt33j8iH2JvZN8R7YqI+3I6wlf/5b/C9dd/FH6tzrTJI1iXNqzNfNpgDHPnBkDIJ2wARDRiQh9u+DtjXqWjFRjf81t1/M9+8lls6+wipq2RNnJQq8cJ4/rt2w/w9/+7r2Bt4zz+5Bdfw0trPkLVu7AnOuJ6khnKfvX20AZATvtjyyu5H+knqYUNEmmAg/2PTrzZMCZ9gXzQDm0nXrSK0dgicac25HiVWvAinacP1GSNFj52FVhf5lWT4syTgPVvmLKrPM/ryfqpwgvPurr3orWSPxTG0QkBvzyW4PzO4IMGzsW9paAXdrU7hrOv9L9Iy/TTxwrgYpE8wou95o+Fc/KQPLCpzP3Jw7wscvZSz4tYHFhcj4FNrmS64oTq1wuaa/qt5DISY8l9i/OiJPuKthbZ/xulPDaaFazWK2hUq6QJbJP0O2MfEW02+mxhHuXO5ZD3vLg8fjJhwTfFs8Uj7Z64lNNkhl4yw3FvgqOzNlqdHoakdzGJmni06KYNvNOvaJ4wpvp2PI2BGZd7u6jdRyC8fvCd8/fwbvGRDUGGf6PJ/KDBGLV02XhW/DG+eH0DP/XqOZSoK2n9r846TRJqKuR7Ka/i0U8usFebLOUKITwsB0CWoAGQ5SHoTyk8YuO8kxAgAiCmxy5OdcW2PCiEIUqzIZ5ZL+C1S6sIM3euwdPbnxc4W4B7dqSOjIr4s2fiyAw8xJOEDamWtlpCwgEJositnIxpMsSZFU1Avzbbx8IwVhFoaQ+8NWFEdaQvplzpM4UVCjE6YF15kEBjB53L4EQlRIQfJMhayqhBBxmFdAiWaLJHIq5l7Xonw4MttZYxnx+nMtbJL8NL+dfMNRnuNJNLhxpKQJRCI8VByWj4YSrCr621mJbKTp+WVxPyKPibkiouagKdlYIRK32VnfdqU/ymcsiHvSA+nbAo5s0vZr8gzmTYpFLyaBuBxHBhK2YUB8sjYcwGOXivWjHBTgWXcMcQrCGim3ExDoXXQIXUdgmCKq9S9WXo0XY3Mngqi8oP/+jFDJyBlBgz7qgeGIKaimazKW7hil4NxyqnVoKofBbREpawhH+jIIHXDtklodRh4DLqaMslM4Syf041WJCRhpEuBVqpRsiMUoj7iUaI5shgyKvRIN5pYHkquqZerIEOR580UcAOTdZ7Koz6ZrTOaIb8kSaS7tggRK5AGhPRiT7Tg+e2ONT2NmaApaKirQVTxW3bOyWkKWOLx7b8ycnQJBoo6p4wHq2UEFUkHWf8mpGteG2VGyFVuqEEcZZLRhXGHzIe2waCedcgiXCi7UhUvik1sohlMT6lASPGoYEJlVOr/mYaPGD+BA+NjKSP4ickpfxGp/hlEONVA/nG8VgH8iCaLZybYZyRJ8bI3OCI6L3RYaYjg4+Vk9i2WbJ8kplKNaSZ2KolOwmL+cqznmzwx+qZeWM9MyrSbYVWnvSOyav8eqGyMmbby39eh5odymQJjte4kj954HingwUfdcV6vDy6nz+z7A6Ef+KKda/6ShLWE/EYZIltD7S+UcdgNMPR6ZlrG9bOVWuu9amulYYMnlrRYPvvs45lVFHdmzGY/E+80iYJEMSnbbBs3i7Eyy0frGVrFkxHVxkC3MSCeXksuMu3bp2hQW2Ff6pLXq2d0OOU31SvMuibQZ2RObzQF9+ZzMswGszLT2NbAW1b0EmOSWMU+X27UcDzF9bwIy9cwKeuruHli01cXSthozBFNTdGcTo2Q6XizzTZgfcB2xm7jyuX8jXvK5a6ZBbhgvjRBBSFm5fM8ixZRrcqr221xfwIRws82GcLwz+2ca02DYsBzjojdPpjxAwympAu+CqJ8CO64/CuM/20HkQHSpfY5q9t1dEIPVT9BHU/RZ2CYC2U81CPfNRY9428T+fNr3wuBGgWQ6zyuloO0RrG+PbdM9ISbZGmbCtv6kWuDHYIusoQD/Di5QZeu7KOJsvdZJNYyc8YZw7VEEwTvBKnzEPFz+iYx1yCMvtpmXSyyGuRz8UZ7ylvFkj7NGNfaRieRYeFJz6Lepjxzp5Fz93Qs73n1Wi0HL8Hqgu6LCUdZp1odrS2Gds/O8Xt+/esfXjZCLu1PL5w4zx+8sVzeHGrjM0wYx7cSrgFbVOZXTsL5qkZBeLnRVtW3lzaah8KYPVu7mMAEUQm/Xjqdm/tjLSXuDAZl/ff/va38F/+l/8FdLi+BiM1IO+2cyMtZnuS3hBqJY14HusvEC0n7vNMo0h/wsaM7a8/6OLWnfdR39nB+eeeY/90q0TCsGiTtDSrPCRy1G7SZMxQMSK2tby2zmJ7nwx1/kpqfEt6V8R8PNjbQ3NjG36hgER1SsXEmbHpDL2iM+oxqi3SOL7TYK/SEk2y+mF71Iz3yytlvHKhyXvlmR7V4XhVH9VgyoOzLr7+nXsoVuq4en4D2xXJBOrZ/DPk0Sevqvv9foZ3DjrojyfGl6SfCOdGl0SLrO0prxZwntd5vgninnrJ7DvepvzPvVo6TyG42nDOwPD1qBepnoWwxbP6o0JZ/+Mb+8LvCzy6q6On9myP86d5PJaGKkHPFsAFtjv+uDePpWn3zlmMFlYfJG84mePxPOtXNIi/vCqXuupXzpVJ/NBitACuJAtYxPH4O4Hz+xiQLqn9OX34gx/1bLx4ji/5s1WK1Ld1jtRwNEa308UJZYAzXseUEfwgQhDlmQ7bpRJjvGZsVo4Yjw2mztNxv78zGEqEX/forgr+6OkHhMfy85h72Pd+jzREvxw88reIz8ovXFnf5tWPZJXAWXeAO3sHePfeAe4enuG41bWzzWREJ5UyuUkrqMU5rPhGaxQxn1gXxttUX8LtR2XvI7PsXj5scryKjpitRHKu0mI6AfNdIB3dIg/+mdeukJ+Dsr/4KTULyhBatadBf9HmRd94MkGIMEzYk/iCsO0G+lV36kvuvUDPy0PQP/kgOXw5APKUglMSRFytSztisOisMnj7efjJANthjE9dXsfltbLN5BIxMbrx1PZsldu5R3cOh46V6s2cifFWuHLMQ06E1gmxJsjyyQQhm+KjGWEUmalciMzKt5uV7MLLm1NiycCoFJuxhs8yvok3SlGRH80u8yjYB1qtAMZphgqXnoYlJKRo0ISasykZmnVobUHGL8aj+cCi78q3DFWaTasXYsLTnLZ30aHmjHEaWSm1bYOMcKYQ8VnKha9ZA7zT4I/2XZZiykyT0cvPzBnFFCeZsQYfbLYE86fBH61AknKoPGjFhVZiaKgl1KGIzLvGE0zNVP5MoZDx0LdZzlkaMD8hIirSYvZJqvQYrwx40LYEMiYQdzLK6I9+GQ0zzTSJe0tTOLSSKX6HuVlK/LN8brasq2H9OKOGq0f3UohT2Hnd6jMR6UIs3BKWsIQfBqgnyigliiEaKRANMZJrvZJ/6tPWr9U79fyor2rGqnVhOkerRZNIZ6gk2GoFxUOCISpi22KRb2oVoE86SerBVIv0QBqnrbLoXdsEJplTknRmhQwwGnBxdIcKEePQ3vXGM/gj2qvF81qtkYaalEDqJaVEAWZajZkwTfohkdKgt7a/yrRlFl+IjpuiLZJEOpbaALXyKYOW4ldZeM90FFIDD6KDSlt2Fg01uMNrNUhNmq7VIVMPofEkKUlKn1ih0yCKVqwI4TLo2hkMUrD5YkYabMY+rVaZjsxgaYMvxFpKfMXKIEsp3xqM190jUI3oV+kwv0xLxjJHb/Ur46Vu576UB92pPkl89VY/Mlqphp2xiXHK2Uf5t1rnH3PA91ppIgPEkwsOF84JFvcq0+IqUNkdjpzjr5CishMHuledmB/eF6II6ytllNkOe6dHSMcj1rFM6WyhbDBaOao6dzPg57Hzxw1iydysaBk3/UjOkNyjP3l27UgeVEuSRZS8qyMb+FDcdDaZQO2K7dEMM8yhOckz/K57C2SRKaZ5aS0ulVA54VtFwzsZWClRWZ3rsONSNjJX82JcqOfx+pUt/PiL5/Ejz67ixd06LtaJg6KHmq9tIiQ3ufwyAVc2pctHl7zLg9qr5c3yp3u2WnUwd0v/yo/D2dzHHBQvQS/Mo4t//tZAJVoYq7Qqt1TJ4507R+gn9Md69DUT3zwKM5Jl1BMphxGHMmrHwyGu7GygVvBsdjqSEQoyaLP/UqQjLcozG4wr1SCr+jwdsyFpymQ2xqHavdeZ4Ddvn0Erx5WO8uSuSkt0SOkCEXF7Y7uGKxsrCFNtQkh6I0lR8pjh4DE3x8Xi+hAf9jx/N/8RDbLat3CKS0WW3Cs575F/a1fzYM7pj+/ZDrRlrAzSCctrdJFxHR0c4ej+PdTzPj517SJ+7OUreOFCA2sFHwXSP63qU2IuFUVosc1Tc3EvnLVx3S/aDB/muZ77+DhA+ZaEq7bl8mQ5UV6tQMzjPL86yP7LX/4y/uk/+Sek0/zONiJqbdvqsi9qoF1bmGmLnDidWJ1KX/HJb2wn3JQ8gPqGVlp47D+T0QD5ehNXXngF9UodOVncNLgeajWhwion4o/ip2xv7PuiN4VSxfLW7/cc72I9+XGCw719rGxvISxXyLekIznKo3Zr/ID3xpOl21pfVDuZMM+Mg/3R9CK+Vd9+7cIKrm5WyQeJF7YJtWYFV5Y0v/fuSR9v3DxAsVzD1d01nKuFroz8xmgJ8mySAPrMy/5ZCwetLqZB0SYa8BV1C+lFarOG7nkY8TfXTgTqQ3zpEmZ8unWD9ApggZ56MHTw12pJfEtv1C4MZ7q6V3ad4031/Ig22Oe5m//x4eE937uvBJML7COdq6/FJwf24XdxuigPc/poLYZt0SVoeTS++BHOglsULl17ZENy1EZxLtwHYRHsoVNw3jy8n4d/+J0fF04eF18c//LtjNAJ+2lvkuK408fRWRft4QQxG6Ztb8r+O2MfW/QpdkPLlniOA8ZImqLoJUragL7Ko+TUMdSBeH2Ysvzoas+LP/lVVIpL3+fvPuwY2L7IL+8tVuXDEnNu4WceHfPt/PLHwpmOTyerjPKrArlJrS4u4URbWEmWlRw04bU9nuLecRvv3D3Ae3vHOGgP0YmnGGuVs3Aj2YX4FB2yiUGWHtPhRXkxe4zdu7y4v8WzfnSVfzqGc+3DcmTPjs89ahvunl/oRyuItLxO549JhlmhrPPjN87jBfLlAumh8K/yaDKDJAZbgWblJSzSfuJACHmIQYc6e8tftVO1IMOfEW+rm+UAyCcfTHZYDoA8faA+qS7suqgzDj3s1OziJHlmkAnTAXYLKT57/TzWypplSb/GvFzIJQgc03HwEXjhoxFXMTLDsRPLBY5xUfC3mai6OkZjMgP9Wr3wz/HHORNiHWibJ0oUmFLqztnsXgrmGpxieCkZMl/Z0lRetZrBDsK0OC02G4jQN2qwjHbCZ49KA9UNKYGBmb7su2Ygz3wqLJYek9YAyPwQ8tlMDFLZmrCtaFmlVBsqOMxsLMVQy2MVC5NxRj1nhEs0CKHZzspTjiqC0mC+ZNxYrEAyBqSwIdNi2mEuNF3I8Md/zeRNpzHDJJZuJtwRDzr4cJolVN6HjIVlpzCWi7SXdMKwOthX29YQ+yZ5acY2lSHi1eqHVaK98cN8hJi41Ocp/adU/qOASpnavusihmfVjAO9FCbkdC/jhvA7f2Ww+L6EJSzhhwHqgc5JaH0klJoRnFd7lmHkoXFkIbLq16kOTlIWfZIP0WPGpEFZ0kgprWbcoW8dgCo6p6XuHkYIMTDheKZtBb0J/NyQlEaDANpGQyY/0WzRHRl36D835nfSHPoJRaPSEeNNGG+CvG2rZ2YjfpWh06N/bf0xQd4jbWIcOQ1GyGik+Jm6Zrv7/oikc0wixpCkd6JjMuznSeh0ILXHeLV9oVbIaZsoUj1LS/nQIeh2NhJptOQAbScYyYDF9yFpqfIbki8EDCPnsYxeMGGpmBchwejflOlnKPia5zZizvtMl3khX8oS4tQLyQt88pQcWYUMZcwH82Lb1QjtQr/VwmN1YC9dvSwMGIu6NF46969bvXVhnNMbrSqxwQ/FaU4fFAPxqvd0i/g+GeDK55zuf/ey6auTTYgH8yoc64l4JrqK5KUbzRqqpQI67Y5trySOHbNtiPeajYPtTCFM3mH92oxGOskYqgf1tkU1OqMw37C9ava4Jhlo9ZM+8hXbIVuRyT2uXm3WKp1rIpJF9WXuz+Lhg/yqni0Nlw9tT6SZ6OwZzpHPB1mMiE4zIHXg50o0w43dVbx67Rw+/9IVvP7sFp7daeJcLY/VCKiyn8noHbF/apKGJpAoHWaIbVg4U+Fdmvw1p1zrvVqpfZdMZ/cLPwJXNrmPhrnfhfcPgV4rRhmMwyjE2WCKw87Qtggi0l2/EB4ktwtHogWStRSS/T5PGnDpXM36rbZHtYO79V1nMyio6o/vtNWeVQrjUp1r9azkNYqSuNOO8fW77fkAiMqi2PUn/zKoKIdsP9kE13fquLzRdMYCxmn1Nvf90aD3H3YOjwtcPvriMP7o+kH3CB5/oxV8kncZm+RUOhnv4iRF56xFujjFFz71Cl64tI1zKyVUWNVaPeOpvRK3VnNWvt8pFVe3C+dAXxymPhzmhwuLfC9+mSPjh4Q5EdXqIW3npclGb731Fv67f/yPEfFeB82z4bMO2U4UmA3BBpF0jlRAmTukfM8GpDO18pSfFd1gMqZMTlovv2xjq7sXcf3lT2N1ZYP8U3oN/Sms+hRpinq1H5KGqM0xvAyHYRRZ+mp3nUGfWdQqLA97d++jtrkFr1hmXqgvKEviR/wuumOr7cmJFqs/1C5VA1YP1JH0pOdmmOIzV9ZxrllkeubR3jt0ULfhq9unQ3zn/WMUmNbVnVWca7jJYNbKzSNzzjxpCM4nzdSs79v7LSRhhWmRTkqHM5o096588MbxMAeuRyh9F/Oj1qPfR/6WIFw592FYYOqDeHv05neGRYwfdj84LOrV1e2jOH+v3D3+3oV01OMPCj6Ym48GyQYz8gWd9aMVDHEyRW88Qac/xFm3h6PTFk60wmHMfse+GrDvaqcGdmr2b+aeCdhOCPPcy4naWElEQ8WnHnPiVfxI5/i8vi/w4Prw3N/cr5MV5t/pFK19mzujbArIj/Tq/Ohn7s/SVV+zd+6DJg9pVaD4oK1sVD5lHNBEJMmwpIFjssbuKMaDkxbev3eIm3cfYO+4hc54ilHmY8xw6UyTNjQzUzxZ/dnhYQG6e4SZOSjf8yd9M1h8fOjJFUnw8BPzrpIsQGFFS4UjbR0rPIkaVqg/XKoF+ImXL2M15DvJ/QwniV2TSrTy2la2MrzsOo9F+YQB6/IxXC5an9UB3+u6HAB5+mA5API0AzumCKe6v7snkTdSQJVEHZzKnZaYX6z5+NwLuyjylZmlpfg9RkyW8PuBD+LNcG9O9+6bWyovwixGRebD13rUgeW2f3pIIZxX2yeWHGqUjVgrE4R5J3CkDKMDAm2mAYWPlIw7zulA3AQ6UF1LyI1hSqENUkxmA35LSfCpMBQVJqXaIAMY4/F1QNcIaU6HyFK5oZ8pGUOceXMFe8bvVGryLEOeTJJhNECS5ahQytjly+DHViOdmvnIQpYhSmy2cMK2lU61tQvT0iCO9owggxbjnVKpmjDchHFM/JgoEhNmvFQaNNMsp82jmU8tt48iCiDTHp9ZPpbTZx5CxpdjWSfMW4wB8xAztAQAlp14kzkxkSFOs1Y0QCQlj4jWrO7MUzljK5cGf4T7TFuUWZ1YVT0G3/ViCUtYwh9i+N57LGmISDMDGIVWQNIk0U5ezEhoMzj5VbPYcqSLQRQh9MYIpi2+61GN6FCJ6JJUDeAlfQYak7aQ/oUaQCGdIq0JZ6dM5wFppQ5Op8vmYTTIQOdnfEdaFWYRCiSy2nIlTDsWt0e/XsLvyRiaaa2VIlMqONrbvOC1LB8Bv/lB3lbQBaTZIfmFl7aYFt1sBB0erv3vw1yf8TBtfhetTTXVNJenH4Zl+ULm28vaZBI9lpnlUZmYj9yUYWZdOoa3meJUrRhfNmM+faadHMObnsH3hmQ5sckOMw1U0zEi/ieIZFDUXuui0cbwHLp/L/he/Px+4A86vicT1LiFC7V6qXu8N8RIYXQDFI1mGaurTTsku99TW+WXGWWIVPxXW6SJVzIGKhiaza0Vq5oR7vqK4tbgAdsr32uNgli/Zo4rfk3EsFnnSpOetbpJM8u1YkqDJDZQwjAaPAnY3rW6U4Z0KaOyrTjTgswYfM/05XTovWbrawvXQjZGlVLBapjiUiOPVy+v44svX8EXXt7GtfOrOL9Zx2qtgEoUUObV4fwyVCq/GkB0cojlzWXQyql7e/UxgfKkWhM286US3r97iB4RqdVVYaBtqSTTW+8irrRKTfXAchAnk2EfF3d3WF6fNEXldAYPITMh3lQHLn4p92oT83LzqjvNgr3VmuAb99uUn/KP/JhyIVxJ3mSNMN4S6d/zWkmz3jSaJmO7WpWLy1L9GEBt2krCtkXH9qI61Wq0aqWCcztb2N1aRSkKSb8o1xqNY5tQm1fZ5nE8mTDv31YK9eH5/bw4ai8aeLAVV/zTQeVf/epX0Wp3kGiAwmRi3yY8aVKWuoL6ud3w37bCJT1QJLY1bZgnf2KHZpxsDvjcj/00Pv2FnzKDqhflkdBroglHbEUaqFfb0nlDMsiZaUn0gEmW+FMtFqiHkJdqUGU0xN0797By/jJm+TLldSocArUvlUXGR60u0WA+Y7OZ5sor45Z+YgOm+qOO1Mhn+CPPn8d6KbRBFrV0oyXWN3Q2Vg7vnY3wxq0zhFERl7YbuLgSubZAWiS+ruakHiPs5omLk/YQ7z0YsPUXrD9pNpfbfk/pLmEJTwqoRbPFzhutJta4lR0eZYHMtuIejcfodHo4PD7BkQYBeiPydNLTPNs+eY/u7dBv9T1e2avIm0RRNTBPHsbvNkBAN+e2lqqtiDa/JCcLx/SNRuneZYh9kO/o1O8X7+VEqTXwqj6tWBVSsoERPYJIliYMLDiSOzvs0WCFDg3XdB8dZi6+OkxmOOsMcO/gGO/euo/be/s4PuugMxxjwm9GryzfDj9u8usPAMyfyvQI9KDCuKvVy9zNa+kxYH5Ebyhzx5no2AylgC4d4kduXMSN81XqIaKZLPucdttkIOJGpbd3gg9G+gSB6lmZdwXIUV4Ulhb4VB25r9aK7Hk5APLJB+kny0PQn1JQ5xftd4dMi7GoU5Mw5Khkkshrpkw1G+EnrtbwJz53lYqj1CsZkjXziYHJBJbw/YBIrwiuY8sL5+gkv5FraxsRdU4Z/CVfmPGexFazj2fRDBMq46dnJzhrn5LZjqB9p2V4qlUbWKlvoFxsIB+UTBE4OTvA0ek91myf7+u4euEV6IDaWabBjSHuHd5Eq9eiDlLFxuoWet0OBn0dGpyxTUww80cmQXhTKi+2d32ISnkF57YuoF6lShufots7Q6t1hs6ga+2qUCyiWq5htbGDYrjCsFQ+2NjG0zYGMfN92ka3MzJGLIWmtrpqByMW/TwZcxVRWMMoTvD+0ds46txBgW3zXH0HOysXoMNZEyoq2hpLhpNO5xT3j9+nQKJZ05Hlq0k8KD8PWntk+DqYqoBpJgFILVyjMRnCoMz8XcDmxi4VmQDdYQunrQfo9M+QZGMKdGNUSmXUS+vM0xpWq+sIKBBZdS1hCUv4xIP4o5tBLfpLmk0lSEpVJqMrabXMQm50V8YgbQcExJ2b6O//Jvy05ZSKTKJwQEZLul4uImhuI086lgvWkUs9xMffxPDoa7aCT5tpaSvCkDROAxBSusB3teYOqitXkSNdn43PgPEROqd3MRq2+Z1Uj8plrV7BrFDHtHoJXujj5L1/hVn/hDRvBWsXPgW/dIFeQyA5RdK/g9b+GyxSiMLqS0Z7k+5ttI/uQgeSF1cvoXTuJchUDA2AzMgDhnvYv/1bLOoZIo+0l+XWahWtBNFBjrFGwGd1lCvnULtwFbNihLT7AL37byIedaFViNksQqm2iYC01Cutwis2yVp0IDz5H/mbVpxoAJxsgW4pX3wcINlEIPnEGQlMVXTGBLVxtpmMjLfPpn3YS3DvuIdvvX0b9w/PkIYlDCUj5DTrkwEkU/LqYlKkTi20AQ4pH/MvkgPMyEAGLWOIfJlBUQ1BIdU+5EPh9Z5yka1EtvDzpCR4ME9mdlSX5Y+timAWIk9nouWwvVLHer2AnWYNG/UAtbxP3h7ajHLP9rDRvEimIasv5Qufacj8qoECrYLQlqAC5coZRpx/gfLnvnw8oPTjGeUYL8I//PJ7+MqdFiW+PMutbfE0qYXlUH1knp0PN0uHlJbcOSCfe3YHP/vaNkpJjLJPJT6Xkf4IH/TBfig8BlOtNFMtEuvEkyROXmzrs1959wz/1VfusP4qthpOtSCfqpCZJpQIT6SRG7Mefv71C/jR6+cRploxJhlT9a8BK4fHHzaoragmlbwmD2kimGb22kI2tgttI5Ylam9uAMi2aZUOZO3PYmAZnmRapVIs+ozqQv3cfZGZSAMEoW1LlWE8HuPv/d2/i//7/+3/Sh1hgCSOrc8EkWZCs4WlxBHrUu0t47PqPOR3n+1I2ztm7GsTrToi39Ci8j/1P/6f4xd+8X+FWbWJHvMwJhoDplVMPM1vop5DdiWhne+lj2ilvOogb7yYbZ2VdPDgCGfvvY9/8cu/jsuf+yn4K5tI1LbIo7Ui0YA8jM2cdecGTwUp6zll3jReE1I/kf9ZboRnayn+N3/iU1glCTPcECF2RiDDayClw7S/9O4J/r+/8h3Ui1X8LNvzzzzfJG1YmDzV2tUbRTnYdhjsG+yL//Wv38PtIctEGmJ5ky7hsrKEJTwR4Ca+stka/yXN4LP0d+O/aszqTOzzjgdLRmZ/Fg8OA+rbPsqFPKrVEsrlEq8VFMl/NSgh6s8gdBpYZhjrI4yDPMi2R+QnpWF2EP4664mjWeqdTk5QXshn3Et7b7fKmz4TtPLqcTAezohtUo5yTX8a+GBIRcf37NHMk1avjMgDWr0BesMR+qR9A161SlCrX8UrbeIG47CzAD1RAoWdD6gzsh90AEQ4eBzmRTJY0OvHYfFqUXb6Mj5lW18Rt+WpzvYt4he+8Dx2KtQ50pg0jvyaPoVDhVdYi4dX4fHJBdF2tTFXB8QCy+rwoTrTQJy1gJnjF5JBl4egf/KBdGx5CPrTCCKYxkZE6NhRHW3jr+uzjtiRka2EU3z+2fPYqlKREmPTqgHjVSKQPxhBf3phge8FzJFujjglURZu3T7qrCVKBFImKL1T/k5xNj7E/aObODi5i+7gDMNhG2k6IKMdYTA6I4PuUOgmgadw4UU5dCbHOGzdpjJxinzBR7O6TcEiMKVWh+ju8dvx4BjTwENztYlRr49up4PRZIhx1sNo1kGcjTGZxDagYlupBDNUGhFG6SkOzm4xL/fQ7p6wVcRsO2MqSsxHXwMjbaYBFNl+Ygxx7/hd3D94h36PKVSMWTYqVXEPneEJWsxDWPRQLOWtbWo7qr2zd9CJ79HPCfPTQq3cQIlKh9jQjGF9ukOm3RoeYThhPtMxVtaaKFHAOmN+Drv3WYaRMf1RPKHCE2MyHWGcjG0FSFgqoMxyDLJj5u07OOq8h35ygmHStZna/XEXR2cn6I+0N2YO9XLV6mYJS1jCJx1Ij01pId3VAIgeNSChq/E/fiFdkfKlmapeECEiDc0N9hAffwve5BB+2rMVGrl0iFxCOt0/wLR/hoCCcug34BdqmA3uYtp6E2HSstUZs/EQ6bAPLyPNIQ2k3oVirYECHbI+Jg++heHBm0h7+/TTZfyksaMHmA7uISbNnWm1x2yM9PC34PXvMQ6gtHkJueI6Uj9EynQmndtIj75BpaeLcnUTQaWAWf8++kfvM8kB8qRzefKJDNrSRltuxZimLfRO7yA3aaMw7SKaHCFguhFps5cNZT2E9oXXSsRC2cPk5H30mFcwD3niwR/3EZBX5Ujnx+198qAJCgXS06BCTIaGWw2S61wUpzM6JWMJP2xQy9bv3PBA5wx7VObJM6fa4koyI12tGGK9WcS1C2s4v7GKlDJCTD5rYalQI5NS7cKayUJKpwYzJOP4VDqDkHw8pDwamlKpTdW0l7ZtmWT1LwOFjBrqh8wJG4ZH4VUykQwvNvzA1/IZ8hqxz5S9DKuUc7ZreVzdqOOVS5v40ecv4Mde2MZLF1fx7FYd5xslrBQjVAIfecYTMgKtYtGKlIB9XYpuLqOcw/6nske+b3v228ANYTED0OQ15evh78cDhu8Z5RniZTYLEBTKeOfBMSYywpocqfnr83wLf0Il+5+29ph6EXrdPi5srmO1Gjo8aLWvBoAC1gX9q/6Eaw1uuBIzRSGe8Y55/+5RD2/tU2ZiXA4z+q6L6sdMVWZ8qnspbuw2sLtacytA1CYUjYxQ/Ps4wAbfpjpHSfRHsrebJTxNtaJJBncZ5KwlkkppUI2lEYFieeRfM6A1VvQxZf8HBhbHsq7y6WqmGt64q7Z+8ZEkGpzXFmt5XH/uBj796U9jdXUF1555Fq996jW8/OpLlMvzOD1pYTQYE5fUL4hPHZYufMXsNvEssgE6r1DCLEnIG1Ps7x+iUKri3NVr7LxaFeh0Uo/pafsVG2xl+sqdnVHF9qJhGWs0Mw9BPo9KSL5Lnef2O2+h2FhHRN5lbV19QoVjmhoA0YCEbfvI9mjbHfJPbVTUSWufREg00HGuEeAnnt2wVYmqZ9sSTHVu9MjHkFG+ezTEzXvHtuL+3HoJz2xWGLe+mnmMMSqvmu3u+t0wzuHOQRdn/bHrN/TlzmE0LC9hCU8EqOWqZ1nfcoyAQPqnAQDSQw0UuBUcbNs2mUWnPAV2Psg4BXqUD3Qo+NFZB3tHp3Q6FLyP3jDGSGcAkfdr8oRxBvUdhnNcwlEn2zZOdJddUpTa5izwGjBN8RCdx0fP8/fqgXyn7/q1/i1CLplCV3I0W12mQcq5Ez9Lc+iNYpx0etg7PsPtvSPcvLOH9+4fYe+0h8N2Hy3241HiJhxoRwytZoGvrcE0cE4qQp6rrJicQ2c6gtESh8HvC+Z0aP4wvzrQk6NoKpt7khPOmCjLypJTYEpJdwuil5TLmkGMn/3sC9ilnJRnLVm9yjvxIGxr8oeCCz/u/ZMMVhm8ulKoRQk7DleuPbivLDNBz8sVIJ98UJ9cDoA8hSCCtiCUInaSLfVo7/lgs5uowO5QIfqR58+hxo8Fm7Wi8xYUzIXV7xK+X1gwswU4nDqZWEIFBQLRWdbHNEdhPJhhnA0oSL+No/YeJpMxSlQmttY2sNbQDCSqBmRsvWEXCetuSi0uKmvG1QCtzj4Z/AClqIT18gUUUEJIISWbjXDQuYeRZvgygmZ9BRW/hGK+iGq1iqAIjLKO5aFarGJrfRu1Sh21KsMXZjg8vYvDkz2MJxO+W8HayiqqhSLD55FMRmS4UzRW1uBFPvYObuH49D7iZIhKqYJ1vq8UKyiXyhilQwyTHoajvs0aqxSbCMMQ+2c3MZ4dU5aSMTBFIaD/chO5kIIH8zQct7F3+D6FkT5S7YVPpWt1dQ2FqIhOv4326IR4mKJSado+wxXLex2NWhPVSoP3VeSLPjq9A+bvPQouQxSLJWyonNUmhSoKZFOPeK5iY2Wd+Cuzbzjmt4QlLOGTDHN6TKVDAyB68qZudrp9FaHWezPQyDgqBSwBBrcwbX2HgvGAtKSA8so28o0tFCtVKm8xZqMWcvEAfmEVfmUDSesOkuN37FupUkNpZde56iryonXlDRSam6S3VK46DzA+fAOz4QHyBQ/ljQ0UjfYzDymVGL9IvxcQ5Kk4Hn8bYdymvldGfusaUr+BlIqaR1rvjw/htd9BgXwlqu/CI72edR8g7R8xrinCUh1R4zzjKzuZYKrVddoAYIpauYSKDk3WtoNpGyH5Ur6+iXzzMoIq80n6qjOXkpP3+PkO8t4Y5WYDxfo68uQrUiG02VVYbTDcDmZBncqiptsSszImCrnC8VzJWMIPG9TC2a4lh6ga7GKqNALKFAHlBM3KLJDXqtZApboaBVirFXFuq4ErF9ex0Wigwnah8zLs3Bi2M3duzcyuds6Ezupim9WWQkgzM26ofUX0rzMWdEaHXJ59qkAFvcg4dAYHJQsUGW+R76rMwHolwu5qHZfXm3j1yg4+dW0Hrz+3hVevrePG+SYurlawSTmoEXqoUmYoMf08pSEzZkv2lRwmZV8Gf8bpMz3lTwMBmokqw6ZkMR0abjNCrV0KI+7qnHvzcYHSlsFCA4iiR2EpxGEvNuOSjDEy+pijTx1YrbK4Lcc8TKaBbV8iWnD1QoPlZ/0TzxpgEomTH7UI++WzBol0VouZTAIfQ1blOwc93DzqEzeh+XNGAuWMdwwkzMhY0AhneF4DICuihTINuwEQxa+/jwOsBvkjg73woi1W3dZNclpBxLJodR6dBj0Ma/Rv59EwoMORFeKJhEW2VS4HvNpLlYllVLvRlRWlSVN59vUL58/hU6++ih/78S+gVq/hX/zav8DXf/M3MOgOGE5UQcbLlPL/hPiZYhpo6yvqDLUVFBpr8EkzvHiEfq+Ht95+h+0owO4l6iXlMuKY/VwDKExfq4ukp9pscvVRNUDTPZkG8xNOJ6ikPZR7+9h/59tYXd8kXy1iwnalrbY8xTKTC3mnfjBh3Wn2rwYfrOdbfM44yj5E3vfsZhWfZj/Q8YP8OP9X2nrWyrccbh4OcGvvyAZid1eLuL7DfsM4TJdWrMzbYvscZXeSznBrv0Vdi/gJCoyNdMSKYpEuYQlPBphxQnYg13Zd+3V0UGcFacDc15aLGlhgH9NqCpmENbigQRENJ9s2V7xqYs84yTAYJ7ZN1lm7i/3DIzzYP8Th8SlOWi20en10B2P6ianr68xPnXUKxOyDuibsw1olrfgVt3vmN77T4KNcQr8T86+zOtxKDqXZYrzHrR4OTmVDOMP9wxO8d2cfdw+Ocf/gxN6fdEdMP8YgnmKkuMjfJCVkXkj6IhuES0fngKhc6tMODzoPTfxWKCNNmPOKHwhE+9zN3Dl49OTS0z1R4GjbHETbtBJFWYh4n0+H+NSVTXz62XXUAsljlMj1kf8aHLZtQ62upfuo7lTXj8f4pAHzbviX06/j48sBkKcblgMgTykYgTSipk5MAi3apgf+q/tqKVyeCuFVCoOfubaKMr9LidXIvxa028i2/S3h+wPHXJwTCJN0ZKambBhhJqmlgO2WftNROD9pHeCgdReDURfNygau7t7AVuMC79fRrDVNiRuOhphQ8dD2WcVyiYwvRbvdshmNlbCB7epl5KdURtgIdMi3VklMZjqLw8d6fQOr+RWslJqMb4XZSXHU2qPEQuW1vIbLu9fQqKyiVChgMOzi8OgBFZYEtdI6rpx/CVvNi9isb2Otssb2EtlWXOtrO+gPO9g/ukeFKEW1uILL289gd+0SVsqbTGfDDiofasUJ865V683yOvJUFE7a9yi8tGxWZhqz5ZFPl0oNm0VGeQaHJ3dw2tpHTIVds7BzFFBWqGAVqAT1Bz20h2c2ULK6soWLm8+wXNtoFjXTcYNprKAUluFTKBp2ztClwJP3y6jm13Fx+wX628YKcbzKvJSYl7UaFbeZm1OyhCUs4ZMOjia7fb0z6h8e+aL6v/5It/VO5JpKn22skWqGNO8Gt4DOm/Q7scGL/NbL8Jo34FV36JkK4egQ2eQUXmkFYX0HWf8Ms84RaXeIqLmLYPMG/PpVePXzvJ5juAukdyvwvQnizm1MO+8h8ofIr2zA334WXuMqwuYziMoXEZC2e+QHWjmYHL2JiIqO51URrF9B6lVstr0UIH94Cr99V+YhoMEwxRpmvRNM+ye2vVVYbjDtS8iCMssmoX/KeAJE5Av52ib8PBXAtIcBafaUNDTafAne1meRMS5opcroDOnBWwiyDvLFkGW6gtzOi/BWLmG2coH+WK7mBRLzLcZfIp4pdRDPtvWMrxxq3cmCNy7hhwnWtu3qfj7wzFtthaN7GduzeIQ8+W7AD9oOoF4soF4IcH6liOvnG3jx8hauX9zCpY06thsFrBQ81MIZ6vkZypQni7mJDWaUvQRVn7JB1kc966GJIVb9GNvFKc5VcrhQ9XGpHuD6VhUvnVvF64z3czcu4PPXd/DZZzbw6oUV3Niu4Zm1Is7XQ2yUPNSDHNOYMQ069tOCr/5r6isLwTY91XYPkmVloCBX59UGPyhraDapCiujgdkBtFqFCrALLf5v2DDQmwWOPi6wXGlQSdfAt1U0+WIVew+OMUwzJJIp2bc0SKuRDRUvJI3QGISMOR5lv7jfx2ZzlfKdBramJnPBBn1IJWQEkZ5gpSfOiC/Q5cA3AAD/9ElEQVSKTbZl3SDN4Z39Lm6d9K3/mnIh/BiKiBviVRgS7leiqa0A2W5I7iKtNK+Oopr3jwncuR8qncuH6LoZ7jVAR7zaGTTMp40F0IOMXPy1lcU6zFtbZT2xYExM5ZdBSM+LtmxIMKOjDjyfsS1odV6WjO08FG0J92u/9iv4j//P/zG+8pUvo9fpsI7ZTjL2M7YLj/2PTZG4Ip2gXL526Tpe/+LPYXVrF2f798hrWijkA8r9I7zxjd/GaDzB+SvXUKk3bdKRbUVjedFgaGK8lZnjv1aLRQjZV9fiU6z1bmOldxedW2/g6pUrmIUROmyvWVhkG/MQUlEINICCmLx8zDhYX7OQMakORctcv9HWzxXm+cULG7ixWbRzSBxu9Nn5keGrn3p4d7+HWw8ODUW7pHUvnSN/5jeZyHI6L1AfLLxrT1pHduuwjdvHPfJU6mRgGfirgbQlLOGJAbVnM+yTVrJrauWH8QG+Mc7AG9kd1Hd178zMCsO+Jh4iPwqrQWW9o5PfmHRUW0m5wY0ZxnGK/vxw9dNOD0dnbRyctHHv6Ay3D+kOWril1RnWp3g9atHpqmfe6z2fbx228P7BCd7fP8X7D47w3v0D3OH1Pt8/OOngsNXDSWeAs16M1igB/8nPgCFphg4vn7Av24pUT4e+06lcxIFsZCqXCKYZz1kO2/qK97YKhs5WfLCsspU5IvKDgU3EsqvSdPHp1221xHQWLwj2ag66V8iU/LagAf14iPOUxX769WcoI81QNVJOXYX+RG4X1Es1p3RIQu2Donws2icMWDDDmSuBanBRPmvLqsP5e4GelwMgn3xwMu0SnkJQ95cjGBE3EjEHNgp27HKYw3q1hAKZlfZRtllQpjQy9JwAL+H7AWHwEbYfgnEth1cbbTdtS8qZcE6mSsGi3W0jkdGBCshKbRXN8iYKuQaCtIqS38RGcwuVYpEdO8Zg1MEk7rHONDeCei+Fbg1KiIzbbGEKHT7TlGKa2bYWQCEosL6LKHplKgB5RLmCzXr2KQSEUqr9AvI6GJfv+q02JqMx81JEo7aBenkL4ayG2aSMXFLBzspVnN+4gohK8aDXxnjcszQaFQ0+bCGaVeh0+FYZqwyvVSFSQcejAcb9AaZaJs92lkyYNwoiUZingDJEb9LCOB2hP+njqHVEAUWrY6iky3Bms04oWE3ZpoVi4VGO7VkzPDWrEyyrxU0/xAhfU1mbSuGpYDqhQtaNsXdnD+3WGXE1Rb1axPrqiu1huoQlLOFpATHFR3zOcUxHThYgumz7/PKLpxmngbbqoBCcjexAaO0ti3wDCJvmvEITEeml/MymY9KeCSMxQkWlab5vOjTRQPunDxm3tsrSYax5etHgQICJr1nbKXqtY4z3bmG8v8dwzFl9A351i3EVbTDG/kjztC+7HTjNNMVXtCXOZML31FATCuypR38F0jYNtpM2ShkSndRK0JTpaPUhwggJaf/Ur9Efy+I3qBCUEM9CjGcR4+BztIlJni5oICEPmQZF4oBxDCcY3H+AwZ27pOUT+KUi8tUm/GITyZTKJaPXQIwUB3qnE9UVrX2E+yV8HKD2r1pRXYgzy+jhjBmaHS95sBD65O9sW+mYvDxFRL5cnU1QxwRNvt8s5nBlJcIrF5r4sRs7+LnPXMYv/Phz+HM/cQP/9s+9iL/4x1/FL/78a/hLP/8q/uKfeAV/+U+9jn/vFz6Hf/fnP8tvn8a/87Ov4i988UX8mS9cx89/7ln87MsX8YVnt/Dq+SauM97LZR87FE43/Rk2/BQ1rXKd9pHPhnQ6clgHKovXs10nscmv6rWakWlGbToz0LOd65tanJSimaw3KrWMNOxzOpeN3YYhP6pNqvc7hfrjA+aASrkOOdUWpSHLfGU1wLWNMuU5mV9ZbpbJtiphn/dZbzJsywUBaQrLfjaZ4us372FIWUkG66lmmLC+tc2f5H2rf15FaoghpknH9iG82HkhH8KA0y/cO2FNWwlplbKbKc92tNAhFtePC5S+GfV0K7MF/5hp5THUKifqPzniRzqR2y7L0VBTno3mfxLkQte/HSzqg7XHW21hlcVj4mFGfMyoX+TRbZ3gH/y9v4P/8K/97/Htb/42xsMh25xwJedWGGmyk1jbhYsX8D/9xV/E/+QX/1288KnXsX7hIkr1BnsMTJfxyAcz6ir/4h/+1/jXv/RL6HdG5AtswTI6EvfiW6HOnGII8SX1V6aAcBpj2m/D63exQnrTSNq4MO1gOz1FFX3y1r6tKnPbXSk19X3SM/YTd/6HystaZiZz5LMB81EiDVmtFBwG+POwPasgFoemo4kvqju5AbCUupTai5xr72oPdPZOdIEiQJ5tqajDkzVrXbyV5Zob0ZawhCcJNOCr3qCBEJ1VKv7hBoQF7Gs2YK5BUA0KyLmBAYUxIFERuxDv0eCJ+uNiO8yMtIPcGhPKgJOpjzHdhP1M1yFdN/XQTjycJcDpeIqTcYajQYrDQYLDfoL93gj73THvJ3yf4GiY4HiU4nic0u+U4X30Mh8dxtNjPBrMHGTU+WcB5dgAI7oJKVlGeTvz86QRkh40wUkUh31b/MHKJrnB8TadhyIn+4x4g3ARsCw5lkVg8sTDwn9/oODmFqT5dwDRoMV14dXu+SCZzZ8lKJPGvXhpAzuNyCaHZMmIdJWUkLTKakn+xfdZTg32LM+wWMInGZZc+KkEETpHrEWcRcBFzo3A63OqwxBnuLS9QQGVTYTE0QzppjhSIfy9KPESfv8wR6mJ62Km/DNlVQIE6yijsJ3ECb9lZFoJqtUaPVPYmEX8qBm5HiIvj2q5jCgk80qHrMY+w2rDEcekpbjpIEEZ2DyPTFvncLB6lbRmMGmSVY4abo5CggY+AirCOV514KA53vtT1n8yxXg0tr2x82GAmvIiISGh32me7SdPMaLC72XEk9QpOrkEUeTblldhWGC+QubbxR3xuVQs2HYq0GoUbcml5R5sd8wFKqVVlItNeJGHvZNbiNOBnfExYf5z1KobzTWGLZLREw9sr5nyr5Bi4skEhwf38I03v4zf+PY/xbff/xV8/Tu/hN/6zpepkGR2+Hu5toOotKJpkRhmLRz23sLd46/h62//M7x192voxWfEmIyTS0FgCUt4OkBUkY4KmAOZN2QEeQSiBhkZqJQhs6ekVN+y1BnOSLdFuzDW+RhdeuwhGfZ0rAdpXok/pFcM4lHlQkB6hw7i07cw/M4/Qfcb/xW6b/6/cfzN/watd34Vs/4xspj0vXoJM7phUCOdGyI7exPx3q+i98Z/g8nbvwR0byHISGuZs0wUy0sx1YbITEizlGW8mcqgF8qQGfM76WeBvJ9xgX5zpglpEJn8R4Ydlkkygu3vTDo90yAIyG9I3UVftYowT5or4xeTgzZ796hQBuUt+M1nMM1vIzcJkG+dIH//25h840sYfvNLCI/eRnnUQpH4ioRT4swdLkw88tFbktmPHSTiLZxUY3OUN3TVNhO2NQLrik3DZAc1fxmKc5ITtZKC/DvIJshPxyjnxqj7GdbY7rYKHnaLAS6UIlws53GlMne8P18pY7taNbdV0dZVZaxRLmjmI9SjAFWt6vCnKCG1Pfo1M9zXWR1sPzmNpKnd2p/yrd4659j2gjmXk6zLfGpmvwYIwavb0Iny0aKsLI87k0R9Rn1FQpIzEj8yFKtbObnZjOO8dwn98MEoE/uhtvpQHWm1S5H4eP3Zc1ihOBaynDpQ1vfYN9n/E8qPmoGr8qbphH08Z2cbvH94hrfvdJBQpoyisq0MEUj21HgIAsp4Mpqo3AwjXE3Y5yeThDnQwIYDQzefhSHhx/DE/i1ZMWIcajTO2MIaMtzJ78cFTN3ateXStRu2b7Ud1x7ce5nPZfQWxVYbML90en6SwdUVHYuiq/ChMj0sNduOBkEiEuaIfUUHib/z9hv4O3/7b+HerffZgDIUghB56YWxGwyQ3N2oN/Dn//yfw9/6z/4W/spf/av43Be+gEK1glwUIigU2f6IN/EibUnHZhZ3Wnjw/m28/db7uH/YMcMnY3P4F0PwhW8+sb1WsgGK8RC37h7hQYftMajDp06yMmnh5XoOq7Mz0pwuo59YWLU2m8GNIl0BMeOKyRe157/KmydtCrT9Ld12k+/cOKkZaqUfuwFRR0ts6x7qWtNcgUUPMOELvRcdtBuhj21IV+FCr4ythqQnUZ48V9GLt+qL3BKW8GSA0TvZjNi/jf6pfeuHYIPHavNs9B77tGiH9V7R9zl/lFNIcRU5dQHXR+R7zlslV5BPuXPBQqRyNhiq88ICfn40sKJBGLdFn6PbmpxhKzV5/5AbM6/2nnxn6mtggzSAcmwSREhtkEPvKIUyDZ3lIbnGDP+igbxXWGbPymZbTCqnc/5lq0aZvK6GkcWV5dV3hxOHlz94UKRM3K6PQHYeOw9Fn4QFreQU3abMUyDtPtcs4JWra6hQjsolY8bg6lElXtSZ43vEo3119TbH5hKW8IkC6yZLePrA0UcKbySQmpFixhFJcaRzOlCynvewWc+TSYnQkwiSopqQLFq4hB8AxLA+yLQciME4JiPGGxjzcWAGNj3ws09BIAzy5Gl6wVrkN+29qauqxmYf8C+gsinlUjOLNetO9acDaqcyigUJmX4izZjhxLB5TcXo+DivZ83OyKgIeBRAtFZiSq6Y6jTDGXOWy9uAQ8IwcZoi1hJKSjNqR2L9Qahl3lSWGUZ51yxptzTWHa6ZZDGZLH3kKXTYNxkjmD4FCB1+bmeY8NmnYOL5JaZfpkK1Y0LPcNLDg9b7OO7cp+I9wkpzHaVSCXHMMFTUbbUKhRoto58xLrVd6juML6baMcAgOaMC02NeU6alvFMBK1Zx/sI1rK5uIyxQsaHf/kiHv+v8lCMqWjfRH3SJHFc/S1jCEp4+cErCXCEwxUo0VnSSdI10xB2YSo98OSM9wqANtG5hdvYmspNvIT57D6PRkPS1hiDSSgopdVQ6/AnDUbESnSa9nmnvdConiEfIxh3GNSCNLyAqb6G6+Twa517GtLABnY4gw1Q4OUbauonxwRvIOntMn3Exb36UR0waZyybtDxk/Bpknmr2LGmZlWTKvMqgTVZiig89y9CXU95UNoXnjYzACWmqtinQGRAatMix3J5t6kwZYeajSJofGM0vobh1DdVzryCoXwWiNWSTFMGki3z/AMmDt5EcvI+Q5YqoYPpmgGRiMmrzTgY3Y3ZL+EMAkgecUxuwe/UEPeubfXdGEXs/DyWw/iJjAPm7VmEEbHcheb8OK4+0QiMdmSvqqlUb0zH9TGDnf+hK/9qfWs6TEX9Gfs54NGAhiZUN5qGTzDIl7zeDCa+WV8lHAuuXi377mKMP5XfhV+VZDPI8fLZ38/fsP0qHgS2snJVRrwiL6w8blAM7cFkrzpT3JLEzU8418rhxcdvMvjZ7nnWhra00M15yT0BZR+edTLMEqe+jPcnwxvsP0B5nGJqR162q1WCHSitKoqEiGa+dkYSyG/t+HLMuiJvfCfRFaUeBjyjUnhuGdfumr26W6ccFKtu8rYgIqi2oLLp3lT0Hd69Xi9cunB4e9/fkgJVTZWCZVV49f7gmfNa9DZqNR+h127j55rfQOdzDj372dRvo0MHDHtuAVhpKR5FB8Mb15/A3/sbfwF//6/8nvPLap1CrVXDl0nlsb66jUipaO0hS6h+U5x2TYf/2gfEkxslJG7funeD9+z0ME34Pi1Q58hizzSZsQyW+qsY9FLr7CDqn6B0dUxfoYRRE5I81hCF1VjZOTYFS8cTnEg12WJ0yESun2uu8zUpnYf51FlEYTFFm/AV9m6/syDK2dfLeJKezRbRaSuciUh/TNrxa3T6iHmF4YlT0r3YuPqZyaQB1yLi7vM/Y16Jy2QYbNZlQWwkuYQlPEjyie4/cAvRJ7X8xqOFWVjkOuhg0EP91z494psD886r4bYupOb/VJARKDuJedn1Io79Pp/A6V0jxysBvfF404AOgUil/GgxwTttLKheLq3im7s3Ze8ZkTmEFi+sfDCiHH87lR8FiwEWTZLVlofJnPJ8ljUiNyl6Kz79wDc0oQi4hLTX7i8KRVvLq5kq5vKsexBtcfaou3fslLOGTBKQMS3jaQKZ1GcUlhBlTE38whVBEPEcB0MNGNcJKme/NAEJhTbIjaaAMJt8bOV7C7wxzpJt7DJfiQhKgCXZwlr7zUbNwNXsvT2Ugo1KQZiG6wxHG6QST3BgTf4SUwnvKOjzrDhAnZNupb6smyqU6tEWBaq2f9BHTbxKOMc71qRiMqVS4lRaL+XsZ49Cs4RmdFA7NcFYevSiER+ViqhUgMyoxUQPZNLSBEh1iHmOAaRhjlqewH+jAdioGbGNBvoQwX6FiUrQVLaNEBwEyXj/DIOsjC6kIMWnt+6nDxHymERaL9BMy/YCKUoFlrqJRvYBaeQ3U03HW3kO3e0jG7aNWXUUxX0AhooDENMWwAz+k0sZIZ1q1pNUyRexu79Jdw7md53DxwnPY2jpvg0VSxnwKR43qCi6few6vXP8RvHbji9jdfB4Fb4VVQuVrOGZ6bcPPEpawhKcDxBuNUvNGV812kxIniuh4IW9Es0TnSEe0BQ0CKhde3p09MDxC/OC30L3zy+ju/QqS0VskaxnKq5cQ1nfNuJORPiUYku7mEZSeQX7jx1E8/2+huPPTqJ//cZQ3rsMrVJEL8siyHKLSBoqbr6L54p9B9dqfQrj+eSC/QzoVI+nfRzo+Y+a0BQnpYZon2w6Ry6YImddI9DEXI0d67cpSgB8X+Z2OdM4jHfTFa3wdZJnndxm/GDYk/dcMX1mpNNge+sj5VKz0KD41ZdnpQu25rn2smNbML8Jbfwb+8z+H4IU/jujZLyK3cp78gvLE8BTT7gGJfseMrzHxp32WNYiuvdpFt5fw8YAzXuhO8oCMBqwOczJKOCOC1uosnjM6Z7BwRouHhgsbhJgPjJijak1Hps3YnFu8c+/5SiZDtc+5A9tCzpYWqT3oKnlVgx26Lu4pr0hMYhpJTtuxaVYn5RKq/cqjK4wMGRo0cU7PAoVJKVdp0MS2fZKpgO8W+XeDOnIyC1gG/5AC88dyKP9amUWBib9jVIIML1/axmaJsptW5GgbvDhGXpZq4txWfstAwiASrHTA8+3jLr5x8wFD52yLO4+ylNqBBkGSqYzGbAsyGpMmCrOaRNIfTpQJB/pueFO96oVrPVptU4gCymo6XYFfKZM6jNKf8/ixg7Lhcuvybm3Tcrsoz+LeOSvsvBRPMqjMDlxZ3LPkZ5aZAr4mWPV6Pfw//pP/BH/mz/15/P2/+/fwuU+/jj/6sz/NNsW+Qr6iCU5bW1v4xb/0F/G3//Z/hj/+J/4YytUq6TvJ/GiCtXqI56/tYqNRY5tiOmHocCjjJMNqOF7nF2qf/f4oxXu3jvDOezrzcIR2zF4bFRFoe99kjAL5x1rvAF9ozPBaQ7wpQ4s88u1ZDTezVfS8bYwmSjtvpZnlyHN80hNeta4rIq8MNagqeqI8iPfmy9Q3Zti7fR+TB7eQHd9F1m5hwjydDsbYH0xsS532JEFXhzInKflWgDH53IEOSqafyXCIpNdG2jlE++QE37xziv/+O4f4R799gG/faSMZD+Czv0TsP2pZS1jCJwPYi8yG8EHn3mmQQNeFH11JTR/zr/Amd/DPyRwL+sqrZIj5vSZf6iy+78dZeCZiaX4orxrQ0Mo2nTP0yOncIfJMoxW612ZY8qdhk8XwiSvjR5XdhGBzfzD9XLE4ucyB+JMmITg+pe+GQBuEFq9VGaWXaGW1zmcrZGM8u7uK6+dqtvrDo4wgu54mSpkeo8AGSsRSs3hdvSxhCZ9MEGVYwtMGom9SQKQAia9o/28ROzMaz1CgMrS70qSgSI/TBCkJpbbOMDopg49mhYk6LuH7AOFN3e7D+HOMR4qADcsT99Y5xYCo4cuQVas2USpWqXREGI0G6E9aSPyBueG0i9PeKYZjbacSIPILKOUrKEpxIJNTRHEaYzQdIA0mVCgotCd9xjNCEk/t/I+8DF/KQS5DJmVZy85Z39oCQXv6TvWndkKhpFSq2n72WRaj2ztCd3SACVoYzzqWl/boFN1hx4par9XNqJYkMdq9Y+bzEKk3wixi2t4Ax+19DPo9TNMpioUyCqWCTdZKmK7O9PBykZV5pb7O8lRs5nHkzbCzcQ7VfMO25NKBlZqtppkKM8ajTTlsP066cqmI9bV1bG7sYHvrArY2z6PKPGUUapJshPsH7+H23bdtcMYPfBSLTexsXma+14kOWQeoxI11gOISlrCEpwpEf+dOapkZXUl7TPkwGkParI/T1GaRUtfAZKoVcxGf5YkK3JSOCodmmBZLJQTNDeQKdUYuIy15MOPUdoJ+kXSyuYOItCdavYDC2i7KjTUEEf2lQ/QP72J4/AAz0njfKyOobNsB56XGJvJRjnS8izHp2SyIUKisk3aWEZLu5gYt8pAWvMEeZr27iPsH/JZDGNWZpxrIDIyGKv9Ix5hNevDGHeSTFqL0FEFyBj8dmBFV5cyxLFlGHjLVij5iRdtj6UrWRckASf8MrQfvIB61TabIFUvwtrYQbW3Mzx/QNocDln9EPOqsFA2880dT0DzmQeeOLOEPGbBuCG6G5sI5Q4W4rUwL8mMGjvlb3X8XPHz1yOfCGZgxQQMUbEzsFx92dhioutVjjl+YF/6oH5L/6yLQxUwezKvu5UdtzT27fMsA69Kfl0fPEoofgotvURYXt7t3bxdfPj5QebQ1iA0kUHYM+Gx77ZFmbNciXD+/AS8bIB8wt+zjkp8C+teqWRlMNOgpI4gX5NEjzfqtm/fwoJMiC7XllU85SRgWHqQvEE8ssAxT2lZvQoLXH0rmZESPg/I0vzV8Mc1CnnSJzs4StDgXPj5uDH43qF4/DI9yubjT9Q9f3r9XcLN6rffQfbAci5Jp+8M0SXDWbuM7b72Ne3cP8Rtf+zq+/tvfwE988Yu48dwN28L29c+8jv/o//If4a/+7/4Krj1zFZWKVjuQN/oByvk8+UcOlzfX8OIzF1EpU75XI6J8n2ffi8QjyFO6nTOMJuRffKfVhvcfnOL9W/toDzMMUg9Dsh8GwYTtrUBetOmPcK4QozidICpW8OZBG9960MYgK7D5FdlGWYekGWaEZXuzw9DVhq3tudXoWv2hc6dS6hitXg9vfPO3cPsbX8XxN7+Kd7/66/jSP/sV/M3/9pfwn/7jr+D/+aVv4x/+2nvYOz5DUMhjSl3h1vEIf+cffwv/r3/0ZXztv/8V3P/1X8GDr/4avvbrv45/+Mtfxj/612/gV751G/dPO+xr7JuUHYyefBDdS1jCH3r4MEXUs5zEtg+DDXI8pCK6Vz907V47PZiTx4+Ax/uG+Z/fW1ySAx5eCQ+v80B21fcPXZX+vP8vVm1oMEMDH6IPyt/Db3PnBkb0jY7fFnTyYVJz9/CFpbO4/4MFUsj53QfB5B6C22GDZWReJM1o2z1pF+L3IWX2zUqETz1zASXybJsq4VGWkrLCImmVp1KwweiH6aicc9xakT46/SUs4UkG/8Yv/C/+D/P7JTxF4Jbr0QUk9STyom8BlRokKdbzHr5w/TwaOrzNuJvOjCA7I4EU+dQyO8cMlvD7B7EnB46luHpwqrTeiQnxHR/0Ru9UVdpn2w89jOIO+uMOBsMuRrymuSGfT9HpH2Pv4B7iyQShF+L8zkU0anUGZt3OErS7p4jJDAejMQbjIa99HJ0eotNpIUQB26sXsd7coTxBdk8FleqBbQV10j601SelfBkbK1SkmZeA3NULc4yP8YzPMBy3GGaMNBvxnvnrn+Hg8B5OTg8QRDlbgZElE0ziPuKkjzGVnEk8YtgWWp19HJ7sYcw8laI8tta30Kiu2uGSR91DTJhGo1zGarnGPBQx7A7R63fJnD1c3H4Ozeo6xixLp31KJcrDqgZJgiK6vQ46o2PikEIMlaE0y2EwGaIz6KI77DOfYxMaZn6MvaN3cdy+jbPeA0y9BL1Rl/46VMaYXypmbPxoVFbRrKwzXTcgsoQlLOGTDE4ZWJg4zTZPpz3FNa4hY2lOW86IOFPBMIVKs9LHJ4h7R/yeh7d6BeGFzyK//iL9hMgGQ9KoAF5hBV5xixHmkXXv2tkdkR00q+hGjOMMs8kJrx1MSatA2pmbDjDcewvJ4beQa78PP+4B/VNgcIKptr1Ku0jzeeTWnoVfWrVZ3uMu+cN4hNyky/x1gMk+/d5C0t43w1a+fh7h6nUS9Aiz4QPGt4ei1ye9n5FtMDPDM0x7d5iHDoKpj3xQIPenMpidMm/7GPfayPk15JvXMC2fR6wZerkR0vZbGN7/MmZnNxnnEXywHIM9TLv3kCYdjGX8Kq0gWrvAa9Pm5U+JQx24rpUlwr2btec45BJ+eODkD+J9jnoZBkzB1yte2EJ5+0heeeiRoF373cxJNwPx4RYRjEP+dXXhFcois7uH13k6bETueUZfNhgxfzb3aMDl8VzobcD0lLZtUaH4GZ/Cu1UpMuZrpYdWpWh1xyKc+rYzGgjc28Wzy8/iXjlZ5P9RfkgjGJcL4b78sMHVmQZapwhZ9lDGDeGScksQss8WC7i9f4xxrO3DWEusBtWEHWgfaJUt5T3iIB8VENOPrMxZMsb53RXb5mhhvNJAr6NRCk9chgHun/XxjZuHGFPm1BZkit9wQZy4cJI/iZlpjOe2m3h+t2EH5qttaCWJrSr72DAncGk/ak2P2vt3O71f+NMrd684nlxwOsaiPI+A79U+woi30j1CtFtt/Oq/+FUMyceOz7r49Kc/jS/+5M/guedv4N//K/8BXnj5RZQKlPVZt6kGFxifHQxMvpAlUxSpM6w0yvitr34V73zj6yj62jIxQxT65IlFlM9dxeqlGwhL60y3qOZLXYFpnZDPsW1pNdL+vT2MDo9QnU1QnLYRZj3M2H6b1F2m1U20qMsMtHqcDHtGWV6TC0LqNCHlfztikAVN2OTE3nRKlwZotGhRAyIFb4Jtf4Bn/CH80QBnkxzeaqd4ZxLhaFpBa5RDa5BRJ9FWcDNMffYlxjvqpwipg6xNe1j3BsiRN+/HId4el3Aa1THQlrxMQQZXdhJiNrS++SS3miU8pTCnf0blRdd5Fe34MLjBxwWF1L3re86zfhyfcPf2cn4n3/wTrV2E5q36cU5b05nTC9Hpx53eL676/uHrw5zMr/P823u9W/zMvfP7B4Fv5rKIhTb54VFsKs+j+w/Dh+P6fsCwYn+GR13pDHhxE6lylN35SJqriUjSS7J4gmbBw4/euIiXLtZRJD68bOIGY0nTJwnlhTBPv6oPxafCE4+S8+2N+3Ple1JBZVIZ5PTr5FFXh5JV3PCS8X6CnjPymvY4xrfeO0Q/o6xDXigZUxhx7YAhSc/ziHF+tYhnz6+TxzhZV+BwRueSXMIfQtAuCMsBkKcQ1Cel9In4a/VHQmFVBEJ7p3oUVC82i/ixG5vIU5mNKP/akjp+1wAISew8kj8Iov60gTAv4umYpaONDo8LOqkZdo7D8bsINOtJe7CrfsLARxiRtRH3WRqjP+ygP+ig3TnDZDKxSX95v4QNKgPnty6iEFCJmGnf5TzSOKMykSCmsjAYjdDv9zDo91ErVLDV3MVm4wLyXolxO8Fcsvp43MfR4Z5py5VynfFqJiHbCOOUghLlQ/qnQhAP0e130Ot10O3SdVqIJ2NbTVEuVlFn2Gq5ijSJmc8xJuMEnW4Pw2GX/k+hfaQDr4DN5jYubFxBFFSkg+PgdB/t3imqLMdmbRVlKhPIAptBWCxUsV49j3Khjn6vhU67hVnmY2N1GzWmp/y0+qe21zVlAJZ3jG6vZ0v5O23mtTOw5fnlSpl56iHJdBDwFMfHx/Q7YN6GGA0GRISHZm0dV85fpwIVsdk/yYLAEpawhO8N5jSatNgdcuhAhpPUVky6VQ9aRSnDaxjkbCuZZHiCXmsf3VGCaX4dpa0X4FUuMWAO8bAPvibN1HYeK8gVykgGB0i7B5iSPs/iGUbjodGzYfsYo9YpOq0B0/FRIJ2aanXHpIV01EFKOpbQXzbooj/qYcLE/fo55DdeQljeQs7Pm2FIdHhCOj7oHjLcKcakk15Ugl/dQWHtGrz6BRPqs9Exxr1jFm6ClIL/qDcgjTxCt32A8SilkrSCqNxAjunMUqbdPybtHlJvKiNsniOD2ESirU1mY8xGh2QeB4jIkKaDIYanR4yvRTobY6zVjPVtlDauWh6ynLYqmW/dQ8VLRlHhfDkA8vHAQip5hHqnFjtn6h9vnAHkcT+Ch9/tGz/KPfTkvrjnR+8+6AS6qu4lZ/I6j8PaxOKPrxYhFk6Dkzaj0/IgD07BdTmi471WSphnCyMDiFLQQM3cF8M8FsL5+dDzPPhDcMrwXCb+2IBlU/mZOR14rvNSdJ4QdMirZLWCjLwR7t7fZ/8KbMBTqrzvPRqeknovOcxWdlDZ73fbdl7DznrJ4Ym4DYkfDQRPSctmfogJQ93cH+DNu6QtQd4GmtwAiAaZhCnVh2bPZsgz7PPnV/DsZhVhyvxpYESrVgx/343XHy6wUBJy52B5+V0ypHawaPNPOizatYNHZTIjEPXBCXmIVm8XiyXyoRl+86tfRavdNp64uXMe/97/8n+N1z7zGVSbNeoD2jqRrI71rdVBdlgx/zTQEKkvMvpyMY/OGXkb9Y9nz+3g+qXzeOWVl3Dp+vPYfPZFVLcvYUp5fzyesD+SJ05T6g0ZeeIAJ60+5fIYg94Ew8EIpXJkE6VmSYTEq+Mo38T+NMKAbTyVHmX9memLv7Af2HZ5fK1zAGxQhzxGW3xppbmfS1HxRthCD88UZyiEBZzOKnizTZ0gWsUgpP4CpUe+yoKkdJoEgVxoW/DmhmdoMuxujf0rG2Nv5OF2XMYwaGDMcNIjjD0yAynTtNGd36WNLWEJf9hAzdXohXUt13h/pybsqAr7l/q9OdH5hzGYe6hLf1ck89DsJg99s+86b6JRCzr1+7laiiJPFo/e6NmtBn3k7Ktd+ExnMgNDOX+SLlyZ5OkDYf4Nw+OpONR/MF1lyVaq6GbquPosjbVbLa7trOKnXzmHBnUUbeclmmqr/xRGW3+S9blz3PRCAx/i25KLVD7SM6u7JxlUVuFKTr/LAZAlsJ7ZB5YDIE8hqE9qAEQNgLIhEgqstn0QtagyO/6N3VW8cr5CpYUdXttRsL+7syAkzoYkoCQD4k5L+H3CnCgKoY6UfuAqcIST70ic5aTYaim5tAc9FwtFlAolXkt2hgVpLr8FyAdVrNS2sL1yGefWLqPgVeClIfxpiNArol7ZQD6qYEDFwrYfoCBeLVSwvbqD3dULqBU26DdPId3lQCtOxuOB7YEbUeivFmuoFes2CIAsTwZa/v+z9+fPtiXXeRj4nT2d6Z47z/fdN4/13qt5QKFQQIEEQIIASYmmZDPklsJuDXZ0uNV/gcLRjg53+De321a7w7LUDkuiSVkUJ9AEAUIACNSEmqdXb57uPN9zz7z3Pv19K89591WhABIFsoqFt9e9efbeuXNYuXLlyp1r5YB8WEKJAyMZWAIvJP/4jFcgfoOYnJjB/MwRjFSmGKfAwXMRg5VhVMrDiNvsXmMOishr6lbGhmZwdO4MJgfnifegpa+ZVXuNGnktxWixgvHiGAdRFRQjpjE0jLGRSQyEI/ASDtZrO2h32pb34MAwB2w+Gs0GWiROzosQ+EW+y3Pko+X2eQ5HQuRJk8HCOKbH51iuYQyVR1DwS4ibOjCUIXIBimERB2eOYnL4EErBkO1z76iTQQYZ/GyDZLQbMEml51ZMSmx2TbmiAYNmtmqpeagZU7KmJh3EjW00a9vw8kVEQ5OIBmfQDSmLo4Cfyl1UKdd2KYdir4AoX0C7sYtWp8MP7jH6TaDjDyANSqZg7AZFdKMRBANTCCfm0R2eRMA0i5UJJHFgB5K3tT3WyDjys6dRnn0QQfEoOq0icmEZEWWaRxkPzeyW0Ybppt4oCmMnzDCTGz6INvuNFnHvxDHqLZ3NVEYclJEW8sSbafPey7NvKM8gp/OkAp95t9Dcq7HvCeCXKG8Hx5EM6NwmGYt4KTJOeRypT5npD6KTRkjDCtJoDOHIUVRmziIaPsxBxSjiThFhTFp12adwkGHDBxmWMjn78YAGhfonu+u7RLXglA/uG+WHry6cwDaQYB3qDA4ZCO3wUl1lLNSg0QaOrl3tOwcuPzfBxl3dn/nebfzQn57f76yVunMwrMUyL8OfuPe3stD+/3JSvtsEIIZ2cR248K5sH+xcqD6ovK5M+2l8HGBUIv0ki3RgvClAWAfaRkil1SqLgYE81jZqWK/x+4/fjcJY35YdvretQlnvcZuhKZO0AribttGq7WJqZBDDpby++uHze4o1qTvKkQDbnRwuLGzj2toWYj8ymWjp8r2UC1LImKGD35vF0Md9B0ZwdLxse5LLP8c0ZDSxb1tXlL8CcDX342rI+OBO/e7ztbWFu0Crmvq8IG7bf/uj03bg2ocDhX1fur3rxwXvLb+Adyy76jPgt31CRonZPxRKJSwsLOIHL72MDvusI8dP4Vd+/dc1eZh8pLGiYkqxxK6Qz1Ks6aVPD59sIEOYjG5HDh7EoZlpHJ+ZxLHZSfJBDtuNNqrgd3++Ar9QRpgP2ZckyLPf0qJAL9UB5AGqbQ8d9lm77C+W6gn7U37bh2N449YmruaHscR+r6EVFl2NLMiP2p5R6bKddoKY6JB7iY9WNLKz4xjK4/iAeMVVJOu30F25jmJjD7utHC7vBVjCADbZJ3fzAxwDp7ZaSkrDkH2q6NJNKHEoY6J4D8neCrZWb+LWrRtsF5tYb3GsFLIPVD8u2UR6mtGEWdtEt08giJN/POZ/fogfB/uxf7J0frpc3w9KTfCXl+J74b3Y/nBuf7ml+csD4qX+sSev1dbfj70ko3sjVbD64V5Iu+qdJGdPepqM6cvm/m/fKYRLzUIra/PRZIP3O4X6IH/nFMf0KXdSpevhY3j0/NQ2XRt9r1N8tV+H9wc5l55zpMFdTsnr8sPQe/k+UJy+791v7763dHvxjfq8lYpIh58b9dVP2fdOF2PDw3ji7CGcGo+QT1qMrG8DUoIRdQZwEBQo2ynH+L1gdDQDiNLRNrRKX+UmHRXhEwtiHkcvQb+/czygOssMIPciSP+d+7V//sYnmbMz+BCgNhnxw61DQdfSVkZs1lJGB/yoneFA5RfOH8ZnjlZQCtpodFq29ZI07fqg9Loc3IpxPDX0jHV+MhDlXYcp2jmBK2HshKbeU6baG207JdBHt+9TrHI0oW1CPC3ttn3T+TGvw8ZjdmoSyIln52N4cYBczEEtBwCWjToufvRrU6vEa6OdazI4/ZiezA8+O78wV2IcfaRLfLehra+iQh6dpGkDYSn9pGDQ1loyqngocXDND3ov5mC6Zttw5TiI0KDIZxjhriXvAbuH0CvYdirqcFLmH+c4VGLHo8GDOM/zZHAoEM28GWvSNrHgAL0bdlFLdxm2xdw8FJKIHXaRz8w3UJn5eaVDDlmUOLdnaSccbEU6hJj82ZEykmnoYHgNUjTw0kw023+ag5ggl+c9PwpCfQAQD9KVrYH9JCkQd/jsBKQZT9IS6UVaZeyeQQb3CLjBjSSiPnS1ZYuEDUWrrXRIu4EpZQLKRh2UqINgA/qH6Ta67U3tr0FZUkTbq1BW5lHIUxi3t5B2GradCHtc5LTNR2eX/lWO07QMnZG0jM/OwaDz+UyZl6CMVmGAaWkrD8rDuIFcu0582syH8k1bfoByNjdMPIco7wJ0ug0UC0yKaafJDvOibKNM7Mp4HY1QXhbs0Og2+xtteVXoNpHUN1kG9keUuZa2Bgjs77tpxYwViQwoWunCsGFMvFt7zICDhaiEFl3KsIEUTpSxmvkdJHV4rRrLpLQoPKUkZZml/kx1yDr7HRm7fQ4wpIju+DEHHtKUqRPMhO3HA25w584H6NWB6sNAz+7bxV37IexDgy1FCgMNEN27vmK7H/KDFSd8vnPbDy3Xz6N/FbiAFr73yhQGvaspI5i3m90onJ3b/77qxxeOLGmXfMjwMrBYiDvlVPK81wxx+mmmqsI7EPZ6UAhlrvw03HXy4eMAlV+SShJL252qCj22tVqL32NS1PJ7rJ7m8PqNXfzuc29irc0ysx12+C0lQ6wmNEWWEr+b6HzKHrXvITTwyJFJ/OITZzHK76Gg3UKe350J23yD8W7Wu/j667fx0tUldGS05TenaCGlkc70EYXcdmgdjBU8fOXhg3j66AiiNuUXZULXd7h1bWyRWDn6IKW6oO/Xp79orjzca73cj9SrRQOnmFL9KqQii/+kknP80H/vatGl4eqzn2c/bcV18Z0TeRnS3ZqPymtEt5TEHft49PmvhwFdSNrIUOQMc271US9Ur93s85pwcWnd5eWAgRyvvze8wJ57s6st7x6ud8N78mCYPtzhbabt8N03RmrVxx/83r/Df/6P/hFajQZ+5Zd/Gf/if/lfzPjhcdyY6Awp9oPaVkqtQThoHCKR7ul7n92ZxpxBlMe3v/lN/Hf/1T/BO6+9wW/0HHaDImr5ESTDc5g6+QBOnXsYY7MzCItl5qwVSwXbZq3FjjXgeChKWyinexhobWO81cQff+ObGHzyKUSHjpOuvvVDytNqqxuRz1jnnvo15k/mCvhOCiut1tjcXMTti6/h5mvfQ+fmBYx12B9zTDL+wM/hM//hP8BGYQR1tietHpGxkAjbxDP14zpMOIhrKNUWcOGbv4VL3/kD4tXAniaKTZ/FiSe/jOn7HkU4OsX+U3goEcYVX35AvXxcIFTEE5KJ4sb3Q/+94A7vG7+KM8gl5FPjNfqolTk+cqD3LgXHU33o+ytd+Rv/08tapvU/CntXHCln5d3zU338MDi+1xB3H0+t1lGafLBvCxfmg2Af17vBJOsdULZ6Vv6G4V0v+yipTKKi3vX93FWB5VwZ7KkXwMLyx3z1guDe8acf6C8C/T6r9/hB4OSi6OTqTaC23vc37Ew27b/T7w/TR3j1nQvRi+1cD21d+3Ry1/00XEh3df7Omd+dYHzSt6XJJbZle+FeWhbvq9N+vsYjvcz78t+VZR/6ZRYoxff293eD8xRd+uVxV97cQVTX/r3zdrFceZS3nP2lKofO11WJlJajgOJI12ArMHp+Doyi9uz83TvDgZG0w4ZkoyYqROxzK/yWP3tkBl959AAmGC6irNOSkCTlWIVFVjlth2/K3rYlIvpoe6y29U3qz6Xid+1cOTle+OSB6MwC93jEpoWQF1TvqgtN0BElPX07EdSft/l9dG1rD//y669jqV1Cm/Jf3zKikPpvgSZyVLpVfPrkKL7y5BmU2jo036WhbxT+Ml+rIfPL4K8XpGnazVaA3INgFmIKXy8MTAGSs5n4AQpxE7NhE0/fP4/hAgUgBUXqSaHsU6BKcKhRE97bf2TwE0JPNPJXzj05p16JH5TWubk/9T32LWj3jvAa/mkfWY8f2Tq/I48iQu05n2qpt7pWBWJEJcl4ThHhtjkI+Rd08wi7BV4j+kTW0VlgCWvNDrBM5cPBhgwauYhOs6rcbABDRx9Z1h2ws5ZpQbhw0EAu4j3zEH78dcoBB7qzAZGwYHqBW4tBvMlj/FKxsCqjoaKcyHf8E54ORzrhprRYTtfJ8N5mMCotpaPOjDH5rHghy6o/Ky/zkVEmIp5aERJoRMY0tF2ExeFb5SijjegqJxrrnUL0y5FBBhn8rMOd4YU96WNZSjknSZ1EkOyTDDT57OljWoPyELlggN/ag0i8AT7LChEyjORanl/NeldmWiUORDSg08qJQfpV0PXLFLF8H1Qo6oYYZsilI8MDZZPknyS4S6fMfBRH+QwyH8ajvDKJLMQox3XQufCxlSTK0x+mP9PVmUhMJ6FMlbxV/2779zOfHMPBcFHeIxYn9QeYh7a4YRmNJKIM5aK2KiTOCdOT8cPOR7IRpwaQxFd9hs/yR8RNK0CYTuzJiF2w+O7AaUXhYMRzTv1Kn+YZfBzQ43lVY9+5n9617xz377v+L6ucTCIFlhteunZ0t/shuDuZvsbgPfe6ijd0VXwpID7gyrCWfs/PgRLoX61h8NZhYqF73xPuU8L5CYT5/nvxaf+dey9wefWud/L76EEY2YoWohBTDrXptEWPxunaEivQLHV+I0WFAOt7dWxWa1Jz2MowbXslucKQdJRxaRO+lzBuDo04Ra0tGRFhamzAJFAxTBmng5YXYKUR4weX1rHRpJyRASTt8hsroSikTHTaRqZI+ZJ2MD1axrmDk5jM5/j9pS11u+hQVmgajqsNM58pNH9Fd0d/R1vVT5dyxqMccpLXfSsyhASS1YGUfoqv8OIH+lAG7a9AUix9Uzrlh+pbMsopvxRbafO5J9lFUxm1HC/rXjg5X7ciyfGy81FaUq2JjvLrG8PERQnppnNpxL96E7GO9N1NEd5NEJJeoplA6Vs6dBabZe7n41YwEcsePjbpyXDVg5J2+SkNGZ+MfxlGijRTpvGtzsBweDglj/JxOfVL0Xe9O/7Yd7iuSpFXGfpff/01LCwtmgHgvrNncfDgITs7Rkp9UUZJ2tkfelYc4u2UlsyX7wKOOzc2NvC9734Xl6/fQBxEaPp0LY436w3Ulhaw+PrL2K5uY+LAHPIDg2g7DPhHXg5Ir7TFtDhGDQuost95/rW3kZ+axdDwmG37r0P+RT+Vzuqa8ZSCq9uczYZOVq7h1W/8Ll77kz/A6qU30dxYRdLqoMZv/u0c+XlkBiceeoK8HaKjMokmJELC9mSTtJiw5gaGxCXe28T1i29jceEm+Vr879m2xMs3r+LaW69jYXEBYRBgeHgEvrantMToPibotTK7Mw5jXenqZJ1oxh/3b9BvJxbe3imea1G6U7sKUsfnVs+mJHTtRJMh1OYU3fjSnH41FSK28OJZGVaVrsJqlGmfA0rBeFV3/TYgPNRe9U1Gf3tmifTNYzFM6sDnB5vCJkRFvCDeMXnBOzkzuFi6it8rvdrXHSzd1RBXWHfHdF1/I8W1sjZFde+l2mZAvPUc9/J1Y1mmxatC9pJi/n26qtyKozCSRC7vfmmUhxkkebX4dEyUoZyf6oMXg/773mv+998oVT2pLSqeqx/RRDQVjk52uNWbwkY4qz6Fi/LpJUina9/1vZWhUr7j1XMO1z5effr2n/tOcffhrtjMwxxj6ftS+gOTdTKG9ZxobnoPe68yiZKii3hR8V3Ze/8/BEpdzvA3XOW5j9vd7g7ufG/3/esd5/K42xktjY7sO7vqY5yOxJNQYd/o+VLGy64qnlQc9pHkXT9WippMwD6MQlilUv05PurXLHPvZdQ/U0v9YJ4y6fhEBV9+6BCmCyHzc32uS0OBhRavJI14VN9Xjt/IvPy1UkkmWCb6kf8nFVQ+lcEKo6q1O5VRfaSurt5dGVXubAXIzz5kW2DdoyDxZn2XPub0ccFP9LSTotJt49iwh0dPzSLy2wzJTp7C16MwDtnYBepQTILwXQYfFt5Pu56w/AuBwuljwDn7ILCrnil27yT93jqyHOw9w7I+dWVvSacPIXUEvUC6mICXCKfHnXDyc/6WiTpM6zRcmvo4ca6PG+/74e+AQvfxdPEsf4W/k7bCObztY8bC6B1d753l6R4M9svi0tnHwZVVW1f1y+xcD89eKna9g4977/Dql8eFyyCDDO5BcELizo37011PvvY+rvUhrb40kXGBTso9DWAku/rv7nZaXq4wFp4DzztOSjJ+WidyGpAynNJwszNdf+3CRi6MjAlMoy8j3YCGV/5ogO3yUFg6S195K627S6J0Xf5xLs/8Cz0cXJz+R7/AysLvglgDM71jenebhPpOQ2sN3mJLU2n3y93vcxhOeBJfDVYpaOmfwV9P2K9X5z4Y7NvyA92Pi/UTQj+h91+Zz767G/q5v89Zu+09vgfufq+reX4g/JhXHxlYa7Lvc/c9r8E6P3esOfUVL5rU4ocR8qUKbq+soZnm0E5YLwwvRS7Hgu4co1yH9zEjsq16BdQ4DKg3OhgbrGB8iGFbTeS0Mq1QxKWVPfzg0oqt/rCVZIaL2rGrgbTXpL20jUOTFZw/NIaxPFt/0mIQtXnJNsoNI7GMDU4eSdnnFJ7yV0rCU2MRPtHpu1BKfcUxsEqwRAzco8JK7spf33qUPN3Eri5vyTBhLBpJOeSUZQrpfJUBCyD8jYKih1MK2XeipaKciKc9Kz1d5cNoTEs4eExDCiujjORlT/Y6pZ3yEC5OEWr1Zmm49O1XUXVVesqTF1MIG6WFqaOTyXyBrlZ2904GnIBO+Smce+ecS/FHgyYGaWtkbYkG8RHvC4UCRkZGsLq6ikajgdHRUXzqiSf4OkUqQ5u2V1PapJVySLRUQiUOWM/y4ztt6esH7DPCItJ8Gf7YNKKJOQSVcfjlIYT5AvyhIQzOHcLY7EF0oxJpExnfWf2xHqWQk5GFgVEjURZu30IaFTE2No4C49tKbyuFQDUlOqu0Doe03cClt17B1sYy20Vg8camZjA6dxhDB09i8NApHLjvIYzOH0GL44DUE6+y3lhHStfox3JAuCQaK0u5mUN+cBQjxHto+iBK49PIDQwijgp23ldpeATloVGirIkG4s19DD9qED3u3PX41viO/NPnCce3PXDMY7cC3dk3A+O6rxsp/9S+ZGpSv69vBnGA+FiUE/1lCtG3jMZVahsKr50JXFuU7FLujl/VTkVn+ffaXS99G58xba2mkcLYhd2XD2qPkhEy+CmNxAwVzpjpwLUvYS1Qm3KYOj5RHJXO/epJ6br2LSzUlpSv8FZ+elYwXdzMfRl0tFJYaTt54saQwo0vLazDVbg4nPXWpSMc3K17r3wdHuLdHn78UXnths7S6IVS6sJT5XLvXQ0wEwujt33Z594oP9GINUgZpaso496prYnOiuPwVDrvB5fv+8Hlp3fCzt27vH5S6NPCaGbfisRLV4Hkb48WfSW/M8ATrO5d7vv5fzC4FOT6eP941y/fXwQks0Q29QE6h0vnc+grvxSSb+OayUcZL1xqTJeyNKJc0iHlMNlJzMg7ys/VDUGkcKFZU/YaIcuqdXIjQYIvPX4GhwcjlEUr1aMC3wGm5ApLcCm4VATyVA79CH+xMv71BeLf4w9Bv/70K39rLdY2XPmtHWQGkJ95yLbAukdBDV0fA2rITTr7WG5r+6sWPndsCF9+/BgCHbjKcElOW1TwwzfV4njNwiLjqL/JuCaDDDLIIIMMMsgggww+FtD3vLb00eBcqxg0k1Sf5+47X4oXfclz4F4oYbMDfP/tJXzrtSvYSSO0tXIjp5WzXUT8rteWp3Gq7VXdgc9JnCBs7eL8VBlffeIkDlU8BF6K7cTDi9e38G+//y6aOiPB1yphKQC1dYapWwwfKQTycQ1Pn5vBLz58GBO5NjymJ3WCtsBqaasihnXbUkipwDIwHW01aP59KwpTk5+UFX7qlKRSOpsisqc4dbOLpSTtKUSZi1MXOXCKUqegMENRTquoE45tmswjsS3BpNSVglWhulrJIkxTp+jteDlDRUpOVzqmzjTdWErqWeZHfJSHUz4ytrat5Rs7F4dlVRyjEX1NsWlKvJ4yhs5+mb5cX+FinhbGgcpsyl6+8PigralypJ/oYXnzToZxpdZfYSKlsFNwKl9LxZzD80eD23qXdZjP27OUBjJ8tNtt85dBJNSWjvSPosi2wZWBQ0YGGT9slqUOQ6dfHMvQ5MrY4S+pjitru/jmc2/g5voOUr+MNmnfSogX+U+Uy5eG6E8+tNXnLJ2MMdpuksySDz20m00EQYBGvY6Czp7yPbSIm3DR4ibl36etK7dACvKEyTSRtuvQ7pQF1rWXtG2rXBn/GsymA7aB/ABxYvhQ5xKyrjUT22iiCnJlCcg7efFmm2PmTpO0Fr2JvRSa5LOYYTsktNqTFxbQJl1keLTttP4agPjwbhBPi9/EYX1wd06uOJ4Rp6ld+ORn1keXtFPbI7012aHjaVKGa5N6rzYg44cU7EpAJfdtXU/H5FVMWsjIqHRDbdGjelYLkNFQ7aQXXvWms9fE6QkbojYuDnuyT1upmaKS9aVzY7TNt7BsB5ITaotMhD5OJogfegxhCg17aWV3vu7ZlVktUe3HGRSNd8h/HfEKQSs++qB75SPjR5PFUTs2gw79TCdvynuHr9J1roeH3Sl/Xh3BLU+HkctLUkbhBIp7N1iKzEuRZajoJeHqt1dGlU/PqiNJCW3rI3mkeJKJmvyi9+bHFqj3wirmO0NfT8rCUv7owMk7VwfufAvxmt6Ilne1I5bxjr8hKfqJr3h3p24/augipKxIOuxjiGtAWaptZNPaOnzKn4h81GZfGOfL5GnKWcpLiO6JTuiSMZe0V1X3kLcVRVYWGf3URtSKVMcJSl6MYmcHnzkzjy88fBAjTCvXarFvFlHuYtR7CtTP9doAwX1riHaOpyST7C7bAuuegmwLrHsU3Gcbm6UEJwWBrMuaxzkSdPHoiTnMDGuJHj9Rrd3qg8LNIlK0XrvupZBBBhlkkEEGGWSQQQYZfNSgwbsNsvnB7pRimv+rwbdzTvHLq3RvHLwPDRaxtrZjW2EhiKCtM/xcim7SZkym4AV2nppUYB7fa3xQr+2gsVfF1MQICgN57LQ7ePHCMpZ2msiFBWVgym2pWGIOEpyCl6OHXIxKroPzB4ZxbGYQgbb8iNvQge3ao8uppNxowqknODCVroJlkaJHMzNNIWtlU+lkcJAycX884mZkKk/RoQcKw4tTXTrn6NQDi9N7z/QdrXrpWEjRzT0rP8uH9/33imnnnPBWlBLo/Z1w7t/GUG4WO2nq+aYgibo6wy6HWHTWOxJKcQxf4uLwdSkqFcNNvoajHP376SskH6UQdCtclJ/Sc8YfRxL5SrEjI1LfSEOcbWawy+lHgYwXgmaT9cy8ZdSQ39DQkD3L+KFnORkbZOiQYUTvZJjoG0B0VVy9F6g2klIR3tAgWt081nbaaCCPuDiEpDiMtDAAP19hyJDxGJbx7exJpitjjrbmTWRQYXK+tnAOQsQy9DB95dFhXiolgxN6ZXRkILBuRfv8ANKo7FaY+MzbZ1vQGVVBkXVC3IoVNEUm+otXtapESkZncGJZhQud6N3iK1Meh2VbEdUJBxCb07lZJXSDvKWhCtGZjv2VJMLl4wDHq06hLLDyiL69diJf87OrC+H8e1czGLhQenYpOt5zSlkp2HsxWWbxdJ8vrVL474wNUlTzoSsltasn1xqUlmuDFkf+hp/4WPVnd3xDlyrEfnuVUzmc4UX5ClfF7fOB2g+fmZ7agkXpgWsbAv0qvMrSe2a+7s/hkPC1hWI6Ln1HQzltj6X3CiGjrsVSOXtpmrNny8Gu7km/TInvVCrRTM+Gcv813zhKuBh9cLkIl31/RxOCEtBFcZm28Bcob1FYoVzdqX70Rn69svBZhihXfgJ/XOyPEJihW8kjnuHjnYpz9eP6DNdPqO7Fc5LbPYx7/h8XUNbLGEc5GIY5dGqb2Fx8B+s338DihTfw7g9ewM7KEopRaCvoJMe8vMKnCCnbZDhzxhvWiBVbP66MAqtL3hZ9ytzmNk7PVPCFR45ikHJQW/R1E9ajld+Fv/dABDTC2ZPxB/2c7OMd+d7duXao52wFyM8+2PdK7z6DewgkBvV5aCMUtVEKXG2QUWQfNzkywO9iNnMTuGrk6mIEelJM9zGRQQYZZJBBBhlkkEEGGXw8YF/lHMw7ZZe+3fvKnhxsxj+/86W/SjsNVLwUk/kQT549hplyBF9nKeg8BMS28sPL+Qj9AJoTiSRFzEG95mnXmMCF5S384XPv4NJ6B9fW67ixtG3GDym8pSjrcsxgq088KT+ZIRHTVh8jpQBTlSJCzZyPY/imTCCupkx2ygjhaqp/lsONLlwZlG5/HCKVsZ7d7GQpNl25WUo+awWEe3bGBm25J8OD0pT/Po3klI7OR9G15RXQ8EpoexoFuVUgOsNBChKNgzQZLOy2OEZq0mmWp5vR7vJLGLbDsDG6Pu9ZHjPe9HGSP/+cEpX+dv5Jm/5yvFeZ+FLKOpXL11xezSLtve96dMxD5yT1wXBPYpspr3tt9ZNP2nYwuJ67tlpCFMqhQzq0tfqE5DalLHGTSz2HK31doj8C+kaLYrFoz7rX6gqtAOkbRFT/faNH3wgio4dWg8hP7wTy07POwjDjQTtFia8eODyD+2ZnEOlEXsaRwaPdJvXaOcStFDryI2I4be8SqO5YRynD2DoC1rF4lIlD53J0xLPEQcpGWUfuVnFIX2jjWdYpX8Am6+qghkTq84h4l+hdINtrtY7wVz2yLEpHfMsEtBGWjHiheFAztDl21tZtbgtihrPtmcj/uYjtyUOHLCBcmYqVXTj0lqYYTh8HKGen/NsHyQyBuMZRzbW7PujZxRRX0YnG5HE5t6pBb6UcFEfvx7SwFk/3eiNekHN+8nVb2rHV0VtXM0zwjdq3u3PhFU7OYWdZ8llxdNV7OXoyPDmcbUftroevvA1UBy4Pl5JkVx8nOf72ZITJIkY0nlEaFsfhIlBd9v3sfc/ZKgT59eSiC+wud4PeWZsnD8l4adsVKr1+GRnH5eHy7+ch6NPybtfH/24wg+pdzoErd1+e9v2Uhpm9GU6Gpf3wakNExoKqIIx9h0b77v08dTf86Dd/UVAZJVOFnxBRim7VkPLWqkHRS2D8RNRtdRyvRp9+MT8uUB8sAwgRWr72Fl78o99EfPsNfPr4FGYp4K5//0/x7X/9z/Dqt/4IaWOLeLNf1tlCcY3sRNnDUvR5QbQQrdWnGH/y2af8z8d1TBc9PH3uOKZLeUqyDjr1OjwtzczgR0BGm3sZ9r8OMrhnQB+pmk0joaw9Xj1bchpjtFzAUEkfmRK2+thQB6mOR58h7iPehG4vnQwyyCCDDDLIIIMMMsjg4wApoJwaTF/nTuEjRZpTkEiNJSWxtgzyO01Tlh+dKuPR+46gnJNCv80kGMsPTTebdPjdn3aR5/hAm82k3dhWDuymIS6v1/H737uA59/eRDXxbGsfpd2Fjrpmfl7AtLSenBknMfy4iclKAVPDg/CT1GaielJO672UVD183zuq4L1pe+TvSmRv5cWwLrxm3Afo6BwkzVru+ZoyDloP4dtYpadK7CnN9E4lkpMRxKUlGvHGZclnl1KO6WqFBstDkHLStvpJ2wjRNJrpWf5SZtu4iAlJB+iUslKU673L351rwBcMo7xdmh06KT51r3CqN76wHzpTLMuIImODjAlSOCu2S8spfhVcz67O+cQsNKNVZhyFlfLMbY+lNG0sZ3RV2B8PUtjLaNE3YAi0qkPGDznd91d5yOgRx7GFVRzdy19pyEgi6KeVKAz5TQacYpxgIu/hkePTODYxiCLpmyd+gcalfoAwjBCEMh6o7DImMS3PbWmUkidl+NBuVO1Ox8a0VirmKXx+HIiOqh8ZMgLSzuhIvGKlk7qVJMLfD0RFne9BOjJPbYFlCm46u+c7bcmjLbm0ikpWlW4sQ1SMSDOy6eeMZUpTzEGc/xzc/qrBFNUy1vT40PG7a4cq0d0gesrXvXFv9Wu8qjJZ2Xr8pHQJ9t5oKtfjzb4fwyuuxREdje565/i13w7MsxfOFN+9tJSz2quc2pxyc+XRnTxYDgXjj1Fdck3KecZTXIUy6KXvDBgOJ4eXw1fvlJ+bCOqc2pErryXvcLb3Cqd4ysXdy5mBweIKIQfKTc7FcUYPSSu3tZfo2Q8rPOn479KQ43ul7QIQ6Nd7NiPNfjbvgT7+ciq3K1fPsSCu3Iov+ktmyQjrjLMMxDdyLszHBaKYrfQhjtZW+adf/YsX7Ik3MkS68z4D3kt2s86FvtX3xwOqIVG53Y5Nbo4MDuDc0SOYL0QY2F3H50/O4+/+/BP49NFJxNsr2NurIecXGSdPeaTCsQwm01VO1aMrkhn3ma6qKI8O8u0qnjg1j6PjZYRJBxFf+JSVOTOof7z1l0EGfx0h2wLrXgR+MOijoA+a0TTIXuWBI9M4MT1gB55rJpL1fQzrrvpw1lUx1P3YTQYZZJBBBhlkkEEGGWTwEYMpBKVu07c69O0ulYuUXfpm76lL0tgMGt1OG4GUxgw1OFbGbq2JzWoDLeSRIHTf9TJUME7AIYKfS+BzbKDZq1LPaW//nVYXa7tNW10AbT9kYwQpHD07r8HOFNQKBaY64LVxbn4c5w6O2zhDpgdhZDp1KSaFk/ncGVowPvGVoo6PfaWeDDwCpzhkPrkAba+IDvFyCmWNaVguT6s3GJb/pqAkVjIyGEVsJURgW08pjpK0PJifwvGNKdiUfewzfW2JxPQ0O1sKQUdlhtMWJSqHsjFn1KIT/bS6QQaPFDp/Q0o7tzqgH1g4MhyfZRTpr2KwEZXqq6+wNdrIT/RyNJOz+hTu/FMYV16N4aTk0rkE2q7DnasihW2UNjme0xoegfC0EvNPKbj7HwU2UY4VJSNHHGvliktF217Jr/+slR7ysxUOPT9dFUbx+8YI+SlNW1Wi+7iNAsunMziGyuKbLhZX17DTaKIbyrAlla/4KkY7pp/Pe/IjGdL4MeUbpSX6+8zf41VUYhZIZcnr5flBoPqTotdW82hbNo53Vb8sMdMmZYi7bWHE+LEU08zbbbHjVvhojUHMR7GxVj7ZFjM5GUnI91I6ku7dpEls1H6UoepVNUl6CUHeO/p/9OBkAvPmRe3JFOK8qvx9alm5DL9++9x37tfFcWk5UArurUBtRVJGUoP0sDK7eNa+5cd7y4FtQbF07/BwNBY/969ulY3eyfBFqhr6vb9+27InxqbQsDrig/BzB36L49nOLKzq0eXdL0c/rpIxP7vKSQ7RqY4NZ6bfK7OVi2HNEGnPLi05ZeNSde/kIVzupM+4oo9LWzwsP4VxbbRPV8uD+CqsiyfP/XwUWp66l7893AUOfxfvzhveOCPCfjr2jvmYP699/34oU8Lb048Dhu0R7r3h+mkJfnwKPwoUS/IydFXH1Eg50cqS4xNvxCO+DCBdyqau+kO+J9riAxlMlcqHy/2nBeZLmSx5KAbIU4Z5y7ex9fLzuPmD5xCvLuDhY7P4G7/8Zcw+9Glsl6bQwAD8YBBhTkYQGd1YLuMfRwC3stH19CHl1xCaOD83jM8+cBCDlF8yfnS1Uk17TZphTSX/eEr/8YMxNa+u/P1269qYeEiywfkL9JxtgfWzDzbBITOA3HvgOg1+RNiHaMqP5A7G+BX6xH1HMFXiB3/csdks1mn1wt5pzNaRSAw4IZBBBhlkkEEGGWSQQQYZfNTglCH6QNcAXM4G8/yG19e61Ota1Z12OohCrfLg+yCwcxPKA2Us6jyQegcyAfhMJwx8O+g54ThAykiN9zVrX8N7KQZ03LHONEhSDvM5mDDlpkJ6AfFwe/9r24582uR4Ajh7aAyHJwZ7h0xzVEHUdIi0Ztnb8MKwlMpAfxqfJDbOMMWdDVak6CESNuTgc9dHnIuw0mxhtdHCZjPBRjPFTjvBTrODvTbL7blzIWScUeqJF6GWRlisNrDWSrFOt90Ctui2W13sMl6t1TaDDsICdhOfYatotjsos6wyAgknK2kv/2qni9VqHXXNOM6XUOskWFOcOIeQtAht9QbHWb2VJDKqbDDfZeKgVQtB4GGLuC6S9putmPddw2eTaGy1cyxLik4awAsjdBBifa+NjXqKDYbb7OTsus4y78YpUpZVdaqtv6pMa5Vhm90AxZC4GXnNFMTaDIhnjnjGqMc+CpGMJU5p836423ig1RuCvgFD4IwPOXvXP/z8bugbP/ReYRW3v2JEhAzpf0cRS/zKlQpp18XK1q7xmFYkpWboEN11EHvEVGPEiVvRIoOH8hcfiS3acezyk2KQediKC8J+KfZBedr2a9ojR8gwrA5QF7tpVZNKKEWX6on/5CXydq8MpogUM/K9zzp1GUjhyFh6Lx4n0WWY4Y9R11ZWqdzETXHsnR4V9SMG5alyGg3UGHtj/T4u1taMK0QHlYH0JL6ig8K4cCqVUx5aSgpjb9SmZayQr2IrFu+VHzNVGGfUoKd7pdCOR+3BvRN+cn0v5WIeHnmJiVtwouDZdmNOPihfZ/gg5opPXjBjhdon35vZj8+Gp97rx+Lo6kDh9KzVXO6ZoXr5yxn+TNfFVf524bPAPRitenRRPadKy/Jw1HDZ8U7eumMG8pextV+WOwYQXU2BrdpwVNc743sXYJ92jGfmDvoJRzFvn88UU/eGP5/6vMkf/jva6YX5GD9Yya0cxg8Kr3fiYbtxOAisrfXuHbj7D/a52/cvDuInd8A84zMvGcGsilh4l6p4TmUVno5fzeDIR/GDUVg4K7GPHNgSWBeSgardqFPHg8Mh/qNHT+NvP/04foVubqSE9Z1t3EyKWA9GWYwyUsr3NEmtz1YNqeM0IznLoa0mRQqtMAuZ3nzZw5ceO4OZwRLyDJNSRjqxKN4RiC4fT+k/fnB13y+/a0uOjtYmjf+dv0DPmQHkZx8ktzIDyL0IbJTuIweI+BHutfYwO+DhM/cfQJlCwQ7To2C1DyPKDtfFMLxF6TdwFz+DDDLIIIMMMsgggwwy+KhByhC33YdTXun73W1hooG4GRHotPVUykG7PXqmMkLeDzA6Oobby+u2RYeU1jkO9k1xqLGAtCgMqc99KdVi3qa+8pPSwONYoadU0o8fOqOIlDJejLC9i/umh/HwqUMoEz3bviSVgpKJERfDznQTNsjo3SsxvVE5dCsFnNaNSDmoEgl8tBDiD7//Br7+4hV8/+Imnn1nBa9dXsZLb13Du9eXUe90EUZ5RIW84aUDrq9vt/G//tFL+M6FDTx3cQsvvLuM595ZwIsXF/GDt6/gnau3MDA6jsHRYVxcrDLss1hY2sKZI/McJ/k261aGFRk/GrkCXru+it/82rew2ogxfeQgrt1awu9+41lcX69hdGwYwwORnUehMzjaxGWHyP/Jy1fwe9952eg/PjmOf//mTfzWn13A8xdX8MKFBbxwcRnPX1jCK3x++a3raJHgo5NjaOV8/N6fvow/eekSnr20huevruJ7DP/sxQW8s7CBvSSH8tAQ8lGIC1dv499+901c32xj7sAUdOZKIGMC6VZPfLz49iJ+59tvYbeTw9HZMfKADAofDHcrOQWmeO353a30/KAtp+6O24+3f08eSh097UBy+YUhKoND2Kq2sL5TQ5tljvneDHaseZnWxOWpDGnkH+Zwxwk9h0OPR0z7x7seivuY9oDvpACTErG/6sY2ODIldMB3ckqjpzhnQN/+eN/jeZXDtpImOCWxi9c3NKlNqmy2IopORh4rew+tH8LpIwSn/BMOrp05yqkc7snOz2E5RZf+lnVpLMMkwzOIDJha2mI0FE36bZ/llZHTpcswKqvKzPQUVoYFaRAkS+woFFG0V2/6t3e8JqZ/YFjJI/2xXjqMkJPByaMMSSWrKBl0BpHwVWSlIuIqU1OQEy/iE8sOKRyZlvhG9ewMDQ4XHUqvalRM+Ss9+SvPLuWPHb7P9Phv+Yg2brs71bmwUxjF1ztGNN6jX0LclT9figd08L2Vh++0ssmyMzqwPJJz4j3Rkem4t0zKdzQwBBmvQxqL15SWslF70p/qTHmIWmrnwj2RPY5xZJDT2UsyHimf2JJSfbg61moq6y14rzLyreWhNMXTbeav7eiEg63CMYOMo5vKLfih9k+6KJAlp8c7v32fnwzEQ76Iy/KbUUMrssgHqm/XQl27TMQjlCOSaDHfJR5xFWrE2+X+4fL/aUH0Duj8tI2hbh2PDqd4bCjBoYjPXgudRg0tv4jVaBxrXsVkh/Xo5B8iz7KR0OId8Srroi3eon+B6Y34bXzx0TM4Mj6ICoPnWPHq5/2A9elpy0HSgHX9YWn/yQcxvKt9gVqIaJcZQO5tkOx8n9TK4F4AdRSaPaPKT+MOCoGHyaEBFNj75dijqbPXh2Ef+reSwYKsTWeQQQYZZJBBBhlkkMHHC3e2WSK4GdYaqidmdDBVH99LfWwrERhOKzy0BVAl6OLQUIRnzh7GTLHLQXwdSdyw738vKkKbVjm9J+ObHkHpSiHnnAaRUrZINaAcfOaJuAU/aWK0GODAeAUjAzpSneENPYWSmsAzZYJAyh357o8rHP4OnDJu3/nETYpxoJHTseQhysUQM6MlTFbyHMeUkA8DvPX2Zfzxt5/Ha5cXUGPWNRaozdR0ILzGMaMjgxgbKWNilPgNlTE0PISJ8TGUCgXDoxvkzEDQ9PLocKykM1DapEUnF5pSvs10mryv5Upo+QUWPIfhoUGMTx3A8k4bi1t7QKgVCxxn+cTZBxY261jcbKI4PIXRyVmExSLqxL+WKyIoD2FkZBiTxGm8UsDoQIRx4jVQHCB9SVWNyVgfnVwe5UGGrZQwOhhhYrBgSt0X37qGb798Deu1BFMH5jE8MYPrS+t4+eIymkGIOsd1MqKsNFp47doC6zbCfacPMC5L2yf1RwxB6Gbvd+IYiYwa3Rhj5QCPnDyIOdIgH9OP49OQYYpRCUkzRq6TohKyjqTdlWL4Lq55L7hC6e0HhpBim3Vj26bJWGGthJWkQ8x5lQJLRg8tENHscxnudLByQD/NQvfZHtzV3bv214tvh9A7p7MI5K/3/ThK8w57f0xgrYrtVle5u0G+Mk74QQSP9EkSIszy61wWGRGShPWQkwxhYJMrOuxdhCId2bg6ndjNQGc6OkBehpE2X8ekg84IklFA24ZpVY2U8i3WqbYcU5qmZLSVNKQ1+dq2SuvqoH3KMranFtPt0oXMtqCVakkHsU6aZyU7Q42wYRzinEjpT3zzDKedgMQHMYWZZuPLMOX5eb5m+a0sKrW7upVNlJXiEeInI53u22I5hpVBQkYed1aq6MUf0klKbi9gmpQL2rXIYxpd0kWKb+WtMshwIYOejA0yQOiEHm09CD8yOjWaTeIgnEiCNLYzadS+pQiPWSmBT7wpe+JO28ono5RwsDgsudqUqkWrTsJ8wc5n4ivSLnRl4zuf5VFZVXZVbUdnOYnk2vJP1FM/ohcqm4pGP9WXzkPxSXe5O7gxaH+ru/7KsL8KIBpImE9C2S47iJT6MoIZr5gzRIkc+yKvQ3mr1Xxt4u1w9EkzbZP18YB4WCUgda3/jLFXXcPSrbexduN1bN66gEZ1C5WhYQwNDKIgXNMmw7bJo66P1QpEGTNS8ojamnrUATJ1vrOHx88cxrGZIQxErv2Id8ieVt8K74woH1fZM8jgry9kK0DuSZCgVC/Gj5SkheEwxSMn5nB4vAyPnWoo67rr1k2YWgeoD0TJUM3M6KWQQQYZZJBBBhlkkEEGGXwcoG9xOX2sSzlpKrCer/PvpnSmzHOzlKVUCXI6ZlWKRA8jlYIp0ja2ttzB5l6IWjPhCDHsKRZdmkzFFKemFKaTUlhgW89IEZXEKPgJ8mkdR0eLeOq+eYwNBOZvmDBtmwku5SGf7VB0S1vQe9fTENtwo9tXUHu9sYhTVEqZ/+qtbWxV9/DFc/P4tSeO4tOnpvH4fQdxQis2ohBXbixgZX0TYxMTGBopotHo4OKFiyj5MX79Sw/i5x+YxhMnp/HkuVk8fPoA7j88hYmiB204slWP8fKVZQxUBvDA0SmjkeXssRQsQ4f3i9t1vHttBcPDIzhzaAqjYYjdWoyLN9dQyUc4NjmMSNtgdT20WI6LtzZw4fIiDs7O4OFTM6iEHt65sYmFjT08/cBx/MqTR/EMcfnMmVl86swcHj0zj/nJQZQKjB938daF62jUWN6nHsBXHj+Cz993AJ9juAPj41hc2cOtpS1M8356rIRivoil27exvbODuflJFAp51Fhf33pjETeWV/HQiSk8eGQcZY71dAbBxwFumyHmTxykFHQ17dnKmS7ptby+bTOddaixXCSjQkdbwuSNf8U5rBCX2HvA8ZP4Uzl8MIiLnNEiZwYPOanO5Xq8Kf5mLjp7QFdbwcS0deaDAfF3MYSDi9eP7a7yVTp8Vlp01m4Ul2DF/5ign7W15969nlwJPTN62nNPwax1LaFWdvFtaBpweqeSISybKfi1HZjOYRElE0QMIoW5a7QB2mwDpmTno9q80lQ81bzqUgpb+elgcLVd5Zt22kzHs1Vo2n7MnaMQUsQ1KXc65AdGkhLf8mHaim9/UhjLi6nHOueF+DOMJnbK+CHDTqvVMvxC+uksGhnUolDGGSHIqx+YolnUsS3LbGUG05RyWqtgKM8UR0UxUBksrmgnf8pWGVnoZavybNUEKUu8xBsyaoheykO2BuUhPxl9QorbHMsiOga815Zv7TbLS5livEW8TXYTX0lmpds35MRMT2nZSgiFlXxl3jr7SVsbmgFGW5z36tAjPeVylPcyLOk8HJnutMpDhhYVT8aekIzrOENSUMYp0oHvtTVim7TUfRip3fYJIrycM7Cb9/j8hKA+ifmxjLY6iH2EaBuw/YvjWBrmLT4g/pTvvkceYT+kfkftrtNi2Vh248ePGFQPVj+8V10UkzqG2ksoNm4gbG2gVd1FpziKndIMLtYjrHXzSIIuy6stKElx1qm2lJQhR72ojJMF9ZG1Tdx/cASfPX8QU4MhfDZaTWi2iQ+sd0cPtU8ZHA2VexRYeKt3V/dqL5IN2QqQexus3+ndZ3CvASvfOk8K5IjCdnp8iB2fOjs1cv3ppX50p+degybLuNlkGWSQQQYZZJBBBhlkkMHHAabo42DcDBPy4Pd5l1/zKb/we0N6DtqlvnMKPSkkpSwzrUjaRhjXMRbm8OixaXzq1AEMoA6vXcXgQGR6A23hYvvYMyfpnnyNHThusAPDpdxTpvzRDPGSnyIf1zAaJjh9cBxTwyUl4BQDdwYVfdcHd+8MI3ZH5xRt+yAVqyuj+fPHtulhvjoho8QyaCuQgW4HQ5GHB+4/iKm5Oey1gXevL6GRJGb4kQJSVCmxvEU/h5CuHedQCH2MlPJmsMglHYZhfj7TN0Wii+MhMQWW6C1Pw4Q4aIspbc80XPQxPVpBpVzA5s4OVrar6IZ52wZrr9nFxnadtGjj0GSE8QEi0hEdeWm2UAiIdylnzxqTaW/3wOuiWFC5WWusg4h+OkdlsNBFmbQutDvINxo4VMnj1KFDxCbE+nqNOHZx8sAAZscr2Ky38dr1beyRTkt7Tbx9exFBKcLZoxMYDLTqQutiPh6I4xZ/pbAUbbXSowOPvFNkHTx4YhL3HxnHQK4BP2koMKQwhhehqTNeNFrt8/B74P3PPwrIy2wndgC3OXoZ89mNOSkSVecyKqr9aDudhOPjmPjaORSsQkWRszaosHS63nGsS+dHnKWUNOfi/HUDyQqVXBwnI4SU2gHLWGAbCbRCp0Peau0iihsosr4KaQsR/YL2Ht/VEde3gXYdIWWK366h26yyehsmI0y5H4Rsb6HxsbbuCTpNho1R0kIQpimnuGl9B35zD4W4iTzTDVt7GJDCm2mlrRrbuw73Zx70z5M3ZND0VT+p+IL4p2oJII6xyaKoVbWVbTLiSL+BhO2N9wXyvitDne2JabAs3caurV7LMS+1P7UlrWywlRRa5cCwUdpEgfkWukyHTkrQkGl5LI/KrzbFVm9nM4he6d4WQtKo2CUvExePtFG4tMWwwiOiPE5ie4ZoVttGMa0Tf9KDNBGeZco0j7LDEz2IZ9TZg9fYRqD64HMhJb6iH8tmefMqehVJa53xGlEuqj4C5h0S97IMBaSJxzbY7bSgrZkoiHphW0yLuKle6ZRf2GFc+XXdChw5GUm0giyQlYZy+W7jx182qL10mH5H7Yc8qabvlM3qV5SvjHQse1pDqbOJYGcBu1ffwOrbL6G2sojBvM5xsqQ+Bui6c7X0x/4izVew7ZewWRjCTlRBOjSKcGIGq80UdYqLINKqQ/ZLLJfOJcrnQyuvVr2oDEW6kPU4zf7myfsOYqKcZz2SDqw7civDsl+hs63PJMHYHjLIIIMfhmwFyD0IEoduVkpiH/yTlQhPnJ5FhYJV1v8uO7lUU1UUjk6DJvfBqX91OoJMqGaQQQYZZJBBBhlkkMHHBfpOd/N1CdKW2FW+PaOCpx+nprU/PtrbVAqkBB6vxXyE4eEydDj3XnUPjUadcaW2kQLKKYll/FA8MxC4JHtp6jzBLvLdJgpxDQ8cnsSnzh7BgJ8iSNuGm+ZZ2uxJJWTPmk2fukf6a0qWM4JI6SzzjYIKZ03NUt4yukip3FsBcnMLq9UGjk6P4cD4CKOwHEGIjuejyfRiv4KrN1dQr9Vw6tQ8WnGKl968gSQsYXBsBEnawlazhd1WE7VaHe16DcMDZY5/PCxXO3j5yhLGBkp47MgkBrwO823bzGuNndrEbmFrD5evL2J8dBCnDk1ZWbVV1epuHUsrSxgaKmNqZgJe6OPW5h5efPsKhko+Hj8zj8lyZEalSwubuL2+h7HhCiIWuEpctlttbBKvvTbz81n2VLPcgWvXb2KLaR89egRDlaIdtF7QzFSW9epyFSsbVUyPDODApLYz9hEWSnhzYQtr9Rjjk0N48+IN3FrbxLnj83js6BgqtkWMiK8a/aiBdJSC2UvIfh1oSx0p96S005kIUTFAuVLGxvYudvZq6PohWsJV2yCRB1KFdRz1Pmcsae7Hw354B0ybD3Zgcs9JcS9e1FhYhg8dvKyt1+R0r/Mx5Gy3BE0cZHizEBr/OqOHmNu9Yyimrxns/fN1/nwc/+rA8CYCwn6fCrqqVbIOErY1vtHqFynUS+T/yaEIEyWgEiWo5HMYLXsYKeQwQl6OWHm5uI2QbUp+E5UAY4OBrapox107u0JGEK22GM8nmCkznq0M6yCmnBku5jA5wPR4HR/IM36EsaKP0QLMqCpjZaNRcwYZ0nNqsMh3XQwyvOhPCrOZEAet3iDOuXYTw1GK2eGI6eZtG6xah3xGeRPGLZRZnmGWYSTfZVoeBoKOlWmgUEDM9mdbbgXabkpyj+mRNDKWRmkDw16LdPAwVQowzGsx6hKnLkKTZZIMbcP7wGDI9IHxSogx0mOQ+AyRNmOVvNHMVsUxbVtx0W6QxgmmtI3fAMw4OcywWqGlVXpabSIaTFY8jJe6GC3lMBimvA8tfW2Zx2La6ikWwwxPQdI0o8WAH+PwxADT65qRVQZUnzRIm3XWNNOXEaMbW5pTlS7GRFemNcLyjfNmtBxQVpDCjCMZKsOw24aLMpGECVjHapr2I0L1QHd3nuzmPT4/EajfMD2+cGVb0oqIroQi61z8a6uzmttorVxB8/bbuPXyn+GVP/06rr/8MjpdH3OHjjGu1i99uPx/WkjI5zISiT+lQcslLawtLdgWaaOTc1hoePjuu4tYStnARmYQRwV0Keua9ZYZv7XiJmaZ1RPK2DjBOnrmwRO4b26YfZP6JL4TD5I+tkKJeVmf2pXZj+2CxVZd35vQ50tX95LLokW2AuTeBn375H7tn79xr7aKexas2bM3UaeX50fwI0dH8auPHcZQV8tKZWmOKQDU1DV4USej+U8UyNaetSzPRDhdBhlkkEEGGWSQQQYZZPBRgwwIZkjgn7YJsZUfUrzaXUzfrinJZeuww3ZzvimuPClpOQZwB9tKURIgDgLUGPelK+v4zuuXsFBN0fLLzKDEAaNvg36b1W6KXuXgFAZ61OzkSq6Js3ND+PxDR3B8ogK0GkzVGS10sKtWbAhfqa2ktLEZ9nznDvANTMnVzbWZdpvjE2UjhVEBCfOOclIGtfk+wLZXwv/8vcu4sLCOrzKvzxyfxHAQ2/kDNb7b9T0s1Vr4vT98EX7awi9/5bPMMcbv/MFzqCXMNUlsprPb/slDCQ2cGg/wN3/hGURBCa8u7uG/+9oLOD43hf/s585hPN8k7TTTXJgHqOZKeOHqCv7wT5/H6aMH8MufexgjQQdtz8ez7yzgm3/2Axw7dhQ//+R5jJc9/NlrV/CN77+BzzxwEl94+CTKXsq6CvFvnr+K71xYQcmLUezsOMWexlwk6GApwq9+4Ukcn59ArRXjt3//O7i2UsWXvvwM7js8hJCoRwxa7yT4+su38Po7V/HFR0/j0RNTKAYeml6C3/zuFbx5cxlH5iexubaEQhjhbz7zCE6PkJ6a8W5qbpmaPmpgrh4rO01Y3tQUqhp3eoE4lmxDGreDIi4tV/FHz72Lm7spGl7BDqBnVKsH4x09fEiwEaymk+siVMzjrjTFqMbhei/GdMoy19LcGNrAFI66cW1C8b270DKlmcXoOxesF/sjB2tjpJ7AyQ2Hv9FALVOrmszxuV1HlDRwYKSEz3/qNI5NSRHoQEZQTTyvscKuL3Vw5eYSLl6+jOmxYXzhs+cxORLi1m4X3/rBMt6+vkQRk2ebTvDlx2fx+TPjRuWvv3QFz794GZ//7AN4/Mz0nbRFG3FlyFA7DeDmSgM/ePcari2vI5ek+KWfexgPHB60g9H/5LUFvHJpGVvNCH44gIilyCc1PHZqCk8/PIUyZcE7t2P80Q8uYrNWQ4XteLIU4v4zR3BwbgxTQ+KnLposx+WFBq6ubOLq0jZWthvQWjC1DxmMtMJtqpzggflB3H90DtPDka0q2yOe23td3Lq1gwvXr2Jjp4pP338cn7lvzsoouurgcaUkbmqTl8TjL729jpdeX8Dm9jaGBko4fngaBydGcPZgGeUC4zAMRRiu3d7F6+/ewNDwKJ58aA5jJWeUEdiF6Sld4aL1XJdvtPH9515FHMeYn53E0QPjOHV0CHnirzCi2dvvruDqzTXc3qyj2kpsddWTj5zGp05XUOwxr359pq2dEOss34WFbTz77iI294iUDCCUU+IXKdrdYeru/JE+GNcbgnR9BvuQXC+joUyKzAoh6y+XtJkX06IM1VkrQdzEpee+gevPfx0Du7dQiBtIvAitwjhGzj6N8z//q0jKg6RPn8M+SmDZSdNI8q5ZR7KzjubNN/DWN34bQ411fO7R+/HOtQW8dH0VE2efwNS5x5GfPIDRucPodCPkdK4M6S1ZGXWaKCV1PH2efd798xhgkjIQ5tiXaRWUxJSdYZPKGMiWkAspV5m9Vja+p3buJZABmvTryXpyrn3HOOO1VpFKkklmS7cpXvPRDou4trWHf/n117HULqHtR6YvFb8rvCBIYsoStvWTo/jKk2dQ0oSFXhr63rEW0OsPMvjrB2mqr+EM7lnQECnPD+UD05PWOWp2l+2jKUFtHYWud4H6MV5c484ggwwyyCCDDDLIIIMMPhbI2bCc3+Z0Nt7mAL3bU36Y0UGqj9SF4ze+tlny+NilkxIp1qxUDvC1xUuBg/wKr48cHsevfOY8Hjo+Yds1STngFKVSxPiWj2ZTa4a8jChSSA3kczh9dBqPnz+Cg6OD8LTXvJeYskFjC5uVasoApxiT0kH3TqnsnCmKe8MLe9u7t7eM45xmWkqF69LstKQu5/ukgbDbRDlIbZuQuJUi7rR403YztIW0ttjpNHBgdoxuHFOTw5iZlhvH+Pg4xz6knfIMQwSFChJPNNRYyA2VnaJEuLjVK1LGSUmrmeld0jvvezg4OYjJqWnc3m7j9k4Tq7UObi9X7YDb2YkxlMMcq8IdxizaayOcaLCCybkJzM2NY57uEMdkByYmUJDCP+Z/B+hIqRWVsLpTw83lDVxfW8Pb6+v403dv47Wbt1CsRDgyP4TBPOnerSMg8Z44cxATBR/Xri8j6QT41PFDmC+F8No+669MzLVZkMDVxd3ur3JLG1EySUjNNEKQGyC+A7wv0C/gNYeQ9CnEMU5PD+Lx0wcwVsjZVmeeVJjkOSmxVBfGkz/CuXLo14U03tKzXXrlZFpauaGVH2oNAr1WbbsDzn22FbokZJ3RJRHv8+6ZCRlnmBqlz5Giq7ix76T2ltFPOy64Lc6sLTDGxwU9KjjHB7fqSr7OsKM2lbDNJDHbFdsMW4BtT1UgjUpBgJB1FLS66Oy0ELYSjJOFzs8X8Kkz0zg1NWBKwUHStRj4CDoxomQPRV/PpE7aRElbOrGdlXw6tsdiWkWeDB5SblXoXyCvB40Yfq0Fv5liMu/j7IEKnnrgGCbLlD3Eq8Rm4ZPOBbY325oJDOupjlUs1kNbW3S1McT3g8xniDim2j6Kcuzk7BB+5bMP4lP3sb1pK7oGZUKD+cdd3H9kAJ97eB7nj85hgDhrkUpEGaadMkbKbD/nj+JLjx3FPNuax3bd3WsR3y5mGPDx+8bwxLk5jBe7KKf0J98UOzI0kh/3mpYPmmybdAHpFrYaTGMTkxRWj54+hKcfmMfDJwYpuyiT98jr9TZGScOHT4zgq8+cx3SFhdirAfSPd5sYYG0NkqeG6IIm64jp51gObY9VjHfxyIlJfPHxo3js1CgGZbCQpYp0FV5PnZvFL3/2LB46MoZBSqDhoIWithNjWiXWQ55BO5RdHeaVb8Y4OBTggWPjePT+YygWIopU4ke5qPNGpHW3voDuDl/R6c+MbY7hfipQfyF5G1AuaFKuzzoO2LfJ+KHzNTr1OtavvIvxdg3PHJrCZ2dG8BnK+F+4/wzOzs+x3omTDMs/BB/k98HQ4y4Dlek9rdg63rvh7nf6Z1/U3MbKxRfwg9///+HZf/uvsXVjBS1/BEvdYayzv47ZNpYvfA8v/dv/Aa/8b/8U17/1Byg1ttlmYrQpC3X+TN5r4+zhSTx8chqD5I1Q7ZY00WQCkOe6SZP14HZwUb8vWSrU7sImg/fAX7z+M/jZg2wLrHsSnCiXtXKUPd3T5+b5EaOPzo71ETl+MPCz0ISmWfB7AwB+xllcgx8S+BlkkEEGGWSQQQYZZJDBRwH6mu8rODR725SxptCkP7/T7Ru+p3TNwYcOKtbXu1NQ6R3/k67N9pW6Nsgl8sDIcAWzU2PIe0yvVUcplyJKWraHvJ9or/8mCrkOhoMUM6Uczs2P4qn7j+DIaBF5baGj1RqaUGX5Mk/NuGQe9iy8DAPNqAwR0+X43s3zTYijlGk9xbLKJAWYFNRdrZyI0PBDvH5zAxu7NZw4MIED42VUiIu24UlzEeIwxMuXNrG8sY2pwTzOnzqAdifFpSs3EIY+vvKlx/D4uTk8enoe5/ju/lOHcGR21mbptuMUKzXg1evrKEc+Hjs+ibInQ49wcOOeZi7AwnYDF64uYnx4CMcPzSBimbR6wwsjbNQ6uLiwheHxQSRJjHffuYn56QmcOzqH4aLbWqfezeHCShXXVrbw6YeO4MtPncBDpw7i/tN0p+Zx9tgsJsoRcsS7njDsrXUs79SwsLyJd965jjffvY5XLi/g+uoWyuUyPnX+OE5NljCQa9qhxVrlM1DIY68RY2m7g5Djul964hTGQtiWRTrXwOhszOPKpcnfpLj9aYznVPz7YMpMOovyUwFr3/JinbN+dei2FHymWCTv6eBr8aPyHxoZRK3ZxsrGJjlAAZzja4e2PbqwUsLa+TbO236Nf+Rn/xZKvva2r/jXv6D3ZOCu+hVfOl50Tn53zHV3nPLo/+378kmktHtdla+L595/9GBYCSmCM864Mjlsez/SAZCWWpnjk0cqUQ6n5ifYliK0mwku3VjFm1dvY3GzgWYrxfRo2QwEOtC5Wd3Gwflp8mQRjVoLNxfXsbq9xzaulWfAfTNDODk1qEUEuHRrGYuLqzh8cB5HpocREq0bSzt4/dJtXL65iq2dBoYHSqiUQuQHIvoto7rbxNkTBzBeLFqbu7aybSsZWglbp/JgmUJ0cIxt4ejkEPw4xzZQx1tXFzDItH75M2cwN1KgPADWtrfx4pvXcJV5ru00EfF9K/Vw7fY2Fta2kXo6DD022TM/VsLT97P9kjydvV28y/K/eXkJ63VyQxBhr53D25dXcXthCccoN8/OjrHNAVdur+KlNy/j6vKu5XNtaRfXFqtsx1to7u2xrR/GE/fPY2zQt0PRL95Yw9uUK1eXNgwXv1jCZi0mzZewtL6DRcqL5YVljFaGTD7JqPYm5cDrV1Zwg+lubm5jdriMpx89YVtibVZTXLi2hgvXl0mrXXQ6OQxGIYbyIeX7AHZ2drG5U8Xh2SkcmxiAR1mzslXDq29fwfXFLWxuVzFYKmJ0MESUB9+1sVtrk94eOtYO1YrZMmzibJ+7+27/ad/vJweLqXbEG/GNtsnr8kZzuDusyObKAm792R9jdHcRXzhzCE+QpsdmZzA4NI4qSghGZ9EOWecy2KgNqj9UezUZ9+Nx0lvJfbdainXNcsq4YG8svhDTZABXWpeeKCIpQeCjVg90ttfw7ve+iVtvPI+w0yATdXDfw0/g1/+T/zNWN9Zw8e3X2PfKEBizDe1h8Sb7Kj+HqUn2wfkIXtzEIfatn3voOA6RF/Msg21wxf7azvxgVtq+UdtsaWWMEDKjFOWpqfDuWegxjtWLfh1P2qoQUk1X99Zqy56zLbB+9iE7BP0TDL3mdZdzs15+tHPhBLackEJce5xqtsJMCWy8HDyo7VJ4xjaDjKwhAcpIbm9TLQ2WMFUqYpt+ahlkkEEGGWSQQQYZZJDBRwkaxmlbBtv+yrREminfMaWLlDZSTzkVlRSE+orX9zz9GVbDeqkM7XBgL7ZtnnTwd0i/QruN2QD4wqkp/L3PncHfeGgOzxwv47EDAe6f9HB+IuR9BV88NYH/6FNH8SsPzeNExUMh1lii1VMwaTIV8fNc3lIaaDwiBbvGIdpuoiODBccdiSmTEuIsY4PUFCpTaOG02UoqpZcfos3wnTs67S6SIEKb/jpw3A8L9AyxvtHE5ZtLaCYpjh08ZGdiaOuubtpUqihx/FPhGGcg51yZtMuHpBH9tfe/tmWSVj7kfS4gngHjM/0u80plPPC7zNMjLnnDUWXzPRmPUlSKPmYmB1HKB7i9WMM7V3ZQq9ZwYLSEyRHiTvraqSgBXdJGlNRRYrkrxKHINIu8lli+AdZHOddEkDZM4dfp0WJsfBgHDk5j7sAs72dIUx+Hx0dx7vAYBiOtWCBHpIkdFD1Aes+PDhk9h4aGUczn4HltUk3bjIlPVB9uFUSOYzxtURRoSyrVBcvktvBgPZJW4rOYtBIOAnv1oYGpieeIQ4IW67XDdPXMWmf5bX9uKe8S0oB0/fT9h3BmdgxlGeDIo9K1ajWQw8Qnb/COvJSm5AiWXds3uXcCldJUmHYvI49Wd1gIxdMd/eRvuxvY2NeVt5+DWo0bR2sllGa/y1BH/O5yxtt913vex9GBnt6b7kcPwi0gbnJ6IrWIj06iUBshZvTX6qTEl6Exj71uSH7P05+yIgaa7Rhvr9bxnat7+Nqbq3jx6gbqLW1NpDMqChgssZ0wnZBF1OoRrQ6TcrzrkfeZlhSIyo3NwMktv0CKOiMYSYOlnSq+f/k2vn15Cc9dW8FmrWl1o1VWUrhr47w4yaEYMjiL0EWRaRWc0YxvdRS0rWpTffJHKzh0NkmFgc8dOWBGRSKItb0Wfue77+LfX6ni29fr+KM3lvH7zy3hhQsbePXyAlpBCfWUmAYFtgXmkmtjogiUyP86WHq50calzSa+9dot/Pafvos/fukW3mB7r4fjiLukFwsk49HSzi6+d2EJ3724zTJt4tsXl/D9S4u4scF2Xx7A8blBO1NE+2S9dGETX3tlCd+gzPjG1Sp++/nL+PprS/j6K7fwKtN+9tYevn1lCy9cW8dag4U3meDh3cUqnru8i+cvb+Hqcg1nT52wg79rDeDNq1v4o5cu45sX1/DNS1v4w5eu4N0ryyYjhqII9586Aj+vo+UlNyhjSbflaorvvruKP7u8ge9fWDFFcMwKG4wCzA6xvijjO1p9QRqBMlE842kLO17VlhyfS27Iufb103M802Q62sarzQTFO+Izbevnd1qYZvM+MlDSZu1s3ymKqvO0g2HGKcQOL1kCJCtMvrAdOH5XW9ZLh7foKWfM2MNaZ2QF7EtUPvVTCXnN+iU6xZXh23o1vVMs4SZZxHu9ydO/sbaK7dU1K0Oboerk1JWddVy7eRPVvT2GY35e0W17JV6O9/DWt38Pt579Giq7t3GwkOLJc0cxy37EVkJSBsXtGnneKebJ5cQtr9yYh5T6lHoyjvjqT9XWMzCQjFe9vueawb0IauEZ/EzAj2vE73+nTo6CkR8Gc+Mj/HChsKWAlBXZWML6grviSGJTmPZeZJBBBhlkkEEGGWSQQQYfM0gBYgqUO09OQatPevusv0uZ48B9y7t3AnejX+kDpBgK0hj5pI1ymmCm4OP8/Ch+/tGT+A++8DD+zlc/jf/wK0/iVz//ID774DEcGytj2I/tgGEdei4FtPKTIsiUQXp8HzicNV/bbSdlBpve1kYqi50ZQh/Ti1p6KTwZH4iblKcWm2FWal28ubSHN1fauLyTw0vXN/HdVy9jfW0F8xNDOHl4EgN5jnGYRquTou2XcWWtiUtrdby1sId3lvfw1u0dXFndwWY9NuWXlOiaYbzb7uLiSg3vrLfw6mobb6y0cHO7jZZwIw6mxCeGUs6GZjyIEcQJpoeGcHByFKtLq7h5awXjk2OYnRlDqIIwTLdDGiUac7GWvAgr2zHeXajjwtIu3lmlY55vL1aJUxV7XR/tIIcOK6sQhXjiwZP4W195BL/xy4/jK595APODJawvLmCFYZupFMpFdP08y0DUNHHN6/ZoZkQ05ZkMVHkdskIa7vMGnR4tmOpA4N5JAd0HVzu9N3f5fxhwh4Nr9jTxlFOuxFMopKRTxErTOScl8sFTD5zEsekR5OMmad2xlTV+mDd8da+tX6J8aNiprOItgSlnxTsqt2HvlJwW8ScCtielo7ZlxP3hwitFcz8lXf6q4Q7+xhP7tDCqGe78EW+aMli+7p2fykzCuKS1DgrXmTsdrboSfyluFCHMl9he2T5UnTFrQ8ZPX8YPpsV8XVXrcG++Y7atjqNkSJdn+mNFD2fmRnFsZhj3HZ7B7HARaauOyzeqqDZ9+F4AzeOXcSWvuZpsR6kaI9ufVjS5rfnEP6wnXlVf6DRR9lNbZaIt6DrM9OqtLaw3cmgFI9hOS9jNldnmtvHsWwuIowE0Eq2C8dm2WeKY5Uw9bNfVlnIYGhvGw4+cw1NP3I9HbIu2GDvL19Fu1dBheJ3FkeRilq2NykAZR+cncZjlOcZyHTkwhonxYcoyYHK0jMnBsrWvai3B5cVVLNdbqHtFNIMStojDixdv49raHmrdPGqUXXt+yd53VDeWD9DUqjgvj0YuwtSBeQwNFGRbRExZdPHaTVB8oRYNoR4O8r6LC5RJTVYQqw2jIxUMVyqsEynq2faYaCt2WyNK0d8mPXdqdTMoBXxfZl8gA4IMWV0WQmeB2OotvrfVhj1ueS84//f7/iSg84GEQ4N15/oV8qf4mHScmpnGoSOH8MCDD2J4eJJ8KXmfZ34+KqNjLAv5QbjxX1u860B+xZeh21aNuQ7mDrgnh7NA9tIOZVHcCycDi1zAFzJA9/s5MbQZ660PZFthHqol9W3tqlb8bGFwsIL5g/OYnp/F4OgI2pRdjUbTZcU0XN+Wkr+1ZdkOXvveN7D41g/wxJl5nD4wYuf0OmNTG/lIBWM4ls21VbftnmvXSqcnq/66C6SPFO6mRUaXexnU82XwMwESeKpO5/QRuO/cB8x+U9fHYMdmaByYnqLgppcJSN6oY1OHYOEc3Lnvh8uEaQYZZJBBBhlkkEEGGXyi4e7xQl950gdToEjZ3I0RcHxgSlB65flOW9ZIGRloNQP9pRgLAm3xxGcpZVIG/DEg5VBe5wIke7zWOS6RIttURpDxQ+pmUyJpzJF0+F6zqhNT0um+1Wrj+dcu4X/7k9fxP/zbZ/Hf/pvv4F/9+5dxeW0LZw5P4RceP4XJoTw60kh2PI51Sljcy+HffPcK/sc/vIB/+rU38f/9A7kf4J/9uz/D9166gG6SQ16rPpjn0nYd//qPX8E//YNX8d9/jXn83vP4/e+8ie2qlFoJgk4VQdKAJ2OGjB/EMex0MFMJcWSqgrixg2Z9C+MTQxgYrJCMqc1I1+zkIsMGHFTViddL7y7hX/3xm/inv/sG/l//7g38v3//Vfx//uhl/NafXcT1WhOJjgJptxHXtxm3g1Inh6FOF2dGAjx5al6aTjz/6gVclsGENdNMQlZKAW1WZ7Or+cYdUwiToAh0rkiHdG7HvRoQnWWk4jXnaN7nhffWnhtJ2vBP40T+/TTgUtN41VI15/zlw3vmkWNZPZWXDDc/HuLRs/OYGQoRxDXbyqwZOyV8PgyQkkfjuGOKWW235A6rVanaiEjvsNsi7omVUe9UznsVnFFjv53369J8WMFGHbU1tse+kyFBroAWxrw6DkQ1nBrr4sBgiNBnCmwzK3sxNms6i0B1B/g+Y+QCxoiQ8wPbsipiWhFlinEc8dDKEq04C2UUaTXxyPwo/uNnzuM//6VH8UsPH8Y4hUynWsc7F65hm+nLspcj76etlimCIR4xfOnPPFUyrQYRMHvDQQZNnf9TKfjIkU9CtsEtbanG6B22gyCI4Ech8QTq5I2dJtu3n2dbJSV03oUXYXm3hVcur2C10UKL6Y2XfTx8eAB/49E5/IMvnsUv3T+LqUirVZrIMZ8kZL7M5/yxKfwnX3kM/+iXzuIffuk0/lOG/cVPn8LUaAEDYQdlj7Sg223uoRHXiTDpTF7VuUXazkir2+qdBInkYs8o0WV4M/KwfAldynxSHXTtU/4EbA8B6cw202rG2K1VbeVaN9DqmxRNyqfF7T3skIbaYkuye7g8gALLzaphXXcxEHmYqkQYLXQwOeJjdnaQ4XJoML2dnT3eh4gipkmax2x/qpP+Fljvgfd4qWY+HKisdg5G4CNi3jrfSEuGlGeTlVgl4tsMtyOzgV+GF42g2imgHg6gWSqjxjJq15OE9WZ9kskw/RMnGXJY5vdCL0APZNSqM9+W77NuSFvmWUwS5GXgS2VwIG27kuae66u6WiUmIwX7KvYNOrdmb30R7a01fOkLz+C//C//Cf7e3/17OHvuHEZGRynLGN94VLzJtsD6VdyIMq7dqOP1V15AbWMBlaiLItuazkLJqf9gWBmB3o9+f3WKle19bf2eB+vAJCjUu/HenjO4F+He/QK4J8EJQYpEfnindpDY+Bg7Cz5rX2AHTlT2nYPeXV9OZPIigwwyyCCDDDLIIIMMfiZAeqW77R8yfrhZpDHHDDKAdOxwc1P0J3yOY6TtFuKOzg/k2EHKFl6lZPrzjB8CzXT1u21TTt/Z+iqnYalWj0gRG0Nb6JiS01dop9TMcwxycKiAczMDODEa4vTMIE4fnMKh6TGcOTaDL33mfvzCp87i6HjBJnppeFMJA5yencCZ6TKOjQU4NhnhDOPfN1XC+dlh3HdoClMcD/m5GAU/xenpEsMWcHCsgKMzozh5cAJHZkcwN17BcJDDZD5g/GEcGs2j6OkQZs1Ed9vA6Lzig/Q/OzeI8wdHcObAEMaK2paqZmenyLyjbVHmKj4enmc+xOX4eBGn5kdx/OA4Ds+NYp5lmZkYsYOndSjx0dEyzjGd2VIXg2kbxbhhRhThffrQJOukiWathk6nK3uVbSkkneRwwcfZ6QrLnEcgvU+ONJfBwJM6W2poKcl072jvjCAya7l6cGCqQtaPhbbnvwxwKbl83L3yo+ODVgV1yWs+eU5K8yDu4sSBCp48dwhTAwH9yXtSijK4jV/5r3NNNCvdpeNSFV8pDVNGsmTiaKcgtCD3HPQVok5Bqmd6Gi2cQtBtY+QMCo52vHfcwfcJBsIuHj46iV984iR+/qGjePS+wygWPOy2EtzebJrxQKsSQraBhDJAKyekcXBpMx224w7zbjG5RKsO2G7YnOy9VgS16bdVazGdBNt7TbTSLkYnRtmuZzGSl+EksdUTwl9nlWjLtCjQodjiWOEqx7SYPlnGjGHapknGg7atFGFJeC1EHgqBtvuLofOKZCUtEDcdLG0U6tFJWz95YR47xOV7L7+Lb75yHS9cWcfl9So29yT/2hj0Yzx+Zh6fOn+Csilh++uyjD46XR+NdoJqK8V6rUuXQ7WdQ7MRI+nEaLfapA8bqypA7bXLcrAaAhKw21Y5ApOJIdsrX6lUDjfDT08sj65yMoqw7K1Oi7/0Z4KSZcTCFOrdmHLHi1Eq+mbM8COSj9Wi7FMJC9JdSyy0qubgSB7PPHgMX3zkND7/yH04e3yeso206DSxvl1l2p4Zn7XyqlwqEhfPzkqxOlFZ7oDDT376/amAaWv7Kq0u8ukk2xL2C+Q25Acp3x55HDerdVQTGSoGUIuGUcsPYYNlakcsKDsO8YWkg/ASjbRyRfUsPv1gcGGdXNQaJXfmig5iV5/Izon+CkHctOWVVoTYH4Fp5ugixq2tr2Fz8Tq8dg3T4yM4d/YMxsjTgyPDmJqdQ7FUsv5Nfa0mASSswy550loOM1y8dhG/+1u/ifXbt9nvthiG8ozvYva9ASvRVrD0GrKj8x0usXvnMvhhyOhyL0N2CPonFJyYc6Ku//RecB+V+5Zg59SJaO/HAjvG+dGCO+CPsfl5wA8G93GoZeay6MtC6kSnfjWbRnc9gWGdWgYZZJBBBhlkkEEGGWTwSQSn1nZjBve3r0aRkkfKUTsXoisFjRRrKQJPas0EAf19T9uKMI1uF4ltrcKwHGvI/ThQ+prNKgWrtvDQbHFTwGucwjR03oMpPDUy8QK0YoYjSoUowNz4EB4+OYsnT8/gUY5jHj06jUdOz+Hs0XHMjwQYyHVsmylTh3I4o/3rTx+ewqfOTOHTx8fx+JFhPHN6HE8eGcMjB4fxwMk5zI4NIPJSDFVKuO/YFJ48OYGnTk/jwaMTePjoKD5zagb3HRhFETEmKxU8fN8hHJ4eRt7T7F1S0NNIykeHj0rj/lOzOH9sFgeGIpS7dURpE6FmnrIscerhwNQwPk38nzg6Rvwn8ODJcTx4jPfE74mTM3jk8AQqpO8A6XHfkSmcPTKL0ZKHfNxA3k/RTlqIShGOzE8zr4OYHR5AnvVV8kP4XdI/bWNqqIJzR6dwZnYEA2EbcbsKHeTbJQ5SB5oCT/Wk+jIeIL36fu7JnD0aDzhOUe2Zc8F+YnDKuX5+vfEpQTwhfrAZ5VLCM08pWgPfR+j5mGAd6aD6xbVdtImotrPpdFjX0rjL+CGFt5XF8U2ff5SfbRHTM5DwyfK698DVmTMTaFzvqlD0EJ3McmBBxA1sn0kTI3l3CPoEeS2fizE8WMLU+DDG6cJiiJ1mjFcvLePld24jiCLMz4yjMlBAo5PDleVd3NrYY3tOMRgkOHNoFNOTFTSY+qWbK1hZXsHRg7M4yLbgkW/fXtrG85eW8ObtLdxe30WZ7baY9zE9VbGzEtbXt3GcbWpyaNB4951b61hcr6KtZV5q6Ew3SNo4NFZmmiOmz9hqABcWtzAyOoHpoQJ5KocWpdeVG7dsZYEMPTpkuhzkUNFKkGYNOfKVZJKn2fl8nycfTU1M2EHjb15dxDvXV8l3CQp+grGRAVtJoYPQN6sxxkmnE9MjtmLh3dvb+O7rN3BhuY5rq3SMf3NxE7vbVUTE7eDcOEaGSowfYXmlhbW1Onk6rwpC0qxjbKjMykgQEwfxtk95WU7ruF80GNCqDuC16+tYqratBodYH6dmRzFQYN2SnrfXtrC+12Q5O8jFNeTTPZw/PI1jByZRjIhzs4kXX7vM+hzFsYmKGbjzhRAHZypm7B1jWYpspju7Tbzw5hW8c2MFDa8ACh5rRzJSim+cEdLxlDNiq331dUiC/bufGCwq82L9asuplH1MTpYIykAZf/y0Q3mcx4kDBzBaKKPZIq1GplA4fBJrfK5Hedu6TMSSHJHhQ8Y3JWxbNBrPO7mh7cj2sVQrcBIJzDdMUzonT6Qf01lQ2hZL/RUDmVosYNl1VbyA9NepHCsXXsHVV76DuL6FcjFvBq0XXn4FpZFJPPbkk3j5he/jyoXXyZeKx/KwnAqjp5j8Kb5eunUNZ44dwanjR1DUeVXEQ6tGtHqkv+Wfo7tiOVxcOXjTu7s3QYQwithTX+67/kZ9T3YI+r0IavOuJjP4GQPX6iT23g/yUyMtUsofmhrnx76WmKvRyumtiyUBYR0BXa/fcM7e98NmkEEGGWSQQQYZZJBBBp80cN/1Gtj3nt3FQOMAKdK1LYcMEloboBmqXqIN5tu2DYfNhCVIh2SKJIKU0nJ6/nErQZRvkvMQax52Toe4SunYn2ylt05dYYck+wUkdAh5ZZpSxEY6FLvTQl5KTM3U7nQQdfboqsh3iVui2d0c7zBJbddV7KYo8P1groZSWkeu2UAoY4KlpTQSpEkTQVLHcNxBuZPAazUw0G1iKG0gimt812Ca7jDuQNsvMU3RSKp2zVbv+lKoEHfG11YtAfFSuprJrfMLRI42n6GZ70qzs4tSXEUpqWKA/uU0Z/kW2w14dZZDKz3QNDxlcBJNEi9EM2a9RCG6DBe0GY8jO5+4a/scGRA04ztCm/FY3jhh+h2kHaYZBvADHZSrCpcSQGM9VZ6juE2as9px9a8w9swwtsc/o0nxbF69608DNnu9d383SKFqik7SVOc9BKI5y1DOJXjw+CzuPzyF4TCxA5BDX5jqcGyiJwVVjw8FUgqLr+zQZOJrqxuY3r0Nqjg5V7/OObA3fHR80VcWetYutRVQtRvi2lYLr93axqu3t/HitS388Yu38L3XF1BNfOyRLzf2GjZncnggwsnZIZybinC01MCD8wM4ODmMLuXJbj1GreGUiqaMpl/COq/X29hY38LK4ipu31xEda9uSmCd8zFULpuxVdvTyYinZjSQDzFZiTA3mMf8cB4HhkIUunXKLLbnQOsgcmh3iRfbyBWl16T8YhuYnRzEfYcncGioi0MDMY4N5fD06Vl89ty8pROyzXfTJtsrZQpZ6syRSXz56RN46vxhM24MBB4Wb9zE1au3UG/JGMm2HoSkGWy9i8xsUpijtoPq8i1Ul25h/eY1bCzcRlzdtS0EN3YbuLxex2ZTh3nn8ADxeejACA6VUhwqJnh4MsIXz8zg4UMTGPAoTyhzfZHKnJOPd4BlpBTDzZVdXLi1jppWkXgeHjl/GscnhnB0IMDxSoDzMyN46OQh5Cmfa5Qz71xboyyJkXSdkSWX97HTauKta0u4tLCFNht7p91BrVbF5Ws3SU8pjdmeSHwpEN2W6awTY6E+PsJt/+mnBeNHpc9yyzAFlqtD+aYVLkPFCOMjLN+pM/jUF38BJx57ApWjx3Hgkcdw5LHHMTE3i3IhQiT7hpbGackL5YP6JuuvyEc5M5y6vD4IzBjPurQVdPxT6WIiFLMiEtYLhb1NEFC6aaq2ElibkUGjsb2FmxffQntn3c6ieuH7f4b/+r/+f+Lf/e4fGC1n5kYwNDrKNGSUoQ/TCQPiwzrRKp+AiRT8LprVLfzu7/w21leXyWfqW1NE+Txa7PNs8Q7jWxX8pVE9gwx+tiFbAfIJhX0Rp7v9JxOC+oB9r/cdkOjWcs+hsIPPnD+KqXKIPDv4XG8Zplk3LZ46NUpVgSylXXXpunUdm/vJIIMMMsgggwwyyCCDDD5xwG95feL3bgm9b3yCxgsCHRYrf203ozM+3NYhLrx0SHrdj6XzP/ogBdOPXwkif9+2p5EhRCYWKYKcf08Zb7P2tVGN1NYywexDKq0bg2prlAQBgihEGDCeFKZpDtouxVY1MJIpJT2mQtdqt5F4JaRBGW3N0Q0KiLXHjJXLHUAbyRCS47jItiZhWTrKWThpBnFoW4/okGEp3KVk1QxjKec09tKh3jab18riabIunUZUDKO9+JkPMWQ6oo3PsMRO+jO9l2ILHVvJIZylVNX5KjGzj2W4CItoa895xjEldaJta+jPAHG3iTCUsUorc5ipziOQecmQSu0gX6380I4/Uigye75XGVztuZIK//5zv1ZVj31DhXzcOPOnAsvApdgHS7Hnp7zFP1oJIp7SGSYyinSTBMViiMHhITs8eHu3amVqm+LRbYnU5XhWnKL0RCdn/HB1YeXtvbt3Qe1qv525epZhSLSXo7/VL9+RloOFCMcOTmNkMMRas4uvv3Ybv/PsBTx/Yw+v39jB0nYDjZR85YemLM+HbnXTUNHDSDHCwdESDg35OH9oFLPjQ2aoevvKMt65uoRau4sDczM4MDkEO1/IZxxtaTQ/jeMHJnB4etRWnOzGHt66voHFtR0cPzaDcfrpkPxcGGJsdBBHZ0dwZIbpTwyitraCmaE8Ds2Ns016WK3GeP3qAnarDQwUSxgeLmFgwMfs1Cimh8s4PDmIkwdG8eiZKYwP59FJAiysbbg212ljtBTh8TMHcf9sHicmSjg6OWzxjsxMYn56EkPDFbRJz4sL27h6cx2HmN7RqQHkRAvy8wzfn5ybwrG5SRyZncJRXiUfbm1W7VDyYrGMaeI7OyJXxhTvjzP+U6dmcXJmEKMTA1jbaWObTgaQEtv1uWMHMFYpkLeB169tYqmaEgdtRxWgtr2JSa3eGCmgMhBhdmwcc8NFnGF5HzpxENOjxI0IvHV9B9975YIZmGdJ/yOzQ3aA+6s3NvDb33wBl5a2MTw2gamREpsO0/UKWNhsoaa6zoXw2RekWgEieaE2apxEviJOepLhQFzkZIXchwfNwVdnI771KOOTbh0TLMexmRmcOXwAk8ODiJiFeOL5N19HfnYO3vg4hicmMDIyRlwj1Ckv2jrTRfjIEWet/LBuRF7WDt4rkwTyowS5Ux6KGiTsqhLJKvYX8jd52tV6M4ZWWpLBnRZuv/Mqrr70beTqK5TnHaPTXrOF8sgEPv3Ml3DkxGm89OxzuPjGK+okrA0KP61qGxoeZaI5tFsN69fWVpbx0IMP4NiRo655sr0logmxUzmEqUBpqB9zss753LvQq9weJZzsFx/pWf1YtgLkXgR9W2QGkE8o7LcrNeVeY9O9NWpXuRp0mIWb0A+vD14dCDfF/uzJc3MYZGehfX0lrCWY9SGpWT6296+tDLFYTJcf/bxzuUmguDcZZJBBBhlkkEEGGWSQwScL7LueP/bdb8/u2gcN5k25xfd9pxUYvHBoIIMBxwZMQGEEGnP0nVaB/GjjhyBnxg+pqzVdW6och4+HxIYuUuVIvaNVFpqJ3YG2OzFVG9P1pIxI2ohCKTF84sXQ2hokcUoOrQzQ9FgdFpvzEsTaP91zucjoIMONDhWOpXhlWtoaR+GldJeCUAfsarVFTltbpYoTMd/QjB02ZYy4G8aiD599X0/EEwkijp+67Tax4hhL4yo6w4p5SJUijZlCc6jFX6ZBHDQ+c+cvyHih0HzPW80M1tZCWnnR4b1UXTYlLYkVk5ECo1dX2lHG06oT7T/fDeiEHvHWllsd0thjeZJOimIYMc8237k4oqBwM7L3nntPLLNwtTs9mGFKV8v7Q4Li9tO3ZHupiYssZ5UjkGHIXtL1/FjXqreBoo9KuYCdah3b1Zopq71A+/Rbjbjwhqtv41oprpSbm6ktoluiCnkPgqOR6COqqB6sLkQb+RjdVBNqXzEGy0UcOTyJkYqHHTL+uysdLNfZPvwB8pxWE4mcrgZjVs5eo41mK0apEKI8UMD4UBFzUyPIl0tYryW4slLF8+/cxI3NPcReHgePTGJ+pmLttVjKY3i0jJHREsbGy+ThwAwYl9Z28dw7N1CtJzh58gDGhwuIAoYv5zE2WsQMw06MFDE6EGBhcQOVUhHTs2PwIg8bjRzeubmB7WaM5fVtpEEJfj5CoRQynTKmxwZRGRzATivF4nYdN9ZZvp0WaZA3GaN2GQa6pgjZlmRUmGB+o2NlhMyn1k5xeWEXP3h7Ceu7dRyYG8Ph2SGTaVGZZRkfYdhBO3N1eLSAodE8amzBV7di3NquodGinGDZo3yIwcGClXt6okJeD7Bdb+PKZg3XNtssOwkda51HjLOnZjE6pLsu3rxVxeJO2ySPzlCJW03sVZsII52VEWKYNDk4QXqODiAqRljebuDdxW089+4Sllkf2g7s8OFZHJwsYzfJYakV4sJCDdU4YnwfR+aGUdJ2W+SD5Z0Uu23PzlNRE5KIlfQzDvKkiHd84HiK7czunP7opwE7WYPFT9h2U7RRLuVw/sRhHBobRrnLtxSUPmV8o7aD//Z//O+RDg3ixLnzZhApUNYVy27rvJ3dXcpi34w3Wjkhg43TlwlT5yyj3oPJRMk/WTjoL9kjyawzlFRCBfIoo/yuM0AYJbSiEA00Vm/h4vN/iq0bbyFK64yesF9hHTH83OHj+NTnvoCp2YN47cXncenNV9xEZGYgg6/609P3nbU+TatvtNxJRpHJ6Rmcv/8BlCuDPZmXt7bax0XUdoYaOWHah/27ewtMOPHqyu9owvo0P8k69XTOX5AZQO4NsO/TzADyyYR+u+oLvb7Tt6JAletmzahB6uOev7zX8tECu8lT0xU8cGSCQllLxDWgYGx9oFsC+hCnkGAaerQOwnqHvlBVYP1kkEEGGWSQQQYZZJBBBp9McModB2747sB98dtXv2nnOVLoOadQ1jsXrg+mCO25Px80R9U3JbXNytU2VOadc4cPcwyjMyBCtDlW2UPUbSDKOUWD4mjmrqd3ppxyYxztu66Bi9dtM67GMc5QkvDZlFhSfim/NuM57Z3Lg7fdToLQz6PNYK3QQ4thlXsqBVsuYPoeUQtsb/+WlEzaiqSfr6eVIwkC5Zu0eI0hk4fhKsOMFPEqK8vslGSKSToxDzfpDHauiiiiN8KTqZIGzI/4p13GZHk0XsvzGsgyImWZH5lBJmH9+HnmkXRQSB09OwFIHSbllZBoizHm72Ztk85MAxwLBhonymDk9+qT8bTiRP59nnC1rPrsvRfRBDYm/LDQVxY5J+jf27P4i9kqZ7fllviOeYtWCkH+GCmHGCgXsVOtoVqr2/jVJvIZ1XUVDRnP/AhSkioto6XKYAnfc9CvT5LTPRtN7c7qVwY1oyV5VjWg1U75fIBW0sDtjRpurrawuSeFe8D2wrahrejIC6KoVmppNcjKZhXLmzXsdVLUO20s7tZxea1pZ3t87+3ruL7TRjsagDZsGxjSyoUUmzvbWNnZw9peHQs7NdxmnJW9Fl69vopvv3YTG03iR34fGCiT9ZtY2aha2JWdOta369hQ+J0GbtzeYDkoNYj/+l4D1zeauLnRsJULtcTDteVtrO3kiFeKvdoey1LHjbUaXr68hucubuDScpV4a6VWBG1b16RcuLm6heuL26i1Yuw0Ymw1GsyrhgWm/c6NKl6+uIjF7YZt1RcUfSSBh5tbe7i12zRjygpxW96q8Z5x9pq4utnA1fUGqmmInXoNS+vr2K7F2IsTrDPOKsNcWNjASzdW8O0LK7ix1SEf503WSEZUSLNap4WFzTquLLEMjZT1wXbP9q02opVRi8u7LF+MpN1hHntm3Lm+Vcdz7yzie2/dwnIjhyry8IpDJhe63SaWWC83NunWOqzvPFpNyWQf280aduMUjW4et1ZqxIBylTJH0kwKdzPAklYOXAvc5ynX1n6a1mYyPKHM09aBXoyD0yM4ND6CcpJDSPkl43OX3JeSR1968xUcPH0GBw8fRoVt38yiMv5Geaytb7BvYR/C57aWIkm53ZN1ws9wNNnsQL4p5XISuLahg84lmzzyRldGD/YJOqyeqTCs+qYYRa+JpLqMC8/+CW689n3bhjCvM0sYv0VCdb0Qx06dxWNPPYPxyWlceus1vPv6y4jbTYcLs4hZpgcffhQjo+NYXV1Bqy1TlwwjPp7+3DMYGZ+wfsmt8XCO2BnGjvauXvTG2rTd3Yvg6N4vv+giOjmasM5Yl+5tZgC5l8C+I37tn7+x39Iz+MRAX9D1Rbb79FDjtYsDCWs2Sn3cG7DBSkQPUzh/5eHD+PSpSeQ7TVvuTW5geM2goijnBw20LRYbs2b6aG9bW/bNMH1x6/LNIIMMMsgggwwyyCCDDD6Z4CZKOeDwXdtB9e4Fblyh0YP+CHc+/3lj4wI38P/JQfvz5+AFkR2mq7GKck6koA/px78cxyJBTnObO9A2SCmzkhI0CUocuWjLowRxs4HIzzM1zTT20dH5G1GMVDNuE8bUOKikw8ljls1HyPGMHyutLlKtGlB5GEeK/yhfQjNuoxNw5BME8NIc8dHYiZiRLsQWbhUJ8RE16CelugweLARd4owKRFTDKs3O7WjLqlAzdWVMkQ6vzVTapKsyZnqkAUOY8aTL8nZ8hvML9A+IPyOQLkmX+OVYYo8YMJG+Al9l0+HRSismLRgDhTZHaixPp0gsGa7b9BAFRdu6pUscNebLJW0zuEjRJqNO6gdoqaK9wNLQShSVhT90ql/hqrGmxoO6Z13JkGDvf1LQCFLxXFzVulPfuTz60OO2Xlj+5pwSykKRuJq6l+TzeOPmNv705cu4vd3BXq6AmGWVIt4ORO+lanv/s/51no22WTI+kv89CHfoyV/b7swI4egu/pYBRMphrUDQAeFo11D0xTcdxAzb8UuodlgPYZH0JEd06uQZR2kp4VMvYpptm2wZ2lk85GvxCttFTN5pMo80qKDLeup0Wih4MUppFUG76nAh73fY7jrkx3wkIxZQj4lLOICk00Y5ZN4My5ZFWUBuJg+HvTanFU4ynsr4qIPFGyxHS4r5whBafB+wmKmMn+SNUPKhvYvIY7xQhhvmGQ4ynMVmW/PZRtSOU7Zblkxl6hk3xUD6YybEoYA248joIhnipU0UoxwaTeJHfPJkw1xap39qM/rTiJRkvEbM9ElDL20hMsOpTEqUJ9pKifwds723Wa5qroRuVEEo/YxkW7fFumjBZz5S5HU88ntYJs9LlkkdT5rHOjOnDbZ6FJh2yvsm889FBSSkR5t13PHKpLPK6lEmxsjHuywvRaHHMF0p+IWLttCrse20YFv8RWXsUL4EhTJpoNV2Tm5rC0OdfSGQnkgrMqQ9UtvWFnSqV8dxHw4kSxVfhu3hAR/nTs5jplLCoIwQlIGJss61Ee+t4r/5b/4fOH7+YfzSL/wysNtAsTSM7tAEdshPb168gdvL60jYX4jawtLTuSImy+iEohmHHYg2iQwgfOGLHj2Dh+S6VmAYu/I3oEzPs0608qO1s4B3XvgWLr/4XeR21hmH0oh5iJ/apFmT7PMLv/q38Hf+4T/G1IFD+Npv/gv81j/7b7G9vsK0ycsyRpNPfukrv4JT953Fb/7mv8atWzesrg/MzeOf/U//DGfOnWWxRRS2BeLSp61k8j79rQc1XFUP9yaQB1l+9dMCGahEI0cTtjPxpqjD9i2QrrPNNnltaw//8uuvY6ldQpvfG2rzRlnrU9js2ZdUulV8+uQovvLkGZQoU7SbjkCTLoxbjZlcvWTw1wvYV/Q4IoNPPKi9WZvrgc2+0seAGjYboT5mzRBC4VtgRz8/NUJB7Toq7UNrlm0KBHVXbLf674Hu+k6QNegMMsgggwwyyCCDDDL4ZINUJHe7/fGEGxfIRyMJveW1p0xxju+kXLBYHwa6dlaFZpBrRUIoBVsSmwGBwxQkrQZDAK1uiGY4iEY0jGpQ4T1dqq2zPJgq0NOmUzkEwijuMK4OTS+iHRSRBAVTQkqVr0OWpeaSkjaJSvZeSv9cGCEXMXbEMZCUq6EMJDlEcZeuzfsmfJ9jqIIOgmYKxLkgxWDcYhHaHF/RScHelfK3zHQH0QyG0IoG0AmZf6mItBDRP4eWaOpJsRyYosQOzCWO7hwS5s2yIyReuQgdKSk5TG8pXb9g26dIEWjKYZZBW1qlIV3SNqOKrCs6HD0tMC3m2+kWEIRl8Acxk81FUirHzEczn3VuibbU4m2Q50vNdHVnsWh7F71z3OBAw0fT51iN/OWCOEsFk1HjvemLtzQulRJcddfnOw1vE5Qj1lOnjZPTg/jMuUOYYVGjRMp4Foq0UHIyLknxLN7QVmjSGSb0uzuXew969SrdgChhFSunJ9JZhBMfkFhSFCLMo01+bHrkS7p6Qj4lT6lmUrYPBde5NtoCSbytdtZh+HquiGqujKo3iBrbRCsYMOW6x7bJloVW24MfsZ3kSthLy2jkJ1EPJtHwxxEXpxDnR1FDie8Vh22EdRpEzJ+1ucs4jcI46uEw9uhqvK9G49gNxlDPj2PLo6wIR9Eq8plhKWGMf6QX0SHTOgg9Zbk6hSHUwiHs+YNo+xW0yTqaBBr54jRnkFR7F2XMJyyhTvwbvDYLA8yzxLwiVIlfQ8YXtTW23xrL3iqMYI8ya5thtxinWqRcKA0bPmqb+TBExPRt5zo+x94I37EslB27pFstIu7BqJ37o/pJyPMd0rmTL2GX+VWjQdSjChK2da2OkLE4l7bI3wzHMjRJqyrjbqt8+QnSdwK7pHMLBdZvRLmrWew+oqDEFkMahWPEm/JLKyq03aDXZFlSbKk8pFPbz6NF+uQod+KYcoSy1vRL6gb4dzdoRY/4Q3gbd33YLqIHWnjhU37KCDczVMbkQBl5+nkyLjCfhP2GVslpFUatuoW129fxzqsv4X/9F/8zvvHHX0Pc2EMp0Nk04yyvR5YnfsRdq1jEV/sgOXTnzpwmBMgopa0VJXc6dG3SWwY6nU+lycPqv6KkgfriJbz+zd/Fhe/8IbzqIoo++waynUc+ybHeZGBWg5maGMfIUAVxu4WBgRKKhZIZ8sie5Dm1QaBYKmF7axutVoe0pgf7g9GJSbYB1pofIoykxROiDmFn9GAFGcUzyCCDHwfZFlifUHB9iX7dnRuk7IOWP9vqD48CXq9kDJGQpOCeHSniydNTKLNT1+wORaXcJTfwA4FBtA+uzf4x0c+uRR9C8rOPJfchcHfeGWSQQQYZZJBBBhlkkMEnCfRd34f+d33fx137Smc931F08eJmOko1/eHBrTSIEdnKc+bCcYpWNGjbGR1wnORL2Gj7uLRWx/XtFhb3EqxWO24f/yhgFO3xHiJleKncZDDY7Hh4Y2UX1zdrCMMCyqU82p0G32p1hm8zvG9tt3FhpYaFRspwDSxX21isNnB7p4EkKKJUKMKLgZC4SXGu1QZVBLi6sYtba1uoM15lRIfUSpmmlRddpF4e23GAy2sNpr2HhWoLS7tNXF+v4vbmHrZb2sbER4V4RxxPxbkAiztNXF7cRD32bJshbWGjffmvrWyhUWugmM+bn01OYz6qhy7zWSe+V9d2UWVZS4USbjMP0efqdoxbOzXcZDlu77SwvFPHUrWJ29sNbDZIu+0atndbKJWHSGcdHJ9H0vVZPoCvcfXmbVO6lYslhHyv2mcBrY5ljuhPlhM49eCHARfrDi8R+vf2q0Gp3Skv5xwO+nN5ykiWJFL4apybw8jQIILAx/pW1c6ggMpGp/GvGYgYz7OZ1S49pXGvwp3S9zW9AnqpnZO5TJ8aamUD26YUy/aONIv5Qoa3XFCw2exaVaP68ElnGT9kwLNaIn9YDgqj1Um8SqOgGfN9v4T5aMcJHVqvE3XcmaMycvlqpYhltGS6ps5l3j7rVmmyldmz9BIy1rVYn+QA4kQ+zmnlhOIzzTBCKyH+jBVETEuGBpbHNw2zcNGWUcyZ8kHbVunUBrflFfNSeTXrn+1NJVS+mvctVX7qMU3jR5aZ+MlYKJxJMaOX6UgYRvPFdSi8ZpSLn30trWDWSay4OkuI7dpjfMq8lM+pV+CVeDKsmpeZDfw8b8jHzEst0VahkYc7rIdcqHUeTJLvlIbpbRRH+SoLn3Qgbm3SWatTtNqhK0MJ48vfVnExnmLJSKjVBYqnMsj4nLOVHaQTn7tBaHWsjZ7MSGsGUycPVH9aeWP1JOW++ZOTjBbOaKS6ore9s+uHAaYhbqj4HZyan8ZQMU/ZzPKqPlkW1YN4qNvexdd+93fQpCyfGBnH//GHXye7FfDwY0+QDwoI85GdGVRr6IwX1g35UatyVFa3FZxoqPxESdWrtGDkIRJHOjQZ6T0GVsk0qViGj3y3iXyniurNd/HGt/8I1157DlHaZL117dyRfGUMx8/cz3ghNtbXLfmnP/M0zj/4CHnAw81L7+DNl59DbY89DMMobxlbHnn0cVy4cAGXL10yPGK2xV/88pfx+Z/7ebZPHUIveeZ0cs5ELPzVjlgGpaEfgRiqf3/PgWihsrvyiz5We+ZH+vV409GNofmcbYH1sw+Sd5kB5BMKdxpYD1xj3gd1QF123vr4s+aqJeXs0LXk+eSBCZybq6CoJZ18lnzQjJgcPzisO+RzvyG7Bu9b+tax20wI5XUvC9QMMsgggwwyyCCDDDL4JAM/+AX2Oe8G9/1v+zsKFF51t++kVLDRwR334YBxbaawrlIOakwiZb+PFlNt+gEuruzhpasb+NZrV/DsWzfxxtUVXLq5jp16ila7g0rewyCd9GDQlje+h2cvLuEPfnAFL11aRhTkcWh2EGE3RZHF04zfzVYOf/buOv7gxRt4/soOXrm8grev38Rrl2/hzRsr2OvkMFAqoxxFtvWWJn+1vQg3tpr4/effxrdfvoK13Rizh+aRD902MWYk8fK4ttXB11++hm+9cRtvXt/Aqxdv4fVLt/Hu9RXcXq2iWm1hIMhhuJy3ra5euHAd33zubTRRwIHZCUSFCK8x3ndefBPVrW3MTYygWC6QQprERlxYhjgX4vXLS/jj5y9gp6MDmYfxrWdfxR8x31d0GPO1daaxijevLeNN0usH7y7j3Vvr2G3mcOXWKl556zrypUHGGzJFQEeLV6IQlxdW8Cff/DY2N7eJyxwqxSLruafUJXm1jb2rfSkb3Z38Pxy4mI6z3FPf9e+0k4GyVF77B/v28qSnZsRrNr+pxvl+fHyU9Mlhg/h32rEpZvsKWil2dSg/g1m6Lp97FXrt/A4RjMo95Z5oyabEe503ISW5FL5S1NoqDzMykH6kp/QEMqLJ2BTLECHaKjnNyteNJUXOZTqqQx0krqy1FZ2Uwaq7NG4yrRbbj9oZ/dn+TQkpJJiIth+y82+62rLOnVeq7YSUl5q8tqmT0cKdjSFltfhD91J7MLz0HrJBJNryjXGZvielN9u0JtXHfO50hb/H7LSBXmrGEq2SMuOGZvgTAvGfJ+OC8GTqKRNNmB79RauAaekclHwgRWkHnbTF9OhPZ4YXSwPI57TJlbbKkrFDRhwZKigLmJ5MuM4Y1Du/KCFOMUOrDsTDTEO6GAvHqynxpJxlfdhh7YapwjEkcZeRxhlgIj6HzIMUMwOIhbD2IPw9rbqzMyqkM5KcYT5xQhzUstQOVaVuxUes1RBRQZjw38kFm3DL/CUXBL7SFI68il9sC3X6992HAeHrsV4OjBZxbHoUkQxppIsSNGMO81DdxY0d/P7//ltoVWv4z/7h/wWF8gi+9Eu/ivEpnZlBnMgvUlUvr28SN97L6sNEhL1ycfgpXd2pPOQJ0jeQscjqQG0ihs5iKvkJymkT2F7E6oWX8Pp3/gi33n4ZA0RNtVGjXM2PzeDhTz+Dyel53Lp5E/XqjtF8ZmoKJ8+cQRRG+O6ffA2vv/w8UhkbRVbmkyYJxsbGcOPGdWyuryFP+VwsFfAP/v7fx7mzZ1lflGUMJ/kmzhHPG82tHD2wou3Xy70J/bp0NZsZQDIQSHbey63iEw13ibgPBNattT0nvtXgKSDVYKMAczNj1mFKmFsHZQLCiU53dam72V19FtE949irfieRQQYZZJBBBhlkkEEGGXzywI0SPtj1QR/+ztlYgk6rx6Wm7CsOPhzk3B7+MnpwPGKHknOcYorWQoSXL2/ga995A69euIqxkQE8eOoAHjk1g1MHRrCycAMvvfAD1Le37AwQKe00W3utneCt28to6MCLsIx3b69jbU/ba+VNYdnuMFQ+QhpGCPI+5qbLePi+STx8fAZPnDmKY3MzuHhpAX/y/BWstlPEOmTclHghbi3tYGmjhWRgCjfbIV67tWm4Sr2XpjHzT9BhEVrEJV8ewLEjs3ji7GF89sETePT0EZR8HxcuXcHL717HSqNDPDimIuK8o4vQJM6a1d3xC2j5Org84HupU0T3FL4moHVjVlnOZsi3g7KdhSKjzsmDE3iceZ1jOY4cmUdUqtihv8eOzeHRs/N47PQcHjkxiQfPnkJ3YMQOol6ttax8OdJaK0pee/eGbR128r4HMDQ6yhzduNB2ABAOHC+6bao035v17gaEPwX0lXOO1/rldI55KD/Lt69Y6odxSnVfW4JJ/adtzxhnIOji0ZOz+Mz5o5gus17ae0SVvBqwjDbBz2eapGEq/O9V6FOQtOcY37Vq5/QrY5+2gNLMcin5ArZJVXNHCnAp+VgnWhXFVmsz3KUQ1pZJsRTEnm9K9ZBxgpyU/k5GyAihytMKEqkVfCkdWaXKX/Voege2Ma3e0KMUu267IYX3KSO0QoJ1yKtS7DBMKkMJn21VD/FME/KA8hRuvHbZHqN8HgHbuXBX+XReTjNObFVEzgwwgdZ9sDzaNk+GDRk4nITTuTgB89AZJ4LYcGSeMl7kikj9AboC77WlEYsgXGPSgY2/m4gOzJtx/KTnT9fhfYv8l5AGKWmns4XE2lK/qxxqClLS6+wiCbSU7V0rUSQDpKbNkSYyhBRIc6/dYNqxbWOlFSIyyORYmlyuYFexeCoDkOpMRFX90N+T072U7QwkI6LkllasdHjthqR3yHJGRdJJdM+zHpi3aJEvsS2FrCfX/hzXiGccH1kl3w13HtXG99v5hwHRt8S8Z8dHUYh8s+/Yloa8kc5KJMuzPvZ2qkiabbR2d9FuNvEb/6e/h6MnT5uRRjyprQonRisYLJdNltmqHaFmlehKsQ/u2UpJ1HPka50fpI2nKmkbY61djGzfQvX17+K1r/0rbF97HcVch31Mgr00j6EjD+LBL/06Tn/qC2h7BWzvNUgr1z5e+cELuPrO27jwxmt48flnUd+rWh2JrjI2ih9eZpj1lWUzrreaNTzz9GfwwPmzyLN+ChHDqNDEQ8ZBtVVbddMrgrVvrfqRzMsggwx+CKzZZ/DJA3Vl6qj74tp9mDr57T5QKf704cwwTnLrP0WRH4gz4xTArHlVvs3w0EvNiOC9+9jmM52i7QM7Cl16fv18M8gggwwyyCCDDDLIIINPHuhbX2MKzYo0p3s6NxKw0YA5p2Chk4rQFC7ysyQ+FCilGIGtaNCIRPYPKba6HIfcXG/jhQu3sNlo4ezJg/iVp8/gN545jf/4s6fx60+dxhcfOYFzR2cwMzKAIpHQdiSa0X1rvYbNvRomR8oYiLrYqNZxbbWFjpSS0DY3WmHSRdJpYtBv4onDRfydzx7G333mDP72p8/gV544i+Nz07i9s4e3l6poMnzihdjYbeDW7VUUwzLGJuewxcyuLK6h1pByMccxlWcz3DUhPuA4a7Ts4YnTM/j1z53G3/rMGfz6Z+/DE+ePIV8oYa0eY1MKUeIrZXzEMmv7JqJFDxIhCNAhTWzrIJvqLlUWvRnAF+62H7wUsgybS1D2Yzx9jnk9fRK/8flT+LkHjqLCOqrkUnzx0cPMm2V76gQ+e6SCszNlzM5OYquT4I2rS9hLElSJyM2VKhaW1zE6PoEjR+YMD0u/B0JNA8w+LxjHmOeHg35K7p5wJ6v9PDRm7Ycyp3Guhdb4lvVIxtVBwFpNIE2yH7dRIS0fPTGLJ+47hKlKaOfLMBn+i3JOGWjnFiid/eK9F+4qWL897Af+KQr91wJcecz1yuYo6kqoomv2uSwRWjFhh5zTk03SWFMGuDxbrYwgkgE6rFmGDDtIWjwjpawIzhSlmpbTzHzFNVZOJEN0I8MA04+K8O1MkDzDaMsnn3zuIyQ2ORku2lLUKzmZALRFHNtwzjeFvCButU2ZL+U20ha6Oqw7JX4SJmkHnTbfM7wfMsWAjngmxDuJE3idDqJ2zQ5gL3Rr8Om6aJsC2tZpkA4heUqHG2uhgIwv0MqNmDIroVzoskWKJ0krLaDIs80GOlujG7E0BQSSOeJPFt7OWiWJzEzqddANE5Zb5hQmHDP9uGXnjoQMY6tvmF6HZWrlGMPXFlNO5kYkWhEdyq4uyvQLSCPtLZbT1l/MTytLctrKS4p2pu0MPKwHM54Q/w7TIL59mZnTKhyd8cIyx76degK2GOYb2Ko3nf3SDVg3Mj6xnsUzxh9EWzomMz4RV/GB4yYH9PpLA6Up+o4OD2JkqMz6FDVkrJJhinnJ0MS66TTbaLK/EBYx631lZRUtyrZas4O2+IBxxDXFKMTs9CRx71BeK3Xyzl1t3nJkWV0PqLcJ2jJwi2EZp0geO0AczuW7eCjfwXxrDcHGDRS7TfInZVFlDAfufwoPf/lv4+AjzyAuDmNzdw819kuS26LT4q3r+MHz38P/8fv/DjevXra+T21EKzuUq7b4293ZRrNZJ56xrW77G7/6VcxMTRKHBK1mw67a6UXMojTfC/KREcSVIYMPgr9MLs3gkwaUhhl80sBEnTohVp/7QGVHRgHoswNy4k5OglGNWzOX6PghHXipzYqZCF2nqNrX56VuFE+zBORcii4VDRTcnXPuN2ObDDLIIIMMMsgggwwy+GSDvvrvVpRo7PAjnAVzYTUe+GnAxhRph6MUKU1jpFJK0lfjmjeur+L2bguHD0zjU2dmMV0KUOD7qF1HBU08emYOTz50Bnk/gZ1P6Edocczz5vUlVJsxTh+YwOOn5xEEHi7eWMJ2M7FVITo81mZrJ262eBC3ELQTFOMGikkTw4UAM5MTNuN8aX3LcEmY9pW1XdxYWsL8eAkPnpzGSGUIGztN3Fitop0LkaYcZ3XcGCphmh2N0PK+5pZJP2VGjog/Or9De9J3GV4GEJ1fIEW+zeIlPWRUgpTEfNL2O0ngIxeQJpqt3WUizEsT26QwM0WpFKBJm2O6NsJWjeXQnvRSesbwOi2UcikCKT/jJuJO27YLu//wBAbCLi7cIo2bKRYaLbx68ZrhcfrYEYyQ1tquRyNAEot1o7Hffn3L/6er+T64VPsp9seX+3yldy5/dxW4dwolBbcpl6UA9UgvKatJi+EgwSPHJ/Gpkwcwne+g0N5BxLrVuZjdXB6pVgMJTFnvymbp6l+K0G6/zD18RGfeuyeNvBXvkwquVM6pyPqz9QV8JR/6W3vqmjFDqyZi8p4ZBTy3IqlnkyMlRDnNrCc/0l+1KD7tc4flIn5mm1AjcNv1+Ma3Up6rzcsA2NVB6j1Dh9Uy0yPnsz02MJSwvbP+Cq0tBJ1d8nSVdbyHfIeuUWUY1i/xLGh7KtZ9LgrQpl/QafJ9DWXyfIF80u10mHjHtq2J2lWU2mrvDcqUPRS7dabRQMj088ynyPdhaw9BU3nwfbuGiOGCDq+MV2BbKnSbKKd7GOxso9zasHh+a4eypIawSRxruwjbTcoY4kLeC+M6SmkDJZYnxzB2eDfbqFZ1GV2kGG8xfGOX6dRMLuVZLm1N1WVjT9gOIz9mmrvA7gaCxg7D1iyMdD+BjDykt4zUWhmilU9iY6sDJywoi1RforBqilzco7fEikD14pTp/GP9eCFlE1NIGDCRMUp1yaSMP3gvo4f4QH6uPl0rVq6uHSthpeb87PIhwFLzU4yPV1AsuLabULa5FTu8Z94+ZWtMWu9Ut8lVXdvua3FxCSn5KqLMbMVdsPuw1RsFvpsdG0AxIv45besl44jKJDqrN5KpOeIz60V8yzz8SOYk8hl5YzbdxYNhE09XPHxhbhRfffQhPHj2QTQwgHDmDE585pfxyFf+NkZPnEWDbWavXkWnSd4hPTvkwZRpilwvPfc9vPbC96y/kNFf562o9WillVYCBYXQjGYq41e++lU89tjjKA8MsD6c/MmJb/qGR9JaTrUnvZ9VCp8+NNF/ZkF0udtlcK9CdgbIJxDcrA3frvo4lcjzKSHVt+n7xb5h6Cchq49lhdXixrLXwWP88D0xOcyPAM0m0HsnBHQvgexmd7G7sXTk4dJy3ZhAv32XQQYZZJBBBhlkkEEGGXwSwRRe9vfnfOGbp3tr45Ce+7BgIxlP4wtt5SJFYADtMV9HgO+8u4wbGzU8dd8szk0VEXJQolm+fqeFiHGk/AkDjXtipuShmctjYS/GN165bFsePXP2AA6PD+Lt60vYqtZxeGYMQ+XAVmc0kxyur9awurGD2YlhHJwcYfpSawdoEYeFnRhXb69jdnQA5+eHsd1q49nLiwy/hbNHRnD25AyqeykWbi/aweVHZidQthJ52GnGuLK8hbVWakqsRnUbS8vruLGyjXdub6OWBLj/+AEcm6rA94nH8i4WVnYxMTaE41ODqEQeFjabuL60gXLew9ED4xjIcxwX6xxH7eOvmec+ljd2cXN5B8NDgzg1XUEl1NkBmsGdx1Yjh4tXbgGdNh4+exADEeN3E5s9r7MCSAbs7Ozi8nodVW8I1WYTF965iCOT4/j0+TMY8DULP2EFdei0IRBLpuGi1XtvjEnnOObDQS+Ju6CftgwOPb56f/L23ONT0lZjVqKlEateWNnsXdpF3vcwOTJkSub11RVTDia5CB0dNk1O0hkLNoOaiUgJbIrg3vjXlMDCgXFsz3fyhtI1FSPDCBzfy33ywGEuValTl7q2f1dt8sboqjKaYqCnATAy69mHDra2lRgM42gm2qlO+N589lPvx3c8RF8FVxx5k89UF1Iym/qWdZJnu54cLODMfBknpgo4Mh5hdqiIkrau6HaQ91Kcmx/BiekyDo4Nol7dg53bwfjari4f+HjoyDBOTBQxO15CrdowxXPei3FwpICzBwZwdLyC+fEiJsfytuWX6rbA1vPgsWkcmSrjwGQJB8fLODRWxvxEic9FHGR6R3g/XGQDils4Tr9zs3nzm58cwAzf63qE8mp+PI8x8p+2iwqY7okDQzg1O4D50RJCL0K9nYMO8Vf5tWxMOpipokd5M4jjsxXmN4BGrYNW2xkgCmHO4p6YLeAk389NDGJyeAD5qEB29W2bLztDheUQjbXKSbwthT7fsK5UG47WamemOeI71YjytpqSHogvXT0RJDNcSGMDwV21auojyRwG3/frvX//3d3XnxxSjJAfjs5PUM55CNIYjb0qwpB08yMmLL6QfExw9eJbeO7730WHMnvu8DGcPfUA/CiPBsvWitsoSLaJFizkdmMPG1phwfiRrAyUC23Kf2115lHOyvih1T96o23A8ryf8po4E8U4H8SYTRuIyAfewAg2S6NYCydw5Mkv4+DDT8EbnkCLBPLJc7u3LiO3vYq5yWE0mKfky9EjRzA3M2NGkT2WxbZS9HzWc8h8ZUh0Wypqa7Lz5+/HP/4v/m84fvyk8QKjs+9g2Ym3no2yqgfmd7dc2r+7l0HMfBdN9Gi+5Bnyv65m0COdBaJjdgbIzz7ImJsZQD6B4AScGq+e9HHKiux9oEmGmxxng9ZBXxLakpY+O8YBr42nTs1jbrBIMe/i/eQt1BJ3txlkkEEGGWSQQQYZZJDBPQR/GeMApiGFg00j1r7nIeKuj/V6F6/c2sbKdg2fOj2Do6MF5DR9N01tZYNWUzQ7bXhhYEpvrSHRgekvvHUbV5c3cPTgND51bArDxRA31vewtl1FxHCnjo6ZwaTFpK6uNbC4voPZqVEcnBsiGgHqTOfmboK3ry9jd2sLD5yYx8GJAm5t7eE7b15DqVTEk6eOYmaoiKTTwLVbi2hynKV96cfzOeRDH1t7TVxe2sLCVh2LCyu4efkGrl5dwKVrq1jYaWNkegrnj03gwKDK6+H64joWVjYwPjaCw9PDKOY93Nxq4cbSBoaY5vGZMYwUfERdV35odjLjLa1VcW11D4NDFZyYHkAlSExB08lFWG/mcEEGkLiJB+87hKGC9v1nXJGZV20B0w0ivHV7E0ss2+7Wrk2Ke+LsKeJQYV4yESQcS8asH6fGlFLUjTI1BuUPx6F3qcz/kuAvmB4RcCENkfdE699qZUGhEGJkuGLK4e1qXbv/sExaccMyybBDnrDw9tM1pYge7CBuXuUt9a6mEDrllnvvFGF628/tXoJ+ud9b/vc+Ce4OczevkI7kKVtZpbZPWuusG9E27Gr1ThuPHhvFk2fm8an7JnH24BhOz0/g+NwEJlmXk+NldOMuzh07gKfOTuHE3CDqu02s7lTRZv2FrNf7Dk3ilx6bx/3HxxCyzV69sYKCx7ZwfIrpzuHpc7M4NT+K04dHceLQBIbLgxgdKmAw8vHFJ8/g7OFx5jnGvEdxXuF4f/LgOE4dGMMDh8ZQqYTY3azh6YdP4YnTUzh2cApHmecpTTA9NIozisv7iYkhrDOcyvX5R47jqVNTuH9+nHKkzDa/hWq9TQYr2DZ3+bRp77/8yEE8eHAEpw+M4irlyOpGle2/i0coM548M4PHTk7joaOTOM50zhDPCbb/4UoezVYDtZZWnpFTSVfR0zPjZWLGEHGteHlf79N3Du72cc6Fde690A/zfvhh/32fDwr/FwWddXF8dhIzg2UzflD4Ymd7C/l8AX4uNLmknaxy7BMuvf4q3vjBS2g225SNI3joU4/DKxfRZrtfXFnF8GCFCTp1d5VhVmsN3vk2iVhXGYy07EJpKl+PMlAr47qphzKDTOWB+WKEScoWnT+ynORwpeNhrTiKyvHzKE4dQivIIyZPp7GMah6qt65iZ/Eajh0+hN3dKgYHh/Frv/a3cObsORw+fgwrG2t2qHuFsv3w4BiCRhNJvUZcuhgcHcb/9b/4x3jmsz9nRg8ZPLTqQ2eFSF5pezfJ4n1ay2WwD+T3u2S1al53agW6yQwg9yao7biazOATBr1WJeGntu0eXONklerj1BmFe50gO0Dtj1mhwJ4YG7RQtvojgwwyyCCDDDLIIIMMMsjgI4Ucxypa9aFtiQroSDmtlR15nVOYgBfUGzE6SWjKH83c1YqRrmbv+25mc9wNGbeE5e0Wrty8bbPDTx+ZRqXMNKIcjh2fkxYb15bWsLjVZn7aKCaHjrZvYRq3N6p49s0bePbt6/jeOzfxZ2/cwKWr13BgOMSJuQHU2wmuL25hu97ByNgYpqeGMBgCh0cLmOH94s4erqysoxv5dsixDm5OkxjlfB5nTx7G44+cwsMPn8VDj53FwSNzWN3YxDvvvovd6o7NemfphQ3LnSImnm26OCdFC7HkMC2ki1LSguM4n1fNSmZQ5qORnc5QkVpTCnudg6EZ3XrWyI+up+hTOn6a2sxibbHlM4/Z6VGcODyPtFlFbWsNB6bGcPTwmJ35oK3IlILGivvw10ibQ1SkQLc1B6KVldmV2712qxFkxCmFPj77xEk8ct8cSukeSvEuCmnDFIlSWWk7J60m0Rku2h6tm9PmS+RD0Z8pBmmHrkW6sZ4YVgpSzRA3psrgJwbxtU3UJPlkANE5E02vYHTNpW2cnangS2en8NB0iHytge2VHaws76HbSnF0powzR6ZQoix467Ub2NpsosjEzs1PYKgQIkg6GA+aeOLoCMZY7xQOePPCGmr1qq0W+cKDh3DfTAndvTpqG7vYWa0CzS5OHRgwY0IhCLC+tovV1U1srm2gu7uHSruNcjtGvNvE5vIO3+1hd3XLtrEKbPuuHFqtHDZ2Eyxv1LG2tofVlW2s0+1t7qFd2wYau8h3mA7xKbU6ODwY4OhEHgU2RMkjtemJEnBqMo/pIEGl2UShzRadsIWTVx84OIyfOzOJc9MF+PUWNlc2sUcXNts4PhHhweMVDOZ1egdlJdPskJe1LZR4NiT/hqSLZMcnVe8jeTeaj2yVXUQ+qdXa2NlpICZPBNrWkHQNyQdeJ0VtnXVaZ4RWgqWFW+iElPnFBGnQxfZejbxGaUv6aDOsSnGI9UiejCXt6CfZSBdQHtj5NpSFiSy/ZKXQtk700GRdr8cBrqQFvJwW8Z1WgGdrXdz2imiXBsjPDK8+ijSP2LeVGKa6VUdpcAiHj5/AxNQ8jhw7i9mjZzB/5n7c/9RnMTQ+hfGhUTx56iz+5pNP428/9QWcHJlGxPL84he/hJ//+S+gUGAP0N/6im1I4AwgdpvBXxQkxNUr2pXOrhnci5CtAPmEgn0cs/HqI8/JW0pBfkyk+uDtWSgZyPxDDhZCtHB0ahCPHJ+wj2l9Kr734zaDDDLIIIMMMsgggwwyyOCvFqR00iHoOV+zeDkekUKRY5qgGOHGeg1rmzsYCHKYmxhCmX5avdBNmhy5Ml5UYtyItzk04xxevbGJS6tV7HYSVAYHsVtt4DqfF+oprq3W0E4jFMICDk0OwAs8vLNUw63VLayvb+DalSVcuryAxaVNjplSzI8U8NnzB3F4ZhALOy08d2ER600PhWKZ46YEtzaquLkVY2mvi8WtPZR84PjMOHJhgM16G5eXt5BGIZ56+Bg+c98sThycxLHD4yiOjGJxYw/LCzcwNlzGxOQobi6sYmFlHWPjY5ifGUVBW2BttXCTuAzmfRw7MIYKrzo8uqtZxToXhFgsbjVxdW0XA70tsAYDzVCV8jPEWgu4cO06dDbIA6cPYljbqsQdBKSV9vbXighEAVAoYHFxDWG3g/tPHcbx6UGG47gxieF5ys8piDTa1K1bL8GRI9MQyP/jA415lb8bzZqP4WoY2qz3uNOx8oaBb5P/dI5BbXcXrU4bWnWQ80kD1rfRFj7L5ds5K7Y9BuNrBrjMbGZqYsI6QlnxXC79XDP4iwMpllN9yVDnjHW6SoehVRKFzh6eOjOH41MV5LsxFhcW8MrbV3Hx9haW2A73uiEuryZ46+ptLK9tYGpyDJODJVQoG7aaCTbX13CabeGJ03Nskz4Wlqr49uvX2WYCfPr8URwcLjCfBNdvLOClN69Zuiu7HdRyIW5sdfHShQWsSm4srWJ9bR1lpjFRKqGRdPH2wjpevHgL7y7WcHW5Js0LDrLNj5UC1OMEr11ewSsXbuLGyg6uL6/j6uIGrqw1mV6MYujjxNQoxst5xqLEK4Ros8y3KQuqrZj5tPHIsVHcf2gUA14HOhy940f4wfVNrBCfZx44jJPjRbZLkCZLeO21t3Hl5iJW99qoooirW228TBm2o4PZWVZtWyeedTPSRe+wpxfq6YY+YaB2eIz0mxgoqZFjfbuKjc0qRsbG2S+UrV9Qe5eRZ+nmDbz4/HO2qnBgfBif/uLnKHeH2fZ97FTrGBobhq9D3UmrJuXkrZUNM2hKlrlVH/p17Vt01Co46du0SZoOu5dxuxGnWG+luMVKvEV5ueHl0QhKdhaUGU8ZO6TMzcu6SnmzcvNdPProffjqV7+KwUHy7MxBTB84QvzGzegdtzs4MDqOLz36BD577gE8dPIMRonz6PwsfuPv/6c4ceIkYvKYzuHR6g/JJ5NRvM/gzwPVo+rTSWtnHNckCj2zbbBduLeqNYbmc7YC5GcfshUgn1Cwjzs2vv5HmUD2D5tZoQZN5/HDTk1R+xzm+HGrD9yZ8VF+1H28n6wZZJBBBhlkkEEGGWSQwb0N7twGjl2S1BTYgZeYAv7UgQnMDpVx6/Yy3rq6jPV6jKQQoVsaQg15XFvZxeuXFlBvp2jEsa3w2Ki30Up9fP+lK/jtP3kLv/2Nd/CN5y5hp+1hg+7Kyg6qzUQTw02R4QUh5mbn8MTjp/HpJ0/hs0+cwC996iS++vgZnJkdRLuT4OZmyw46j9tdXL+1jv/9m6/hX/7xa/jd713EpYUdjsUCrK7X8M6tLbRCoBP5dhh71/aO5yiMA648x2F5XmXMGYgCbO/F2Gh2oRMANGZTIK3MkCJY4zOSwQZ13SCPdhCgnY+QlMpAuYiU6ScBOPrTcblupYMFhxRjvm7oJ1VNwmcd7mtqHudSqfCFm0wowMRAFxU/RTnoYnSAacesCeIR+rq6tJWg8NEBwYYdx5BO9S/3cYLDw5xweh86Ophbo2CbAS9lqO/h848cwWfOzmEiislBTdIkdis/PIVUPZAXfXeuhcAZVFxpXT5WLS4vFySDnwhIQ+PRED7baUD2CtMEedaRJmZKgR2EbAuh1u6Q4iHrppDHdruNf//6Rfz+c5fx7IUbWG11UY1KePn6OqqdGMWyh/PHZ3BsYgBPnj6MQc9Hu9XBD968go29hPIhRD4aYGNjpaUBckEZLb9AmZDg269ewO986wK+9/YObrdKeHGhjZduNfHWYgtrNR+xT07JBbix28YPbu/ixeUWLu4CeyjZ+RM6lqRVa+HWwjLevHILL19dIF5reOH6Bl68voXbTKMbVMRZtnVd0w9t1dGhiUEcnRlAIbeH8WIHZw4Muq2syLU6A0krFWpkNJ35E0WhrYiT3icKI3hREZv1FN95/Rr+8MVL+Pqrt7CWFtEJdB6GFLFaVSYKymAXIhZ/swyfVKYV1tW9PXTYLzRjttR8GW3Wi8pFVjDjjt7lKLcefPwxTB0+BL9UwtkHHkK5RNpT4MvEMTE64to2XcJKaDZ0MD55zNo+gfTWahMni6Ukp+OrJBcznxZlMVAPC1hO87jaIk90ImyEFbSKI+STAbQRMnxohopEh/B3myike5ibGsX03Bxy+RLOPfoEnvzcz2PywGGgMIj84Di+/Ku/jv/gN/4ODp88zbyklM/hq7/6N/BP/u//Fc6dPYeYPC6DyntXfuzfZ5BBBj85ZCtAPqFgH2V3fZzJPq29Te98CMpKyc5Sn3VB0sJw2MVj/3/2/gNQj+s8z0XfKX/fvaIXAmAXRVKURFFdVLMkx4psx05xYifOuWk3/ZycE8cnTnyT69z03JPEabblJseyZRVXuehYlq0uWaQkkmIvIAGi7L2x21+mnO/91j8bGyDAAgIEQLwPsPbMrFmzpq215p/vnW+t63dj60jdfnQEp2khhBBCCCGEeCnhqwq/tIe9kxRlhjTlmB4J8qzA1GgbyICDh47g8WNLONIv8NiJdTz49DIePHQCX7zrETz2xDHMzG/BsdUBvnTPQ0jSGLce2IJrt03iqtkx7N81iZ1bRyxMY3lpHVhfwc6JBtqdtuWzhuMLC7hl3w685badOLBzFvu2TmHLSAsjaWIHl+OY7fPT33wSx2y/N+7aght2BaPlge0T2Ds/jh1zo2ikwMKhwxhtNrB12wyW1vp4+NBxHO/2MIhTHF22Y35iAU/YcT/yxBE89vBjmGwAN1+9E5NTo3joyRU7xyXMT03gqvlJjNRjPHV8DY8cWkA3L7GalTi4sGrnvIhH6bGy3EWz3fSvoB97+igmx0ZwzZYxO2a7jvZ/ECdY7Gb41gMPohys47Yb9mG8Ye99JccQyd0jggbAKK2h1+/jXl63sosDu7ZhqtVCy14d2WtAUQzc+MebRIGKAgj/8b93l0/C4kWheoMNX/IGTr4PB+EmYVc3fA9O7I23LJHae/Hc1LitiXF8eQXr3T5ojY5rddvC3p9tS2ZX8ovyYYznNuz2ymMsj7CPsC/x/DlpsaDwybuQ2zR8ke3jLVgbsGVyFNvmxnxMh8mJCUxPz2FqehJbZkbBwe2PHF32cYKKpI4TS4vYPtPG3AQHSE+s/Dawa27SRax7Dq3hU19/FMv1CR+PYarTsHrbQdMK9ezkmLUb85i26UQ78a72FhaWvb7lad3vccvq0b75Geyd6biR/d5jq7j/6UXktTZSK1edpMAr9sxga9POiF9/W9szNzWC3XMT2L99Cnu2z7i31sJyH9PNFNdYuzE92bL9rKLfyzBtx2zNGw4fPIir50dwy1U7OLQFVrq5ldc6FTzc9fASnl7oYZedO88xseOanBy3fKawdescOmMdrOURjpxYsytJ+Y4lNLMQBE67EFZuw/W+nMsry0kryTE9NYY8SVE2ajh4dAGNkRF0RprepV+7Hnn3fSNjbQws/bcefhh/+vu+D3v37LfnSGxli4OfR2hyEHW7t4N+hCcOH7Nnx7q1c7SI2fXxNi4I8lR9y9jaQU55EBbFHlY4yD69bNwTz6a+bAm4He8Pu9BKih7qxSpu278Fje4xHD/+JK694Xp0xifcwyyy8tjLC9hjzsUSjknEj5PLLMMgG7hXyJjd39Ed81bObb9+ADEGA0rmYRsGwrFAKjFEnAneHF6fcI34bGBdCM8Nik1Ve85nhqW2ZXmAvPxxDyoJIJcjrNBsrPkD4mRlY8X0flEZbF1kPyjq1oDX7cftlpEaXn39NkzXUkRZP7QHQgghhBBCCPESQkNEUvY9xHGCgoFf65Yx2vaOMznSQmusg6Uiwd2PHcZXH3oS9z12CE8fX0OrPoo9O+cxNjWJr33zARw9fhy3XrcX77p1N27dNY4bto3j+p3juGbHJHbOj6C3OsCxJx5G2lvAtm1bcfDoCRw79CSunhnB3lkO/J0hHQwQ98MbVZZEuO+po/iDP34QW6cn8f7XXY3X7JvATZbnzZbnjTsncPWOKbSadTx98DDWllYxOzmBTivBI48fwuNHjuPRp9fwjYcWcN/Dh/Hoo4ewdOwYZtsxXn/9bjuurSjTFA89eQJPPnEU2yZGcGB+HKP1FE8eW7T4ozh0fBkP2Lp7HzuGex45hAceeQIrq8vYu2sea2vL7h0zOdLG1VsnYa94RuldNC2tdfGt++5DNFjHq264Gp2UXznTkHdSAKHxZ70/wL3fvA/Iu9i7fQvmJ0bt2nOsi8J7D/AusBy7JkMBhB/Y+Ud2HhvCRWFj5yePoJrzKUUMe0GmcZDd1vBdmV9116IEszPjaDRqOLG0bNexhzKpwT8LtNN185a9O9MAzxOlSdkNnvyC3vJiHhGN9tWlES8INzxa2YrLAVL07ZqyXNJuQWNkgt7auhuy26221a0aGrUEM+NNXLNtAlvHx1GvpTi6sIpuFsyN+foJ7JqfwIzdz63jbcspxrLl9WtffQwPLAO9WstLfra6iLblO2r1emqUYwpFmJto4IadU9g9O27HUuLo4hK6licHx+9YPTkwN409E030ixL3L5zAI8eO27GnViIGmLF6fr3VOwog7XoNc5bHdbtnrM2ZwbXbp3Bg+yTW8wIPPHYE0506Dlja8ZE6nrR6vby8jpGRUYzY+ZWrS7jG1u3ZMoPHDi1hYTXDSKuB1OrsXQ8dxeGlHgbrK3be1iaOWv2kF1kjwfREG7tsP1tmJ1GzuIVjC8CAHl+sq7QF0ajPFjay9rUyzrJQV7XkcsLqoz0jpqbt/rfpeVPi8PFF1K3tpdfMoccewje+/Dl844+/hBUrD9fffBPSVguvfd3r0YrbaEZ1rC8vo2ttZ8cFkNTLz/3WTq/aveXg+SdtYpUHWOECCKs5yyzFj9yiOT4TPzCOh+1B6Q3isG2xmVreQ7Ncw417p/C2W/figa9+Bnf98Vdxy2vvwPjkrJ0JNVduE6PGnlrYrZbnb/fLynrcbiId7WB8yxSimuVv8RT0ssxaoqF3GrchlfAhAeTZsJvj12d4rey+slZIALmykQByueLix3DWF1kph8FiQgVlGrpd52ihhwNb7IXAHs78KcAvLdReCiGEEEIIIV5q+KaSFBZoEIoT5OxzHZl3gxXlA7RrMWZnJzEzPYX58Tb2zo3hum1TeMXuebzy6j248cAMJhpAvnoC22fGcPOBnZhKCzSKdaRlD9GghzjP0bS8J1pNTLVKbBuLscXyq9VTzI3VsW9uHFPtGpoRhRgaMWggY1/vXTeOj410cN3OGeyfHUGzGCDJVix0gT6FghJNy2dmvGN5NLB1qo250SboT7DVjmf/9jn3KrlhxxSu2zqBa2x667W7cPWuebRsu9je4zh478xIA/u2TGDLWAP1BMjserQsvx0Wt2frOPbtnMI1u2b9y/K926Z9TBQa6EfbTeycn8QWuzYNDhBAww7fAS1wLJFdW2axa+scavbCSN2DuHHG9uuGuyhBmibYPj+D7XPTGG3WEReZXQda9GgC5AbBoMrNuS29P7iprxqGi0HYN8/U5vjfDqqa9xPk+jj2sQACTGtlzc6rlsaYnhxFs5HixMo6llfX7XztfviYIHatgo3LLk+NkhEy5sH3asuAhi/fhTg32ANWkVu576NhlZ9eEP2SX9TXragl6K4sYfHocRw5toynjq5itUjsvjTRsgI8bpWDY7lwbKCnT6xZ+YzQXV/D3EQHO0etDpd9H4fhm0+ewGceOIbltO3iV7NYRbx8FAtPH8GTi+t48kTf861ZYRi1us7xQkbHxnH4xDoOLi27eNCytmff3ASumm6in5d46PgJPHx0AQN2vTQYYLpVw3XbZzHXqqNXxDi0nNsx9XF8bYAjK10cX89x/+E1PHJ4CVtGU1y7bQzT400cWzzhAmet3cb8ZAtbbd3UWBOoN/CVbz2GdbsWO+dZv0t85f6DOLbex5q1b0eOHcOTC308eZweC3ZN4hrqVlAphsxNd3DwiaNYWs3Qj1vIooYLoV5eWRdoM7J/oQZcfqWX3kJFfx3j1haPj41YG2nnkPeQ5msYrwF3f/YP8Ilf+Fl86Q8/7dfqwIH92Lf/gA9c3rV7+ju/8Zs4cfwwFg89ge6xo5ib3YLj3QLfeuoIVigmWH7sUYVXi4InLxFFTm9HbJ7Vn01ivV4P3mEWKKTmloSCSC2t2VYW31vBVC3HK6+axRtu2oOZpIff/fhHsGLPkTve9i4kjba3TLGVZbYxNbuP9FLrWX0orAzSuyW3MtmZGEPHnilxwtR212xfJGH7ZGzu9krix3Nh18qvUbhOEkAEkQByubKpboUffay0/GE6XGHVkBWe7qQc/LxjlfS2a3Zh1/QoEnup8A+FmEwIIYQQQgghXkJoWOdYABytgV/XFnGBKGH/9T2LGbiRgeMFjDdr2D/TwY1b6dkxgqtmGpgaiVC39R3k2Ld1Evt3zGLMXm5ScPsMpX/TD3vfiZHmwES7jv3bp7F7ywSaSYnpiVEXE6Y6Te8WmF8ZV4YL9p/ftP3TsHpg5xy2T40gtX0l9k4VzB80mPEvBzgusW16Eldtn8N0q+nHs2duDNfsmMG1Wydw/bZx3LhlHNexW64tk5gcbSCm8mHpGkWObWMNP6658TbqEcftyNEe7WCnpd+/bQLXbZ+0bSdwjZ371dunsGvWjt8OYmJkBLu3zWB+guMIFHatBjTr+Ltdo9HAbjuePdvmUYv4tTINMxZinpv9s2SxnQC72tmxbRbbLXSG3WSxoycacmjucWOPpeNX9TQT8epQ/LgUBJChPOOcchxu7DViO4tyaDwcnoOnYlzBLmeA+ZlRtJoNnFhaxepal1cPpa2jN5Ibwiw9ZSV6BNBo6UYylkmP29ijeCGwTBWFl3V6XfSt4mcRx66wJasPV+8cw5gV8MeeeBoPHjyCp46v4+jxZWwZb2LK4ukZscgxNyxu1W6YdyW0voabrG6M1mMsFzF+76uP4sGlDL2oZm1EH6PlGq6fH0Xb6sXXHjuOew+fwGHbfunoMeyw+tPmGDtx6uMMPXjkuHdB1EojXDU3jqumW8gogBxbwgOHj6Nfa3kZmrR93bBzHjPtFMdPZPjKfU/hy/c8hgeeOooHnzyGB55cwCNH132MovlOaW3BKKbGO1hYWcfXH3kCuR3LjukRTDUK1Gz/B0+s47PffNDHt9hn7USzVuCuhw/i0NIyrr5qm9XpOu5/4ijuf/wIjhxbxNHDT2PbVAedtImaHe/icoaDCwOsFdZyJQ0rqcFou9mwG8rs5VduabCmMMvB5OfGRoDVJSw9fj+OPfB1fOVTv4WlJx7GQ3d/Dd3lRdSSBDu3b8Xk+DjKQYHVxSX8y3/2o97udo8exmBhAXv27sNTHNNp4QT61k7QfkahiC1HPhQbwrWzAsbrZiU1ojDCgcit7LLcxtYI5tYmZGxSrNym2Tqm6zleddUM3nDTbuyYrOOJe+/CJ37pw5iY247b3vB2fzJ59kORmQIIDbEDy8vHaaGnh+XdbjfQaqRoWBm0XXgablgJH7yPan+eL7x2J8u9BBBBWJfCnRSXF/7rkxVxWMk8sGEcNo42DTfWfr4VA//KYrv90OMgfOwD0X/9CiGEEEIIIcRLDN9EsjjGIArdDLETkYhffJexBRoZaHIo/AtcGiEz9o8+6KIc9BFbCMIF423a6yLN6MVR+LsRQ2558zOwPKq7MXyQ5/41N/+lg3UkvT6iLPcvvgsOFmzpBjGn9EaJvbvgWncZ9f6adw1Fo+IgannILD3ftNwjYGD77wNJbnvLeWxriPurln8X9W6GpDuw4+sjH+QYFDST8BxpJslRFusoslUUNrWMEEUZ4oJ55JZHjqRvy7Zt0ut5fml/HQ3bRz3rIe2x264gfnDMEgbmmeYDS2vHZdvT45/XKHThEsw/fGOMCzteOye7KCgGtl+7luw2me+NJ7u+ItU7JgPhOgsX+T0yHFEoH+GYhgZLX4pRWhmiscrlHD/v8FYc3o+Hg6Pbed+wcxrvfM0+HJhtod5bhJWAUIasvNDkxfFD6DXCARp8fwk7E6uuhXhh2H2w8o+4YfemQScquxeJXfMSjaKHuU6KO27chre+5mq88dXX4fqr5jFSH2B9+TDK3Oq9NQpW7bBeWD1KIgzSGtbiOp5cXsdqEaFv93wtK3B0YRFF39oHaxfqdh+nWk28+bZrcedrX4G3Wd5Xb5/GWML6sYr1NdY9q2ep3W2rAzWrf0nRddtJyXJgh8tDtmzsj5U1eolZPUsiprcyQdGw7KNddtHBOlrZOupW/90gPlL3wAGxC4qQVmw4HPdKt8BDjx/F0wtdZGUNXTTwzYcO4dDRFSRJzds7Fygt/exYB6975V684/br8JZbr8FNe2cwVc/QWzqMrGttAC+npcsG1qrZNWC7EnM6LOk06GfDNq2yDF1usL5ZS4elE+tYX1wEjj+NxT/+Arpf/wru/42PIjn0KKLV48jWTmD52NM4dvAJDBaO4fjjD+GJh76JMlvGwQfvsfq+jjErQ2vHj+LYsWPe9RUHpvdxPobB75EFevfxA2Mu8GomfCZZ81izaxmxlWBRsPRxbEeWr2G2Cdx+7U684RW7MT+aWPuS4YnHHsGDDzyARq3hIbb2qGSbyzbayl9sga0MocBSlvTwCPlbDrYDS8/CIIQ471yeraGwRnOItc/+x3+M8gcgG1Ob8iFtD2t+zTM13sb0qDWo9uPcfyDag1UIIYQQQgghXmpoXxrYW2ifxkw30CVIihSphais2dsLPUPCV7aDOEY/5qCzdYujoahuGfANx4JvS0MV34NoZOJ29AWpW/qmiyAcCNlHHWD3MDb1wWrdGEU5JPE4Boohvq0FGs7ZLVZSDvzLX+adxXU7VsvX8s4tcP9uvqIQUtCIZm9gtl0QEfjORVEjiCwDPyZ+6U6vF9/M4hm43ckBd7lPduFVc2M8t+Ax0GhfhpCXqOf0IBmgZumCyBHyo3Hf91L2LQRjPglG+3CFwhw9WoJXC/dH4YTvjlzP4Gl5HsPUpxJSXBrwCIPIc/K4qmO3ssB5N3WcPA/GUNSoFTk6dv7XbBnB22+9CjftmrFruopo0LUSYdebm+V9u419y4FiVe4DHsdp6IpGvHDC3eIoGkGYZLdj3jNF0cPWyRbGm3XsnGvjjpt34q2vPoA7X3sAb739BoyNta2diPH4QhcPHFrAqtXxPtuCWsvahQZWLM9eSk8Oa08GGZoJ7+/A7l+OyYkpjI+0sH2mhTtftQd33rIbb3v11bj9VTdhfGYSg1riXVg9+tTTVoet/thNTodlp2fHzHFB6PsVJ9Y+sd2wPNlFFf+x5I126rjxwHa87TU34B23X493vO56vPW11+GOW67C3q3jLmiwRPWs+PWswmdFA48fWsb9T61gOe3gsZUI33pqHWs9y9/KVt+q7LplzHEmZscmMNWqYfd0A298xRa887Z9uPPV19k1uQXTM+N+fE8uZnjiyLKLxDxq91Rzcdiu91D4CPXh8sTLTFzDWj/DXV/9Gr7+2c8hOXIU+9IY3/aK67HfysZ4XLhn3+KxI/jMpz6Fj/3Ch/DLP/tBfPzDH0TZX8QD93wNeXfVy9pTBw/i0NGjLpBX1yW0vIFTrtRQhGD736w1rImkC4e131SdKESXXWwbjfGmG3fi9ddvw2zLSo6VPwobjz5+EIsnVjE9Pe9eZd76sDDwmWLPPAamc48O5pqVaOQJWrbPhoWwxeYjE0KcL/h4F5cZLkp7E83GkQ14iPdY+0HLr6aCew9D7n272quC94XLzxjUmAohhBBCCCEuBnwXoWcCBxznm0kwyPMDLhpJUwxiGjTtNZVdPNGo7wZ/W1PwY6+wPY3/vo0LCNwuGFbd6yNKLC8Oqp6BYw7UXBDgVjRiha4vuC0HY07KHk2UljfnK+NheEVmmrptWw0Q7u9gbrQKX1uzq/YwOHZ4v6KoQdGGxlh++Z3HZRA3LI77pGxTLyhSVIZ74pKEHTePjdeC5znw/fJr4prt28WYgvuyPfs++b7HPLiJnY8Fbss4Xq/gEcLrabMMRXhz5B45jW2Z14PHHo7DYt0g6GtPmV5qVEccjrESv2zOTyOco6/z8wn3cfN52KXzAbbrdr+beYb9sx285Zb9uOWqrRiJ1lHL1hD1LWR9H3Ogng7NkTm//A+iknih2B2wMhlHA6v3JQZJbDXP6kYaWx2JcGx5HX/0jafw1YdXcGQFmJoew/4dc9izYxb9pIX7nlrHp//4IJ44lqGXU3ysswFBnifocgyFeoLS7lVUt/pvNzixZXZn8+RKD79390EfG+TYiQF2bRvH7h2TGJ8fw1Kzha8c7eM3v/4k7l/gGCIjGBQNq69tFLURFA1rU9oxerWmxdWsSln9tIpd2vFkjRa6zQTFaA0jWzqY3TmBue2T2LJ9Gju3TWDbfAPtdtMK2hh6jY7lbW1do2FhDAuDOj778AJ+8cuP49fvfgqPr1srVB9FWbN9tICenQcl0IXlHj71xW/hjx8+hsX1HHMzo5b3NLbv3mLnXMe9T6/j9237xxbt2L1No3jKtsoC2w1rQ5r5uoVNQullh9XhNMVSr4/DCyt4/KljiOKGnWMde+Z3ohWnGB/tWLocq2sr+MbX78bv/fYn8dXP/RG+dfeXrQ6vobe2jHvv+wZWuqt4+vgxKztWbqwaR1Z+ypztc2hB6HnobaUvsf228uSBTnx99yIsrC2mBN7MVrCzVeAt1+3Ea/fNYr4ZW7thzxN7biwsreDBRx7D1Pw8du/fh8zaDNrl2IYwJFb2Y6qwtsAxTmirS4rc2nt2rRShZvFMt9E0CyHOKxoD5DIk/Phm4I9gNpGcDy0kl/hTj4O/RXnXHgxdvOa6vdjWtgext+z2czhMhBBCCCGEEOIlxt5H+E5iwftEp5GfBnuUwWOD/aLbOvdqKHPUaSCyQJM8hQKak1LbjuNz8B2IAkJBzw2miC1P20O9oOcEvSh63m1NXFosv+odvgRxfAzvYIVdT7lgsBlb4v7tnck/LLNFN4jZnik+0G/Eu8By4YEGcjuOOHfBg+KH78P3w8B92r5tlqIGDe/Mp0pDExilmNLy4flVHvwUPXwfNs/3vZCO50njWXjvY5yPrWCpwt4Yz2vCJUbETDHMlxE2tVUUUrjIroV4bmFb/mW3MLbOt6dRlfdgmK9F+WunBcZz9uJQ7TkcDI8txAyPqTp3P/4qVbheYSnGoG/3wW6JlzkrJ+OjLUxNjvu1WVw6gf6gjyStWVYhLb/OpxfAILN5CnPiBWLljn2vUZzzMmc1jxbeJNTZE6tdPHlkGUeX+jhs0yPHFvDIwaN4hONpHO7iS/cdxn1PLGA9bmG9bFq5Tf3jzoRd1dl9fPTpBTx4aAWPH+1i2XbRt/tWJjUsrXVx6PgKDh9bxtNHF/D08RP41hPH8MjRVXz1kQV86aHjuMe268VtOy7mGLoiyvMMS8sncP/BRTx0ZBXHV1hnG9aO1Ow8Uqz3M9vXcXzryaN46PACHj68iAeeXMT9Fh56ahEPP7mChx4/jqXVgXt1PLlwws7jBB4/1sNynuJYFuE+W37SzrfrQo4lsuuzuHICjx1ftv2ewNNLPdtuFYeX1u241+y6HMdjTx3Bo7avux+x8Ohxy2MZiy7KWBtkbQJFELZl3lJY+xE8yHi9vQWwc7v8oKDFejneGcHEyCg6taY3f2vdNXzz/nvwxJHDOLG+brevadeQY3bYs8FOtcEm17Zle3DU7n1msyM79mJ9bBvWk46l4jXjal4ZCtr0DmTrkFkbaCU1tgw8la23DAu7rvTOaxVr2DfdxFtesRs3753DhD1Hanb/GkNh44GHHsZHfuWjGJ+cwdvf9ycRtcbsmWUZ8vJb/s06x4JK0Bvktsh2yc7PnlNNu//0+Ok0eDTsho2iFQ9Q7c25YdfWnwUM/Mtn6fC5azeDdSKsZbvEZ5vVQ40B8rLHxcgP/OTdrHniMoKNcvXDNrGHpn+RxM4JWT39l6lVaquwSbaK+XYff+btN+PqZopR+8GR2d2mEk3hmQ2uEEIIIYQQQryUsOsntxSUMTj2R9UdEw1PHBidxgr3UCjpzUGhxNLbNuwSiyJAzV59mGYQ0wOE70OJ5cn3pOBF0WB3NUWGwt6RvDuYomn5pi5ScN8UBEI3UFnoZivh2B5wYYVfBzN3ii/sBosmMh/7g4cbsXsrBnv/Ki3PsuXzSdRzIxk9PyhmRGVq+4hsCjeAUWxwb5SC+fEcafy1LWl4sfmwb3bWVXVfxRj+pfGSwgdlFxpo/WhsS1vPc7YlvtPx2vEre64PXYPZGdgxcP8njTw0jNqbIr9+tnPp89rZ5rwWns7uA98zKTLZxI8/sfdGHgGvYxYys3Q8P8/yJYfHTdy4yenw3DgXrpVNh0Yu78+faywt17oRK65hQO8OnrTF5+whod6y+9/EkW6OLz9wGJ+/9yAOr9p9rLctreUfR+Bg6EybxOFeiReC3RmWtYweIHZf2GUViyrLrt0jdivFL9/R76LGsp1nVvYsPbdkGbd75mPZJHX0ax2rc1Y383U0KG5aHc84Vg67J7N82eUUx/tpNevo9Qeo1eqIsh5qgxM+HmpvPUet2bI6XyKrNX0cDn7pb0fkZSS3ChAPBmgzX6ureZMd0nF8hrYPoI98zQ7K6nDRs6OngEr7i8Wzftq2pVWotGbHa/UmsraMY9JQUKvV61b06li38pSn1pbY8RZWDtnGpP7haoayu4K6XYg8bto+YzRsm4LdshXWhtm5gF5qtp2P75E27HpYsH0Ebzd6Eti1Y/tj1ywIwmyz/Kz83C4/7Jj9+loLaAWmZeVn1O77WH8RD33xd/D1z/0Olo4+ZdcDGNj16NlZxtaOU1CoZVaWanbtaSuzcgMLb//ev4z0urdgIRpHamWlsLa8iPveztWyhl/nKO5Z2YjQi9ntVYq6ldMkye0KLqOTr+DG+TG86ab92LdlzMtqbPcNPQoYNaStBn7tNz+Jv/MP/le85Z3vwv/y9/4Rnu7yflo7bA0vx52aHGlaOUqxtLyOvuWa2/klVs5GrSrsnhrHdJPdrXXt1OmNyAJHIUa8cKwesL33jxTY0gzbFIsLz18+46xdsrpM+Mzs11p4eGEFP/fJu/BUn13v1a1ecQwwPqPDfUjtfo+Wy7jj6im893XXoc0xh4Z5BDus5eoNgp4SlyLWLg9LhLisCHXK/gzrFSt39YNvGGNtZoZ6EmNqtI0xuuXRxdQe5kVuP3wTNaRCCCGEEEKIiwE9O+gN0XNjP99h3KhHg6EvsZuonnddxbcbGvMoQLhQYBEbBn2bC8ZuGjLY7YttR4O95elfZUZMRzMHv83kv2CY4F8Odk4DIb/n5NTH6WD+JUUG+gYwzkKc2v4pwFAwCUIDInYzxS+F2c1VEDFoVKGAEAZyD4HvbNynnZktD+xYKfCEc+VoA/zi3L9EZlo7YqZmcIMLt+I1sWPiAO0cK4VCTdieQkXYb9iGU+bJuHCWjA8D+la5BsKHdLwKw/iQ2HH7jVHl4Hj6jdTDcBGpDnLjODYfl5eIEPxekXAu4ZwKN0xz/Aka0Vl2UrueMfv0z7uYaUR4zbVb8KZb9mLbZAdlf93eoXl1bbuBlUdLW+XHv2Hu2aiOS9glBAeDTlneM9ZRu+6sN36fwr3hQPODpIGVdATrnTmsNqexXOtg0Gghalg9dRGla9v27eIPuAV6cRNZaxwDS9ctaPCvo2np4yy39sPqucX1E8uvMYHV2hjQnkRpaWMLRR5bLQ9Cp+dZhC66ipq1NY2mTVtWrZp2nA07PrYJidX3uh1jE4PmKPq2325jFGv1UazXxzBoTaLfsGOJbTvbtrB0uQU0J9GL2BWWFSZ6Jlg71bDzboBdVrFrJavTaQtla8rSjPnYJiXFGaus/aiFbjqBbmsW3c52LDfnsNbg+CVtaxNYhmnopWHXpnZ9vFRakWNbSc+Wnh0LfcouS+w8KDoVeY5+2sCCXevHmuN4bHQGh0emcMjuHo3UEdvG/sC9c/K0jtmdexDXW8g4FAyvobWDeS3B8RUOfG8tL0XM3J4DbMq5E5ZFu2xsxQnbSArpdnmtzbd0vVWMpgO8ct8c7rztAK6e76A2WPXeVjhCemwPhzLv2XKOw488iu7SCnbt2o1mp21500PR8hu28fROSe2kYmvL2ZTxvhUUWNLMykrwIgwtVxXE+SfcZ3FlIgHkMoQ/EvxrAftpzOrLhzFVS/5Y5k++UKlL76Pw6rlxjFlUaj+4qTBba+sNsRBCCCGEEEJcDMLHW9VHWTTiBWEimKTCOooAHsd1FlzOGL7G+PJwwc1EQ1tReBsKQoALCDGFE37xyfyZfmhwpWFrmCcJXWrRcM40zMPNVmHORYVqe+7IjrusWVoeKb0x+Dl7tY7ix1Bs8eMLRkka2LguvLcxHSPCfih3sJ9+xvrRuWGTOfD6hLSesxtqOe+ZGZa376M6Or7nMSXFj+E+uD7893huzS+maeTjcvBSCduEmJCKR8pjcwOrxXE7/mP+vsuLhB/lxvHybtOcwVDFeYrh33DkTB6uoC3zK+88XGtfkYSursCPB/MMkylw21XTeOetu3DdXBOt3iJaxTpa3IVtxy40mDvvD+8caNTmvaIh39bxiALh2KoQjsj3egXC62PnbvWQXfr4vF0mL2d27ehZk1koYg6SHuwa/KaancvQayKzNH3eOptGXk/sytNTjNeVxmy7B+71FNt62josX3axxUHrWcMLelBQSLS8B3a/OWZG346BJdyy5F+/l8yDNZqR7EZr4EKZHS9vW8x6YIH5J7Yv7rPkfmsW6E3AqS3bcfUtObfncftYRgnzLjHIaHG3c7K43Mob2xGKPjTK53a87MGjsH0GjzVbbcfiXiSWD8+N3jNME7rj4ZHagfn4Pn6AdnT0DrH2ztsNxrNtolhbtXKXF6H5tBbTTo9nxHs+iBtYja1ezm9H1uygZ+07OyirNejDwzGYUmw/cB0iW8eSklgmeW8dZT7A0SOHUGQ9NOq8XgE6zdX8erL7RQrMvIZ2HymUWL1vZkewtbGO1x/YinfedgA7Z8dcwKpZvjG7ZbRy6wObN1IcO3YE33roAczOz2HP7t3I+gMrSrxHYT8c26ltMzV7GHgrMSxv7oFCzxVLWlqevspFKx6XOC94Ja5CqD/iykS16jKEN61mD4PUG0hr1K21DD+s7IE4vKWJNazsT/eqmTGM2kOP/ZuyobXnhj0nww9xIYQQQgghhHhpCUIAjVUuBriBbpORrqyMeTT28Z2FRjx77xka8hgVBhe3Nx+bD+IC48Ibjpv+LG8XPywflxgsEb8g97emktJCeB/iF9+MY1/eVX/eFDRi74QmGKOYIgxozh3wZaqGsqxbLL8eZzqaa6tjo2GFRxHOyRctnb/BcVs35dkeeS7D86aIQi8RmmHDtdlsNOf52dXix2/D4CKI7YLHTTOx5+PXienpURK244TXKQzKHs6DIXzhzBT8szkEQv7hHPyvrfLcLUMa6y4u4SxOEs6JoToHvxSe5mS6cO9oEKVBlfeYi3aHC7vedl9iK2s0aNb6fUzYyldu7eC9r9mH1xzYik6xjqi/6oOiJ76NXW+7PvQe4XgRWUZTq+dogdMq+C49VMtXKrzWLjLYxaBRmANAR3a9g2E7iBgZL5SlSyhk2HX1uki7hV1W77jE7lMS232ya+/33O5ZsVFOLcYtyFkQPCwday/rVp333NLR44RdvmUW2C0dxQcKVyEHiiWhyzjiVpaYR8DdMw09uIIs40KXrUj4VX/BcQJY52yV7dfHFnLBw8qJ7cO/8LdjoJdATEt+Va9tnYu8LHu2H+/2zuo2Mwq1385nGBfZOdHDjV5k7C7JPdHoyWT7DMfA82aLxs9j2aZyHxR0e6ixqy7mc1nCixrqXJxlPtZGzdp0es7Vmh27nvSMY+tr15/iEO9LrYmRqVlkFJLsPvA61u1yFIMBTiwdt5R9777MsvB7kPASD/gc4DMjiG6l7YeDkrfKVeyZjvHOV1+FN16/A5MU1AbhmWA3zVJyA7Ylpd3hHA8ffBz3PvQAtu3aiauuusp2yvLLM6DMQdvcAA2WRZv3Umf3jmNTxXli8RzXxsoBBS1vnJk776M4P/Casp5UU48UVyCqVZchfM57nR1W3JPzbH7DLPswHG2kmB5ro5ny4c6fBWEtfxtsbCyEEEIIIYQQLylDQ+BZGRoqnOoN5/kTtqi235xPxal5BhN6FXfqulNhXpuPvdrudM4Ux22q7cjmfW1Of3o6svn4Ks60rTg7NEVuvl+8xryXwSRCgzONzHHWQysqsXu2jTfeugevfcVezLRTIOsip4EyilCnoTrvohZlPp4I/9GDgAbUsB+a+3OEsW1s7em384rk2S7CM8v8M+vV5vXPTH8mQh6nCgAh19O3fa68uNXJ4zmZ+rmP4dnr6PPfviq7IYQtqxA4NYZlMISz7fvShmcZjj72OucDGNs/ek60Wm0kSWz1KoKPz5Nl7olBMWlkZBRNW+9CMoUwq3wULZeWFt0TpCz6iKhgUcRIGp7foGA9tS1Y94suJuMuDsx18OZbr8GtV2/DZDO1dQUaFOesDSgG7G4+Dd4jvLxxDQcPPY2HHnscu/fsxY6du1wY9cO1Y2Qa2uBSLnMhRFmbQzEwiB30hmLgvBqM8w2vNq87p5erICjOB+FpLy4vrD3kVyzugslGlF8BMJr1mQ8Im/J7p7kpNv42R+8PKuKWPjSlnlAIIYQQQgghhHj5Yy/CtCtWXYwxwu2M9vLMaRSX3mUOB82OcgohJSaaNdzxyt14y2v2Y260afFd1Nnn/2AdcTFAGtGYZiHiV/8ne2NgXOjWjF/wBy8D2TSFeCFQ9Ijco8W9fSzG66nV0War6V2csbbRmwgcAJ4eF5aqbetGx8ZtReq+dfQuyi3J2soKut11lJY2eA6VVjtDe+DNgMW30cM41vCKHeN4+21X4dqdU4gHubcF7TRCbO0CRYwkjjEYDEK95jFaRnv2XoU//xe+H+993/vQbLaQZcHQ7nlbSBI73oRijkdbu2Bb+3wQPmir21hpOTNvcZ5gGQl3KwRfFlciEkAuS1hph9XXGlzeRDb2jHFd3BrT1H6c7Z6fsgbaGmc2vpaeg5+74mwPByGEEEIIIYQQ4krA350thLfm6u05vEGHGAog7FYoRzMp0UKORp5jPI1x0+5ZvPu1V+HmXRNoZydQZj2UcYp+WcPAQlmyGyP6f7DrJgbmyRzDB4jshih0KyaEeL6E7voogLBGsSaF+lqr1ZA2Gu79QYGR3aZxsHT3EklSTMzMWkWuuTDBZVvwMTmWFhc9TUjLQfX7ti09O3LU81XM1Au84cY9ePvNu3BgZgQtDlhvmTTpzZX3UQx63oUVxw3Kc3ZlZfXb9sN6ftXeffj+7/+LeNVtr+GQQkhS7tcIh+0CB+1x3tYMzXFcNVxtBCFGXGh0la9kJIBchrDxZ2PrA4HZMgVM7yPSZ8JDoI4+ds62XQChWx9vdVnY48L7trUc9PtLCCGEEEIIIcQVQngF9pdn/5qcYQN/V85QY/fR/R7iwTrayFEfZBi1d+zrt43h3bfuxh3XbcNUK0FhaZHWUcY1F1P4Ys5ur9zzw97HQ94UQTbvRAjxfPD6Y/XO/Tqqysou6FiJ4xjt9qjNW/3KcyQcR8ZNm5Y2ijE5s8UHM8+tYiaWBwO9QI4eO+bVn14g7LCOwkearaI2OIF9cx288/ZrrH7vwpZmjJbV+2aRo8YuswZdH2GlmdKmlqPMCiQJe1phvnYMdjz85pieH816k4fp+6nw3ljsGCjY2IKtCj24VPipbkofeEaEEOJFIgHksiT8kGKzGQYG9DlrNEPgwG6zo01MdjioljW2HPmc6fkjjT/IuM0zW1ghhBBCCCGEEOJlzjNlCbex8q264EDpcCEjLnpoRAM0ywHa+QC7RiO86cYdePurrsKuiSawfsINqW4MpSE0fGrI3FwMYRdY/h5uSwx6Axfi+RHqSuwzJc1XFA8KioulCxudkXFYxbN6S5uYpePA5+wqK6pjfH4HirTpdi8OIs8p6/Wxo8dsuUA95kDnXTSyZUzE67h5z7R3efWKPbOYrAHNvHThA3kPcZQhjZlP4Z4jPAwOoM9u73zK+u3HZ4dnx5fYtMZu8mze8eNngsj+eyPDVsZXuUnO1nG9p+FyxC7zfAWTCCHOIxJALlO8oR/+uIqskax+bvGnFfsi3Tk7gXachIaajaent3RssNlqM04IIYQQQgghhHjZw3fiEPzDQb4b0+joa/wl2f7zS+7Cu6tJ2X10kSOmV0jRR6Psol32MFsv8NoD8/i21+zFzbun0MpXUfRX3DDKfNwYa1N+nV7lTcNsNe6IEOK5iYfmKo7Xwe6q6EHh2JSeF43OCJJa3epsikFh9YxeILnVtaSO9uQWoN5BxDE3igFi99roYW3pOJK8h3bUt3q7grlmhje9ci/eZXX5wPwYGoPM6rkF7pzjilgbwfE+WIspULB9oOWNx+Tjh/h8YSFHmtr+bZpzf9yOKiqxiW/LWT+H4TzbHg9MFFoGF0GqBSHEeUcCyGVKQfc/enawkeSAT9aY+g85a3AbyLBvxzzqwzg2o6U15D4IusVR/RZCCCGEEEIIIa4M7F3ZDYwnAz8RrOASvTRoUKWBlR8R0uBZGSppE+WHhnV73x5DHzds7eDdt+7Cm67fim3NDGlvCUmR2VYxyqSBQVTHoOAX6cHoyc/EacglG+/lfFf3YxJCnA7rJ4VFdh1ViQgUQoooQb097nWV4mLOMT6Q2gZWd+M6ysYIGuOzLopQnPAURR/9pSNoDFbQ7C3i6i0jeM8bXoFXXb0d8yNNq9c56lHmnl9uX6Op1OophQ6GwuYpbtKvi7WYgibbCI5Twvrt9jYXV4Pnl3udDNuOoInaOeQ8h6EniMNlepwNl21CQWVjQQhxXpEAcpniP5PsD5vF0LBaY8mvU6zp76QlZsbbaLDNtvUMFD3YrrIpZ/+H4fEhhBBCCCGEEEJcGXi3M0MvkLAQcFOke2okyGnoLDnccYySxtfhu3NhL9L8mjztr6EzWMM1UwnefuNWvPvWq3DDVg6avIoo66E/yGlyDV+lF8Foy65x+M7Od/c8z1EMP2IMAyMLIU7HP/AFvT+4RGEgZxWyClVHozNmdTV0PZe7xSuIIb3cUqUtTG/b4XWwXm/a3wK1QQ/Z0acwFfVwx3W7ceetV+O6HdOYqNk+sgw1enGwxg+bBIodtJ0xhK61ghjiQkbMtoFpfNFC6V1exRHFjDD1OA8hDcWRDXxjtkFhgeu9TeJUCHHBYEshLkNc+bZGtsLbUFtuxwVmRupo1ei2S3XZVriC7Sn8sVG55QohhBBCCCGEEFcW4d04GFjdCskl+0sRJB4GGj1pOh0u29S/UJKImwAArb9JREFU3vbEljrro9Zbx3w9w227xvDeW/fhDddsxWytj3Sw6kJJbNvRiyQfZMizDEkSo1arbXiAyAtEiLPjXbiXlDc4zi01AgoNVleSGpqd8VAnWcdsmpe0eUVIaynSRgtjU7NAvYlBbvlY3UvzdYwnA7xi1zTe+Ip92DczhkbWRS0fuNeH5Qx2beXdx/u+GSiIBs8Pn2db4EcT1lep2Ia4UMPjHQaKIFy3Ubc3zG92lBZVtSNe/5mPe34wn42EQojzjASQyxTvA9GFDWs8+cPJ5ug6Vyv72DU3gWYtDMjENGxIvTHljyz7sUVXPiGEEEIIIYQQ4srA35z9i+zwhwyNk0P4Th1MJOGDQS6HuJCetswoSpCkNdRoeM37qA3WMBGt48B0HW99xS68/Za9uHZLB+18GUl/FWmRga/mzIGeH1mWudGT7+b0AuEyvUAoigghhlAlqMQDt2UFGxjrDD0yas024jS1+FBvuJ7dUOWDAZI4wrbtO5Faml6Wu50sLQZolQPMtxLMNmLUB+toutcHu6wK4od3dWXzVfMQxt3dLHqEFfxLDw9vJViXfU11vKFuh3F3K1sc04c4z8H+cDksDG179p9CyPB0jOrchRDnCz1lL1PY4Lq6zEYz5pcpdKu1kK9j15YpNGppeDhY8Cabbaol9qbZWvSN33xCCCGEEEIIIcTLGnt79i+5aQIZGk397djeld1wyRfkEJPbe3MYu4NwSkMm36GH790WKFhwbALG09MjKTNM1Uu8dv8c3veq3Xj17lHMRMs+5gC9Qej9QaGD7+ibu8BiPvICEeJ0rCYO6yDHxWD9oEbIWsIu3cOC1Ul6WmEoZEQ5alFmdXGA8bG2Cw5pnSIJULP0g+46jh96CnXLpcF1Q1tZkB7CX9rJwjz/cMHqqC0wsHVgCxLZ8biNjV4nHpiYa7ldZPuztsHaio0qbdkkbCM4s7muM087OP9I2dfxr02FEBeE8OQXlxnWMrKh9bYxNNb0BOTvr04txtxYw10E2ZST8DPOUto2uUV6x1lSQIQQQgghhBBCXAEEwybNl8OeEk4xNNoae1fmlCGs4fzmKQ2bib2GR/ZOzS/GaYiNkJUxMh8bpEDD3rTH0MM1My2869Y9ePutV+GqqQaa2QrQX7esSu8Ci6GiEkUYhBAn8VrKemv1hnWuEgtyr4PBGySiuOhixMDme6jHGRpRjvFOC1u3zHn6LM8towRpWkN3fYAis4xZZ21C8ZMhyBf21+q05eqtwOZWIgilQ8GDa6tmwbFUdmyeY5nYrNXvuGpnQr5BzAm58WNmxnOJAmhqbYCfJ9N6OiHEhUACyOUIG0wLsY/QxBAEEPZYuG12Eu0aVW5rOF15Dg23f9ViiZia36zwrxBCCCGEEEII8XInGDbdVGrvxCffhU+OA0JDKLvDCYbOap5DLFdT5AN//S5QQxE37CW7hShp2Lt34obRuBhYyFC3tFvGW7j9+m14z2v34fVXz2KubTn0OUC65eF7s+xyy5fv6zJ6CvEM/JvdONRXjvFBkxaj2DUV5cJGo24LVj+tXjYsVTlYR5KtYdvsBN7y+tfg1puu93pMkbGfFejlCdbzFF2OCxKl4Hgivr7M3IOE43aUse3L9lnErNOV9weFD1g6htICWxJKqTyaEKKS4odtZ20BxRbbkkc6XG9/N9dznghX2Tp6hqRJGBMoeIb4CnGBeGFXd/OT4tnRXbs8kAByuTL8QKRqJOn9wYZ4x/wMGnZX+QPsJBQ+QpWkm25kDawQQgghhBBCCHElwM8Ch6ZK/7sR/L+9Kw8/6aYgcrIvhVO9Mmi/ZLc6HBR5UEQe+CGiZzV8L/f1NNYOemiVOfbPdnDnzbvwrtdcjWt3TKNZdhEP1imh+Du8b+YZnHxH5/EEE++p+68IR/r8oBHZDlOIi0KoFWfCYjlQ+OYQYg1WjNgFCi+6Vt+8G3erIy42+jRCbygmJnGJor+GkWaCW67dj9ffei1uPDCDuclR7yKL8mVUq1t9LbG6vo60FmqWCyyGd2floTJ4P7PChNpZnUnVmpwKt/YcKHZwaufA06JoEsb54DZVCHU8sXanZov8RHnYGPheqj2Jc8O/GR/eEcLuD4lffd4PF7HCfT+dqlwwtYvfnp7LJ+/KRhLfR1V+cs9XXLrIEn45YjWSP7SCC26B1H5Y1ZChVvSwfXYMbWtBK5U6pI9tOfh9uIJdPUiEEEIIIYQQQoiXOW4MKxloDq2MrZWJbBjsJfmk8YtwIawLU5pP+JIdjF2hc2k3pdp2w/WeSeEfJ3IA9HoxwGwrxat2juIDt23He27age1Ne3/vLaNOY5llF8xnib3jR2CXPu5NYtmErnL45TvDyWOhMY+iRnW8mwUOpqgMAYyv0kkEES+UqqyF8n8qoSSePXDr0srh5uDl0kJIU9XDEOjhkds/r0cR6wJtV7ac97wexLVaEByLBHE+QDOxdOzeykIcF6hFFpf38epr9mH/zDg6Vug7jYZ3nZVZngU/BEbPalnXdhfqbW7nltETZKPeBo8PFyxYNyMeD8+FZxOux8bRW1pOY47HW1j9tH+1lHY3m88zj0+jGtLc2oF+jpT523+OL0SvFvbmktj5dmybJrflWCa2k74db54GLxJxbtAbh/chePFldnXZ/kV27XldS7sXfWuXexY4HXhbHYTvcI/ZHvucx/Pe8d5wrBlubuXIy4rfTosPHkEpvYjoAbgpL3HpwXsoLjus0vkPLDa4sVfMRpRhaqSJMftxxa9JEmuEQwUNFZPNvVdWih9WeUMTLoQQQgghhBBCvNyhmZNGLBpcT+IGLxolz0h4k2ZgumD34pzlE/Hr7dA9FgmGW6YLW7CLnJTv5TScZX2MW9p94yneeM08vv111+FVe+cxHvfRzNeR5sEIZ2/23MK2tKO0jNhFFgeAjhN7j6ciwpxtH2Ev4Y3e9xcWfb8eY/9d+PCUIQjxgqmKzTOKT1Xyzh5CGR2KH1WcG4cr0SOk2pgO606eZ8iLzD0m0loNSWz1wVZzC07T1OLBrub6oEqYWRzTp6ABOkfH6krdUtcsz/GxMST1OkqKFLbfmtXBuOi6PYwOATSIu/DID4vdQ4ACCA3als7S83jCOYT6xHaiChRfeExZlnkXW6yeg37PkucuhCTsdcX+0zulU088Lk8sD0tY2D7omRIVA+8ur2nb1i3Pmo8FEqM3yJD5dbIV4gXDdpgtMP8GMaK6k2xfLZb/Ge//eR8rka8KAZZIilInW1BuaEteBlgebDsP3GcVfANxicJaLi5DWIV9oDRreOkFwkZ655ZptK2B98GgWI35gAnJvTKGrz7C4yfkIIQQQgghhBBCiAuBG9H4Dp5l4EDp4/UY128bwbffvgfve9UOHBjNMFUuoVmsWNoMZVxDP2qgHzeBtIUkSeE2tbIcTjfNW77BpMcp3+8Z+NJfhSCmBLOPTD/ihRHKWQinUpW45wpW5jgouJXDsBkLrUsZw/UJ8rLmAXEDaa2JWpqgZmlqcemDl3O8Do5ZXsS2XdRDUSwjidcx1oltmlkuwUOKedJTJC96lm6AJC0xNz+DeoOjg1Ak4VggMfoUKXybcE60k52JoensrLjXh+WRpmH83eoScbvC9lVEGYqkh0G0ZnV5DV07i54dZm7nVqJv2wxQs8vSbtXtPCIXfoqcNrwI9SixK8ecnuUAxBlhuSooh0Wpe/jwMrJcVGWYotfA2tdu0kI3HrHQtvvTwIDCFNPa9fd7T2ye+dFrpxK+gteQtdSWNbfpxwl6Uc3yq2E9qVtcaptt5CAuMfQUvFyx+mvtKr1rvfFN8gF2zE2jXrMKZ+v4I4tfuLD6k/BI8DoshBBCCCGEEEKIlwC+h/vYIPT0yPtoFwNMJ328dv80vuutN+IN12/DVNpFI1tFIyn8a3IaQ+2/vdvTOJrbe38w4AWTnNv1grGO4wycjPFQreOeT5rzgl1AiBcCy9uZOVnezhSC7Edzoy1bFlVZjQuWV8ZTGEltBbugSrycs8yXeWkhx6Df9zRxnHpOabGOpL+IEazh6m0TeNsdt2C8RT8PK9f0ErF0zLakd1ZcILWwbesW9yThB8PuUmUMBgMXLugR4lXkNPzLfk65cIb1FeyJhSHLMrfHVUQWR4+QmtXxTslxgHpoRjaflqjb+nqRoxUVaNKY1+vaFbD4up0nPUZoOLfDDFfoWXYungW73/TK8MLA1s/m7N7Tz8PLssVxAAGKHlWgKMLS4WLfhg2V+VD0sLwsUPgIJSj8pZbHOXqPFFaGs6iGzMqge/CdqWCJSwK2POKyJPKvQVjhEquYnVqJrdM1eHeB9gBgxfU+71wNZz1nxdTtFkIIIYQQQgghXipoeKslJVpJgVq+jnqxjlY5wAj62D5Wxxtv2okPvOUm3H71VkyUy6j3jqGFHmoYhK/CE34lHkyiNLx5jjTsDoN3ycO1NLzR6GdpaK5jLxFJmXlgVy5CnC+GRc3L35kDSyltUTQos/AxcWqhbuWzZuWRBmorn+y6yj05BsPur5i0ibTWsZkYaVSgka1jMl/DTdNtfNuN+/C+Ww7g9n3zGG8klkeBIkkxiGq0gFlZT9AsIqtjJbbMzboYQVh/CLufosJIr42Kc6kaFCX9Q2TLvxJAOO+eJYPMjrfE3Moa2k8ewtTyGrZGMSYZv97DmMW3VlaxpdXAaGrXxI51YPlxHBR6g8RUQMU5wSvHLs5YrhhoE63awdTaXIaYZc7bxGAzZc85qd22ut27lN45Xm6DuBGkE2t7rUCHcZ2sPFqo50DD7jHnOW1mNp/B89Hdu3SRRfwyhX0DMvBLEOqVMyN1TDZZMdmg88cRqyofAScrbxjASrdcCCGEEEIIIYR4KeC7ed7rIsr6aPhAyfZWXvobOtK8j9Eox7VbxvDOW3fg/a+/Dq+5ahZT0RpqvSXUir6ntSyGOXHMApuWfLfnMg3LFD34tXMQPnxahi+ZQ7fYvrEQ5wWWppMhlMHTA+EcR9lgOR9+i29l12JKWrBYbi1RYeW0oLG68LrRqNWRshuhzLYddFHvL2N7J8Zbb9iH737j9Xjbdduwq1XDiG03O9r2j4GZH3PI6V1Spkhsyq/+O60WpiYmba9B8KBQUeQcD9eObSgynHIuIep5wfwoeLALLE5DN1jMBajVEhx84H584Td/A/d9/o9w+P570F845gO3Lz75BH7xf/w3/Lt/9qN47N570LK07DKLokxar4X5/GRX9uKFwjbPSpffCwZrEWkHdVsoyyTFDorCFEkoiAQxJLX0Pg6TzbOkEpYHinmgWGcwTxdS7B6ltpyy3FZ5DQPb3bBfcSkia/hlCh8YrjRb4ONj28w4WlS3rVIy3geYssrNBsArLpvQjRZdFVIIIYQQQgghhLjQ8O07sVdxGtC8q5+k5l+s94tgCK7FQLPoYibN8MptbbznVbvwnlfvwyt3jmMy7SEdrFgmuXfDwv7o3SA3zM+/cPYPH8MXzSftAMTmaJhlYiFeMCw5IVRwLpiV+Ofs5kRfa4lTfrDrhmUahnMrmQVyW8FyTM8mK/0oM5vPY6S57StbR9k/gUaxjB2tEm+7die+6w1X403Xz2HHSB2j8QCtqO8Dne/eshXttIHIto0KdgWfWnnncOixVZEEtVode/bsBsf+sKridrI+u9ay+dNrxMkzfH6w+yt6gayv2/F6vQ45MO6Tn/wt/Ni/+TH86//+H/Cv/sd/ws/++kfwwNHHUdSBz9/9RXz8tz6KT/7ub+DTf/j7OLZwzAdkd68Py6MY0ChP4Ui8GFhq86iOftREL2qhayGzZUoX4U6FdvJkWxm2IZWXHcs374R7NA1XlFHuoYgKZEmOQZyjn2QYJANbHli8BJBLGQkglynsW5CNLLsKbMQZtk2PoW3zaVU5Df9SZLjkP3zYslpFHdZoIYQQQgghhBBCXEDonUFDWuiqJ0GvsGUabpMGsix8Ad8oB2iVfYyji63NAq/eN4333XE13n7rfuyfaaETdVErukgtDUPiXbmE7oVKN+LZO/7Qqsu3/dD7A9eGIMQLJZSak7Yjzp0UP567TG02O3kpdFsUP9ClIZlyCEOE2Mpqw5bTbB313hK2dXLcfvU8PvCma/Gum3fgmplRTCQ56lbuo7xnB9FHLY2xY9t2tJod5hACvUssr57tN7N5dhm/d+9e1Op1Pxh6aWRZZtvzwOg15Yd2CjyuM0SfEXp+VN1era6u4pOf/CT+9t/+2/iHP/RD+OSnfhdPHDmEx449hS/f/008dvxpO7YS9z50L5548nHESYmf/9BP48O//ItYOLGIrCgwyAZoNutsKVBamyBeOLynwePIriFbSCsHLAuc+lgfNImyLA7bTB/zxcpFGOjcyqO3myfLwMa8FxbL16aF5cH0WWzbxbFPGbh9qB/iUsVunbgcYddXHNCpZpVwpB5jfryNpj0EoiL3eKvRTOVpA6zmwzkXRoQQQgghhBBCCHEh4RfEeUzxo44Bvyjm9932cs5xO9OYXhzhTd3f2Nm9SpGhjQxb2zXcvm8G3/2mq/GOm7bjmukEE+UiGtkS6mUXZd7HoOAYCPzSmQP71pGlDR+MlznSWEfPEBR9FGVuodj4Up3TauwCfs0uxPODZSVYeVmSOKaGj6th0A7lspuVq9LKcWblu2chY7mzbSgExgwUAK3o5UwX54iSzNatYKLRx2sPzOEDr7sa3/bKbbhutoXJNEM9X7fturaHgdUjepDEHnYf2Idmp211IENpVSq3fxQZonrsx0QPkKv27LXaFod9005m8SzvVdmvuq7ydQbHCuE61pXngtuxC6wHH3wQP/qjP4of/uEfxm/+5m/g8cceQ5QVaFud7FidXzlyAt2lNaytr+HEkePuFdNKYpw4fhz/8xc+hPvuvde9VPi9cmlXrbDzHF5i8QJhG5qWPdRcKO4h4dSuZ83H/wjCMcogLmVWbF0cSVIrT1Z+LPQtMogYFJbtL8uTTb2LQXY7mNse8lDWUTQtQcc2bCPJm0iKGpURlnRmIC5B9KS7TAmNNCv3APPjLYy2UqvY/HqEGvowDVtQbwJYfb3aMloIIYQQQgghhBAvAW4oBjuqSn3KL945UC89P/yN3V/TIxQlx0jgl+wREnqFZF1MRl3s7iR48/Vz+I47DuAdN+/BgZkGxiy+nYRxEwaDDHmUol9G6OfcH790jpCXGYqcniI0+tIAzLxjNwBzH2SzECLEs3OqPcktTFaWfN7KEcU7Ch+0EFtxQ0SjflpHVG+AAmBG4SN3XyhYDBrFGur9RUzW1nDLvlm8/8034l2v3o9r5zqYr+dol2tWD9as/PYtUERhPWIdqaGIa9h37XUoqCVGVpdiK8MRB1Lv2rFYfch6SJMI+6/a58bq0kWZEDgOiBuwWc+sPqR2Dhk9Q2w5z62GplZH2b38s8A6w+6uKICsrKyg2+3ihhtuwFve+jZ8+/u+He/7tvfhPe94N97zzvfgXXe+G1tmtqG7bGmuvQHvede78Y4778S3v/e9uPmVN6HebNo5BQ8CCpWhUeDZiheKWz8pVlhJ4Ty95Nj9WghhXWZt5SBpYKls4oSVxhVbdyLLsVTEqI1Mej6Vd93m28B7FNXaKOojWOpnWLcytxwVOFGUWGfZidnG17jVcAtxqRF94CfvVs26DMntx1E9yjCSLeMtr9iFt92wFVNJH1YPraG3Rrzoe6XnDyj+0KK7F6shFVDG+1cnqphCCCGEEEIIIcQFgwYxH7nT38ntTdyFDxrYgvBAUx2/aKe5rvpGld4hHJCXA+u6WS9J0I9rWM0TPL06wD0HF/G1B5/CwaWe93GfJQ23EdDAxz3Cv3QeoJZGFlL0B4wLeVdUX78zVIKIEBUsq16WfG4YTisnXnZs6oIHU7jnRChPHI+jZ4vs3omDlVNoSG19UnRRtzBRy3H9ni14xVVbMDfSwFg9RqcRI8pz5IMu0iijJhHKbZnavt2/hHvz/JdXFvFd3/3d+Prdf4wkiTA+MoJf/8QnsH/vfksS6tPDDz+C73j/+7Fw9BgajQa+8zu/Ez/yT/8JklrND7rb76Fm8wwUQZhvyq6SKJRYDmejEg7r9bqPA3L8+HHPYzCweleUaNYaKAZ9t8OVFj86PoZG3erv0iKKXs/SBM+YNUs/NT+Hth17bsfCtsG7tbft2GaIFwZLRxgAPZRVu0s25XIQl1e6GT79xbtxdK3AejKCdfecS211grX1AZ5eWEbGfnZY1mx73gOKy4TtMcvtZD3H3FTHx3UqeL9sL7ViHSNRH6/avws37t2GiIKauKSw+lom173/r/3IcFlcJvA3DX8k0X1rLFrD627YjZ2TdLmyxtbWhIePzfkDgg8Kl8VZ5S3YDy1vD7xpsCCEEEIIIYQQQogLQegUhe/jZfgSeSh+0DznRjo3trFrrGB0C+Y6mnr9e3cPyPuo24t+PU3QrNcwO93B7h1TmBobRd5dw2B1KRhPLW/mROMcPT6Kkl+1W47lSa8PGm5pwK08Qap4ITZzslRwbhhOKyseW1Zf2w8FkCK3/wVyK3v88JZeEo2EA6Kvo5YtY/tIgpv3TONNN+7BzbtnsHM0wWStRDuxPPIB8kHfu6Kilwa7HmL/Vswn2LUsWBSlPBq3v/T5z+LQ44+h6K2jnTbx/X/2ezE5PoZBb4A0qSGz4/i1T/waVk4s2WYR9u/bh3e+9z0uCtJOzn3UrD5xLA+KF24rK4IoePq5boZ1h9vQC4TTiYkJjIyMYHR0FGO2/7GxMTRteWRqEs3RMUS2PwoqnVYL7U4DrXYTE1NTmJicDnY7218Ss7Mu1t2Nqzncm3j++BX04AXFbqi3qDZl2zqIGzjWBb503xM4tJbiqbXIpsCRtQJLXbtDcW24DbdlGbOt3a7KqUXYfe9bET+2OsCR1RxHbXp8tYujCwsY6zRx44G9mGik1s5TCBSXEl7HJIBcfvAZQIWSyvl8I8ft1+3AZCu1esoG25rKYYNZVX6vuf638C9IGFt1jyWEEEIIIYQQQogLA42qlZDBwLdwvq9ziR3/c74SSPg+T/Mdx+8I62h4s3f6pIlBaW/0RYlaEqFdSzDKsUDHmrh++xR2TbdRH6xhfeEYkNH4y+5YIh9zJE7rPAqEbrBO2gBoEKqCRBBxOidLBOeGYVM54RxLqJdmW0gtsJt2zvu4MklqiWLEg1U0+4vY0Spwx/553HnTXtxC4WOygdFagVpcIIlL5FmGMrPyndaQWs5xYaG0PdAbwvJhfaEtjNYuhlpZ4NjBg7jnq1/zcTWmx8fxvd/zPRifnrb9s87ElmeOCYtHXuJVt96Kd77jHdi7e48dVoQsz32A9MGgj/VuF41a3cUa7yqLdYInchYoIlYeIBRBmJ7nTBEls32614EdAh2vuuyiLi88bw4EX7KLrjzDwOIiO86S52gnRg8ZO2DLN/fr5kG8QFg2+I/trAW73hScvd3lPbWy1ex08PiRFRxe6SOrd5DHVgao29m2ubeFvPb+P5Q0Ww55WkxhudrtyYvEPUVS2zax+zhuhf811+7CdbvmkFp54L7FpQXrqASQyxAXQKwKJ3kX18218cq9c2il1mgWmf9Y4kOHrlrBZY6PhgArPWOJBBAhhBBCCCGEEOICY+/nldGWUPAIS8HIybfyar0b6XzeI+29nV++B78OmtVAQ6u908dFD2k+QCcpMNFMMdNu4Kpt09g1P+feH2trq8OxDix1zkGdSzfsMtPK86MSP3xXEkDEaZwsEZwbhs3lxMsUyxiQWlHmGAvFcNyZMmP3bX104j72TDbxhut34u237MJNO6cx30wwlmRoxDmKrB/KIMu5FU/KgAnL+4BdvyUWYeXXggsKw3rk5b/MUbeCTjFjsN5Fu9XGNdddhzff+XY0OqPILGVmebQaLUxNTuLLX/oSjhw5gru+dheOHT+G8YkJNNst7/aKubbb7Y264OOUUAixf2eDdagSPOgBQnGDQgip14PQMcgGLnDUKECy6lHwYE22dbVaClbHsqBdzs7P9ukGdjtHCpXhOm+61uJ5wzJCgt2UeEvrV5NySBE3UKQtPHpoAb0ywYACm6Wp2z3xLe3an7zy1X1gDvbX1lFcpj2VHk4U/RoY4PodM3jtNTsxWgNq3lKfveyIiwPrt8YAuQzh4Ej8LoQDRn3nq7bhLdduQcMaf/aVmNpDJrY7mrFSDwWQ0A8jHx/ss84eRvYvo9I8rMRCCCGEEEIIIYS4cNCGe0Z8RVhZpQlGXxrsaHzjwOk0ykVucC7tnT7ml81UOix9XtifuI4+v0qOa1hHjoMLA9z7yNO4/7GncGQ1w3p9FGsZjUCWGwd5pmF5+BW7f60vxGkEIy4D54ZLLI4278EKk3fpZrO0OVH4iKx81umd1Eyxb6aJm3bNYM/8KMZaDUSDDHUr0U1+vOvCRxgngd4a/r1+RuN/ijSxVJZ3ZrFFTLHD1/o0iB8npYler4+/+lf+Gj73+S9icnoGH/6lj2DLtm3h2HI7Fju4++/7Fr77T/0pLC0soDfoozMygsmZaczMzWLbjh14xStvwuvf8AZcf911LgTmdpwcLyTjp/5nwdNZ/gz0AqnqUq1Wt13nNs86CnAoiFqN4opdP6vcScR1XTv+0q6X1ei4Yefb5OEaFlf07C/HIqlM9uKFwm7TwvgdFM94DTkXxl0qoxoGtRaeXuvjE3/0MO56/Bh66YiLIN5FVsaB7euWBy2uLJ+8U8GuSiohOU452HmJdLCOrZ0S73nVHrxu3yQSK192YzfacXHpYPVTY4BcqvgDxipg1eRxujFvtSkuMjSLdbz++h3YNt6yZcod9vCxxpZ1PIz/EXvFDU2nTa0SUolmRt5/3UaOQgghhBBCCCGEuDDYuzeNmnwP9/f8ykLGl3R7+/d39WGUQUNzkDyGNgH2iuOGvOpb5BLhi/VhnjTYWf6c5ZC9E506dm0ZwZ4tU5ifnkCv37PYAaJsHTENdMzQ8uAX91FMQyEFlzPZIGh8tn1xF77+5LrwN1gbqqWTIZjMGQIhzbkS8jz5j/v18SF4vKdNq9QhVPu/WPAYqmtUBXKm5Wp6+rrzwKasaLgN13ATUbjPp943S+MD5wfjsAfGWXAhwrfJkRZ9Cz33Rto23sT1e7bjda/YgVfvncK+iQZm6hEa9HqwbRKW2eEHusyL416EwlW64ZliXJYVKBPbQ1JaueRx0ATt5mwLw+OzYxlYOf613/otfOiXfhmHjhylNQy3vPrV2L5jVxD5LM+8yLCysoyf+dmfxdKJJR/8vJ9lOHL0CJ4+8jSeePIg7rrrLjzx+ON429ve5mKGn6Gf67PDNKd6flD8CEIIx/EIZnOWU3YPZkdOQaWkuMFzoCeWHWPM7YfXg9tSUIptrW0vzg1ec3poUPzwFtMupV9vKw+8F3Z7ECc1NEeaOPjkUfTt+g847ovdMZZB3p1gTbXyzULAdtvimB9vi4/RYveJg/S34gFu3D2FV189h07ZQ0pRzxtJ3b9LDT4vJYBcNFghWK2G9cPgJDxYQoVlDJtdpvKBpSwh01PkaJTr2DXZwM0H5jFeb6BmldYFEKqUtimrL3PwYNux6hNvBBjpa4QQQgghhBBCCHHh8bf/ECobGS1qJxdC2IirYoLB197mLVTb2vu8J+EfCh985+cczXc05ZVoWtxEq4YtUx3s2zWBPVvGMFrLMVhbQNZfd8GE9gEa/xDX4F+p8/AsB1oLQqfaXAdkNNomwR7Br6A9TZT64dCeTQ8VtzBwnYXQi89wpSUKxxeOsQrhL7cKMX7klm5zYHxix2VniIgDuQ+njHfB40zTjX/DJTc4Vwb+KgWnIQQ4d/JYNgfm63P259Q1m4Mf/WmB8czz9HzJ5rhqPog6IZbnyhle6xeAf/Bq21igx0HB87YDdy8fy5AG9sJvmKX1qJB2o+s1flBr29D468dTWLnwr+NDjB8U09tSUg5QL7sYTfo4sGUEb7xhN95ywy7csmMEe0dqmExL1KPM8rAtLYT7MAyWz4aR3/P0I7HAddxTCDRauzF64zIEWxmL7Kf/4DP4sR/7/+Hxxx/38sYv8/dfdRVuveUmNGqpnbOV2yJHL8vw8V/9VSytrKDebCBOE0zPzOCWW2/Fne94O77v+74P73//+zE9Pe17oCDIUHWJ9Vx42ebxD9OH8wpnGozn4bxYPL2I+gmHG8A0Xk88hGsU1otzxq8hp6EuhfLDcsTyxLKY+zgztVoNgwx44tDT6NmNKWst79aKd87Tun2V2dmStXXsRYf3hr4fqZX9OFvF3tlR3HHdbuwcb6A59ICS986liQSQiworxLBS2GRjiY0lH+jeaFbxrIBhmQ0ohY5GvooDWydx7c4ZdNIUNatoaWSVLeYjjo1nSO/ihy2yCrKxze3JERrZkLcQQgghhBBCCCEuInw5r8IZGRr1TuH0DfimT9tBZezLkfDjyTjHWD3BVCvF7vkJ7N81j9nxcRSDHrJeFxGtyUWGNI7A8UQpWtB4nCRuRcCgoI2BNmy3JCChgZj7dWsut+FeeXw2ZTTnGec2Cdo2mM8w/dBOEeD8puXNq4ZUKfzsbYZTHw/C91FNufLkNBwWl23G/w/TeQJPtLHEaeDkumdg0W7gtn9nSeFrQn6cVue+OXV1DCf3eEaGm21s6ef4/GBX6RRQqinPP/Z7yG7SwkDdvB9Rkvg6LlaiV1jHbYLxvzLiu2xk5YFdN3Fsg3o5QKPsYgQ9bBtLccu+bbjjhl147bVbsG92FNM1oBNlaIJjgNg+n+t8T4FpLdg582qHcrz5modj4rHRS+SjH/0YvvTFL/omjXoD42NjuObqq3HD9ddhbHQUHGg8pcfHoI9v3nsPpmam8dY734Yf+Et/EX/tr/91/Inv+BN4/etfj2uvvRYzMzM+lkfF8xU/zk44Vg/2P5TJ0+I9DM95I4jzQbi6bHtoE+WEgl0oT2maWBNn81Y24nqKg0cWsdLPMbASzrFowrbB6yhAAYSBZc+WrFwlRQ+TjRK37J3FK/fOoGXtZ8PKO9tC1hnfsbikYJ3WGCAXCW/SWYE4x8aVDza/E4y3ysVFqzOsfl7x7H/YBqiVPYzmC3jna67Ha66ZRyezBp/qe9RDGRfIrPLZk842iBEXbMRtavnxQcg+FOlGWAkjQgghhBBCCCGEeHlCgaMchL7tizhFt4jQT2Os5RmeXMzxyKEl3PPok1hYH2BlUKCHBAMG2v8SjsmQIHZbYDAA0pCU86t+g134uDHd/9mUdgeft3VR7AZBRgYPA9o03OLhdo3nZ45gKu7LpszgdDzDsA/ntHwpBND2EQhiAGEU7SG0kWzgniWnw/2GYw/7CtsNZ0+ZhrRhUu2S5lD/6vwUgl3nmYRIpuaRMM+QL5fOuMEpMK3vnp4Efi70KOA9oSdI6V4gEb05uMZ2wnh2QRWM/eEcPT0Fr2JgiazMxPzaPQ9jdyDDeK3E7rkJXL93K7ZPj6CdJhht8yPdEhk/p7eLQyGBeUR5gTCsdDiL883i4iKWl5f9+MM5ACMjI5idnQ3nzGOw8+F5Hz582Lur4tgeDOyuijBN1YVVuD7hejFwXlx+eP20W0cJo6o3VT2kMEw9tlfEGKQNrNjCH9xzFL//lW/hBFroRw1rBqwc2DYJvTksF9aM4AGVej2KygztYgXXzTXx3tuvxd4pK0vdvtcRFpngIScuNTgGiASQi0SoRKcJIDYfVoYeOfmg8wbb4+y/ry7dzXA+XcafuvNWHJgfQ9IrrKpmlsW6V2a6p1rVs39BAAkPfbvhjOcM157x4S6EEEIIIYQQQoiXC0nJjyg5JgIHbi4xKAtE9ZpFplgvgJWsxGo5wMHjGe577Gncf/BpHF8bIE8byKM6cn5fadvTsOe+IFHkYyxEKcdryIIY4l4F4Xt9LuZuQI5pkRh+eW2Rlb3D4fzm5TNDY34YB+IsVNZO7zbpmdDu4TaR4TI5e25nspE8v+PcjG/hO/SrYbmG8VYCbgHyOdqDqnlu4Ck2H6gteJdYtuKU6NPgvp55hDyXcE3cqG9TenvQ4M+pxzOO08rmZNPQbRk/mC2QFutooIuReoTtk+PYv30O++bHMTeSYNTuv5UO9/LI877tqURJ4cPKRO4ii113K2s0IrNUXCgoZAwGA59nl0aZlUeKFxQ1KGgw8Jw5reB6pqvWV0JHJXyIy5uquaBowXIYOCmAcCyWPEoxqDXRTVI8udrHb372Adz3+HH0ax30Y8p2iZVdy8jbFWZIm2pi29GQ3sWWRoZ337QTt189h1bRt3VWdgqWJaY8va0TlwISQC4ifNBtFkCGj6Sw0nBXRFZY1iA+oGxVUKFLNIs1XDsJfNdbb8D8SBtpP0MjylFmXbqMWLAfNtzeHvYJhQ6bD/lbZffWgOHkA0AIIYQQQgghhBAvQ8qYH/M7tTRBjQNM5wP0Bz0gjpE0muhbmtUBXBBZzjIcWhjgwSeO4vHDx7G0HqFbNtHLC2TerRGzLN224EZ8mw+m9tiN6Bv2CwQDvn+HXVklN6jsEjQYDmd95nQsb8sz5H8qTB7sHJw7LT/H5izqpAdIIKQ6E5vTWaqNYz51+4qz5wP3LOHmPPIoyjwuWH2Yl0153TakgWq+Ws8om5b0vmDXPcObdxY2joObhInNBHtPGVuebhuynN2gG7JmN2b8zp1jfsD2UWQ2LQb+QW2r0cBIs46tYzXcsGMS8+MNzIzXMdJI0bBtUooLBf2EglG54HJq+aWplQ+KC5YXxa/I7vzGwZ1/KGxQvKhCEHfsPG2+Ejwq7w73SrF1leDB+DNtwymXSTUVlxdVa0ERw+uUlUWOqcyy6r3rWMXs53ZvGx2sFjHWrD28/+AiPvGpr2ERdazHHau/qQu3lQ3V2zGr1CWsrJdd3LZ7At95+35MRn2rE33LM7E8bRt2OceB7i9kwRfnhASQi0ioiEGYOFUACbeDdY06fGEViTql/bRgPfVK28lX8OZrpnHnLbsxnkaoWVzNHlxF1vcfH7AHj91a28IeOvbg8+e2u0Gy8lY/HcIDQQghhBBCCCGEEC9PaBdg11dIYkT8Qj7rohaVqKc0UOcY0GCdpIjSBrKyFrrIimL0ixwrvQKHFnLc/9gyDh49joXlZWSWTw8FurbdALSmD7+Mpg3Dtksi9kLhJgiuHR5DsH+chEYKBkvDtD5nuPHiVGgPyWk7KfmBKA2ZwxXGM6UR7mlTfuQ0AeR5c4ZjIYw9uebUvM+8qyr1SauPz2++Hr4h48Ii7TW0E8XI3AYU9sMtw5QG2cowGz5y3ZTXEBdV2MWV3U8KHRzfJbFkLnpkfQs9pBZXjws0rCyMNGuYmRjH9m1z2LVtFDOtCO2sxFgzQhrbfWAXV3aTKaC5XMP92/UvrExxcHWeTjglelLwlKxMuTfIM4/tfEDBotfruRcIvT+63a4LHZsFEHqHVOIH5yl4cJnpK3GE6RkI11eiCLvMEpcboX1gPfLyb4Hjd7AO8Q7TGyuxcpvZvS+SOnpxA10ro0u9AT79pYfxufufwGp9Gllcs20o5A1rq2VIT7o4X8f8aIz3vHo/bts+iuZgzerQAFlhbaDl5QOgSwC5JJEAchHhQyAIIFaJrHENwkR4gPiUir0FumaFnudYWYG6PQBHsmV89+sP4NZd42jZdpRIIirYNqXC70NN2XZUPEP+VmE9X1b68AOBDYEQQgghhBBCCCFevtAYOKB9ICrd9kDDHg2CNIi7vYB/SkuTF8GGkNTcnsAlLtOK0OuXWO7neHqpj8eOLuLhI8dweHkd62UNfUu7zq61Mm4BJFEMmo79A0zff4I8xFg4nWCfOAU3OtIm4n9t+9iPoRJAaB2hJYWpgjjAOWL585zsHKs9cU1u5xCsKWc+gpDKPzn19VUa7oFr3JvDppyv1lV7fCY0uhobCTlT2V7CfgjPjbYZFxH8eC1ieNzhzEIGFJY8C/7xqQXOMvlwemaYCwUQXnebowtQ3kdacOzYDJ20RCspMN6IsXVqBDvnZ7B1egwTnTraNbt/cYmapavx/tg1zuz+luxKzO41B0kv7MA4yDiPv1ZLrQxROOhbWsaFe1L6CCBnu+8vHooWm8fvoMBBMaQSMCqxgyEbdnlVdZlVCSOVUEKYnjCOeVfL4nLimQJI5QHCUhj50AHhvlIYyaI6MmvvVgbAU4sr+NhnvomH1qxNS5q2ZfDcQhmEsKgcYDzq4o4Ds3jrTbtsvo8OB0eyeuBWWa9roeaJSw8JIBcRXnQKINVg5K7aRxQxgtwRu3tV6j9UQh+KVOsLtO2BMlks4wfecQP2T9ZRt/aaD8wss4cZFWrLs59ZHj4YGb/oCE/FoHiGEPYvAUQIIYQQQgghhHg5Q5NATgM1hsb2iN0TRW4kjorQpRWNgxy0nMZ6zjOGUzcCW7o4rqG0sF5EWLcM+3GB4z3g0ae7eOiJp/HksUWsDXJ0B8WwO+4yGKFpRoybyOO6LYc8T0IbiFtGwuIpVIZM2kWGWw1tG5uhoPOM7d0AH5LS7kFDJ6enbboJW+GJh/kPp9VstRmPgvPV9EwErw4GLvDPpms6PNZgl+Gxc8ojs3hfF86ZcUxHw21m+eVUqJ5x7U7l9HXMjkJXkvdRp5hhh8FPa1tJhPmpDnZtmcH2uXFsm6hZXIympakzfTmwkPlX8jweevXQg4THArv/AL0pUr+mPFVPxTJk21A0iWMKEnb9KUL4uXsHaBbOPxQx2u22iyAsp5XXRtW9VQXjKWowDQPXUfyoxBOyOb24nGEdYt1hyQx1nx+WU8S0v1an2SLZOisHtXod631rr5IaIptfWM3w6XsO4re/eRhr1mZ5A8Ay7AKIlaF8DfsmErz/tgO4ZusIGkUPxaBrdYvichCQk8TmvS6LSw0JIBcRXnRWkiCA8IFiMS6AUJEs7aGT2MMmRs+mZa1uVTVH3UKn6OKa6Ra+67V7sbPD6piFvFjJvNHmQyY8RtlXZoUEECGEEEIIIYQQ4kqDRt9BsDm47YGmQNoDaAqkzSDYDWhip22C1gLaJNxQaClpQXBDohsTmbDKI0I/Z1dZBVazHEdXSjxxbAWPH1nA4cVVLPcy9EqKJil6RegKiSYK3w/z4D92M2PLFSG2mq+mPG47Ct+/zXseFiwPSguFrSu53rcMeQeYv0243bPYP0LyYVrPg2ktP4vw6zPclMmqJH6ZNvBYJwwwfnJl2DPztjgms3vg2YWdcTFM7SB4HIzeMKDacs7rz23sHDZy9TQhHbfxbncYzWtg+6GxP00SdNDDdHQCc50U83MzmJ+dwdR4C2PtxLu8qkUcD4a2J8u/CF5B7B4r2I1CyeC4sgE7Cz8A/rEUNgkpSDigsGZ47J7HhcfLUXW9jNOXTydcs2H5e5Z04nKFAoi1B174aBO18nuaAMLy7UKjxYXPz/nReYosTvDQUhcf/syDeHRpHUVSs/U1W8+xlQcYiXt449XzeN/Nu9Dy+jIYlnvbR0TBj21QqAXi0kMCyEUkKJJWlfhAcQXdKkzMvuKy8AByX8cU/aiB3B5OWdFDC310+qt4+yv34c5r5zGVdi0PultVFYwPp+EDyvJlpWdF94f3sJKz0jvD9UIIIYQQQgghhHh54gY/UGigiS4CxQsa9YIdIQgTIZ0FGtDdZlD6f25bxEAWVoJfVyclbQucp/GQdgV2cVVH11L3Y4YSS1mJp5dKHF7o4vHDCzi6uIpuf4But4d+noNjEHPfPDIkNrVjqo6nmncDdWEpIqayPQ27JiJcF77oZ3yI8zOojNt+/JbGAsUcX8tknB2mqagM4ZvjwjyNmlzwrAz74/9Dem5HYSJO7OiGefgqO6bhki3bmdh1s4kR8mfeIdB2w/NkCJv6vfD/9sdWl+y6ymc9Yz+X6iv2lBsVfdSSCPUaxzkofZD7idFRbN0yhx3THRyYjNCxfNKUogjHZ7HsfGd2QDZlPrzHhNvb6k3YUdBoxMBz4DHQbuXzPFb+reARc+wXbhOWebzBG2dzOiEuJGw5QnkObRPbEtazYAtl2QwCCNN5CT3ZHkY1LFj43MOL+PXPfh3duIksqfs2tWwNV8938P47bsTuNlDP+xbPcs22hpOh55PnyiAuNSSAXCz4wPAHgT3eC3ZTRcXRHs5DAYSVMcn5w6NmPx7q9mPDKmPZQ9t+Uoz1l/Bn77wVt2wbRzNf83xYdStXS/aLGR44rMh0dQ3zrIys9szbkQAihBBCCCGEEEK87Ak2gjPYAPhBZpjZMNvREF5BI3ceF8iSwjNhPuyuO3xcGQzktFzQiD/ILS0zqaXgqNmZpetm7MsC6NufxeUuji2esLCMo0urOHpiHUvrA/TBDz9r6OWJzbMv/bp/fc3xK2heZNdNUT5Awa6OeGwUD2ILUegCvBJDeAxugnRxwY7Kx3cIXYn7GBhc8lMLpvsgbzBtdQ0Cvo8zwDPl/wCv13C/Fngc/Meuxez/xjHktt/c8uO4Gd7tmG9V5cA/3Dcz9Y3sP6+lHd/wGOjVwbWUqZIoQ1pwXI4MDbsnLVue7NQwM9rB1pkJbJkex8RIA+16jEaS+MDl3I7/eWWYow+EHnYc9ur5D21ERmVLInFJQYP2Kh4mPVEoftg9iC1wY+bh6e24bcr0cZF6ueA29FzhNqdkKsQF5WR5fjYBxMOwWG7IgFGCbtrEE6t9/NYXH8Fdjx1FUWsiz/uYa5Z4581X4dUHtqCZF6hbe8R6RDEw1AsuMG9xqSIB5GJhlcOqideOJLeHekl3K9gPC6r7oc/FNLcHpK3rJxz23CprOkCrWMWupI8/c+crcWByBGl/zbbhDxJWZULV3/JkxbPAh1II1Vo+lMK8BBAhhBBCCCGEEOLlToyIH166RSAY6YIRsHSjXfh6mR9pBjtC9YW/p2JEVPgYItyQk9jzo7mf/2J3JmBeSWLxsc2VObIiC+kpQkSWj2WelfRDsWmUomerT/RzrPTpJbKCIyfWsLDcxXELJ7q5rS8wsHzpKZIVQUTxQ+UeOdap7cfjOEgFd8T9xMPxJtzoWaLgoO4W2K2TmzjtOFxksH8bug/Tcy1XhQhLGbanuBOuCa+NxVaJ/OLQZMoZ5ssJ03MpxPmES0li++LemcSWPR2vPfdq14XjUNgyxREeEvOsxBu7nN4BD8d9bTdSdJo1TI60MDsxgvmJUUyNxpjsWBq7F6ldh3pcoG2XILUpsgwZBaO4YfeOg5db3gy+fx4fj8jScZ9+rBU8snD44T7zKHlW9s+FD7syFENs2Y+VW/C6MD0HSacIwljLgLYqphtmKcRLAts2ll+KHyTUNq/lPt2of2HR4SwHMh/ENaxENdz9+AJ+9Y++gTXaTYserts2gQ+87iZMNujnlKNuDVNq1YcfpFMgdgHEOLUuiUsJCSAXC68VfBDbQ7So2TTFwB5UGR9U0QCpPaBTeoAUFh/XMbDqmKZ9NAaLuGP7BN77qgPY0k6R5D2rbNwuVGVmS/HDP85gpbdaTWEleImE9Sn9V4cMn1NCCCGEEEIIIYR4GUJ7Q1zU3QBQGe1Dl1g0HNBSQNtBbsE/03Q7AT+kdPN2ZNtsjAtBuMx8mJC2hdiSMFgK75LK8ippgKRhgkb9YH/gsufNLZOaZZOA/V8M7DA4dql3s1WU6Ocl1vvAieV1LCws4djKOp5c7mKhX6I7GKDXGyCnIGKZef/9PB3bR2YzFEu45wh2vhRi3EuEBvnERZpgsrd/bgix4wkb21wlgPAP19nBDJc9haXzo+cCV7voYrlZPK+Ld83FlVy2CZMwMM++xQ1sicfj3hcWn9o2NbvuKYNtl1o8Rxtgh2Dszmqk3cD46BjGO01snx7DZLuOkVYNzUbs63lNOSwz07NLq5geKGVmU4opzMfOyNUOu752EH64hFE28fFEbB2TsAuxQGUeDlOemX8xzzC8TgGb50ka1bluZnhpfUW43qenEOJCwwJodXZDAAmEJZbbEOMl86QSaliryHYpTXCkW+D3vvwgvvyNezA1PY533H4Tbtk+jTRnq2X1NKfoyLYrR5YEjyiWdea5WVgRlw4SQC4W/sDw7xWQ5OxTruYCyCDhDw8KIBnqmT2mi9QqHwUQPtBW0ckX8J2vugZvuGobxmJ73JcDZPYg5bYcnIoVLbWHn4sgVqmpzgfPEu4p7FYCiBBCCCGEEEIIcaWQIMlpeq9sAcGwXXl+cDl4fdBoGLmdwGPdXhCBBnB+ZFltzXXhi2cmCEZu2shpUPf0PsM4CwW9G2zJdl8UucVZwji2OIuIKDwwHcWIIF24wTxOXJzIsww9O4g1W1636N4A6PZLrK4NsLyyhhMrq1jt9rC23rN1uYWBB9vMu50i/Ko7K4Ip32UMxlue3Ftl+6+M9PRS8XO3NEwWsqBwwYkt2LHyGrhnhC2Ho7VrEzb3XIInhwUXX2yvSeJjhHAvFEDqFt9p1DDaaoRpu+Fhot3CWCdBqxGhZhlRpKhZXuwPpG75cB++G9p57MDdS4R7t+vr8y5qhOsYVestjveQ5zo8GT83vxJh0dNRAGLuXMMpBSluwnOmn42XFV9kWQhG3uD1wXkvNZz1MuEp7XhD9vQI8RkhXkJYCq1kshwPl0jVfgUBZFh+vXyGeQZvJ2y7flrD/U8+jd/5zBexfdcWvOOO29DOC6T5ADWrXz5us9UBeshlMXvl8VpwMieV+0sOCSAXC68NHOvDHigFBZA6+vZEqzxA+C1EzR7aacExQDg+CB+Ay5hJ1/Hn7rgRt2yZQD2jX0geBJDwRPb8KICklj27uqoEEE45kBh3GwQQBv7IsYkQQgghhBBCCCFeptD+UIWzGwFo+KNhm3YC2g427AXs2mjDfBjyYS8TQTQZxtm8e3twu8LiS5cBgvHfre2V2MLFamp/bB9M44Z4iwgGepu3zXxqBxHF7tPgAgVNl5xS4OD2ua1xzw8L9AKhR0m3V7owsr7WxVp/gJWs754l7BKq3++j18/Qp1CSF8gzdtdV2PYUDyx/TofLw8P1brxocnFxwwJPKQgQ7KkjRbNRR83S1Os1NOp1NC3Ua3WkSYRWLcJII0G73UKnldp6ygIGL66dTML8LPB6UyDhVbZLa9gfN9QObD1FCPtn6fyw+MfglEISz91XMJ+h3cevpf0rSrsgfuwW/DyYE9Mzb0thExc8PI57D94whMZd/iOM8i1tpc97NNMHgiBm+2OSEGXpeD48mGGEEC8BVfmt8OpknCytQ7yNGuJl38os65hN+9YGrAz6eOrIUTQ7o5idnUFS5Ghbbk1rQ5iaYklhdSq3bTicgct/rF+sIyrzlxwSQC4WVhsoUPBLigJ1qyjs2dEqS5zZNPSVyUHQOUB6zxbiuEQjWsPeiQTf9dqrcc1UE8mAadkXJ1XH8EOA1Td4gIQqzoeVe3/wwTWsiNRY/FGkGimEEEIIIYQQQrzMKcBxG9wUODT0BdyUvWErcHx98AUI2FxJAWIYE6zzwcZg+QVzoUFBxI3j1b/Yl91YT9sHbSD+4aYt0jhvgcbGk4R8T8fzsu3DwN2MoEndzerBcB8lLlAUdtwUQrg77xqLWdsCPybt27455UbVvumjUGXJFSfnPZmLCsNN3PuCUy77IXMdr5nNhDNlJAnz/Ed4JWt27Ozuyj04bBu/HkUQNPjfRSPLp/TuqyzKrpFfFzsAihd2ugavzfAY/cQYiG9g0yqOgalsSuNuNTYBz5n5D1Pwr186rit4rWyZyXzzkIITihmb8WNm9hvz4dhPRtt+mHF1DHbcmwfUF+KlYFiEn4ONQntqWR4uR9bgDIos2FvL1CpqEHOTQR/tfGDlmj3t0LMs8XYopzedt4227fM7APESIwHkIsHqwArDmtmPa+AYHs28h0YxcNcpH9OjYK+OVslSS130UF9bwhuu34l33LQDW1rs35E/MJgbqylzDJWMUggfXhVV3eN0c7wQQgghhBBCCCGuBM4kMAQ7wnPbCtwKfxo0dp95IzdBuCHC5wymO3djRPjcc8imfIOtIyyH3E9d53E2s6kX8GqjanIWYl9fiQInT5MzGwuOZ7M5atM14ax3vnWaCFAd7amclsYWTx7j5nvHyI0VzwJP+kz3fDM8tlPPdTN+RJviNp3akFMubPjL9MN0Zz5PIS5FTi/Lm8tz6EqOs94dIAVdRnsJ5xzTqaxf6kgAuYikVNqtkvWSxLuw6mQ9NPO+e2wM4gQ5VUZ/XA5QjzOMrK3gfa+7AXdcN4V2vuwCShScJ4UQQgghhBBCCCHERSOYRYUQQlxaUADZLHOJlwh/LLpCSEU+DCrF/hXpXkVRJECX0NJdJCl2cJCsmYkEzRpXWcRpXxEIIYQQQgghhBBCiIuBbDRCCHGpIgHkYhIFp6nYh+5iv3Gh/zjifUMatSTx/hqnJ0cx1moAWYGYA1sN0wkhhBBCCCGEEEIIIYQQ4plIALlIsC8572sRHBiKA1KxX7kEuQ/qFQ0FjiCClNkAO+enMNZsouhntta2kwAihBBCCCGEEEIIIYQQQpwVCSAXFQ6eU3WBBeQRx/3guB708Ajri2yAus1vm2lgtBGFAXe8CyyuF0IIIYQQQgghhBBCCCHEmZAAchEY+nV4iMvCbkLpY4LkUZBE6BdSUugYrp8caWO8VUPd0iR2x+T8IYQQQgghhBBCCCGEEEI8OxJALhIc/pxdXQXYBZbFsfuriB4gtq7k2gJplGN+fBQjaR1JXiBxUYQSiRBCCCGEEEIIIYQQQgghzoYEkItOybHQqzn+8ZDS1aMYIB50sW16FGOdmq3NXQAZ/hdCCCGEEEIIIYQQQgghxFmQAHKRiexfPPTnYJdXYWpzeWbxOdopMDsWo2F3il1l0XeE3WNJARFCCCGEEEIIIYQQQgghzo4EkIsGRQ9KHuzoKtwGzoUYC7Y6seWpThNz4ynqUYGyKFCUHC/EVgbNRAghhBBCCCGEEEIIIYQQZ0ACyEWmdL8O9/mwuSCA8H8S260pc2ybGcNku4WoLFAUOQp6fkS8bbp1QgghhBBCCCGEEEIIIcTZkBX9IhJ8PWIf/DwsFYg5+HkZ2WLhY4BsmxtHp1a3VJY2cnkE7h4ihBBCCCGEEEIIIYQQQoizIgHkIkIZgwJIuA0UPnILQRbJixytRg1zkw004sI1jzhJ+Sd0gxWkECGEEEIIIYQQQgghhBBCnAEJIBcNyh+8/MELhFPODX08vMuryfERjHUaqLtDSI6S4gi9RSyJzQohhBBCCCGEEEIIIYQQ4ixIALloUMEInh0o2N0V42Jk3s1ViUa+jl3jLYymqUslniayNe79YTHqBksIIYQQQgghhBBCCCGEOCsSQC4iFDMSKh955stFlKKPyKY5mtk69o83MBqnKIoSaRJb2qHnR0RvESGEEEIIIYQQQgghhBBCnA0JIBeN4AFScNyPOEYUcWwP2HwE+4+Jdh0TrRrqSegaq6AHCNe78iH5QwghhBBCCCGEEEIIIYR4NiSAXFQilGUUVA2GsnAvj6jMMD05gfGxUSQJ49n1VeGBaapxQoQQQgghhBBCCCGEEEIIcWYkgFwsSg5oTuEj9jE9fIBzm0uQA3kfczNTGBvtAIUtlwXimOlskX1geT9YQgghhBBCCCGEEEIIIYQ4GxJALhKuY7Arq9CnlQsgcWShGKAZFZidGkGrmSLn+CD0DGFXWLY+8oHTKZ74ZkIIIYQQQgghhBBCCCGEOAMSQC4W3uUV/8coI94Gn0NcdDE9WsfkWB1J7AksaYTodKeP05eFEEIIIYQQQgghhBBCCLGBBJCLBEUNen1wcHMOc05BJCpzJHkP8xMjGG02OEY60iTmWuQ+CHqJmCOko7R/tiyEEEIIIYQQQgghhBBCiDMiAeQiEQQQahp05YjtX4TY5pN8gPmpJkYbdSAvEVMYiYaDoA+3k/uHEEIIIYQQQgghhBBCCPHsSAC5SLBLK3pzRH4L2B1WibjM0a6VmBuvo91gXAEUma23xBQ+PJk8P4QQQgghhBBCCCGEEEKI50ICyEWAPhw+sHkUIY458gc9PEpERYb5yVFMtlpIuGzxVQhwS99aCCGEEEIIIYQQQgghhBDPggSQiwQ9Odypw706KHLYNM+wbXocMyMUQHKL47gfXOGboLTERUTBRCKIEEIIIYQQQgghhBBCCPFsSAC5WLjywe6sKHJwrA8giUrMjI9gvJUiKTJEXM++sjgGyCbvDwoh1bwQQgghhBBCCCGEEEIIIZ6JBJCLQhA8yqIM+sZQ3ui06pgYaaKZ2I2hB0jJMUKq7q8oldAnRLdMCCGEEEIIIYQQQgghhHguZE2/CLikMez2yvGZEtOTUxgbaSMuM78x3gXWkJKCySlyiBBCCCGEEEIIIYQQQgghzoYEkIvAUO9A7IOADDu3yvvYMj2G8XYDyMP4H6V3fVVJHkES8W2FEEIIIYQQQgghhBBCCPGsSAC5CFDyKKIIeWSXv4yQljk65Tp2jpYYa5TeNVaBxEJqaRPbIkLEcUJKi/Wp/ECEEEIIIYQQQgghhBBCiGdDAshFoohiZIh8QHMKINPNElvbEdoxxQ36fyRD8YMiSeyeHx5TiSCbuscSQgghhBBCCCGEEEIIIcSpSAC5WETeyRXAwc6LAeYmRjHebtk8hzqvuro6zdNDjh9CCCGEEEIIIYQQQgghxPNCAshFI3JBI3RtlWN2ahKdTgfBsYNKRzXkORMxshwOhM4kXKNbJ4QQQgghhBBCCCGEEEKcDVnRLxbUNewfu7KqxyUmR5to1ZOhtFEiKovhlJLHSTh2CLvPCkOnCyGEEEIIIYQQQgghhBDiTEgAuUiUFDqiEilyTHYamBypoxZbnN0RiiAUQCh+uMyxoYFwibdMt00IIYQQQgghhBBCCCGEeDZkSb9YUNygl0cxwPzUGCZGOz7+ByyudOGDgZ1dhe6vfBML9AsJHiC6dUIIIYQQQgghhBBCCCHE2ZAV/SIRfDlKxHkf8xN1jHfqQfwo8pDACB4gQy+QDREkxJzaMZYQQgghhBBCCCGEEEIIITYjAeQiEUcUODKMNmLMTdTRSsPQ5lFEuaPkSg8UOjj4efAGOSmCCCGEEEIIIYQQQgghhBDi7EgAuQhQvvBhzPMBJjtNTLebSIddYnFgdES8LUEIofhxEooiw1khhBBCCCGEEEIIIYQQQpwVCSAXAfp10JsjLjLMjDYx2W6ixvg859AgQJTwj0VQ7diseJwcD0QIIYQQQgghhBBCCCGEEGdHAshFwCWNskAtKjE70cFEq4a0zN0DhBIHBzrnIOelD3YexvwI44FwW+8Uy+eEEEIIIYQQQgghhBBCCHFmJIBcJKIiQ6dZcw+Qdlract/HBQES5C6AVAIHp+E2hXFAQrANPE4IIYQQQgghhBBCCCGEEM9EAsjFoiwxNTaCqdE20nKAKBsgien1ESEvgcK9P2KbRsOesILnh3uC2KwvCiGEEEIIIYQQQgghhBDijEgAuRiUpXt7zM6MY2KsBWT94NkRx/TtcNGDfh4UQ+gJUmkdYanyApECIoQQQgghhBBCCCGEEEKcDQkgF5yhiEFRw705Ivp1oIYMc2MpJjsJypxdWlHWcG3EUofgg6WfwduD64QQQgghhBBCCCGEEEIIcXYkgLwYhspEFPqoGgodnB16aZSlCxoFEgyi4dgethznGeZbEbY1I7Q8gwRFlPq6Whwh9W0LxAyct8A9sUusQNivEEIIIYQQQgghhBBCCCHOjASQcyZIEpH/42VkCH4bHl+GwPjcBzZPUMZJSJ33sW20hq3tFHGWoaAAQtmj4Fqfs61CN1cupHieYYnTsMwghBBCCCGEEEIIIYQQQogzIQHkRREED/4NVKKExbgAEuQKd+2wEMeUSiy+yDE1PorJsQ5QZL46YvdYFl8U7AiL24W8+LcSPkIQQgghhBBCCCGEEEIIIcRzIQHkghEEC47jwX8UPtilFco+mrUEk+MdNBo15EXh4kcSxxwG5AwSh4QPIYQQQgghhBBCCCGEEOKFIgHkQuFqRoSSnh8okfBKFwNEeR9To21Mjnbgw56XdhNc3yhdCIljjhMSvD82M5RQhktCCCGEEEIIIYQQQgghhHg2ZFE/DzxTrjCG7hw+FohNKV8g7yMpMsxNjWFibAR0CIn9DpTIMnaFdcacTsPVEiGEEEIIIYQQQgghhBBCPAsSQF4ElCuqULERRzHD/kdRuMRRmSGx0ExyzE00MNZJPSW9PjjuRzX2B7dj3NngeCDBE0RCiBBCCCGEEEIIIYQQQghxNiSAnCObRY/TqQQQBg58nlC2yAeoRRlaaYnxDtCqUSDxlC54sOurqvsrF0+EEEIIIYQQQgghhBBCCHHOSAC5ALhvRhyhdE+O0sf4SCKKID3MjbcxOzYKWwwCyFDroAgi4UMIIYQQQgghhBBCCCGEOD9IAHnRBJFjQ8kwwhJH/aCoYQtFYUuFj/8xNdLyQdATW8HOrCR5CCGEEEIIIYQQQgghhBDnHwkg50wYg4N/eRHjsorZRGkx9OwockQWGkmEmfE6JlopkjyIIhRBXhjc4hl7EkIIIYQQQgghhBBCCCHEJiSAvChOFyJOihkuUnBsjyqUBTrNGmbG22ggB/K+pQgDn78Qwh64X4kgQgghhBBCCCGEEEIIIcTZkAByvvBBPXxmGDih90eJNI7cA2RytI2p8XGbH1jyLKRxqYTbPpcnSOX5IeFDCCGEEEIIIYQQQgghhHguJIBcECJEUexSRVHQy4PSRY6psVFMjLQRlQUS9pm1wXN3aiXxQwghhBBCCCGEEEIIIYR4/kgAeRE8m89GRLHC9YrSxwCp11JMTbbRaURINgSP00WQM3mCaMwPIYQQQgghhBBCCCGEEOKFIgHkHKEkwUHMYaH0f5uJUJYUPgpE7P7K1o42a5jqNNCwKx7ZusI3OF3YOF38CLLIM9MJIYQQQgghhBBCCCGEEOLZkAByjlD8SIocHMi8iLARApQ8KI7kFkrklm7LaBu7xtqI+5lFxYjj1NbEzwinix3M/0zhTGKJEEIIIYQQQgghhBBCCCECEkDOCYoPocsqenOUUfACCQQBgxc2Hnp/RHmG6U4D8+0G6kWBoohQlM8UO4QQQgghhBBCCCGEEEIIcX6QAHKOlFFkwS6fTTmeeZAy+DfMVRIJx/to12JMjTXRasQumPj64VQIIYQQQgghhBBCCCGEEOcfCSDnRISyjJBHMYqIgkeBuAyjdVR4R1XsASvPMDPaxPzkGFUP5GWOmLoJ/wghhBBCCCGEEEIIIYQQ4oIgK/w5QN8NCh8FEh+Ng+OB+Lgc5UkPkMhi2S1W0V/H3FgL0xMjyLPcN45sW/4LOQkhhBBCCCGEEEIIIYQQ4nwjAeScoezByxeD43xsiBkUOCzEMQc6j1CPcsyNJRhvRh6fJgnKokRZUjrZ7DMihBBCCCGEEEIIIYQQQojzhQSQc8KHNkcRxe70wXE9gggScN+OsrD4AlMjdcxZaCV2saNqqHQKICfTCyGEEEIIIYQQQgghhBDi/CIB5BwJI37Y5fNuryhmhFBS5LCoIhsgKvqYHmtistNAjVuUJYqi8PE/2A1W2EYIIYQQQgghhBBCCCGEEOcbCSDnBYoZFtjHlVO6t0eKDLNjLWyZ6KAc9H0NdQ9PzT9CCCGEEEIIIYQQQgghhLggSAA5R0KXVxzHAygrVWODEklUoBkXGGslGGmmiGNLT4eRMkJR5MMxQIQQQgghhBBCCCGEEEIIcSGQAHKOUACJXQQpfTD00CXWyS6tUuQYbyWYHm2hWWeXV7a2GKYpCiohIaEQQgghhBBCCCGEEEIIIc47EkDOgTAEeonYvTjKMBj6KZfS5rM+plop5idHXezICwolQfSIowjJKR4jQgghhBBCCCGEEEIIIYQ4n0gAOUeiskCCzIUQeoAUZWxxlapRoswHmOrUMTPeQZ5loFbCdITdY0U+Xoi8QIQQQgghhBBCCPHyoewPsPaZL6Fc7w5jhBBCiIuHBJBzInR/FZelj3teIvEYErErLItrpjGmx+roNEqURYEojhFbiKIIpW1XFhI/hBBCCCGEEEII8XKjxNoffQULP/FLyBdPDOOEEEKIi4MEkHOmQIQ8jO0R8TJu8v4oS0yNdjA/NT4USKIwTkhZiSSFpzm5jRBCCCGEEEIIIcTLgWDrWP/sV7H0cx9HvrDky0IIIcTFQALIi4adYBH6gORILMRFhqmxNmbHRxFlA6QR+7/KUJYUTOyHQJRI+xBCCCGEEEIIIcTLljLP3RNk8YO/gnxBniBCCCEuDhJAzpHg1ZEE7w92hUWPkHyApMhRjwpMj9YxN15HPe+jUWaoxyXSKHiC5EhRUAQRQgghhBBCCCGEeLlSFOh++W4sfvAjyI8tDCOFEEKIlw4JIOcEvT58FBCUPvB58AGJI1vOM7RrMaZG26hbnHuElBZcMrEtLX3oMkuXXgghhBBCCCGEEC9vyizH+he+hsWf/qg8QYQQQrzkyAp/zkTgkB7FUNjgYCBlnLoAMt5KMcfxP6p0DAUdRZiaMwUiHwNECCGEEEIIIYQQ4mVOWaL75a9j8ad/BflxjQkihBDipUMCyLkS8fldoiwKW6CYEaNkt1ZFjqnRGmYnGyE+YpdXEQqb9YHP2V0WxwTh6OhCCCGEEEIIIYQQVwAcE4SeIEs/9zHki/IEEUII8dIgAeRFErGLq6EfCOfqtQSzIwnG6kHjoDzCcT8K7/YqdJcVuQdIJZwIIYQQQgghhBBCXAEUBdY/P+wOa2l5GCmEEEJcOCSAnCvULiz4uB42w8W8KDHabmB+vIOmraAkUrJrLB/wPHSI5f4g7gHCpRAnhBBCCCGEEEIIcSVAT5Cue4J8XJ4gQgghLjgSQF4Ekf+zi1jQq4PdYZWYGmlj++QYagW9PHL4+B92mcvYLjUTW/DxPxiEEEIIIYQQQgghrjAogqz94Zex+MGPSAQRQghxQZEAcq5EVDKCB0cY5jxHYmGyU8f0SB1pMUDsvVyx+6vKR2RTt1dhUyGEEEIIIYQQQogrj6JA90t3Y/FnPor8+OIwUgghhDi/SAB5MWyIGCXSqEQzBWbGmphsx0jKzOPLU4QOih+MY6QUECGEEEIIIYQQQly5lFmO9c9+FYsf/BXkC0vDWCGEEOL8IQHknClRDLux8q6wihzjjQQzoy0kwy6uXObYcPjwjrB8TgghhBBCCCGEEEIYZYnuV76OxZ/+FeTH5AkihBDi/CIB5FwpKW6wS6sggMTZANOdFFunRhEVFr+xjul8doPC5RBy2gohhBBCCCGEEEKIKwz3BPnC17D4sx/VmCBCCCHOKxJAzplKvIhQ2L+k6GOmA0yNJmFNxEsb0lAEid1bxFJGEXJbV/h6eYMIIYQQQgghhBBCoCjR/eLdwRNkQSKIEEKI84MEkBdDRJ3DLmEJtNIScyMp2jYtKXZEocOr4O9BbxALQ1eQ0BmWxA8hhBBCCCGEEEKIijIPniBLP/9xeYIIIYQ4L0gAeRGw6ytCwWOs08S2yVHUbL4oI5RRMkwRPD8ognCeg6K794cPhC6EEEIIIYQQQgghNsgLrH32K8ETRCKIEEKIF4kEkHMmcs+P0sWOCBOjbWyZGkNsD2p39KDSwTT+l/4ewecjzMW2HS+9RBAhhBBCCCGEEEKIU8gLdL9wF5Z+9mPIF5aGkUIIIcQLRwLIi4ICRoGahYlOE5PtOtIiQ60cAGXmKUpwTBCGmJ1guTjC8UBCb1j+RwghhBBCCCGEEEJsgt1hrX32q1j8IMcEkQgihBDi3JAAco6wc6vYQmIP5JFGhLmJNpoJ0ERhoY+k7Lu8we6uSqTIoyCCUPyoFYWtpxwihBBCCCGEEEIIIc5IUaD75buDCHJsYRgphBBCPH8kgJwjHPfD/iOJCow1U8yOjyL2cc5zlEUGH+/DPUSG3VyVFEJCt1dVl1hCCCGEEEIIIYQQ4uyUWRgY3ccEWdCYIEIIIV4YEkDOEcoXLoDYdLJVw9xk25dzCy50RMlQ5GAoEEUcBD1A+aPQIOhCCCGEEEIIIYQQz01Zovvlb2Dxpz+C/PjiMFIIIYR4biSAvChK1KICMyMJJjsRoqhETnEjqaGIKI3Q24NuIezuiuN+UAyJfNB0IYQQQgghhBBCCPH84Jgg6xwY/ec+jnxRniBCCCGeHxJAzpWI/h0FmmmELeMdNOxKlmXuA50XUc3m6QFCcg8+8LnNSfoQQgghhBBCCCGEOAeKAuufH3aHtbQ8jBRCCCHOjgSQc8TH8ShzTLTr2D45gXhQ2HKBMo5RILW1my9tGPMjKu0vg8cIIYQQQgghhBBCiBcCPUG67gnyMXmCCCGEeE6iD/zk3bLFv2DskkUl4n4Xr9oxij/3xmswGmWIowGiKEGeJy5/xMjszwBlVCApItskQWGxeUw/ENveu8QSQgghhLjyKAcZyv5guCTEuRHVa4hq6XDp8oFln3VAvAREEeJWw6eXEzTwlr2+v3oKcbnBNu74f/459O6+bxhzgYhjtF59EyZ+4DuRjI8OI4UQQoiTFEVRSgB5FiJ2c1WWHjh/EnpzZGiUPbzlwAy+5/arEPfWEcX0AKljkMU+OHoS2UtNZD9aKXuU9sO7TJHbmlMFEF1+IYQQQlx5rHzyD7D8id8bLglxbtT378HYd70bte3zw5hLn+zJw1j6+U+g/+jBYYy4kMSNOtpvuR2j733LZSOCZIeOYOXXfx/dr92DsmAny0JcZpQlihOrKAcvwYcOcYTOm1+Lse98N5LpiWGkEEIIEZAA8ixQ8GDIsvBlVhzHvkwxxH6FIi562NJJ8J5b9uGOnWNolGvIYQ/3pIUsTz0NBZAo4gM/Dx4gkAAihBBCCEGWP/rbWPqfvzZcEuLciUfamP6bfwGN6/fbb3F+hnRpwi/6e3fdh4X/9j+RLywNY8VLgr3LtW+/BePf9x1IJsaGkZcgRYHB40/h+H/6OZ/SiCyEeB5EUfAE+f4PIJkcH0YKIYQQQQBJrnv/X/uR4bI4DbtAG8JHhQsgFp/kPWwbr+HV1+zAdB2oudBRoiiZNrVtOO5H4VPGc/yPCDHn4EmMy+P7IyGEEEKI80//3ofQ+8b9wyUhzh12tbL+xbuBPEfj+gPD2EsLdnd14n/+Ok78wq+iWF4dxoqXDHuHo6DANqe2cwvSmcnhikuL1d/+Qyz8119A9vSxYYwQ4vmSHzqK7MhxNA7sQdxuDmOFEEJc6dCWLwHkLLjQYVAA2QzFkDgq0UAP+2ZbuO2arWhQEClzcBB0CiBRZNtElocFDnnuwbOjJBJbPMUQCSBCCCGEuHKRACLOK1mOnpWp/sNPBONXpzVccfHJnnwaC//pZ7H2h1/WuB8XmWLxhA+cnG6Z9RCd9q53sciXlnHi5z+OEx/5ZBj3QwjxwilL72IwP76IxjVXhbF/hBBCXPHQxn9p/OK7BHGhw34Q8yIx0BskxMcuXLRrMebHmqjHto6eH4y1dKlLHLktUfHgX15iKiFDzw96htiqyNLaBhaEEEIIIYQQLxr7fd398tdx5Md+HL17HxxGXkR4PF//Fo7+i//iUy6Li0+xto7j//FnsPTzH/duyS42+dEFHPuX/w0rv/tZlREhXixsd794NxZ/+leQL5wYRgohhLjSkQfI84SCSNUVVpH1MdeJcNu+LZjttJAmERJ70Mb2AzqJKXoUKKM4iCIWXPCwufBzlt4fIR8hhBBCiCsVeYCICwW7mFr/wl1IRjqo7diC6CKMC8JuuVZ/69NY/OBHZIS7FCkK9B94FIMHH0f9wF4fR+Ylx46BXbcd/79+BoMnDkn8EOJ8YXUpe+ppFAtLqF9t9bspTxAhhLiSkQfI84CeHxQ+kuGLU17kduEKjLZa2Do1hqjMUEQxSo4VYus5yod7gJTV10RVbCWB0JNEP26FEEIIIYS4UJTrXSz+5C9h4b//IsruS9ulUH5iBcf/889h6UO/imJlbRgrLkW6d92LI//436F3z4NuNH2poEB24pd/Cws//vMa70OIC0FeYO1zX8XiB38F+aJEaCGEuNKRB8gmTvfLqLq/in1MjwhFkfsP42Ytwv6ZNl5zYBY1cNwPu5CWvmbrE/p9JBHYu28ZMTa2f/T5sETs/or/yiCWhD9CCCGEEFce8gARFxz73T547En0vnk/6lftRDIxNlxx4aBXweKPfwjdr93r+xeXPhxzo/vFu+zdLEZ9/+4LPi4Iu7xa/IkPY/X3PutCiBDiAmFtcP7UEeTHl6xu70Hc0sDoQghxJULb/hUrgPB1pGB3VVGEuGSgiJG7KBEGKh+KFNQtbBJHqQsdaTTAZLPEDdvHcN2WMR/8vMhzpJaG3WBR5CgtXw6Gzjw878rrYyh4MMbHAxFCCCGEuEKRACJeKjgg7tpnvox0egK1HVv5w3645vxRZhnW/+BLOP7jH/KuV8TlBQen733zAWQPH0Tjhv0Xpssce5mkQHbs3/2UD9jvL5dCiAsLhfCDh5EfPT4cGF0iiBBCXGlc0QJIEdvLELuuiiKkJUNhIQd9NPI4DGUehI8IUREEEHpzpPkato3keM3V2zDXqiHJM/f+qDw82B1WXoaBzzc8P06B3iTDWSGEEEKIKxQJIOIlJcvRves+FKtraFyzF1HK3/bnB3ZztfQzH8Xyx34X5fr6MFZcdtjLMcWr/r0PIt0yi3R2arjixUOBbPW3/xALP/Fh9wARQryEWN3ODx/17uYa9ARpt4YrhBBCXAloDJAoaBGVRMF51ybonuEuGhFiju0RUcZgd1iFe4mMNWLMTYzY2jCyRxjhgymqmCow5yoQxgkhhBBCCCFeatjV0cpv/D6O/PP/jOypI8PYFwG/LH78KRz9l/8Nq5/6HMr+SzvWiLgw9B98DMf+/U9h7TNfcs+QF0txYgVLP/MxLP7MR31eCPHSU2Y51r9wFxZ/+leQLywNY4UQQlwpXLkCSGknX4BOGyiiEDK7GkVkM3T5sATVGCBFyYHQSyQxx/9IMDnaxmg79TyEEEIIIYQQlwn2275//yM4+i9+HOtf/vow8hwowgC7FD/633rY8xUvHyhULPyXD2Hp5z/ugymfKxyD5ti/+Qms/M4fepkRQlxErJ3ufuUbQQQ5vjiMFEIIcSVwxXaBRZ0jdFF1EvfisBXsxooruC4aCiBxEiEuMkw1gJv2zGH3zCjSPHPvDyGEEEII8cJQF1jiYlKsrqP7hbt8rIfazq0vqEssdnm18tt/iKWf+ojNrw5jxcuO4ZgdvXseCGMHjHSGK54bfm1OQ+vx//Rz7iUkgUyISwSri9mTT7sXCLtDvCDj/QghhLikuKK7wOKg5z7w+fC3KD1Acg5ebvMRBY/hxYnYBVZKaSRHka1jpJ5g28w0oozpNssnQgghhBBCiMsFjsuw+PMfw7H/8EGUeT6MfXbKbg8LP/7zOPELv+rbi5c/vXsexJF/+n+h9/VvDWOeg6LAyq//3zj+H39W430IcSlidXT9818LniCLJ4aRQgghXs5cuR4gFhJ2gWVTdntVRvT+4Age1T97weHfmMHSFRmSwTqumungNddsAYfN4ngglEaEEEIIIcQLQx4g4pKAXwMfOoLul76O2o75Zx34uvf1+3Hs3/wP9O5Tl1dXGhS+1r/wNR88ubZ9/qweQ+xWZ+G//gJWfvPTPvC+EOIShW3/U0dQLJxA/eo98gQRQoiXMfQAuWIFkMr7g68u7vnhAghlD+odjA0iCH+22hqkHPw8zXH11jHcsHMK9YIeImGsECGEEEII8cKQACIuJYqlZf8iOBkfRW3XVvcCryj7A6z+1h9g4X/8IvLjGjz3iiXP0b37XgweehyNV1xzqsF02F3W8X/7E0EgE0Jc+pQlBk8cQn7keOgOq9UcrhBCCPFy4ooWQChusJsrDgbiAgg9PYaiR2LxfOUpSnqGMEmJtOhhth3j5r3bsWO8jRoHRh/KI0IIIYQQ4oUhAURccmQ5enfdi/zIAuoHwhfB+bFFLP7MR7HyG592IURc4dh7Ynb4KPr3PIh06xzSmUmURYHV3/0jLP7Eh5GpyyshLi+sTueHj3jdbey3dr8tEUQIIV5uXNkCCIWNoacHBZAytgtikZUAEtmqciiAxLY+zdaxfbSG26/fi8mUaTgICD1AhBBCCCHEC0UCiLgkKQoMHj3o5TOZmvDujHp33+fxQlRwAGUfRH98FKuf/AxWPvF7KNa7w7VCiMuKokR28LCP2dO49ip5ggghxMsMCiDRB37y7ivShYEeHom9yNDXo5fEQQRhXJmjUXBAQ/p3pBgUHOejwFTSwy1bm/jON9+EsbxAlPcQsR8tIYQQQgjxgln+6G9j6X/+2nDphdHYvR1TH3jXRj/8/YOHcPQXPuFGjNOpzc9g5s9+B6Ik8eXuQ4/h+C//ps+fTn3XNkz/qfciGnaLuvyHX8LyH30FY296DUZee7PHkaVPfRarX7p7uHQqzQN7MPX+d/o8vwxf/I3fx/o3zy70pJPjmP2B79o4vmzxBI7+/MdQrK77csXUn3wXmvt3D5eeH89n/2di9PWvwugdrxouAb3HDuLYc9yrrX/3L22cw5nIV1bRf/IwTvzuH9n82jD2VKa/531o2D14vix/xu7PZ78yXDr/RPaOUNrv/hdLOjGG6T/zJ5B02sOY50fR7eHYL/wqWtftOy/lj3WB5fv59nVfDjIc//jvoGd15rmY/t5vR2PnVp/ngPLHfvHX0X/iKV/eTGPPjlB3h2XFz/HDv47BoSOYeO9b0b5+v8WG+vdcsC6nE+NIp8aHMcCJT38BK5//4+HSM5l839vsenIfPM4CR37ql5AdX/Tlc8IP1f7Yi/WFYuvf/gFEtdpw6czkq2sYPPW0nf8XkR17bi+UqJZi/O2vR33HNruGox5XrK1jYNdi5fNfO+M9T8ZGMPOnrRzb9KUgO7GMp//LhzD93e/xclPB8tJ75Inh0tmZ+b4/ifqW2eHSc7P6la9jydonls2ZP/8nUZsJ4wGt3/sgFj7xuz5/OqxLU3Z81X7Yth392V9BvrzqyyOvu9Xb0+qZ8lwMnj5mbe2ver04ndjaj7E3vdqfU8noiOdZ9Pp+v9fuvg9rd907THmS9iuv8/tcdem38sW7cOL//pzPb4ZeD1PfZecxP21L4VhXvvg1S/t5n6/gfeD5pHZt4nrNDUqFnfPg+AJW7FnZf+LQMOUz6dx2E9qvuMaeeWN+jcvBwJ53y1j98t1Y+/q3Lmgder7wuJq3vQIT3/cdSKYnh7FCCCEud4qiKK9YAYSPdRdAohgD+0GQ25TeHmmRoVYG9/YMKdjRVWxx8/Ue3nz1NN71qn2o9QaIcktzsmtgIYQQQgjxAngxAghFg93/5h8hnZ7wZRruHvzB/90NMacz9f53YPb7v9t+twWjDg1TD/7F/w1lr+/Lm5n/K38GE+95q8+XWY5H/9Y/Qe/xpzD75z+Aqe/6No8nT/+PX8TCx357uHQqNHht/z/+qs/TEHzo3//UGQ1OFXN/+Xsx+e13DpfsXOy4Hv+H/wrd+08dR2D7P/obGHnNK4dLz4/ns//ToWF054/+XbSuPzCMsd/EC0t4/If+1bMat67+yI8jSs8ugDg0ltm9Ov6J38XCr3zyGV/M7/znfx/tG68ZLj03R3/uY24svNSpbZ3Drn/xD1wIeSFQNOJ1H3vja85L+Wvu24Wd/5+/54bU50PZ7+Pgj/0XrH7prmHM2dn5z/9Xu3dX+3yZZXjih/8t1r7xLV+uSKcn/diaV+/1ZQosxz78a0Fcs7Kx9e/+IMbe8lpf93ygCLT4O5/Btr//lzfEUBqCD/7o//+MBuT69nk/TrYfhGmf+Cf//pLv2uzAh/8j4kZ9uPQs2DXMV9dx5Kc+7IbrM51XOjXhBvFJaxddkDvdMG95UBii+Hv8l34DvUcPDldYOZ6bxq4f+9/c+P1SMDhyDA/9pf8dO/7p30Hn5uuHscAT//jfYfWr3xgunZ3d//ofoXng+YvGi7/6ezj8Xz/kbeDuf/vDG2Is26mn/vV/x8oXvubLm0lGOnZ8fxvN/Xt8mW3lo3/vn210hUZhcOZPf/szr/NZoLDD9p91v4L3afydb/R75m3IGe9ZbvXtfhyxtqH/2JMufpKJd7/Jnmt/1p5/wXBx3NrdIz/5YZ+vYLs9+b47XfSp6hFFnyd+5N97e01qW2b9WdW55fogXp7pGIoSXdvuqf/wkxg8dcSjmbZ907WY+8E/ZfVvi0XYcWze1LZjoGh5+L986MWJkecLO7fWa1+JCXvuJ5MvrM0WQghxaUIB5Io24Rd29hz8nERlhKjY9DQuCxQWEvuxkNpTumEvzVun7Mdezod05s9uIYQQQgjx0kMjU+/xJ4dL/Hq1hdHX3TpcOklUr6HJr72H4gdJRjvo3HrDcOkkNAo3r7lquAQMDj2NwbELa4zhl7D0LtkMDZ3T3/u+4dJLT+OqXWjs3TlcCqTjY2jfdN1w6UUQRX6dp7/7vdjy//4Lw0hxpbD17/9l91BxyhILv/q77iniRtBzZP2uU798b12/HyO33zJcOhUKjZUIRXFg4aOffHmN62L1Kxlpu8GbIsfp1LfNY8c//pvuEUfD/TOM2MTiaBAfe/NrseOf/B3/2v+M6a4g2B3S3F/5M6htff7eJOcLinbbf/hvYOYvfCAId2e9Zyk6r7zOBc6RTd57zweK/vSWqcSP7PgSnvwXP74hfnCcGxfgX31TSHO2Y0hiNK+9Cok9jyvG3/kGbPvf/wrqO7fZhTxN/CDMy+JZZ9k+XBJYe9T94t1Y/Olf8a7uhBBCvDy4YscAsScb+F0Ex/2wp+4whGdygsy7wyosLo4TJFmGrZ0Eb7hhF0aSHHE5sGd19UP9DD8AhBBCCCHEs/KixwApiiB6VMYYW2Z3VZuNqenYqHtvnN7lT3FiGatfOfULYhqa2HUQRRPCrmSqrnRoWNrsEcGvj7v3PTRcOpX6zq0Ye+Orw8Lwy9Yzdtdixz3+9jdglMba6hyG1OansfrH95zSlQ2NcOwepfuthzcCu0CpvGD4BTDPn8bgk2kewdrd976gr2on3/fWZ4odth92fbL4m78P2H7OBLuvqrpZyU+sYOm3P3PyOB54BGVv4AY8GsmiOPLrnS8t27pHfRsyfucdqM3N+DwN00u/80f+JfLJ8zk1rH/9W97tz6UOz5eGw97DT2wcO7sYYpdU1Zf9xeoaTvz+57F+zwMnz+9eC3Y/W9dcdV7KH7uKGn/bHRtlnN1OLVs5X7e8qn1uDuv3PWzl6R6/n8/F+J2vdw8Bx+riiU99zr/gJyy7W//+D2LkVTeGsm7HRa+UIz/xYfcWqWB93tzVEcvQ5utxeuAX791vPWT7OY7RN7zaDfcsg80De+28vnCKFwiv4dz/8qfD1+vG8h98Ccd/+Td8/lLHu+UbelfRw2Ppk39wynXoPfy4X2N2i8RXU16D+pY5vwf0siG89zRiu7g5bG/o2cDu0Va//HWsWz6sS+zeyttLS8M8O7e9AutsQ9yjwcpxreZeIRv7fuhxb4OY1vPsdt37ZP2bZ79vDDxmltXqvNhGsfupzWlYLtfvvg9jb33dKV1Zseyw7D4XE+9600b7SBZ+7VOn5H96YNtJLze2URPvfjPS8dA1GKFRv7FrO1Y+99VTymxcr9vx3e6eNYRljvenWAvebfRoY7dP1TVf/oMvuufRmfbPwOvGNo/tLO/Dlr/1A+5BUXWhxftJ78DVL9zl14feHjw2F7QMHnu+eMK78yLsNnHktps29s+81/74mz5PRt9wG+Z+8Hs22iE+Yw7+yL875fpOfeDdp3SJmB097u1KqH+PILP6x2NNrAz0Dx7Gwsd/19rvvnuuUGyj8Mb989hZ3tgNF7djG1+bnQrHZoHtR+/BxzyPi461UZnVh2LhBOpX733GbwghhBCXF1f0GCBlVCA4fNgPuTK1iNjHA4lhL2dY9+6wMtRQWqJWXuD2vWP43jfstvkekmjgLp4R+IMt/JgQQgghhBDPnxfTBRahJ8He//hPNgxPg8NH8fg//JduDK0Ye8vt2Pp3/mIwsGyCxufH/uG/2vjClYy/+03Y8lf/nKdl9yHeddCnPuvrLkQXWDSo7PiRv7Vh2PbuoGzfbmixX+fHP/KbOPLBX/Z1Z4PGJQoPhMakx+z8aUQ7V2iM3PfBfxUMqQbH7KhvnQvXz14c2D3M4q99ytedzuYusGhEfPiv/bDPV/C8KHDM/uD3bBih175+n3ezUn2Fv7kLLI5p8PD/64eel/H9coReS7v/zQ8F46BBg+Nj/8e/POP4Deer/J3eBRa7kDr4//1PG0byF8PZusDivZ79y9+DyXe/2U46CGTs7//Jf/4fnzEWzOldYD345/+ej4nzfJi3ujvxbbYPYmWVXaMd/dDHbT6Uve0/9Nd9PASSLZzAY3//n28INJc6m7vAYvv20F/6Bz6/mYbd2x3/59/c6N6L1/bhvxLqD7t02vI3/rwLCRX0omO3TjSIb/aCYVdH83/1z6Jz8w1W70Mcx1h64v/8f9q7DwBHzvru4/+ZkbTS9nr9XDC429gGhzgQCBBsQnWlu9EMpldT3xAIJC8lJIFQEoIDhBTIC7wkIS8lDiEQk4SQUBNKaDbu7Xzn892tZp73+T0zo7K3u7dX1rvSfj93s5oZjbSSVlpp5zf/5//Ort+tpX0NAbUQXe7I9785VOTJ3d/5gX/+vzXMz3WohsD63tmXhXBuX+YOgdXi//6/4wv/ZDe+56Ot69nfIbB++tLf7Ap9F6NgIgyPWFxWwzde99b3h9/xreED/XnJ2EjozTL2iAfaHZ/5ot185V+F174sNgTW0Kkn2KYrLgu/i0Thja5fPTnC0aCFo658axi+LvCvrR8//9fz4RD9fOCvW2GR+hTFjQG77VOfa11ej8+If01P+/epmz/8CbvzH/81hCOi0EwVSZ3hrt7zFurRtSKS2Bqnn8xwWADQ49b0EFiKL0SFHGpyrqW8DXouzEWJPz+z4Vpkm2bGLNabfPgwUXwaBAAAwIrQTpRwpGxBO/6SYudfScO4lDuPOqkng3bUdBo/85db26qXyFL6HhyMgXtt7Rpy6/a/vSoc/Rr4mzHyy6ebhrO5J0095fGt8EM7xW9830dDsBT4x0ZHCx/okbDauaaqlrI5sNQ2rm+FIeg/2pGsvgITj/yV1g5Y7Uy/8Q8+vFf4cbBu++Rnw9HrgX+ualifson10P1ODENjle784tU2e8veO/N72ezPb+wOHbSDvthBraqqodNPDvOix/66t/1hqHjoDD9EQdzP3/Ru/7v1h8UahSLrunZSr1mxf16d+WAbP6v9XrFcKjOTXe9fChVvev+f2c5v/Fd37yT/M1bFh0KNG971IbvpA3/ZCj8Wo7By/Qsu6go/dP0KRTvDD4mL6hLR7+/ZG/3rrAw/xD/XFPyoQlABS+fl1ctEvVV+/II3hIquMvwQ3Q9drlPrNbxapFkYDmvbn37K0tsYDgsAetmaDUDU8yPO/OTfoNUMPXY68skv+M8YWZRYahW/lFglm7Wp2m47YmrQqi4LJeyZ03kqHV+zDx8AAMCK0g76MPZ/cSSuhvUZe+gvhnnR0Bpls2XJd+zke2Z05On4o34lzIvGOB84vD30jnYyde6onysZaoTLzDclo+2dRQuKY5t+0mNbO/+1k+i2j33G7vzSv7Ruo27/6MN+KczfE5Lx0a4m67t/co3t+t6Pbfs//3vrNtWPOjwMXXWgZm+6xdLb20f0l0MxzScM7zU5Pu9jrKk8cnwtOujnX0GPv47snu96NJWhxQGpJDZ21oNt4jEP89eT78QNO9ff/AdLHuImWeTnP7ehvII67WAtn6sayklDXqnaZeai88LQTaLt1Dy/awduj4tqNRu49+FW3ZAPHyd7bripVdnTOPHocCR+ScM4qeJiIdrZfvvfXOVP8x3pGlZJTbiXe6f/cqvO9zwqpn3+Pul4ukw/7Zy9q0OWSL9n5/v+YSqqGWXw+PtY3BGAq2pq+5e/ViztTQGGhjxbCg3lpaG1yoBQgYkqprYtcPnOPhh6XW1900tCNZWGVSuHPtsXhTRd/HNJVT1Dp51YrFA4eqPtuPrrxdLqocdn51f/0+740CfoCQIAPWztBiB+il3sT/XP+fdg/wEvysJnGwUfCjgyF/mvTZsZaNqGochqrmlJpKGyKpb5CQAAACtHAUjWcQSzhuAoNY49yuLBfOeM270nDCk12zG80NCp7R0vakReDt+k4a/u+Nw/hfmFTJxzlh35rt+Yd1r3zCcVWy2sruqPo9vVHxozP/O38c6rrm4fERtFNvaIB1k81G4ou5x0hHw5HJN2DqufiI7Q3fG1b7WOKFb1h+77gVLPCzV+L3WOpT+Xdqwd9ttXzPsYa9JQWmvVwT7/SvqZH/G7r5/3ejQdeMgU+dfifW3m4nbwkG7fYde/84P50DlLdNhbXjHv7dK06YrnFFsV/HNWTc13/fiaYoWFnbSbXv3cVjDgZmfzviNzqh56iX4m6y9/Wte0+VXPsc2vvrxVvaXfibd/4rNhp7gM3/+kcFpSD499BUDqMVNeXgbUxLq38w874vd/fd7nkqaZSy8ottqbhuPr7DWkn8Hm11x+QGHwpldeNu/316Th6Ur6Hq3qOP+z0nCMem86WBpKbcOLLwm/i0W/22/zzxVN5cEEc6myo/N7N467t21940vCMGHqK6Mh+tQjREHcUqm5vkKYMkBRRdaN7/lIK3Rbdfz93/X1b9sdf/IJS/cxvBsAYHVa4yUMCj/0tfwAmMcfoQGIp/V1/8fw9PiQDdb8Q+Wy8OafXwoAAAArSTtTOxuMV6Ynw7jmOnJ98JTjWzuQNHb97muuD0c+l7TzShUNOgp+8KRj/Qe//POdjvDcc+31YX4h2omkYGLeqRirfzFqLFwOwaWdjOF2ORdCEDXQLXdOqv/G0H3bY98vp8lzzmqFQAo+7vzSv4Z5HSm+qxyayxs541T/2G0olpZODXGHH3CqJaPtxsK7f3bdwju8/M9DAda8j7GmAxyKqx8c7POvpMbsGgJn3uvxU9l4eX/peTR+1kO6bot2dO5vr5HFfv7RPD9/vX5CwOFPRc+RoY7X9s7v/nBJvSNWM90nNejunPT7pAyrtENbQZCCy1I05zmxx/8u3JcwFFFHQJmM63Xb238DL/pcX2TnvfO/D2/+yCdDo/aSeqUoNJk7lOK+6Oc33/cPU2c1RUf1lX5HNm9tf++DMfrwX2r1KxE1zN+XOz77Jbvzqn/uDg79a0rDTqrB++R5j7SNr3i2HfnuN4S+W/sa1lDBpHrSlA3qZ2+53a5/+wdCT6jVTD+Hu//tm3bHhz9priMcBAD0hjUdgCjnyCMPfZjr/kAX6Q/PdNZqSWTr181YxX+QD5+dXT6eajgfAAAAK2r7l/+tmMtpZ6B2wCoAKe364U8s3bbdtv/T11o7cbRTsH70EaGB7MCR7eGv7v7ej/YeruMQ007LcqeshgXqbFyuHZflkdcKZ0ZUnbLMfTK0Q0phUOmub/63NcuGx/4z720f/9tWFYiO6B/TGPiL0GO64fkXt6cXXmJbfuNFNv3Ux/m/PvL7revTz05H5aP/qP9HJ4UtG1/y9NZOz+WiyoWdHb2Byj/x1Hvglo98squqoR/pd8XEox9mU09+bCvQnKsSwozFhfCqIwDLdqrvxNr9+1fvITf94Z+3nz/+sRm630mhyfmyS+Lw+jkU9gpI/f2YPPtM/5704GLF3rK77g6N369907ts2z9cHd5Lu/jr0DBpoYH+8y7sGl5yPlNPekwIo6R52za74Xf+2O7+7g964+nl3w/1GcKxLwgAes7aDkDCpA927RqQ8mNebJkl2Wyo/Fg/M+k3VNln0TpdvUD8DG97AAAAK2vHv3wjNC0vaeiroVOOCz00JAxp9ZkvhvnZm2+1ZhFu6MjXwZOPs4HDN4dx2Uvqe+HSxYcauemDH7fvPf7Z807X/fZ7i63mN/WER3eN9a6eBBqjX8GNpurUROgJUtLwNWqIu1y0k3TsYWe0d5ZmznZ+/Tut26MpGR/r2nGs4U40FvxCdDT62JkPak+/+sAw5Fe5E0+P744v/7tt++zCQ41p2JkfXvjSeR9jTdf99vuKLdeeg3n+dbrr379l3z//8nmvR1P5WjlQqvjo3Fla27oxHPmtvhxL8T8Xv3ze26Xppy/9zWKrbqoCueF3r+xusu6f03d8/su26wc/KVb0rnTnrjBE39xJ/SHSO3eEbVRNMHn2Wa2ePnuuuS6clqoazmof6sfcq6vKKjwXevyP3++f85x5n0uarn/HHxVbLUzDAmooxc7eKKMPPcNqWzaG5aX46cvePO/31/Q/T39lsZV/yur3rX/eSniv8u9pYQfEoeBcCN5b/bOqFZt+8uPCkHgL0XCF6o2l19YPL3qZXfsbv2+3ferzoaKqs1+WApapJz66VZE0n+rMVHg+aVL142qv/GjxP+/6ycfa+CXndlfrAAB6whoOQELnj/w0fJgoH4p8gKvYZVazzCaGqzY2UrVmMy+lDpv682Id6RDWAAAAYKVop9+un7TH/a9unLGpJzymWDJr3nRrawgnDSOy+0ft4Zwax9/Hpp74mNYwINphu+3zC++Ub9HRnwtMOlmIjnodeeD9i6Wc+pZs+V8vbE2hZ8HMVHGu/+xZq9rUBb9WLB16YRiT+x5XLHlxFPoKdN4m7bTWEFYlNc/tusx+0GOsIXpuePeHijWLmPPY7jWtVfM9FsWkkyXTtnMu3zUdBFX43Pynn7Lrf+/KMKRaSU2Ppy541JKG3pn3NnVOC1AF166OKhDtTN7+xX9Z9DK9Irtrp9347g/vNV339j+ya9/4+/4+5ttp5/zkefnvje3/9G+tCi5RqJp0NNjei/87V0MJ6ndPaftXVGnX249fOGp/sWkJbvv439mdX2o/lxQc79dwfHO/59ypoCHIOnskaWipxULnYIkByd3f/3F4ruzoGA5OBwFseJ7/PV/0kVlQcTsVnt78wY/Zz/31/Ozlb+kaoksBp95bF3LNa99uP3vFb4Xplo9+qli7+tVPPNrGn3mBVTbMFGsAAL1kTVeA+E8J4WNcXttRytfErmlDVWcbp0ZtoKItdZbfMvLnawqXAgAAwErSztVd//2jfMeMlwwPWf3oI8O81m3/ytfMpcWOJL+87R++ms97ashdv3d76Ke7v/+j7iPHD7GGv121LfvfOFc7I8umtYeajmDurEhZkjiyqfMfteCwLBoyZdsXvtyausav95fVUcM6Uh99yr/O1Dj5jk9/we762rfslj//dHuosyiy8V/L+1Ysp65+I/729P2QNVkW+iF1Vo/lfTvM9txwi+35absKRA3Npy86d95KHAUnCkgmHvOw8LMSvZ53fPUb/nEMi2uagqRbPvSJrr5Iy2Hnf363q6F/RQGFmoYP5UNHzaWKnU2ves4+G7M31W/jHR8I/bN0P1QVWVKF1vrLn7rXMFka0nDkl08P761zqZpvz/U3hUrGTnOHwOukIGfwxGOsftRhXcHcqhXHVj/lOBu/5DyrdBycAADoLWs8APFv2uGDXXsIrFDd4T8gx27WRirONvo/CJMssqp/48sy1YxEYehiDafgv+aXAQAAwIrZ8a/fKD6bddNO0LsVjhRDiciOf/lPa95S9LfwWv01/Oe/2/7q/+Xzy2Ti8b8aemiIdvzs/tE1YVie+aY9198cbpMk/vPo4MnHhvlDSTupxtSPpKAj5ee7LeXU6gvi1bZssKHTTy6WujVv32Y3/P6HWtN1//t9rSoAPd7rn/NUq0yOheWF6DO3hlHRzrIFJx3FvsSjnrE3Hb0+7+PaMXVWASxVGOLs6v9o7dy846+vsm2f/0rr+azhYza84OKu3jvziff189cwO2vs56/KmfkeCwWkoVKro7Ij25WHjKqIueUv/rodQvk/ZsfPfLBt+Y0X2+Cpx/vLj+TXo53sL77UNr7ysnbjdP8zu/OLX/W/q36aL68CqqSbe/87p84G4p3m27ZrWmTYpk76/Xbdb71nr53+S6HQad7vXU6qwChu/w2/d2XX8FLD9zvRDn/rq230IQ/w2+Y/s8r0pE0/7Wzb8oYX2cgZp9nm178wBBkL2X711/PhrzwFZj9/83v898iHTpNhfx3hPaHjdTV94Tm28aXPsMPe8RqbufR8q23e0Lq9qiCcPOdMq9+nfSCB2z1rO781/7BW9fsc4W/ri23Diy4JjdPXPfspq/s17F8r9VOOtfGnU/kBAL0uOvfKb63RvfiRunz4v4edacjjLEv9+5v/QGnOonSPVZs77Ijxml1w5mm2oV6xIbfH4nSXJX6bpsXh8zt/bwEAAByY7Z/6vG37y78tlg7eke99U9gx02n2ltvtpy95015NW9WMWZUPnbQT6JrXvN12//TnxZq2mYvOtcnz28NQ3fTHH7Pb/+/ni6Vu2oG0+dXPDfPaAXzD7/1J2IE4cK+tYedVuUN594+vtZ++/M3dR6p3aJxwn7CjqDwad/c119lPnv+G1k5kmX7q48MQXqLGrD97zdu6Gqrvy9jDH2jrn39ROOpb7vi7L9qN7/1omJ+Phu/a+PJntkKjbVf9s934rg+H+3n0J97X6iOio4t/fPnrw7xo/bpnPqndHNffh21XXR128HXa+paXhyODA79NuvNuf5ovzmfPz2+wa1/3jmWpJkmmJyy7/c7WTvxDTTtxD/+d11ptU37EtnZK/uzVb7PmrbeH5U6H4vknOuJ662++rHXkv557+3rsbv6Tv7Jtn9v3sHBb3/IK/7M7Osxr6J5rX/9O2/md74dl0fNYR6hrCKzyj6id3/zvMBSPnruy8aXPtNFfeUCYl/Qu/fwXfgJkO+6yn7zojV1DbImen5teeZl/LE4Ny6pguObX37lfr42lqPjniJo4l70Ulst9Pv4Hrd8DCpfm3l+Jq5V2aFG49eOfCY3fSxNnP8JmnnZOd6jlH181OFeFTNwYaAfCkrmww/z6t//Rgq8DVQVseeOLrX7vI8KywgH1uVClwWJ0uSPf/+ZW6HD3d37gn/9vDfNzbXnjS2zolOOLJX+z/O8F1xFqz/WzV7zF/2640Q5/x+u6dszvq7qvedsd/nfsr4dg+PB3vt4GDst7pSgw12uzK/Dwz+Hh00/2vw+f1d0rZc79V5P06Sc/tvWcD4/1Is8Xt2t3eBzC9/KXUf+kdc960l7DbOk5rZ/ZXkNw+XV3fPZLduN7/jQsqrm5AucyVLntk5+zm6/8eJgPFIY98iH+9/MTWxV9mX89Xvdb7w3DXKmx+eFve3WoAinp9ofnoPaH+MuXDc1F5936Z5+2Wz82/3v7xpc8w7/3/mKx5B+vW++wn13x22HIr1XHP2b1U4+38YvOsco6Kj8AoJdlWebWdAVI5O+98//yjyD+Q4lm/Ik+nlQjZ1PDVRsfjBV3+DXhHd5vUsyHCQAAAKvB9q/8ezHXtusHP94r/JDtHUenl7TTXkN5LIs4tonHPLy94zFzdtunPrtg+CF3f/eHtrtjmBUNWzP2iAcVSwdPO0u1I6oMP7RTcdvnvxzmF3L3f/+wqwpk5BdPtWRi8UoOUdPgmz7wl7brf4qjyKPIRh/8CyGAKXcM7sWvV98RHdG+4KQd+Qtd/kD5n9XAcUfZ9CueZdOvu9yq2gl6iL/FaqEdvfM+rh3TYkPZ7A8FLTd94GN5ZVNh8KRjbOMLL1mwyiQZasx7m8ppqc3UDzU9JoMPur+t+82X2tQLLrLY35Z7il6v8z0WneGHAqi7vv5tU8PuTrd/+u/thj/4iO254eb2Tnj/+tGwSuE6OsIP9Va67dNfCMMlLVcIeKBCBcic+985hT/y5zHftl3T/jyfnLMd//bNsLO/bIq+FPFgff7vXUzhuVT+TvPfY9vf/7P9/I3vsj3XXN/1cyh/Zq3ww7V/h9/84U/k65bCvxfd8f++ZNu+8JXWcyL2r8cNlz8thB8K93b9+Nqu0C1UIRW/mzvDD73G77zqarv9b64q1uxtzw3+Pdbfr5KGbCub968qCj9OUfhxLuEHAPSJtRuA+M8V+mxRDmcV+QVFIfoAE0fOGrXENs1M2IDfMHE6X58rwhbFFQAAAGC12PHV/+g6ml2f727/5OeKpW4a+kNH0Ha6+7/+p3Uk+qGmpuGdRzDP3nq73fX1dgPaeTmXD1tT7qj0NPTJfjXcXcTA1o3WOO6oYkkVKdfY7muuL5bmp6N11b+jpJ1fU094dLG0OO2UVXVJ2aNAO5Enn/Co/e8/sox0m0Ye93CbetkzQ/AxcOxRNn3Fs61xxmnFFjgYqti57q3va+/w9H9gqUpDR6mHP7Z6gIawG33SY2zimU+weGzEGr9wX5t+zXOtduTWYosV4n9PKOzV6/P6t38gNEWf+ztO29z5D1fbNa95Wwg2dn77+10BsaoTFATf9n/+zq55/e+ESoHORtyYw/+Ovv0z/2B3/uMyNtj3P7Od3/5e+HloOMHwM9Prp/h+qtbYc92Ndsdn/9GufcPv2Q3v/rBl+9vHyn+Pm//k/9jO//yvYoVZZWbSNrzwkhDS//xN7wqVWrf82f+1XT/8Sdf3V0WSqlXUGF7Dgt343j8NQcxCbv/rv7ft/r1a72uquLnp/X9mGnpxVfG/i/KeHwo/JouVAIBet4aHwPJv2HF+lEuaplZNYsuas6Y1VZu1jfXUznvQsXbMhlFL0j1Wi53/AOj/qNajFSX+Pd/598be+KAOAACw2hzqIbC000JHpnZa7MjlvPKh/VnOucw6e4V0if11dxxVHEKJhXZ4zbkd5bZdQ8vosJq0HWwsZtHL7c/tmmvu7dTldPl9mfs9i8st9f7t9bh3/IzC7dmvz9dLfxz3RX1Wxp706HBk/9zboGBsx9/9o23/m6v2f+fiIrofi0XuyyF4/gVzzluKpT6n5v7sFrvc3q+9/Dmko6739++rBV/jc65rv14bC6hu3WgTz36S1Y46rOu+SrZtu93+wY/brq9/Z78qApai+7W1GP8c0l3UfV2K8BhppuO++CsIP4/9eKyW/Dyeo+t+6fsucLv39/eCy/zj72/+3OfZvrVv+37dp67X55xt57x2l2LRipv9/Zn5jbt+H2ibhZ4fc14ze90Xnafrm/v9tZ3eO+f7/vNpPSb7eFxXgv+5108+1sYvPtcq66eLlQCAXqchsNZ0AKL+H0lSsVn/IaPi34Nd2rSqfy9Psj12r/HYLn7EqTYz4N+U01mr+Q9o2Wx+VGFcBCfhAwQAAAD22yEPQIADpCGvtMMrH+6qc8det93f/r7d+u6PhJ3dWEPiyBr3O9E/R86zZGrhiiU1Gb/rqqtt20c/vejwdgBWp/p9j7PxZ1wQKmAAAP1jTfcAUXiho0zKv3F01IJmtZzEsU2OjtjwQGxx1rRIBzToqIZwpMLCfxQBAAAA6A3qmzD00F+0qZc83aqHb140/JCBE4+29b/1irAzXEdLo/9F9QEbefTDbOKypywafoiGxxo+68E29eJLOXoc6CWq/NCwV5eeR/gBAH1qzX5y15836vWhICT2f+yo3DPW2sxZrVqzjRvWWcWyEICo3qMMS1RC6i+VXwEAAACAnqP+JeNPP99PF1g8MlSs3bdkYtQmX3ixjZ3/SIsqh6ZBOFYnPS8mnv3EMDSamk4vVf20E2zmtZdb7Zgj9QdnsRbAqhRFVj/5uPBeQHAJAP1r7R665D+LxgozsjTPMnQUl6Yss+Eks81TwxZl2iy2KE7yIaHDhgpNdAoAAACg19TufbhNXfFsG3rwL1hUWWp/hbaoVrWRsx9hUy+5xCobZoq16BtRFBrgz7zueTaoBvgHUO2TzEzazGsut+FHPuSALg/gHuBfmwosQ8NzKj8AoK+t2U9jkTl/5zOL1PDSaSmxpj+tuFnbUNtjh4/pwUlVA2KZ09Fd/o8jv23kFJiEMbHyKwIAAACw6kXVig09/AybfuWzbeDoI4u1B0hHDZ92YjjSf+CE+4Rl9D49R4bP+mWbevkz8p4wB0FB2dhTHmtTL7zYkrGRYi2AVUHhx6nH5w3P100VKwEA/WoNH46Shxga/kpU4ZFZZAOJ2ZaRmo3FkSXOWRap+iP2f9NEISyJTAFIRhUIAAAA0CM0nNH4JeeFRtb7M+TVviTTEzb98mfa6Dlnhh3e6F1xo25jT36sjT3lcRYPDRZrD06UJNb4hZNtyj9Havc5olgLYEXFCrBPyMMPKj8AYE2gHjdSnBFZmqWWRM4GByq2deN6i7Mor/Twk04jl5/6CxQTAAAAgFXNf9avHrHFpl/1nNDwXEf4H2pqlD16/iNt4rInWzK5eKNsrE7VrRtt+rUasurBh/454p+DGnZt+pXPCg306R0DrKAktsYpx9vEhWcTfgDAGrJmAxBFGWF4K/+BNMQaToNgpTZUS2zTuhl/jobISrVF2FKZh9bkkYgQggAAAACrVhLb0MPOsOlXPNNq99oadkQvG3/dg790ms287vKwsxs9wv/cGg84JQyLttzPkXh4yCZfdImNX3qeRbVasRbAPalx0rGhGjBh2CsAWFPWcAVIbC6EH/mHXLU/rEXOxgarNjaahPAjDHmlYbJaW4kesu41AAAAAFaPeHQ4DEulnc33ZFVGZeM6m3nDC0MfCQ1/hNUrHmrYyGMfbpOXPzUMZbasAVkh9KF52Bk2+YILrbJ+ulgLYNklsdVPOc7GLjnXEio/AGDNWcMBiIa+iq2p4o44sjjKrB6ltm5ixGqVvD5E8YgeIFWHdDb9aM8BAAAAWE0qUxM2+bwLbfTcs1YkhND3HHva423i2U8KR/1j9UlGh23isqfY2BMetSK9Wxr3PykMuRUa6ANYdo2Tj7WJp19A8AgAa9SaDUDyga0ii6LYPwiRJVlqjcTZ1vVTeeihc9X3w6X51pEuUVaMUP0BAAAArCah4fTpJ9nMG19s9ZOP8StW7jO7+jwMPvh0m37Nc612FENirSZqRq6m5Hqu6KjwlaL+A2qgP/xrD6EvCLBc1PPjtBNs7OLzqPwAgDVszQYgocYjy8OMKMosypo2lDRt03TNIn9mPvRVTmFIZ92H8xfTBAAAAGDllY3IJ59/kSWTY8XalVc7cktofq1hj5ajATuWLqokNvSrDwzhh0KQ1UDP2/GnPs6mXvp0S8ZGirUADok4b3g+fun5VllPzw8AWMvWbAASRZEloSQ+M5fOWr3ibN3YkI1U/UPSnPXn54FHFKo9GPQKAAAAWI2qWzfa5POeZiOPe/iKDGe0L+pHMvGsJ9r4xedaPNgo1uKeFA8P+sf/PBu/6Jww/NWq4v8mrZ96vE1dcZnVjjqsWAngoCj8uN+J4fdu6PEDAFjT1mwAEqvKQ8GGU58PZwMVZ5umxqwaxcWwV57Tw9P5ECkM0YBZfo5MBAAAAFgxOqK/ftIxNvXKZ4WeCtrhtZqpCmTdG19s1cM3+xtPOfk9wj/O1cM22fSrnmNDD1/dVTihWuiKy2zwjFOpFgIORjHs1fiFZzPsFQAgWLMBiKo6oiy1OEqtEmfWqEZ22LpJG/B/i+hvp9Q5c1GcD34V/j5RWFL+oaL0gwQEAAAAWAkKP0bOfoRNveTpVpnukR1cUWSVzett+lWX2dBDH1CsxLLxf9QN/tJpNvWyZ+SVFT0QOsUjQzZx+VNt7KmPJwQBDoR/nTdOPT6v/CD8AAAU1nQAYi61ODQ6z2ykXrENk4NWU+Thl/OIQw+PPigrDMkDj1blx+r//AwAAAD0HTWPnnzBxTZ67lkWNQaKtb0jGR+1iadf4Kfzw9BMOPTioYaNPPpXbOI5T7bKut4a+18N0YfPfJBNv/q5Vtk4U6wFsE+q/Dj1eBu78ByGvQIAdFmzAYiGv1J9R2xNi13TJtX/o+7fM/2yc6lFURK2CNOcsCMKoQkVIAAAAMA9aUBDXl1xmTVOP8l/KO/hI5KSdkPuyvrpYiUOBfVZmXjuU230iY8OYUJP8s/tgeOOspnXPs/qpxxfrASwmMbJx+YNz3ss9AQALL/o3Cu/tSb35KvPh6YkSq0eOzvztHvbI48Zt3pzp2UhAPEflrOqaj/MxX5ZUUimvEjVIOoRoj+4KAMBAAA4EDs+92Xb8TdXFUvAPlQr1jj1BBs975E9WfWxmGz7Drv9j//KZn9yrV/QALw4UJUtG2z8aWdbZdO6Yk3vc7t227a//Izt+sZ3zZpFr0pgtXPO0jt3mNszW6xYRhr26vSTbOwpjyNQBgDsJcsyt6YDkDhrWhI3bXywYk946El22lhi1T3b/SdnxR0Vc1lNeYdl8WwIQJIiALEiAHEEIAAAAAfE7d4TduwBSxLHYVij1d7o/EC5NDV3191hpyEOXNSoW1SrFkt9JMssu2unP+X5gd6g4OO2P/wL2/3t7xdrlknZ8+MZF1gyOV6sBACgrS8CEEUQ5R1oD1WVr23165hHZKl/BJo24PbY1smaXXTWyXZ4Elm0e7tFA1Vrpv6PLAUg/npcNOsvoNAjDtep6EMIQAAAAAAAANoUgNz6u1farv/4brFmGajnx2kn2PiFZ1syw7BXAID5KQDp6UOo1MA8dlked/gv6uiRT0l+WuYTkaIKbVdOftsosrQSWW0gsiPHhmwsjSzJ/CWTxJp+3mV52JH469dklloaN/2kBul5fxAAAAAAAADcg+Ii/LjoXMIPAMA+9exefIUYZSWGlNUYLvJry+BDFH6EUvL2tqKlVOGGZXavdVM24i9nzT2WZc4yfwWRf2hiv1HslxWa6BJZlPrrVlcQfQM9dJ3fCAAAAAAAAMsmjqxxvxPz8GN6olgJAMDCejYAUYCRRbE5TWFNHkYo7IhCxUapDD7y0EKVGwowdMcrfm4giWzzxnFVT6okxq/R9nmIEoIUP+XDXmlS5FJ87UpZAAAAAAAAsGzCsFcn5sNeEX4AAJaoZwMQCSFImMvvRhlJ5GGFoo52EBICjWI+RBl+oe7XTY8M2kgjsixNQzQSKwlR6Ueh+zJRflZ7JQAAAAAAAJZZ477H2fjFGvZqslgDAMC+9XQAolBCVSCtXh+m+owsVIDEanJeCP06QruTsmJEYUZqNde0w9ZNWcWvs8xfTuGHhtBSBYm/zkzDXSk40fU7v6qYAAAAAAAAsPyiJLH6aSfYmMIPKj8AAPuppwMQ9fvoFJqiKwCJOofAauusAomyzGpZaocrAPGXqiSxv5wLw2ClGgorVviRByBhe//Pb5GflkEIYQgAAAAAAMCyqZ9ynE1cer5V1tHwHACw/3o4AFGlRj7QVU5VG+rN0Z5KqhDJVNlRLIuCkvGBxDaMJVbVsopAXN4DJM9V8oTD+e1UMRIu679fCD80n68BAAAAAADAoaaeH/c/0cYuOofKDwDAAevZAETVH50VIKrI6Aw9ShoMK48s8m3zucyqsbOZkbqN1GJLFHOkTUtTVY/EFsd+i0xDaGWhAkRT+xpK+l6EIAAAAAAAAIdUXDQ8v/g8Kj8AAAelhytAupXhRGdIkakSREFJkVM4l1qi0CSbtXrk7MhN663qYr/OhfMq1Ypp2CtdIG5dkZ8J42D5hyqclgg/AAAAAAAADimFH/c/ycYvOpvKDwDAQeuLACQflkqDYWmwqlxeHeLXtKpC/GnmzKWzVo0yG/DT5pkxqycKSJqh4blqPlQFInFHdUkegsQWqZG6U+P1ojdI5yYAAAAAAAA4cMWwV+MXKvyYLFYCAHDg+qQCRCFHR9BRzOtr5vL+Hcoz4iiz2DVDADLWqNjMWNVqcWYubVoUKz7JL6PqjzLfyBuez006yi0BAAAAAABw0KLIGqedYOP0/AAAHEI9G4Dkjc6L02KdenbkwUS5Jg5DYGnS6sSvUfgRp03bvG7SBqt+TTrrz9KZCkBii6PEf9X6/Prza/P/VP3R8Z32ykQAAAAAAACw/1T5cb8TbOzCcyyZIvwAABw6PVwBorhCLc4VUWSmOg8FFiGkiNTm3J8T+bsX6y5q+Cqdn1klyixJd9mWjess0bYu9We7EJ1k/vJRlFjiL+cyXafO0ldFIG2hT0j4vgAAAAAAADgYjfseb+OXnGeVGYa9AgAcWj0cgIiqP5zFXVUg+ZBX+RqFIEmo1sgUaDg/ZakNDiS2fqpuFcss8ecp3lDgoabpumzslzXlgYq+6LqK6/Wz5QQAAAAAAIADlCTWuN+JNnYxlR8AgOXR0wFIGXWEeX8Sgomwxp8TRZb6OTVBz4fBykIPkCibtanJERsZjEP4oWbn2iY0TY+TcFkFIWXNh76WlSXaRLOZTsMZWg8AAAAAAID9EhU9Py493yrrpoqVAAAcWj0dgOTRh7STCIUieePyfN65NK/80FKkniBmm6fGbDBWhUcWKkMUgKjioxIn4UqzNC2uLf8eLvLbmLbLv1MeiHR+fwAAAAAAACyJen6cfrKNX3i2JVPjxUoAAA69ng5AMvXqUJ8PNS13iUVOoYazJDOr+Cm21K/fY4lrWtW/uc6mzqq1qh0xPWYNP6/+Ic5fRj0/dDnLmhaH5CQy9TzPoqw1KQQpkw+FKfn3CosAAAAAAABYitDw/CQbv+hsS+j5AQBYZj0bgIQhqPyXTElFi1ZqWT081N/Dmao8TJUezdSSpGL1WsWmR+s2kOTnhevRJZR7FFNJ53VOpbnbAQAAAAAAYB/i2Br3Lys/6PkBAFh+PRuAtIQkIgtTCCossizyk79roZV5SC7y9GIgMZseGbKJkYo/hwQDAAAAAADgHqHKj/ufaONPe7wl04QfAIB7Rm8HICH8KCbNO4UfcR6ARGZZVjQzj5KwTc017bB1k1avVixLm7oGAAAAAAAALLPGqcfb+EXnEn4AAO5RvV8BouoP9ecIdHc0+JV6gygBcZZEiWpD/Oys1WyPHbFh0iqO/h0AAAAAAADLLUoSq9/vRBu76BwangMA7nE9G4CUAUY+lFU+BJZfa84llvl7pdoPCw3SzdJMzdBTm6wntnEstjhzVok1RBYpCAAAAAAAwLKIzOqnHm8Tl55nlZmpYiUAAPecHq8AUejh/Btqai7K/FI+BFbeB0R3LgyAFaaqP3/T9KgNVSKLM7+lVhKAAAAAAAAAHHpJEhqe55UfDHsFAFgZPR6AdFOmoUijnLQi9jOJXxrw93Tz9EQ+/JU1zWXlsFkAAAAAAAA4NPKDTRunn2TjF59rlZnJsAwAwEro+QBEb6tFHUjxFpt/zUXm0szirGmNitmGqVEbiPzaZurPIwABAAAAAAA4pJxZ/ZTjbOIZT6DnBwBgxfVJBUhiLvT7cP4OaSAsnfoll1nsZwbi1KaG6zY8kPgtU1VhmhqkAwAAAAAA4NCJBmo2/KsPsnh4sFgDAMDK6fEAxIV6j0x3w/kpUviRWuxU3ZH586LQB70SpbZxetSG64nfrhlCEUcFCAAAAAAAwKEXh8arAACsuJ4PQPKvsbkostj5OZf6JYUg5bmZVbLUtqybsHotCdUhWhflXdABAAAAAAAAAEAf6vEARHQXEnMuMYsUhaSWZApCXDjiIPPLQzWzDRMjVlHlR2SW6XyORgAAAAAAAAAAoG/1eAAShUDDlT1AnAa9yvJKEL/WRflQWDNjwzY+lFd/hKoQhSMaHisvEQEAAAAAAAAAAH2mpwOQKIQYijpUzeHvSuTn1Phca5wzF4KOzDatm7TBxK/1y5k/PwpNQEg/AAAAAAAAAADoVz0cgOT9PtT0XFTrkUZxmPJoI7M4S63mp02Tw9aInFUyNUlXUFIxp+CEUbAAAAAAAAAAAOhLPRuAaDir2DJLihAkU/hhVUujqp/X+ZnV/HlDUWZbJxpWz3ZbNZv1W/hLNZ05VYH0cv4DAAAAAAAAAAAW1NMJgHp4qIgjTGFIqzzUcJEGx3JWs8wOWzdhjSSxOJ21WMNfaTt/PuUfAAAAAAAAAAD0r54OQPLeH3mQocBDVR8SWqC7yKpRakds3mD1aiWco+xDfUDi0P1cQ2fl2wMAAAAAAAAAgP7SwwFIFCo91NVDcUYnRSGKRQai1DZPD1u16pejxK/x26oKJFxi7qUAAAAAAAAAAEC/6NkARCFHqPQIdyEf8kpDXOXU6jyziUbFJocjSyK/Jk6KUa+KS7q8fgQAAAAAAAAAAPSfnh4CS7UcanjeWc2hmhANdaVhrjZNj9pwNbYoy5SAhPWKSmIFIroMRSAAAAAAAAAAAPSlHq4A8VOkU90FVXOkIfxQHqLTxKV22Popa0SxZX4+9ADxU0g/NK80BAAAAAAAAAAA9KXerQBphR+5EGtEWqnwo2kDcWYbJwdDH5A4c+3AQw3Qw/BXeRACAAAAAAAAAAD6T08PgVVSuKE4I0QaWWoVa9rkcM3GGolVomboAaJt4hCQuLwaRPMAAAAAAAAAAKAv9UUAkvf9UKyhuo7IBqxph81MWD1JQmP0fGgsVYDkTdIVfoRW6GQgAAAAAAAAAAD0pZ4OQPJ2Hi4f+iqfC4FH3Zp25MZJG6j4u1cMfRWrAsSycL7WEH4AAAAAAAAAANC/ejYAUSsPhRtRqPBQoJFXdajaY6RqtmGiZtUkbFpUf2jbfDlfo7tOCgIAAAAAAAAAQD/q6QoQhR8KNsJ8FFvm8tbmU2MNG63F/s65IujIIw9N+pr5dZnfXvMAAAAAAAAAAKD/9HAA4pSAhJDDFISEAMQsiSPbsn7a6nESKj60hU7zKpCcI/wAAAAAAAAAAKCv9XYFSPgSWZZl5r+Yy1KrVCI7bMOU1TX8lRKRcBf9VIQgeRWI/0f+AQAAAAAAAABA3+rhACQKlRxh2Cs/JS61gbhpYwORTQ3WrBYGukr9V+eniv9aLS6VhW2TEI60q0IAAAAAAAAAAED/6NkARBUcmUv8FFscxZa4zIZs1jaND9pQElklS0PY4b+EKCSzxDQclkIRfyk/6XwCEAAAAAAAAAAA+lHvBiB+ypyzOM6HuApdPdI9tnl6wurVxG+QWRymotIjyuOOsieIhfUAAAAAAAAAAKAf9WwAElp4hFwjUrYRAo9a7GzTuiGrVhWH+DNdFIIR1X+oDkRzLgyHRQMQAAAAAAAAAAD6We8GIM7f+LIBegg0MpsYqtvkcOLXO3NxEX5kiju0jSKRfPArp2oQMhAAAAAAAAAAAPpWzwYgkqj0QwGHP0n8soa/Gq5UzGVpGPIqivLqD/X9UECSqWm6AhAqQAAAAAAAAAAA6Gs9HYCEgMNPkaVWS8yO2DhtjaRqzmm4K79eVSJ+PnJ5Q/RQCxLpLlMBAgAAAAAAAABAP+vpAMRlLlSBRFnTBpLUNk7WreHvUSgMCRFIiDrC1O4BomGwSD8AAAAAAAAAAOhnPV4BEoXqjoqlNjFct5GBKMyHsEMpiPPbOOe3y5SEBCEO0XkAAAAAAAAAAKBv9XYAojgjSy3Jdtvm6XGrJ5WwHIVhr8IGYagr57SQz4dUJEwAAAAAAAAAAKBf9WwAoizDpalVYmeV5m7bMjNs9aqGuHIh3wiZRyvn0NbhEn7SAFhdZwIAAAAAAAAAgD7T0xUgyjTU5Hy0FtmGsSSEIS5LLY4iS2J/pv+v4a5clGgmDz4iVYe4MAEAAAAAAAAAgP7U0wGIMg5rNm3zzLiN1mt+IbXMqTF64u9YYmp6nlpkWbib+V3VkiYAAAAAAAAAANC/ejgAcZZlCjNSO2LTOhtMqv7OqCQkDztc5s/3c1mc+K95GBIqP/xciESKeQAAAAAAAAAA0H96ugJE/T7qtYptnh6zRhKFihCnACTLQgCipucKQRR+qPYjrwVRk/Qy/CAAAQAAAAAAAACgH636AEQhRqk9m89VLbORwZqfKlZNzDKnihB/mSyzSuTnotASvYg58mV1R29fDwAAAAAAAAAA6EerIAAp44gyqsjjCn3N/FkhAAm3MvMLzipR4i8RW5I5qzZ32qbxutUHEn+u3zDLLM6aVonVCD21xG8f+ytqBx66onw4LDVH7zwHAAAAAAAAAAD0jxUNQCIXWazJNDxVMSyVqjTCaR5+pC4fykq1HDorbJlps9Rq6U7bOjVstWoSmp2HeCNLraI4xJ8f++1CAKKrFKctYn9NfvLz1IIAAAAAAAAAANCfVjQAKZX5xFyRqjScmp07i+OkCERSf456eTgbSMzWT9Yt8Uux3zZEG34bDYUVBr8K+Yb/oqvRbKdwHgAAAAAAAAAA6EcrGoDklR2lvW9KXhni+Y0yv7GqQRRtRH7TOMpsYmTIJodrlrjMYn+ewpJi8zDElYbFCqdzA5CyyqRrJQAAAAAAAAAA6BcrXAGi4a2KMCLwN0epiIIPv0pTHCWh+kPhR6rt/MoQbaSztnn9lA1V61b166Ms9ZfV9agOJMlPo2KYq3CdJW2ThdMofG8AAAAAAAAAANBvVrYCJExhsKogP22HFS5VE3NVgSR+IbZIpR+q6Ehn/Q1v2mEbZ6xeqVrNr66EKpAQnYTLqmJE4Ucel5T0HfLwoz0BAAAAAAAAAIB+s7IVIFFeAdKOIdrhR5jLFGoo0tBSZHEcm8tSf7FZG21UbP1YwwYTs8RpXRpqP9Q3JM00VFZoqV4UlMytNAEAAAAAAAAAAP1sxQKQdhxRhBKq8AhpRXmT8obmam7uMi05i5LYnEutGjmbGR+2wWocGqFbc9ayNM1jEv8lC1cZljQThDgkKqs/AAAAAAAAAABAP1vZCpAOebNy9e3QfFiThx/N1LIssyhKzDkNaJVaxZq2eXrCBmsVs0zDYaWWFBUe2iaJ/d0K15EHIEUtSJjvRBQCAAAAAAAAAEB/WrEARKFEHkzkS8VYVa21YcpLPyxW7w+/Pm3OhqGuajZrGyYGrVGNzakfSBSFSVT94RSA6DoDf43O+Tvarv7IAxYAAAAAAAAAANCvVkUFiPp8xEVgkfmTvArEmctUzVGGGxoEK7PEUhupJTYzklgtLjt95PLwRNvm1xWWQvjh5/1mmg/8N8i3WxV3HwAAAAAAAAAAHGIrmgAo5GjFFa0KkHx9SCzisGRp2gyn1SS2apzZ+okhGx2oWOLXFZFGuHh+bZ0UfmgLVX90an1XAAAAAAAAAADQh1Y0AAk5h2ILneYJRsglMr9CUxTr3MzSTA3OtaxMJLXD1k/ZUHXAoiwLF1HwEWpB1DOkGApLIqe1+dBXunwpbNOxHQAAAAAAAAAA6C8rG4AUp20h5ihCDaUian6eWRxHFsWxZc1Zq/j1G6fGbKiaWD6klZqn54FGftnyWnX5/JrisJ0mhR+6y3lgAgAAAAAAAAAA+tOKBiASRrkKFEgUIUaYdZY5vxRHlsTqEKKG6KmNjQ3Z5GjNasXwWGXo4YohtEoKR8I5rdOuc8NlAAAAAAAAAABAf1rBACSyMOxV61QJRRlW+OUwaTt1+vCzWWYDLrPNE6M2VK2aU18QnRGGsiqncIHWaR56FPP64q8zLwqJQuN1AAAAAAAAAADQn1a0AsSFcCOxzN+KLFKfj1mrZk0/+bXOr4wia/otsigOw1gNzt5lx0wNW6NSMRdVwvkWhrfK+3x0Tso3Ql8Qfxc1ZToNYUkeipTBCAAAAAAAAAAA6D8rPgRWCCeUY8Spn0ut4vyU+bVKRSyx1KnRubOKXxr3X9YPVmwgjvyWedShSCOfiuqRsDanwEPhiXqEdBd8lEEJAAAAAAAAAADoRysagIThqDrDiPJEgUiIMvLqDVV5xK5p0xOjNjLUsGriN8iaxQW6kg0AAAAAAAAAAICVDUAkD0FyZfBhLh+uKsQb/jRWFcjsLls/PWEjg/UwHFZnpQcAAAAAAAAAAECnlQ1AOtOPUMmRxxphyCp/09TZI4ojdQmxJN1t6yfHrF6rmEv3WOIvq/qQvAoEAAAAAAAAAACgbWWHwAqTYo529Uc+5FU+9JVTI3SnNumzNjZYtcnRmlUVmqTN0D4dAAAAAAAAAABgPitbAeLKCg61OS/mIlWA5KcWKwTJLHFN2zwzbqONgRB8hPDDr88vAQAAAAAAAAAA0G1lA5C9Aoy8JiRMLgr9P7I0tSTbbZumRqxerfgbnCkXCQFI1whaAAAAAAAAAAAAhRUOQOajAEQnzlyWWeIXK27WtszUbayRWLpnt0V+vXqDBIQgAAAAAAAAAABgjhUNQJyanRc5Rs5ZpMqO4lRZSORSmxgesPF61armz/OXsdhv4Vx+2a7LAwAAAAAAAAAArHgFSJ5gzM0x1Bg9TC4z19xjm6fHbLRey5ufV/xN1tBYVH4AAAAAAAAAAIAFrIIhsBR1+JvhonBjyuqP0OtDk0ttw+SojQ4kfr4Zzlf44dwquOkAAAAAAAAAAGBVWtEUweVxR5jaaxR8KATRlNlAtWJTI4M2WDFLoiwMfZVmfssk8VvlkQkAAAAAAAAAAECnVVFGoQikkyKNshpkcnzExobrVo3SEIw4VX9EsT8vKbYEAAAAAAAAAADotgoCEIUYeZChwCMuKj/yYbCcrZ+ZttGhhl9uhvMUgERxYlm4BI1AAAAAAAAAAADA3lZFBUiLi/x/TarwMBtwu23TWM2GB2JzmVmmwMP/T2J/szMNh5VfDAAAAAAAAAAAoNOKBiCRwg5Ve5gmF6o6sqhis1leETJZnbUjRzMbrjpzcdVSl+TFIlnTkshZ7CeqQAAAAAAAAAAAwFwrXgGiEERCbw+L/LIGvqpYlqY2M1Sz6UZkiT8zHxArtjgEIKnfMtWlwmUBAAAAAAAAAAA6rYoARENb6V8INFxmSewsSvfY+qlJG24MmmXOMj855yyO1fxcmxJ+AAAAAAAAAACA+a1oAKJAQzFGplNVdvgp8vOJa6oGxKYnR60+ULMsy1uet/htojAWFgAAAAAAAAAAwN5WNADJin8ShsIKw2FlFmezNtqo2vho1eIotUhVIdrG/1Phh05jvy0RCAAAAAAAAAAAmM/KDoGlNMOykHtoTkGHudRit8c2To3b2NCgNgr/FXjECkAyNT/Pw4/QAx0AAAAAAAAAAGCOlQ1AFHyE5COv5Qg9Plxq1WyPbV43ZqONAb8c+xup/h9pHpRo+Kty+/AVAAAAAAAAAACg24oGIPmwVy4EIGWYobBjwK9bN5pYo9YxzFUY+6pY8ieZqkUAAAAAAAAAAADmsaIBSBzlN6Ds/xH7FYmfnRpr2ORQxar+TDVF19BXykkUkkRRHIbBKqIQAAAAAAAAAACAvaxgAKKhrFTYkYVqDtV6KNRIZ3fbuvERm2g0rJJqSCzFHmV9SGTOX0i1HxkNQAAAAAAAAAAAwAJWtAJEuUao7EgVgOTVHlHatE1TozbWqFmUpX6t4g7CDgAAAAAAAAAAsHQrGoBEmbNEpwpBnDP9awxUbWp0wOpJ0+KsaYlCEp3jN8r/teMQxzhYAAAAAAAAAABgHisagDinCg9r9zZ3ZtPj4zbaaFjVn5fo/CgL4YdiDwUemZ8IPgAAAAAAAAAAwGKicz74ze3F/D3M+f/N0AA9jap+Kbaa22P33TJujz15o917NLPIpRYGxwo9QjQYVmLqARL75dgv5a3QSUMAAAAAAAAAAEAns/8PPhqyhuaKbpYAAAAASUVORK5CYII="
+                src=asset_url('rpf_framework.png')
             ),
             html.P([
                 html.B("The proposed approach starts by focusing on the development outcomes that governments want to pursue, and builds its way back to how the effective functioning of public sector and fiscal institutions can support governments in achieving those outcomes. "),
@@ -1,15 +1,17 @@
 import dash
 from dash import html, dcc, callback, Input, Output
 import dash_bootstrap_components as dbc
+from figures import THEMATIC_CLIENT_CACHE, THEMATIC_VERSION_POLL
+from indicators import INDICATORS, tab_id
 
 dash.register_page(__name__)
 
 layout = html.Div(children=[
     dbc.Card(
         dbc.CardBody([
-            dbc.Tabs(id='thematic-tabs', active_tab='tab-education', children=[
-                dbc.Tab(label='Education', tab_id='tab-education'),
-                dbc.Tab(label='Health', tab_id='tab-health'),
+            dbc.Tabs(id='thematic-tabs', active_tab=tab_id(next(iter(INDICATORS))), children=[
+                dbc.Tab(label=indicator['label'], tab_id=tab_id(name))
+                for name, indicator in INDICATORS.items()
             ], style={"marginBottom": "2rem"}),
             html.Div(id='thematic-spinner', children=[
                 dbc.Spinner(color="primary", spinner_style={
@@ -21,3 +23,14 @@ layout = html.Div(children=[
     )
 ])
 
+if THEMATIC_CLIENT_CACHE != 'none':
+    layout.children += [
+        # tab id -> current data version, from the server
+        dcc.Store(id='thematic-versions'),
+        dcc.Interval(id='thematic-version-poll', interval=THEMATIC_VERSION_POLL * 1000),
+        # the tab the server is asked to render
+        dcc.Store(id='thematic-request'),
+        # the cache entry shown in thematic-content
+        dcc.Store(id='thematic-shown'),
+    ]
+
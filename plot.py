@@ -1,17 +1,70 @@
-import math
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
-from sklearn.linear_model import LinearRegression, RANSACRegressor, HuberRegressor
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.pipeline import Pipeline
 from plotly.subplots import make_subplots
-from queries import get_health_data, get_edu_data
+from indicators import INDICATORS, query_spec
+from queries import get_indicator_data
 
 
-def make_plot(dataset, gdp, country, yaxes_title, table_header_outcome, column_name):
-    earliest_year = dataset.year.min() 
+OUTLIER_THRESHOLD = 1.5
+
+
+def fit_trendlines(dataset, column_name, threshold=OUTLIER_THRESHOLD):
+    """
+    Fits an ordinary least squares trendline of `column_name` against gdp per
+    capita for every (year, income_level) group in a single vectorized pass
+
+    Returns
+    -------
+    df : pandas dataframe
+        the dataset sorted by year, income_level and gdp per capita, with the
+        group's fitted value (fitted_y) and whether the row's absolute residual
+        is more than `threshold` residual standard deviations (is_outlier)
+    group_slices : dict
+        (year, income_level) -> slice of the rows of df belonging to that group
+    """
+    df = dataset.sort_values(by=['year', 'income_level', 'gdp_per_capita_2017_ppp'], kind='mergesort').reset_index(drop=True)
+    if df.empty:
+        return df.assign(fitted_y=pd.Series(dtype=float), is_outlier=pd.Series(dtype=bool)), {}
+
+    years = df['year'].to_numpy()
+    levels = df['income_level'].to_numpy()
+    x = df['gdp_per_capita_2017_ppp'].to_numpy(dtype=float)
+    y = df[column_name].to_numpy(dtype=float)
+
+    # rows are sorted by group, so each group is a contiguous run
+    boundaries = np.flatnonzero((years[1:] != years[:-1]) | (levels[1:] != levels[:-1])) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(df)]))
+    group = np.repeat(np.arange(len(starts)), ends - starts)
+
+    n = np.bincount(group).astype(float)
+    mean_x = np.bincount(group, x) / n
+    mean_y = np.bincount(group, y) / n
+    dx = x - mean_x[group]
+    dy = y - mean_y[group]
+    sxx = np.bincount(group, dx * dx)
+    sxy = np.bincount(group, dx * dy)
+    # a group with a single distinct x gets a flat line through its mean
+    slope = np.divide(sxy, sxx, out=np.zeros_like(sxx), where=sxx > 0)
+    intercept = mean_y - slope * mean_x
+
+    fitted_y = intercept[group] + slope[group] * x
+    residuals = y - fitted_y
+    residual_std = np.sqrt(np.bincount(group, residuals * residuals) / n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std_residuals = np.abs(residuals / residual_std[group])
+
+    df['fitted_y'] = fitted_y
+    df['is_outlier'] = std_residuals > threshold
+    group_slices = {
+        (years[start], levels[start]): slice(start, end)
+        for start, end in zip(starts, ends)
+    }
+    return df, group_slices
+
+
+def make_plot(dataset, yaxes_title, table_header_outcome, column_name):
     latest_year = dataset.year.max()
     years = sorted(dataset.year.unique().tolist())
     max_exp = dataset.gdp_per_capita_2017_ppp.max()
@@ -20,34 +73,35 @@ def make_plot(dataset, gdp, country, yaxes_title, table_header_outcome, column_n
     table_cols = ['year', 'income_level_label', 'country_name', 'gdp_per_capita_2017_ppp', column_name, 'link']
     table_headers = ['Year', 'Income Level', 'Country', 'Per Capita GDP (2017 PPP)', table_header_outcome, 'Link']
 
+    fitted, group_slices = fit_trendlines(
+        dataset[dataset['income_level'].isin(income_level_legend_map.keys())], column_name)
+    x_all = fitted['gdp_per_capita_2017_ppp'].to_numpy()
+    y_all = fitted[column_name].to_numpy()
+    fitted_y_all = fitted['fitted_y'].to_numpy()
+    outlier_all = fitted['is_outlier'].to_numpy()
+    country_names_all = fitted['country_name'].to_numpy()
+
+    outlier_countries = fitted[outlier_all].copy()
+    outlier_countries['income_level_label'] = outlier_countries['income_level'].map(income_level_legend_map)
+    outlier_countries['y_minus_fitted_y'] = outlier_countries[column_name] - outlier_countries.fitted_y
+    outlier_countries['link'] = '<a href="https://app.powerbi.com/groups/75fff923-5acd-443e-877b-d2c6e88cdb31/reports/a28af24a-6a8a-4241-bd42-40a4c4af5716/ReportSection?experience=power-bi">investigate</a>'
+    outlier_countries.sort_values(by=['year', 'income_level_label', 'y_minus_fitted_y'], inplace=True)
+    outliers_by_year = dict(tuple(outlier_countries.groupby('year', sort=False)))
+
     def build_graph_and_table(year):
         graphs = []
-        outlier_countries = pd.DataFrame(columns=dataset.columns + ['fitted_y'])
-        dataset_by_year = dataset[dataset["year"] == year]
         for level in income_level_legend_map.keys():
             level_name = income_level_legend_map[level]
-            dataset_by_year_level = dataset_by_year[
-                dataset_by_year["income_level"] == level].sort_values(by="gdp_per_capita_2017_ppp")
-
-            x = dataset_by_year_level["gdp_per_capita_2017_ppp"]
-            y = dataset_by_year_level[column_name]
-            country_names = dataset_by_year_level['country_name']
-
-            if not dataset_by_year_level.empty:
-                # trendline
-                x_input = x.values.reshape(-1, 1)
-                model = LinearRegression()
-                fitted_y = model.fit(x_input, y.ravel()).predict(x_input)
-                residuals = y - fitted_y
-                std_residuals = np.abs(residuals / np.std(residuals))
-                outlier_mask = std_residuals > 1.5
-            else:
-                fitted_y = y
-                outlier_mask = y != fitted_y
+            rows = group_slices.get((year, level), slice(0, 0))
+            x = x_all[rows]
+            y = y_all[rows]
+            fitted_y = fitted_y_all[rows]
+            outlier_mask = outlier_all[rows]
+            country_names = country_names_all[rows]
 
             data_dict = {
-                'y': list(fitted_y),
-                'x': list(x),
+                'y': fitted_y,
+                'x': x,
                 'line': dict(color=color_map[level]),
                 'name': f'Trendline: {level_name}',
                 'legendgroup': level_name,
@@ -59,10 +113,10 @@ def make_plot(dataset, gdp, country, yaxes_title, table_header_outcome, column_n
 
             # scatter non-outliers
             data_dict = {
-                "x": list(x[~outlier_mask]),
-                "y": list(y[~outlier_mask]),
+                "x": x[~outlier_mask],
+                "y": y[~outlier_mask],
                 "mode": "markers",
-                "text": list(country_names[~outlier_mask]),
+                "text": country_names[~outlier_mask],
                 "marker": {
                     "color": color_map[level], 
                     "opacity": 0.3,
@@ -76,11 +130,11 @@ def make_plot(dataset, gdp, country, yaxes_title, table_header_outcome, column_n
             # scatter outliers
             textposition = np.where(y[outlier_mask] > fitted_y[outlier_mask], 'top center', 'bottom center')
             data_dict = {
-                "x": list(x[outlier_mask]),
-                "y": list(y[outlier_mask]),
+                "x": x[outlier_mask],
+                "y": y[outlier_mask],
                 "mode": "markers",
-                "text": list(country_names[outlier_mask]),
-                "textposition": list(textposition),
+                "text": country_names[outlier_mask],
+                "textposition": textposition,
                 "marker": {
                     "color": color_map[level], 
                     "opacity": 0.6,
@@ -90,31 +144,25 @@ def make_plot(dataset, gdp, country, yaxes_title, table_header_outcome, column_n
             }
             graphs.append(go.Scatter(**data_dict))
 
-            dataset_by_year_level['fitted_y'] = fitted_y
-            outlier_countries = pd.concat([outlier_countries, dataset_by_year_level[outlier_mask]], ignore_index=True)
-
-        outlier_countries['income_level_label'] = outlier_countries['income_level'].map(income_level_legend_map)
-        outlier_countries['y_minus_fitted_y'] = outlier_countries[column_name] - outlier_countries.fitted_y
-        outlier_countries['link'] = '<a href="https://app.powerbi.com/groups/75fff923-5acd-443e-877b-d2c6e88cdb31/reports/a28af24a-6a8a-4241-bd42-40a4c4af5716/ReportSection?experience=power-bi">investigate</a>'
-        outlier_countries.sort_values(by=['year', 'income_level_label', 'y_minus_fitted_y'], inplace=True)
-        # color underformers red, overperformers green
-        colors = np.where(outlier_countries.y_minus_fitted_y > 0, '#D8FFB1', '#FFCCCB')
-
-        if outlier_countries.shape[0] > 0:
+        outliers = outliers_by_year.get(year)
+        if outliers is not None:
+            # color underformers red, overperformers green
+            colors = np.where(outliers.y_minus_fitted_y > 0, '#D8FFB1', '#FFCCCB')
             t = go.Table(
                 header=dict(values=table_headers,
                                 fill = dict(color='#C2D4FF'),
                                 align = ['left'] * 5),
-                cells=dict(values=[outlier_countries[col] for col in table_cols],
-                            fill = dict(color=[colors for col in table_cols]),
+                cells=dict(values=[outliers[col] for col in table_cols],
+                            # a single column of colors applies to every column
+                            fill = dict(color=[colors]),
                             align = ['left'] * 5),
                 )
         else:
             t = go.Table(header=dict(values=[f'No outlier country detected for {year}']))
 
+        return graphs, t
 
-        return graphs, t, outlier_countries
-
+    graphs_and_tables = {year: build_graph_and_table(year) for year in years}
 
     fig = make_subplots(
         rows=2, cols=1,
@@ -127,7 +175,7 @@ def make_plot(dataset, gdp, country, yaxes_title, table_header_outcome, column_n
         subplot_titles=('Institutional Capacity vs. Outcome', 'Outlier Countries')
     )
 
-    graphs, t, _ = build_graph_and_table(latest_year)
+    graphs, t = graphs_and_tables[latest_year]
     num_scatters = len(graphs)
     fig.add_traces(graphs, rows=1, cols=1)
     fig.add_trace(t, row=2, col=1)
@@ -182,7 +230,7 @@ def make_plot(dataset, gdp, country, yaxes_title, table_header_outcome, column_n
 
     frames = []
     for year in years:
-        graphs, t, outliers = build_graph_and_table(year)
+        graphs, t = graphs_and_tables[year]
 
         # each frame must have the same number of traces, otherwise annimation may fail with out-of-index error
         assert len(graphs) == num_scatters, f'Expect the number of scatter traces ({num_scatters}) to be the same across years but got {len(graphs)} for {year}'
@@ -211,10 +259,7 @@ def make_plot(dataset, gdp, country, yaxes_title, table_header_outcome, column_n
     return fig
 
 
-def make_health_plot(gdp, country):
-    dataset = get_health_data(gdp, country)
-    return make_plot(dataset, gdp, country, 'Universal Health Coverage', 'Universal Health Coverage Index', 'universal_health_coverage_index')
-
-def make_edu_plot(gdp, country):
-    dataset = get_edu_data(gdp, country)
-    return make_plot(dataset, gdp, country, 'Learning Poverty Rate', 'Learning Poverty Rate', 'learning_poverty_rate')
+def make_indicator_plot(name):
+    indicator = INDICATORS[name]
+    dataset = get_indicator_data(**query_spec(name))
+    return make_plot(dataset, indicator['axis_title'], indicator['table_header'], indicator['value_column'])
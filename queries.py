@@ -1,65 +1,507 @@
+import hashlib
+import json
+import logging
 import os
-import pandas as pd
-from databricks import sql
+import time
+import re
+from functools import partial
+import diskcache
+import pyarrow as pa
+from caching import cache, CACHE_DIR
+from backends import get_backend
+from indicators import INDICATORS
+from query_executor import run_concurrently
+from metrics import inc, observe, request_id
 
-SERVER_HOSTNAME = os.getenv("SERVER_HOSTNAME")
-HTTP_PATH = os.getenv("HTTP_PATH")
-ACCESS_TOKEN = os.getenv("ACCESS_TOKEN")
+# seconds a cached query result stays valid, per table. reference tables change at most daily
+QUERY_CACHE_TTLS = {
+    'boost.data_availability': int(os.getenv("AVAILABILITY_CACHE_TTL", 24 * 60 * 60)),
+    'indicator.gdp': int(os.getenv("GDP_CACHE_TTL", 24 * 60 * 60)),
+    'indicator.country': int(os.getenv("COUNTRY_CACHE_TTL", 24 * 60 * 60)),
+    **{
+        indicator['table']: int(os.getenv("INDICATOR_CACHE_TTL", 24 * 60 * 60))
+        for indicator in INDICATORS.values()
+    },
+}
+# upper bound on how long one process may hold a refresh lock, in case it dies mid-query
+QUERY_CACHE_LOCK_TIMEOUT = 5 * 60
+# with the background refresh scheduler running, expired results are served for
+# up to this many more seconds while they are refreshed
+REFRESH_SCHEDULER = os.getenv("REFRESH_SCHEDULER", "0") == "1"
+QUERY_CACHE_STALE_TTL = int(os.getenv("QUERY_CACHE_STALE_TTL", 7 * 24 * 60 * 60))
+REFRESH_QUEUE = 'refresh-request'
 
-def execute_query(dbsql_query):
+# tables refreshed incrementally -> their watermark column. Refreshing a cached
+# result then only fetches the rows from the last INCREMENTAL_LOOKBACK years
+# before its watermark (the latest year it holds) and replaces those years in
+# it. Results are re-read in full when older than INCREMENTAL_FULL_RELOAD_AGE,
+# to pick up revisions of earlier years. country and data_availability have no
+# year and are small, they are always re-read in full
+INCREMENTAL_TABLES = {
+    'indicator.gdp': 'year',
+    **{indicator['table']: 'year' for indicator in INDICATORS.values()},
+}
+INCREMENTAL_LOOKBACK = int(os.getenv("INCREMENTAL_LOOKBACK", 2))
+INCREMENTAL_FULL_RELOAD_AGE = int(os.getenv("INCREMENTAL_FULL_RELOAD_AGE", 7 * 24 * 60 * 60))
+# rows of incrementally refreshed results are sorted by these columns, then the
+# others, so the same rows get the same version whether merged or read in full
+INCREMENTAL_SORT_KEYS = ['country_code', 'year']
+# queries that read columns of a single table, which can be narrowed with a WHERE clause
+SIMPLE_SELECT = re.compile(r'^\s*SELECT\s+[\w\s,*]+?\s+FROM\s+[\w.]+\s*$', re.IGNORECASE)
+
+# where indicator tables are joined with gdp and country: "arrow" fetches only
+# the indicator and joins it in process with the base frame built once from the
+# cached gdp and country tables, "warehouse" pushes the joins down into SQL
+INDICATOR_JOIN = os.getenv("INDICATOR_JOIN", "arrow")
+
+# cached results are written here as Arrow IPC files named by their version,
+# and memory-mapped when read, so every process on the host shares their pages
+# through the page cache instead of holding its own copy. Files no live cache
+# entry can refer to anymore are removed after DATASET_RETENTION seconds
+DATASET_DIR = os.getenv("DATASET_DIR", os.path.join(CACHE_DIR, "datasets"))
+DATASET_RETENTION = max(max(QUERY_CACHE_TTLS.values()) + QUERY_CACHE_STALE_TTL, INCREMENTAL_FULL_RELOAD_AGE)
+
+backend = get_backend()
+
+logger = logging.getLogger(__name__)
+
+
+def execute_query(dbsql_query, as_arrow=False):
     """
-    Fetches data from the Databricks database and returns it as a pandas dataframe
+    Fetches data from the configured backend (the Databricks database by
+    default, see backends.py) and returns it as a pandas dataframe
 
     Returns
     -------
     df : pandas dataframe
-        basic query of data from Databricks as a pandas dataframe
+        basic query of data from Databricks as a pandas dataframe, or as a
+        pyarrow Table if as_arrow is True
+    """
+    table_data = _fetch_arrow(dbsql_query)
+    return table_data if as_arrow else table_data.to_pandas()
+
+
+def _fetch_arrow(dbsql_query):
+    table = table_label(dbsql_query)
+    start = time.perf_counter()
+    rows = None
+    try:
+        table_data = backend.fetch_arrow(dbsql_query)
+        rows = table_data.num_rows
+        observe('query_rows', rows, table=table)
+        return table_data
+    except Exception:
+        inc('query_errors_total', table=table)
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        observe('query_duration_seconds', duration, table=table)
+        logger.info(json.dumps({
+            'request_id': request_id.get(),
+            'query_table': table,
+            'rows': rows,
+            'duration_ms': round(duration * 1000, 1),
+        }))
+
+
+def table_label(dbsql_query):
+    """
+    The first table a query reads from, used to label its metrics
+    """
+    match = re.search(r'\bFROM\s+([\w.]+)', dbsql_query, re.IGNORECASE)
+    return match.group(1) if match else 'unknown'
+
+
+def get_pool_stats():
+    return backend.stats()
+
+
+def normalize_query(dbsql_query):
+    return re.sub(r'\s+', ' ', dbsql_query).strip().rstrip(';').strip()
+
+
+def query_cache_key(dbsql_query):
+    digest = hashlib.sha256(normalize_query(dbsql_query).encode('utf-8')).hexdigest()
+    return f'dataset:{digest}'
+
+
+def cached_query(dbsql_query, table, as_arrow=False):
+    """
+    Same as execute_query but results are shared across processes for
+    QUERY_CACHE_TTLS[table] seconds: the diskcache maps the query to the
+    version of its result, read from a memory-mapped file in DATASET_DIR.
+    Queries against tables without a TTL are not cached.
+
+    When an entry is missing only one process runs the query, the others wait
+    on its lock and then read the stored entry. With REFRESH_SCHEDULER
+    enabled, entries past their TTL are kept for another QUERY_CACHE_STALE_TTL
+    seconds and served as they are while the scheduler refreshes them (see
+    refresh.py).
+    """
+    ttl = QUERY_CACHE_TTLS.get(table)
+    if ttl is None:
+        return execute_query(dbsql_query, as_arrow=as_arrow)
+
+    key = query_cache_key(dbsql_query)
+    table_data = load_dataset(cache.get(key))
+    if table_data is None:
+        with diskcache.Lock(cache, f'{key}:lock', expire=QUERY_CACHE_LOCK_TIMEOUT):
+            table_data = load_dataset(cache.get(key))
+            if table_data is None:
+                table_data = refresh_query(dbsql_query, table)
+    elif REFRESH_SCHEDULER and (query_age(dbsql_query) or float('inf')) > ttl:
+        request_refresh(dbsql_query, table)
+    return table_data if as_arrow else table_data.to_pandas()
+
+
+def refresh_query(dbsql_query, table):
+    """
+    Runs the query and replaces its cached result, returns it as a pyarrow
+    Table. Results of INCREMENTAL_TABLES are brought up to date with only the
+    rows that may have changed when possible.
+    """
+    ttl = QUERY_CACHE_TTLS[table]
+    expire = ttl + QUERY_CACHE_STALE_TTL if REFRESH_SCHEDULER else ttl
+    key = query_cache_key(dbsql_query)
+    column = INCREMENTAL_TABLES.get(table)
+    table_data = _fetch_incremental(dbsql_query, table, key)
+    if table_data is None:
+        table_data = _fetch_arrow(dbsql_query)
+        if column:
+            cache.set(f'{key}:full_at', time.time(), expire=INCREMENTAL_FULL_RELOAD_AGE, tag=table)
+    if column:
+        table_data = _sort_rows(table_data)
+    version = store_dataset(table_data)
+    cache.set(key, version, expire=expire, tag=table)
+    cache.set(f'{key}:fetched_at', time.time(), expire=expire, tag=table)
+    full_at = cache.get(f'{key}:full_at')
+    if column in table_data.column_names and table_data.num_rows and full_at is not None:
+        import pyarrow.compute as pc
+
+        # kept until the next full read is due rather than for the TTL, so the
+        # refresh after the cached entry expired can still merge into it
+        until_full_reload = max(1, full_at + INCREMENTAL_FULL_RELOAD_AGE - time.time())
+        cache.set(f'{key}:watermark', pc.max(table_data[column]).as_py(), expire=until_full_reload, tag=table)
+        cache.set(f'{key}:base', version, expire=until_full_reload, tag=table)
+    return load_dataset(version)
+
+
+def _fetch_incremental(dbsql_query, table, key):
+    """
+    Merges the rows at or after the watermark minus INCREMENTAL_LOOKBACK into
+    the cached result of the query. Returns None when the result has to be
+    fetched in full instead.
+    """
+    column = INCREMENTAL_TABLES.get(table)
+    if column is None or not SIMPLE_SELECT.match(dbsql_query):
+        return None
+    full_at = cache.get(f'{key}:full_at')
+    watermark = cache.get(f'{key}:watermark')
+    current = load_dataset(cache.get(f'{key}:base'))
+    if full_at is None or watermark is None or current is None or time.time() - full_at > INCREMENTAL_FULL_RELOAD_AGE:
+        return None
+
+    import pyarrow.compute as pc
+
+    cutoff = watermark - INCREMENTAL_LOOKBACK
+    changed = _fetch_arrow(f'{dbsql_query} WHERE {column} >= {cutoff}')
+    if not changed.schema.equals(current.schema):
+        return None
+    kept = current.filter(pc.less(current[column], cutoff))
+    logger.info('Refreshed %s from %s %s on: %d rows fetched, %d kept', table, column, cutoff, changed.num_rows, kept.num_rows)
+    return pa.concat_tables([kept, changed])
+
+
+def _sort_rows(table_data):
+    """
+    The rows in INCREMENTAL_SORT_KEYS order, then by the other columns, in a
+    single chunk: the serialized result, and its version, then only depend
+    on which rows it holds
+    """
+    keys = [c for c in INCREMENTAL_SORT_KEYS if c in table_data.column_names]
+    keys += [c for c in table_data.column_names if c not in keys]
+    return table_data.sort_by([(c, 'ascending') for c in keys]).combine_chunks()
+
+
+def query_age(dbsql_query):
+    """
+    Seconds since the cached result of the query was fetched, None if it is not cached
+    """
+    fetched_at = cache.get(f'{query_cache_key(dbsql_query)}:fetched_at')
+    return None if fetched_at is None else time.time() - fetched_at
+
+
+def request_refresh(dbsql_query, table):
+    # queued in the shared cache, as stale reads also happen in long callback
+    # processes that exit before a refresh could finish
+    cache.push((dbsql_query, table), prefix=REFRESH_QUEUE, expire=QUERY_CACHE_LOCK_TIMEOUT)
+
+
+def get_data_version(dbsql_query, table):
+    """
+    Returns a short hash of the cached result of the query, fetching it first
+    if needed. The version only changes when the data itself does, so it can
+    be used to key anything derived from the result.
+    """
+    key = query_cache_key(dbsql_query)
+    version = cache.get(key)
+    if version is None:
+        cached_query(dbsql_query, table)
+        version = cache.get(key)
+    return version
+
+
+def get_cached_data_version(dbsql_query):
+    """
+    The version of the cached result of the query, None if it is not cached.
+    Never runs the query.
     """
-    conn = sql.connect(
-        server_hostname=SERVER_HOSTNAME,
-        http_path=HTTP_PATH,
-        access_token=ACCESS_TOKEN,
-    )
-    cursor = conn.cursor()
-    cursor.execute(dbsql_query)
-    df = cursor.fetchall_arrow().to_pandas()
-    cursor.close()
-    conn.close()
-    return df
+    return cache.get(query_cache_key(dbsql_query))
 
 
-def get_available_data():
-    return execute_query("SELECT * FROM boost.data_availability")
+def invalidate_cache(table=None):
+    """
+    Drops cached results for the given table, or for every cached table if none is given
+    """
+    tables = [table] if table else QUERY_CACHE_TTLS.keys()
+    return sum(cache.evict(t) for t in tables)
+
+
+def dataset_path(version):
+    return os.path.join(DATASET_DIR, f'{version}.arrow')
+
+
+def store_dataset(table_data):
+    """
+    Writes a query result to DATASET_DIR, returns its version: a short hash of
+    the serialized data, which is also its file name
+    """
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table_data.schema) as writer:
+        writer.write_table(table_data)
+    data = sink.getvalue()
+    version = hashlib.sha256(data).hexdigest()[:16]
+    path = dataset_path(version)
+    if os.path.exists(path):
+        # unchanged data, its file is kept for another DATASET_RETENTION
+        os.utime(path)
+    else:
+        os.makedirs(DATASET_DIR, exist_ok=True)
+        # renamed into place, readers never see a partly written file
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    _prune_datasets()
+    return version
+
+
+def load_dataset(version):
+    """
+    Memory-maps the query result stored as `version`. The returned Table
+    references the mapped file rather than copying it. Returns None if there
+    is no such result.
+    """
+    if version is None:
+        return None
+    try:
+        source = pa.memory_map(dataset_path(version))
+    except FileNotFoundError:
+        return None
+    return pa.ipc.open_file(source).read_all()
+
+
+def _prune_datasets():
+    # files are only removed long after any cache entry referring to them
+    # expired, and a file still mapped by a process stays readable by it
+    cutoff = time.time() - DATASET_RETENTION
+    for entry in os.scandir(DATASET_DIR):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            pass
 
 
-def get_gdp():
-    return execute_query("SELECT * FROM indicator.gdp")
+AVAILABILITY_QUERY = "SELECT * FROM boost.data_availability"
 
-def get_country():
-    return execute_query("SELECT * FROM indicator.country")
 
+def get_available_data(as_arrow=False):
+    return cached_query(AVAILABILITY_QUERY, 'boost.data_availability', as_arrow=as_arrow)
 
-def get_health_data(gdp, country):
-    health_indicator = execute_query("SELECT * FROM indicator.universal_health_coverage_index_gho")
-    merged = pd.merge(gdp, health_indicator, on=['country_code', 'year'], how='inner')
-    merged = merged[merged.gdp_per_capita_2017_ppp.notnull() & merged.universal_health_coverage_index.notnull()]
-    df = pd.merge(merged, country, on=['country_code'], how='inner')
-    df = df[df.income_level != 'INX']
-    df['universal_health_coverage_index'] = df['universal_health_coverage_index']/100
-    return df
+def get_available_data_version():
+    return get_data_version(AVAILABILITY_QUERY, 'boost.data_availability')
 
 
-def get_edu_data(gdp, country):
-    edu_indicator = execute_query("SELECT * FROM indicator.learning_poverty_rate")
-    merged = pd.merge(gdp, edu_indicator, on=['country_code', 'year'], how='inner')
-    merged = merged[merged.gdp_per_capita_2017_ppp.notnull() & merged.learning_poverty_rate.notnull()]
-    df = pd.merge(merged, country, on=['country_code'], how='inner')
-    df = df[df.income_level != 'INX']
+GDP_QUERY = "SELECT * FROM indicator.gdp"
+COUNTRY_QUERY = "SELECT * FROM indicator.country"
 
-    # some years have very few countries' data available, drop them
-    country_counts = df.groupby('year')['country_code'].nunique()
-    comparable_years = country_counts[country_counts >= 45].index
-    df_filtered = df[df['year'].isin(comparable_years)]
 
-    return df_filtered
+def get_gdp(as_arrow=False):
+    return cached_query(GDP_QUERY, 'indicator.gdp', as_arrow=as_arrow)
+
+def get_country(as_arrow=False):
+    return cached_query(COUNTRY_QUERY, 'indicator.country', as_arrow=as_arrow)
+
+
+def build_indicator_query(table, value_column, scale=None, min_countries_per_year=None):
+    """
+    Builds a single projected query joining an indicator table with gdp and
+    country, with the null filters and INX exclusion applied in the warehouse.
+    Only the columns used by plot.make_plot are returned.
+
+    Parameters
+    ----------
+    table : str
+        fully qualified indicator table, keyed on country_code and year
+    value_column : str
+        indicator column to plot
+    scale : number, optional
+        the indicator value is divided by this, e.g. 100 for percentages
+    min_countries_per_year : int, optional
+        drop years with data for fewer countries than this
+    """
+    value = f'i.{value_column} / {scale}' if scale else f'i.{value_column}'
+    joined = f"""
+        SELECT
+            i.year,
+            i.country_code,
+            c.country_name,
+            c.income_level,
+            g.gdp_per_capita_2017_ppp,
+            {value} AS {value_column}
+        FROM {table} i
+        JOIN indicator.gdp g ON g.country_code = i.country_code AND g.year = i.year
+        JOIN indicator.country c ON c.country_code = i.country_code
+        WHERE g.gdp_per_capita_2017_ppp IS NOT NULL
+            AND i.{value_column} IS NOT NULL
+            AND c.income_level IS DISTINCT FROM 'INX'
+    """
+    columns = f'year, country_name, income_level, gdp_per_capita_2017_ppp, {value_column}'
+    if not min_countries_per_year:
+        return f'SELECT {columns} FROM ({joined}) joined'
+
+    return f"""
+        WITH joined AS ({joined})
+        SELECT {columns}
+        FROM joined
+        WHERE year IN (
+            SELECT year FROM joined
+            GROUP BY year
+            HAVING COUNT(DISTINCT country_code) >= {int(min_countries_per_year)}
+        )
+    """
+
+
+def build_base_frame(gdp, country):
+    """
+    Joins gdp with country and applies the filters every indicator shares:
+    known gdp per capita and INX excluded. All arguments and the result are
+    pyarrow Tables.
+    """
+    import pyarrow.compute as pc
 
+    gdp = gdp.select(['country_code', 'year', 'gdp_per_capita_2017_ppp'])
+    gdp = gdp.filter(pc.is_valid(gdp['gdp_per_capita_2017_ppp']))
+    # year may be typed differently across tables, join keys must match
+    gdp = gdp.set_column(1, 'year', pc.cast(gdp['year'], pa.int64()))
+    country = country.select(['country_code', 'country_name', 'income_level'])
+    country = country.filter(pc.fill_null(pc.not_equal(country['income_level'], 'INX'), True))
+    return gdp.join(country, keys='country_code', join_type='inner')
+
+
+_base_frames = {}
+
+
+def get_base_frame():
+    """
+    Returns the base frame for the current gdp and country data, built once
+    per version of them and shared by every indicator
+    """
+    version = (get_data_version(GDP_QUERY, 'indicator.gdp'), get_data_version(COUNTRY_QUERY, 'indicator.country'))
+    if version not in _base_frames:
+        _base_frames.clear()
+        _base_frames[version] = build_base_frame(get_gdp(as_arrow=True), get_country(as_arrow=True))
+    return _base_frames[version]
+
+
+def join_indicator(base, indicator, value_column, scale=None, min_countries_per_year=None):
+    """
+    Arrow compute equivalent of build_indicator_query: joins an indicator
+    table with the base frame, applies the null filter, scaling and
+    comparable-year threshold, and projects the columns used by
+    plot.make_plot. All arguments and the result are pyarrow Tables.
+    """
+    import pyarrow.compute as pc
+
+    indicator = indicator.select(['country_code', 'year', value_column])
+    indicator = indicator.filter(pc.is_valid(indicator[value_column]))
+    indicator = indicator.set_column(1, 'year', pc.cast(indicator['year'], pa.int64()))
+    joined = indicator.join(base, keys=['country_code', 'year'], join_type='inner')
+
+    if scale:
+        index = joined.schema.get_field_index(value_column)
+        joined = joined.set_column(index, value_column, pc.divide(pc.cast(joined[value_column], pa.float64()), scale))
+
+    if min_countries_per_year:
+        counts = joined.group_by('year').aggregate([('country_code', 'count_distinct')])
+        comparable_years = counts.filter(pc.greater_equal(counts['country_code_count_distinct'], min_countries_per_year))['year']
+        joined = joined.filter(pc.is_in(joined['year'], value_set=comparable_years))
+
+    return joined.select(['year', 'country_name', 'income_level', 'gdp_per_capita_2017_ppp', value_column])
+
+
+def indicator_query(table, value_column, scale=None, min_countries_per_year=None):
+    """
+    The query reading an indicator's own table: just its columns when joining
+    in Arrow, the whole joined dataset when joining in the warehouse
+    """
+    if INDICATOR_JOIN == 'arrow':
+        return f'SELECT country_code, year, {value_column} FROM {table}'
+    return build_indicator_query(table, value_column, scale=scale, min_countries_per_year=min_countries_per_year)
+
+
+def get_indicator_data(table, value_column, scale=None, min_countries_per_year=None):
+    """
+    Returns the plot-ready data of an indicator as a pandas dataframe, joined
+    either in the warehouse or in process depending on INDICATOR_JOIN. Data
+    stays in Arrow until this single conversion of the projected columns.
+    """
+    query = indicator_query(table, value_column, scale=scale, min_countries_per_year=min_countries_per_year)
+    if INDICATOR_JOIN == 'arrow':
+        tables = run_concurrently({
+            'base': get_base_frame,
+            'indicator': partial(cached_query, query, table, as_arrow=True),
+        }, warehouse=backend.name)
+        table_data = join_indicator(
+            tables['base'], tables['indicator'],
+            value_column, scale=scale, min_countries_per_year=min_countries_per_year,
+        )
+    else:
+        table_data = cached_query(query, table, as_arrow=True)
+    return table_data.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def get_indicator_data_version(table, value_column, scale=None, min_countries_per_year=None, cached_only=False):
+    """
+    The version of the plot-ready data of an indicator. With cached_only
+    nothing is fetched: None is returned unless every result it depends on
+    is cached.
+    """
+    query = indicator_query(table, value_column, scale=scale, min_countries_per_year=min_countries_per_year)
+    if INDICATOR_JOIN == 'arrow':
+        sources = {
+            'gdp': (GDP_QUERY, 'indicator.gdp'),
+            'country': (COUNTRY_QUERY, 'indicator.country'),
+            'indicator': (query, table),
+        }
+        if cached_only:
+            versions = [get_cached_data_version(source_query) for source_query, _ in sources.values()]
+            if None in versions:
+                return None
+        else:
+            versions = run_concurrently({
+                name: partial(get_data_version, *source) for name, source in sources.items()
+            }, warehouse=backend.name).values()
+        return hashlib.sha256(f'{scale}:{min_countries_per_year}:{":".join(versions)}'.encode('utf-8')).hexdigest()[:16]
+    return get_cached_data_version(query) if cached_only else get_data_version(query, table)
@@ -0,0 +1,82 @@
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+# max queries in flight against one warehouse from this process
+WAREHOUSE_CONCURRENCY = int(os.getenv("WAREHOUSE_CONCURRENCY", 4))
+QUERY_TIMEOUT = float(os.getenv("QUERY_TIMEOUT", 120))
+
+
+class QueryTimeout(Exception):
+    pass
+
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(warehouse):
+    with _executors_lock:
+        if warehouse not in _executors:
+            _executors[warehouse] = ThreadPoolExecutor(
+                max_workers=WAREHOUSE_CONCURRENCY,
+                thread_name_prefix=f'query-{len(_executors)}',
+            )
+        return _executors[warehouse]
+
+
+def _reset_after_fork():
+    # the threads of an executor do not survive a fork, a forked process (a
+    # preforked server worker, a long callback worker) starts its own
+    global _executors_lock
+    _executors.clear()
+    _executors_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def run_concurrently(calls, warehouse='default', timeout=QUERY_TIMEOUT):
+    """
+    Runs independent queries concurrently and waits for all of them, so the
+    total latency is that of the slowest rather than the sum
+
+    Parameters
+    ----------
+    calls : dict
+        name -> callable taking no arguments, e.g. a partial of execute_query
+    warehouse : str
+        queries for the same warehouse share a pool of WAREHOUSE_CONCURRENCY threads
+    timeout : float or dict
+        seconds each query may take, counted from submission, either one value
+        for all queries or name -> seconds
+
+    Returns
+    -------
+    results : dict
+        name -> return value of the call
+
+    If a query fails or times out the queries that have not started yet are
+    cancelled and the error is raised. Queries already running on the
+    warehouse cannot be interrupted, their results are discarded.
+    """
+    executor = get_executor(warehouse)
+    start = time.monotonic()
+    # run each call in a copy of the caller's context, so e.g. the request ID follows it
+    futures = {name: executor.submit(contextvars.copy_context().run, call) for name, call in calls.items()}
+    results = {}
+    try:
+        for name, future in futures.items():
+            query_timeout = timeout.get(name, QUERY_TIMEOUT) if isinstance(timeout, dict) else timeout
+            remaining = max(0, query_timeout - (time.monotonic() - start))
+            try:
+                results[name] = future.result(timeout=remaining)
+            except TimeoutError:
+                raise QueryTimeout(f'Query {name} did not finish within {query_timeout}s') from None
+    except BaseException:
+        for future in futures.values():
+            future.cancel()
+        raise
+    return results
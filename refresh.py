@@ -0,0 +1,230 @@
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from caching import cache
+from figures import THEMATIC_FIGURES, ensure_built
+from indicators import INDICATORS, query_spec
+from queries import (
+    AVAILABILITY_QUERY, GDP_QUERY, COUNTRY_QUERY, INDICATOR_JOIN,
+    QUERY_CACHE_TTLS, QUERY_CACHE_LOCK_TIMEOUT, REFRESH_QUEUE, indicator_query, query_age, refresh_query,
+)
+
+logger = logging.getLogger(__name__)
+
+# a dataset is refreshed once this fraction of its cache TTL has passed, so
+# entries are normally replaced before anyone is served a stale one
+REFRESH_FRACTION = float(os.getenv("REFRESH_FRACTION", 0.5))
+# refresh times are spread by up to this fraction, so datasets and workers do not refresh in lockstep
+REFRESH_JITTER = float(os.getenv("REFRESH_JITTER", 0.1))
+# after a failed refresh wait this long, doubling with each consecutive failure up to the max
+REFRESH_BACKOFF = float(os.getenv("REFRESH_BACKOFF", 60))
+REFRESH_MAX_BACKOFF = float(os.getenv("REFRESH_MAX_BACKOFF", 60 * 60))
+# how often the scheduler looks for due datasets and queued refresh requests
+REFRESH_TICK = float(os.getenv("REFRESH_TICK", 1))
+
+
+class Dataset:
+    """
+    Cached queries refreshed together every `interval` seconds, and the
+    thematic figures derived from them. The figures are rebuilt after each
+    refresh, which only does work when the data actually changed.
+    """
+
+    def __init__(self, name, queries, figures=(), interval=None):
+        self.name = name
+        self.queries = queries
+        self.figures = figures
+        self.interval = interval or min(QUERY_CACHE_TTLS[table] for _, table in queries) * REFRESH_FRACTION
+
+    def age(self):
+        ages = [query_age(query) for query, _ in self.queries]
+        return None if None in ages else max(ages)
+
+    def refresh(self):
+        for query, table in self.queries:
+            refresh_query(query, table)
+        for name in self.figures:
+            ensure_built(name)
+
+
+# figures that include gdp and country through the in process base frame
+JOINED_FIGURES = tuple(THEMATIC_FIGURES) if INDICATOR_JOIN == 'arrow' else ()
+
+DATASETS = {
+    'availability': Dataset('availability', [(AVAILABILITY_QUERY, 'boost.data_availability')]),
+    'gdp': Dataset('gdp', [(GDP_QUERY, 'indicator.gdp')], figures=JOINED_FIGURES),
+    'country': Dataset('country', [(COUNTRY_QUERY, 'indicator.country')], figures=JOINED_FIGURES),
+}
+DATASETS.update({
+    name: Dataset(name, [(indicator_query(**query_spec(name)), INDICATORS[name]['table'])], figures=[name])
+    for name in INDICATORS
+})
+
+
+def _status_key(name):
+    return f'refresh-status:{name}'
+
+
+def _timestamp(seconds):
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat(timespec='seconds')
+
+
+def _jittered(seconds):
+    return seconds * (1 + random.uniform(-REFRESH_JITTER, REFRESH_JITTER))
+
+
+class RefreshScheduler:
+    """
+    Keeps the cached datasets fresh from a background thread. Each dataset is
+    refreshed when its data gets older than its interval, or right away when
+    a request was served its stale result. Refreshes are coordinated through
+    the shared cache, so with several workers each dataset is still refreshed
+    by only one of them, and the status of the last refresh is visible to all.
+    """
+
+    def __init__(self, datasets=DATASETS):
+        self.datasets = datasets
+        self.next_run = {name: 0 for name in datasets}
+        self._stop = threading.Event()
+
+    def start(self):
+        thread = threading.Thread(target=self.run, name='refresh-scheduler', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self):
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception:
+                logger.exception('Refresh scheduler tick failed')
+            self._stop.wait(REFRESH_TICK)
+
+    def tick(self):
+        self._take_requests()
+        for name, dataset in self.datasets.items():
+            if self.next_run[name] <= time.time():
+                self.next_run[name] = self._run(dataset)
+
+    def _take_requests(self):
+        while True:
+            _, request = cache.pull(prefix=REFRESH_QUEUE)
+            if request is None:
+                return
+            for name, dataset in self.datasets.items():
+                # a dataset backing off from errors keeps waiting
+                if tuple(request) in dataset.queries and not get_status(name).get('consecutive_failures'):
+                    self.next_run[name] = 0
+
+    def _run(self, dataset):
+        """
+        Refreshes the dataset if it is due, returns when to look at it next
+        """
+        age = dataset.age()
+        if age is not None and age < dataset.interval:
+            # refreshed recently, possibly by another worker
+            return time.time() + _jittered(dataset.interval - age)
+
+        lock = f'refresh-lock:{dataset.name}'
+        if not cache.add(lock, os.getpid(), expire=QUERY_CACHE_LOCK_TIMEOUT):
+            # another worker is refreshing it
+            return time.time() + _jittered(min(REFRESH_BACKOFF, dataset.interval))
+
+        status = get_status(dataset.name)
+        start = time.time()
+        try:
+            dataset.refresh()
+        except Exception as e:
+            logger.exception('Failed to refresh dataset %s', dataset.name)
+            failures = status.get('consecutive_failures', 0) + 1
+            delay = min(REFRESH_MAX_BACKOFF, REFRESH_BACKOFF * 2 ** (failures - 1))
+            status.update(last_error=repr(e), last_error_at=_timestamp(time.time()), consecutive_failures=failures)
+        else:
+            delay = dataset.interval
+            status.update(
+                last_refresh_at=_timestamp(start),
+                last_duration_seconds=round(time.time() - start, 3),
+                consecutive_failures=0,
+            )
+        finally:
+            cache.delete(lock)
+
+        next_run = time.time() + _jittered(delay)
+        status['next_refresh_at'] = _timestamp(next_run)
+        cache.set(_status_key(dataset.name), status)
+        return next_run
+
+
+def get_status(name):
+    return cache.get(_status_key(name)) or {}
+
+
+def refresh_status(datasets=DATASETS):
+    """
+    Returns, per dataset, when it was last refreshed and how long that took,
+    the last error, when the next refresh is planned and how old the cached
+    data currently is
+    """
+    status = {}
+    for name, dataset in datasets.items():
+        age = dataset.age()
+        status[name] = dict(
+            get_status(name),
+            interval_seconds=dataset.interval,
+            age_seconds=None if age is None else round(age, 1),
+        )
+    return status
+
+
+def missing_datasets(datasets=DATASETS):
+    """
+    Names of the datasets with no cached result
+    """
+    return [name for name, dataset in datasets.items() if dataset.age() is None]
+
+
+# names of the datasets loaded, by this process or the one it was forked from
+_loaded = set()
+
+
+def datasets_loaded(datasets=DATASETS):
+    """
+    Whether every dataset has been loaded. Stays true once it is: results
+    that expire or are evicted later are fetched again on demand, so they
+    do not make the process unable to serve.
+    """
+    missing = set(datasets) - _loaded
+    if missing:
+        _loaded.update(missing - set(missing_datasets({name: datasets[name] for name in missing})))
+    return _loaded.issuperset(datasets)
+
+
+def load_datasets(datasets=DATASETS):
+    """
+    Fetches the datasets with no cached result, returns the names of those
+    that could not be loaded. The others count as loaded for datasets_loaded
+    from then on, also in processes forked afterwards.
+    """
+    for name, dataset in datasets.items():
+        # may have been loaded along with an earlier one, e.g. for its figures
+        if dataset.age() is not None:
+            continue
+        try:
+            dataset.refresh()
+        except Exception:
+            logger.exception('Failed to load dataset %s', name)
+    missing = missing_datasets(datasets)
+    _loaded.update(name for name in datasets if name not in missing)
+    return missing
+
+
+def start_scheduler():
+    scheduler = RefreshScheduler()
+    scheduler.start()
+    return scheduler
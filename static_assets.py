@@ -0,0 +1,48 @@
+import functools
+import hashlib
+import os
+import dash
+import flask
+
+ASSETS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+MEDIA_URL_PATH = '/media/'
+# hashed urls change whenever the content does, so browsers may keep them forever
+MEDIA_MAX_AGE = 365 * 24 * 60 * 60
+
+
+@functools.lru_cache(maxsize=None)
+def content_hash(filename):
+    with open(os.path.join(ASSETS_FOLDER, filename), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def hashed_filename(filename):
+    stem, suffix = os.path.splitext(filename)
+    return f'{stem}.{content_hash(filename)}{suffix}'
+
+
+def asset_url(filename):
+    """
+    Returns the content-hashed url of a file in the assets folder, e.g.
+    /media/rpf_logo.0a1b2c3d4e5f.png, which is served with long-lived
+    caching headers
+    """
+    return dash.get_relative_path(MEDIA_URL_PATH + hashed_filename(filename))
+
+
+def serve_media(hashed_name):
+    stem, suffix = os.path.splitext(hashed_name)
+    stem, _, digest = stem.rpartition('.')
+    filename = stem + suffix
+    if not stem or not os.path.isfile(os.path.join(ASSETS_FOLDER, filename)) or digest != content_hash(filename):
+        flask.abort(404)
+
+    # conditional requests are answered with 304 based on the ETag and Last-Modified headers
+    response = flask.send_from_directory(ASSETS_FOLDER, filename, conditional=True, etag=True, max_age=MEDIA_MAX_AGE)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+def register_media_route(server):
+    server.add_url_rule(MEDIA_URL_PATH + '<path:hashed_name>', 'media', serve_media)
@@ -0,0 +1,25 @@
+import argparse
+from backends import DatabricksBackend, DATA_SNAPSHOT_DIR, SNAPSHOT_TABLES, sync_snapshots
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Refresh the local Parquet snapshots read by DATA_BACKEND=duckdb from Databricks')
+    parser.add_argument('--snapshot-dir', default=DATA_SNAPSHOT_DIR)
+    parser.add_argument('--tables', nargs='+', default=SNAPSHOT_TABLES)
+    parser.add_argument('--keep-cache', action='store_true',
+                        help='do not invalidate cached query results of the synced tables')
+    args = parser.parse_args()
+
+    rows = sync_snapshots(DatabricksBackend(), args.snapshot_dir, args.tables)
+    for table, count in rows.items():
+        print(f'{table}: {count} rows')
+
+    if not args.keep_cache:
+        from queries import invalidate_cache
+        for table in args.tables:
+            invalidate_cache(table)
+
+
+if __name__ == '__main__':
+    main()
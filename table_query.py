@@ -0,0 +1,110 @@
+import math
+import re
+
+# DataTable filter query operators, both the symbol and word forms. An `s` or
+# `i` prefix on the word form marks a case sensitive or insensitive comparison
+OPERATORS = {
+    '>=': 'ge', '<=': 'le', '<': 'lt', '>': 'gt', '!=': 'ne', '=': 'eq',
+    'ge': 'ge', 'le': 'le', 'lt': 'lt', 'gt': 'gt', 'ne': 'ne', 'eq': 'eq',
+    'contains': 'contains', 'datestartswith': 'datestartswith',
+}
+# compared as strings whatever the column type: contains is also the default
+# operator of columns declared without a type, so a year typed into their
+# filter box arrives as `{latest_year} contains 2005`
+TEXT_OPERATORS = ('contains', 'datestartswith')
+FILTER_PART = re.compile(
+    r'^\s*\{(?P<column>[^}]+)\}\s+'
+    r'(?P<case>[si]?)(?P<operator>>=|<=|!=|<|>|=|ge|le|lt|gt|ne|eq|contains|datestartswith)\s+'
+    r'(?P<value>.+?)\s*$'
+)
+
+
+def split_filter_part(filter_part):
+    """
+    Splits one `&&` separated clause of a DataTable filter query into its
+    column id, operator, value and whether the comparison is case insensitive.
+    Returns None if the clause cannot be parsed.
+    """
+    match = FILTER_PART.match(filter_part)
+    if match is None:
+        return None
+    operator = OPERATORS[match.group('operator')]
+    value = match.group('value')
+    if value[0] == value[-1] and value[0] in ("'", '"', '`') and len(value) > 1:
+        value = value[1:-1].replace('\\' + value[0], value[0])
+    elif operator not in TEXT_OPERATORS:
+        try:
+            value = float(value)
+        except ValueError:
+            pass
+    return match.group('column'), operator, value, match.group('case') == 'i'
+
+
+def filter_frame(df, filter_query):
+    for filter_part in (filter_query or '').split(' && '):
+        parsed = split_filter_part(filter_part)
+        if parsed is None:
+            continue
+        column, operator, value, case_insensitive = parsed
+        if column not in df.columns:
+            continue
+
+        col = df[column]
+        numeric = col.dtype.kind in 'iuf' and isinstance(value, float)
+        if not numeric:
+            col = col.astype(str)
+            value = str(value) if not isinstance(value, float) or not value.is_integer() else str(int(value))
+            if case_insensitive:
+                col = col.str.lower()
+                value = value.lower()
+
+        if operator == 'contains':
+            mask = col.str.contains(value, regex=False)
+        elif operator == 'datestartswith':
+            mask = col.str.startswith(value)
+        elif operator == 'eq':
+            mask = col == value
+        elif operator == 'ne':
+            mask = col != value
+        elif operator == 'lt':
+            mask = col < value
+        elif operator == 'le':
+            mask = col <= value
+        elif operator == 'gt':
+            mask = col > value
+        else:
+            mask = col >= value
+        df = df[mask.fillna(False).astype(bool)]
+    return df
+
+
+def sort_frame(df, sort_by):
+    sort_by = [s for s in (sort_by or []) if s['column_id'] in df.columns]
+    if not sort_by:
+        return df
+    return df.sort_values(
+        by=[s['column_id'] for s in sort_by],
+        ascending=[s['direction'] == 'asc' for s in sort_by],
+        kind='mergesort',
+    )
+
+
+def query_frame(df, filter_query, sort_by, page_current, page_size):
+    """
+    Applies a DataTable's custom filter, sort and paging state to a dataframe
+
+    Returns
+    -------
+    records : list of dict
+        rows of the requested page only
+    total : int
+        number of rows matching the filter
+    page_count : int
+        number of pages at the given page size
+    """
+    df = sort_frame(filter_frame(df, filter_query), sort_by)
+    total = len(df)
+    page_current = page_current or 0
+    start = page_current * page_size
+    records = df.iloc[start:start + page_size].to_dict('records')
+    return records, total, max(1, math.ceil(total / page_size))
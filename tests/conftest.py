@@ -0,0 +1,9 @@
+import os
+import tempfile
+
+# the app modules read their configuration when imported: point them at a
+# scratch cache and the local DuckDB backend before any test imports them
+_scratch = tempfile.mkdtemp(prefix='boost-tests-')
+os.environ.setdefault('CACHE_DIR', os.path.join(_scratch, 'cache'))
+os.environ.setdefault('DATA_SNAPSHOT_DIR', os.path.join(_scratch, 'data'))
+os.environ.setdefault('DATA_BACKEND', 'duckdb')
@@ -0,0 +1,27 @@
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from backends import DuckDBBackend, snapshot_path
+
+GDP = pa.table({'country_code': ['KEN', 'PER'], 'year': [2020, 2020], 'gdp_per_capita_2017_ppp': [4500.0, 12000.0]})
+
+
+def test_snapshot_synced_after_start_is_read(tmp_path):
+    backend = DuckDBBackend(str(tmp_path))
+    with pytest.raises(duckdb.CatalogException):
+        backend.fetch_arrow('SELECT * FROM indicator.gdp')
+
+    pq.write_table(GDP, snapshot_path(str(tmp_path), 'indicator.gdp'))
+    assert backend.fetch_arrow('SELECT * FROM indicator.gdp').equals(GDP)
+
+
+def test_replaced_snapshot_is_read(tmp_path):
+    path = snapshot_path(str(tmp_path), 'indicator.gdp')
+    pq.write_table(GDP, path)
+    backend = DuckDBBackend(str(tmp_path))
+    assert backend.fetch_arrow('SELECT count(*) AS n FROM indicator.gdp').to_pylist() == [{'n': 2}]
+
+    pq.write_table(GDP.slice(0, 1), path)
+    assert backend.fetch_arrow('SELECT count(*) AS n FROM indicator.gdp').to_pylist() == [{'n': 1}]
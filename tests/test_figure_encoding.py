@@ -0,0 +1,32 @@
+import numpy as np
+
+from figure_encoding import encode_traces
+
+LINK = '<a href="https://example.org/report">investigate</a>'
+
+
+def table(*columns, **cells):
+    return {'type': 'table', 'cells': dict(cells, values=list(columns))}
+
+
+def test_repeated_table_column_is_sent_once():
+    years = np.array([2019, 2020, 2020])
+    [trace] = encode_traces([table(years, ['LIC', 'HIC', 'LIC'], [LINK] * 3, ['note'] * 3)])
+    cells = trace['cells']
+    assert cells['values'] == [[2019, 2020, 2020], ['LIC', 'HIC', 'LIC'], ['>'] * 3, [''] * 3]
+    assert cells['prefix'] == [None, None, LINK[:-1], 'note']
+    # what plotly.js shows: prefix + value
+    assert [cells['prefix'][2] + value for value in cells['values'][2]] == [LINK] * 3
+
+
+def test_table_left_alone():
+    single_row = table(['only'])
+    assert encode_traces([single_row]) == [single_row]
+    prefixed = table([LINK] * 2, prefix=['$'])
+    assert encode_traces([prefixed]) == [prefixed]
+
+
+def test_scatter_arrays_are_typed():
+    [trace] = encode_traces([{'type': 'scatter', 'x': np.arange(3), 'textposition': ['top'] * 3}])
+    assert trace['x']['dtype'] == 'i4'
+    assert trace['textposition'] == 'top'
@@ -0,0 +1,75 @@
+import plotly.graph_objects as go
+import pytest
+
+import figures
+from caching import cache
+
+NAME = 'test-figure'
+
+
+def build():
+    return go.Figure(
+        data=[go.Scatter(x=[1], y=[2019])],
+        frames=[go.Frame(name=str(year), data=[go.Scatter(x=[1], y=[year])]) for year in (2019, 2020)],
+    )
+
+
+@pytest.fixture
+def key(monkeypatch):
+    builds = []
+
+    def counted_build():
+        builds.append(1)
+        return build()
+
+    monkeypatch.setitem(figures.THEMATIC_FIGURES, NAME, (lambda: 'v1', counted_build))
+    key = figures.ensure_built(NAME)
+    yield key, builds
+    figures.invalidate_figures()
+
+
+def test_lazy_figure(key):
+    figure, years = figures.get_lazy_figure(NAME)
+    assert years == [2019, 2020]
+    assert figure['layout']['meta'] == {'year': 2020}
+    assert 'frames' not in figure
+
+
+@pytest.mark.parametrize('suffix', [':lazy', ':frame:2019'])
+def test_evicted_entry_is_split_out_again(key, suffix):
+    key, builds = key
+    cache.delete(f'{key}{suffix}')
+    assert figures.get_lazy_figure(NAME)[1] == [2019, 2020]
+    assert list(figures.get_frames(NAME, [2019, 2020])) == ['2019', '2020']
+    assert len(builds) == 1
+
+
+def test_figure_stored_without_lazy_entries(key):
+    key, builds = key
+    # as stored before figures were split into frames
+    cache.delete(f'{key}:lazy')
+    for year in (2019, 2020):
+        cache.delete(f'{key}:frame:{year}')
+    assert figures.get_lazy_figure(NAME)[1] == [2019, 2020]
+    assert figures.get_frames(NAME, [2019])['2019'][0]['y'] == [2019]
+    assert len(builds) == 1
+
+
+def test_rebuilt_when_everything_is_gone(key, monkeypatch):
+    key, builds = key
+    # the figure expires between the check in ensure_built and the reads
+    monkeypatch.setattr(figures, 'ensure_built', lambda name: key)
+    figures.invalidate_figures()
+    assert figures.get_lazy_figure(NAME)[1] == [2019, 2020]
+    figures.invalidate_figures()
+    assert list(figures.get_frames(NAME, [2020])) == ['2020']
+    assert len(builds) == 3
+
+
+def test_unknown_year_does_not_split_again(key, monkeypatch):
+    key, builds = key
+    splits = []
+    split_stored = figures._split_stored
+    monkeypatch.setattr(figures, '_split_stored', lambda *args: splits.append(1) or split_stored(*args))
+    assert figures.get_frames(NAME, [2019, 1990]).keys() == {'2019'}
+    assert splits == []
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plot import OUTLIER_THRESHOLD, fit_trendlines
+
+
+def make_dataset(seed=0):
+    rng = np.random.default_rng(seed)
+    groups = []
+    for year in (2018, 2019):
+        for level, size in [('LIC', 12), ('LMC', 30), ('UMC', 7), ('HIC', 3)]:
+            x = rng.uniform(500, 60000, size)
+            y = 80 - 0.001 * x + rng.normal(0, 5, size)
+            # a few rows far off the line
+            y[rng.choice(size, size // 6, replace=False)] += 40
+            groups.append(pd.DataFrame({'year': year, 'income_level': level, 'gdp_per_capita_2017_ppp': x, 'value': y}))
+    # a single country, and countries that all have the same gdp per capita
+    groups.append(pd.DataFrame({'year': 2020, 'income_level': 'LIC', 'gdp_per_capita_2017_ppp': [1200.0], 'value': [55.0]}))
+    groups.append(pd.DataFrame({'year': 2020, 'income_level': 'HIC', 'gdp_per_capita_2017_ppp': [40000.0] * 4, 'value': [3.0, 5.0, 4.0, 20.0]}))
+    # shuffled, fit_trendlines sorts the rows into groups itself
+    return pd.concat(groups).sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def expected_fit(x, y, threshold=OUTLIER_THRESHOLD):
+    # a line needs two distinct gdp values, otherwise the fit is flat through the mean
+    degree = 1 if len(np.unique(x)) > 1 else 0
+    coefficients = np.polyfit(x, y, degree)
+    fitted = np.polyval(coefficients, x)
+    residuals = y - fitted
+    std = residuals.std()
+    is_outlier = np.abs(residuals) > threshold * std if std > 0 else np.zeros(len(y), dtype=bool)
+    slope, intercept = coefficients if degree else (0.0, coefficients[0])
+    return slope, intercept, fitted, is_outlier
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_matches_polyfit_per_group(seed):
+    dataset = make_dataset(seed)
+    df, group_slices = fit_trendlines(dataset, 'value')
+
+    assert len(df) == len(dataset)
+    assert set(group_slices) == set(dataset.groupby(['year', 'income_level']).groups)
+    for (year, level), rows in group_slices.items():
+        group = df.iloc[rows]
+        assert (group['year'] == year).all() and (group['income_level'] == level).all()
+        assert group['gdp_per_capita_2017_ppp'].is_monotonic_increasing
+
+        x = group['gdp_per_capita_2017_ppp'].to_numpy()
+        slope, intercept, fitted, is_outlier = expected_fit(x, group['value'].to_numpy())
+        np.testing.assert_allclose(group['fitted_y'], fitted, rtol=1e-9, atol=1e-9)
+        np.testing.assert_array_equal(group['is_outlier'], is_outlier)
+        # the fitted values lie on the group's line
+        if len(np.unique(x)) > 1:
+            np.testing.assert_allclose(np.polyfit(x, group['fitted_y'], 1), [slope, intercept], rtol=1e-6, atol=1e-9)
+        else:
+            np.testing.assert_allclose(group['fitted_y'], intercept)
+
+
+def test_degenerate_groups():
+    df, group_slices = fit_trendlines(make_dataset(), 'value')
+    single = df.iloc[group_slices[(2020, 'LIC')]]
+    assert single['fitted_y'].tolist() == [55.0]
+    assert not single['is_outlier'].any()
+
+    same_gdp = df.iloc[group_slices[(2020, 'HIC')]]
+    np.testing.assert_allclose(same_gdp['fitted_y'], 8.0)
+    assert same_gdp.loc[same_gdp['is_outlier'], 'value'].tolist() == [20.0]
+
+
+def test_empty_dataset():
+    df, group_slices = fit_trendlines(make_dataset().iloc[:0], 'value')
+    assert df.empty and group_slices == {}
+    assert {'fitted_y', 'is_outlier'} <= set(df.columns)
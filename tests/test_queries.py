@@ -0,0 +1,150 @@
+import os
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import queries
+from backends import snapshot_path
+from caching import cache
+from indicators import INDICATORS, query_spec
+
+NAME = next(iter(INDICATORS))
+GDP_TABLE = 'indicator.gdp'
+
+
+@pytest.fixture
+def no_warehouse(monkeypatch):
+    def fetch(dbsql_query):
+        raise AssertionError(f'queried the warehouse: {dbsql_query}')
+
+    monkeypatch.setattr(queries, '_fetch_arrow', fetch)
+    yield
+    queries.invalidate_cache()
+
+
+def test_cached_indicator_version_does_not_query(no_warehouse):
+    spec = query_spec(NAME)
+    assert queries.get_indicator_data_version(**spec, cached_only=True) is None
+
+    for query in (queries.GDP_QUERY, queries.COUNTRY_QUERY, queries.indicator_query(**spec)):
+        cache.set(queries.query_cache_key(query), f'v-{query}', tag=spec['table'])
+    assert queries.get_indicator_data_version(**spec, cached_only=True) == queries.get_indicator_data_version(**spec)
+
+
+def gdp(years, countries=('KEN', 'PER', 'ALB'), revised=None, **columns):
+    rows = [(country, year) for year in years for country in countries]
+    values = {row: 1000.0 * (i + 1) for i, row in enumerate(rows)}
+    values.update(revised or {})
+    return pa.table({
+        'country_code': [country for country, _ in rows],
+        'year': [year for _, year in rows],
+        'gdp_per_capita_2017_ppp': [values[row] for row in rows],
+        **columns,
+    })
+
+
+@pytest.fixture
+def warehouse(tmp_path, monkeypatch):
+    """
+    Serves indicator.gdp from a snapshot the test replaces, records the
+    queries sent to the backend
+    """
+    monkeypatch.setattr(queries, 'DATASET_DIR', str(tmp_path / 'datasets'))
+    sent = []
+    fetch = queries._fetch_arrow
+
+    def recorded_fetch(dbsql_query):
+        sent.append(dbsql_query)
+        return fetch(dbsql_query)
+
+    monkeypatch.setattr(queries, '_fetch_arrow', recorded_fetch)
+
+    def publish(table_data):
+        path = snapshot_path(queries.backend.snapshot_dir, GDP_TABLE)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pq.write_table(table_data, path)
+        sent.clear()
+
+    yield publish, sent
+    queries.invalidate_cache()
+
+
+def refresh():
+    return queries.refresh_query(queries.GDP_QUERY, GDP_TABLE)
+
+
+def version():
+    return queries.get_cached_data_version(queries.GDP_QUERY)
+
+
+def full_read():
+    cache.delete(f'{queries.query_cache_key(queries.GDP_QUERY)}:full_at')
+    return refresh()
+
+
+def rows(table_data):
+    return sorted(table_data.to_pylist(), key=lambda row: (row['country_code'], row['year']))
+
+
+def test_new_year_is_merged(warehouse):
+    publish, sent = warehouse
+    publish(gdp(range(2000, 2021)))
+    refresh()
+    assert sent == [queries.GDP_QUERY]
+
+    publish(gdp(range(2000, 2022)))
+    merged = refresh()
+    # only the years from the watermark (2020) minus the lookback on
+    assert sent == [f'{queries.GDP_QUERY} WHERE year >= {2020 - queries.INCREMENTAL_LOOKBACK}']
+    assert rows(merged) == rows(gdp(range(2000, 2022)))
+    assert cache.get(f'{queries.query_cache_key(queries.GDP_QUERY)}:watermark') == 2021
+
+
+def test_revisions_within_the_lookback(warehouse):
+    publish, sent = warehouse
+    publish(gdp(range(2000, 2021)))
+    refresh()
+
+    recent = ('PER', 2020 - queries.INCREMENTAL_LOOKBACK)
+    old = ('PER', 2005)
+    publish(gdp(range(2000, 2021), revised={recent: 1.0, old: 2.0}))
+    merged = refresh()
+    revised = {(row['country_code'], row['year']): row['gdp_per_capita_2017_ppp'] for row in merged.to_pylist()}
+    assert revised[recent] == 1.0
+    # before the cutoff, picked up by the next full read
+    assert revised[old] != 2.0
+    assert {(row['country_code'], row['year']): row['gdp_per_capita_2017_ppp'] for row in full_read().to_pylist()}[old] == 2.0
+
+
+def test_unchanged_data_keeps_its_version(warehouse):
+    publish, sent = warehouse
+    publish(gdp(range(2000, 2021)))
+    refresh()
+    first = version()
+
+    refresh()
+    assert sent[-1].endswith(f'WHERE year >= {2020 - queries.INCREMENTAL_LOOKBACK}')
+    assert version() == first
+    full_read()
+    assert sent[-1] == queries.GDP_QUERY
+    assert version() == first
+
+    # the same rows merged or read in full are stored alike
+    publish(gdp(range(2000, 2022)))
+    refresh()
+    merged = version()
+    full_read()
+    assert version() == merged != first
+
+
+def test_schema_change_reads_in_full(warehouse):
+    publish, sent = warehouse
+    publish(gdp(range(2000, 2021)))
+    refresh()
+
+    publish(gdp(range(2000, 2021), source=['WDI'] * 63))
+    table_data = refresh()
+    assert sent == [f'{queries.GDP_QUERY} WHERE year >= {2020 - queries.INCREMENTAL_LOOKBACK}', queries.GDP_QUERY]
+    assert table_data.column_names == ['country_code', 'year', 'gdp_per_capita_2017_ppp', 'source']
+    assert table_data.num_rows == 63
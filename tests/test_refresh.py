@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+import refresh
+
+
+class FakeDataset:
+    def __init__(self):
+        self.fetched = False
+
+    def age(self):
+        return 0.0 if self.fetched else None
+
+    def refresh(self):
+        self.fetched = True
+
+
+@pytest.fixture(autouse=True)
+def not_loaded(monkeypatch):
+    monkeypatch.setattr(refresh, '_loaded', set())
+
+
+def test_loaded_once_every_dataset_was_loaded():
+    datasets = {'gdp': FakeDataset(), 'country': FakeDataset()}
+    assert not refresh.datasets_loaded(datasets)
+    assert refresh.load_datasets({'gdp': datasets['gdp']}) == []
+    assert not refresh.datasets_loaded(datasets)
+    assert refresh.load_datasets(datasets) == []
+    assert refresh.datasets_loaded(datasets)
+
+
+def test_failed_load_is_not_ready():
+    failing = FakeDataset()
+    failing.refresh = lambda: 1 / 0
+    datasets = {'gdp': FakeDataset(), 'country': failing}
+    assert refresh.load_datasets(datasets) == ['country']
+    assert not refresh.datasets_loaded(datasets)
+
+
+@pytest.mark.filterwarnings('ignore:This process .* is multi-threaded')
+def test_preloaded_datasets_stay_loaded_in_forked_workers():
+    datasets = {'gdp': FakeDataset(), 'country': FakeDataset()}
+    # the preload in the master process, before any readiness check
+    refresh.load_datasets(datasets)
+    # the cached results expire before a worker is forked
+    for dataset in datasets.values():
+        dataset.fetched = False
+
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0 if refresh.datasets_loaded(datasets) else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
@@ -0,0 +1,74 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from table_query import query_frame, split_filter_part
+
+AVAILABILITY = pa.table({
+    'country_name': ['Kenya', 'Albania', 'Peru', 'Chad'],
+    'boost_source': ['A', 'B', 'A', None],
+    'earliest_year': [2005, 1998, 2010, None],
+    'latest_year': [2020, 2005, 2022, 2015],
+})
+
+
+@pytest.fixture(params=['numpy', 'arrow'])
+def frame(request):
+    # the app pages through an Arrow-backed frame, check the default dtypes too
+    if request.param == 'arrow':
+        return AVAILABILITY.to_pandas(types_mapper=pd.ArrowDtype)
+    return AVAILABILITY.to_pandas()
+
+
+def names(records):
+    return [record['country_name'] for record in records]
+
+
+def test_split_filter_part():
+    assert split_filter_part('{latest_year} >= 2010') == ('latest_year', 'ge', 2010.0, False)
+    assert split_filter_part('{country_name} icontains "ke"') == ('country_name', 'contains', 'ke', True)
+    assert split_filter_part('{country_name} = \'Côte d\\\'Ivoire\'') == ('country_name', 'eq', "Côte d'Ivoire", False)
+    assert split_filter_part('latest_year > 2010') is None
+
+
+@pytest.mark.parametrize('filter_query, expected', [
+    ('{latest_year} > 2015', ['Kenya', 'Peru']),
+    ('{latest_year} = 2005', ['Albania']),
+    ('{boost_source} = A && {latest_year} < 2021', ['Kenya']),
+    ('{country_name} icontains a', ['Kenya', 'Albania', 'Chad']),
+    ('{country_name} scontains A', ['Albania']),
+    ('{unknown} = 1', ['Kenya', 'Albania', 'Peru', 'Chad']),
+    ('', ['Kenya', 'Albania', 'Peru', 'Chad']),
+])
+def test_filter(frame, filter_query, expected):
+    records, total, _ = query_frame(frame, filter_query, [], 0, 10)
+    assert names(records) == expected
+    assert total == len(expected)
+
+
+@pytest.mark.parametrize('filter_query, expected', [
+    # contains is the default operator of columns declared without a type
+    ('{earliest_year} contains 2005', ['Kenya']),
+    ('{latest_year} contains 05', ['Albania']),
+    ('{latest_year} datestartswith 202', ['Kenya', 'Peru']),
+])
+def test_text_operators_on_numeric_columns(frame, filter_query, expected):
+    records, _, _ = query_frame(frame, filter_query, [], 0, 10)
+    assert names(records) == expected
+
+
+def test_sort_and_page(frame):
+    sort_by = [
+        {'column_id': 'boost_source', 'direction': 'asc'},
+        {'column_id': 'latest_year', 'direction': 'desc'},
+    ]
+    records, total, page_count = query_frame(frame, '', sort_by, 0, 3)
+    assert names(records) == ['Peru', 'Kenya', 'Albania']
+    assert (total, page_count) == (4, 2)
+    records, _, _ = query_frame(frame, '', sort_by, 1, 3)
+    assert names(records) == ['Chad']
+
+
+def test_empty_result(frame):
+    records, total, page_count = query_frame(frame, '{latest_year} > 2100', [], 0, 10)
+    assert (records, total, page_count) == ([], 0, 1)
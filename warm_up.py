@@ -0,0 +1,44 @@
+import importlib
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# modules only needed once data is joined or a figure is built, imported on
+# first use or ahead of it by start_warm_up. plot brings in pandas, numpy and
+# plotly's figure classes, together most of the app's import time
+HEAVY_MODULES = ['pyarrow.compute', 'plot']
+WARM_UP = os.getenv("WARM_UP", "1") == "1"
+
+_thread = None
+
+
+def import_heavy_modules(modules=HEAVY_MODULES):
+    for name in modules:
+        start = time.perf_counter()
+        importlib.import_module(name)
+        logger.info('Imported %s in %.0f ms', name, (time.perf_counter() - start) * 1000)
+
+
+def start_warm_up():
+    """
+    Imports the heavy modules in a background thread, so the first thematic
+    request does not wait for them and processes forked afterwards (long
+    callback workers) start with them loaded
+    """
+    global _thread
+    _thread = threading.Thread(target=import_heavy_modules, name='warm-up', daemon=True)
+    _thread.start()
+    return _thread
+
+
+def wait_for_warm_up():
+    if _thread is not None and _thread is not threading.current_thread():
+        _thread.join()
+
+
+# a module the warm-up thread is halfway through importing would stay locked
+# in a forked child, so forks wait for the warm-up to finish
+os.register_at_fork(before=wait_for_warm_up)
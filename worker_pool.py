@@ -0,0 +1,237 @@
+import logging
+import os
+import queue
+import signal
+import threading
+import time
+import uuid
+from dash.long_callback import DiskcacheLongCallbackManager
+from metrics import instrument_job, observe
+
+logger = logging.getLogger(__name__)
+
+# "pool" runs long callbacks in warm worker processes, "diskcache" in a new process per call
+LONG_CALLBACK_MANAGER = os.getenv("LONG_CALLBACK_MANAGER", "pool")
+# long callback worker processes per app process
+LONG_CALLBACK_WORKERS = int(os.getenv("LONG_CALLBACK_WORKERS", 2))
+# job bookkeeping is dropped after this long, in case the browser stops polling
+JOB_EXPIRE = 60 * 60
+# how often dead workers are replaced, and workers check the app is still running
+SUPERVISE_INTERVAL = 0.5
+
+QUEUED, RUNNING, DONE, CANCELLED, FAILED = 'queued', 'running', 'done', 'cancelled', 'failed'
+
+
+class WarmPoolManager(DiskcacheLongCallbackManager):
+    """
+    Long callback manager running jobs in a pool of persistent worker
+    processes forked from the app, so imported modules and data loaded in
+    memory stay resident between jobs. Results, progress and job state go
+    through the diskcache as with DiskcacheLongCallbackManager, so the polling
+    requests can be answered by any process of the app.
+
+    Requests with identical inputs (the same cache key) while a job for them
+    is in flight share that job. A job every requester has moved on from,
+    e.g. by switching tabs, is dropped if it has not started yet. If it has,
+    it runs to completion and its result is discarded, unless the same inputs
+    are requested again meanwhile: its worker may be holding locks other
+    requests wait on (a query or figure build), which killing it would leave
+    taken until they expire.
+
+    Parameters
+    ----------
+    cache : diskcache.Cache
+    workers : int
+        number of worker processes, forked on the first job or by start()
+    initializer : callable, optional
+        run once in each worker after it is forked, e.g. to import modules
+        the callbacks need
+    """
+
+    def __init__(self, cache=None, workers=LONG_CALLBACK_WORKERS, initializer=None, **kwargs):
+        self.workers = workers
+        self.initializer = initializer
+        self._pid = None
+        self._processes = []
+        self._tasks = None
+        self._start_lock = threading.Lock()
+        super().__init__(cache, **kwargs)
+
+    def start(self):
+        """
+        Forks the worker processes, unless this process already did. A process
+        forked from the one that started them (e.g. a server worker) gets its own.
+        """
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            from multiprocess import get_context
+
+            self._context = get_context('fork')
+            self._tasks = self._context.Queue()
+            self._pid = os.getpid()
+            self._processes = [self._spawn() for _ in range(self.workers)]
+        threading.Thread(target=self._supervise, name='long-callback-pool', daemon=True).start()
+
+    def _spawn(self):
+        process = self._context.Process(target=self._work, name='long-callback-worker', daemon=True)
+        process.start()
+        return process
+
+    def _supervise(self):
+        while True:
+            time.sleep(SUPERVISE_INTERVAL)
+            for i, process in enumerate(self._processes):
+                if not process.is_alive():
+                    process.join()
+                    self._worker_lost(process.pid)
+                    self._processes[i] = self._spawn()
+
+    def _worker_lost(self, pid):
+        job = self.handle.pop(_worker_key(pid))
+        if job is None:
+            return
+        with self.handle.transact():
+            state = self._job_state(job)
+            if state and state['state'] in (RUNNING, CANCELLED):
+                logger.error('Long callback worker %s died running %s', pid, state['callback'])
+                self._set_job_state(job, state, state=FAILED)
+                self._forget_job(state['key'], job)
+
+    def _work(self):
+        # workers exit with the app; interrupting it stops them through their parent
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        # the app's own handler (e.g. a server worker's graceful shutdown) would
+        # keep the worker alive when its parent terminates it on exit
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        if self.initializer:
+            try:
+                self.initializer()
+            except Exception:
+                logger.exception('Long callback worker initializer failed')
+        while os.getppid() == self._pid:
+            try:
+                task = self._tasks.get(timeout=SUPERVISE_INTERVAL)
+            except queue.Empty:
+                continue
+            self._run(*task)
+
+    def _run(self, job, key, fn_key, args, context, submitted):
+        with self.handle.transact():
+            state = self._job_state(job)
+            if state is None or state['state'] != QUEUED:
+                # cancelled while queued
+                return
+            self._set_job_state(job, state, state=RUNNING, pid=os.getpid())
+            self.handle.set(_worker_key(os.getpid()), job, expire=JOB_EXPIRE)
+        observe('long_callback_queue_seconds', time.time() - submitted, callback=state['callback'])
+        try:
+            self.func_registry[fn_key](key, self._make_progress_key(key), args, context)
+        finally:
+            with self.handle.transact():
+                state = self._job_state(job)
+                if state and state['state'] == RUNNING:
+                    self._set_job_state(job, state, state=DONE)
+                elif state and state['state'] == CANCELLED:
+                    # nobody asked for it again while it ran
+                    self.clear_cache_entry(key)
+                    self.clear_cache_entry(self._make_progress_key(key))
+                    self._forget_job(key, job)
+                self.handle.delete(_worker_key(os.getpid()))
+
+    def make_job_fn(self, fn, progress, key=None):
+        job_fn = super().make_job_fn(instrument_job(fn), progress, key)
+        job_fn.callback_name = fn.__name__
+        # jobs are sent to the workers by key, they have the same registry
+        job_fn.registry_key = key
+        return job_fn
+
+    def call_job_fn(self, key, job_fn, args, context):
+        self.start()
+        with self.handle.transact():
+            job = self.handle.get(_job_key(key))
+            state = self._job_state(job) if job else None
+            if state and state['state'] in (QUEUED, RUNNING, DONE):
+                self._set_job_state(job, state, subscribers=state['subscribers'] + 1)
+                return job
+            if state and state['state'] == CANCELLED and state['pid']:
+                # cancelled while running and still running, wanted again
+                self._set_job_state(job, state, state=RUNNING, subscribers=1)
+                return job
+
+            job = uuid.uuid4().hex
+            self.clear_cache_entry(key)
+            self.handle.set(_job_key(key), job, expire=JOB_EXPIRE)
+            self._set_job_state(job, {
+                'state': QUEUED,
+                'key': key,
+                'callback': job_fn.callback_name,
+                'subscribers': 1,
+                'pid': None,
+            })
+        self._tasks.put((job, key, job_fn.registry_key, args, context, time.time()))
+        return job
+
+    def job_running(self, job):
+        state = self._job_state(job) if job else None
+        return state is not None and state['state'] in (QUEUED, RUNNING)
+
+    def terminate_job(self, job):
+        """
+        Called when a requester no longer wants the job's result. The job is
+        cancelled once no requester is left.
+        """
+        if not job:
+            return
+        with self.handle.transact():
+            state = self._job_state(job)
+            if state is None or state['state'] not in (QUEUED, RUNNING) or self.result_ready(state['key']):
+                return
+            if state['subscribers'] > 1:
+                self._set_job_state(job, state, subscribers=state['subscribers'] - 1)
+                return
+            self._set_job_state(job, state, state=CANCELLED, subscribers=0)
+            if state['state'] == QUEUED:
+                self._forget_job(state['key'], job)
+            # a running job is forgotten when it finishes, see _run
+
+    def terminate_unhealthy_job(self, job):
+        return False
+
+    def get_result(self, key, job):
+        result = self.handle.get(key, self.UNDEFINED)
+        if result is self.UNDEFINED:
+            return self.UNDEFINED
+        with self.handle.transact():
+            state = self._job_state(job) if job else None
+            subscribers = state['subscribers'] - 1 if state else 0
+            if state:
+                self._set_job_state(job, state, subscribers=subscribers)
+            if subscribers <= 0:
+                # the last requester got the result
+                if self.cache_by is None:
+                    self.clear_cache_entry(key)
+                elif self.expire:
+                    self.handle.touch(key, expire=self.expire)
+                self.clear_cache_entry(self._make_progress_key(key))
+                self._forget_job(key, job)
+        return result
+
+    def _job_state(self, job):
+        return self.handle.get(f'long-callback-job:{job}')
+
+    def _set_job_state(self, job, current, **changes):
+        self.handle.set(f'long-callback-job:{job}', dict(current, **changes), expire=JOB_EXPIRE)
+
+    def _forget_job(self, key, job):
+        # later requests with the same inputs start a new job
+        if self.handle.get(_job_key(key)) == job:
+            self.handle.delete(_job_key(key))
+
+
+def _job_key(key):
+    return f'{key}-job'
+
+
+def _worker_key(pid):
+    return f'long-callback-worker:{pid}'
@@ -0,0 +1,14 @@
+"""
+Entry point of the production server, serving the app from several preforked
+worker processes:
+
+    gunicorn -c gunicorn.conf.py wsgi:server
+
+With preload_app (see gunicorn.conf.py) this module is imported once by the
+master process, which loads the datasets before forking the workers.
+"""
+from app import app, preload
+
+preload()
+
+server = app.server